@@ -20,9 +20,15 @@ setup(
     keywords=['ConnectWise', 'Manage', 'Automate', 'API', 'Python', 'Client', 'Annotated', 'Typed', 'MSP'],
     install_requires=[
           'requests',
-          'pydantic>=2',
+          'pydantic>=2.2.1,<2.15',
           'jinja2'
     ],
+    extras_require={
+          'async': ['httpx'],
+          'orjson': ['orjson'],
+          'msgspec': ['msgspec'],
+          'arrow': ['pyarrow']
+    },
     classifiers=[
         'Development Status :: 4 - Beta',  
         'Intended Audience :: Developers',   
@@ -1,2 +1,4 @@
 from pyconnectwise.clients.manage_client import ConnectWiseManageAPIClient
 from pyconnectwise.clients.automate_client import ConnectWiseAutomateAPIClient
+from pyconnectwise.clients.async_manage_client import AsyncConnectWiseManageAPIClient
+from pyconnectwise.clients.async_automate_client import AsyncConnectWiseAutomateAPIClient
@@ -0,0 +1,305 @@
+import asyncio
+from datetime import datetime
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.exceptions import ConnectWiseRequestException
+from pyconnectwise.transports.base import AsyncConnectWiseTransport
+from pyconnectwise.transports.httpx_transport import HttpxTransport
+from pyconnectwise.utils.concurrency import AdaptiveConcurrencyLimiter
+from pyconnectwise.utils.json_backend import JSONBackend, default_json_backend
+from pyconnectwise.utils.rate_limit import RateLimiter
+from pyconnectwise.utils.response_formats import validate_response_format
+from pyconnectwise.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncClientsEndpoint import AsyncClientsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncCommandsEndpoint import AsyncCommandsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersEndpoint import AsyncComputersEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncContactsEndpoint import AsyncContactsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncDataviewfoldersEndpoint import AsyncDataviewfoldersEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncDataviewsEndpoint import AsyncDataviewsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncDrivesEndpoint import AsyncDrivesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncExternalsystemcredentialsEndpoint import \
+        AsyncExternalsystemcredentialsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncGroupsEndpoint import AsyncGroupsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncLocationsEndpoint import AsyncLocationsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncLookupsEndpoint import AsyncLookupsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncMonitorsEndpoint import AsyncMonitorsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncNetworkdevicesEndpoint import AsyncNetworkdevicesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncPatchactionsEndpoint import AsyncPatchactionsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncPermissionsEndpoint import AsyncPermissionsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationEndpoint import AsyncProbeconfigurationEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncScriptfoldersEndpoint import AsyncScriptfoldersEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncScriptingEndpoint import AsyncScriptingEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncScriptsEndpoint import AsyncScriptsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncServicesEndpoint import AsyncServicesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncStatisticsEndpoint import AsyncStatisticsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncSystemEndpoint import AsyncSystemEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncUserclassesEndpoint import AsyncUserclassesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncUsersEndpoint import AsyncUsersEndpoint
+
+
+class AsyncConnectWiseAutomateAPIClient:
+    """
+    Asynchronous ConnectWise Automate API client. Handles the connection to the ConnectWise Automate API
+    and the configuration of all the available endpoints, whose requests are awaitable.
+    """
+
+    def __init__(
+        self,
+        automate_url: str,
+        client_id: str,
+        username: str,
+        password: str,
+        pool_maxsize: int = 100,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        transport: AsyncConnectWiseTransport | None = None,
+        response_format: str = "models",
+        json_backend: JSONBackend | None = None,
+        trusted_parsing: bool = False,
+    ):
+        """
+        Initializes the client with the given credentials. An access token is obtained before the first request.
+
+        Parameters:
+            automate_url (str): URL of your ConnectWise Automate instance.
+            client_id (str): Your ConnectWise Automate API Client ID.
+            username (str): Your ConnectWise Automate API username.
+            password (str): Your ConnectWise Automate API password.
+            pool_maxsize (int, optional): Maximum number of concurrent keep-alive connections to the API. Defaults to 100.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Limits the request rate and number of concurrent requests. Defaults to None (no limit).
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adapts the number of concurrent requests to the API's latency and throttling. Defaults to None (no limit).
+            transport (AsyncConnectWiseTransport, optional): The transport requests are sent through. Defaults to an HttpxTransport using pool_maxsize.
+            response_format (str, optional): What requests return: "models" (parsed models), "stream" (models parsed one at a time as the response body is read), "json" (decoded JSON), "raw" (undecoded response bodies) or "arrow" (pyarrow Tables, requires pyarrow). Endpoints can override it with with_response_format(). Defaults to "models".
+            json_backend (JSONBackend, optional): Decodes the responses that aren't parsed into models. Defaults to the fastest backend installed (see default_json_backend).
+            trusted_parsing (bool, optional): Parse responses into models without validating them (see ConnectWiseEndpoint.with_trusted_parsing). Only for data read straight from ConnectWise. Defaults to False.
+        """
+        self.client_id: str = client_id
+        self.automate_url: str = automate_url
+        self.username: str = username
+        self.password: str = password
+        self.token_expiry_time: datetime = datetime.utcnow()
+        self.access_token: str = ""
+        self._token_lock: asyncio.Lock = asyncio.Lock()
+        self.transport: AsyncConnectWiseTransport = transport if transport is not None else HttpxTransport(pool_maxsize)
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self.response_format: str = validate_response_format(response_format)
+        self.json_backend: JSONBackend = json_backend if json_backend is not None else default_json_backend()
+        self.trusted_parsing: bool = trusted_parsing
+
+    # Endpoints are created, and their modules imported, on first access
+    @cached_property
+    def commands(self) -> "AsyncCommandsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncCommandsEndpoint import AsyncCommandsEndpoint
+
+        return AsyncCommandsEndpoint(self)
+
+    @cached_property
+    def clients(self) -> "AsyncClientsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncClientsEndpoint import AsyncClientsEndpoint
+
+        return AsyncClientsEndpoint(self)
+
+    @cached_property
+    def computers(self) -> "AsyncComputersEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncComputersEndpoint import AsyncComputersEndpoint
+
+        return AsyncComputersEndpoint(self)
+
+    @cached_property
+    def services(self) -> "AsyncServicesEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncServicesEndpoint import AsyncServicesEndpoint
+
+        return AsyncServicesEndpoint(self)
+
+    @cached_property
+    def contacts(self) -> "AsyncContactsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncContactsEndpoint import AsyncContactsEndpoint
+
+        return AsyncContactsEndpoint(self)
+
+    @cached_property
+    def dataviewfolders(self) -> "AsyncDataviewfoldersEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncDataviewfoldersEndpoint import AsyncDataviewfoldersEndpoint
+
+        return AsyncDataviewfoldersEndpoint(self)
+
+    @cached_property
+    def dataviews(self) -> "AsyncDataviewsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncDataviewsEndpoint import AsyncDataviewsEndpoint
+
+        return AsyncDataviewsEndpoint(self)
+
+    @cached_property
+    def groups(self) -> "AsyncGroupsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncGroupsEndpoint import AsyncGroupsEndpoint
+
+        return AsyncGroupsEndpoint(self)
+
+    @cached_property
+    def monitors(self) -> "AsyncMonitorsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncMonitorsEndpoint import AsyncMonitorsEndpoint
+
+        return AsyncMonitorsEndpoint(self)
+
+    @cached_property
+    def networkdevices(self) -> "AsyncNetworkdevicesEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncNetworkdevicesEndpoint import AsyncNetworkdevicesEndpoint
+
+        return AsyncNetworkdevicesEndpoint(self)
+
+    @cached_property
+    def patchactions(self) -> "AsyncPatchactionsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncPatchactionsEndpoint import AsyncPatchactionsEndpoint
+
+        return AsyncPatchactionsEndpoint(self)
+
+    @cached_property
+    def locations(self) -> "AsyncLocationsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncLocationsEndpoint import AsyncLocationsEndpoint
+
+        return AsyncLocationsEndpoint(self)
+
+    @cached_property
+    def lookups(self) -> "AsyncLookupsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncLookupsEndpoint import AsyncLookupsEndpoint
+
+        return AsyncLookupsEndpoint(self)
+
+    @cached_property
+    def probeconfiguration(self) -> "AsyncProbeconfigurationEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationEndpoint import \
+            AsyncProbeconfigurationEndpoint
+
+        return AsyncProbeconfigurationEndpoint(self)
+
+    @cached_property
+    def scriptfolders(self) -> "AsyncScriptfoldersEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncScriptfoldersEndpoint import AsyncScriptfoldersEndpoint
+
+        return AsyncScriptfoldersEndpoint(self)
+
+    @cached_property
+    def scripting(self) -> "AsyncScriptingEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncScriptingEndpoint import AsyncScriptingEndpoint
+
+        return AsyncScriptingEndpoint(self)
+
+    @cached_property
+    def scripts(self) -> "AsyncScriptsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncScriptsEndpoint import AsyncScriptsEndpoint
+
+        return AsyncScriptsEndpoint(self)
+
+    @cached_property
+    def drives(self) -> "AsyncDrivesEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncDrivesEndpoint import AsyncDrivesEndpoint
+
+        return AsyncDrivesEndpoint(self)
+
+    @cached_property
+    def statistics(self) -> "AsyncStatisticsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncStatisticsEndpoint import AsyncStatisticsEndpoint
+
+        return AsyncStatisticsEndpoint(self)
+
+    @cached_property
+    def system(self) -> "AsyncSystemEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncSystemEndpoint import AsyncSystemEndpoint
+
+        return AsyncSystemEndpoint(self)
+
+    @cached_property
+    def externalsystemcredentials(self) -> "AsyncExternalsystemcredentialsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncExternalsystemcredentialsEndpoint import \
+            AsyncExternalsystemcredentialsEndpoint
+
+        return AsyncExternalsystemcredentialsEndpoint(self)
+
+    @cached_property
+    def permissions(self) -> "AsyncPermissionsEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncPermissionsEndpoint import AsyncPermissionsEndpoint
+
+        return AsyncPermissionsEndpoint(self)
+
+    @cached_property
+    def userclasses(self) -> "AsyncUserclassesEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncUserclassesEndpoint import AsyncUserclassesEndpoint
+
+        return AsyncUserclassesEndpoint(self)
+
+    @cached_property
+    def users(self) -> "AsyncUsersEndpoint":
+        from pyconnectwise.endpoints.async_automate.AsyncUsersEndpoint import AsyncUsersEndpoint
+
+        return AsyncUsersEndpoint(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the client's transport and releases all pooled connections.
+        """
+        await self.transport.close()
+
+    def _get_url(self) -> str:
+        """
+        Generates and returns the URL for the ConnectWise Automate API endpoints based on the company url and codebase.
+
+        Returns:
+            str: API URL.
+        """
+        return f"https://{self.automate_url}/cwa/api/v1"
+
+    async def _get_access_token(self) -> str:
+        """
+        Performs a request to the ConnectWise Automate API to obtain an access token.
+
+        Raises:
+            ConnectWiseRequestException: If the API rejects the credentials or the request fails.
+        """
+        auth_response = await self.transport.request(
+            "POST",
+            f"{self._get_url()}/apitoken",
+            json={"UserName": self.username, "Password": self.password},
+            headers={"Content-Type": "application/json", "ClientId": self.client_id},
+        )
+        if auth_response.status_code >= 400:
+            raise ConnectWiseRequestException(auth_response)
+        auth_body = auth_response.json()
+        self.token_expiry_time = datetime.fromisoformat(auth_body["ExpirationDate"])
+        return auth_body["AccessToken"]
+
+    async def _refresh_access_token_if_necessary(self):
+        if self.access_token and datetime.utcnow() <= self.token_expiry_time:
+            return
+        async with self._token_lock:
+            # Another request may have refreshed the token while we waited for the lock
+            if self.access_token and datetime.utcnow() <= self.token_expiry_time:
+                return
+            self.access_token = await self._get_access_token()
+
+    async def _get_headers(self) -> dict[str, str]:
+        """
+        Generates and returns the headers required for making API requests. The access token is refreshed if necessary before returning.
+
+        Returns:
+            dict[str, str]: Dictionary of headers including Content-Type, Client ID, and Authorization.
+        """
+        await self._refresh_access_token_if_necessary()
+        headers = {
+            "Content-Type": "application/json",
+            "clientId": self.client_id,
+            "Authorization": f"Bearer {self.access_token}",
+        }
+        return headers
@@ -0,0 +1,247 @@
+import asyncio
+import base64
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.transports.base import AsyncConnectWiseTransport
+from pyconnectwise.transports.httpx_transport import HttpxTransport
+from pyconnectwise.utils.concurrency import AdaptiveConcurrencyLimiter
+from pyconnectwise.utils.json_backend import JSONBackend, default_json_backend
+from pyconnectwise.utils.rate_limit import RateLimiter
+from pyconnectwise.utils.response_formats import validate_response_format
+from pyconnectwise.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyEndpoint import AsyncCompanyEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncConfigurationsEndpoint import AsyncConfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseEndpoint import AsyncExpenseEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceEndpoint import AsyncFinanceEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingEndpoint import AsyncMarketingEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementEndpoint import AsyncProcurementEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectEndpoint import AsyncProjectEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesEndpoint import AsyncSalesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleEndpoint import AsyncScheduleEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceEndpoint import AsyncServiceEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEndpoint import AsyncSystemEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeEndpoint import AsyncTimeEndpoint
+
+
+class AsyncConnectWiseManageAPIClient:
+    """
+    Asynchronous ConnectWise Manage API client. Handles the connection to the ConnectWise Manage API
+    and the configuration of all the available endpoints, whose requests are awaitable.
+    """
+
+    def __init__(
+        self,
+        company_name: str,
+        manage_url: str,
+        client_id: str,
+        public_key: str,
+        private_key: str,
+        codebase: str | None = None,
+        pool_maxsize: int = 100,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        transport: AsyncConnectWiseTransport | None = None,
+        response_format: str = "models",
+        json_backend: JSONBackend | None = None,
+        trusted_parsing: bool = False,
+    ):
+        """
+        Initializes the client with the given credentials and optionally a specific codebase.
+        If no codebase is given, it is fetched from the API before the first request.
+
+        Parameters:
+            company_name (str): Name of your company.
+            manage_url (str): URL of your ConnectWise Manage instance.
+            client_id (str): Your ConnectWise Manage API Client ID.
+            public_key (str): Your ConnectWise Manage API Public key.
+            private_key (str): Your ConnectWise Manage API Private key.
+            codebase (str, optional): Your ConnectWise Manage Codebase. If not provided, it will be fetched from the API. Defaults to None.
+            pool_maxsize (int, optional): Maximum number of concurrent keep-alive connections to the API. Defaults to 100.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Limits the request rate and number of concurrent requests. Defaults to None (no limit).
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adapts the number of concurrent requests to the API's latency and throttling. Defaults to None (no limit).
+            transport (AsyncConnectWiseTransport, optional): The transport requests are sent through. Defaults to an HttpxTransport using pool_maxsize.
+            response_format (str, optional): What requests return: "models" (parsed models), "stream" (models parsed one at a time as the response body is read), "json" (decoded JSON), "raw" (undecoded response bodies) or "arrow" (pyarrow Tables, requires pyarrow). Endpoints can override it with with_response_format(). Defaults to "models".
+            json_backend (JSONBackend, optional): Decodes the responses that aren't parsed into models. Defaults to the fastest backend installed (see default_json_backend).
+            trusted_parsing (bool, optional): Parse responses into models without validating them (see ConnectWiseEndpoint.with_trusted_parsing). Only for data read straight from ConnectWise. Defaults to False.
+        """
+        self.client_id: str = client_id
+        self.company_name: str = company_name
+        self.manage_url: str = manage_url
+        self.public_key: str = public_key
+        self.private_key: str = private_key
+        self.codebase: str | None = codebase
+        self._codebase_lock: asyncio.Lock = asyncio.Lock()
+        self.transport: AsyncConnectWiseTransport = transport if transport is not None else HttpxTransport(pool_maxsize)
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self.response_format: str = validate_response_format(response_format)
+        self.json_backend: JSONBackend = json_backend if json_backend is not None else default_json_backend()
+        self.trusted_parsing: bool = trusted_parsing
+
+    # Endpoints are created, and their modules imported, on first access
+    @cached_property
+    def company(self) -> "AsyncCompanyEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncCompanyEndpoint import AsyncCompanyEndpoint
+
+        return AsyncCompanyEndpoint(self)
+
+    @cached_property
+    def configurations(self) -> "AsyncConfigurationsEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncConfigurationsEndpoint import AsyncConfigurationsEndpoint
+
+        return AsyncConfigurationsEndpoint(self)
+
+    @cached_property
+    def expense(self) -> "AsyncExpenseEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncExpenseEndpoint import AsyncExpenseEndpoint
+
+        return AsyncExpenseEndpoint(self)
+
+    @cached_property
+    def finance(self) -> "AsyncFinanceEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncFinanceEndpoint import AsyncFinanceEndpoint
+
+        return AsyncFinanceEndpoint(self)
+
+    @cached_property
+    def marketing(self) -> "AsyncMarketingEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncMarketingEndpoint import AsyncMarketingEndpoint
+
+        return AsyncMarketingEndpoint(self)
+
+    @cached_property
+    def procurement(self) -> "AsyncProcurementEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncProcurementEndpoint import AsyncProcurementEndpoint
+
+        return AsyncProcurementEndpoint(self)
+
+    @cached_property
+    def project(self) -> "AsyncProjectEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncProjectEndpoint import AsyncProjectEndpoint
+
+        return AsyncProjectEndpoint(self)
+
+    @cached_property
+    def sales(self) -> "AsyncSalesEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncSalesEndpoint import AsyncSalesEndpoint
+
+        return AsyncSalesEndpoint(self)
+
+    @cached_property
+    def schedule(self) -> "AsyncScheduleEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncScheduleEndpoint import AsyncScheduleEndpoint
+
+        return AsyncScheduleEndpoint(self)
+
+    @cached_property
+    def service(self) -> "AsyncServiceEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncServiceEndpoint import AsyncServiceEndpoint
+
+        return AsyncServiceEndpoint(self)
+
+    @cached_property
+    def system(self) -> "AsyncSystemEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncSystemEndpoint import AsyncSystemEndpoint
+
+        return AsyncSystemEndpoint(self)
+
+    @cached_property
+    def time(self) -> "AsyncTimeEndpoint":
+        from pyconnectwise.endpoints.async_manage.AsyncTimeEndpoint import AsyncTimeEndpoint
+
+        return AsyncTimeEndpoint(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the client's transport and releases all pooled connections.
+        """
+        await self.transport.close()
+
+    def _get_url(self) -> str:
+        """
+        Generates and returns the URL for the ConnectWise Manage API endpoints based on the company url and codebase.
+
+        Returns:
+            str: API URL.
+        """
+        return f"https://{self.manage_url}/{self.codebase.strip('/')}/apis/3.0"
+
+    async def _try_get_codebase_from_api(
+        self, manage_url: str, company_name: str, headers: dict[str, str]
+    ) -> str | None:
+        """
+        Tries to retrieve the codebase from the API using the provided company url, company name and headers.
+
+        Parameters:
+            company_url (str): URL of the company.
+            company_name (str): Name of the company.
+            headers (dict[str, str]): Headers to be sent in the request.
+
+        Returns:
+            str: Codebase string or None if an error occurs.
+        """
+        result = ""
+        try:
+            url = f"https://{manage_url}/login/companyinfo/{company_name}"
+            result = (await self.transport.request("GET", url, headers=headers)).json().get("Codebase")
+        except:
+            result = None
+        return result
+
+    async def _resolve_codebase_if_necessary(self, headers: dict[str, str]):
+        if self.codebase:
+            return
+        async with self._codebase_lock:
+            if self.codebase:
+                return
+            codebase_request = await self._try_get_codebase_from_api(
+                manage_url=self.manage_url,
+                company_name=self.company_name,
+                headers=headers,
+            )
+
+            if codebase_request is None:
+                # we need to except here
+                raise Exception("Could not retrieve codebase from API.")
+            self.codebase = codebase_request
+
+    def _get_auth_string(self) -> str:
+        """
+        Creates and returns the base64 encoded authorization string required for API requests.
+
+        Returns:
+            str: Base64 encoded authorization string.
+        """
+        return "Basic " + base64.b64encode(
+            bytes(
+                f"{self.company_name}+{self.public_key}:{self.private_key}",
+                encoding="utf8",
+            )
+        ).decode("ascii")
+
+    async def _get_headers(self) -> dict[str, str]:
+        """
+        Generates and returns the headers required for making API requests. The codebase is fetched if necessary before returning.
+
+        Returns:
+            dict[str, str]: Dictionary of headers including Content-Type, Client ID, and Authorization.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "clientId": self.client_id,
+            "Authorization": self._get_auth_string(),
+        }
+        await self._resolve_codebase_if_necessary(headers)
+        return headers
@@ -1,32 +1,42 @@
 import base64
 from datetime import datetime
+from functools import cached_property
+from typing import TYPE_CHECKING
 
-import requests
-
-from pyconnectwise.endpoints.automate.ClientsEndpoint import ClientsEndpoint
-from pyconnectwise.endpoints.automate.CommandsEndpoint import CommandsEndpoint
-from pyconnectwise.endpoints.automate.ComputersEndpoint import ComputersEndpoint
-from pyconnectwise.endpoints.automate.ContactsEndpoint import ContactsEndpoint
-from pyconnectwise.endpoints.automate.DataviewfoldersEndpoint import DataviewfoldersEndpoint
-from pyconnectwise.endpoints.automate.DataviewsEndpoint import DataviewsEndpoint
-from pyconnectwise.endpoints.automate.DrivesEndpoint import DrivesEndpoint
-from pyconnectwise.endpoints.automate.ExternalsystemcredentialsEndpoint import ExternalsystemcredentialsEndpoint
-from pyconnectwise.endpoints.automate.GroupsEndpoint import GroupsEndpoint
-from pyconnectwise.endpoints.automate.LocationsEndpoint import LocationsEndpoint
-from pyconnectwise.endpoints.automate.LookupsEndpoint import LookupsEndpoint
-from pyconnectwise.endpoints.automate.MonitorsEndpoint import MonitorsEndpoint
-from pyconnectwise.endpoints.automate.NetworkdevicesEndpoint import NetworkdevicesEndpoint
-from pyconnectwise.endpoints.automate.PatchactionsEndpoint import PatchactionsEndpoint
-from pyconnectwise.endpoints.automate.PermissionsEndpoint import PermissionsEndpoint
-from pyconnectwise.endpoints.automate.ProbeconfigurationEndpoint import ProbeconfigurationEndpoint
-from pyconnectwise.endpoints.automate.ScriptfoldersEndpoint import ScriptfoldersEndpoint
-from pyconnectwise.endpoints.automate.ScriptingEndpoint import ScriptingEndpoint
-from pyconnectwise.endpoints.automate.ScriptsEndpoint import ScriptsEndpoint
-from pyconnectwise.endpoints.automate.ServicesEndpoint import ServicesEndpoint
-from pyconnectwise.endpoints.automate.StatisticsEndpoint import StatisticsEndpoint
-from pyconnectwise.endpoints.automate.SystemEndpoint import SystemEndpoint
-from pyconnectwise.endpoints.automate.UserclassesEndpoint import UserclassesEndpoint
-from pyconnectwise.endpoints.automate.UsersEndpoint import UsersEndpoint
+from pyconnectwise.exceptions import ConnectWiseRequestException
+from pyconnectwise.transports.base import ConnectWiseTransport
+from pyconnectwise.transports.requests_transport import RequestsTransport
+from pyconnectwise.utils.concurrency import AdaptiveConcurrencyLimiter
+from pyconnectwise.utils.json_backend import JSONBackend, default_json_backend
+from pyconnectwise.utils.rate_limit import RateLimiter
+from pyconnectwise.utils.response_formats import validate_response_format
+from pyconnectwise.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ClientsEndpoint import ClientsEndpoint
+    from pyconnectwise.endpoints.automate.CommandsEndpoint import CommandsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersEndpoint import ComputersEndpoint
+    from pyconnectwise.endpoints.automate.ContactsEndpoint import ContactsEndpoint
+    from pyconnectwise.endpoints.automate.DataviewfoldersEndpoint import DataviewfoldersEndpoint
+    from pyconnectwise.endpoints.automate.DataviewsEndpoint import DataviewsEndpoint
+    from pyconnectwise.endpoints.automate.DrivesEndpoint import DrivesEndpoint
+    from pyconnectwise.endpoints.automate.ExternalsystemcredentialsEndpoint import ExternalsystemcredentialsEndpoint
+    from pyconnectwise.endpoints.automate.GroupsEndpoint import GroupsEndpoint
+    from pyconnectwise.endpoints.automate.LocationsEndpoint import LocationsEndpoint
+    from pyconnectwise.endpoints.automate.LookupsEndpoint import LookupsEndpoint
+    from pyconnectwise.endpoints.automate.MonitorsEndpoint import MonitorsEndpoint
+    from pyconnectwise.endpoints.automate.NetworkdevicesEndpoint import NetworkdevicesEndpoint
+    from pyconnectwise.endpoints.automate.PatchactionsEndpoint import PatchactionsEndpoint
+    from pyconnectwise.endpoints.automate.PermissionsEndpoint import PermissionsEndpoint
+    from pyconnectwise.endpoints.automate.ProbeconfigurationEndpoint import ProbeconfigurationEndpoint
+    from pyconnectwise.endpoints.automate.ScriptfoldersEndpoint import ScriptfoldersEndpoint
+    from pyconnectwise.endpoints.automate.ScriptingEndpoint import ScriptingEndpoint
+    from pyconnectwise.endpoints.automate.ScriptsEndpoint import ScriptsEndpoint
+    from pyconnectwise.endpoints.automate.ServicesEndpoint import ServicesEndpoint
+    from pyconnectwise.endpoints.automate.StatisticsEndpoint import StatisticsEndpoint
+    from pyconnectwise.endpoints.automate.SystemEndpoint import SystemEndpoint
+    from pyconnectwise.endpoints.automate.UserclassesEndpoint import UserclassesEndpoint
+    from pyconnectwise.endpoints.automate.UsersEndpoint import UsersEndpoint
 
 
 class ConnectWiseAutomateAPIClient:
@@ -41,6 +51,16 @@ class ConnectWiseAutomateAPIClient:
         client_id: str,
         username: str,
         password: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        transport: ConnectWiseTransport | None = None,
+        response_format: str = "models",
+        json_backend: JSONBackend | None = None,
+        trusted_parsing: bool = False,
     ):
         """
         Initializes the client with the given credentials and optionally a specific codebase.
@@ -51,41 +71,191 @@ class ConnectWiseAutomateAPIClient:
             client_id (str): Your ConnectWise Automate API Client ID.
             username (str): Your ConnectWise Automate API username.
             password (str): Your ConnectWise Automate API password.
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of keep-alive connections kept open per host. Defaults to 10.
+            pool_block (bool, optional): Block when all pooled connections to a host are in use instead of opening extra ones. Defaults to False.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Limits the request rate and number of concurrent requests. Defaults to None (no limit).
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adapts the number of concurrent requests to the API's latency and throttling. Defaults to None (no limit).
+            transport (ConnectWiseTransport, optional): The transport requests are sent through. Defaults to a RequestsTransport using the pool arguments.
+            response_format (str, optional): What requests return: "models" (parsed models), "stream" (models parsed one at a time as the response body is read), "json" (decoded JSON), "raw" (undecoded response bodies) or "arrow" (pyarrow Tables, requires pyarrow). Endpoints can override it with with_response_format(). Defaults to "models".
+            json_backend (JSONBackend, optional): Decodes the responses that aren't parsed into models. Defaults to the fastest backend installed (see default_json_backend).
+            trusted_parsing (bool, optional): Parse responses into models without validating them (see ConnectWiseEndpoint.with_trusted_parsing). Only for data read straight from ConnectWise. Defaults to False.
         """
         self.client_id: str = client_id
         self.automate_url: str = automate_url
         self.username: str = username
         self.password: str = password
         self.token_expiry_time: datetime = datetime.utcnow()
+        self.transport: ConnectWiseTransport = (
+            transport if transport is not None else RequestsTransport(pool_connections, pool_maxsize, pool_block)
+        )
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self.response_format: str = validate_response_format(response_format)
+        self.json_backend: JSONBackend = json_backend if json_backend is not None else default_json_backend()
+        self.trusted_parsing: bool = trusted_parsing
 
         # Grab first access token
         self.access_token: str = self._get_access_token()
 
-        # Initializing endpoints
-        self.commands = CommandsEndpoint(self)
-        self.clients = ClientsEndpoint(self)
-        self.computers = ComputersEndpoint(self)
-        self.services = ServicesEndpoint(self)
-        self.contacts = ContactsEndpoint(self)
-        self.dataviewfolders = DataviewfoldersEndpoint(self)
-        self.dataviews = DataviewsEndpoint(self)
-        self.groups = GroupsEndpoint(self)
-        self.monitors = MonitorsEndpoint(self)
-        self.networkdevices = NetworkdevicesEndpoint(self)
-        self.patchactions = PatchactionsEndpoint(self)
-        self.locations = LocationsEndpoint(self)
-        self.lookups = LookupsEndpoint(self)
-        self.probeconfiguration = ProbeconfigurationEndpoint(self)
-        self.scriptfolders = ScriptfoldersEndpoint(self)
-        self.scripting = ScriptingEndpoint(self)
-        self.scripts = ScriptsEndpoint(self)
-        self.drives = DrivesEndpoint(self)
-        self.statistics = StatisticsEndpoint(self)
-        self.system = SystemEndpoint(self)
-        self.externalsystemcredentials = ExternalsystemcredentialsEndpoint(self)
-        self.permissions = PermissionsEndpoint(self)
-        self.userclasses = UserclassesEndpoint(self)
-        self.users = UsersEndpoint(self)
+    # Endpoints are created, and their modules imported, on first access
+    @cached_property
+    def commands(self) -> "CommandsEndpoint":
+        from pyconnectwise.endpoints.automate.CommandsEndpoint import CommandsEndpoint
+
+        return CommandsEndpoint(self)
+
+    @cached_property
+    def clients(self) -> "ClientsEndpoint":
+        from pyconnectwise.endpoints.automate.ClientsEndpoint import ClientsEndpoint
+
+        return ClientsEndpoint(self)
+
+    @cached_property
+    def computers(self) -> "ComputersEndpoint":
+        from pyconnectwise.endpoints.automate.ComputersEndpoint import ComputersEndpoint
+
+        return ComputersEndpoint(self)
+
+    @cached_property
+    def services(self) -> "ServicesEndpoint":
+        from pyconnectwise.endpoints.automate.ServicesEndpoint import ServicesEndpoint
+
+        return ServicesEndpoint(self)
+
+    @cached_property
+    def contacts(self) -> "ContactsEndpoint":
+        from pyconnectwise.endpoints.automate.ContactsEndpoint import ContactsEndpoint
+
+        return ContactsEndpoint(self)
+
+    @cached_property
+    def dataviewfolders(self) -> "DataviewfoldersEndpoint":
+        from pyconnectwise.endpoints.automate.DataviewfoldersEndpoint import DataviewfoldersEndpoint
+
+        return DataviewfoldersEndpoint(self)
+
+    @cached_property
+    def dataviews(self) -> "DataviewsEndpoint":
+        from pyconnectwise.endpoints.automate.DataviewsEndpoint import DataviewsEndpoint
+
+        return DataviewsEndpoint(self)
+
+    @cached_property
+    def groups(self) -> "GroupsEndpoint":
+        from pyconnectwise.endpoints.automate.GroupsEndpoint import GroupsEndpoint
+
+        return GroupsEndpoint(self)
+
+    @cached_property
+    def monitors(self) -> "MonitorsEndpoint":
+        from pyconnectwise.endpoints.automate.MonitorsEndpoint import MonitorsEndpoint
+
+        return MonitorsEndpoint(self)
+
+    @cached_property
+    def networkdevices(self) -> "NetworkdevicesEndpoint":
+        from pyconnectwise.endpoints.automate.NetworkdevicesEndpoint import NetworkdevicesEndpoint
+
+        return NetworkdevicesEndpoint(self)
+
+    @cached_property
+    def patchactions(self) -> "PatchactionsEndpoint":
+        from pyconnectwise.endpoints.automate.PatchactionsEndpoint import PatchactionsEndpoint
+
+        return PatchactionsEndpoint(self)
+
+    @cached_property
+    def locations(self) -> "LocationsEndpoint":
+        from pyconnectwise.endpoints.automate.LocationsEndpoint import LocationsEndpoint
+
+        return LocationsEndpoint(self)
+
+    @cached_property
+    def lookups(self) -> "LookupsEndpoint":
+        from pyconnectwise.endpoints.automate.LookupsEndpoint import LookupsEndpoint
+
+        return LookupsEndpoint(self)
+
+    @cached_property
+    def probeconfiguration(self) -> "ProbeconfigurationEndpoint":
+        from pyconnectwise.endpoints.automate.ProbeconfigurationEndpoint import ProbeconfigurationEndpoint
+
+        return ProbeconfigurationEndpoint(self)
+
+    @cached_property
+    def scriptfolders(self) -> "ScriptfoldersEndpoint":
+        from pyconnectwise.endpoints.automate.ScriptfoldersEndpoint import ScriptfoldersEndpoint
+
+        return ScriptfoldersEndpoint(self)
+
+    @cached_property
+    def scripting(self) -> "ScriptingEndpoint":
+        from pyconnectwise.endpoints.automate.ScriptingEndpoint import ScriptingEndpoint
+
+        return ScriptingEndpoint(self)
+
+    @cached_property
+    def scripts(self) -> "ScriptsEndpoint":
+        from pyconnectwise.endpoints.automate.ScriptsEndpoint import ScriptsEndpoint
+
+        return ScriptsEndpoint(self)
+
+    @cached_property
+    def drives(self) -> "DrivesEndpoint":
+        from pyconnectwise.endpoints.automate.DrivesEndpoint import DrivesEndpoint
+
+        return DrivesEndpoint(self)
+
+    @cached_property
+    def statistics(self) -> "StatisticsEndpoint":
+        from pyconnectwise.endpoints.automate.StatisticsEndpoint import StatisticsEndpoint
+
+        return StatisticsEndpoint(self)
+
+    @cached_property
+    def system(self) -> "SystemEndpoint":
+        from pyconnectwise.endpoints.automate.SystemEndpoint import SystemEndpoint
+
+        return SystemEndpoint(self)
+
+    @cached_property
+    def externalsystemcredentials(self) -> "ExternalsystemcredentialsEndpoint":
+        from pyconnectwise.endpoints.automate.ExternalsystemcredentialsEndpoint import ExternalsystemcredentialsEndpoint
+
+        return ExternalsystemcredentialsEndpoint(self)
+
+    @cached_property
+    def permissions(self) -> "PermissionsEndpoint":
+        from pyconnectwise.endpoints.automate.PermissionsEndpoint import PermissionsEndpoint
+
+        return PermissionsEndpoint(self)
+
+    @cached_property
+    def userclasses(self) -> "UserclassesEndpoint":
+        from pyconnectwise.endpoints.automate.UserclassesEndpoint import UserclassesEndpoint
+
+        return UserclassesEndpoint(self)
+
+    @cached_property
+    def users(self) -> "UsersEndpoint":
+        from pyconnectwise.endpoints.automate.UsersEndpoint import UsersEndpoint
+
+        return UsersEndpoint(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the client's transport and releases all pooled connections.
+        """
+        self.transport.close()
 
     def _get_url(self) -> str:
         """
@@ -99,20 +269,21 @@ class ConnectWiseAutomateAPIClient:
     def _get_access_token(self) -> str:
         """
         Performs a request to the ConnectWise Automate API to obtain an access token.
+
+        Raises:
+            ConnectWiseRequestException: If the API rejects the credentials or the request fails.
         """
-        token: str = ""
-        try:
-            auth_response = requests.post(
-                f"{self._get_url()}/apitoken",
-                json={"UserName": self.username, "Password": self.password},
-                headers={"Content-Type": "application/json", "ClientId": self.client_id},
-            ).json()
-            token = auth_response["AccessToken"]
-            self.token_expiry_time = datetime.fromisoformat(auth_response["ExpirationDate"])
-        except Exception as e:
-            print(e)
-            return token
-        return token
+        auth_response = self.transport.request(
+            "POST",
+            f"{self._get_url()}/apitoken",
+            json={"UserName": self.username, "Password": self.password},
+            headers={"Content-Type": "application/json", "ClientId": self.client_id},
+        )
+        if auth_response.status_code >= 400:
+            raise ConnectWiseRequestException(auth_response)
+        auth_body = auth_response.json()
+        self.token_expiry_time = datetime.fromisoformat(auth_body["ExpirationDate"])
+        return auth_body["AccessToken"]
 
     def _refresh_access_token_if_necessary(self):
         if datetime.utcnow() > self.token_expiry_time:
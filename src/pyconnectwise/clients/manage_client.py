@@ -1,19 +1,28 @@
 import base64
-
-import requests
-
-from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsEndpoint import ConfigurationsEndpoint
-from pyconnectwise.endpoints.manage.ExpenseEndpoint import ExpenseEndpoint
-from pyconnectwise.endpoints.manage.FinanceEndpoint import FinanceEndpoint
-from pyconnectwise.endpoints.manage.MarketingEndpoint import MarketingEndpoint
-from pyconnectwise.endpoints.manage.ProcurementEndpoint import ProcurementEndpoint
-from pyconnectwise.endpoints.manage.ProjectEndpoint import ProjectEndpoint
-from pyconnectwise.endpoints.manage.SalesEndpoint import SalesEndpoint
-from pyconnectwise.endpoints.manage.ScheduleEndpoint import ScheduleEndpoint
-from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
-from pyconnectwise.endpoints.manage.SystemEndpoint import SystemEndpoint
-from pyconnectwise.endpoints.manage.TimeEndpoint import TimeEndpoint
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.transports.base import ConnectWiseTransport
+from pyconnectwise.transports.requests_transport import RequestsTransport
+from pyconnectwise.utils.concurrency import AdaptiveConcurrencyLimiter
+from pyconnectwise.utils.json_backend import JSONBackend, default_json_backend
+from pyconnectwise.utils.rate_limit import RateLimiter
+from pyconnectwise.utils.response_formats import validate_response_format
+from pyconnectwise.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+    from pyconnectwise.endpoints.manage.ConfigurationsEndpoint import ConfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseEndpoint import ExpenseEndpoint
+    from pyconnectwise.endpoints.manage.FinanceEndpoint import FinanceEndpoint
+    from pyconnectwise.endpoints.manage.MarketingEndpoint import MarketingEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementEndpoint import ProcurementEndpoint
+    from pyconnectwise.endpoints.manage.ProjectEndpoint import ProjectEndpoint
+    from pyconnectwise.endpoints.manage.SalesEndpoint import SalesEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleEndpoint import ScheduleEndpoint
+    from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+    from pyconnectwise.endpoints.manage.SystemEndpoint import SystemEndpoint
+    from pyconnectwise.endpoints.manage.TimeEndpoint import TimeEndpoint
 
 
 class ConnectWiseManageAPIClient:
@@ -30,6 +39,16 @@ class ConnectWiseManageAPIClient:
         public_key: str,
         private_key: str,
         codebase: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        transport: ConnectWiseTransport | None = None,
+        response_format: str = "models",
+        json_backend: JSONBackend | None = None,
+        trusted_parsing: bool = False,
     ):
         """
         Initializes the client with the given credentials and optionally a specific codebase.
@@ -42,12 +61,33 @@ class ConnectWiseManageAPIClient:
             public_key (str): Your ConnectWise Manage API Public key.
             private_key (str): Your ConnectWise Manage API Private key.
             codebase (str, optional): Your ConnectWise Manage Codebase. If not provided, it will be fetched from the API. Defaults to None.
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of keep-alive connections kept open per host. Defaults to 10.
+            pool_block (bool, optional): Block when all pooled connections to a host are in use instead of opening extra ones. Defaults to False.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Limits the request rate and number of concurrent requests. Defaults to None (no limit).
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adapts the number of concurrent requests to the API's latency and throttling. Defaults to None (no limit).
+            transport (ConnectWiseTransport, optional): The transport requests are sent through. Defaults to a RequestsTransport using the pool arguments.
+            response_format (str, optional): What requests return: "models" (parsed models), "stream" (models parsed one at a time as the response body is read), "json" (decoded JSON), "raw" (undecoded response bodies) or "arrow" (pyarrow Tables, requires pyarrow). Endpoints can override it with with_response_format(). Defaults to "models".
+            json_backend (JSONBackend, optional): Decodes the responses that aren't parsed into models. Defaults to the fastest backend installed (see default_json_backend).
+            trusted_parsing (bool, optional): Parse responses into models without validating them (see ConnectWiseEndpoint.with_trusted_parsing). Only for data read straight from ConnectWise. Defaults to False.
         """
         self.client_id: str = client_id
         self.company_name: str = company_name
         self.manage_url: str = manage_url
         self.public_key: str = public_key
         self.private_key: str = private_key
+        self.transport: ConnectWiseTransport = (
+            transport if transport is not None else RequestsTransport(pool_connections, pool_maxsize, pool_block)
+        )
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self.response_format: str = validate_response_format(response_format)
+        self.json_backend: JSONBackend = json_backend if json_backend is not None else default_json_backend()
+        self.trusted_parsing: bool = trusted_parsing
+
+        self.codebase: str | None = codebase
 
         # Retrieve codebase from the API if not provided
         if not codebase:
@@ -60,21 +100,92 @@ class ConnectWiseManageAPIClient:
             if codebase_request is None:
                 # we need to except here
                 raise Exception("Could not retrieve codebase from API.")
-            self.codebase: str = codebase_request
-
-        # Initializing endpoints
-        self.company = CompanyEndpoint(self)
-        self.configurations = ConfigurationsEndpoint(self)
-        self.expense = ExpenseEndpoint(self)
-        self.finance = FinanceEndpoint(self)
-        self.marketing = MarketingEndpoint(self)
-        self.procurement = ProcurementEndpoint(self)
-        self.project = ProjectEndpoint(self)
-        self.sales = SalesEndpoint(self)
-        self.schedule = ScheduleEndpoint(self)
-        self.service = ServiceEndpoint(self)
-        self.system = SystemEndpoint(self)
-        self.time = TimeEndpoint(self)
+            self.codebase = codebase_request
+
+    # Endpoints are created, and their modules imported, on first access
+    @cached_property
+    def company(self) -> "CompanyEndpoint":
+        from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+
+        return CompanyEndpoint(self)
+
+    @cached_property
+    def configurations(self) -> "ConfigurationsEndpoint":
+        from pyconnectwise.endpoints.manage.ConfigurationsEndpoint import ConfigurationsEndpoint
+
+        return ConfigurationsEndpoint(self)
+
+    @cached_property
+    def expense(self) -> "ExpenseEndpoint":
+        from pyconnectwise.endpoints.manage.ExpenseEndpoint import ExpenseEndpoint
+
+        return ExpenseEndpoint(self)
+
+    @cached_property
+    def finance(self) -> "FinanceEndpoint":
+        from pyconnectwise.endpoints.manage.FinanceEndpoint import FinanceEndpoint
+
+        return FinanceEndpoint(self)
+
+    @cached_property
+    def marketing(self) -> "MarketingEndpoint":
+        from pyconnectwise.endpoints.manage.MarketingEndpoint import MarketingEndpoint
+
+        return MarketingEndpoint(self)
+
+    @cached_property
+    def procurement(self) -> "ProcurementEndpoint":
+        from pyconnectwise.endpoints.manage.ProcurementEndpoint import ProcurementEndpoint
+
+        return ProcurementEndpoint(self)
+
+    @cached_property
+    def project(self) -> "ProjectEndpoint":
+        from pyconnectwise.endpoints.manage.ProjectEndpoint import ProjectEndpoint
+
+        return ProjectEndpoint(self)
+
+    @cached_property
+    def sales(self) -> "SalesEndpoint":
+        from pyconnectwise.endpoints.manage.SalesEndpoint import SalesEndpoint
+
+        return SalesEndpoint(self)
+
+    @cached_property
+    def schedule(self) -> "ScheduleEndpoint":
+        from pyconnectwise.endpoints.manage.ScheduleEndpoint import ScheduleEndpoint
+
+        return ScheduleEndpoint(self)
+
+    @cached_property
+    def service(self) -> "ServiceEndpoint":
+        from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+
+        return ServiceEndpoint(self)
+
+    @cached_property
+    def system(self) -> "SystemEndpoint":
+        from pyconnectwise.endpoints.manage.SystemEndpoint import SystemEndpoint
+
+        return SystemEndpoint(self)
+
+    @cached_property
+    def time(self) -> "TimeEndpoint":
+        from pyconnectwise.endpoints.manage.TimeEndpoint import TimeEndpoint
+
+        return TimeEndpoint(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the client's transport and releases all pooled connections.
+        """
+        self.transport.close()
 
     def _get_url(self) -> str:
         """
@@ -100,7 +211,7 @@ class ConnectWiseManageAPIClient:
         result = ""
         try:
             url = f"https://{manage_url}/login/companyinfo/{company_name}"
-            result = requests.request("GET", url, headers=headers).json().get("Codebase")
+            result = self.transport.request("GET", url, headers=headers).json().get("Codebase")
         except:
             result = None
         return result
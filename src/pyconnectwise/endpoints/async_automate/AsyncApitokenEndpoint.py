@@ -0,0 +1,42 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateAuthInformation, AutomateTokenResult
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncApitokenEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Apitoken"
+    _route = "Apitoken"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateAuthInformation:
+        """
+        Performs a GET request against the /Apitoken endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateAuthInformation: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateAuthInformation, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateTokenResult:
+        """
+        Performs a POST request against the /Apitoken endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateTokenResult: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateTokenResult, (await super()._make_request("POST", data=data, params=params)).content
+        )
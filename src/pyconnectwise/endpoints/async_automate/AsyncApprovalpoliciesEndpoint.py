@@ -0,0 +1,12 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncApprovalpoliciesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Approvalpolicies"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechAVTemplatePolicyData
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncAvtemplatepolicydataEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Avtemplatepolicydata"
+    _route = "Avtemplatepolicydata"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechAVTemplatePolicyData:
+        """
+        Performs a POST request against the /Avtemplatepolicydata endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechAVTemplatePolicyData: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechAVTemplatePolicyData, (await super()._make_request("POST", data=data, params=params)).content
+        )
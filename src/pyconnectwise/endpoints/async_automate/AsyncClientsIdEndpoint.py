@@ -0,0 +1,66 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechClient
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncClientsIdDocumentsEndpoint import AsyncClientsIdDocumentsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncClientsIdLicensesEndpoint import AsyncClientsIdLicensesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncClientsIdPermissionsEndpoint import \
+        AsyncClientsIdPermissionsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncClientsIdProductkeysEndpoint import \
+        AsyncClientsIdProductkeysEndpoint
+
+
+class AsyncClientsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Clients/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[LabTechClient]:
+        """
+        Performs a GET request against the /Clients/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[LabTechClient]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(LabTechClient, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechClient:
+        """
+        Performs a GET request against the /Clients/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechClient: The parsed response data.
+        """
+        return self._parse_one(LabTechClient, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def productkeys(self) -> "AsyncClientsIdProductkeysEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncClientsIdProductkeysEndpoint")
+
+    @cached_property
+    def licenses(self) -> "AsyncClientsIdLicensesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncClientsIdLicensesEndpoint")
+
+    @cached_property
+    def permissions(self) -> "AsyncClientsIdPermissionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncClientsIdPermissionsEndpoint")
+
+    @cached_property
+    def documents(self) -> "AsyncClientsIdDocumentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncClientsIdDocumentsEndpoint")
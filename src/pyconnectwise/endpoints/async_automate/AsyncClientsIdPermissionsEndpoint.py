@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncClientsIdPermissionsIdEndpoint import \
+        AsyncClientsIdPermissionsIdEndpoint
+
+
+class AsyncClientsIdPermissionsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Permissions"
+    _route = "Clients/{id}/Permissions"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncClientsIdPermissionsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncClientsIdPermissionsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncClientsIdPermissionsIdEndpoint: The AsyncClientsIdPermissionsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncClientsIdPermissionsIdEndpoint", id)
@@ -0,0 +1,58 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechComputerMenu
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncComputermenusEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Computermenus"
+    _route = "Computermenus"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[LabTechComputerMenu]:
+        """
+        Performs a GET request against the /Computermenus endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[LabTechComputerMenu]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(LabTechComputerMenu, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechComputerMenu]:
+        """
+        Performs a GET request against the /Computermenus endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechComputerMenu]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechComputerMenu, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechComputerMenu:
+        """
+        Performs a POST request against the /Computermenus endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechComputerMenu: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechComputerMenu, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,85 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechComputer
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncComputersChassisEndpoint import AsyncComputersChassisEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersDrivesEndpoint import AsyncComputersDrivesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdEndpoint import AsyncComputersIdEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersMaintenancemodesEndpoint import \
+        AsyncComputersMaintenancemodesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersMemoryslotsEndpoint import \
+        AsyncComputersMemoryslotsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersSoftwareEndpoint import AsyncComputersSoftwareEndpoint
+
+
+class AsyncComputersEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Computers"
+    _route = "Computers"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncComputersIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncComputersIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncComputersIdEndpoint: The AsyncComputersIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncComputersIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[LabTechComputer]:
+        """
+        Performs a GET request against the /Computers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[LabTechComputer]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(LabTechComputer, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechComputer]:
+        """
+        Performs a GET request against the /Computers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechComputer]: The parsed response data.
+        """
+        return self._parse_many(LabTechComputer, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def chassis(self) -> "AsyncComputersChassisEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersChassisEndpoint")
+
+    @cached_property
+    def software(self) -> "AsyncComputersSoftwareEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersSoftwareEndpoint")
+
+    @cached_property
+    def memoryslots(self) -> "AsyncComputersMemoryslotsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersMemoryslotsEndpoint")
+
+    @cached_property
+    def drives(self) -> "AsyncComputersDrivesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersDrivesEndpoint")
+
+    @cached_property
+    def maintenancemodes(self) -> "AsyncComputersMaintenancemodesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersMaintenancemodesEndpoint"
+        )
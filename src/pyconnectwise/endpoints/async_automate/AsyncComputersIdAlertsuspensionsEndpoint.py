@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdAlertsuspensionsMaintenancewindowEndpoint import \
+        AsyncComputersIdAlertsuspensionsMaintenancewindowEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdAlertsuspensionsTemplatediversionEndpoint import \
+        AsyncComputersIdAlertsuspensionsTemplatediversionEndpoint
+
+
+class AsyncComputersIdAlertsuspensionsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Alertsuspensions"
+    _route = "Computers/{id}/Alertsuspensions"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def maintenancewindow(self) -> "AsyncComputersIdAlertsuspensionsMaintenancewindowEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdAlertsuspensionsMaintenancewindowEndpoint"
+        )
+
+    @cached_property
+    def templatediversion(self) -> "AsyncComputersIdAlertsuspensionsTemplatediversionEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdAlertsuspensionsTemplatediversionEndpoint"
+        )
@@ -0,0 +1,46 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechComputerPatchingPolicy
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncComputersIdComputerpatchingpoliciesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Computerpatchingpolicies"
+    _route = "Computers/{id}/Computerpatchingpolicies"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[LabTechComputerPatchingPolicy]:
+        """
+        Performs a GET request against the /Computers/{id}/Computerpatchingpolicies endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[LabTechComputerPatchingPolicy]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(LabTechComputerPatchingPolicy, page, page_size, params, forward_only)
+
+    async def get(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> list[LabTechComputerPatchingPolicy]:
+        """
+        Performs a GET request against the /Computers/{id}/Computerpatchingpolicies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechComputerPatchingPolicy]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechComputerPatchingPolicy, (await super()._make_request("GET", data=data, params=params)).content
+        )
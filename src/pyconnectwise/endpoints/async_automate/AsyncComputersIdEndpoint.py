@@ -0,0 +1,235 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechComputer
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdAlertsEndpoint import AsyncComputersIdAlertsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdAlertsuspensionsEndpoint import \
+        AsyncComputersIdAlertsuspensionsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdBiosEndpoint import AsyncComputersIdBiosEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdCommandexecuteEndpoint import \
+        AsyncComputersIdCommandexecuteEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdCommandhistoryEndpoint import \
+        AsyncComputersIdCommandhistoryEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdComputerpatchingpoliciesEndpoint import \
+        AsyncComputersIdComputerpatchingpoliciesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdDevicesEndpoint import AsyncComputersIdDevicesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdDriversEndpoint import AsyncComputersIdDriversEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdDrivesEndpoint import AsyncComputersIdDrivesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdEffectivepatchingpolicyEndpoint import \
+        AsyncComputersIdEffectivepatchingpolicyEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdMicrosoftupdatesEndpoint import \
+        AsyncComputersIdMicrosoftupdatesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdMonitoralertsuspensionsEndpoint import \
+        AsyncComputersIdMonitoralertsuspensionsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdMonitorsEndpoint import AsyncComputersIdMonitorsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdOperatingsystemEndpoint import \
+        AsyncComputersIdOperatingsystemEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdPatchingstatsEndpoint import \
+        AsyncComputersIdPatchingstatsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdPatchjobsEndpoint import \
+        AsyncComputersIdPatchjobsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdPrintersEndpoint import AsyncComputersIdPrintersEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdProcessorsEndpoint import \
+        AsyncComputersIdProcessorsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdRunningscriptsEndpoint import \
+        AsyncComputersIdRunningscriptsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdScheduledscriptsEndpoint import \
+        AsyncComputersIdScheduledscriptsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdScheduledtasksEndpoint import \
+        AsyncComputersIdScheduledtasksEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdScripthistoryEndpoint import \
+        AsyncComputersIdScripthistoryEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdSensorsEndpoint import AsyncComputersIdSensorsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdServicesEndpoint import AsyncComputersIdServicesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdSoftwareEndpoint import AsyncComputersIdSoftwareEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdSystemslotsEndpoint import \
+        AsyncComputersIdSystemslotsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdThirdpartypatchesEndpoint import \
+        AsyncComputersIdThirdpartypatchesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdUpsEndpoint import AsyncComputersIdUpsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncComputersIdVideocardsEndpoint import \
+        AsyncComputersIdVideocardsEndpoint
+
+
+class AsyncComputersIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Computers/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[LabTechComputer]:
+        """
+        Performs a GET request against the /Computers/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[LabTechComputer]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(LabTechComputer, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechComputer:
+        """
+        Performs a GET request against the /Computers/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechComputer: The parsed response data.
+        """
+        return self._parse_one(LabTechComputer, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def drivers(self) -> "AsyncComputersIdDriversEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdDriversEndpoint")
+
+    @cached_property
+    def patchjobs(self) -> "AsyncComputersIdPatchjobsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdPatchjobsEndpoint")
+
+    @cached_property
+    def printers(self) -> "AsyncComputersIdPrintersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdPrintersEndpoint")
+
+    @cached_property
+    def services(self) -> "AsyncComputersIdServicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdServicesEndpoint")
+
+    @cached_property
+    def sensors(self) -> "AsyncComputersIdSensorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdSensorsEndpoint")
+
+    @cached_property
+    def scheduledtasks(self) -> "AsyncComputersIdScheduledtasksEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdScheduledtasksEndpoint"
+        )
+
+    @cached_property
+    def scripthistory(self) -> "AsyncComputersIdScripthistoryEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdScripthistoryEndpoint"
+        )
+
+    @cached_property
+    def patchingstats(self) -> "AsyncComputersIdPatchingstatsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdPatchingstatsEndpoint"
+        )
+
+    @cached_property
+    def drives(self) -> "AsyncComputersIdDrivesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdDrivesEndpoint")
+
+    @cached_property
+    def systemslots(self) -> "AsyncComputersIdSystemslotsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdSystemslotsEndpoint")
+
+    @cached_property
+    def ups(self) -> "AsyncComputersIdUpsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdUpsEndpoint")
+
+    @cached_property
+    def monitors(self) -> "AsyncComputersIdMonitorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdMonitorsEndpoint")
+
+    @cached_property
+    def microsoftupdates(self) -> "AsyncComputersIdMicrosoftupdatesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdMicrosoftupdatesEndpoint"
+        )
+
+    @cached_property
+    def effectivepatchingpolicy(self) -> "AsyncComputersIdEffectivepatchingpolicyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdEffectivepatchingpolicyEndpoint"
+        )
+
+    @cached_property
+    def alerts(self) -> "AsyncComputersIdAlertsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdAlertsEndpoint")
+
+    @cached_property
+    def thirdpartypatches(self) -> "AsyncComputersIdThirdpartypatchesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdThirdpartypatchesEndpoint"
+        )
+
+    @cached_property
+    def videocards(self) -> "AsyncComputersIdVideocardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdVideocardsEndpoint")
+
+    @cached_property
+    def runningscripts(self) -> "AsyncComputersIdRunningscriptsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdRunningscriptsEndpoint"
+        )
+
+    @cached_property
+    def alertsuspensions(self) -> "AsyncComputersIdAlertsuspensionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdAlertsuspensionsEndpoint"
+        )
+
+    @cached_property
+    def commandhistory(self) -> "AsyncComputersIdCommandhistoryEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdCommandhistoryEndpoint"
+        )
+
+    @cached_property
+    def commandexecute(self) -> "AsyncComputersIdCommandexecuteEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdCommandexecuteEndpoint"
+        )
+
+    @cached_property
+    def monitoralertsuspensions(self) -> "AsyncComputersIdMonitoralertsuspensionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdMonitoralertsuspensionsEndpoint"
+        )
+
+    @cached_property
+    def operatingsystem(self) -> "AsyncComputersIdOperatingsystemEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdOperatingsystemEndpoint"
+        )
+
+    @cached_property
+    def software(self) -> "AsyncComputersIdSoftwareEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdSoftwareEndpoint")
+
+    @cached_property
+    def devices(self) -> "AsyncComputersIdDevicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdDevicesEndpoint")
+
+    @cached_property
+    def computerpatchingpolicies(self) -> "AsyncComputersIdComputerpatchingpoliciesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdComputerpatchingpoliciesEndpoint"
+        )
+
+    @cached_property
+    def scheduledscripts(self) -> "AsyncComputersIdScheduledscriptsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncComputersIdScheduledscriptsEndpoint"
+        )
+
+    @cached_property
+    def processors(self) -> "AsyncComputersIdProcessorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdProcessorsEndpoint")
+
+    @cached_property
+    def bios(self) -> "AsyncComputersIdBiosEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncComputersIdBiosEndpoint")
@@ -0,0 +1,23 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncComputersIdSoftwareIdUninstallEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Uninstall"
+    _route = "Computers/{id}/Software/{id}/Uninstall"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a POST request against the /Computers/{id}/Software/{id}/Uninstall endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("POST", data=data, params=params)
@@ -0,0 +1,27 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncDrivesIdEndpoint import AsyncDrivesIdEndpoint
+
+
+class AsyncDrivesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Drives"
+    _route = "Drives"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncDrivesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncDrivesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncDrivesIdEndpoint: The AsyncDrivesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncDrivesIdEndpoint", id)
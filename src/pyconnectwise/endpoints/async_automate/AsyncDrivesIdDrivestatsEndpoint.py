@@ -0,0 +1,47 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncDrivesIdDrivestatsDailyEndpoint import \
+        AsyncDrivesIdDrivestatsDailyEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncDrivesIdDrivestatsMonthlyEndpoint import \
+        AsyncDrivesIdDrivestatsMonthlyEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncDrivesIdDrivestatsWeeklyEndpoint import \
+        AsyncDrivesIdDrivestatsWeeklyEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncDrivesIdDrivestatsYearlyEndpoint import \
+        AsyncDrivesIdDrivestatsYearlyEndpoint
+
+
+class AsyncDrivesIdDrivestatsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Drivestats"
+    _route = "Drives/{id}/Drivestats"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def yearly(self) -> "AsyncDrivesIdDrivestatsYearlyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncDrivesIdDrivestatsYearlyEndpoint"
+        )
+
+    @cached_property
+    def daily(self) -> "AsyncDrivesIdDrivestatsDailyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncDrivesIdDrivestatsDailyEndpoint"
+        )
+
+    @cached_property
+    def monthly(self) -> "AsyncDrivesIdDrivestatsMonthlyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncDrivesIdDrivestatsMonthlyEndpoint"
+        )
+
+    @cached_property
+    def weekly(self) -> "AsyncDrivesIdDrivestatsWeeklyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncDrivesIdDrivestatsWeeklyEndpoint"
+        )
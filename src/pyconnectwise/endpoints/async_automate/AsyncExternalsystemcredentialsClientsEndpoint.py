@@ -0,0 +1,30 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncExternalsystemcredentialsClientsIdEndpoint import \
+        AsyncExternalsystemcredentialsClientsIdEndpoint
+
+
+class AsyncExternalsystemcredentialsClientsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Clients"
+    _route = "Externalsystemcredentials/Clients"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncExternalsystemcredentialsClientsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncExternalsystemcredentialsClientsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncExternalsystemcredentialsClientsIdEndpoint: The AsyncExternalsystemcredentialsClientsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_automate.AsyncExternalsystemcredentialsClientsIdEndpoint", id
+        )
@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechFeatureFlag
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncFeatureflagsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Featureflags"
+    _route = "Featureflags"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechFeatureFlag:
+        """
+        Performs a POST request against the /Featureflags endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechFeatureFlag: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechFeatureFlag, (await super()._make_request("POST", data=data, params=params)).content
+        )
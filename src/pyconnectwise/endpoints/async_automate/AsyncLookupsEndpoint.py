@@ -0,0 +1,51 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncLookupsProbeeventlevelsEndpoint import \
+        AsyncLookupsProbeeventlevelsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncLookupsScanfrequenciesEndpoint import \
+        AsyncLookupsScanfrequenciesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncLookupsSnmpencryptionmethodsEndpoint import \
+        AsyncLookupsSnmpencryptionmethodsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncLookupsSnmphashmethodsEndpoint import \
+        AsyncLookupsSnmphashmethodsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncLookupsStatusscannetworkportoptionsEndpoint import \
+        AsyncLookupsStatusscannetworkportoptionsEndpoint
+
+
+class AsyncLookupsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Lookups"
+    _route = "Lookups"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def scanfrequencies(self) -> "AsyncLookupsScanfrequenciesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncLookupsScanfrequenciesEndpoint")
+
+    @cached_property
+    def probeeventlevels(self) -> "AsyncLookupsProbeeventlevelsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncLookupsProbeeventlevelsEndpoint"
+        )
+
+    @cached_property
+    def snmpencryptionmethods(self) -> "AsyncLookupsSnmpencryptionmethodsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncLookupsSnmpencryptionmethodsEndpoint"
+        )
+
+    @cached_property
+    def snmphashmethods(self) -> "AsyncLookupsSnmphashmethodsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncLookupsSnmphashmethodsEndpoint")
+
+    @cached_property
+    def statusscannetworkportoptions(self) -> "AsyncLookupsStatusscannetworkportoptionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncLookupsStatusscannetworkportoptionsEndpoint"
+        )
@@ -0,0 +1,44 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechEncryptionMethod
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncLookupsSnmpencryptionmethodsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Snmpencryptionmethods"
+    _route = "Lookups/Snmpencryptionmethods"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[LabTechEncryptionMethod]:
+        """
+        Performs a GET request against the /Lookups/Snmpencryptionmethods endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[LabTechEncryptionMethod]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(LabTechEncryptionMethod, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechEncryptionMethod]:
+        """
+        Performs a GET request against the /Lookups/Snmpencryptionmethods endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechEncryptionMethod]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechEncryptionMethod, (await super()._make_request("GET", data=data, params=params)).content
+        )
@@ -0,0 +1,47 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataDailyaveragesEndpoint import \
+        AsyncMonitorsIdCollecteddataDailyaveragesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataMonthlyaveragesEndpoint import \
+        AsyncMonitorsIdCollecteddataMonthlyaveragesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataWeeklyaveragesEndpoint import \
+        AsyncMonitorsIdCollecteddataWeeklyaveragesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataYearlyaveragesEndpoint import \
+        AsyncMonitorsIdCollecteddataYearlyaveragesEndpoint
+
+
+class AsyncMonitorsIdCollecteddataEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Collecteddata"
+    _route = "Monitors/{id}/Collecteddata"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def dailyaverages(self) -> "AsyncMonitorsIdCollecteddataDailyaveragesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataDailyaveragesEndpoint"
+        )
+
+    @cached_property
+    def monthlyaverages(self) -> "AsyncMonitorsIdCollecteddataMonthlyaveragesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataMonthlyaveragesEndpoint"
+        )
+
+    @cached_property
+    def weeklyaverages(self) -> "AsyncMonitorsIdCollecteddataWeeklyaveragesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataWeeklyaveragesEndpoint"
+        )
+
+    @cached_property
+    def yearlyaverages(self) -> "AsyncMonitorsIdCollecteddataYearlyaveragesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataYearlyaveragesEndpoint"
+        )
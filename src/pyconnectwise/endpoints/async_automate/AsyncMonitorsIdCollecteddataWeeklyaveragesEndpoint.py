@@ -0,0 +1,13 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncMonitorsIdCollecteddataWeeklyaveragesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Weeklyaverages"
+    _route = "Monitors/{id}/Collecteddata/Weeklyaverages"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataEndpoint import \
+        AsyncMonitorsIdCollecteddataEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncMonitorsIdDatacollectionsettingsEndpoint import \
+        AsyncMonitorsIdDatacollectionsettingsEndpoint
+
+
+class AsyncMonitorsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Monitors/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def collecteddata(self) -> "AsyncMonitorsIdCollecteddataEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncMonitorsIdCollecteddataEndpoint"
+        )
+
+    @cached_property
+    def datacollectionsettings(self) -> "AsyncMonitorsIdDatacollectionsettingsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncMonitorsIdDatacollectionsettingsEndpoint"
+        )
@@ -0,0 +1,63 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncPatchactionsDeployallapprovedEndpoint import \
+        AsyncPatchactionsDeployallapprovedEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncPatchactionsDeployallsecurityEndpoint import \
+        AsyncPatchactionsDeployallsecurityEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncPatchactionsReattemptfailedEndpoint import \
+        AsyncPatchactionsReattemptfailedEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncPatchactionsSettopilotstageEndpoint import \
+        AsyncPatchactionsSettopilotstageEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncPatchactionsSettoproductionstageEndpoint import \
+        AsyncPatchactionsSettoproductionstageEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncPatchactionsSettoteststageEndpoint import \
+        AsyncPatchactionsSettoteststageEndpoint
+
+
+class AsyncPatchactionsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Patchactions"
+    _route = "Patchactions"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def deployallapproved(self) -> "AsyncPatchactionsDeployallapprovedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncPatchactionsDeployallapprovedEndpoint"
+        )
+
+    @cached_property
+    def settoteststage(self) -> "AsyncPatchactionsSettoteststageEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncPatchactionsSettoteststageEndpoint"
+        )
+
+    @cached_property
+    def settoproductionstage(self) -> "AsyncPatchactionsSettoproductionstageEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncPatchactionsSettoproductionstageEndpoint"
+        )
+
+    @cached_property
+    def deployallsecurity(self) -> "AsyncPatchactionsDeployallsecurityEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncPatchactionsDeployallsecurityEndpoint"
+        )
+
+    @cached_property
+    def settopilotstage(self) -> "AsyncPatchactionsSettopilotstageEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncPatchactionsSettopilotstageEndpoint"
+        )
+
+    @cached_property
+    def reattemptfailed(self) -> "AsyncPatchactionsReattemptfailedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncPatchactionsReattemptfailedEndpoint"
+        )
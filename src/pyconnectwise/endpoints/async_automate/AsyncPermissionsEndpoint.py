@@ -0,0 +1,25 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncPermissionsClientsEndpoint import AsyncPermissionsClientsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncPermissionsUsersEndpoint import AsyncPermissionsUsersEndpoint
+
+
+class AsyncPermissionsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Permissions"
+    _route = "Permissions"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def users(self) -> "AsyncPermissionsUsersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncPermissionsUsersEndpoint")
+
+    @cached_property
+    def clients(self) -> "AsyncPermissionsClientsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncPermissionsClientsEndpoint")
@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationEnableprobeIdEndpoint import \
+        AsyncProbeconfigurationEnableprobeIdEndpoint
+
+
+class AsyncProbeconfigurationEnableprobeEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Enableprobe"
+    _route = "Probeconfiguration/Enableprobe"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProbeconfigurationEnableprobeIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProbeconfigurationEnableprobeIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProbeconfigurationEnableprobeIdEndpoint: The AsyncProbeconfigurationEnableprobeIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationEnableprobeIdEndpoint", id)
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationEnableprobeEndpoint import \
+        AsyncProbeconfigurationEnableprobeEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationIdEndpoint import \
+        AsyncProbeconfigurationIdEndpoint
+
+
+class AsyncProbeconfigurationEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Probeconfiguration"
+    _route = "Probeconfiguration"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProbeconfigurationIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProbeconfigurationIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProbeconfigurationIdEndpoint: The AsyncProbeconfigurationIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationIdEndpoint", id)
+
+    @cached_property
+    def enableprobe(self) -> "AsyncProbeconfigurationEnableprobeEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationEnableprobeEndpoint"
+        )
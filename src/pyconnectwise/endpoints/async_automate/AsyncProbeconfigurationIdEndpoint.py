@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationIdAgentpushcredentialsEndpoint import \
+        AsyncProbeconfigurationIdAgentpushcredentialsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationIdSnmpconfigurationEndpoint import \
+        AsyncProbeconfigurationIdSnmpconfigurationEndpoint
+
+
+class AsyncProbeconfigurationIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Probeconfiguration/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def agentpushcredentials(self) -> "AsyncProbeconfigurationIdAgentpushcredentialsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationIdAgentpushcredentialsEndpoint"
+        )
+
+    @cached_property
+    def snmpconfiguration(self) -> "AsyncProbeconfigurationIdSnmpconfigurationEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncProbeconfigurationIdSnmpconfigurationEndpoint"
+        )
@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncScriptingRunningscriptsEndpoint import \
+        AsyncScriptingRunningscriptsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncScriptingScriptschedulesEndpoint import \
+        AsyncScriptingScriptschedulesEndpoint
+
+
+class AsyncScriptingEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Scripting"
+    _route = "Scripting"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def scriptschedules(self) -> "AsyncScriptingScriptschedulesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncScriptingScriptschedulesEndpoint"
+        )
+
+    @cached_property
+    def runningscripts(self) -> "AsyncScriptingRunningscriptsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_automate.AsyncScriptingRunningscriptsEndpoint"
+        )
@@ -0,0 +1,46 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateScript
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncScriptsIdEndpoint import AsyncScriptsIdEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncScriptsScriptfoldersEndpoint import \
+        AsyncScriptsScriptfoldersEndpoint
+
+
+class AsyncScriptsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Scripts"
+    _route = "Scripts"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncScriptsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncScriptsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncScriptsIdEndpoint: The AsyncScriptsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncScriptsIdEndpoint", id)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateScript:
+        """
+        Performs a POST request against the /Scripts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateScript: The parsed response data.
+        """
+        return self._parse_one(AutomateScript, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def scriptfolders(self) -> "AsyncScriptsScriptfoldersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncScriptsScriptfoldersEndpoint")
@@ -0,0 +1,55 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateScript
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncScriptsIdCopyEndpoint import AsyncScriptsIdCopyEndpoint
+
+
+class AsyncScriptsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Scripts/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateScript:
+        """
+        Performs a GET request against the /Scripts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateScript: The parsed response data.
+        """
+        return self._parse_one(AutomateScript, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateScript:
+        """
+        Performs a PUT request against the /Scripts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateScript: The parsed response data.
+        """
+        return self._parse_one(AutomateScript, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /Scripts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def copy(self) -> "AsyncScriptsIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncScriptsIdCopyEndpoint")
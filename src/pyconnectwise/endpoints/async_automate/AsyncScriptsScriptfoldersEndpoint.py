@@ -0,0 +1,45 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateSubmittableScriptFolder
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncScriptsScriptfoldersIdEndpoint import \
+        AsyncScriptsScriptfoldersIdEndpoint
+
+
+class AsyncScriptsScriptfoldersEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Scriptfolders"
+    _route = "Scripts/Scriptfolders"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncScriptsScriptfoldersIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncScriptsScriptfoldersIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncScriptsScriptfoldersIdEndpoint: The AsyncScriptsScriptfoldersIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncScriptsScriptfoldersIdEndpoint", id)
+
+    async def post(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> AutomateSubmittableScriptFolder:
+        """
+        Performs a POST request against the /Scripts/Scriptfolders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateSubmittableScriptFolder: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateSubmittableScriptFolder, (await super()._make_request("POST", data=data, params=params)).content
+        )
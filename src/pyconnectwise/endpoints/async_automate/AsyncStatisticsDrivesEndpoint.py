@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechDriveStatistics
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncStatisticsDrivesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Drives"
+    _route = "Statistics/Drives"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechDriveStatistics]:
+        """
+        Performs a GET request against the /Statistics/Drives endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechDriveStatistics]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechDriveStatistics, (await super()._make_request("GET", data=data, params=params)).content
+        )
@@ -0,0 +1,48 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateUserClassWebExtensionViewModel
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncUserclassesIdWebextensionsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Webextensions"
+    _route = "Userclasses/{id}/Webextensions"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def get(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> list[AutomateUserClassWebExtensionViewModel]:
+        """
+        Performs a GET request against the /Userclasses/{id}/Webextensions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AutomateUserClassWebExtensionViewModel]: The parsed response data.
+        """
+        return self._parse_many(
+            AutomateUserClassWebExtensionViewModel,
+            (await super()._make_request("GET", data=data, params=params)).content,
+        )
+
+    async def put(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> list[AutomateUserClassWebExtensionViewModel]:
+        """
+        Performs a PUT request against the /Userclasses/{id}/Webextensions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AutomateUserClassWebExtensionViewModel]: The parsed response data.
+        """
+        return self._parse_many(
+            AutomateUserClassWebExtensionViewModel,
+            (await super()._make_request("PUT", data=data, params=params)).content,
+        )
@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechUserProfile
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncUserprofilesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Userprofiles"
+    _route = "Userprofiles"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechUserProfile:
+        """
+        Performs a GET request against the /Userprofiles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechUserProfile: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechUserProfile, (await super()._make_request("GET", data=data, params=params)).content
+        )
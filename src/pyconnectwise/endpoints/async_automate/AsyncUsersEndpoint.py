@@ -0,0 +1,45 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateUser
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncUsersFoldersEndpoint import AsyncUsersFoldersEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncUsersIdEndpoint import AsyncUsersIdEndpoint
+
+
+class AsyncUsersEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Users"
+    _route = "Users"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncUsersIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncUsersIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncUsersIdEndpoint: The AsyncUsersIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncUsersIdEndpoint", id)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUser:
+        """
+        Performs a POST request against the /Users endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUser: The parsed response data.
+        """
+        return self._parse_one(AutomateUser, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def folders(self) -> "AsyncUsersFoldersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncUsersFoldersEndpoint")
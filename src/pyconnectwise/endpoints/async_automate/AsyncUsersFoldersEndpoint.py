@@ -0,0 +1,42 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateUserFolder
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncUsersFoldersIdEndpoint import AsyncUsersFoldersIdEndpoint
+
+
+class AsyncUsersFoldersEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Folders"
+    _route = "Users/Folders"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncUsersFoldersIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncUsersFoldersIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncUsersFoldersIdEndpoint: The AsyncUsersFoldersIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_automate.AsyncUsersFoldersIdEndpoint", id)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUserFolder:
+        """
+        Performs a POST request against the /Users/Folders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUserFolder: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateUserFolder, (await super()._make_request("POST", data=data, params=params)).content
+        )
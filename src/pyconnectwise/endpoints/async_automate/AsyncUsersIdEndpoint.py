@@ -0,0 +1,92 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateUser
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_automate.AsyncUsersIdAuthlinkEndpoint import AsyncUsersIdAuthlinkEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncUsersIdChangepasswordEndpoint import \
+        AsyncUsersIdChangepasswordEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncUsersIdFavoritesEndpoint import AsyncUsersIdFavoritesEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncUsersIdSettingsEndpoint import AsyncUsersIdSettingsEndpoint
+    from pyconnectwise.endpoints.async_automate.AsyncUsersIdUseraccessEndpoint import AsyncUsersIdUseraccessEndpoint
+
+
+class AsyncUsersIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Users/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[AutomateUser]:
+        """
+        Performs a GET request against the /Users/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[AutomateUser]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(AutomateUser, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUser:
+        """
+        Performs a GET request against the /Users/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUser: The parsed response data.
+        """
+        return self._parse_one(AutomateUser, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /Users/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUser:
+        """
+        Performs a PATCH request against the /Users/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUser: The parsed response data.
+        """
+        return self._parse_one(AutomateUser, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def settings(self) -> "AsyncUsersIdSettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncUsersIdSettingsEndpoint")
+
+    @cached_property
+    def useraccess(self) -> "AsyncUsersIdUseraccessEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncUsersIdUseraccessEndpoint")
+
+    @cached_property
+    def authlink(self) -> "AsyncUsersIdAuthlinkEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncUsersIdAuthlinkEndpoint")
+
+    @cached_property
+    def favorites(self) -> "AsyncUsersIdFavoritesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncUsersIdFavoritesEndpoint")
+
+    @cached_property
+    def changepassword(self) -> "AsyncUsersIdChangepasswordEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_automate.AsyncUsersIdChangepasswordEndpoint")
@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.automate import AutomateUserAccess
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncUsersIdUseraccessEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "Useraccess"
+    _route = "Users/{id}/Useraccess"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUserAccess:
+        """
+        Performs a GET request against the /Users/{id}/Useraccess endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUserAccess: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateUserAccess, (await super()._make_request("GET", data=data, params=params)).content
+        )
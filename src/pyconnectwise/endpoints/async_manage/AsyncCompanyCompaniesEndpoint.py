@@ -0,0 +1,97 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Company
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesCountEndpoint import \
+        AsyncCompanyCompaniesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesDefaultEndpoint import \
+        AsyncCompanyCompaniesDefaultEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdEndpoint import AsyncCompanyCompaniesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesInfoEndpoint import AsyncCompanyCompaniesInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesStatusesEndpoint import \
+        AsyncCompanyCompaniesStatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesTypesEndpoint import \
+        AsyncCompanyCompaniesTypesEndpoint
+
+
+class AsyncCompanyCompaniesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "companies"
+    _route = "company/companies"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncCompanyCompaniesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncCompanyCompaniesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncCompanyCompaniesIdEndpoint: The AsyncCompanyCompaniesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Company]:
+        """
+        Performs a GET request against the /company/companies endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Company]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Company, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Company]:
+        """
+        Performs a GET request against the /company/companies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Company]: The parsed response data.
+        """
+        return self._parse_many(Company, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Company:
+        """
+        Performs a POST request against the /company/companies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Company: The parsed response data.
+        """
+        return self._parse_one(Company, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def info(self) -> "AsyncCompanyCompaniesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesInfoEndpoint")
+
+    @cached_property
+    def types(self) -> "AsyncCompanyCompaniesTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "AsyncCompanyCompaniesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesCountEndpoint")
+
+    @cached_property
+    def default(self) -> "AsyncCompanyCompaniesDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesDefaultEndpoint")
+
+    @cached_property
+    def statuses(self) -> "AsyncCompanyCompaniesStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesStatusesEndpoint")
@@ -0,0 +1,168 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Company
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdCustomstatusnotesEndpoint import \
+        AsyncCompanyCompaniesIdCustomstatusnotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdGroupsEndpoint import \
+        AsyncCompanyCompaniesIdGroupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdManagementreportnotificationsEndpoint import \
+        AsyncCompanyCompaniesIdManagementreportnotificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdManagementreportsetupEndpoint import \
+        AsyncCompanyCompaniesIdManagementreportsetupEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdManagementsummaryreportsEndpoint import \
+        AsyncCompanyCompaniesIdManagementsummaryreportsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdMergeEndpoint import \
+        AsyncCompanyCompaniesIdMergeEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdNotesEndpoint import \
+        AsyncCompanyCompaniesIdNotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdSitesEndpoint import \
+        AsyncCompanyCompaniesIdSitesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdSurveysEndpoint import \
+        AsyncCompanyCompaniesIdSurveysEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdTeamsEndpoint import \
+        AsyncCompanyCompaniesIdTeamsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdTracksEndpoint import \
+        AsyncCompanyCompaniesIdTracksEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdTypeassociationsEndpoint import \
+        AsyncCompanyCompaniesIdTypeassociationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdUsagesEndpoint import \
+        AsyncCompanyCompaniesIdUsagesEndpoint
+
+
+class AsyncCompanyCompaniesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/companies/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Company]:
+        """
+        Performs a GET request against the /company/companies/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Company]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Company, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Company:
+        """
+        Performs a GET request against the /company/companies/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Company: The parsed response data.
+        """
+        return self._parse_one(Company, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /company/companies/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Company:
+        """
+        Performs a PUT request against the /company/companies/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Company: The parsed response data.
+        """
+        return self._parse_one(Company, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Company:
+        """
+        Performs a PATCH request against the /company/companies/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Company: The parsed response data.
+        """
+        return self._parse_one(Company, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def management_report_notifications(self) -> "AsyncCompanyCompaniesIdManagementreportnotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdManagementreportnotificationsEndpoint"
+        )
+
+    @cached_property
+    def groups(self) -> "AsyncCompanyCompaniesIdGroupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdGroupsEndpoint")
+
+    @cached_property
+    def custom_status_notes(self) -> "AsyncCompanyCompaniesIdCustomstatusnotesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdCustomstatusnotesEndpoint"
+        )
+
+    @cached_property
+    def surveys(self) -> "AsyncCompanyCompaniesIdSurveysEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdSurveysEndpoint"
+        )
+
+    @cached_property
+    def teams(self) -> "AsyncCompanyCompaniesIdTeamsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdTeamsEndpoint")
+
+    @cached_property
+    def type_associations(self) -> "AsyncCompanyCompaniesIdTypeassociationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdTypeassociationsEndpoint"
+        )
+
+    @cached_property
+    def merge(self) -> "AsyncCompanyCompaniesIdMergeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdMergeEndpoint")
+
+    @cached_property
+    def management_report_setup(self) -> "AsyncCompanyCompaniesIdManagementreportsetupEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdManagementreportsetupEndpoint"
+        )
+
+    @cached_property
+    def notes(self) -> "AsyncCompanyCompaniesIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdNotesEndpoint")
+
+    @cached_property
+    def usages(self) -> "AsyncCompanyCompaniesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdUsagesEndpoint")
+
+    @cached_property
+    def management_summary_reports(self) -> "AsyncCompanyCompaniesIdManagementsummaryreportsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdManagementsummaryreportsEndpoint"
+        )
+
+    @cached_property
+    def sites(self) -> "AsyncCompanyCompaniesIdSitesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdSitesEndpoint")
+
+    @cached_property
+    def tracks(self) -> "AsyncCompanyCompaniesIdTracksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesIdTracksEndpoint")
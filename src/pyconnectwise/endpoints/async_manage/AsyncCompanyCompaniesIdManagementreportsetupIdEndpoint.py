@@ -0,0 +1,42 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import ManagementReportSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncCompanyCompaniesIdManagementreportsetupIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/companies/{id}/managementReportSetup/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagementReportSetup:
+        """
+        Performs a PUT request against the /company/companies/{id}/managementReportSetup/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementReportSetup: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementReportSetup, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagementReportSetup:
+        """
+        Performs a PATCH request against the /company/companies/{id}/managementReportSetup/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementReportSetup: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementReportSetup, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompanyfinanceIdEndpoint import \
+        AsyncCompanyCompanyfinanceIdEndpoint
+
+
+class AsyncCompanyCompanyfinanceEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "companyFinance"
+    _route = "company/companyFinance"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncCompanyCompanyfinanceIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncCompanyCompanyfinanceIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncCompanyCompanyfinanceIdEndpoint: The AsyncCompanyCompanyfinanceIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncCompanyCompanyfinanceIdEndpoint", id)
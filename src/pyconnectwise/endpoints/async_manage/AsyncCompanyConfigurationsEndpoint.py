@@ -0,0 +1,105 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import CompanyConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsBulkEndpoint import \
+        AsyncCompanyConfigurationsBulkEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsCountEndpoint import \
+        AsyncCompanyConfigurationsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsIdEndpoint import \
+        AsyncCompanyConfigurationsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsStatusesEndpoint import \
+        AsyncCompanyConfigurationsStatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsTypesEndpoint import \
+        AsyncCompanyConfigurationsTypesEndpoint
+
+
+class AsyncCompanyConfigurationsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "configurations"
+    _route = "company/configurations"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncCompanyConfigurationsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncCompanyConfigurationsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncCompanyConfigurationsIdEndpoint: The AsyncCompanyConfigurationsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[CompanyConfiguration]:
+        """
+        Performs a GET request against the /company/configurations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[CompanyConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(CompanyConfiguration, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyConfiguration]:
+        """
+        Performs a GET request against the /company/configurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyConfiguration]: The parsed response data.
+        """
+        return self._parse_many(
+            CompanyConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyConfiguration:
+        """
+        Performs a POST request against the /company/configurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def bulk(self) -> "AsyncCompanyConfigurationsBulkEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsBulkEndpoint"
+        )
+
+    @cached_property
+    def types(self) -> "AsyncCompanyConfigurationsTypesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsTypesEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "AsyncCompanyConfigurationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsCountEndpoint"
+        )
+
+    @cached_property
+    def statuses(self) -> "AsyncCompanyConfigurationsStatusesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsStatusesEndpoint"
+        )
@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import CompanyConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncCompanyConfigurationsIdChangetypeEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "changeType"
+    _route = "company/configurations/{id}/changeType"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyConfiguration:
+        """
+        Performs a PATCH request against the /company/configurations/{id}/changeType endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyConfiguration, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
@@ -0,0 +1,116 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Contact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsCountEndpoint import AsyncCompanyContactsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsDefaultEndpoint import \
+        AsyncCompanyContactsDefaultEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsDepartmentsEndpoint import \
+        AsyncCompanyContactsDepartmentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdEndpoint import AsyncCompanyContactsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsRelationshipsEndpoint import \
+        AsyncCompanyContactsRelationshipsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsRequestpasswordEndpoint import \
+        AsyncCompanyContactsRequestpasswordEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsTypesEndpoint import AsyncCompanyContactsTypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsValidateportalcredentialsEndpoint import \
+        AsyncCompanyContactsValidateportalcredentialsEndpoint
+
+
+class AsyncCompanyContactsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "contacts"
+    _route = "company/contacts"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncCompanyContactsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncCompanyContactsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncCompanyContactsIdEndpoint: The AsyncCompanyContactsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Contact]:
+        """
+        Performs a GET request against the /company/contacts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Contact]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Contact, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Contact]:
+        """
+        Performs a GET request against the /company/contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Contact]: The parsed response data.
+        """
+        return self._parse_many(Contact, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Contact:
+        """
+        Performs a POST request against the /company/contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Contact: The parsed response data.
+        """
+        return self._parse_one(Contact, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def request_password(self) -> "AsyncCompanyContactsRequestpasswordEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsRequestpasswordEndpoint"
+        )
+
+    @cached_property
+    def relationships(self) -> "AsyncCompanyContactsRelationshipsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsRelationshipsEndpoint"
+        )
+
+    @cached_property
+    def types(self) -> "AsyncCompanyContactsTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "AsyncCompanyContactsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsCountEndpoint")
+
+    @cached_property
+    def departments(self) -> "AsyncCompanyContactsDepartmentsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsDepartmentsEndpoint"
+        )
+
+    @cached_property
+    def validate_portal_credentials(self) -> "AsyncCompanyContactsValidateportalcredentialsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsValidateportalcredentialsEndpoint"
+        )
+
+    @cached_property
+    def default(self) -> "AsyncCompanyContactsDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsDefaultEndpoint")
@@ -0,0 +1,132 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Contact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdCommunicationsEndpoint import \
+        AsyncCompanyContactsIdCommunicationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdGroupsEndpoint import \
+        AsyncCompanyContactsIdGroupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdImageEndpoint import \
+        AsyncCompanyContactsIdImageEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdNotesEndpoint import \
+        AsyncCompanyContactsIdNotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdPortalsecurityEndpoint import \
+        AsyncCompanyContactsIdPortalsecurityEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdTracksEndpoint import \
+        AsyncCompanyContactsIdTracksEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdTypeassociationsEndpoint import \
+        AsyncCompanyContactsIdTypeassociationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdUsagesEndpoint import \
+        AsyncCompanyContactsIdUsagesEndpoint
+
+
+class AsyncCompanyContactsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/contacts/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Contact]:
+        """
+        Performs a GET request against the /company/contacts/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Contact]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Contact, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Contact:
+        """
+        Performs a GET request against the /company/contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Contact: The parsed response data.
+        """
+        return self._parse_one(Contact, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /company/contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Contact:
+        """
+        Performs a PUT request against the /company/contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Contact: The parsed response data.
+        """
+        return self._parse_one(Contact, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Contact:
+        """
+        Performs a PATCH request against the /company/contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Contact: The parsed response data.
+        """
+        return self._parse_one(Contact, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def communications(self) -> "AsyncCompanyContactsIdCommunicationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdCommunicationsEndpoint"
+        )
+
+    @cached_property
+    def portal_security(self) -> "AsyncCompanyContactsIdPortalsecurityEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdPortalsecurityEndpoint"
+        )
+
+    @cached_property
+    def groups(self) -> "AsyncCompanyContactsIdGroupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdGroupsEndpoint")
+
+    @cached_property
+    def image(self) -> "AsyncCompanyContactsIdImageEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdImageEndpoint")
+
+    @cached_property
+    def type_associations(self) -> "AsyncCompanyContactsIdTypeassociationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdTypeassociationsEndpoint"
+        )
+
+    @cached_property
+    def notes(self) -> "AsyncCompanyContactsIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdNotesEndpoint")
+
+    @cached_property
+    def usages(self) -> "AsyncCompanyContactsIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdUsagesEndpoint")
+
+    @cached_property
+    def tracks(self) -> "AsyncCompanyContactsIdTracksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsIdTracksEndpoint")
@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsyncCompanyEndpoint import \
+        AsyncCompanyContactsyncCompanyEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsyncCompanysyncEndpoint import \
+        AsyncCompanyContactsyncCompanysyncEndpoint
+
+
+class AsyncCompanyContactsyncEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "contactsync"
+    _route = "company/contactsync"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def companysync(self) -> "AsyncCompanyContactsyncCompanysyncEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsyncCompanysyncEndpoint"
+        )
+
+    @cached_property
+    def company(self) -> "AsyncCompanyContactsyncCompanyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContactsyncCompanyEndpoint"
+        )
@@ -0,0 +1,210 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyAddressformatsEndpoint import \
+        AsyncCompanyAddressformatsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyBillingsetupsEndpoint import AsyncCompanyBillingsetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCommunicationtypesEndpoint import \
+        AsyncCompanyCommunicationtypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesEndpoint import AsyncCompanyCompaniesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompanyfinanceEndpoint import \
+        AsyncCompanyCompanyfinanceEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompanypickeritemsEndpoint import \
+        AsyncCompanyCompanypickeritemsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCompanytypeassociationsEndpoint import \
+        AsyncCompanyCompanytypeassociationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsEndpoint import \
+        AsyncCompanyConfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactEndpoint import AsyncCompanyContactEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsEndpoint import AsyncCompanyContactsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContactsyncEndpoint import AsyncCompanyContactsyncEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyContacttypeassociationsEndpoint import \
+        AsyncCompanyContacttypeassociationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyCountriesEndpoint import AsyncCompanyCountriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyEntitytypesEndpoint import AsyncCompanyEntitytypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyExpensetypesEndpoint import AsyncCompanyExpensetypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactEndpoint import AsyncCompanyM365contactEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncEndpoint import \
+        AsyncCompanyM365contactsyncEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsEndpoint import \
+        AsyncCompanyManageddevicesintegrationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManagementbackupsEndpoint import \
+        AsyncCompanyManagementbackupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManagementEndpoint import AsyncCompanyManagementEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManagementitsolutionsEndpoint import \
+        AsyncCompanyManagementitsolutionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyMarketdescriptionsEndpoint import \
+        AsyncCompanyMarketdescriptionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyNotetypesEndpoint import AsyncCompanyNotetypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyOwnershiptypesEndpoint import \
+        AsyncCompanyOwnershiptypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPaymenttypesEndpoint import AsyncCompanyPaymenttypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsEndpoint import \
+        AsyncCompanyPortalconfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalsecuritylevelsEndpoint import \
+        AsyncCompanyPortalsecuritylevelsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalsecuritysettingsEndpoint import \
+        AsyncCompanyPortalsecuritysettingsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyStatesEndpoint import AsyncCompanyStatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyTeamrolesEndpoint import AsyncCompanyTeamrolesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyTracksEndpoint import AsyncCompanyTracksEndpoint
+
+
+class AsyncCompanyEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "company"
+    _route = "company"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def portal_configurations(self) -> "AsyncCompanyPortalconfigurationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsEndpoint"
+        )
+
+    @cached_property
+    def managed_devices_integrations(self) -> "AsyncCompanyManageddevicesintegrationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsEndpoint"
+        )
+
+    @cached_property
+    def team_roles(self) -> "AsyncCompanyTeamrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyTeamrolesEndpoint")
+
+    @cached_property
+    def billing_setups(self) -> "AsyncCompanyBillingsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyBillingsetupsEndpoint")
+
+    @cached_property
+    def note_types(self) -> "AsyncCompanyNotetypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyNotetypesEndpoint")
+
+    @cached_property
+    def contactsync(self) -> "AsyncCompanyContactsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsyncEndpoint")
+
+    @cached_property
+    def entity_types(self) -> "AsyncCompanyEntitytypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyEntitytypesEndpoint")
+
+    @cached_property
+    def management_it_solutions(self) -> "AsyncCompanyManagementitsolutionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManagementitsolutionsEndpoint"
+        )
+
+    @cached_property
+    def expense_types(self) -> "AsyncCompanyExpensetypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyExpensetypesEndpoint")
+
+    @cached_property
+    def contacts(self) -> "AsyncCompanyContactsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactsEndpoint")
+
+    @cached_property
+    def portal_security_levels(self) -> "AsyncCompanyPortalsecuritylevelsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalsecuritylevelsEndpoint"
+        )
+
+    @cached_property
+    def company_picker_items(self) -> "AsyncCompanyCompanypickeritemsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCompanypickeritemsEndpoint"
+        )
+
+    @cached_property
+    def tracks(self) -> "AsyncCompanyTracksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyTracksEndpoint")
+
+    @cached_property
+    def company_finance(self) -> "AsyncCompanyCompanyfinanceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompanyfinanceEndpoint")
+
+    @cached_property
+    def company_type_associations(self) -> "AsyncCompanyCompanytypeassociationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCompanytypeassociationsEndpoint"
+        )
+
+    @cached_property
+    def contact_type_associations(self) -> "AsyncCompanyContacttypeassociationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyContacttypeassociationsEndpoint"
+        )
+
+    @cached_property
+    def states(self) -> "AsyncCompanyStatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyStatesEndpoint")
+
+    @cached_property
+    def companies(self) -> "AsyncCompanyCompaniesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCompaniesEndpoint")
+
+    @cached_property
+    def payment_types(self) -> "AsyncCompanyPaymenttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyPaymenttypesEndpoint")
+
+    @cached_property
+    def management_backups(self) -> "AsyncCompanyManagementbackupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyManagementbackupsEndpoint")
+
+    @cached_property
+    def ownership_types(self) -> "AsyncCompanyOwnershiptypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyOwnershiptypesEndpoint")
+
+    @cached_property
+    def entitytypes(self) -> "AsyncCompanyEntitytypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyEntitytypesEndpoint")
+
+    @cached_property
+    def market_descriptions(self) -> "AsyncCompanyMarketdescriptionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyMarketdescriptionsEndpoint"
+        )
+
+    @cached_property
+    def portal_security_settings(self) -> "AsyncCompanyPortalsecuritysettingsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalsecuritysettingsEndpoint"
+        )
+
+    @cached_property
+    def configurations(self) -> "AsyncCompanyConfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyConfigurationsEndpoint")
+
+    @cached_property
+    def address_formats(self) -> "AsyncCompanyAddressformatsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyAddressformatsEndpoint")
+
+    @cached_property
+    def communication_types(self) -> "AsyncCompanyCommunicationtypesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyCommunicationtypesEndpoint"
+        )
+
+    @cached_property
+    def contact(self) -> "AsyncCompanyContactEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyContactEndpoint")
+
+    @cached_property
+    def countries(self) -> "AsyncCompanyCountriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyCountriesEndpoint")
+
+    @cached_property
+    def m365contact(self) -> "AsyncCompanyM365contactEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactEndpoint")
+
+    @cached_property
+    def management(self) -> "AsyncCompanyManagementEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyManagementEndpoint")
+
+    @cached_property
+    def m365contactsync(self) -> "AsyncCompanyM365contactsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncEndpoint")
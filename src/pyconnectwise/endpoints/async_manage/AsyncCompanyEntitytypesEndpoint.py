@@ -0,0 +1,33 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyEntitytypesIdEndpoint import AsyncCompanyEntitytypesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyEntitytypesInfoEndpoint import \
+        AsyncCompanyEntitytypesInfoEndpoint
+
+
+class AsyncCompanyEntitytypesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "entitytypes"
+    _route = "company/entitytypes"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncCompanyEntitytypesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncCompanyEntitytypesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncCompanyEntitytypesIdEndpoint: The AsyncCompanyEntitytypesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncCompanyEntitytypesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncCompanyEntitytypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyEntitytypesInfoEndpoint")
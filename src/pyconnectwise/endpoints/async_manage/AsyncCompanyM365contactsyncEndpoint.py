@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncIdEndpoint import \
+        AsyncCompanyM365contactsyncIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncPropertyEndpoint import \
+        AsyncCompanyM365contactsyncPropertyEndpoint
+
+
+class AsyncCompanyM365contactsyncEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "m365contactsync"
+    _route = "company/m365contactsync"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncCompanyM365contactsyncIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncCompanyM365contactsyncIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncCompanyM365contactsyncIdEndpoint: The AsyncCompanyM365contactsyncIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncIdEndpoint", id)
+
+    @cached_property
+    def property(self) -> "AsyncCompanyM365contactsyncPropertyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncPropertyEndpoint"
+        )
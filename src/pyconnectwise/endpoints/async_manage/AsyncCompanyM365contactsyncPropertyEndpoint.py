@@ -0,0 +1,54 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import M365ContactSyncProperty
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncPropertyCountEndpoint import \
+        AsyncCompanyM365contactsyncPropertyCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncPropertyExcludedEndpoint import \
+        AsyncCompanyM365contactsyncPropertyExcludedEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncPropertyIncludedEndpoint import \
+        AsyncCompanyM365contactsyncPropertyIncludedEndpoint
+
+
+class AsyncCompanyM365contactsyncPropertyEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "property"
+    _route = "company/m365contactsync/property"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> M365ContactSyncProperty:
+        """
+        Performs a POST request against the /company/m365contactsync/property endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            M365ContactSyncProperty: The parsed response data.
+        """
+        return self._parse_one(
+            M365ContactSyncProperty, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def excluded(self) -> "AsyncCompanyM365contactsyncPropertyExcludedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncPropertyExcludedEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "AsyncCompanyM365contactsyncPropertyCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncPropertyCountEndpoint"
+        )
+
+    @cached_property
+    def included(self) -> "AsyncCompanyM365contactsyncPropertyIncludedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyM365contactsyncPropertyIncludedEndpoint"
+        )
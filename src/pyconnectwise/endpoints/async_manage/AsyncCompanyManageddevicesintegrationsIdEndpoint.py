@@ -0,0 +1,124 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import ManagedDevicesIntegration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdCrossreferencesEndpoint import \
+        AsyncCompanyManageddevicesintegrationsIdCrossreferencesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdInfoEndpoint import \
+        AsyncCompanyManageddevicesintegrationsIdInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdLoginsEndpoint import \
+        AsyncCompanyManageddevicesintegrationsIdLoginsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdNotificationsEndpoint import \
+        AsyncCompanyManageddevicesintegrationsIdNotificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdUsagesEndpoint import \
+        AsyncCompanyManageddevicesintegrationsIdUsagesEndpoint
+
+
+class AsyncCompanyManageddevicesintegrationsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/managedDevicesIntegrations/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[ManagedDevicesIntegration]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[ManagedDevicesIntegration]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(ManagedDevicesIntegration, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagedDevicesIntegration:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegration: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /company/managedDevicesIntegrations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagedDevicesIntegration:
+        """
+        Performs a PUT request against the /company/managedDevicesIntegrations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegration: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegration, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagedDevicesIntegration:
+        """
+        Performs a PATCH request against the /company/managedDevicesIntegrations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegration: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegration, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    @cached_property
+    def logins(self) -> "AsyncCompanyManageddevicesintegrationsIdLoginsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdLoginsEndpoint"
+        )
+
+    @cached_property
+    def info(self) -> "AsyncCompanyManageddevicesintegrationsIdInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdInfoEndpoint"
+        )
+
+    @cached_property
+    def cross_references(self) -> "AsyncCompanyManageddevicesintegrationsIdCrossreferencesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdCrossreferencesEndpoint"
+        )
+
+    @cached_property
+    def notifications(self) -> "AsyncCompanyManageddevicesintegrationsIdNotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdNotificationsEndpoint"
+        )
+
+    @cached_property
+    def usages(self) -> "AsyncCompanyManageddevicesintegrationsIdUsagesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManageddevicesintegrationsIdUsagesEndpoint"
+        )
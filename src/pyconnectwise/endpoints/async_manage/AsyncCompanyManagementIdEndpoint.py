@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Management
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManagementIdExecutemanageditsyncEndpoint import \
+        AsyncCompanyManagementIdExecutemanageditsyncEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManagementIdLogEndpoint import \
+        AsyncCompanyManagementIdLogEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManagementIdLogsEndpoint import \
+        AsyncCompanyManagementIdLogsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyManagementIdManagementreportnotificationsEndpoint import \
+        AsyncCompanyManagementIdManagementreportnotificationsEndpoint
+
+
+class AsyncCompanyManagementIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/management/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Management]:
+        """
+        Performs a GET request against the /company/management/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Management]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Management, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Management:
+        """
+        Performs a GET request against the /company/management/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Management: The parsed response data.
+        """
+        return self._parse_one(Management, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Management:
+        """
+        Performs a PUT request against the /company/management/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Management: The parsed response data.
+        """
+        return self._parse_one(Management, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Management:
+        """
+        Performs a PATCH request against the /company/management/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Management: The parsed response data.
+        """
+        return self._parse_one(Management, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def log(self) -> "AsyncCompanyManagementIdLogEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyManagementIdLogEndpoint")
+
+    @cached_property
+    def management_report_notifications(self) -> "AsyncCompanyManagementIdManagementreportnotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManagementIdManagementreportnotificationsEndpoint"
+        )
+
+    @cached_property
+    def logs(self) -> "AsyncCompanyManagementIdLogsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyManagementIdLogsEndpoint")
+
+    @cached_property
+    def execute_managed_it_sync(self) -> "AsyncCompanyManagementIdExecutemanageditsyncEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyManagementIdExecutemanageditsyncEndpoint"
+        )
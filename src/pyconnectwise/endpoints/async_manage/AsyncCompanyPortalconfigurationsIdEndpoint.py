@@ -0,0 +1,124 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import PortalConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdInvoicesetupsEndpoint import \
+        AsyncCompanyPortalconfigurationsIdInvoicesetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdOpportunitysetupsEndpoint import \
+        AsyncCompanyPortalconfigurationsIdOpportunitysetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdPasswordemailsetupsEndpoint import \
+        AsyncCompanyPortalconfigurationsIdPasswordemailsetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdProjectsetupsEndpoint import \
+        AsyncCompanyPortalconfigurationsIdProjectsetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdServicesetupsEndpoint import \
+        AsyncCompanyPortalconfigurationsIdServicesetupsEndpoint
+
+
+class AsyncCompanyPortalconfigurationsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/portalConfigurations/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[PortalConfiguration]:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[PortalConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(PortalConfiguration, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PortalConfiguration:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /company/portalConfigurations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PortalConfiguration:
+        """
+        Performs a PUT request against the /company/portalConfigurations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfiguration, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PortalConfiguration:
+        """
+        Performs a PATCH request against the /company/portalConfigurations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfiguration, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    @cached_property
+    def invoice_setups(self) -> "AsyncCompanyPortalconfigurationsIdInvoicesetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdInvoicesetupsEndpoint"
+        )
+
+    @cached_property
+    def project_setups(self) -> "AsyncCompanyPortalconfigurationsIdProjectsetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdProjectsetupsEndpoint"
+        )
+
+    @cached_property
+    def password_email_setups(self) -> "AsyncCompanyPortalconfigurationsIdPasswordemailsetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdPasswordemailsetupsEndpoint"
+        )
+
+    @cached_property
+    def opportunity_setups(self) -> "AsyncCompanyPortalconfigurationsIdOpportunitysetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdOpportunitysetupsEndpoint"
+        )
+
+    @cached_property
+    def service_setups(self) -> "AsyncCompanyPortalconfigurationsIdServicesetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdServicesetupsEndpoint"
+        )
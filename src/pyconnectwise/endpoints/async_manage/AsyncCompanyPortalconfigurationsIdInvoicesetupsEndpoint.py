@@ -0,0 +1,71 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import PortalConfigurationInvoiceSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdInvoicesetupsCountEndpoint import \
+        AsyncCompanyPortalconfigurationsIdInvoicesetupsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdInvoicesetupsIdEndpoint import \
+        AsyncCompanyPortalconfigurationsIdInvoicesetupsIdEndpoint
+
+
+class AsyncCompanyPortalconfigurationsIdInvoicesetupsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "invoiceSetups"
+    _route = "company/portalConfigurations/{id}/invoiceSetups"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncCompanyPortalconfigurationsIdInvoicesetupsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncCompanyPortalconfigurationsIdInvoicesetupsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncCompanyPortalconfigurationsIdInvoicesetupsIdEndpoint: The AsyncCompanyPortalconfigurationsIdInvoicesetupsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdInvoicesetupsIdEndpoint", id
+        )
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[PortalConfigurationInvoiceSetup]:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id}/invoiceSetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[PortalConfigurationInvoiceSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(PortalConfigurationInvoiceSetup, page, page_size, params, forward_only)
+
+    async def get(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> list[PortalConfigurationInvoiceSetup]:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id}/invoiceSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PortalConfigurationInvoiceSetup]: The parsed response data.
+        """
+        return self._parse_many(
+            PortalConfigurationInvoiceSetup, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> "AsyncCompanyPortalconfigurationsIdInvoicesetupsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsIdInvoicesetupsCountEndpoint"
+        )
@@ -0,0 +1,23 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint import \
+        AsyncCompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint
+
+
+class AsyncCompanyPortalconfigurationsInvoicesetupEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "invoiceSetup"
+    _route = "company/portalConfigurations/invoiceSetup"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def payment_processors(self) -> "AsyncCompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncCompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint"
+        )
@@ -0,0 +1,90 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import TeamRole
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyTeamrolesIdInfoEndpoint import \
+        AsyncCompanyTeamrolesIdInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncCompanyTeamrolesIdUsagesEndpoint import \
+        AsyncCompanyTeamrolesIdUsagesEndpoint
+
+
+class AsyncCompanyTeamrolesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/teamRoles/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[TeamRole]:
+        """
+        Performs a GET request against the /company/teamRoles/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[TeamRole]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(TeamRole, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TeamRole:
+        """
+        Performs a GET request against the /company/teamRoles/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TeamRole: The parsed response data.
+        """
+        return self._parse_one(TeamRole, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /company/teamRoles/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TeamRole:
+        """
+        Performs a PUT request against the /company/teamRoles/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TeamRole: The parsed response data.
+        """
+        return self._parse_one(TeamRole, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TeamRole:
+        """
+        Performs a PATCH request against the /company/teamRoles/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TeamRole: The parsed response data.
+        """
+        return self._parse_one(TeamRole, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def usages(self) -> "AsyncCompanyTeamrolesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyTeamrolesIdUsagesEndpoint")
+
+    @cached_property
+    def info(self) -> "AsyncCompanyTeamrolesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncCompanyTeamrolesIdInfoEndpoint")
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdEndpoint import \
+        AsyncConfigurationsTypesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesInfoEndpoint import \
+        AsyncConfigurationsTypesInfoEndpoint
+
+
+class AsyncConfigurationsTypesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "types"
+    _route = "configurations/types"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncConfigurationsTypesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncConfigurationsTypesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncConfigurationsTypesIdEndpoint: The AsyncConfigurationsTypesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncConfigurationsTypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesInfoEndpoint")
@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdQuestionsIdInfoEndpoint import \
+        AsyncConfigurationsTypesIdQuestionsIdInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdQuestionsIdValuesEndpoint import \
+        AsyncConfigurationsTypesIdQuestionsIdValuesEndpoint
+
+
+class AsyncConfigurationsTypesIdQuestionsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "configurations/types/{id}/questions/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def info(self) -> "AsyncConfigurationsTypesIdQuestionsIdInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdQuestionsIdInfoEndpoint"
+        )
+
+    @cached_property
+    def values(self) -> "AsyncConfigurationsTypesIdQuestionsIdValuesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdQuestionsIdValuesEndpoint"
+        )
@@ -0,0 +1,38 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdQuestionsIdValuesIdEndpoint import \
+        AsyncConfigurationsTypesIdQuestionsIdValuesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdQuestionsIdValuesInfoEndpoint import \
+        AsyncConfigurationsTypesIdQuestionsIdValuesInfoEndpoint
+
+
+class AsyncConfigurationsTypesIdQuestionsIdValuesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "values"
+    _route = "configurations/types/{id}/questions/{id}/values"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncConfigurationsTypesIdQuestionsIdValuesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncConfigurationsTypesIdQuestionsIdValuesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncConfigurationsTypesIdQuestionsIdValuesIdEndpoint: The AsyncConfigurationsTypesIdQuestionsIdValuesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdQuestionsIdValuesIdEndpoint", id
+        )
+
+    @cached_property
+    def info(self) -> "AsyncConfigurationsTypesIdQuestionsIdValuesInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncConfigurationsTypesIdQuestionsIdValuesInfoEndpoint"
+        )
@@ -0,0 +1,46 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseClassificationsEndpoint import \
+        AsyncExpenseClassificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseEntriesEndpoint import AsyncExpenseEntriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseInfoEndpoint import AsyncExpenseInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpensePaymenttypesEndpoint import AsyncExpensePaymenttypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseReportsEndpoint import AsyncExpenseReportsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseTypesEndpoint import AsyncExpenseTypesEndpoint
+
+
+class AsyncExpenseEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "expense"
+    _route = "expense"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def info(self) -> "AsyncExpenseInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseInfoEndpoint")
+
+    @cached_property
+    def classifications(self) -> "AsyncExpenseClassificationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseClassificationsEndpoint")
+
+    @cached_property
+    def payment_types(self) -> "AsyncExpensePaymenttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpensePaymenttypesEndpoint")
+
+    @cached_property
+    def types(self) -> "AsyncExpenseTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseTypesEndpoint")
+
+    @cached_property
+    def entries(self) -> "AsyncExpenseEntriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseEntriesEndpoint")
+
+    @cached_property
+    def reports(self) -> "AsyncExpenseReportsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseReportsEndpoint")
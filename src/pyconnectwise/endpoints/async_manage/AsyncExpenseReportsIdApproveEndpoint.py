@@ -0,0 +1,26 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import SuccessResponse
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncExpenseReportsIdApproveEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "approve"
+    _route = "expense/reports/{id}/approve"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SuccessResponse:
+        """
+        Performs a POST request against the /expense/reports/{id}/approve endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SuccessResponse: The parsed response data.
+        """
+        return self._parse_one(SuccessResponse, (await super()._make_request("POST", data=data, params=params)).content)
@@ -0,0 +1,74 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import ExpenseReport
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdApproveEndpoint import \
+        AsyncExpenseReportsIdApproveEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdAuditsEndpoint import \
+        AsyncExpenseReportsIdAuditsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdRejectEndpoint import \
+        AsyncExpenseReportsIdRejectEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdReverseEndpoint import \
+        AsyncExpenseReportsIdReverseEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdSubmitEndpoint import \
+        AsyncExpenseReportsIdSubmitEndpoint
+
+
+class AsyncExpenseReportsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "expense/reports/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[ExpenseReport]:
+        """
+        Performs a GET request against the /expense/reports/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[ExpenseReport]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(ExpenseReport, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ExpenseReport:
+        """
+        Performs a GET request against the /expense/reports/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ExpenseReport: The parsed response data.
+        """
+        return self._parse_one(ExpenseReport, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def reverse(self) -> "AsyncExpenseReportsIdReverseEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdReverseEndpoint")
+
+    @cached_property
+    def submit(self) -> "AsyncExpenseReportsIdSubmitEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdSubmitEndpoint")
+
+    @cached_property
+    def reject(self) -> "AsyncExpenseReportsIdRejectEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdRejectEndpoint")
+
+    @cached_property
+    def audits(self) -> "AsyncExpenseReportsIdAuditsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdAuditsEndpoint")
+
+    @cached_property
+    def approve(self) -> "AsyncExpenseReportsIdApproveEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncExpenseReportsIdApproveEndpoint")
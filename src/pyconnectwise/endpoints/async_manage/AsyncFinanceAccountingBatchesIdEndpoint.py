@@ -0,0 +1,70 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import AccountingBatch
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingBatchesIdEntriesEndpoint import \
+        AsyncFinanceAccountingBatchesIdEntriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingBatchesIdExportEndpoint import \
+        AsyncFinanceAccountingBatchesIdExportEndpoint
+
+
+class AsyncFinanceAccountingBatchesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "finance/accounting/batches/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[AccountingBatch]:
+        """
+        Performs a GET request against the /finance/accounting/batches/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[AccountingBatch]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(AccountingBatch, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AccountingBatch:
+        """
+        Performs a GET request against the /finance/accounting/batches/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AccountingBatch: The parsed response data.
+        """
+        return self._parse_one(AccountingBatch, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /finance/accounting/batches/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def entries(self) -> "AsyncFinanceAccountingBatchesIdEntriesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingBatchesIdEntriesEndpoint"
+        )
+
+    @cached_property
+    def export(self) -> "AsyncFinanceAccountingBatchesIdExportEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingBatchesIdExportEndpoint"
+        )
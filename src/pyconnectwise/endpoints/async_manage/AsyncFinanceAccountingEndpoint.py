@@ -0,0 +1,51 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingBatchesEndpoint import \
+        AsyncFinanceAccountingBatchesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingExportEndpoint import \
+        AsyncFinanceAccountingExportEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingUnpostedexpensesEndpoint import \
+        AsyncFinanceAccountingUnpostedexpensesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingUnpostedinvoicesEndpoint import \
+        AsyncFinanceAccountingUnpostedinvoicesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingUnpostedprocurementEndpoint import \
+        AsyncFinanceAccountingUnpostedprocurementEndpoint
+
+
+class AsyncFinanceAccountingEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "accounting"
+    _route = "finance/accounting"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def unpostedexpenses(self) -> "AsyncFinanceAccountingUnpostedexpensesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingUnpostedexpensesEndpoint"
+        )
+
+    @cached_property
+    def unpostedinvoices(self) -> "AsyncFinanceAccountingUnpostedinvoicesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingUnpostedinvoicesEndpoint"
+        )
+
+    @cached_property
+    def batches(self) -> "AsyncFinanceAccountingBatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingBatchesEndpoint")
+
+    @cached_property
+    def unpostedprocurement(self) -> "AsyncFinanceAccountingUnpostedprocurementEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingUnpostedprocurementEndpoint"
+        )
+
+    @cached_property
+    def export(self) -> "AsyncFinanceAccountingExportEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingExportEndpoint")
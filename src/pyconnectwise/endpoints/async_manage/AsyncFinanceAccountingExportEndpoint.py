@@ -0,0 +1,26 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import GLExport
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncFinanceAccountingExportEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "export"
+    _route = "finance/accounting/export"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> GLExport:
+        """
+        Performs a POST request against the /finance/accounting/export endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            GLExport: The parsed response data.
+        """
+        return self._parse_one(GLExport, (await super()._make_request("POST", data=data, params=params)).content)
@@ -0,0 +1,178 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Agreement
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdAdditionsEndpoint import \
+        AsyncFinanceAgreementsIdAdditionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdAdjustmentsEndpoint import \
+        AsyncFinanceAgreementsIdAdjustmentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdApplicationparametersEndpoint import \
+        AsyncFinanceAgreementsIdApplicationparametersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdBoarddefaultsEndpoint import \
+        AsyncFinanceAgreementsIdBoarddefaultsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdConfigurationsEndpoint import \
+        AsyncFinanceAgreementsIdConfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdCopyEndpoint import \
+        AsyncFinanceAgreementsIdCopyEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdInvoiceEndpoint import \
+        AsyncFinanceAgreementsIdInvoiceEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdRecurringparametersEndpoint import \
+        AsyncFinanceAgreementsIdRecurringparametersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdSitesEndpoint import \
+        AsyncFinanceAgreementsIdSitesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdWorkroleexclusionsEndpoint import \
+        AsyncFinanceAgreementsIdWorkroleexclusionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdWorkrolesEndpoint import \
+        AsyncFinanceAgreementsIdWorkrolesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdWorktypeexclusionsEndpoint import \
+        AsyncFinanceAgreementsIdWorktypeexclusionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdWorktypesEndpoint import \
+        AsyncFinanceAgreementsIdWorktypesEndpoint
+
+
+class AsyncFinanceAgreementsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "finance/agreements/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Agreement]:
+        """
+        Performs a GET request against the /finance/agreements/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Agreement]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Agreement, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Agreement:
+        """
+        Performs a GET request against the /finance/agreements/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Agreement: The parsed response data.
+        """
+        return self._parse_one(Agreement, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /finance/agreements/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Agreement:
+        """
+        Performs a PUT request against the /finance/agreements/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Agreement: The parsed response data.
+        """
+        return self._parse_one(Agreement, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Agreement:
+        """
+        Performs a PATCH request against the /finance/agreements/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Agreement: The parsed response data.
+        """
+        return self._parse_one(Agreement, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def additions(self) -> "AsyncFinanceAgreementsIdAdditionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdAdditionsEndpoint"
+        )
+
+    @cached_property
+    def recurring_parameters(self) -> "AsyncFinanceAgreementsIdRecurringparametersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdRecurringparametersEndpoint"
+        )
+
+    @cached_property
+    def workroles(self) -> "AsyncFinanceAgreementsIdWorkrolesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdWorkrolesEndpoint"
+        )
+
+    @cached_property
+    def application_parameters(self) -> "AsyncFinanceAgreementsIdApplicationparametersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdApplicationparametersEndpoint"
+        )
+
+    @cached_property
+    def copy(self) -> "AsyncFinanceAgreementsIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdCopyEndpoint")
+
+    @cached_property
+    def board_defaults(self) -> "AsyncFinanceAgreementsIdBoarddefaultsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdBoarddefaultsEndpoint"
+        )
+
+    @cached_property
+    def work_type_exclusions(self) -> "AsyncFinanceAgreementsIdWorktypeexclusionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdWorktypeexclusionsEndpoint"
+        )
+
+    @cached_property
+    def invoice(self) -> "AsyncFinanceAgreementsIdInvoiceEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdInvoiceEndpoint"
+        )
+
+    @cached_property
+    def worktypes(self) -> "AsyncFinanceAgreementsIdWorktypesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdWorktypesEndpoint"
+        )
+
+    @cached_property
+    def adjustments(self) -> "AsyncFinanceAgreementsIdAdjustmentsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdAdjustmentsEndpoint"
+        )
+
+    @cached_property
+    def sites(self) -> "AsyncFinanceAgreementsIdSitesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdSitesEndpoint")
+
+    @cached_property
+    def work_role_exclusions(self) -> "AsyncFinanceAgreementsIdWorkroleexclusionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdWorkroleexclusionsEndpoint"
+        )
+
+    @cached_property
+    def configurations(self) -> "AsyncFinanceAgreementsIdConfigurationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsIdConfigurationsEndpoint"
+        )
@@ -0,0 +1,85 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import AgreementTypeBoardDefault
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdBoarddefaultsCountEndpoint import \
+        AsyncFinanceAgreementtypesIdBoarddefaultsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdBoarddefaultsIdEndpoint import \
+        AsyncFinanceAgreementtypesIdBoarddefaultsIdEndpoint
+
+
+class AsyncFinanceAgreementtypesIdBoarddefaultsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "boardDefaults"
+    _route = "finance/agreementTypes/{id}/boardDefaults"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncFinanceAgreementtypesIdBoarddefaultsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncFinanceAgreementtypesIdBoarddefaultsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncFinanceAgreementtypesIdBoarddefaultsIdEndpoint: The AsyncFinanceAgreementtypesIdBoarddefaultsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdBoarddefaultsIdEndpoint", id
+        )
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[AgreementTypeBoardDefault]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/boardDefaults endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[AgreementTypeBoardDefault]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(AgreementTypeBoardDefault, page, page_size, params, forward_only)
+
+    async def get(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> list[AgreementTypeBoardDefault]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/boardDefaults endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementTypeBoardDefault]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementTypeBoardDefault, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementTypeBoardDefault:
+        """
+        Performs a POST request against the /finance/agreementTypes/{id}/boardDefaults endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementTypeBoardDefault: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementTypeBoardDefault, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> "AsyncFinanceAgreementtypesIdBoarddefaultsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdBoarddefaultsCountEndpoint"
+        )
@@ -0,0 +1,55 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdBoarddefaultsEndpoint import \
+        AsyncFinanceAgreementtypesIdBoarddefaultsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdWorkroleexclusionsEndpoint import \
+        AsyncFinanceAgreementtypesIdWorkroleexclusionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdWorkrolesEndpoint import \
+        AsyncFinanceAgreementtypesIdWorkrolesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdWorktypeexclusionsEndpoint import \
+        AsyncFinanceAgreementtypesIdWorktypeexclusionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdWorktypesEndpoint import \
+        AsyncFinanceAgreementtypesIdWorktypesEndpoint
+
+
+class AsyncFinanceAgreementtypesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "finance/agreementTypes/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def workroles(self) -> "AsyncFinanceAgreementtypesIdWorkrolesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdWorkrolesEndpoint"
+        )
+
+    @cached_property
+    def board_defaults(self) -> "AsyncFinanceAgreementtypesIdBoarddefaultsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdBoarddefaultsEndpoint"
+        )
+
+    @cached_property
+    def work_type_exclusions(self) -> "AsyncFinanceAgreementtypesIdWorktypeexclusionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdWorktypeexclusionsEndpoint"
+        )
+
+    @cached_property
+    def work_role_exclusions(self) -> "AsyncFinanceAgreementtypesIdWorkroleexclusionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdWorkroleexclusionsEndpoint"
+        )
+
+    @cached_property
+    def worktypes(self) -> "AsyncFinanceAgreementtypesIdWorktypesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesIdWorktypesEndpoint"
+        )
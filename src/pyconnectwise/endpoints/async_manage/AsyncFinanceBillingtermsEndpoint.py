@@ -0,0 +1,81 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import BillingTerm
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceBillingtermsCountEndpoint import \
+        AsyncFinanceBillingtermsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceBillingtermsIdEndpoint import \
+        AsyncFinanceBillingtermsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceBillingtermsInfoEndpoint import \
+        AsyncFinanceBillingtermsInfoEndpoint
+
+
+class AsyncFinanceBillingtermsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "billingTerms"
+    _route = "finance/billingTerms"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncFinanceBillingtermsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncFinanceBillingtermsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncFinanceBillingtermsIdEndpoint: The AsyncFinanceBillingtermsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncFinanceBillingtermsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[BillingTerm]:
+        """
+        Performs a GET request against the /finance/billingTerms endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[BillingTerm]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(BillingTerm, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[BillingTerm]:
+        """
+        Performs a GET request against the /finance/billingTerms endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BillingTerm]: The parsed response data.
+        """
+        return self._parse_many(BillingTerm, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BillingTerm:
+        """
+        Performs a POST request against the /finance/billingTerms endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BillingTerm: The parsed response data.
+        """
+        return self._parse_one(BillingTerm, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def info(self) -> "AsyncFinanceBillingtermsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceBillingtermsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "AsyncFinanceBillingtermsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceBillingtermsCountEndpoint")
@@ -0,0 +1,38 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import ClosedInvoice
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncFinanceClosedinvoicesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "finance/closedInvoices/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ClosedInvoice:
+        """
+        Performs a PUT request against the /finance/closedInvoices/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ClosedInvoice: The parsed response data.
+        """
+        return self._parse_one(ClosedInvoice, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ClosedInvoice:
+        """
+        Performs a PATCH request against the /finance/closedInvoices/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ClosedInvoice: The parsed response data.
+        """
+        return self._parse_one(ClosedInvoice, (await super()._make_request("PATCH", data=data, params=params)).content)
@@ -0,0 +1,160 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingEndpoint import AsyncFinanceAccountingEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingpackagesEndpoint import \
+        AsyncFinanceAccountingpackagesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingpackagesetupEndpoint import \
+        AsyncFinanceAccountingpackagesetupEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementrecapEndpoint import \
+        AsyncFinanceAgreementrecapEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsEndpoint import AsyncFinanceAgreementsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesEndpoint import \
+        AsyncFinanceAgreementtypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceBatchsetupsEndpoint import AsyncFinanceBatchsetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceBillingcyclesEndpoint import AsyncFinanceBillingcyclesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceBillingsetupsEndpoint import AsyncFinanceBillingsetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceBillingstatusesEndpoint import \
+        AsyncFinanceBillingstatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceBillingtermsEndpoint import AsyncFinanceBillingtermsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceClosedinvoicesEndpoint import \
+        AsyncFinanceClosedinvoicesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceCompanyfinanceEndpoint import \
+        AsyncFinanceCompanyfinanceEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceCurrenciesEndpoint import AsyncFinanceCurrenciesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceDeliverymethodsEndpoint import \
+        AsyncFinanceDeliverymethodsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceGlaccountsEndpoint import AsyncFinanceGlaccountsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceGlcaptionsEndpoint import AsyncFinanceGlcaptionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceGlpathsEndpoint import AsyncFinanceGlpathsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInfoEndpoint import AsyncFinanceInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInvoiceemailtemplatesEndpoint import \
+        AsyncFinanceInvoiceemailtemplatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicesEndpoint import AsyncFinanceInvoicesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicetemplatesEndpoint import \
+        AsyncFinanceInvoicetemplatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicetemplatesetupsEndpoint import \
+        AsyncFinanceInvoicetemplatesetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesEndpoint import AsyncFinanceTaxcodesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxintegrationsEndpoint import \
+        AsyncFinanceTaxintegrationsEndpoint
+
+
+class AsyncFinanceEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "finance"
+    _route = "finance"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def billing_terms(self) -> "AsyncFinanceBillingtermsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceBillingtermsEndpoint")
+
+    @cached_property
+    def closed_invoices(self) -> "AsyncFinanceClosedinvoicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceClosedinvoicesEndpoint")
+
+    @cached_property
+    def gl_captions(self) -> "AsyncFinanceGlcaptionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceGlcaptionsEndpoint")
+
+    @cached_property
+    def tax_integrations(self) -> "AsyncFinanceTaxintegrationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceTaxintegrationsEndpoint")
+
+    @cached_property
+    def currencies(self) -> "AsyncFinanceCurrenciesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceCurrenciesEndpoint")
+
+    @cached_property
+    def billing_setups(self) -> "AsyncFinanceBillingsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceBillingsetupsEndpoint")
+
+    @cached_property
+    def gl_accounts(self) -> "AsyncFinanceGlaccountsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceGlaccountsEndpoint")
+
+    @cached_property
+    def batch_setups(self) -> "AsyncFinanceBatchsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceBatchsetupsEndpoint")
+
+    @cached_property
+    def accounting_package_setup(self) -> "AsyncFinanceAccountingpackagesetupEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingpackagesetupEndpoint"
+        )
+
+    @cached_property
+    def invoice_email_templates(self) -> "AsyncFinanceInvoiceemailtemplatesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceInvoiceemailtemplatesEndpoint"
+        )
+
+    @cached_property
+    def invoice_templates(self) -> "AsyncFinanceInvoicetemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicetemplatesEndpoint")
+
+    @cached_property
+    def delivery_methods(self) -> "AsyncFinanceDeliverymethodsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceDeliverymethodsEndpoint")
+
+    @cached_property
+    def tax_codes(self) -> "AsyncFinanceTaxcodesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesEndpoint")
+
+    @cached_property
+    def billing_cycles(self) -> "AsyncFinanceBillingcyclesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceBillingcyclesEndpoint")
+
+    @cached_property
+    def company_finance(self) -> "AsyncFinanceCompanyfinanceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceCompanyfinanceEndpoint")
+
+    @cached_property
+    def invoices(self) -> "AsyncFinanceInvoicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicesEndpoint")
+
+    @cached_property
+    def accounting(self) -> "AsyncFinanceAccountingEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingEndpoint")
+
+    @cached_property
+    def agreement_types(self) -> "AsyncFinanceAgreementtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementtypesEndpoint")
+
+    @cached_property
+    def agreements(self) -> "AsyncFinanceAgreementsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementsEndpoint")
+
+    @cached_property
+    def info(self) -> "AsyncFinanceInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceInfoEndpoint")
+
+    @cached_property
+    def agreementrecap(self) -> "AsyncFinanceAgreementrecapEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceAgreementrecapEndpoint")
+
+    @cached_property
+    def accounting_packages(self) -> "AsyncFinanceAccountingpackagesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceAccountingpackagesEndpoint"
+        )
+
+    @cached_property
+    def invoice_template_setups(self) -> "AsyncFinanceInvoicetemplatesetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicetemplatesetupsEndpoint"
+        )
+
+    @cached_property
+    def billing_statuses(self) -> "AsyncFinanceBillingstatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceBillingstatusesEndpoint")
+
+    @cached_property
+    def glpaths(self) -> "AsyncFinanceGlpathsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceGlpathsEndpoint")
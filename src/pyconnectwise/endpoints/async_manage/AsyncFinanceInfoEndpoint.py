@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInfoCurrencycodesEndpoint import \
+        AsyncFinanceInfoCurrencycodesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInfoInvoiceEndpoint import AsyncFinanceInfoInvoiceEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInfoTaxintegrationsEndpoint import \
+        AsyncFinanceInfoTaxintegrationsEndpoint
+
+
+class AsyncFinanceInfoEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "finance/info"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def currency_codes(self) -> "AsyncFinanceInfoCurrencycodesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceInfoCurrencycodesEndpoint")
+
+    @cached_property
+    def invoice(self) -> "AsyncFinanceInfoInvoiceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceInfoInvoiceEndpoint")
+
+    @cached_property
+    def tax_integrations(self) -> "AsyncFinanceInfoTaxintegrationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceInfoTaxintegrationsEndpoint"
+        )
@@ -0,0 +1,69 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import InvoicePayment
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicesIdPaymentsIdEndpoint import \
+        AsyncFinanceInvoicesIdPaymentsIdEndpoint
+
+
+class AsyncFinanceInvoicesIdPaymentsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "payments"
+    _route = "finance/invoices/{id}/payments"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncFinanceInvoicesIdPaymentsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncFinanceInvoicesIdPaymentsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncFinanceInvoicesIdPaymentsIdEndpoint: The AsyncFinanceInvoicesIdPaymentsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicesIdPaymentsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[InvoicePayment]:
+        """
+        Performs a GET request against the /finance/invoices/{id}/payments endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[InvoicePayment]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(InvoicePayment, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[InvoicePayment]:
+        """
+        Performs a GET request against the /finance/invoices/{id}/payments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[InvoicePayment]: The parsed response data.
+        """
+        return self._parse_many(InvoicePayment, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> InvoicePayment:
+        """
+        Performs a POST request against the /finance/invoices/{id}/payments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            InvoicePayment: The parsed response data.
+        """
+        return self._parse_one(InvoicePayment, (await super()._make_request("POST", data=data, params=params)).content)
@@ -0,0 +1,77 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import InvoiceTemplate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicetemplatesCountEndpoint import \
+        AsyncFinanceInvoicetemplatesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicetemplatesIdEndpoint import \
+        AsyncFinanceInvoicetemplatesIdEndpoint
+
+
+class AsyncFinanceInvoicetemplatesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "invoiceTemplates"
+    _route = "finance/invoiceTemplates"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncFinanceInvoicetemplatesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncFinanceInvoicetemplatesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncFinanceInvoicetemplatesIdEndpoint: The AsyncFinanceInvoicetemplatesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicetemplatesIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[InvoiceTemplate]:
+        """
+        Performs a GET request against the /finance/invoiceTemplates endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[InvoiceTemplate]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(InvoiceTemplate, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[InvoiceTemplate]:
+        """
+        Performs a GET request against the /finance/invoiceTemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[InvoiceTemplate]: The parsed response data.
+        """
+        return self._parse_many(InvoiceTemplate, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> InvoiceTemplate:
+        """
+        Performs a POST request against the /finance/invoiceTemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            InvoiceTemplate: The parsed response data.
+        """
+        return self._parse_one(InvoiceTemplate, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> "AsyncFinanceInvoicetemplatesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceInvoicetemplatesCountEndpoint"
+        )
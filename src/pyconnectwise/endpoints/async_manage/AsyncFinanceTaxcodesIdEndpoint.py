@@ -0,0 +1,136 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import TaxCode
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdCopyEndpoint import \
+        AsyncFinanceTaxcodesIdCopyEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdExpensetypeexemptionsEndpoint import \
+        AsyncFinanceTaxcodesIdExpensetypeexemptionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdInfoEndpoint import \
+        AsyncFinanceTaxcodesIdInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdProducttypeexemptionsEndpoint import \
+        AsyncFinanceTaxcodesIdProducttypeexemptionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdTaxcodelevelsEndpoint import \
+        AsyncFinanceTaxcodesIdTaxcodelevelsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdTaxcodexrefsEndpoint import \
+        AsyncFinanceTaxcodesIdTaxcodexrefsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdUsagesEndpoint import \
+        AsyncFinanceTaxcodesIdUsagesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdWorkroleexemptionsEndpoint import \
+        AsyncFinanceTaxcodesIdWorkroleexemptionsEndpoint
+
+
+class AsyncFinanceTaxcodesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "finance/taxCodes/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[TaxCode]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[TaxCode]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(TaxCode, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxCode:
+        """
+        Performs a GET request against the /finance/taxCodes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCode: The parsed response data.
+        """
+        return self._parse_one(TaxCode, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /finance/taxCodes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxCode:
+        """
+        Performs a PUT request against the /finance/taxCodes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCode: The parsed response data.
+        """
+        return self._parse_one(TaxCode, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxCode:
+        """
+        Performs a PATCH request against the /finance/taxCodes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCode: The parsed response data.
+        """
+        return self._parse_one(TaxCode, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def info(self) -> "AsyncFinanceTaxcodesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdInfoEndpoint")
+
+    @cached_property
+    def product_type_exemptions(self) -> "AsyncFinanceTaxcodesIdProducttypeexemptionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdProducttypeexemptionsEndpoint"
+        )
+
+    @cached_property
+    def work_role_exemptions(self) -> "AsyncFinanceTaxcodesIdWorkroleexemptionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdWorkroleexemptionsEndpoint"
+        )
+
+    @cached_property
+    def tax_code_levels(self) -> "AsyncFinanceTaxcodesIdTaxcodelevelsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdTaxcodelevelsEndpoint"
+        )
+
+    @cached_property
+    def copy(self) -> "AsyncFinanceTaxcodesIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdCopyEndpoint")
+
+    @cached_property
+    def expense_type_exemptions(self) -> "AsyncFinanceTaxcodesIdExpensetypeexemptionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdExpensetypeexemptionsEndpoint"
+        )
+
+    @cached_property
+    def tax_code_x_refs(self) -> "AsyncFinanceTaxcodesIdTaxcodexrefsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdTaxcodexrefsEndpoint"
+        )
+
+    @cached_property
+    def usages(self) -> "AsyncFinanceTaxcodesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncFinanceTaxcodesIdUsagesEndpoint")
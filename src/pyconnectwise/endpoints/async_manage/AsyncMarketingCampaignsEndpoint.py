@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Campaign
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsCountEndpoint import \
+        AsyncMarketingCampaignsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdEndpoint import AsyncMarketingCampaignsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsStatusesEndpoint import \
+        AsyncMarketingCampaignsStatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsSubtypesEndpoint import \
+        AsyncMarketingCampaignsSubtypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsTypesEndpoint import \
+        AsyncMarketingCampaignsTypesEndpoint
+
+
+class AsyncMarketingCampaignsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "campaigns"
+    _route = "marketing/campaigns"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncMarketingCampaignsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncMarketingCampaignsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncMarketingCampaignsIdEndpoint: The AsyncMarketingCampaignsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Campaign]:
+        """
+        Performs a GET request against the /marketing/campaigns endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Campaign]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Campaign, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Campaign]:
+        """
+        Performs a GET request against the /marketing/campaigns endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Campaign]: The parsed response data.
+        """
+        return self._parse_many(Campaign, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Campaign:
+        """
+        Performs a POST request against the /marketing/campaigns endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Campaign: The parsed response data.
+        """
+        return self._parse_one(Campaign, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def types(self) -> "AsyncMarketingCampaignsTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "AsyncMarketingCampaignsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsCountEndpoint")
+
+    @cached_property
+    def statuses(self) -> "AsyncMarketingCampaignsStatusesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsStatusesEndpoint"
+        )
+
+    @cached_property
+    def sub_types(self) -> "AsyncMarketingCampaignsSubtypesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsSubtypesEndpoint"
+        )
@@ -0,0 +1,126 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Campaign
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdActivitiesEndpoint import \
+        AsyncMarketingCampaignsIdActivitiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdAuditsEndpoint import \
+        AsyncMarketingCampaignsIdAuditsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdEmailsopenedEndpoint import \
+        AsyncMarketingCampaignsIdEmailsopenedEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdFormssubmittedEndpoint import \
+        AsyncMarketingCampaignsIdFormssubmittedEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdLinksclickedEndpoint import \
+        AsyncMarketingCampaignsIdLinksclickedEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdOpportunitiesEndpoint import \
+        AsyncMarketingCampaignsIdOpportunitiesEndpoint
+
+
+class AsyncMarketingCampaignsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "marketing/campaigns/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Campaign]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Campaign]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Campaign, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Campaign:
+        """
+        Performs a GET request against the /marketing/campaigns/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Campaign: The parsed response data.
+        """
+        return self._parse_one(Campaign, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /marketing/campaigns/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Campaign:
+        """
+        Performs a PUT request against the /marketing/campaigns/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Campaign: The parsed response data.
+        """
+        return self._parse_one(Campaign, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Campaign:
+        """
+        Performs a PATCH request against the /marketing/campaigns/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Campaign: The parsed response data.
+        """
+        return self._parse_one(Campaign, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def forms_submitted(self) -> "AsyncMarketingCampaignsIdFormssubmittedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdFormssubmittedEndpoint"
+        )
+
+    @cached_property
+    def audits(self) -> "AsyncMarketingCampaignsIdAuditsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdAuditsEndpoint"
+        )
+
+    @cached_property
+    def emails_opened(self) -> "AsyncMarketingCampaignsIdEmailsopenedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdEmailsopenedEndpoint"
+        )
+
+    @cached_property
+    def links_clicked(self) -> "AsyncMarketingCampaignsIdLinksclickedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdLinksclickedEndpoint"
+        )
+
+    @cached_property
+    def activities(self) -> "AsyncMarketingCampaignsIdActivitiesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdActivitiesEndpoint"
+        )
+
+    @cached_property
+    def opportunities(self) -> "AsyncMarketingCampaignsIdOpportunitiesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsIdOpportunitiesEndpoint"
+        )
@@ -0,0 +1,85 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import CampaignSubTypeCampaignSubType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsSubtypesCountEndpoint import \
+        AsyncMarketingCampaignsSubtypesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsSubtypesIdEndpoint import \
+        AsyncMarketingCampaignsSubtypesIdEndpoint
+
+
+class AsyncMarketingCampaignsSubtypesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "subTypes"
+    _route = "marketing/campaigns/subTypes"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncMarketingCampaignsSubtypesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncMarketingCampaignsSubtypesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncMarketingCampaignsSubtypesIdEndpoint: The AsyncMarketingCampaignsSubtypesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsSubtypesIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[CampaignSubTypeCampaignSubType]:
+        """
+        Performs a GET request against the /marketing/campaigns/subTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[CampaignSubTypeCampaignSubType]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(CampaignSubTypeCampaignSubType, page, page_size, params, forward_only)
+
+    async def get(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> list[CampaignSubTypeCampaignSubType]:
+        """
+        Performs a GET request against the /marketing/campaigns/subTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CampaignSubTypeCampaignSubType]: The parsed response data.
+        """
+        return self._parse_many(
+            CampaignSubTypeCampaignSubType, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> CampaignSubTypeCampaignSubType:
+        """
+        Performs a POST request against the /marketing/campaigns/subTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CampaignSubTypeCampaignSubType: The parsed response data.
+        """
+        return self._parse_one(
+            CampaignSubTypeCampaignSubType, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> "AsyncMarketingCampaignsSubtypesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsSubtypesCountEndpoint"
+        )
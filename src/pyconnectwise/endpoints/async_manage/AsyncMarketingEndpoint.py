@@ -0,0 +1,25 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsEndpoint import AsyncMarketingCampaignsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncMarketingGroupsEndpoint import AsyncMarketingGroupsEndpoint
+
+
+class AsyncMarketingEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "marketing"
+    _route = "marketing"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def campaigns(self) -> "AsyncMarketingCampaignsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncMarketingCampaignsEndpoint")
+
+    @cached_property
+    def groups(self) -> "AsyncMarketingGroupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncMarketingGroupsEndpoint")
@@ -0,0 +1,124 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import CatalogItem
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdComponentsEndpoint import \
+        AsyncProcurementCatalogIdComponentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdInfoEndpoint import \
+        AsyncProcurementCatalogIdInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdInventoryEndpoint import \
+        AsyncProcurementCatalogIdInventoryEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdMinimumstockbywarehouseEndpoint import \
+        AsyncProcurementCatalogIdMinimumstockbywarehouseEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdPricingEndpoint import \
+        AsyncProcurementCatalogIdPricingEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdQuantityonhandEndpoint import \
+        AsyncProcurementCatalogIdQuantityonhandEndpoint
+
+
+class AsyncProcurementCatalogIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "procurement/catalog/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[CatalogItem]:
+        """
+        Performs a GET request against the /procurement/catalog/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[CatalogItem]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(CatalogItem, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CatalogItem:
+        """
+        Performs a GET request against the /procurement/catalog/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CatalogItem: The parsed response data.
+        """
+        return self._parse_one(CatalogItem, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /procurement/catalog/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CatalogItem:
+        """
+        Performs a PUT request against the /procurement/catalog/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CatalogItem: The parsed response data.
+        """
+        return self._parse_one(CatalogItem, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CatalogItem:
+        """
+        Performs a PATCH request against the /procurement/catalog/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CatalogItem: The parsed response data.
+        """
+        return self._parse_one(CatalogItem, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def info(self) -> "AsyncProcurementCatalogIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdInfoEndpoint")
+
+    @cached_property
+    def quantity_on_hand(self) -> "AsyncProcurementCatalogIdQuantityonhandEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdQuantityonhandEndpoint"
+        )
+
+    @cached_property
+    def pricing(self) -> "AsyncProcurementCatalogIdPricingEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdPricingEndpoint"
+        )
+
+    @cached_property
+    def components(self) -> "AsyncProcurementCatalogIdComponentsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdComponentsEndpoint"
+        )
+
+    @cached_property
+    def minimum_stock_by_warehouse(self) -> "AsyncProcurementCatalogIdMinimumstockbywarehouseEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdMinimumstockbywarehouseEndpoint"
+        )
+
+    @cached_property
+    def inventory(self) -> "AsyncProcurementCatalogIdInventoryEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdInventoryEndpoint"
+        )
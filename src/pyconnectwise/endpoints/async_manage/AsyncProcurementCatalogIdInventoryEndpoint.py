@@ -0,0 +1,67 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import CatalogInventory
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdInventoryCountEndpoint import \
+        AsyncProcurementCatalogIdInventoryCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdInventoryIdEndpoint import \
+        AsyncProcurementCatalogIdInventoryIdEndpoint
+
+
+class AsyncProcurementCatalogIdInventoryEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "inventory"
+    _route = "procurement/catalog/{id}/inventory"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProcurementCatalogIdInventoryIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProcurementCatalogIdInventoryIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProcurementCatalogIdInventoryIdEndpoint: The AsyncProcurementCatalogIdInventoryIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdInventoryIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[CatalogInventory]:
+        """
+        Performs a GET request against the /procurement/catalog/{id}/inventory endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[CatalogInventory]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(CatalogInventory, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CatalogInventory]:
+        """
+        Performs a GET request against the /procurement/catalog/{id}/inventory endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CatalogInventory]: The parsed response data.
+        """
+        return self._parse_many(
+            CatalogInventory, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> "AsyncProcurementCatalogIdInventoryCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogIdInventoryCountEndpoint"
+        )
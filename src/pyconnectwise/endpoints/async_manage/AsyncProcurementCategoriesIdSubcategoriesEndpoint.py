@@ -0,0 +1,46 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCategoriesIdSubcategoriesCountEndpoint import \
+        AsyncProcurementCategoriesIdSubcategoriesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCategoriesIdSubcategoriesIdEndpoint import \
+        AsyncProcurementCategoriesIdSubcategoriesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCategoriesIdSubcategoriesInfoEndpoint import \
+        AsyncProcurementCategoriesIdSubcategoriesInfoEndpoint
+
+
+class AsyncProcurementCategoriesIdSubcategoriesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "subcategories"
+    _route = "procurement/categories/{id}/subcategories"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProcurementCategoriesIdSubcategoriesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProcurementCategoriesIdSubcategoriesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProcurementCategoriesIdSubcategoriesIdEndpoint: The AsyncProcurementCategoriesIdSubcategoriesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCategoriesIdSubcategoriesIdEndpoint", id
+        )
+
+    @cached_property
+    def info(self) -> "AsyncProcurementCategoriesIdSubcategoriesInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCategoriesIdSubcategoriesInfoEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "AsyncProcurementCategoriesIdSubcategoriesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementCategoriesIdSubcategoriesCountEndpoint"
+        )
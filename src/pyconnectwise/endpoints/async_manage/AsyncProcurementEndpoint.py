@@ -0,0 +1,160 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementAdjustmentsEndpoint import \
+        AsyncProcurementAdjustmentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogEndpoint import AsyncProcurementCatalogEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementCategoriesEndpoint import \
+        AsyncProcurementCategoriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementDirectionalsyncsEndpoint import \
+        AsyncProcurementDirectionalsyncsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementManufacturersEndpoint import \
+        AsyncProcurementManufacturersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementOnhandserialnumbersEndpoint import \
+        AsyncProcurementOnhandserialnumbersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPricingschedulesEndpoint import \
+        AsyncProcurementPricingschedulesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementProductsEndpoint import AsyncProcurementProductsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseordersEndpoint import \
+        AsyncProcurementPurchaseordersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseorderstatusesEndpoint import \
+        AsyncProcurementPurchaseorderstatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchasingdemandsEndpoint import \
+        AsyncProcurementPurchasingdemandsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementRmaactionsEndpoint import \
+        AsyncProcurementRmaactionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementRmadispositionsEndpoint import \
+        AsyncProcurementRmadispositionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementRmastatusesEndpoint import \
+        AsyncProcurementRmastatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementRmatagsEndpoint import AsyncProcurementRmatagsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementSettingsEndpoint import AsyncProcurementSettingsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementShipmentmethodsEndpoint import \
+        AsyncProcurementShipmentmethodsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementSubcategoriesEndpoint import \
+        AsyncProcurementSubcategoriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementTypesEndpoint import AsyncProcurementTypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementUnitofmeasuresEndpoint import \
+        AsyncProcurementUnitofmeasuresEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementWarehousebinsEndpoint import \
+        AsyncProcurementWarehousebinsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementWarehousesEndpoint import \
+        AsyncProcurementWarehousesEndpoint
+
+
+class AsyncProcurementEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "procurement"
+    _route = "procurement"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def directional_syncs(self) -> "AsyncProcurementDirectionalsyncsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementDirectionalsyncsEndpoint"
+        )
+
+    @cached_property
+    def rma_tags(self) -> "AsyncProcurementRmatagsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementRmatagsEndpoint")
+
+    @cached_property
+    def warehouses(self) -> "AsyncProcurementWarehousesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementWarehousesEndpoint")
+
+    @cached_property
+    def rma_statuses(self) -> "AsyncProcurementRmastatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementRmastatusesEndpoint")
+
+    @cached_property
+    def unit_of_measures(self) -> "AsyncProcurementUnitofmeasuresEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementUnitofmeasuresEndpoint"
+        )
+
+    @cached_property
+    def warehouse_bins(self) -> "AsyncProcurementWarehousebinsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementWarehousebinsEndpoint")
+
+    @cached_property
+    def types(self) -> "AsyncProcurementTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementTypesEndpoint")
+
+    @cached_property
+    def subcategories(self) -> "AsyncProcurementSubcategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementSubcategoriesEndpoint")
+
+    @cached_property
+    def adjustments(self) -> "AsyncProcurementAdjustmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementAdjustmentsEndpoint")
+
+    @cached_property
+    def r_m_a_dispositions(self) -> "AsyncProcurementRmadispositionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementRmadispositionsEndpoint"
+        )
+
+    @cached_property
+    def shipmentmethods(self) -> "AsyncProcurementShipmentmethodsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementShipmentmethodsEndpoint"
+        )
+
+    @cached_property
+    def purchaseorders(self) -> "AsyncProcurementPurchaseordersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseordersEndpoint"
+        )
+
+    @cached_property
+    def purchasing_demands(self) -> "AsyncProcurementPurchasingdemandsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchasingdemandsEndpoint"
+        )
+
+    @cached_property
+    def settings(self) -> "AsyncProcurementSettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementSettingsEndpoint")
+
+    @cached_property
+    def onhandserialnumbers(self) -> "AsyncProcurementOnhandserialnumbersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementOnhandserialnumbersEndpoint"
+        )
+
+    @cached_property
+    def pricingschedules(self) -> "AsyncProcurementPricingschedulesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPricingschedulesEndpoint"
+        )
+
+    @cached_property
+    def categories(self) -> "AsyncProcurementCategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementCategoriesEndpoint")
+
+    @cached_property
+    def products(self) -> "AsyncProcurementProductsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementProductsEndpoint")
+
+    @cached_property
+    def manufacturers(self) -> "AsyncProcurementManufacturersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementManufacturersEndpoint")
+
+    @cached_property
+    def purchaseorderstatuses(self) -> "AsyncProcurementPurchaseorderstatusesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseorderstatusesEndpoint"
+        )
+
+    @cached_property
+    def catalog(self) -> "AsyncProcurementCatalogEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementCatalogEndpoint")
+
+    @cached_property
+    def rma_actions(self) -> "AsyncProcurementRmaactionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProcurementRmaactionsEndpoint")
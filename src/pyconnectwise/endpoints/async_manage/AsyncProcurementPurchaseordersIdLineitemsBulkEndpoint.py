@@ -0,0 +1,50 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import BulkResult
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncProcurementPurchaseordersIdLineitemsBulkEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "bulk"
+    _route = "procurement/purchaseorders/{id}/lineitems/bulk"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BulkResult:
+        """
+        Performs a POST request against the /procurement/purchaseorders/{id}/lineitems/bulk endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BulkResult: The parsed response data.
+        """
+        return self._parse_one(BulkResult, (await super()._make_request("POST", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BulkResult:
+        """
+        Performs a DELETE request against the /procurement/purchaseorders/{id}/lineitems/bulk endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BulkResult: The parsed response data.
+        """
+        return self._parse_one(BulkResult, (await super()._make_request("DELETE", data=data, params=params)).content)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BulkResult:
+        """
+        Performs a PUT request against the /procurement/purchaseorders/{id}/lineitems/bulk endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BulkResult: The parsed response data.
+        """
+        return self._parse_one(BulkResult, (await super()._make_request("PUT", data=data, params=params)).content)
@@ -0,0 +1,101 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import PurchaseOrderLineItem
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseordersIdLineitemsBulkEndpoint import \
+        AsyncProcurementPurchaseordersIdLineitemsBulkEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseordersIdLineitemsCountEndpoint import \
+        AsyncProcurementPurchaseordersIdLineitemsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseordersIdLineitemsIdEndpoint import \
+        AsyncProcurementPurchaseordersIdLineitemsIdEndpoint
+
+
+class AsyncProcurementPurchaseordersIdLineitemsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "lineitems"
+    _route = "procurement/purchaseorders/{id}/lineitems"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProcurementPurchaseordersIdLineitemsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProcurementPurchaseordersIdLineitemsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProcurementPurchaseordersIdLineitemsIdEndpoint: The AsyncProcurementPurchaseordersIdLineitemsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseordersIdLineitemsIdEndpoint", id
+        )
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[PurchaseOrderLineItem]:
+        """
+        Performs a GET request against the /procurement/purchaseorders/{id}/lineitems endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[PurchaseOrderLineItem]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(PurchaseOrderLineItem, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PurchaseOrderLineItem]:
+        """
+        Performs a GET request against the /procurement/purchaseorders/{id}/lineitems endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PurchaseOrderLineItem]: The parsed response data.
+        """
+        return self._parse_many(
+            PurchaseOrderLineItem, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrderLineItem:
+        """
+        Performs a POST request against the /procurement/purchaseorders/{id}/lineitems endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PurchaseOrderLineItem: The parsed response data.
+        """
+        return self._parse_one(
+            PurchaseOrderLineItem, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /procurement/purchaseorders/{id}/lineitems endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def bulk(self) -> "AsyncProcurementPurchaseordersIdLineitemsBulkEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseordersIdLineitemsBulkEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "AsyncProcurementPurchaseordersIdLineitemsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseordersIdLineitemsCountEndpoint"
+        )
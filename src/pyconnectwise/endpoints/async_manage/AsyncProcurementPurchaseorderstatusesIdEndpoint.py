@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import PurchaseOrderStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint import \
+        AsyncProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseorderstatusesIdNotificationsEndpoint import \
+        AsyncProcurementPurchaseorderstatusesIdNotificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseorderstatusesIdUsagesEndpoint import \
+        AsyncProcurementPurchaseorderstatusesIdUsagesEndpoint
+
+
+class AsyncProcurementPurchaseorderstatusesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "procurement/purchaseorderstatuses/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[PurchaseOrderStatus]:
+        """
+        Performs a GET request against the /procurement/purchaseorderstatuses/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[PurchaseOrderStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(PurchaseOrderStatus, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrderStatus:
+        """
+        Performs a GET request against the /procurement/purchaseorderstatuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PurchaseOrderStatus: The parsed response data.
+        """
+        return self._parse_one(
+            PurchaseOrderStatus, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /procurement/purchaseorderstatuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrderStatus:
+        """
+        Performs a PATCH request against the /procurement/purchaseorderstatuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PurchaseOrderStatus: The parsed response data.
+        """
+        return self._parse_one(
+            PurchaseOrderStatus, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrderStatus:
+        """
+        Performs a PUT request against the /procurement/purchaseorderstatuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PurchaseOrderStatus: The parsed response data.
+        """
+        return self._parse_one(
+            PurchaseOrderStatus, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    @cached_property
+    def usages(self) -> "AsyncProcurementPurchaseorderstatusesIdUsagesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseorderstatusesIdUsagesEndpoint"
+        )
+
+    @cached_property
+    def emailtemplates(self) -> "AsyncProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint"
+        )
+
+    @cached_property
+    def notifications(self) -> "AsyncProcurementPurchaseorderstatusesIdNotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementPurchaseorderstatusesIdNotificationsEndpoint"
+        )
@@ -0,0 +1,44 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementSubcategoriesCountEndpoint import \
+        AsyncProcurementSubcategoriesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementSubcategoriesIdEndpoint import \
+        AsyncProcurementSubcategoriesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementSubcategoriesInfoEndpoint import \
+        AsyncProcurementSubcategoriesInfoEndpoint
+
+
+class AsyncProcurementSubcategoriesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "subcategories"
+    _route = "procurement/subcategories"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProcurementSubcategoriesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProcurementSubcategoriesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProcurementSubcategoriesIdEndpoint: The AsyncProcurementSubcategoriesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncProcurementSubcategoriesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncProcurementSubcategoriesInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementSubcategoriesInfoEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "AsyncProcurementSubcategoriesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementSubcategoriesCountEndpoint"
+        )
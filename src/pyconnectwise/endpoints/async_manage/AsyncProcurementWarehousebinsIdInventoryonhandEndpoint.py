@@ -0,0 +1,67 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import InventoryOnHand
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementWarehousebinsIdInventoryonhandCountEndpoint import \
+        AsyncProcurementWarehousebinsIdInventoryonhandCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProcurementWarehousebinsIdInventoryonhandIdEndpoint import \
+        AsyncProcurementWarehousebinsIdInventoryonhandIdEndpoint
+
+
+class AsyncProcurementWarehousebinsIdInventoryonhandEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "inventoryOnHand"
+    _route = "procurement/warehouseBins/{id}/inventoryOnHand"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProcurementWarehousebinsIdInventoryonhandIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProcurementWarehousebinsIdInventoryonhandIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProcurementWarehousebinsIdInventoryonhandIdEndpoint: The AsyncProcurementWarehousebinsIdInventoryonhandIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementWarehousebinsIdInventoryonhandIdEndpoint", id
+        )
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[InventoryOnHand]:
+        """
+        Performs a GET request against the /procurement/warehouseBins/{id}/inventoryOnHand endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[InventoryOnHand]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(InventoryOnHand, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[InventoryOnHand]:
+        """
+        Performs a GET request against the /procurement/warehouseBins/{id}/inventoryOnHand endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[InventoryOnHand]: The parsed response data.
+        """
+        return self._parse_many(InventoryOnHand, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> "AsyncProcurementWarehousebinsIdInventoryonhandCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProcurementWarehousebinsIdInventoryonhandCountEndpoint"
+        )
@@ -0,0 +1,84 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProjectBillingratesEndpoint import AsyncProjectBillingratesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectBoardsEndpoint import AsyncProjectBoardsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectIdEndpoint import AsyncProjectIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectPhasestatusesEndpoint import AsyncProjectPhasestatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectProjectsEndpoint import AsyncProjectProjectsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectProjecttemplatesEndpoint import \
+        AsyncProjectProjecttemplatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectProjecttypesEndpoint import AsyncProjectProjecttypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectSecurityrolesEndpoint import AsyncProjectSecurityrolesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectStatusesEndpoint import AsyncProjectStatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectStatusindicatorsEndpoint import \
+        AsyncProjectStatusindicatorsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketnoteEndpoint import AsyncProjectTicketnoteEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsEndpoint import AsyncProjectTicketsEndpoint
+
+
+class AsyncProjectEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "project"
+    _route = "project"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProjectIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProjectIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProjectIdEndpoint: The AsyncProjectIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncProjectIdEndpoint", id)
+
+    @cached_property
+    def projects(self) -> "AsyncProjectProjectsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectProjectsEndpoint")
+
+    @cached_property
+    def phase_statuses(self) -> "AsyncProjectPhasestatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectPhasestatusesEndpoint")
+
+    @cached_property
+    def security_roles(self) -> "AsyncProjectSecurityrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectSecurityrolesEndpoint")
+
+    @cached_property
+    def status_indicators(self) -> "AsyncProjectStatusindicatorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectStatusindicatorsEndpoint")
+
+    @cached_property
+    def ticket_note(self) -> "AsyncProjectTicketnoteEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectTicketnoteEndpoint")
+
+    @cached_property
+    def billing_rates(self) -> "AsyncProjectBillingratesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectBillingratesEndpoint")
+
+    @cached_property
+    def project_types(self) -> "AsyncProjectProjecttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectProjecttypesEndpoint")
+
+    @cached_property
+    def tickets(self) -> "AsyncProjectTicketsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectTicketsEndpoint")
+
+    @cached_property
+    def boards(self) -> "AsyncProjectBoardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectBoardsEndpoint")
+
+    @cached_property
+    def statuses(self) -> "AsyncProjectStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectStatusesEndpoint")
+
+    @cached_property
+    def project_templates(self) -> "AsyncProjectProjecttemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectProjecttemplatesEndpoint")
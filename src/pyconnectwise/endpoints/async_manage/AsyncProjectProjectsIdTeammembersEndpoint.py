@@ -0,0 +1,81 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import ProjectTeamMember
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProjectProjectsIdTeammembersCountEndpoint import \
+        AsyncProjectProjectsIdTeammembersCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectProjectsIdTeammembersIdEndpoint import \
+        AsyncProjectProjectsIdTeammembersIdEndpoint
+
+
+class AsyncProjectProjectsIdTeammembersEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "teamMembers"
+    _route = "project/projects/{id}/teamMembers"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProjectProjectsIdTeammembersIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProjectProjectsIdTeammembersIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProjectProjectsIdTeammembersIdEndpoint: The AsyncProjectProjectsIdTeammembersIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncProjectProjectsIdTeammembersIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[ProjectTeamMember]:
+        """
+        Performs a GET request against the /project/projects/{id}/teamMembers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[ProjectTeamMember]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(ProjectTeamMember, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectTeamMember]:
+        """
+        Performs a GET request against the /project/projects/{id}/teamMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectTeamMember]: The parsed response data.
+        """
+        return self._parse_many(
+            ProjectTeamMember, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTeamMember:
+        """
+        Performs a POST request against the /project/projects/{id}/teamMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTeamMember: The parsed response data.
+        """
+        return self._parse_one(
+            ProjectTeamMember, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> "AsyncProjectProjectsIdTeammembersCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectProjectsIdTeammembersCountEndpoint"
+        )
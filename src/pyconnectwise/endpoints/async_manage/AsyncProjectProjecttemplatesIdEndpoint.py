@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import ProjectTemplate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProjectProjecttemplatesIdProjecttemplateticketsEndpoint import \
+        AsyncProjectProjecttemplatesIdProjecttemplateticketsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectProjecttemplatesIdWorkplanEndpoint import \
+        AsyncProjectProjecttemplatesIdWorkplanEndpoint
+
+
+class AsyncProjectProjecttemplatesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "project/projectTemplates/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[ProjectTemplate]:
+        """
+        Performs a GET request against the /project/projectTemplates/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[ProjectTemplate]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(ProjectTemplate, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTemplate:
+        """
+        Performs a GET request against the /project/projectTemplates/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTemplate: The parsed response data.
+        """
+        return self._parse_one(ProjectTemplate, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /project/projectTemplates/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTemplate:
+        """
+        Performs a PUT request against the /project/projectTemplates/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTemplate: The parsed response data.
+        """
+        return self._parse_one(ProjectTemplate, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTemplate:
+        """
+        Performs a PATCH request against the /project/projectTemplates/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTemplate: The parsed response data.
+        """
+        return self._parse_one(
+            ProjectTemplate, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    @cached_property
+    def project_template_tickets(self) -> "AsyncProjectProjecttemplatesIdProjecttemplateticketsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectProjecttemplatesIdProjecttemplateticketsEndpoint"
+        )
+
+    @cached_property
+    def workplan(self) -> "AsyncProjectProjecttemplatesIdWorkplanEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectProjecttemplatesIdWorkplanEndpoint"
+        )
@@ -0,0 +1,65 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import StatusIndicator
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProjectStatusindicatorsCountEndpoint import \
+        AsyncProjectStatusindicatorsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectStatusindicatorsIdEndpoint import \
+        AsyncProjectStatusindicatorsIdEndpoint
+
+
+class AsyncProjectStatusindicatorsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "statusIndicators"
+    _route = "project/statusIndicators"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProjectStatusindicatorsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProjectStatusindicatorsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProjectStatusindicatorsIdEndpoint: The AsyncProjectStatusindicatorsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncProjectStatusindicatorsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[StatusIndicator]:
+        """
+        Performs a GET request against the /project/statusIndicators endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[StatusIndicator]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(StatusIndicator, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[StatusIndicator]:
+        """
+        Performs a GET request against the /project/statusIndicators endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[StatusIndicator]: The parsed response data.
+        """
+        return self._parse_many(StatusIndicator, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> "AsyncProjectStatusindicatorsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectStatusindicatorsCountEndpoint"
+        )
@@ -0,0 +1,27 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketnoteIdEndpoint import AsyncProjectTicketnoteIdEndpoint
+
+
+class AsyncProjectTicketnoteEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "ticketNote"
+    _route = "project/ticketNote"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncProjectTicketnoteIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncProjectTicketnoteIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncProjectTicketnoteIdEndpoint: The AsyncProjectTicketnoteIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncProjectTicketnoteIdEndpoint", id)
@@ -0,0 +1,148 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import ProjectTicket
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdActivitiesEndpoint import \
+        AsyncProjectTicketsIdActivitiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdAllnotesEndpoint import \
+        AsyncProjectTicketsIdAllnotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdConfigurationsEndpoint import \
+        AsyncProjectTicketsIdConfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdConvertEndpoint import \
+        AsyncProjectTicketsIdConvertEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdDocumentsEndpoint import \
+        AsyncProjectTicketsIdDocumentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdNotesEndpoint import \
+        AsyncProjectTicketsIdNotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdProductsEndpoint import \
+        AsyncProjectTicketsIdProductsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdScheduleentriesEndpoint import \
+        AsyncProjectTicketsIdScheduleentriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdTasksEndpoint import \
+        AsyncProjectTicketsIdTasksEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdTimeentriesEndpoint import \
+        AsyncProjectTicketsIdTimeentriesEndpoint
+
+
+class AsyncProjectTicketsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "project/tickets/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[ProjectTicket]:
+        """
+        Performs a GET request against the /project/tickets/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[ProjectTicket]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(ProjectTicket, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTicket:
+        """
+        Performs a GET request against the /project/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTicket: The parsed response data.
+        """
+        return self._parse_one(ProjectTicket, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /project/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTicket:
+        """
+        Performs a PUT request against the /project/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTicket: The parsed response data.
+        """
+        return self._parse_one(ProjectTicket, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTicket:
+        """
+        Performs a PATCH request against the /project/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTicket: The parsed response data.
+        """
+        return self._parse_one(ProjectTicket, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def scheduleentries(self) -> "AsyncProjectTicketsIdScheduleentriesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdScheduleentriesEndpoint"
+        )
+
+    @cached_property
+    def tasks(self) -> "AsyncProjectTicketsIdTasksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdTasksEndpoint")
+
+    @cached_property
+    def all_notes(self) -> "AsyncProjectTicketsIdAllnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdAllnotesEndpoint")
+
+    @cached_property
+    def products(self) -> "AsyncProjectTicketsIdProductsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdProductsEndpoint")
+
+    @cached_property
+    def timeentries(self) -> "AsyncProjectTicketsIdTimeentriesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdTimeentriesEndpoint"
+        )
+
+    @cached_property
+    def convert(self) -> "AsyncProjectTicketsIdConvertEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdConvertEndpoint")
+
+    @cached_property
+    def notes(self) -> "AsyncProjectTicketsIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdNotesEndpoint")
+
+    @cached_property
+    def activities(self) -> "AsyncProjectTicketsIdActivitiesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdActivitiesEndpoint"
+        )
+
+    @cached_property
+    def documents(self) -> "AsyncProjectTicketsIdDocumentsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdDocumentsEndpoint"
+        )
+
+    @cached_property
+    def configurations(self) -> "AsyncProjectTicketsIdConfigurationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncProjectTicketsIdConfigurationsEndpoint"
+        )
@@ -0,0 +1,70 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesActivitiesEndpoint import AsyncSalesActivitiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesCommissionsEndpoint import AsyncSalesCommissionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesEndpoint import AsyncSalesOpportunitiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOrdersEndpoint import AsyncSalesOrdersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesProbabilitiesEndpoint import AsyncSalesProbabilitiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesQuotasEndpoint import AsyncSalesQuotasEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesRolesEndpoint import AsyncSalesRolesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesSalesteamsEndpoint import AsyncSalesSalesteamsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesScheduleEndpoint import AsyncSalesScheduleEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesServiceEndpoint import AsyncSalesServiceEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesStagesEndpoint import AsyncSalesStagesEndpoint
+
+
+class AsyncSalesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "sales"
+    _route = "sales"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def sales_teams(self) -> "AsyncSalesSalesteamsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesSalesteamsEndpoint")
+
+    @cached_property
+    def stages(self) -> "AsyncSalesStagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesStagesEndpoint")
+
+    @cached_property
+    def service(self) -> "AsyncSalesServiceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesServiceEndpoint")
+
+    @cached_property
+    def commissions(self) -> "AsyncSalesCommissionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesCommissionsEndpoint")
+
+    @cached_property
+    def probabilities(self) -> "AsyncSalesProbabilitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesProbabilitiesEndpoint")
+
+    @cached_property
+    def orders(self) -> "AsyncSalesOrdersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesOrdersEndpoint")
+
+    @cached_property
+    def roles(self) -> "AsyncSalesRolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesRolesEndpoint")
+
+    @cached_property
+    def schedule(self) -> "AsyncSalesScheduleEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesScheduleEndpoint")
+
+    @cached_property
+    def quotas(self) -> "AsyncSalesQuotasEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesQuotasEndpoint")
+
+    @cached_property
+    def opportunities(self) -> "AsyncSalesOpportunitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesEndpoint")
+
+    @cached_property
+    def activities(self) -> "AsyncSalesActivitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesActivitiesEndpoint")
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Opportunity
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesCountEndpoint import \
+        AsyncSalesOpportunitiesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesDefaultEndpoint import \
+        AsyncSalesOpportunitiesDefaultEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdEndpoint import AsyncSalesOpportunitiesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesRatingsEndpoint import \
+        AsyncSalesOpportunitiesRatingsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesStatusesEndpoint import \
+        AsyncSalesOpportunitiesStatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesTypesEndpoint import \
+        AsyncSalesOpportunitiesTypesEndpoint
+
+
+class AsyncSalesOpportunitiesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "opportunities"
+    _route = "sales/opportunities"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSalesOpportunitiesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSalesOpportunitiesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSalesOpportunitiesIdEndpoint: The AsyncSalesOpportunitiesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Opportunity]:
+        """
+        Performs a GET request against the /sales/opportunities endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Opportunity]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Opportunity, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Opportunity]:
+        """
+        Performs a GET request against the /sales/opportunities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Opportunity]: The parsed response data.
+        """
+        return self._parse_many(Opportunity, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Opportunity:
+        """
+        Performs a POST request against the /sales/opportunities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Opportunity: The parsed response data.
+        """
+        return self._parse_one(Opportunity, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def ratings(self) -> "AsyncSalesOpportunitiesRatingsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesRatingsEndpoint"
+        )
+
+    @cached_property
+    def types(self) -> "AsyncSalesOpportunitiesTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "AsyncSalesOpportunitiesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesCountEndpoint")
+
+    @cached_property
+    def default(self) -> "AsyncSalesOpportunitiesDefaultEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesDefaultEndpoint"
+        )
+
+    @cached_property
+    def statuses(self) -> "AsyncSalesOpportunitiesStatusesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesStatusesEndpoint"
+        )
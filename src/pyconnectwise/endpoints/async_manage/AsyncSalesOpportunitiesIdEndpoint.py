@@ -0,0 +1,140 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Opportunity
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdContactsEndpoint import \
+        AsyncSalesOpportunitiesIdContactsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdConverttoagreementEndpoint import \
+        AsyncSalesOpportunitiesIdConverttoagreementEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdConverttoprojectEndpoint import \
+        AsyncSalesOpportunitiesIdConverttoprojectEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdConverttosalesorderEndpoint import \
+        AsyncSalesOpportunitiesIdConverttosalesorderEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdConverttoserviceticketEndpoint import \
+        AsyncSalesOpportunitiesIdConverttoserviceticketEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdForecastEndpoint import \
+        AsyncSalesOpportunitiesIdForecastEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdNotesEndpoint import \
+        AsyncSalesOpportunitiesIdNotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdTeamEndpoint import \
+        AsyncSalesOpportunitiesIdTeamEndpoint
+
+
+class AsyncSalesOpportunitiesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "sales/opportunities/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Opportunity]:
+        """
+        Performs a GET request against the /sales/opportunities/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Opportunity]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Opportunity, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Opportunity:
+        """
+        Performs a GET request against the /sales/opportunities/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Opportunity: The parsed response data.
+        """
+        return self._parse_one(Opportunity, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /sales/opportunities/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Opportunity:
+        """
+        Performs a PUT request against the /sales/opportunities/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Opportunity: The parsed response data.
+        """
+        return self._parse_one(Opportunity, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Opportunity:
+        """
+        Performs a PATCH request against the /sales/opportunities/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Opportunity: The parsed response data.
+        """
+        return self._parse_one(Opportunity, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def forecast(self) -> "AsyncSalesOpportunitiesIdForecastEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdForecastEndpoint"
+        )
+
+    @cached_property
+    def convert_to_sales_order(self) -> "AsyncSalesOpportunitiesIdConverttosalesorderEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdConverttosalesorderEndpoint"
+        )
+
+    @cached_property
+    def notes(self) -> "AsyncSalesOpportunitiesIdNotesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdNotesEndpoint"
+        )
+
+    @cached_property
+    def convert_to_service_ticket(self) -> "AsyncSalesOpportunitiesIdConverttoserviceticketEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdConverttoserviceticketEndpoint"
+        )
+
+    @cached_property
+    def convert_to_project(self) -> "AsyncSalesOpportunitiesIdConverttoprojectEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdConverttoprojectEndpoint"
+        )
+
+    @cached_property
+    def contacts(self) -> "AsyncSalesOpportunitiesIdContactsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdContactsEndpoint"
+        )
+
+    @cached_property
+    def team(self) -> "AsyncSalesOpportunitiesIdTeamEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdTeamEndpoint")
+
+    @cached_property
+    def convert_to_agreement(self) -> "AsyncSalesOpportunitiesIdConverttoagreementEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOpportunitiesIdConverttoagreementEndpoint"
+        )
@@ -0,0 +1,38 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOrdersStatusesIdEmailtemplatesCountEndpoint import \
+        AsyncSalesOrdersStatusesIdEmailtemplatesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOrdersStatusesIdEmailtemplatesIdEndpoint import \
+        AsyncSalesOrdersStatusesIdEmailtemplatesIdEndpoint
+
+
+class AsyncSalesOrdersStatusesIdEmailtemplatesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "emailtemplates"
+    _route = "sales/orders/statuses/{id}/emailtemplates"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSalesOrdersStatusesIdEmailtemplatesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSalesOrdersStatusesIdEmailtemplatesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSalesOrdersStatusesIdEmailtemplatesIdEndpoint: The AsyncSalesOrdersStatusesIdEmailtemplatesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOrdersStatusesIdEmailtemplatesIdEndpoint", id
+        )
+
+    @cached_property
+    def count(self) -> "AsyncSalesOrdersStatusesIdEmailtemplatesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOrdersStatusesIdEmailtemplatesCountEndpoint"
+        )
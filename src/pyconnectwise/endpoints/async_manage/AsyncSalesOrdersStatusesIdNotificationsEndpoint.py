@@ -0,0 +1,83 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import OrderStatusNotification
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOrdersStatusesIdNotificationsCountEndpoint import \
+        AsyncSalesOrdersStatusesIdNotificationsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesOrdersStatusesIdNotificationsIdEndpoint import \
+        AsyncSalesOrdersStatusesIdNotificationsIdEndpoint
+
+
+class AsyncSalesOrdersStatusesIdNotificationsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "notifications"
+    _route = "sales/orders/statuses/{id}/notifications"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSalesOrdersStatusesIdNotificationsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSalesOrdersStatusesIdNotificationsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSalesOrdersStatusesIdNotificationsIdEndpoint: The AsyncSalesOrdersStatusesIdNotificationsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOrdersStatusesIdNotificationsIdEndpoint", id
+        )
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[OrderStatusNotification]:
+        """
+        Performs a GET request against the /sales/orders/statuses/{id}/notifications endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[OrderStatusNotification]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(OrderStatusNotification, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OrderStatusNotification]:
+        """
+        Performs a GET request against the /sales/orders/statuses/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OrderStatusNotification]: The parsed response data.
+        """
+        return self._parse_many(
+            OrderStatusNotification, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OrderStatusNotification:
+        """
+        Performs a POST request against the /sales/orders/statuses/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            OrderStatusNotification: The parsed response data.
+        """
+        return self._parse_one(
+            OrderStatusNotification, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> "AsyncSalesOrdersStatusesIdNotificationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesOrdersStatusesIdNotificationsCountEndpoint"
+        )
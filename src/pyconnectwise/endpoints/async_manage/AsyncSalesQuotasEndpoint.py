@@ -0,0 +1,73 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import SalesQuota
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesQuotasCountEndpoint import AsyncSalesQuotasCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesQuotasIdEndpoint import AsyncSalesQuotasIdEndpoint
+
+
+class AsyncSalesQuotasEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "quotas"
+    _route = "sales/quotas"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSalesQuotasIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSalesQuotasIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSalesQuotasIdEndpoint: The AsyncSalesQuotasIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSalesQuotasIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[SalesQuota]:
+        """
+        Performs a GET request against the /sales/quotas endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[SalesQuota]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(SalesQuota, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SalesQuota]:
+        """
+        Performs a GET request against the /sales/quotas endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SalesQuota]: The parsed response data.
+        """
+        return self._parse_many(SalesQuota, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SalesQuota:
+        """
+        Performs a POST request against the /sales/quotas endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SalesQuota: The parsed response data.
+        """
+        return self._parse_one(SalesQuota, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> "AsyncSalesQuotasCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesQuotasCountEndpoint")
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesScheduleHolidaylistsIdEndpoint import \
+        AsyncSalesScheduleHolidaylistsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesScheduleHolidaylistsInfoEndpoint import \
+        AsyncSalesScheduleHolidaylistsInfoEndpoint
+
+
+class AsyncSalesScheduleHolidaylistsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "holidaylists"
+    _route = "sales/schedule/holidaylists"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSalesScheduleHolidaylistsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSalesScheduleHolidaylistsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSalesScheduleHolidaylistsIdEndpoint: The AsyncSalesScheduleHolidaylistsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSalesScheduleHolidaylistsIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncSalesScheduleHolidaylistsInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSalesScheduleHolidaylistsInfoEndpoint"
+        )
@@ -0,0 +1,20 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesServicePriorityEndpoint import AsyncSalesServicePriorityEndpoint
+
+
+class AsyncSalesServiceEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "service"
+    _route = "sales/service"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def priority(self) -> "AsyncSalesServicePriorityEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesServicePriorityEndpoint")
@@ -0,0 +1,82 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import OpportunityStage
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSalesStagesCountEndpoint import AsyncSalesStagesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesStagesIdEndpoint import AsyncSalesStagesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSalesStagesInfoEndpoint import AsyncSalesStagesInfoEndpoint
+
+
+class AsyncSalesStagesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "stages"
+    _route = "sales/stages"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSalesStagesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSalesStagesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSalesStagesIdEndpoint: The AsyncSalesStagesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSalesStagesIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[OpportunityStage]:
+        """
+        Performs a GET request against the /sales/stages endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[OpportunityStage]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(OpportunityStage, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OpportunityStage]:
+        """
+        Performs a GET request against the /sales/stages endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OpportunityStage]: The parsed response data.
+        """
+        return self._parse_many(
+            OpportunityStage, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OpportunityStage:
+        """
+        Performs a POST request against the /sales/stages endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            OpportunityStage: The parsed response data.
+        """
+        return self._parse_one(
+            OpportunityStage, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def info(self) -> "AsyncSalesStagesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesStagesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "AsyncSalesStagesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSalesStagesCountEndpoint")
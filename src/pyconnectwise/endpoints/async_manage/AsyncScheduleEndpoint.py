@@ -0,0 +1,66 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleCalendarsEndpoint import AsyncScheduleCalendarsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleColorsEndpoint import AsyncScheduleColorsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleDetailsEndpoint import AsyncScheduleDetailsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleEntriesEndpoint import AsyncScheduleEntriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsEndpoint import AsyncScheduleHolidaylistsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSchedulePortalcalendarsEndpoint import \
+        AsyncSchedulePortalcalendarsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleRemindertimesEndpoint import \
+        AsyncScheduleRemindertimesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleStatusesEndpoint import AsyncScheduleStatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleTypesEndpoint import AsyncScheduleTypesEndpoint
+
+
+class AsyncScheduleEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "schedule"
+    _route = "schedule"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def holiday_lists(self) -> "AsyncScheduleHolidaylistsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsEndpoint")
+
+    @cached_property
+    def details(self) -> "AsyncScheduleDetailsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleDetailsEndpoint")
+
+    @cached_property
+    def types(self) -> "AsyncScheduleTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleTypesEndpoint")
+
+    @cached_property
+    def holidaylists(self) -> "AsyncScheduleHolidaylistsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsEndpoint")
+
+    @cached_property
+    def reminder_times(self) -> "AsyncScheduleRemindertimesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleRemindertimesEndpoint")
+
+    @cached_property
+    def portalcalendars(self) -> "AsyncSchedulePortalcalendarsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSchedulePortalcalendarsEndpoint")
+
+    @cached_property
+    def entries(self) -> "AsyncScheduleEntriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleEntriesEndpoint")
+
+    @cached_property
+    def colors(self) -> "AsyncScheduleColorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleColorsEndpoint")
+
+    @cached_property
+    def calendars(self) -> "AsyncScheduleCalendarsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleCalendarsEndpoint")
+
+    @cached_property
+    def statuses(self) -> "AsyncScheduleStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleStatusesEndpoint")
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsIdEndpoint import \
+        AsyncScheduleHolidaylistsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsInfoEndpoint import \
+        AsyncScheduleHolidaylistsInfoEndpoint
+
+
+class AsyncScheduleHolidaylistsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "holidaylists"
+    _route = "schedule/holidaylists"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncScheduleHolidaylistsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncScheduleHolidaylistsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncScheduleHolidaylistsIdEndpoint: The AsyncScheduleHolidaylistsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncScheduleHolidaylistsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsInfoEndpoint")
@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsIdHolidaysEndpoint import \
+        AsyncScheduleHolidaylistsIdHolidaysEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsIdInfoEndpoint import \
+        AsyncScheduleHolidaylistsIdInfoEndpoint
+
+
+class AsyncScheduleHolidaylistsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "schedule/holidaylists/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def holidays(self) -> "AsyncScheduleHolidaylistsIdHolidaysEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsIdHolidaysEndpoint"
+        )
+
+    @cached_property
+    def info(self) -> "AsyncScheduleHolidaylistsIdInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncScheduleHolidaylistsIdInfoEndpoint"
+        )
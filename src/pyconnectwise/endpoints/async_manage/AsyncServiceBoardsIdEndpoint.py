@@ -0,0 +1,151 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Board
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdAutoassignresourcesEndpoint import \
+        AsyncServiceBoardsIdAutoassignresourcesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdAutotemplatesEndpoint import \
+        AsyncServiceBoardsIdAutotemplatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdExcludedmembersEndpoint import \
+        AsyncServiceBoardsIdExcludedmembersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdItemsEndpoint import AsyncServiceBoardsIdItemsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdNotificationsEndpoint import \
+        AsyncServiceBoardsIdNotificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdStatusesEndpoint import \
+        AsyncServiceBoardsIdStatusesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdSubtypesEndpoint import \
+        AsyncServiceBoardsIdSubtypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdTeamsEndpoint import AsyncServiceBoardsIdTeamsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdTypesEndpoint import AsyncServiceBoardsIdTypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdTypesubtypeitemassociationsEndpoint import \
+        AsyncServiceBoardsIdTypesubtypeitemassociationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdUsagesEndpoint import \
+        AsyncServiceBoardsIdUsagesEndpoint
+
+
+class AsyncServiceBoardsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "service/boards/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Board]:
+        """
+        Performs a GET request against the /service/boards/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Board]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Board, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Board:
+        """
+        Performs a GET request against the /service/boards/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Board: The parsed response data.
+        """
+        return self._parse_one(Board, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /service/boards/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Board:
+        """
+        Performs a PUT request against the /service/boards/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Board: The parsed response data.
+        """
+        return self._parse_one(Board, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Board:
+        """
+        Performs a PATCH request against the /service/boards/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Board: The parsed response data.
+        """
+        return self._parse_one(Board, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def auto_assign_resources(self) -> "AsyncServiceBoardsIdAutoassignresourcesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdAutoassignresourcesEndpoint"
+        )
+
+    @cached_property
+    def excluded_members(self) -> "AsyncServiceBoardsIdExcludedmembersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdExcludedmembersEndpoint"
+        )
+
+    @cached_property
+    def notifications(self) -> "AsyncServiceBoardsIdNotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdNotificationsEndpoint"
+        )
+
+    @cached_property
+    def types(self) -> "AsyncServiceBoardsIdTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdTypesEndpoint")
+
+    @cached_property
+    def type_sub_type_item_associations(self) -> "AsyncServiceBoardsIdTypesubtypeitemassociationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdTypesubtypeitemassociationsEndpoint"
+        )
+
+    @cached_property
+    def teams(self) -> "AsyncServiceBoardsIdTeamsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdTeamsEndpoint")
+
+    @cached_property
+    def auto_templates(self) -> "AsyncServiceBoardsIdAutotemplatesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdAutotemplatesEndpoint"
+        )
+
+    @cached_property
+    def usages(self) -> "AsyncServiceBoardsIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdUsagesEndpoint")
+
+    @cached_property
+    def subtypes(self) -> "AsyncServiceBoardsIdSubtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdSubtypesEndpoint")
+
+    @cached_property
+    def statuses(self) -> "AsyncServiceBoardsIdStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdStatusesEndpoint")
+
+    @cached_property
+    def items(self) -> "AsyncServiceBoardsIdItemsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdItemsEndpoint")
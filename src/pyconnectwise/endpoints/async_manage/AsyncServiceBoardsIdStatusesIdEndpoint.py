@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import BoardStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdStatusesIdInfoEndpoint import \
+        AsyncServiceBoardsIdStatusesIdInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdStatusesIdNotificationsEndpoint import \
+        AsyncServiceBoardsIdStatusesIdNotificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdStatusesIdUsagesEndpoint import \
+        AsyncServiceBoardsIdStatusesIdUsagesEndpoint
+
+
+class AsyncServiceBoardsIdStatusesIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "service/boards/{id}/statuses/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[BoardStatus]:
+        """
+        Performs a GET request against the /service/boards/{id}/statuses/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[BoardStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(BoardStatus, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BoardStatus:
+        """
+        Performs a GET request against the /service/boards/{id}/statuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardStatus: The parsed response data.
+        """
+        return self._parse_one(BoardStatus, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /service/boards/{id}/statuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BoardStatus:
+        """
+        Performs a PUT request against the /service/boards/{id}/statuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardStatus: The parsed response data.
+        """
+        return self._parse_one(BoardStatus, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BoardStatus:
+        """
+        Performs a PATCH request against the /service/boards/{id}/statuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardStatus: The parsed response data.
+        """
+        return self._parse_one(BoardStatus, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def usages(self) -> "AsyncServiceBoardsIdStatusesIdUsagesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdStatusesIdUsagesEndpoint"
+        )
+
+    @cached_property
+    def notifications(self) -> "AsyncServiceBoardsIdStatusesIdNotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdStatusesIdNotificationsEndpoint"
+        )
+
+    @cached_property
+    def info(self) -> "AsyncServiceBoardsIdStatusesIdInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceBoardsIdStatusesIdInfoEndpoint"
+        )
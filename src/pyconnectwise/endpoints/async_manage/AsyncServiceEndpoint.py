@@ -0,0 +1,153 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncServiceBoardsEndpoint import AsyncServiceBoardsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceCodesEndpoint import AsyncServiceCodesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceEmailtemplatesEndpoint import \
+        AsyncServiceEmailtemplatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceImpactsEndpoint import AsyncServiceImpactsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceInfoEndpoint import AsyncServiceInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceKnowledgebasearticlesEndpoint import \
+        AsyncServiceKnowledgebasearticlesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceKnowledgebasecategoriesEndpoint import \
+        AsyncServiceKnowledgebasecategoriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceKnowledgebasesettingsEndpoint import \
+        AsyncServiceKnowledgebasesettingsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceKnowledgebasesubcategoriesEndpoint import \
+        AsyncServiceKnowledgebasesubcategoriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceLocationsEndpoint import AsyncServiceLocationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServicePrioritiesEndpoint import AsyncServicePrioritiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServicePriorityEndpoint import AsyncServicePriorityEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceSchedulingEndpoint import AsyncServiceSchedulingEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceServicesignoffEndpoint import \
+        AsyncServiceServicesignoffEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceSeveritiesEndpoint import AsyncServiceSeveritiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceSlasEndpoint import AsyncServiceSlasEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceSourcesEndpoint import AsyncServiceSourcesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceSurveysEndpoint import AsyncServiceSurveysEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTeammembersEndpoint import AsyncServiceTeammembersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTeamsEndpoint import AsyncServiceTeamsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTemplatesEndpoint import AsyncServiceTemplatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketlinksEndpoint import AsyncServiceTicketlinksEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsEndpoint import AsyncServiceTicketsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsyncsEndpoint import AsyncServiceTicketsyncsEndpoint
+
+
+class AsyncServiceEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "service"
+    _route = "service"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def email_templates(self) -> "AsyncServiceEmailtemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceEmailtemplatesEndpoint")
+
+    @cached_property
+    def impacts(self) -> "AsyncServiceImpactsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceImpactsEndpoint")
+
+    @cached_property
+    def s_l_as(self) -> "AsyncServiceSlasEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceSlasEndpoint")
+
+    @cached_property
+    def team_members(self) -> "AsyncServiceTeammembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTeammembersEndpoint")
+
+    @cached_property
+    def slas(self) -> "AsyncServiceSlasEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceSlasEndpoint")
+
+    @cached_property
+    def tickets(self) -> "AsyncServiceTicketsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsEndpoint")
+
+    @cached_property
+    def knowledgebasesettings(self) -> "AsyncServiceKnowledgebasesettingsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceKnowledgebasesettingsEndpoint"
+        )
+
+    @cached_property
+    def knowledge_base_categories(self) -> "AsyncServiceKnowledgebasecategoriesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceKnowledgebasecategoriesEndpoint"
+        )
+
+    @cached_property
+    def ticket_links(self) -> "AsyncServiceTicketlinksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketlinksEndpoint")
+
+    @cached_property
+    def ticket_syncs(self) -> "AsyncServiceTicketsyncsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsyncsEndpoint")
+
+    @cached_property
+    def scheduling(self) -> "AsyncServiceSchedulingEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceSchedulingEndpoint")
+
+    @cached_property
+    def sources(self) -> "AsyncServiceSourcesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceSourcesEndpoint")
+
+    @cached_property
+    def codes(self) -> "AsyncServiceCodesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceCodesEndpoint")
+
+    @cached_property
+    def surveys(self) -> "AsyncServiceSurveysEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceSurveysEndpoint")
+
+    @cached_property
+    def priorities(self) -> "AsyncServicePrioritiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServicePrioritiesEndpoint")
+
+    @cached_property
+    def service_signoff(self) -> "AsyncServiceServicesignoffEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceServicesignoffEndpoint")
+
+    @cached_property
+    def locations(self) -> "AsyncServiceLocationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceLocationsEndpoint")
+
+    @cached_property
+    def boards(self) -> "AsyncServiceBoardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceBoardsEndpoint")
+
+    @cached_property
+    def knowledge_base_sub_categories(self) -> "AsyncServiceKnowledgebasesubcategoriesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceKnowledgebasesubcategoriesEndpoint"
+        )
+
+    @cached_property
+    def severities(self) -> "AsyncServiceSeveritiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceSeveritiesEndpoint")
+
+    @cached_property
+    def info(self) -> "AsyncServiceInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceInfoEndpoint")
+
+    @cached_property
+    def teams(self) -> "AsyncServiceTeamsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTeamsEndpoint")
+
+    @cached_property
+    def templates(self) -> "AsyncServiceTemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTemplatesEndpoint")
+
+    @cached_property
+    def knowledge_base_articles(self) -> "AsyncServiceKnowledgebasearticlesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceKnowledgebasearticlesEndpoint"
+        )
+
+    @cached_property
+    def priority(self) -> "AsyncServicePriorityEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServicePriorityEndpoint")
@@ -0,0 +1,26 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncServiceInfoBoardsEndpoint import AsyncServiceInfoBoardsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceInfoBoardtypesEndpoint import \
+        AsyncServiceInfoBoardtypesEndpoint
+
+
+class AsyncServiceInfoEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "service/info"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def boards(self) -> "AsyncServiceInfoBoardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceInfoBoardsEndpoint")
+
+    @cached_property
+    def boardtypes(self) -> "AsyncServiceInfoBoardtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceInfoBoardtypesEndpoint")
@@ -0,0 +1,32 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncServicePriorityIdEndpoint import AsyncServicePriorityIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServicePriorityInfoEndpoint import AsyncServicePriorityInfoEndpoint
+
+
+class AsyncServicePriorityEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "priority"
+    _route = "service/priority"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncServicePriorityIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncServicePriorityIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncServicePriorityIdEndpoint: The AsyncServicePriorityIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncServicePriorityIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncServicePriorityInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServicePriorityInfoEndpoint")
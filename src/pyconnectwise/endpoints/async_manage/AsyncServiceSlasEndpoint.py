@@ -0,0 +1,32 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncServiceSlasIdEndpoint import AsyncServiceSlasIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceSlasInfoEndpoint import AsyncServiceSlasInfoEndpoint
+
+
+class AsyncServiceSlasEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "slas"
+    _route = "service/slas"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncServiceSlasIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncServiceSlasIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncServiceSlasIdEndpoint: The AsyncServiceSlasIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncServiceSlasIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncServiceSlasInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceSlasInfoEndpoint")
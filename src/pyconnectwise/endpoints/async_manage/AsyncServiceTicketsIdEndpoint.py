@@ -0,0 +1,167 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Ticket
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdActivitiesEndpoint import \
+        AsyncServiceTicketsIdActivitiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdAllnotesEndpoint import \
+        AsyncServiceTicketsIdAllnotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdAttachchildrenEndpoint import \
+        AsyncServiceTicketsIdAttachchildrenEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdConfigurationsEndpoint import \
+        AsyncServiceTicketsIdConfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdConvertEndpoint import \
+        AsyncServiceTicketsIdConvertEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdDocumentsEndpoint import \
+        AsyncServiceTicketsIdDocumentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdInfoEndpoint import AsyncServiceTicketsIdInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdMergeEndpoint import \
+        AsyncServiceTicketsIdMergeEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdNotesEndpoint import \
+        AsyncServiceTicketsIdNotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdProductsEndpoint import \
+        AsyncServiceTicketsIdProductsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdScheduleentriesEndpoint import \
+        AsyncServiceTicketsIdScheduleentriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdTasksEndpoint import \
+        AsyncServiceTicketsIdTasksEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdTimeentriesEndpoint import \
+        AsyncServiceTicketsIdTimeentriesEndpoint
+
+
+class AsyncServiceTicketsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "service/tickets/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Ticket]:
+        """
+        Performs a GET request against the /service/tickets/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Ticket]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Ticket, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Ticket:
+        """
+        Performs a GET request against the /service/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Ticket: The parsed response data.
+        """
+        return self._parse_one(Ticket, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /service/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Ticket:
+        """
+        Performs a PUT request against the /service/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Ticket: The parsed response data.
+        """
+        return self._parse_one(Ticket, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Ticket:
+        """
+        Performs a PATCH request against the /service/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Ticket: The parsed response data.
+        """
+        return self._parse_one(Ticket, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def scheduleentries(self) -> "AsyncServiceTicketsIdScheduleentriesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdScheduleentriesEndpoint"
+        )
+
+    @cached_property
+    def info(self) -> "AsyncServiceTicketsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdInfoEndpoint")
+
+    @cached_property
+    def tasks(self) -> "AsyncServiceTicketsIdTasksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdTasksEndpoint")
+
+    @cached_property
+    def all_notes(self) -> "AsyncServiceTicketsIdAllnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdAllnotesEndpoint")
+
+    @cached_property
+    def products(self) -> "AsyncServiceTicketsIdProductsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdProductsEndpoint")
+
+    @cached_property
+    def timeentries(self) -> "AsyncServiceTicketsIdTimeentriesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdTimeentriesEndpoint"
+        )
+
+    @cached_property
+    def convert(self) -> "AsyncServiceTicketsIdConvertEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdConvertEndpoint")
+
+    @cached_property
+    def merge(self) -> "AsyncServiceTicketsIdMergeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdMergeEndpoint")
+
+    @cached_property
+    def notes(self) -> "AsyncServiceTicketsIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdNotesEndpoint")
+
+    @cached_property
+    def activities(self) -> "AsyncServiceTicketsIdActivitiesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdActivitiesEndpoint"
+        )
+
+    @cached_property
+    def attach_children(self) -> "AsyncServiceTicketsIdAttachchildrenEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdAttachchildrenEndpoint"
+        )
+
+    @cached_property
+    def documents(self) -> "AsyncServiceTicketsIdDocumentsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdDocumentsEndpoint"
+        )
+
+    @cached_property
+    def configurations(self) -> "AsyncServiceTicketsIdConfigurationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncServiceTicketsIdConfigurationsEndpoint"
+        )
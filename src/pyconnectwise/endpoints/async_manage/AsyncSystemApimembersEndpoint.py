@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import ApiMember
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemApimembersCountEndpoint import \
+        AsyncSystemApimembersCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemApimembersDefaultEndpoint import \
+        AsyncSystemApimembersDefaultEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemApimembersIdEndpoint import AsyncSystemApimembersIdEndpoint
+
+
+class AsyncSystemApimembersEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "apiMembers"
+    _route = "system/apiMembers"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemApimembersIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemApimembersIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemApimembersIdEndpoint: The AsyncSystemApimembersIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemApimembersIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[ApiMember]:
+        """
+        Performs a GET request against the /system/apiMembers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[ApiMember]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(ApiMember, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ApiMember]:
+        """
+        Performs a GET request against the /system/apiMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ApiMember]: The parsed response data.
+        """
+        return self._parse_many(ApiMember, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ApiMember:
+        """
+        Performs a POST request against the /system/apiMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ApiMember: The parsed response data.
+        """
+        return self._parse_one(ApiMember, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def default(self) -> "AsyncSystemApimembersDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemApimembersDefaultEndpoint")
+
+    @cached_property
+    def count(self) -> "AsyncSystemApimembersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemApimembersCountEndpoint")
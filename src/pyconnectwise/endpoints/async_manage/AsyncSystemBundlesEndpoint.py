@@ -0,0 +1,35 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import BundleResultsCollection
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemBundlesCountEndpoint import AsyncSystemBundlesCountEndpoint
+
+
+class AsyncSystemBundlesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "bundles"
+    _route = "system/bundles"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BundleResultsCollection:
+        """
+        Performs a POST request against the /system/bundles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BundleResultsCollection: The parsed response data.
+        """
+        return self._parse_one(
+            BundleResultsCollection, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> "AsyncSystemBundlesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemBundlesCountEndpoint")
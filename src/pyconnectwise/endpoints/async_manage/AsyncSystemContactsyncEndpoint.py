@@ -0,0 +1,23 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringEndpoint import \
+        AsyncSystemContactsyncMonitoringEndpoint
+
+
+class AsyncSystemContactsyncEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "contactsync"
+    _route = "system/contactsync"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def monitoring(self) -> "AsyncSystemContactsyncMonitoringEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringEndpoint"
+        )
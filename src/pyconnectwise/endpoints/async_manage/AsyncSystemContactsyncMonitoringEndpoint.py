@@ -0,0 +1,85 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import M365ContactSyncMonitoring
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringCountEndpoint import \
+        AsyncSystemContactsyncMonitoringCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringIdEndpoint import \
+        AsyncSystemContactsyncMonitoringIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringNotificationtypeEndpoint import \
+        AsyncSystemContactsyncMonitoringNotificationtypeEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringTypeEndpoint import \
+        AsyncSystemContactsyncMonitoringTypeEndpoint
+
+
+class AsyncSystemContactsyncMonitoringEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "monitoring"
+    _route = "system/contactsync/monitoring"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemContactsyncMonitoringIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemContactsyncMonitoringIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemContactsyncMonitoringIdEndpoint: The AsyncSystemContactsyncMonitoringIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[M365ContactSyncMonitoring]:
+        """
+        Performs a GET request against the /system/contactsync/monitoring endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[M365ContactSyncMonitoring]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(M365ContactSyncMonitoring, page, page_size, params, forward_only)
+
+    async def get(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> list[M365ContactSyncMonitoring]:
+        """
+        Performs a GET request against the /system/contactsync/monitoring endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[M365ContactSyncMonitoring]: The parsed response data.
+        """
+        return self._parse_many(
+            M365ContactSyncMonitoring, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def type(self) -> "AsyncSystemContactsyncMonitoringTypeEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringTypeEndpoint"
+        )
+
+    @cached_property
+    def notificationtype(self) -> "AsyncSystemContactsyncMonitoringNotificationtypeEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringNotificationtypeEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "AsyncSystemContactsyncMonitoringCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncMonitoringCountEndpoint"
+        )
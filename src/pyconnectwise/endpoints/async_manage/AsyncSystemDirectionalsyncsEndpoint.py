@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemDirectionalsyncsIdEndpoint import \
+        AsyncSystemDirectionalsyncsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemDirectionalsyncsInfoEndpoint import \
+        AsyncSystemDirectionalsyncsInfoEndpoint
+
+
+class AsyncSystemDirectionalsyncsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "directionalSyncs"
+    _route = "system/directionalSyncs"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemDirectionalsyncsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemDirectionalsyncsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemDirectionalsyncsIdEndpoint: The AsyncSystemDirectionalsyncsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemDirectionalsyncsIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncSystemDirectionalsyncsInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemDirectionalsyncsInfoEndpoint"
+        )
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemDocumenttypesIdEndpoint import \
+        AsyncSystemDocumenttypesIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemDocumenttypesInfoEndpoint import \
+        AsyncSystemDocumenttypesInfoEndpoint
+
+
+class AsyncSystemDocumenttypesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "documentTypes"
+    _route = "system/documentTypes"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemDocumenttypesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemDocumenttypesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemDocumenttypesIdEndpoint: The AsyncSystemDocumenttypesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemDocumenttypesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncSystemDocumenttypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemDocumenttypesInfoEndpoint")
@@ -0,0 +1,85 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import EmailConnector
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEmailconnectorsCountEndpoint import \
+        AsyncSystemEmailconnectorsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEmailconnectorsIdEndpoint import \
+        AsyncSystemEmailconnectorsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEmailconnectorsInfoEndpoint import \
+        AsyncSystemEmailconnectorsInfoEndpoint
+
+
+class AsyncSystemEmailconnectorsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "emailConnectors"
+    _route = "system/emailConnectors"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemEmailconnectorsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemEmailconnectorsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemEmailconnectorsIdEndpoint: The AsyncSystemEmailconnectorsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemEmailconnectorsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[EmailConnector]:
+        """
+        Performs a GET request against the /system/emailConnectors endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[EmailConnector]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(EmailConnector, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[EmailConnector]:
+        """
+        Performs a GET request against the /system/emailConnectors endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[EmailConnector]: The parsed response data.
+        """
+        return self._parse_many(EmailConnector, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EmailConnector:
+        """
+        Performs a POST request against the /system/emailConnectors endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EmailConnector: The parsed response data.
+        """
+        return self._parse_one(EmailConnector, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def info(self) -> "AsyncSystemEmailconnectorsInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemEmailconnectorsInfoEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "AsyncSystemEmailconnectorsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemEmailconnectorsCountEndpoint"
+        )
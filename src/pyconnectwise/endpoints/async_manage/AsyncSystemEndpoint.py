@@ -0,0 +1,424 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemAllowedfiletypesEndpoint import \
+        AsyncSystemAllowedfiletypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemAllowedoriginsEndpoint import AsyncSystemAllowedoriginsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemApimembersEndpoint import AsyncSystemApimembersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemAudittrailEndpoint import AsyncSystemAudittrailEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemAuthanvilsEndpoint import AsyncSystemAuthanvilsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemAutosynctimeEndpoint import AsyncSystemAutosynctimeEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemBundlesEndpoint import AsyncSystemBundlesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemCallbacksEndpoint import AsyncSystemCallbacksEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemCertificationsEndpoint import AsyncSystemCertificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemConnectwisehostedscreensEndpoint import \
+        AsyncSystemConnectwisehostedscreensEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemConnectwisehostedsetupsEndpoint import \
+        AsyncSystemConnectwisehostedsetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncEndpoint import AsyncSystemContactsyncEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemCustomreportsEndpoint import AsyncSystemCustomreportsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemCwtimezonesEndpoint import AsyncSystemCwtimezonesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemDepartmentsEndpoint import AsyncSystemDepartmentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemDirectionalsyncsEndpoint import \
+        AsyncSystemDirectionalsyncsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemDocumentsEndpoint import AsyncSystemDocumentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemDocumenttypesEndpoint import AsyncSystemDocumenttypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEmailconnectorsEndpoint import \
+        AsyncSystemEmailconnectorsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEmailexclusionsEndpoint import \
+        AsyncSystemEmailexclusionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEmailtokensEndpoint import AsyncSystemEmailtokensEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEpayconfigurationsEndpoint import \
+        AsyncSystemEpayconfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemExperimentsEndpoint import AsyncSystemExperimentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemFileuploadsettingsEndpoint import \
+        AsyncSystemFileuploadsettingsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemGoogleemailsetupEndpoint import \
+        AsyncSystemGoogleemailsetupEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemImapsEndpoint import AsyncSystemImapsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemImportmassmaintenanceEndpoint import \
+        AsyncSystemImportmassmaintenanceEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoEndpoint import AsyncSystemInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInoutboardsEndpoint import AsyncSystemInoutboardsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInouttypesEndpoint import AsyncSystemInouttypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemIntegratorloginsEndpoint import \
+        AsyncSystemIntegratorloginsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemIntegratortagsEndpoint import AsyncSystemIntegratortagsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemKpicategoriesEndpoint import AsyncSystemKpicategoriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemKpisEndpoint import AsyncSystemKpisEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsEndpoint import \
+        AsyncSystemLdapconfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemLinksEndpoint import AsyncSystemLinksEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemLocationsEndpoint import AsyncSystemLocationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncEndpoint import \
+        AsyncSystemM365contactsyncEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemManagementnetworksecuritiesEndpoint import \
+        AsyncSystemManagementnetworksecuritiesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMarketplaceimportEndpoint import \
+        AsyncSystemMarketplaceimportEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersEndpoint import AsyncSystemMembersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembertemplatesEndpoint import \
+        AsyncSystemMembertemplatesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMenuentriesEndpoint import AsyncSystemMenuentriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMyaccountEndpoint import AsyncSystemMyaccountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyEndpoint import AsyncSystemMycompanyEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMymembersEndpoint import AsyncSystemMymembersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMysecurityEndpoint import AsyncSystemMysecurityEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemNotificationrecipientsEndpoint import \
+        AsyncSystemNotificationrecipientsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemOffice365Endpoint import AsyncSystemOffice365Endpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemOnpremisesearchsettingEndpoint import \
+        AsyncSystemOnpremisesearchsettingEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemOsgradeweightsEndpoint import AsyncSystemOsgradeweightsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemParsingtypesEndpoint import AsyncSystemParsingtypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemParsingvariablesEndpoint import \
+        AsyncSystemParsingvariablesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemPortalreportsEndpoint import AsyncSystemPortalreportsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemQuotelinksetupEndpoint import AsyncSystemQuotelinksetupEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemReportcardsEndpoint import AsyncSystemReportcardsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemReportsEndpoint import AsyncSystemReportsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSecurityrolesEndpoint import AsyncSystemSecurityrolesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSettingsEndpoint import AsyncSystemSettingsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSetupscreensEndpoint import AsyncSystemSetupscreensEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSkillcategoriesEndpoint import \
+        AsyncSystemSkillcategoriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSkillsEndpoint import AsyncSystemSkillsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSsoconfigurationsEndpoint import \
+        AsyncSystemSsoconfigurationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSsousersEndpoint import AsyncSystemSsousersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemStandardnotesEndpoint import AsyncSystemStandardnotesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSurveysEndpoint import AsyncSystemSurveysEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemTimezonesetupsEndpoint import AsyncSystemTimezonesetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemTodaypagecategoriesEndpoint import \
+        AsyncSystemTodaypagecategoriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemUserdefinedfieldsEndpoint import \
+        AsyncSystemUserdefinedfieldsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowactionsEndpoint import \
+        AsyncSystemWorkflowactionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsEndpoint import AsyncSystemWorkflowsEndpoint
+
+
+class AsyncSystemEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "system"
+    _route = "system"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def membertemplates(self) -> "AsyncSystemMembertemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembertemplatesEndpoint")
+
+    @cached_property
+    def directional_syncs(self) -> "AsyncSystemDirectionalsyncsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemDirectionalsyncsEndpoint")
+
+    @cached_property
+    def notification_recipients(self) -> "AsyncSystemNotificationrecipientsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemNotificationrecipientsEndpoint"
+        )
+
+    @cached_property
+    def imaps(self) -> "AsyncSystemImapsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemImapsEndpoint")
+
+    @cached_property
+    def ldap_configurations(self) -> "AsyncSystemLdapconfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsEndpoint")
+
+    @cached_property
+    def menuentries(self) -> "AsyncSystemMenuentriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMenuentriesEndpoint")
+
+    @cached_property
+    def fileuploadsettings(self) -> "AsyncSystemFileuploadsettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemFileuploadsettingsEndpoint")
+
+    @cached_property
+    def securityroles(self) -> "AsyncSystemSecurityrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSecurityrolesEndpoint")
+
+    @cached_property
+    def office365(self) -> "AsyncSystemOffice365Endpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemOffice365Endpoint")
+
+    @cached_property
+    def quote_link_setup(self) -> "AsyncSystemQuotelinksetupEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemQuotelinksetupEndpoint")
+
+    @cached_property
+    def setup_screens(self) -> "AsyncSystemSetupscreensEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSetupscreensEndpoint")
+
+    @cached_property
+    def connectwisehostedsetups(self) -> "AsyncSystemConnectwisehostedsetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemConnectwisehostedsetupsEndpoint"
+        )
+
+    @cached_property
+    def workflows(self) -> "AsyncSystemWorkflowsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsEndpoint")
+
+    @cached_property
+    def skills(self) -> "AsyncSystemSkillsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSkillsEndpoint")
+
+    @cached_property
+    def my_members(self) -> "AsyncSystemMymembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMymembersEndpoint")
+
+    @cached_property
+    def marketplaceimport(self) -> "AsyncSystemMarketplaceimportEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMarketplaceimportEndpoint")
+
+    @cached_property
+    def in_out_boards(self) -> "AsyncSystemInoutboardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInoutboardsEndpoint")
+
+    @cached_property
+    def email_connectors(self) -> "AsyncSystemEmailconnectorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemEmailconnectorsEndpoint")
+
+    @cached_property
+    def auth_anvils(self) -> "AsyncSystemAuthanvilsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemAuthanvilsEndpoint")
+
+    @cached_property
+    def osgradeweights(self) -> "AsyncSystemOsgradeweightsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemOsgradeweightsEndpoint")
+
+    @cached_property
+    def contactsync(self) -> "AsyncSystemContactsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemContactsyncEndpoint")
+
+    @cached_property
+    def experiments(self) -> "AsyncSystemExperimentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemExperimentsEndpoint")
+
+    @cached_property
+    def sso_users(self) -> "AsyncSystemSsousersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSsousersEndpoint")
+
+    @cached_property
+    def bundles(self) -> "AsyncSystemBundlesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemBundlesEndpoint")
+
+    @cached_property
+    def report_cards(self) -> "AsyncSystemReportcardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemReportcardsEndpoint")
+
+    @cached_property
+    def callbacks(self) -> "AsyncSystemCallbacksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemCallbacksEndpoint")
+
+    @cached_property
+    def allowedfiletypes(self) -> "AsyncSystemAllowedfiletypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemAllowedfiletypesEndpoint")
+
+    @cached_property
+    def integratorlogins(self) -> "AsyncSystemIntegratorloginsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemIntegratorloginsEndpoint")
+
+    @cached_property
+    def import_mass_maintenance(self) -> "AsyncSystemImportmassmaintenanceEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemImportmassmaintenanceEndpoint"
+        )
+
+    @cached_property
+    def audittrail(self) -> "AsyncSystemAudittrailEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemAudittrailEndpoint")
+
+    @cached_property
+    def departments(self) -> "AsyncSystemDepartmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemDepartmentsEndpoint")
+
+    @cached_property
+    def members(self) -> "AsyncSystemMembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersEndpoint")
+
+    @cached_property
+    def sso_configurations(self) -> "AsyncSystemSsoconfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSsoconfigurationsEndpoint")
+
+    @cached_property
+    def time_zone_setups(self) -> "AsyncSystemTimezonesetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemTimezonesetupsEndpoint")
+
+    @cached_property
+    def workflow_actions(self) -> "AsyncSystemWorkflowactionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowactionsEndpoint")
+
+    @cached_property
+    def portal_reports(self) -> "AsyncSystemPortalreportsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemPortalreportsEndpoint")
+
+    @cached_property
+    def menu_entries(self) -> "AsyncSystemMenuentriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMenuentriesEndpoint")
+
+    @cached_property
+    def parsing_types(self) -> "AsyncSystemParsingtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemParsingtypesEndpoint")
+
+    @cached_property
+    def standard_notes(self) -> "AsyncSystemStandardnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemStandardnotesEndpoint")
+
+    @cached_property
+    def custom_reports(self) -> "AsyncSystemCustomreportsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemCustomreportsEndpoint")
+
+    @cached_property
+    def document_types(self) -> "AsyncSystemDocumenttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemDocumenttypesEndpoint")
+
+    @cached_property
+    def connect_wise_hosted_screens(self) -> "AsyncSystemConnectwisehostedscreensEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemConnectwisehostedscreensEndpoint"
+        )
+
+    @cached_property
+    def email_tokens(self) -> "AsyncSystemEmailtokensEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemEmailtokensEndpoint")
+
+    @cached_property
+    def documents(self) -> "AsyncSystemDocumentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemDocumentsEndpoint")
+
+    @cached_property
+    def my_company(self) -> "AsyncSystemMycompanyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyEndpoint")
+
+    @cached_property
+    def security_roles(self) -> "AsyncSystemSecurityrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSecurityrolesEndpoint")
+
+    @cached_property
+    def my_security(self) -> "AsyncSystemMysecurityEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMysecurityEndpoint")
+
+    @cached_property
+    def settings(self) -> "AsyncSystemSettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSettingsEndpoint")
+
+    @cached_property
+    def googleemailsetup(self) -> "AsyncSystemGoogleemailsetupEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemGoogleemailsetupEndpoint")
+
+    @cached_property
+    def surveys(self) -> "AsyncSystemSurveysEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSurveysEndpoint")
+
+    @cached_property
+    def certifications(self) -> "AsyncSystemCertificationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemCertificationsEndpoint")
+
+    @cached_property
+    def mycompany(self) -> "AsyncSystemMycompanyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyEndpoint")
+
+    @cached_property
+    def today_page_categories(self) -> "AsyncSystemTodaypagecategoriesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemTodaypagecategoriesEndpoint"
+        )
+
+    @cached_property
+    def locations(self) -> "AsyncSystemLocationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemLocationsEndpoint")
+
+    @cached_property
+    def api_members(self) -> "AsyncSystemApimembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemApimembersEndpoint")
+
+    @cached_property
+    def in_out_types(self) -> "AsyncSystemInouttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInouttypesEndpoint")
+
+    @cached_property
+    def on_premise_search_setting(self) -> "AsyncSystemOnpremisesearchsettingEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemOnpremisesearchsettingEndpoint"
+        )
+
+    @cached_property
+    def skill_categories(self) -> "AsyncSystemSkillcategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemSkillcategoriesEndpoint")
+
+    @cached_property
+    def email_exclusions(self) -> "AsyncSystemEmailexclusionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemEmailexclusionsEndpoint")
+
+    @cached_property
+    def links(self) -> "AsyncSystemLinksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemLinksEndpoint")
+
+    @cached_property
+    def auto_sync_time(self) -> "AsyncSystemAutosynctimeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemAutosynctimeEndpoint")
+
+    @cached_property
+    def info(self) -> "AsyncSystemInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInfoEndpoint")
+
+    @cached_property
+    def allowed_file_types(self) -> "AsyncSystemAllowedfiletypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemAllowedfiletypesEndpoint")
+
+    @cached_property
+    def kpis(self) -> "AsyncSystemKpisEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemKpisEndpoint")
+
+    @cached_property
+    def management_network_securities(self) -> "AsyncSystemManagementnetworksecuritiesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemManagementnetworksecuritiesEndpoint"
+        )
+
+    @cached_property
+    def cw_time_zones(self) -> "AsyncSystemCwtimezonesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemCwtimezonesEndpoint")
+
+    @cached_property
+    def user_defined_fields(self) -> "AsyncSystemUserdefinedfieldsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemUserdefinedfieldsEndpoint")
+
+    @cached_property
+    def kpi_categories(self) -> "AsyncSystemKpicategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemKpicategoriesEndpoint")
+
+    @cached_property
+    def parsing_variables(self) -> "AsyncSystemParsingvariablesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemParsingvariablesEndpoint")
+
+    @cached_property
+    def integrator_tags(self) -> "AsyncSystemIntegratortagsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemIntegratortagsEndpoint")
+
+    @cached_property
+    def reports(self) -> "AsyncSystemReportsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemReportsEndpoint")
+
+    @cached_property
+    def allowedorigins(self) -> "AsyncSystemAllowedoriginsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemAllowedoriginsEndpoint")
+
+    @cached_property
+    def e_pay_configurations(self) -> "AsyncSystemEpayconfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemEpayconfigurationsEndpoint")
+
+    @cached_property
+    def m365contactsync(self) -> "AsyncSystemM365contactsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncEndpoint")
+
+    @cached_property
+    def my_account(self) -> "AsyncSystemMyaccountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMyaccountEndpoint")
@@ -0,0 +1,81 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import EPayConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEpayconfigurationsCountEndpoint import \
+        AsyncSystemEpayconfigurationsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemEpayconfigurationsIdEndpoint import \
+        AsyncSystemEpayconfigurationsIdEndpoint
+
+
+class AsyncSystemEpayconfigurationsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "ePayConfigurations"
+    _route = "system/ePayConfigurations"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemEpayconfigurationsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemEpayconfigurationsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemEpayconfigurationsIdEndpoint: The AsyncSystemEpayconfigurationsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemEpayconfigurationsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[EPayConfiguration]:
+        """
+        Performs a GET request against the /system/ePayConfigurations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[EPayConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(EPayConfiguration, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[EPayConfiguration]:
+        """
+        Performs a GET request against the /system/ePayConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[EPayConfiguration]: The parsed response data.
+        """
+        return self._parse_many(
+            EPayConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EPayConfiguration:
+        """
+        Performs a POST request against the /system/ePayConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EPayConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            EPayConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> "AsyncSystemEpayconfigurationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemEpayconfigurationsCountEndpoint"
+        )
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemFileuploadsettingsCountEndpoint import \
+        AsyncSystemFileuploadsettingsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemFileuploadsettingsIdEndpoint import \
+        AsyncSystemFileuploadsettingsIdEndpoint
+
+
+class AsyncSystemFileuploadsettingsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "fileuploadsettings"
+    _route = "system/fileuploadsettings"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemFileuploadsettingsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemFileuploadsettingsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemFileuploadsettingsIdEndpoint: The AsyncSystemFileuploadsettingsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemFileuploadsettingsIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "AsyncSystemFileuploadsettingsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemFileuploadsettingsCountEndpoint"
+        )
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemGoogleemailsetupCountEndpoint import \
+        AsyncSystemGoogleemailsetupCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemGoogleemailsetupIdEndpoint import \
+        AsyncSystemGoogleemailsetupIdEndpoint
+
+
+class AsyncSystemGoogleemailsetupEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "googleemailsetup"
+    _route = "system/googleemailsetup"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemGoogleemailsetupIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemGoogleemailsetupIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemGoogleemailsetupIdEndpoint: The AsyncSystemGoogleemailsetupIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemGoogleemailsetupIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "AsyncSystemGoogleemailsetupCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemGoogleemailsetupCountEndpoint"
+        )
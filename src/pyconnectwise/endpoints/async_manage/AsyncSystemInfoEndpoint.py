@@ -0,0 +1,89 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Info
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoDepartmentlocationsEndpoint import \
+        AsyncSystemInfoDepartmentlocationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoDepartmentsEndpoint import \
+        AsyncSystemInfoDepartmentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoLinksEndpoint import AsyncSystemInfoLinksEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoLocalesEndpoint import AsyncSystemInfoLocalesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoLocationsEndpoint import AsyncSystemInfoLocationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoMembersEndpoint import AsyncSystemInfoMembersEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoPersonasEndpoint import AsyncSystemInfoPersonasEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemInfoStandardnotesEndpoint import \
+        AsyncSystemInfoStandardnotesEndpoint
+
+
+class AsyncSystemInfoEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "system/info"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Info]:
+        """
+        Performs a GET request against the /system/info endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Info]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Info, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Info:
+        """
+        Performs a GET request against the /system/info endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Info: The parsed response data.
+        """
+        return self._parse_one(Info, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def links(self) -> "AsyncSystemInfoLinksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInfoLinksEndpoint")
+
+    @cached_property
+    def personas(self) -> "AsyncSystemInfoPersonasEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInfoPersonasEndpoint")
+
+    @cached_property
+    def departmentlocations(self) -> "AsyncSystemInfoDepartmentlocationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemInfoDepartmentlocationsEndpoint"
+        )
+
+    @cached_property
+    def departments(self) -> "AsyncSystemInfoDepartmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInfoDepartmentsEndpoint")
+
+    @cached_property
+    def locales(self) -> "AsyncSystemInfoLocalesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInfoLocalesEndpoint")
+
+    @cached_property
+    def locations(self) -> "AsyncSystemInfoLocationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInfoLocationsEndpoint")
+
+    @cached_property
+    def members(self) -> "AsyncSystemInfoMembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInfoMembersEndpoint")
+
+    @cached_property
+    def standard_notes(self) -> "AsyncSystemInfoStandardnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemInfoStandardnotesEndpoint")
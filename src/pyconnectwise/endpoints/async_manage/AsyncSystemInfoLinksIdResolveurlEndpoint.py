@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import LinkResolveUrlInfo
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncSystemInfoLinksIdResolveurlEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "resolveurl"
+    _route = "system/info/links/{id}/resolveurl"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LinkResolveUrlInfo:
+        """
+        Performs a POST request against the /system/info/links/{id}/resolveurl endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LinkResolveUrlInfo: The parsed response data.
+        """
+        return self._parse_one(
+            LinkResolveUrlInfo, (await super()._make_request("POST", data=data, params=params)).content
+        )
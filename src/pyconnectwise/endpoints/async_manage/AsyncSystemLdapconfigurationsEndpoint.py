@@ -0,0 +1,97 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import LdapConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsCountEndpoint import \
+        AsyncSystemLdapconfigurationsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsIdEndpoint import \
+        AsyncSystemLdapconfigurationsIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsInfoEndpoint import \
+        AsyncSystemLdapconfigurationsInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsTestlinkEndpoint import \
+        AsyncSystemLdapconfigurationsTestlinkEndpoint
+
+
+class AsyncSystemLdapconfigurationsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "ldapConfigurations"
+    _route = "system/ldapConfigurations"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemLdapconfigurationsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemLdapconfigurationsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemLdapconfigurationsIdEndpoint: The AsyncSystemLdapconfigurationsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[LdapConfiguration]:
+        """
+        Performs a GET request against the /system/ldapConfigurations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[LdapConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(LdapConfiguration, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LdapConfiguration]:
+        """
+        Performs a GET request against the /system/ldapConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LdapConfiguration]: The parsed response data.
+        """
+        return self._parse_many(
+            LdapConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LdapConfiguration:
+        """
+        Performs a POST request against the /system/ldapConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LdapConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            LdapConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def info(self) -> "AsyncSystemLdapconfigurationsInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsInfoEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "AsyncSystemLdapconfigurationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsCountEndpoint"
+        )
+
+    @cached_property
+    def test_link(self) -> "AsyncSystemLdapconfigurationsTestlinkEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemLdapconfigurationsTestlinkEndpoint"
+        )
@@ -0,0 +1,68 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncAuthorizeEndpoint import \
+        AsyncSystemM365contactsyncAuthorizeEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncCheckvalidsyncEndpoint import \
+        AsyncSystemM365contactsyncCheckvalidsyncEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncIdEndpoint import \
+        AsyncSystemM365contactsyncIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncInfoEndpoint import \
+        AsyncSystemM365contactsyncInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncNotifydeactivationEndpoint import \
+        AsyncSystemM365contactsyncNotifydeactivationEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncNotifyerrorEndpoint import \
+        AsyncSystemM365contactsyncNotifyerrorEndpoint
+
+
+class AsyncSystemM365contactsyncEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "m365contactsync"
+    _route = "system/m365contactsync"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemM365contactsyncIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemM365contactsyncIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemM365contactsyncIdEndpoint: The AsyncSystemM365contactsyncIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "AsyncSystemM365contactsyncInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncInfoEndpoint"
+        )
+
+    @cached_property
+    def checkvalidsync(self) -> "AsyncSystemM365contactsyncCheckvalidsyncEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncCheckvalidsyncEndpoint"
+        )
+
+    @cached_property
+    def notifydeactivation(self) -> "AsyncSystemM365contactsyncNotifydeactivationEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncNotifydeactivationEndpoint"
+        )
+
+    @cached_property
+    def notifyerror(self) -> "AsyncSystemM365contactsyncNotifyerrorEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncNotifyerrorEndpoint"
+        )
+
+    @cached_property
+    def authorize(self) -> "AsyncSystemM365contactsyncAuthorizeEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncAuthorizeEndpoint"
+        )
@@ -0,0 +1,39 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncIdInfoEndpoint import \
+        AsyncSystemM365contactsyncIdInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncIdTestEndpoint import \
+        AsyncSystemM365contactsyncIdTestEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncIdViewauthEndpoint import \
+        AsyncSystemM365contactsyncIdViewauthEndpoint
+
+
+class AsyncSystemM365contactsyncIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/m365contactsync/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def viewauth(self) -> "AsyncSystemM365contactsyncIdViewauthEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncIdViewauthEndpoint"
+        )
+
+    @cached_property
+    def info(self) -> "AsyncSystemM365contactsyncIdInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncIdInfoEndpoint"
+        )
+
+    @cached_property
+    def test(self) -> "AsyncSystemM365contactsyncIdTestEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemM365contactsyncIdTestEndpoint"
+        )
@@ -0,0 +1,31 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMarketplaceimportGetdefinitionEndpoint import \
+        AsyncSystemMarketplaceimportGetdefinitionEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMarketplaceimportImportEndpoint import \
+        AsyncSystemMarketplaceimportImportEndpoint
+
+
+class AsyncSystemMarketplaceimportEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "marketplaceimport"
+    _route = "system/marketplaceimport"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def import_(self) -> "AsyncSystemMarketplaceimportImportEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMarketplaceimportImportEndpoint"
+        )
+
+    @cached_property
+    def getdefinition(self) -> "AsyncSystemMarketplaceimportGetdefinitionEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMarketplaceimportGetdefinitionEndpoint"
+        )
@@ -0,0 +1,83 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Member
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersCountEndpoint import AsyncSystemMembersCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdEndpoint import AsyncSystemMembersIdEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersTypesEndpoint import AsyncSystemMembersTypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersWithssoEndpoint import AsyncSystemMembersWithssoEndpoint
+
+
+class AsyncSystemMembersEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "members"
+    _route = "system/members"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemMembersIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemMembersIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemMembersIdEndpoint: The AsyncSystemMembersIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Member]:
+        """
+        Performs a GET request against the /system/members endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Member]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Member, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Member]:
+        """
+        Performs a GET request against the /system/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Member]: The parsed response data.
+        """
+        return self._parse_many(Member, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Member:
+        """
+        Performs a POST request against the /system/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Member: The parsed response data.
+        """
+        return self._parse_one(Member, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def with_sso(self) -> "AsyncSystemMembersWithssoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersWithssoEndpoint")
+
+    @cached_property
+    def types(self) -> "AsyncSystemMembersTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "AsyncSystemMembersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersCountEndpoint")
@@ -0,0 +1,181 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Member
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdAccrualsEndpoint import \
+        AsyncSystemMembersIdAccrualsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdCertificationsEndpoint import \
+        AsyncSystemMembersIdCertificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdDeactivateEndpoint import \
+        AsyncSystemMembersIdDeactivateEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdDelegationsEndpoint import \
+        AsyncSystemMembersIdDelegationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdImageEndpoint import AsyncSystemMembersIdImageEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdLinkssouserEndpoint import \
+        AsyncSystemMembersIdLinkssouserEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdManageddeviceaccountsEndpoint import \
+        AsyncSystemMembersIdManageddeviceaccountsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdMycertificationsEndpoint import \
+        AsyncSystemMembersIdMycertificationsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdNotificationsettingsEndpoint import \
+        AsyncSystemMembersIdNotificationsettingsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdPersonasEndpoint import \
+        AsyncSystemMembersIdPersonasEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdSkillsEndpoint import \
+        AsyncSystemMembersIdSkillsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdSubmitEndpoint import \
+        AsyncSystemMembersIdSubmitEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdTokensEndpoint import \
+        AsyncSystemMembersIdTokensEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdUnlinkssouserEndpoint import \
+        AsyncSystemMembersIdUnlinkssouserEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdUnusedtimesheetsEndpoint import \
+        AsyncSystemMembersIdUnusedtimesheetsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdUsagesEndpoint import \
+        AsyncSystemMembersIdUsagesEndpoint
+
+
+class AsyncSystemMembersIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/members/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Member]:
+        """
+        Performs a GET request against the /system/members/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Member]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Member, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Member:
+        """
+        Performs a GET request against the /system/members/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Member: The parsed response data.
+        """
+        return self._parse_one(Member, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Member:
+        """
+        Performs a PUT request against the /system/members/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Member: The parsed response data.
+        """
+        return self._parse_one(Member, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Member:
+        """
+        Performs a PATCH request against the /system/members/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Member: The parsed response data.
+        """
+        return self._parse_one(Member, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def delegations(self) -> "AsyncSystemMembersIdDelegationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdDelegationsEndpoint"
+        )
+
+    @cached_property
+    def unlink_sso_user(self) -> "AsyncSystemMembersIdUnlinkssouserEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdUnlinkssouserEndpoint"
+        )
+
+    @cached_property
+    def unused_time_sheets(self) -> "AsyncSystemMembersIdUnusedtimesheetsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdUnusedtimesheetsEndpoint"
+        )
+
+    @cached_property
+    def image(self) -> "AsyncSystemMembersIdImageEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdImageEndpoint")
+
+    @cached_property
+    def accruals(self) -> "AsyncSystemMembersIdAccrualsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdAccrualsEndpoint")
+
+    @cached_property
+    def submit(self) -> "AsyncSystemMembersIdSubmitEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdSubmitEndpoint")
+
+    @cached_property
+    def certifications(self) -> "AsyncSystemMembersIdCertificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdCertificationsEndpoint"
+        )
+
+    @cached_property
+    def managed_device_accounts(self) -> "AsyncSystemMembersIdManageddeviceaccountsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdManageddeviceaccountsEndpoint"
+        )
+
+    @cached_property
+    def mycertifications(self) -> "AsyncSystemMembersIdMycertificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdMycertificationsEndpoint"
+        )
+
+    @cached_property
+    def notification_settings(self) -> "AsyncSystemMembersIdNotificationsettingsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdNotificationsettingsEndpoint"
+        )
+
+    @cached_property
+    def tokens(self) -> "AsyncSystemMembersIdTokensEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdTokensEndpoint")
+
+    @cached_property
+    def personas(self) -> "AsyncSystemMembersIdPersonasEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdPersonasEndpoint")
+
+    @cached_property
+    def skills(self) -> "AsyncSystemMembersIdSkillsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdSkillsEndpoint")
+
+    @cached_property
+    def usages(self) -> "AsyncSystemMembersIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdUsagesEndpoint")
+
+    @cached_property
+    def deactivate(self) -> "AsyncSystemMembersIdDeactivateEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdDeactivateEndpoint"
+        )
+
+    @cached_property
+    def link_sso_user(self) -> "AsyncSystemMembersIdLinkssouserEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdLinkssouserEndpoint"
+        )
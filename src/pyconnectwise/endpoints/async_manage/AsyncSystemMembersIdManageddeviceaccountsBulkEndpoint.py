@@ -0,0 +1,38 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import BulkResult
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+
+class AsyncSystemMembersIdManageddeviceaccountsBulkEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "bulk"
+    _route = "system/members/{id}/managedDeviceAccounts/bulk"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BulkResult:
+        """
+        Performs a DELETE request against the /system/members/{id}/managedDeviceAccounts/bulk endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BulkResult: The parsed response data.
+        """
+        return self._parse_one(BulkResult, (await super()._make_request("DELETE", data=data, params=params)).content)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BulkResult:
+        """
+        Performs a PUT request against the /system/members/{id}/managedDeviceAccounts/bulk endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BulkResult: The parsed response data.
+        """
+        return self._parse_one(BulkResult, (await super()._make_request("PUT", data=data, params=params)).content)
@@ -0,0 +1,77 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import MemberPersona
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdPersonasCountEndpoint import \
+        AsyncSystemMembersIdPersonasCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdPersonasIdEndpoint import \
+        AsyncSystemMembersIdPersonasIdEndpoint
+
+
+class AsyncSystemMembersIdPersonasEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "personas"
+    _route = "system/members/{id}/personas"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemMembersIdPersonasIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemMembersIdPersonasIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemMembersIdPersonasIdEndpoint: The AsyncSystemMembersIdPersonasIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdPersonasIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[MemberPersona]:
+        """
+        Performs a GET request against the /system/members/{id}/personas endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[MemberPersona]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(MemberPersona, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MemberPersona]:
+        """
+        Performs a GET request against the /system/members/{id}/personas endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberPersona]: The parsed response data.
+        """
+        return self._parse_many(MemberPersona, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MemberPersona:
+        """
+        Performs a POST request against the /system/members/{id}/personas endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MemberPersona: The parsed response data.
+        """
+        return self._parse_one(MemberPersona, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> "AsyncSystemMembersIdPersonasCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMembersIdPersonasCountEndpoint"
+        )
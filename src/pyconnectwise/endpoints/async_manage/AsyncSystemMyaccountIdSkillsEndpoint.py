@@ -0,0 +1,77 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import MemberSkill
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMyaccountIdSkillsCountEndpoint import \
+        AsyncSystemMyaccountIdSkillsCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMyaccountIdSkillsIdEndpoint import \
+        AsyncSystemMyaccountIdSkillsIdEndpoint
+
+
+class AsyncSystemMyaccountIdSkillsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "skills"
+    _route = "system/myAccount/{id}/skills"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemMyaccountIdSkillsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemMyaccountIdSkillsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemMyaccountIdSkillsIdEndpoint: The AsyncSystemMyaccountIdSkillsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemMyaccountIdSkillsIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[MemberSkill]:
+        """
+        Performs a GET request against the /system/myAccount/{id}/skills endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[MemberSkill]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(MemberSkill, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MemberSkill]:
+        """
+        Performs a GET request against the /system/myAccount/{id}/skills endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberSkill]: The parsed response data.
+        """
+        return self._parse_many(MemberSkill, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MemberSkill:
+        """
+        Performs a POST request against the /system/myAccount/{id}/skills endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MemberSkill: The parsed response data.
+        """
+        return self._parse_one(MemberSkill, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> "AsyncSystemMyaccountIdSkillsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMyaccountIdSkillsCountEndpoint"
+        )
@@ -0,0 +1,40 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyDocumentsEndpoint import \
+        AsyncSystemMycompanyDocumentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyInfoEndpoint import AsyncSystemMycompanyInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyReportingservicesEndpoint import \
+        AsyncSystemMycompanyReportingservicesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyServicesEndpoint import \
+        AsyncSystemMycompanyServicesEndpoint
+
+
+class AsyncSystemMycompanyEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "mycompany"
+    _route = "system/mycompany"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def reporting_services(self) -> "AsyncSystemMycompanyReportingservicesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyReportingservicesEndpoint"
+        )
+
+    @cached_property
+    def info(self) -> "AsyncSystemMycompanyInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyInfoEndpoint")
+
+    @cached_property
+    def documents(self) -> "AsyncSystemMycompanyDocumentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyDocumentsEndpoint")
+
+    @cached_property
+    def services(self) -> "AsyncSystemMycompanyServicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemMycompanyServicesEndpoint")
@@ -0,0 +1,77 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import SkillCategory
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSkillcategoriesCountEndpoint import \
+        AsyncSystemSkillcategoriesCountEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemSkillcategoriesIdEndpoint import \
+        AsyncSystemSkillcategoriesIdEndpoint
+
+
+class AsyncSystemSkillcategoriesEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "skillCategories"
+    _route = "system/skillCategories"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemSkillcategoriesIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemSkillcategoriesIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemSkillcategoriesIdEndpoint: The AsyncSystemSkillcategoriesIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemSkillcategoriesIdEndpoint", id)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[SkillCategory]:
+        """
+        Performs a GET request against the /system/skillCategories endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[SkillCategory]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(SkillCategory, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SkillCategory]:
+        """
+        Performs a GET request against the /system/skillCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SkillCategory]: The parsed response data.
+        """
+        return self._parse_many(SkillCategory, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SkillCategory:
+        """
+        Performs a POST request against the /system/skillCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SkillCategory: The parsed response data.
+        """
+        return self._parse_one(SkillCategory, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> "AsyncSystemSkillcategoriesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemSkillcategoriesCountEndpoint"
+        )
@@ -0,0 +1,114 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import Workflow
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdAttachmentsEndpoint import \
+        AsyncSystemWorkflowsIdAttachmentsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdCopyEndpoint import \
+        AsyncSystemWorkflowsIdCopyEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdEventsEndpoint import \
+        AsyncSystemWorkflowsIdEventsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdNotifytypesEndpoint import \
+        AsyncSystemWorkflowsIdNotifytypesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdTriggersEndpoint import \
+        AsyncSystemWorkflowsIdTriggersEndpoint
+
+
+class AsyncSystemWorkflowsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/workflows/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[Workflow]:
+        """
+        Performs a GET request against the /system/workflows/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[Workflow]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(Workflow, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Workflow:
+        """
+        Performs a GET request against the /system/workflows/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Workflow: The parsed response data.
+        """
+        return self._parse_one(Workflow, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /system/workflows/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Workflow:
+        """
+        Performs a PUT request against the /system/workflows/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Workflow: The parsed response data.
+        """
+        return self._parse_one(Workflow, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Workflow:
+        """
+        Performs a PATCH request against the /system/workflows/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Workflow: The parsed response data.
+        """
+        return self._parse_one(Workflow, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def triggers(self) -> "AsyncSystemWorkflowsIdTriggersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdTriggersEndpoint"
+        )
+
+    @cached_property
+    def notify_types(self) -> "AsyncSystemWorkflowsIdNotifytypesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdNotifytypesEndpoint"
+        )
+
+    @cached_property
+    def copy(self) -> "AsyncSystemWorkflowsIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdCopyEndpoint")
+
+    @cached_property
+    def attachments(self) -> "AsyncSystemWorkflowsIdAttachmentsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdAttachmentsEndpoint"
+        )
+
+    @cached_property
+    def events(self) -> "AsyncSystemWorkflowsIdEventsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdEventsEndpoint")
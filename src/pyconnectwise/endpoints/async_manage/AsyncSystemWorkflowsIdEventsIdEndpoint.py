@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import WorkflowEvent
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdEventsIdActionsEndpoint import \
+        AsyncSystemWorkflowsIdEventsIdActionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdEventsIdCopyEndpoint import \
+        AsyncSystemWorkflowsIdEventsIdCopyEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdEventsIdTestEndpoint import \
+        AsyncSystemWorkflowsIdEventsIdTestEndpoint
+
+
+class AsyncSystemWorkflowsIdEventsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/workflows/{id}/events/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[WorkflowEvent]:
+        """
+        Performs a GET request against the /system/workflows/{id}/events/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[WorkflowEvent]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(WorkflowEvent, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowEvent:
+        """
+        Performs a GET request against the /system/workflows/{id}/events/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowEvent: The parsed response data.
+        """
+        return self._parse_one(WorkflowEvent, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /system/workflows/{id}/events/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowEvent:
+        """
+        Performs a PUT request against the /system/workflows/{id}/events/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowEvent: The parsed response data.
+        """
+        return self._parse_one(WorkflowEvent, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowEvent:
+        """
+        Performs a PATCH request against the /system/workflows/{id}/events/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowEvent: The parsed response data.
+        """
+        return self._parse_one(WorkflowEvent, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def copy(self) -> "AsyncSystemWorkflowsIdEventsIdCopyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdEventsIdCopyEndpoint"
+        )
+
+    @cached_property
+    def actions(self) -> "AsyncSystemWorkflowsIdEventsIdActionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdEventsIdActionsEndpoint"
+        )
+
+    @cached_property
+    def test(self) -> "AsyncSystemWorkflowsIdEventsIdTestEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsIdEventsIdTestEndpoint"
+        )
@@ -0,0 +1,44 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsUserdefinedfieldsActionsEndpoint import \
+        AsyncSystemWorkflowsUserdefinedfieldsActionsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsUserdefinedfieldsEventsEndpoint import \
+        AsyncSystemWorkflowsUserdefinedfieldsEventsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsUserdefinedfieldsIdEndpoint import \
+        AsyncSystemWorkflowsUserdefinedfieldsIdEndpoint
+
+
+class AsyncSystemWorkflowsUserdefinedfieldsEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "userdefinedfields"
+    _route = "system/workflows/userdefinedfields"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "AsyncSystemWorkflowsUserdefinedfieldsIdEndpoint":
+        """
+        Sets the ID for this endpoint and returns a AsyncSystemWorkflowsUserdefinedfieldsIdEndpoint view bound to it to move down the chain.
+
+        Parameters:
+            id (int): The ID to set.
+        Returns:
+            AsyncSystemWorkflowsUserdefinedfieldsIdEndpoint: The AsyncSystemWorkflowsUserdefinedfieldsIdEndpoint view bound to the ID.
+        """
+        return self._bind_id("pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsUserdefinedfieldsIdEndpoint", id)
+
+    @cached_property
+    def actions(self) -> "AsyncSystemWorkflowsUserdefinedfieldsActionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsUserdefinedfieldsActionsEndpoint"
+        )
+
+    @cached_property
+    def events(self) -> "AsyncSystemWorkflowsUserdefinedfieldsEventsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsUserdefinedfieldsEventsEndpoint"
+        )
@@ -0,0 +1,40 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import WorkflowActionUserDefinedField
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint import \
+        AsyncSystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint
+
+
+class AsyncSystemWorkflowsUserdefinedfieldsEventsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/workflows/userdefinedfields/events/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def post(
+        self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
+    ) -> WorkflowActionUserDefinedField:
+        """
+        Performs a POST request against the /system/workflows/userdefinedfields/events/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowActionUserDefinedField: The parsed response data.
+        """
+        return self._parse_one(
+            WorkflowActionUserDefinedField, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def actions(self) -> "AsyncSystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.async_manage.AsyncSystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint"
+        )
@@ -0,0 +1,73 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncTimeAccrualsEndpoint import AsyncTimeAccrualsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeActivitystopwatchesEndpoint import \
+        AsyncTimeActivitystopwatchesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeChargecodesEndpoint import AsyncTimeChargecodesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeEntriesEndpoint import AsyncTimeEntriesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeInfoEndpoint import AsyncTimeInfoEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeSchedulestopwatchesEndpoint import \
+        AsyncTimeSchedulestopwatchesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeSheetsEndpoint import AsyncTimeSheetsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeTicketstopwatchesEndpoint import \
+        AsyncTimeTicketstopwatchesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeTimeperiodsetupsEndpoint import AsyncTimeTimeperiodsetupsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeWorkrolesEndpoint import AsyncTimeWorkrolesEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeWorktypesEndpoint import AsyncTimeWorktypesEndpoint
+
+
+class AsyncTimeEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "time"
+    _route = "time"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def info(self) -> "AsyncTimeInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeInfoEndpoint")
+
+    @cached_property
+    def accruals(self) -> "AsyncTimeAccrualsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeAccrualsEndpoint")
+
+    @cached_property
+    def time_period_setups(self) -> "AsyncTimeTimeperiodsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeTimeperiodsetupsEndpoint")
+
+    @cached_property
+    def activitystopwatches(self) -> "AsyncTimeActivitystopwatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeActivitystopwatchesEndpoint")
+
+    @cached_property
+    def entries(self) -> "AsyncTimeEntriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeEntriesEndpoint")
+
+    @cached_property
+    def work_types(self) -> "AsyncTimeWorktypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeWorktypesEndpoint")
+
+    @cached_property
+    def sheets(self) -> "AsyncTimeSheetsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeSheetsEndpoint")
+
+    @cached_property
+    def schedulestopwatches(self) -> "AsyncTimeSchedulestopwatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeSchedulestopwatchesEndpoint")
+
+    @cached_property
+    def charge_codes(self) -> "AsyncTimeChargecodesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeChargecodesEndpoint")
+
+    @cached_property
+    def work_roles(self) -> "AsyncTimeWorkrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeWorkrolesEndpoint")
+
+    @cached_property
+    def ticketstopwatches(self) -> "AsyncTimeTicketstopwatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeTicketstopwatchesEndpoint")
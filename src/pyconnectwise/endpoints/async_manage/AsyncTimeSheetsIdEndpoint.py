@@ -0,0 +1,79 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.models.manage import TimeSheet
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdApproveEndpoint import AsyncTimeSheetsIdApproveEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdAuditsEndpoint import AsyncTimeSheetsIdAuditsEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdRejectEndpoint import AsyncTimeSheetsIdRejectEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdReverseEndpoint import AsyncTimeSheetsIdReverseEndpoint
+    from pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdSubmitEndpoint import AsyncTimeSheetsIdSubmitEndpoint
+
+
+class AsyncTimeSheetsIdEndpoint(AsyncConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "time/sheets/{id}"
+
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    async def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> AsyncPaginatedResponse[TimeSheet]:
+        """
+        Performs a GET request against the /time/sheets/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
+        Returns:
+            AsyncPaginatedResponse[TimeSheet]: The initialized AsyncPaginatedResponse object.
+        """
+        return await super()._paginated(TimeSheet, page, page_size, params, forward_only)
+
+    async def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TimeSheet:
+        """
+        Performs a GET request against the /time/sheets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TimeSheet: The parsed response data.
+        """
+        return self._parse_one(TimeSheet, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
+        """
+        Performs a DELETE request against the /time/sheets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def reverse(self) -> "AsyncTimeSheetsIdReverseEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdReverseEndpoint")
+
+    @cached_property
+    def submit(self) -> "AsyncTimeSheetsIdSubmitEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdSubmitEndpoint")
+
+    @cached_property
+    def reject(self) -> "AsyncTimeSheetsIdRejectEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdRejectEndpoint")
+
+    @cached_property
+    def audits(self) -> "AsyncTimeSheetsIdAuditsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdAuditsEndpoint")
+
+    @cached_property
+    def approve(self) -> "AsyncTimeSheetsIdApproveEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.async_manage.AsyncTimeSheetsIdApproveEndpoint")
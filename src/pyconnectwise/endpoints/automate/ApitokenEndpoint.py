@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateAuthInformation, AutomateTokenResult
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ApitokenEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Apitoken"
+    _route = "Apitoken"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Apitoken", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateAuthInformation:
         """
@@ -19,7 +23,7 @@ class ApitokenEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateAuthInformation: The parsed response data.
         """
-        return self._parse_one(AutomateAuthInformation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AutomateAuthInformation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateTokenResult:
         """
@@ -31,4 +35,4 @@ class ApitokenEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateTokenResult: The parsed response data.
         """
-        return self._parse_one(AutomateTokenResult, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AutomateTokenResult, super()._make_request("POST", data=data, params=params).content)
@@ -1,50 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ClientsIdEndpoint import ClientsIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechClient
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ClientsIdEndpoint import ClientsIdEndpoint
+
 
 class ClientsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Clients"
+    _route = "Clients"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Clients", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ClientsIdEndpoint:
+    def id(self, id: int) -> "ClientsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ClientsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ClientsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ClientsIdEndpoint: The initialized ClientsIdEndpoint object.
+            ClientsIdEndpoint: The ClientsIdEndpoint view bound to the ID.
         """
-        child = ClientsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ClientsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechClient]:
         """
         Performs a GET request against the /Clients endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechClient]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechClient,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechClient, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechClient]:
         """
@@ -56,7 +53,7 @@ class ClientsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LabTechClient]: The parsed response data.
         """
-        return self._parse_many(LabTechClient, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechClient, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechClient:
         """
@@ -68,4 +65,4 @@ class ClientsEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechClient: The parsed response data.
         """
-        return self._parse_one(LabTechClient, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LabTechClient, super()._make_request("POST", data=data, params=params).content)
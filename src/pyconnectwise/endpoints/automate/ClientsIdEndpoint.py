@@ -1,45 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ClientsIdDocumentsEndpoint import ClientsIdDocumentsEndpoint
-from pyconnectwise.endpoints.automate.ClientsIdLicensesEndpoint import ClientsIdLicensesEndpoint
-from pyconnectwise.endpoints.automate.ClientsIdPermissionsEndpoint import ClientsIdPermissionsEndpoint
-from pyconnectwise.endpoints.automate.ClientsIdProductkeysEndpoint import ClientsIdProductkeysEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechClient
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ClientsIdDocumentsEndpoint import ClientsIdDocumentsEndpoint
+    from pyconnectwise.endpoints.automate.ClientsIdLicensesEndpoint import ClientsIdLicensesEndpoint
+    from pyconnectwise.endpoints.automate.ClientsIdPermissionsEndpoint import ClientsIdPermissionsEndpoint
+    from pyconnectwise.endpoints.automate.ClientsIdProductkeysEndpoint import ClientsIdProductkeysEndpoint
+
 
 class ClientsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "Clients/{id}"
 
-        self.productkeys = self._register_child_endpoint(ClientsIdProductkeysEndpoint(client, parent_endpoint=self))
-        self.licenses = self._register_child_endpoint(ClientsIdLicensesEndpoint(client, parent_endpoint=self))
-        self.permissions = self._register_child_endpoint(ClientsIdPermissionsEndpoint(client, parent_endpoint=self))
-        self.documents = self._register_child_endpoint(ClientsIdDocumentsEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechClient]:
         """
         Performs a GET request against the /Clients/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechClient]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechClient,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechClient, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechClient:
         """
@@ -51,4 +45,20 @@ class ClientsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechClient: The parsed response data.
         """
-        return self._parse_one(LabTechClient, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LabTechClient, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def productkeys(self) -> "ClientsIdProductkeysEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ClientsIdProductkeysEndpoint")
+
+    @cached_property
+    def licenses(self) -> "ClientsIdLicensesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ClientsIdLicensesEndpoint")
+
+    @cached_property
+    def permissions(self) -> "ClientsIdPermissionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ClientsIdPermissionsEndpoint")
+
+    @cached_property
+    def documents(self) -> "ClientsIdDocumentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ClientsIdDocumentsEndpoint")
@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ClientsIdPermissionsIdEndpoint import ClientsIdPermissionsIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ClientsIdPermissionsIdEndpoint import ClientsIdPermissionsIdEndpoint
+
 
 class ClientsIdPermissionsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Permissions"
+    _route = "Clients/{id}/Permissions"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Permissions", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ClientsIdPermissionsIdEndpoint:
+    def id(self, id: int) -> "ClientsIdPermissionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ClientsIdPermissionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ClientsIdPermissionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ClientsIdPermissionsIdEndpoint: The initialized ClientsIdPermissionsIdEndpoint object.
+            ClientsIdPermissionsIdEndpoint: The ClientsIdPermissionsIdEndpoint view bound to the ID.
         """
-        child = ClientsIdPermissionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ClientsIdPermissionsIdEndpoint", id)
@@ -1,63 +1,52 @@
-from typing import Any
-
-from pyconnectwise.endpoints.automate.ComputersChassisEndpoint import ComputersChassisEndpoint
-from pyconnectwise.endpoints.automate.ComputersDrivesEndpoint import ComputersDrivesEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdEndpoint import ComputersIdEndpoint
-from pyconnectwise.endpoints.automate.ComputersMaintenancemodesEndpoint import ComputersMaintenancemodesEndpoint
-from pyconnectwise.endpoints.automate.ComputersMemoryslotsEndpoint import ComputersMemoryslotsEndpoint
-from pyconnectwise.endpoints.automate.ComputersSoftwareEndpoint import ComputersSoftwareEndpoint
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechComputer
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ComputersChassisEndpoint import ComputersChassisEndpoint
+    from pyconnectwise.endpoints.automate.ComputersDrivesEndpoint import ComputersDrivesEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdEndpoint import ComputersIdEndpoint
+    from pyconnectwise.endpoints.automate.ComputersMaintenancemodesEndpoint import ComputersMaintenancemodesEndpoint
+    from pyconnectwise.endpoints.automate.ComputersMemoryslotsEndpoint import ComputersMemoryslotsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersSoftwareEndpoint import ComputersSoftwareEndpoint
+
 
 class ComputersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Computers", parent_endpoint=parent_endpoint)
+    endpoint_base = "Computers"
+    _route = "Computers"
 
-        self.chassis = self._register_child_endpoint(ComputersChassisEndpoint(client, parent_endpoint=self))
-        self.software = self._register_child_endpoint(ComputersSoftwareEndpoint(client, parent_endpoint=self))
-        self.memoryslots = self._register_child_endpoint(ComputersMemoryslotsEndpoint(client, parent_endpoint=self))
-        self.drives = self._register_child_endpoint(ComputersDrivesEndpoint(client, parent_endpoint=self))
-        self.maintenancemodes = self._register_child_endpoint(
-            ComputersMaintenancemodesEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ComputersIdEndpoint:
+    def id(self, id: int) -> "ComputersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ComputersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ComputersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ComputersIdEndpoint: The initialized ComputersIdEndpoint object.
+            ComputersIdEndpoint: The ComputersIdEndpoint view bound to the ID.
         """
-        child = ComputersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ComputersIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechComputer]:
         """
         Performs a GET request against the /Computers endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechComputer]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechComputer,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechComputer, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechComputer]:
         """
@@ -69,4 +58,24 @@ class ComputersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LabTechComputer]: The parsed response data.
         """
-        return self._parse_many(LabTechComputer, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechComputer, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def chassis(self) -> "ComputersChassisEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersChassisEndpoint")
+
+    @cached_property
+    def software(self) -> "ComputersSoftwareEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersSoftwareEndpoint")
+
+    @cached_property
+    def memoryslots(self) -> "ComputersMemoryslotsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersMemoryslotsEndpoint")
+
+    @cached_property
+    def drives(self) -> "ComputersDrivesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersDrivesEndpoint")
+
+    @cached_property
+    def maintenancemodes(self) -> "ComputersMaintenancemodesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersMaintenancemodesEndpoint")
@@ -1,20 +1,31 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsMaintenancewindowEndpoint import \
-    ComputersIdAlertsuspensionsMaintenancewindowEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsTemplatediversionEndpoint import \
-    ComputersIdAlertsuspensionsTemplatediversionEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsMaintenancewindowEndpoint import \
+        ComputersIdAlertsuspensionsMaintenancewindowEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsTemplatediversionEndpoint import \
+        ComputersIdAlertsuspensionsTemplatediversionEndpoint
+
 
 class ComputersIdAlertsuspensionsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Alertsuspensions"
+    _route = "Computers/{id}/Alertsuspensions"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Alertsuspensions", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.maintenancewindow = self._register_child_endpoint(
-            ComputersIdAlertsuspensionsMaintenancewindowEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def maintenancewindow(self) -> "ComputersIdAlertsuspensionsMaintenancewindowEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsMaintenancewindowEndpoint"
         )
-        self.templatediversion = self._register_child_endpoint(
-            ComputersIdAlertsuspensionsTemplatediversionEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def templatediversion(self) -> "ComputersIdAlertsuspensionsTemplatediversionEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsTemplatediversionEndpoint"
         )
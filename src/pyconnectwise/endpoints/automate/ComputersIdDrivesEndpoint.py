@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ComputersIdDrivesIdEndpoint import ComputersIdDrivesIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ComputersIdDrivesIdEndpoint import ComputersIdDrivesIdEndpoint
+
 
 class ComputersIdDrivesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Drives"
+    _route = "Computers/{id}/Drives"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Drives", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ComputersIdDrivesIdEndpoint:
+    def id(self, id: int) -> "ComputersIdDrivesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ComputersIdDrivesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ComputersIdDrivesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ComputersIdDrivesIdEndpoint: The initialized ComputersIdDrivesIdEndpoint object.
+            ComputersIdDrivesIdEndpoint: The ComputersIdDrivesIdEndpoint view bound to the ID.
         """
-        child = ComputersIdDrivesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ComputersIdDrivesIdEndpoint", id)
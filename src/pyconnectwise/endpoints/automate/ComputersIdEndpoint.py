@@ -1,126 +1,68 @@
-from typing import Any
-
-from pyconnectwise.endpoints.automate.ComputersIdAlertsEndpoint import ComputersIdAlertsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsEndpoint import ComputersIdAlertsuspensionsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdBiosEndpoint import ComputersIdBiosEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdCommandexecuteEndpoint import ComputersIdCommandexecuteEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdCommandhistoryEndpoint import ComputersIdCommandhistoryEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdComputerpatchingpoliciesEndpoint import \
-    ComputersIdComputerpatchingpoliciesEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdDevicesEndpoint import ComputersIdDevicesEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdDriversEndpoint import ComputersIdDriversEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdDrivesEndpoint import ComputersIdDrivesEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdEffectivepatchingpolicyEndpoint import \
-    ComputersIdEffectivepatchingpolicyEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdMicrosoftupdatesEndpoint import ComputersIdMicrosoftupdatesEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdMonitoralertsuspensionsEndpoint import \
-    ComputersIdMonitoralertsuspensionsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdMonitorsEndpoint import ComputersIdMonitorsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdOperatingsystemEndpoint import ComputersIdOperatingsystemEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdPatchingstatsEndpoint import ComputersIdPatchingstatsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdPatchjobsEndpoint import ComputersIdPatchjobsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdPrintersEndpoint import ComputersIdPrintersEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdProcessorsEndpoint import ComputersIdProcessorsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdRunningscriptsEndpoint import ComputersIdRunningscriptsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdScheduledscriptsEndpoint import ComputersIdScheduledscriptsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdScheduledtasksEndpoint import ComputersIdScheduledtasksEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdScripthistoryEndpoint import ComputersIdScripthistoryEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdSensorsEndpoint import ComputersIdSensorsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdServicesEndpoint import ComputersIdServicesEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdSoftwareEndpoint import ComputersIdSoftwareEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdSystemslotsEndpoint import ComputersIdSystemslotsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdThirdpartypatchesEndpoint import ComputersIdThirdpartypatchesEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdUpsEndpoint import ComputersIdUpsEndpoint
-from pyconnectwise.endpoints.automate.ComputersIdVideocardsEndpoint import ComputersIdVideocardsEndpoint
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechComputer
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ComputersIdAlertsEndpoint import ComputersIdAlertsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsEndpoint import ComputersIdAlertsuspensionsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdBiosEndpoint import ComputersIdBiosEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdCommandexecuteEndpoint import ComputersIdCommandexecuteEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdCommandhistoryEndpoint import ComputersIdCommandhistoryEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdComputerpatchingpoliciesEndpoint import \
+        ComputersIdComputerpatchingpoliciesEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdDevicesEndpoint import ComputersIdDevicesEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdDriversEndpoint import ComputersIdDriversEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdDrivesEndpoint import ComputersIdDrivesEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdEffectivepatchingpolicyEndpoint import \
+        ComputersIdEffectivepatchingpolicyEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdMicrosoftupdatesEndpoint import ComputersIdMicrosoftupdatesEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdMonitoralertsuspensionsEndpoint import \
+        ComputersIdMonitoralertsuspensionsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdMonitorsEndpoint import ComputersIdMonitorsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdOperatingsystemEndpoint import ComputersIdOperatingsystemEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdPatchingstatsEndpoint import ComputersIdPatchingstatsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdPatchjobsEndpoint import ComputersIdPatchjobsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdPrintersEndpoint import ComputersIdPrintersEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdProcessorsEndpoint import ComputersIdProcessorsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdRunningscriptsEndpoint import ComputersIdRunningscriptsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdScheduledscriptsEndpoint import ComputersIdScheduledscriptsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdScheduledtasksEndpoint import ComputersIdScheduledtasksEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdScripthistoryEndpoint import ComputersIdScripthistoryEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdSensorsEndpoint import ComputersIdSensorsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdServicesEndpoint import ComputersIdServicesEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdSoftwareEndpoint import ComputersIdSoftwareEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdSystemslotsEndpoint import ComputersIdSystemslotsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdThirdpartypatchesEndpoint import \
+        ComputersIdThirdpartypatchesEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdUpsEndpoint import ComputersIdUpsEndpoint
+    from pyconnectwise.endpoints.automate.ComputersIdVideocardsEndpoint import ComputersIdVideocardsEndpoint
+
 
 class ComputersIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Computers/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
-
-        self.drivers = self._register_child_endpoint(ComputersIdDriversEndpoint(client, parent_endpoint=self))
-        self.patchjobs = self._register_child_endpoint(ComputersIdPatchjobsEndpoint(client, parent_endpoint=self))
-        self.printers = self._register_child_endpoint(ComputersIdPrintersEndpoint(client, parent_endpoint=self))
-        self.services = self._register_child_endpoint(ComputersIdServicesEndpoint(client, parent_endpoint=self))
-        self.sensors = self._register_child_endpoint(ComputersIdSensorsEndpoint(client, parent_endpoint=self))
-        self.scheduledtasks = self._register_child_endpoint(
-            ComputersIdScheduledtasksEndpoint(client, parent_endpoint=self)
-        )
-        self.scripthistory = self._register_child_endpoint(
-            ComputersIdScripthistoryEndpoint(client, parent_endpoint=self)
-        )
-        self.patchingstats = self._register_child_endpoint(
-            ComputersIdPatchingstatsEndpoint(client, parent_endpoint=self)
-        )
-        self.drives = self._register_child_endpoint(ComputersIdDrivesEndpoint(client, parent_endpoint=self))
-        self.systemslots = self._register_child_endpoint(ComputersIdSystemslotsEndpoint(client, parent_endpoint=self))
-        self.ups = self._register_child_endpoint(ComputersIdUpsEndpoint(client, parent_endpoint=self))
-        self.monitors = self._register_child_endpoint(ComputersIdMonitorsEndpoint(client, parent_endpoint=self))
-        self.microsoftupdates = self._register_child_endpoint(
-            ComputersIdMicrosoftupdatesEndpoint(client, parent_endpoint=self)
-        )
-        self.effectivepatchingpolicy = self._register_child_endpoint(
-            ComputersIdEffectivepatchingpolicyEndpoint(client, parent_endpoint=self)
-        )
-        self.alerts = self._register_child_endpoint(ComputersIdAlertsEndpoint(client, parent_endpoint=self))
-        self.thirdpartypatches = self._register_child_endpoint(
-            ComputersIdThirdpartypatchesEndpoint(client, parent_endpoint=self)
-        )
-        self.videocards = self._register_child_endpoint(ComputersIdVideocardsEndpoint(client, parent_endpoint=self))
-        self.runningscripts = self._register_child_endpoint(
-            ComputersIdRunningscriptsEndpoint(client, parent_endpoint=self)
-        )
-        self.alertsuspensions = self._register_child_endpoint(
-            ComputersIdAlertsuspensionsEndpoint(client, parent_endpoint=self)
-        )
-        self.commandhistory = self._register_child_endpoint(
-            ComputersIdCommandhistoryEndpoint(client, parent_endpoint=self)
-        )
-        self.commandexecute = self._register_child_endpoint(
-            ComputersIdCommandexecuteEndpoint(client, parent_endpoint=self)
-        )
-        self.monitoralertsuspensions = self._register_child_endpoint(
-            ComputersIdMonitoralertsuspensionsEndpoint(client, parent_endpoint=self)
-        )
-        self.operatingsystem = self._register_child_endpoint(
-            ComputersIdOperatingsystemEndpoint(client, parent_endpoint=self)
-        )
-        self.software = self._register_child_endpoint(ComputersIdSoftwareEndpoint(client, parent_endpoint=self))
-        self.devices = self._register_child_endpoint(ComputersIdDevicesEndpoint(client, parent_endpoint=self))
-        self.computerpatchingpolicies = self._register_child_endpoint(
-            ComputersIdComputerpatchingpoliciesEndpoint(client, parent_endpoint=self)
-        )
-        self.scheduledscripts = self._register_child_endpoint(
-            ComputersIdScheduledscriptsEndpoint(client, parent_endpoint=self)
-        )
-        self.processors = self._register_child_endpoint(ComputersIdProcessorsEndpoint(client, parent_endpoint=self))
-        self.bios = self._register_child_endpoint(ComputersIdBiosEndpoint(client, parent_endpoint=self))
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechComputer]:
         """
         Performs a GET request against the /Computers/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechComputer]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechComputer,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechComputer, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechComputer:
         """
@@ -132,4 +74,126 @@ class ComputersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechComputer: The parsed response data.
         """
-        return self._parse_one(LabTechComputer, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LabTechComputer, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def drivers(self) -> "ComputersIdDriversEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdDriversEndpoint")
+
+    @cached_property
+    def patchjobs(self) -> "ComputersIdPatchjobsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdPatchjobsEndpoint")
+
+    @cached_property
+    def printers(self) -> "ComputersIdPrintersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdPrintersEndpoint")
+
+    @cached_property
+    def services(self) -> "ComputersIdServicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdServicesEndpoint")
+
+    @cached_property
+    def sensors(self) -> "ComputersIdSensorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdSensorsEndpoint")
+
+    @cached_property
+    def scheduledtasks(self) -> "ComputersIdScheduledtasksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdScheduledtasksEndpoint")
+
+    @cached_property
+    def scripthistory(self) -> "ComputersIdScripthistoryEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdScripthistoryEndpoint")
+
+    @cached_property
+    def patchingstats(self) -> "ComputersIdPatchingstatsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdPatchingstatsEndpoint")
+
+    @cached_property
+    def drives(self) -> "ComputersIdDrivesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdDrivesEndpoint")
+
+    @cached_property
+    def systemslots(self) -> "ComputersIdSystemslotsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdSystemslotsEndpoint")
+
+    @cached_property
+    def ups(self) -> "ComputersIdUpsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdUpsEndpoint")
+
+    @cached_property
+    def monitors(self) -> "ComputersIdMonitorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdMonitorsEndpoint")
+
+    @cached_property
+    def microsoftupdates(self) -> "ComputersIdMicrosoftupdatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdMicrosoftupdatesEndpoint")
+
+    @cached_property
+    def effectivepatchingpolicy(self) -> "ComputersIdEffectivepatchingpolicyEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.ComputersIdEffectivepatchingpolicyEndpoint"
+        )
+
+    @cached_property
+    def alerts(self) -> "ComputersIdAlertsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdAlertsEndpoint")
+
+    @cached_property
+    def thirdpartypatches(self) -> "ComputersIdThirdpartypatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdThirdpartypatchesEndpoint")
+
+    @cached_property
+    def videocards(self) -> "ComputersIdVideocardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdVideocardsEndpoint")
+
+    @cached_property
+    def runningscripts(self) -> "ComputersIdRunningscriptsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdRunningscriptsEndpoint")
+
+    @cached_property
+    def alertsuspensions(self) -> "ComputersIdAlertsuspensionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsEndpoint")
+
+    @cached_property
+    def commandhistory(self) -> "ComputersIdCommandhistoryEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdCommandhistoryEndpoint")
+
+    @cached_property
+    def commandexecute(self) -> "ComputersIdCommandexecuteEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdCommandexecuteEndpoint")
+
+    @cached_property
+    def monitoralertsuspensions(self) -> "ComputersIdMonitoralertsuspensionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.ComputersIdMonitoralertsuspensionsEndpoint"
+        )
+
+    @cached_property
+    def operatingsystem(self) -> "ComputersIdOperatingsystemEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdOperatingsystemEndpoint")
+
+    @cached_property
+    def software(self) -> "ComputersIdSoftwareEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdSoftwareEndpoint")
+
+    @cached_property
+    def devices(self) -> "ComputersIdDevicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdDevicesEndpoint")
+
+    @cached_property
+    def computerpatchingpolicies(self) -> "ComputersIdComputerpatchingpoliciesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.ComputersIdComputerpatchingpoliciesEndpoint"
+        )
+
+    @cached_property
+    def scheduledscripts(self) -> "ComputersIdScheduledscriptsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdScheduledscriptsEndpoint")
+
+    @cached_property
+    def processors(self) -> "ComputersIdProcessorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdProcessorsEndpoint")
+
+    @cached_property
+    def bios(self) -> "ComputersIdBiosEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdBiosEndpoint")
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechComputerRunningScript
@@ -6,31 +7,27 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ComputersIdRunningscriptsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Runningscripts"
+    _route = "Computers/{id}/Runningscripts"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Runningscripts", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechComputerRunningScript]:
         """
         Performs a GET request against the /Computers/{id}/Runningscripts endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechComputerRunningScript]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechComputerRunningScript,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechComputerRunningScript, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechComputerRunningScript]:
         """
@@ -43,5 +40,5 @@ class ComputersIdRunningscriptsEndpoint(ConnectWiseEndpoint):
             list[LabTechComputerRunningScript]: The parsed response data.
         """
         return self._parse_many(
-            LabTechComputerRunningScript, super()._make_request("GET", data=data, params=params).json()
+            LabTechComputerRunningScript, super()._make_request("GET", data=data, params=params).content
         )
@@ -1,50 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ComputersIdScheduledscriptsIdEndpoint import ComputersIdScheduledscriptsIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechScheduledScript
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ComputersIdScheduledscriptsIdEndpoint import \
+        ComputersIdScheduledscriptsIdEndpoint
+
 
 class ComputersIdScheduledscriptsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Scheduledscripts"
+    _route = "Computers/{id}/Scheduledscripts"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Scheduledscripts", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ComputersIdScheduledscriptsIdEndpoint:
+    def id(self, id: int) -> "ComputersIdScheduledscriptsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ComputersIdScheduledscriptsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ComputersIdScheduledscriptsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ComputersIdScheduledscriptsIdEndpoint: The initialized ComputersIdScheduledscriptsIdEndpoint object.
+            ComputersIdScheduledscriptsIdEndpoint: The ComputersIdScheduledscriptsIdEndpoint view bound to the ID.
         """
-        child = ComputersIdScheduledscriptsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ComputersIdScheduledscriptsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechScheduledScript]:
         """
         Performs a GET request against the /Computers/{id}/Scheduledscripts endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechScheduledScript]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechScheduledScript,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechScheduledScript, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechScheduledScript]:
         """
@@ -56,7 +54,7 @@ class ComputersIdScheduledscriptsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LabTechScheduledScript]: The parsed response data.
         """
-        return self._parse_many(LabTechScheduledScript, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechScheduledScript, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechScheduledScript:
         """
@@ -68,4 +66,4 @@ class ComputersIdScheduledscriptsEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechScheduledScript: The parsed response data.
         """
-        return self._parse_one(LabTechScheduledScript, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LabTechScheduledScript, super()._make_request("POST", data=data, params=params).content)
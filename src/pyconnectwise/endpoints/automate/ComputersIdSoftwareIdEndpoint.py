@@ -1,15 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ComputersIdSoftwareIdUninstallEndpoint import \
-    ComputersIdSoftwareIdUninstallEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ComputersIdSoftwareIdUninstallEndpoint import \
+        ComputersIdSoftwareIdUninstallEndpoint
+
 
 class ComputersIdSoftwareIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Computers/{id}/Software/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.uninstall = self._register_child_endpoint(
-            ComputersIdSoftwareIdUninstallEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def uninstall(self) -> "ComputersIdSoftwareIdUninstallEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ComputersIdSoftwareIdUninstallEndpoint")
@@ -1,50 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.DataviewfoldersIdEndpoint import DataviewfoldersIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechDataViewFolder
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.DataviewfoldersIdEndpoint import DataviewfoldersIdEndpoint
+
 
 class DataviewfoldersEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Dataviewfolders"
+    _route = "Dataviewfolders"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Dataviewfolders", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> DataviewfoldersIdEndpoint:
+    def id(self, id: int) -> "DataviewfoldersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized DataviewfoldersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a DataviewfoldersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            DataviewfoldersIdEndpoint: The initialized DataviewfoldersIdEndpoint object.
+            DataviewfoldersIdEndpoint: The DataviewfoldersIdEndpoint view bound to the ID.
         """
-        child = DataviewfoldersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.DataviewfoldersIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechDataViewFolder]:
         """
         Performs a GET request against the /Dataviewfolders endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechDataViewFolder]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechDataViewFolder,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechDataViewFolder, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechDataViewFolder]:
         """
@@ -56,4 +53,4 @@ class DataviewfoldersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LabTechDataViewFolder]: The parsed response data.
         """
-        return self._parse_many(LabTechDataViewFolder, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechDataViewFolder, super()._make_request("GET", data=data, params=params).content)
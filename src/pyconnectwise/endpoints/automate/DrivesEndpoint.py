@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.DrivesIdEndpoint import DrivesIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.DrivesIdEndpoint import DrivesIdEndpoint
+
 
 class DrivesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Drives"
+    _route = "Drives"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Drives", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> DrivesIdEndpoint:
+    def id(self, id: int) -> "DrivesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized DrivesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a DrivesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            DrivesIdEndpoint: The initialized DrivesIdEndpoint object.
+            DrivesIdEndpoint: The DrivesIdEndpoint view bound to the ID.
         """
-        child = DrivesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.DrivesIdEndpoint", id)
@@ -1,18 +1,35 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.DrivesIdDrivestatsDailyEndpoint import DrivesIdDrivestatsDailyEndpoint
-from pyconnectwise.endpoints.automate.DrivesIdDrivestatsMonthlyEndpoint import DrivesIdDrivestatsMonthlyEndpoint
-from pyconnectwise.endpoints.automate.DrivesIdDrivestatsWeeklyEndpoint import DrivesIdDrivestatsWeeklyEndpoint
-from pyconnectwise.endpoints.automate.DrivesIdDrivestatsYearlyEndpoint import DrivesIdDrivestatsYearlyEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.DrivesIdDrivestatsDailyEndpoint import DrivesIdDrivestatsDailyEndpoint
+    from pyconnectwise.endpoints.automate.DrivesIdDrivestatsMonthlyEndpoint import DrivesIdDrivestatsMonthlyEndpoint
+    from pyconnectwise.endpoints.automate.DrivesIdDrivestatsWeeklyEndpoint import DrivesIdDrivestatsWeeklyEndpoint
+    from pyconnectwise.endpoints.automate.DrivesIdDrivestatsYearlyEndpoint import DrivesIdDrivestatsYearlyEndpoint
+
 
 class DrivesIdDrivestatsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Drivestats"
+    _route = "Drives/{id}/Drivestats"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Drivestats", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def yearly(self) -> "DrivesIdDrivestatsYearlyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.DrivesIdDrivestatsYearlyEndpoint")
+
+    @cached_property
+    def daily(self) -> "DrivesIdDrivestatsDailyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.DrivesIdDrivestatsDailyEndpoint")
+
+    @cached_property
+    def monthly(self) -> "DrivesIdDrivestatsMonthlyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.DrivesIdDrivestatsMonthlyEndpoint")
 
-        self.yearly = self._register_child_endpoint(DrivesIdDrivestatsYearlyEndpoint(client, parent_endpoint=self))
-        self.daily = self._register_child_endpoint(DrivesIdDrivestatsDailyEndpoint(client, parent_endpoint=self))
-        self.monthly = self._register_child_endpoint(DrivesIdDrivestatsMonthlyEndpoint(client, parent_endpoint=self))
-        self.weekly = self._register_child_endpoint(DrivesIdDrivestatsWeeklyEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def weekly(self) -> "DrivesIdDrivestatsWeeklyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.DrivesIdDrivestatsWeeklyEndpoint")
@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.DrivesIdDrivestatsEndpoint import DrivesIdDrivestatsEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.DrivesIdDrivestatsEndpoint import DrivesIdDrivestatsEndpoint
+
 
 class DrivesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Drives/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.drivestats = self._register_child_endpoint(DrivesIdDrivestatsEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def drivestats(self) -> "DrivesIdDrivestatsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.DrivesIdDrivestatsEndpoint")
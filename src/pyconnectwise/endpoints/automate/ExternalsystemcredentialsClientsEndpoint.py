@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ExternalsystemcredentialsClientsIdEndpoint import \
-    ExternalsystemcredentialsClientsIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ExternalsystemcredentialsClientsIdEndpoint import \
+        ExternalsystemcredentialsClientsIdEndpoint
+
 
 class ExternalsystemcredentialsClientsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Clients"
+    _route = "Externalsystemcredentials/Clients"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Clients", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ExternalsystemcredentialsClientsIdEndpoint:
+    def id(self, id: int) -> "ExternalsystemcredentialsClientsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ExternalsystemcredentialsClientsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ExternalsystemcredentialsClientsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ExternalsystemcredentialsClientsIdEndpoint: The initialized ExternalsystemcredentialsClientsIdEndpoint object.
+            ExternalsystemcredentialsClientsIdEndpoint: The ExternalsystemcredentialsClientsIdEndpoint view bound to the ID.
         """
-        child = ExternalsystemcredentialsClientsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ExternalsystemcredentialsClientsIdEndpoint", id)
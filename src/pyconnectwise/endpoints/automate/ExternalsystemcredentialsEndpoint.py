@@ -1,15 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ExternalsystemcredentialsClientsEndpoint import \
-    ExternalsystemcredentialsClientsEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ExternalsystemcredentialsClientsEndpoint import \
+        ExternalsystemcredentialsClientsEndpoint
+
 
 class ExternalsystemcredentialsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Externalsystemcredentials"
+    _route = "Externalsystemcredentials"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Externalsystemcredentials", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.clients = self._register_child_endpoint(
-            ExternalsystemcredentialsClientsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def clients(self) -> "ExternalsystemcredentialsClientsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ExternalsystemcredentialsClientsEndpoint")
@@ -1,50 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.GroupsIdEndpoint import GroupsIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechGroup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.GroupsIdEndpoint import GroupsIdEndpoint
+
 
 class GroupsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Groups"
+    _route = "Groups"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Groups", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> GroupsIdEndpoint:
+    def id(self, id: int) -> "GroupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized GroupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a GroupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            GroupsIdEndpoint: The initialized GroupsIdEndpoint object.
+            GroupsIdEndpoint: The GroupsIdEndpoint view bound to the ID.
         """
-        child = GroupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.GroupsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechGroup]:
         """
         Performs a GET request against the /Groups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechGroup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechGroup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechGroup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechGroup]:
         """
@@ -56,7 +53,7 @@ class GroupsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LabTechGroup]: The parsed response data.
         """
-        return self._parse_many(LabTechGroup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechGroup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechGroup:
         """
@@ -68,4 +65,4 @@ class GroupsEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechGroup: The parsed response data.
         """
-        return self._parse_one(LabTechGroup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LabTechGroup, super()._make_request("POST", data=data, params=params).content)
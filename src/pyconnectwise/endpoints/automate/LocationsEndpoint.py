@@ -1,50 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.LocationsIdEndpoint import LocationsIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateLocation, LabTechLocation
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.LocationsIdEndpoint import LocationsIdEndpoint
+
 
 class LocationsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Locations"
+    _route = "Locations"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Locations", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> LocationsIdEndpoint:
+    def id(self, id: int) -> "LocationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized LocationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a LocationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            LocationsIdEndpoint: The initialized LocationsIdEndpoint object.
+            LocationsIdEndpoint: The LocationsIdEndpoint view bound to the ID.
         """
-        child = LocationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.LocationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AutomateLocation]:
         """
         Performs a GET request against the /Locations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AutomateLocation]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AutomateLocation,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AutomateLocation, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AutomateLocation]:
         """
@@ -56,7 +53,7 @@ class LocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AutomateLocation]: The parsed response data.
         """
-        return self._parse_many(AutomateLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AutomateLocation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechLocation:
         """
@@ -68,4 +65,4 @@ class LocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechLocation: The parsed response data.
         """
-        return self._parse_one(LabTechLocation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LabTechLocation, super()._make_request("POST", data=data, params=params).content)
@@ -1,16 +1,26 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.LocationsIdProbeconfigurationEndpoint import LocationsIdProbeconfigurationEndpoint
-from pyconnectwise.endpoints.automate.LocationsIdUpgradeprobeEndpoint import LocationsIdUpgradeprobeEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.LocationsIdProbeconfigurationEndpoint import \
+        LocationsIdProbeconfigurationEndpoint
+    from pyconnectwise.endpoints.automate.LocationsIdUpgradeprobeEndpoint import LocationsIdUpgradeprobeEndpoint
+
 
 class LocationsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Locations/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def upgradeprobe(self) -> "LocationsIdUpgradeprobeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.LocationsIdUpgradeprobeEndpoint")
 
-        self.upgradeprobe = self._register_child_endpoint(LocationsIdUpgradeprobeEndpoint(client, parent_endpoint=self))
-        self.probeconfiguration = self._register_child_endpoint(
-            LocationsIdProbeconfigurationEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def probeconfiguration(self) -> "LocationsIdProbeconfigurationEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.LocationsIdProbeconfigurationEndpoint")
@@ -1,31 +1,44 @@
-from typing import Any
-
-from pyconnectwise.endpoints.automate.LookupsProbeeventlevelsEndpoint import LookupsProbeeventlevelsEndpoint
-from pyconnectwise.endpoints.automate.LookupsScanfrequenciesEndpoint import LookupsScanfrequenciesEndpoint
-from pyconnectwise.endpoints.automate.LookupsSnmpencryptionmethodsEndpoint import LookupsSnmpencryptionmethodsEndpoint
-from pyconnectwise.endpoints.automate.LookupsSnmphashmethodsEndpoint import LookupsSnmphashmethodsEndpoint
-from pyconnectwise.endpoints.automate.LookupsStatusscannetworkportoptionsEndpoint import \
-    LookupsStatusscannetworkportoptionsEndpoint
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.LookupsProbeeventlevelsEndpoint import LookupsProbeeventlevelsEndpoint
+    from pyconnectwise.endpoints.automate.LookupsScanfrequenciesEndpoint import LookupsScanfrequenciesEndpoint
+    from pyconnectwise.endpoints.automate.LookupsSnmpencryptionmethodsEndpoint import \
+        LookupsSnmpencryptionmethodsEndpoint
+    from pyconnectwise.endpoints.automate.LookupsSnmphashmethodsEndpoint import LookupsSnmphashmethodsEndpoint
+    from pyconnectwise.endpoints.automate.LookupsStatusscannetworkportoptionsEndpoint import \
+        LookupsStatusscannetworkportoptionsEndpoint
+
 
 class LookupsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Lookups"
+    _route = "Lookups"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Lookups", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.scanfrequencies = self._register_child_endpoint(
-            LookupsScanfrequenciesEndpoint(client, parent_endpoint=self)
-        )
-        self.probeeventlevels = self._register_child_endpoint(
-            LookupsProbeeventlevelsEndpoint(client, parent_endpoint=self)
-        )
-        self.snmpencryptionmethods = self._register_child_endpoint(
-            LookupsSnmpencryptionmethodsEndpoint(client, parent_endpoint=self)
-        )
-        self.snmphashmethods = self._register_child_endpoint(
-            LookupsSnmphashmethodsEndpoint(client, parent_endpoint=self)
-        )
-        self.statusscannetworkportoptions = self._register_child_endpoint(
-            LookupsStatusscannetworkportoptionsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def scanfrequencies(self) -> "LookupsScanfrequenciesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.LookupsScanfrequenciesEndpoint")
+
+    @cached_property
+    def probeeventlevels(self) -> "LookupsProbeeventlevelsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.LookupsProbeeventlevelsEndpoint")
+
+    @cached_property
+    def snmpencryptionmethods(self) -> "LookupsSnmpencryptionmethodsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.LookupsSnmpencryptionmethodsEndpoint")
+
+    @cached_property
+    def snmphashmethods(self) -> "LookupsSnmphashmethodsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.LookupsSnmphashmethodsEndpoint")
+
+    @cached_property
+    def statusscannetworkportoptions(self) -> "LookupsStatusscannetworkportoptionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.LookupsStatusscannetworkportoptionsEndpoint"
         )
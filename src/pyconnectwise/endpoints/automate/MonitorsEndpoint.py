@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.MonitorsIdEndpoint import MonitorsIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.MonitorsIdEndpoint import MonitorsIdEndpoint
+
 
 class MonitorsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Monitors"
+    _route = "Monitors"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Monitors", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MonitorsIdEndpoint:
+    def id(self, id: int) -> "MonitorsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MonitorsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MonitorsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MonitorsIdEndpoint: The initialized MonitorsIdEndpoint object.
+            MonitorsIdEndpoint: The MonitorsIdEndpoint view bound to the ID.
         """
-        child = MonitorsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.MonitorsIdEndpoint", id)
@@ -1,30 +1,47 @@
-from typing import Any
-
-from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataDailyaveragesEndpoint import \
-    MonitorsIdCollecteddataDailyaveragesEndpoint
-from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataMonthlyaveragesEndpoint import \
-    MonitorsIdCollecteddataMonthlyaveragesEndpoint
-from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataWeeklyaveragesEndpoint import \
-    MonitorsIdCollecteddataWeeklyaveragesEndpoint
-from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataYearlyaveragesEndpoint import \
-    MonitorsIdCollecteddataYearlyaveragesEndpoint
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataDailyaveragesEndpoint import \
+        MonitorsIdCollecteddataDailyaveragesEndpoint
+    from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataMonthlyaveragesEndpoint import \
+        MonitorsIdCollecteddataMonthlyaveragesEndpoint
+    from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataWeeklyaveragesEndpoint import \
+        MonitorsIdCollecteddataWeeklyaveragesEndpoint
+    from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataYearlyaveragesEndpoint import \
+        MonitorsIdCollecteddataYearlyaveragesEndpoint
+
 
 class MonitorsIdCollecteddataEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Collecteddata"
+    _route = "Monitors/{id}/Collecteddata"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Collecteddata", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.dailyaverages = self._register_child_endpoint(
-            MonitorsIdCollecteddataDailyaveragesEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def dailyaverages(self) -> "MonitorsIdCollecteddataDailyaveragesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.MonitorsIdCollecteddataDailyaveragesEndpoint"
         )
-        self.monthlyaverages = self._register_child_endpoint(
-            MonitorsIdCollecteddataMonthlyaveragesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def monthlyaverages(self) -> "MonitorsIdCollecteddataMonthlyaveragesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.MonitorsIdCollecteddataMonthlyaveragesEndpoint"
         )
-        self.weeklyaverages = self._register_child_endpoint(
-            MonitorsIdCollecteddataWeeklyaveragesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def weeklyaverages(self) -> "MonitorsIdCollecteddataWeeklyaveragesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.MonitorsIdCollecteddataWeeklyaveragesEndpoint"
         )
-        self.yearlyaverages = self._register_child_endpoint(
-            MonitorsIdCollecteddataYearlyaveragesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def yearlyaverages(self) -> "MonitorsIdCollecteddataYearlyaveragesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.MonitorsIdCollecteddataYearlyaveragesEndpoint"
         )
@@ -1,19 +1,26 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataEndpoint import MonitorsIdCollecteddataEndpoint
-from pyconnectwise.endpoints.automate.MonitorsIdDatacollectionsettingsEndpoint import \
-    MonitorsIdDatacollectionsettingsEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataEndpoint import MonitorsIdCollecteddataEndpoint
+    from pyconnectwise.endpoints.automate.MonitorsIdDatacollectionsettingsEndpoint import \
+        MonitorsIdDatacollectionsettingsEndpoint
+
 
 class MonitorsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Monitors/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def collecteddata(self) -> "MonitorsIdCollecteddataEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.MonitorsIdCollecteddataEndpoint")
 
-        self.collecteddata = self._register_child_endpoint(
-            MonitorsIdCollecteddataEndpoint(client, parent_endpoint=self)
-        )
-        self.datacollectionsettings = self._register_child_endpoint(
-            MonitorsIdDatacollectionsettingsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def datacollectionsettings(self) -> "MonitorsIdDatacollectionsettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.MonitorsIdDatacollectionsettingsEndpoint")
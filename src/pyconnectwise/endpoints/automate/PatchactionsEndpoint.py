@@ -1,35 +1,48 @@
-from typing import Any
-
-from pyconnectwise.endpoints.automate.PatchactionsDeployallapprovedEndpoint import PatchactionsDeployallapprovedEndpoint
-from pyconnectwise.endpoints.automate.PatchactionsDeployallsecurityEndpoint import PatchactionsDeployallsecurityEndpoint
-from pyconnectwise.endpoints.automate.PatchactionsReattemptfailedEndpoint import PatchactionsReattemptfailedEndpoint
-from pyconnectwise.endpoints.automate.PatchactionsSettopilotstageEndpoint import PatchactionsSettopilotstageEndpoint
-from pyconnectwise.endpoints.automate.PatchactionsSettoproductionstageEndpoint import \
-    PatchactionsSettoproductionstageEndpoint
-from pyconnectwise.endpoints.automate.PatchactionsSettoteststageEndpoint import PatchactionsSettoteststageEndpoint
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.PatchactionsDeployallapprovedEndpoint import \
+        PatchactionsDeployallapprovedEndpoint
+    from pyconnectwise.endpoints.automate.PatchactionsDeployallsecurityEndpoint import \
+        PatchactionsDeployallsecurityEndpoint
+    from pyconnectwise.endpoints.automate.PatchactionsReattemptfailedEndpoint import PatchactionsReattemptfailedEndpoint
+    from pyconnectwise.endpoints.automate.PatchactionsSettopilotstageEndpoint import PatchactionsSettopilotstageEndpoint
+    from pyconnectwise.endpoints.automate.PatchactionsSettoproductionstageEndpoint import \
+        PatchactionsSettoproductionstageEndpoint
+    from pyconnectwise.endpoints.automate.PatchactionsSettoteststageEndpoint import PatchactionsSettoteststageEndpoint
+
 
 class PatchactionsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Patchactions"
+    _route = "Patchactions"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Patchactions", parent_endpoint=parent_endpoint)
-
-        self.deployallapproved = self._register_child_endpoint(
-            PatchactionsDeployallapprovedEndpoint(client, parent_endpoint=self)
-        )
-        self.settoteststage = self._register_child_endpoint(
-            PatchactionsSettoteststageEndpoint(client, parent_endpoint=self)
-        )
-        self.settoproductionstage = self._register_child_endpoint(
-            PatchactionsSettoproductionstageEndpoint(client, parent_endpoint=self)
-        )
-        self.deployallsecurity = self._register_child_endpoint(
-            PatchactionsDeployallsecurityEndpoint(client, parent_endpoint=self)
-        )
-        self.settopilotstage = self._register_child_endpoint(
-            PatchactionsSettopilotstageEndpoint(client, parent_endpoint=self)
-        )
-        self.reattemptfailed = self._register_child_endpoint(
-            PatchactionsReattemptfailedEndpoint(client, parent_endpoint=self)
-        )
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def deployallapproved(self) -> "PatchactionsDeployallapprovedEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.PatchactionsDeployallapprovedEndpoint")
+
+    @cached_property
+    def settoteststage(self) -> "PatchactionsSettoteststageEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.PatchactionsSettoteststageEndpoint")
+
+    @cached_property
+    def settoproductionstage(self) -> "PatchactionsSettoproductionstageEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.PatchactionsSettoproductionstageEndpoint")
+
+    @cached_property
+    def deployallsecurity(self) -> "PatchactionsDeployallsecurityEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.PatchactionsDeployallsecurityEndpoint")
+
+    @cached_property
+    def settopilotstage(self) -> "PatchactionsSettopilotstageEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.PatchactionsSettopilotstageEndpoint")
+
+    @cached_property
+    def reattemptfailed(self) -> "PatchactionsReattemptfailedEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.PatchactionsReattemptfailedEndpoint")
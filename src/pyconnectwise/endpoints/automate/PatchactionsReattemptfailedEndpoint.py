@@ -1,12 +1,16 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class PatchactionsReattemptfailedEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Reattemptfailed"
+    _route = "Patchactions/Reattemptfailed"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Reattemptfailed", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
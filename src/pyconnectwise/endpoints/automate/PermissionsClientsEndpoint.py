@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.PermissionsClientsIdEndpoint import PermissionsClientsIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.PermissionsClientsIdEndpoint import PermissionsClientsIdEndpoint
+
 
 class PermissionsClientsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Clients"
+    _route = "Permissions/Clients"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Clients", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> PermissionsClientsIdEndpoint:
+    def id(self, id: int) -> "PermissionsClientsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized PermissionsClientsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a PermissionsClientsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            PermissionsClientsIdEndpoint: The initialized PermissionsClientsIdEndpoint object.
+            PermissionsClientsIdEndpoint: The PermissionsClientsIdEndpoint view bound to the ID.
         """
-        child = PermissionsClientsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.PermissionsClientsIdEndpoint", id)
@@ -1,14 +1,25 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.PermissionsClientsEndpoint import PermissionsClientsEndpoint
-from pyconnectwise.endpoints.automate.PermissionsUsersEndpoint import PermissionsUsersEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.PermissionsClientsEndpoint import PermissionsClientsEndpoint
+    from pyconnectwise.endpoints.automate.PermissionsUsersEndpoint import PermissionsUsersEndpoint
+
 
 class PermissionsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Permissions"
+    _route = "Permissions"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Permissions", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def users(self) -> "PermissionsUsersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.PermissionsUsersEndpoint")
 
-        self.users = self._register_child_endpoint(PermissionsUsersEndpoint(client, parent_endpoint=self))
-        self.clients = self._register_child_endpoint(PermissionsClientsEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def clients(self) -> "PermissionsClientsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.PermissionsClientsEndpoint")
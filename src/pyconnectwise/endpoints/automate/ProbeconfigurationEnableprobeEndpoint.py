@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ProbeconfigurationEnableprobeIdEndpoint import \
-    ProbeconfigurationEnableprobeIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ProbeconfigurationEnableprobeIdEndpoint import \
+        ProbeconfigurationEnableprobeIdEndpoint
+
 
 class ProbeconfigurationEnableprobeEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Enableprobe"
+    _route = "Probeconfiguration/Enableprobe"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Enableprobe", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProbeconfigurationEnableprobeIdEndpoint:
+    def id(self, id: int) -> "ProbeconfigurationEnableprobeIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProbeconfigurationEnableprobeIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProbeconfigurationEnableprobeIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProbeconfigurationEnableprobeIdEndpoint: The initialized ProbeconfigurationEnableprobeIdEndpoint object.
+            ProbeconfigurationEnableprobeIdEndpoint: The ProbeconfigurationEnableprobeIdEndpoint view bound to the ID.
         """
-        child = ProbeconfigurationEnableprobeIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ProbeconfigurationEnableprobeIdEndpoint", id)
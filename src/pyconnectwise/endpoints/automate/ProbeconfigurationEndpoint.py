@@ -1,28 +1,33 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ProbeconfigurationEnableprobeEndpoint import ProbeconfigurationEnableprobeEndpoint
-from pyconnectwise.endpoints.automate.ProbeconfigurationIdEndpoint import ProbeconfigurationIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ProbeconfigurationEnableprobeEndpoint import \
+        ProbeconfigurationEnableprobeEndpoint
+    from pyconnectwise.endpoints.automate.ProbeconfigurationIdEndpoint import ProbeconfigurationIdEndpoint
+
 
 class ProbeconfigurationEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Probeconfiguration", parent_endpoint=parent_endpoint)
+    endpoint_base = "Probeconfiguration"
+    _route = "Probeconfiguration"
 
-        self.enableprobe = self._register_child_endpoint(
-            ProbeconfigurationEnableprobeEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProbeconfigurationIdEndpoint:
+    def id(self, id: int) -> "ProbeconfigurationIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProbeconfigurationIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProbeconfigurationIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProbeconfigurationIdEndpoint: The initialized ProbeconfigurationIdEndpoint object.
+            ProbeconfigurationIdEndpoint: The ProbeconfigurationIdEndpoint view bound to the ID.
         """
-        child = ProbeconfigurationIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ProbeconfigurationIdEndpoint", id)
+
+    @cached_property
+    def enableprobe(self) -> "ProbeconfigurationEnableprobeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ProbeconfigurationEnableprobeEndpoint")
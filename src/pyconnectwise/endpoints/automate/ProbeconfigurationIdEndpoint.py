@@ -1,20 +1,31 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ProbeconfigurationIdAgentpushcredentialsEndpoint import \
-    ProbeconfigurationIdAgentpushcredentialsEndpoint
-from pyconnectwise.endpoints.automate.ProbeconfigurationIdSnmpconfigurationEndpoint import \
-    ProbeconfigurationIdSnmpconfigurationEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ProbeconfigurationIdAgentpushcredentialsEndpoint import \
+        ProbeconfigurationIdAgentpushcredentialsEndpoint
+    from pyconnectwise.endpoints.automate.ProbeconfigurationIdSnmpconfigurationEndpoint import \
+        ProbeconfigurationIdSnmpconfigurationEndpoint
+
 
 class ProbeconfigurationIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Probeconfiguration/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.agentpushcredentials = self._register_child_endpoint(
-            ProbeconfigurationIdAgentpushcredentialsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def agentpushcredentials(self) -> "ProbeconfigurationIdAgentpushcredentialsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.ProbeconfigurationIdAgentpushcredentialsEndpoint"
         )
-        self.snmpconfiguration = self._register_child_endpoint(
-            ProbeconfigurationIdSnmpconfigurationEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def snmpconfiguration(self) -> "ProbeconfigurationIdSnmpconfigurationEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.automate.ProbeconfigurationIdSnmpconfigurationEndpoint"
         )
@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ScriptfoldersHierarchyEndpoint import ScriptfoldersHierarchyEndpoint
-from pyconnectwise.endpoints.automate.ScriptfoldersIdEndpoint import ScriptfoldersIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechScriptFolder
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ScriptfoldersHierarchyEndpoint import ScriptfoldersHierarchyEndpoint
+    from pyconnectwise.endpoints.automate.ScriptfoldersIdEndpoint import ScriptfoldersIdEndpoint
+
 
 class ScriptfoldersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Scriptfolders", parent_endpoint=parent_endpoint)
+    endpoint_base = "Scriptfolders"
+    _route = "Scriptfolders"
 
-        self.hierarchy = self._register_child_endpoint(ScriptfoldersHierarchyEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScriptfoldersIdEndpoint:
+    def id(self, id: int) -> "ScriptfoldersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScriptfoldersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScriptfoldersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScriptfoldersIdEndpoint: The initialized ScriptfoldersIdEndpoint object.
+            ScriptfoldersIdEndpoint: The ScriptfoldersIdEndpoint view bound to the ID.
         """
-        child = ScriptfoldersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ScriptfoldersIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechScriptFolder]:
         """
         Performs a GET request against the /Scriptfolders endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechScriptFolder]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechScriptFolder,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechScriptFolder, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechScriptFolder]:
         """
@@ -59,7 +54,7 @@ class ScriptfoldersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LabTechScriptFolder]: The parsed response data.
         """
-        return self._parse_many(LabTechScriptFolder, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechScriptFolder, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechScriptFolder:
         """
@@ -71,4 +66,8 @@ class ScriptfoldersEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechScriptFolder: The parsed response data.
         """
-        return self._parse_one(LabTechScriptFolder, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LabTechScriptFolder, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def hierarchy(self) -> "ScriptfoldersHierarchyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ScriptfoldersHierarchyEndpoint")
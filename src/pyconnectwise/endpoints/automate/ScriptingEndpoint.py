@@ -1,18 +1,25 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ScriptingRunningscriptsEndpoint import ScriptingRunningscriptsEndpoint
-from pyconnectwise.endpoints.automate.ScriptingScriptschedulesEndpoint import ScriptingScriptschedulesEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ScriptingRunningscriptsEndpoint import ScriptingRunningscriptsEndpoint
+    from pyconnectwise.endpoints.automate.ScriptingScriptschedulesEndpoint import ScriptingScriptschedulesEndpoint
+
 
 class ScriptingEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Scripting"
+    _route = "Scripting"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Scripting", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def scriptschedules(self) -> "ScriptingScriptschedulesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ScriptingScriptschedulesEndpoint")
 
-        self.scriptschedules = self._register_child_endpoint(
-            ScriptingScriptschedulesEndpoint(client, parent_endpoint=self)
-        )
-        self.runningscripts = self._register_child_endpoint(
-            ScriptingRunningscriptsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def runningscripts(self) -> "ScriptingRunningscriptsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ScriptingRunningscriptsEndpoint")
@@ -1,50 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ScriptingScriptschedulesIdEndpoint import ScriptingScriptschedulesIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateScheduledScript
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ScriptingScriptschedulesIdEndpoint import ScriptingScriptschedulesIdEndpoint
+
 
 class ScriptingScriptschedulesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Scriptschedules"
+    _route = "Scripting/Scriptschedules"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Scriptschedules", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScriptingScriptschedulesIdEndpoint:
+    def id(self, id: int) -> "ScriptingScriptschedulesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScriptingScriptschedulesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScriptingScriptschedulesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScriptingScriptschedulesIdEndpoint: The initialized ScriptingScriptschedulesIdEndpoint object.
+            ScriptingScriptschedulesIdEndpoint: The ScriptingScriptschedulesIdEndpoint view bound to the ID.
         """
-        child = ScriptingScriptschedulesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ScriptingScriptschedulesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AutomateScheduledScript]:
         """
         Performs a GET request against the /Scripting/Scriptschedules endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AutomateScheduledScript]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AutomateScheduledScript,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AutomateScheduledScript, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AutomateScheduledScript]:
         """
@@ -56,4 +53,4 @@ class ScriptingScriptschedulesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AutomateScheduledScript]: The parsed response data.
         """
-        return self._parse_many(AutomateScheduledScript, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AutomateScheduledScript, super()._make_request("GET", data=data, params=params).content)
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateScheduledScript
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ScriptingScriptschedulesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Scripting/Scriptschedules/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -29,4 +33,6 @@ class ScriptingScriptschedulesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateScheduledScript: The parsed response data.
         """
-        return self._parse_one(AutomateScheduledScript, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(
+            AutomateScheduledScript, super()._make_request("PATCH", data=data, params=params).content
+        )
@@ -1,30 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ScriptsIdEndpoint import ScriptsIdEndpoint
-from pyconnectwise.endpoints.automate.ScriptsScriptfoldersEndpoint import ScriptsScriptfoldersEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateScript
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ScriptsIdEndpoint import ScriptsIdEndpoint
+    from pyconnectwise.endpoints.automate.ScriptsScriptfoldersEndpoint import ScriptsScriptfoldersEndpoint
+
 
 class ScriptsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Scripts", parent_endpoint=parent_endpoint)
+    endpoint_base = "Scripts"
+    _route = "Scripts"
 
-        self.scriptfolders = self._register_child_endpoint(ScriptsScriptfoldersEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScriptsIdEndpoint:
+    def id(self, id: int) -> "ScriptsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScriptsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScriptsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScriptsIdEndpoint: The initialized ScriptsIdEndpoint object.
+            ScriptsIdEndpoint: The ScriptsIdEndpoint view bound to the ID.
         """
-        child = ScriptsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ScriptsIdEndpoint", id)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateScript:
         """
@@ -36,4 +38,8 @@ class ScriptsEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateScript: The parsed response data.
         """
-        return self._parse_one(AutomateScript, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AutomateScript, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def scriptfolders(self) -> "ScriptsScriptfoldersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ScriptsScriptfoldersEndpoint")
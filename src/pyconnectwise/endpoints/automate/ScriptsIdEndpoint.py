@@ -1,16 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ScriptsIdCopyEndpoint import ScriptsIdCopyEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateScript
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ScriptsIdCopyEndpoint import ScriptsIdCopyEndpoint
+
 
 class ScriptsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "Scripts/{id}"
 
-        self.copy = self._register_child_endpoint(ScriptsIdCopyEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateScript:
         """
@@ -22,7 +26,7 @@ class ScriptsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateScript: The parsed response data.
         """
-        return self._parse_one(AutomateScript, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AutomateScript, super()._make_request("GET", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateScript:
         """
@@ -34,7 +38,7 @@ class ScriptsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateScript: The parsed response data.
         """
-        return self._parse_one(AutomateScript, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(AutomateScript, super()._make_request("PUT", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -45,3 +49,7 @@ class ScriptsIdEndpoint(ConnectWiseEndpoint):
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def copy(self) -> "ScriptsIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.ScriptsIdCopyEndpoint")
@@ -1,27 +1,31 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ScriptsScriptfoldersIdEndpoint import ScriptsScriptfoldersIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateSubmittableScriptFolder
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ScriptsScriptfoldersIdEndpoint import ScriptsScriptfoldersIdEndpoint
+
 
 class ScriptsScriptfoldersEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Scriptfolders"
+    _route = "Scripts/Scriptfolders"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Scriptfolders", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScriptsScriptfoldersIdEndpoint:
+    def id(self, id: int) -> "ScriptsScriptfoldersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScriptsScriptfoldersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScriptsScriptfoldersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScriptsScriptfoldersIdEndpoint: The initialized ScriptsScriptfoldersIdEndpoint object.
+            ScriptsScriptfoldersIdEndpoint: The ScriptsScriptfoldersIdEndpoint view bound to the ID.
         """
-        child = ScriptsScriptfoldersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ScriptsScriptfoldersIdEndpoint", id)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateSubmittableScriptFolder:
         """
@@ -34,5 +38,5 @@ class ScriptsScriptfoldersEndpoint(ConnectWiseEndpoint):
             AutomateSubmittableScriptFolder: The parsed response data.
         """
         return self._parse_one(
-            AutomateSubmittableScriptFolder, super()._make_request("POST", data=data, params=params).json()
+            AutomateSubmittableScriptFolder, super()._make_request("POST", data=data, params=params).content
         )
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateSubmittableScriptFolder
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ScriptsScriptfoldersIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "Scripts/Scriptfolders/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateSubmittableScriptFolder:
         """
@@ -20,5 +24,5 @@ class ScriptsScriptfoldersIdEndpoint(ConnectWiseEndpoint):
             AutomateSubmittableScriptFolder: The parsed response data.
         """
         return self._parse_one(
-            AutomateSubmittableScriptFolder, super()._make_request("POST", data=data, params=params).json()
+            AutomateSubmittableScriptFolder, super()._make_request("POST", data=data, params=params).content
         )
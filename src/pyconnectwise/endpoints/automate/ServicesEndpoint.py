@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.ServicesIdEndpoint import ServicesIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.ServicesIdEndpoint import ServicesIdEndpoint
+
 
 class ServicesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Services"
+    _route = "Services"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Services", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServicesIdEndpoint:
+    def id(self, id: int) -> "ServicesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServicesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServicesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServicesIdEndpoint: The initialized ServicesIdEndpoint object.
+            ServicesIdEndpoint: The ServicesIdEndpoint view bound to the ID.
         """
-        child = ServicesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.ServicesIdEndpoint", id)
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechDriveStatistics
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class StatisticsDrivesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Drives"
+    _route = "Statistics/Drives"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Drives", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechDriveStatistics]:
         """
@@ -19,4 +23,4 @@ class StatisticsDrivesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LabTechDriveStatistics]: The parsed response data.
         """
-        return self._parse_many(LabTechDriveStatistics, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechDriveStatistics, super()._make_request("GET", data=data, params=params).content)
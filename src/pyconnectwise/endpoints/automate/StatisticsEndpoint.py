@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.StatisticsDrivesEndpoint import StatisticsDrivesEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.StatisticsDrivesEndpoint import StatisticsDrivesEndpoint
+
 
 class StatisticsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Statistics"
+    _route = "Statistics"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Statistics", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.drives = self._register_child_endpoint(StatisticsDrivesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def drives(self) -> "StatisticsDrivesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.StatisticsDrivesEndpoint")
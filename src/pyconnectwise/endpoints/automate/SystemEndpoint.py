@@ -1,14 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.SystemServerinformationEndpoint import SystemServerinformationEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.SystemServerinformationEndpoint import SystemServerinformationEndpoint
+
 
 class SystemEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "System"
+    _route = "System"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "System", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.serverinformation = self._register_child_endpoint(
-            SystemServerinformationEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def serverinformation(self) -> "SystemServerinformationEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.SystemServerinformationEndpoint")
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechUserAudit
@@ -6,31 +7,27 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class UserauditsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Useraudits"
+    _route = "Useraudits"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Useraudits", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LabTechUserAudit]:
         """
         Performs a GET request against the /Useraudits endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LabTechUserAudit]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LabTechUserAudit,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LabTechUserAudit, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LabTechUserAudit]:
         """
@@ -42,7 +39,7 @@ class UserauditsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LabTechUserAudit]: The parsed response data.
         """
-        return self._parse_many(LabTechUserAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechUserAudit, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechUserAudit:
         """
@@ -54,4 +51,4 @@ class UserauditsEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechUserAudit: The parsed response data.
         """
-        return self._parse_one(LabTechUserAudit, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LabTechUserAudit, super()._make_request("POST", data=data, params=params).content)
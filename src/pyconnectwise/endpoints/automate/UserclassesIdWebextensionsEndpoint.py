@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateUserClassWebExtensionViewModel
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class UserclassesIdWebextensionsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Webextensions"
+    _route = "Userclasses/{id}/Webextensions"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Webextensions", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -22,7 +26,7 @@ class UserclassesIdWebextensionsEndpoint(ConnectWiseEndpoint):
             list[AutomateUserClassWebExtensionViewModel]: The parsed response data.
         """
         return self._parse_many(
-            AutomateUserClassWebExtensionViewModel, super()._make_request("GET", data=data, params=params).json()
+            AutomateUserClassWebExtensionViewModel, super()._make_request("GET", data=data, params=params).content
         )
 
     def put(
@@ -38,5 +42,5 @@ class UserclassesIdWebextensionsEndpoint(ConnectWiseEndpoint):
             list[AutomateUserClassWebExtensionViewModel]: The parsed response data.
         """
         return self._parse_many(
-            AutomateUserClassWebExtensionViewModel, super()._make_request("PUT", data=data, params=params).json()
+            AutomateUserClassWebExtensionViewModel, super()._make_request("PUT", data=data, params=params).content
         )
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechUserProfile
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class UserprofilesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Userprofiles"
+    _route = "Userprofiles"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Userprofiles", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechUserProfile:
         """
@@ -19,4 +23,4 @@ class UserprofilesEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechUserProfile: The parsed response data.
         """
-        return self._parse_one(LabTechUserProfile, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LabTechUserProfile, super()._make_request("GET", data=data, params=params).content)
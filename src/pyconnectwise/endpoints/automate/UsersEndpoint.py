@@ -1,30 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.UsersFoldersEndpoint import UsersFoldersEndpoint
-from pyconnectwise.endpoints.automate.UsersIdEndpoint import UsersIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateUser
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.UsersFoldersEndpoint import UsersFoldersEndpoint
+    from pyconnectwise.endpoints.automate.UsersIdEndpoint import UsersIdEndpoint
+
 
 class UsersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Users", parent_endpoint=parent_endpoint)
+    endpoint_base = "Users"
+    _route = "Users"
 
-        self.folders = self._register_child_endpoint(UsersFoldersEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> UsersIdEndpoint:
+    def id(self, id: int) -> "UsersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized UsersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a UsersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            UsersIdEndpoint: The initialized UsersIdEndpoint object.
+            UsersIdEndpoint: The UsersIdEndpoint view bound to the ID.
         """
-        child = UsersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.UsersIdEndpoint", id)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUser:
         """
@@ -36,4 +38,8 @@ class UsersEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateUser: The parsed response data.
         """
-        return self._parse_one(AutomateUser, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AutomateUser, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def folders(self) -> "UsersFoldersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.UsersFoldersEndpoint")
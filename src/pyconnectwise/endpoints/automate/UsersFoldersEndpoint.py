@@ -1,27 +1,31 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.UsersFoldersIdEndpoint import UsersFoldersIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateUserFolder
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.UsersFoldersIdEndpoint import UsersFoldersIdEndpoint
+
 
 class UsersFoldersEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Folders"
+    _route = "Users/Folders"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Folders", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> UsersFoldersIdEndpoint:
+    def id(self, id: int) -> "UsersFoldersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized UsersFoldersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a UsersFoldersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            UsersFoldersIdEndpoint: The initialized UsersFoldersIdEndpoint object.
+            UsersFoldersIdEndpoint: The UsersFoldersIdEndpoint view bound to the ID.
         """
-        child = UsersFoldersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.automate.UsersFoldersIdEndpoint", id)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUserFolder:
         """
@@ -33,4 +37,4 @@ class UsersFoldersEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateUserFolder: The parsed response data.
         """
-        return self._parse_one(AutomateUserFolder, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AutomateUserFolder, super()._make_request("POST", data=data, params=params).content)
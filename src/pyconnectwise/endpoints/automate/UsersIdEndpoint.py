@@ -1,47 +1,40 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
-from pyconnectwise.endpoints.automate.UsersIdAuthlinkEndpoint import UsersIdAuthlinkEndpoint
-from pyconnectwise.endpoints.automate.UsersIdChangepasswordEndpoint import UsersIdChangepasswordEndpoint
-from pyconnectwise.endpoints.automate.UsersIdFavoritesEndpoint import UsersIdFavoritesEndpoint
-from pyconnectwise.endpoints.automate.UsersIdSettingsEndpoint import UsersIdSettingsEndpoint
-from pyconnectwise.endpoints.automate.UsersIdUseraccessEndpoint import UsersIdUseraccessEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateUser
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate.UsersIdAuthlinkEndpoint import UsersIdAuthlinkEndpoint
+    from pyconnectwise.endpoints.automate.UsersIdChangepasswordEndpoint import UsersIdChangepasswordEndpoint
+    from pyconnectwise.endpoints.automate.UsersIdFavoritesEndpoint import UsersIdFavoritesEndpoint
+    from pyconnectwise.endpoints.automate.UsersIdSettingsEndpoint import UsersIdSettingsEndpoint
+    from pyconnectwise.endpoints.automate.UsersIdUseraccessEndpoint import UsersIdUseraccessEndpoint
+
 
 class UsersIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "Users/{id}"
 
-        self.settings = self._register_child_endpoint(UsersIdSettingsEndpoint(client, parent_endpoint=self))
-        self.useraccess = self._register_child_endpoint(UsersIdUseraccessEndpoint(client, parent_endpoint=self))
-        self.authlink = self._register_child_endpoint(UsersIdAuthlinkEndpoint(client, parent_endpoint=self))
-        self.favorites = self._register_child_endpoint(UsersIdFavoritesEndpoint(client, parent_endpoint=self))
-        self.changepassword = self._register_child_endpoint(UsersIdChangepasswordEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AutomateUser]:
         """
         Performs a GET request against the /Users/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AutomateUser]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AutomateUser,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AutomateUser, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUser:
         """
@@ -53,7 +46,7 @@ class UsersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateUser: The parsed response data.
         """
-        return self._parse_one(AutomateUser, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AutomateUser, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -75,4 +68,24 @@ class UsersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateUser: The parsed response data.
         """
-        return self._parse_one(AutomateUser, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(AutomateUser, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def settings(self) -> "UsersIdSettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.UsersIdSettingsEndpoint")
+
+    @cached_property
+    def useraccess(self) -> "UsersIdUseraccessEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.UsersIdUseraccessEndpoint")
+
+    @cached_property
+    def authlink(self) -> "UsersIdAuthlinkEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.UsersIdAuthlinkEndpoint")
+
+    @cached_property
+    def favorites(self) -> "UsersIdFavoritesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.UsersIdFavoritesEndpoint")
+
+    @cached_property
+    def changepassword(self) -> "UsersIdChangepasswordEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.automate.UsersIdChangepasswordEndpoint")
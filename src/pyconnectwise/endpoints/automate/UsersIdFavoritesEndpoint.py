@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import LabTechUserFavorite
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class UsersIdFavoritesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Favorites"
+    _route = "Users/{id}/Favorites"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Favorites", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LabTechUserFavorite:
         """
@@ -19,4 +23,4 @@ class UsersIdFavoritesEndpoint(ConnectWiseEndpoint):
         Returns:
             LabTechUserFavorite: The parsed response data.
         """
-        return self._parse_one(LabTechUserFavorite, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LabTechUserFavorite, super()._make_request("POST", data=data, params=params).content)
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.automate import AutomateUserAccess
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class UsersIdUseraccessEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "Useraccess"
+    _route = "Users/{id}/Useraccess"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "Useraccess", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AutomateUserAccess:
         """
@@ -19,4 +23,4 @@ class UsersIdUseraccessEndpoint(ConnectWiseEndpoint):
         Returns:
             AutomateUserAccess: The parsed response data.
         """
-        return self._parse_one(AutomateUserAccess, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AutomateUserAccess, super()._make_request("GET", data=data, params=params).content)
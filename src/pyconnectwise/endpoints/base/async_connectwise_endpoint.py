@@ -0,0 +1,206 @@
+from __future__ import annotations
+import asyncio
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Mapping, Type
+from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint, T
+from pyconnectwise.exceptions import ConnectWiseRequestException
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.responses.pagination_query import PaginationQuery
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+
+class AsyncConnectWiseEndpoint(ConnectWiseEndpoint):
+    """
+    AsyncConnectWiseEndpoint is the asyncio counterpart of ConnectWiseEndpoint and the base
+    class for all generated async endpoint classes.
+
+    It shares URL building, child endpoint registration and response parsing with
+    ConnectWiseEndpoint, but performs requests through the async client's httpx.AsyncClient,
+    so every CRUD method on a derived class is awaitable and many requests can be in flight
+    on a single event loop.
+
+    Args:
+        client: The AsyncConnectWiseAPIClient instance.
+        endpoint_url (str): The base URL for the specific endpoint.
+        parent_endpoint (AsyncConnectWiseEndpoint, optional): The parent endpoint, if applicable.
+    """
+
+    async def _make_request_and_get_json(
+        self,
+        endpoint=None,
+        data: dict[str, Any] = {},
+        params: dict[str, int | str] = {},
+    ) -> dict[str, Any]:
+        return self.client.json_backend.loads((await self._make_request("GET", endpoint, data, params)).content)
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint=None,
+        data: dict[str, Any] = {},
+        params: dict[str, int | str] = {},
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """
+        Make an API request using the specified method, endpoint, data, and parameters.
+        This function isn't intended for use outside of this class.
+        Please use the available CRUD methods as intended.
+
+        Args:
+            method (str): The HTTP method to use for the request (e.g., GET, POST, PUT, etc.).
+            endpoint (str, optional): The endpoint to make the request to.
+            data (dict, optional): The request data to send.
+            params (dict, optional): The query parameters to include in the request.
+            headers (dict, optional): Additional headers to send alongside the client's headers.
+
+        Failed requests are retried according to the client's retry policy (see RetryPolicy).
+
+        Returns:
+            The Response object (see httpx.Response).
+
+        Raises:
+            ConnectWiseRequestException: If the request returns a status code >= 400.
+        """
+        if not params:
+            params = {}
+        if not data:
+            data = {}
+
+        retry_policy = self.client.retry_policy
+        attempt = 0
+        while True:
+            # Headers are resolved first as the client may need to log in or look up its codebase
+            request_headers = await self.client._get_headers()
+            if headers:
+                request_headers = {**request_headers, **headers}
+            url = self._build_url(endpoint)
+
+            try:
+                response = await self._send_request(method, url, request_headers, data, params)
+            except self.client.transport.retryable_exceptions:
+                if not retry_policy.should_retry(method, attempt):
+                    raise
+                await asyncio.sleep(retry_policy.get_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code >= 400:
+                if retry_policy.should_retry(method, attempt, response.status_code):
+                    await asyncio.sleep(retry_policy.get_delay(attempt, response.headers.get("Retry-After")))
+                    attempt += 1
+                    continue
+                raise ConnectWiseRequestException(response)
+
+            return response
+
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: dict[str, Any],
+        params: dict[str, int | str],
+    ) -> Response:
+        """
+        Send a single request, without retrying. See ConnectWiseEndpoint._send_request.
+
+        Args:
+            method (str): The HTTP method to use for the request.
+            url (str): The full URL to send the request to.
+            headers (dict): The request headers.
+            data (dict): The request data to send.
+            params (dict): The query parameters to include in the request.
+
+        Returns:
+            The Response object (see httpx.Response).
+        """
+        concurrency_limiter = self.client.concurrency_limiter
+        if concurrency_limiter is not None:
+            await concurrency_limiter.acquire_async()
+        latency = None
+        status_code = None
+        try:
+            async with self.client.rate_limiter or nullcontext():
+                started = time.monotonic()
+                response = await self.client.transport.request(
+                    method, url, headers=headers, params=params, json=data or None
+                )
+                latency = time.monotonic() - started
+                status_code = response.status_code
+            return response
+        finally:
+            if concurrency_limiter is not None:
+                concurrency_limiter.release(latency, status_code)
+
+    async def _paginated(
+        self,
+        model_type: Type[T],
+        page: int,
+        page_size: int,
+        params: Mapping[str, int | str] | None = None,
+        forward_only: bool = False,
+    ) -> AsyncPaginatedResponse[T]:
+        """
+        Request a page of a paginated collection, as the generated paginated() methods do. The params
+        are captured in an immutable PaginationQuery, which the response requests every later page with.
+
+        Args:
+            model_type (Type[T]): The model to parse the page's items into.
+            page (int): The number of the page to request, counting from 1. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (Mapping, optional): The query parameters to include in every page's request.
+            forward_only (bool, optional): Use forward-only (pageId) pagination instead of page numbers.
+
+        Returns:
+            AsyncPaginatedResponse[T]: The initialized AsyncPaginatedResponse object.
+        """
+        query = PaginationQuery.of(params)
+        if forward_only:
+            return await self._paginated_forward_only(model_type, page_size, query)
+        return AsyncPaginatedResponse(
+            await self._make_request("GET", params=query.for_page(page, page_size)),
+            model_type,
+            self,
+            page,
+            page_size,
+            params=query,
+        )
+
+    async def _paginated_forward_only(
+        self,
+        model_type: Type[T],
+        page_size: int,
+        params: Mapping[str, int | str] | None = None,
+        page_id: int | None = None,
+        page: int = 1,
+    ) -> AsyncPaginatedResponse[T]:
+        """
+        Request a page using ConnectWise Manage's forward-only (keyset) pagination.
+        See ConnectWiseEndpoint._paginated_forward_only.
+
+        Args:
+            model_type (Type[T]): The model to parse the page's items into.
+            page_size (int): The number of results to return per page.
+            params (Mapping, optional): The query parameters to include in every page's request.
+            page_id (int, optional): The pageId to continue from. Omit to request the first page.
+            page (int, optional): The number of the page being requested, counting from 1.
+
+        Returns:
+            AsyncPaginatedResponse[T]: The initialized AsyncPaginatedResponse object.
+        """
+        query = PaginationQuery.of(params)
+        return AsyncPaginatedResponse(
+            await self._make_request(
+                "GET", params=query.for_page_id(page_size, page_id), headers=AsyncPaginatedResponse.FORWARD_ONLY_HEADERS
+            ),
+            model_type,
+            self,
+            page,
+            page_size,
+            forward_only=True,
+            page_id=page_id,
+            params=query,
+        )
@@ -1,14 +1,59 @@
 from __future__ import annotations
-import requests
+import importlib
+import json
+import time
+from contextlib import nullcontext
+from functools import cache, cached_property
 from requests import Response
-from typing import Any
+from typing import Any, Iterable, Iterator, Mapping
 from typing import TypeVar, Type
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pyconnectwise.exceptions import ConnectWiseRequestException
+from pyconnectwise.models.base.connectwise_model import build_model
+from pyconnectwise.responses.paginated_response import PaginatedResponse
+from pyconnectwise.responses.pagination_query import PaginationQuery
+from pyconnectwise.utils.columnar import read_arrow_table
+from pyconnectwise.utils.construct import construct_model
+from pyconnectwise.utils.json_stream import iter_json_array
+from pyconnectwise.utils.response_formats import RESPONSE_FORMATS, validate_response_format
 
 TChildEndpoint = TypeVar("TChildEndpoint", bound="ConnectWiseEndpoint")
 TSelf = TypeVar("TSelf", bound="ConnectWiseEndpoint")
 T = TypeVar("T", bound="BaseModel")
 
+# The state an endpoint view needs to build URLs and parse responses, everything else (e.g. cached child
+# endpoints) is left behind
+_VIEW_ATTRIBUTES: frozenset[str] = frozenset(
+    {
+        "client",
+        "endpoint_base",
+        "_route_format",
+        "_parent_endpoint",
+        "_id",
+        "_path_ids",
+        "_response_format",
+        "_trusted_parsing",
+    }
+)
+
+
+@cache
+def _load_endpoint_class(module_name: str) -> type[ConnectWiseEndpoint]:
+    """
+    Import a generated endpoint module and return its endpoint class, which shares the
+    module's name. Cached, so resolving a child endpoint class costs a dictionary lookup.
+    """
+    return getattr(importlib.import_module(module_name), module_name.rpartition(".")[2])
+
+
+@cache
+def _list_adapter(model_type: type[T]) -> TypeAdapter[list[T]]:
+    """
+    The TypeAdapter that validates a list of a model, built once per model.
+    """
+    build_model(model_type)
+    return TypeAdapter(list[model_type])
+
 
 class ConnectWiseEndpoint:
     """
@@ -35,26 +80,50 @@ class ConnectWiseEndpoint:
 
     Args:
         client: The ConnectWiseAPIClient instance.
-        endpoint_url (str): The base URL for the specific endpoint.
+        endpoint_url (str, optional): The base URL for the specific endpoint. Defaults to the class's endpoint_base.
         parent_endpoint (ConnectWiseEndpoint, optional): The parent endpoint, if applicable.
 
     Attributes:
         client (ConnectWiseAPIClient): The ConnectWiseAPIClient instance.
-        endpoint_url (str): The base URL for the specific endpoint.
+        endpoint_base (str): The base URL for the specific endpoint. Generated endpoint classes
+            declare it on the class, so it is shared by all their instances.
         _parent_endpoint (ConnectWiseEndpoint): The parent endpoint, if applicable.
         model_parser (ModelParser): An instance of the ModelParser class used for parsing API responses.
         _model (Type[TModel]): The model class for the endpoint.
         _id (int): The ID of the current resource, if applicable.
-        _child_endpoints (List[ConnectWiseEndpoint]): A list of registered child endpoints.
+        _path_ids (tuple[int, ...]): The IDs bound along the endpoint and its parents, outermost first.
+        _route (str): The path of the endpoint below the API root, e.g. "service/tickets/{id}/notes".
+            Generated endpoint classes declare it, so their URLs are built by formatting it with
+            _path_ids instead of walking up the parent endpoints.
+        _child_endpoints (List[ConnectWiseEndpoint]): The child endpoints created so far. Child endpoints are created on first access.
+        _response_format (str): The response format set with with_response_format(), passed on to child
+            endpoints and ID views. None to use the client's response_format.
+        _trusted_parsing (bool): Whether responses are parsed into models without validating them, set with
+            with_trusted_parsing() and passed on like _response_format. None to use the client's trusted_parsing.
 
     Generic Type:
         TModel: The model class for the endpoint.
     """
 
+    endpoint_base: str = ""
+    _route: str | None = None
+    _route_format: str | None = None
+    _route_id_count: int = 0
+    _path_ids: tuple[int, ...] = ()
+    _response_format: str | None = None
+    _trusted_parsing: bool | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Precompile the route once per class into a format string taking the bound IDs
+        if cls._route is not None:
+            cls._route_format = cls._route.replace("{id}", "{}")
+            cls._route_id_count = cls._route.count("{id}")
+
     def __init__(
         self,
         client,
-        endpoint_url: str,
+        endpoint_url: str | None = None,
         parent_endpoint: ConnectWiseEndpoint | None = None,
     ):
         """
@@ -62,13 +131,146 @@ class ConnectWiseEndpoint:
 
         Args:
             client: The ConnectWiseAPIClient instance.
-            endpoint_base (str): The base URL for the specific endpoint.
+            endpoint_url (str, optional): The base URL for the specific endpoint. Defaults to the class's endpoint_base.
+            parent_endpoint (ConnectWiseEndpoint, optional): The parent endpoint, if applicable.
         """
         self.client = client
-        self.endpoint_base = endpoint_url
+        if endpoint_url is not None and endpoint_url != self.endpoint_base:
+            self.endpoint_base = endpoint_url
+            # The class's route no longer describes this endpoint
+            self._route_format = None
         self._parent_endpoint = parent_endpoint
         self._id = None
-        self._child_endpoints: list[ConnectWiseEndpoint] = []
+        if parent_endpoint is not None:
+            self._path_ids = parent_endpoint._path_ids
+            if parent_endpoint._response_format is not None:
+                self._response_format = parent_endpoint._response_format
+            if parent_endpoint._trusted_parsing is not None:
+                self._trusted_parsing = parent_endpoint._trusted_parsing
+
+    @cached_property
+    def _child_endpoints(self) -> list[ConnectWiseEndpoint]:
+        # Most endpoints, and ID views in particular, never create a child endpoint
+        return []
+
+    @classmethod
+    def _at_path(cls, client, path_ids: tuple[int, ...]) -> ConnectWiseEndpoint:
+        """
+        Create a view of this endpoint class bound to the given IDs, without walking down to it from
+        the client, e.g. to resume a walk from a PaginationCursor. Like the views made by _bind_id(),
+        it builds its URL from the class's route.
+
+        Args:
+            client: The ConnectWiseAPIClient instance.
+            path_ids (tuple[int, ...]): The IDs bound along the endpoint and its parents, outermost first.
+
+        Returns:
+            ConnectWiseEndpoint: The view.
+        """
+        view = cls.__new__(cls)
+        view.client = client
+        view._parent_endpoint = None
+        view._path_ids = tuple(path_ids)
+        view._id = view._path_ids[-1] if cls._route is not None and cls._route.endswith("{id}") else None
+        return view
+
+    def _create_child_endpoint(self, module_name: str) -> ConnectWiseEndpoint:
+        """
+        Create and register the child endpoint defined in a generated endpoint module,
+        importing the module on first use.
+
+        Args:
+            module_name (str): The module of the child endpoint class.
+
+        Returns:
+            ConnectWiseEndpoint: The registered child endpoint.
+        """
+        endpoint_class = _load_endpoint_class(module_name)
+        return self._register_child_endpoint(
+            endpoint_class(self.client, parent_endpoint=self)
+        )
+
+    def _bind_id(self, module_name: str, id: int) -> ConnectWiseEndpoint:
+        """
+        Create a lightweight view of an ID child endpoint, bound to the given ID.
+
+        The view shares its endpoint_base with its class and gets just the client, parent and
+        ID, without running __init__. Its own child endpoints are only created when they are
+        accessed, so calling id() in a loop over many IDs stays cheap.
+
+        Args:
+            module_name (str): The module of the ID child endpoint class.
+            id (int): The ID to bind.
+
+        Returns:
+            ConnectWiseEndpoint: The bound ID child endpoint.
+        """
+        endpoint_class = _load_endpoint_class(module_name)
+        view = endpoint_class.__new__(endpoint_class)
+        view.client = self.client
+        view._parent_endpoint = self
+        view._id = id
+        view._path_ids = (*self._path_ids, id)
+        if self._response_format is not None:
+            view._response_format = self._response_format
+        if self._trusted_parsing is not None:
+            view._trusted_parsing = self._trusted_parsing
+        return view
+
+    def with_response_format(self: TSelf, response_format: str) -> TSelf:
+        """
+        Get a view of this endpoint whose requests return their responses in another format
+        than the client's response_format. The view makes the same requests, with the same
+        pagination, retries and authentication, and the endpoints reached through it share its
+        format.
+
+        Args:
+            response_format (str): "models" to parse responses into models, "stream" for models parsed one at a
+                time as the response body is read (see PaginatedResponse.all), "json" for the decoded
+                JSON (dicts and lists), "raw" for the undecoded response bodies (bytes), or "arrow" for
+                pyarrow Tables with a column per model field (see pyconnectwise.utils.columnar). Paginated
+                responses in "raw" and "arrow" format yield one body or table per page.
+
+        Returns:
+            ConnectWiseEndpoint: The view.
+
+        Raises:
+            ValueError: If the response format isn't one of RESPONSE_FORMATS.
+        """
+        validate_response_format(response_format)
+        view = self.__class__.__new__(self.__class__)
+        view.__dict__.update({name: value for name, value in self.__dict__.items() if name in _VIEW_ATTRIBUTES})
+        view._response_format = response_format
+        return view
+
+    def with_trusted_parsing(self: TSelf, trusted: bool = True) -> TSelf:
+        """
+        Get a view of this endpoint that parses responses into models without validating them, or that
+        validates them again if trusted is False, whatever the client's trusted_parsing. Like views made
+        with with_response_format(), the view makes the same requests and the endpoints reached through
+        it share its parsing.
+
+        Trusted parsing only maps the API's field names to the models' and constructs nested models (see
+        pyconnectwise.utils.construct). Values keep the types JSON decoded them to, e.g. timestamps stay
+        strings, so it's only meant for data read straight from ConnectWise. It applies to the "models"
+        and "stream" response formats.
+
+        Args:
+            trusted (bool, optional): Whether to skip validation. Defaults to True.
+
+        Returns:
+            ConnectWiseEndpoint: The view.
+        """
+        view = self.__class__.__new__(self.__class__)
+        view.__dict__.update({name: value for name, value in self.__dict__.items() if name in _VIEW_ATTRIBUTES})
+        view._trusted_parsing = trusted
+        return view
+
+    def _get_response_format(self) -> str:
+        return self._response_format or self.client.response_format
+
+    def _get_trusted_parsing(self) -> bool:
+        return self._trusted_parsing if self._trusted_parsing is not None else self.client.trusted_parsing
 
     def _register_child_endpoint(
         self, child_endpoint: TChildEndpoint
@@ -103,13 +305,51 @@ class ConnectWiseEndpoint:
             return self.endpoint_base
         return self.endpoint_base.replace("{id}", str(self._id))
 
+    def _build_url(self, endpoint: str | None = None) -> str:
+        """
+        Build the full request URL for this endpoint from its route and bound IDs, or, for
+        endpoints without a route, by walking up its parent endpoints.
+
+        Args:
+            endpoint (str, optional): An additional path segment to append to the URL.
+
+        Returns:
+            str: The full request URL.
+        """
+        route_format = self._route_format
+        if route_format is not None and len(self._path_ids) == self._route_id_count:
+            url = f"{self.client._get_url()}/{route_format.format(*self._path_ids)}"
+            if endpoint:
+                url = self._url_join(url, endpoint)
+            return url
+
+        def build_url(endpoint: ConnectWiseEndpoint) -> str:
+            if endpoint._parent_endpoint is not None:
+                parent_url = build_url(endpoint._parent_endpoint)
+                if endpoint._parent_endpoint._id is not None:
+                    return self._url_join(
+                        parent_url,
+                        endpoint._get_replaced_url(),
+                    )
+                else:
+                    return self._url_join(parent_url, endpoint._get_replaced_url())
+            else:
+                return self._url_join(
+                    self.client._get_url(), endpoint._get_replaced_url()
+                )
+
+        url = build_url(self)
+        if endpoint:
+            url = self._url_join(url, endpoint)
+        return url
+
     def _make_request_and_get_json(
         self,
         endpoint=None,
         data: dict[str, Any] = {},
         params: dict[str, int | str] = {},
     ) -> dict[str, Any]:
-        return self._make_request("GET", endpoint, data, params).json()
+        return self.client.json_backend.loads(self._make_request("GET", endpoint, data, params).content)
 
     def _make_request(
         self,
@@ -117,6 +357,7 @@ class ConnectWiseEndpoint:
         endpoint=None,
         data: dict[str, Any] = {},
         params: dict[str, int | str] = {},
+        headers: dict[str, str] | None = None,
     ) -> Response:
         """
         Make an API request using the specified method, endpoint, data, and parameters.
@@ -128,55 +369,231 @@ class ConnectWiseEndpoint:
             endpoint (str, optional): The endpoint to make the request to.
             data (dict, optional): The request data to send.
             params (dict, optional): The query parameters to include in the request.
+            headers (dict, optional): Additional headers to send alongside the client's headers.
+
+        Failed requests are retried according to the client's retry policy (see RetryPolicy).
 
         Returns:
             The Response object (see requests.Response).
 
         Raises:
-            Exception: If the request returns a status code >= 400.
+            ConnectWiseRequestException: If the request returns a status code >= 400.
         """
         if not params:
             params = {}
         if not data:
             data = {}
 
-        def build_url(endpoint: ConnectWiseEndpoint) -> str:
-            if endpoint._parent_endpoint is not None:
-                parent_url = build_url(endpoint._parent_endpoint)
-                if endpoint._parent_endpoint._id is not None:
-                    return self._url_join(
-                        parent_url,
-                        endpoint._get_replaced_url(),
-                    )
-                else:
-                    return self._url_join(parent_url, endpoint._get_replaced_url())
-            else:
-                return self._url_join(
-                    self.client._get_url(), endpoint._get_replaced_url()
+        url = self._build_url(endpoint)
+        # In the "stream" response format the body is left on the connection, to be read as it's parsed
+        stream = method == "GET" and self._get_response_format() == "stream"
+        retry_policy = self.client.retry_policy
+        attempt = 0
+        while True:
+            request_headers = self.client._get_headers()
+            if headers:
+                request_headers = {**request_headers, **headers}
+
+            try:
+                response = self._send_request(method, url, request_headers, data, params, stream)
+            except self.client.transport.retryable_exceptions:
+                if not retry_policy.should_retry(method, attempt):
+                    raise
+                time.sleep(retry_policy.get_delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code >= 400:
+                if retry_policy.should_retry(method, attempt, response.status_code):
+                    # A streamed response holds its pooled connection until it's read or closed
+                    response.close()
+                    time.sleep(retry_policy.get_delay(attempt, response.headers.get("Retry-After")))
+                    attempt += 1
+                    continue
+                # The exception reads the body for its message, after which the connection can be released
+                exception = ConnectWiseRequestException(response)
+                response.close()
+                raise exception
+
+            return response
+
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        data: dict[str, Any],
+        params: dict[str, int | str],
+        stream: bool = False,
+    ) -> Response:
+        """
+        Send a single request, without retrying, while holding a slot from the client's
+        concurrency limiter and rate limiter, if it has them. The request's latency and
+        status code are reported back to the concurrency limiter.
+
+        Args:
+            method (str): The HTTP method to use for the request.
+            url (str): The full URL to send the request to.
+            headers (dict): The request headers.
+            data (dict): The request data to send.
+            params (dict): The query parameters to include in the request.
+            stream (bool): Return as soon as the headers have arrived, leaving the body to be read from the
+                response (see ConnectWiseTransport.request).
+
+        Returns:
+            The Response object (see requests.Response).
+        """
+        concurrency_limiter = self.client.concurrency_limiter
+        if concurrency_limiter is not None:
+            concurrency_limiter.acquire()
+        latency = None
+        status_code = None
+        try:
+            with self.client.rate_limiter or nullcontext():
+                started = time.monotonic()
+                # Requests go through the client's transport, by default a pooled keep-alive session
+                # Only passed when set, so transports written before streaming was added keep working
+                options = {"stream": True} if stream else {}
+                response = self.client.transport.request(
+                    method, url, headers=headers, params=params, json=data or None, **options
                 )
+                latency = time.monotonic() - started
+                status_code = response.status_code
+            return response
+        finally:
+            if concurrency_limiter is not None:
+                concurrency_limiter.release(latency, status_code)
 
-        url = build_url(self)
-        if endpoint:
-            url = self._url_join(url, endpoint)
+    def _paginated(
+        self,
+        model_type: Type[T],
+        page: int,
+        page_size: int,
+        params: Mapping[str, int | str] | None = None,
+        forward_only: bool = False,
+    ) -> PaginatedResponse[T]:
+        """
+        Request a page of a paginated collection, as the generated paginated() methods do. The params
+        are captured in an immutable PaginationQuery, which the response requests every later page with.
 
-        if not data:
-            response = requests.request(
-                method, url, headers=self.client._get_headers(), params=params
-            )
-        else:
-            response = requests.request(
-                method, url, headers=self.client._get_headers(), json=data, params=params
-            )
-
-        if response.status_code >= 400:
-            raise Exception(
-                f"Request failed with status code {response.status_code}: {response.text}"
-            )
-
-        return response
-
-    def _parse_many(self, model_type: Type[T], data: list[dict[str, Any]]) -> list[T]:
-        return [model_type.model_validate(d) for d in data]
-
-    def _parse_one(self, model_type: Type[T], data: dict[str, Any]) -> T:
-        return model_type.model_validate(data)
+        Args:
+            model_type (Type[T]): The model to parse the page's items into.
+            page (int): The number of the page to request, counting from 1. Ignored when forward_only is set.
+            page_size (int): The number of results to return per page.
+            params (Mapping, optional): The query parameters to include in every page's request.
+            forward_only (bool, optional): Use forward-only (pageId) pagination instead of page numbers.
+
+        Returns:
+            PaginatedResponse[T]: The initialized PaginatedResponse object.
+        """
+        query = PaginationQuery.of(params)
+        if forward_only:
+            return self._paginated_forward_only(model_type, page_size, query)
+        return PaginatedResponse(
+            self._make_request("GET", params=query.for_page(page, page_size)),
+            model_type,
+            self,
+            page,
+            page_size,
+            params=query,
+        )
+
+    def _paginated_forward_only(
+        self,
+        model_type: Type[T],
+        page_size: int,
+        params: Mapping[str, int | str] | None = None,
+        page_id: int | None = None,
+        page: int = 1,
+    ) -> PaginatedResponse[T]:
+        """
+        Request a page using ConnectWise Manage's forward-only (keyset) pagination. Instead of
+        page numbers, each response's Link header carries the pageId to continue from, which keeps
+        the cost of every page constant and the walk stable while rows are being added.
+
+        Args:
+            model_type (Type[T]): The model to parse the page's items into.
+            page_size (int): The number of results to return per page.
+            params (Mapping, optional): The query parameters to include in every page's request.
+            page_id (int, optional): The pageId to continue from. Omit to request the first page.
+            page (int, optional): The number of the page being requested, counting from 1.
+
+        Returns:
+            PaginatedResponse[T]: The initialized PaginatedResponse object.
+        """
+        query = PaginationQuery.of(params)
+        return PaginatedResponse(
+            self._make_request(
+                "GET", params=query.for_page_id(page_size, page_id), headers=PaginatedResponse.FORWARD_ONLY_HEADERS
+            ),
+            model_type,
+            self,
+            page,
+            page_size,
+            forward_only=True,
+            page_id=page_id,
+            params=query,
+        )
+
+    def _parse_many(self, model_type: Type[T], data: list[dict[str, Any]] | bytes | Iterable[bytes]) -> Iterable[T]:
+        """
+        Parse a response holding a list of objects in the endpoint's response format: into a list of models
+        ("models"), an iterator of models parsed as they're read ("stream", see _stream_many), or the
+        "json", "raw" or "arrow" formats (see _unparsed).
+        """
+        response_format = self._get_response_format()
+        if response_format == "stream":
+            return self._stream_many(model_type, data)
+        if response_format == "models":
+            if self._get_trusted_parsing():
+                data = self.client.json_backend.loads(data) if isinstance(data, (bytes, str)) else data
+                return [construct_model(model_type, item) for item in data]
+            # A raw JSON body is validated in one call into pydantic-core, without decoding it to dicts first
+            if isinstance(data, (bytes, str)):
+                return _list_adapter(model_type).validate_json(data)
+            return _list_adapter(model_type).validate_python(data)
+        return self._unparsed(response_format, model_type, data)
+
+    def _stream_many(self, model_type: Type[T], data: list[dict[str, Any]] | bytes | Iterable[bytes]) -> Iterator[T]:
+        """
+        Parse the objects of a list into models one at a time, from a body or from the chunks it's read
+        in, for the "stream" response format. Only one is held in memory on top of what's left of the
+        body. Nothing is read until the first model is asked for.
+        """
+        if not isinstance(data, list):
+            data = data.encode() if isinstance(data, str) else data
+            data = iter_json_array((data,) if isinstance(data, bytes) else data)
+        if self._get_trusted_parsing():
+            return (construct_model(model_type, item) for item in data)
+        build_model(model_type)
+        return (model_type.model_validate(item) for item in data)
+
+    def _parse_one(self, model_type: Type[T], data: dict[str, Any] | bytes) -> T:
+        response_format = self._get_response_format()
+        if response_format in ("models", "stream") and self._get_trusted_parsing():
+            data = self.client.json_backend.loads(data) if isinstance(data, (bytes, str)) else data
+            return construct_model(model_type, data)
+        if response_format in ("models", "stream"):
+            build_model(model_type)
+            if isinstance(data, (bytes, str)):
+                return model_type.model_validate_json(data)
+            return model_type.model_validate(data)
+        if response_format == "arrow":
+            # A single object is read as a table of one row
+            data = data.encode() if isinstance(data, str) else data
+            data = b"[" + data + b"]" if isinstance(data, bytes) else [data]
+        return self._unparsed(response_format, model_type, data)
+
+    def _unparsed(self, response_format: str, model_type: Type[T], data: Any) -> Any:
+        """
+        Return response data in the "json", "raw" or "arrow" response format, for _parse_many and _parse_one.
+        """
+        if response_format == "raw":
+            return data
+        if response_format == "json":
+            return self.client.json_backend.loads(data) if isinstance(data, (bytes, str)) else data
+        if response_format == "arrow":
+            # Already decoded data (e.g. passed in by a caller) is encoded again for pyarrow's JSON reader
+            data = data if isinstance(data, (bytes, str)) else json.dumps(data)
+            return read_arrow_table(model_type, data.encode() if isinstance(data, str) else data)
+        raise ValueError(f"Unknown response format {response_format!r}, expected one of {RESPONSE_FORMATS}")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyAddressformatsCountEndpoint import CompanyAddressformatsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyAddressformatsIdEndpoint import CompanyAddressformatsIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyAddressformatsInfoEndpoint import CompanyAddressformatsInfoEndpoint
 from pyconnectwise.models.manage import AddressFormat
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyAddressformatsCountEndpoint import CompanyAddressformatsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyAddressformatsIdEndpoint import CompanyAddressformatsIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyAddressformatsInfoEndpoint import CompanyAddressformatsInfoEndpoint
+
 
 class CompanyAddressformatsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "addressFormats", parent_endpoint=parent_endpoint)
+    endpoint_base = "addressFormats"
+    _route = "company/addressFormats"
 
-        self.info = self._register_child_endpoint(CompanyAddressformatsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyAddressformatsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyAddressformatsIdEndpoint:
+    def id(self, id: int) -> "CompanyAddressformatsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyAddressformatsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyAddressformatsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyAddressformatsIdEndpoint: The initialized CompanyAddressformatsIdEndpoint object.
+            CompanyAddressformatsIdEndpoint: The CompanyAddressformatsIdEndpoint view bound to the ID.
         """
-        child = CompanyAddressformatsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyAddressformatsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AddressFormat]:
         """
         Performs a GET request against the /company/addressFormats endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AddressFormat]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AddressFormat,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AddressFormat, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AddressFormat]:
         """
@@ -61,7 +55,7 @@ class CompanyAddressformatsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AddressFormat]: The parsed response data.
         """
-        return self._parse_many(AddressFormat, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AddressFormat, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AddressFormat:
         """
@@ -73,4 +67,12 @@ class CompanyAddressformatsEndpoint(ConnectWiseEndpoint):
         Returns:
             AddressFormat: The parsed response data.
         """
-        return self._parse_one(AddressFormat, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AddressFormat, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyAddressformatsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyAddressformatsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyAddressformatsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyAddressformatsCountEndpoint")
@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyBillingsetupsInfoEndpoint import CompanyBillingsetupsInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyBillingsetupsInfoEndpoint import CompanyBillingsetupsInfoEndpoint
+
 
 class CompanyBillingsetupsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "billingSetups"
+    _route = "company/billingSetups"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "billingSetups", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(CompanyBillingsetupsInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> "CompanyBillingsetupsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyBillingsetupsInfoEndpoint")
@@ -1,55 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCommunicationtypesCountEndpoint import CompanyCommunicationtypesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCommunicationtypesIdEndpoint import CompanyCommunicationtypesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyCommunicationtypesInfoEndpoint import CompanyCommunicationtypesInfoEndpoint
 from pyconnectwise.models.manage import CommunicationType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCommunicationtypesCountEndpoint import \
+        CompanyCommunicationtypesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCommunicationtypesIdEndpoint import CompanyCommunicationtypesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCommunicationtypesInfoEndpoint import \
+        CompanyCommunicationtypesInfoEndpoint
+
 
 class CompanyCommunicationtypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "communicationTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "communicationTypes"
+    _route = "company/communicationTypes"
 
-        self.info = self._register_child_endpoint(CompanyCommunicationtypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyCommunicationtypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCommunicationtypesIdEndpoint:
+    def id(self, id: int) -> "CompanyCommunicationtypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCommunicationtypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCommunicationtypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCommunicationtypesIdEndpoint: The initialized CompanyCommunicationtypesIdEndpoint object.
+            CompanyCommunicationtypesIdEndpoint: The CompanyCommunicationtypesIdEndpoint view bound to the ID.
         """
-        child = CompanyCommunicationtypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCommunicationtypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CommunicationType]:
         """
         Performs a GET request against the /company/communicationTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CommunicationType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CommunicationType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CommunicationType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CommunicationType]:
         """
@@ -61,7 +57,7 @@ class CompanyCommunicationtypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CommunicationType]: The parsed response data.
         """
-        return self._parse_many(CommunicationType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CommunicationType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CommunicationType:
         """
@@ -73,4 +69,12 @@ class CompanyCommunicationtypesEndpoint(ConnectWiseEndpoint):
         Returns:
             CommunicationType: The parsed response data.
         """
-        return self._parse_one(CommunicationType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CommunicationType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyCommunicationtypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCommunicationtypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyCommunicationtypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCommunicationtypesCountEndpoint")
@@ -1,59 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesCountEndpoint import CompanyCompaniesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesDefaultEndpoint import CompanyCompaniesDefaultEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdEndpoint import CompanyCompaniesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesInfoEndpoint import CompanyCompaniesInfoEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesStatusesEndpoint import CompanyCompaniesStatusesEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesTypesEndpoint import CompanyCompaniesTypesEndpoint
 from pyconnectwise.models.manage import Company
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesCountEndpoint import CompanyCompaniesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesDefaultEndpoint import CompanyCompaniesDefaultEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdEndpoint import CompanyCompaniesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesInfoEndpoint import CompanyCompaniesInfoEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesStatusesEndpoint import CompanyCompaniesStatusesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesTypesEndpoint import CompanyCompaniesTypesEndpoint
+
 
 class CompanyCompaniesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "companies", parent_endpoint=parent_endpoint)
+    endpoint_base = "companies"
+    _route = "company/companies"
 
-        self.info = self._register_child_endpoint(CompanyCompaniesInfoEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(CompanyCompaniesTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyCompaniesCountEndpoint(client, parent_endpoint=self))
-        self.default = self._register_child_endpoint(CompanyCompaniesDefaultEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(CompanyCompaniesStatusesEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesIdEndpoint: The initialized CompanyCompaniesIdEndpoint object.
+            CompanyCompaniesIdEndpoint: The CompanyCompaniesIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Company]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Company]:
         """
         Performs a GET request against the /company/companies endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Company]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Company,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Company, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Company]:
         """
@@ -65,7 +58,7 @@ class CompanyCompaniesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Company]: The parsed response data.
         """
-        return self._parse_many(Company, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Company, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Company:
         """
@@ -77,4 +70,24 @@ class CompanyCompaniesEndpoint(ConnectWiseEndpoint):
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyCompaniesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesInfoEndpoint")
+
+    @cached_property
+    def types(self) -> "CompanyCompaniesTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyCompaniesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesCountEndpoint")
+
+    @cached_property
+    def default(self) -> "CompanyCompaniesDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesDefaultEndpoint")
+
+    @cached_property
+    def statuses(self) -> "CompanyCompaniesStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesStatusesEndpoint")
@@ -1,76 +1,53 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdCustomstatusnotesEndpoint import \
-    CompanyCompaniesIdCustomstatusnotesEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdGroupsEndpoint import CompanyCompaniesIdGroupsEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportnotificationsEndpoint import \
-    CompanyCompaniesIdManagementreportnotificationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportsetupEndpoint import \
-    CompanyCompaniesIdManagementreportsetupEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsEndpoint import \
-    CompanyCompaniesIdManagementsummaryreportsEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdMergeEndpoint import CompanyCompaniesIdMergeEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdNotesEndpoint import CompanyCompaniesIdNotesEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesEndpoint import CompanyCompaniesIdSitesEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdSurveysEndpoint import CompanyCompaniesIdSurveysEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsEndpoint import CompanyCompaniesIdTeamsEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksEndpoint import CompanyCompaniesIdTracksEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsEndpoint import \
-    CompanyCompaniesIdTypeassociationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdUsagesEndpoint import CompanyCompaniesIdUsagesEndpoint
 from pyconnectwise.models.manage import Company
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdCustomstatusnotesEndpoint import \
+        CompanyCompaniesIdCustomstatusnotesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdGroupsEndpoint import CompanyCompaniesIdGroupsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportnotificationsEndpoint import \
+        CompanyCompaniesIdManagementreportnotificationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportsetupEndpoint import \
+        CompanyCompaniesIdManagementreportsetupEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsEndpoint import \
+        CompanyCompaniesIdManagementsummaryreportsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdMergeEndpoint import CompanyCompaniesIdMergeEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdNotesEndpoint import CompanyCompaniesIdNotesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesEndpoint import CompanyCompaniesIdSitesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdSurveysEndpoint import CompanyCompaniesIdSurveysEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsEndpoint import CompanyCompaniesIdTeamsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksEndpoint import CompanyCompaniesIdTracksEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsEndpoint import \
+        CompanyCompaniesIdTypeassociationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdUsagesEndpoint import CompanyCompaniesIdUsagesEndpoint
+
 
 class CompanyCompaniesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "company/companies/{id}"
 
-        self.management_report_notifications = self._register_child_endpoint(
-            CompanyCompaniesIdManagementreportnotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.groups = self._register_child_endpoint(CompanyCompaniesIdGroupsEndpoint(client, parent_endpoint=self))
-        self.custom_status_notes = self._register_child_endpoint(
-            CompanyCompaniesIdCustomstatusnotesEndpoint(client, parent_endpoint=self)
-        )
-        self.surveys = self._register_child_endpoint(CompanyCompaniesIdSurveysEndpoint(client, parent_endpoint=self))
-        self.teams = self._register_child_endpoint(CompanyCompaniesIdTeamsEndpoint(client, parent_endpoint=self))
-        self.type_associations = self._register_child_endpoint(
-            CompanyCompaniesIdTypeassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.merge = self._register_child_endpoint(CompanyCompaniesIdMergeEndpoint(client, parent_endpoint=self))
-        self.management_report_setup = self._register_child_endpoint(
-            CompanyCompaniesIdManagementreportsetupEndpoint(client, parent_endpoint=self)
-        )
-        self.notes = self._register_child_endpoint(CompanyCompaniesIdNotesEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(CompanyCompaniesIdUsagesEndpoint(client, parent_endpoint=self))
-        self.management_summary_reports = self._register_child_endpoint(
-            CompanyCompaniesIdManagementsummaryreportsEndpoint(client, parent_endpoint=self)
-        )
-        self.sites = self._register_child_endpoint(CompanyCompaniesIdSitesEndpoint(client, parent_endpoint=self))
-        self.tracks = self._register_child_endpoint(CompanyCompaniesIdTracksEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Company]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Company]:
         """
         Performs a GET request against the /company/companies/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Company]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Company,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Company, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Company:
         """
@@ -82,7 +59,7 @@ class CompanyCompaniesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -104,7 +81,7 @@ class CompanyCompaniesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Company:
         """
@@ -116,4 +93,62 @@ class CompanyCompaniesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def management_report_notifications(self) -> "CompanyCompaniesIdManagementreportnotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportnotificationsEndpoint"
+        )
+
+    @cached_property
+    def groups(self) -> "CompanyCompaniesIdGroupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdGroupsEndpoint")
+
+    @cached_property
+    def custom_status_notes(self) -> "CompanyCompaniesIdCustomstatusnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdCustomstatusnotesEndpoint")
+
+    @cached_property
+    def surveys(self) -> "CompanyCompaniesIdSurveysEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdSurveysEndpoint")
+
+    @cached_property
+    def teams(self) -> "CompanyCompaniesIdTeamsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsEndpoint")
+
+    @cached_property
+    def type_associations(self) -> "CompanyCompaniesIdTypeassociationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsEndpoint")
+
+    @cached_property
+    def merge(self) -> "CompanyCompaniesIdMergeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdMergeEndpoint")
+
+    @cached_property
+    def management_report_setup(self) -> "CompanyCompaniesIdManagementreportsetupEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportsetupEndpoint"
+        )
+
+    @cached_property
+    def notes(self) -> "CompanyCompaniesIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdNotesEndpoint")
+
+    @cached_property
+    def usages(self) -> "CompanyCompaniesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdUsagesEndpoint")
+
+    @cached_property
+    def management_summary_reports(self) -> "CompanyCompaniesIdManagementsummaryreportsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsEndpoint"
+        )
+
+    @cached_property
+    def sites(self) -> "CompanyCompaniesIdSitesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesEndpoint")
+
+    @cached_property
+    def tracks(self) -> "CompanyCompaniesIdTracksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportsetupIdEndpoint import \
-    CompanyCompaniesIdManagementreportsetupIdEndpoint
 from pyconnectwise.models.manage import ManagementReportSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportsetupIdEndpoint import \
+        CompanyCompaniesIdManagementreportsetupIdEndpoint
+
 
 class CompanyCompaniesIdManagementreportsetupEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "managementReportSetup"
+    _route = "company/companies/{id}/managementReportSetup"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "managementReportSetup", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesIdManagementreportsetupIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesIdManagementreportsetupIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdManagementreportsetupIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesIdManagementreportsetupIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesIdManagementreportsetupIdEndpoint: The initialized CompanyCompaniesIdManagementreportsetupIdEndpoint object.
+            CompanyCompaniesIdManagementreportsetupIdEndpoint: The CompanyCompaniesIdManagementreportsetupIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesIdManagementreportsetupIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementreportsetupIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagementReportSetup]:
         """
         Performs a GET request against the /company/companies/{id}/managementReportSetup endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagementReportSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagementReportSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ManagementReportSetup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ManagementReportSetup]:
         """
@@ -57,7 +54,7 @@ class CompanyCompaniesIdManagementreportsetupEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ManagementReportSetup]: The parsed response data.
         """
-        return self._parse_many(ManagementReportSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ManagementReportSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagementReportSetup:
         """
@@ -69,4 +66,4 @@ class CompanyCompaniesIdManagementreportsetupEndpoint(ConnectWiseEndpoint):
         Returns:
             ManagementReportSetup: The parsed response data.
         """
-        return self._parse_one(ManagementReportSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ManagementReportSetup, super()._make_request("POST", data=data, params=params).content)
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import ManagementReportSetup
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class CompanyCompaniesIdManagementreportsetupIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/companies/{id}/managementReportSetup/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagementReportSetup:
         """
@@ -19,7 +23,7 @@ class CompanyCompaniesIdManagementreportsetupIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ManagementReportSetup: The parsed response data.
         """
-        return self._parse_one(ManagementReportSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ManagementReportSetup, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagementReportSetup:
         """
@@ -31,4 +35,4 @@ class CompanyCompaniesIdManagementreportsetupIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ManagementReportSetup: The parsed response data.
         """
-        return self._parse_one(ManagementReportSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ManagementReportSetup, super()._make_request("PATCH", data=data, params=params).content)
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsCountEndpoint import \
-    CompanyCompaniesIdManagementsummaryreportsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsIdEndpoint import \
-    CompanyCompaniesIdManagementsummaryreportsIdEndpoint
 from pyconnectwise.models.manage import CompanyManagementSummary
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsCountEndpoint import \
+        CompanyCompaniesIdManagementsummaryreportsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsIdEndpoint import \
+        CompanyCompaniesIdManagementsummaryreportsIdEndpoint
+
 
 class CompanyCompaniesIdManagementsummaryreportsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "managementSummaryReports", parent_endpoint=parent_endpoint)
+    endpoint_base = "managementSummaryReports"
+    _route = "company/companies/{id}/managementSummaryReports"
 
-        self.count = self._register_child_endpoint(
-            CompanyCompaniesIdManagementsummaryreportsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesIdManagementsummaryreportsIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesIdManagementsummaryreportsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdManagementsummaryreportsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesIdManagementsummaryreportsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesIdManagementsummaryreportsIdEndpoint: The initialized CompanyCompaniesIdManagementsummaryreportsIdEndpoint object.
+            CompanyCompaniesIdManagementsummaryreportsIdEndpoint: The CompanyCompaniesIdManagementsummaryreportsIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesIdManagementsummaryreportsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CompanyManagementSummary]:
         """
         Performs a GET request against the /company/companies/{id}/managementSummaryReports endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyManagementSummary]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyManagementSummary,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanyManagementSummary, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyManagementSummary]:
         """
@@ -63,7 +56,9 @@ class CompanyCompaniesIdManagementsummaryreportsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CompanyManagementSummary]: The parsed response data.
         """
-        return self._parse_many(CompanyManagementSummary, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(
+            CompanyManagementSummary, super()._make_request("GET", data=data, params=params).content
+        )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyManagementSummary:
         """
@@ -75,4 +70,12 @@ class CompanyCompaniesIdManagementsummaryreportsEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanyManagementSummary: The parsed response data.
         """
-        return self._parse_one(CompanyManagementSummary, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(
+            CompanyManagementSummary, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "CompanyCompaniesIdManagementsummaryreportsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyCompaniesIdManagementsummaryreportsCountEndpoint"
+        )
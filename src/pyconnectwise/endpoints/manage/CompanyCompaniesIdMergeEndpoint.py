@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import SuccessResponse
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class CompanyCompaniesIdMergeEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "merge"
+    _route = "company/companies/{id}/merge"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "merge", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SuccessResponse:
         """
@@ -19,4 +23,4 @@ class CompanyCompaniesIdMergeEndpoint(ConnectWiseEndpoint):
         Returns:
             SuccessResponse: The parsed response data.
         """
-        return self._parse_one(SuccessResponse, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SuccessResponse, super()._make_request("POST", data=data, params=params).content)
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesCountEndpoint import CompanyCompaniesIdSitesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesIdEndpoint import CompanyCompaniesIdSitesIdEndpoint
 from pyconnectwise.models.manage import CompanySite
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesCountEndpoint import CompanyCompaniesIdSitesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesIdEndpoint import CompanyCompaniesIdSitesIdEndpoint
+
 
 class CompanyCompaniesIdSitesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "sites", parent_endpoint=parent_endpoint)
+    endpoint_base = "sites"
+    _route = "company/companies/{id}/sites"
 
-        self.count = self._register_child_endpoint(CompanyCompaniesIdSitesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesIdSitesIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesIdSitesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdSitesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesIdSitesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesIdSitesIdEndpoint: The initialized CompanyCompaniesIdSitesIdEndpoint object.
+            CompanyCompaniesIdSitesIdEndpoint: The CompanyCompaniesIdSitesIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesIdSitesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[CompanySite]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[CompanySite]:
         """
         Performs a GET request against the /company/companies/{id}/sites endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanySite]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanySite,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanySite, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanySite]:
         """
@@ -57,7 +54,7 @@ class CompanyCompaniesIdSitesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CompanySite]: The parsed response data.
         """
-        return self._parse_many(CompanySite, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanySite, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanySite:
         """
@@ -69,4 +66,8 @@ class CompanyCompaniesIdSitesEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanySite: The parsed response data.
         """
-        return self._parse_one(CompanySite, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanySite, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyCompaniesIdSitesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdSitesCountEndpoint")
@@ -1,12 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdSurveysCountEndpoint import CompanyCompaniesIdSurveysCountEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdSurveysCountEndpoint import \
+        CompanyCompaniesIdSurveysCountEndpoint
+
 
 class CompanyCompaniesIdSurveysEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "surveys"
+    _route = "company/companies/{id}/surveys"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "surveys", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesIdSurveysCountEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def count(self) -> "CompanyCompaniesIdSurveysCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdSurveysCountEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsCountEndpoint import CompanyCompaniesIdTeamsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsIdEndpoint import CompanyCompaniesIdTeamsIdEndpoint
 from pyconnectwise.models.manage import CompanyTeam
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsCountEndpoint import CompanyCompaniesIdTeamsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsIdEndpoint import CompanyCompaniesIdTeamsIdEndpoint
+
 
 class CompanyCompaniesIdTeamsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "teams", parent_endpoint=parent_endpoint)
+    endpoint_base = "teams"
+    _route = "company/companies/{id}/teams"
 
-        self.count = self._register_child_endpoint(CompanyCompaniesIdTeamsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesIdTeamsIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesIdTeamsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdTeamsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesIdTeamsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesIdTeamsIdEndpoint: The initialized CompanyCompaniesIdTeamsIdEndpoint object.
+            CompanyCompaniesIdTeamsIdEndpoint: The CompanyCompaniesIdTeamsIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesIdTeamsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[CompanyTeam]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[CompanyTeam]:
         """
         Performs a GET request against the /company/companies/{id}/teams endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyTeam]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyTeam,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanyTeam, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyTeam]:
         """
@@ -57,7 +54,7 @@ class CompanyCompaniesIdTeamsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CompanyTeam]: The parsed response data.
         """
-        return self._parse_many(CompanyTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyTeam, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyTeam:
         """
@@ -69,4 +66,8 @@ class CompanyCompaniesIdTeamsEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanyTeam: The parsed response data.
         """
-        return self._parse_one(CompanyTeam, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyTeam, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyCompaniesIdTeamsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdTeamsCountEndpoint")
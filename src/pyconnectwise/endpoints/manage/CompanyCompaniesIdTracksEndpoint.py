@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksCountEndpoint import CompanyCompaniesIdTracksCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksIdEndpoint import CompanyCompaniesIdTracksIdEndpoint
 from pyconnectwise.models.manage import ContactTrack
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksCountEndpoint import \
+        CompanyCompaniesIdTracksCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksIdEndpoint import CompanyCompaniesIdTracksIdEndpoint
+
 
 class CompanyCompaniesIdTracksEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "tracks", parent_endpoint=parent_endpoint)
+    endpoint_base = "tracks"
+    _route = "company/companies/{id}/tracks"
 
-        self.count = self._register_child_endpoint(CompanyCompaniesIdTracksCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesIdTracksIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesIdTracksIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdTracksIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesIdTracksIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesIdTracksIdEndpoint: The initialized CompanyCompaniesIdTracksIdEndpoint object.
+            CompanyCompaniesIdTracksIdEndpoint: The CompanyCompaniesIdTracksIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesIdTracksIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ContactTrack]:
         """
         Performs a GET request against the /company/companies/{id}/tracks endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ContactTrack]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ContactTrack,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ContactTrack, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ContactTrack]:
         """
@@ -59,7 +55,7 @@ class CompanyCompaniesIdTracksEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ContactTrack]: The parsed response data.
         """
-        return self._parse_many(ContactTrack, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactTrack, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ContactTrack:
         """
@@ -71,4 +67,8 @@ class CompanyCompaniesIdTracksEndpoint(ConnectWiseEndpoint):
         Returns:
             ContactTrack: The parsed response data.
         """
-        return self._parse_one(ContactTrack, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactTrack, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyCompaniesIdTracksCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesIdTracksCountEndpoint")
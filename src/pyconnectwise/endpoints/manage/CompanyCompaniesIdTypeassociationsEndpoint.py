@@ -1,56 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsCountEndpoint import \
-    CompanyCompaniesIdTypeassociationsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsIdEndpoint import \
-    CompanyCompaniesIdTypeassociationsIdEndpoint
 from pyconnectwise.models.manage import CompanyCompanyTypeAssociationCompanyTypeAssociation
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsCountEndpoint import \
+        CompanyCompaniesIdTypeassociationsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsIdEndpoint import \
+        CompanyCompaniesIdTypeassociationsIdEndpoint
+
 
 class CompanyCompaniesIdTypeassociationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "typeAssociations", parent_endpoint=parent_endpoint)
+    endpoint_base = "typeAssociations"
+    _route = "company/companies/{id}/typeAssociations"
 
-        self.count = self._register_child_endpoint(
-            CompanyCompaniesIdTypeassociationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesIdTypeassociationsIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesIdTypeassociationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdTypeassociationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesIdTypeassociationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesIdTypeassociationsIdEndpoint: The initialized CompanyCompaniesIdTypeassociationsIdEndpoint object.
+            CompanyCompaniesIdTypeassociationsIdEndpoint: The CompanyCompaniesIdTypeassociationsIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesIdTypeassociationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CompanyCompanyTypeAssociationCompanyTypeAssociation]:
         """
         Performs a GET request against the /company/companies/{id}/typeAssociations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyCompanyTypeAssociationCompanyTypeAssociation]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyCompanyTypeAssociationCompanyTypeAssociation,
-            self,
-            page,
-            page_size,
+        return super()._paginated(
+            CompanyCompanyTypeAssociationCompanyTypeAssociation, page, page_size, params, forward_only
         )
 
     def get(
@@ -67,7 +62,7 @@ class CompanyCompaniesIdTypeassociationsEndpoint(ConnectWiseEndpoint):
         """
         return self._parse_many(
             CompanyCompanyTypeAssociationCompanyTypeAssociation,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -84,5 +79,11 @@ class CompanyCompaniesIdTypeassociationsEndpoint(ConnectWiseEndpoint):
         """
         return self._parse_one(
             CompanyCompanyTypeAssociationCompanyTypeAssociation,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> "CompanyCompaniesIdTypeassociationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyCompaniesIdTypeassociationsCountEndpoint"
         )
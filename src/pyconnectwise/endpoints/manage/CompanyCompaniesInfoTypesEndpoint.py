@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesInfoTypesCountEndpoint import CompanyCompaniesInfoTypesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesInfoTypesIdEndpoint import CompanyCompaniesInfoTypesIdEndpoint
 from pyconnectwise.models.manage import CompanyTypeInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesInfoTypesCountEndpoint import \
+        CompanyCompaniesInfoTypesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesInfoTypesIdEndpoint import CompanyCompaniesInfoTypesIdEndpoint
+
 
 class CompanyCompaniesInfoTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "company/companies/info/types"
 
-        self.count = self._register_child_endpoint(CompanyCompaniesInfoTypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesInfoTypesIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesInfoTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesInfoTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesInfoTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesInfoTypesIdEndpoint: The initialized CompanyCompaniesInfoTypesIdEndpoint object.
+            CompanyCompaniesInfoTypesIdEndpoint: The CompanyCompaniesInfoTypesIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesInfoTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesInfoTypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CompanyTypeInfo]:
         """
         Performs a GET request against the /company/companies/info/types endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyTypeInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyTypeInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanyTypeInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyTypeInfo]:
         """
@@ -59,4 +55,8 @@ class CompanyCompaniesInfoTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CompanyTypeInfo]: The parsed response data.
         """
-        return self._parse_many(CompanyTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyCompaniesInfoTypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesInfoTypesCountEndpoint")
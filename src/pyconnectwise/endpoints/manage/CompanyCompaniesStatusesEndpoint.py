@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesStatusesCountEndpoint import CompanyCompaniesStatusesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesStatusesIdEndpoint import CompanyCompaniesStatusesIdEndpoint
 from pyconnectwise.models.manage import CompanyStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompaniesStatusesCountEndpoint import \
+        CompanyCompaniesStatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesStatusesIdEndpoint import CompanyCompaniesStatusesIdEndpoint
+
 
 class CompanyCompaniesStatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "statuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "statuses"
+    _route = "company/companies/statuses"
 
-        self.count = self._register_child_endpoint(CompanyCompaniesStatusesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompaniesStatusesIdEndpoint:
+    def id(self, id: int) -> "CompanyCompaniesStatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompaniesStatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompaniesStatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompaniesStatusesIdEndpoint: The initialized CompanyCompaniesStatusesIdEndpoint object.
+            CompanyCompaniesStatusesIdEndpoint: The CompanyCompaniesStatusesIdEndpoint view bound to the ID.
         """
-        child = CompanyCompaniesStatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompaniesStatusesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CompanyStatus]:
         """
         Performs a GET request against the /company/companies/statuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanyStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyStatus]:
         """
@@ -59,7 +55,7 @@ class CompanyCompaniesStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CompanyStatus]: The parsed response data.
         """
-        return self._parse_many(CompanyStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyStatus:
         """
@@ -71,4 +67,8 @@ class CompanyCompaniesStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanyStatus: The parsed response data.
         """
-        return self._parse_one(CompanyStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyCompaniesStatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesStatusesCountEndpoint")
@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompanyfinanceIdEndpoint import CompanyCompanyfinanceIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompanyfinanceIdEndpoint import CompanyCompanyfinanceIdEndpoint
+
 
 class CompanyCompanyfinanceEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "companyFinance"
+    _route = "company/companyFinance"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "companyFinance", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompanyfinanceIdEndpoint:
+    def id(self, id: int) -> "CompanyCompanyfinanceIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompanyfinanceIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompanyfinanceIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompanyfinanceIdEndpoint: The initialized CompanyCompanyfinanceIdEndpoint object.
+            CompanyCompanyfinanceIdEndpoint: The CompanyCompanyfinanceIdEndpoint view bound to the ID.
         """
-        child = CompanyCompanyfinanceIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompanyfinanceIdEndpoint", id)
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import CompanyFinance
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class CompanyCompanyfinanceIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/companyFinance/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyFinance:
         """
@@ -19,4 +23,4 @@ class CompanyCompanyfinanceIdEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanyFinance: The parsed response data.
         """
-        return self._parse_one(CompanyFinance, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CompanyFinance, super()._make_request("PUT", data=data, params=params).content)
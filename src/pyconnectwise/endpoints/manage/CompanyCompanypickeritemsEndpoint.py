@@ -1,55 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompanypickeritemsClearEndpoint import CompanyCompanypickeritemsClearEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompanypickeritemsCountEndpoint import CompanyCompanypickeritemsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompanypickeritemsIdEndpoint import CompanyCompanypickeritemsIdEndpoint
 from pyconnectwise.models.manage import CompanyPickerItem
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCompanypickeritemsClearEndpoint import \
+        CompanyCompanypickeritemsClearEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompanypickeritemsCountEndpoint import \
+        CompanyCompanypickeritemsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompanypickeritemsIdEndpoint import CompanyCompanypickeritemsIdEndpoint
+
 
 class CompanyCompanypickeritemsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "companyPickerItems", parent_endpoint=parent_endpoint)
+    endpoint_base = "companyPickerItems"
+    _route = "company/companyPickerItems"
 
-        self.clear = self._register_child_endpoint(CompanyCompanypickeritemsClearEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyCompanypickeritemsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCompanypickeritemsIdEndpoint:
+    def id(self, id: int) -> "CompanyCompanypickeritemsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCompanypickeritemsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCompanypickeritemsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCompanypickeritemsIdEndpoint: The initialized CompanyCompanypickeritemsIdEndpoint object.
+            CompanyCompanypickeritemsIdEndpoint: The CompanyCompanypickeritemsIdEndpoint view bound to the ID.
         """
-        child = CompanyCompanypickeritemsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCompanypickeritemsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CompanyPickerItem]:
         """
         Performs a GET request against the /company/companyPickerItems endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyPickerItem]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyPickerItem,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanyPickerItem, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyPickerItem]:
         """
@@ -61,7 +57,7 @@ class CompanyCompanypickeritemsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CompanyPickerItem]: The parsed response data.
         """
-        return self._parse_many(CompanyPickerItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyPickerItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyPickerItem:
         """
@@ -73,4 +69,12 @@ class CompanyCompanypickeritemsEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanyPickerItem: The parsed response data.
         """
-        return self._parse_one(CompanyPickerItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyPickerItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def clear(self) -> "CompanyCompanypickeritemsClearEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompanypickeritemsClearEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyCompanypickeritemsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompanypickeritemsCountEndpoint")
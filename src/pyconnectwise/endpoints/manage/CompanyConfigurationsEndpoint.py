@@ -1,61 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsBulkEndpoint import CompanyConfigurationsBulkEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsCountEndpoint import CompanyConfigurationsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsIdEndpoint import CompanyConfigurationsIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesEndpoint import CompanyConfigurationsStatusesEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesEndpoint import CompanyConfigurationsTypesEndpoint
 from pyconnectwise.models.manage import CompanyConfiguration
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsBulkEndpoint import CompanyConfigurationsBulkEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsCountEndpoint import CompanyConfigurationsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsIdEndpoint import CompanyConfigurationsIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesEndpoint import \
+        CompanyConfigurationsStatusesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesEndpoint import CompanyConfigurationsTypesEndpoint
+
 
 class CompanyConfigurationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "configurations", parent_endpoint=parent_endpoint)
+    endpoint_base = "configurations"
+    _route = "company/configurations"
 
-        self.bulk = self._register_child_endpoint(CompanyConfigurationsBulkEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(CompanyConfigurationsTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyConfigurationsCountEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(
-            CompanyConfigurationsStatusesEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyConfigurationsIdEndpoint:
+    def id(self, id: int) -> "CompanyConfigurationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyConfigurationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyConfigurationsIdEndpoint: The initialized CompanyConfigurationsIdEndpoint object.
+            CompanyConfigurationsIdEndpoint: The CompanyConfigurationsIdEndpoint view bound to the ID.
         """
-        child = CompanyConfigurationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyConfigurationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CompanyConfiguration]:
         """
         Performs a GET request against the /company/configurations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyConfiguration]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyConfiguration,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanyConfiguration, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyConfiguration]:
         """
@@ -67,7 +58,7 @@ class CompanyConfigurationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CompanyConfiguration]: The parsed response data.
         """
-        return self._parse_many(CompanyConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyConfiguration:
         """
@@ -79,4 +70,20 @@ class CompanyConfigurationsEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanyConfiguration: The parsed response data.
         """
-        return self._parse_one(CompanyConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyConfiguration, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def bulk(self) -> "CompanyConfigurationsBulkEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsBulkEndpoint")
+
+    @cached_property
+    def types(self) -> "CompanyConfigurationsTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyConfigurationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsCountEndpoint")
+
+    @cached_property
+    def statuses(self) -> "CompanyConfigurationsStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesEndpoint")
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import CompanyConfiguration
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class CompanyConfigurationsIdChangetypeEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "changeType"
+    _route = "company/configurations/{id}/changeType"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "changeType", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyConfiguration:
         """
@@ -19,4 +23,4 @@ class CompanyConfigurationsIdChangetypeEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanyConfiguration: The parsed response data.
         """
-        return self._parse_one(CompanyConfiguration, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CompanyConfiguration, super()._make_request("PATCH", data=data, params=params).content)
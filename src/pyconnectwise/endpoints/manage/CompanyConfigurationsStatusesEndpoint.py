@@ -1,62 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesCountEndpoint import \
-    CompanyConfigurationsStatusesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesIdEndpoint import \
-    CompanyConfigurationsStatusesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesInfoEndpoint import \
-    CompanyConfigurationsStatusesInfoEndpoint
 from pyconnectwise.models.manage import ConfigurationStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesCountEndpoint import \
+        CompanyConfigurationsStatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesIdEndpoint import \
+        CompanyConfigurationsStatusesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesInfoEndpoint import \
+        CompanyConfigurationsStatusesInfoEndpoint
+
 
 class CompanyConfigurationsStatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "statuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "statuses"
+    _route = "company/configurations/statuses"
 
-        self.info = self._register_child_endpoint(
-            CompanyConfigurationsStatusesInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            CompanyConfigurationsStatusesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyConfigurationsStatusesIdEndpoint:
+    def id(self, id: int) -> "CompanyConfigurationsStatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsStatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyConfigurationsStatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyConfigurationsStatusesIdEndpoint: The initialized CompanyConfigurationsStatusesIdEndpoint object.
+            CompanyConfigurationsStatusesIdEndpoint: The CompanyConfigurationsStatusesIdEndpoint view bound to the ID.
         """
-        child = CompanyConfigurationsStatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ConfigurationStatus]:
         """
         Performs a GET request against the /company/configurations/statuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ConfigurationStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ConfigurationStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ConfigurationStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ConfigurationStatus]:
         """
@@ -68,7 +58,7 @@ class CompanyConfigurationsStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ConfigurationStatus]: The parsed response data.
         """
-        return self._parse_many(ConfigurationStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConfigurationStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ConfigurationStatus:
         """
@@ -80,4 +70,12 @@ class CompanyConfigurationsStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             ConfigurationStatus: The parsed response data.
         """
-        return self._parse_one(ConfigurationStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ConfigurationStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyConfigurationsStatusesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyConfigurationsStatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsStatusesCountEndpoint")
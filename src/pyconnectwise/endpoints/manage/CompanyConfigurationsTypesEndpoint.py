@@ -1,58 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesCopyEndpoint import CompanyConfigurationsTypesCopyEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesCountEndpoint import \
-    CompanyConfigurationsTypesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdEndpoint import CompanyConfigurationsTypesIdEndpoint
 from pyconnectwise.models.manage import ConfigurationType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesCopyEndpoint import \
+        CompanyConfigurationsTypesCopyEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesCountEndpoint import \
+        CompanyConfigurationsTypesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdEndpoint import CompanyConfigurationsTypesIdEndpoint
+
 
 class CompanyConfigurationsTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "company/configurations/types"
 
-        self.copy = self._register_child_endpoint(CompanyConfigurationsTypesCopyEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(
-            CompanyConfigurationsTypesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyConfigurationsTypesIdEndpoint:
+    def id(self, id: int) -> "CompanyConfigurationsTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyConfigurationsTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyConfigurationsTypesIdEndpoint: The initialized CompanyConfigurationsTypesIdEndpoint object.
+            CompanyConfigurationsTypesIdEndpoint: The CompanyConfigurationsTypesIdEndpoint view bound to the ID.
         """
-        child = CompanyConfigurationsTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ConfigurationType]:
         """
         Performs a GET request against the /company/configurations/types endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ConfigurationType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ConfigurationType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ConfigurationType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ConfigurationType]:
         """
@@ -64,7 +57,7 @@ class CompanyConfigurationsTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ConfigurationType]: The parsed response data.
         """
-        return self._parse_many(ConfigurationType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConfigurationType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ConfigurationType:
         """
@@ -76,4 +69,12 @@ class CompanyConfigurationsTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             ConfigurationType: The parsed response data.
         """
-        return self._parse_one(ConfigurationType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ConfigurationType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> "CompanyConfigurationsTypesCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsTypesCopyEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyConfigurationsTypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsTypesCountEndpoint")
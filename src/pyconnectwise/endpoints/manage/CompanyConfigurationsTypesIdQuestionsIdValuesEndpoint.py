@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint import \
-    CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint import \
-    CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint
 from pyconnectwise.models.manage import ConfigurationTypeQuestionValue
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint import \
+        CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint import \
+        CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint
+
 
 class CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "values", parent_endpoint=parent_endpoint)
+    endpoint_base = "values"
+    _route = "company/configurations/types/{id}/questions/{id}/values"
 
-        self.count = self._register_child_endpoint(
-            CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint:
+    def id(self, id: int) -> "CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint: The initialized CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint object.
+            CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint: The CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint view bound to the ID.
         """
-        child = CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ConfigurationTypeQuestionValue]:
         """
         Performs a GET request against the /company/configurations/types/{id}/questions/{id}/values endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ConfigurationTypeQuestionValue]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ConfigurationTypeQuestionValue,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ConfigurationTypeQuestionValue, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ConfigurationTypeQuestionValue]:
         """
@@ -64,7 +59,7 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(ConnectWiseEndpoint)
             list[ConfigurationTypeQuestionValue]: The parsed response data.
         """
         return self._parse_many(
-            ConfigurationTypeQuestionValue, super()._make_request("GET", data=data, params=params).json()
+            ConfigurationTypeQuestionValue, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ConfigurationTypeQuestionValue:
@@ -78,5 +73,11 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(ConnectWiseEndpoint)
             ConfigurationTypeQuestionValue: The parsed response data.
         """
         return self._parse_one(
-            ConfigurationTypeQuestionValue, super()._make_request("POST", data=data, params=params).json()
+            ConfigurationTypeQuestionValue, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint"
         )
@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactTypesEndpoint import CompanyContactTypesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactTypesEndpoint import CompanyContactTypesEndpoint
+
 
 class CompanyContactEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "contact"
+    _route = "company/contact"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "contact", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.types = self._register_child_endpoint(CompanyContactTypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def types(self) -> "CompanyContactTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactTypesEndpoint")
@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactTypesIdEndpoint import CompanyContactTypesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactTypesIdEndpoint import CompanyContactTypesIdEndpoint
+
 
 class CompanyContactTypesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "types"
+    _route = "company/contact/types"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactTypesIdEndpoint:
+    def id(self, id: int) -> "CompanyContactTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactTypesIdEndpoint: The initialized CompanyContactTypesIdEndpoint object.
+            CompanyContactTypesIdEndpoint: The CompanyContactTypesIdEndpoint view bound to the ID.
         """
-        child = CompanyContactTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactTypesIdEndpoint", id)
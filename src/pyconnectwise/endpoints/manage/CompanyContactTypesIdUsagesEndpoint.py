@@ -1,13 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactTypesIdUsagesListEndpoint import \
-    CompanyContactTypesIdUsagesListEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactTypesIdUsagesListEndpoint import \
+        CompanyContactTypesIdUsagesListEndpoint
+
 
 class CompanyContactTypesIdUsagesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "usages"
+    _route = "company/contact/types/{id}/usages"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "usages", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.list = self._register_child_endpoint(CompanyContactTypesIdUsagesListEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def list(self) -> "CompanyContactTypesIdUsagesListEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactTypesIdUsagesListEndpoint")
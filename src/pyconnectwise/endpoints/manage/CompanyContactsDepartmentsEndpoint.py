@@ -1,58 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsDepartmentsCountEndpoint import \
-    CompanyContactsDepartmentsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsDepartmentsIdEndpoint import CompanyContactsDepartmentsIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsDepartmentsInfoEndpoint import CompanyContactsDepartmentsInfoEndpoint
 from pyconnectwise.models.manage import ContactDepartment
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsDepartmentsCountEndpoint import \
+        CompanyContactsDepartmentsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsDepartmentsIdEndpoint import CompanyContactsDepartmentsIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsDepartmentsInfoEndpoint import \
+        CompanyContactsDepartmentsInfoEndpoint
+
 
 class CompanyContactsDepartmentsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "departments", parent_endpoint=parent_endpoint)
+    endpoint_base = "departments"
+    _route = "company/contacts/departments"
 
-        self.info = self._register_child_endpoint(CompanyContactsDepartmentsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(
-            CompanyContactsDepartmentsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsDepartmentsIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsDepartmentsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsDepartmentsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsDepartmentsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsDepartmentsIdEndpoint: The initialized CompanyContactsDepartmentsIdEndpoint object.
+            CompanyContactsDepartmentsIdEndpoint: The CompanyContactsDepartmentsIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsDepartmentsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsDepartmentsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ContactDepartment]:
         """
         Performs a GET request against the /company/contacts/departments endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ContactDepartment]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ContactDepartment,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ContactDepartment, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ContactDepartment]:
         """
@@ -64,7 +57,7 @@ class CompanyContactsDepartmentsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ContactDepartment]: The parsed response data.
         """
-        return self._parse_many(ContactDepartment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactDepartment, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ContactDepartment:
         """
@@ -76,4 +69,12 @@ class CompanyContactsDepartmentsEndpoint(ConnectWiseEndpoint):
         Returns:
             ContactDepartment: The parsed response data.
         """
-        return self._parse_one(ContactDepartment, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactDepartment, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyContactsDepartmentsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsDepartmentsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyContactsDepartmentsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsDepartmentsCountEndpoint")
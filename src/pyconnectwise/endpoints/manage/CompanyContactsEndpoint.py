@@ -1,72 +1,56 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsCountEndpoint import CompanyContactsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsDefaultEndpoint import CompanyContactsDefaultEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsDepartmentsEndpoint import CompanyContactsDepartmentsEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdEndpoint import CompanyContactsIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsRelationshipsEndpoint import CompanyContactsRelationshipsEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsRequestpasswordEndpoint import CompanyContactsRequestpasswordEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsTypesEndpoint import CompanyContactsTypesEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsValidateportalcredentialsEndpoint import \
-    CompanyContactsValidateportalcredentialsEndpoint
 from pyconnectwise.models.manage import Contact
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsCountEndpoint import CompanyContactsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsDefaultEndpoint import CompanyContactsDefaultEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsDepartmentsEndpoint import CompanyContactsDepartmentsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdEndpoint import CompanyContactsIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsRelationshipsEndpoint import CompanyContactsRelationshipsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsRequestpasswordEndpoint import \
+        CompanyContactsRequestpasswordEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsTypesEndpoint import CompanyContactsTypesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsValidateportalcredentialsEndpoint import \
+        CompanyContactsValidateportalcredentialsEndpoint
+
 
 class CompanyContactsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "contacts", parent_endpoint=parent_endpoint)
+    endpoint_base = "contacts"
+    _route = "company/contacts"
 
-        self.request_password = self._register_child_endpoint(
-            CompanyContactsRequestpasswordEndpoint(client, parent_endpoint=self)
-        )
-        self.relationships = self._register_child_endpoint(
-            CompanyContactsRelationshipsEndpoint(client, parent_endpoint=self)
-        )
-        self.types = self._register_child_endpoint(CompanyContactsTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyContactsCountEndpoint(client, parent_endpoint=self))
-        self.departments = self._register_child_endpoint(
-            CompanyContactsDepartmentsEndpoint(client, parent_endpoint=self)
-        )
-        self.validate_portal_credentials = self._register_child_endpoint(
-            CompanyContactsValidateportalcredentialsEndpoint(client, parent_endpoint=self)
-        )
-        self.default = self._register_child_endpoint(CompanyContactsDefaultEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsIdEndpoint: The initialized CompanyContactsIdEndpoint object.
+            CompanyContactsIdEndpoint: The CompanyContactsIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Contact]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Contact]:
         """
         Performs a GET request against the /company/contacts endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Contact]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Contact,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Contact, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Contact]:
         """
@@ -78,7 +62,7 @@ class CompanyContactsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Contact]: The parsed response data.
         """
-        return self._parse_many(Contact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Contact, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Contact:
         """
@@ -90,4 +74,34 @@ class CompanyContactsEndpoint(ConnectWiseEndpoint):
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def request_password(self) -> "CompanyContactsRequestpasswordEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsRequestpasswordEndpoint")
+
+    @cached_property
+    def relationships(self) -> "CompanyContactsRelationshipsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsRelationshipsEndpoint")
+
+    @cached_property
+    def types(self) -> "CompanyContactsTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyContactsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsCountEndpoint")
+
+    @cached_property
+    def departments(self) -> "CompanyContactsDepartmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsDepartmentsEndpoint")
+
+    @cached_property
+    def validate_portal_credentials(self) -> "CompanyContactsValidateportalcredentialsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyContactsValidateportalcredentialsEndpoint"
+        )
+
+    @cached_property
+    def default(self) -> "CompanyContactsDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsDefaultEndpoint")
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsCountEndpoint import \
-    CompanyContactsIdCommunicationsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsIdEndpoint import \
-    CompanyContactsIdCommunicationsIdEndpoint
 from pyconnectwise.models.manage import ContactCommunication
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsCountEndpoint import \
+        CompanyContactsIdCommunicationsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsIdEndpoint import \
+        CompanyContactsIdCommunicationsIdEndpoint
+
 
 class CompanyContactsIdCommunicationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "communications", parent_endpoint=parent_endpoint)
+    endpoint_base = "communications"
+    _route = "company/contacts/{id}/communications"
 
-        self.count = self._register_child_endpoint(
-            CompanyContactsIdCommunicationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsIdCommunicationsIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsIdCommunicationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsIdCommunicationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsIdCommunicationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsIdCommunicationsIdEndpoint: The initialized CompanyContactsIdCommunicationsIdEndpoint object.
+            CompanyContactsIdCommunicationsIdEndpoint: The CompanyContactsIdCommunicationsIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsIdCommunicationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ContactCommunication]:
         """
         Performs a GET request against the /company/contacts/{id}/communications endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ContactCommunication]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ContactCommunication,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ContactCommunication, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ContactCommunication]:
         """
@@ -63,7 +56,7 @@ class CompanyContactsIdCommunicationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ContactCommunication]: The parsed response data.
         """
-        return self._parse_many(ContactCommunication, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactCommunication, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ContactCommunication:
         """
@@ -75,4 +68,10 @@ class CompanyContactsIdCommunicationsEndpoint(ConnectWiseEndpoint):
         Returns:
             ContactCommunication: The parsed response data.
         """
-        return self._parse_one(ContactCommunication, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactCommunication, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyContactsIdCommunicationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsCountEndpoint"
+        )
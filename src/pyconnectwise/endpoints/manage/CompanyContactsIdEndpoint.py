@@ -1,60 +1,46 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsEndpoint import \
-    CompanyContactsIdCommunicationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdGroupsEndpoint import CompanyContactsIdGroupsEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdImageEndpoint import CompanyContactsIdImageEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdNotesEndpoint import CompanyContactsIdNotesEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdPortalsecurityEndpoint import \
-    CompanyContactsIdPortalsecurityEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdTracksEndpoint import CompanyContactsIdTracksEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdTypeassociationsEndpoint import \
-    CompanyContactsIdTypeassociationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdUsagesEndpoint import CompanyContactsIdUsagesEndpoint
 from pyconnectwise.models.manage import Contact
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsEndpoint import \
+        CompanyContactsIdCommunicationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdGroupsEndpoint import CompanyContactsIdGroupsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdImageEndpoint import CompanyContactsIdImageEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdNotesEndpoint import CompanyContactsIdNotesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdPortalsecurityEndpoint import \
+        CompanyContactsIdPortalsecurityEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdTracksEndpoint import CompanyContactsIdTracksEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdTypeassociationsEndpoint import \
+        CompanyContactsIdTypeassociationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdUsagesEndpoint import CompanyContactsIdUsagesEndpoint
+
 
 class CompanyContactsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/contacts/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
-
-        self.communications = self._register_child_endpoint(
-            CompanyContactsIdCommunicationsEndpoint(client, parent_endpoint=self)
-        )
-        self.portal_security = self._register_child_endpoint(
-            CompanyContactsIdPortalsecurityEndpoint(client, parent_endpoint=self)
-        )
-        self.groups = self._register_child_endpoint(CompanyContactsIdGroupsEndpoint(client, parent_endpoint=self))
-        self.image = self._register_child_endpoint(CompanyContactsIdImageEndpoint(client, parent_endpoint=self))
-        self.type_associations = self._register_child_endpoint(
-            CompanyContactsIdTypeassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.notes = self._register_child_endpoint(CompanyContactsIdNotesEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(CompanyContactsIdUsagesEndpoint(client, parent_endpoint=self))
-        self.tracks = self._register_child_endpoint(CompanyContactsIdTracksEndpoint(client, parent_endpoint=self))
-
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Contact]:
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Contact]:
         """
         Performs a GET request against the /company/contacts/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Contact]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Contact,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Contact, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Contact:
         """
@@ -66,7 +52,7 @@ class CompanyContactsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -88,7 +74,7 @@ class CompanyContactsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Contact:
         """
@@ -100,4 +86,36 @@ class CompanyContactsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def communications(self) -> "CompanyContactsIdCommunicationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdCommunicationsEndpoint")
+
+    @cached_property
+    def portal_security(self) -> "CompanyContactsIdPortalsecurityEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdPortalsecurityEndpoint")
+
+    @cached_property
+    def groups(self) -> "CompanyContactsIdGroupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdGroupsEndpoint")
+
+    @cached_property
+    def image(self) -> "CompanyContactsIdImageEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdImageEndpoint")
+
+    @cached_property
+    def type_associations(self) -> "CompanyContactsIdTypeassociationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdTypeassociationsEndpoint")
+
+    @cached_property
+    def notes(self) -> "CompanyContactsIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdNotesEndpoint")
+
+    @cached_property
+    def usages(self) -> "CompanyContactsIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdUsagesEndpoint")
+
+    @cached_property
+    def tracks(self) -> "CompanyContactsIdTracksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdTracksEndpoint")
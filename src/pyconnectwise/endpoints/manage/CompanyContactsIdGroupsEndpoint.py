@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdGroupsCountEndpoint import CompanyContactsIdGroupsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdGroupsIdEndpoint import CompanyContactsIdGroupsIdEndpoint
 from pyconnectwise.models.manage import ContactGroup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsIdGroupsCountEndpoint import CompanyContactsIdGroupsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdGroupsIdEndpoint import CompanyContactsIdGroupsIdEndpoint
+
 
 class CompanyContactsIdGroupsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "groups", parent_endpoint=parent_endpoint)
+    endpoint_base = "groups"
+    _route = "company/contacts/{id}/groups"
 
-        self.count = self._register_child_endpoint(CompanyContactsIdGroupsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsIdGroupsIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsIdGroupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsIdGroupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsIdGroupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsIdGroupsIdEndpoint: The initialized CompanyContactsIdGroupsIdEndpoint object.
+            CompanyContactsIdGroupsIdEndpoint: The CompanyContactsIdGroupsIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsIdGroupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsIdGroupsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ContactGroup]:
         """
         Performs a GET request against the /company/contacts/{id}/groups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ContactGroup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ContactGroup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ContactGroup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ContactGroup]:
         """
@@ -59,7 +54,7 @@ class CompanyContactsIdGroupsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ContactGroup]: The parsed response data.
         """
-        return self._parse_many(ContactGroup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactGroup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ContactGroup:
         """
@@ -71,4 +66,8 @@ class CompanyContactsIdGroupsEndpoint(ConnectWiseEndpoint):
         Returns:
             ContactGroup: The parsed response data.
         """
-        return self._parse_one(ContactGroup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactGroup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyContactsIdGroupsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdGroupsCountEndpoint")
@@ -1,12 +1,16 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class CompanyContactsIdImageEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "image"
+    _route = "company/contacts/{id}/image"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "image", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdNotesCountEndpoint import CompanyContactsIdNotesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsIdNotesIdEndpoint import CompanyContactsIdNotesIdEndpoint
 from pyconnectwise.models.manage import ContactNote
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsIdNotesCountEndpoint import CompanyContactsIdNotesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsIdNotesIdEndpoint import CompanyContactsIdNotesIdEndpoint
+
 
 class CompanyContactsIdNotesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "notes", parent_endpoint=parent_endpoint)
+    endpoint_base = "notes"
+    _route = "company/contacts/{id}/notes"
 
-        self.count = self._register_child_endpoint(CompanyContactsIdNotesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsIdNotesIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsIdNotesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsIdNotesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsIdNotesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsIdNotesIdEndpoint: The initialized CompanyContactsIdNotesIdEndpoint object.
+            CompanyContactsIdNotesIdEndpoint: The CompanyContactsIdNotesIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsIdNotesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsIdNotesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ContactNote]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ContactNote]:
         """
         Performs a GET request against the /company/contacts/{id}/notes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ContactNote]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ContactNote,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ContactNote, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ContactNote]:
         """
@@ -57,7 +54,7 @@ class CompanyContactsIdNotesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ContactNote]: The parsed response data.
         """
-        return self._parse_many(ContactNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ContactNote:
         """
@@ -69,4 +66,8 @@ class CompanyContactsIdNotesEndpoint(ConnectWiseEndpoint):
         Returns:
             ContactNote: The parsed response data.
         """
-        return self._parse_one(ContactNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyContactsIdNotesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsIdNotesCountEndpoint")
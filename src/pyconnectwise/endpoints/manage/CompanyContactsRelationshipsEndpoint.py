@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsRelationshipsCountEndpoint import \
-    CompanyContactsRelationshipsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsRelationshipsIdEndpoint import CompanyContactsRelationshipsIdEndpoint
 from pyconnectwise.models.manage import ContactRelationship
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsRelationshipsCountEndpoint import \
+        CompanyContactsRelationshipsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsRelationshipsIdEndpoint import \
+        CompanyContactsRelationshipsIdEndpoint
+
 
 class CompanyContactsRelationshipsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "relationships", parent_endpoint=parent_endpoint)
+    endpoint_base = "relationships"
+    _route = "company/contacts/relationships"
 
-        self.count = self._register_child_endpoint(
-            CompanyContactsRelationshipsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsRelationshipsIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsRelationshipsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsRelationshipsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsRelationshipsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsRelationshipsIdEndpoint: The initialized CompanyContactsRelationshipsIdEndpoint object.
+            CompanyContactsRelationshipsIdEndpoint: The CompanyContactsRelationshipsIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsRelationshipsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsRelationshipsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ContactRelationship]:
         """
         Performs a GET request against the /company/contacts/relationships endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ContactRelationship]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ContactRelationship,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ContactRelationship, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ContactRelationship]:
         """
@@ -62,7 +56,7 @@ class CompanyContactsRelationshipsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ContactRelationship]: The parsed response data.
         """
-        return self._parse_many(ContactRelationship, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactRelationship, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ContactRelationship:
         """
@@ -74,4 +68,8 @@ class CompanyContactsRelationshipsEndpoint(ConnectWiseEndpoint):
         Returns:
             ContactRelationship: The parsed response data.
         """
-        return self._parse_one(ContactRelationship, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactRelationship, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyContactsRelationshipsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsRelationshipsCountEndpoint")
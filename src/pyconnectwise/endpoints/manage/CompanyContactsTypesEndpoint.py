@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsTypesCountEndpoint import CompanyContactsTypesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsTypesIdEndpoint import CompanyContactsTypesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsTypesInfoEndpoint import CompanyContactsTypesInfoEndpoint
 from pyconnectwise.models.manage import ContactType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsTypesCountEndpoint import CompanyContactsTypesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsTypesIdEndpoint import CompanyContactsTypesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsTypesInfoEndpoint import CompanyContactsTypesInfoEndpoint
+
 
 class CompanyContactsTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "company/contacts/types"
 
-        self.info = self._register_child_endpoint(CompanyContactsTypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyContactsTypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsTypesIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsTypesIdEndpoint: The initialized CompanyContactsTypesIdEndpoint object.
+            CompanyContactsTypesIdEndpoint: The CompanyContactsTypesIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsTypesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ContactType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ContactType]:
         """
         Performs a GET request against the /company/contacts/types endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ContactType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ContactType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ContactType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ContactType]:
         """
@@ -59,7 +55,7 @@ class CompanyContactsTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ContactType]: The parsed response data.
         """
-        return self._parse_many(ContactType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ContactType:
         """
@@ -71,4 +67,12 @@ class CompanyContactsTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             ContactType: The parsed response data.
         """
-        return self._parse_one(ContactType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyContactsTypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsTypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyContactsTypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsTypesCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsyncCompanyCountEndpoint import CompanyContactsyncCompanyCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsyncCompanyIdEndpoint import CompanyContactsyncCompanyIdEndpoint
 from pyconnectwise.models.manage import M365ContactSyncCompany
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsyncCompanyCountEndpoint import \
+        CompanyContactsyncCompanyCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsyncCompanyIdEndpoint import CompanyContactsyncCompanyIdEndpoint
+
 
 class CompanyContactsyncCompanyEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "company", parent_endpoint=parent_endpoint)
+    endpoint_base = "company"
+    _route = "company/contactsync/company"
 
-        self.count = self._register_child_endpoint(CompanyContactsyncCompanyCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsyncCompanyIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsyncCompanyIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsyncCompanyIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsyncCompanyIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsyncCompanyIdEndpoint: The initialized CompanyContactsyncCompanyIdEndpoint object.
+            CompanyContactsyncCompanyIdEndpoint: The CompanyContactsyncCompanyIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsyncCompanyIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsyncCompanyIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[M365ContactSyncCompany]:
         """
         Performs a GET request against the /company/contactsync/company endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[M365ContactSyncCompany]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            M365ContactSyncCompany,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(M365ContactSyncCompany, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[M365ContactSyncCompany]:
         """
@@ -59,7 +55,7 @@ class CompanyContactsyncCompanyEndpoint(ConnectWiseEndpoint):
         Returns:
             list[M365ContactSyncCompany]: The parsed response data.
         """
-        return self._parse_many(M365ContactSyncCompany, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(M365ContactSyncCompany, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -70,3 +66,7 @@ class CompanyContactsyncCompanyEndpoint(ConnectWiseEndpoint):
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def count(self) -> "CompanyContactsyncCompanyCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsyncCompanyCountEndpoint")
@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsyncCompanysyncIdEndpoint import \
-    CompanyContactsyncCompanysyncIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsyncCompanysyncIdEndpoint import \
+        CompanyContactsyncCompanysyncIdEndpoint
+
 
 class CompanyContactsyncCompanysyncEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "companysync"
+    _route = "company/contactsync/companysync"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "companysync", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContactsyncCompanysyncIdEndpoint:
+    def id(self, id: int) -> "CompanyContactsyncCompanysyncIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContactsyncCompanysyncIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContactsyncCompanysyncIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContactsyncCompanysyncIdEndpoint: The initialized CompanyContactsyncCompanysyncIdEndpoint object.
+            CompanyContactsyncCompanysyncIdEndpoint: The CompanyContactsyncCompanysyncIdEndpoint view bound to the ID.
         """
-        child = CompanyContactsyncCompanysyncIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContactsyncCompanysyncIdEndpoint", id)
@@ -1,16 +1,26 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsyncCompanyEndpoint import CompanyContactsyncCompanyEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsyncCompanysyncEndpoint import CompanyContactsyncCompanysyncEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContactsyncCompanyEndpoint import CompanyContactsyncCompanyEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsyncCompanysyncEndpoint import \
+        CompanyContactsyncCompanysyncEndpoint
+
 
 class CompanyContactsyncEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "contactsync"
+    _route = "company/contactsync"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "contactsync", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def companysync(self) -> "CompanyContactsyncCompanysyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsyncCompanysyncEndpoint")
 
-        self.companysync = self._register_child_endpoint(
-            CompanyContactsyncCompanysyncEndpoint(client, parent_endpoint=self)
-        )
-        self.company = self._register_child_endpoint(CompanyContactsyncCompanyEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def company(self) -> "CompanyContactsyncCompanyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsyncCompanyEndpoint")
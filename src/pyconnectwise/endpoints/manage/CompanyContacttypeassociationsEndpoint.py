@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyContacttypeassociationsCountEndpoint import \
-    CompanyContacttypeassociationsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyContacttypeassociationsIdEndpoint import \
-    CompanyContacttypeassociationsIdEndpoint
 from pyconnectwise.models.manage import CompanyContactTypeAssociation
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyContacttypeassociationsCountEndpoint import \
+        CompanyContacttypeassociationsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContacttypeassociationsIdEndpoint import \
+        CompanyContacttypeassociationsIdEndpoint
+
 
 class CompanyContacttypeassociationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "contactTypeAssociations", parent_endpoint=parent_endpoint)
+    endpoint_base = "contactTypeAssociations"
+    _route = "company/contactTypeAssociations"
 
-        self.count = self._register_child_endpoint(
-            CompanyContacttypeassociationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyContacttypeassociationsIdEndpoint:
+    def id(self, id: int) -> "CompanyContacttypeassociationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyContacttypeassociationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyContacttypeassociationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyContacttypeassociationsIdEndpoint: The initialized CompanyContacttypeassociationsIdEndpoint object.
+            CompanyContacttypeassociationsIdEndpoint: The CompanyContacttypeassociationsIdEndpoint view bound to the ID.
         """
-        child = CompanyContacttypeassociationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyContacttypeassociationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CompanyContactTypeAssociation]:
         """
         Performs a GET request against the /company/contactTypeAssociations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyContactTypeAssociation]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyContactTypeAssociation,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanyContactTypeAssociation, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyContactTypeAssociation]:
         """
@@ -64,7 +57,7 @@ class CompanyContacttypeassociationsEndpoint(ConnectWiseEndpoint):
             list[CompanyContactTypeAssociation]: The parsed response data.
         """
         return self._parse_many(
-            CompanyContactTypeAssociation, super()._make_request("GET", data=data, params=params).json()
+            CompanyContactTypeAssociation, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyContactTypeAssociation:
@@ -78,5 +71,9 @@ class CompanyContacttypeassociationsEndpoint(ConnectWiseEndpoint):
             CompanyContactTypeAssociation: The parsed response data.
         """
         return self._parse_one(
-            CompanyContactTypeAssociation, super()._make_request("POST", data=data, params=params).json()
+            CompanyContactTypeAssociation, super()._make_request("POST", data=data, params=params).content
         )
+
+    @cached_property
+    def count(self) -> "CompanyContacttypeassociationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContacttypeassociationsCountEndpoint")
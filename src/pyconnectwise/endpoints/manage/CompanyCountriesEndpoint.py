@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyCountriesCountEndpoint import CompanyCountriesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyCountriesIdEndpoint import CompanyCountriesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyCountriesInfoEndpoint import CompanyCountriesInfoEndpoint
 from pyconnectwise.models.manage import Country
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyCountriesCountEndpoint import CompanyCountriesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCountriesIdEndpoint import CompanyCountriesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCountriesInfoEndpoint import CompanyCountriesInfoEndpoint
+
 
 class CompanyCountriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "countries", parent_endpoint=parent_endpoint)
+    endpoint_base = "countries"
+    _route = "company/countries"
 
-        self.info = self._register_child_endpoint(CompanyCountriesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyCountriesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyCountriesIdEndpoint:
+    def id(self, id: int) -> "CompanyCountriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyCountriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyCountriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyCountriesIdEndpoint: The initialized CompanyCountriesIdEndpoint object.
+            CompanyCountriesIdEndpoint: The CompanyCountriesIdEndpoint view bound to the ID.
         """
-        child = CompanyCountriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyCountriesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Country]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Country]:
         """
         Performs a GET request against the /company/countries endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Country]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Country,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Country, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Country]:
         """
@@ -59,7 +55,7 @@ class CompanyCountriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Country]: The parsed response data.
         """
-        return self._parse_many(Country, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Country, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Country:
         """
@@ -71,4 +67,12 @@ class CompanyCountriesEndpoint(ConnectWiseEndpoint):
         Returns:
             Country: The parsed response data.
         """
-        return self._parse_one(Country, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Country, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyCountriesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCountriesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyCountriesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCountriesCountEndpoint")
@@ -1,104 +1,178 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyAddressformatsEndpoint import CompanyAddressformatsEndpoint
-from pyconnectwise.endpoints.manage.CompanyBillingsetupsEndpoint import CompanyBillingsetupsEndpoint
-from pyconnectwise.endpoints.manage.CompanyCommunicationtypesEndpoint import CompanyCommunicationtypesEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompaniesEndpoint import CompanyCompaniesEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompanyfinanceEndpoint import CompanyCompanyfinanceEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompanypickeritemsEndpoint import CompanyCompanypickeritemsEndpoint
-from pyconnectwise.endpoints.manage.CompanyCompanytypeassociationsEndpoint import CompanyCompanytypeassociationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyConfigurationsEndpoint import CompanyConfigurationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactEndpoint import CompanyContactEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsEndpoint import CompanyContactsEndpoint
-from pyconnectwise.endpoints.manage.CompanyContactsyncEndpoint import CompanyContactsyncEndpoint
-from pyconnectwise.endpoints.manage.CompanyContacttypeassociationsEndpoint import CompanyContacttypeassociationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyCountriesEndpoint import CompanyCountriesEndpoint
-from pyconnectwise.endpoints.manage.CompanyEntitytypesEndpoint import CompanyEntitytypesEndpoint
-from pyconnectwise.endpoints.manage.CompanyExpensetypesEndpoint import CompanyExpensetypesEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactEndpoint import CompanyM365contactEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactsyncEndpoint import CompanyM365contactsyncEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsEndpoint import \
-    CompanyManageddevicesintegrationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementbackupsEndpoint import CompanyManagementbackupsEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementEndpoint import CompanyManagementEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementitsolutionsEndpoint import CompanyManagementitsolutionsEndpoint
-from pyconnectwise.endpoints.manage.CompanyMarketdescriptionsEndpoint import CompanyMarketdescriptionsEndpoint
-from pyconnectwise.endpoints.manage.CompanyNotetypesEndpoint import CompanyNotetypesEndpoint
-from pyconnectwise.endpoints.manage.CompanyOwnershiptypesEndpoint import CompanyOwnershiptypesEndpoint
-from pyconnectwise.endpoints.manage.CompanyPaymenttypesEndpoint import CompanyPaymenttypesEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsEndpoint import CompanyPortalconfigurationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsEndpoint import CompanyPortalsecuritylevelsEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalsecuritysettingsEndpoint import CompanyPortalsecuritysettingsEndpoint
-from pyconnectwise.endpoints.manage.CompanyStatesEndpoint import CompanyStatesEndpoint
-from pyconnectwise.endpoints.manage.CompanyTeamrolesEndpoint import CompanyTeamrolesEndpoint
-from pyconnectwise.endpoints.manage.CompanyTracksEndpoint import CompanyTracksEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyAddressformatsEndpoint import CompanyAddressformatsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyBillingsetupsEndpoint import CompanyBillingsetupsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCommunicationtypesEndpoint import CompanyCommunicationtypesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompaniesEndpoint import CompanyCompaniesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompanyfinanceEndpoint import CompanyCompanyfinanceEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompanypickeritemsEndpoint import CompanyCompanypickeritemsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCompanytypeassociationsEndpoint import \
+        CompanyCompanytypeassociationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyConfigurationsEndpoint import CompanyConfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactEndpoint import CompanyContactEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsEndpoint import CompanyContactsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContactsyncEndpoint import CompanyContactsyncEndpoint
+    from pyconnectwise.endpoints.manage.CompanyContacttypeassociationsEndpoint import \
+        CompanyContacttypeassociationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyCountriesEndpoint import CompanyCountriesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyEntitytypesEndpoint import CompanyEntitytypesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyExpensetypesEndpoint import CompanyExpensetypesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyM365contactEndpoint import CompanyM365contactEndpoint
+    from pyconnectwise.endpoints.manage.CompanyM365contactsyncEndpoint import CompanyM365contactsyncEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsEndpoint import \
+        CompanyManageddevicesintegrationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManagementbackupsEndpoint import CompanyManagementbackupsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManagementEndpoint import CompanyManagementEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManagementitsolutionsEndpoint import CompanyManagementitsolutionsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyMarketdescriptionsEndpoint import CompanyMarketdescriptionsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyNotetypesEndpoint import CompanyNotetypesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyOwnershiptypesEndpoint import CompanyOwnershiptypesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPaymenttypesEndpoint import CompanyPaymenttypesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsEndpoint import CompanyPortalconfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsEndpoint import CompanyPortalsecuritylevelsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalsecuritysettingsEndpoint import \
+        CompanyPortalsecuritysettingsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyStatesEndpoint import CompanyStatesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyTeamrolesEndpoint import CompanyTeamrolesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyTracksEndpoint import CompanyTracksEndpoint
+
 
 class CompanyEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "company"
+    _route = "company"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "company", parent_endpoint=parent_endpoint)
-
-        self.portal_configurations = self._register_child_endpoint(
-            CompanyPortalconfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.managed_devices_integrations = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsEndpoint(client, parent_endpoint=self)
-        )
-        self.team_roles = self._register_child_endpoint(CompanyTeamrolesEndpoint(client, parent_endpoint=self))
-        self.billing_setups = self._register_child_endpoint(CompanyBillingsetupsEndpoint(client, parent_endpoint=self))
-        self.note_types = self._register_child_endpoint(CompanyNotetypesEndpoint(client, parent_endpoint=self))
-        self.contactsync = self._register_child_endpoint(CompanyContactsyncEndpoint(client, parent_endpoint=self))
-        self.entity_types = self._register_child_endpoint(CompanyEntitytypesEndpoint(client, parent_endpoint=self))
-        self.management_it_solutions = self._register_child_endpoint(
-            CompanyManagementitsolutionsEndpoint(client, parent_endpoint=self)
-        )
-        self.expense_types = self._register_child_endpoint(CompanyExpensetypesEndpoint(client, parent_endpoint=self))
-        self.contacts = self._register_child_endpoint(CompanyContactsEndpoint(client, parent_endpoint=self))
-        self.portal_security_levels = self._register_child_endpoint(
-            CompanyPortalsecuritylevelsEndpoint(client, parent_endpoint=self)
-        )
-        self.company_picker_items = self._register_child_endpoint(
-            CompanyCompanypickeritemsEndpoint(client, parent_endpoint=self)
-        )
-        self.tracks = self._register_child_endpoint(CompanyTracksEndpoint(client, parent_endpoint=self))
-        self.company_finance = self._register_child_endpoint(
-            CompanyCompanyfinanceEndpoint(client, parent_endpoint=self)
-        )
-        self.company_type_associations = self._register_child_endpoint(
-            CompanyCompanytypeassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.contact_type_associations = self._register_child_endpoint(
-            CompanyContacttypeassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.states = self._register_child_endpoint(CompanyStatesEndpoint(client, parent_endpoint=self))
-        self.companies = self._register_child_endpoint(CompanyCompaniesEndpoint(client, parent_endpoint=self))
-        self.payment_types = self._register_child_endpoint(CompanyPaymenttypesEndpoint(client, parent_endpoint=self))
-        self.management_backups = self._register_child_endpoint(
-            CompanyManagementbackupsEndpoint(client, parent_endpoint=self)
-        )
-        self.ownership_types = self._register_child_endpoint(
-            CompanyOwnershiptypesEndpoint(client, parent_endpoint=self)
-        )
-        self.entitytypes = self._register_child_endpoint(CompanyEntitytypesEndpoint(client, parent_endpoint=self))
-        self.market_descriptions = self._register_child_endpoint(
-            CompanyMarketdescriptionsEndpoint(client, parent_endpoint=self)
-        )
-        self.portal_security_settings = self._register_child_endpoint(
-            CompanyPortalsecuritysettingsEndpoint(client, parent_endpoint=self)
-        )
-        self.configurations = self._register_child_endpoint(CompanyConfigurationsEndpoint(client, parent_endpoint=self))
-        self.address_formats = self._register_child_endpoint(
-            CompanyAddressformatsEndpoint(client, parent_endpoint=self)
-        )
-        self.communication_types = self._register_child_endpoint(
-            CompanyCommunicationtypesEndpoint(client, parent_endpoint=self)
-        )
-        self.contact = self._register_child_endpoint(CompanyContactEndpoint(client, parent_endpoint=self))
-        self.countries = self._register_child_endpoint(CompanyCountriesEndpoint(client, parent_endpoint=self))
-        self.m365contact = self._register_child_endpoint(CompanyM365contactEndpoint(client, parent_endpoint=self))
-        self.management = self._register_child_endpoint(CompanyManagementEndpoint(client, parent_endpoint=self))
-        self.m365contactsync = self._register_child_endpoint(
-            CompanyM365contactsyncEndpoint(client, parent_endpoint=self)
-        )
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def portal_configurations(self) -> "CompanyPortalconfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyPortalconfigurationsEndpoint")
+
+    @cached_property
+    def managed_devices_integrations(self) -> "CompanyManageddevicesintegrationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsEndpoint")
+
+    @cached_property
+    def team_roles(self) -> "CompanyTeamrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyTeamrolesEndpoint")
+
+    @cached_property
+    def billing_setups(self) -> "CompanyBillingsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyBillingsetupsEndpoint")
+
+    @cached_property
+    def note_types(self) -> "CompanyNotetypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyNotetypesEndpoint")
+
+    @cached_property
+    def contactsync(self) -> "CompanyContactsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsyncEndpoint")
+
+    @cached_property
+    def entity_types(self) -> "CompanyEntitytypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyEntitytypesEndpoint")
+
+    @cached_property
+    def management_it_solutions(self) -> "CompanyManagementitsolutionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManagementitsolutionsEndpoint")
+
+    @cached_property
+    def expense_types(self) -> "CompanyExpensetypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyExpensetypesEndpoint")
+
+    @cached_property
+    def contacts(self) -> "CompanyContactsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactsEndpoint")
+
+    @cached_property
+    def portal_security_levels(self) -> "CompanyPortalsecuritylevelsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsEndpoint")
+
+    @cached_property
+    def company_picker_items(self) -> "CompanyCompanypickeritemsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompanypickeritemsEndpoint")
+
+    @cached_property
+    def tracks(self) -> "CompanyTracksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyTracksEndpoint")
+
+    @cached_property
+    def company_finance(self) -> "CompanyCompanyfinanceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompanyfinanceEndpoint")
+
+    @cached_property
+    def company_type_associations(self) -> "CompanyCompanytypeassociationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompanytypeassociationsEndpoint")
+
+    @cached_property
+    def contact_type_associations(self) -> "CompanyContacttypeassociationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContacttypeassociationsEndpoint")
+
+    @cached_property
+    def states(self) -> "CompanyStatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyStatesEndpoint")
+
+    @cached_property
+    def companies(self) -> "CompanyCompaniesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCompaniesEndpoint")
+
+    @cached_property
+    def payment_types(self) -> "CompanyPaymenttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyPaymenttypesEndpoint")
+
+    @cached_property
+    def management_backups(self) -> "CompanyManagementbackupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManagementbackupsEndpoint")
+
+    @cached_property
+    def ownership_types(self) -> "CompanyOwnershiptypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyOwnershiptypesEndpoint")
+
+    @cached_property
+    def entitytypes(self) -> "CompanyEntitytypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyEntitytypesEndpoint")
+
+    @cached_property
+    def market_descriptions(self) -> "CompanyMarketdescriptionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyMarketdescriptionsEndpoint")
+
+    @cached_property
+    def portal_security_settings(self) -> "CompanyPortalsecuritysettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyPortalsecuritysettingsEndpoint")
+
+    @cached_property
+    def configurations(self) -> "CompanyConfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyConfigurationsEndpoint")
+
+    @cached_property
+    def address_formats(self) -> "CompanyAddressformatsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyAddressformatsEndpoint")
+
+    @cached_property
+    def communication_types(self) -> "CompanyCommunicationtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCommunicationtypesEndpoint")
+
+    @cached_property
+    def contact(self) -> "CompanyContactEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyContactEndpoint")
+
+    @cached_property
+    def countries(self) -> "CompanyCountriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyCountriesEndpoint")
+
+    @cached_property
+    def m365contact(self) -> "CompanyM365contactEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyM365contactEndpoint")
+
+    @cached_property
+    def management(self) -> "CompanyManagementEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManagementEndpoint")
+
+    @cached_property
+    def m365contactsync(self) -> "CompanyM365contactsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyM365contactsyncEndpoint")
@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyEntitytypesIdEndpoint import CompanyEntitytypesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyEntitytypesInfoEndpoint import CompanyEntitytypesInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyEntitytypesIdEndpoint import CompanyEntitytypesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyEntitytypesInfoEndpoint import CompanyEntitytypesInfoEndpoint
+
 
 class CompanyEntitytypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "entitytypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "entitytypes"
+    _route = "company/entitytypes"
 
-        self.info = self._register_child_endpoint(CompanyEntitytypesInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyEntitytypesIdEndpoint:
+    def id(self, id: int) -> "CompanyEntitytypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyEntitytypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyEntitytypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyEntitytypesIdEndpoint: The initialized CompanyEntitytypesIdEndpoint object.
+            CompanyEntitytypesIdEndpoint: The CompanyEntitytypesIdEndpoint view bound to the ID.
         """
-        child = CompanyEntitytypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyEntitytypesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "CompanyEntitytypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyEntitytypesInfoEndpoint")
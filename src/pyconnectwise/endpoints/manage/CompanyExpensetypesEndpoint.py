@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyExpensetypesInfoEndpoint import CompanyExpensetypesInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyExpensetypesInfoEndpoint import CompanyExpensetypesInfoEndpoint
+
 
 class CompanyExpensetypesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "expenseTypes"
+    _route = "company/expenseTypes"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "expenseTypes", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(CompanyExpensetypesInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> "CompanyExpensetypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyExpensetypesInfoEndpoint")
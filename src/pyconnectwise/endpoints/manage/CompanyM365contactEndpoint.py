@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactCountEndpoint import CompanyM365contactCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactIdEndpoint import CompanyM365contactIdEndpoint
 from pyconnectwise.models.manage import M365Contact
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyM365contactCountEndpoint import CompanyM365contactCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyM365contactIdEndpoint import CompanyM365contactIdEndpoint
+
 
 class CompanyM365contactEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "m365contact", parent_endpoint=parent_endpoint)
+    endpoint_base = "m365contact"
+    _route = "company/m365contact"
 
-        self.count = self._register_child_endpoint(CompanyM365contactCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyM365contactIdEndpoint:
+    def id(self, id: int) -> "CompanyM365contactIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyM365contactIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyM365contactIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyM365contactIdEndpoint: The initialized CompanyM365contactIdEndpoint object.
+            CompanyM365contactIdEndpoint: The CompanyM365contactIdEndpoint view bound to the ID.
         """
-        child = CompanyM365contactIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyM365contactIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[M365Contact]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[M365Contact]:
         """
         Performs a GET request against the /company/m365contact endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[M365Contact]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            M365Contact,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(M365Contact, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[M365Contact]:
         """
@@ -57,4 +54,8 @@ class CompanyM365contactEndpoint(ConnectWiseEndpoint):
         Returns:
             list[M365Contact]: The parsed response data.
         """
-        return self._parse_many(M365Contact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(M365Contact, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyM365contactCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyM365contactCountEndpoint")
@@ -1,28 +1,33 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactsyncIdEndpoint import CompanyM365contactsyncIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyEndpoint import CompanyM365contactsyncPropertyEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyM365contactsyncIdEndpoint import CompanyM365contactsyncIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyEndpoint import \
+        CompanyM365contactsyncPropertyEndpoint
+
 
 class CompanyM365contactsyncEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "m365contactsync", parent_endpoint=parent_endpoint)
+    endpoint_base = "m365contactsync"
+    _route = "company/m365contactsync"
 
-        self.property = self._register_child_endpoint(
-            CompanyM365contactsyncPropertyEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyM365contactsyncIdEndpoint:
+    def id(self, id: int) -> "CompanyM365contactsyncIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyM365contactsyncIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyM365contactsyncIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyM365contactsyncIdEndpoint: The initialized CompanyM365contactsyncIdEndpoint object.
+            CompanyM365contactsyncIdEndpoint: The CompanyM365contactsyncIdEndpoint view bound to the ID.
         """
-        child = CompanyM365contactsyncIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyM365contactsyncIdEndpoint", id)
+
+    @cached_property
+    def property(self) -> "CompanyM365contactsyncPropertyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyEndpoint")
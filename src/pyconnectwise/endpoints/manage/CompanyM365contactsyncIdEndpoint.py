@@ -1,15 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactsyncIdPropertyEndpoint import \
-    CompanyM365contactsyncIdPropertyEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyM365contactsyncIdPropertyEndpoint import \
+        CompanyM365contactsyncIdPropertyEndpoint
+
 
 class CompanyM365contactsyncIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/m365contactsync/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.property = self._register_child_endpoint(
-            CompanyM365contactsyncIdPropertyEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def property(self) -> "CompanyM365contactsyncIdPropertyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyM365contactsyncIdPropertyEndpoint")
@@ -1,29 +1,25 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyCountEndpoint import \
-    CompanyM365contactsyncPropertyCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyExcludedEndpoint import \
-    CompanyM365contactsyncPropertyExcludedEndpoint
-from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyIncludedEndpoint import \
-    CompanyM365contactsyncPropertyIncludedEndpoint
 from pyconnectwise.models.manage import M365ContactSyncProperty
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyCountEndpoint import \
+        CompanyM365contactsyncPropertyCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyExcludedEndpoint import \
+        CompanyM365contactsyncPropertyExcludedEndpoint
+    from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyIncludedEndpoint import \
+        CompanyM365contactsyncPropertyIncludedEndpoint
+
 
 class CompanyM365contactsyncPropertyEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "property", parent_endpoint=parent_endpoint)
+    endpoint_base = "property"
+    _route = "company/m365contactsync/property"
 
-        self.excluded = self._register_child_endpoint(
-            CompanyM365contactsyncPropertyExcludedEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            CompanyM365contactsyncPropertyCountEndpoint(client, parent_endpoint=self)
-        )
-        self.included = self._register_child_endpoint(
-            CompanyM365contactsyncPropertyIncludedEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> M365ContactSyncProperty:
         """
@@ -35,4 +31,20 @@ class CompanyM365contactsyncPropertyEndpoint(ConnectWiseEndpoint):
         Returns:
             M365ContactSyncProperty: The parsed response data.
         """
-        return self._parse_one(M365ContactSyncProperty, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(M365ContactSyncProperty, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def excluded(self) -> "CompanyM365contactsyncPropertyExcludedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyExcludedEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "CompanyM365contactsyncPropertyCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyCountEndpoint")
+
+    @cached_property
+    def included(self) -> "CompanyM365contactsyncPropertyIncludedEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyIncludedEndpoint"
+        )
@@ -1,62 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsCountEndpoint import \
-    CompanyManageddevicesintegrationsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdEndpoint import \
-    CompanyManageddevicesintegrationsIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsInfoEndpoint import \
-    CompanyManageddevicesintegrationsInfoEndpoint
 from pyconnectwise.models.manage import ManagedDevicesIntegration
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsCountEndpoint import \
+        CompanyManageddevicesintegrationsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdEndpoint import \
+        CompanyManageddevicesintegrationsIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsInfoEndpoint import \
+        CompanyManageddevicesintegrationsInfoEndpoint
+
 
 class CompanyManageddevicesintegrationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "managedDevicesIntegrations", parent_endpoint=parent_endpoint)
+    endpoint_base = "managedDevicesIntegrations"
+    _route = "company/managedDevicesIntegrations"
 
-        self.info = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyManageddevicesintegrationsIdEndpoint:
+    def id(self, id: int) -> "CompanyManageddevicesintegrationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyManageddevicesintegrationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyManageddevicesintegrationsIdEndpoint: The initialized CompanyManageddevicesintegrationsIdEndpoint object.
+            CompanyManageddevicesintegrationsIdEndpoint: The CompanyManageddevicesintegrationsIdEndpoint view bound to the ID.
         """
-        child = CompanyManageddevicesintegrationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagedDevicesIntegration]:
         """
         Performs a GET request against the /company/managedDevicesIntegrations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagedDevicesIntegration]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagedDevicesIntegration,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ManagedDevicesIntegration, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ManagedDevicesIntegration]:
         """
@@ -69,7 +59,7 @@ class CompanyManageddevicesintegrationsEndpoint(ConnectWiseEndpoint):
             list[ManagedDevicesIntegration]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegration, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegration, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagedDevicesIntegration:
@@ -83,5 +73,17 @@ class CompanyManageddevicesintegrationsEndpoint(ConnectWiseEndpoint):
             ManagedDevicesIntegration: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegration, super()._make_request("POST", data=data, params=params).json()
+            ManagedDevicesIntegration, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def info(self) -> "CompanyManageddevicesintegrationsInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsInfoEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "CompanyManageddevicesintegrationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsCountEndpoint"
         )
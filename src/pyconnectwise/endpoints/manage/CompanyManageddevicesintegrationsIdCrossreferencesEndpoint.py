@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint import \
-    CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint import \
-    CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint
 from pyconnectwise.models.manage import ManagedDevicesIntegrationCrossReference
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint import \
+        CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint import \
+        CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint
+
 
 class CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "crossReferences", parent_endpoint=parent_endpoint)
+    endpoint_base = "crossReferences"
+    _route = "company/managedDevicesIntegrations/{id}/crossReferences"
 
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint:
+    def id(self, id: int) -> "CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint: The initialized CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint object.
+            CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint: The CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint view bound to the ID.
         """
-        child = CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagedDevicesIntegrationCrossReference]:
         """
         Performs a GET request against the /company/managedDevicesIntegrations/{id}/crossReferences endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagedDevicesIntegrationCrossReference]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagedDevicesIntegrationCrossReference,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ManagedDevicesIntegrationCrossReference, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -66,7 +61,7 @@ class CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(ConnectWiseEndp
             list[ManagedDevicesIntegrationCrossReference]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegrationCrossReference, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationCrossReference, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -82,5 +77,11 @@ class CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(ConnectWiseEndp
             ManagedDevicesIntegrationCrossReference: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationCrossReference, super()._make_request("POST", data=data, params=params).json()
+            ManagedDevicesIntegrationCrossReference, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint"
         )
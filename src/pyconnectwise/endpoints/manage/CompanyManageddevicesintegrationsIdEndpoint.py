@@ -1,62 +1,45 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesEndpoint import \
-    CompanyManageddevicesintegrationsIdCrossreferencesEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdInfoEndpoint import \
-    CompanyManageddevicesintegrationsIdInfoEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsEndpoint import \
-    CompanyManageddevicesintegrationsIdLoginsEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsEndpoint import \
-    CompanyManageddevicesintegrationsIdNotificationsEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdUsagesEndpoint import \
-    CompanyManageddevicesintegrationsIdUsagesEndpoint
 from pyconnectwise.models.manage import ManagedDevicesIntegration
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesEndpoint import \
+        CompanyManageddevicesintegrationsIdCrossreferencesEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdInfoEndpoint import \
+        CompanyManageddevicesintegrationsIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsEndpoint import \
+        CompanyManageddevicesintegrationsIdLoginsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsEndpoint import \
+        CompanyManageddevicesintegrationsIdNotificationsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdUsagesEndpoint import \
+        CompanyManageddevicesintegrationsIdUsagesEndpoint
+
 
 class CompanyManageddevicesintegrationsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "company/managedDevicesIntegrations/{id}"
 
-        self.logins = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdLoginsEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.cross_references = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(client, parent_endpoint=self)
-        )
-        self.notifications = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdUsagesEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagedDevicesIntegration]:
         """
         Performs a GET request against the /company/managedDevicesIntegrations/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagedDevicesIntegration]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagedDevicesIntegration,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ManagedDevicesIntegration, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagedDevicesIntegration:
         """
@@ -68,7 +51,9 @@ class CompanyManageddevicesintegrationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ManagedDevicesIntegration: The parsed response data.
         """
-        return self._parse_one(ManagedDevicesIntegration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(
+            ManagedDevicesIntegration, super()._make_request("GET", data=data, params=params).content
+        )
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -90,7 +75,9 @@ class CompanyManageddevicesintegrationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ManagedDevicesIntegration: The parsed response data.
         """
-        return self._parse_one(ManagedDevicesIntegration, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(
+            ManagedDevicesIntegration, super()._make_request("PUT", data=data, params=params).content
+        )
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagedDevicesIntegration:
         """
@@ -103,5 +90,35 @@ class CompanyManageddevicesintegrationsIdEndpoint(ConnectWiseEndpoint):
             ManagedDevicesIntegration: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegration, super()._make_request("PATCH", data=data, params=params).json()
+            ManagedDevicesIntegration, super()._make_request("PATCH", data=data, params=params).content
+        )
+
+    @cached_property
+    def logins(self) -> "CompanyManageddevicesintegrationsIdLoginsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsEndpoint"
+        )
+
+    @cached_property
+    def info(self) -> "CompanyManageddevicesintegrationsIdInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdInfoEndpoint"
+        )
+
+    @cached_property
+    def cross_references(self) -> "CompanyManageddevicesintegrationsIdCrossreferencesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdCrossreferencesEndpoint"
+        )
+
+    @cached_property
+    def notifications(self) -> "CompanyManageddevicesintegrationsIdNotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsEndpoint"
+        )
+
+    @cached_property
+    def usages(self) -> "CompanyManageddevicesintegrationsIdUsagesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdUsagesEndpoint"
         )
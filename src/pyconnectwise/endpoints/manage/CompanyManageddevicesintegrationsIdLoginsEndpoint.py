@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsCountEndpoint import \
-    CompanyManageddevicesintegrationsIdLoginsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsIdEndpoint import \
-    CompanyManageddevicesintegrationsIdLoginsIdEndpoint
 from pyconnectwise.models.manage import ManagedDevicesIntegrationLogin
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsCountEndpoint import \
+        CompanyManageddevicesintegrationsIdLoginsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsIdEndpoint import \
+        CompanyManageddevicesintegrationsIdLoginsIdEndpoint
+
 
 class CompanyManageddevicesintegrationsIdLoginsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "logins", parent_endpoint=parent_endpoint)
+    endpoint_base = "logins"
+    _route = "company/managedDevicesIntegrations/{id}/logins"
 
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdLoginsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyManageddevicesintegrationsIdLoginsIdEndpoint:
+    def id(self, id: int) -> "CompanyManageddevicesintegrationsIdLoginsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdLoginsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyManageddevicesintegrationsIdLoginsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyManageddevicesintegrationsIdLoginsIdEndpoint: The initialized CompanyManageddevicesintegrationsIdLoginsIdEndpoint object.
+            CompanyManageddevicesintegrationsIdLoginsIdEndpoint: The CompanyManageddevicesintegrationsIdLoginsIdEndpoint view bound to the ID.
         """
-        child = CompanyManageddevicesintegrationsIdLoginsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagedDevicesIntegrationLogin]:
         """
         Performs a GET request against the /company/managedDevicesIntegrations/{id}/logins endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagedDevicesIntegrationLogin]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagedDevicesIntegrationLogin,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ManagedDevicesIntegrationLogin, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ManagedDevicesIntegrationLogin]:
         """
@@ -64,7 +57,7 @@ class CompanyManageddevicesintegrationsIdLoginsEndpoint(ConnectWiseEndpoint):
             list[ManagedDevicesIntegrationLogin]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegrationLogin, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationLogin, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagedDevicesIntegrationLogin:
@@ -78,5 +71,11 @@ class CompanyManageddevicesintegrationsIdLoginsEndpoint(ConnectWiseEndpoint):
             ManagedDevicesIntegrationLogin: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationLogin, super()._make_request("POST", data=data, params=params).json()
+            ManagedDevicesIntegrationLogin, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "CompanyManageddevicesintegrationsIdLoginsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdLoginsCountEndpoint"
         )
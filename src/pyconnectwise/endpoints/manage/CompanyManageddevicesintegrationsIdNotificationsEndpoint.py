@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsCountEndpoint import \
-    CompanyManageddevicesintegrationsIdNotificationsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsIdEndpoint import \
-    CompanyManageddevicesintegrationsIdNotificationsIdEndpoint
 from pyconnectwise.models.manage import ManagedDevicesIntegrationNotification
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsCountEndpoint import \
+        CompanyManageddevicesintegrationsIdNotificationsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsIdEndpoint import \
+        CompanyManageddevicesintegrationsIdNotificationsIdEndpoint
+
 
 class CompanyManageddevicesintegrationsIdNotificationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "notifications", parent_endpoint=parent_endpoint)
+    endpoint_base = "notifications"
+    _route = "company/managedDevicesIntegrations/{id}/notifications"
 
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdNotificationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyManageddevicesintegrationsIdNotificationsIdEndpoint:
+    def id(self, id: int) -> "CompanyManageddevicesintegrationsIdNotificationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdNotificationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyManageddevicesintegrationsIdNotificationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyManageddevicesintegrationsIdNotificationsIdEndpoint: The initialized CompanyManageddevicesintegrationsIdNotificationsIdEndpoint object.
+            CompanyManageddevicesintegrationsIdNotificationsIdEndpoint: The CompanyManageddevicesintegrationsIdNotificationsIdEndpoint view bound to the ID.
         """
-        child = CompanyManageddevicesintegrationsIdNotificationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagedDevicesIntegrationNotification]:
         """
         Performs a GET request against the /company/managedDevicesIntegrations/{id}/notifications endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagedDevicesIntegrationNotification]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagedDevicesIntegrationNotification,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ManagedDevicesIntegrationNotification, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -66,7 +61,7 @@ class CompanyManageddevicesintegrationsIdNotificationsEndpoint(ConnectWiseEndpoi
             list[ManagedDevicesIntegrationNotification]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegrationNotification, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationNotification, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -82,5 +77,11 @@ class CompanyManageddevicesintegrationsIdNotificationsEndpoint(ConnectWiseEndpoi
             ManagedDevicesIntegrationNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationNotification, super()._make_request("POST", data=data, params=params).json()
+            ManagedDevicesIntegrationNotification, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "CompanyManageddevicesintegrationsIdNotificationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManageddevicesintegrationsIdNotificationsCountEndpoint"
         )
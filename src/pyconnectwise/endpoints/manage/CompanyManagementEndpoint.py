@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementCountEndpoint import CompanyManagementCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementIdEndpoint import CompanyManagementIdEndpoint
 from pyconnectwise.models.manage import Management
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManagementCountEndpoint import CompanyManagementCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManagementIdEndpoint import CompanyManagementIdEndpoint
+
 
 class CompanyManagementEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "management", parent_endpoint=parent_endpoint)
+    endpoint_base = "management"
+    _route = "company/management"
 
-        self.count = self._register_child_endpoint(CompanyManagementCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyManagementIdEndpoint:
+    def id(self, id: int) -> "CompanyManagementIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyManagementIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyManagementIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyManagementIdEndpoint: The initialized CompanyManagementIdEndpoint object.
+            CompanyManagementIdEndpoint: The CompanyManagementIdEndpoint view bound to the ID.
         """
-        child = CompanyManagementIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyManagementIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Management]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Management]:
         """
         Performs a GET request against the /company/management endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Management]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Management,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Management, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Management]:
         """
@@ -57,4 +54,8 @@ class CompanyManagementEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Management]: The parsed response data.
         """
-        return self._parse_many(Management, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Management, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyManagementCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManagementCountEndpoint")
@@ -1,49 +1,41 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementIdExecutemanageditsyncEndpoint import \
-    CompanyManagementIdExecutemanageditsyncEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementIdLogEndpoint import CompanyManagementIdLogEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementIdLogsEndpoint import CompanyManagementIdLogsEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementIdManagementreportnotificationsEndpoint import \
-    CompanyManagementIdManagementreportnotificationsEndpoint
 from pyconnectwise.models.manage import Management
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManagementIdExecutemanageditsyncEndpoint import \
+        CompanyManagementIdExecutemanageditsyncEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManagementIdLogEndpoint import CompanyManagementIdLogEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManagementIdLogsEndpoint import CompanyManagementIdLogsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManagementIdManagementreportnotificationsEndpoint import \
+        CompanyManagementIdManagementreportnotificationsEndpoint
+
 
 class CompanyManagementIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "company/management/{id}"
 
-        self.log = self._register_child_endpoint(CompanyManagementIdLogEndpoint(client, parent_endpoint=self))
-        self.management_report_notifications = self._register_child_endpoint(
-            CompanyManagementIdManagementreportnotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.logs = self._register_child_endpoint(CompanyManagementIdLogsEndpoint(client, parent_endpoint=self))
-        self.execute_managed_it_sync = self._register_child_endpoint(
-            CompanyManagementIdExecutemanageditsyncEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Management]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Management]:
         """
         Performs a GET request against the /company/management/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Management]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Management,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Management, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Management:
         """
@@ -55,7 +47,7 @@ class CompanyManagementIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Management: The parsed response data.
         """
-        return self._parse_one(Management, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Management, super()._make_request("GET", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Management:
         """
@@ -67,7 +59,7 @@ class CompanyManagementIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Management: The parsed response data.
         """
-        return self._parse_one(Management, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Management, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Management:
         """
@@ -79,4 +71,24 @@ class CompanyManagementIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Management: The parsed response data.
         """
-        return self._parse_one(Management, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Management, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def log(self) -> "CompanyManagementIdLogEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManagementIdLogEndpoint")
+
+    @cached_property
+    def management_report_notifications(self) -> "CompanyManagementIdManagementreportnotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManagementIdManagementreportnotificationsEndpoint"
+        )
+
+    @cached_property
+    def logs(self) -> "CompanyManagementIdLogsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManagementIdLogsEndpoint")
+
+    @cached_property
+    def execute_managed_it_sync(self) -> "CompanyManagementIdExecutemanageditsyncEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyManagementIdExecutemanageditsyncEndpoint"
+        )
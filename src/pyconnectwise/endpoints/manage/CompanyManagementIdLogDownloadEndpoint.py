@@ -1,12 +1,16 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class CompanyManagementIdLogDownloadEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "download"
+    _route = "company/management/{id}/log/download"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "download", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
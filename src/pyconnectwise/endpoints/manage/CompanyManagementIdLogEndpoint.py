@@ -1,14 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementIdLogDownloadEndpoint import CompanyManagementIdLogDownloadEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManagementIdLogDownloadEndpoint import \
+        CompanyManagementIdLogDownloadEndpoint
+
 
 class CompanyManagementIdLogEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "log"
+    _route = "company/management/{id}/log"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "log", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.download = self._register_child_endpoint(
-            CompanyManagementIdLogDownloadEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def download(self) -> "CompanyManagementIdLogDownloadEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManagementIdLogDownloadEndpoint")
@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementitsolutionsCountEndpoint import \
-    CompanyManagementitsolutionsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyManagementitsolutionsIdEndpoint import CompanyManagementitsolutionsIdEndpoint
 from pyconnectwise.models.manage import ManagementItSolution
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyManagementitsolutionsCountEndpoint import \
+        CompanyManagementitsolutionsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyManagementitsolutionsIdEndpoint import \
+        CompanyManagementitsolutionsIdEndpoint
+
 
 class CompanyManagementitsolutionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "managementItSolutions", parent_endpoint=parent_endpoint)
+    endpoint_base = "managementItSolutions"
+    _route = "company/managementItSolutions"
 
-        self.count = self._register_child_endpoint(
-            CompanyManagementitsolutionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyManagementitsolutionsIdEndpoint:
+    def id(self, id: int) -> "CompanyManagementitsolutionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyManagementitsolutionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyManagementitsolutionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyManagementitsolutionsIdEndpoint: The initialized CompanyManagementitsolutionsIdEndpoint object.
+            CompanyManagementitsolutionsIdEndpoint: The CompanyManagementitsolutionsIdEndpoint view bound to the ID.
         """
-        child = CompanyManagementitsolutionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyManagementitsolutionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagementItSolution]:
         """
         Performs a GET request against the /company/managementItSolutions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagementItSolution]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagementItSolution,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ManagementItSolution, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ManagementItSolution]:
         """
@@ -62,7 +56,7 @@ class CompanyManagementitsolutionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ManagementItSolution]: The parsed response data.
         """
-        return self._parse_many(ManagementItSolution, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ManagementItSolution, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagementItSolution:
         """
@@ -74,4 +68,8 @@ class CompanyManagementitsolutionsEndpoint(ConnectWiseEndpoint):
         Returns:
             ManagementItSolution: The parsed response data.
         """
-        return self._parse_one(ManagementItSolution, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ManagementItSolution, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyManagementitsolutionsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyManagementitsolutionsCountEndpoint")
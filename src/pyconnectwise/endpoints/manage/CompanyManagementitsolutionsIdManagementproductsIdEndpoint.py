@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import ManagementItSolutionAgreementInterfaceParameter
@@ -6,30 +7,28 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/managementItSolutions/{id}/managementProducts/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagementItSolutionAgreementInterfaceParameter]:
         """
         Performs a GET request against the /company/managementItSolutions/{id}/managementProducts/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagementItSolutionAgreementInterfaceParameter]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagementItSolutionAgreementInterfaceParameter,
-            self,
-            page,
-            page_size,
+        return super()._paginated(
+            ManagementItSolutionAgreementInterfaceParameter, page, page_size, params, forward_only
         )
 
     def get(
@@ -46,7 +45,7 @@ class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(ConnectWiseEndp
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def put(
@@ -63,7 +62,7 @@ class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(ConnectWiseEndp
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
 
     def patch(
@@ -80,7 +79,7 @@ class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(ConnectWiseEndp
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
 
     def delete(
@@ -97,5 +96,5 @@ class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(ConnectWiseEndp
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("DELETE", data=data, params=params).json(),
+            super()._make_request("DELETE", data=data, params=params).content,
         )
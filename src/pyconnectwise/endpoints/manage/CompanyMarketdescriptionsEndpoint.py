@@ -1,55 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyMarketdescriptionsCountEndpoint import CompanyMarketdescriptionsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyMarketdescriptionsIdEndpoint import CompanyMarketdescriptionsIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyMarketdescriptionsInfoEndpoint import CompanyMarketdescriptionsInfoEndpoint
 from pyconnectwise.models.manage import MarketDescription
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyMarketdescriptionsCountEndpoint import \
+        CompanyMarketdescriptionsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyMarketdescriptionsIdEndpoint import CompanyMarketdescriptionsIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyMarketdescriptionsInfoEndpoint import \
+        CompanyMarketdescriptionsInfoEndpoint
+
 
 class CompanyMarketdescriptionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "marketDescriptions", parent_endpoint=parent_endpoint)
+    endpoint_base = "marketDescriptions"
+    _route = "company/marketDescriptions"
 
-        self.info = self._register_child_endpoint(CompanyMarketdescriptionsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyMarketdescriptionsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyMarketdescriptionsIdEndpoint:
+    def id(self, id: int) -> "CompanyMarketdescriptionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyMarketdescriptionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyMarketdescriptionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyMarketdescriptionsIdEndpoint: The initialized CompanyMarketdescriptionsIdEndpoint object.
+            CompanyMarketdescriptionsIdEndpoint: The CompanyMarketdescriptionsIdEndpoint view bound to the ID.
         """
-        child = CompanyMarketdescriptionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyMarketdescriptionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[MarketDescription]:
         """
         Performs a GET request against the /company/marketDescriptions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MarketDescription]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MarketDescription,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MarketDescription, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MarketDescription]:
         """
@@ -61,7 +57,7 @@ class CompanyMarketdescriptionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[MarketDescription]: The parsed response data.
         """
-        return self._parse_many(MarketDescription, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MarketDescription, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MarketDescription:
         """
@@ -73,4 +69,12 @@ class CompanyMarketdescriptionsEndpoint(ConnectWiseEndpoint):
         Returns:
             MarketDescription: The parsed response data.
         """
-        return self._parse_one(MarketDescription, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MarketDescription, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyMarketdescriptionsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyMarketdescriptionsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyMarketdescriptionsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyMarketdescriptionsCountEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyNotetypesCountEndpoint import CompanyNotetypesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyNotetypesIdEndpoint import CompanyNotetypesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyNotetypesInfoEndpoint import CompanyNotetypesInfoEndpoint
 from pyconnectwise.models.manage import CompanyNoteType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyNotetypesCountEndpoint import CompanyNotetypesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyNotetypesIdEndpoint import CompanyNotetypesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyNotetypesInfoEndpoint import CompanyNotetypesInfoEndpoint
+
 
 class CompanyNotetypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "noteTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "noteTypes"
+    _route = "company/noteTypes"
 
-        self.info = self._register_child_endpoint(CompanyNotetypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyNotetypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyNotetypesIdEndpoint:
+    def id(self, id: int) -> "CompanyNotetypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyNotetypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyNotetypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyNotetypesIdEndpoint: The initialized CompanyNotetypesIdEndpoint object.
+            CompanyNotetypesIdEndpoint: The CompanyNotetypesIdEndpoint view bound to the ID.
         """
-        child = CompanyNotetypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyNotetypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CompanyNoteType]:
         """
         Performs a GET request against the /company/noteTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CompanyNoteType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CompanyNoteType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CompanyNoteType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CompanyNoteType]:
         """
@@ -61,7 +55,7 @@ class CompanyNotetypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CompanyNoteType]: The parsed response data.
         """
-        return self._parse_many(CompanyNoteType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyNoteType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CompanyNoteType:
         """
@@ -73,4 +67,12 @@ class CompanyNotetypesEndpoint(ConnectWiseEndpoint):
         Returns:
             CompanyNoteType: The parsed response data.
         """
-        return self._parse_one(CompanyNoteType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyNoteType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyNotetypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyNotetypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyNotetypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyNotetypesCountEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyOwnershiptypesCountEndpoint import CompanyOwnershiptypesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyOwnershiptypesIdEndpoint import CompanyOwnershiptypesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyOwnershiptypesInfoEndpoint import CompanyOwnershiptypesInfoEndpoint
 from pyconnectwise.models.manage import OwnershipType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyOwnershiptypesCountEndpoint import CompanyOwnershiptypesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyOwnershiptypesIdEndpoint import CompanyOwnershiptypesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyOwnershiptypesInfoEndpoint import CompanyOwnershiptypesInfoEndpoint
+
 
 class CompanyOwnershiptypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "ownershipTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "ownershipTypes"
+    _route = "company/ownershipTypes"
 
-        self.info = self._register_child_endpoint(CompanyOwnershiptypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyOwnershiptypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyOwnershiptypesIdEndpoint:
+    def id(self, id: int) -> "CompanyOwnershiptypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyOwnershiptypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyOwnershiptypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyOwnershiptypesIdEndpoint: The initialized CompanyOwnershiptypesIdEndpoint object.
+            CompanyOwnershiptypesIdEndpoint: The CompanyOwnershiptypesIdEndpoint view bound to the ID.
         """
-        child = CompanyOwnershiptypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyOwnershiptypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[OwnershipType]:
         """
         Performs a GET request against the /company/ownershipTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[OwnershipType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            OwnershipType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(OwnershipType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OwnershipType]:
         """
@@ -61,7 +55,7 @@ class CompanyOwnershiptypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[OwnershipType]: The parsed response data.
         """
-        return self._parse_many(OwnershipType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OwnershipType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OwnershipType:
         """
@@ -73,4 +67,12 @@ class CompanyOwnershiptypesEndpoint(ConnectWiseEndpoint):
         Returns:
             OwnershipType: The parsed response data.
         """
-        return self._parse_one(OwnershipType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OwnershipType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyOwnershiptypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyOwnershiptypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyOwnershiptypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyOwnershiptypesCountEndpoint")
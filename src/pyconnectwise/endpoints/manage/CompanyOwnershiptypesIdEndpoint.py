@@ -1,39 +1,36 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyOwnershiptypesIdInfoEndpoint import CompanyOwnershiptypesIdInfoEndpoint
 from pyconnectwise.models.manage import OwnershipType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyOwnershiptypesIdInfoEndpoint import CompanyOwnershiptypesIdInfoEndpoint
+
 
 class CompanyOwnershiptypesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "company/ownershipTypes/{id}"
 
-        self.info = self._register_child_endpoint(CompanyOwnershiptypesIdInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[OwnershipType]:
         """
         Performs a GET request against the /company/ownershipTypes/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[OwnershipType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            OwnershipType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(OwnershipType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OwnershipType:
         """
@@ -45,7 +42,7 @@ class CompanyOwnershiptypesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             OwnershipType: The parsed response data.
         """
-        return self._parse_one(OwnershipType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OwnershipType, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -67,7 +64,7 @@ class CompanyOwnershiptypesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             OwnershipType: The parsed response data.
         """
-        return self._parse_one(OwnershipType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OwnershipType, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OwnershipType:
         """
@@ -79,4 +76,8 @@ class CompanyOwnershiptypesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             OwnershipType: The parsed response data.
         """
-        return self._parse_one(OwnershipType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(OwnershipType, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyOwnershiptypesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyOwnershiptypesIdInfoEndpoint")
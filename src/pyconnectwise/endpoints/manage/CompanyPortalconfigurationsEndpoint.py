@@ -1,64 +1,54 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsCopyEndpoint import \
-    CompanyPortalconfigurationsCopyEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsCountEndpoint import \
-    CompanyPortalconfigurationsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdEndpoint import CompanyPortalconfigurationsIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupEndpoint import \
-    CompanyPortalconfigurationsInvoicesetupEndpoint
 from pyconnectwise.models.manage import PortalConfiguration
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsCopyEndpoint import \
+        CompanyPortalconfigurationsCopyEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsCountEndpoint import \
+        CompanyPortalconfigurationsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdEndpoint import \
+        CompanyPortalconfigurationsIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupEndpoint import \
+        CompanyPortalconfigurationsInvoicesetupEndpoint
+
 
 class CompanyPortalconfigurationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "portalConfigurations", parent_endpoint=parent_endpoint)
+    endpoint_base = "portalConfigurations"
+    _route = "company/portalConfigurations"
 
-        self.copy = self._register_child_endpoint(CompanyPortalconfigurationsCopyEndpoint(client, parent_endpoint=self))
-        self.invoice_setup = self._register_child_endpoint(
-            CompanyPortalconfigurationsInvoicesetupEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            CompanyPortalconfigurationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyPortalconfigurationsIdEndpoint:
+    def id(self, id: int) -> "CompanyPortalconfigurationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyPortalconfigurationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyPortalconfigurationsIdEndpoint: The initialized CompanyPortalconfigurationsIdEndpoint object.
+            CompanyPortalconfigurationsIdEndpoint: The CompanyPortalconfigurationsIdEndpoint view bound to the ID.
         """
-        child = CompanyPortalconfigurationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalConfiguration]:
         """
         Performs a GET request against the /company/portalConfigurations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalConfiguration]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalConfiguration,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalConfiguration, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PortalConfiguration]:
         """
@@ -70,7 +60,7 @@ class CompanyPortalconfigurationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PortalConfiguration]: The parsed response data.
         """
-        return self._parse_many(PortalConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PortalConfiguration:
         """
@@ -82,4 +72,18 @@ class CompanyPortalconfigurationsEndpoint(ConnectWiseEndpoint):
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> "CompanyPortalconfigurationsCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyPortalconfigurationsCopyEndpoint")
+
+    @cached_property
+    def invoice_setup(self) -> "CompanyPortalconfigurationsInvoicesetupEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "CompanyPortalconfigurationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyPortalconfigurationsCountEndpoint")
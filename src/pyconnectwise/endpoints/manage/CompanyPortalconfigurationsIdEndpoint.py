@@ -1,62 +1,45 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdInvoicesetupsEndpoint import \
-    CompanyPortalconfigurationsIdInvoicesetupsEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdOpportunitysetupsEndpoint import \
-    CompanyPortalconfigurationsIdOpportunitysetupsEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint import \
-    CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdProjectsetupsEndpoint import \
-    CompanyPortalconfigurationsIdProjectsetupsEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsEndpoint import \
-    CompanyPortalconfigurationsIdServicesetupsEndpoint
 from pyconnectwise.models.manage import PortalConfiguration
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdInvoicesetupsEndpoint import \
+        CompanyPortalconfigurationsIdInvoicesetupsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdOpportunitysetupsEndpoint import \
+        CompanyPortalconfigurationsIdOpportunitysetupsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint import \
+        CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdProjectsetupsEndpoint import \
+        CompanyPortalconfigurationsIdProjectsetupsEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsEndpoint import \
+        CompanyPortalconfigurationsIdServicesetupsEndpoint
+
 
 class CompanyPortalconfigurationsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "company/portalConfigurations/{id}"
 
-        self.invoice_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdInvoicesetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.project_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdProjectsetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.password_email_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.opportunity_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.service_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdServicesetupsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalConfiguration]:
         """
         Performs a GET request against the /company/portalConfigurations/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalConfiguration]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalConfiguration,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalConfiguration, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PortalConfiguration:
         """
@@ -68,7 +51,7 @@ class CompanyPortalconfigurationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -90,7 +73,7 @@ class CompanyPortalconfigurationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PortalConfiguration:
         """
@@ -102,4 +85,34 @@ class CompanyPortalconfigurationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def invoice_setups(self) -> "CompanyPortalconfigurationsIdInvoicesetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdInvoicesetupsEndpoint"
+        )
+
+    @cached_property
+    def project_setups(self) -> "CompanyPortalconfigurationsIdProjectsetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdProjectsetupsEndpoint"
+        )
+
+    @cached_property
+    def password_email_setups(self) -> "CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint"
+        )
+
+    @cached_property
+    def opportunity_setups(self) -> "CompanyPortalconfigurationsIdOpportunitysetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdOpportunitysetupsEndpoint"
+        )
+
+    @cached_property
+    def service_setups(self) -> "CompanyPortalconfigurationsIdServicesetupsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsEndpoint"
+        )
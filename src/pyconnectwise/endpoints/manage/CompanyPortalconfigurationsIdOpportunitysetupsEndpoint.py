@@ -1,51 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint import \
-    CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint
 from pyconnectwise.models.manage import PortalConfigurationOpportunitySetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint import \
+        CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint
+
 
 class CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "opportunitySetups"
+    _route = "company/portalConfigurations/{id}/opportunitySetups"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "opportunitySetups", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint:
+    def id(self, id: int) -> "CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint: The initialized CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint object.
+            CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint: The CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint view bound to the ID.
         """
-        child = CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalConfigurationOpportunitySetup]:
         """
         Performs a GET request against the /company/portalConfigurations/{id}/opportunitySetups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalConfigurationOpportunitySetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalConfigurationOpportunitySetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalConfigurationOpportunitySetup, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -60,7 +59,7 @@ class CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(ConnectWiseEndpoint
             list[PortalConfigurationOpportunitySetup]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationOpportunitySetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("GET", data=data, params=params).content
         )
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PortalConfigurationOpportunitySetup:
@@ -74,7 +73,7 @@ class CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(ConnectWiseEndpoint
             PortalConfigurationOpportunitySetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationOpportunitySetup, super()._make_request("PUT", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("PUT", data=data, params=params).content
         )
 
     def patch(
@@ -90,5 +89,5 @@ class CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(ConnectWiseEndpoint
             PortalConfigurationOpportunitySetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationOpportunitySetup, super()._make_request("PATCH", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("PATCH", data=data, params=params).content
         )
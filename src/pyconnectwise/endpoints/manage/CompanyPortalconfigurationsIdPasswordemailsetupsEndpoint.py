@@ -1,51 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint import \
-    CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint
 from pyconnectwise.models.manage import PortalConfigurationPasswordEmailSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint import \
+        CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint
+
 
 class CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "passwordEmailSetups"
+    _route = "company/portalConfigurations/{id}/passwordEmailSetups"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "passwordEmailSetups", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint:
+    def id(self, id: int) -> "CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint: The initialized CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint object.
+            CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint: The CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint view bound to the ID.
         """
-        child = CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalConfigurationPasswordEmailSetup]:
         """
         Performs a GET request against the /company/portalConfigurations/{id}/passwordEmailSetups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalConfigurationPasswordEmailSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalConfigurationPasswordEmailSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalConfigurationPasswordEmailSetup, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -60,5 +59,5 @@ class CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint(ConnectWiseEndpoi
             list[PortalConfigurationPasswordEmailSetup]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationPasswordEmailSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationPasswordEmailSetup, super()._make_request("GET", data=data, params=params).content
         )
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import PortalConfigurationPasswordEmailSetup
@@ -6,31 +7,27 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "company/portalConfigurations/{id}/passwordEmailSetups/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalConfigurationPasswordEmailSetup]:
         """
         Performs a GET request against the /company/portalConfigurations/{id}/passwordEmailSetups/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalConfigurationPasswordEmailSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalConfigurationPasswordEmailSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalConfigurationPasswordEmailSetup, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -45,7 +42,7 @@ class CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint(ConnectWiseEndp
             PortalConfigurationPasswordEmailSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationPasswordEmailSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationPasswordEmailSetup, super()._make_request("GET", data=data, params=params).content
         )
 
     def put(
@@ -61,7 +58,7 @@ class CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint(ConnectWiseEndp
             PortalConfigurationPasswordEmailSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationPasswordEmailSetup, super()._make_request("PUT", data=data, params=params).json()
+            PortalConfigurationPasswordEmailSetup, super()._make_request("PUT", data=data, params=params).content
         )
 
     def patch(
@@ -77,5 +74,5 @@ class CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint(ConnectWiseEndp
             PortalConfigurationPasswordEmailSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationPasswordEmailSetup, super()._make_request("PATCH", data=data, params=params).json()
+            PortalConfigurationPasswordEmailSetup, super()._make_request("PATCH", data=data, params=params).content
         )
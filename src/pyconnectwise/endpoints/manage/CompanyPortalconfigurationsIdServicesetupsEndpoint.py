@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsCountEndpoint import \
-    CompanyPortalconfigurationsIdServicesetupsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsIdEndpoint import \
-    CompanyPortalconfigurationsIdServicesetupsIdEndpoint
 from pyconnectwise.models.manage import PortalConfigurationServiceSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsCountEndpoint import \
+        CompanyPortalconfigurationsIdServicesetupsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsIdEndpoint import \
+        CompanyPortalconfigurationsIdServicesetupsIdEndpoint
+
 
 class CompanyPortalconfigurationsIdServicesetupsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "serviceSetups", parent_endpoint=parent_endpoint)
+    endpoint_base = "serviceSetups"
+    _route = "company/portalConfigurations/{id}/serviceSetups"
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdServicesetupsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyPortalconfigurationsIdServicesetupsIdEndpoint:
+    def id(self, id: int) -> "CompanyPortalconfigurationsIdServicesetupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdServicesetupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyPortalconfigurationsIdServicesetupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyPortalconfigurationsIdServicesetupsIdEndpoint: The initialized CompanyPortalconfigurationsIdServicesetupsIdEndpoint object.
+            CompanyPortalconfigurationsIdServicesetupsIdEndpoint: The CompanyPortalconfigurationsIdServicesetupsIdEndpoint view bound to the ID.
         """
-        child = CompanyPortalconfigurationsIdServicesetupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalConfigurationServiceSetup]:
         """
         Performs a GET request against the /company/portalConfigurations/{id}/serviceSetups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalConfigurationServiceSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalConfigurationServiceSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalConfigurationServiceSetup, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -66,5 +59,11 @@ class CompanyPortalconfigurationsIdServicesetupsEndpoint(ConnectWiseEndpoint):
             list[PortalConfigurationServiceSetup]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationServiceSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationServiceSetup, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "CompanyPortalconfigurationsIdServicesetupsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsIdServicesetupsCountEndpoint"
         )
@@ -1,15 +1,23 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint import \
-    CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint import \
+        CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint
+
 
 class CompanyPortalconfigurationsInvoicesetupEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "invoiceSetup"
+    _route = "company/portalConfigurations/invoiceSetup"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "invoiceSetup", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.payment_processors = self._register_child_endpoint(
-            CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def payment_processors(self) -> "CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint"
         )
@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint import \
-    CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint import \
-    CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint
 from pyconnectwise.models.manage import PortalConfigurationPaymentProcessor
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint import \
+        CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint import \
+        CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint
+
 
 class CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "paymentProcessors", parent_endpoint=parent_endpoint)
+    endpoint_base = "paymentProcessors"
+    _route = "company/portalConfigurations/invoiceSetup/paymentProcessors"
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint:
+    def id(self, id: int) -> "CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint: The initialized CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint object.
+            CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint: The CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint view bound to the ID.
         """
-        child = CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalConfigurationPaymentProcessor]:
         """
         Performs a GET request against the /company/portalConfigurations/invoiceSetup/paymentProcessors endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalConfigurationPaymentProcessor]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalConfigurationPaymentProcessor,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalConfigurationPaymentProcessor, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -66,5 +61,11 @@ class CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint(ConnectWi
             list[PortalConfigurationPaymentProcessor]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationPaymentProcessor, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationPaymentProcessor, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint"
         )
@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsCountEndpoint import \
-    CompanyPortalsecuritylevelsCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsIdEndpoint import CompanyPortalsecuritylevelsIdEndpoint
 from pyconnectwise.models.manage import PortalSecurityLevel
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsCountEndpoint import \
+        CompanyPortalsecuritylevelsCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsIdEndpoint import \
+        CompanyPortalsecuritylevelsIdEndpoint
+
 
 class CompanyPortalsecuritylevelsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "portalSecurityLevels", parent_endpoint=parent_endpoint)
+    endpoint_base = "portalSecurityLevels"
+    _route = "company/portalSecurityLevels"
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalsecuritylevelsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyPortalsecuritylevelsIdEndpoint:
+    def id(self, id: int) -> "CompanyPortalsecuritylevelsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyPortalsecuritylevelsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyPortalsecuritylevelsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyPortalsecuritylevelsIdEndpoint: The initialized CompanyPortalsecuritylevelsIdEndpoint object.
+            CompanyPortalsecuritylevelsIdEndpoint: The CompanyPortalsecuritylevelsIdEndpoint view bound to the ID.
         """
-        child = CompanyPortalsecuritylevelsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalSecurityLevel]:
         """
         Performs a GET request against the /company/portalSecurityLevels endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalSecurityLevel]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalSecurityLevel,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalSecurityLevel, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PortalSecurityLevel]:
         """
@@ -62,4 +56,8 @@ class CompanyPortalsecuritylevelsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PortalSecurityLevel]: The parsed response data.
         """
-        return self._parse_many(PortalSecurityLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalSecurityLevel, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyPortalsecuritylevelsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyPortalsecuritylevelsCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyStatesCountEndpoint import CompanyStatesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyStatesIdEndpoint import CompanyStatesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyStatesInfoEndpoint import CompanyStatesInfoEndpoint
 from pyconnectwise.models.manage import State
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyStatesCountEndpoint import CompanyStatesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyStatesIdEndpoint import CompanyStatesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyStatesInfoEndpoint import CompanyStatesInfoEndpoint
+
 
 class CompanyStatesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "states", parent_endpoint=parent_endpoint)
+    endpoint_base = "states"
+    _route = "company/states"
 
-        self.info = self._register_child_endpoint(CompanyStatesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyStatesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyStatesIdEndpoint:
+    def id(self, id: int) -> "CompanyStatesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyStatesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyStatesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyStatesIdEndpoint: The initialized CompanyStatesIdEndpoint object.
+            CompanyStatesIdEndpoint: The CompanyStatesIdEndpoint view bound to the ID.
         """
-        child = CompanyStatesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyStatesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[State]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[State]:
         """
         Performs a GET request against the /company/states endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[State]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            State,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(State, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[State]:
         """
@@ -59,7 +55,7 @@ class CompanyStatesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[State]: The parsed response data.
         """
-        return self._parse_many(State, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(State, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> State:
         """
@@ -71,4 +67,12 @@ class CompanyStatesEndpoint(ConnectWiseEndpoint):
         Returns:
             State: The parsed response data.
         """
-        return self._parse_one(State, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(State, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyStatesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyStatesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyStatesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyStatesCountEndpoint")
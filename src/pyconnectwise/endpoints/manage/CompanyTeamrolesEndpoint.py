@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyTeamrolesCountEndpoint import CompanyTeamrolesCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyTeamrolesIdEndpoint import CompanyTeamrolesIdEndpoint
-from pyconnectwise.endpoints.manage.CompanyTeamrolesInfoEndpoint import CompanyTeamrolesInfoEndpoint
 from pyconnectwise.models.manage import TeamRole
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyTeamrolesCountEndpoint import CompanyTeamrolesCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyTeamrolesIdEndpoint import CompanyTeamrolesIdEndpoint
+    from pyconnectwise.endpoints.manage.CompanyTeamrolesInfoEndpoint import CompanyTeamrolesInfoEndpoint
+
 
 class CompanyTeamrolesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "teamRoles", parent_endpoint=parent_endpoint)
+    endpoint_base = "teamRoles"
+    _route = "company/teamRoles"
 
-        self.info = self._register_child_endpoint(CompanyTeamrolesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyTeamrolesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyTeamrolesIdEndpoint:
+    def id(self, id: int) -> "CompanyTeamrolesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyTeamrolesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyTeamrolesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyTeamrolesIdEndpoint: The initialized CompanyTeamrolesIdEndpoint object.
+            CompanyTeamrolesIdEndpoint: The CompanyTeamrolesIdEndpoint view bound to the ID.
         """
-        child = CompanyTeamrolesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyTeamrolesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TeamRole]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TeamRole]:
         """
         Performs a GET request against the /company/teamRoles endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TeamRole]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TeamRole,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TeamRole, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TeamRole]:
         """
@@ -59,7 +55,7 @@ class CompanyTeamrolesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TeamRole]: The parsed response data.
         """
-        return self._parse_many(TeamRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TeamRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TeamRole:
         """
@@ -71,4 +67,12 @@ class CompanyTeamrolesEndpoint(ConnectWiseEndpoint):
         Returns:
             TeamRole: The parsed response data.
         """
-        return self._parse_one(TeamRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TeamRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "CompanyTeamrolesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyTeamrolesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "CompanyTeamrolesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyTeamrolesCountEndpoint")
@@ -1,39 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyTeamrolesIdInfoEndpoint import CompanyTeamrolesIdInfoEndpoint
-from pyconnectwise.endpoints.manage.CompanyTeamrolesIdUsagesEndpoint import CompanyTeamrolesIdUsagesEndpoint
 from pyconnectwise.models.manage import TeamRole
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyTeamrolesIdInfoEndpoint import CompanyTeamrolesIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.CompanyTeamrolesIdUsagesEndpoint import CompanyTeamrolesIdUsagesEndpoint
+
 
 class CompanyTeamrolesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "company/teamRoles/{id}"
 
-        self.usages = self._register_child_endpoint(CompanyTeamrolesIdUsagesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyTeamrolesIdInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TeamRole]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TeamRole]:
         """
         Performs a GET request against the /company/teamRoles/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TeamRole]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TeamRole,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TeamRole, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TeamRole:
         """
@@ -45,7 +43,7 @@ class CompanyTeamrolesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             TeamRole: The parsed response data.
         """
-        return self._parse_one(TeamRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TeamRole, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -67,7 +65,7 @@ class CompanyTeamrolesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             TeamRole: The parsed response data.
         """
-        return self._parse_one(TeamRole, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(TeamRole, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TeamRole:
         """
@@ -79,4 +77,12 @@ class CompanyTeamrolesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             TeamRole: The parsed response data.
         """
-        return self._parse_one(TeamRole, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(TeamRole, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "CompanyTeamrolesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyTeamrolesIdUsagesEndpoint")
+
+    @cached_property
+    def info(self) -> "CompanyTeamrolesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyTeamrolesIdInfoEndpoint")
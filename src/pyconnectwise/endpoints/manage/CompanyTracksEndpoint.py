@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.CompanyTracksCountEndpoint import CompanyTracksCountEndpoint
-from pyconnectwise.endpoints.manage.CompanyTracksIdEndpoint import CompanyTracksIdEndpoint
 from pyconnectwise.models.manage import Track
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.CompanyTracksCountEndpoint import CompanyTracksCountEndpoint
+    from pyconnectwise.endpoints.manage.CompanyTracksIdEndpoint import CompanyTracksIdEndpoint
+
 
 class CompanyTracksEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "tracks", parent_endpoint=parent_endpoint)
+    endpoint_base = "tracks"
+    _route = "company/tracks"
 
-        self.count = self._register_child_endpoint(CompanyTracksCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> CompanyTracksIdEndpoint:
+    def id(self, id: int) -> "CompanyTracksIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized CompanyTracksIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a CompanyTracksIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            CompanyTracksIdEndpoint: The initialized CompanyTracksIdEndpoint object.
+            CompanyTracksIdEndpoint: The CompanyTracksIdEndpoint view bound to the ID.
         """
-        child = CompanyTracksIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.CompanyTracksIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Track]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Track]:
         """
         Performs a GET request against the /company/tracks endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Track]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Track,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Track, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Track]:
         """
@@ -57,7 +54,7 @@ class CompanyTracksEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Track]: The parsed response data.
         """
-        return self._parse_many(Track, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Track, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Track:
         """
@@ -69,4 +66,8 @@ class CompanyTracksEndpoint(ConnectWiseEndpoint):
         Returns:
             Track: The parsed response data.
         """
-        return self._parse_one(Track, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Track, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "CompanyTracksCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.CompanyTracksCountEndpoint")
@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesEndpoint import ConfigurationsTypesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesEndpoint import ConfigurationsTypesEndpoint
+
 
 class ConfigurationsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "configurations"
+    _route = "configurations"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "configurations", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.types = self._register_child_endpoint(ConfigurationsTypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def types(self) -> "ConfigurationsTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ConfigurationsTypesEndpoint")
@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesIdEndpoint import ConfigurationsTypesIdEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesInfoEndpoint import ConfigurationsTypesInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesIdEndpoint import ConfigurationsTypesIdEndpoint
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesInfoEndpoint import ConfigurationsTypesInfoEndpoint
+
 
 class ConfigurationsTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "configurations/types"
 
-        self.info = self._register_child_endpoint(ConfigurationsTypesInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ConfigurationsTypesIdEndpoint:
+    def id(self, id: int) -> "ConfigurationsTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ConfigurationsTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ConfigurationsTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ConfigurationsTypesIdEndpoint: The initialized ConfigurationsTypesIdEndpoint object.
+            ConfigurationsTypesIdEndpoint: The ConfigurationsTypesIdEndpoint view bound to the ID.
         """
-        child = ConfigurationsTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ConfigurationsTypesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ConfigurationsTypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ConfigurationsTypesInfoEndpoint")
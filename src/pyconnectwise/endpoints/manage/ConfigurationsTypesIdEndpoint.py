@@ -1,14 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsEndpoint import ConfigurationsTypesIdQuestionsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsEndpoint import \
+        ConfigurationsTypesIdQuestionsEndpoint
+
 
 class ConfigurationsTypesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "configurations/types/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.questions = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def questions(self) -> "ConfigurationsTypesIdQuestionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsEndpoint")
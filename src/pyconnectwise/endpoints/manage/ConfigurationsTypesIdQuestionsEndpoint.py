@@ -1,30 +1,34 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdEndpoint import \
-    ConfigurationsTypesIdQuestionsIdEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsInfoEndpoint import \
-    ConfigurationsTypesIdQuestionsInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdEndpoint import \
+        ConfigurationsTypesIdQuestionsIdEndpoint
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsInfoEndpoint import \
+        ConfigurationsTypesIdQuestionsInfoEndpoint
+
 
 class ConfigurationsTypesIdQuestionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "questions", parent_endpoint=parent_endpoint)
+    endpoint_base = "questions"
+    _route = "configurations/types/{id}/questions"
 
-        self.info = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsInfoEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ConfigurationsTypesIdQuestionsIdEndpoint:
+    def id(self, id: int) -> "ConfigurationsTypesIdQuestionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ConfigurationsTypesIdQuestionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ConfigurationsTypesIdQuestionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ConfigurationsTypesIdQuestionsIdEndpoint: The initialized ConfigurationsTypesIdQuestionsIdEndpoint object.
+            ConfigurationsTypesIdQuestionsIdEndpoint: The ConfigurationsTypesIdQuestionsIdEndpoint view bound to the ID.
         """
-        child = ConfigurationsTypesIdQuestionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ConfigurationsTypesIdQuestionsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsInfoEndpoint")
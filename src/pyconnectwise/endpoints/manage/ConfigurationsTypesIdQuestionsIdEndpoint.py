@@ -1,20 +1,31 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdInfoEndpoint import \
-    ConfigurationsTypesIdQuestionsIdInfoEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesEndpoint import \
-    ConfigurationsTypesIdQuestionsIdValuesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdInfoEndpoint import \
+        ConfigurationsTypesIdQuestionsIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesEndpoint import \
+        ConfigurationsTypesIdQuestionsIdValuesEndpoint
+
 
 class ConfigurationsTypesIdQuestionsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "configurations/types/{id}/questions/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsIdInfoEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def info(self) -> "ConfigurationsTypesIdQuestionsIdInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdInfoEndpoint"
         )
-        self.values = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsIdValuesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def values(self) -> "ConfigurationsTypesIdQuestionsIdValuesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesEndpoint"
         )
@@ -1,30 +1,36 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesIdEndpoint import \
-    ConfigurationsTypesIdQuestionsIdValuesIdEndpoint
-from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint import \
-    ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesIdEndpoint import \
+        ConfigurationsTypesIdQuestionsIdValuesIdEndpoint
+    from pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint import \
+        ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint
+
 
 class ConfigurationsTypesIdQuestionsIdValuesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "values", parent_endpoint=parent_endpoint)
+    endpoint_base = "values"
+    _route = "configurations/types/{id}/questions/{id}/values"
 
-        self.info = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ConfigurationsTypesIdQuestionsIdValuesIdEndpoint:
+    def id(self, id: int) -> "ConfigurationsTypesIdQuestionsIdValuesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ConfigurationsTypesIdQuestionsIdValuesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ConfigurationsTypesIdQuestionsIdValuesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ConfigurationsTypesIdQuestionsIdValuesIdEndpoint: The initialized ConfigurationsTypesIdQuestionsIdValuesIdEndpoint object.
+            ConfigurationsTypesIdQuestionsIdValuesIdEndpoint: The ConfigurationsTypesIdQuestionsIdValuesIdEndpoint view bound to the ID.
         """
-        child = ConfigurationsTypesIdQuestionsIdValuesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint"
+        )
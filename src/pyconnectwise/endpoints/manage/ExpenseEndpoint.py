@@ -1,24 +1,45 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ExpenseClassificationsEndpoint import ExpenseClassificationsEndpoint
-from pyconnectwise.endpoints.manage.ExpenseEntriesEndpoint import ExpenseEntriesEndpoint
-from pyconnectwise.endpoints.manage.ExpenseInfoEndpoint import ExpenseInfoEndpoint
-from pyconnectwise.endpoints.manage.ExpensePaymenttypesEndpoint import ExpensePaymenttypesEndpoint
-from pyconnectwise.endpoints.manage.ExpenseReportsEndpoint import ExpenseReportsEndpoint
-from pyconnectwise.endpoints.manage.ExpenseTypesEndpoint import ExpenseTypesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ExpenseClassificationsEndpoint import ExpenseClassificationsEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseEntriesEndpoint import ExpenseEntriesEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseInfoEndpoint import ExpenseInfoEndpoint
+    from pyconnectwise.endpoints.manage.ExpensePaymenttypesEndpoint import ExpensePaymenttypesEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseReportsEndpoint import ExpenseReportsEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseTypesEndpoint import ExpenseTypesEndpoint
+
 
 class ExpenseEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "expense"
+    _route = "expense"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "expense", parent_endpoint=parent_endpoint)
-
-        self.info = self._register_child_endpoint(ExpenseInfoEndpoint(client, parent_endpoint=self))
-        self.classifications = self._register_child_endpoint(
-            ExpenseClassificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.payment_types = self._register_child_endpoint(ExpensePaymenttypesEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(ExpenseTypesEndpoint(client, parent_endpoint=self))
-        self.entries = self._register_child_endpoint(ExpenseEntriesEndpoint(client, parent_endpoint=self))
-        self.reports = self._register_child_endpoint(ExpenseReportsEndpoint(client, parent_endpoint=self))
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def info(self) -> "ExpenseInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseInfoEndpoint")
+
+    @cached_property
+    def classifications(self) -> "ExpenseClassificationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseClassificationsEndpoint")
+
+    @cached_property
+    def payment_types(self) -> "ExpensePaymenttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpensePaymenttypesEndpoint")
+
+    @cached_property
+    def types(self) -> "ExpenseTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseTypesEndpoint")
+
+    @cached_property
+    def entries(self) -> "ExpenseEntriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseEntriesEndpoint")
+
+    @cached_property
+    def reports(self) -> "ExpenseReportsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseReportsEndpoint")
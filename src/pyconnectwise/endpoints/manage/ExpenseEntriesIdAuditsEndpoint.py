@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ExpenseEntriesIdAuditsCountEndpoint import ExpenseEntriesIdAuditsCountEndpoint
-from pyconnectwise.endpoints.manage.ExpenseEntriesIdAuditsIdEndpoint import ExpenseEntriesIdAuditsIdEndpoint
 from pyconnectwise.models.manage import ExpenseEntryAudit
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ExpenseEntriesIdAuditsCountEndpoint import ExpenseEntriesIdAuditsCountEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseEntriesIdAuditsIdEndpoint import ExpenseEntriesIdAuditsIdEndpoint
+
 
 class ExpenseEntriesIdAuditsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "audits", parent_endpoint=parent_endpoint)
+    endpoint_base = "audits"
+    _route = "expense/entries/{id}/audits"
 
-        self.count = self._register_child_endpoint(ExpenseEntriesIdAuditsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ExpenseEntriesIdAuditsIdEndpoint:
+    def id(self, id: int) -> "ExpenseEntriesIdAuditsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ExpenseEntriesIdAuditsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ExpenseEntriesIdAuditsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ExpenseEntriesIdAuditsIdEndpoint: The initialized ExpenseEntriesIdAuditsIdEndpoint object.
+            ExpenseEntriesIdAuditsIdEndpoint: The ExpenseEntriesIdAuditsIdEndpoint view bound to the ID.
         """
-        child = ExpenseEntriesIdAuditsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ExpenseEntriesIdAuditsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ExpenseEntryAudit]:
         """
         Performs a GET request against the /expense/entries/{id}/audits endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ExpenseEntryAudit]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ExpenseEntryAudit,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ExpenseEntryAudit, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ExpenseEntryAudit]:
         """
@@ -59,4 +54,8 @@ class ExpenseEntriesIdAuditsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ExpenseEntryAudit]: The parsed response data.
         """
-        return self._parse_many(ExpenseEntryAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseEntryAudit, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ExpenseEntriesIdAuditsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseEntriesIdAuditsCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ExpensePaymenttypesCountEndpoint import ExpensePaymenttypesCountEndpoint
-from pyconnectwise.endpoints.manage.ExpensePaymenttypesIdEndpoint import ExpensePaymenttypesIdEndpoint
-from pyconnectwise.endpoints.manage.ExpensePaymenttypesInfoEndpoint import ExpensePaymenttypesInfoEndpoint
 from pyconnectwise.models.manage import PaymentType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ExpensePaymenttypesCountEndpoint import ExpensePaymenttypesCountEndpoint
+    from pyconnectwise.endpoints.manage.ExpensePaymenttypesIdEndpoint import ExpensePaymenttypesIdEndpoint
+    from pyconnectwise.endpoints.manage.ExpensePaymenttypesInfoEndpoint import ExpensePaymenttypesInfoEndpoint
+
 
 class ExpensePaymenttypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "paymentTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "paymentTypes"
+    _route = "expense/paymentTypes"
 
-        self.info = self._register_child_endpoint(ExpensePaymenttypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ExpensePaymenttypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ExpensePaymenttypesIdEndpoint:
+    def id(self, id: int) -> "ExpensePaymenttypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ExpensePaymenttypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ExpensePaymenttypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ExpensePaymenttypesIdEndpoint: The initialized ExpensePaymenttypesIdEndpoint object.
+            ExpensePaymenttypesIdEndpoint: The ExpensePaymenttypesIdEndpoint view bound to the ID.
         """
-        child = ExpensePaymenttypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ExpensePaymenttypesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[PaymentType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[PaymentType]:
         """
         Performs a GET request against the /expense/paymentTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PaymentType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PaymentType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PaymentType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PaymentType]:
         """
@@ -59,7 +55,7 @@ class ExpensePaymenttypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PaymentType]: The parsed response data.
         """
-        return self._parse_many(PaymentType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PaymentType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PaymentType:
         """
@@ -71,4 +67,12 @@ class ExpensePaymenttypesEndpoint(ConnectWiseEndpoint):
         Returns:
             PaymentType: The parsed response data.
         """
-        return self._parse_one(PaymentType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PaymentType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ExpensePaymenttypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpensePaymenttypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ExpensePaymenttypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpensePaymenttypesCountEndpoint")
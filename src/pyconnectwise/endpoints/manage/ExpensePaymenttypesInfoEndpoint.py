@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import PaymentTypeInfo
@@ -6,31 +7,27 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ExpensePaymenttypesInfoEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "expense/paymentTypes/info"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PaymentTypeInfo]:
         """
         Performs a GET request against the /expense/paymentTypes/info endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PaymentTypeInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PaymentTypeInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PaymentTypeInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PaymentTypeInfo]:
         """
@@ -42,4 +39,4 @@ class ExpensePaymenttypesInfoEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PaymentTypeInfo]: The parsed response data.
         """
-        return self._parse_many(PaymentTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PaymentTypeInfo, super()._make_request("GET", data=data, params=params).content)
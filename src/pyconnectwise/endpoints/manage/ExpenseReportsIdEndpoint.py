@@ -1,47 +1,40 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ExpenseReportsIdApproveEndpoint import ExpenseReportsIdApproveEndpoint
-from pyconnectwise.endpoints.manage.ExpenseReportsIdAuditsEndpoint import ExpenseReportsIdAuditsEndpoint
-from pyconnectwise.endpoints.manage.ExpenseReportsIdRejectEndpoint import ExpenseReportsIdRejectEndpoint
-from pyconnectwise.endpoints.manage.ExpenseReportsIdReverseEndpoint import ExpenseReportsIdReverseEndpoint
-from pyconnectwise.endpoints.manage.ExpenseReportsIdSubmitEndpoint import ExpenseReportsIdSubmitEndpoint
 from pyconnectwise.models.manage import ExpenseReport
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ExpenseReportsIdApproveEndpoint import ExpenseReportsIdApproveEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseReportsIdAuditsEndpoint import ExpenseReportsIdAuditsEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseReportsIdRejectEndpoint import ExpenseReportsIdRejectEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseReportsIdReverseEndpoint import ExpenseReportsIdReverseEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseReportsIdSubmitEndpoint import ExpenseReportsIdSubmitEndpoint
+
 
 class ExpenseReportsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "expense/reports/{id}"
 
-        self.reverse = self._register_child_endpoint(ExpenseReportsIdReverseEndpoint(client, parent_endpoint=self))
-        self.submit = self._register_child_endpoint(ExpenseReportsIdSubmitEndpoint(client, parent_endpoint=self))
-        self.reject = self._register_child_endpoint(ExpenseReportsIdRejectEndpoint(client, parent_endpoint=self))
-        self.audits = self._register_child_endpoint(ExpenseReportsIdAuditsEndpoint(client, parent_endpoint=self))
-        self.approve = self._register_child_endpoint(ExpenseReportsIdApproveEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ExpenseReport]:
         """
         Performs a GET request against the /expense/reports/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ExpenseReport]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ExpenseReport,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ExpenseReport, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ExpenseReport:
         """
@@ -53,4 +46,24 @@ class ExpenseReportsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ExpenseReport: The parsed response data.
         """
-        return self._parse_one(ExpenseReport, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ExpenseReport, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def reverse(self) -> "ExpenseReportsIdReverseEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseReportsIdReverseEndpoint")
+
+    @cached_property
+    def submit(self) -> "ExpenseReportsIdSubmitEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseReportsIdSubmitEndpoint")
+
+    @cached_property
+    def reject(self) -> "ExpenseReportsIdRejectEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseReportsIdRejectEndpoint")
+
+    @cached_property
+    def audits(self) -> "ExpenseReportsIdAuditsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseReportsIdAuditsEndpoint")
+
+    @cached_property
+    def approve(self) -> "ExpenseReportsIdApproveEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseReportsIdApproveEndpoint")
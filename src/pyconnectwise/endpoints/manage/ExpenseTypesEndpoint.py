@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ExpenseTypesCountEndpoint import ExpenseTypesCountEndpoint
-from pyconnectwise.endpoints.manage.ExpenseTypesIdEndpoint import ExpenseTypesIdEndpoint
-from pyconnectwise.endpoints.manage.ExpenseTypesInfoEndpoint import ExpenseTypesInfoEndpoint
 from pyconnectwise.models.manage import ExpenseType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ExpenseTypesCountEndpoint import ExpenseTypesCountEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseTypesIdEndpoint import ExpenseTypesIdEndpoint
+    from pyconnectwise.endpoints.manage.ExpenseTypesInfoEndpoint import ExpenseTypesInfoEndpoint
+
 
 class ExpenseTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "expense/types"
 
-        self.info = self._register_child_endpoint(ExpenseTypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ExpenseTypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ExpenseTypesIdEndpoint:
+    def id(self, id: int) -> "ExpenseTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ExpenseTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ExpenseTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ExpenseTypesIdEndpoint: The initialized ExpenseTypesIdEndpoint object.
+            ExpenseTypesIdEndpoint: The ExpenseTypesIdEndpoint view bound to the ID.
         """
-        child = ExpenseTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ExpenseTypesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ExpenseType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ExpenseType]:
         """
         Performs a GET request against the /expense/types endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ExpenseType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ExpenseType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ExpenseType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ExpenseType]:
         """
@@ -59,7 +55,7 @@ class ExpenseTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ExpenseType]: The parsed response data.
         """
-        return self._parse_many(ExpenseType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ExpenseType:
         """
@@ -71,4 +67,12 @@ class ExpenseTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             ExpenseType: The parsed response data.
         """
-        return self._parse_one(ExpenseType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ExpenseType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ExpenseTypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseTypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ExpenseTypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ExpenseTypesCountEndpoint")
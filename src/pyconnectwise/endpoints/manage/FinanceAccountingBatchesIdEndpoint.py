@@ -1,47 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesEndpoint import \
-    FinanceAccountingBatchesIdEntriesEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdExportEndpoint import \
-    FinanceAccountingBatchesIdExportEndpoint
 from pyconnectwise.models.manage import AccountingBatch
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesEndpoint import \
+        FinanceAccountingBatchesIdEntriesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdExportEndpoint import \
+        FinanceAccountingBatchesIdExportEndpoint
+
 
 class FinanceAccountingBatchesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "finance/accounting/batches/{id}"
 
-        self.entries = self._register_child_endpoint(
-            FinanceAccountingBatchesIdEntriesEndpoint(client, parent_endpoint=self)
-        )
-        self.export = self._register_child_endpoint(
-            FinanceAccountingBatchesIdExportEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AccountingBatch]:
         """
         Performs a GET request against the /finance/accounting/batches/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AccountingBatch]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AccountingBatch,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AccountingBatch, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AccountingBatch:
         """
@@ -53,7 +45,7 @@ class FinanceAccountingBatchesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AccountingBatch: The parsed response data.
         """
-        return self._parse_one(AccountingBatch, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AccountingBatch, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -64,3 +56,11 @@ class FinanceAccountingBatchesIdEndpoint(ConnectWiseEndpoint):
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def entries(self) -> "FinanceAccountingBatchesIdEntriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesEndpoint")
+
+    @cached_property
+    def export(self) -> "FinanceAccountingBatchesIdExportEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdExportEndpoint")
@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesCountEndpoint import \
-    FinanceAccountingBatchesIdEntriesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesIdEndpoint import \
-    FinanceAccountingBatchesIdEntriesIdEndpoint
 from pyconnectwise.models.manage import BatchEntry
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesCountEndpoint import \
+        FinanceAccountingBatchesIdEntriesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesIdEndpoint import \
+        FinanceAccountingBatchesIdEntriesIdEndpoint
+
 
 class FinanceAccountingBatchesIdEntriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "entries", parent_endpoint=parent_endpoint)
+    endpoint_base = "entries"
+    _route = "finance/accounting/batches/{id}/entries"
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingBatchesIdEntriesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAccountingBatchesIdEntriesIdEndpoint:
+    def id(self, id: int) -> "FinanceAccountingBatchesIdEntriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAccountingBatchesIdEntriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAccountingBatchesIdEntriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAccountingBatchesIdEntriesIdEndpoint: The initialized FinanceAccountingBatchesIdEntriesIdEndpoint object.
+            FinanceAccountingBatchesIdEntriesIdEndpoint: The FinanceAccountingBatchesIdEntriesIdEndpoint view bound to the ID.
         """
-        child = FinanceAccountingBatchesIdEntriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[BatchEntry]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[BatchEntry]:
         """
         Performs a GET request against the /finance/accounting/batches/{id}/entries endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BatchEntry]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BatchEntry,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BatchEntry, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[BatchEntry]:
         """
@@ -61,4 +56,10 @@ class FinanceAccountingBatchesIdEntriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[BatchEntry]: The parsed response data.
         """
-        return self._parse_many(BatchEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BatchEntry, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceAccountingBatchesIdEntriesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAccountingBatchesIdEntriesCountEndpoint"
+        )
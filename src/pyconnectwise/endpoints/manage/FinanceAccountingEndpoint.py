@@ -1,29 +1,45 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingBatchesEndpoint import FinanceAccountingBatchesEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingExportEndpoint import FinanceAccountingExportEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesEndpoint import \
-    FinanceAccountingUnpostedexpensesEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesEndpoint import \
-    FinanceAccountingUnpostedinvoicesEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementEndpoint import \
-    FinanceAccountingUnpostedprocurementEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAccountingBatchesEndpoint import FinanceAccountingBatchesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingExportEndpoint import FinanceAccountingExportEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesEndpoint import \
+        FinanceAccountingUnpostedexpensesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesEndpoint import \
+        FinanceAccountingUnpostedinvoicesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementEndpoint import \
+        FinanceAccountingUnpostedprocurementEndpoint
+
 
 class FinanceAccountingEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "accounting"
+    _route = "finance/accounting"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "accounting", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.unpostedexpenses = self._register_child_endpoint(
-            FinanceAccountingUnpostedexpensesEndpoint(client, parent_endpoint=self)
-        )
-        self.unpostedinvoices = self._register_child_endpoint(
-            FinanceAccountingUnpostedinvoicesEndpoint(client, parent_endpoint=self)
-        )
-        self.batches = self._register_child_endpoint(FinanceAccountingBatchesEndpoint(client, parent_endpoint=self))
-        self.unpostedprocurement = self._register_child_endpoint(
-            FinanceAccountingUnpostedprocurementEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def unpostedexpenses(self) -> "FinanceAccountingUnpostedexpensesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesEndpoint")
+
+    @cached_property
+    def unpostedinvoices(self) -> "FinanceAccountingUnpostedinvoicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesEndpoint")
+
+    @cached_property
+    def batches(self) -> "FinanceAccountingBatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingBatchesEndpoint")
+
+    @cached_property
+    def unpostedprocurement(self) -> "FinanceAccountingUnpostedprocurementEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementEndpoint"
         )
-        self.export = self._register_child_endpoint(FinanceAccountingExportEndpoint(client, parent_endpoint=self))
+
+    @cached_property
+    def export(self) -> "FinanceAccountingExportEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingExportEndpoint")
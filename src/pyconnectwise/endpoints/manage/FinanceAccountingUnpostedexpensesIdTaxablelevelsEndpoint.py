@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint import \
-    FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint import \
-    FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint
 from pyconnectwise.models.manage import UnpostedExpenseTaxableLevel
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint import \
+        FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint import \
+        FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint
+
 
 class FinanceAccountingUnpostedexpensesIdTaxablelevelsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "taxableLevels", parent_endpoint=parent_endpoint)
+    endpoint_base = "taxableLevels"
+    _route = "finance/accounting/unpostedexpenses/{id}/taxableLevels"
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint:
+    def id(self, id: int) -> "FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint: The initialized FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint object.
+            FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint: The FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint view bound to the ID.
         """
-        child = FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[UnpostedExpenseTaxableLevel]:
         """
         Performs a GET request against the /finance/accounting/unpostedexpenses/{id}/taxableLevels endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[UnpostedExpenseTaxableLevel]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            UnpostedExpenseTaxableLevel,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(UnpostedExpenseTaxableLevel, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[UnpostedExpenseTaxableLevel]:
         """
@@ -64,5 +59,11 @@ class FinanceAccountingUnpostedexpensesIdTaxablelevelsEndpoint(ConnectWiseEndpoi
             list[UnpostedExpenseTaxableLevel]: The parsed response data.
         """
         return self._parse_many(
-            UnpostedExpenseTaxableLevel, super()._make_request("GET", data=data, params=params).json()
+            UnpostedExpenseTaxableLevel, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint"
         )
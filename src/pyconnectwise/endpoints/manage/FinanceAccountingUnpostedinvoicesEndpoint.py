@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesCountEndpoint import \
-    FinanceAccountingUnpostedinvoicesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesIdEndpoint import \
-    FinanceAccountingUnpostedinvoicesIdEndpoint
 from pyconnectwise.models.manage import UnpostedInvoice
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesCountEndpoint import \
+        FinanceAccountingUnpostedinvoicesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesIdEndpoint import \
+        FinanceAccountingUnpostedinvoicesIdEndpoint
+
 
 class FinanceAccountingUnpostedinvoicesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "unpostedinvoices", parent_endpoint=parent_endpoint)
+    endpoint_base = "unpostedinvoices"
+    _route = "finance/accounting/unpostedinvoices"
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedinvoicesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAccountingUnpostedinvoicesIdEndpoint:
+    def id(self, id: int) -> "FinanceAccountingUnpostedinvoicesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedinvoicesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAccountingUnpostedinvoicesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAccountingUnpostedinvoicesIdEndpoint: The initialized FinanceAccountingUnpostedinvoicesIdEndpoint object.
+            FinanceAccountingUnpostedinvoicesIdEndpoint: The FinanceAccountingUnpostedinvoicesIdEndpoint view bound to the ID.
         """
-        child = FinanceAccountingUnpostedinvoicesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[UnpostedInvoice]:
         """
         Performs a GET request against the /finance/accounting/unpostedinvoices endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[UnpostedInvoice]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            UnpostedInvoice,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(UnpostedInvoice, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[UnpostedInvoice]:
         """
@@ -63,4 +56,10 @@ class FinanceAccountingUnpostedinvoicesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[UnpostedInvoice]: The parsed response data.
         """
-        return self._parse_many(UnpostedInvoice, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(UnpostedInvoice, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceAccountingUnpostedinvoicesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAccountingUnpostedinvoicesCountEndpoint"
+        )
@@ -1,42 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint import \
-    FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint
 from pyconnectwise.models.manage import UnpostedProcurement
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint import \
+        FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint
+
 
 class FinanceAccountingUnpostedprocurementIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "finance/accounting/unpostedprocurement/{id}"
 
-        self.taxable_levels = self._register_child_endpoint(
-            FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[UnpostedProcurement]:
         """
         Performs a GET request against the /finance/accounting/unpostedprocurement/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[UnpostedProcurement]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            UnpostedProcurement,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(UnpostedProcurement, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> UnpostedProcurement:
         """
@@ -48,4 +43,10 @@ class FinanceAccountingUnpostedprocurementIdEndpoint(ConnectWiseEndpoint):
         Returns:
             UnpostedProcurement: The parsed response data.
         """
-        return self._parse_one(UnpostedProcurement, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(UnpostedProcurement, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def taxable_levels(self) -> "FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint"
+        )
@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint import \
-    FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint import \
-    FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint
 from pyconnectwise.models.manage import UnpostedProcurementTaxableLevel
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint import \
+        FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint import \
+        FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint
+
 
 class FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "taxableLevels", parent_endpoint=parent_endpoint)
+    endpoint_base = "taxableLevels"
+    _route = "finance/accounting/unpostedprocurement/{id}/taxableLevels"
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint:
+    def id(self, id: int) -> "FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint: The initialized FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint object.
+            FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint: The FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint view bound to the ID.
         """
-        child = FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[UnpostedProcurementTaxableLevel]:
         """
         Performs a GET request against the /finance/accounting/unpostedprocurement/{id}/taxableLevels endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[UnpostedProcurementTaxableLevel]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            UnpostedProcurementTaxableLevel,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(UnpostedProcurementTaxableLevel, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -66,5 +61,11 @@ class FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint(ConnectWiseEnd
             list[UnpostedProcurementTaxableLevel]: The parsed response data.
         """
         return self._parse_many(
-            UnpostedProcurementTaxableLevel, super()._make_request("GET", data=data, params=params).json()
+            UnpostedProcurementTaxableLevel, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint"
         )
@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementrecapIdEndpoint import FinanceAgreementrecapIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementrecapIdEndpoint import FinanceAgreementrecapIdEndpoint
+
 
 class FinanceAgreementrecapEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "agreementrecap"
+    _route = "finance/agreementrecap"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "agreementrecap", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementrecapIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementrecapIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementrecapIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementrecapIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementrecapIdEndpoint: The initialized FinanceAgreementrecapIdEndpoint object.
+            FinanceAgreementrecapIdEndpoint: The FinanceAgreementrecapIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementrecapIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementrecapIdEndpoint", id)
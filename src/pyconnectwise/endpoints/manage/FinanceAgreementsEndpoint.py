@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsCountEndpoint import FinanceAgreementsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdEndpoint import FinanceAgreementsIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsTypesEndpoint import FinanceAgreementsTypesEndpoint
 from pyconnectwise.models.manage import Agreement
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsCountEndpoint import FinanceAgreementsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdEndpoint import FinanceAgreementsIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsTypesEndpoint import FinanceAgreementsTypesEndpoint
+
 
 class FinanceAgreementsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "agreements", parent_endpoint=parent_endpoint)
+    endpoint_base = "agreements"
+    _route = "finance/agreements"
 
-        self.types = self._register_child_endpoint(FinanceAgreementsTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(FinanceAgreementsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdEndpoint: The initialized FinanceAgreementsIdEndpoint object.
+            FinanceAgreementsIdEndpoint: The FinanceAgreementsIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Agreement]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Agreement]:
         """
         Performs a GET request against the /finance/agreements endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Agreement]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Agreement,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Agreement, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Agreement]:
         """
@@ -59,7 +55,7 @@ class FinanceAgreementsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Agreement]: The parsed response data.
         """
-        return self._parse_many(Agreement, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Agreement, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Agreement:
         """
@@ -71,4 +67,12 @@ class FinanceAgreementsEndpoint(ConnectWiseEndpoint):
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def types(self) -> "FinanceAgreementsTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceAgreementsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsCountEndpoint")
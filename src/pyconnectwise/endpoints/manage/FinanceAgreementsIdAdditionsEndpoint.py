@@ -1,54 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsCountEndpoint import \
-    FinanceAgreementsIdAdditionsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsIdEndpoint import FinanceAgreementsIdAdditionsIdEndpoint
 from pyconnectwise.models.manage import Addition
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsCountEndpoint import \
+        FinanceAgreementsIdAdditionsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsIdEndpoint import \
+        FinanceAgreementsIdAdditionsIdEndpoint
+
 
 class FinanceAgreementsIdAdditionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "additions", parent_endpoint=parent_endpoint)
+    endpoint_base = "additions"
+    _route = "finance/agreements/{id}/additions"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdAdditionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdAdditionsIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdAdditionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdAdditionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdAdditionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdAdditionsIdEndpoint: The initialized FinanceAgreementsIdAdditionsIdEndpoint object.
+            FinanceAgreementsIdAdditionsIdEndpoint: The FinanceAgreementsIdAdditionsIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdAdditionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Addition]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Addition]:
         """
         Performs a GET request against the /finance/agreements/{id}/additions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Addition]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Addition,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Addition, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Addition]:
         """
@@ -60,7 +56,7 @@ class FinanceAgreementsIdAdditionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Addition]: The parsed response data.
         """
-        return self._parse_many(Addition, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Addition, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Addition:
         """
@@ -72,4 +68,8 @@ class FinanceAgreementsIdAdditionsEndpoint(ConnectWiseEndpoint):
         Returns:
             Addition: The parsed response data.
         """
-        return self._parse_one(Addition, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Addition, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceAgreementsIdAdditionsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsCountEndpoint")
@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdApplicationparametersIdEndpoint import \
-    FinanceAgreementsIdApplicationparametersIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdApplicationparametersIdEndpoint import \
+        FinanceAgreementsIdApplicationparametersIdEndpoint
+
 
 class FinanceAgreementsIdApplicationparametersEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "applicationParameters"
+    _route = "finance/agreements/{id}/applicationParameters"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "applicationParameters", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdApplicationparametersIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdApplicationparametersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdApplicationparametersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdApplicationparametersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdApplicationparametersIdEndpoint: The initialized FinanceAgreementsIdApplicationparametersIdEndpoint object.
+            FinanceAgreementsIdApplicationparametersIdEndpoint: The FinanceAgreementsIdApplicationparametersIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdApplicationparametersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdApplicationparametersIdEndpoint", id)
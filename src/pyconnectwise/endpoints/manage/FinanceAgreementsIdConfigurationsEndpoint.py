@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsCountEndpoint import \
-    FinanceAgreementsIdConfigurationsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsIdEndpoint import \
-    FinanceAgreementsIdConfigurationsIdEndpoint
 from pyconnectwise.models.manage import ConfigurationReference
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsCountEndpoint import \
+        FinanceAgreementsIdConfigurationsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsIdEndpoint import \
+        FinanceAgreementsIdConfigurationsIdEndpoint
+
 
 class FinanceAgreementsIdConfigurationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "configurations", parent_endpoint=parent_endpoint)
+    endpoint_base = "configurations"
+    _route = "finance/agreements/{id}/configurations"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdConfigurationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdConfigurationsIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdConfigurationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdConfigurationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdConfigurationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdConfigurationsIdEndpoint: The initialized FinanceAgreementsIdConfigurationsIdEndpoint object.
+            FinanceAgreementsIdConfigurationsIdEndpoint: The FinanceAgreementsIdConfigurationsIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdConfigurationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ConfigurationReference]:
         """
         Performs a GET request against the /finance/agreements/{id}/configurations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ConfigurationReference]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ConfigurationReference,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ConfigurationReference, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ConfigurationReference]:
         """
@@ -63,7 +56,7 @@ class FinanceAgreementsIdConfigurationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ConfigurationReference]: The parsed response data.
         """
-        return self._parse_many(ConfigurationReference, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConfigurationReference, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ConfigurationReference:
         """
@@ -75,4 +68,10 @@ class FinanceAgreementsIdConfigurationsEndpoint(ConnectWiseEndpoint):
         Returns:
             ConfigurationReference: The parsed response data.
         """
-        return self._parse_one(ConfigurationReference, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ConfigurationReference, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceAgreementsIdConfigurationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsCountEndpoint"
+        )
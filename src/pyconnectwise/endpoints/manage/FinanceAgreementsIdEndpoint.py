@@ -1,87 +1,55 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsEndpoint import FinanceAgreementsIdAdditionsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdAdjustmentsEndpoint import FinanceAgreementsIdAdjustmentsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdApplicationparametersEndpoint import \
-    FinanceAgreementsIdApplicationparametersEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdBoarddefaultsEndpoint import \
-    FinanceAgreementsIdBoarddefaultsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsEndpoint import \
-    FinanceAgreementsIdConfigurationsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdCopyEndpoint import FinanceAgreementsIdCopyEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdInvoiceEndpoint import FinanceAgreementsIdInvoiceEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdRecurringparametersEndpoint import \
-    FinanceAgreementsIdRecurringparametersEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesEndpoint import FinanceAgreementsIdSitesEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsEndpoint import \
-    FinanceAgreementsIdWorkroleexclusionsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkrolesEndpoint import FinanceAgreementsIdWorkrolesEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsEndpoint import \
-    FinanceAgreementsIdWorktypeexclusionsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesEndpoint import FinanceAgreementsIdWorktypesEndpoint
 from pyconnectwise.models.manage import Agreement
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsEndpoint import FinanceAgreementsIdAdditionsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdAdjustmentsEndpoint import \
+        FinanceAgreementsIdAdjustmentsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdApplicationparametersEndpoint import \
+        FinanceAgreementsIdApplicationparametersEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdBoarddefaultsEndpoint import \
+        FinanceAgreementsIdBoarddefaultsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsEndpoint import \
+        FinanceAgreementsIdConfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdCopyEndpoint import FinanceAgreementsIdCopyEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdInvoiceEndpoint import FinanceAgreementsIdInvoiceEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdRecurringparametersEndpoint import \
+        FinanceAgreementsIdRecurringparametersEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesEndpoint import FinanceAgreementsIdSitesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsEndpoint import \
+        FinanceAgreementsIdWorkroleexclusionsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkrolesEndpoint import FinanceAgreementsIdWorkrolesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsEndpoint import \
+        FinanceAgreementsIdWorktypeexclusionsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesEndpoint import FinanceAgreementsIdWorktypesEndpoint
+
 
 class FinanceAgreementsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "finance/agreements/{id}"
 
-        self.additions = self._register_child_endpoint(
-            FinanceAgreementsIdAdditionsEndpoint(client, parent_endpoint=self)
-        )
-        self.recurring_parameters = self._register_child_endpoint(
-            FinanceAgreementsIdRecurringparametersEndpoint(client, parent_endpoint=self)
-        )
-        self.workroles = self._register_child_endpoint(
-            FinanceAgreementsIdWorkrolesEndpoint(client, parent_endpoint=self)
-        )
-        self.application_parameters = self._register_child_endpoint(
-            FinanceAgreementsIdApplicationparametersEndpoint(client, parent_endpoint=self)
-        )
-        self.copy = self._register_child_endpoint(FinanceAgreementsIdCopyEndpoint(client, parent_endpoint=self))
-        self.board_defaults = self._register_child_endpoint(
-            FinanceAgreementsIdBoarddefaultsEndpoint(client, parent_endpoint=self)
-        )
-        self.work_type_exclusions = self._register_child_endpoint(
-            FinanceAgreementsIdWorktypeexclusionsEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice = self._register_child_endpoint(FinanceAgreementsIdInvoiceEndpoint(client, parent_endpoint=self))
-        self.worktypes = self._register_child_endpoint(
-            FinanceAgreementsIdWorktypesEndpoint(client, parent_endpoint=self)
-        )
-        self.adjustments = self._register_child_endpoint(
-            FinanceAgreementsIdAdjustmentsEndpoint(client, parent_endpoint=self)
-        )
-        self.sites = self._register_child_endpoint(FinanceAgreementsIdSitesEndpoint(client, parent_endpoint=self))
-        self.work_role_exclusions = self._register_child_endpoint(
-            FinanceAgreementsIdWorkroleexclusionsEndpoint(client, parent_endpoint=self)
-        )
-        self.configurations = self._register_child_endpoint(
-            FinanceAgreementsIdConfigurationsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Agreement]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Agreement]:
         """
         Performs a GET request against the /finance/agreements/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Agreement]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Agreement,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Agreement, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Agreement:
         """
@@ -93,7 +61,7 @@ class FinanceAgreementsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -115,7 +83,7 @@ class FinanceAgreementsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Agreement:
         """
@@ -127,4 +95,64 @@ class FinanceAgreementsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def additions(self) -> "FinanceAgreementsIdAdditionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdAdditionsEndpoint")
+
+    @cached_property
+    def recurring_parameters(self) -> "FinanceAgreementsIdRecurringparametersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementsIdRecurringparametersEndpoint"
+        )
+
+    @cached_property
+    def workroles(self) -> "FinanceAgreementsIdWorkrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkrolesEndpoint")
+
+    @cached_property
+    def application_parameters(self) -> "FinanceAgreementsIdApplicationparametersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementsIdApplicationparametersEndpoint"
+        )
+
+    @cached_property
+    def copy(self) -> "FinanceAgreementsIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdCopyEndpoint")
+
+    @cached_property
+    def board_defaults(self) -> "FinanceAgreementsIdBoarddefaultsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdBoarddefaultsEndpoint")
+
+    @cached_property
+    def work_type_exclusions(self) -> "FinanceAgreementsIdWorktypeexclusionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsEndpoint"
+        )
+
+    @cached_property
+    def invoice(self) -> "FinanceAgreementsIdInvoiceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdInvoiceEndpoint")
+
+    @cached_property
+    def worktypes(self) -> "FinanceAgreementsIdWorktypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesEndpoint")
+
+    @cached_property
+    def adjustments(self) -> "FinanceAgreementsIdAdjustmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdAdjustmentsEndpoint")
+
+    @cached_property
+    def sites(self) -> "FinanceAgreementsIdSitesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesEndpoint")
+
+    @cached_property
+    def work_role_exclusions(self) -> "FinanceAgreementsIdWorkroleexclusionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsEndpoint"
+        )
+
+    @cached_property
+    def configurations(self) -> "FinanceAgreementsIdConfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdConfigurationsEndpoint")
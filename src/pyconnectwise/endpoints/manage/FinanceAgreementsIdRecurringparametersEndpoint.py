@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdRecurringparametersIdEndpoint import \
-    FinanceAgreementsIdRecurringparametersIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdRecurringparametersIdEndpoint import \
+        FinanceAgreementsIdRecurringparametersIdEndpoint
+
 
 class FinanceAgreementsIdRecurringparametersEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "recurringParameters"
+    _route = "finance/agreements/{id}/recurringParameters"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "recurringParameters", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdRecurringparametersIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdRecurringparametersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdRecurringparametersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdRecurringparametersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdRecurringparametersIdEndpoint: The initialized FinanceAgreementsIdRecurringparametersIdEndpoint object.
+            FinanceAgreementsIdRecurringparametersIdEndpoint: The FinanceAgreementsIdRecurringparametersIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdRecurringparametersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdRecurringparametersIdEndpoint", id)
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesCountEndpoint import FinanceAgreementsIdSitesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesIdEndpoint import FinanceAgreementsIdSitesIdEndpoint
 from pyconnectwise.models.manage import AgreementSite
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesCountEndpoint import \
+        FinanceAgreementsIdSitesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesIdEndpoint import FinanceAgreementsIdSitesIdEndpoint
+
 
 class FinanceAgreementsIdSitesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "sites", parent_endpoint=parent_endpoint)
+    endpoint_base = "sites"
+    _route = "finance/agreements/{id}/sites"
 
-        self.count = self._register_child_endpoint(FinanceAgreementsIdSitesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdSitesIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdSitesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdSitesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdSitesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdSitesIdEndpoint: The initialized FinanceAgreementsIdSitesIdEndpoint object.
+            FinanceAgreementsIdSitesIdEndpoint: The FinanceAgreementsIdSitesIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdSitesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementSite]:
         """
         Performs a GET request against the /finance/agreements/{id}/sites endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementSite]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementSite,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementSite, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementSite]:
         """
@@ -59,7 +55,7 @@ class FinanceAgreementsIdSitesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AgreementSite]: The parsed response data.
         """
-        return self._parse_many(AgreementSite, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementSite, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementSite:
         """
@@ -71,4 +67,8 @@ class FinanceAgreementsIdSitesEndpoint(ConnectWiseEndpoint):
         Returns:
             AgreementSite: The parsed response data.
         """
-        return self._parse_one(AgreementSite, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementSite, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceAgreementsIdSitesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdSitesCountEndpoint")
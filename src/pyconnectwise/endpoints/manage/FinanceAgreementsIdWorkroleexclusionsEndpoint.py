@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsCountEndpoint import \
-    FinanceAgreementsIdWorkroleexclusionsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsIdEndpoint import \
-    FinanceAgreementsIdWorkroleexclusionsIdEndpoint
 from pyconnectwise.models.manage import AgreementWorkRoleExclusion
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsCountEndpoint import \
+        FinanceAgreementsIdWorkroleexclusionsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsIdEndpoint import \
+        FinanceAgreementsIdWorkroleexclusionsIdEndpoint
+
 
 class FinanceAgreementsIdWorkroleexclusionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "workRoleExclusions", parent_endpoint=parent_endpoint)
+    endpoint_base = "workRoleExclusions"
+    _route = "finance/agreements/{id}/workRoleExclusions"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdWorkroleexclusionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdWorkroleexclusionsIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdWorkroleexclusionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorkroleexclusionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdWorkroleexclusionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdWorkroleexclusionsIdEndpoint: The initialized FinanceAgreementsIdWorkroleexclusionsIdEndpoint object.
+            FinanceAgreementsIdWorkroleexclusionsIdEndpoint: The FinanceAgreementsIdWorkroleexclusionsIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdWorkroleexclusionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementWorkRoleExclusion]:
         """
         Performs a GET request against the /finance/agreements/{id}/workRoleExclusions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementWorkRoleExclusion]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementWorkRoleExclusion,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementWorkRoleExclusion, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementWorkRoleExclusion]:
         """
@@ -64,7 +57,7 @@ class FinanceAgreementsIdWorkroleexclusionsEndpoint(ConnectWiseEndpoint):
             list[AgreementWorkRoleExclusion]: The parsed response data.
         """
         return self._parse_many(
-            AgreementWorkRoleExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementWorkRoleExclusion, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementWorkRoleExclusion:
@@ -78,5 +71,11 @@ class FinanceAgreementsIdWorkroleexclusionsEndpoint(ConnectWiseEndpoint):
             AgreementWorkRoleExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementWorkRoleExclusion, super()._make_request("POST", data=data, params=params).json()
+            AgreementWorkRoleExclusion, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "FinanceAgreementsIdWorkroleexclusionsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementsIdWorkroleexclusionsCountEndpoint"
         )
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsCountEndpoint import \
-    FinanceAgreementsIdWorktypeexclusionsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsIdEndpoint import \
-    FinanceAgreementsIdWorktypeexclusionsIdEndpoint
 from pyconnectwise.models.manage import AgreementWorkTypeExclusion
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsCountEndpoint import \
+        FinanceAgreementsIdWorktypeexclusionsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsIdEndpoint import \
+        FinanceAgreementsIdWorktypeexclusionsIdEndpoint
+
 
 class FinanceAgreementsIdWorktypeexclusionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "workTypeExclusions", parent_endpoint=parent_endpoint)
+    endpoint_base = "workTypeExclusions"
+    _route = "finance/agreements/{id}/workTypeExclusions"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdWorktypeexclusionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdWorktypeexclusionsIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdWorktypeexclusionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorktypeexclusionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdWorktypeexclusionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdWorktypeexclusionsIdEndpoint: The initialized FinanceAgreementsIdWorktypeexclusionsIdEndpoint object.
+            FinanceAgreementsIdWorktypeexclusionsIdEndpoint: The FinanceAgreementsIdWorktypeexclusionsIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdWorktypeexclusionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementWorkTypeExclusion]:
         """
         Performs a GET request against the /finance/agreements/{id}/workTypeExclusions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementWorkTypeExclusion]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementWorkTypeExclusion,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementWorkTypeExclusion, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementWorkTypeExclusion]:
         """
@@ -64,7 +57,7 @@ class FinanceAgreementsIdWorktypeexclusionsEndpoint(ConnectWiseEndpoint):
             list[AgreementWorkTypeExclusion]: The parsed response data.
         """
         return self._parse_many(
-            AgreementWorkTypeExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementWorkTypeExclusion, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementWorkTypeExclusion:
@@ -78,5 +71,11 @@ class FinanceAgreementsIdWorktypeexclusionsEndpoint(ConnectWiseEndpoint):
             AgreementWorkTypeExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementWorkTypeExclusion, super()._make_request("POST", data=data, params=params).json()
+            AgreementWorkTypeExclusion, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "FinanceAgreementsIdWorktypeexclusionsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypeexclusionsCountEndpoint"
         )
@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesCountEndpoint import \
-    FinanceAgreementsIdWorktypesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesIdEndpoint import FinanceAgreementsIdWorktypesIdEndpoint
 from pyconnectwise.models.manage import AgreementWorkType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesCountEndpoint import \
+        FinanceAgreementsIdWorktypesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesIdEndpoint import \
+        FinanceAgreementsIdWorktypesIdEndpoint
+
 
 class FinanceAgreementsIdWorktypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "worktypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "worktypes"
+    _route = "finance/agreements/{id}/worktypes"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdWorktypesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementsIdWorktypesIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementsIdWorktypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorktypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementsIdWorktypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementsIdWorktypesIdEndpoint: The initialized FinanceAgreementsIdWorktypesIdEndpoint object.
+            FinanceAgreementsIdWorktypesIdEndpoint: The FinanceAgreementsIdWorktypesIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementsIdWorktypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementWorkType]:
         """
         Performs a GET request against the /finance/agreements/{id}/worktypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementWorkType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementWorkType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementWorkType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementWorkType]:
         """
@@ -62,7 +56,7 @@ class FinanceAgreementsIdWorktypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AgreementWorkType]: The parsed response data.
         """
-        return self._parse_many(AgreementWorkType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementWorkType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementWorkType:
         """
@@ -74,4 +68,8 @@ class FinanceAgreementsIdWorktypesEndpoint(ConnectWiseEndpoint):
         Returns:
             AgreementWorkType: The parsed response data.
         """
-        return self._parse_one(AgreementWorkType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementWorkType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceAgreementsIdWorktypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsIdWorktypesCountEndpoint")
@@ -1,45 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdCopyEndpoint import FinanceAgreementsTypesIdCopyEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdInfoEndpoint import FinanceAgreementsTypesIdInfoEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdUsagesEndpoint import FinanceAgreementsTypesIdUsagesEndpoint
 from pyconnectwise.models.manage import AgreementType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdCopyEndpoint import FinanceAgreementsTypesIdCopyEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdInfoEndpoint import FinanceAgreementsTypesIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdUsagesEndpoint import \
+        FinanceAgreementsTypesIdUsagesEndpoint
+
 
 class FinanceAgreementsTypesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "finance/agreements/types/{id}"
 
-        self.usages = self._register_child_endpoint(
-            FinanceAgreementsTypesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(FinanceAgreementsTypesIdInfoEndpoint(client, parent_endpoint=self))
-        self.copy = self._register_child_endpoint(FinanceAgreementsTypesIdCopyEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementType]:
         """
         Performs a GET request against the /finance/agreements/types/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementType:
         """
@@ -51,7 +45,7 @@ class FinanceAgreementsTypesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AgreementType: The parsed response data.
         """
-        return self._parse_one(AgreementType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AgreementType, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -73,7 +67,7 @@ class FinanceAgreementsTypesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AgreementType: The parsed response data.
         """
-        return self._parse_one(AgreementType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(AgreementType, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementType:
         """
@@ -85,4 +79,16 @@ class FinanceAgreementsTypesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             AgreementType: The parsed response data.
         """
-        return self._parse_one(AgreementType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(AgreementType, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "FinanceAgreementsTypesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdUsagesEndpoint")
+
+    @cached_property
+    def info(self) -> "FinanceAgreementsTypesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdInfoEndpoint")
+
+    @cached_property
+    def copy(self) -> "FinanceAgreementsTypesIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsTypesIdCopyEndpoint")
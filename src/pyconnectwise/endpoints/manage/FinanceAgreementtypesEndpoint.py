@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdEndpoint import FinanceAgreementtypesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdEndpoint import FinanceAgreementtypesIdEndpoint
+
 
 class FinanceAgreementtypesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "agreementTypes"
+    _route = "finance/agreementTypes"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "agreementTypes", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementtypesIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementtypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementtypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementtypesIdEndpoint: The initialized FinanceAgreementtypesIdEndpoint object.
+            FinanceAgreementtypesIdEndpoint: The FinanceAgreementtypesIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementtypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementtypesIdEndpoint", id)
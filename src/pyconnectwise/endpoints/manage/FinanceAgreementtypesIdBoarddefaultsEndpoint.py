@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsCountEndpoint import \
-    FinanceAgreementtypesIdBoarddefaultsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsIdEndpoint import \
-    FinanceAgreementtypesIdBoarddefaultsIdEndpoint
 from pyconnectwise.models.manage import AgreementTypeBoardDefault
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsCountEndpoint import \
+        FinanceAgreementtypesIdBoarddefaultsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsIdEndpoint import \
+        FinanceAgreementtypesIdBoarddefaultsIdEndpoint
+
 
 class FinanceAgreementtypesIdBoarddefaultsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "boardDefaults", parent_endpoint=parent_endpoint)
+    endpoint_base = "boardDefaults"
+    _route = "finance/agreementTypes/{id}/boardDefaults"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdBoarddefaultsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementtypesIdBoarddefaultsIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementtypesIdBoarddefaultsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdBoarddefaultsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementtypesIdBoarddefaultsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementtypesIdBoarddefaultsIdEndpoint: The initialized FinanceAgreementtypesIdBoarddefaultsIdEndpoint object.
+            FinanceAgreementtypesIdBoarddefaultsIdEndpoint: The FinanceAgreementtypesIdBoarddefaultsIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementtypesIdBoarddefaultsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementTypeBoardDefault]:
         """
         Performs a GET request against the /finance/agreementTypes/{id}/boardDefaults endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementTypeBoardDefault]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementTypeBoardDefault,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementTypeBoardDefault, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementTypeBoardDefault]:
         """
@@ -64,7 +57,7 @@ class FinanceAgreementtypesIdBoarddefaultsEndpoint(ConnectWiseEndpoint):
             list[AgreementTypeBoardDefault]: The parsed response data.
         """
         return self._parse_many(
-            AgreementTypeBoardDefault, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeBoardDefault, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementTypeBoardDefault:
@@ -78,5 +71,11 @@ class FinanceAgreementtypesIdBoarddefaultsEndpoint(ConnectWiseEndpoint):
             AgreementTypeBoardDefault: The parsed response data.
         """
         return self._parse_one(
-            AgreementTypeBoardDefault, super()._make_request("POST", data=data, params=params).json()
+            AgreementTypeBoardDefault, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "FinanceAgreementtypesIdBoarddefaultsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsCountEndpoint"
         )
@@ -1,35 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsEndpoint import \
-    FinanceAgreementtypesIdBoarddefaultsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkroleexclusionsEndpoint import \
-    FinanceAgreementtypesIdWorkroleexclusionsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesEndpoint import \
-    FinanceAgreementtypesIdWorkrolesEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsEndpoint import \
-    FinanceAgreementtypesIdWorktypeexclusionsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesEndpoint import \
-    FinanceAgreementtypesIdWorktypesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsEndpoint import \
+        FinanceAgreementtypesIdBoarddefaultsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkroleexclusionsEndpoint import \
+        FinanceAgreementtypesIdWorkroleexclusionsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesEndpoint import \
+        FinanceAgreementtypesIdWorkrolesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsEndpoint import \
+        FinanceAgreementtypesIdWorktypeexclusionsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesEndpoint import \
+        FinanceAgreementtypesIdWorktypesEndpoint
+
 
 class FinanceAgreementtypesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "finance/agreementTypes/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.workroles = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkrolesEndpoint(client, parent_endpoint=self)
-        )
-        self.board_defaults = self._register_child_endpoint(
-            FinanceAgreementtypesIdBoarddefaultsEndpoint(client, parent_endpoint=self)
-        )
-        self.work_type_exclusions = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorktypeexclusionsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def workroles(self) -> "FinanceAgreementtypesIdWorkrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesEndpoint")
+
+    @cached_property
+    def board_defaults(self) -> "FinanceAgreementtypesIdBoarddefaultsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdBoarddefaultsEndpoint"
         )
-        self.work_role_exclusions = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkroleexclusionsEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def work_type_exclusions(self) -> "FinanceAgreementtypesIdWorktypeexclusionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsEndpoint"
         )
-        self.worktypes = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorktypesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def work_role_exclusions(self) -> "FinanceAgreementtypesIdWorkroleexclusionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkroleexclusionsEndpoint"
         )
+
+    @cached_property
+    def worktypes(self) -> "FinanceAgreementtypesIdWorktypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesEndpoint")
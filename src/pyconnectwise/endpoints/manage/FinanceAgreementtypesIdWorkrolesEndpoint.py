@@ -1,62 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesCountEndpoint import \
-    FinanceAgreementtypesIdWorkrolesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesIdEndpoint import \
-    FinanceAgreementtypesIdWorkrolesIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoEndpoint import \
-    FinanceAgreementtypesIdWorkrolesInfoEndpoint
 from pyconnectwise.models.manage import AgreementTypeWorkRole
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesCountEndpoint import \
+        FinanceAgreementtypesIdWorkrolesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesIdEndpoint import \
+        FinanceAgreementtypesIdWorkrolesIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoEndpoint import \
+        FinanceAgreementtypesIdWorkrolesInfoEndpoint
+
 
 class FinanceAgreementtypesIdWorkrolesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "workroles", parent_endpoint=parent_endpoint)
+    endpoint_base = "workroles"
+    _route = "finance/agreementTypes/{id}/workroles"
 
-        self.info = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkrolesInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkrolesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementtypesIdWorkrolesIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementtypesIdWorkrolesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorkrolesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementtypesIdWorkrolesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementtypesIdWorkrolesIdEndpoint: The initialized FinanceAgreementtypesIdWorkrolesIdEndpoint object.
+            FinanceAgreementtypesIdWorkrolesIdEndpoint: The FinanceAgreementtypesIdWorkrolesIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementtypesIdWorkrolesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementTypeWorkRole]:
         """
         Performs a GET request against the /finance/agreementTypes/{id}/workroles endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementTypeWorkRole]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementTypeWorkRole,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementTypeWorkRole, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementTypeWorkRole]:
         """
@@ -68,7 +58,7 @@ class FinanceAgreementtypesIdWorkrolesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AgreementTypeWorkRole]: The parsed response data.
         """
-        return self._parse_many(AgreementTypeWorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementTypeWorkRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementTypeWorkRole:
         """
@@ -80,4 +70,16 @@ class FinanceAgreementtypesIdWorkrolesEndpoint(ConnectWiseEndpoint):
         Returns:
             AgreementTypeWorkRole: The parsed response data.
         """
-        return self._parse_one(AgreementTypeWorkRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementTypeWorkRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceAgreementtypesIdWorkrolesInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "FinanceAgreementtypesIdWorkrolesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesCountEndpoint"
+        )
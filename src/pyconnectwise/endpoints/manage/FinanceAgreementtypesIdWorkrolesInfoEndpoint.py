@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoCountEndpoint import \
-    FinanceAgreementtypesIdWorkrolesInfoCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoIdEndpoint import \
-    FinanceAgreementtypesIdWorkrolesInfoIdEndpoint
 from pyconnectwise.models.manage import AgreementTypeWorkRoleInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoCountEndpoint import \
+        FinanceAgreementtypesIdWorkrolesInfoCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoIdEndpoint import \
+        FinanceAgreementtypesIdWorkrolesInfoIdEndpoint
+
 
 class FinanceAgreementtypesIdWorkrolesInfoEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
+    endpoint_base = "info"
+    _route = "finance/agreementTypes/{id}/workroles/info"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkrolesInfoCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementtypesIdWorkrolesInfoIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementtypesIdWorkrolesInfoIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorkrolesInfoIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementtypesIdWorkrolesInfoIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementtypesIdWorkrolesInfoIdEndpoint: The initialized FinanceAgreementtypesIdWorkrolesInfoIdEndpoint object.
+            FinanceAgreementtypesIdWorkrolesInfoIdEndpoint: The FinanceAgreementtypesIdWorkrolesInfoIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementtypesIdWorkrolesInfoIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementTypeWorkRoleInfo]:
         """
         Performs a GET request against the /finance/agreementTypes/{id}/workroles/info endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementTypeWorkRoleInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementTypeWorkRoleInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementTypeWorkRoleInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementTypeWorkRoleInfo]:
         """
@@ -64,5 +57,11 @@ class FinanceAgreementtypesIdWorkrolesInfoEndpoint(ConnectWiseEndpoint):
             list[AgreementTypeWorkRoleInfo]: The parsed response data.
         """
         return self._parse_many(
-            AgreementTypeWorkRoleInfo, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeWorkRoleInfo, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "FinanceAgreementtypesIdWorkrolesInfoCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorkrolesInfoCountEndpoint"
         )
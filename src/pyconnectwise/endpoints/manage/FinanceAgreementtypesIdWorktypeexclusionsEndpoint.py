@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint import \
-    FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint import \
-    FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint
 from pyconnectwise.models.manage import AgreementTypeWorkTypeExclusion
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint import \
+        FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint import \
+        FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint
+
 
 class FinanceAgreementtypesIdWorktypeexclusionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "workTypeExclusions", parent_endpoint=parent_endpoint)
+    endpoint_base = "workTypeExclusions"
+    _route = "finance/agreementTypes/{id}/workTypeExclusions"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint: The initialized FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint object.
+            FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint: The FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementTypeWorkTypeExclusion]:
         """
         Performs a GET request against the /finance/agreementTypes/{id}/workTypeExclusions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementTypeWorkTypeExclusion]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementTypeWorkTypeExclusion,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementTypeWorkTypeExclusion, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementTypeWorkTypeExclusion]:
         """
@@ -64,7 +57,7 @@ class FinanceAgreementtypesIdWorktypeexclusionsEndpoint(ConnectWiseEndpoint):
             list[AgreementTypeWorkTypeExclusion]: The parsed response data.
         """
         return self._parse_many(
-            AgreementTypeWorkTypeExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeWorkTypeExclusion, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementTypeWorkTypeExclusion:
@@ -78,5 +71,11 @@ class FinanceAgreementtypesIdWorktypeexclusionsEndpoint(ConnectWiseEndpoint):
             AgreementTypeWorkTypeExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementTypeWorkTypeExclusion, super()._make_request("POST", data=data, params=params).json()
+            AgreementTypeWorkTypeExclusion, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint"
         )
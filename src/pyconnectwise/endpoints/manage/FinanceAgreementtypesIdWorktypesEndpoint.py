@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesCountEndpoint import \
-    FinanceAgreementtypesIdWorktypesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesIdEndpoint import \
-    FinanceAgreementtypesIdWorktypesIdEndpoint
 from pyconnectwise.models.manage import AgreementTypeWorkType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesCountEndpoint import \
+        FinanceAgreementtypesIdWorktypesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesIdEndpoint import \
+        FinanceAgreementtypesIdWorktypesIdEndpoint
+
 
 class FinanceAgreementtypesIdWorktypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "worktypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "worktypes"
+    _route = "finance/agreementTypes/{id}/worktypes"
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorktypesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceAgreementtypesIdWorktypesIdEndpoint:
+    def id(self, id: int) -> "FinanceAgreementtypesIdWorktypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorktypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceAgreementtypesIdWorktypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceAgreementtypesIdWorktypesIdEndpoint: The initialized FinanceAgreementtypesIdWorktypesIdEndpoint object.
+            FinanceAgreementtypesIdWorktypesIdEndpoint: The FinanceAgreementtypesIdWorktypesIdEndpoint view bound to the ID.
         """
-        child = FinanceAgreementtypesIdWorktypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AgreementTypeWorkType]:
         """
         Performs a GET request against the /finance/agreementTypes/{id}/worktypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AgreementTypeWorkType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AgreementTypeWorkType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AgreementTypeWorkType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AgreementTypeWorkType]:
         """
@@ -63,7 +56,7 @@ class FinanceAgreementtypesIdWorktypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AgreementTypeWorkType]: The parsed response data.
         """
-        return self._parse_many(AgreementTypeWorkType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementTypeWorkType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AgreementTypeWorkType:
         """
@@ -75,4 +68,10 @@ class FinanceAgreementtypesIdWorktypesEndpoint(ConnectWiseEndpoint):
         Returns:
             AgreementTypeWorkType: The parsed response data.
         """
-        return self._parse_one(AgreementTypeWorkType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementTypeWorkType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceAgreementtypesIdWorktypesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceAgreementtypesIdWorktypesCountEndpoint"
+        )
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingcyclesCountEndpoint import FinanceBillingcyclesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingcyclesIdEndpoint import FinanceBillingcyclesIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingcyclesInfoEndpoint import FinanceBillingcyclesInfoEndpoint
 from pyconnectwise.models.manage import BillingCycle
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceBillingcyclesCountEndpoint import FinanceBillingcyclesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingcyclesIdEndpoint import FinanceBillingcyclesIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingcyclesInfoEndpoint import FinanceBillingcyclesInfoEndpoint
+
 
 class FinanceBillingcyclesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "billingCycles", parent_endpoint=parent_endpoint)
+    endpoint_base = "billingCycles"
+    _route = "finance/billingCycles"
 
-        self.info = self._register_child_endpoint(FinanceBillingcyclesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(FinanceBillingcyclesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceBillingcyclesIdEndpoint:
+    def id(self, id: int) -> "FinanceBillingcyclesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceBillingcyclesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceBillingcyclesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceBillingcyclesIdEndpoint: The initialized FinanceBillingcyclesIdEndpoint object.
+            FinanceBillingcyclesIdEndpoint: The FinanceBillingcyclesIdEndpoint view bound to the ID.
         """
-        child = FinanceBillingcyclesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceBillingcyclesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[BillingCycle]:
         """
         Performs a GET request against the /finance/billingCycles endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BillingCycle]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BillingCycle,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BillingCycle, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[BillingCycle]:
         """
@@ -61,7 +55,7 @@ class FinanceBillingcyclesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[BillingCycle]: The parsed response data.
         """
-        return self._parse_many(BillingCycle, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingCycle, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BillingCycle:
         """
@@ -73,4 +67,12 @@ class FinanceBillingcyclesEndpoint(ConnectWiseEndpoint):
         Returns:
             BillingCycle: The parsed response data.
         """
-        return self._parse_one(BillingCycle, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingCycle, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceBillingcyclesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingcyclesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceBillingcyclesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingcyclesCountEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingsetupsCountEndpoint import FinanceBillingsetupsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingsetupsIdEndpoint import FinanceBillingsetupsIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingsetupsInfoEndpoint import FinanceBillingsetupsInfoEndpoint
 from pyconnectwise.models.manage import BillingSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceBillingsetupsCountEndpoint import FinanceBillingsetupsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingsetupsIdEndpoint import FinanceBillingsetupsIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingsetupsInfoEndpoint import FinanceBillingsetupsInfoEndpoint
+
 
 class FinanceBillingsetupsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "billingSetups", parent_endpoint=parent_endpoint)
+    endpoint_base = "billingSetups"
+    _route = "finance/billingSetups"
 
-        self.info = self._register_child_endpoint(FinanceBillingsetupsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(FinanceBillingsetupsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceBillingsetupsIdEndpoint:
+    def id(self, id: int) -> "FinanceBillingsetupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceBillingsetupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceBillingsetupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceBillingsetupsIdEndpoint: The initialized FinanceBillingsetupsIdEndpoint object.
+            FinanceBillingsetupsIdEndpoint: The FinanceBillingsetupsIdEndpoint view bound to the ID.
         """
-        child = FinanceBillingsetupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceBillingsetupsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[BillingSetup]:
         """
         Performs a GET request against the /finance/billingSetups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BillingSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BillingSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BillingSetup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[BillingSetup]:
         """
@@ -61,7 +55,7 @@ class FinanceBillingsetupsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[BillingSetup]: The parsed response data.
         """
-        return self._parse_many(BillingSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BillingSetup:
         """
@@ -73,4 +67,12 @@ class FinanceBillingsetupsEndpoint(ConnectWiseEndpoint):
         Returns:
             BillingSetup: The parsed response data.
         """
-        return self._parse_one(BillingSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingSetup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceBillingsetupsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingsetupsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceBillingsetupsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingsetupsCountEndpoint")
@@ -1,43 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingsetupsIdInfoEndpoint import FinanceBillingsetupsIdInfoEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingsetupsIdRoutingsEndpoint import FinanceBillingsetupsIdRoutingsEndpoint
 from pyconnectwise.models.manage import BillingSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceBillingsetupsIdInfoEndpoint import FinanceBillingsetupsIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingsetupsIdRoutingsEndpoint import \
+        FinanceBillingsetupsIdRoutingsEndpoint
+
 
 class FinanceBillingsetupsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "finance/billingSetups/{id}"
 
-        self.info = self._register_child_endpoint(FinanceBillingsetupsIdInfoEndpoint(client, parent_endpoint=self))
-        self.routings = self._register_child_endpoint(
-            FinanceBillingsetupsIdRoutingsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[BillingSetup]:
         """
         Performs a GET request against the /finance/billingSetups/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BillingSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BillingSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BillingSetup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BillingSetup:
         """
@@ -49,7 +44,7 @@ class FinanceBillingsetupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             BillingSetup: The parsed response data.
         """
-        return self._parse_one(BillingSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BillingSetup, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -71,7 +66,7 @@ class FinanceBillingsetupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             BillingSetup: The parsed response data.
         """
-        return self._parse_one(BillingSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BillingSetup, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BillingSetup:
         """
@@ -83,4 +78,12 @@ class FinanceBillingsetupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             BillingSetup: The parsed response data.
         """
-        return self._parse_one(BillingSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(BillingSetup, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceBillingsetupsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingsetupsIdInfoEndpoint")
+
+    @cached_property
+    def routings(self) -> "FinanceBillingsetupsIdRoutingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingsetupsIdRoutingsEndpoint")
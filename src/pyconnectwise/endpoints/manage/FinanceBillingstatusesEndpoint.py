@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingstatusesCountEndpoint import FinanceBillingstatusesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingstatusesIdEndpoint import FinanceBillingstatusesIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingstatusesInfoEndpoint import FinanceBillingstatusesInfoEndpoint
 from pyconnectwise.models.manage import BillingStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceBillingstatusesCountEndpoint import FinanceBillingstatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingstatusesIdEndpoint import FinanceBillingstatusesIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingstatusesInfoEndpoint import FinanceBillingstatusesInfoEndpoint
+
 
 class FinanceBillingstatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "billingStatuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "billingStatuses"
+    _route = "finance/billingStatuses"
 
-        self.info = self._register_child_endpoint(FinanceBillingstatusesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(FinanceBillingstatusesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceBillingstatusesIdEndpoint:
+    def id(self, id: int) -> "FinanceBillingstatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceBillingstatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceBillingstatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceBillingstatusesIdEndpoint: The initialized FinanceBillingstatusesIdEndpoint object.
+            FinanceBillingstatusesIdEndpoint: The FinanceBillingstatusesIdEndpoint view bound to the ID.
         """
-        child = FinanceBillingstatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceBillingstatusesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[BillingStatus]:
         """
         Performs a GET request against the /finance/billingStatuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BillingStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BillingStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BillingStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[BillingStatus]:
         """
@@ -61,7 +55,7 @@ class FinanceBillingstatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[BillingStatus]: The parsed response data.
         """
-        return self._parse_many(BillingStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BillingStatus:
         """
@@ -73,4 +67,12 @@ class FinanceBillingstatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             BillingStatus: The parsed response data.
         """
-        return self._parse_one(BillingStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceBillingstatusesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingstatusesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceBillingstatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingstatusesCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingtermsCountEndpoint import FinanceBillingtermsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingtermsIdEndpoint import FinanceBillingtermsIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingtermsInfoEndpoint import FinanceBillingtermsInfoEndpoint
 from pyconnectwise.models.manage import BillingTerm
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceBillingtermsCountEndpoint import FinanceBillingtermsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingtermsIdEndpoint import FinanceBillingtermsIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingtermsInfoEndpoint import FinanceBillingtermsInfoEndpoint
+
 
 class FinanceBillingtermsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "billingTerms", parent_endpoint=parent_endpoint)
+    endpoint_base = "billingTerms"
+    _route = "finance/billingTerms"
 
-        self.info = self._register_child_endpoint(FinanceBillingtermsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(FinanceBillingtermsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceBillingtermsIdEndpoint:
+    def id(self, id: int) -> "FinanceBillingtermsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceBillingtermsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceBillingtermsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceBillingtermsIdEndpoint: The initialized FinanceBillingtermsIdEndpoint object.
+            FinanceBillingtermsIdEndpoint: The FinanceBillingtermsIdEndpoint view bound to the ID.
         """
-        child = FinanceBillingtermsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceBillingtermsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[BillingTerm]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[BillingTerm]:
         """
         Performs a GET request against the /finance/billingTerms endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BillingTerm]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BillingTerm,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BillingTerm, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[BillingTerm]:
         """
@@ -59,7 +55,7 @@ class FinanceBillingtermsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[BillingTerm]: The parsed response data.
         """
-        return self._parse_many(BillingTerm, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingTerm, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BillingTerm:
         """
@@ -71,4 +67,12 @@ class FinanceBillingtermsEndpoint(ConnectWiseEndpoint):
         Returns:
             BillingTerm: The parsed response data.
         """
-        return self._parse_one(BillingTerm, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingTerm, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceBillingtermsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingtermsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceBillingtermsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingtermsCountEndpoint")
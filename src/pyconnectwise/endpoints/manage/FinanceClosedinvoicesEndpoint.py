@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceClosedinvoicesIdEndpoint import FinanceClosedinvoicesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceClosedinvoicesIdEndpoint import FinanceClosedinvoicesIdEndpoint
+
 
 class FinanceClosedinvoicesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "closedInvoices"
+    _route = "finance/closedInvoices"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "closedInvoices", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceClosedinvoicesIdEndpoint:
+    def id(self, id: int) -> "FinanceClosedinvoicesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceClosedinvoicesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceClosedinvoicesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceClosedinvoicesIdEndpoint: The initialized FinanceClosedinvoicesIdEndpoint object.
+            FinanceClosedinvoicesIdEndpoint: The FinanceClosedinvoicesIdEndpoint view bound to the ID.
         """
-        child = FinanceClosedinvoicesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceClosedinvoicesIdEndpoint", id)
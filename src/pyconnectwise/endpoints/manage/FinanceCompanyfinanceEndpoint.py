@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceCompanyfinanceCountEndpoint import FinanceCompanyfinanceCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceCompanyfinanceIdEndpoint import FinanceCompanyfinanceIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceCompanyfinanceCountEndpoint import FinanceCompanyfinanceCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceCompanyfinanceIdEndpoint import FinanceCompanyfinanceIdEndpoint
+
 
 class FinanceCompanyfinanceEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "companyFinance", parent_endpoint=parent_endpoint)
+    endpoint_base = "companyFinance"
+    _route = "finance/companyFinance"
 
-        self.count = self._register_child_endpoint(FinanceCompanyfinanceCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceCompanyfinanceIdEndpoint:
+    def id(self, id: int) -> "FinanceCompanyfinanceIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceCompanyfinanceIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceCompanyfinanceIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceCompanyfinanceIdEndpoint: The initialized FinanceCompanyfinanceIdEndpoint object.
+            FinanceCompanyfinanceIdEndpoint: The FinanceCompanyfinanceIdEndpoint view bound to the ID.
         """
-        child = FinanceCompanyfinanceIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceCompanyfinanceIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "FinanceCompanyfinanceCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceCompanyfinanceCountEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceCurrenciesCountEndpoint import FinanceCurrenciesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceCurrenciesIdEndpoint import FinanceCurrenciesIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceCurrenciesInfoEndpoint import FinanceCurrenciesInfoEndpoint
 from pyconnectwise.models.manage import FinanceCurrency
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceCurrenciesCountEndpoint import FinanceCurrenciesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceCurrenciesIdEndpoint import FinanceCurrenciesIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceCurrenciesInfoEndpoint import FinanceCurrenciesInfoEndpoint
+
 
 class FinanceCurrenciesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "currencies", parent_endpoint=parent_endpoint)
+    endpoint_base = "currencies"
+    _route = "finance/currencies"
 
-        self.info = self._register_child_endpoint(FinanceCurrenciesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(FinanceCurrenciesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceCurrenciesIdEndpoint:
+    def id(self, id: int) -> "FinanceCurrenciesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceCurrenciesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceCurrenciesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceCurrenciesIdEndpoint: The initialized FinanceCurrenciesIdEndpoint object.
+            FinanceCurrenciesIdEndpoint: The FinanceCurrenciesIdEndpoint view bound to the ID.
         """
-        child = FinanceCurrenciesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceCurrenciesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[FinanceCurrency]:
         """
         Performs a GET request against the /finance/currencies endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[FinanceCurrency]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            FinanceCurrency,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(FinanceCurrency, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[FinanceCurrency]:
         """
@@ -61,7 +55,7 @@ class FinanceCurrenciesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[FinanceCurrency]: The parsed response data.
         """
-        return self._parse_many(FinanceCurrency, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(FinanceCurrency, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> FinanceCurrency:
         """
@@ -73,4 +67,12 @@ class FinanceCurrenciesEndpoint(ConnectWiseEndpoint):
         Returns:
             FinanceCurrency: The parsed response data.
         """
-        return self._parse_one(FinanceCurrency, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(FinanceCurrency, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceCurrenciesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceCurrenciesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceCurrenciesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceCurrenciesCountEndpoint")
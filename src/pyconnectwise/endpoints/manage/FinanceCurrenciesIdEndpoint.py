@@ -1,41 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceCurrenciesIdInfoEndpoint import FinanceCurrenciesIdInfoEndpoint
-from pyconnectwise.endpoints.manage.FinanceCurrenciesIdUsagesEndpoint import FinanceCurrenciesIdUsagesEndpoint
 from pyconnectwise.models.manage import FinanceCurrency
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceCurrenciesIdInfoEndpoint import FinanceCurrenciesIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.FinanceCurrenciesIdUsagesEndpoint import FinanceCurrenciesIdUsagesEndpoint
+
 
 class FinanceCurrenciesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "finance/currencies/{id}"
 
-        self.usages = self._register_child_endpoint(FinanceCurrenciesIdUsagesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceCurrenciesIdInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[FinanceCurrency]:
         """
         Performs a GET request against the /finance/currencies/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[FinanceCurrency]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            FinanceCurrency,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(FinanceCurrency, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> FinanceCurrency:
         """
@@ -47,7 +43,7 @@ class FinanceCurrenciesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             FinanceCurrency: The parsed response data.
         """
-        return self._parse_one(FinanceCurrency, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(FinanceCurrency, super()._make_request("GET", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> FinanceCurrency:
         """
@@ -59,7 +55,7 @@ class FinanceCurrenciesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             FinanceCurrency: The parsed response data.
         """
-        return self._parse_one(FinanceCurrency, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(FinanceCurrency, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> FinanceCurrency:
         """
@@ -71,7 +67,7 @@ class FinanceCurrenciesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             FinanceCurrency: The parsed response data.
         """
-        return self._parse_one(FinanceCurrency, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(FinanceCurrency, super()._make_request("PATCH", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -82,3 +78,11 @@ class FinanceCurrenciesIdEndpoint(ConnectWiseEndpoint):
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def usages(self) -> "FinanceCurrenciesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceCurrenciesIdUsagesEndpoint")
+
+    @cached_property
+    def info(self) -> "FinanceCurrenciesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceCurrenciesIdInfoEndpoint")
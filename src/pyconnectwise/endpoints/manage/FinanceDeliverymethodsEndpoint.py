@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceDeliverymethodsCountEndpoint import FinanceDeliverymethodsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceDeliverymethodsIdEndpoint import FinanceDeliverymethodsIdEndpoint
 from pyconnectwise.models.manage import DeliveryMethod
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceDeliverymethodsCountEndpoint import FinanceDeliverymethodsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceDeliverymethodsIdEndpoint import FinanceDeliverymethodsIdEndpoint
+
 
 class FinanceDeliverymethodsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "deliveryMethods", parent_endpoint=parent_endpoint)
+    endpoint_base = "deliveryMethods"
+    _route = "finance/deliveryMethods"
 
-        self.count = self._register_child_endpoint(FinanceDeliverymethodsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceDeliverymethodsIdEndpoint:
+    def id(self, id: int) -> "FinanceDeliverymethodsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceDeliverymethodsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceDeliverymethodsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceDeliverymethodsIdEndpoint: The initialized FinanceDeliverymethodsIdEndpoint object.
+            FinanceDeliverymethodsIdEndpoint: The FinanceDeliverymethodsIdEndpoint view bound to the ID.
         """
-        child = FinanceDeliverymethodsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceDeliverymethodsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[DeliveryMethod]:
         """
         Performs a GET request against the /finance/deliveryMethods endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[DeliveryMethod]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            DeliveryMethod,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(DeliveryMethod, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[DeliveryMethod]:
         """
@@ -59,7 +54,7 @@ class FinanceDeliverymethodsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[DeliveryMethod]: The parsed response data.
         """
-        return self._parse_many(DeliveryMethod, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DeliveryMethod, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> DeliveryMethod:
         """
@@ -71,4 +66,8 @@ class FinanceDeliverymethodsEndpoint(ConnectWiseEndpoint):
         Returns:
             DeliveryMethod: The parsed response data.
         """
-        return self._parse_one(DeliveryMethod, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(DeliveryMethod, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceDeliverymethodsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceDeliverymethodsCountEndpoint")
@@ -1,82 +1,141 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingEndpoint import FinanceAccountingEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingpackagesEndpoint import FinanceAccountingpackagesEndpoint
-from pyconnectwise.endpoints.manage.FinanceAccountingpackagesetupEndpoint import FinanceAccountingpackagesetupEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementrecapEndpoint import FinanceAgreementrecapEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementsEndpoint import FinanceAgreementsEndpoint
-from pyconnectwise.endpoints.manage.FinanceAgreementtypesEndpoint import FinanceAgreementtypesEndpoint
-from pyconnectwise.endpoints.manage.FinanceBatchsetupsEndpoint import FinanceBatchsetupsEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingcyclesEndpoint import FinanceBillingcyclesEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingsetupsEndpoint import FinanceBillingsetupsEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingstatusesEndpoint import FinanceBillingstatusesEndpoint
-from pyconnectwise.endpoints.manage.FinanceBillingtermsEndpoint import FinanceBillingtermsEndpoint
-from pyconnectwise.endpoints.manage.FinanceClosedinvoicesEndpoint import FinanceClosedinvoicesEndpoint
-from pyconnectwise.endpoints.manage.FinanceCompanyfinanceEndpoint import FinanceCompanyfinanceEndpoint
-from pyconnectwise.endpoints.manage.FinanceCurrenciesEndpoint import FinanceCurrenciesEndpoint
-from pyconnectwise.endpoints.manage.FinanceDeliverymethodsEndpoint import FinanceDeliverymethodsEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlaccountsEndpoint import FinanceGlaccountsEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlcaptionsEndpoint import FinanceGlcaptionsEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlpathsEndpoint import FinanceGlpathsEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoEndpoint import FinanceInfoEndpoint
-from pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesEndpoint import FinanceInvoiceemailtemplatesEndpoint
-from pyconnectwise.endpoints.manage.FinanceInvoicesEndpoint import FinanceInvoicesEndpoint
-from pyconnectwise.endpoints.manage.FinanceInvoicetemplatesEndpoint import FinanceInvoicetemplatesEndpoint
-from pyconnectwise.endpoints.manage.FinanceInvoicetemplatesetupsEndpoint import FinanceInvoicetemplatesetupsEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesEndpoint import FinanceTaxcodesEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxintegrationsEndpoint import FinanceTaxintegrationsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceAccountingEndpoint import FinanceAccountingEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingpackagesEndpoint import FinanceAccountingpackagesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAccountingpackagesetupEndpoint import \
+        FinanceAccountingpackagesetupEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementrecapEndpoint import FinanceAgreementrecapEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementsEndpoint import FinanceAgreementsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceAgreementtypesEndpoint import FinanceAgreementtypesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBatchsetupsEndpoint import FinanceBatchsetupsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingcyclesEndpoint import FinanceBillingcyclesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingsetupsEndpoint import FinanceBillingsetupsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingstatusesEndpoint import FinanceBillingstatusesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceBillingtermsEndpoint import FinanceBillingtermsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceClosedinvoicesEndpoint import FinanceClosedinvoicesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceCompanyfinanceEndpoint import FinanceCompanyfinanceEndpoint
+    from pyconnectwise.endpoints.manage.FinanceCurrenciesEndpoint import FinanceCurrenciesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceDeliverymethodsEndpoint import FinanceDeliverymethodsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceGlaccountsEndpoint import FinanceGlaccountsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceGlcaptionsEndpoint import FinanceGlcaptionsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceGlpathsEndpoint import FinanceGlpathsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInfoEndpoint import FinanceInfoEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesEndpoint import FinanceInvoiceemailtemplatesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInvoicesEndpoint import FinanceInvoicesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInvoicetemplatesEndpoint import FinanceInvoicetemplatesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInvoicetemplatesetupsEndpoint import FinanceInvoicetemplatesetupsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesEndpoint import FinanceTaxcodesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxintegrationsEndpoint import FinanceTaxintegrationsEndpoint
+
 
 class FinanceEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "finance"
+    _route = "finance"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "finance", parent_endpoint=parent_endpoint)
-
-        self.billing_terms = self._register_child_endpoint(FinanceBillingtermsEndpoint(client, parent_endpoint=self))
-        self.closed_invoices = self._register_child_endpoint(
-            FinanceClosedinvoicesEndpoint(client, parent_endpoint=self)
-        )
-        self.gl_captions = self._register_child_endpoint(FinanceGlcaptionsEndpoint(client, parent_endpoint=self))
-        self.tax_integrations = self._register_child_endpoint(
-            FinanceTaxintegrationsEndpoint(client, parent_endpoint=self)
-        )
-        self.currencies = self._register_child_endpoint(FinanceCurrenciesEndpoint(client, parent_endpoint=self))
-        self.billing_setups = self._register_child_endpoint(FinanceBillingsetupsEndpoint(client, parent_endpoint=self))
-        self.gl_accounts = self._register_child_endpoint(FinanceGlaccountsEndpoint(client, parent_endpoint=self))
-        self.batch_setups = self._register_child_endpoint(FinanceBatchsetupsEndpoint(client, parent_endpoint=self))
-        self.accounting_package_setup = self._register_child_endpoint(
-            FinanceAccountingpackagesetupEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice_email_templates = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice_templates = self._register_child_endpoint(
-            FinanceInvoicetemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.delivery_methods = self._register_child_endpoint(
-            FinanceDeliverymethodsEndpoint(client, parent_endpoint=self)
-        )
-        self.tax_codes = self._register_child_endpoint(FinanceTaxcodesEndpoint(client, parent_endpoint=self))
-        self.billing_cycles = self._register_child_endpoint(FinanceBillingcyclesEndpoint(client, parent_endpoint=self))
-        self.company_finance = self._register_child_endpoint(
-            FinanceCompanyfinanceEndpoint(client, parent_endpoint=self)
-        )
-        self.invoices = self._register_child_endpoint(FinanceInvoicesEndpoint(client, parent_endpoint=self))
-        self.accounting = self._register_child_endpoint(FinanceAccountingEndpoint(client, parent_endpoint=self))
-        self.agreement_types = self._register_child_endpoint(
-            FinanceAgreementtypesEndpoint(client, parent_endpoint=self)
-        )
-        self.agreements = self._register_child_endpoint(FinanceAgreementsEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceInfoEndpoint(client, parent_endpoint=self))
-        self.agreementrecap = self._register_child_endpoint(FinanceAgreementrecapEndpoint(client, parent_endpoint=self))
-        self.accounting_packages = self._register_child_endpoint(
-            FinanceAccountingpackagesEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice_template_setups = self._register_child_endpoint(
-            FinanceInvoicetemplatesetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.billing_statuses = self._register_child_endpoint(
-            FinanceBillingstatusesEndpoint(client, parent_endpoint=self)
-        )
-        self.glpaths = self._register_child_endpoint(FinanceGlpathsEndpoint(client, parent_endpoint=self))
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def billing_terms(self) -> "FinanceBillingtermsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingtermsEndpoint")
+
+    @cached_property
+    def closed_invoices(self) -> "FinanceClosedinvoicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceClosedinvoicesEndpoint")
+
+    @cached_property
+    def gl_captions(self) -> "FinanceGlcaptionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceGlcaptionsEndpoint")
+
+    @cached_property
+    def tax_integrations(self) -> "FinanceTaxintegrationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxintegrationsEndpoint")
+
+    @cached_property
+    def currencies(self) -> "FinanceCurrenciesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceCurrenciesEndpoint")
+
+    @cached_property
+    def billing_setups(self) -> "FinanceBillingsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingsetupsEndpoint")
+
+    @cached_property
+    def gl_accounts(self) -> "FinanceGlaccountsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceGlaccountsEndpoint")
+
+    @cached_property
+    def batch_setups(self) -> "FinanceBatchsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBatchsetupsEndpoint")
+
+    @cached_property
+    def accounting_package_setup(self) -> "FinanceAccountingpackagesetupEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingpackagesetupEndpoint")
+
+    @cached_property
+    def invoice_email_templates(self) -> "FinanceInvoiceemailtemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesEndpoint")
+
+    @cached_property
+    def invoice_templates(self) -> "FinanceInvoicetemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInvoicetemplatesEndpoint")
+
+    @cached_property
+    def delivery_methods(self) -> "FinanceDeliverymethodsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceDeliverymethodsEndpoint")
+
+    @cached_property
+    def tax_codes(self) -> "FinanceTaxcodesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesEndpoint")
+
+    @cached_property
+    def billing_cycles(self) -> "FinanceBillingcyclesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingcyclesEndpoint")
+
+    @cached_property
+    def company_finance(self) -> "FinanceCompanyfinanceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceCompanyfinanceEndpoint")
+
+    @cached_property
+    def invoices(self) -> "FinanceInvoicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInvoicesEndpoint")
+
+    @cached_property
+    def accounting(self) -> "FinanceAccountingEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingEndpoint")
+
+    @cached_property
+    def agreement_types(self) -> "FinanceAgreementtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementtypesEndpoint")
+
+    @cached_property
+    def agreements(self) -> "FinanceAgreementsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementsEndpoint")
+
+    @cached_property
+    def info(self) -> "FinanceInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInfoEndpoint")
+
+    @cached_property
+    def agreementrecap(self) -> "FinanceAgreementrecapEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAgreementrecapEndpoint")
+
+    @cached_property
+    def accounting_packages(self) -> "FinanceAccountingpackagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceAccountingpackagesEndpoint")
+
+    @cached_property
+    def invoice_template_setups(self) -> "FinanceInvoicetemplatesetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInvoicetemplatesetupsEndpoint")
+
+    @cached_property
+    def billing_statuses(self) -> "FinanceBillingstatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceBillingstatusesEndpoint")
+
+    @cached_property
+    def glpaths(self) -> "FinanceGlpathsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceGlpathsEndpoint")
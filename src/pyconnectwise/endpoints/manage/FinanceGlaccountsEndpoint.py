@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlaccountsCountEndpoint import FinanceGlaccountsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlaccountsIdEndpoint import FinanceGlaccountsIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlaccountsMappedtypesEndpoint import FinanceGlaccountsMappedtypesEndpoint
 from pyconnectwise.models.manage import GLAccount
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceGlaccountsCountEndpoint import FinanceGlaccountsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceGlaccountsIdEndpoint import FinanceGlaccountsIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceGlaccountsMappedtypesEndpoint import FinanceGlaccountsMappedtypesEndpoint
+
 
 class FinanceGlaccountsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "glAccounts", parent_endpoint=parent_endpoint)
+    endpoint_base = "glAccounts"
+    _route = "finance/glAccounts"
 
-        self.mapped_types = self._register_child_endpoint(
-            FinanceGlaccountsMappedtypesEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(FinanceGlaccountsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceGlaccountsIdEndpoint:
+    def id(self, id: int) -> "FinanceGlaccountsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceGlaccountsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceGlaccountsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceGlaccountsIdEndpoint: The initialized FinanceGlaccountsIdEndpoint object.
+            FinanceGlaccountsIdEndpoint: The FinanceGlaccountsIdEndpoint view bound to the ID.
         """
-        child = FinanceGlaccountsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceGlaccountsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[GLAccount]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[GLAccount]:
         """
         Performs a GET request against the /finance/glAccounts endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[GLAccount]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            GLAccount,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(GLAccount, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[GLAccount]:
         """
@@ -61,7 +55,7 @@ class FinanceGlaccountsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[GLAccount]: The parsed response data.
         """
-        return self._parse_many(GLAccount, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(GLAccount, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> GLAccount:
         """
@@ -73,4 +67,12 @@ class FinanceGlaccountsEndpoint(ConnectWiseEndpoint):
         Returns:
             GLAccount: The parsed response data.
         """
-        return self._parse_one(GLAccount, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(GLAccount, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def mapped_types(self) -> "FinanceGlaccountsMappedtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceGlaccountsMappedtypesEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceGlaccountsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceGlaccountsCountEndpoint")
@@ -1,40 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlaccountsMappedtypesCountEndpoint import \
-    FinanceGlaccountsMappedtypesCountEndpoint
 from pyconnectwise.models.manage import MappedType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceGlaccountsMappedtypesCountEndpoint import \
+        FinanceGlaccountsMappedtypesCountEndpoint
+
 
 class FinanceGlaccountsMappedtypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "mappedTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "mappedTypes"
+    _route = "finance/glAccounts/mappedTypes"
 
-        self.count = self._register_child_endpoint(
-            FinanceGlaccountsMappedtypesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[MappedType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[MappedType]:
         """
         Performs a GET request against the /finance/glAccounts/mappedTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MappedType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MappedType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MappedType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MappedType]:
         """
@@ -46,4 +43,8 @@ class FinanceGlaccountsMappedtypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[MappedType]: The parsed response data.
         """
-        return self._parse_many(MappedType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MappedType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceGlaccountsMappedtypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceGlaccountsMappedtypesCountEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlpathsCountEndpoint import FinanceGlpathsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceGlpathsIdEndpoint import FinanceGlpathsIdEndpoint
 from pyconnectwise.models.manage import GLPath
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceGlpathsCountEndpoint import FinanceGlpathsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceGlpathsIdEndpoint import FinanceGlpathsIdEndpoint
+
 
 class FinanceGlpathsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "glpaths", parent_endpoint=parent_endpoint)
+    endpoint_base = "glpaths"
+    _route = "finance/glpaths"
 
-        self.count = self._register_child_endpoint(FinanceGlpathsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceGlpathsIdEndpoint:
+    def id(self, id: int) -> "FinanceGlpathsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceGlpathsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceGlpathsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceGlpathsIdEndpoint: The initialized FinanceGlpathsIdEndpoint object.
+            FinanceGlpathsIdEndpoint: The FinanceGlpathsIdEndpoint view bound to the ID.
         """
-        child = FinanceGlpathsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceGlpathsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[GLPath]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[GLPath]:
         """
         Performs a GET request against the /finance/glpaths endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[GLPath]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            GLPath,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(GLPath, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[GLPath]:
         """
@@ -57,7 +54,7 @@ class FinanceGlpathsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[GLPath]: The parsed response data.
         """
-        return self._parse_many(GLPath, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(GLPath, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> GLPath:
         """
@@ -69,4 +66,8 @@ class FinanceGlpathsEndpoint(ConnectWiseEndpoint):
         Returns:
             GLPath: The parsed response data.
         """
-        return self._parse_one(GLPath, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(GLPath, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceGlpathsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceGlpathsCountEndpoint")
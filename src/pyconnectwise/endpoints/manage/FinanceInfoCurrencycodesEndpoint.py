@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesCountEndpoint import FinanceInfoCurrencycodesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesIdEndpoint import FinanceInfoCurrencycodesIdEndpoint
 from pyconnectwise.models.manage import CurrencyCode
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesCountEndpoint import \
+        FinanceInfoCurrencycodesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesIdEndpoint import FinanceInfoCurrencycodesIdEndpoint
+
 
 class FinanceInfoCurrencycodesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "currencyCodes", parent_endpoint=parent_endpoint)
+    endpoint_base = "currencyCodes"
+    _route = "finance/info/currencyCodes"
 
-        self.count = self._register_child_endpoint(FinanceInfoCurrencycodesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceInfoCurrencycodesIdEndpoint:
+    def id(self, id: int) -> "FinanceInfoCurrencycodesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceInfoCurrencycodesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceInfoCurrencycodesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceInfoCurrencycodesIdEndpoint: The initialized FinanceInfoCurrencycodesIdEndpoint object.
+            FinanceInfoCurrencycodesIdEndpoint: The FinanceInfoCurrencycodesIdEndpoint view bound to the ID.
         """
-        child = FinanceInfoCurrencycodesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CurrencyCode]:
         """
         Performs a GET request against the /finance/info/currencyCodes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CurrencyCode]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CurrencyCode,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CurrencyCode, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CurrencyCode]:
         """
@@ -59,4 +55,8 @@ class FinanceInfoCurrencycodesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CurrencyCode]: The parsed response data.
         """
-        return self._parse_many(CurrencyCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CurrencyCode, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceInfoCurrencycodesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesCountEndpoint")
@@ -1,20 +1,30 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesEndpoint import FinanceInfoCurrencycodesEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoInvoiceEndpoint import FinanceInfoInvoiceEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsEndpoint import FinanceInfoTaxintegrationsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesEndpoint import FinanceInfoCurrencycodesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInfoInvoiceEndpoint import FinanceInfoInvoiceEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsEndpoint import FinanceInfoTaxintegrationsEndpoint
+
 
 class FinanceInfoEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "finance/info"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
-
-        self.currency_codes = self._register_child_endpoint(
-            FinanceInfoCurrencycodesEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice = self._register_child_endpoint(FinanceInfoInvoiceEndpoint(client, parent_endpoint=self))
-        self.tax_integrations = self._register_child_endpoint(
-            FinanceInfoTaxintegrationsEndpoint(client, parent_endpoint=self)
-        )
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def currency_codes(self) -> "FinanceInfoCurrencycodesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInfoCurrencycodesEndpoint")
+
+    @cached_property
+    def invoice(self) -> "FinanceInfoInvoiceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInfoInvoiceEndpoint")
+
+    @cached_property
+    def tax_integrations(self) -> "FinanceInfoTaxintegrationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsEndpoint")
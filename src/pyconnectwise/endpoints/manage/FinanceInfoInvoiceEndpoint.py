@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoInvoiceIdEndpoint import FinanceInfoInvoiceIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceInfoInvoiceIdEndpoint import FinanceInfoInvoiceIdEndpoint
+
 
 class FinanceInfoInvoiceEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "invoice"
+    _route = "finance/info/invoice"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "invoice", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceInfoInvoiceIdEndpoint:
+    def id(self, id: int) -> "FinanceInfoInvoiceIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceInfoInvoiceIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceInfoInvoiceIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceInfoInvoiceIdEndpoint: The initialized FinanceInfoInvoiceIdEndpoint object.
+            FinanceInfoInvoiceIdEndpoint: The FinanceInfoInvoiceIdEndpoint view bound to the ID.
         """
-        child = FinanceInfoInvoiceIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceInfoInvoiceIdEndpoint", id)
@@ -1,56 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsCountEndpoint import \
-    FinanceInfoTaxintegrationsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsIdEndpoint import FinanceInfoTaxintegrationsIdEndpoint
 from pyconnectwise.models.manage import TaxIntegrationInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsCountEndpoint import \
+        FinanceInfoTaxintegrationsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsIdEndpoint import FinanceInfoTaxintegrationsIdEndpoint
+
 
 class FinanceInfoTaxintegrationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "taxIntegrations", parent_endpoint=parent_endpoint)
+    endpoint_base = "taxIntegrations"
+    _route = "finance/info/taxIntegrations"
 
-        self.count = self._register_child_endpoint(
-            FinanceInfoTaxintegrationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceInfoTaxintegrationsIdEndpoint:
+    def id(self, id: int) -> "FinanceInfoTaxintegrationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceInfoTaxintegrationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceInfoTaxintegrationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceInfoTaxintegrationsIdEndpoint: The initialized FinanceInfoTaxintegrationsIdEndpoint object.
+            FinanceInfoTaxintegrationsIdEndpoint: The FinanceInfoTaxintegrationsIdEndpoint view bound to the ID.
         """
-        child = FinanceInfoTaxintegrationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[TaxIntegrationInfo]:
         """
         Performs a GET request against the /finance/info/taxIntegrations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TaxIntegrationInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TaxIntegrationInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TaxIntegrationInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TaxIntegrationInfo]:
         """
@@ -62,4 +55,8 @@ class FinanceInfoTaxintegrationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TaxIntegrationInfo]: The parsed response data.
         """
-        return self._parse_many(TaxIntegrationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxIntegrationInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceInfoTaxintegrationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInfoTaxintegrationsCountEndpoint")
@@ -1,61 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesCountEndpoint import \
-    FinanceInvoiceemailtemplatesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesIdEndpoint import FinanceInvoiceemailtemplatesIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesInfoEndpoint import \
-    FinanceInvoiceemailtemplatesInfoEndpoint
 from pyconnectwise.models.manage import InvoiceEmailTemplate
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesCountEndpoint import \
+        FinanceInvoiceemailtemplatesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesIdEndpoint import \
+        FinanceInvoiceemailtemplatesIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesInfoEndpoint import \
+        FinanceInvoiceemailtemplatesInfoEndpoint
+
 
 class FinanceInvoiceemailtemplatesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "invoiceEmailTemplates", parent_endpoint=parent_endpoint)
+    endpoint_base = "invoiceEmailTemplates"
+    _route = "finance/invoiceEmailTemplates"
 
-        self.info = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceInvoiceemailtemplatesIdEndpoint:
+    def id(self, id: int) -> "FinanceInvoiceemailtemplatesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceInvoiceemailtemplatesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceInvoiceemailtemplatesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceInvoiceemailtemplatesIdEndpoint: The initialized FinanceInvoiceemailtemplatesIdEndpoint object.
+            FinanceInvoiceemailtemplatesIdEndpoint: The FinanceInvoiceemailtemplatesIdEndpoint view bound to the ID.
         """
-        child = FinanceInvoiceemailtemplatesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[InvoiceEmailTemplate]:
         """
         Performs a GET request against the /finance/invoiceEmailTemplates endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[InvoiceEmailTemplate]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            InvoiceEmailTemplate,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(InvoiceEmailTemplate, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[InvoiceEmailTemplate]:
         """
@@ -67,7 +58,7 @@ class FinanceInvoiceemailtemplatesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[InvoiceEmailTemplate]: The parsed response data.
         """
-        return self._parse_many(InvoiceEmailTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InvoiceEmailTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> InvoiceEmailTemplate:
         """
@@ -79,4 +70,12 @@ class FinanceInvoiceemailtemplatesEndpoint(ConnectWiseEndpoint):
         Returns:
             InvoiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(InvoiceEmailTemplate, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(InvoiceEmailTemplate, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceInvoiceemailtemplatesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceInvoiceemailtemplatesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceInvoiceemailtemplatesCountEndpoint")
@@ -1,50 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceInvoicesIdPaymentsIdEndpoint import FinanceInvoicesIdPaymentsIdEndpoint
 from pyconnectwise.models.manage import InvoicePayment
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceInvoicesIdPaymentsIdEndpoint import FinanceInvoicesIdPaymentsIdEndpoint
+
 
 class FinanceInvoicesIdPaymentsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "payments"
+    _route = "finance/invoices/{id}/payments"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "payments", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceInvoicesIdPaymentsIdEndpoint:
+    def id(self, id: int) -> "FinanceInvoicesIdPaymentsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceInvoicesIdPaymentsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceInvoicesIdPaymentsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceInvoicesIdPaymentsIdEndpoint: The initialized FinanceInvoicesIdPaymentsIdEndpoint object.
+            FinanceInvoicesIdPaymentsIdEndpoint: The FinanceInvoicesIdPaymentsIdEndpoint view bound to the ID.
         """
-        child = FinanceInvoicesIdPaymentsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceInvoicesIdPaymentsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[InvoicePayment]:
         """
         Performs a GET request against the /finance/invoices/{id}/payments endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[InvoicePayment]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            InvoicePayment,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(InvoicePayment, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[InvoicePayment]:
         """
@@ -56,7 +53,7 @@ class FinanceInvoicesIdPaymentsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[InvoicePayment]: The parsed response data.
         """
-        return self._parse_many(InvoicePayment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InvoicePayment, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> InvoicePayment:
         """
@@ -68,4 +65,4 @@ class FinanceInvoicesIdPaymentsEndpoint(ConnectWiseEndpoint):
         Returns:
             InvoicePayment: The parsed response data.
         """
-        return self._parse_one(InvoicePayment, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(InvoicePayment, super()._make_request("POST", data=data, params=params).content)
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesCountEndpoint import FinanceTaxcodesCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdEndpoint import FinanceTaxcodesIdEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesInfoEndpoint import FinanceTaxcodesInfoEndpoint
 from pyconnectwise.models.manage import TaxCode
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesCountEndpoint import FinanceTaxcodesCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdEndpoint import FinanceTaxcodesIdEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesInfoEndpoint import FinanceTaxcodesInfoEndpoint
+
 
 class FinanceTaxcodesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "taxCodes", parent_endpoint=parent_endpoint)
+    endpoint_base = "taxCodes"
+    _route = "finance/taxCodes"
 
-        self.info = self._register_child_endpoint(FinanceTaxcodesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(FinanceTaxcodesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceTaxcodesIdEndpoint:
+    def id(self, id: int) -> "FinanceTaxcodesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceTaxcodesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceTaxcodesIdEndpoint: The initialized FinanceTaxcodesIdEndpoint object.
+            FinanceTaxcodesIdEndpoint: The FinanceTaxcodesIdEndpoint view bound to the ID.
         """
-        child = FinanceTaxcodesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceTaxcodesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TaxCode]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TaxCode]:
         """
         Performs a GET request against the /finance/taxCodes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TaxCode]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TaxCode,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TaxCode, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TaxCode]:
         """
@@ -59,7 +55,7 @@ class FinanceTaxcodesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TaxCode]: The parsed response data.
         """
-        return self._parse_many(TaxCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxCode, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxCode:
         """
@@ -71,4 +67,12 @@ class FinanceTaxcodesEndpoint(ConnectWiseEndpoint):
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceTaxcodesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "FinanceTaxcodesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesCountEndpoint")
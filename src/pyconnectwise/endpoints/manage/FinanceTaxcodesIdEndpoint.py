@@ -1,64 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdCopyEndpoint import FinanceTaxcodesIdCopyEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsEndpoint import \
-    FinanceTaxcodesIdExpensetypeexemptionsEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdInfoEndpoint import FinanceTaxcodesIdInfoEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsEndpoint import \
-    FinanceTaxcodesIdProducttypeexemptionsEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodelevelsEndpoint import FinanceTaxcodesIdTaxcodelevelsEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsEndpoint import FinanceTaxcodesIdTaxcodexrefsEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdUsagesEndpoint import FinanceTaxcodesIdUsagesEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsEndpoint import \
-    FinanceTaxcodesIdWorkroleexemptionsEndpoint
 from pyconnectwise.models.manage import TaxCode
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdCopyEndpoint import FinanceTaxcodesIdCopyEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsEndpoint import \
+        FinanceTaxcodesIdExpensetypeexemptionsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdInfoEndpoint import FinanceTaxcodesIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsEndpoint import \
+        FinanceTaxcodesIdProducttypeexemptionsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodelevelsEndpoint import \
+        FinanceTaxcodesIdTaxcodelevelsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsEndpoint import \
+        FinanceTaxcodesIdTaxcodexrefsEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdUsagesEndpoint import FinanceTaxcodesIdUsagesEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsEndpoint import \
+        FinanceTaxcodesIdWorkroleexemptionsEndpoint
+
 
 class FinanceTaxcodesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "finance/taxCodes/{id}"
 
-        self.info = self._register_child_endpoint(FinanceTaxcodesIdInfoEndpoint(client, parent_endpoint=self))
-        self.product_type_exemptions = self._register_child_endpoint(
-            FinanceTaxcodesIdProducttypeexemptionsEndpoint(client, parent_endpoint=self)
-        )
-        self.work_role_exemptions = self._register_child_endpoint(
-            FinanceTaxcodesIdWorkroleexemptionsEndpoint(client, parent_endpoint=self)
-        )
-        self.tax_code_levels = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodelevelsEndpoint(client, parent_endpoint=self)
-        )
-        self.copy = self._register_child_endpoint(FinanceTaxcodesIdCopyEndpoint(client, parent_endpoint=self))
-        self.expense_type_exemptions = self._register_child_endpoint(
-            FinanceTaxcodesIdExpensetypeexemptionsEndpoint(client, parent_endpoint=self)
-        )
-        self.tax_code_x_refs = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodexrefsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(FinanceTaxcodesIdUsagesEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TaxCode]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TaxCode]:
         """
         Performs a GET request against the /finance/taxCodes/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TaxCode]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TaxCode,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TaxCode, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxCode:
         """
@@ -70,7 +54,7 @@ class FinanceTaxcodesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -92,7 +76,7 @@ class FinanceTaxcodesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxCode:
         """
@@ -104,4 +88,40 @@ class FinanceTaxcodesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "FinanceTaxcodesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesIdInfoEndpoint")
+
+    @cached_property
+    def product_type_exemptions(self) -> "FinanceTaxcodesIdProducttypeexemptionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsEndpoint"
+        )
+
+    @cached_property
+    def work_role_exemptions(self) -> "FinanceTaxcodesIdWorkroleexemptionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsEndpoint")
+
+    @cached_property
+    def tax_code_levels(self) -> "FinanceTaxcodesIdTaxcodelevelsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodelevelsEndpoint")
+
+    @cached_property
+    def copy(self) -> "FinanceTaxcodesIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesIdCopyEndpoint")
+
+    @cached_property
+    def expense_type_exemptions(self) -> "FinanceTaxcodesIdExpensetypeexemptionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsEndpoint"
+        )
+
+    @cached_property
+    def tax_code_x_refs(self) -> "FinanceTaxcodesIdTaxcodexrefsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsEndpoint")
+
+    @cached_property
+    def usages(self) -> "FinanceTaxcodesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesIdUsagesEndpoint")
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsCountEndpoint import \
-    FinanceTaxcodesIdExpensetypeexemptionsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint import \
-    FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint
 from pyconnectwise.models.manage import ExpenseTypeExemption
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsCountEndpoint import \
+        FinanceTaxcodesIdExpensetypeexemptionsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint import \
+        FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint
+
 
 class FinanceTaxcodesIdExpensetypeexemptionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "expenseTypeExemptions", parent_endpoint=parent_endpoint)
+    endpoint_base = "expenseTypeExemptions"
+    _route = "finance/taxCodes/{id}/expenseTypeExemptions"
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdExpensetypeexemptionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint:
+    def id(self, id: int) -> "FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint: The initialized FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint object.
+            FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint: The FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint view bound to the ID.
         """
-        child = FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ExpenseTypeExemption]:
         """
         Performs a GET request against the /finance/taxCodes/{id}/expenseTypeExemptions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ExpenseTypeExemption]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ExpenseTypeExemption,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ExpenseTypeExemption, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ExpenseTypeExemption]:
         """
@@ -63,7 +56,7 @@ class FinanceTaxcodesIdExpensetypeexemptionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ExpenseTypeExemption]: The parsed response data.
         """
-        return self._parse_many(ExpenseTypeExemption, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseTypeExemption, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ExpenseTypeExemption:
         """
@@ -75,4 +68,10 @@ class FinanceTaxcodesIdExpensetypeexemptionsEndpoint(ConnectWiseEndpoint):
         Returns:
             ExpenseTypeExemption: The parsed response data.
         """
-        return self._parse_one(ExpenseTypeExemption, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ExpenseTypeExemption, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceTaxcodesIdExpensetypeexemptionsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdExpensetypeexemptionsCountEndpoint"
+        )
@@ -1,59 +1,53 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint import \
-    FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint import \
-    FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint
 from pyconnectwise.models.manage import TaxableProductTypeLevel
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint import \
+        FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint import \
+        FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint
+
 
 class FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "taxableProductTypeLevels", parent_endpoint=parent_endpoint)
+    endpoint_base = "taxableProductTypeLevels"
+    _route = "finance/taxCodes/{id}/productTypeExemptions/{id}/taxableProductTypeLevels"
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint:
+    def id(self, id: int) -> "FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint: The initialized FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint object.
+            FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint: The FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint view bound to the ID.
         """
-        child = FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint(
-            self.client, parent_endpoint=self
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint",
+            id,
         )
-        child._id = id
-        return child
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[TaxableProductTypeLevel]:
         """
         Performs a GET request against the /finance/taxCodes/{id}/productTypeExemptions/{id}/taxableProductTypeLevels endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TaxableProductTypeLevel]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TaxableProductTypeLevel,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TaxableProductTypeLevel, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TaxableProductTypeLevel]:
         """
@@ -65,7 +59,7 @@ class FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint(C
         Returns:
             list[TaxableProductTypeLevel]: The parsed response data.
         """
-        return self._parse_many(TaxableProductTypeLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxableProductTypeLevel, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxableProductTypeLevel:
         """
@@ -77,4 +71,10 @@ class FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint(C
         Returns:
             TaxableProductTypeLevel: The parsed response data.
         """
-        return self._parse_one(TaxableProductTypeLevel, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxableProductTypeLevel, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint"
+        )
@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsCountEndpoint import \
-    FinanceTaxcodesIdTaxcodexrefsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdEndpoint import \
-    FinanceTaxcodesIdTaxcodexrefsIdEndpoint
 from pyconnectwise.models.manage import TaxCodeXRef
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsCountEndpoint import \
+        FinanceTaxcodesIdTaxcodexrefsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdEndpoint import \
+        FinanceTaxcodesIdTaxcodexrefsIdEndpoint
+
 
 class FinanceTaxcodesIdTaxcodexrefsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "taxCodeXRefs", parent_endpoint=parent_endpoint)
+    endpoint_base = "taxCodeXRefs"
+    _route = "finance/taxCodes/{id}/taxCodeXRefs"
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodexrefsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceTaxcodesIdTaxcodexrefsIdEndpoint:
+    def id(self, id: int) -> "FinanceTaxcodesIdTaxcodexrefsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdTaxcodexrefsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceTaxcodesIdTaxcodexrefsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceTaxcodesIdTaxcodexrefsIdEndpoint: The initialized FinanceTaxcodesIdTaxcodexrefsIdEndpoint object.
+            FinanceTaxcodesIdTaxcodexrefsIdEndpoint: The FinanceTaxcodesIdTaxcodexrefsIdEndpoint view bound to the ID.
         """
-        child = FinanceTaxcodesIdTaxcodexrefsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TaxCodeXRef]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TaxCodeXRef]:
         """
         Performs a GET request against the /finance/taxCodes/{id}/taxCodeXRefs endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TaxCodeXRef]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TaxCodeXRef,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TaxCodeXRef, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TaxCodeXRef]:
         """
@@ -61,7 +56,7 @@ class FinanceTaxcodesIdTaxcodexrefsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TaxCodeXRef]: The parsed response data.
         """
-        return self._parse_many(TaxCodeXRef, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxCodeXRef, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxCodeXRef:
         """
@@ -73,4 +68,8 @@ class FinanceTaxcodesIdTaxcodexrefsEndpoint(ConnectWiseEndpoint):
         Returns:
             TaxCodeXRef: The parsed response data.
         """
-        return self._parse_one(TaxCodeXRef, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxCodeXRef, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceTaxcodesIdTaxcodexrefsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsCountEndpoint")
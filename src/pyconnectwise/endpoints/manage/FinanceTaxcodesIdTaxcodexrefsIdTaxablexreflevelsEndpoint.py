@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint import \
-    FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint import \
-    FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint
 from pyconnectwise.models.manage import TaxableXRefLevel
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint import \
+        FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint import \
+        FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint
+
 
 class FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "taxableXRefLevels", parent_endpoint=parent_endpoint)
+    endpoint_base = "taxableXRefLevels"
+    _route = "finance/taxCodes/{id}/taxCodeXRefs/{id}/taxableXRefLevels"
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint:
+    def id(self, id: int) -> "FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint: The initialized FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint object.
+            FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint: The FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint view bound to the ID.
         """
-        child = FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[TaxableXRefLevel]:
         """
         Performs a GET request against the /finance/taxCodes/{id}/taxCodeXRefs/{id}/taxableXRefLevels endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TaxableXRefLevel]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TaxableXRefLevel,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TaxableXRefLevel, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TaxableXRefLevel]:
         """
@@ -63,7 +58,7 @@ class FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint(ConnectWiseEndpoi
         Returns:
             list[TaxableXRefLevel]: The parsed response data.
         """
-        return self._parse_many(TaxableXRefLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxableXRefLevel, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxableXRefLevel:
         """
@@ -75,4 +70,10 @@ class FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint(ConnectWiseEndpoi
         Returns:
             TaxableXRefLevel: The parsed response data.
         """
-        return self._parse_one(TaxableXRefLevel, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxableXRefLevel, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint"
+        )
@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint import \
-    FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint
-from pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint import \
-    FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint
 from pyconnectwise.models.manage import TaxableWorkRoleLevel
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint import \
+        FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint
+    from pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint import \
+        FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint
+
 
 class FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "taxableWorkRoleLevels", parent_endpoint=parent_endpoint)
+    endpoint_base = "taxableWorkRoleLevels"
+    _route = "finance/taxCodes/{id}/workRoleExemptions/{id}/taxableWorkRoleLevels"
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint:
+    def id(self, id: int) -> "FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint: The initialized FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint object.
+            FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint: The FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint view bound to the ID.
         """
-        child = FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[TaxableWorkRoleLevel]:
         """
         Performs a GET request against the /finance/taxCodes/{id}/workRoleExemptions/{id}/taxableWorkRoleLevels endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TaxableWorkRoleLevel]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TaxableWorkRoleLevel,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TaxableWorkRoleLevel, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TaxableWorkRoleLevel]:
         """
@@ -63,7 +58,7 @@ class FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint(Connect
         Returns:
             list[TaxableWorkRoleLevel]: The parsed response data.
         """
-        return self._parse_many(TaxableWorkRoleLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxableWorkRoleLevel, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TaxableWorkRoleLevel:
         """
@@ -75,4 +70,10 @@ class FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint(Connect
         Returns:
             TaxableWorkRoleLevel: The parsed response data.
         """
-        return self._parse_one(TaxableWorkRoleLevel, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxableWorkRoleLevel, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint"
+        )
@@ -1,57 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsCountEndpoint import MarketingCampaignsCountEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdEndpoint import MarketingCampaignsIdEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsStatusesEndpoint import MarketingCampaignsStatusesEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesEndpoint import MarketingCampaignsSubtypesEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsTypesEndpoint import MarketingCampaignsTypesEndpoint
 from pyconnectwise.models.manage import Campaign
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingCampaignsCountEndpoint import MarketingCampaignsCountEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdEndpoint import MarketingCampaignsIdEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsStatusesEndpoint import MarketingCampaignsStatusesEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesEndpoint import MarketingCampaignsSubtypesEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsTypesEndpoint import MarketingCampaignsTypesEndpoint
+
 
 class MarketingCampaignsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "campaigns", parent_endpoint=parent_endpoint)
+    endpoint_base = "campaigns"
+    _route = "marketing/campaigns"
 
-        self.types = self._register_child_endpoint(MarketingCampaignsTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(MarketingCampaignsCountEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(MarketingCampaignsStatusesEndpoint(client, parent_endpoint=self))
-        self.sub_types = self._register_child_endpoint(MarketingCampaignsSubtypesEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MarketingCampaignsIdEndpoint:
+    def id(self, id: int) -> "MarketingCampaignsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MarketingCampaignsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MarketingCampaignsIdEndpoint: The initialized MarketingCampaignsIdEndpoint object.
+            MarketingCampaignsIdEndpoint: The MarketingCampaignsIdEndpoint view bound to the ID.
         """
-        child = MarketingCampaignsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.MarketingCampaignsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Campaign]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Campaign]:
         """
         Performs a GET request against the /marketing/campaigns endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Campaign]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Campaign,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Campaign, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Campaign]:
         """
@@ -63,7 +57,7 @@ class MarketingCampaignsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Campaign]: The parsed response data.
         """
-        return self._parse_many(Campaign, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Campaign, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Campaign:
         """
@@ -75,4 +69,20 @@ class MarketingCampaignsEndpoint(ConnectWiseEndpoint):
         Returns:
             Campaign: The parsed response data.
         """
-        return self._parse_one(Campaign, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Campaign, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def types(self) -> "MarketingCampaignsTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "MarketingCampaignsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsCountEndpoint")
+
+    @cached_property
+    def statuses(self) -> "MarketingCampaignsStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsStatusesEndpoint")
+
+    @cached_property
+    def sub_types(self) -> "MarketingCampaignsSubtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesEndpoint")
@@ -1,56 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsCountEndpoint import \
-    MarketingCampaignsIdAuditsCountEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsIdEndpoint import MarketingCampaignsIdAuditsIdEndpoint
 from pyconnectwise.models.manage import CampaignAudit
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsCountEndpoint import \
+        MarketingCampaignsIdAuditsCountEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsIdEndpoint import MarketingCampaignsIdAuditsIdEndpoint
+
 
 class MarketingCampaignsIdAuditsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "audits", parent_endpoint=parent_endpoint)
+    endpoint_base = "audits"
+    _route = "marketing/campaigns/{id}/audits"
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsIdAuditsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MarketingCampaignsIdAuditsIdEndpoint:
+    def id(self, id: int) -> "MarketingCampaignsIdAuditsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdAuditsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MarketingCampaignsIdAuditsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MarketingCampaignsIdAuditsIdEndpoint: The initialized MarketingCampaignsIdAuditsIdEndpoint object.
+            MarketingCampaignsIdAuditsIdEndpoint: The MarketingCampaignsIdAuditsIdEndpoint view bound to the ID.
         """
-        child = MarketingCampaignsIdAuditsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CampaignAudit]:
         """
         Performs a GET request against the /marketing/campaigns/{id}/audits endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CampaignAudit]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CampaignAudit,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CampaignAudit, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CampaignAudit]:
         """
@@ -62,7 +55,7 @@ class MarketingCampaignsIdAuditsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CampaignAudit]: The parsed response data.
         """
-        return self._parse_many(CampaignAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CampaignAudit, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CampaignAudit:
         """
@@ -74,4 +67,8 @@ class MarketingCampaignsIdAuditsEndpoint(ConnectWiseEndpoint):
         Returns:
             CampaignAudit: The parsed response data.
         """
-        return self._parse_one(CampaignAudit, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CampaignAudit, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "MarketingCampaignsIdAuditsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsCountEndpoint")
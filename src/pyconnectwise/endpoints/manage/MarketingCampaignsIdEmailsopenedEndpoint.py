@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedCountEndpoint import \
-    MarketingCampaignsIdEmailsopenedCountEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedIdEndpoint import \
-    MarketingCampaignsIdEmailsopenedIdEndpoint
 from pyconnectwise.models.manage import EmailOpened
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedCountEndpoint import \
+        MarketingCampaignsIdEmailsopenedCountEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedIdEndpoint import \
+        MarketingCampaignsIdEmailsopenedIdEndpoint
+
 
 class MarketingCampaignsIdEmailsopenedEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "emailsOpened", parent_endpoint=parent_endpoint)
+    endpoint_base = "emailsOpened"
+    _route = "marketing/campaigns/{id}/emailsOpened"
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsIdEmailsopenedCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MarketingCampaignsIdEmailsopenedIdEndpoint:
+    def id(self, id: int) -> "MarketingCampaignsIdEmailsopenedIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdEmailsopenedIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MarketingCampaignsIdEmailsopenedIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MarketingCampaignsIdEmailsopenedIdEndpoint: The initialized MarketingCampaignsIdEmailsopenedIdEndpoint object.
+            MarketingCampaignsIdEmailsopenedIdEndpoint: The MarketingCampaignsIdEmailsopenedIdEndpoint view bound to the ID.
         """
-        child = MarketingCampaignsIdEmailsopenedIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[EmailOpened]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[EmailOpened]:
         """
         Performs a GET request against the /marketing/campaigns/{id}/emailsOpened endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[EmailOpened]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            EmailOpened,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(EmailOpened, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[EmailOpened]:
         """
@@ -61,7 +56,7 @@ class MarketingCampaignsIdEmailsopenedEndpoint(ConnectWiseEndpoint):
         Returns:
             list[EmailOpened]: The parsed response data.
         """
-        return self._parse_many(EmailOpened, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EmailOpened, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EmailOpened:
         """
@@ -73,4 +68,10 @@ class MarketingCampaignsIdEmailsopenedEndpoint(ConnectWiseEndpoint):
         Returns:
             EmailOpened: The parsed response data.
         """
-        return self._parse_one(EmailOpened, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(EmailOpened, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "MarketingCampaignsIdEmailsopenedCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedCountEndpoint"
+        )
@@ -1,61 +1,46 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdActivitiesEndpoint import MarketingCampaignsIdActivitiesEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsEndpoint import MarketingCampaignsIdAuditsEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedEndpoint import \
-    MarketingCampaignsIdEmailsopenedEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdFormssubmittedEndpoint import \
-    MarketingCampaignsIdFormssubmittedEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedEndpoint import \
-    MarketingCampaignsIdLinksclickedEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdOpportunitiesEndpoint import \
-    MarketingCampaignsIdOpportunitiesEndpoint
 from pyconnectwise.models.manage import Campaign
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdActivitiesEndpoint import \
+        MarketingCampaignsIdActivitiesEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsEndpoint import MarketingCampaignsIdAuditsEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedEndpoint import \
+        MarketingCampaignsIdEmailsopenedEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdFormssubmittedEndpoint import \
+        MarketingCampaignsIdFormssubmittedEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedEndpoint import \
+        MarketingCampaignsIdLinksclickedEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdOpportunitiesEndpoint import \
+        MarketingCampaignsIdOpportunitiesEndpoint
+
 
 class MarketingCampaignsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "marketing/campaigns/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
-
-        self.forms_submitted = self._register_child_endpoint(
-            MarketingCampaignsIdFormssubmittedEndpoint(client, parent_endpoint=self)
-        )
-        self.audits = self._register_child_endpoint(MarketingCampaignsIdAuditsEndpoint(client, parent_endpoint=self))
-        self.emails_opened = self._register_child_endpoint(
-            MarketingCampaignsIdEmailsopenedEndpoint(client, parent_endpoint=self)
-        )
-        self.links_clicked = self._register_child_endpoint(
-            MarketingCampaignsIdLinksclickedEndpoint(client, parent_endpoint=self)
-        )
-        self.activities = self._register_child_endpoint(
-            MarketingCampaignsIdActivitiesEndpoint(client, parent_endpoint=self)
-        )
-        self.opportunities = self._register_child_endpoint(
-            MarketingCampaignsIdOpportunitiesEndpoint(client, parent_endpoint=self)
-        )
-
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Campaign]:
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Campaign]:
         """
         Performs a GET request against the /marketing/campaigns/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Campaign]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Campaign,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Campaign, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Campaign:
         """
@@ -67,7 +52,7 @@ class MarketingCampaignsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Campaign: The parsed response data.
         """
-        return self._parse_one(Campaign, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Campaign, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -89,7 +74,7 @@ class MarketingCampaignsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Campaign: The parsed response data.
         """
-        return self._parse_one(Campaign, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Campaign, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Campaign:
         """
@@ -101,4 +86,28 @@ class MarketingCampaignsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Campaign: The parsed response data.
         """
-        return self._parse_one(Campaign, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Campaign, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def forms_submitted(self) -> "MarketingCampaignsIdFormssubmittedEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsIdFormssubmittedEndpoint")
+
+    @cached_property
+    def audits(self) -> "MarketingCampaignsIdAuditsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsIdAuditsEndpoint")
+
+    @cached_property
+    def emails_opened(self) -> "MarketingCampaignsIdEmailsopenedEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsIdEmailsopenedEndpoint")
+
+    @cached_property
+    def links_clicked(self) -> "MarketingCampaignsIdLinksclickedEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedEndpoint")
+
+    @cached_property
+    def activities(self) -> "MarketingCampaignsIdActivitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsIdActivitiesEndpoint")
+
+    @cached_property
+    def opportunities(self) -> "MarketingCampaignsIdOpportunitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsIdOpportunitiesEndpoint")
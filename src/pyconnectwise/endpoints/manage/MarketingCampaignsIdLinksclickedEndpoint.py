@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedCountEndpoint import \
-    MarketingCampaignsIdLinksclickedCountEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedIdEndpoint import \
-    MarketingCampaignsIdLinksclickedIdEndpoint
 from pyconnectwise.models.manage import LinkClicked
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedCountEndpoint import \
+        MarketingCampaignsIdLinksclickedCountEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedIdEndpoint import \
+        MarketingCampaignsIdLinksclickedIdEndpoint
+
 
 class MarketingCampaignsIdLinksclickedEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "linksClicked", parent_endpoint=parent_endpoint)
+    endpoint_base = "linksClicked"
+    _route = "marketing/campaigns/{id}/linksClicked"
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsIdLinksclickedCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MarketingCampaignsIdLinksclickedIdEndpoint:
+    def id(self, id: int) -> "MarketingCampaignsIdLinksclickedIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdLinksclickedIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MarketingCampaignsIdLinksclickedIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MarketingCampaignsIdLinksclickedIdEndpoint: The initialized MarketingCampaignsIdLinksclickedIdEndpoint object.
+            MarketingCampaignsIdLinksclickedIdEndpoint: The MarketingCampaignsIdLinksclickedIdEndpoint view bound to the ID.
         """
-        child = MarketingCampaignsIdLinksclickedIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[LinkClicked]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[LinkClicked]:
         """
         Performs a GET request against the /marketing/campaigns/{id}/linksClicked endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LinkClicked]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LinkClicked,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LinkClicked, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LinkClicked]:
         """
@@ -61,7 +56,7 @@ class MarketingCampaignsIdLinksclickedEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LinkClicked]: The parsed response data.
         """
-        return self._parse_many(LinkClicked, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LinkClicked, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LinkClicked:
         """
@@ -73,4 +68,10 @@ class MarketingCampaignsIdLinksclickedEndpoint(ConnectWiseEndpoint):
         Returns:
             LinkClicked: The parsed response data.
         """
-        return self._parse_one(LinkClicked, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LinkClicked, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "MarketingCampaignsIdLinksclickedCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.MarketingCampaignsIdLinksclickedCountEndpoint"
+        )
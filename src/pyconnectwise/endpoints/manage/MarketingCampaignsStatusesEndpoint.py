@@ -1,56 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsStatusesCountEndpoint import \
-    MarketingCampaignsStatusesCountEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsStatusesIdEndpoint import MarketingCampaignsStatusesIdEndpoint
 from pyconnectwise.models.manage import CampaignStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingCampaignsStatusesCountEndpoint import \
+        MarketingCampaignsStatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsStatusesIdEndpoint import MarketingCampaignsStatusesIdEndpoint
+
 
 class MarketingCampaignsStatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "statuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "statuses"
+    _route = "marketing/campaigns/statuses"
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsStatusesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MarketingCampaignsStatusesIdEndpoint:
+    def id(self, id: int) -> "MarketingCampaignsStatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MarketingCampaignsStatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MarketingCampaignsStatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MarketingCampaignsStatusesIdEndpoint: The initialized MarketingCampaignsStatusesIdEndpoint object.
+            MarketingCampaignsStatusesIdEndpoint: The MarketingCampaignsStatusesIdEndpoint view bound to the ID.
         """
-        child = MarketingCampaignsStatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.MarketingCampaignsStatusesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CampaignStatus]:
         """
         Performs a GET request against the /marketing/campaigns/statuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CampaignStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CampaignStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CampaignStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CampaignStatus]:
         """
@@ -62,7 +55,7 @@ class MarketingCampaignsStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CampaignStatus]: The parsed response data.
         """
-        return self._parse_many(CampaignStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CampaignStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CampaignStatus:
         """
@@ -74,4 +67,8 @@ class MarketingCampaignsStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             CampaignStatus: The parsed response data.
         """
-        return self._parse_one(CampaignStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CampaignStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "MarketingCampaignsStatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsStatusesCountEndpoint")
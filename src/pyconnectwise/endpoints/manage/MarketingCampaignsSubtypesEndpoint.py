@@ -1,56 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesCountEndpoint import \
-    MarketingCampaignsSubtypesCountEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesIdEndpoint import MarketingCampaignsSubtypesIdEndpoint
 from pyconnectwise.models.manage import CampaignSubTypeCampaignSubType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesCountEndpoint import \
+        MarketingCampaignsSubtypesCountEndpoint
+    from pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesIdEndpoint import MarketingCampaignsSubtypesIdEndpoint
+
 
 class MarketingCampaignsSubtypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "subTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "subTypes"
+    _route = "marketing/campaigns/subTypes"
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsSubtypesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MarketingCampaignsSubtypesIdEndpoint:
+    def id(self, id: int) -> "MarketingCampaignsSubtypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MarketingCampaignsSubtypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MarketingCampaignsSubtypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MarketingCampaignsSubtypesIdEndpoint: The initialized MarketingCampaignsSubtypesIdEndpoint object.
+            MarketingCampaignsSubtypesIdEndpoint: The MarketingCampaignsSubtypesIdEndpoint view bound to the ID.
         """
-        child = MarketingCampaignsSubtypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CampaignSubTypeCampaignSubType]:
         """
         Performs a GET request against the /marketing/campaigns/subTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CampaignSubTypeCampaignSubType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CampaignSubTypeCampaignSubType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CampaignSubTypeCampaignSubType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CampaignSubTypeCampaignSubType]:
         """
@@ -63,7 +56,7 @@ class MarketingCampaignsSubtypesEndpoint(ConnectWiseEndpoint):
             list[CampaignSubTypeCampaignSubType]: The parsed response data.
         """
         return self._parse_many(
-            CampaignSubTypeCampaignSubType, super()._make_request("GET", data=data, params=params).json()
+            CampaignSubTypeCampaignSubType, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CampaignSubTypeCampaignSubType:
@@ -77,5 +70,9 @@ class MarketingCampaignsSubtypesEndpoint(ConnectWiseEndpoint):
             CampaignSubTypeCampaignSubType: The parsed response data.
         """
         return self._parse_one(
-            CampaignSubTypeCampaignSubType, super()._make_request("POST", data=data, params=params).json()
+            CampaignSubTypeCampaignSubType, super()._make_request("POST", data=data, params=params).content
         )
+
+    @cached_property
+    def count(self) -> "MarketingCampaignsSubtypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsSubtypesCountEndpoint")
@@ -1,14 +1,25 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingCampaignsEndpoint import MarketingCampaignsEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsEndpoint import MarketingGroupsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingCampaignsEndpoint import MarketingCampaignsEndpoint
+    from pyconnectwise.endpoints.manage.MarketingGroupsEndpoint import MarketingGroupsEndpoint
+
 
 class MarketingEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "marketing"
+    _route = "marketing"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "marketing", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def campaigns(self) -> "MarketingCampaignsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingCampaignsEndpoint")
 
-        self.campaigns = self._register_child_endpoint(MarketingCampaignsEndpoint(client, parent_endpoint=self))
-        self.groups = self._register_child_endpoint(MarketingGroupsEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def groups(self) -> "MarketingGroupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingGroupsEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsCountEndpoint import MarketingGroupsCountEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsIdEndpoint import MarketingGroupsIdEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsInfoEndpoint import MarketingGroupsInfoEndpoint
 from pyconnectwise.models.manage import Group
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingGroupsCountEndpoint import MarketingGroupsCountEndpoint
+    from pyconnectwise.endpoints.manage.MarketingGroupsIdEndpoint import MarketingGroupsIdEndpoint
+    from pyconnectwise.endpoints.manage.MarketingGroupsInfoEndpoint import MarketingGroupsInfoEndpoint
+
 
 class MarketingGroupsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "groups", parent_endpoint=parent_endpoint)
+    endpoint_base = "groups"
+    _route = "marketing/groups"
 
-        self.info = self._register_child_endpoint(MarketingGroupsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(MarketingGroupsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MarketingGroupsIdEndpoint:
+    def id(self, id: int) -> "MarketingGroupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MarketingGroupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MarketingGroupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MarketingGroupsIdEndpoint: The initialized MarketingGroupsIdEndpoint object.
+            MarketingGroupsIdEndpoint: The MarketingGroupsIdEndpoint view bound to the ID.
         """
-        child = MarketingGroupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.MarketingGroupsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Group]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Group]:
         """
         Performs a GET request against the /marketing/groups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Group]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Group,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Group, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Group]:
         """
@@ -59,7 +55,7 @@ class MarketingGroupsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Group]: The parsed response data.
         """
-        return self._parse_many(Group, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Group, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Group:
         """
@@ -71,4 +67,12 @@ class MarketingGroupsEndpoint(ConnectWiseEndpoint):
         Returns:
             Group: The parsed response data.
         """
-        return self._parse_one(Group, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Group, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "MarketingGroupsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingGroupsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "MarketingGroupsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingGroupsCountEndpoint")
@@ -1,56 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesCountEndpoint import \
-    MarketingGroupsIdCompaniesCountEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesIdEndpoint import MarketingGroupsIdCompaniesIdEndpoint
 from pyconnectwise.models.manage import MarketingCompany
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesCountEndpoint import \
+        MarketingGroupsIdCompaniesCountEndpoint
+    from pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesIdEndpoint import MarketingGroupsIdCompaniesIdEndpoint
+
 
 class MarketingGroupsIdCompaniesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "companies", parent_endpoint=parent_endpoint)
+    endpoint_base = "companies"
+    _route = "marketing/groups/{id}/companies"
 
-        self.count = self._register_child_endpoint(
-            MarketingGroupsIdCompaniesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> MarketingGroupsIdCompaniesIdEndpoint:
+    def id(self, id: int) -> "MarketingGroupsIdCompaniesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized MarketingGroupsIdCompaniesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a MarketingGroupsIdCompaniesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            MarketingGroupsIdCompaniesIdEndpoint: The initialized MarketingGroupsIdCompaniesIdEndpoint object.
+            MarketingGroupsIdCompaniesIdEndpoint: The MarketingGroupsIdCompaniesIdEndpoint view bound to the ID.
         """
-        child = MarketingGroupsIdCompaniesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[MarketingCompany]:
         """
         Performs a GET request against the /marketing/groups/{id}/companies endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MarketingCompany]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MarketingCompany,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MarketingCompany, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MarketingCompany]:
         """
@@ -62,7 +55,7 @@ class MarketingGroupsIdCompaniesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[MarketingCompany]: The parsed response data.
         """
-        return self._parse_many(MarketingCompany, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MarketingCompany, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MarketingCompany:
         """
@@ -74,4 +67,8 @@ class MarketingGroupsIdCompaniesEndpoint(ConnectWiseEndpoint):
         Returns:
             MarketingCompany: The parsed response data.
         """
-        return self._parse_one(MarketingCompany, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MarketingCompany, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "MarketingGroupsIdCompaniesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesCountEndpoint")
@@ -1,43 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesEndpoint import MarketingGroupsIdCompaniesEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsIdContactsEndpoint import MarketingGroupsIdContactsEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsIdInfoEndpoint import MarketingGroupsIdInfoEndpoint
-from pyconnectwise.endpoints.manage.MarketingGroupsIdUsagesEndpoint import MarketingGroupsIdUsagesEndpoint
 from pyconnectwise.models.manage import Group
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesEndpoint import MarketingGroupsIdCompaniesEndpoint
+    from pyconnectwise.endpoints.manage.MarketingGroupsIdContactsEndpoint import MarketingGroupsIdContactsEndpoint
+    from pyconnectwise.endpoints.manage.MarketingGroupsIdInfoEndpoint import MarketingGroupsIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.MarketingGroupsIdUsagesEndpoint import MarketingGroupsIdUsagesEndpoint
+
 
 class MarketingGroupsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "marketing/groups/{id}"
 
-        self.usages = self._register_child_endpoint(MarketingGroupsIdUsagesEndpoint(client, parent_endpoint=self))
-        self.companies = self._register_child_endpoint(MarketingGroupsIdCompaniesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(MarketingGroupsIdInfoEndpoint(client, parent_endpoint=self))
-        self.contacts = self._register_child_endpoint(MarketingGroupsIdContactsEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Group]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Group]:
         """
         Performs a GET request against the /marketing/groups/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Group]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Group,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Group, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Group:
         """
@@ -49,7 +45,7 @@ class MarketingGroupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Group: The parsed response data.
         """
-        return self._parse_one(Group, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Group, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -71,7 +67,7 @@ class MarketingGroupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Group: The parsed response data.
         """
-        return self._parse_one(Group, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Group, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Group:
         """
@@ -83,4 +79,20 @@ class MarketingGroupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Group: The parsed response data.
         """
-        return self._parse_one(Group, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Group, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "MarketingGroupsIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingGroupsIdUsagesEndpoint")
+
+    @cached_property
+    def companies(self) -> "MarketingGroupsIdCompaniesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingGroupsIdCompaniesEndpoint")
+
+    @cached_property
+    def info(self) -> "MarketingGroupsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingGroupsIdInfoEndpoint")
+
+    @cached_property
+    def contacts(self) -> "MarketingGroupsIdContactsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.MarketingGroupsIdContactsEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementAdjustmentsCountEndpoint import ProcurementAdjustmentsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementAdjustmentsIdEndpoint import ProcurementAdjustmentsIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesEndpoint import ProcurementAdjustmentsTypesEndpoint
 from pyconnectwise.models.manage import ProcurementAdjustment
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementAdjustmentsCountEndpoint import ProcurementAdjustmentsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementAdjustmentsIdEndpoint import ProcurementAdjustmentsIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesEndpoint import ProcurementAdjustmentsTypesEndpoint
+
 
 class ProcurementAdjustmentsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "adjustments", parent_endpoint=parent_endpoint)
+    endpoint_base = "adjustments"
+    _route = "procurement/adjustments"
 
-        self.types = self._register_child_endpoint(ProcurementAdjustmentsTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementAdjustmentsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementAdjustmentsIdEndpoint:
+    def id(self, id: int) -> "ProcurementAdjustmentsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementAdjustmentsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementAdjustmentsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementAdjustmentsIdEndpoint: The initialized ProcurementAdjustmentsIdEndpoint object.
+            ProcurementAdjustmentsIdEndpoint: The ProcurementAdjustmentsIdEndpoint view bound to the ID.
         """
-        child = ProcurementAdjustmentsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementAdjustmentsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProcurementAdjustment]:
         """
         Performs a GET request against the /procurement/adjustments endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProcurementAdjustment]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProcurementAdjustment,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProcurementAdjustment, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProcurementAdjustment]:
         """
@@ -61,7 +55,7 @@ class ProcurementAdjustmentsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProcurementAdjustment]: The parsed response data.
         """
-        return self._parse_many(ProcurementAdjustment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProcurementAdjustment, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProcurementAdjustment:
         """
@@ -73,4 +67,12 @@ class ProcurementAdjustmentsEndpoint(ConnectWiseEndpoint):
         Returns:
             ProcurementAdjustment: The parsed response data.
         """
-        return self._parse_one(ProcurementAdjustment, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProcurementAdjustment, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def types(self) -> "ProcurementAdjustmentsTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementAdjustmentsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementAdjustmentsCountEndpoint")
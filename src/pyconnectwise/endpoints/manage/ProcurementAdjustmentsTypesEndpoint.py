@@ -1,59 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesCountEndpoint import \
-    ProcurementAdjustmentsTypesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesIdEndpoint import ProcurementAdjustmentsTypesIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesInfoEndpoint import \
-    ProcurementAdjustmentsTypesInfoEndpoint
 from pyconnectwise.models.manage import AdjustmentType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesCountEndpoint import \
+        ProcurementAdjustmentsTypesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesIdEndpoint import \
+        ProcurementAdjustmentsTypesIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesInfoEndpoint import \
+        ProcurementAdjustmentsTypesInfoEndpoint
+
 
 class ProcurementAdjustmentsTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "procurement/adjustments/types"
 
-        self.info = self._register_child_endpoint(ProcurementAdjustmentsTypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(
-            ProcurementAdjustmentsTypesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementAdjustmentsTypesIdEndpoint:
+    def id(self, id: int) -> "ProcurementAdjustmentsTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementAdjustmentsTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementAdjustmentsTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementAdjustmentsTypesIdEndpoint: The initialized ProcurementAdjustmentsTypesIdEndpoint object.
+            ProcurementAdjustmentsTypesIdEndpoint: The ProcurementAdjustmentsTypesIdEndpoint view bound to the ID.
         """
-        child = ProcurementAdjustmentsTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AdjustmentType]:
         """
         Performs a GET request against the /procurement/adjustments/types endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AdjustmentType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AdjustmentType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AdjustmentType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AdjustmentType]:
         """
@@ -65,7 +58,7 @@ class ProcurementAdjustmentsTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AdjustmentType]: The parsed response data.
         """
-        return self._parse_many(AdjustmentType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AdjustmentType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AdjustmentType:
         """
@@ -77,4 +70,12 @@ class ProcurementAdjustmentsTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             AdjustmentType: The parsed response data.
         """
-        return self._parse_one(AdjustmentType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AdjustmentType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementAdjustmentsTypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementAdjustmentsTypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementAdjustmentsTypesCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogCountEndpoint import ProcurementCatalogCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdEndpoint import ProcurementCatalogIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogInfoEndpoint import ProcurementCatalogInfoEndpoint
 from pyconnectwise.models.manage import CatalogItem
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementCatalogCountEndpoint import ProcurementCatalogCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdEndpoint import ProcurementCatalogIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogInfoEndpoint import ProcurementCatalogInfoEndpoint
+
 
 class ProcurementCatalogEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "catalog", parent_endpoint=parent_endpoint)
+    endpoint_base = "catalog"
+    _route = "procurement/catalog"
 
-        self.info = self._register_child_endpoint(ProcurementCatalogInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementCatalogCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementCatalogIdEndpoint:
+    def id(self, id: int) -> "ProcurementCatalogIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementCatalogIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementCatalogIdEndpoint: The initialized ProcurementCatalogIdEndpoint object.
+            ProcurementCatalogIdEndpoint: The ProcurementCatalogIdEndpoint view bound to the ID.
         """
-        child = ProcurementCatalogIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementCatalogIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[CatalogItem]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[CatalogItem]:
         """
         Performs a GET request against the /procurement/catalog endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CatalogItem]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CatalogItem,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CatalogItem, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CatalogItem]:
         """
@@ -59,7 +55,7 @@ class ProcurementCatalogEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CatalogItem]: The parsed response data.
         """
-        return self._parse_many(CatalogItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CatalogItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CatalogItem:
         """
@@ -71,4 +67,12 @@ class ProcurementCatalogEndpoint(ConnectWiseEndpoint):
         Returns:
             CatalogItem: The parsed response data.
         """
-        return self._parse_one(CatalogItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CatalogItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementCatalogInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementCatalogCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogCountEndpoint")
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsCountEndpoint import \
-    ProcurementCatalogIdComponentsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsIdEndpoint import \
-    ProcurementCatalogIdComponentsIdEndpoint
 from pyconnectwise.models.manage import CatalogComponent
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsCountEndpoint import \
+        ProcurementCatalogIdComponentsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsIdEndpoint import \
+        ProcurementCatalogIdComponentsIdEndpoint
+
 
 class ProcurementCatalogIdComponentsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "components", parent_endpoint=parent_endpoint)
+    endpoint_base = "components"
+    _route = "procurement/catalog/{id}/components"
 
-        self.count = self._register_child_endpoint(
-            ProcurementCatalogIdComponentsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementCatalogIdComponentsIdEndpoint:
+    def id(self, id: int) -> "ProcurementCatalogIdComponentsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdComponentsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementCatalogIdComponentsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementCatalogIdComponentsIdEndpoint: The initialized ProcurementCatalogIdComponentsIdEndpoint object.
+            ProcurementCatalogIdComponentsIdEndpoint: The ProcurementCatalogIdComponentsIdEndpoint view bound to the ID.
         """
-        child = ProcurementCatalogIdComponentsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CatalogComponent]:
         """
         Performs a GET request against the /procurement/catalog/{id}/components endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CatalogComponent]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CatalogComponent,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CatalogComponent, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CatalogComponent]:
         """
@@ -63,7 +56,7 @@ class ProcurementCatalogIdComponentsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CatalogComponent]: The parsed response data.
         """
-        return self._parse_many(CatalogComponent, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CatalogComponent, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CatalogComponent:
         """
@@ -75,4 +68,8 @@ class ProcurementCatalogIdComponentsEndpoint(ConnectWiseEndpoint):
         Returns:
             CatalogComponent: The parsed response data.
         """
-        return self._parse_one(CatalogComponent, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CatalogComponent, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementCatalogIdComponentsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsCountEndpoint")
@@ -1,57 +1,45 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsEndpoint import ProcurementCatalogIdComponentsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdInfoEndpoint import ProcurementCatalogIdInfoEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryEndpoint import ProcurementCatalogIdInventoryEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdMinimumstockbywarehouseEndpoint import \
-    ProcurementCatalogIdMinimumstockbywarehouseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdPricingEndpoint import ProcurementCatalogIdPricingEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdQuantityonhandEndpoint import \
-    ProcurementCatalogIdQuantityonhandEndpoint
 from pyconnectwise.models.manage import CatalogItem
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsEndpoint import \
+        ProcurementCatalogIdComponentsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdInfoEndpoint import ProcurementCatalogIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryEndpoint import \
+        ProcurementCatalogIdInventoryEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdMinimumstockbywarehouseEndpoint import \
+        ProcurementCatalogIdMinimumstockbywarehouseEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdPricingEndpoint import ProcurementCatalogIdPricingEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdQuantityonhandEndpoint import \
+        ProcurementCatalogIdQuantityonhandEndpoint
+
 
 class ProcurementCatalogIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "procurement/catalog/{id}"
 
-        self.info = self._register_child_endpoint(ProcurementCatalogIdInfoEndpoint(client, parent_endpoint=self))
-        self.quantity_on_hand = self._register_child_endpoint(
-            ProcurementCatalogIdQuantityonhandEndpoint(client, parent_endpoint=self)
-        )
-        self.pricing = self._register_child_endpoint(ProcurementCatalogIdPricingEndpoint(client, parent_endpoint=self))
-        self.components = self._register_child_endpoint(
-            ProcurementCatalogIdComponentsEndpoint(client, parent_endpoint=self)
-        )
-        self.minimum_stock_by_warehouse = self._register_child_endpoint(
-            ProcurementCatalogIdMinimumstockbywarehouseEndpoint(client, parent_endpoint=self)
-        )
-        self.inventory = self._register_child_endpoint(
-            ProcurementCatalogIdInventoryEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[CatalogItem]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[CatalogItem]:
         """
         Performs a GET request against the /procurement/catalog/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CatalogItem]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CatalogItem,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CatalogItem, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CatalogItem:
         """
@@ -63,7 +51,7 @@ class ProcurementCatalogIdEndpoint(ConnectWiseEndpoint):
         Returns:
             CatalogItem: The parsed response data.
         """
-        return self._parse_one(CatalogItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CatalogItem, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -85,7 +73,7 @@ class ProcurementCatalogIdEndpoint(ConnectWiseEndpoint):
         Returns:
             CatalogItem: The parsed response data.
         """
-        return self._parse_one(CatalogItem, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CatalogItem, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CatalogItem:
         """
@@ -97,4 +85,30 @@ class ProcurementCatalogIdEndpoint(ConnectWiseEndpoint):
         Returns:
             CatalogItem: The parsed response data.
         """
-        return self._parse_one(CatalogItem, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CatalogItem, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementCatalogIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogIdInfoEndpoint")
+
+    @cached_property
+    def quantity_on_hand(self) -> "ProcurementCatalogIdQuantityonhandEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogIdQuantityonhandEndpoint")
+
+    @cached_property
+    def pricing(self) -> "ProcurementCatalogIdPricingEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogIdPricingEndpoint")
+
+    @cached_property
+    def components(self) -> "ProcurementCatalogIdComponentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogIdComponentsEndpoint")
+
+    @cached_property
+    def minimum_stock_by_warehouse(self) -> "ProcurementCatalogIdMinimumstockbywarehouseEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementCatalogIdMinimumstockbywarehouseEndpoint"
+        )
+
+    @cached_property
+    def inventory(self) -> "ProcurementCatalogIdInventoryEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryEndpoint")
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryCountEndpoint import \
-    ProcurementCatalogIdInventoryCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryIdEndpoint import \
-    ProcurementCatalogIdInventoryIdEndpoint
 from pyconnectwise.models.manage import CatalogInventory
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryCountEndpoint import \
+        ProcurementCatalogIdInventoryCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryIdEndpoint import \
+        ProcurementCatalogIdInventoryIdEndpoint
+
 
 class ProcurementCatalogIdInventoryEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "inventory", parent_endpoint=parent_endpoint)
+    endpoint_base = "inventory"
+    _route = "procurement/catalog/{id}/inventory"
 
-        self.count = self._register_child_endpoint(
-            ProcurementCatalogIdInventoryCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementCatalogIdInventoryIdEndpoint:
+    def id(self, id: int) -> "ProcurementCatalogIdInventoryIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdInventoryIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementCatalogIdInventoryIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementCatalogIdInventoryIdEndpoint: The initialized ProcurementCatalogIdInventoryIdEndpoint object.
+            ProcurementCatalogIdInventoryIdEndpoint: The ProcurementCatalogIdInventoryIdEndpoint view bound to the ID.
         """
-        child = ProcurementCatalogIdInventoryIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CatalogInventory]:
         """
         Performs a GET request against the /procurement/catalog/{id}/inventory endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CatalogInventory]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CatalogInventory,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CatalogInventory, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CatalogInventory]:
         """
@@ -63,4 +56,8 @@ class ProcurementCatalogIdInventoryEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CatalogInventory]: The parsed response data.
         """
-        return self._parse_many(CatalogInventory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CatalogInventory, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementCatalogIdInventoryCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogIdInventoryCountEndpoint")
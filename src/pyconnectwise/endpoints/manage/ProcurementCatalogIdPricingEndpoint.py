@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import CatalogPricing
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ProcurementCatalogIdPricingEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "pricing"
+    _route = "procurement/catalog/{id}/pricing"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "pricing", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CatalogPricing:
         """
@@ -19,4 +23,4 @@ class ProcurementCatalogIdPricingEndpoint(ConnectWiseEndpoint):
         Returns:
             CatalogPricing: The parsed response data.
         """
-        return self._parse_one(CatalogPricing, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CatalogPricing, super()._make_request("POST", data=data, params=params).content)
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCategoriesCountEndpoint import ProcurementCategoriesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCategoriesIdEndpoint import ProcurementCategoriesIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCategoriesInfoEndpoint import ProcurementCategoriesInfoEndpoint
 from pyconnectwise.models.manage import Category
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementCategoriesCountEndpoint import ProcurementCategoriesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCategoriesIdEndpoint import ProcurementCategoriesIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCategoriesInfoEndpoint import ProcurementCategoriesInfoEndpoint
+
 
 class ProcurementCategoriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "categories", parent_endpoint=parent_endpoint)
+    endpoint_base = "categories"
+    _route = "procurement/categories"
 
-        self.info = self._register_child_endpoint(ProcurementCategoriesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementCategoriesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementCategoriesIdEndpoint:
+    def id(self, id: int) -> "ProcurementCategoriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementCategoriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementCategoriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementCategoriesIdEndpoint: The initialized ProcurementCategoriesIdEndpoint object.
+            ProcurementCategoriesIdEndpoint: The ProcurementCategoriesIdEndpoint view bound to the ID.
         """
-        child = ProcurementCategoriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementCategoriesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Category]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Category]:
         """
         Performs a GET request against the /procurement/categories endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Category]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Category,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Category, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Category]:
         """
@@ -59,7 +55,7 @@ class ProcurementCategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Category]: The parsed response data.
         """
-        return self._parse_many(Category, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Category, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Category:
         """
@@ -71,4 +67,12 @@ class ProcurementCategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             Category: The parsed response data.
         """
-        return self._parse_one(Category, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Category, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementCategoriesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCategoriesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementCategoriesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCategoriesCountEndpoint")
@@ -1,35 +1,44 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesCountEndpoint import \
-    ProcurementCategoriesIdSubcategoriesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesIdEndpoint import \
-    ProcurementCategoriesIdSubcategoriesIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesInfoEndpoint import \
-    ProcurementCategoriesIdSubcategoriesInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesCountEndpoint import \
+        ProcurementCategoriesIdSubcategoriesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesIdEndpoint import \
+        ProcurementCategoriesIdSubcategoriesIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesInfoEndpoint import \
+        ProcurementCategoriesIdSubcategoriesInfoEndpoint
+
 
 class ProcurementCategoriesIdSubcategoriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "subcategories", parent_endpoint=parent_endpoint)
+    endpoint_base = "subcategories"
+    _route = "procurement/categories/{id}/subcategories"
 
-        self.info = self._register_child_endpoint(
-            ProcurementCategoriesIdSubcategoriesInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            ProcurementCategoriesIdSubcategoriesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementCategoriesIdSubcategoriesIdEndpoint:
+    def id(self, id: int) -> "ProcurementCategoriesIdSubcategoriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementCategoriesIdSubcategoriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementCategoriesIdSubcategoriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementCategoriesIdSubcategoriesIdEndpoint: The initialized ProcurementCategoriesIdSubcategoriesIdEndpoint object.
+            ProcurementCategoriesIdSubcategoriesIdEndpoint: The ProcurementCategoriesIdSubcategoriesIdEndpoint view bound to the ID.
         """
-        child = ProcurementCategoriesIdSubcategoriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ProcurementCategoriesIdSubcategoriesInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesInfoEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "ProcurementCategoriesIdSubcategoriesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementCategoriesIdSubcategoriesCountEndpoint"
+        )
@@ -1,79 +1,127 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementAdjustmentsEndpoint import ProcurementAdjustmentsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCatalogEndpoint import ProcurementCatalogEndpoint
-from pyconnectwise.endpoints.manage.ProcurementCategoriesEndpoint import ProcurementCategoriesEndpoint
-from pyconnectwise.endpoints.manage.ProcurementDirectionalsyncsEndpoint import ProcurementDirectionalsyncsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementManufacturersEndpoint import ProcurementManufacturersEndpoint
-from pyconnectwise.endpoints.manage.ProcurementOnhandserialnumbersEndpoint import ProcurementOnhandserialnumbersEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPricingschedulesEndpoint import ProcurementPricingschedulesEndpoint
-from pyconnectwise.endpoints.manage.ProcurementProductsEndpoint import ProcurementProductsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseordersEndpoint import ProcurementPurchaseordersEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesEndpoint import \
-    ProcurementPurchaseorderstatusesEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchasingdemandsEndpoint import ProcurementPurchasingdemandsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmaactionsEndpoint import ProcurementRmaactionsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmadispositionsEndpoint import ProcurementRmadispositionsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesEndpoint import ProcurementRmastatusesEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmatagsEndpoint import ProcurementRmatagsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementSettingsEndpoint import ProcurementSettingsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementShipmentmethodsEndpoint import ProcurementShipmentmethodsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementSubcategoriesEndpoint import ProcurementSubcategoriesEndpoint
-from pyconnectwise.endpoints.manage.ProcurementTypesEndpoint import ProcurementTypesEndpoint
-from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresEndpoint import ProcurementUnitofmeasuresEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousebinsEndpoint import ProcurementWarehousebinsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousesEndpoint import ProcurementWarehousesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementAdjustmentsEndpoint import ProcurementAdjustmentsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCatalogEndpoint import ProcurementCatalogEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementCategoriesEndpoint import ProcurementCategoriesEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementDirectionalsyncsEndpoint import ProcurementDirectionalsyncsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementManufacturersEndpoint import ProcurementManufacturersEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementOnhandserialnumbersEndpoint import \
+        ProcurementOnhandserialnumbersEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPricingschedulesEndpoint import ProcurementPricingschedulesEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementProductsEndpoint import ProcurementProductsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseordersEndpoint import ProcurementPurchaseordersEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesEndpoint import \
+        ProcurementPurchaseorderstatusesEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchasingdemandsEndpoint import ProcurementPurchasingdemandsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmaactionsEndpoint import ProcurementRmaactionsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmadispositionsEndpoint import ProcurementRmadispositionsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesEndpoint import ProcurementRmastatusesEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmatagsEndpoint import ProcurementRmatagsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementSettingsEndpoint import ProcurementSettingsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementShipmentmethodsEndpoint import ProcurementShipmentmethodsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementSubcategoriesEndpoint import ProcurementSubcategoriesEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementTypesEndpoint import ProcurementTypesEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresEndpoint import ProcurementUnitofmeasuresEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementWarehousebinsEndpoint import ProcurementWarehousebinsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementWarehousesEndpoint import ProcurementWarehousesEndpoint
+
 
 class ProcurementEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "procurement"
+    _route = "procurement"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "procurement", parent_endpoint=parent_endpoint)
-
-        self.directional_syncs = self._register_child_endpoint(
-            ProcurementDirectionalsyncsEndpoint(client, parent_endpoint=self)
-        )
-        self.rma_tags = self._register_child_endpoint(ProcurementRmatagsEndpoint(client, parent_endpoint=self))
-        self.warehouses = self._register_child_endpoint(ProcurementWarehousesEndpoint(client, parent_endpoint=self))
-        self.rma_statuses = self._register_child_endpoint(ProcurementRmastatusesEndpoint(client, parent_endpoint=self))
-        self.unit_of_measures = self._register_child_endpoint(
-            ProcurementUnitofmeasuresEndpoint(client, parent_endpoint=self)
-        )
-        self.warehouse_bins = self._register_child_endpoint(
-            ProcurementWarehousebinsEndpoint(client, parent_endpoint=self)
-        )
-        self.types = self._register_child_endpoint(ProcurementTypesEndpoint(client, parent_endpoint=self))
-        self.subcategories = self._register_child_endpoint(
-            ProcurementSubcategoriesEndpoint(client, parent_endpoint=self)
-        )
-        self.adjustments = self._register_child_endpoint(ProcurementAdjustmentsEndpoint(client, parent_endpoint=self))
-        self.r_m_a_dispositions = self._register_child_endpoint(
-            ProcurementRmadispositionsEndpoint(client, parent_endpoint=self)
-        )
-        self.shipmentmethods = self._register_child_endpoint(
-            ProcurementShipmentmethodsEndpoint(client, parent_endpoint=self)
-        )
-        self.purchaseorders = self._register_child_endpoint(
-            ProcurementPurchaseordersEndpoint(client, parent_endpoint=self)
-        )
-        self.purchasing_demands = self._register_child_endpoint(
-            ProcurementPurchasingdemandsEndpoint(client, parent_endpoint=self)
-        )
-        self.settings = self._register_child_endpoint(ProcurementSettingsEndpoint(client, parent_endpoint=self))
-        self.onhandserialnumbers = self._register_child_endpoint(
-            ProcurementOnhandserialnumbersEndpoint(client, parent_endpoint=self)
-        )
-        self.pricingschedules = self._register_child_endpoint(
-            ProcurementPricingschedulesEndpoint(client, parent_endpoint=self)
-        )
-        self.categories = self._register_child_endpoint(ProcurementCategoriesEndpoint(client, parent_endpoint=self))
-        self.products = self._register_child_endpoint(ProcurementProductsEndpoint(client, parent_endpoint=self))
-        self.manufacturers = self._register_child_endpoint(
-            ProcurementManufacturersEndpoint(client, parent_endpoint=self)
-        )
-        self.purchaseorderstatuses = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesEndpoint(client, parent_endpoint=self)
-        )
-        self.catalog = self._register_child_endpoint(ProcurementCatalogEndpoint(client, parent_endpoint=self))
-        self.rma_actions = self._register_child_endpoint(ProcurementRmaactionsEndpoint(client, parent_endpoint=self))
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def directional_syncs(self) -> "ProcurementDirectionalsyncsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementDirectionalsyncsEndpoint")
+
+    @cached_property
+    def rma_tags(self) -> "ProcurementRmatagsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmatagsEndpoint")
+
+    @cached_property
+    def warehouses(self) -> "ProcurementWarehousesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementWarehousesEndpoint")
+
+    @cached_property
+    def rma_statuses(self) -> "ProcurementRmastatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmastatusesEndpoint")
+
+    @cached_property
+    def unit_of_measures(self) -> "ProcurementUnitofmeasuresEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresEndpoint")
+
+    @cached_property
+    def warehouse_bins(self) -> "ProcurementWarehousebinsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementWarehousebinsEndpoint")
+
+    @cached_property
+    def types(self) -> "ProcurementTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementTypesEndpoint")
+
+    @cached_property
+    def subcategories(self) -> "ProcurementSubcategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementSubcategoriesEndpoint")
+
+    @cached_property
+    def adjustments(self) -> "ProcurementAdjustmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementAdjustmentsEndpoint")
+
+    @cached_property
+    def r_m_a_dispositions(self) -> "ProcurementRmadispositionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmadispositionsEndpoint")
+
+    @cached_property
+    def shipmentmethods(self) -> "ProcurementShipmentmethodsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementShipmentmethodsEndpoint")
+
+    @cached_property
+    def purchaseorders(self) -> "ProcurementPurchaseordersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementPurchaseordersEndpoint")
+
+    @cached_property
+    def purchasing_demands(self) -> "ProcurementPurchasingdemandsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementPurchasingdemandsEndpoint")
+
+    @cached_property
+    def settings(self) -> "ProcurementSettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementSettingsEndpoint")
+
+    @cached_property
+    def onhandserialnumbers(self) -> "ProcurementOnhandserialnumbersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementOnhandserialnumbersEndpoint")
+
+    @cached_property
+    def pricingschedules(self) -> "ProcurementPricingschedulesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementPricingschedulesEndpoint")
+
+    @cached_property
+    def categories(self) -> "ProcurementCategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCategoriesEndpoint")
+
+    @cached_property
+    def products(self) -> "ProcurementProductsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementProductsEndpoint")
+
+    @cached_property
+    def manufacturers(self) -> "ProcurementManufacturersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementManufacturersEndpoint")
+
+    @cached_property
+    def purchaseorderstatuses(self) -> "ProcurementPurchaseorderstatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesEndpoint")
+
+    @cached_property
+    def catalog(self) -> "ProcurementCatalogEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementCatalogEndpoint")
+
+    @cached_property
+    def rma_actions(self) -> "ProcurementRmaactionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmaactionsEndpoint")
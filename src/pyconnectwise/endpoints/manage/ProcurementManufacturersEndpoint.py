@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementManufacturersCountEndpoint import ProcurementManufacturersCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementManufacturersIdEndpoint import ProcurementManufacturersIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementManufacturersInfoEndpoint import ProcurementManufacturersInfoEndpoint
 from pyconnectwise.models.manage import Manufacturer
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementManufacturersCountEndpoint import \
+        ProcurementManufacturersCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementManufacturersIdEndpoint import ProcurementManufacturersIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementManufacturersInfoEndpoint import ProcurementManufacturersInfoEndpoint
+
 
 class ProcurementManufacturersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "manufacturers", parent_endpoint=parent_endpoint)
+    endpoint_base = "manufacturers"
+    _route = "procurement/manufacturers"
 
-        self.info = self._register_child_endpoint(ProcurementManufacturersInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementManufacturersCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementManufacturersIdEndpoint:
+    def id(self, id: int) -> "ProcurementManufacturersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementManufacturersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementManufacturersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementManufacturersIdEndpoint: The initialized ProcurementManufacturersIdEndpoint object.
+            ProcurementManufacturersIdEndpoint: The ProcurementManufacturersIdEndpoint view bound to the ID.
         """
-        child = ProcurementManufacturersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementManufacturersIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[Manufacturer]:
         """
         Performs a GET request against the /procurement/manufacturers endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Manufacturer]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Manufacturer,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Manufacturer, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Manufacturer]:
         """
@@ -61,7 +56,7 @@ class ProcurementManufacturersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Manufacturer]: The parsed response data.
         """
-        return self._parse_many(Manufacturer, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Manufacturer, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Manufacturer:
         """
@@ -73,4 +68,12 @@ class ProcurementManufacturersEndpoint(ConnectWiseEndpoint):
         Returns:
             Manufacturer: The parsed response data.
         """
-        return self._parse_one(Manufacturer, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Manufacturer, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementManufacturersInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementManufacturersInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementManufacturersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementManufacturersCountEndpoint")
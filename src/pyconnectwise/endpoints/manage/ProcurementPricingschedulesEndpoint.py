@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPricingschedulesCountEndpoint import \
-    ProcurementPricingschedulesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdEndpoint import ProcurementPricingschedulesIdEndpoint
 from pyconnectwise.models.manage import PricingSchedule
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementPricingschedulesCountEndpoint import \
+        ProcurementPricingschedulesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdEndpoint import \
+        ProcurementPricingschedulesIdEndpoint
+
 
 class ProcurementPricingschedulesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "pricingschedules", parent_endpoint=parent_endpoint)
+    endpoint_base = "pricingschedules"
+    _route = "procurement/pricingschedules"
 
-        self.count = self._register_child_endpoint(
-            ProcurementPricingschedulesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementPricingschedulesIdEndpoint:
+    def id(self, id: int) -> "ProcurementPricingschedulesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementPricingschedulesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementPricingschedulesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementPricingschedulesIdEndpoint: The initialized ProcurementPricingschedulesIdEndpoint object.
+            ProcurementPricingschedulesIdEndpoint: The ProcurementPricingschedulesIdEndpoint view bound to the ID.
         """
-        child = ProcurementPricingschedulesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PricingSchedule]:
         """
         Performs a GET request against the /procurement/pricingschedules endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PricingSchedule]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PricingSchedule,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PricingSchedule, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PricingSchedule]:
         """
@@ -62,7 +56,7 @@ class ProcurementPricingschedulesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PricingSchedule]: The parsed response data.
         """
-        return self._parse_many(PricingSchedule, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PricingSchedule, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PricingSchedule:
         """
@@ -74,4 +68,8 @@ class ProcurementPricingschedulesEndpoint(ConnectWiseEndpoint):
         Returns:
             PricingSchedule: The parsed response data.
         """
-        return self._parse_one(PricingSchedule, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PricingSchedule, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementPricingschedulesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementPricingschedulesCountEndpoint")
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsCountEndpoint import \
-    ProcurementPricingschedulesIdDetailsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdEndpoint import \
-    ProcurementPricingschedulesIdDetailsIdEndpoint
 from pyconnectwise.models.manage import PricingDetail
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsCountEndpoint import \
+        ProcurementPricingschedulesIdDetailsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdEndpoint import \
+        ProcurementPricingschedulesIdDetailsIdEndpoint
+
 
 class ProcurementPricingschedulesIdDetailsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "details", parent_endpoint=parent_endpoint)
+    endpoint_base = "details"
+    _route = "procurement/pricingschedules/{id}/details"
 
-        self.count = self._register_child_endpoint(
-            ProcurementPricingschedulesIdDetailsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementPricingschedulesIdDetailsIdEndpoint:
+    def id(self, id: int) -> "ProcurementPricingschedulesIdDetailsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementPricingschedulesIdDetailsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementPricingschedulesIdDetailsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementPricingschedulesIdDetailsIdEndpoint: The initialized ProcurementPricingschedulesIdDetailsIdEndpoint object.
+            ProcurementPricingschedulesIdDetailsIdEndpoint: The ProcurementPricingschedulesIdDetailsIdEndpoint view bound to the ID.
         """
-        child = ProcurementPricingschedulesIdDetailsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PricingDetail]:
         """
         Performs a GET request against the /procurement/pricingschedules/{id}/details endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PricingDetail]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PricingDetail,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PricingDetail, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PricingDetail]:
         """
@@ -63,7 +56,7 @@ class ProcurementPricingschedulesIdDetailsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PricingDetail]: The parsed response data.
         """
-        return self._parse_many(PricingDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PricingDetail, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PricingDetail:
         """
@@ -75,4 +68,10 @@ class ProcurementPricingschedulesIdDetailsEndpoint(ConnectWiseEndpoint):
         Returns:
             PricingDetail: The parsed response data.
         """
-        return self._parse_one(PricingDetail, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PricingDetail, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementPricingschedulesIdDetailsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsCountEndpoint"
+        )
@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint import \
-    ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint import \
-    ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint
 from pyconnectwise.models.manage import PricingBreak
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint import \
+        ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint import \
+        ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint
+
 
 class ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "breaks", parent_endpoint=parent_endpoint)
+    endpoint_base = "breaks"
+    _route = "procurement/pricingschedules/{id}/details/{id}/breaks"
 
-        self.count = self._register_child_endpoint(
-            ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint:
+    def id(self, id: int) -> "ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint: The initialized ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint object.
+            ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint: The ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint view bound to the ID.
         """
-        child = ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PricingBreak]:
         """
         Performs a GET request against the /procurement/pricingschedules/{id}/details/{id}/breaks endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PricingBreak]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PricingBreak,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PricingBreak, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PricingBreak]:
         """
@@ -63,7 +58,7 @@ class ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PricingBreak]: The parsed response data.
         """
-        return self._parse_many(PricingBreak, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PricingBreak, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PricingBreak:
         """
@@ -75,4 +70,10 @@ class ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(ConnectWiseEndpoint):
         Returns:
             PricingBreak: The parsed response data.
         """
-        return self._parse_one(PricingBreak, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PricingBreak, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint"
+        )
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementProductsCountEndpoint import ProcurementProductsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementProductsIdEndpoint import ProcurementProductsIdEndpoint
 from pyconnectwise.models.manage import ProductItem
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementProductsCountEndpoint import ProcurementProductsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementProductsIdEndpoint import ProcurementProductsIdEndpoint
+
 
 class ProcurementProductsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "products", parent_endpoint=parent_endpoint)
+    endpoint_base = "products"
+    _route = "procurement/products"
 
-        self.count = self._register_child_endpoint(ProcurementProductsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementProductsIdEndpoint:
+    def id(self, id: int) -> "ProcurementProductsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementProductsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementProductsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementProductsIdEndpoint: The initialized ProcurementProductsIdEndpoint object.
+            ProcurementProductsIdEndpoint: The ProcurementProductsIdEndpoint view bound to the ID.
         """
-        child = ProcurementProductsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementProductsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ProductItem]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ProductItem]:
         """
         Performs a GET request against the /procurement/products endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProductItem]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProductItem,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProductItem, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProductItem]:
         """
@@ -57,7 +54,7 @@ class ProcurementProductsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProductItem]: The parsed response data.
         """
-        return self._parse_many(ProductItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProductItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProductItem:
         """
@@ -69,4 +66,8 @@ class ProcurementProductsEndpoint(ConnectWiseEndpoint):
         Returns:
             ProductItem: The parsed response data.
         """
-        return self._parse_one(ProductItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProductItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementProductsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementProductsCountEndpoint")
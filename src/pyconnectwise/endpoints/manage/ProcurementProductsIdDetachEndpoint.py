@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import ProductDetach
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ProcurementProductsIdDetachEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "detach"
+    _route = "procurement/products/{id}/detach"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "detach", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProductDetach:
         """
@@ -19,4 +23,4 @@ class ProcurementProductsIdDetachEndpoint(ConnectWiseEndpoint):
         Returns:
             ProductDetach: The parsed response data.
         """
-        return self._parse_one(ProductDetach, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProductDetach, super()._make_request("POST", data=data, params=params).content)
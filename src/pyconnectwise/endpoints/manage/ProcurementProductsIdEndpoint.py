@@ -1,47 +1,40 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementProductsIdComponentsEndpoint import \
-    ProcurementProductsIdComponentsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementProductsIdDetachEndpoint import ProcurementProductsIdDetachEndpoint
-from pyconnectwise.endpoints.manage.ProcurementProductsIdPickingshippingdetailsEndpoint import \
-    ProcurementProductsIdPickingshippingdetailsEndpoint
 from pyconnectwise.models.manage import ProductItem
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementProductsIdComponentsEndpoint import \
+        ProcurementProductsIdComponentsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementProductsIdDetachEndpoint import ProcurementProductsIdDetachEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementProductsIdPickingshippingdetailsEndpoint import \
+        ProcurementProductsIdPickingshippingdetailsEndpoint
+
 
 class ProcurementProductsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "procurement/products/{id}"
 
-        self.picking_shipping_details = self._register_child_endpoint(
-            ProcurementProductsIdPickingshippingdetailsEndpoint(client, parent_endpoint=self)
-        )
-        self.detach = self._register_child_endpoint(ProcurementProductsIdDetachEndpoint(client, parent_endpoint=self))
-        self.components = self._register_child_endpoint(
-            ProcurementProductsIdComponentsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ProductItem]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ProductItem]:
         """
         Performs a GET request against the /procurement/products/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProductItem]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProductItem,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProductItem, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProductItem:
         """
@@ -53,7 +46,7 @@ class ProcurementProductsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProductItem: The parsed response data.
         """
-        return self._parse_one(ProductItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProductItem, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -75,7 +68,7 @@ class ProcurementProductsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProductItem: The parsed response data.
         """
-        return self._parse_one(ProductItem, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProductItem, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProductItem:
         """
@@ -87,4 +80,18 @@ class ProcurementProductsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProductItem: The parsed response data.
         """
-        return self._parse_one(ProductItem, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProductItem, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def picking_shipping_details(self) -> "ProcurementProductsIdPickingshippingdetailsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementProductsIdPickingshippingdetailsEndpoint"
+        )
+
+    @cached_property
+    def detach(self) -> "ProcurementProductsIdDetachEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementProductsIdDetachEndpoint")
+
+    @cached_property
+    def components(self) -> "ProcurementProductsIdComponentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementProductsIdComponentsEndpoint")
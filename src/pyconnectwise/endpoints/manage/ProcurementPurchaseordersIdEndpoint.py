@@ -1,52 +1,41 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsEndpoint import \
-    ProcurementPurchaseordersIdLineitemsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdRebatchEndpoint import \
-    ProcurementPurchaseordersIdRebatchEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdUnbatchEndpoint import \
-    ProcurementPurchaseordersIdUnbatchEndpoint
 from pyconnectwise.models.manage import PurchaseOrder
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsEndpoint import \
+        ProcurementPurchaseordersIdLineitemsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdRebatchEndpoint import \
+        ProcurementPurchaseordersIdRebatchEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdUnbatchEndpoint import \
+        ProcurementPurchaseordersIdUnbatchEndpoint
+
 
 class ProcurementPurchaseordersIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "procurement/purchaseorders/{id}"
 
-        self.lineitems = self._register_child_endpoint(
-            ProcurementPurchaseordersIdLineitemsEndpoint(client, parent_endpoint=self)
-        )
-        self.unbatch = self._register_child_endpoint(
-            ProcurementPurchaseordersIdUnbatchEndpoint(client, parent_endpoint=self)
-        )
-        self.rebatch = self._register_child_endpoint(
-            ProcurementPurchaseordersIdRebatchEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PurchaseOrder]:
         """
         Performs a GET request against the /procurement/purchaseorders/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PurchaseOrder]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PurchaseOrder,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PurchaseOrder, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrder:
         """
@@ -58,7 +47,7 @@ class ProcurementPurchaseordersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PurchaseOrder: The parsed response data.
         """
-        return self._parse_one(PurchaseOrder, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PurchaseOrder, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -80,7 +69,7 @@ class ProcurementPurchaseordersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PurchaseOrder: The parsed response data.
         """
-        return self._parse_one(PurchaseOrder, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(PurchaseOrder, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrder:
         """
@@ -92,4 +81,18 @@ class ProcurementPurchaseordersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PurchaseOrder: The parsed response data.
         """
-        return self._parse_one(PurchaseOrder, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(PurchaseOrder, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def lineitems(self) -> "ProcurementPurchaseordersIdLineitemsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsEndpoint"
+        )
+
+    @cached_property
+    def unbatch(self) -> "ProcurementPurchaseordersIdUnbatchEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdUnbatchEndpoint")
+
+    @cached_property
+    def rebatch(self) -> "ProcurementPurchaseordersIdRebatchEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdRebatchEndpoint")
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import BulkResult
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ProcurementPurchaseordersIdLineitemsBulkEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "bulk"
+    _route = "procurement/purchaseorders/{id}/lineitems/bulk"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "bulk", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BulkResult:
         """
@@ -19,7 +23,7 @@ class ProcurementPurchaseordersIdLineitemsBulkEndpoint(ConnectWiseEndpoint):
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("POST", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BulkResult:
         """
@@ -31,7 +35,7 @@ class ProcurementPurchaseordersIdLineitemsBulkEndpoint(ConnectWiseEndpoint):
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("DELETE", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("DELETE", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BulkResult:
         """
@@ -43,4 +47,4 @@ class ProcurementPurchaseordersIdLineitemsBulkEndpoint(ConnectWiseEndpoint):
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("PUT", data=data, params=params).content)
@@ -1,62 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsBulkEndpoint import \
-    ProcurementPurchaseordersIdLineitemsBulkEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsCountEndpoint import \
-    ProcurementPurchaseordersIdLineitemsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsIdEndpoint import \
-    ProcurementPurchaseordersIdLineitemsIdEndpoint
 from pyconnectwise.models.manage import PurchaseOrderLineItem
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsBulkEndpoint import \
+        ProcurementPurchaseordersIdLineitemsBulkEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsCountEndpoint import \
+        ProcurementPurchaseordersIdLineitemsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsIdEndpoint import \
+        ProcurementPurchaseordersIdLineitemsIdEndpoint
+
 
 class ProcurementPurchaseordersIdLineitemsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "lineitems", parent_endpoint=parent_endpoint)
+    endpoint_base = "lineitems"
+    _route = "procurement/purchaseorders/{id}/lineitems"
 
-        self.bulk = self._register_child_endpoint(
-            ProcurementPurchaseordersIdLineitemsBulkEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            ProcurementPurchaseordersIdLineitemsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementPurchaseordersIdLineitemsIdEndpoint:
+    def id(self, id: int) -> "ProcurementPurchaseordersIdLineitemsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementPurchaseordersIdLineitemsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementPurchaseordersIdLineitemsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementPurchaseordersIdLineitemsIdEndpoint: The initialized ProcurementPurchaseordersIdLineitemsIdEndpoint object.
+            ProcurementPurchaseordersIdLineitemsIdEndpoint: The ProcurementPurchaseordersIdLineitemsIdEndpoint view bound to the ID.
         """
-        child = ProcurementPurchaseordersIdLineitemsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PurchaseOrderLineItem]:
         """
         Performs a GET request against the /procurement/purchaseorders/{id}/lineitems endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PurchaseOrderLineItem]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PurchaseOrderLineItem,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PurchaseOrderLineItem, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PurchaseOrderLineItem]:
         """
@@ -68,7 +58,7 @@ class ProcurementPurchaseordersIdLineitemsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PurchaseOrderLineItem]: The parsed response data.
         """
-        return self._parse_many(PurchaseOrderLineItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PurchaseOrderLineItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrderLineItem:
         """
@@ -80,7 +70,7 @@ class ProcurementPurchaseordersIdLineitemsEndpoint(ConnectWiseEndpoint):
         Returns:
             PurchaseOrderLineItem: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderLineItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderLineItem, super()._make_request("POST", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -91,3 +81,15 @@ class ProcurementPurchaseordersIdLineitemsEndpoint(ConnectWiseEndpoint):
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def bulk(self) -> "ProcurementPurchaseordersIdLineitemsBulkEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsBulkEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "ProcurementPurchaseordersIdLineitemsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseordersIdLineitemsCountEndpoint"
+        )
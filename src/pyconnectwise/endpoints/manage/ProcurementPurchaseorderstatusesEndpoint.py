@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesCountEndpoint import \
-    ProcurementPurchaseorderstatusesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEndpoint import \
-    ProcurementPurchaseorderstatusesIdEndpoint
 from pyconnectwise.models.manage import PurchaseOrderStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesCountEndpoint import \
+        ProcurementPurchaseorderstatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEndpoint import \
+        ProcurementPurchaseorderstatusesIdEndpoint
+
 
 class ProcurementPurchaseorderstatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "purchaseorderstatuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "purchaseorderstatuses"
+    _route = "procurement/purchaseorderstatuses"
 
-        self.count = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementPurchaseorderstatusesIdEndpoint:
+    def id(self, id: int) -> "ProcurementPurchaseorderstatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementPurchaseorderstatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementPurchaseorderstatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementPurchaseorderstatusesIdEndpoint: The initialized ProcurementPurchaseorderstatusesIdEndpoint object.
+            ProcurementPurchaseorderstatusesIdEndpoint: The ProcurementPurchaseorderstatusesIdEndpoint view bound to the ID.
         """
-        child = ProcurementPurchaseorderstatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PurchaseOrderStatus]:
         """
         Performs a GET request against the /procurement/purchaseorderstatuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PurchaseOrderStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PurchaseOrderStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PurchaseOrderStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PurchaseOrderStatus]:
         """
@@ -63,7 +56,7 @@ class ProcurementPurchaseorderstatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PurchaseOrderStatus]: The parsed response data.
         """
-        return self._parse_many(PurchaseOrderStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PurchaseOrderStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrderStatus:
         """
@@ -75,4 +68,10 @@ class ProcurementPurchaseorderstatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             PurchaseOrderStatus: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementPurchaseorderstatusesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesCountEndpoint"
+        )
@@ -1,30 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint import \
-    ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint import \
-    ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint import \
+        ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint import \
+        ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint
+
 
 class ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "emailtemplates", parent_endpoint=parent_endpoint)
+    endpoint_base = "emailtemplates"
+    _route = "procurement/purchaseorderstatuses/{id}/emailtemplates"
 
-        self.count = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint:
+    def id(self, id: int) -> "ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint: The initialized ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint object.
+            ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint: The ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint view bound to the ID.
         """
-        child = ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint", id
+        )
+
+    @cached_property
+    def count(self) -> "ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint"
+        )
@@ -1,52 +1,41 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint import \
-    ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdNotificationsEndpoint import \
-    ProcurementPurchaseorderstatusesIdNotificationsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdUsagesEndpoint import \
-    ProcurementPurchaseorderstatusesIdUsagesEndpoint
 from pyconnectwise.models.manage import PurchaseOrderStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint import \
+        ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdNotificationsEndpoint import \
+        ProcurementPurchaseorderstatusesIdNotificationsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdUsagesEndpoint import \
+        ProcurementPurchaseorderstatusesIdUsagesEndpoint
+
 
 class ProcurementPurchaseorderstatusesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "procurement/purchaseorderstatuses/{id}"
 
-        self.usages = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-        self.emailtemplates = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.notifications = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PurchaseOrderStatus]:
         """
         Performs a GET request against the /procurement/purchaseorderstatuses/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PurchaseOrderStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PurchaseOrderStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PurchaseOrderStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrderStatus:
         """
@@ -58,7 +47,7 @@ class ProcurementPurchaseorderstatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PurchaseOrderStatus: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderStatus, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -80,7 +69,7 @@ class ProcurementPurchaseorderstatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PurchaseOrderStatus: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> PurchaseOrderStatus:
         """
@@ -92,4 +81,22 @@ class ProcurementPurchaseorderstatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             PurchaseOrderStatus: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "ProcurementPurchaseorderstatusesIdUsagesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdUsagesEndpoint"
+        )
+
+    @cached_property
+    def emailtemplates(self) -> "ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint"
+        )
+
+    @cached_property
+    def notifications(self) -> "ProcurementPurchaseorderstatusesIdNotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementPurchaseorderstatusesIdNotificationsEndpoint"
+        )
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmaactionsCountEndpoint import ProcurementRmaactionsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmaactionsIdEndpoint import ProcurementRmaactionsIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmaactionsInfoEndpoint import ProcurementRmaactionsInfoEndpoint
 from pyconnectwise.models.manage import RmaAction
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementRmaactionsCountEndpoint import ProcurementRmaactionsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmaactionsIdEndpoint import ProcurementRmaactionsIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmaactionsInfoEndpoint import ProcurementRmaactionsInfoEndpoint
+
 
 class ProcurementRmaactionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "rmaActions", parent_endpoint=parent_endpoint)
+    endpoint_base = "rmaActions"
+    _route = "procurement/rmaActions"
 
-        self.info = self._register_child_endpoint(ProcurementRmaactionsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementRmaactionsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementRmaactionsIdEndpoint:
+    def id(self, id: int) -> "ProcurementRmaactionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementRmaactionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementRmaactionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementRmaactionsIdEndpoint: The initialized ProcurementRmaactionsIdEndpoint object.
+            ProcurementRmaactionsIdEndpoint: The ProcurementRmaactionsIdEndpoint view bound to the ID.
         """
-        child = ProcurementRmaactionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementRmaactionsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[RmaAction]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[RmaAction]:
         """
         Performs a GET request against the /procurement/rmaActions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[RmaAction]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            RmaAction,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(RmaAction, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[RmaAction]:
         """
@@ -59,7 +55,7 @@ class ProcurementRmaactionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[RmaAction]: The parsed response data.
         """
-        return self._parse_many(RmaAction, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaAction, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> RmaAction:
         """
@@ -71,4 +67,12 @@ class ProcurementRmaactionsEndpoint(ConnectWiseEndpoint):
         Returns:
             RmaAction: The parsed response data.
         """
-        return self._parse_one(RmaAction, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaAction, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementRmaactionsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmaactionsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementRmaactionsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmaactionsCountEndpoint")
@@ -1,58 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmadispositionsCountEndpoint import \
-    ProcurementRmadispositionsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmadispositionsIdEndpoint import ProcurementRmadispositionsIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmadispositionsInfoEndpoint import ProcurementRmadispositionsInfoEndpoint
 from pyconnectwise.models.manage import RmaDisposition
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementRmadispositionsCountEndpoint import \
+        ProcurementRmadispositionsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmadispositionsIdEndpoint import ProcurementRmadispositionsIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmadispositionsInfoEndpoint import \
+        ProcurementRmadispositionsInfoEndpoint
+
 
 class ProcurementRmadispositionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "RMADispositions", parent_endpoint=parent_endpoint)
+    endpoint_base = "RMADispositions"
+    _route = "procurement/RMADispositions"
 
-        self.info = self._register_child_endpoint(ProcurementRmadispositionsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(
-            ProcurementRmadispositionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementRmadispositionsIdEndpoint:
+    def id(self, id: int) -> "ProcurementRmadispositionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementRmadispositionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementRmadispositionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementRmadispositionsIdEndpoint: The initialized ProcurementRmadispositionsIdEndpoint object.
+            ProcurementRmadispositionsIdEndpoint: The ProcurementRmadispositionsIdEndpoint view bound to the ID.
         """
-        child = ProcurementRmadispositionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementRmadispositionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[RmaDisposition]:
         """
         Performs a GET request against the /procurement/RMADispositions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[RmaDisposition]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            RmaDisposition,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(RmaDisposition, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[RmaDisposition]:
         """
@@ -64,7 +57,7 @@ class ProcurementRmadispositionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[RmaDisposition]: The parsed response data.
         """
-        return self._parse_many(RmaDisposition, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaDisposition, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> RmaDisposition:
         """
@@ -76,4 +69,12 @@ class ProcurementRmadispositionsEndpoint(ConnectWiseEndpoint):
         Returns:
             RmaDisposition: The parsed response data.
         """
-        return self._parse_one(RmaDisposition, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaDisposition, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementRmadispositionsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmadispositionsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementRmadispositionsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmadispositionsCountEndpoint")
@@ -1,42 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmadispositionsInfoCountEndpoint import \
-    ProcurementRmadispositionsInfoCountEndpoint
 from pyconnectwise.models.manage import RmaDispositionInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementRmadispositionsInfoCountEndpoint import \
+        ProcurementRmadispositionsInfoCountEndpoint
+
 
 class ProcurementRmadispositionsInfoEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
+    endpoint_base = "info"
+    _route = "procurement/RMADispositions/info"
 
-        self.count = self._register_child_endpoint(
-            ProcurementRmadispositionsInfoCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[RmaDispositionInfo]:
         """
         Performs a GET request against the /procurement/RMADispositions/info endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[RmaDispositionInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            RmaDispositionInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(RmaDispositionInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[RmaDispositionInfo]:
         """
@@ -48,4 +43,8 @@ class ProcurementRmadispositionsInfoEndpoint(ConnectWiseEndpoint):
         Returns:
             list[RmaDispositionInfo]: The parsed response data.
         """
-        return self._parse_many(RmaDispositionInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaDispositionInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementRmadispositionsInfoCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmadispositionsInfoCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesCountEndpoint import ProcurementRmastatusesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdEndpoint import ProcurementRmastatusesIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesInfoEndpoint import ProcurementRmastatusesInfoEndpoint
 from pyconnectwise.models.manage import RmaStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesCountEndpoint import ProcurementRmastatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdEndpoint import ProcurementRmastatusesIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesInfoEndpoint import ProcurementRmastatusesInfoEndpoint
+
 
 class ProcurementRmastatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "rmaStatuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "rmaStatuses"
+    _route = "procurement/rmaStatuses"
 
-        self.info = self._register_child_endpoint(ProcurementRmastatusesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementRmastatusesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementRmastatusesIdEndpoint:
+    def id(self, id: int) -> "ProcurementRmastatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementRmastatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementRmastatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementRmastatusesIdEndpoint: The initialized ProcurementRmastatusesIdEndpoint object.
+            ProcurementRmastatusesIdEndpoint: The ProcurementRmastatusesIdEndpoint view bound to the ID.
         """
-        child = ProcurementRmastatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementRmastatusesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[RmaStatus]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[RmaStatus]:
         """
         Performs a GET request against the /procurement/rmaStatuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[RmaStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            RmaStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(RmaStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[RmaStatus]:
         """
@@ -59,7 +55,7 @@ class ProcurementRmastatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[RmaStatus]: The parsed response data.
         """
-        return self._parse_many(RmaStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> RmaStatus:
         """
@@ -71,4 +67,12 @@ class ProcurementRmastatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             RmaStatus: The parsed response data.
         """
-        return self._parse_one(RmaStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementRmastatusesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmastatusesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementRmastatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmastatusesCountEndpoint")
@@ -1,54 +1,42 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdEmailtemplatesEndpoint import \
-    ProcurementRmastatusesIdEmailtemplatesEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdInfoEndpoint import ProcurementRmastatusesIdInfoEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsEndpoint import \
-    ProcurementRmastatusesIdNotificationsEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdUsagesEndpoint import ProcurementRmastatusesIdUsagesEndpoint
 from pyconnectwise.models.manage import RmaStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdEmailtemplatesEndpoint import \
+        ProcurementRmastatusesIdEmailtemplatesEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdInfoEndpoint import ProcurementRmastatusesIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsEndpoint import \
+        ProcurementRmastatusesIdNotificationsEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdUsagesEndpoint import \
+        ProcurementRmastatusesIdUsagesEndpoint
+
 
 class ProcurementRmastatusesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "procurement/rmaStatuses/{id}"
 
-        self.emailtemplates = self._register_child_endpoint(
-            ProcurementRmastatusesIdEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ProcurementRmastatusesIdInfoEndpoint(client, parent_endpoint=self))
-        self.email_templates = self._register_child_endpoint(
-            ProcurementRmastatusesIdEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.notifications = self._register_child_endpoint(
-            ProcurementRmastatusesIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            ProcurementRmastatusesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[RmaStatus]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[RmaStatus]:
         """
         Performs a GET request against the /procurement/rmaStatuses/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[RmaStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            RmaStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(RmaStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> RmaStatus:
         """
@@ -60,7 +48,7 @@ class ProcurementRmastatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             RmaStatus: The parsed response data.
         """
-        return self._parse_one(RmaStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(RmaStatus, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -82,7 +70,7 @@ class ProcurementRmastatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             RmaStatus: The parsed response data.
         """
-        return self._parse_one(RmaStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(RmaStatus, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> RmaStatus:
         """
@@ -94,4 +82,30 @@ class ProcurementRmastatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             RmaStatus: The parsed response data.
         """
-        return self._parse_one(RmaStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(RmaStatus, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def emailtemplates(self) -> "ProcurementRmastatusesIdEmailtemplatesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementRmastatusesIdEmailtemplatesEndpoint"
+        )
+
+    @cached_property
+    def info(self) -> "ProcurementRmastatusesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmastatusesIdInfoEndpoint")
+
+    @cached_property
+    def email_templates(self) -> "ProcurementRmastatusesIdEmailtemplatesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementRmastatusesIdEmailtemplatesEndpoint"
+        )
+
+    @cached_property
+    def notifications(self) -> "ProcurementRmastatusesIdNotificationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsEndpoint"
+        )
+
+    @cached_property
+    def usages(self) -> "ProcurementRmastatusesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmastatusesIdUsagesEndpoint")
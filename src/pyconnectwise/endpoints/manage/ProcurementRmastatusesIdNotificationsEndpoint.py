@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsCountEndpoint import \
-    ProcurementRmastatusesIdNotificationsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsIdEndpoint import \
-    ProcurementRmastatusesIdNotificationsIdEndpoint
 from pyconnectwise.models.manage import RmaStatusNotification
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsCountEndpoint import \
+        ProcurementRmastatusesIdNotificationsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsIdEndpoint import \
+        ProcurementRmastatusesIdNotificationsIdEndpoint
+
 
 class ProcurementRmastatusesIdNotificationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "notifications", parent_endpoint=parent_endpoint)
+    endpoint_base = "notifications"
+    _route = "procurement/rmaStatuses/{id}/notifications"
 
-        self.count = self._register_child_endpoint(
-            ProcurementRmastatusesIdNotificationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementRmastatusesIdNotificationsIdEndpoint:
+    def id(self, id: int) -> "ProcurementRmastatusesIdNotificationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementRmastatusesIdNotificationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementRmastatusesIdNotificationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementRmastatusesIdNotificationsIdEndpoint: The initialized ProcurementRmastatusesIdNotificationsIdEndpoint object.
+            ProcurementRmastatusesIdNotificationsIdEndpoint: The ProcurementRmastatusesIdNotificationsIdEndpoint view bound to the ID.
         """
-        child = ProcurementRmastatusesIdNotificationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[RmaStatusNotification]:
         """
         Performs a GET request against the /procurement/rmaStatuses/{id}/notifications endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[RmaStatusNotification]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            RmaStatusNotification,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(RmaStatusNotification, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[RmaStatusNotification]:
         """
@@ -63,7 +56,7 @@ class ProcurementRmastatusesIdNotificationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[RmaStatusNotification]: The parsed response data.
         """
-        return self._parse_many(RmaStatusNotification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaStatusNotification, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> RmaStatusNotification:
         """
@@ -75,4 +68,10 @@ class ProcurementRmastatusesIdNotificationsEndpoint(ConnectWiseEndpoint):
         Returns:
             RmaStatusNotification: The parsed response data.
         """
-        return self._parse_one(RmaStatusNotification, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaStatusNotification, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementRmastatusesIdNotificationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementRmastatusesIdNotificationsCountEndpoint"
+        )
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmatagsCountEndpoint import ProcurementRmatagsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmatagsDefaultEndpoint import ProcurementRmatagsDefaultEndpoint
-from pyconnectwise.endpoints.manage.ProcurementRmatagsIdEndpoint import ProcurementRmatagsIdEndpoint
 from pyconnectwise.models.manage import RmaTag
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementRmatagsCountEndpoint import ProcurementRmatagsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmatagsDefaultEndpoint import ProcurementRmatagsDefaultEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementRmatagsIdEndpoint import ProcurementRmatagsIdEndpoint
+
 
 class ProcurementRmatagsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "rmaTags", parent_endpoint=parent_endpoint)
+    endpoint_base = "rmaTags"
+    _route = "procurement/rmaTags"
 
-        self.default = self._register_child_endpoint(ProcurementRmatagsDefaultEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementRmatagsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementRmatagsIdEndpoint:
+    def id(self, id: int) -> "ProcurementRmatagsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementRmatagsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementRmatagsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementRmatagsIdEndpoint: The initialized ProcurementRmatagsIdEndpoint object.
+            ProcurementRmatagsIdEndpoint: The ProcurementRmatagsIdEndpoint view bound to the ID.
         """
-        child = ProcurementRmatagsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementRmatagsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[RmaTag]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[RmaTag]:
         """
         Performs a GET request against the /procurement/rmaTags endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[RmaTag]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            RmaTag,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(RmaTag, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[RmaTag]:
         """
@@ -59,7 +55,7 @@ class ProcurementRmatagsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[RmaTag]: The parsed response data.
         """
-        return self._parse_many(RmaTag, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaTag, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> RmaTag:
         """
@@ -71,4 +67,12 @@ class ProcurementRmatagsEndpoint(ConnectWiseEndpoint):
         Returns:
             RmaTag: The parsed response data.
         """
-        return self._parse_one(RmaTag, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaTag, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def default(self) -> "ProcurementRmatagsDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmatagsDefaultEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementRmatagsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementRmatagsCountEndpoint")
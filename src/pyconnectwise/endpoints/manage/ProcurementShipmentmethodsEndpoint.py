@@ -1,58 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementShipmentmethodsCountEndpoint import \
-    ProcurementShipmentmethodsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementShipmentmethodsIdEndpoint import ProcurementShipmentmethodsIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementShipmentmethodsInfoEndpoint import ProcurementShipmentmethodsInfoEndpoint
 from pyconnectwise.models.manage import ShipmentMethod
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementShipmentmethodsCountEndpoint import \
+        ProcurementShipmentmethodsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementShipmentmethodsIdEndpoint import ProcurementShipmentmethodsIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementShipmentmethodsInfoEndpoint import \
+        ProcurementShipmentmethodsInfoEndpoint
+
 
 class ProcurementShipmentmethodsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "shipmentmethods", parent_endpoint=parent_endpoint)
+    endpoint_base = "shipmentmethods"
+    _route = "procurement/shipmentmethods"
 
-        self.info = self._register_child_endpoint(ProcurementShipmentmethodsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(
-            ProcurementShipmentmethodsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementShipmentmethodsIdEndpoint:
+    def id(self, id: int) -> "ProcurementShipmentmethodsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementShipmentmethodsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementShipmentmethodsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementShipmentmethodsIdEndpoint: The initialized ProcurementShipmentmethodsIdEndpoint object.
+            ProcurementShipmentmethodsIdEndpoint: The ProcurementShipmentmethodsIdEndpoint view bound to the ID.
         """
-        child = ProcurementShipmentmethodsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementShipmentmethodsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ShipmentMethod]:
         """
         Performs a GET request against the /procurement/shipmentmethods endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ShipmentMethod]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ShipmentMethod,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ShipmentMethod, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ShipmentMethod]:
         """
@@ -64,7 +57,7 @@ class ProcurementShipmentmethodsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ShipmentMethod]: The parsed response data.
         """
-        return self._parse_many(ShipmentMethod, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ShipmentMethod, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ShipmentMethod:
         """
@@ -76,4 +69,12 @@ class ProcurementShipmentmethodsEndpoint(ConnectWiseEndpoint):
         Returns:
             ShipmentMethod: The parsed response data.
         """
-        return self._parse_one(ShipmentMethod, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ShipmentMethod, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementShipmentmethodsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementShipmentmethodsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementShipmentmethodsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementShipmentmethodsCountEndpoint")
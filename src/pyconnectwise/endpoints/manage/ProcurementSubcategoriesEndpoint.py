@@ -1,28 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementSubcategoriesCountEndpoint import ProcurementSubcategoriesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementSubcategoriesIdEndpoint import ProcurementSubcategoriesIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementSubcategoriesInfoEndpoint import ProcurementSubcategoriesInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementSubcategoriesCountEndpoint import \
+        ProcurementSubcategoriesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementSubcategoriesIdEndpoint import ProcurementSubcategoriesIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementSubcategoriesInfoEndpoint import ProcurementSubcategoriesInfoEndpoint
+
 
 class ProcurementSubcategoriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "subcategories", parent_endpoint=parent_endpoint)
+    endpoint_base = "subcategories"
+    _route = "procurement/subcategories"
 
-        self.info = self._register_child_endpoint(ProcurementSubcategoriesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementSubcategoriesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementSubcategoriesIdEndpoint:
+    def id(self, id: int) -> "ProcurementSubcategoriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementSubcategoriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementSubcategoriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementSubcategoriesIdEndpoint: The initialized ProcurementSubcategoriesIdEndpoint object.
+            ProcurementSubcategoriesIdEndpoint: The ProcurementSubcategoriesIdEndpoint view bound to the ID.
         """
-        child = ProcurementSubcategoriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementSubcategoriesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ProcurementSubcategoriesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementSubcategoriesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementSubcategoriesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementSubcategoriesCountEndpoint")
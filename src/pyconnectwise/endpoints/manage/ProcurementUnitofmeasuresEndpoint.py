@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresCountEndpoint import ProcurementUnitofmeasuresCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdEndpoint import ProcurementUnitofmeasuresIdEndpoint
 from pyconnectwise.models.manage import UnitOfMeasure
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresCountEndpoint import \
+        ProcurementUnitofmeasuresCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdEndpoint import ProcurementUnitofmeasuresIdEndpoint
+
 
 class ProcurementUnitofmeasuresEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "unitOfMeasures", parent_endpoint=parent_endpoint)
+    endpoint_base = "unitOfMeasures"
+    _route = "procurement/unitOfMeasures"
 
-        self.count = self._register_child_endpoint(ProcurementUnitofmeasuresCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementUnitofmeasuresIdEndpoint:
+    def id(self, id: int) -> "ProcurementUnitofmeasuresIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementUnitofmeasuresIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementUnitofmeasuresIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementUnitofmeasuresIdEndpoint: The initialized ProcurementUnitofmeasuresIdEndpoint object.
+            ProcurementUnitofmeasuresIdEndpoint: The ProcurementUnitofmeasuresIdEndpoint view bound to the ID.
         """
-        child = ProcurementUnitofmeasuresIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[UnitOfMeasure]:
         """
         Performs a GET request against the /procurement/unitOfMeasures endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[UnitOfMeasure]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            UnitOfMeasure,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(UnitOfMeasure, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[UnitOfMeasure]:
         """
@@ -59,7 +55,7 @@ class ProcurementUnitofmeasuresEndpoint(ConnectWiseEndpoint):
         Returns:
             list[UnitOfMeasure]: The parsed response data.
         """
-        return self._parse_many(UnitOfMeasure, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(UnitOfMeasure, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> UnitOfMeasure:
         """
@@ -71,4 +67,8 @@ class ProcurementUnitofmeasuresEndpoint(ConnectWiseEndpoint):
         Returns:
             UnitOfMeasure: The parsed response data.
         """
-        return self._parse_one(UnitOfMeasure, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(UnitOfMeasure, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementUnitofmeasuresCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresCountEndpoint")
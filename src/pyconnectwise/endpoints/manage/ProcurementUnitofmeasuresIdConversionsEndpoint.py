@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdConversionsCountEndpoint import \
-    ProcurementUnitofmeasuresIdConversionsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdConversionsIdEndpoint import \
-    ProcurementUnitofmeasuresIdConversionsIdEndpoint
 from pyconnectwise.models.manage import Conversion
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdConversionsCountEndpoint import \
+        ProcurementUnitofmeasuresIdConversionsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdConversionsIdEndpoint import \
+        ProcurementUnitofmeasuresIdConversionsIdEndpoint
+
 
 class ProcurementUnitofmeasuresIdConversionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "conversions", parent_endpoint=parent_endpoint)
+    endpoint_base = "conversions"
+    _route = "procurement/unitOfMeasures/{id}/conversions"
 
-        self.count = self._register_child_endpoint(
-            ProcurementUnitofmeasuresIdConversionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementUnitofmeasuresIdConversionsIdEndpoint:
+    def id(self, id: int) -> "ProcurementUnitofmeasuresIdConversionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementUnitofmeasuresIdConversionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementUnitofmeasuresIdConversionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementUnitofmeasuresIdConversionsIdEndpoint: The initialized ProcurementUnitofmeasuresIdConversionsIdEndpoint object.
+            ProcurementUnitofmeasuresIdConversionsIdEndpoint: The ProcurementUnitofmeasuresIdConversionsIdEndpoint view bound to the ID.
         """
-        child = ProcurementUnitofmeasuresIdConversionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdConversionsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Conversion]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Conversion]:
         """
         Performs a GET request against the /procurement/unitOfMeasures/{id}/conversions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Conversion]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Conversion,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Conversion, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Conversion]:
         """
@@ -61,7 +56,7 @@ class ProcurementUnitofmeasuresIdConversionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Conversion]: The parsed response data.
         """
-        return self._parse_many(Conversion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Conversion, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Conversion:
         """
@@ -73,4 +68,10 @@ class ProcurementUnitofmeasuresIdConversionsEndpoint(ConnectWiseEndpoint):
         Returns:
             Conversion: The parsed response data.
         """
-        return self._parse_one(Conversion, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Conversion, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementUnitofmeasuresIdConversionsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementUnitofmeasuresIdConversionsCountEndpoint"
+        )
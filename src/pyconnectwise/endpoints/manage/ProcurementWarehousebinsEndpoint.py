@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousebinsCountEndpoint import ProcurementWarehousebinsCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdEndpoint import ProcurementWarehousebinsIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousebinsInfoEndpoint import ProcurementWarehousebinsInfoEndpoint
 from pyconnectwise.models.manage import WarehouseBin
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementWarehousebinsCountEndpoint import \
+        ProcurementWarehousebinsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdEndpoint import ProcurementWarehousebinsIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementWarehousebinsInfoEndpoint import ProcurementWarehousebinsInfoEndpoint
+
 
 class ProcurementWarehousebinsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "warehouseBins", parent_endpoint=parent_endpoint)
+    endpoint_base = "warehouseBins"
+    _route = "procurement/warehouseBins"
 
-        self.info = self._register_child_endpoint(ProcurementWarehousebinsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementWarehousebinsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementWarehousebinsIdEndpoint:
+    def id(self, id: int) -> "ProcurementWarehousebinsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementWarehousebinsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementWarehousebinsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementWarehousebinsIdEndpoint: The initialized ProcurementWarehousebinsIdEndpoint object.
+            ProcurementWarehousebinsIdEndpoint: The ProcurementWarehousebinsIdEndpoint view bound to the ID.
         """
-        child = ProcurementWarehousebinsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[WarehouseBin]:
         """
         Performs a GET request against the /procurement/warehouseBins endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WarehouseBin]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WarehouseBin,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WarehouseBin, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[WarehouseBin]:
         """
@@ -61,7 +56,7 @@ class ProcurementWarehousebinsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[WarehouseBin]: The parsed response data.
         """
-        return self._parse_many(WarehouseBin, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WarehouseBin, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WarehouseBin:
         """
@@ -73,4 +68,12 @@ class ProcurementWarehousebinsEndpoint(ConnectWiseEndpoint):
         Returns:
             WarehouseBin: The parsed response data.
         """
-        return self._parse_one(WarehouseBin, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WarehouseBin, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementWarehousebinsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementWarehousebinsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementWarehousebinsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementWarehousebinsCountEndpoint")
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdInventoryonhandCountEndpoint import \
-    ProcurementWarehousebinsIdInventoryonhandCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdInventoryonhandIdEndpoint import \
-    ProcurementWarehousebinsIdInventoryonhandIdEndpoint
 from pyconnectwise.models.manage import InventoryOnHand
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdInventoryonhandCountEndpoint import \
+        ProcurementWarehousebinsIdInventoryonhandCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdInventoryonhandIdEndpoint import \
+        ProcurementWarehousebinsIdInventoryonhandIdEndpoint
+
 
 class ProcurementWarehousebinsIdInventoryonhandEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "inventoryOnHand", parent_endpoint=parent_endpoint)
+    endpoint_base = "inventoryOnHand"
+    _route = "procurement/warehouseBins/{id}/inventoryOnHand"
 
-        self.count = self._register_child_endpoint(
-            ProcurementWarehousebinsIdInventoryonhandCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementWarehousebinsIdInventoryonhandIdEndpoint:
+    def id(self, id: int) -> "ProcurementWarehousebinsIdInventoryonhandIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementWarehousebinsIdInventoryonhandIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementWarehousebinsIdInventoryonhandIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementWarehousebinsIdInventoryonhandIdEndpoint: The initialized ProcurementWarehousebinsIdInventoryonhandIdEndpoint object.
+            ProcurementWarehousebinsIdInventoryonhandIdEndpoint: The ProcurementWarehousebinsIdInventoryonhandIdEndpoint view bound to the ID.
         """
-        child = ProcurementWarehousebinsIdInventoryonhandIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdInventoryonhandIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[InventoryOnHand]:
         """
         Performs a GET request against the /procurement/warehouseBins/{id}/inventoryOnHand endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[InventoryOnHand]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            InventoryOnHand,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(InventoryOnHand, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[InventoryOnHand]:
         """
@@ -63,4 +56,10 @@ class ProcurementWarehousebinsIdInventoryonhandEndpoint(ConnectWiseEndpoint):
         Returns:
             list[InventoryOnHand]: The parsed response data.
         """
-        return self._parse_many(InventoryOnHand, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InventoryOnHand, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProcurementWarehousebinsIdInventoryonhandCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProcurementWarehousebinsIdInventoryonhandCountEndpoint"
+        )
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousesCountEndpoint import ProcurementWarehousesCountEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousesIdEndpoint import ProcurementWarehousesIdEndpoint
-from pyconnectwise.endpoints.manage.ProcurementWarehousesInfoEndpoint import ProcurementWarehousesInfoEndpoint
 from pyconnectwise.models.manage import Warehouse
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProcurementWarehousesCountEndpoint import ProcurementWarehousesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementWarehousesIdEndpoint import ProcurementWarehousesIdEndpoint
+    from pyconnectwise.endpoints.manage.ProcurementWarehousesInfoEndpoint import ProcurementWarehousesInfoEndpoint
+
 
 class ProcurementWarehousesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "warehouses", parent_endpoint=parent_endpoint)
+    endpoint_base = "warehouses"
+    _route = "procurement/warehouses"
 
-        self.info = self._register_child_endpoint(ProcurementWarehousesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProcurementWarehousesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProcurementWarehousesIdEndpoint:
+    def id(self, id: int) -> "ProcurementWarehousesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProcurementWarehousesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProcurementWarehousesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProcurementWarehousesIdEndpoint: The initialized ProcurementWarehousesIdEndpoint object.
+            ProcurementWarehousesIdEndpoint: The ProcurementWarehousesIdEndpoint view bound to the ID.
         """
-        child = ProcurementWarehousesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProcurementWarehousesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Warehouse]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Warehouse]:
         """
         Performs a GET request against the /procurement/warehouses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Warehouse]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Warehouse,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Warehouse, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Warehouse]:
         """
@@ -59,7 +55,7 @@ class ProcurementWarehousesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Warehouse]: The parsed response data.
         """
-        return self._parse_many(Warehouse, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Warehouse, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Warehouse:
         """
@@ -71,4 +67,12 @@ class ProcurementWarehousesEndpoint(ConnectWiseEndpoint):
         Returns:
             Warehouse: The parsed response data.
         """
-        return self._parse_one(Warehouse, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Warehouse, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProcurementWarehousesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementWarehousesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProcurementWarehousesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProcurementWarehousesCountEndpoint")
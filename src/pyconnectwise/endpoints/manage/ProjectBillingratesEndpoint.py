@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectBillingratesIdEndpoint import ProjectBillingratesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectBillingratesIdEndpoint import ProjectBillingratesIdEndpoint
+
 
 class ProjectBillingratesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "billingRates"
+    _route = "project/billingRates"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "billingRates", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectBillingratesIdEndpoint:
+    def id(self, id: int) -> "ProjectBillingratesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectBillingratesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectBillingratesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectBillingratesIdEndpoint: The initialized ProjectBillingratesIdEndpoint object.
+            ProjectBillingratesIdEndpoint: The ProjectBillingratesIdEndpoint view bound to the ID.
         """
-        child = ProjectBillingratesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectBillingratesIdEndpoint", id)
@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectBillingratesIdBillingratesIdEndpoint import \
-    ProjectBillingratesIdBillingratesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectBillingratesIdBillingratesIdEndpoint import \
+        ProjectBillingratesIdBillingratesIdEndpoint
+
 
 class ProjectBillingratesIdBillingratesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "billingRates"
+    _route = "project/billingRates/{id}/billingRates"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "billingRates", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectBillingratesIdBillingratesIdEndpoint:
+    def id(self, id: int) -> "ProjectBillingratesIdBillingratesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectBillingratesIdBillingratesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectBillingratesIdBillingratesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectBillingratesIdBillingratesIdEndpoint: The initialized ProjectBillingratesIdBillingratesIdEndpoint object.
+            ProjectBillingratesIdBillingratesIdEndpoint: The ProjectBillingratesIdBillingratesIdEndpoint view bound to the ID.
         """
-        child = ProjectBillingratesIdBillingratesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectBillingratesIdBillingratesIdEndpoint", id)
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import ProjectBillingRate
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ProjectBillingratesIdBillingratesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "project/billingRates/{id}/billingRates/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectBillingRate:
         """
@@ -19,4 +23,4 @@ class ProjectBillingratesIdBillingratesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectBillingRate: The parsed response data.
         """
-        return self._parse_one(ProjectBillingRate, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectBillingRate, super()._make_request("PATCH", data=data, params=params).content)
@@ -1,15 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectBillingratesIdBillingratesEndpoint import \
-    ProjectBillingratesIdBillingratesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectBillingratesIdBillingratesEndpoint import \
+        ProjectBillingratesIdBillingratesEndpoint
+
 
 class ProjectBillingratesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "project/billingRates/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.billing_rates = self._register_child_endpoint(
-            ProjectBillingratesIdBillingratesEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def billing_rates(self) -> "ProjectBillingratesIdBillingratesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectBillingratesIdBillingratesEndpoint")
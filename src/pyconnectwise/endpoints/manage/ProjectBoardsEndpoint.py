@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectBoardsIdEndpoint import ProjectBoardsIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectBoardsIdEndpoint import ProjectBoardsIdEndpoint
+
 
 class ProjectBoardsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "boards"
+    _route = "project/boards"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "boards", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectBoardsIdEndpoint:
+    def id(self, id: int) -> "ProjectBoardsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectBoardsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectBoardsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectBoardsIdEndpoint: The initialized ProjectBoardsIdEndpoint object.
+            ProjectBoardsIdEndpoint: The ProjectBoardsIdEndpoint view bound to the ID.
         """
-        child = ProjectBoardsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectBoardsIdEndpoint", id)
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsCountEndpoint import ProjectBoardsIdTeamsCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdEndpoint import ProjectBoardsIdTeamsIdEndpoint
-from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsInfoEndpoint import ProjectBoardsIdTeamsInfoEndpoint
 from pyconnectwise.models.manage import ProjectBoardTeam
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsCountEndpoint import ProjectBoardsIdTeamsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdEndpoint import ProjectBoardsIdTeamsIdEndpoint
+    from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsInfoEndpoint import ProjectBoardsIdTeamsInfoEndpoint
+
 
 class ProjectBoardsIdTeamsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "teams", parent_endpoint=parent_endpoint)
+    endpoint_base = "teams"
+    _route = "project/boards/{id}/teams"
 
-        self.info = self._register_child_endpoint(ProjectBoardsIdTeamsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProjectBoardsIdTeamsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectBoardsIdTeamsIdEndpoint:
+    def id(self, id: int) -> "ProjectBoardsIdTeamsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectBoardsIdTeamsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectBoardsIdTeamsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectBoardsIdTeamsIdEndpoint: The initialized ProjectBoardsIdTeamsIdEndpoint object.
+            ProjectBoardsIdTeamsIdEndpoint: The ProjectBoardsIdTeamsIdEndpoint view bound to the ID.
         """
-        child = ProjectBoardsIdTeamsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectBoardTeam]:
         """
         Performs a GET request against the /project/boards/{id}/teams endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectBoardTeam]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectBoardTeam,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectBoardTeam, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectBoardTeam]:
         """
@@ -61,7 +55,7 @@ class ProjectBoardsIdTeamsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProjectBoardTeam]: The parsed response data.
         """
-        return self._parse_many(ProjectBoardTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectBoardTeam, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectBoardTeam:
         """
@@ -73,4 +67,12 @@ class ProjectBoardsIdTeamsEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectBoardTeam: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeam, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeam, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProjectBoardsIdTeamsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProjectBoardsIdTeamsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsCountEndpoint")
@@ -1,43 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdInfoEndpoint import ProjectBoardsIdTeamsIdInfoEndpoint
-from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdMembersEndpoint import ProjectBoardsIdTeamsIdMembersEndpoint
 from pyconnectwise.models.manage import ProjectBoardTeam
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdInfoEndpoint import ProjectBoardsIdTeamsIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdMembersEndpoint import \
+        ProjectBoardsIdTeamsIdMembersEndpoint
+
 
 class ProjectBoardsIdTeamsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "project/boards/{id}/teams/{id}"
 
-        self.info = self._register_child_endpoint(ProjectBoardsIdTeamsIdInfoEndpoint(client, parent_endpoint=self))
-        self.members = self._register_child_endpoint(
-            ProjectBoardsIdTeamsIdMembersEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectBoardTeam]:
         """
         Performs a GET request against the /project/boards/{id}/teams/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectBoardTeam]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectBoardTeam,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectBoardTeam, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectBoardTeam:
         """
@@ -49,7 +44,7 @@ class ProjectBoardsIdTeamsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectBoardTeam: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeam, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -71,7 +66,7 @@ class ProjectBoardsIdTeamsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectBoardTeam: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeam, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeam, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectBoardTeam:
         """
@@ -83,4 +78,12 @@ class ProjectBoardsIdTeamsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectBoardTeam: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeam, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeam, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProjectBoardsIdTeamsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdInfoEndpoint")
+
+    @cached_property
+    def members(self) -> "ProjectBoardsIdTeamsIdMembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectBoardsIdTeamsIdMembersEndpoint")
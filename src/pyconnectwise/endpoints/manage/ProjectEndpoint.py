@@ -1,50 +1,82 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectBillingratesEndpoint import ProjectBillingratesEndpoint
-from pyconnectwise.endpoints.manage.ProjectBoardsEndpoint import ProjectBoardsEndpoint
-from pyconnectwise.endpoints.manage.ProjectIdEndpoint import ProjectIdEndpoint
-from pyconnectwise.endpoints.manage.ProjectPhasestatusesEndpoint import ProjectPhasestatusesEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsEndpoint import ProjectProjectsEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttemplatesEndpoint import ProjectProjecttemplatesEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttypesEndpoint import ProjectProjecttypesEndpoint
-from pyconnectwise.endpoints.manage.ProjectSecurityrolesEndpoint import ProjectSecurityrolesEndpoint
-from pyconnectwise.endpoints.manage.ProjectStatusesEndpoint import ProjectStatusesEndpoint
-from pyconnectwise.endpoints.manage.ProjectStatusindicatorsEndpoint import ProjectStatusindicatorsEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketnoteEndpoint import ProjectTicketnoteEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsEndpoint import ProjectTicketsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectBillingratesEndpoint import ProjectBillingratesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectBoardsEndpoint import ProjectBoardsEndpoint
+    from pyconnectwise.endpoints.manage.ProjectIdEndpoint import ProjectIdEndpoint
+    from pyconnectwise.endpoints.manage.ProjectPhasestatusesEndpoint import ProjectPhasestatusesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjectsEndpoint import ProjectProjectsEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjecttemplatesEndpoint import ProjectProjecttemplatesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjecttypesEndpoint import ProjectProjecttypesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectSecurityrolesEndpoint import ProjectSecurityrolesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectStatusesEndpoint import ProjectStatusesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectStatusindicatorsEndpoint import ProjectStatusindicatorsEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketnoteEndpoint import ProjectTicketnoteEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsEndpoint import ProjectTicketsEndpoint
+
 
 class ProjectEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "project"
+    _route = "project"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "project", parent_endpoint=parent_endpoint)
-
-        self.projects = self._register_child_endpoint(ProjectProjectsEndpoint(client, parent_endpoint=self))
-        self.phase_statuses = self._register_child_endpoint(ProjectPhasestatusesEndpoint(client, parent_endpoint=self))
-        self.security_roles = self._register_child_endpoint(ProjectSecurityrolesEndpoint(client, parent_endpoint=self))
-        self.status_indicators = self._register_child_endpoint(
-            ProjectStatusindicatorsEndpoint(client, parent_endpoint=self)
-        )
-        self.ticket_note = self._register_child_endpoint(ProjectTicketnoteEndpoint(client, parent_endpoint=self))
-        self.billing_rates = self._register_child_endpoint(ProjectBillingratesEndpoint(client, parent_endpoint=self))
-        self.project_types = self._register_child_endpoint(ProjectProjecttypesEndpoint(client, parent_endpoint=self))
-        self.tickets = self._register_child_endpoint(ProjectTicketsEndpoint(client, parent_endpoint=self))
-        self.boards = self._register_child_endpoint(ProjectBoardsEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(ProjectStatusesEndpoint(client, parent_endpoint=self))
-        self.project_templates = self._register_child_endpoint(
-            ProjectProjecttemplatesEndpoint(client, parent_endpoint=self)
-        )
-
-    def id(self, id: int) -> ProjectIdEndpoint:
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def id(self, id: int) -> "ProjectIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectIdEndpoint: The initialized ProjectIdEndpoint object.
+            ProjectIdEndpoint: The ProjectIdEndpoint view bound to the ID.
         """
-        child = ProjectIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectIdEndpoint", id)
+
+    @cached_property
+    def projects(self) -> "ProjectProjectsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjectsEndpoint")
+
+    @cached_property
+    def phase_statuses(self) -> "ProjectPhasestatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectPhasestatusesEndpoint")
+
+    @cached_property
+    def security_roles(self) -> "ProjectSecurityrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectSecurityrolesEndpoint")
+
+    @cached_property
+    def status_indicators(self) -> "ProjectStatusindicatorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectStatusindicatorsEndpoint")
+
+    @cached_property
+    def ticket_note(self) -> "ProjectTicketnoteEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketnoteEndpoint")
+
+    @cached_property
+    def billing_rates(self) -> "ProjectBillingratesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectBillingratesEndpoint")
+
+    @cached_property
+    def project_types(self) -> "ProjectProjecttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjecttypesEndpoint")
+
+    @cached_property
+    def tickets(self) -> "ProjectTicketsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsEndpoint")
+
+    @cached_property
+    def boards(self) -> "ProjectBoardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectBoardsEndpoint")
+
+    @cached_property
+    def statuses(self) -> "ProjectStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectStatusesEndpoint")
+
+    @cached_property
+    def project_templates(self) -> "ProjectProjecttemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjecttemplatesEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsCountEndpoint import ProjectProjectsCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdEndpoint import ProjectProjectsIdEndpoint
 from pyconnectwise.models.manage import Project
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjectsCountEndpoint import ProjectProjectsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdEndpoint import ProjectProjectsIdEndpoint
+
 
 class ProjectProjectsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "projects", parent_endpoint=parent_endpoint)
+    endpoint_base = "projects"
+    _route = "project/projects"
 
-        self.count = self._register_child_endpoint(ProjectProjectsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectProjectsIdEndpoint:
+    def id(self, id: int) -> "ProjectProjectsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectProjectsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectProjectsIdEndpoint: The initialized ProjectProjectsIdEndpoint object.
+            ProjectProjectsIdEndpoint: The ProjectProjectsIdEndpoint view bound to the ID.
         """
-        child = ProjectProjectsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectProjectsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Project]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Project]:
         """
         Performs a GET request against the /project/projects endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Project]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Project,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Project, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Project]:
         """
@@ -57,7 +54,7 @@ class ProjectProjectsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Project]: The parsed response data.
         """
-        return self._parse_many(Project, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Project, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Project:
         """
@@ -69,4 +66,8 @@ class ProjectProjectsEndpoint(ConnectWiseEndpoint):
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProjectProjectsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjectsCountEndpoint")
@@ -1,50 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdContactsIdEndpoint import ProjectProjectsIdContactsIdEndpoint
 from pyconnectwise.models.manage import ProjectContact
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdContactsIdEndpoint import ProjectProjectsIdContactsIdEndpoint
+
 
 class ProjectProjectsIdContactsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "contacts"
+    _route = "project/projects/{id}/contacts"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "contacts", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectProjectsIdContactsIdEndpoint:
+    def id(self, id: int) -> "ProjectProjectsIdContactsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdContactsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectProjectsIdContactsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectProjectsIdContactsIdEndpoint: The initialized ProjectProjectsIdContactsIdEndpoint object.
+            ProjectProjectsIdContactsIdEndpoint: The ProjectProjectsIdContactsIdEndpoint view bound to the ID.
         """
-        child = ProjectProjectsIdContactsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectProjectsIdContactsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectContact]:
         """
         Performs a GET request against the /project/projects/{id}/contacts endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectContact]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectContact,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectContact, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectContact]:
         """
@@ -56,7 +53,7 @@ class ProjectProjectsIdContactsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProjectContact]: The parsed response data.
         """
-        return self._parse_many(ProjectContact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectContact, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectContact:
         """
@@ -68,4 +65,4 @@ class ProjectProjectsIdContactsEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectContact: The parsed response data.
         """
-        return self._parse_one(ProjectContact, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectContact, super()._make_request("POST", data=data, params=params).content)
@@ -1,50 +1,41 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdContactsEndpoint import ProjectProjectsIdContactsEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdNotesEndpoint import ProjectProjectsIdNotesEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdPhasesEndpoint import ProjectProjectsIdPhasesEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanEndpoint import \
-    ProjectProjectsIdProjectworkplanEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersEndpoint import ProjectProjectsIdTeammembersEndpoint
 from pyconnectwise.models.manage import Project
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdContactsEndpoint import ProjectProjectsIdContactsEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdNotesEndpoint import ProjectProjectsIdNotesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdPhasesEndpoint import ProjectProjectsIdPhasesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanEndpoint import \
+        ProjectProjectsIdProjectworkplanEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersEndpoint import ProjectProjectsIdTeammembersEndpoint
+
 
 class ProjectProjectsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "project/projects/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
-
-        self.phases = self._register_child_endpoint(ProjectProjectsIdPhasesEndpoint(client, parent_endpoint=self))
-        self.team_members = self._register_child_endpoint(
-            ProjectProjectsIdTeammembersEndpoint(client, parent_endpoint=self)
-        )
-        self.notes = self._register_child_endpoint(ProjectProjectsIdNotesEndpoint(client, parent_endpoint=self))
-        self.contacts = self._register_child_endpoint(ProjectProjectsIdContactsEndpoint(client, parent_endpoint=self))
-        self.project_workplan = self._register_child_endpoint(
-            ProjectProjectsIdProjectworkplanEndpoint(client, parent_endpoint=self)
-        )
-
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Project]:
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Project]:
         """
         Performs a GET request against the /project/projects/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Project]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Project,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Project, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Project:
         """
@@ -56,7 +47,7 @@ class ProjectProjectsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -78,7 +69,7 @@ class ProjectProjectsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Project:
         """
@@ -90,4 +81,24 @@ class ProjectProjectsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def phases(self) -> "ProjectProjectsIdPhasesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjectsIdPhasesEndpoint")
+
+    @cached_property
+    def team_members(self) -> "ProjectProjectsIdTeammembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersEndpoint")
+
+    @cached_property
+    def notes(self) -> "ProjectProjectsIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjectsIdNotesEndpoint")
+
+    @cached_property
+    def contacts(self) -> "ProjectProjectsIdContactsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjectsIdContactsEndpoint")
+
+    @cached_property
+    def project_workplan(self) -> "ProjectProjectsIdProjectworkplanEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanEndpoint")
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanCountEndpoint import \
-    ProjectProjectsIdProjectworkplanCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanIdEndpoint import \
-    ProjectProjectsIdProjectworkplanIdEndpoint
 from pyconnectwise.models.manage import ProjectWorkplan
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanCountEndpoint import \
+        ProjectProjectsIdProjectworkplanCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanIdEndpoint import \
+        ProjectProjectsIdProjectworkplanIdEndpoint
+
 
 class ProjectProjectsIdProjectworkplanEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "projectWorkplan", parent_endpoint=parent_endpoint)
+    endpoint_base = "projectWorkplan"
+    _route = "project/projects/{id}/projectWorkplan"
 
-        self.count = self._register_child_endpoint(
-            ProjectProjectsIdProjectworkplanCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectProjectsIdProjectworkplanIdEndpoint:
+    def id(self, id: int) -> "ProjectProjectsIdProjectworkplanIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdProjectworkplanIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectProjectsIdProjectworkplanIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectProjectsIdProjectworkplanIdEndpoint: The initialized ProjectProjectsIdProjectworkplanIdEndpoint object.
+            ProjectProjectsIdProjectworkplanIdEndpoint: The ProjectProjectsIdProjectworkplanIdEndpoint view bound to the ID.
         """
-        child = ProjectProjectsIdProjectworkplanIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectWorkplan]:
         """
         Performs a GET request against the /project/projects/{id}/projectWorkplan endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectWorkplan]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectWorkplan,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectWorkplan, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectWorkplan]:
         """
@@ -63,4 +56,10 @@ class ProjectProjectsIdProjectworkplanEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProjectWorkplan]: The parsed response data.
         """
-        return self._parse_many(ProjectWorkplan, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectWorkplan, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProjectProjectsIdProjectworkplanCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanCountEndpoint"
+        )
@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersCountEndpoint import \
-    ProjectProjectsIdTeammembersCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersIdEndpoint import ProjectProjectsIdTeammembersIdEndpoint
 from pyconnectwise.models.manage import ProjectTeamMember
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersCountEndpoint import \
+        ProjectProjectsIdTeammembersCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersIdEndpoint import \
+        ProjectProjectsIdTeammembersIdEndpoint
+
 
 class ProjectProjectsIdTeammembersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "teamMembers", parent_endpoint=parent_endpoint)
+    endpoint_base = "teamMembers"
+    _route = "project/projects/{id}/teamMembers"
 
-        self.count = self._register_child_endpoint(
-            ProjectProjectsIdTeammembersCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectProjectsIdTeammembersIdEndpoint:
+    def id(self, id: int) -> "ProjectProjectsIdTeammembersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdTeammembersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectProjectsIdTeammembersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectProjectsIdTeammembersIdEndpoint: The initialized ProjectProjectsIdTeammembersIdEndpoint object.
+            ProjectProjectsIdTeammembersIdEndpoint: The ProjectProjectsIdTeammembersIdEndpoint view bound to the ID.
         """
-        child = ProjectProjectsIdTeammembersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectTeamMember]:
         """
         Performs a GET request against the /project/projects/{id}/teamMembers endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectTeamMember]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectTeamMember,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectTeamMember, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectTeamMember]:
         """
@@ -62,7 +56,7 @@ class ProjectProjectsIdTeammembersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProjectTeamMember]: The parsed response data.
         """
-        return self._parse_many(ProjectTeamMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectTeamMember, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTeamMember:
         """
@@ -74,4 +68,8 @@ class ProjectProjectsIdTeammembersEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectTeamMember: The parsed response data.
         """
-        return self._parse_one(ProjectTeamMember, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectTeamMember, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProjectProjectsIdTeammembersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjectsIdTeammembersCountEndpoint")
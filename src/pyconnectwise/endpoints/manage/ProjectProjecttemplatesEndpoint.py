@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttemplatesCountEndpoint import ProjectProjecttemplatesCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdEndpoint import ProjectProjecttemplatesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjecttemplatesCountEndpoint import ProjectProjecttemplatesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdEndpoint import ProjectProjecttemplatesIdEndpoint
+
 
 class ProjectProjecttemplatesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "projectTemplates", parent_endpoint=parent_endpoint)
+    endpoint_base = "projectTemplates"
+    _route = "project/projectTemplates"
 
-        self.count = self._register_child_endpoint(ProjectProjecttemplatesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectProjecttemplatesIdEndpoint:
+    def id(self, id: int) -> "ProjectProjecttemplatesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectProjecttemplatesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectProjecttemplatesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectProjecttemplatesIdEndpoint: The initialized ProjectProjecttemplatesIdEndpoint object.
+            ProjectProjecttemplatesIdEndpoint: The ProjectProjecttemplatesIdEndpoint view bound to the ID.
         """
-        child = ProjectProjecttemplatesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "ProjectProjecttemplatesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjecttemplatesCountEndpoint")
@@ -1,47 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsEndpoint import \
-    ProjectProjecttemplatesIdProjecttemplateticketsEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdWorkplanEndpoint import \
-    ProjectProjecttemplatesIdWorkplanEndpoint
 from pyconnectwise.models.manage import ProjectTemplate
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsEndpoint import \
+        ProjectProjecttemplatesIdProjecttemplateticketsEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdWorkplanEndpoint import \
+        ProjectProjecttemplatesIdWorkplanEndpoint
+
 
 class ProjectProjecttemplatesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "project/projectTemplates/{id}"
 
-        self.project_template_tickets = self._register_child_endpoint(
-            ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(client, parent_endpoint=self)
-        )
-        self.workplan = self._register_child_endpoint(
-            ProjectProjecttemplatesIdWorkplanEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectTemplate]:
         """
         Performs a GET request against the /project/projectTemplates/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectTemplate]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectTemplate,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectTemplate, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTemplate:
         """
@@ -53,7 +45,7 @@ class ProjectProjecttemplatesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectTemplate: The parsed response data.
         """
-        return self._parse_one(ProjectTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -75,7 +67,7 @@ class ProjectProjecttemplatesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectTemplate: The parsed response data.
         """
-        return self._parse_one(ProjectTemplate, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProjectTemplate, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTemplate:
         """
@@ -87,4 +79,14 @@ class ProjectProjecttemplatesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectTemplate: The parsed response data.
         """
-        return self._parse_one(ProjectTemplate, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectTemplate, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def project_template_tickets(self) -> "ProjectProjecttemplatesIdProjecttemplateticketsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsEndpoint"
+        )
+
+    @cached_property
+    def workplan(self) -> "ProjectProjecttemplatesIdWorkplanEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdWorkplanEndpoint")
@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint import \
-    ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint import \
-    ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint
 from pyconnectwise.models.manage import ProjectTemplateTicket
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint import \
+        ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint import \
+        ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint
+
 
 class ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "projectTemplateTickets", parent_endpoint=parent_endpoint)
+    endpoint_base = "projectTemplateTickets"
+    _route = "project/projectTemplates/{id}/projectTemplateTickets"
 
-        self.count = self._register_child_endpoint(
-            ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint:
+    def id(self, id: int) -> "ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint: The initialized ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint object.
+            ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint: The ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint view bound to the ID.
         """
-        child = ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectTemplateTicket]:
         """
         Performs a GET request against the /project/projectTemplates/{id}/projectTemplateTickets endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectTemplateTicket]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectTemplateTicket,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectTemplateTicket, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectTemplateTicket]:
         """
@@ -63,7 +58,7 @@ class ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(ConnectWiseEndpoin
         Returns:
             list[ProjectTemplateTicket]: The parsed response data.
         """
-        return self._parse_many(ProjectTemplateTicket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectTemplateTicket, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTemplateTicket:
         """
@@ -75,4 +70,10 @@ class ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(ConnectWiseEndpoin
         Returns:
             ProjectTemplateTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTemplateTicket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectTemplateTicket, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint"
+        )
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttypesCountEndpoint import ProjectProjecttypesCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttypesIdEndpoint import ProjectProjecttypesIdEndpoint
-from pyconnectwise.endpoints.manage.ProjectProjecttypesInfoEndpoint import ProjectProjecttypesInfoEndpoint
 from pyconnectwise.models.manage import ProjectType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectProjecttypesCountEndpoint import ProjectProjecttypesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjecttypesIdEndpoint import ProjectProjecttypesIdEndpoint
+    from pyconnectwise.endpoints.manage.ProjectProjecttypesInfoEndpoint import ProjectProjecttypesInfoEndpoint
+
 
 class ProjectProjecttypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "projectTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "projectTypes"
+    _route = "project/projectTypes"
 
-        self.info = self._register_child_endpoint(ProjectProjecttypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProjectProjecttypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectProjecttypesIdEndpoint:
+    def id(self, id: int) -> "ProjectProjecttypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectProjecttypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectProjecttypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectProjecttypesIdEndpoint: The initialized ProjectProjecttypesIdEndpoint object.
+            ProjectProjecttypesIdEndpoint: The ProjectProjecttypesIdEndpoint view bound to the ID.
         """
-        child = ProjectProjecttypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectProjecttypesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ProjectType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ProjectType]:
         """
         Performs a GET request against the /project/projectTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectType]:
         """
@@ -59,7 +55,7 @@ class ProjectProjecttypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProjectType]: The parsed response data.
         """
-        return self._parse_many(ProjectType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectType:
         """
@@ -71,4 +67,12 @@ class ProjectProjecttypesEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectType: The parsed response data.
         """
-        return self._parse_one(ProjectType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProjectProjecttypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjecttypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProjectProjecttypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectProjecttypesCountEndpoint")
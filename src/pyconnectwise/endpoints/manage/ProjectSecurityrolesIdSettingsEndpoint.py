@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectSecurityrolesIdSettingsCountEndpoint import \
-    ProjectSecurityrolesIdSettingsCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectSecurityrolesIdSettingsIdEndpoint import \
-    ProjectSecurityrolesIdSettingsIdEndpoint
 from pyconnectwise.models.manage import ProjectSecurityRoleSetting
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectSecurityrolesIdSettingsCountEndpoint import \
+        ProjectSecurityrolesIdSettingsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectSecurityrolesIdSettingsIdEndpoint import \
+        ProjectSecurityrolesIdSettingsIdEndpoint
+
 
 class ProjectSecurityrolesIdSettingsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "settings", parent_endpoint=parent_endpoint)
+    endpoint_base = "settings"
+    _route = "project/securityRoles/{id}/settings"
 
-        self.count = self._register_child_endpoint(
-            ProjectSecurityrolesIdSettingsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectSecurityrolesIdSettingsIdEndpoint:
+    def id(self, id: int) -> "ProjectSecurityrolesIdSettingsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectSecurityrolesIdSettingsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectSecurityrolesIdSettingsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectSecurityrolesIdSettingsIdEndpoint: The initialized ProjectSecurityrolesIdSettingsIdEndpoint object.
+            ProjectSecurityrolesIdSettingsIdEndpoint: The ProjectSecurityrolesIdSettingsIdEndpoint view bound to the ID.
         """
-        child = ProjectSecurityrolesIdSettingsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectSecurityrolesIdSettingsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectSecurityRoleSetting]:
         """
         Performs a GET request against the /project/securityRoles/{id}/settings endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectSecurityRoleSetting]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectSecurityRoleSetting,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectSecurityRoleSetting, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectSecurityRoleSetting]:
         """
@@ -64,5 +57,9 @@ class ProjectSecurityrolesIdSettingsEndpoint(ConnectWiseEndpoint):
             list[ProjectSecurityRoleSetting]: The parsed response data.
         """
         return self._parse_many(
-            ProjectSecurityRoleSetting, super()._make_request("GET", data=data, params=params).json()
+            ProjectSecurityRoleSetting, super()._make_request("GET", data=data, params=params).content
         )
+
+    @cached_property
+    def count(self) -> "ProjectSecurityrolesIdSettingsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectSecurityrolesIdSettingsCountEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectStatusesCountEndpoint import ProjectStatusesCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectStatusesIdEndpoint import ProjectStatusesIdEndpoint
-from pyconnectwise.endpoints.manage.ProjectStatusesInfoEndpoint import ProjectStatusesInfoEndpoint
 from pyconnectwise.models.manage import ProjectStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectStatusesCountEndpoint import ProjectStatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectStatusesIdEndpoint import ProjectStatusesIdEndpoint
+    from pyconnectwise.endpoints.manage.ProjectStatusesInfoEndpoint import ProjectStatusesInfoEndpoint
+
 
 class ProjectStatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "statuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "statuses"
+    _route = "project/statuses"
 
-        self.info = self._register_child_endpoint(ProjectStatusesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ProjectStatusesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectStatusesIdEndpoint:
+    def id(self, id: int) -> "ProjectStatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectStatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectStatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectStatusesIdEndpoint: The initialized ProjectStatusesIdEndpoint object.
+            ProjectStatusesIdEndpoint: The ProjectStatusesIdEndpoint view bound to the ID.
         """
-        child = ProjectStatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectStatusesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectStatus]:
         """
         Performs a GET request against the /project/statuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectStatus]:
         """
@@ -61,7 +55,7 @@ class ProjectStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProjectStatus]: The parsed response data.
         """
-        return self._parse_many(ProjectStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectStatus:
         """
@@ -73,4 +67,12 @@ class ProjectStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectStatus: The parsed response data.
         """
-        return self._parse_one(ProjectStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ProjectStatusesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectStatusesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ProjectStatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectStatusesCountEndpoint")
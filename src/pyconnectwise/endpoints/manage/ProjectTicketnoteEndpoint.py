@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketnoteIdEndpoint import ProjectTicketnoteIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectTicketnoteIdEndpoint import ProjectTicketnoteIdEndpoint
+
 
 class ProjectTicketnoteEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "ticketNote"
+    _route = "project/ticketNote"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "ticketNote", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectTicketnoteIdEndpoint:
+    def id(self, id: int) -> "ProjectTicketnoteIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectTicketnoteIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectTicketnoteIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectTicketnoteIdEndpoint: The initialized ProjectTicketnoteIdEndpoint object.
+            ProjectTicketnoteIdEndpoint: The ProjectTicketnoteIdEndpoint view bound to the ID.
         """
-        child = ProjectTicketnoteIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectTicketnoteIdEndpoint", id)
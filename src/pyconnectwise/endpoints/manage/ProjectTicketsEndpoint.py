@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsCountEndpoint import ProjectTicketsCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdEndpoint import ProjectTicketsIdEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsSearchEndpoint import ProjectTicketsSearchEndpoint
 from pyconnectwise.models.manage import ProjectTicket
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectTicketsCountEndpoint import ProjectTicketsCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdEndpoint import ProjectTicketsIdEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsSearchEndpoint import ProjectTicketsSearchEndpoint
+
 
 class ProjectTicketsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "tickets", parent_endpoint=parent_endpoint)
+    endpoint_base = "tickets"
+    _route = "project/tickets"
 
-        self.count = self._register_child_endpoint(ProjectTicketsCountEndpoint(client, parent_endpoint=self))
-        self.search = self._register_child_endpoint(ProjectTicketsSearchEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectTicketsIdEndpoint:
+    def id(self, id: int) -> "ProjectTicketsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectTicketsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectTicketsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectTicketsIdEndpoint: The initialized ProjectTicketsIdEndpoint object.
+            ProjectTicketsIdEndpoint: The ProjectTicketsIdEndpoint view bound to the ID.
         """
-        child = ProjectTicketsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectTicketsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectTicket]:
         """
         Performs a GET request against the /project/tickets endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectTicket]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectTicket,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectTicket, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ProjectTicket]:
         """
@@ -61,7 +55,7 @@ class ProjectTicketsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ProjectTicket]: The parsed response data.
         """
-        return self._parse_many(ProjectTicket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectTicket, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTicket:
         """
@@ -73,4 +67,12 @@ class ProjectTicketsEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTicket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectTicket, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProjectTicketsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsCountEndpoint")
+
+    @cached_property
+    def search(self) -> "ProjectTicketsSearchEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsSearchEndpoint")
@@ -1,66 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdActivitiesEndpoint import ProjectTicketsIdActivitiesEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdAllnotesEndpoint import ProjectTicketsIdAllnotesEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdConfigurationsEndpoint import ProjectTicketsIdConfigurationsEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdConvertEndpoint import ProjectTicketsIdConvertEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdDocumentsEndpoint import ProjectTicketsIdDocumentsEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdNotesEndpoint import ProjectTicketsIdNotesEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdProductsEndpoint import ProjectTicketsIdProductsEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdScheduleentriesEndpoint import \
-    ProjectTicketsIdScheduleentriesEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdTasksEndpoint import ProjectTicketsIdTasksEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdTimeentriesEndpoint import ProjectTicketsIdTimeentriesEndpoint
 from pyconnectwise.models.manage import ProjectTicket
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdActivitiesEndpoint import ProjectTicketsIdActivitiesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdAllnotesEndpoint import ProjectTicketsIdAllnotesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdConfigurationsEndpoint import \
+        ProjectTicketsIdConfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdConvertEndpoint import ProjectTicketsIdConvertEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdDocumentsEndpoint import ProjectTicketsIdDocumentsEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdNotesEndpoint import ProjectTicketsIdNotesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdProductsEndpoint import ProjectTicketsIdProductsEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdScheduleentriesEndpoint import \
+        ProjectTicketsIdScheduleentriesEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdTasksEndpoint import ProjectTicketsIdTasksEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdTimeentriesEndpoint import ProjectTicketsIdTimeentriesEndpoint
+
 
 class ProjectTicketsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "project/tickets/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
-
-        self.scheduleentries = self._register_child_endpoint(
-            ProjectTicketsIdScheduleentriesEndpoint(client, parent_endpoint=self)
-        )
-        self.tasks = self._register_child_endpoint(ProjectTicketsIdTasksEndpoint(client, parent_endpoint=self))
-        self.all_notes = self._register_child_endpoint(ProjectTicketsIdAllnotesEndpoint(client, parent_endpoint=self))
-        self.products = self._register_child_endpoint(ProjectTicketsIdProductsEndpoint(client, parent_endpoint=self))
-        self.timeentries = self._register_child_endpoint(
-            ProjectTicketsIdTimeentriesEndpoint(client, parent_endpoint=self)
-        )
-        self.convert = self._register_child_endpoint(ProjectTicketsIdConvertEndpoint(client, parent_endpoint=self))
-        self.notes = self._register_child_endpoint(ProjectTicketsIdNotesEndpoint(client, parent_endpoint=self))
-        self.activities = self._register_child_endpoint(
-            ProjectTicketsIdActivitiesEndpoint(client, parent_endpoint=self)
-        )
-        self.documents = self._register_child_endpoint(ProjectTicketsIdDocumentsEndpoint(client, parent_endpoint=self))
-        self.configurations = self._register_child_endpoint(
-            ProjectTicketsIdConfigurationsEndpoint(client, parent_endpoint=self)
-        )
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ProjectTicket]:
         """
         Performs a GET request against the /project/tickets/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ProjectTicket]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ProjectTicket,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ProjectTicket, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTicket:
         """
@@ -72,7 +53,7 @@ class ProjectTicketsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTicket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectTicket, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -94,7 +75,7 @@ class ProjectTicketsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTicket, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProjectTicket, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ProjectTicket:
         """
@@ -106,4 +87,44 @@ class ProjectTicketsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ProjectTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTicket, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectTicket, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def scheduleentries(self) -> "ProjectTicketsIdScheduleentriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdScheduleentriesEndpoint")
+
+    @cached_property
+    def tasks(self) -> "ProjectTicketsIdTasksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdTasksEndpoint")
+
+    @cached_property
+    def all_notes(self) -> "ProjectTicketsIdAllnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdAllnotesEndpoint")
+
+    @cached_property
+    def products(self) -> "ProjectTicketsIdProductsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdProductsEndpoint")
+
+    @cached_property
+    def timeentries(self) -> "ProjectTicketsIdTimeentriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdTimeentriesEndpoint")
+
+    @cached_property
+    def convert(self) -> "ProjectTicketsIdConvertEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdConvertEndpoint")
+
+    @cached_property
+    def notes(self) -> "ProjectTicketsIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdNotesEndpoint")
+
+    @cached_property
+    def activities(self) -> "ProjectTicketsIdActivitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdActivitiesEndpoint")
+
+    @cached_property
+    def documents(self) -> "ProjectTicketsIdDocumentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdDocumentsEndpoint")
+
+    @cached_property
+    def configurations(self) -> "ProjectTicketsIdConfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdConfigurationsEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdTasksCountEndpoint import ProjectTicketsIdTasksCountEndpoint
-from pyconnectwise.endpoints.manage.ProjectTicketsIdTasksIdEndpoint import ProjectTicketsIdTasksIdEndpoint
 from pyconnectwise.models.manage import TicketTask
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdTasksCountEndpoint import ProjectTicketsIdTasksCountEndpoint
+    from pyconnectwise.endpoints.manage.ProjectTicketsIdTasksIdEndpoint import ProjectTicketsIdTasksIdEndpoint
+
 
 class ProjectTicketsIdTasksEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "tasks", parent_endpoint=parent_endpoint)
+    endpoint_base = "tasks"
+    _route = "project/tickets/{id}/tasks"
 
-        self.count = self._register_child_endpoint(ProjectTicketsIdTasksCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ProjectTicketsIdTasksIdEndpoint:
+    def id(self, id: int) -> "ProjectTicketsIdTasksIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ProjectTicketsIdTasksIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ProjectTicketsIdTasksIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ProjectTicketsIdTasksIdEndpoint: The initialized ProjectTicketsIdTasksIdEndpoint object.
+            ProjectTicketsIdTasksIdEndpoint: The ProjectTicketsIdTasksIdEndpoint view bound to the ID.
         """
-        child = ProjectTicketsIdTasksIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ProjectTicketsIdTasksIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TicketTask]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TicketTask]:
         """
         Performs a GET request against the /project/tickets/{id}/tasks endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TicketTask]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TicketTask,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TicketTask, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TicketTask]:
         """
@@ -57,7 +54,7 @@ class ProjectTicketsIdTasksEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TicketTask]: The parsed response data.
         """
-        return self._parse_many(TicketTask, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TicketTask, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TicketTask:
         """
@@ -69,4 +66,8 @@ class ProjectTicketsIdTasksEndpoint(ConnectWiseEndpoint):
         Returns:
             TicketTask: The parsed response data.
         """
-        return self._parse_one(TicketTask, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TicketTask, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ProjectTicketsIdTasksCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ProjectTicketsIdTasksCountEndpoint")
@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesCountEndpoint import SalesActivitiesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesIdEndpoint import SalesActivitiesIdEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesStatusesEndpoint import SalesActivitiesStatusesEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesTypesEndpoint import SalesActivitiesTypesEndpoint
 from pyconnectwise.models.manage import Activity
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesActivitiesCountEndpoint import SalesActivitiesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesActivitiesIdEndpoint import SalesActivitiesIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesActivitiesStatusesEndpoint import SalesActivitiesStatusesEndpoint
+    from pyconnectwise.endpoints.manage.SalesActivitiesTypesEndpoint import SalesActivitiesTypesEndpoint
+
 
 class SalesActivitiesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "activities", parent_endpoint=parent_endpoint)
+    endpoint_base = "activities"
+    _route = "sales/activities"
 
-        self.types = self._register_child_endpoint(SalesActivitiesTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SalesActivitiesCountEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(SalesActivitiesStatusesEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesActivitiesIdEndpoint:
+    def id(self, id: int) -> "SalesActivitiesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesActivitiesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesActivitiesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesActivitiesIdEndpoint: The initialized SalesActivitiesIdEndpoint object.
+            SalesActivitiesIdEndpoint: The SalesActivitiesIdEndpoint view bound to the ID.
         """
-        child = SalesActivitiesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesActivitiesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Activity]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Activity]:
         """
         Performs a GET request against the /sales/activities endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Activity]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Activity,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Activity, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Activity]:
         """
@@ -61,7 +56,7 @@ class SalesActivitiesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Activity]: The parsed response data.
         """
-        return self._parse_many(Activity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Activity, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Activity:
         """
@@ -73,4 +68,16 @@ class SalesActivitiesEndpoint(ConnectWiseEndpoint):
         Returns:
             Activity: The parsed response data.
         """
-        return self._parse_one(Activity, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Activity, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def types(self) -> "SalesActivitiesTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesActivitiesTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesActivitiesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesActivitiesCountEndpoint")
+
+    @cached_property
+    def statuses(self) -> "SalesActivitiesStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesActivitiesStatusesEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesStatusesCountEndpoint import SalesActivitiesStatusesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesStatusesIdEndpoint import SalesActivitiesStatusesIdEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesStatusesInfoEndpoint import SalesActivitiesStatusesInfoEndpoint
 from pyconnectwise.models.manage import ActivityStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesActivitiesStatusesCountEndpoint import SalesActivitiesStatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesActivitiesStatusesIdEndpoint import SalesActivitiesStatusesIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesActivitiesStatusesInfoEndpoint import SalesActivitiesStatusesInfoEndpoint
+
 
 class SalesActivitiesStatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "statuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "statuses"
+    _route = "sales/activities/statuses"
 
-        self.info = self._register_child_endpoint(SalesActivitiesStatusesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SalesActivitiesStatusesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesActivitiesStatusesIdEndpoint:
+    def id(self, id: int) -> "SalesActivitiesStatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesActivitiesStatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesActivitiesStatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesActivitiesStatusesIdEndpoint: The initialized SalesActivitiesStatusesIdEndpoint object.
+            SalesActivitiesStatusesIdEndpoint: The SalesActivitiesStatusesIdEndpoint view bound to the ID.
         """
-        child = SalesActivitiesStatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesActivitiesStatusesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ActivityStatus]:
         """
         Performs a GET request against the /sales/activities/statuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ActivityStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ActivityStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ActivityStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ActivityStatus]:
         """
@@ -61,7 +55,7 @@ class SalesActivitiesStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ActivityStatus]: The parsed response data.
         """
-        return self._parse_many(ActivityStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ActivityStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ActivityStatus:
         """
@@ -73,4 +67,12 @@ class SalesActivitiesStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             ActivityStatus: The parsed response data.
         """
-        return self._parse_one(ActivityStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ActivityStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SalesActivitiesStatusesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesActivitiesStatusesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesActivitiesStatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesActivitiesStatusesCountEndpoint")
@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesTypesCountEndpoint import SalesActivitiesTypesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesTypesIdEndpoint import SalesActivitiesTypesIdEndpoint
 from pyconnectwise.models.manage import ActivityType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesActivitiesTypesCountEndpoint import SalesActivitiesTypesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesActivitiesTypesIdEndpoint import SalesActivitiesTypesIdEndpoint
+
 
 class SalesActivitiesTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "sales/activities/types"
 
-        self.count = self._register_child_endpoint(SalesActivitiesTypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesActivitiesTypesIdEndpoint:
+    def id(self, id: int) -> "SalesActivitiesTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesActivitiesTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesActivitiesTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesActivitiesTypesIdEndpoint: The initialized SalesActivitiesTypesIdEndpoint object.
+            SalesActivitiesTypesIdEndpoint: The SalesActivitiesTypesIdEndpoint view bound to the ID.
         """
-        child = SalesActivitiesTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesActivitiesTypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ActivityType]:
         """
         Performs a GET request against the /sales/activities/types endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ActivityType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ActivityType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ActivityType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ActivityType]:
         """
@@ -59,7 +54,7 @@ class SalesActivitiesTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ActivityType]: The parsed response data.
         """
-        return self._parse_many(ActivityType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ActivityType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ActivityType:
         """
@@ -71,4 +66,8 @@ class SalesActivitiesTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             ActivityType: The parsed response data.
         """
-        return self._parse_one(ActivityType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ActivityType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SalesActivitiesTypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesActivitiesTypesCountEndpoint")
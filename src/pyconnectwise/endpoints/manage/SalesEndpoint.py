@@ -1,32 +1,70 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesActivitiesEndpoint import SalesActivitiesEndpoint
-from pyconnectwise.endpoints.manage.SalesCommissionsEndpoint import SalesCommissionsEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesEndpoint import SalesOpportunitiesEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersEndpoint import SalesOrdersEndpoint
-from pyconnectwise.endpoints.manage.SalesProbabilitiesEndpoint import SalesProbabilitiesEndpoint
-from pyconnectwise.endpoints.manage.SalesQuotasEndpoint import SalesQuotasEndpoint
-from pyconnectwise.endpoints.manage.SalesRolesEndpoint import SalesRolesEndpoint
-from pyconnectwise.endpoints.manage.SalesSalesteamsEndpoint import SalesSalesteamsEndpoint
-from pyconnectwise.endpoints.manage.SalesScheduleEndpoint import SalesScheduleEndpoint
-from pyconnectwise.endpoints.manage.SalesServiceEndpoint import SalesServiceEndpoint
-from pyconnectwise.endpoints.manage.SalesStagesEndpoint import SalesStagesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesActivitiesEndpoint import SalesActivitiesEndpoint
+    from pyconnectwise.endpoints.manage.SalesCommissionsEndpoint import SalesCommissionsEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesEndpoint import SalesOpportunitiesEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersEndpoint import SalesOrdersEndpoint
+    from pyconnectwise.endpoints.manage.SalesProbabilitiesEndpoint import SalesProbabilitiesEndpoint
+    from pyconnectwise.endpoints.manage.SalesQuotasEndpoint import SalesQuotasEndpoint
+    from pyconnectwise.endpoints.manage.SalesRolesEndpoint import SalesRolesEndpoint
+    from pyconnectwise.endpoints.manage.SalesSalesteamsEndpoint import SalesSalesteamsEndpoint
+    from pyconnectwise.endpoints.manage.SalesScheduleEndpoint import SalesScheduleEndpoint
+    from pyconnectwise.endpoints.manage.SalesServiceEndpoint import SalesServiceEndpoint
+    from pyconnectwise.endpoints.manage.SalesStagesEndpoint import SalesStagesEndpoint
+
 
 class SalesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "sales"
+    _route = "sales"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "sales", parent_endpoint=parent_endpoint)
-
-        self.sales_teams = self._register_child_endpoint(SalesSalesteamsEndpoint(client, parent_endpoint=self))
-        self.stages = self._register_child_endpoint(SalesStagesEndpoint(client, parent_endpoint=self))
-        self.service = self._register_child_endpoint(SalesServiceEndpoint(client, parent_endpoint=self))
-        self.commissions = self._register_child_endpoint(SalesCommissionsEndpoint(client, parent_endpoint=self))
-        self.probabilities = self._register_child_endpoint(SalesProbabilitiesEndpoint(client, parent_endpoint=self))
-        self.orders = self._register_child_endpoint(SalesOrdersEndpoint(client, parent_endpoint=self))
-        self.roles = self._register_child_endpoint(SalesRolesEndpoint(client, parent_endpoint=self))
-        self.schedule = self._register_child_endpoint(SalesScheduleEndpoint(client, parent_endpoint=self))
-        self.quotas = self._register_child_endpoint(SalesQuotasEndpoint(client, parent_endpoint=self))
-        self.opportunities = self._register_child_endpoint(SalesOpportunitiesEndpoint(client, parent_endpoint=self))
-        self.activities = self._register_child_endpoint(SalesActivitiesEndpoint(client, parent_endpoint=self))
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def sales_teams(self) -> "SalesSalesteamsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesSalesteamsEndpoint")
+
+    @cached_property
+    def stages(self) -> "SalesStagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesStagesEndpoint")
+
+    @cached_property
+    def service(self) -> "SalesServiceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesServiceEndpoint")
+
+    @cached_property
+    def commissions(self) -> "SalesCommissionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesCommissionsEndpoint")
+
+    @cached_property
+    def probabilities(self) -> "SalesProbabilitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesProbabilitiesEndpoint")
+
+    @cached_property
+    def orders(self) -> "SalesOrdersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersEndpoint")
+
+    @cached_property
+    def roles(self) -> "SalesRolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesRolesEndpoint")
+
+    @cached_property
+    def schedule(self) -> "SalesScheduleEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesScheduleEndpoint")
+
+    @cached_property
+    def quotas(self) -> "SalesQuotasEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesQuotasEndpoint")
+
+    @cached_property
+    def opportunities(self) -> "SalesOpportunitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesEndpoint")
+
+    @cached_property
+    def activities(self) -> "SalesActivitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesActivitiesEndpoint")
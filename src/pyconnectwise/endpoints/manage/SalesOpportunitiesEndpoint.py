@@ -1,59 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesCountEndpoint import SalesOpportunitiesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesDefaultEndpoint import SalesOpportunitiesDefaultEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdEndpoint import SalesOpportunitiesIdEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsEndpoint import SalesOpportunitiesRatingsEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesEndpoint import SalesOpportunitiesStatusesEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesTypesEndpoint import SalesOpportunitiesTypesEndpoint
 from pyconnectwise.models.manage import Opportunity
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesCountEndpoint import SalesOpportunitiesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesDefaultEndpoint import SalesOpportunitiesDefaultEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdEndpoint import SalesOpportunitiesIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsEndpoint import SalesOpportunitiesRatingsEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesEndpoint import SalesOpportunitiesStatusesEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesTypesEndpoint import SalesOpportunitiesTypesEndpoint
+
 
 class SalesOpportunitiesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "opportunities", parent_endpoint=parent_endpoint)
+    endpoint_base = "opportunities"
+    _route = "sales/opportunities"
 
-        self.ratings = self._register_child_endpoint(SalesOpportunitiesRatingsEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(SalesOpportunitiesTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SalesOpportunitiesCountEndpoint(client, parent_endpoint=self))
-        self.default = self._register_child_endpoint(SalesOpportunitiesDefaultEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(SalesOpportunitiesStatusesEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOpportunitiesIdEndpoint:
+    def id(self, id: int) -> "SalesOpportunitiesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOpportunitiesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOpportunitiesIdEndpoint: The initialized SalesOpportunitiesIdEndpoint object.
+            SalesOpportunitiesIdEndpoint: The SalesOpportunitiesIdEndpoint view bound to the ID.
         """
-        child = SalesOpportunitiesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOpportunitiesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Opportunity]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Opportunity]:
         """
         Performs a GET request against the /sales/opportunities endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Opportunity]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Opportunity,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Opportunity, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Opportunity]:
         """
@@ -65,7 +58,7 @@ class SalesOpportunitiesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Opportunity]: The parsed response data.
         """
-        return self._parse_many(Opportunity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Opportunity, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Opportunity:
         """
@@ -77,4 +70,24 @@ class SalesOpportunitiesEndpoint(ConnectWiseEndpoint):
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def ratings(self) -> "SalesOpportunitiesRatingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsEndpoint")
+
+    @cached_property
+    def types(self) -> "SalesOpportunitiesTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesOpportunitiesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesCountEndpoint")
+
+    @cached_property
+    def default(self) -> "SalesOpportunitiesDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesDefaultEndpoint")
+
+    @cached_property
+    def statuses(self) -> "SalesOpportunitiesStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesEndpoint")
@@ -1,67 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdContactsEndpoint import SalesOpportunitiesIdContactsEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoagreementEndpoint import \
-    SalesOpportunitiesIdConverttoagreementEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoprojectEndpoint import \
-    SalesOpportunitiesIdConverttoprojectEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttosalesorderEndpoint import \
-    SalesOpportunitiesIdConverttosalesorderEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoserviceticketEndpoint import \
-    SalesOpportunitiesIdConverttoserviceticketEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastEndpoint import SalesOpportunitiesIdForecastEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdNotesEndpoint import SalesOpportunitiesIdNotesEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamEndpoint import SalesOpportunitiesIdTeamEndpoint
 from pyconnectwise.models.manage import Opportunity
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdContactsEndpoint import SalesOpportunitiesIdContactsEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoagreementEndpoint import \
+        SalesOpportunitiesIdConverttoagreementEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoprojectEndpoint import \
+        SalesOpportunitiesIdConverttoprojectEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttosalesorderEndpoint import \
+        SalesOpportunitiesIdConverttosalesorderEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoserviceticketEndpoint import \
+        SalesOpportunitiesIdConverttoserviceticketEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastEndpoint import SalesOpportunitiesIdForecastEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdNotesEndpoint import SalesOpportunitiesIdNotesEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamEndpoint import SalesOpportunitiesIdTeamEndpoint
+
 
 class SalesOpportunitiesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "sales/opportunities/{id}"
 
-        self.forecast = self._register_child_endpoint(
-            SalesOpportunitiesIdForecastEndpoint(client, parent_endpoint=self)
-        )
-        self.convert_to_sales_order = self._register_child_endpoint(
-            SalesOpportunitiesIdConverttosalesorderEndpoint(client, parent_endpoint=self)
-        )
-        self.notes = self._register_child_endpoint(SalesOpportunitiesIdNotesEndpoint(client, parent_endpoint=self))
-        self.convert_to_service_ticket = self._register_child_endpoint(
-            SalesOpportunitiesIdConverttoserviceticketEndpoint(client, parent_endpoint=self)
-        )
-        self.convert_to_project = self._register_child_endpoint(
-            SalesOpportunitiesIdConverttoprojectEndpoint(client, parent_endpoint=self)
-        )
-        self.contacts = self._register_child_endpoint(
-            SalesOpportunitiesIdContactsEndpoint(client, parent_endpoint=self)
-        )
-        self.team = self._register_child_endpoint(SalesOpportunitiesIdTeamEndpoint(client, parent_endpoint=self))
-        self.convert_to_agreement = self._register_child_endpoint(
-            SalesOpportunitiesIdConverttoagreementEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Opportunity]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Opportunity]:
         """
         Performs a GET request against the /sales/opportunities/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Opportunity]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Opportunity,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Opportunity, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Opportunity:
         """
@@ -73,7 +53,7 @@ class SalesOpportunitiesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -95,7 +75,7 @@ class SalesOpportunitiesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Opportunity:
         """
@@ -107,4 +87,44 @@ class SalesOpportunitiesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def forecast(self) -> "SalesOpportunitiesIdForecastEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastEndpoint")
+
+    @cached_property
+    def convert_to_sales_order(self) -> "SalesOpportunitiesIdConverttosalesorderEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttosalesorderEndpoint"
+        )
+
+    @cached_property
+    def notes(self) -> "SalesOpportunitiesIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesIdNotesEndpoint")
+
+    @cached_property
+    def convert_to_service_ticket(self) -> "SalesOpportunitiesIdConverttoserviceticketEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoserviceticketEndpoint"
+        )
+
+    @cached_property
+    def convert_to_project(self) -> "SalesOpportunitiesIdConverttoprojectEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoprojectEndpoint"
+        )
+
+    @cached_property
+    def contacts(self) -> "SalesOpportunitiesIdContactsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesIdContactsEndpoint")
+
+    @cached_property
+    def team(self) -> "SalesOpportunitiesIdTeamEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamEndpoint")
+
+    @cached_property
+    def convert_to_agreement(self) -> "SalesOpportunitiesIdConverttoagreementEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SalesOpportunitiesIdConverttoagreementEndpoint"
+        )
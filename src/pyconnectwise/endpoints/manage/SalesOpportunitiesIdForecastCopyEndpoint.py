@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCopyIdEndpoint import \
-    SalesOpportunitiesIdForecastCopyIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCopyIdEndpoint import \
+        SalesOpportunitiesIdForecastCopyIdEndpoint
+
 
 class SalesOpportunitiesIdForecastCopyEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "copy"
+    _route = "sales/opportunities/{id}/forecast/copy"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "copy", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOpportunitiesIdForecastCopyIdEndpoint:
+    def id(self, id: int) -> "SalesOpportunitiesIdForecastCopyIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdForecastCopyIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOpportunitiesIdForecastCopyIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOpportunitiesIdForecastCopyIdEndpoint: The initialized SalesOpportunitiesIdForecastCopyIdEndpoint object.
+            SalesOpportunitiesIdForecastCopyIdEndpoint: The SalesOpportunitiesIdForecastCopyIdEndpoint view bound to the ID.
         """
-        child = SalesOpportunitiesIdForecastCopyIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCopyIdEndpoint", id)
@@ -1,59 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCopyEndpoint import \
-    SalesOpportunitiesIdForecastCopyEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCountEndpoint import \
-    SalesOpportunitiesIdForecastCountEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastIdEndpoint import SalesOpportunitiesIdForecastIdEndpoint
 from pyconnectwise.models.manage import Forecast
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCopyEndpoint import \
+        SalesOpportunitiesIdForecastCopyEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCountEndpoint import \
+        SalesOpportunitiesIdForecastCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastIdEndpoint import \
+        SalesOpportunitiesIdForecastIdEndpoint
+
 
 class SalesOpportunitiesIdForecastEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "forecast", parent_endpoint=parent_endpoint)
+    endpoint_base = "forecast"
+    _route = "sales/opportunities/{id}/forecast"
 
-        self.copy = self._register_child_endpoint(
-            SalesOpportunitiesIdForecastCopyEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            SalesOpportunitiesIdForecastCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOpportunitiesIdForecastIdEndpoint:
+    def id(self, id: int) -> "SalesOpportunitiesIdForecastIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdForecastIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOpportunitiesIdForecastIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOpportunitiesIdForecastIdEndpoint: The initialized SalesOpportunitiesIdForecastIdEndpoint object.
+            SalesOpportunitiesIdForecastIdEndpoint: The SalesOpportunitiesIdForecastIdEndpoint view bound to the ID.
         """
-        child = SalesOpportunitiesIdForecastIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Forecast]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Forecast]:
         """
         Performs a GET request against the /sales/opportunities/{id}/forecast endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Forecast]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Forecast,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Forecast, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Forecast]:
         """
@@ -65,7 +58,7 @@ class SalesOpportunitiesIdForecastEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Forecast]: The parsed response data.
         """
-        return self._parse_many(Forecast, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Forecast, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Forecast:
         """
@@ -77,4 +70,12 @@ class SalesOpportunitiesIdForecastEndpoint(ConnectWiseEndpoint):
         Returns:
             Forecast: The parsed response data.
         """
-        return self._parse_one(Forecast, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Forecast, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> "SalesOpportunitiesIdForecastCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCopyEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesOpportunitiesIdForecastCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesIdForecastCountEndpoint")
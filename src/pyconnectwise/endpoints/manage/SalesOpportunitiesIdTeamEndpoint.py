@@ -1,51 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamCountEndpoint import SalesOpportunitiesIdTeamCountEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamIdEndpoint import SalesOpportunitiesIdTeamIdEndpoint
 from pyconnectwise.models.manage import Team
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamCountEndpoint import \
+        SalesOpportunitiesIdTeamCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamIdEndpoint import SalesOpportunitiesIdTeamIdEndpoint
+
 
 class SalesOpportunitiesIdTeamEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "team", parent_endpoint=parent_endpoint)
+    endpoint_base = "team"
+    _route = "sales/opportunities/{id}/team"
 
-        self.count = self._register_child_endpoint(SalesOpportunitiesIdTeamCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOpportunitiesIdTeamIdEndpoint:
+    def id(self, id: int) -> "SalesOpportunitiesIdTeamIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdTeamIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOpportunitiesIdTeamIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOpportunitiesIdTeamIdEndpoint: The initialized SalesOpportunitiesIdTeamIdEndpoint object.
+            SalesOpportunitiesIdTeamIdEndpoint: The SalesOpportunitiesIdTeamIdEndpoint view bound to the ID.
         """
-        child = SalesOpportunitiesIdTeamIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Team]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Team]:
         """
         Performs a GET request against the /sales/opportunities/{id}/team endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Team]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Team,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Team, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Team]:
         """
@@ -57,7 +55,7 @@ class SalesOpportunitiesIdTeamEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Team]: The parsed response data.
         """
-        return self._parse_many(Team, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Team, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Team:
         """
@@ -69,4 +67,8 @@ class SalesOpportunitiesIdTeamEndpoint(ConnectWiseEndpoint):
         Returns:
             Team: The parsed response data.
         """
-        return self._parse_one(Team, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Team, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SalesOpportunitiesIdTeamCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesIdTeamCountEndpoint")
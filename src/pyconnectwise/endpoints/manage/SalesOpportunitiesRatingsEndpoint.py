@@ -1,55 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsCountEndpoint import SalesOpportunitiesRatingsCountEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsIdEndpoint import SalesOpportunitiesRatingsIdEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsInfoEndpoint import SalesOpportunitiesRatingsInfoEndpoint
 from pyconnectwise.models.manage import OpportunityRating
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsCountEndpoint import \
+        SalesOpportunitiesRatingsCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsIdEndpoint import SalesOpportunitiesRatingsIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsInfoEndpoint import \
+        SalesOpportunitiesRatingsInfoEndpoint
+
 
 class SalesOpportunitiesRatingsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "ratings", parent_endpoint=parent_endpoint)
+    endpoint_base = "ratings"
+    _route = "sales/opportunities/ratings"
 
-        self.info = self._register_child_endpoint(SalesOpportunitiesRatingsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SalesOpportunitiesRatingsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOpportunitiesRatingsIdEndpoint:
+    def id(self, id: int) -> "SalesOpportunitiesRatingsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesRatingsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOpportunitiesRatingsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOpportunitiesRatingsIdEndpoint: The initialized SalesOpportunitiesRatingsIdEndpoint object.
+            SalesOpportunitiesRatingsIdEndpoint: The SalesOpportunitiesRatingsIdEndpoint view bound to the ID.
         """
-        child = SalesOpportunitiesRatingsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[OpportunityRating]:
         """
         Performs a GET request against the /sales/opportunities/ratings endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[OpportunityRating]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            OpportunityRating,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(OpportunityRating, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OpportunityRating]:
         """
@@ -61,7 +57,7 @@ class SalesOpportunitiesRatingsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[OpportunityRating]: The parsed response data.
         """
-        return self._parse_many(OpportunityRating, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityRating, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OpportunityRating:
         """
@@ -73,4 +69,12 @@ class SalesOpportunitiesRatingsEndpoint(ConnectWiseEndpoint):
         Returns:
             OpportunityRating: The parsed response data.
         """
-        return self._parse_one(OpportunityRating, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityRating, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SalesOpportunitiesRatingsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesOpportunitiesRatingsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesRatingsCountEndpoint")
@@ -1,58 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesCountEndpoint import \
-    SalesOpportunitiesStatusesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesIdEndpoint import SalesOpportunitiesStatusesIdEndpoint
-from pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesInfoEndpoint import SalesOpportunitiesStatusesInfoEndpoint
 from pyconnectwise.models.manage import OpportunityStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesCountEndpoint import \
+        SalesOpportunitiesStatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesIdEndpoint import SalesOpportunitiesStatusesIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesInfoEndpoint import \
+        SalesOpportunitiesStatusesInfoEndpoint
+
 
 class SalesOpportunitiesStatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "statuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "statuses"
+    _route = "sales/opportunities/statuses"
 
-        self.info = self._register_child_endpoint(SalesOpportunitiesStatusesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(
-            SalesOpportunitiesStatusesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOpportunitiesStatusesIdEndpoint:
+    def id(self, id: int) -> "SalesOpportunitiesStatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesStatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOpportunitiesStatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOpportunitiesStatusesIdEndpoint: The initialized SalesOpportunitiesStatusesIdEndpoint object.
+            SalesOpportunitiesStatusesIdEndpoint: The SalesOpportunitiesStatusesIdEndpoint view bound to the ID.
         """
-        child = SalesOpportunitiesStatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[OpportunityStatus]:
         """
         Performs a GET request against the /sales/opportunities/statuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[OpportunityStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            OpportunityStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(OpportunityStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OpportunityStatus]:
         """
@@ -64,7 +57,7 @@ class SalesOpportunitiesStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[OpportunityStatus]: The parsed response data.
         """
-        return self._parse_many(OpportunityStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OpportunityStatus:
         """
@@ -76,4 +69,12 @@ class SalesOpportunitiesStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             OpportunityStatus: The parsed response data.
         """
-        return self._parse_one(OpportunityStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SalesOpportunitiesStatusesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesOpportunitiesStatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOpportunitiesStatusesCountEndpoint")
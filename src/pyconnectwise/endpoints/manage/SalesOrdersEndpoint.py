@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersCountEndpoint import SalesOrdersCountEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersIdEndpoint import SalesOrdersIdEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesEndpoint import SalesOrdersStatusesEndpoint
 from pyconnectwise.models.manage import Order
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOrdersCountEndpoint import SalesOrdersCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersIdEndpoint import SalesOrdersIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesEndpoint import SalesOrdersStatusesEndpoint
+
 
 class SalesOrdersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "orders", parent_endpoint=parent_endpoint)
+    endpoint_base = "orders"
+    _route = "sales/orders"
 
-        self.count = self._register_child_endpoint(SalesOrdersCountEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(SalesOrdersStatusesEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOrdersIdEndpoint:
+    def id(self, id: int) -> "SalesOrdersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOrdersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOrdersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOrdersIdEndpoint: The initialized SalesOrdersIdEndpoint object.
+            SalesOrdersIdEndpoint: The SalesOrdersIdEndpoint view bound to the ID.
         """
-        child = SalesOrdersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOrdersIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Order]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Order]:
         """
         Performs a GET request against the /sales/orders endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Order]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Order,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Order, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Order]:
         """
@@ -59,7 +55,7 @@ class SalesOrdersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Order]: The parsed response data.
         """
-        return self._parse_many(Order, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Order, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Order:
         """
@@ -71,4 +67,12 @@ class SalesOrdersEndpoint(ConnectWiseEndpoint):
         Returns:
             Order: The parsed response data.
         """
-        return self._parse_one(Order, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Order, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SalesOrdersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersCountEndpoint")
+
+    @cached_property
+    def statuses(self) -> "SalesOrdersStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersStatusesEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesCountEndpoint import SalesOrdersStatusesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEndpoint import SalesOrdersStatusesIdEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesInfoEndpoint import SalesOrdersStatusesInfoEndpoint
 from pyconnectwise.models.manage import OrderStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesCountEndpoint import SalesOrdersStatusesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEndpoint import SalesOrdersStatusesIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesInfoEndpoint import SalesOrdersStatusesInfoEndpoint
+
 
 class SalesOrdersStatusesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "statuses", parent_endpoint=parent_endpoint)
+    endpoint_base = "statuses"
+    _route = "sales/orders/statuses"
 
-        self.info = self._register_child_endpoint(SalesOrdersStatusesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SalesOrdersStatusesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOrdersStatusesIdEndpoint:
+    def id(self, id: int) -> "SalesOrdersStatusesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOrdersStatusesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOrdersStatusesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOrdersStatusesIdEndpoint: The initialized SalesOrdersStatusesIdEndpoint object.
+            SalesOrdersStatusesIdEndpoint: The SalesOrdersStatusesIdEndpoint view bound to the ID.
         """
-        child = SalesOrdersStatusesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[OrderStatus]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[OrderStatus]:
         """
         Performs a GET request against the /sales/orders/statuses endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[OrderStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            OrderStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(OrderStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OrderStatus]:
         """
@@ -59,7 +55,7 @@ class SalesOrdersStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[OrderStatus]: The parsed response data.
         """
-        return self._parse_many(OrderStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OrderStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OrderStatus]:
         """
@@ -71,4 +67,12 @@ class SalesOrdersStatusesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[OrderStatus]: The parsed response data.
         """
-        return self._parse_many(OrderStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_many(OrderStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SalesOrdersStatusesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersStatusesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesOrdersStatusesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersStatusesCountEndpoint")
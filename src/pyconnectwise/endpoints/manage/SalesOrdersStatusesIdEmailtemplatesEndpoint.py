@@ -1,30 +1,36 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesCountEndpoint import \
-    SalesOrdersStatusesIdEmailtemplatesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesIdEndpoint import \
-    SalesOrdersStatusesIdEmailtemplatesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesCountEndpoint import \
+        SalesOrdersStatusesIdEmailtemplatesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesIdEndpoint import \
+        SalesOrdersStatusesIdEmailtemplatesIdEndpoint
+
 
 class SalesOrdersStatusesIdEmailtemplatesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "emailtemplates", parent_endpoint=parent_endpoint)
+    endpoint_base = "emailtemplates"
+    _route = "sales/orders/statuses/{id}/emailtemplates"
 
-        self.count = self._register_child_endpoint(
-            SalesOrdersStatusesIdEmailtemplatesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesOrdersStatusesIdEmailtemplatesIdEndpoint:
+    def id(self, id: int) -> "SalesOrdersStatusesIdEmailtemplatesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesOrdersStatusesIdEmailtemplatesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesOrdersStatusesIdEmailtemplatesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesOrdersStatusesIdEmailtemplatesIdEndpoint: The initialized SalesOrdersStatusesIdEmailtemplatesIdEndpoint object.
+            SalesOrdersStatusesIdEmailtemplatesIdEndpoint: The SalesOrdersStatusesIdEmailtemplatesIdEndpoint view bound to the ID.
         """
-        child = SalesOrdersStatusesIdEmailtemplatesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "SalesOrdersStatusesIdEmailtemplatesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesCountEndpoint"
+        )
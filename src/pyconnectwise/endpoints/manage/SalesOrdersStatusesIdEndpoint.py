@@ -1,49 +1,41 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesEndpoint import \
-    SalesOrdersStatusesIdEmailtemplatesEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdInfoEndpoint import SalesOrdersStatusesIdInfoEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdNotificationsEndpoint import \
-    SalesOrdersStatusesIdNotificationsEndpoint
-from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdUsagesEndpoint import SalesOrdersStatusesIdUsagesEndpoint
 from pyconnectwise.models.manage import OrderStatus
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesEndpoint import \
+        SalesOrdersStatusesIdEmailtemplatesEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdInfoEndpoint import SalesOrdersStatusesIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdNotificationsEndpoint import \
+        SalesOrdersStatusesIdNotificationsEndpoint
+    from pyconnectwise.endpoints.manage.SalesOrdersStatusesIdUsagesEndpoint import SalesOrdersStatusesIdUsagesEndpoint
+
 
 class SalesOrdersStatusesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "sales/orders/statuses/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
-
-        self.usages = self._register_child_endpoint(SalesOrdersStatusesIdUsagesEndpoint(client, parent_endpoint=self))
-        self.emailtemplates = self._register_child_endpoint(
-            SalesOrdersStatusesIdEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.notifications = self._register_child_endpoint(
-            SalesOrdersStatusesIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(SalesOrdersStatusesIdInfoEndpoint(client, parent_endpoint=self))
-
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[OrderStatus]:
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[OrderStatus]:
         """
         Performs a GET request against the /sales/orders/statuses/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[OrderStatus]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            OrderStatus,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(OrderStatus, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OrderStatus:
         """
@@ -55,7 +47,7 @@ class SalesOrdersStatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             OrderStatus: The parsed response data.
         """
-        return self._parse_one(OrderStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OrderStatus, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -77,7 +69,7 @@ class SalesOrdersStatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             OrderStatus: The parsed response data.
         """
-        return self._parse_one(OrderStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OrderStatus, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OrderStatus:
         """
@@ -89,4 +81,20 @@ class SalesOrdersStatusesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             OrderStatus: The parsed response data.
         """
-        return self._parse_one(OrderStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(OrderStatus, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "SalesOrdersStatusesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersStatusesIdUsagesEndpoint")
+
+    @cached_property
+    def emailtemplates(self) -> "SalesOrdersStatusesIdEmailtemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersStatusesIdEmailtemplatesEndpoint")
+
+    @cached_property
+    def notifications(self) -> "SalesOrdersStatusesIdNotificationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersStatusesIdNotificationsEndpoint")
+
+    @cached_property
+    def info(self) -> "SalesOrdersStatusesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesOrdersStatusesIdInfoEndpoint")
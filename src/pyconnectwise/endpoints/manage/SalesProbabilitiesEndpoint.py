@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesProbabilitiesCountEndpoint import SalesProbabilitiesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesProbabilitiesIdEndpoint import SalesProbabilitiesIdEndpoint
-from pyconnectwise.endpoints.manage.SalesProbabilitiesInfoEndpoint import SalesProbabilitiesInfoEndpoint
 from pyconnectwise.models.manage import SalesProbability
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesProbabilitiesCountEndpoint import SalesProbabilitiesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesProbabilitiesIdEndpoint import SalesProbabilitiesIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesProbabilitiesInfoEndpoint import SalesProbabilitiesInfoEndpoint
+
 
 class SalesProbabilitiesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "probabilities", parent_endpoint=parent_endpoint)
+    endpoint_base = "probabilities"
+    _route = "sales/probabilities"
 
-        self.info = self._register_child_endpoint(SalesProbabilitiesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SalesProbabilitiesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesProbabilitiesIdEndpoint:
+    def id(self, id: int) -> "SalesProbabilitiesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesProbabilitiesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesProbabilitiesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesProbabilitiesIdEndpoint: The initialized SalesProbabilitiesIdEndpoint object.
+            SalesProbabilitiesIdEndpoint: The SalesProbabilitiesIdEndpoint view bound to the ID.
         """
-        child = SalesProbabilitiesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesProbabilitiesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[SalesProbability]:
         """
         Performs a GET request against the /sales/probabilities endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SalesProbability]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SalesProbability,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SalesProbability, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SalesProbability]:
         """
@@ -61,7 +55,7 @@ class SalesProbabilitiesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SalesProbability]: The parsed response data.
         """
-        return self._parse_many(SalesProbability, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SalesProbability, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SalesProbability:
         """
@@ -73,4 +67,12 @@ class SalesProbabilitiesEndpoint(ConnectWiseEndpoint):
         Returns:
             SalesProbability: The parsed response data.
         """
-        return self._parse_one(SalesProbability, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SalesProbability, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SalesProbabilitiesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesProbabilitiesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesProbabilitiesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesProbabilitiesCountEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesQuotasCountEndpoint import SalesQuotasCountEndpoint
-from pyconnectwise.endpoints.manage.SalesQuotasIdEndpoint import SalesQuotasIdEndpoint
 from pyconnectwise.models.manage import SalesQuota
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesQuotasCountEndpoint import SalesQuotasCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesQuotasIdEndpoint import SalesQuotasIdEndpoint
+
 
 class SalesQuotasEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "quotas", parent_endpoint=parent_endpoint)
+    endpoint_base = "quotas"
+    _route = "sales/quotas"
 
-        self.count = self._register_child_endpoint(SalesQuotasCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesQuotasIdEndpoint:
+    def id(self, id: int) -> "SalesQuotasIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesQuotasIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesQuotasIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesQuotasIdEndpoint: The initialized SalesQuotasIdEndpoint object.
+            SalesQuotasIdEndpoint: The SalesQuotasIdEndpoint view bound to the ID.
         """
-        child = SalesQuotasIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesQuotasIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[SalesQuota]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[SalesQuota]:
         """
         Performs a GET request against the /sales/quotas endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SalesQuota]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SalesQuota,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SalesQuota, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SalesQuota]:
         """
@@ -57,7 +54,7 @@ class SalesQuotasEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SalesQuota]: The parsed response data.
         """
-        return self._parse_many(SalesQuota, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SalesQuota, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SalesQuota:
         """
@@ -69,4 +66,8 @@ class SalesQuotasEndpoint(ConnectWiseEndpoint):
         Returns:
             SalesQuota: The parsed response data.
         """
-        return self._parse_one(SalesQuota, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SalesQuota, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SalesQuotasCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesQuotasCountEndpoint")
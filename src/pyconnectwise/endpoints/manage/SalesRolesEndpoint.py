@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesRolesCountEndpoint import SalesRolesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesRolesIdEndpoint import SalesRolesIdEndpoint
 from pyconnectwise.models.manage import Role
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesRolesCountEndpoint import SalesRolesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesRolesIdEndpoint import SalesRolesIdEndpoint
+
 
 class SalesRolesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "roles", parent_endpoint=parent_endpoint)
+    endpoint_base = "roles"
+    _route = "sales/roles"
 
-        self.count = self._register_child_endpoint(SalesRolesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesRolesIdEndpoint:
+    def id(self, id: int) -> "SalesRolesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesRolesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesRolesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesRolesIdEndpoint: The initialized SalesRolesIdEndpoint object.
+            SalesRolesIdEndpoint: The SalesRolesIdEndpoint view bound to the ID.
         """
-        child = SalesRolesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesRolesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Role]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Role]:
         """
         Performs a GET request against the /sales/roles endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Role]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Role,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Role, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Role]:
         """
@@ -57,7 +54,7 @@ class SalesRolesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Role]: The parsed response data.
         """
-        return self._parse_many(Role, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Role, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Role:
         """
@@ -69,4 +66,8 @@ class SalesRolesEndpoint(ConnectWiseEndpoint):
         Returns:
             Role: The parsed response data.
         """
-        return self._parse_one(Role, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Role, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SalesRolesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesRolesCountEndpoint")
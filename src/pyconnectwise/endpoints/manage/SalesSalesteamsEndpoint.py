@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesSalesteamsCountEndpoint import SalesSalesteamsCountEndpoint
-from pyconnectwise.endpoints.manage.SalesSalesteamsIdEndpoint import SalesSalesteamsIdEndpoint
 from pyconnectwise.models.manage import SalesTeam
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesSalesteamsCountEndpoint import SalesSalesteamsCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesSalesteamsIdEndpoint import SalesSalesteamsIdEndpoint
+
 
 class SalesSalesteamsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "salesTeams", parent_endpoint=parent_endpoint)
+    endpoint_base = "salesTeams"
+    _route = "sales/salesTeams"
 
-        self.count = self._register_child_endpoint(SalesSalesteamsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesSalesteamsIdEndpoint:
+    def id(self, id: int) -> "SalesSalesteamsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesSalesteamsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesSalesteamsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesSalesteamsIdEndpoint: The initialized SalesSalesteamsIdEndpoint object.
+            SalesSalesteamsIdEndpoint: The SalesSalesteamsIdEndpoint view bound to the ID.
         """
-        child = SalesSalesteamsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesSalesteamsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[SalesTeam]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[SalesTeam]:
         """
         Performs a GET request against the /sales/salesTeams endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SalesTeam]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SalesTeam,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SalesTeam, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SalesTeam]:
         """
@@ -57,7 +54,7 @@ class SalesSalesteamsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SalesTeam]: The parsed response data.
         """
-        return self._parse_many(SalesTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SalesTeam, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SalesTeam:
         """
@@ -69,4 +66,8 @@ class SalesSalesteamsEndpoint(ConnectWiseEndpoint):
         Returns:
             SalesTeam: The parsed response data.
         """
-        return self._parse_one(SalesTeam, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SalesTeam, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SalesSalesteamsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesSalesteamsCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesSalesteamsIdMembersCountEndpoint import SalesSalesteamsIdMembersCountEndpoint
-from pyconnectwise.endpoints.manage.SalesSalesteamsIdMembersIdEndpoint import SalesSalesteamsIdMembersIdEndpoint
 from pyconnectwise.models.manage import SalesTeamMember
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesSalesteamsIdMembersCountEndpoint import \
+        SalesSalesteamsIdMembersCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesSalesteamsIdMembersIdEndpoint import SalesSalesteamsIdMembersIdEndpoint
+
 
 class SalesSalesteamsIdMembersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "members", parent_endpoint=parent_endpoint)
+    endpoint_base = "members"
+    _route = "sales/salesTeams/{id}/members"
 
-        self.count = self._register_child_endpoint(SalesSalesteamsIdMembersCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesSalesteamsIdMembersIdEndpoint:
+    def id(self, id: int) -> "SalesSalesteamsIdMembersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesSalesteamsIdMembersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesSalesteamsIdMembersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesSalesteamsIdMembersIdEndpoint: The initialized SalesSalesteamsIdMembersIdEndpoint object.
+            SalesSalesteamsIdMembersIdEndpoint: The SalesSalesteamsIdMembersIdEndpoint view bound to the ID.
         """
-        child = SalesSalesteamsIdMembersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesSalesteamsIdMembersIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[SalesTeamMember]:
         """
         Performs a GET request against the /sales/salesTeams/{id}/members endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SalesTeamMember]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SalesTeamMember,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SalesTeamMember, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SalesTeamMember]:
         """
@@ -59,7 +55,7 @@ class SalesSalesteamsIdMembersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SalesTeamMember]: The parsed response data.
         """
-        return self._parse_many(SalesTeamMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SalesTeamMember, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SalesTeamMember:
         """
@@ -71,4 +67,8 @@ class SalesSalesteamsIdMembersEndpoint(ConnectWiseEndpoint):
         Returns:
             SalesTeamMember: The parsed response data.
         """
-        return self._parse_one(SalesTeamMember, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SalesTeamMember, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SalesSalesteamsIdMembersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesSalesteamsIdMembersCountEndpoint")
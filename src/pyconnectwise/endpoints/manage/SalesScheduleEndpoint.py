@@ -1,14 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsEndpoint import SalesScheduleHolidaylistsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsEndpoint import SalesScheduleHolidaylistsEndpoint
+
 
 class SalesScheduleEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "schedule"
+    _route = "sales/schedule"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "schedule", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.holidaylists = self._register_child_endpoint(
-            SalesScheduleHolidaylistsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def holidaylists(self) -> "SalesScheduleHolidaylistsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsEndpoint")
@@ -1,26 +1,33 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdEndpoint import SalesScheduleHolidaylistsIdEndpoint
-from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsInfoEndpoint import SalesScheduleHolidaylistsInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdEndpoint import SalesScheduleHolidaylistsIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsInfoEndpoint import \
+        SalesScheduleHolidaylistsInfoEndpoint
+
 
 class SalesScheduleHolidaylistsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "holidaylists", parent_endpoint=parent_endpoint)
+    endpoint_base = "holidaylists"
+    _route = "sales/schedule/holidaylists"
 
-        self.info = self._register_child_endpoint(SalesScheduleHolidaylistsInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesScheduleHolidaylistsIdEndpoint:
+    def id(self, id: int) -> "SalesScheduleHolidaylistsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesScheduleHolidaylistsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesScheduleHolidaylistsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesScheduleHolidaylistsIdEndpoint: The initialized SalesScheduleHolidaylistsIdEndpoint object.
+            SalesScheduleHolidaylistsIdEndpoint: The SalesScheduleHolidaylistsIdEndpoint view bound to the ID.
         """
-        child = SalesScheduleHolidaylistsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "SalesScheduleHolidaylistsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsInfoEndpoint")
@@ -1,15 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdHolidaysEndpoint import \
-    SalesScheduleHolidaylistsIdHolidaysEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdHolidaysEndpoint import \
+        SalesScheduleHolidaylistsIdHolidaysEndpoint
+
 
 class SalesScheduleHolidaylistsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "sales/schedule/holidaylists/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.holidays = self._register_child_endpoint(
-            SalesScheduleHolidaylistsIdHolidaysEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def holidays(self) -> "SalesScheduleHolidaylistsIdHolidaysEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdHolidaysEndpoint")
@@ -1,15 +1,23 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdHolidaysInfoEndpoint import \
-    SalesScheduleHolidaylistsIdHolidaysInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdHolidaysInfoEndpoint import \
+        SalesScheduleHolidaylistsIdHolidaysInfoEndpoint
+
 
 class SalesScheduleHolidaylistsIdHolidaysEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "holidays"
+    _route = "sales/schedule/holidaylists/{id}/holidays"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "holidays", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(
-            SalesScheduleHolidaylistsIdHolidaysInfoEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def info(self) -> "SalesScheduleHolidaylistsIdHolidaysInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SalesScheduleHolidaylistsIdHolidaysInfoEndpoint"
         )
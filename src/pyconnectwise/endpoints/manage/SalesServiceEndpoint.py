@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesServicePriorityEndpoint import SalesServicePriorityEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesServicePriorityEndpoint import SalesServicePriorityEndpoint
+
 
 class SalesServiceEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "service"
+    _route = "sales/service"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "service", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.priority = self._register_child_endpoint(SalesServicePriorityEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def priority(self) -> "SalesServicePriorityEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesServicePriorityEndpoint")
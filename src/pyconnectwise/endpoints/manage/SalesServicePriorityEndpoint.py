@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesServicePriorityInfoEndpoint import SalesServicePriorityInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesServicePriorityInfoEndpoint import SalesServicePriorityInfoEndpoint
+
 
 class SalesServicePriorityEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "priority"
+    _route = "sales/service/priority"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "priority", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(SalesServicePriorityInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> "SalesServicePriorityInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesServicePriorityInfoEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SalesStagesCountEndpoint import SalesStagesCountEndpoint
-from pyconnectwise.endpoints.manage.SalesStagesIdEndpoint import SalesStagesIdEndpoint
-from pyconnectwise.endpoints.manage.SalesStagesInfoEndpoint import SalesStagesInfoEndpoint
 from pyconnectwise.models.manage import OpportunityStage
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SalesStagesCountEndpoint import SalesStagesCountEndpoint
+    from pyconnectwise.endpoints.manage.SalesStagesIdEndpoint import SalesStagesIdEndpoint
+    from pyconnectwise.endpoints.manage.SalesStagesInfoEndpoint import SalesStagesInfoEndpoint
+
 
 class SalesStagesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "stages", parent_endpoint=parent_endpoint)
+    endpoint_base = "stages"
+    _route = "sales/stages"
 
-        self.info = self._register_child_endpoint(SalesStagesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SalesStagesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SalesStagesIdEndpoint:
+    def id(self, id: int) -> "SalesStagesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SalesStagesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SalesStagesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SalesStagesIdEndpoint: The initialized SalesStagesIdEndpoint object.
+            SalesStagesIdEndpoint: The SalesStagesIdEndpoint view bound to the ID.
         """
-        child = SalesStagesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SalesStagesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[OpportunityStage]:
         """
         Performs a GET request against the /sales/stages endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[OpportunityStage]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            OpportunityStage,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(OpportunityStage, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OpportunityStage]:
         """
@@ -61,7 +55,7 @@ class SalesStagesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[OpportunityStage]: The parsed response data.
         """
-        return self._parse_many(OpportunityStage, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityStage, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> OpportunityStage:
         """
@@ -73,4 +67,12 @@ class SalesStagesEndpoint(ConnectWiseEndpoint):
         Returns:
             OpportunityStage: The parsed response data.
         """
-        return self._parse_one(OpportunityStage, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityStage, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SalesStagesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesStagesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SalesStagesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SalesStagesCountEndpoint")
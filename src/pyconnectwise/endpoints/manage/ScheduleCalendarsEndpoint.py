@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleCalendarsCountEndpoint import ScheduleCalendarsCountEndpoint
-from pyconnectwise.endpoints.manage.ScheduleCalendarsIdEndpoint import ScheduleCalendarsIdEndpoint
-from pyconnectwise.endpoints.manage.ScheduleCalendarsInfoEndpoint import ScheduleCalendarsInfoEndpoint
 from pyconnectwise.models.manage import Calendar
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleCalendarsCountEndpoint import ScheduleCalendarsCountEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleCalendarsIdEndpoint import ScheduleCalendarsIdEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleCalendarsInfoEndpoint import ScheduleCalendarsInfoEndpoint
+
 
 class ScheduleCalendarsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "calendars", parent_endpoint=parent_endpoint)
+    endpoint_base = "calendars"
+    _route = "schedule/calendars"
 
-        self.info = self._register_child_endpoint(ScheduleCalendarsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ScheduleCalendarsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScheduleCalendarsIdEndpoint:
+    def id(self, id: int) -> "ScheduleCalendarsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScheduleCalendarsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScheduleCalendarsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScheduleCalendarsIdEndpoint: The initialized ScheduleCalendarsIdEndpoint object.
+            ScheduleCalendarsIdEndpoint: The ScheduleCalendarsIdEndpoint view bound to the ID.
         """
-        child = ScheduleCalendarsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ScheduleCalendarsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Calendar]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Calendar]:
         """
         Performs a GET request against the /schedule/calendars endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Calendar]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Calendar,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Calendar, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Calendar]:
         """
@@ -59,7 +55,7 @@ class ScheduleCalendarsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Calendar]: The parsed response data.
         """
-        return self._parse_many(Calendar, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Calendar, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Calendar:
         """
@@ -71,4 +67,12 @@ class ScheduleCalendarsEndpoint(ConnectWiseEndpoint):
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ScheduleCalendarsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleCalendarsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ScheduleCalendarsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleCalendarsCountEndpoint")
@@ -1,41 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleCalendarsIdCopyEndpoint import ScheduleCalendarsIdCopyEndpoint
-from pyconnectwise.endpoints.manage.ScheduleCalendarsIdInfoEndpoint import ScheduleCalendarsIdInfoEndpoint
-from pyconnectwise.endpoints.manage.ScheduleCalendarsIdUsagesEndpoint import ScheduleCalendarsIdUsagesEndpoint
 from pyconnectwise.models.manage import Calendar
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleCalendarsIdCopyEndpoint import ScheduleCalendarsIdCopyEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleCalendarsIdInfoEndpoint import ScheduleCalendarsIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleCalendarsIdUsagesEndpoint import ScheduleCalendarsIdUsagesEndpoint
+
 
 class ScheduleCalendarsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "schedule/calendars/{id}"
 
-        self.copy = self._register_child_endpoint(ScheduleCalendarsIdCopyEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ScheduleCalendarsIdUsagesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ScheduleCalendarsIdInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Calendar]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Calendar]:
         """
         Performs a GET request against the /schedule/calendars/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Calendar]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Calendar,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Calendar, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Calendar:
         """
@@ -47,7 +44,7 @@ class ScheduleCalendarsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Calendar:
         """
@@ -59,7 +56,7 @@ class ScheduleCalendarsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Calendar:
         """
@@ -71,7 +68,7 @@ class ScheduleCalendarsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("PUT", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -82,3 +79,15 @@ class ScheduleCalendarsIdEndpoint(ConnectWiseEndpoint):
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def copy(self) -> "ScheduleCalendarsIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleCalendarsIdCopyEndpoint")
+
+    @cached_property
+    def usages(self) -> "ScheduleCalendarsIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleCalendarsIdUsagesEndpoint")
+
+    @cached_property
+    def info(self) -> "ScheduleCalendarsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleCalendarsIdInfoEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleColorsCountEndpoint import ScheduleColorsCountEndpoint
-from pyconnectwise.endpoints.manage.ScheduleColorsIdEndpoint import ScheduleColorsIdEndpoint
-from pyconnectwise.endpoints.manage.ScheduleColorsResetEndpoint import ScheduleColorsResetEndpoint
 from pyconnectwise.models.manage import ScheduleColor
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleColorsCountEndpoint import ScheduleColorsCountEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleColorsIdEndpoint import ScheduleColorsIdEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleColorsResetEndpoint import ScheduleColorsResetEndpoint
+
 
 class ScheduleColorsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "colors", parent_endpoint=parent_endpoint)
+    endpoint_base = "colors"
+    _route = "schedule/colors"
 
-        self.reset = self._register_child_endpoint(ScheduleColorsResetEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ScheduleColorsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScheduleColorsIdEndpoint:
+    def id(self, id: int) -> "ScheduleColorsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScheduleColorsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScheduleColorsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScheduleColorsIdEndpoint: The initialized ScheduleColorsIdEndpoint object.
+            ScheduleColorsIdEndpoint: The ScheduleColorsIdEndpoint view bound to the ID.
         """
-        child = ScheduleColorsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ScheduleColorsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ScheduleColor]:
         """
         Performs a GET request against the /schedule/colors endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ScheduleColor]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ScheduleColor,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ScheduleColor, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ScheduleColor]:
         """
@@ -61,4 +55,12 @@ class ScheduleColorsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ScheduleColor]: The parsed response data.
         """
-        return self._parse_many(ScheduleColor, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleColor, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def reset(self) -> "ScheduleColorsResetEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleColorsResetEndpoint")
+
+    @cached_property
+    def count(self) -> "ScheduleColorsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleColorsCountEndpoint")
@@ -1,31 +1,64 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleCalendarsEndpoint import ScheduleCalendarsEndpoint
-from pyconnectwise.endpoints.manage.ScheduleColorsEndpoint import ScheduleColorsEndpoint
-from pyconnectwise.endpoints.manage.ScheduleDetailsEndpoint import ScheduleDetailsEndpoint
-from pyconnectwise.endpoints.manage.ScheduleEntriesEndpoint import ScheduleEntriesEndpoint
-from pyconnectwise.endpoints.manage.ScheduleHolidaylistsEndpoint import ScheduleHolidaylistsEndpoint
-from pyconnectwise.endpoints.manage.SchedulePortalcalendarsEndpoint import SchedulePortalcalendarsEndpoint
-from pyconnectwise.endpoints.manage.ScheduleRemindertimesEndpoint import ScheduleRemindertimesEndpoint
-from pyconnectwise.endpoints.manage.ScheduleStatusesEndpoint import ScheduleStatusesEndpoint
-from pyconnectwise.endpoints.manage.ScheduleTypesEndpoint import ScheduleTypesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleCalendarsEndpoint import ScheduleCalendarsEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleColorsEndpoint import ScheduleColorsEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleDetailsEndpoint import ScheduleDetailsEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleEntriesEndpoint import ScheduleEntriesEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleHolidaylistsEndpoint import ScheduleHolidaylistsEndpoint
+    from pyconnectwise.endpoints.manage.SchedulePortalcalendarsEndpoint import SchedulePortalcalendarsEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleRemindertimesEndpoint import ScheduleRemindertimesEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleStatusesEndpoint import ScheduleStatusesEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleTypesEndpoint import ScheduleTypesEndpoint
+
 
 class ScheduleEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "schedule"
+    _route = "schedule"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "schedule", parent_endpoint=parent_endpoint)
-
-        self.holiday_lists = self._register_child_endpoint(ScheduleHolidaylistsEndpoint(client, parent_endpoint=self))
-        self.details = self._register_child_endpoint(ScheduleDetailsEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(ScheduleTypesEndpoint(client, parent_endpoint=self))
-        self.holidaylists = self._register_child_endpoint(ScheduleHolidaylistsEndpoint(client, parent_endpoint=self))
-        self.reminder_times = self._register_child_endpoint(ScheduleRemindertimesEndpoint(client, parent_endpoint=self))
-        self.portalcalendars = self._register_child_endpoint(
-            SchedulePortalcalendarsEndpoint(client, parent_endpoint=self)
-        )
-        self.entries = self._register_child_endpoint(ScheduleEntriesEndpoint(client, parent_endpoint=self))
-        self.colors = self._register_child_endpoint(ScheduleColorsEndpoint(client, parent_endpoint=self))
-        self.calendars = self._register_child_endpoint(ScheduleCalendarsEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(ScheduleStatusesEndpoint(client, parent_endpoint=self))
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def holiday_lists(self) -> "ScheduleHolidaylistsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleHolidaylistsEndpoint")
+
+    @cached_property
+    def details(self) -> "ScheduleDetailsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleDetailsEndpoint")
+
+    @cached_property
+    def types(self) -> "ScheduleTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleTypesEndpoint")
+
+    @cached_property
+    def holidaylists(self) -> "ScheduleHolidaylistsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleHolidaylistsEndpoint")
+
+    @cached_property
+    def reminder_times(self) -> "ScheduleRemindertimesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleRemindertimesEndpoint")
+
+    @cached_property
+    def portalcalendars(self) -> "SchedulePortalcalendarsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SchedulePortalcalendarsEndpoint")
+
+    @cached_property
+    def entries(self) -> "ScheduleEntriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleEntriesEndpoint")
+
+    @cached_property
+    def colors(self) -> "ScheduleColorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleColorsEndpoint")
+
+    @cached_property
+    def calendars(self) -> "ScheduleCalendarsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleCalendarsEndpoint")
+
+    @cached_property
+    def statuses(self) -> "ScheduleStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleStatusesEndpoint")
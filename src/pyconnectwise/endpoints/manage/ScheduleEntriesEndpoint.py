@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleEntriesCountEndpoint import ScheduleEntriesCountEndpoint
-from pyconnectwise.endpoints.manage.ScheduleEntriesIdEndpoint import ScheduleEntriesIdEndpoint
 from pyconnectwise.models.manage import ScheduleEntry
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleEntriesCountEndpoint import ScheduleEntriesCountEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleEntriesIdEndpoint import ScheduleEntriesIdEndpoint
+
 
 class ScheduleEntriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "entries", parent_endpoint=parent_endpoint)
+    endpoint_base = "entries"
+    _route = "schedule/entries"
 
-        self.count = self._register_child_endpoint(ScheduleEntriesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScheduleEntriesIdEndpoint:
+    def id(self, id: int) -> "ScheduleEntriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScheduleEntriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScheduleEntriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScheduleEntriesIdEndpoint: The initialized ScheduleEntriesIdEndpoint object.
+            ScheduleEntriesIdEndpoint: The ScheduleEntriesIdEndpoint view bound to the ID.
         """
-        child = ScheduleEntriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ScheduleEntriesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ScheduleEntry]:
         """
         Performs a GET request against the /schedule/entries endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ScheduleEntry]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ScheduleEntry,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ScheduleEntry, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ScheduleEntry]:
         """
@@ -59,7 +54,7 @@ class ScheduleEntriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ScheduleEntry]: The parsed response data.
         """
-        return self._parse_many(ScheduleEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleEntry, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ScheduleEntry:
         """
@@ -71,4 +66,8 @@ class ScheduleEntriesEndpoint(ConnectWiseEndpoint):
         Returns:
             ScheduleEntry: The parsed response data.
         """
-        return self._parse_one(ScheduleEntry, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ScheduleEntry, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ScheduleEntriesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleEntriesCountEndpoint")
@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdEndpoint import ScheduleHolidaylistsIdEndpoint
-from pyconnectwise.endpoints.manage.ScheduleHolidaylistsInfoEndpoint import ScheduleHolidaylistsInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdEndpoint import ScheduleHolidaylistsIdEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleHolidaylistsInfoEndpoint import ScheduleHolidaylistsInfoEndpoint
+
 
 class ScheduleHolidaylistsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "holidaylists", parent_endpoint=parent_endpoint)
+    endpoint_base = "holidaylists"
+    _route = "schedule/holidaylists"
 
-        self.info = self._register_child_endpoint(ScheduleHolidaylistsInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScheduleHolidaylistsIdEndpoint:
+    def id(self, id: int) -> "ScheduleHolidaylistsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScheduleHolidaylistsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScheduleHolidaylistsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScheduleHolidaylistsIdEndpoint: The initialized ScheduleHolidaylistsIdEndpoint object.
+            ScheduleHolidaylistsIdEndpoint: The ScheduleHolidaylistsIdEndpoint view bound to the ID.
         """
-        child = ScheduleHolidaylistsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ScheduleHolidaylistsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleHolidaylistsInfoEndpoint")
@@ -1,16 +1,26 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysEndpoint import ScheduleHolidaylistsIdHolidaysEndpoint
-from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdInfoEndpoint import ScheduleHolidaylistsIdInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysEndpoint import \
+        ScheduleHolidaylistsIdHolidaysEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdInfoEndpoint import ScheduleHolidaylistsIdInfoEndpoint
+
 
 class ScheduleHolidaylistsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "schedule/holidaylists/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def holidays(self) -> "ScheduleHolidaylistsIdHolidaysEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysEndpoint")
 
-        self.holidays = self._register_child_endpoint(
-            ScheduleHolidaylistsIdHolidaysEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ScheduleHolidaylistsIdInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> "ScheduleHolidaylistsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdInfoEndpoint")
@@ -1,30 +1,34 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysIdEndpoint import \
-    ScheduleHolidaylistsIdHolidaysIdEndpoint
-from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysInfoEndpoint import \
-    ScheduleHolidaylistsIdHolidaysInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysIdEndpoint import \
+        ScheduleHolidaylistsIdHolidaysIdEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysInfoEndpoint import \
+        ScheduleHolidaylistsIdHolidaysInfoEndpoint
+
 
 class ScheduleHolidaylistsIdHolidaysEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "holidays", parent_endpoint=parent_endpoint)
+    endpoint_base = "holidays"
+    _route = "schedule/holidaylists/{id}/holidays"
 
-        self.info = self._register_child_endpoint(
-            ScheduleHolidaylistsIdHolidaysInfoEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScheduleHolidaylistsIdHolidaysIdEndpoint:
+    def id(self, id: int) -> "ScheduleHolidaylistsIdHolidaysIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScheduleHolidaylistsIdHolidaysIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScheduleHolidaylistsIdHolidaysIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScheduleHolidaylistsIdHolidaysIdEndpoint: The initialized ScheduleHolidaylistsIdHolidaysIdEndpoint object.
+            ScheduleHolidaylistsIdHolidaysIdEndpoint: The ScheduleHolidaylistsIdHolidaysIdEndpoint view bound to the ID.
         """
-        child = ScheduleHolidaylistsIdHolidaysIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ScheduleHolidaylistsIdHolidaysInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysInfoEndpoint")
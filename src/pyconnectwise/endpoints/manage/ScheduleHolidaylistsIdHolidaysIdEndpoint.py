@@ -1,15 +1,23 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysIdInfoEndpoint import \
-    ScheduleHolidaylistsIdHolidaysIdInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysIdInfoEndpoint import \
+        ScheduleHolidaylistsIdHolidaysIdInfoEndpoint
+
 
 class ScheduleHolidaylistsIdHolidaysIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "schedule/holidaylists/{id}/holidays/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(
-            ScheduleHolidaylistsIdHolidaysIdInfoEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def info(self) -> "ScheduleHolidaylistsIdHolidaysIdInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ScheduleHolidaylistsIdHolidaysIdInfoEndpoint"
         )
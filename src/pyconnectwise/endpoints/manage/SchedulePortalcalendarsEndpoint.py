@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SchedulePortalcalendarsCountEndpoint import SchedulePortalcalendarsCountEndpoint
-from pyconnectwise.endpoints.manage.SchedulePortalcalendarsIdEndpoint import SchedulePortalcalendarsIdEndpoint
 from pyconnectwise.models.manage import PortalCalendar
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SchedulePortalcalendarsCountEndpoint import SchedulePortalcalendarsCountEndpoint
+    from pyconnectwise.endpoints.manage.SchedulePortalcalendarsIdEndpoint import SchedulePortalcalendarsIdEndpoint
+
 
 class SchedulePortalcalendarsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "portalcalendars", parent_endpoint=parent_endpoint)
+    endpoint_base = "portalcalendars"
+    _route = "schedule/portalcalendars"
 
-        self.count = self._register_child_endpoint(SchedulePortalcalendarsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SchedulePortalcalendarsIdEndpoint:
+    def id(self, id: int) -> "SchedulePortalcalendarsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SchedulePortalcalendarsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SchedulePortalcalendarsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SchedulePortalcalendarsIdEndpoint: The initialized SchedulePortalcalendarsIdEndpoint object.
+            SchedulePortalcalendarsIdEndpoint: The SchedulePortalcalendarsIdEndpoint view bound to the ID.
         """
-        child = SchedulePortalcalendarsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SchedulePortalcalendarsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[PortalCalendar]:
         """
         Performs a GET request against the /schedule/portalcalendars endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[PortalCalendar]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            PortalCalendar,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(PortalCalendar, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[PortalCalendar]:
         """
@@ -59,4 +54,8 @@ class SchedulePortalcalendarsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[PortalCalendar]: The parsed response data.
         """
-        return self._parse_many(PortalCalendar, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalCalendar, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SchedulePortalcalendarsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SchedulePortalcalendarsCountEndpoint")
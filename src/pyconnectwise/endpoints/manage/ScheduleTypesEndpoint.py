@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ScheduleTypesCountEndpoint import ScheduleTypesCountEndpoint
-from pyconnectwise.endpoints.manage.ScheduleTypesIdEndpoint import ScheduleTypesIdEndpoint
-from pyconnectwise.endpoints.manage.ScheduleTypesInfoEndpoint import ScheduleTypesInfoEndpoint
 from pyconnectwise.models.manage import ScheduleType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ScheduleTypesCountEndpoint import ScheduleTypesCountEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleTypesIdEndpoint import ScheduleTypesIdEndpoint
+    from pyconnectwise.endpoints.manage.ScheduleTypesInfoEndpoint import ScheduleTypesInfoEndpoint
+
 
 class ScheduleTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "schedule/types"
 
-        self.info = self._register_child_endpoint(ScheduleTypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ScheduleTypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ScheduleTypesIdEndpoint:
+    def id(self, id: int) -> "ScheduleTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ScheduleTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ScheduleTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ScheduleTypesIdEndpoint: The initialized ScheduleTypesIdEndpoint object.
+            ScheduleTypesIdEndpoint: The ScheduleTypesIdEndpoint view bound to the ID.
         """
-        child = ScheduleTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ScheduleTypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ScheduleType]:
         """
         Performs a GET request against the /schedule/types endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ScheduleType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ScheduleType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ScheduleType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ScheduleType]:
         """
@@ -61,7 +55,7 @@ class ScheduleTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ScheduleType]: The parsed response data.
         """
-        return self._parse_many(ScheduleType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ScheduleType:
         """
@@ -73,4 +67,12 @@ class ScheduleTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             ScheduleType: The parsed response data.
         """
-        return self._parse_one(ScheduleType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ScheduleType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ScheduleTypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleTypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ScheduleTypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ScheduleTypesCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsCopyEndpoint import ServiceBoardsCopyEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsCountEndpoint import ServiceBoardsCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdEndpoint import ServiceBoardsIdEndpoint
 from pyconnectwise.models.manage import Board
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceBoardsCopyEndpoint import ServiceBoardsCopyEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsCountEndpoint import ServiceBoardsCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdEndpoint import ServiceBoardsIdEndpoint
+
 
 class ServiceBoardsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "boards", parent_endpoint=parent_endpoint)
+    endpoint_base = "boards"
+    _route = "service/boards"
 
-        self.copy = self._register_child_endpoint(ServiceBoardsCopyEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceBoardsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceBoardsIdEndpoint:
+    def id(self, id: int) -> "ServiceBoardsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceBoardsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceBoardsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceBoardsIdEndpoint: The initialized ServiceBoardsIdEndpoint object.
+            ServiceBoardsIdEndpoint: The ServiceBoardsIdEndpoint view bound to the ID.
         """
-        child = ServiceBoardsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceBoardsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Board]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Board]:
         """
         Performs a GET request against the /service/boards endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Board]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Board,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Board, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Board]:
         """
@@ -59,7 +55,7 @@ class ServiceBoardsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Board]: The parsed response data.
         """
-        return self._parse_many(Board, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Board, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Board:
         """
@@ -71,4 +67,12 @@ class ServiceBoardsEndpoint(ConnectWiseEndpoint):
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> "ServiceBoardsCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsCopyEndpoint")
+
+    @cached_property
+    def count(self) -> "ServiceBoardsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsCountEndpoint")
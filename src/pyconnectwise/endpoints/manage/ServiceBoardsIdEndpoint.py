@@ -1,69 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdAutoassignresourcesEndpoint import \
-    ServiceBoardsIdAutoassignresourcesEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdAutotemplatesEndpoint import ServiceBoardsIdAutotemplatesEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdExcludedmembersEndpoint import ServiceBoardsIdExcludedmembersEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsEndpoint import ServiceBoardsIdItemsEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdNotificationsEndpoint import ServiceBoardsIdNotificationsEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdStatusesEndpoint import ServiceBoardsIdStatusesEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesEndpoint import ServiceBoardsIdSubtypesEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdTeamsEndpoint import ServiceBoardsIdTeamsEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdTypesEndpoint import ServiceBoardsIdTypesEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdTypesubtypeitemassociationsEndpoint import \
-    ServiceBoardsIdTypesubtypeitemassociationsEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdUsagesEndpoint import ServiceBoardsIdUsagesEndpoint
 from pyconnectwise.models.manage import Board
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdAutoassignresourcesEndpoint import \
+        ServiceBoardsIdAutoassignresourcesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdAutotemplatesEndpoint import ServiceBoardsIdAutotemplatesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdExcludedmembersEndpoint import \
+        ServiceBoardsIdExcludedmembersEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsEndpoint import ServiceBoardsIdItemsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdNotificationsEndpoint import ServiceBoardsIdNotificationsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdStatusesEndpoint import ServiceBoardsIdStatusesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesEndpoint import ServiceBoardsIdSubtypesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdTeamsEndpoint import ServiceBoardsIdTeamsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdTypesEndpoint import ServiceBoardsIdTypesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdTypesubtypeitemassociationsEndpoint import \
+        ServiceBoardsIdTypesubtypeitemassociationsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdUsagesEndpoint import ServiceBoardsIdUsagesEndpoint
+
 
 class ServiceBoardsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "service/boards/{id}"
 
-        self.auto_assign_resources = self._register_child_endpoint(
-            ServiceBoardsIdAutoassignresourcesEndpoint(client, parent_endpoint=self)
-        )
-        self.excluded_members = self._register_child_endpoint(
-            ServiceBoardsIdExcludedmembersEndpoint(client, parent_endpoint=self)
-        )
-        self.notifications = self._register_child_endpoint(
-            ServiceBoardsIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.types = self._register_child_endpoint(ServiceBoardsIdTypesEndpoint(client, parent_endpoint=self))
-        self.type_sub_type_item_associations = self._register_child_endpoint(
-            ServiceBoardsIdTypesubtypeitemassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.teams = self._register_child_endpoint(ServiceBoardsIdTeamsEndpoint(client, parent_endpoint=self))
-        self.auto_templates = self._register_child_endpoint(
-            ServiceBoardsIdAutotemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(ServiceBoardsIdUsagesEndpoint(client, parent_endpoint=self))
-        self.subtypes = self._register_child_endpoint(ServiceBoardsIdSubtypesEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(ServiceBoardsIdStatusesEndpoint(client, parent_endpoint=self))
-        self.items = self._register_child_endpoint(ServiceBoardsIdItemsEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Board]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Board]:
         """
         Performs a GET request against the /service/boards/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Board]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Board,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Board, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Board:
         """
@@ -75,7 +55,7 @@ class ServiceBoardsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -97,7 +77,7 @@ class ServiceBoardsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Board:
         """
@@ -109,4 +89,50 @@ class ServiceBoardsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def auto_assign_resources(self) -> "ServiceBoardsIdAutoassignresourcesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdAutoassignresourcesEndpoint")
+
+    @cached_property
+    def excluded_members(self) -> "ServiceBoardsIdExcludedmembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdExcludedmembersEndpoint")
+
+    @cached_property
+    def notifications(self) -> "ServiceBoardsIdNotificationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdNotificationsEndpoint")
+
+    @cached_property
+    def types(self) -> "ServiceBoardsIdTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdTypesEndpoint")
+
+    @cached_property
+    def type_sub_type_item_associations(self) -> "ServiceBoardsIdTypesubtypeitemassociationsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ServiceBoardsIdTypesubtypeitemassociationsEndpoint"
+        )
+
+    @cached_property
+    def teams(self) -> "ServiceBoardsIdTeamsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdTeamsEndpoint")
+
+    @cached_property
+    def auto_templates(self) -> "ServiceBoardsIdAutotemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdAutotemplatesEndpoint")
+
+    @cached_property
+    def usages(self) -> "ServiceBoardsIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdUsagesEndpoint")
+
+    @cached_property
+    def subtypes(self) -> "ServiceBoardsIdSubtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesEndpoint")
+
+    @cached_property
+    def statuses(self) -> "ServiceBoardsIdStatusesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdStatusesEndpoint")
+
+    @cached_property
+    def items(self) -> "ServiceBoardsIdItemsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdItemsEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsCountEndpoint import ServiceBoardsIdItemsCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdEndpoint import ServiceBoardsIdItemsIdEndpoint
 from pyconnectwise.models.manage import BoardItem
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsCountEndpoint import ServiceBoardsIdItemsCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdEndpoint import ServiceBoardsIdItemsIdEndpoint
+
 
 class ServiceBoardsIdItemsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "items", parent_endpoint=parent_endpoint)
+    endpoint_base = "items"
+    _route = "service/boards/{id}/items"
 
-        self.count = self._register_child_endpoint(ServiceBoardsIdItemsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceBoardsIdItemsIdEndpoint:
+    def id(self, id: int) -> "ServiceBoardsIdItemsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceBoardsIdItemsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceBoardsIdItemsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceBoardsIdItemsIdEndpoint: The initialized ServiceBoardsIdItemsIdEndpoint object.
+            ServiceBoardsIdItemsIdEndpoint: The ServiceBoardsIdItemsIdEndpoint view bound to the ID.
         """
-        child = ServiceBoardsIdItemsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[BoardItem]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[BoardItem]:
         """
         Performs a GET request against the /service/boards/{id}/items endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BoardItem]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BoardItem,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BoardItem, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[BoardItem]:
         """
@@ -57,7 +54,7 @@ class ServiceBoardsIdItemsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[BoardItem]: The parsed response data.
         """
-        return self._parse_many(BoardItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BoardItem:
         """
@@ -69,4 +66,8 @@ class ServiceBoardsIdItemsEndpoint(ConnectWiseEndpoint):
         Returns:
             BoardItem: The parsed response data.
         """
-        return self._parse_one(BoardItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ServiceBoardsIdItemsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdItemsCountEndpoint")
@@ -1,42 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdAssociationsEndpoint import \
-    ServiceBoardsIdItemsIdAssociationsEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdUsagesEndpoint import ServiceBoardsIdItemsIdUsagesEndpoint
 from pyconnectwise.models.manage import BoardItem
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdAssociationsEndpoint import \
+        ServiceBoardsIdItemsIdAssociationsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdUsagesEndpoint import ServiceBoardsIdItemsIdUsagesEndpoint
+
 
 class ServiceBoardsIdItemsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "service/boards/{id}/items/{id}"
 
-        self.usages = self._register_child_endpoint(ServiceBoardsIdItemsIdUsagesEndpoint(client, parent_endpoint=self))
-        self.associations = self._register_child_endpoint(
-            ServiceBoardsIdItemsIdAssociationsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[BoardItem]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[BoardItem]:
         """
         Performs a GET request against the /service/boards/{id}/items/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BoardItem]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BoardItem,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BoardItem, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BoardItem:
         """
@@ -48,7 +44,7 @@ class ServiceBoardsIdItemsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             BoardItem: The parsed response data.
         """
-        return self._parse_one(BoardItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardItem, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -70,7 +66,7 @@ class ServiceBoardsIdItemsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             BoardItem: The parsed response data.
         """
-        return self._parse_one(BoardItem, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BoardItem, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BoardItem:
         """
@@ -82,4 +78,12 @@ class ServiceBoardsIdItemsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             BoardItem: The parsed response data.
         """
-        return self._parse_one(BoardItem, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(BoardItem, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "ServiceBoardsIdItemsIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdUsagesEndpoint")
+
+    @cached_property
+    def associations(self) -> "ServiceBoardsIdItemsIdAssociationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdAssociationsEndpoint")
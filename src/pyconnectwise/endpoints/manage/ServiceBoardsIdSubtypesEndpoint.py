@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesCountEndpoint import ServiceBoardsIdSubtypesCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesIdEndpoint import ServiceBoardsIdSubtypesIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesInfoEndpoint import ServiceBoardsIdSubtypesInfoEndpoint
 from pyconnectwise.models.manage import BoardSubType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesCountEndpoint import ServiceBoardsIdSubtypesCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesIdEndpoint import ServiceBoardsIdSubtypesIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesInfoEndpoint import ServiceBoardsIdSubtypesInfoEndpoint
+
 
 class ServiceBoardsIdSubtypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "subtypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "subtypes"
+    _route = "service/boards/{id}/subtypes"
 
-        self.info = self._register_child_endpoint(ServiceBoardsIdSubtypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceBoardsIdSubtypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceBoardsIdSubtypesIdEndpoint:
+    def id(self, id: int) -> "ServiceBoardsIdSubtypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceBoardsIdSubtypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceBoardsIdSubtypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceBoardsIdSubtypesIdEndpoint: The initialized ServiceBoardsIdSubtypesIdEndpoint object.
+            ServiceBoardsIdSubtypesIdEndpoint: The ServiceBoardsIdSubtypesIdEndpoint view bound to the ID.
         """
-        child = ServiceBoardsIdSubtypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[BoardSubType]:
         """
         Performs a GET request against the /service/boards/{id}/subtypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[BoardSubType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            BoardSubType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(BoardSubType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[BoardSubType]:
         """
@@ -61,7 +55,7 @@ class ServiceBoardsIdSubtypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[BoardSubType]: The parsed response data.
         """
-        return self._parse_many(BoardSubType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardSubType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BoardSubType:
         """
@@ -73,4 +67,12 @@ class ServiceBoardsIdSubtypesEndpoint(ConnectWiseEndpoint):
         Returns:
             BoardSubType: The parsed response data.
         """
-        return self._parse_one(BoardSubType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardSubType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ServiceBoardsIdSubtypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ServiceBoardsIdSubtypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdSubtypesCountEndpoint")
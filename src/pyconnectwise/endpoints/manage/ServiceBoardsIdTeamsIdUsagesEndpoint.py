@@ -1,15 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceBoardsIdTeamsIdUsagesListEndpoint import \
-    ServiceBoardsIdTeamsIdUsagesListEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceBoardsIdTeamsIdUsagesListEndpoint import \
+        ServiceBoardsIdTeamsIdUsagesListEndpoint
+
 
 class ServiceBoardsIdTeamsIdUsagesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "usages"
+    _route = "service/boards/{id}/teams/{id}/usages"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "usages", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.list = self._register_child_endpoint(
-            ServiceBoardsIdTeamsIdUsagesListEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def list(self) -> "ServiceBoardsIdTeamsIdUsagesListEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceBoardsIdTeamsIdUsagesListEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceImpactsCountEndpoint import ServiceImpactsCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceImpactsIdEndpoint import ServiceImpactsIdEndpoint
 from pyconnectwise.models.manage import Impact
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceImpactsCountEndpoint import ServiceImpactsCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceImpactsIdEndpoint import ServiceImpactsIdEndpoint
+
 
 class ServiceImpactsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "impacts", parent_endpoint=parent_endpoint)
+    endpoint_base = "impacts"
+    _route = "service/impacts"
 
-        self.count = self._register_child_endpoint(ServiceImpactsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceImpactsIdEndpoint:
+    def id(self, id: int) -> "ServiceImpactsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceImpactsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceImpactsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceImpactsIdEndpoint: The initialized ServiceImpactsIdEndpoint object.
+            ServiceImpactsIdEndpoint: The ServiceImpactsIdEndpoint view bound to the ID.
         """
-        child = ServiceImpactsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceImpactsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Impact]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Impact]:
         """
         Performs a GET request against the /service/impacts endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Impact]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Impact,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Impact, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Impact]:
         """
@@ -57,4 +54,8 @@ class ServiceImpactsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Impact]: The parsed response data.
         """
-        return self._parse_many(Impact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Impact, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ServiceImpactsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceImpactsCountEndpoint")
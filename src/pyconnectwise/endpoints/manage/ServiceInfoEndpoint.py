@@ -1,14 +1,25 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceInfoBoardsEndpoint import ServiceInfoBoardsEndpoint
-from pyconnectwise.endpoints.manage.ServiceInfoBoardtypesEndpoint import ServiceInfoBoardtypesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceInfoBoardsEndpoint import ServiceInfoBoardsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceInfoBoardtypesEndpoint import ServiceInfoBoardtypesEndpoint
+
 
 class ServiceInfoEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "service/info"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def boards(self) -> "ServiceInfoBoardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceInfoBoardsEndpoint")
 
-        self.boards = self._register_child_endpoint(ServiceInfoBoardsEndpoint(client, parent_endpoint=self))
-        self.boardtypes = self._register_child_endpoint(ServiceInfoBoardtypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def boardtypes(self) -> "ServiceInfoBoardtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceInfoBoardtypesEndpoint")
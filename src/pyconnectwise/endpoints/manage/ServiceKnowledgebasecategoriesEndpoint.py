@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceKnowledgebasecategoriesCountEndpoint import \
-    ServiceKnowledgebasecategoriesCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceKnowledgebasecategoriesIdEndpoint import \
-    ServiceKnowledgebasecategoriesIdEndpoint
 from pyconnectwise.models.manage import KnowledgeBaseCategory
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceKnowledgebasecategoriesCountEndpoint import \
+        ServiceKnowledgebasecategoriesCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceKnowledgebasecategoriesIdEndpoint import \
+        ServiceKnowledgebasecategoriesIdEndpoint
+
 
 class ServiceKnowledgebasecategoriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "knowledgeBaseCategories", parent_endpoint=parent_endpoint)
+    endpoint_base = "knowledgeBaseCategories"
+    _route = "service/knowledgeBaseCategories"
 
-        self.count = self._register_child_endpoint(
-            ServiceKnowledgebasecategoriesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceKnowledgebasecategoriesIdEndpoint:
+    def id(self, id: int) -> "ServiceKnowledgebasecategoriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceKnowledgebasecategoriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceKnowledgebasecategoriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceKnowledgebasecategoriesIdEndpoint: The initialized ServiceKnowledgebasecategoriesIdEndpoint object.
+            ServiceKnowledgebasecategoriesIdEndpoint: The ServiceKnowledgebasecategoriesIdEndpoint view bound to the ID.
         """
-        child = ServiceKnowledgebasecategoriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceKnowledgebasecategoriesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[KnowledgeBaseCategory]:
         """
         Performs a GET request against the /service/knowledgeBaseCategories endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[KnowledgeBaseCategory]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            KnowledgeBaseCategory,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(KnowledgeBaseCategory, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[KnowledgeBaseCategory]:
         """
@@ -63,7 +56,7 @@ class ServiceKnowledgebasecategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[KnowledgeBaseCategory]: The parsed response data.
         """
-        return self._parse_many(KnowledgeBaseCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(KnowledgeBaseCategory, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> KnowledgeBaseCategory:
         """
@@ -75,4 +68,8 @@ class ServiceKnowledgebasecategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             KnowledgeBaseCategory: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseCategory, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseCategory, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ServiceKnowledgebasecategoriesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceKnowledgebasecategoriesCountEndpoint")
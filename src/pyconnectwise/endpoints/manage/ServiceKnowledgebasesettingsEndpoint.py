@@ -1,50 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceKnowledgebasesettingsIdEndpoint import ServiceKnowledgebasesettingsIdEndpoint
 from pyconnectwise.models.manage import KnowledgeBaseSettings
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceKnowledgebasesettingsIdEndpoint import \
+        ServiceKnowledgebasesettingsIdEndpoint
+
 
 class ServiceKnowledgebasesettingsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "knowledgebasesettings"
+    _route = "service/knowledgebasesettings"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "knowledgebasesettings", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceKnowledgebasesettingsIdEndpoint:
+    def id(self, id: int) -> "ServiceKnowledgebasesettingsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceKnowledgebasesettingsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceKnowledgebasesettingsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceKnowledgebasesettingsIdEndpoint: The initialized ServiceKnowledgebasesettingsIdEndpoint object.
+            ServiceKnowledgebasesettingsIdEndpoint: The ServiceKnowledgebasesettingsIdEndpoint view bound to the ID.
         """
-        child = ServiceKnowledgebasesettingsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceKnowledgebasesettingsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[KnowledgeBaseSettings]:
         """
         Performs a GET request against the /service/knowledgebasesettings endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[KnowledgeBaseSettings]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            KnowledgeBaseSettings,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(KnowledgeBaseSettings, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> KnowledgeBaseSettings:
         """
@@ -56,7 +54,7 @@ class ServiceKnowledgebasesettingsEndpoint(ConnectWiseEndpoint):
         Returns:
             KnowledgeBaseSettings: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSettings, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseSettings, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> KnowledgeBaseSettings:
         """
@@ -68,4 +66,4 @@ class ServiceKnowledgebasesettingsEndpoint(ConnectWiseEndpoint):
         Returns:
             KnowledgeBaseSettings: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSettings, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseSettings, super()._make_request("POST", data=data, params=params).content)
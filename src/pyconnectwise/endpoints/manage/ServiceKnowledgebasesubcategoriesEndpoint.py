@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesCountEndpoint import \
-    ServiceKnowledgebasesubcategoriesCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesIdEndpoint import \
-    ServiceKnowledgebasesubcategoriesIdEndpoint
 from pyconnectwise.models.manage import KnowledgeBaseSubCategory
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesCountEndpoint import \
+        ServiceKnowledgebasesubcategoriesCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesIdEndpoint import \
+        ServiceKnowledgebasesubcategoriesIdEndpoint
+
 
 class ServiceKnowledgebasesubcategoriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "knowledgeBaseSubCategories", parent_endpoint=parent_endpoint)
+    endpoint_base = "knowledgeBaseSubCategories"
+    _route = "service/knowledgeBaseSubCategories"
 
-        self.count = self._register_child_endpoint(
-            ServiceKnowledgebasesubcategoriesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceKnowledgebasesubcategoriesIdEndpoint:
+    def id(self, id: int) -> "ServiceKnowledgebasesubcategoriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceKnowledgebasesubcategoriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceKnowledgebasesubcategoriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceKnowledgebasesubcategoriesIdEndpoint: The initialized ServiceKnowledgebasesubcategoriesIdEndpoint object.
+            ServiceKnowledgebasesubcategoriesIdEndpoint: The ServiceKnowledgebasesubcategoriesIdEndpoint view bound to the ID.
         """
-        child = ServiceKnowledgebasesubcategoriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[KnowledgeBaseSubCategory]:
         """
         Performs a GET request against the /service/knowledgeBaseSubCategories endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[KnowledgeBaseSubCategory]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            KnowledgeBaseSubCategory,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(KnowledgeBaseSubCategory, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[KnowledgeBaseSubCategory]:
         """
@@ -63,7 +56,9 @@ class ServiceKnowledgebasesubcategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[KnowledgeBaseSubCategory]: The parsed response data.
         """
-        return self._parse_many(KnowledgeBaseSubCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(
+            KnowledgeBaseSubCategory, super()._make_request("GET", data=data, params=params).content
+        )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> KnowledgeBaseSubCategory:
         """
@@ -75,4 +70,12 @@ class ServiceKnowledgebasesubcategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             KnowledgeBaseSubCategory: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(
+            KnowledgeBaseSubCategory, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "ServiceKnowledgebasesubcategoriesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesCountEndpoint"
+        )
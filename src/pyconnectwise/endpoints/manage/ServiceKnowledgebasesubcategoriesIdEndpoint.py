@@ -1,42 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesIdUsagesEndpoint import \
-    ServiceKnowledgebasesubcategoriesIdUsagesEndpoint
 from pyconnectwise.models.manage import KnowledgeBaseSubCategory
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesIdUsagesEndpoint import \
+        ServiceKnowledgebasesubcategoriesIdUsagesEndpoint
+
 
 class ServiceKnowledgebasesubcategoriesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "service/knowledgeBaseSubCategories/{id}"
 
-        self.usages = self._register_child_endpoint(
-            ServiceKnowledgebasesubcategoriesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[KnowledgeBaseSubCategory]:
         """
         Performs a GET request against the /service/knowledgeBaseSubCategories/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[KnowledgeBaseSubCategory]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            KnowledgeBaseSubCategory,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(KnowledgeBaseSubCategory, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> KnowledgeBaseSubCategory:
         """
@@ -48,7 +43,7 @@ class ServiceKnowledgebasesubcategoriesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             KnowledgeBaseSubCategory: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -70,7 +65,7 @@ class ServiceKnowledgebasesubcategoriesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             KnowledgeBaseSubCategory: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> KnowledgeBaseSubCategory:
         """
@@ -83,5 +78,11 @@ class ServiceKnowledgebasesubcategoriesIdEndpoint(ConnectWiseEndpoint):
             KnowledgeBaseSubCategory: The parsed response data.
         """
         return self._parse_one(
-            KnowledgeBaseSubCategory, super()._make_request("PATCH", data=data, params=params).json()
+            KnowledgeBaseSubCategory, super()._make_request("PATCH", data=data, params=params).content
+        )
+
+    @cached_property
+    def usages(self) -> "ServiceKnowledgebasesubcategoriesIdUsagesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ServiceKnowledgebasesubcategoriesIdUsagesEndpoint"
         )
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceLocationsCountEndpoint import ServiceLocationsCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceLocationsIdEndpoint import ServiceLocationsIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceLocationsInfoEndpoint import ServiceLocationsInfoEndpoint
 from pyconnectwise.models.manage import ServiceLocation
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceLocationsCountEndpoint import ServiceLocationsCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceLocationsIdEndpoint import ServiceLocationsIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceLocationsInfoEndpoint import ServiceLocationsInfoEndpoint
+
 
 class ServiceLocationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "locations", parent_endpoint=parent_endpoint)
+    endpoint_base = "locations"
+    _route = "service/locations"
 
-        self.info = self._register_child_endpoint(ServiceLocationsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceLocationsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceLocationsIdEndpoint:
+    def id(self, id: int) -> "ServiceLocationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceLocationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceLocationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceLocationsIdEndpoint: The initialized ServiceLocationsIdEndpoint object.
+            ServiceLocationsIdEndpoint: The ServiceLocationsIdEndpoint view bound to the ID.
         """
-        child = ServiceLocationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceLocationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ServiceLocation]:
         """
         Performs a GET request against the /service/locations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceLocation]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceLocation,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceLocation, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ServiceLocation]:
         """
@@ -61,7 +55,7 @@ class ServiceLocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ServiceLocation]: The parsed response data.
         """
-        return self._parse_many(ServiceLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceLocation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceLocation:
         """
@@ -73,4 +67,12 @@ class ServiceLocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceLocation: The parsed response data.
         """
-        return self._parse_one(ServiceLocation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceLocation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ServiceLocationsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceLocationsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ServiceLocationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceLocationsCountEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServicePrioritiesCountEndpoint import ServicePrioritiesCountEndpoint
-from pyconnectwise.endpoints.manage.ServicePrioritiesIdEndpoint import ServicePrioritiesIdEndpoint
 from pyconnectwise.models.manage import Priority
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServicePrioritiesCountEndpoint import ServicePrioritiesCountEndpoint
+    from pyconnectwise.endpoints.manage.ServicePrioritiesIdEndpoint import ServicePrioritiesIdEndpoint
+
 
 class ServicePrioritiesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "priorities", parent_endpoint=parent_endpoint)
+    endpoint_base = "priorities"
+    _route = "service/priorities"
 
-        self.count = self._register_child_endpoint(ServicePrioritiesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServicePrioritiesIdEndpoint:
+    def id(self, id: int) -> "ServicePrioritiesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServicePrioritiesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServicePrioritiesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServicePrioritiesIdEndpoint: The initialized ServicePrioritiesIdEndpoint object.
+            ServicePrioritiesIdEndpoint: The ServicePrioritiesIdEndpoint view bound to the ID.
         """
-        child = ServicePrioritiesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServicePrioritiesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Priority]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Priority]:
         """
         Performs a GET request against the /service/priorities endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Priority]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Priority,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Priority, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Priority]:
         """
@@ -57,7 +54,7 @@ class ServicePrioritiesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Priority]: The parsed response data.
         """
-        return self._parse_many(Priority, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Priority, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Priority:
         """
@@ -69,4 +66,8 @@ class ServicePrioritiesEndpoint(ConnectWiseEndpoint):
         Returns:
             Priority: The parsed response data.
         """
-        return self._parse_one(Priority, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Priority, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ServicePrioritiesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServicePrioritiesCountEndpoint")
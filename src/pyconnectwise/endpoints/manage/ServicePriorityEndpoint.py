@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServicePriorityIdEndpoint import ServicePriorityIdEndpoint
-from pyconnectwise.endpoints.manage.ServicePriorityInfoEndpoint import ServicePriorityInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServicePriorityIdEndpoint import ServicePriorityIdEndpoint
+    from pyconnectwise.endpoints.manage.ServicePriorityInfoEndpoint import ServicePriorityInfoEndpoint
+
 
 class ServicePriorityEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "priority", parent_endpoint=parent_endpoint)
+    endpoint_base = "priority"
+    _route = "service/priority"
 
-        self.info = self._register_child_endpoint(ServicePriorityInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServicePriorityIdEndpoint:
+    def id(self, id: int) -> "ServicePriorityIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServicePriorityIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServicePriorityIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServicePriorityIdEndpoint: The initialized ServicePriorityIdEndpoint object.
+            ServicePriorityIdEndpoint: The ServicePriorityIdEndpoint view bound to the ID.
         """
-        child = ServicePriorityIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServicePriorityIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ServicePriorityInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServicePriorityInfoEndpoint")
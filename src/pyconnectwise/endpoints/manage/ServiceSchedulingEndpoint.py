@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSchedulingMembersEndpoint import ServiceSchedulingMembersEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSchedulingMembersEndpoint import ServiceSchedulingMembersEndpoint
+
 
 class ServiceSchedulingEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "scheduling"
+    _route = "service/scheduling"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "scheduling", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.members = self._register_child_endpoint(ServiceSchedulingMembersEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def members(self) -> "ServiceSchedulingMembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSchedulingMembersEndpoint")
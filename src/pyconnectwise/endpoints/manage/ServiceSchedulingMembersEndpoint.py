@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSchedulingMembersIdEndpoint import ServiceSchedulingMembersIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceSchedulingMembersInfoEndpoint import ServiceSchedulingMembersInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSchedulingMembersIdEndpoint import ServiceSchedulingMembersIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSchedulingMembersInfoEndpoint import ServiceSchedulingMembersInfoEndpoint
+
 
 class ServiceSchedulingMembersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "members", parent_endpoint=parent_endpoint)
+    endpoint_base = "members"
+    _route = "service/scheduling/members"
 
-        self.info = self._register_child_endpoint(ServiceSchedulingMembersInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceSchedulingMembersIdEndpoint:
+    def id(self, id: int) -> "ServiceSchedulingMembersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceSchedulingMembersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceSchedulingMembersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceSchedulingMembersIdEndpoint: The initialized ServiceSchedulingMembersIdEndpoint object.
+            ServiceSchedulingMembersIdEndpoint: The ServiceSchedulingMembersIdEndpoint view bound to the ID.
         """
-        child = ServiceSchedulingMembersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceSchedulingMembersIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ServiceSchedulingMembersInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSchedulingMembersInfoEndpoint")
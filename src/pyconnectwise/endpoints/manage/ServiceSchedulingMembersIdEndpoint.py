@@ -1,12 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSchedulingMembersIdInfoEndpoint import ServiceSchedulingMembersIdInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSchedulingMembersIdInfoEndpoint import \
+        ServiceSchedulingMembersIdInfoEndpoint
+
 
 class ServiceSchedulingMembersIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "service/scheduling/members/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(ServiceSchedulingMembersIdInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> "ServiceSchedulingMembersIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSchedulingMembersIdInfoEndpoint")
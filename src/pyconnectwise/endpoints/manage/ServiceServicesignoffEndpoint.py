@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceServicesignoffCountEndpoint import ServiceServicesignoffCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceServicesignoffIdEndpoint import ServiceServicesignoffIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceServicesignoffInfoEndpoint import ServiceServicesignoffInfoEndpoint
 from pyconnectwise.models.manage import ServiceSignoff
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceServicesignoffCountEndpoint import ServiceServicesignoffCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceServicesignoffIdEndpoint import ServiceServicesignoffIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceServicesignoffInfoEndpoint import ServiceServicesignoffInfoEndpoint
+
 
 class ServiceServicesignoffEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "serviceSignoff", parent_endpoint=parent_endpoint)
+    endpoint_base = "serviceSignoff"
+    _route = "service/serviceSignoff"
 
-        self.info = self._register_child_endpoint(ServiceServicesignoffInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceServicesignoffCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceServicesignoffIdEndpoint:
+    def id(self, id: int) -> "ServiceServicesignoffIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceServicesignoffIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceServicesignoffIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceServicesignoffIdEndpoint: The initialized ServiceServicesignoffIdEndpoint object.
+            ServiceServicesignoffIdEndpoint: The ServiceServicesignoffIdEndpoint view bound to the ID.
         """
-        child = ServiceServicesignoffIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceServicesignoffIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ServiceSignoff]:
         """
         Performs a GET request against the /service/serviceSignoff endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceSignoff]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceSignoff,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceSignoff, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ServiceSignoff]:
         """
@@ -61,7 +55,7 @@ class ServiceServicesignoffEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ServiceSignoff]: The parsed response data.
         """
-        return self._parse_many(ServiceSignoff, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceSignoff, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceSignoff:
         """
@@ -73,4 +67,12 @@ class ServiceServicesignoffEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceSignoff: The parsed response data.
         """
-        return self._parse_one(ServiceSignoff, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceSignoff, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ServiceServicesignoffInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceServicesignoffInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ServiceServicesignoffCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceServicesignoffCountEndpoint")
@@ -1,46 +1,40 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceServicesignoffIdInfoEndpoint import ServiceServicesignoffIdInfoEndpoint
-from pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsEndpoint import \
-    ServiceServicesignoffIdSignoffcustomfieldsEndpoint
-from pyconnectwise.endpoints.manage.ServiceServicesignoffIdUsagesEndpoint import ServiceServicesignoffIdUsagesEndpoint
 from pyconnectwise.models.manage import ServiceSignoff
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceServicesignoffIdInfoEndpoint import ServiceServicesignoffIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsEndpoint import \
+        ServiceServicesignoffIdSignoffcustomfieldsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceServicesignoffIdUsagesEndpoint import \
+        ServiceServicesignoffIdUsagesEndpoint
+
 
 class ServiceServicesignoffIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "service/serviceSignoff/{id}"
 
-        self.usages = self._register_child_endpoint(ServiceServicesignoffIdUsagesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceServicesignoffIdInfoEndpoint(client, parent_endpoint=self))
-        self.signoffcustomfields = self._register_child_endpoint(
-            ServiceServicesignoffIdSignoffcustomfieldsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ServiceSignoff]:
         """
         Performs a GET request against the /service/serviceSignoff/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceSignoff]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceSignoff,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceSignoff, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceSignoff:
         """
@@ -52,7 +46,7 @@ class ServiceServicesignoffIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceSignoff: The parsed response data.
         """
-        return self._parse_one(ServiceSignoff, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceSignoff, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -74,7 +68,7 @@ class ServiceServicesignoffIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceSignoff: The parsed response data.
         """
-        return self._parse_one(ServiceSignoff, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ServiceSignoff, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceSignoff:
         """
@@ -86,4 +80,18 @@ class ServiceServicesignoffIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceSignoff: The parsed response data.
         """
-        return self._parse_one(ServiceSignoff, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ServiceSignoff, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "ServiceServicesignoffIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceServicesignoffIdUsagesEndpoint")
+
+    @cached_property
+    def info(self) -> "ServiceServicesignoffIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceServicesignoffIdInfoEndpoint")
+
+    @cached_property
+    def signoffcustomfields(self) -> "ServiceServicesignoffIdSignoffcustomfieldsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsEndpoint"
+        )
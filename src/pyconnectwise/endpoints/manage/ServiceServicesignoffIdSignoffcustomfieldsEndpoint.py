@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint import \
-    ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint import \
-    ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint
 from pyconnectwise.models.manage import ServiceSignoffCustomField
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint import \
+        ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint import \
+        ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint
+
 
 class ServiceServicesignoffIdSignoffcustomfieldsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "signoffcustomfields", parent_endpoint=parent_endpoint)
+    endpoint_base = "signoffcustomfields"
+    _route = "service/serviceSignoff/{id}/signoffcustomfields"
 
-        self.count = self._register_child_endpoint(
-            ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint:
+    def id(self, id: int) -> "ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint: The initialized ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint object.
+            ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint: The ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint view bound to the ID.
         """
-        child = ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ServiceSignoffCustomField]:
         """
         Performs a GET request against the /service/serviceSignoff/{id}/signoffcustomfields endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceSignoffCustomField]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceSignoffCustomField,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceSignoffCustomField, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ServiceSignoffCustomField]:
         """
@@ -64,7 +57,7 @@ class ServiceServicesignoffIdSignoffcustomfieldsEndpoint(ConnectWiseEndpoint):
             list[ServiceSignoffCustomField]: The parsed response data.
         """
         return self._parse_many(
-            ServiceSignoffCustomField, super()._make_request("GET", data=data, params=params).json()
+            ServiceSignoffCustomField, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceSignoffCustomField:
@@ -78,5 +71,11 @@ class ServiceServicesignoffIdSignoffcustomfieldsEndpoint(ConnectWiseEndpoint):
             ServiceSignoffCustomField: The parsed response data.
         """
         return self._parse_one(
-            ServiceSignoffCustomField, super()._make_request("POST", data=data, params=params).json()
+            ServiceSignoffCustomField, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint"
         )
@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSlasIdEndpoint import ServiceSlasIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceSlasInfoEndpoint import ServiceSlasInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSlasIdEndpoint import ServiceSlasIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSlasInfoEndpoint import ServiceSlasInfoEndpoint
+
 
 class ServiceSlasEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "slas", parent_endpoint=parent_endpoint)
+    endpoint_base = "slas"
+    _route = "service/slas"
 
-        self.info = self._register_child_endpoint(ServiceSlasInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceSlasIdEndpoint:
+    def id(self, id: int) -> "ServiceSlasIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceSlasIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceSlasIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceSlasIdEndpoint: The initialized ServiceSlasIdEndpoint object.
+            ServiceSlasIdEndpoint: The ServiceSlasIdEndpoint view bound to the ID.
         """
-        child = ServiceSlasIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceSlasIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "ServiceSlasInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSlasInfoEndpoint")
@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSlasInfoCountEndpoint import ServiceSlasInfoCountEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSlasInfoCountEndpoint import ServiceSlasInfoCountEndpoint
+
 
 class ServiceSlasInfoEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "service/slas/info"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(ServiceSlasInfoCountEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def count(self) -> "ServiceSlasInfoCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSlasInfoCountEndpoint")
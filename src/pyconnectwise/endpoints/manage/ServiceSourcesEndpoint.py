@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSourcesCountEndpoint import ServiceSourcesCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceSourcesIdEndpoint import ServiceSourcesIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceSourcesInfoEndpoint import ServiceSourcesInfoEndpoint
 from pyconnectwise.models.manage import Source
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSourcesCountEndpoint import ServiceSourcesCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSourcesIdEndpoint import ServiceSourcesIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSourcesInfoEndpoint import ServiceSourcesInfoEndpoint
+
 
 class ServiceSourcesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "sources", parent_endpoint=parent_endpoint)
+    endpoint_base = "sources"
+    _route = "service/sources"
 
-        self.info = self._register_child_endpoint(ServiceSourcesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceSourcesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceSourcesIdEndpoint:
+    def id(self, id: int) -> "ServiceSourcesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceSourcesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceSourcesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceSourcesIdEndpoint: The initialized ServiceSourcesIdEndpoint object.
+            ServiceSourcesIdEndpoint: The ServiceSourcesIdEndpoint view bound to the ID.
         """
-        child = ServiceSourcesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceSourcesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Source]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Source]:
         """
         Performs a GET request against the /service/sources endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Source]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Source,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Source, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Source]:
         """
@@ -59,7 +55,7 @@ class ServiceSourcesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Source]: The parsed response data.
         """
-        return self._parse_many(Source, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Source, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Source:
         """
@@ -71,4 +67,12 @@ class ServiceSourcesEndpoint(ConnectWiseEndpoint):
         Returns:
             Source: The parsed response data.
         """
-        return self._parse_one(Source, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Source, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ServiceSourcesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSourcesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ServiceSourcesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSourcesCountEndpoint")
@@ -1,45 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSurveysIdCopyEndpoint import ServiceSurveysIdCopyEndpoint
-from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsEndpoint import ServiceSurveysIdQuestionsEndpoint
-from pyconnectwise.endpoints.manage.ServiceSurveysIdResultsEndpoint import ServiceSurveysIdResultsEndpoint
-from pyconnectwise.endpoints.manage.ServiceSurveysIdUsagesEndpoint import ServiceSurveysIdUsagesEndpoint
 from pyconnectwise.models.manage import ServiceSurvey
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSurveysIdCopyEndpoint import ServiceSurveysIdCopyEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsEndpoint import ServiceSurveysIdQuestionsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSurveysIdResultsEndpoint import ServiceSurveysIdResultsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSurveysIdUsagesEndpoint import ServiceSurveysIdUsagesEndpoint
+
 
 class ServiceSurveysIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "service/surveys/{id}"
 
-        self.copy = self._register_child_endpoint(ServiceSurveysIdCopyEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ServiceSurveysIdUsagesEndpoint(client, parent_endpoint=self))
-        self.questions = self._register_child_endpoint(ServiceSurveysIdQuestionsEndpoint(client, parent_endpoint=self))
-        self.results = self._register_child_endpoint(ServiceSurveysIdResultsEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ServiceSurvey]:
         """
         Performs a GET request against the /service/surveys/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceSurvey]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceSurvey,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceSurvey, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceSurvey:
         """
@@ -51,7 +45,7 @@ class ServiceSurveysIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceSurvey: The parsed response data.
         """
-        return self._parse_one(ServiceSurvey, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceSurvey, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -73,7 +67,7 @@ class ServiceSurveysIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceSurvey: The parsed response data.
         """
-        return self._parse_one(ServiceSurvey, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ServiceSurvey, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceSurvey:
         """
@@ -85,4 +79,20 @@ class ServiceSurveysIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceSurvey: The parsed response data.
         """
-        return self._parse_one(ServiceSurvey, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ServiceSurvey, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> "ServiceSurveysIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSurveysIdCopyEndpoint")
+
+    @cached_property
+    def usages(self) -> "ServiceSurveysIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSurveysIdUsagesEndpoint")
+
+    @cached_property
+    def questions(self) -> "ServiceSurveysIdQuestionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsEndpoint")
+
+    @cached_property
+    def results(self) -> "ServiceSurveysIdResultsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSurveysIdResultsEndpoint")
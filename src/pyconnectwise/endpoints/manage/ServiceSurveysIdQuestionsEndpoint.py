@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsCountEndpoint import ServiceSurveysIdQuestionsCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdEndpoint import ServiceSurveysIdQuestionsIdEndpoint
 from pyconnectwise.models.manage import ServiceSurveyQuestion
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsCountEndpoint import \
+        ServiceSurveysIdQuestionsCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdEndpoint import ServiceSurveysIdQuestionsIdEndpoint
+
 
 class ServiceSurveysIdQuestionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "questions", parent_endpoint=parent_endpoint)
+    endpoint_base = "questions"
+    _route = "service/surveys/{id}/questions"
 
-        self.count = self._register_child_endpoint(ServiceSurveysIdQuestionsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceSurveysIdQuestionsIdEndpoint:
+    def id(self, id: int) -> "ServiceSurveysIdQuestionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceSurveysIdQuestionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceSurveysIdQuestionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceSurveysIdQuestionsIdEndpoint: The initialized ServiceSurveysIdQuestionsIdEndpoint object.
+            ServiceSurveysIdQuestionsIdEndpoint: The ServiceSurveysIdQuestionsIdEndpoint view bound to the ID.
         """
-        child = ServiceSurveysIdQuestionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ServiceSurveyQuestion]:
         """
         Performs a GET request against the /service/surveys/{id}/questions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceSurveyQuestion]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceSurveyQuestion,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceSurveyQuestion, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ServiceSurveyQuestion]:
         """
@@ -59,7 +55,7 @@ class ServiceSurveysIdQuestionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ServiceSurveyQuestion]: The parsed response data.
         """
-        return self._parse_many(ServiceSurveyQuestion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceSurveyQuestion, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceSurveyQuestion:
         """
@@ -71,4 +67,8 @@ class ServiceSurveysIdQuestionsEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceSurveyQuestion: The parsed response data.
         """
-        return self._parse_one(ServiceSurveyQuestion, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceSurveyQuestion, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ServiceSurveysIdQuestionsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsCountEndpoint")
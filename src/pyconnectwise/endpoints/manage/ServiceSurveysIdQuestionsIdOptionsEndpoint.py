@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdOptionsCountEndpoint import \
-    ServiceSurveysIdQuestionsIdOptionsCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdOptionsIdEndpoint import \
-    ServiceSurveysIdQuestionsIdOptionsIdEndpoint
 from pyconnectwise.models.manage import SurveyOption
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdOptionsCountEndpoint import \
+        ServiceSurveysIdQuestionsIdOptionsCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdOptionsIdEndpoint import \
+        ServiceSurveysIdQuestionsIdOptionsIdEndpoint
+
 
 class ServiceSurveysIdQuestionsIdOptionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "options", parent_endpoint=parent_endpoint)
+    endpoint_base = "options"
+    _route = "service/surveys/{id}/questions/{id}/options"
 
-        self.count = self._register_child_endpoint(
-            ServiceSurveysIdQuestionsIdOptionsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceSurveysIdQuestionsIdOptionsIdEndpoint:
+    def id(self, id: int) -> "ServiceSurveysIdQuestionsIdOptionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceSurveysIdQuestionsIdOptionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceSurveysIdQuestionsIdOptionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceSurveysIdQuestionsIdOptionsIdEndpoint: The initialized ServiceSurveysIdQuestionsIdOptionsIdEndpoint object.
+            ServiceSurveysIdQuestionsIdOptionsIdEndpoint: The ServiceSurveysIdQuestionsIdOptionsIdEndpoint view bound to the ID.
         """
-        child = ServiceSurveysIdQuestionsIdOptionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdOptionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[SurveyOption]:
         """
         Performs a GET request against the /service/surveys/{id}/questions/{id}/options endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SurveyOption]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SurveyOption,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SurveyOption, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SurveyOption]:
         """
@@ -63,7 +56,7 @@ class ServiceSurveysIdQuestionsIdOptionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SurveyOption]: The parsed response data.
         """
-        return self._parse_many(SurveyOption, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SurveyOption, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SurveyOption:
         """
@@ -75,4 +68,10 @@ class ServiceSurveysIdQuestionsIdOptionsEndpoint(ConnectWiseEndpoint):
         Returns:
             SurveyOption: The parsed response data.
         """
-        return self._parse_one(SurveyOption, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SurveyOption, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "ServiceSurveysIdQuestionsIdOptionsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.ServiceSurveysIdQuestionsIdOptionsCountEndpoint"
+        )
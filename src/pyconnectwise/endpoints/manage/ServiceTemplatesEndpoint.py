@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceTemplatesCountEndpoint import ServiceTemplatesCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceTemplatesIdEndpoint import ServiceTemplatesIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceTemplatesInfoEndpoint import ServiceTemplatesInfoEndpoint
 from pyconnectwise.models.manage import ServiceTemplate
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceTemplatesCountEndpoint import ServiceTemplatesCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTemplatesIdEndpoint import ServiceTemplatesIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTemplatesInfoEndpoint import ServiceTemplatesInfoEndpoint
+
 
 class ServiceTemplatesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "templates", parent_endpoint=parent_endpoint)
+    endpoint_base = "templates"
+    _route = "service/templates"
 
-        self.info = self._register_child_endpoint(ServiceTemplatesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceTemplatesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceTemplatesIdEndpoint:
+    def id(self, id: int) -> "ServiceTemplatesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceTemplatesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceTemplatesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceTemplatesIdEndpoint: The initialized ServiceTemplatesIdEndpoint object.
+            ServiceTemplatesIdEndpoint: The ServiceTemplatesIdEndpoint view bound to the ID.
         """
-        child = ServiceTemplatesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceTemplatesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ServiceTemplate]:
         """
         Performs a GET request against the /service/templates endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceTemplate]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceTemplate,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceTemplate, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ServiceTemplate]:
         """
@@ -61,4 +55,12 @@ class ServiceTemplatesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ServiceTemplate]: The parsed response data.
         """
-        return self._parse_many(ServiceTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceTemplate, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ServiceTemplatesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTemplatesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ServiceTemplatesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTemplatesCountEndpoint")
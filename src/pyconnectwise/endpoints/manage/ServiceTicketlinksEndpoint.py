@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketlinksCountEndpoint import ServiceTicketlinksCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketlinksIdEndpoint import ServiceTicketlinksIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketlinksInfoEndpoint import ServiceTicketlinksInfoEndpoint
 from pyconnectwise.models.manage import ServiceTicketLink
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceTicketlinksCountEndpoint import ServiceTicketlinksCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketlinksIdEndpoint import ServiceTicketlinksIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketlinksInfoEndpoint import ServiceTicketlinksInfoEndpoint
+
 
 class ServiceTicketlinksEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "ticketLinks", parent_endpoint=parent_endpoint)
+    endpoint_base = "ticketLinks"
+    _route = "service/ticketLinks"
 
-        self.info = self._register_child_endpoint(ServiceTicketlinksInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceTicketlinksCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceTicketlinksIdEndpoint:
+    def id(self, id: int) -> "ServiceTicketlinksIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceTicketlinksIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceTicketlinksIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceTicketlinksIdEndpoint: The initialized ServiceTicketlinksIdEndpoint object.
+            ServiceTicketlinksIdEndpoint: The ServiceTicketlinksIdEndpoint view bound to the ID.
         """
-        child = ServiceTicketlinksIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceTicketlinksIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ServiceTicketLink]:
         """
         Performs a GET request against the /service/ticketLinks endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceTicketLink]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceTicketLink,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceTicketLink, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ServiceTicketLink]:
         """
@@ -61,7 +55,7 @@ class ServiceTicketlinksEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ServiceTicketLink]: The parsed response data.
         """
-        return self._parse_many(ServiceTicketLink, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceTicketLink, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ServiceTicketLink:
         """
@@ -73,4 +67,12 @@ class ServiceTicketlinksEndpoint(ConnectWiseEndpoint):
         Returns:
             ServiceTicketLink: The parsed response data.
         """
-        return self._parse_one(ServiceTicketLink, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceTicketLink, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ServiceTicketlinksInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketlinksInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ServiceTicketlinksCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketlinksCountEndpoint")
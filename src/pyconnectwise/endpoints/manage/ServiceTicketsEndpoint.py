@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsCountEndpoint import ServiceTicketsCountEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdEndpoint import ServiceTicketsIdEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsInfoEndpoint import ServiceTicketsInfoEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsSearchEndpoint import ServiceTicketsSearchEndpoint
 from pyconnectwise.models.manage import Ticket
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceTicketsCountEndpoint import ServiceTicketsCountEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdEndpoint import ServiceTicketsIdEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsInfoEndpoint import ServiceTicketsInfoEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsSearchEndpoint import ServiceTicketsSearchEndpoint
+
 
 class ServiceTicketsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "tickets", parent_endpoint=parent_endpoint)
+    endpoint_base = "tickets"
+    _route = "service/tickets"
 
-        self.info = self._register_child_endpoint(ServiceTicketsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceTicketsCountEndpoint(client, parent_endpoint=self))
-        self.search = self._register_child_endpoint(ServiceTicketsSearchEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> ServiceTicketsIdEndpoint:
+    def id(self, id: int) -> "ServiceTicketsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized ServiceTicketsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a ServiceTicketsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            ServiceTicketsIdEndpoint: The initialized ServiceTicketsIdEndpoint object.
+            ServiceTicketsIdEndpoint: The ServiceTicketsIdEndpoint view bound to the ID.
         """
-        child = ServiceTicketsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.ServiceTicketsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Ticket]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Ticket]:
         """
         Performs a GET request against the /service/tickets endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Ticket]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Ticket,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Ticket, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Ticket]:
         """
@@ -61,7 +56,7 @@ class ServiceTicketsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Ticket]: The parsed response data.
         """
-        return self._parse_many(Ticket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Ticket, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Ticket:
         """
@@ -73,4 +68,16 @@ class ServiceTicketsEndpoint(ConnectWiseEndpoint):
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "ServiceTicketsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "ServiceTicketsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsCountEndpoint")
+
+    @cached_property
+    def search(self) -> "ServiceTicketsSearchEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsSearchEndpoint")
@@ -1,72 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdActivitiesEndpoint import ServiceTicketsIdActivitiesEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdAllnotesEndpoint import ServiceTicketsIdAllnotesEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdAttachchildrenEndpoint import ServiceTicketsIdAttachchildrenEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdConfigurationsEndpoint import ServiceTicketsIdConfigurationsEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdConvertEndpoint import ServiceTicketsIdConvertEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdDocumentsEndpoint import ServiceTicketsIdDocumentsEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdInfoEndpoint import ServiceTicketsIdInfoEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdMergeEndpoint import ServiceTicketsIdMergeEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdNotesEndpoint import ServiceTicketsIdNotesEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdProductsEndpoint import ServiceTicketsIdProductsEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdScheduleentriesEndpoint import \
-    ServiceTicketsIdScheduleentriesEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdTasksEndpoint import ServiceTicketsIdTasksEndpoint
-from pyconnectwise.endpoints.manage.ServiceTicketsIdTimeentriesEndpoint import ServiceTicketsIdTimeentriesEndpoint
 from pyconnectwise.models.manage import Ticket
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdActivitiesEndpoint import ServiceTicketsIdActivitiesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdAllnotesEndpoint import ServiceTicketsIdAllnotesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdAttachchildrenEndpoint import \
+        ServiceTicketsIdAttachchildrenEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdConfigurationsEndpoint import \
+        ServiceTicketsIdConfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdConvertEndpoint import ServiceTicketsIdConvertEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdDocumentsEndpoint import ServiceTicketsIdDocumentsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdInfoEndpoint import ServiceTicketsIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdMergeEndpoint import ServiceTicketsIdMergeEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdNotesEndpoint import ServiceTicketsIdNotesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdProductsEndpoint import ServiceTicketsIdProductsEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdScheduleentriesEndpoint import \
+        ServiceTicketsIdScheduleentriesEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdTasksEndpoint import ServiceTicketsIdTasksEndpoint
+    from pyconnectwise.endpoints.manage.ServiceTicketsIdTimeentriesEndpoint import ServiceTicketsIdTimeentriesEndpoint
+
 
 class ServiceTicketsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "service/tickets/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
-
-        self.scheduleentries = self._register_child_endpoint(
-            ServiceTicketsIdScheduleentriesEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ServiceTicketsIdInfoEndpoint(client, parent_endpoint=self))
-        self.tasks = self._register_child_endpoint(ServiceTicketsIdTasksEndpoint(client, parent_endpoint=self))
-        self.all_notes = self._register_child_endpoint(ServiceTicketsIdAllnotesEndpoint(client, parent_endpoint=self))
-        self.products = self._register_child_endpoint(ServiceTicketsIdProductsEndpoint(client, parent_endpoint=self))
-        self.timeentries = self._register_child_endpoint(
-            ServiceTicketsIdTimeentriesEndpoint(client, parent_endpoint=self)
-        )
-        self.convert = self._register_child_endpoint(ServiceTicketsIdConvertEndpoint(client, parent_endpoint=self))
-        self.merge = self._register_child_endpoint(ServiceTicketsIdMergeEndpoint(client, parent_endpoint=self))
-        self.notes = self._register_child_endpoint(ServiceTicketsIdNotesEndpoint(client, parent_endpoint=self))
-        self.activities = self._register_child_endpoint(
-            ServiceTicketsIdActivitiesEndpoint(client, parent_endpoint=self)
-        )
-        self.attach_children = self._register_child_endpoint(
-            ServiceTicketsIdAttachchildrenEndpoint(client, parent_endpoint=self)
-        )
-        self.documents = self._register_child_endpoint(ServiceTicketsIdDocumentsEndpoint(client, parent_endpoint=self))
-        self.configurations = self._register_child_endpoint(
-            ServiceTicketsIdConfigurationsEndpoint(client, parent_endpoint=self)
-        )
-
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Ticket]:
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Ticket]:
         """
         Performs a GET request against the /service/tickets/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Ticket]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Ticket,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Ticket, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Ticket:
         """
@@ -78,7 +57,7 @@ class ServiceTicketsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -100,7 +79,7 @@ class ServiceTicketsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Ticket:
         """
@@ -112,4 +91,56 @@ class ServiceTicketsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def scheduleentries(self) -> "ServiceTicketsIdScheduleentriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdScheduleentriesEndpoint")
+
+    @cached_property
+    def info(self) -> "ServiceTicketsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdInfoEndpoint")
+
+    @cached_property
+    def tasks(self) -> "ServiceTicketsIdTasksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdTasksEndpoint")
+
+    @cached_property
+    def all_notes(self) -> "ServiceTicketsIdAllnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdAllnotesEndpoint")
+
+    @cached_property
+    def products(self) -> "ServiceTicketsIdProductsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdProductsEndpoint")
+
+    @cached_property
+    def timeentries(self) -> "ServiceTicketsIdTimeentriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdTimeentriesEndpoint")
+
+    @cached_property
+    def convert(self) -> "ServiceTicketsIdConvertEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdConvertEndpoint")
+
+    @cached_property
+    def merge(self) -> "ServiceTicketsIdMergeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdMergeEndpoint")
+
+    @cached_property
+    def notes(self) -> "ServiceTicketsIdNotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdNotesEndpoint")
+
+    @cached_property
+    def activities(self) -> "ServiceTicketsIdActivitiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdActivitiesEndpoint")
+
+    @cached_property
+    def attach_children(self) -> "ServiceTicketsIdAttachchildrenEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdAttachchildrenEndpoint")
+
+    @cached_property
+    def documents(self) -> "ServiceTicketsIdDocumentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdDocumentsEndpoint")
+
+    @cached_property
+    def configurations(self) -> "ServiceTicketsIdConfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.ServiceTicketsIdConfigurationsEndpoint")
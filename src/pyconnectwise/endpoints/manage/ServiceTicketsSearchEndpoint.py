@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import Ticket
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class ServiceTicketsSearchEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "search"
+    _route = "service/tickets/search"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "search", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Ticket]:
         """
@@ -19,4 +23,4 @@ class ServiceTicketsSearchEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Ticket]: The parsed response data.
         """
-        return self._parse_many(Ticket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_many(Ticket, super()._make_request("POST", data=data, params=params).content)
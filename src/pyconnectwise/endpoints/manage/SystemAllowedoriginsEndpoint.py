@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemAllowedoriginsCountEndpoint import SystemAllowedoriginsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemAllowedoriginsIdEndpoint import SystemAllowedoriginsIdEndpoint
 from pyconnectwise.models.manage import AllowedOrigin
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemAllowedoriginsCountEndpoint import SystemAllowedoriginsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemAllowedoriginsIdEndpoint import SystemAllowedoriginsIdEndpoint
+
 
 class SystemAllowedoriginsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "allowedorigins", parent_endpoint=parent_endpoint)
+    endpoint_base = "allowedorigins"
+    _route = "system/allowedorigins"
 
-        self.count = self._register_child_endpoint(SystemAllowedoriginsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemAllowedoriginsIdEndpoint:
+    def id(self, id: int) -> "SystemAllowedoriginsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemAllowedoriginsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemAllowedoriginsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemAllowedoriginsIdEndpoint: The initialized SystemAllowedoriginsIdEndpoint object.
+            SystemAllowedoriginsIdEndpoint: The SystemAllowedoriginsIdEndpoint view bound to the ID.
         """
-        child = SystemAllowedoriginsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemAllowedoriginsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[AllowedOrigin]:
         """
         Performs a GET request against the /system/allowedorigins endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AllowedOrigin]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AllowedOrigin,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AllowedOrigin, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AllowedOrigin]:
         """
@@ -59,7 +54,7 @@ class SystemAllowedoriginsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AllowedOrigin]: The parsed response data.
         """
-        return self._parse_many(AllowedOrigin, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AllowedOrigin, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> AllowedOrigin:
         """
@@ -71,4 +66,8 @@ class SystemAllowedoriginsEndpoint(ConnectWiseEndpoint):
         Returns:
             AllowedOrigin: The parsed response data.
         """
-        return self._parse_one(AllowedOrigin, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AllowedOrigin, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemAllowedoriginsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAllowedoriginsCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemApimembersCountEndpoint import SystemApimembersCountEndpoint
-from pyconnectwise.endpoints.manage.SystemApimembersDefaultEndpoint import SystemApimembersDefaultEndpoint
-from pyconnectwise.endpoints.manage.SystemApimembersIdEndpoint import SystemApimembersIdEndpoint
 from pyconnectwise.models.manage import ApiMember
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemApimembersCountEndpoint import SystemApimembersCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemApimembersDefaultEndpoint import SystemApimembersDefaultEndpoint
+    from pyconnectwise.endpoints.manage.SystemApimembersIdEndpoint import SystemApimembersIdEndpoint
+
 
 class SystemApimembersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "apiMembers", parent_endpoint=parent_endpoint)
+    endpoint_base = "apiMembers"
+    _route = "system/apiMembers"
 
-        self.default = self._register_child_endpoint(SystemApimembersDefaultEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemApimembersCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemApimembersIdEndpoint:
+    def id(self, id: int) -> "SystemApimembersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemApimembersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemApimembersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemApimembersIdEndpoint: The initialized SystemApimembersIdEndpoint object.
+            SystemApimembersIdEndpoint: The SystemApimembersIdEndpoint view bound to the ID.
         """
-        child = SystemApimembersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemApimembersIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ApiMember]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ApiMember]:
         """
         Performs a GET request against the /system/apiMembers endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ApiMember]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ApiMember,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ApiMember, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ApiMember]:
         """
@@ -59,7 +55,7 @@ class SystemApimembersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ApiMember]: The parsed response data.
         """
-        return self._parse_many(ApiMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ApiMember, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ApiMember:
         """
@@ -71,4 +67,12 @@ class SystemApimembersEndpoint(ConnectWiseEndpoint):
         Returns:
             ApiMember: The parsed response data.
         """
-        return self._parse_one(ApiMember, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ApiMember, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def default(self) -> "SystemApimembersDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemApimembersDefaultEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemApimembersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemApimembersCountEndpoint")
@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemAuthanvilsCountEndpoint import SystemAuthanvilsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemAuthanvilsIdEndpoint import SystemAuthanvilsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemAuthanvilsTestconnectionEndpoint import SystemAuthanvilsTestconnectionEndpoint
 from pyconnectwise.models.manage import AuthAnvil
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemAuthanvilsCountEndpoint import SystemAuthanvilsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemAuthanvilsIdEndpoint import SystemAuthanvilsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemAuthanvilsTestconnectionEndpoint import \
+        SystemAuthanvilsTestconnectionEndpoint
+
 
 class SystemAuthanvilsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "authAnvils", parent_endpoint=parent_endpoint)
+    endpoint_base = "authAnvils"
+    _route = "system/authAnvils"
 
-        self.test_connection = self._register_child_endpoint(
-            SystemAuthanvilsTestconnectionEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(SystemAuthanvilsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemAuthanvilsIdEndpoint:
+    def id(self, id: int) -> "SystemAuthanvilsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemAuthanvilsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemAuthanvilsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemAuthanvilsIdEndpoint: The initialized SystemAuthanvilsIdEndpoint object.
+            SystemAuthanvilsIdEndpoint: The SystemAuthanvilsIdEndpoint view bound to the ID.
         """
-        child = SystemAuthanvilsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemAuthanvilsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[AuthAnvil]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[AuthAnvil]:
         """
         Performs a GET request against the /system/authAnvils endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[AuthAnvil]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            AuthAnvil,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(AuthAnvil, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[AuthAnvil]:
         """
@@ -61,4 +56,12 @@ class SystemAuthanvilsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[AuthAnvil]: The parsed response data.
         """
-        return self._parse_many(AuthAnvil, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AuthAnvil, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def test_connection(self) -> "SystemAuthanvilsTestconnectionEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAuthanvilsTestconnectionEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemAuthanvilsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAuthanvilsCountEndpoint")
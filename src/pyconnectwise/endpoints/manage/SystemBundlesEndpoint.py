@@ -1,16 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemBundlesCountEndpoint import SystemBundlesCountEndpoint
 from pyconnectwise.models.manage import BundleResultsCollection
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemBundlesCountEndpoint import SystemBundlesCountEndpoint
+
 
 class SystemBundlesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "bundles", parent_endpoint=parent_endpoint)
+    endpoint_base = "bundles"
+    _route = "system/bundles"
 
-        self.count = self._register_child_endpoint(SystemBundlesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> BundleResultsCollection:
         """
@@ -22,4 +26,8 @@ class SystemBundlesEndpoint(ConnectWiseEndpoint):
         Returns:
             BundleResultsCollection: The parsed response data.
         """
-        return self._parse_one(BundleResultsCollection, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BundleResultsCollection, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemBundlesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemBundlesCountEndpoint")
@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemCertificationsCountEndpoint import SystemCertificationsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemCertificationsIdEndpoint import SystemCertificationsIdEndpoint
 from pyconnectwise.models.manage import Certification
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemCertificationsCountEndpoint import SystemCertificationsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemCertificationsIdEndpoint import SystemCertificationsIdEndpoint
+
 
 class SystemCertificationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "certifications", parent_endpoint=parent_endpoint)
+    endpoint_base = "certifications"
+    _route = "system/certifications"
 
-        self.count = self._register_child_endpoint(SystemCertificationsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemCertificationsIdEndpoint:
+    def id(self, id: int) -> "SystemCertificationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemCertificationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemCertificationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemCertificationsIdEndpoint: The initialized SystemCertificationsIdEndpoint object.
+            SystemCertificationsIdEndpoint: The SystemCertificationsIdEndpoint view bound to the ID.
         """
-        child = SystemCertificationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemCertificationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[Certification]:
         """
         Performs a GET request against the /system/certifications endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Certification]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Certification,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Certification, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Certification]:
         """
@@ -59,7 +54,7 @@ class SystemCertificationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Certification]: The parsed response data.
         """
-        return self._parse_many(Certification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Certification, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Certification:
         """
@@ -71,4 +66,8 @@ class SystemCertificationsEndpoint(ConnectWiseEndpoint):
         Returns:
             Certification: The parsed response data.
         """
-        return self._parse_one(Certification, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Certification, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemCertificationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemCertificationsCountEndpoint")
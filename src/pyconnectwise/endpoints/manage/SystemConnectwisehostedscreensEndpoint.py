@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensCountEndpoint import \
-    SystemConnectwisehostedscreensCountEndpoint
-from pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensIdEndpoint import \
-    SystemConnectwisehostedscreensIdEndpoint
 from pyconnectwise.models.manage import ConnectWiseHostedScreen
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensCountEndpoint import \
+        SystemConnectwisehostedscreensCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensIdEndpoint import \
+        SystemConnectwisehostedscreensIdEndpoint
+
 
 class SystemConnectwisehostedscreensEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "connectWiseHostedScreens", parent_endpoint=parent_endpoint)
+    endpoint_base = "connectWiseHostedScreens"
+    _route = "system/connectWiseHostedScreens"
 
-        self.count = self._register_child_endpoint(
-            SystemConnectwisehostedscreensCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemConnectwisehostedscreensIdEndpoint:
+    def id(self, id: int) -> "SystemConnectwisehostedscreensIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemConnectwisehostedscreensIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemConnectwisehostedscreensIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemConnectwisehostedscreensIdEndpoint: The initialized SystemConnectwisehostedscreensIdEndpoint object.
+            SystemConnectwisehostedscreensIdEndpoint: The SystemConnectwisehostedscreensIdEndpoint view bound to the ID.
         """
-        child = SystemConnectwisehostedscreensIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ConnectWiseHostedScreen]:
         """
         Performs a GET request against the /system/connectWiseHostedScreens endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ConnectWiseHostedScreen]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ConnectWiseHostedScreen,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ConnectWiseHostedScreen, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ConnectWiseHostedScreen]:
         """
@@ -63,4 +56,8 @@ class SystemConnectwisehostedscreensEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ConnectWiseHostedScreen]: The parsed response data.
         """
-        return self._parse_many(ConnectWiseHostedScreen, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConnectWiseHostedScreen, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemConnectwisehostedscreensCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensCountEndpoint")
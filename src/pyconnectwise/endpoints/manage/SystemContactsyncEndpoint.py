@@ -1,14 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringEndpoint import SystemContactsyncMonitoringEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringEndpoint import SystemContactsyncMonitoringEndpoint
+
 
 class SystemContactsyncEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "contactsync"
+    _route = "system/contactsync"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "contactsync", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.monitoring = self._register_child_endpoint(
-            SystemContactsyncMonitoringEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def monitoring(self) -> "SystemContactsyncMonitoringEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemContactsyncMonitoringEndpoint")
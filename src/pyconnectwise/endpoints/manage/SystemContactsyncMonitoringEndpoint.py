@@ -1,64 +1,54 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringCountEndpoint import \
-    SystemContactsyncMonitoringCountEndpoint
-from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringIdEndpoint import SystemContactsyncMonitoringIdEndpoint
-from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringNotificationtypeEndpoint import \
-    SystemContactsyncMonitoringNotificationtypeEndpoint
-from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringTypeEndpoint import \
-    SystemContactsyncMonitoringTypeEndpoint
 from pyconnectwise.models.manage import M365ContactSyncMonitoring
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringCountEndpoint import \
+        SystemContactsyncMonitoringCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringIdEndpoint import \
+        SystemContactsyncMonitoringIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringNotificationtypeEndpoint import \
+        SystemContactsyncMonitoringNotificationtypeEndpoint
+    from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringTypeEndpoint import \
+        SystemContactsyncMonitoringTypeEndpoint
+
 
 class SystemContactsyncMonitoringEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "monitoring", parent_endpoint=parent_endpoint)
+    endpoint_base = "monitoring"
+    _route = "system/contactsync/monitoring"
 
-        self.type = self._register_child_endpoint(SystemContactsyncMonitoringTypeEndpoint(client, parent_endpoint=self))
-        self.notificationtype = self._register_child_endpoint(
-            SystemContactsyncMonitoringNotificationtypeEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            SystemContactsyncMonitoringCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemContactsyncMonitoringIdEndpoint:
+    def id(self, id: int) -> "SystemContactsyncMonitoringIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemContactsyncMonitoringIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemContactsyncMonitoringIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemContactsyncMonitoringIdEndpoint: The initialized SystemContactsyncMonitoringIdEndpoint object.
+            SystemContactsyncMonitoringIdEndpoint: The SystemContactsyncMonitoringIdEndpoint view bound to the ID.
         """
-        child = SystemContactsyncMonitoringIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemContactsyncMonitoringIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[M365ContactSyncMonitoring]:
         """
         Performs a GET request against the /system/contactsync/monitoring endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[M365ContactSyncMonitoring]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            M365ContactSyncMonitoring,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(M365ContactSyncMonitoring, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[M365ContactSyncMonitoring]:
         """
@@ -71,5 +61,19 @@ class SystemContactsyncMonitoringEndpoint(ConnectWiseEndpoint):
             list[M365ContactSyncMonitoring]: The parsed response data.
         """
         return self._parse_many(
-            M365ContactSyncMonitoring, super()._make_request("GET", data=data, params=params).json()
+            M365ContactSyncMonitoring, super()._make_request("GET", data=data, params=params).content
         )
+
+    @cached_property
+    def type(self) -> "SystemContactsyncMonitoringTypeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemContactsyncMonitoringTypeEndpoint")
+
+    @cached_property
+    def notificationtype(self) -> "SystemContactsyncMonitoringNotificationtypeEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemContactsyncMonitoringNotificationtypeEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "SystemContactsyncMonitoringCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemContactsyncMonitoringCountEndpoint")
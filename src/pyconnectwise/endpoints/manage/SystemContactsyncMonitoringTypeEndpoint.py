@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringTypeIdEndpoint import \
-    SystemContactsyncMonitoringTypeIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringTypeIdEndpoint import \
+        SystemContactsyncMonitoringTypeIdEndpoint
+
 
 class SystemContactsyncMonitoringTypeEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "type"
+    _route = "system/contactsync/monitoring/type"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "type", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemContactsyncMonitoringTypeIdEndpoint:
+    def id(self, id: int) -> "SystemContactsyncMonitoringTypeIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemContactsyncMonitoringTypeIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemContactsyncMonitoringTypeIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemContactsyncMonitoringTypeIdEndpoint: The initialized SystemContactsyncMonitoringTypeIdEndpoint object.
+            SystemContactsyncMonitoringTypeIdEndpoint: The SystemContactsyncMonitoringTypeIdEndpoint view bound to the ID.
         """
-        child = SystemContactsyncMonitoringTypeIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemContactsyncMonitoringTypeIdEndpoint", id)
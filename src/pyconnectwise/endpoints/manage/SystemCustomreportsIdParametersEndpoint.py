@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemCustomreportsIdParametersCountEndpoint import \
-    SystemCustomreportsIdParametersCountEndpoint
-from pyconnectwise.endpoints.manage.SystemCustomreportsIdParametersIdEndpoint import \
-    SystemCustomreportsIdParametersIdEndpoint
 from pyconnectwise.models.manage import CustomReportParameter
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemCustomreportsIdParametersCountEndpoint import \
+        SystemCustomreportsIdParametersCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemCustomreportsIdParametersIdEndpoint import \
+        SystemCustomreportsIdParametersIdEndpoint
+
 
 class SystemCustomreportsIdParametersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "parameters", parent_endpoint=parent_endpoint)
+    endpoint_base = "parameters"
+    _route = "system/customReports/{id}/parameters"
 
-        self.count = self._register_child_endpoint(
-            SystemCustomreportsIdParametersCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemCustomreportsIdParametersIdEndpoint:
+    def id(self, id: int) -> "SystemCustomreportsIdParametersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemCustomreportsIdParametersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemCustomreportsIdParametersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemCustomreportsIdParametersIdEndpoint: The initialized SystemCustomreportsIdParametersIdEndpoint object.
+            SystemCustomreportsIdParametersIdEndpoint: The SystemCustomreportsIdParametersIdEndpoint view bound to the ID.
         """
-        child = SystemCustomreportsIdParametersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemCustomreportsIdParametersIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CustomReportParameter]:
         """
         Performs a GET request against the /system/customReports/{id}/parameters endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CustomReportParameter]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CustomReportParameter,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CustomReportParameter, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CustomReportParameter]:
         """
@@ -63,7 +56,7 @@ class SystemCustomreportsIdParametersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CustomReportParameter]: The parsed response data.
         """
-        return self._parse_many(CustomReportParameter, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CustomReportParameter, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> CustomReportParameter:
         """
@@ -75,4 +68,10 @@ class SystemCustomreportsIdParametersEndpoint(ConnectWiseEndpoint):
         Returns:
             CustomReportParameter: The parsed response data.
         """
-        return self._parse_one(CustomReportParameter, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CustomReportParameter, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemCustomreportsIdParametersCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemCustomreportsIdParametersCountEndpoint"
+        )
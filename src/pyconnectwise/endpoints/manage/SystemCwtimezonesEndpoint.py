@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemCwtimezonesCountEndpoint import SystemCwtimezonesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemCwtimezonesIdEndpoint import SystemCwtimezonesIdEndpoint
 from pyconnectwise.models.manage import CwTimeZone
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemCwtimezonesCountEndpoint import SystemCwtimezonesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemCwtimezonesIdEndpoint import SystemCwtimezonesIdEndpoint
+
 
 class SystemCwtimezonesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "cwTimeZones", parent_endpoint=parent_endpoint)
+    endpoint_base = "cwTimeZones"
+    _route = "system/cwTimeZones"
 
-        self.count = self._register_child_endpoint(SystemCwtimezonesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemCwtimezonesIdEndpoint:
+    def id(self, id: int) -> "SystemCwtimezonesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemCwtimezonesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemCwtimezonesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemCwtimezonesIdEndpoint: The initialized SystemCwtimezonesIdEndpoint object.
+            SystemCwtimezonesIdEndpoint: The SystemCwtimezonesIdEndpoint view bound to the ID.
         """
-        child = SystemCwtimezonesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemCwtimezonesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[CwTimeZone]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[CwTimeZone]:
         """
         Performs a GET request against the /system/cwTimeZones endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CwTimeZone]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CwTimeZone,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CwTimeZone, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CwTimeZone]:
         """
@@ -57,4 +54,8 @@ class SystemCwtimezonesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CwTimeZone]: The parsed response data.
         """
-        return self._parse_many(CwTimeZone, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CwTimeZone, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemCwtimezonesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemCwtimezonesCountEndpoint")
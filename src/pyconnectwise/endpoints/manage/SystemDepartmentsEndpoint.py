@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDepartmentsCountEndpoint import SystemDepartmentsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemDepartmentsIdEndpoint import SystemDepartmentsIdEndpoint
 from pyconnectwise.models.manage import Department
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDepartmentsCountEndpoint import SystemDepartmentsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemDepartmentsIdEndpoint import SystemDepartmentsIdEndpoint
+
 
 class SystemDepartmentsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "departments", parent_endpoint=parent_endpoint)
+    endpoint_base = "departments"
+    _route = "system/departments"
 
-        self.count = self._register_child_endpoint(SystemDepartmentsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemDepartmentsIdEndpoint:
+    def id(self, id: int) -> "SystemDepartmentsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemDepartmentsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemDepartmentsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemDepartmentsIdEndpoint: The initialized SystemDepartmentsIdEndpoint object.
+            SystemDepartmentsIdEndpoint: The SystemDepartmentsIdEndpoint view bound to the ID.
         """
-        child = SystemDepartmentsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemDepartmentsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Department]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Department]:
         """
         Performs a GET request against the /system/departments endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Department]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Department,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Department, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Department]:
         """
@@ -57,7 +54,7 @@ class SystemDepartmentsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Department]: The parsed response data.
         """
-        return self._parse_many(Department, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Department, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Department:
         """
@@ -69,4 +66,8 @@ class SystemDepartmentsEndpoint(ConnectWiseEndpoint):
         Returns:
             Department: The parsed response data.
         """
-        return self._parse_one(Department, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Department, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemDepartmentsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDepartmentsCountEndpoint")
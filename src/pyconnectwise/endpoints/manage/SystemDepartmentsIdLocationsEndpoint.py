@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDepartmentsIdLocationsCountEndpoint import \
-    SystemDepartmentsIdLocationsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemDepartmentsIdLocationsIdEndpoint import SystemDepartmentsIdLocationsIdEndpoint
 from pyconnectwise.models.manage import DepartmentLocation
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDepartmentsIdLocationsCountEndpoint import \
+        SystemDepartmentsIdLocationsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemDepartmentsIdLocationsIdEndpoint import \
+        SystemDepartmentsIdLocationsIdEndpoint
+
 
 class SystemDepartmentsIdLocationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "locations", parent_endpoint=parent_endpoint)
+    endpoint_base = "locations"
+    _route = "system/departments/{id}/locations"
 
-        self.count = self._register_child_endpoint(
-            SystemDepartmentsIdLocationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemDepartmentsIdLocationsIdEndpoint:
+    def id(self, id: int) -> "SystemDepartmentsIdLocationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemDepartmentsIdLocationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemDepartmentsIdLocationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemDepartmentsIdLocationsIdEndpoint: The initialized SystemDepartmentsIdLocationsIdEndpoint object.
+            SystemDepartmentsIdLocationsIdEndpoint: The SystemDepartmentsIdLocationsIdEndpoint view bound to the ID.
         """
-        child = SystemDepartmentsIdLocationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemDepartmentsIdLocationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[DepartmentLocation]:
         """
         Performs a GET request against the /system/departments/{id}/locations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[DepartmentLocation]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            DepartmentLocation,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(DepartmentLocation, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[DepartmentLocation]:
         """
@@ -62,7 +56,7 @@ class SystemDepartmentsIdLocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[DepartmentLocation]: The parsed response data.
         """
-        return self._parse_many(DepartmentLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DepartmentLocation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> DepartmentLocation:
         """
@@ -74,4 +68,8 @@ class SystemDepartmentsIdLocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             DepartmentLocation: The parsed response data.
         """
-        return self._parse_one(DepartmentLocation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(DepartmentLocation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemDepartmentsIdLocationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDepartmentsIdLocationsCountEndpoint")
@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDirectionalsyncsIdEndpoint import SystemDirectionalsyncsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemDirectionalsyncsInfoEndpoint import SystemDirectionalsyncsInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDirectionalsyncsIdEndpoint import SystemDirectionalsyncsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemDirectionalsyncsInfoEndpoint import SystemDirectionalsyncsInfoEndpoint
+
 
 class SystemDirectionalsyncsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "directionalSyncs", parent_endpoint=parent_endpoint)
+    endpoint_base = "directionalSyncs"
+    _route = "system/directionalSyncs"
 
-        self.info = self._register_child_endpoint(SystemDirectionalsyncsInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemDirectionalsyncsIdEndpoint:
+    def id(self, id: int) -> "SystemDirectionalsyncsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemDirectionalsyncsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemDirectionalsyncsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemDirectionalsyncsIdEndpoint: The initialized SystemDirectionalsyncsIdEndpoint object.
+            SystemDirectionalsyncsIdEndpoint: The SystemDirectionalsyncsIdEndpoint view bound to the ID.
         """
-        child = SystemDirectionalsyncsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemDirectionalsyncsIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "SystemDirectionalsyncsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDirectionalsyncsInfoEndpoint")
@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDirectionalsyncsIdInfoEndpoint import SystemDirectionalsyncsIdInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDirectionalsyncsIdInfoEndpoint import SystemDirectionalsyncsIdInfoEndpoint
+
 
 class SystemDirectionalsyncsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/directionalSyncs/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(SystemDirectionalsyncsIdInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> "SystemDirectionalsyncsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDirectionalsyncsIdInfoEndpoint")
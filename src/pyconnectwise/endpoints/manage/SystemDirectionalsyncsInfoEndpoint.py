@@ -1,42 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDirectionalsyncsInfoCountEndpoint import \
-    SystemDirectionalsyncsInfoCountEndpoint
 from pyconnectwise.models.manage import DirectionalSyncInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDirectionalsyncsInfoCountEndpoint import \
+        SystemDirectionalsyncsInfoCountEndpoint
+
 
 class SystemDirectionalsyncsInfoEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
+    endpoint_base = "info"
+    _route = "system/directionalSyncs/info"
 
-        self.count = self._register_child_endpoint(
-            SystemDirectionalsyncsInfoCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[DirectionalSyncInfo]:
         """
         Performs a GET request against the /system/directionalSyncs/info endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[DirectionalSyncInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            DirectionalSyncInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(DirectionalSyncInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[DirectionalSyncInfo]:
         """
@@ -48,4 +43,8 @@ class SystemDirectionalsyncsInfoEndpoint(ConnectWiseEndpoint):
         Returns:
             list[DirectionalSyncInfo]: The parsed response data.
         """
-        return self._parse_many(DirectionalSyncInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DirectionalSyncInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemDirectionalsyncsInfoCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDirectionalsyncsInfoCountEndpoint")
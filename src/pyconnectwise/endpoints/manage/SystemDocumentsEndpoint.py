@@ -1,57 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumentsCountEndpoint import SystemDocumentsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumentsIdEndpoint import SystemDocumentsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumentsUploadsampleEndpoint import SystemDocumentsUploadsampleEndpoint
 from pyconnectwise.models.manage import DocumentInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDocumentsCountEndpoint import SystemDocumentsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemDocumentsIdEndpoint import SystemDocumentsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemDocumentsUploadsampleEndpoint import SystemDocumentsUploadsampleEndpoint
+
 
 class SystemDocumentsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "documents", parent_endpoint=parent_endpoint)
+    endpoint_base = "documents"
+    _route = "system/documents"
 
-        self.count = self._register_child_endpoint(SystemDocumentsCountEndpoint(client, parent_endpoint=self))
-        self.uploadsample = self._register_child_endpoint(
-            SystemDocumentsUploadsampleEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemDocumentsIdEndpoint:
+    def id(self, id: int) -> "SystemDocumentsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemDocumentsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemDocumentsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemDocumentsIdEndpoint: The initialized SystemDocumentsIdEndpoint object.
+            SystemDocumentsIdEndpoint: The SystemDocumentsIdEndpoint view bound to the ID.
         """
-        child = SystemDocumentsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemDocumentsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[DocumentInfo]:
         """
         Performs a GET request against the /system/documents endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[DocumentInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            DocumentInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(DocumentInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[DocumentInfo]:
         """
@@ -63,7 +55,7 @@ class SystemDocumentsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[DocumentInfo]: The parsed response data.
         """
-        return self._parse_many(DocumentInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DocumentInfo, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> DocumentInfo:
         """
@@ -75,4 +67,12 @@ class SystemDocumentsEndpoint(ConnectWiseEndpoint):
         Returns:
             DocumentInfo: The parsed response data.
         """
-        return self._parse_one(DocumentInfo, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(DocumentInfo, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemDocumentsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDocumentsCountEndpoint")
+
+    @cached_property
+    def uploadsample(self) -> "SystemDocumentsUploadsampleEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDocumentsUploadsampleEndpoint")
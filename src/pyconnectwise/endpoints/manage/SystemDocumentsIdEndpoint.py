@@ -1,41 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumentsIdDownloadEndpoint import SystemDocumentsIdDownloadEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumentsIdThumbnailEndpoint import SystemDocumentsIdThumbnailEndpoint
 from pyconnectwise.models.manage import DocumentInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDocumentsIdDownloadEndpoint import SystemDocumentsIdDownloadEndpoint
+    from pyconnectwise.endpoints.manage.SystemDocumentsIdThumbnailEndpoint import SystemDocumentsIdThumbnailEndpoint
+
 
 class SystemDocumentsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/documents/{id}"
 
-        self.download = self._register_child_endpoint(SystemDocumentsIdDownloadEndpoint(client, parent_endpoint=self))
-        self.thumbnail = self._register_child_endpoint(SystemDocumentsIdThumbnailEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[DocumentInfo]:
         """
         Performs a GET request against the /system/documents/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[DocumentInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            DocumentInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(DocumentInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> DocumentInfo:
         """
@@ -47,7 +43,7 @@ class SystemDocumentsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             DocumentInfo: The parsed response data.
         """
-        return self._parse_one(DocumentInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(DocumentInfo, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -69,4 +65,12 @@ class SystemDocumentsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             DocumentInfo: The parsed response data.
         """
-        return self._parse_one(DocumentInfo, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(DocumentInfo, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def download(self) -> "SystemDocumentsIdDownloadEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDocumentsIdDownloadEndpoint")
+
+    @cached_property
+    def thumbnail(self) -> "SystemDocumentsIdThumbnailEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDocumentsIdThumbnailEndpoint")
@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumenttypesIdEndpoint import SystemDocumenttypesIdEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumenttypesInfoEndpoint import SystemDocumenttypesInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDocumenttypesIdEndpoint import SystemDocumenttypesIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemDocumenttypesInfoEndpoint import SystemDocumenttypesInfoEndpoint
+
 
 class SystemDocumenttypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "documentTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "documentTypes"
+    _route = "system/documentTypes"
 
-        self.info = self._register_child_endpoint(SystemDocumenttypesInfoEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemDocumenttypesIdEndpoint:
+    def id(self, id: int) -> "SystemDocumenttypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemDocumenttypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemDocumenttypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemDocumenttypesIdEndpoint: The initialized SystemDocumenttypesIdEndpoint object.
+            SystemDocumenttypesIdEndpoint: The SystemDocumenttypesIdEndpoint view bound to the ID.
         """
-        child = SystemDocumenttypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemDocumenttypesIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "SystemDocumenttypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDocumenttypesInfoEndpoint")
@@ -1,12 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumenttypesIdInfoEndpoint import SystemDocumenttypesIdInfoEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemDocumenttypesIdInfoEndpoint import SystemDocumenttypesIdInfoEndpoint
+
 
 class SystemDocumenttypesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/documentTypes/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(SystemDocumenttypesIdInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> "SystemDocumenttypesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDocumenttypesIdInfoEndpoint")
@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsCountEndpoint import SystemEmailconnectorsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdEndpoint import SystemEmailconnectorsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsInfoEndpoint import SystemEmailconnectorsInfoEndpoint
 from pyconnectwise.models.manage import EmailConnector
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsCountEndpoint import SystemEmailconnectorsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdEndpoint import SystemEmailconnectorsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsInfoEndpoint import SystemEmailconnectorsInfoEndpoint
+
 
 class SystemEmailconnectorsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "emailConnectors", parent_endpoint=parent_endpoint)
+    endpoint_base = "emailConnectors"
+    _route = "system/emailConnectors"
 
-        self.info = self._register_child_endpoint(SystemEmailconnectorsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemEmailconnectorsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemEmailconnectorsIdEndpoint:
+    def id(self, id: int) -> "SystemEmailconnectorsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemEmailconnectorsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemEmailconnectorsIdEndpoint: The initialized SystemEmailconnectorsIdEndpoint object.
+            SystemEmailconnectorsIdEndpoint: The SystemEmailconnectorsIdEndpoint view bound to the ID.
         """
-        child = SystemEmailconnectorsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemEmailconnectorsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[EmailConnector]:
         """
         Performs a GET request against the /system/emailConnectors endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[EmailConnector]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            EmailConnector,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(EmailConnector, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[EmailConnector]:
         """
@@ -61,7 +55,7 @@ class SystemEmailconnectorsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[EmailConnector]: The parsed response data.
         """
-        return self._parse_many(EmailConnector, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EmailConnector, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EmailConnector:
         """
@@ -73,4 +67,12 @@ class SystemEmailconnectorsEndpoint(ConnectWiseEndpoint):
         Returns:
             EmailConnector: The parsed response data.
         """
-        return self._parse_one(EmailConnector, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(EmailConnector, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemEmailconnectorsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemEmailconnectorsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemEmailconnectorsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemEmailconnectorsCountEndpoint")
@@ -1,44 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdInfoEndpoint import SystemEmailconnectorsIdInfoEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesEndpoint import \
-    SystemEmailconnectorsIdParsingstylesEndpoint
 from pyconnectwise.models.manage import EmailConnector
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdInfoEndpoint import SystemEmailconnectorsIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesEndpoint import \
+        SystemEmailconnectorsIdParsingstylesEndpoint
+
 
 class SystemEmailconnectorsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/emailConnectors/{id}"
 
-        self.info = self._register_child_endpoint(SystemEmailconnectorsIdInfoEndpoint(client, parent_endpoint=self))
-        self.parsing_styles = self._register_child_endpoint(
-            SystemEmailconnectorsIdParsingstylesEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[EmailConnector]:
         """
         Performs a GET request against the /system/emailConnectors/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[EmailConnector]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            EmailConnector,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(EmailConnector, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EmailConnector:
         """
@@ -50,7 +44,7 @@ class SystemEmailconnectorsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             EmailConnector: The parsed response data.
         """
-        return self._parse_one(EmailConnector, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(EmailConnector, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -72,7 +66,7 @@ class SystemEmailconnectorsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             EmailConnector: The parsed response data.
         """
-        return self._parse_one(EmailConnector, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(EmailConnector, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EmailConnector:
         """
@@ -84,4 +78,14 @@ class SystemEmailconnectorsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             EmailConnector: The parsed response data.
         """
-        return self._parse_one(EmailConnector, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(EmailConnector, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemEmailconnectorsIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemEmailconnectorsIdInfoEndpoint")
+
+    @cached_property
+    def parsing_styles(self) -> "SystemEmailconnectorsIdParsingstylesEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesEndpoint"
+        )
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesCountEndpoint import \
-    SystemEmailconnectorsIdParsingstylesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdEndpoint import \
-    SystemEmailconnectorsIdParsingstylesIdEndpoint
 from pyconnectwise.models.manage import EmailConnectorParsingStyle
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesCountEndpoint import \
+        SystemEmailconnectorsIdParsingstylesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdEndpoint import \
+        SystemEmailconnectorsIdParsingstylesIdEndpoint
+
 
 class SystemEmailconnectorsIdParsingstylesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "parsingStyles", parent_endpoint=parent_endpoint)
+    endpoint_base = "parsingStyles"
+    _route = "system/emailConnectors/{id}/parsingStyles"
 
-        self.count = self._register_child_endpoint(
-            SystemEmailconnectorsIdParsingstylesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemEmailconnectorsIdParsingstylesIdEndpoint:
+    def id(self, id: int) -> "SystemEmailconnectorsIdParsingstylesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdParsingstylesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemEmailconnectorsIdParsingstylesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemEmailconnectorsIdParsingstylesIdEndpoint: The initialized SystemEmailconnectorsIdParsingstylesIdEndpoint object.
+            SystemEmailconnectorsIdParsingstylesIdEndpoint: The SystemEmailconnectorsIdParsingstylesIdEndpoint view bound to the ID.
         """
-        child = SystemEmailconnectorsIdParsingstylesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[EmailConnectorParsingStyle]:
         """
         Performs a GET request against the /system/emailConnectors/{id}/parsingStyles endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[EmailConnectorParsingStyle]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            EmailConnectorParsingStyle,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(EmailConnectorParsingStyle, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[EmailConnectorParsingStyle]:
         """
@@ -64,7 +57,7 @@ class SystemEmailconnectorsIdParsingstylesEndpoint(ConnectWiseEndpoint):
             list[EmailConnectorParsingStyle]: The parsed response data.
         """
         return self._parse_many(
-            EmailConnectorParsingStyle, super()._make_request("GET", data=data, params=params).json()
+            EmailConnectorParsingStyle, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EmailConnectorParsingStyle:
@@ -78,5 +71,11 @@ class SystemEmailconnectorsIdParsingstylesEndpoint(ConnectWiseEndpoint):
             EmailConnectorParsingStyle: The parsed response data.
         """
         return self._parse_one(
-            EmailConnectorParsingStyle, super()._make_request("POST", data=data, params=params).json()
+            EmailConnectorParsingStyle, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "SystemEmailconnectorsIdParsingstylesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesCountEndpoint"
         )
@@ -1,57 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint import \
-    SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint import \
-    SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint
 from pyconnectwise.models.manage import EmailConnectorParsingRule
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint import \
+        SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint import \
+        SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint
+
 
 class SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "parsingRules", parent_endpoint=parent_endpoint)
+    endpoint_base = "parsingRules"
+    _route = "system/emailConnectors/{id}/parsingStyles/{id}/parsingRules"
 
-        self.count = self._register_child_endpoint(
-            SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint:
+    def id(self, id: int) -> "SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint: The initialized SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint object.
+            SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint: The SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint view bound to the ID.
         """
-        child = SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint", id
+        )
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[EmailConnectorParsingRule]:
         """
         Performs a GET request against the /system/emailConnectors/{id}/parsingStyles/{id}/parsingRules endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[EmailConnectorParsingRule]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            EmailConnectorParsingRule,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(EmailConnectorParsingRule, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[EmailConnectorParsingRule]:
         """
@@ -64,7 +59,7 @@ class SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(ConnectWiseEndp
             list[EmailConnectorParsingRule]: The parsed response data.
         """
         return self._parse_many(
-            EmailConnectorParsingRule, super()._make_request("GET", data=data, params=params).json()
+            EmailConnectorParsingRule, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EmailConnectorParsingRule:
@@ -78,5 +73,11 @@ class SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(ConnectWiseEndp
             EmailConnectorParsingRule: The parsed response data.
         """
         return self._parse_one(
-            EmailConnectorParsingRule, super()._make_request("POST", data=data, params=params).json()
+            EmailConnectorParsingRule, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint"
         )
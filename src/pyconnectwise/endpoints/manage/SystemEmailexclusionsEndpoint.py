@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailexclusionsCountEndpoint import SystemEmailexclusionsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailexclusionsIdEndpoint import SystemEmailexclusionsIdEndpoint
 from pyconnectwise.models.manage import EmailExclusion
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemEmailexclusionsCountEndpoint import SystemEmailexclusionsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailexclusionsIdEndpoint import SystemEmailexclusionsIdEndpoint
+
 
 class SystemEmailexclusionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "emailExclusions", parent_endpoint=parent_endpoint)
+    endpoint_base = "emailExclusions"
+    _route = "system/emailExclusions"
 
-        self.count = self._register_child_endpoint(SystemEmailexclusionsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemEmailexclusionsIdEndpoint:
+    def id(self, id: int) -> "SystemEmailexclusionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemEmailexclusionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemEmailexclusionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemEmailexclusionsIdEndpoint: The initialized SystemEmailexclusionsIdEndpoint object.
+            SystemEmailexclusionsIdEndpoint: The SystemEmailexclusionsIdEndpoint view bound to the ID.
         """
-        child = SystemEmailexclusionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemEmailexclusionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[EmailExclusion]:
         """
         Performs a GET request against the /system/emailExclusions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[EmailExclusion]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            EmailExclusion,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(EmailExclusion, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[EmailExclusion]:
         """
@@ -59,7 +54,7 @@ class SystemEmailexclusionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[EmailExclusion]: The parsed response data.
         """
-        return self._parse_many(EmailExclusion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EmailExclusion, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> EmailExclusion:
         """
@@ -71,4 +66,8 @@ class SystemEmailexclusionsEndpoint(ConnectWiseEndpoint):
         Returns:
             EmailExclusion: The parsed response data.
         """
-        return self._parse_one(EmailExclusion, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(EmailExclusion, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemEmailexclusionsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemEmailexclusionsCountEndpoint")
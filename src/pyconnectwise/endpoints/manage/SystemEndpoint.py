@@ -1,211 +1,389 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemAllowedfiletypesEndpoint import SystemAllowedfiletypesEndpoint
-from pyconnectwise.endpoints.manage.SystemAllowedoriginsEndpoint import SystemAllowedoriginsEndpoint
-from pyconnectwise.endpoints.manage.SystemApimembersEndpoint import SystemApimembersEndpoint
-from pyconnectwise.endpoints.manage.SystemAudittrailEndpoint import SystemAudittrailEndpoint
-from pyconnectwise.endpoints.manage.SystemAuthanvilsEndpoint import SystemAuthanvilsEndpoint
-from pyconnectwise.endpoints.manage.SystemAutosynctimeEndpoint import SystemAutosynctimeEndpoint
-from pyconnectwise.endpoints.manage.SystemBundlesEndpoint import SystemBundlesEndpoint
-from pyconnectwise.endpoints.manage.SystemCallbacksEndpoint import SystemCallbacksEndpoint
-from pyconnectwise.endpoints.manage.SystemCertificationsEndpoint import SystemCertificationsEndpoint
-from pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensEndpoint import SystemConnectwisehostedscreensEndpoint
-from pyconnectwise.endpoints.manage.SystemConnectwisehostedsetupsEndpoint import SystemConnectwisehostedsetupsEndpoint
-from pyconnectwise.endpoints.manage.SystemContactsyncEndpoint import SystemContactsyncEndpoint
-from pyconnectwise.endpoints.manage.SystemCustomreportsEndpoint import SystemCustomreportsEndpoint
-from pyconnectwise.endpoints.manage.SystemCwtimezonesEndpoint import SystemCwtimezonesEndpoint
-from pyconnectwise.endpoints.manage.SystemDepartmentsEndpoint import SystemDepartmentsEndpoint
-from pyconnectwise.endpoints.manage.SystemDirectionalsyncsEndpoint import SystemDirectionalsyncsEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumentsEndpoint import SystemDocumentsEndpoint
-from pyconnectwise.endpoints.manage.SystemDocumenttypesEndpoint import SystemDocumenttypesEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailconnectorsEndpoint import SystemEmailconnectorsEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailexclusionsEndpoint import SystemEmailexclusionsEndpoint
-from pyconnectwise.endpoints.manage.SystemEmailtokensEndpoint import SystemEmailtokensEndpoint
-from pyconnectwise.endpoints.manage.SystemEpayconfigurationsEndpoint import SystemEpayconfigurationsEndpoint
-from pyconnectwise.endpoints.manage.SystemExperimentsEndpoint import SystemExperimentsEndpoint
-from pyconnectwise.endpoints.manage.SystemFileuploadsettingsEndpoint import SystemFileuploadsettingsEndpoint
-from pyconnectwise.endpoints.manage.SystemGoogleemailsetupEndpoint import SystemGoogleemailsetupEndpoint
-from pyconnectwise.endpoints.manage.SystemImapsEndpoint import SystemImapsEndpoint
-from pyconnectwise.endpoints.manage.SystemImportmassmaintenanceEndpoint import SystemImportmassmaintenanceEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoEndpoint import SystemInfoEndpoint
-from pyconnectwise.endpoints.manage.SystemInoutboardsEndpoint import SystemInoutboardsEndpoint
-from pyconnectwise.endpoints.manage.SystemInouttypesEndpoint import SystemInouttypesEndpoint
-from pyconnectwise.endpoints.manage.SystemIntegratorloginsEndpoint import SystemIntegratorloginsEndpoint
-from pyconnectwise.endpoints.manage.SystemIntegratortagsEndpoint import SystemIntegratortagsEndpoint
-from pyconnectwise.endpoints.manage.SystemKpicategoriesEndpoint import SystemKpicategoriesEndpoint
-from pyconnectwise.endpoints.manage.SystemKpisEndpoint import SystemKpisEndpoint
-from pyconnectwise.endpoints.manage.SystemLdapconfigurationsEndpoint import SystemLdapconfigurationsEndpoint
-from pyconnectwise.endpoints.manage.SystemLinksEndpoint import SystemLinksEndpoint
-from pyconnectwise.endpoints.manage.SystemLocationsEndpoint import SystemLocationsEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncEndpoint import SystemM365contactsyncEndpoint
-from pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesEndpoint import \
-    SystemManagementnetworksecuritiesEndpoint
-from pyconnectwise.endpoints.manage.SystemMarketplaceimportEndpoint import SystemMarketplaceimportEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersEndpoint import SystemMembersEndpoint
-from pyconnectwise.endpoints.manage.SystemMembertemplatesEndpoint import SystemMembertemplatesEndpoint
-from pyconnectwise.endpoints.manage.SystemMenuentriesEndpoint import SystemMenuentriesEndpoint
-from pyconnectwise.endpoints.manage.SystemMyaccountEndpoint import SystemMyaccountEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyEndpoint import SystemMycompanyEndpoint
-from pyconnectwise.endpoints.manage.SystemMymembersEndpoint import SystemMymembersEndpoint
-from pyconnectwise.endpoints.manage.SystemMysecurityEndpoint import SystemMysecurityEndpoint
-from pyconnectwise.endpoints.manage.SystemNotificationrecipientsEndpoint import SystemNotificationrecipientsEndpoint
-from pyconnectwise.endpoints.manage.SystemOffice365Endpoint import SystemOffice365Endpoint
-from pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingEndpoint import SystemOnpremisesearchsettingEndpoint
-from pyconnectwise.endpoints.manage.SystemOsgradeweightsEndpoint import SystemOsgradeweightsEndpoint
-from pyconnectwise.endpoints.manage.SystemParsingtypesEndpoint import SystemParsingtypesEndpoint
-from pyconnectwise.endpoints.manage.SystemParsingvariablesEndpoint import SystemParsingvariablesEndpoint
-from pyconnectwise.endpoints.manage.SystemPortalreportsEndpoint import SystemPortalreportsEndpoint
-from pyconnectwise.endpoints.manage.SystemQuotelinksetupEndpoint import SystemQuotelinksetupEndpoint
-from pyconnectwise.endpoints.manage.SystemReportcardsEndpoint import SystemReportcardsEndpoint
-from pyconnectwise.endpoints.manage.SystemReportsEndpoint import SystemReportsEndpoint
-from pyconnectwise.endpoints.manage.SystemSecurityrolesEndpoint import SystemSecurityrolesEndpoint
-from pyconnectwise.endpoints.manage.SystemSettingsEndpoint import SystemSettingsEndpoint
-from pyconnectwise.endpoints.manage.SystemSetupscreensEndpoint import SystemSetupscreensEndpoint
-from pyconnectwise.endpoints.manage.SystemSkillcategoriesEndpoint import SystemSkillcategoriesEndpoint
-from pyconnectwise.endpoints.manage.SystemSkillsEndpoint import SystemSkillsEndpoint
-from pyconnectwise.endpoints.manage.SystemSsoconfigurationsEndpoint import SystemSsoconfigurationsEndpoint
-from pyconnectwise.endpoints.manage.SystemSsousersEndpoint import SystemSsousersEndpoint
-from pyconnectwise.endpoints.manage.SystemStandardnotesEndpoint import SystemStandardnotesEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysEndpoint import SystemSurveysEndpoint
-from pyconnectwise.endpoints.manage.SystemTimezonesetupsEndpoint import SystemTimezonesetupsEndpoint
-from pyconnectwise.endpoints.manage.SystemTodaypagecategoriesEndpoint import SystemTodaypagecategoriesEndpoint
-from pyconnectwise.endpoints.manage.SystemUserdefinedfieldsEndpoint import SystemUserdefinedfieldsEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowactionsEndpoint import SystemWorkflowactionsEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsEndpoint import SystemWorkflowsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemAllowedfiletypesEndpoint import SystemAllowedfiletypesEndpoint
+    from pyconnectwise.endpoints.manage.SystemAllowedoriginsEndpoint import SystemAllowedoriginsEndpoint
+    from pyconnectwise.endpoints.manage.SystemApimembersEndpoint import SystemApimembersEndpoint
+    from pyconnectwise.endpoints.manage.SystemAudittrailEndpoint import SystemAudittrailEndpoint
+    from pyconnectwise.endpoints.manage.SystemAuthanvilsEndpoint import SystemAuthanvilsEndpoint
+    from pyconnectwise.endpoints.manage.SystemAutosynctimeEndpoint import SystemAutosynctimeEndpoint
+    from pyconnectwise.endpoints.manage.SystemBundlesEndpoint import SystemBundlesEndpoint
+    from pyconnectwise.endpoints.manage.SystemCallbacksEndpoint import SystemCallbacksEndpoint
+    from pyconnectwise.endpoints.manage.SystemCertificationsEndpoint import SystemCertificationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensEndpoint import \
+        SystemConnectwisehostedscreensEndpoint
+    from pyconnectwise.endpoints.manage.SystemConnectwisehostedsetupsEndpoint import \
+        SystemConnectwisehostedsetupsEndpoint
+    from pyconnectwise.endpoints.manage.SystemContactsyncEndpoint import SystemContactsyncEndpoint
+    from pyconnectwise.endpoints.manage.SystemCustomreportsEndpoint import SystemCustomreportsEndpoint
+    from pyconnectwise.endpoints.manage.SystemCwtimezonesEndpoint import SystemCwtimezonesEndpoint
+    from pyconnectwise.endpoints.manage.SystemDepartmentsEndpoint import SystemDepartmentsEndpoint
+    from pyconnectwise.endpoints.manage.SystemDirectionalsyncsEndpoint import SystemDirectionalsyncsEndpoint
+    from pyconnectwise.endpoints.manage.SystemDocumentsEndpoint import SystemDocumentsEndpoint
+    from pyconnectwise.endpoints.manage.SystemDocumenttypesEndpoint import SystemDocumenttypesEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailconnectorsEndpoint import SystemEmailconnectorsEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailexclusionsEndpoint import SystemEmailexclusionsEndpoint
+    from pyconnectwise.endpoints.manage.SystemEmailtokensEndpoint import SystemEmailtokensEndpoint
+    from pyconnectwise.endpoints.manage.SystemEpayconfigurationsEndpoint import SystemEpayconfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemExperimentsEndpoint import SystemExperimentsEndpoint
+    from pyconnectwise.endpoints.manage.SystemFileuploadsettingsEndpoint import SystemFileuploadsettingsEndpoint
+    from pyconnectwise.endpoints.manage.SystemGoogleemailsetupEndpoint import SystemGoogleemailsetupEndpoint
+    from pyconnectwise.endpoints.manage.SystemImapsEndpoint import SystemImapsEndpoint
+    from pyconnectwise.endpoints.manage.SystemImportmassmaintenanceEndpoint import SystemImportmassmaintenanceEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoEndpoint import SystemInfoEndpoint
+    from pyconnectwise.endpoints.manage.SystemInoutboardsEndpoint import SystemInoutboardsEndpoint
+    from pyconnectwise.endpoints.manage.SystemInouttypesEndpoint import SystemInouttypesEndpoint
+    from pyconnectwise.endpoints.manage.SystemIntegratorloginsEndpoint import SystemIntegratorloginsEndpoint
+    from pyconnectwise.endpoints.manage.SystemIntegratortagsEndpoint import SystemIntegratortagsEndpoint
+    from pyconnectwise.endpoints.manage.SystemKpicategoriesEndpoint import SystemKpicategoriesEndpoint
+    from pyconnectwise.endpoints.manage.SystemKpisEndpoint import SystemKpisEndpoint
+    from pyconnectwise.endpoints.manage.SystemLdapconfigurationsEndpoint import SystemLdapconfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemLinksEndpoint import SystemLinksEndpoint
+    from pyconnectwise.endpoints.manage.SystemLocationsEndpoint import SystemLocationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncEndpoint import SystemM365contactsyncEndpoint
+    from pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesEndpoint import \
+        SystemManagementnetworksecuritiesEndpoint
+    from pyconnectwise.endpoints.manage.SystemMarketplaceimportEndpoint import SystemMarketplaceimportEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersEndpoint import SystemMembersEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembertemplatesEndpoint import SystemMembertemplatesEndpoint
+    from pyconnectwise.endpoints.manage.SystemMenuentriesEndpoint import SystemMenuentriesEndpoint
+    from pyconnectwise.endpoints.manage.SystemMyaccountEndpoint import SystemMyaccountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyEndpoint import SystemMycompanyEndpoint
+    from pyconnectwise.endpoints.manage.SystemMymembersEndpoint import SystemMymembersEndpoint
+    from pyconnectwise.endpoints.manage.SystemMysecurityEndpoint import SystemMysecurityEndpoint
+    from pyconnectwise.endpoints.manage.SystemNotificationrecipientsEndpoint import SystemNotificationrecipientsEndpoint
+    from pyconnectwise.endpoints.manage.SystemOffice365Endpoint import SystemOffice365Endpoint
+    from pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingEndpoint import SystemOnpremisesearchsettingEndpoint
+    from pyconnectwise.endpoints.manage.SystemOsgradeweightsEndpoint import SystemOsgradeweightsEndpoint
+    from pyconnectwise.endpoints.manage.SystemParsingtypesEndpoint import SystemParsingtypesEndpoint
+    from pyconnectwise.endpoints.manage.SystemParsingvariablesEndpoint import SystemParsingvariablesEndpoint
+    from pyconnectwise.endpoints.manage.SystemPortalreportsEndpoint import SystemPortalreportsEndpoint
+    from pyconnectwise.endpoints.manage.SystemQuotelinksetupEndpoint import SystemQuotelinksetupEndpoint
+    from pyconnectwise.endpoints.manage.SystemReportcardsEndpoint import SystemReportcardsEndpoint
+    from pyconnectwise.endpoints.manage.SystemReportsEndpoint import SystemReportsEndpoint
+    from pyconnectwise.endpoints.manage.SystemSecurityrolesEndpoint import SystemSecurityrolesEndpoint
+    from pyconnectwise.endpoints.manage.SystemSettingsEndpoint import SystemSettingsEndpoint
+    from pyconnectwise.endpoints.manage.SystemSetupscreensEndpoint import SystemSetupscreensEndpoint
+    from pyconnectwise.endpoints.manage.SystemSkillcategoriesEndpoint import SystemSkillcategoriesEndpoint
+    from pyconnectwise.endpoints.manage.SystemSkillsEndpoint import SystemSkillsEndpoint
+    from pyconnectwise.endpoints.manage.SystemSsoconfigurationsEndpoint import SystemSsoconfigurationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemSsousersEndpoint import SystemSsousersEndpoint
+    from pyconnectwise.endpoints.manage.SystemStandardnotesEndpoint import SystemStandardnotesEndpoint
+    from pyconnectwise.endpoints.manage.SystemSurveysEndpoint import SystemSurveysEndpoint
+    from pyconnectwise.endpoints.manage.SystemTimezonesetupsEndpoint import SystemTimezonesetupsEndpoint
+    from pyconnectwise.endpoints.manage.SystemTodaypagecategoriesEndpoint import SystemTodaypagecategoriesEndpoint
+    from pyconnectwise.endpoints.manage.SystemUserdefinedfieldsEndpoint import SystemUserdefinedfieldsEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowactionsEndpoint import SystemWorkflowactionsEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsEndpoint import SystemWorkflowsEndpoint
+
 
 class SystemEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "system"
+    _route = "system"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "system", parent_endpoint=parent_endpoint)
-
-        self.membertemplates = self._register_child_endpoint(
-            SystemMembertemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.directional_syncs = self._register_child_endpoint(
-            SystemDirectionalsyncsEndpoint(client, parent_endpoint=self)
-        )
-        self.notification_recipients = self._register_child_endpoint(
-            SystemNotificationrecipientsEndpoint(client, parent_endpoint=self)
-        )
-        self.imaps = self._register_child_endpoint(SystemImapsEndpoint(client, parent_endpoint=self))
-        self.ldap_configurations = self._register_child_endpoint(
-            SystemLdapconfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.menuentries = self._register_child_endpoint(SystemMenuentriesEndpoint(client, parent_endpoint=self))
-        self.fileuploadsettings = self._register_child_endpoint(
-            SystemFileuploadsettingsEndpoint(client, parent_endpoint=self)
-        )
-        self.securityroles = self._register_child_endpoint(SystemSecurityrolesEndpoint(client, parent_endpoint=self))
-        self.office365 = self._register_child_endpoint(SystemOffice365Endpoint(client, parent_endpoint=self))
-        self.quote_link_setup = self._register_child_endpoint(
-            SystemQuotelinksetupEndpoint(client, parent_endpoint=self)
-        )
-        self.setup_screens = self._register_child_endpoint(SystemSetupscreensEndpoint(client, parent_endpoint=self))
-        self.connectwisehostedsetups = self._register_child_endpoint(
-            SystemConnectwisehostedsetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.workflows = self._register_child_endpoint(SystemWorkflowsEndpoint(client, parent_endpoint=self))
-        self.skills = self._register_child_endpoint(SystemSkillsEndpoint(client, parent_endpoint=self))
-        self.my_members = self._register_child_endpoint(SystemMymembersEndpoint(client, parent_endpoint=self))
-        self.marketplaceimport = self._register_child_endpoint(
-            SystemMarketplaceimportEndpoint(client, parent_endpoint=self)
-        )
-        self.in_out_boards = self._register_child_endpoint(SystemInoutboardsEndpoint(client, parent_endpoint=self))
-        self.email_connectors = self._register_child_endpoint(
-            SystemEmailconnectorsEndpoint(client, parent_endpoint=self)
-        )
-        self.auth_anvils = self._register_child_endpoint(SystemAuthanvilsEndpoint(client, parent_endpoint=self))
-        self.osgradeweights = self._register_child_endpoint(SystemOsgradeweightsEndpoint(client, parent_endpoint=self))
-        self.contactsync = self._register_child_endpoint(SystemContactsyncEndpoint(client, parent_endpoint=self))
-        self.experiments = self._register_child_endpoint(SystemExperimentsEndpoint(client, parent_endpoint=self))
-        self.sso_users = self._register_child_endpoint(SystemSsousersEndpoint(client, parent_endpoint=self))
-        self.bundles = self._register_child_endpoint(SystemBundlesEndpoint(client, parent_endpoint=self))
-        self.report_cards = self._register_child_endpoint(SystemReportcardsEndpoint(client, parent_endpoint=self))
-        self.callbacks = self._register_child_endpoint(SystemCallbacksEndpoint(client, parent_endpoint=self))
-        self.allowedfiletypes = self._register_child_endpoint(
-            SystemAllowedfiletypesEndpoint(client, parent_endpoint=self)
-        )
-        self.integratorlogins = self._register_child_endpoint(
-            SystemIntegratorloginsEndpoint(client, parent_endpoint=self)
-        )
-        self.import_mass_maintenance = self._register_child_endpoint(
-            SystemImportmassmaintenanceEndpoint(client, parent_endpoint=self)
-        )
-        self.audittrail = self._register_child_endpoint(SystemAudittrailEndpoint(client, parent_endpoint=self))
-        self.departments = self._register_child_endpoint(SystemDepartmentsEndpoint(client, parent_endpoint=self))
-        self.members = self._register_child_endpoint(SystemMembersEndpoint(client, parent_endpoint=self))
-        self.sso_configurations = self._register_child_endpoint(
-            SystemSsoconfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.time_zone_setups = self._register_child_endpoint(
-            SystemTimezonesetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.workflow_actions = self._register_child_endpoint(
-            SystemWorkflowactionsEndpoint(client, parent_endpoint=self)
-        )
-        self.portal_reports = self._register_child_endpoint(SystemPortalreportsEndpoint(client, parent_endpoint=self))
-        self.menu_entries = self._register_child_endpoint(SystemMenuentriesEndpoint(client, parent_endpoint=self))
-        self.parsing_types = self._register_child_endpoint(SystemParsingtypesEndpoint(client, parent_endpoint=self))
-        self.standard_notes = self._register_child_endpoint(SystemStandardnotesEndpoint(client, parent_endpoint=self))
-        self.custom_reports = self._register_child_endpoint(SystemCustomreportsEndpoint(client, parent_endpoint=self))
-        self.document_types = self._register_child_endpoint(SystemDocumenttypesEndpoint(client, parent_endpoint=self))
-        self.connect_wise_hosted_screens = self._register_child_endpoint(
-            SystemConnectwisehostedscreensEndpoint(client, parent_endpoint=self)
-        )
-        self.email_tokens = self._register_child_endpoint(SystemEmailtokensEndpoint(client, parent_endpoint=self))
-        self.documents = self._register_child_endpoint(SystemDocumentsEndpoint(client, parent_endpoint=self))
-        self.my_company = self._register_child_endpoint(SystemMycompanyEndpoint(client, parent_endpoint=self))
-        self.security_roles = self._register_child_endpoint(SystemSecurityrolesEndpoint(client, parent_endpoint=self))
-        self.my_security = self._register_child_endpoint(SystemMysecurityEndpoint(client, parent_endpoint=self))
-        self.settings = self._register_child_endpoint(SystemSettingsEndpoint(client, parent_endpoint=self))
-        self.googleemailsetup = self._register_child_endpoint(
-            SystemGoogleemailsetupEndpoint(client, parent_endpoint=self)
-        )
-        self.surveys = self._register_child_endpoint(SystemSurveysEndpoint(client, parent_endpoint=self))
-        self.certifications = self._register_child_endpoint(SystemCertificationsEndpoint(client, parent_endpoint=self))
-        self.mycompany = self._register_child_endpoint(SystemMycompanyEndpoint(client, parent_endpoint=self))
-        self.today_page_categories = self._register_child_endpoint(
-            SystemTodaypagecategoriesEndpoint(client, parent_endpoint=self)
-        )
-        self.locations = self._register_child_endpoint(SystemLocationsEndpoint(client, parent_endpoint=self))
-        self.api_members = self._register_child_endpoint(SystemApimembersEndpoint(client, parent_endpoint=self))
-        self.in_out_types = self._register_child_endpoint(SystemInouttypesEndpoint(client, parent_endpoint=self))
-        self.on_premise_search_setting = self._register_child_endpoint(
-            SystemOnpremisesearchsettingEndpoint(client, parent_endpoint=self)
-        )
-        self.skill_categories = self._register_child_endpoint(
-            SystemSkillcategoriesEndpoint(client, parent_endpoint=self)
-        )
-        self.email_exclusions = self._register_child_endpoint(
-            SystemEmailexclusionsEndpoint(client, parent_endpoint=self)
-        )
-        self.links = self._register_child_endpoint(SystemLinksEndpoint(client, parent_endpoint=self))
-        self.auto_sync_time = self._register_child_endpoint(SystemAutosynctimeEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemInfoEndpoint(client, parent_endpoint=self))
-        self.allowed_file_types = self._register_child_endpoint(
-            SystemAllowedfiletypesEndpoint(client, parent_endpoint=self)
-        )
-        self.kpis = self._register_child_endpoint(SystemKpisEndpoint(client, parent_endpoint=self))
-        self.management_network_securities = self._register_child_endpoint(
-            SystemManagementnetworksecuritiesEndpoint(client, parent_endpoint=self)
-        )
-        self.cw_time_zones = self._register_child_endpoint(SystemCwtimezonesEndpoint(client, parent_endpoint=self))
-        self.user_defined_fields = self._register_child_endpoint(
-            SystemUserdefinedfieldsEndpoint(client, parent_endpoint=self)
-        )
-        self.kpi_categories = self._register_child_endpoint(SystemKpicategoriesEndpoint(client, parent_endpoint=self))
-        self.parsing_variables = self._register_child_endpoint(
-            SystemParsingvariablesEndpoint(client, parent_endpoint=self)
-        )
-        self.integrator_tags = self._register_child_endpoint(SystemIntegratortagsEndpoint(client, parent_endpoint=self))
-        self.reports = self._register_child_endpoint(SystemReportsEndpoint(client, parent_endpoint=self))
-        self.allowedorigins = self._register_child_endpoint(SystemAllowedoriginsEndpoint(client, parent_endpoint=self))
-        self.e_pay_configurations = self._register_child_endpoint(
-            SystemEpayconfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.m365contactsync = self._register_child_endpoint(
-            SystemM365contactsyncEndpoint(client, parent_endpoint=self)
-        )
-        self.my_account = self._register_child_endpoint(SystemMyaccountEndpoint(client, parent_endpoint=self))
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def membertemplates(self) -> "SystemMembertemplatesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembertemplatesEndpoint")
+
+    @cached_property
+    def directional_syncs(self) -> "SystemDirectionalsyncsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDirectionalsyncsEndpoint")
+
+    @cached_property
+    def notification_recipients(self) -> "SystemNotificationrecipientsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemNotificationrecipientsEndpoint")
+
+    @cached_property
+    def imaps(self) -> "SystemImapsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemImapsEndpoint")
+
+    @cached_property
+    def ldap_configurations(self) -> "SystemLdapconfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLdapconfigurationsEndpoint")
+
+    @cached_property
+    def menuentries(self) -> "SystemMenuentriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMenuentriesEndpoint")
+
+    @cached_property
+    def fileuploadsettings(self) -> "SystemFileuploadsettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemFileuploadsettingsEndpoint")
+
+    @cached_property
+    def securityroles(self) -> "SystemSecurityrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSecurityrolesEndpoint")
+
+    @cached_property
+    def office365(self) -> "SystemOffice365Endpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemOffice365Endpoint")
+
+    @cached_property
+    def quote_link_setup(self) -> "SystemQuotelinksetupEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemQuotelinksetupEndpoint")
+
+    @cached_property
+    def setup_screens(self) -> "SystemSetupscreensEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSetupscreensEndpoint")
+
+    @cached_property
+    def connectwisehostedsetups(self) -> "SystemConnectwisehostedsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemConnectwisehostedsetupsEndpoint")
+
+    @cached_property
+    def workflows(self) -> "SystemWorkflowsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsEndpoint")
+
+    @cached_property
+    def skills(self) -> "SystemSkillsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSkillsEndpoint")
+
+    @cached_property
+    def my_members(self) -> "SystemMymembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMymembersEndpoint")
+
+    @cached_property
+    def marketplaceimport(self) -> "SystemMarketplaceimportEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMarketplaceimportEndpoint")
+
+    @cached_property
+    def in_out_boards(self) -> "SystemInoutboardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInoutboardsEndpoint")
+
+    @cached_property
+    def email_connectors(self) -> "SystemEmailconnectorsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemEmailconnectorsEndpoint")
+
+    @cached_property
+    def auth_anvils(self) -> "SystemAuthanvilsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAuthanvilsEndpoint")
+
+    @cached_property
+    def osgradeweights(self) -> "SystemOsgradeweightsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemOsgradeweightsEndpoint")
+
+    @cached_property
+    def contactsync(self) -> "SystemContactsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemContactsyncEndpoint")
+
+    @cached_property
+    def experiments(self) -> "SystemExperimentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemExperimentsEndpoint")
+
+    @cached_property
+    def sso_users(self) -> "SystemSsousersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSsousersEndpoint")
+
+    @cached_property
+    def bundles(self) -> "SystemBundlesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemBundlesEndpoint")
+
+    @cached_property
+    def report_cards(self) -> "SystemReportcardsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemReportcardsEndpoint")
+
+    @cached_property
+    def callbacks(self) -> "SystemCallbacksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemCallbacksEndpoint")
+
+    @cached_property
+    def allowedfiletypes(self) -> "SystemAllowedfiletypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAllowedfiletypesEndpoint")
+
+    @cached_property
+    def integratorlogins(self) -> "SystemIntegratorloginsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemIntegratorloginsEndpoint")
+
+    @cached_property
+    def import_mass_maintenance(self) -> "SystemImportmassmaintenanceEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemImportmassmaintenanceEndpoint")
+
+    @cached_property
+    def audittrail(self) -> "SystemAudittrailEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAudittrailEndpoint")
+
+    @cached_property
+    def departments(self) -> "SystemDepartmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDepartmentsEndpoint")
+
+    @cached_property
+    def members(self) -> "SystemMembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersEndpoint")
+
+    @cached_property
+    def sso_configurations(self) -> "SystemSsoconfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSsoconfigurationsEndpoint")
+
+    @cached_property
+    def time_zone_setups(self) -> "SystemTimezonesetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemTimezonesetupsEndpoint")
+
+    @cached_property
+    def workflow_actions(self) -> "SystemWorkflowactionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowactionsEndpoint")
+
+    @cached_property
+    def portal_reports(self) -> "SystemPortalreportsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemPortalreportsEndpoint")
+
+    @cached_property
+    def menu_entries(self) -> "SystemMenuentriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMenuentriesEndpoint")
+
+    @cached_property
+    def parsing_types(self) -> "SystemParsingtypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemParsingtypesEndpoint")
+
+    @cached_property
+    def standard_notes(self) -> "SystemStandardnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemStandardnotesEndpoint")
+
+    @cached_property
+    def custom_reports(self) -> "SystemCustomreportsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemCustomreportsEndpoint")
+
+    @cached_property
+    def document_types(self) -> "SystemDocumenttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDocumenttypesEndpoint")
+
+    @cached_property
+    def connect_wise_hosted_screens(self) -> "SystemConnectwisehostedscreensEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemConnectwisehostedscreensEndpoint")
+
+    @cached_property
+    def email_tokens(self) -> "SystemEmailtokensEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemEmailtokensEndpoint")
+
+    @cached_property
+    def documents(self) -> "SystemDocumentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemDocumentsEndpoint")
+
+    @cached_property
+    def my_company(self) -> "SystemMycompanyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyEndpoint")
+
+    @cached_property
+    def security_roles(self) -> "SystemSecurityrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSecurityrolesEndpoint")
+
+    @cached_property
+    def my_security(self) -> "SystemMysecurityEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMysecurityEndpoint")
+
+    @cached_property
+    def settings(self) -> "SystemSettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSettingsEndpoint")
+
+    @cached_property
+    def googleemailsetup(self) -> "SystemGoogleemailsetupEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemGoogleemailsetupEndpoint")
+
+    @cached_property
+    def surveys(self) -> "SystemSurveysEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSurveysEndpoint")
+
+    @cached_property
+    def certifications(self) -> "SystemCertificationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemCertificationsEndpoint")
+
+    @cached_property
+    def mycompany(self) -> "SystemMycompanyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyEndpoint")
+
+    @cached_property
+    def today_page_categories(self) -> "SystemTodaypagecategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemTodaypagecategoriesEndpoint")
+
+    @cached_property
+    def locations(self) -> "SystemLocationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLocationsEndpoint")
+
+    @cached_property
+    def api_members(self) -> "SystemApimembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemApimembersEndpoint")
+
+    @cached_property
+    def in_out_types(self) -> "SystemInouttypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInouttypesEndpoint")
+
+    @cached_property
+    def on_premise_search_setting(self) -> "SystemOnpremisesearchsettingEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingEndpoint")
+
+    @cached_property
+    def skill_categories(self) -> "SystemSkillcategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSkillcategoriesEndpoint")
+
+    @cached_property
+    def email_exclusions(self) -> "SystemEmailexclusionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemEmailexclusionsEndpoint")
+
+    @cached_property
+    def links(self) -> "SystemLinksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLinksEndpoint")
+
+    @cached_property
+    def auto_sync_time(self) -> "SystemAutosynctimeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAutosynctimeEndpoint")
+
+    @cached_property
+    def info(self) -> "SystemInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoEndpoint")
+
+    @cached_property
+    def allowed_file_types(self) -> "SystemAllowedfiletypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAllowedfiletypesEndpoint")
+
+    @cached_property
+    def kpis(self) -> "SystemKpisEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemKpisEndpoint")
+
+    @cached_property
+    def management_network_securities(self) -> "SystemManagementnetworksecuritiesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesEndpoint")
+
+    @cached_property
+    def cw_time_zones(self) -> "SystemCwtimezonesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemCwtimezonesEndpoint")
+
+    @cached_property
+    def user_defined_fields(self) -> "SystemUserdefinedfieldsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemUserdefinedfieldsEndpoint")
+
+    @cached_property
+    def kpi_categories(self) -> "SystemKpicategoriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemKpicategoriesEndpoint")
+
+    @cached_property
+    def parsing_variables(self) -> "SystemParsingvariablesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemParsingvariablesEndpoint")
+
+    @cached_property
+    def integrator_tags(self) -> "SystemIntegratortagsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemIntegratortagsEndpoint")
+
+    @cached_property
+    def reports(self) -> "SystemReportsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemReportsEndpoint")
+
+    @cached_property
+    def allowedorigins(self) -> "SystemAllowedoriginsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemAllowedoriginsEndpoint")
+
+    @cached_property
+    def e_pay_configurations(self) -> "SystemEpayconfigurationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemEpayconfigurationsEndpoint")
+
+    @cached_property
+    def m365contactsync(self) -> "SystemM365contactsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemM365contactsyncEndpoint")
+
+    @cached_property
+    def my_account(self) -> "SystemMyaccountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMyaccountEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemExperimentsCountEndpoint import SystemExperimentsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemExperimentsIdEndpoint import SystemExperimentsIdEndpoint
 from pyconnectwise.models.manage import Experiment
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemExperimentsCountEndpoint import SystemExperimentsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemExperimentsIdEndpoint import SystemExperimentsIdEndpoint
+
 
 class SystemExperimentsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "experiments", parent_endpoint=parent_endpoint)
+    endpoint_base = "experiments"
+    _route = "system/experiments"
 
-        self.count = self._register_child_endpoint(SystemExperimentsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemExperimentsIdEndpoint:
+    def id(self, id: int) -> "SystemExperimentsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemExperimentsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemExperimentsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemExperimentsIdEndpoint: The initialized SystemExperimentsIdEndpoint object.
+            SystemExperimentsIdEndpoint: The SystemExperimentsIdEndpoint view bound to the ID.
         """
-        child = SystemExperimentsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemExperimentsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Experiment]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Experiment]:
         """
         Performs a GET request against the /system/experiments endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Experiment]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Experiment,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Experiment, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Experiment]:
         """
@@ -57,4 +54,8 @@ class SystemExperimentsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Experiment]: The parsed response data.
         """
-        return self._parse_many(Experiment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Experiment, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemExperimentsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemExperimentsCountEndpoint")
@@ -1,26 +1,33 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemFileuploadsettingsCountEndpoint import SystemFileuploadsettingsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemFileuploadsettingsIdEndpoint import SystemFileuploadsettingsIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemFileuploadsettingsCountEndpoint import \
+        SystemFileuploadsettingsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemFileuploadsettingsIdEndpoint import SystemFileuploadsettingsIdEndpoint
+
 
 class SystemFileuploadsettingsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "fileuploadsettings", parent_endpoint=parent_endpoint)
+    endpoint_base = "fileuploadsettings"
+    _route = "system/fileuploadsettings"
 
-        self.count = self._register_child_endpoint(SystemFileuploadsettingsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemFileuploadsettingsIdEndpoint:
+    def id(self, id: int) -> "SystemFileuploadsettingsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemFileuploadsettingsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemFileuploadsettingsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemFileuploadsettingsIdEndpoint: The initialized SystemFileuploadsettingsIdEndpoint object.
+            SystemFileuploadsettingsIdEndpoint: The SystemFileuploadsettingsIdEndpoint view bound to the ID.
         """
-        child = SystemFileuploadsettingsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemFileuploadsettingsIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "SystemFileuploadsettingsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemFileuploadsettingsCountEndpoint")
@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemGoogleemailsetupCountEndpoint import SystemGoogleemailsetupCountEndpoint
-from pyconnectwise.endpoints.manage.SystemGoogleemailsetupIdEndpoint import SystemGoogleemailsetupIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemGoogleemailsetupCountEndpoint import SystemGoogleemailsetupCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemGoogleemailsetupIdEndpoint import SystemGoogleemailsetupIdEndpoint
+
 
 class SystemGoogleemailsetupEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "googleemailsetup", parent_endpoint=parent_endpoint)
+    endpoint_base = "googleemailsetup"
+    _route = "system/googleemailsetup"
 
-        self.count = self._register_child_endpoint(SystemGoogleemailsetupCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemGoogleemailsetupIdEndpoint:
+    def id(self, id: int) -> "SystemGoogleemailsetupIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemGoogleemailsetupIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemGoogleemailsetupIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemGoogleemailsetupIdEndpoint: The initialized SystemGoogleemailsetupIdEndpoint object.
+            SystemGoogleemailsetupIdEndpoint: The SystemGoogleemailsetupIdEndpoint view bound to the ID.
         """
-        child = SystemGoogleemailsetupIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemGoogleemailsetupIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "SystemGoogleemailsetupCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemGoogleemailsetupCountEndpoint")
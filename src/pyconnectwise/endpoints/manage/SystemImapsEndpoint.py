@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemImapsCountEndpoint import SystemImapsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemImapsIdEndpoint import SystemImapsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemImapsInfoEndpoint import SystemImapsInfoEndpoint
 from pyconnectwise.models.manage import Imap
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemImapsCountEndpoint import SystemImapsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemImapsIdEndpoint import SystemImapsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemImapsInfoEndpoint import SystemImapsInfoEndpoint
+
 
 class SystemImapsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "imaps", parent_endpoint=parent_endpoint)
+    endpoint_base = "imaps"
+    _route = "system/imaps"
 
-        self.info = self._register_child_endpoint(SystemImapsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemImapsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemImapsIdEndpoint:
+    def id(self, id: int) -> "SystemImapsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemImapsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemImapsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemImapsIdEndpoint: The initialized SystemImapsIdEndpoint object.
+            SystemImapsIdEndpoint: The SystemImapsIdEndpoint view bound to the ID.
         """
-        child = SystemImapsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemImapsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Imap]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Imap]:
         """
         Performs a GET request against the /system/imaps endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Imap]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Imap,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Imap, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Imap]:
         """
@@ -59,7 +55,7 @@ class SystemImapsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Imap]: The parsed response data.
         """
-        return self._parse_many(Imap, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Imap, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Imap:
         """
@@ -71,4 +67,12 @@ class SystemImapsEndpoint(ConnectWiseEndpoint):
         Returns:
             Imap: The parsed response data.
         """
-        return self._parse_one(Imap, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Imap, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemImapsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemImapsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemImapsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemImapsCountEndpoint")
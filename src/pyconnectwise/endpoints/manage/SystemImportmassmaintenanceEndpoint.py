@@ -1,23 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemImportmassmaintenanceIdEndpoint import SystemImportmassmaintenanceIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemImportmassmaintenanceIdEndpoint import \
+        SystemImportmassmaintenanceIdEndpoint
+
 
 class SystemImportmassmaintenanceEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "importMassMaintenance"
+    _route = "system/importMassMaintenance"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "importMassMaintenance", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemImportmassmaintenanceIdEndpoint:
+    def id(self, id: int) -> "SystemImportmassmaintenanceIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemImportmassmaintenanceIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemImportmassmaintenanceIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemImportmassmaintenanceIdEndpoint: The initialized SystemImportmassmaintenanceIdEndpoint object.
+            SystemImportmassmaintenanceIdEndpoint: The SystemImportmassmaintenanceIdEndpoint view bound to the ID.
         """
-        child = SystemImportmassmaintenanceIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemImportmassmaintenanceIdEndpoint", id)
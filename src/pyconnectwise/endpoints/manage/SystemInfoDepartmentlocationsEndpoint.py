@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsCountEndpoint import \
-    SystemInfoDepartmentlocationsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsIdEndpoint import \
-    SystemInfoDepartmentlocationsIdEndpoint
 from pyconnectwise.models.manage import DepartmentLocationInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsCountEndpoint import \
+        SystemInfoDepartmentlocationsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsIdEndpoint import \
+        SystemInfoDepartmentlocationsIdEndpoint
+
 
 class SystemInfoDepartmentlocationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "departmentlocations", parent_endpoint=parent_endpoint)
+    endpoint_base = "departmentlocations"
+    _route = "system/info/departmentlocations"
 
-        self.count = self._register_child_endpoint(
-            SystemInfoDepartmentlocationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemInfoDepartmentlocationsIdEndpoint:
+    def id(self, id: int) -> "SystemInfoDepartmentlocationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemInfoDepartmentlocationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemInfoDepartmentlocationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemInfoDepartmentlocationsIdEndpoint: The initialized SystemInfoDepartmentlocationsIdEndpoint object.
+            SystemInfoDepartmentlocationsIdEndpoint: The SystemInfoDepartmentlocationsIdEndpoint view bound to the ID.
         """
-        child = SystemInfoDepartmentlocationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[DepartmentLocationInfo]:
         """
         Performs a GET request against the /system/info/departmentlocations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[DepartmentLocationInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            DepartmentLocationInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(DepartmentLocationInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[DepartmentLocationInfo]:
         """
@@ -63,4 +56,8 @@ class SystemInfoDepartmentlocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[DepartmentLocationInfo]: The parsed response data.
         """
-        return self._parse_many(DepartmentLocationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DepartmentLocationInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemInfoDepartmentlocationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsCountEndpoint")
@@ -1,55 +1,44 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsEndpoint import SystemInfoDepartmentlocationsEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoDepartmentsEndpoint import SystemInfoDepartmentsEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoLinksEndpoint import SystemInfoLinksEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoLocalesEndpoint import SystemInfoLocalesEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoLocationsEndpoint import SystemInfoLocationsEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoMembersEndpoint import SystemInfoMembersEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoPersonasEndpoint import SystemInfoPersonasEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoStandardnotesEndpoint import SystemInfoStandardnotesEndpoint
 from pyconnectwise.models.manage import Info
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsEndpoint import \
+        SystemInfoDepartmentlocationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoDepartmentsEndpoint import SystemInfoDepartmentsEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoLinksEndpoint import SystemInfoLinksEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoLocalesEndpoint import SystemInfoLocalesEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoLocationsEndpoint import SystemInfoLocationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoMembersEndpoint import SystemInfoMembersEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoPersonasEndpoint import SystemInfoPersonasEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoStandardnotesEndpoint import SystemInfoStandardnotesEndpoint
+
 
 class SystemInfoEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "system/info"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
-
-        self.links = self._register_child_endpoint(SystemInfoLinksEndpoint(client, parent_endpoint=self))
-        self.personas = self._register_child_endpoint(SystemInfoPersonasEndpoint(client, parent_endpoint=self))
-        self.departmentlocations = self._register_child_endpoint(
-            SystemInfoDepartmentlocationsEndpoint(client, parent_endpoint=self)
-        )
-        self.departments = self._register_child_endpoint(SystemInfoDepartmentsEndpoint(client, parent_endpoint=self))
-        self.locales = self._register_child_endpoint(SystemInfoLocalesEndpoint(client, parent_endpoint=self))
-        self.locations = self._register_child_endpoint(SystemInfoLocationsEndpoint(client, parent_endpoint=self))
-        self.members = self._register_child_endpoint(SystemInfoMembersEndpoint(client, parent_endpoint=self))
-        self.standard_notes = self._register_child_endpoint(
-            SystemInfoStandardnotesEndpoint(client, parent_endpoint=self)
-        )
-
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Info]:
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Info]:
         """
         Performs a GET request against the /system/info endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Info]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Info,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Info, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Info:
         """
@@ -61,4 +50,36 @@ class SystemInfoEndpoint(ConnectWiseEndpoint):
         Returns:
             Info: The parsed response data.
         """
-        return self._parse_one(Info, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Info, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def links(self) -> "SystemInfoLinksEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoLinksEndpoint")
+
+    @cached_property
+    def personas(self) -> "SystemInfoPersonasEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoPersonasEndpoint")
+
+    @cached_property
+    def departmentlocations(self) -> "SystemInfoDepartmentlocationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoDepartmentlocationsEndpoint")
+
+    @cached_property
+    def departments(self) -> "SystemInfoDepartmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoDepartmentsEndpoint")
+
+    @cached_property
+    def locales(self) -> "SystemInfoLocalesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoLocalesEndpoint")
+
+    @cached_property
+    def locations(self) -> "SystemInfoLocationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoLocationsEndpoint")
+
+    @cached_property
+    def members(self) -> "SystemInfoMembersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoMembersEndpoint")
+
+    @cached_property
+    def standard_notes(self) -> "SystemInfoStandardnotesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoStandardnotesEndpoint")
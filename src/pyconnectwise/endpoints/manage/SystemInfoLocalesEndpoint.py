@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoLocalesCountEndpoint import SystemInfoLocalesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemInfoLocalesIdEndpoint import SystemInfoLocalesIdEndpoint
 from pyconnectwise.models.manage import LocaleInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemInfoLocalesCountEndpoint import SystemInfoLocalesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemInfoLocalesIdEndpoint import SystemInfoLocalesIdEndpoint
+
 
 class SystemInfoLocalesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "locales", parent_endpoint=parent_endpoint)
+    endpoint_base = "locales"
+    _route = "system/info/locales"
 
-        self.count = self._register_child_endpoint(SystemInfoLocalesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemInfoLocalesIdEndpoint:
+    def id(self, id: int) -> "SystemInfoLocalesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemInfoLocalesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemInfoLocalesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemInfoLocalesIdEndpoint: The initialized SystemInfoLocalesIdEndpoint object.
+            SystemInfoLocalesIdEndpoint: The SystemInfoLocalesIdEndpoint view bound to the ID.
         """
-        child = SystemInfoLocalesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemInfoLocalesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[LocaleInfo]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[LocaleInfo]:
         """
         Performs a GET request against the /system/info/locales endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LocaleInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LocaleInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LocaleInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LocaleInfo]:
         """
@@ -57,4 +54,8 @@ class SystemInfoLocalesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LocaleInfo]: The parsed response data.
         """
-        return self._parse_many(LocaleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LocaleInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemInfoLocalesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInfoLocalesCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemInouttypesCountEndpoint import SystemInouttypesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemInouttypesIdEndpoint import SystemInouttypesIdEndpoint
-from pyconnectwise.endpoints.manage.SystemInouttypesInfoEndpoint import SystemInouttypesInfoEndpoint
 from pyconnectwise.models.manage import InOutType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemInouttypesCountEndpoint import SystemInouttypesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemInouttypesIdEndpoint import SystemInouttypesIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemInouttypesInfoEndpoint import SystemInouttypesInfoEndpoint
+
 
 class SystemInouttypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "inOutTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "inOutTypes"
+    _route = "system/inOutTypes"
 
-        self.info = self._register_child_endpoint(SystemInouttypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemInouttypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemInouttypesIdEndpoint:
+    def id(self, id: int) -> "SystemInouttypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemInouttypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemInouttypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemInouttypesIdEndpoint: The initialized SystemInouttypesIdEndpoint object.
+            SystemInouttypesIdEndpoint: The SystemInouttypesIdEndpoint view bound to the ID.
         """
-        child = SystemInouttypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemInouttypesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[InOutType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[InOutType]:
         """
         Performs a GET request against the /system/inOutTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[InOutType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            InOutType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(InOutType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[InOutType]:
         """
@@ -59,7 +55,7 @@ class SystemInouttypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[InOutType]: The parsed response data.
         """
-        return self._parse_many(InOutType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InOutType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> InOutType:
         """
@@ -71,4 +67,12 @@ class SystemInouttypesEndpoint(ConnectWiseEndpoint):
         Returns:
             InOutType: The parsed response data.
         """
-        return self._parse_one(InOutType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(InOutType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemInouttypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInouttypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemInouttypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemInouttypesCountEndpoint")
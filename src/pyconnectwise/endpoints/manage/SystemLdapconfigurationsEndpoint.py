@@ -1,60 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemLdapconfigurationsCountEndpoint import SystemLdapconfigurationsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemLdapconfigurationsIdEndpoint import SystemLdapconfigurationsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemLdapconfigurationsInfoEndpoint import SystemLdapconfigurationsInfoEndpoint
-from pyconnectwise.endpoints.manage.SystemLdapconfigurationsTestlinkEndpoint import \
-    SystemLdapconfigurationsTestlinkEndpoint
 from pyconnectwise.models.manage import LdapConfiguration
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemLdapconfigurationsCountEndpoint import \
+        SystemLdapconfigurationsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemLdapconfigurationsIdEndpoint import SystemLdapconfigurationsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemLdapconfigurationsInfoEndpoint import SystemLdapconfigurationsInfoEndpoint
+    from pyconnectwise.endpoints.manage.SystemLdapconfigurationsTestlinkEndpoint import \
+        SystemLdapconfigurationsTestlinkEndpoint
+
 
 class SystemLdapconfigurationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "ldapConfigurations", parent_endpoint=parent_endpoint)
+    endpoint_base = "ldapConfigurations"
+    _route = "system/ldapConfigurations"
 
-        self.info = self._register_child_endpoint(SystemLdapconfigurationsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemLdapconfigurationsCountEndpoint(client, parent_endpoint=self))
-        self.test_link = self._register_child_endpoint(
-            SystemLdapconfigurationsTestlinkEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemLdapconfigurationsIdEndpoint:
+    def id(self, id: int) -> "SystemLdapconfigurationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemLdapconfigurationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemLdapconfigurationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemLdapconfigurationsIdEndpoint: The initialized SystemLdapconfigurationsIdEndpoint object.
+            SystemLdapconfigurationsIdEndpoint: The SystemLdapconfigurationsIdEndpoint view bound to the ID.
         """
-        child = SystemLdapconfigurationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemLdapconfigurationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[LdapConfiguration]:
         """
         Performs a GET request against the /system/ldapConfigurations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[LdapConfiguration]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            LdapConfiguration,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(LdapConfiguration, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[LdapConfiguration]:
         """
@@ -66,7 +58,7 @@ class SystemLdapconfigurationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[LdapConfiguration]: The parsed response data.
         """
-        return self._parse_many(LdapConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LdapConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> LdapConfiguration:
         """
@@ -78,4 +70,16 @@ class SystemLdapconfigurationsEndpoint(ConnectWiseEndpoint):
         Returns:
             LdapConfiguration: The parsed response data.
         """
-        return self._parse_one(LdapConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LdapConfiguration, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemLdapconfigurationsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLdapconfigurationsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemLdapconfigurationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLdapconfigurationsCountEndpoint")
+
+    @cached_property
+    def test_link(self) -> "SystemLdapconfigurationsTestlinkEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLdapconfigurationsTestlinkEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemLinksCountEndpoint import SystemLinksCountEndpoint
-from pyconnectwise.endpoints.manage.SystemLinksIdEndpoint import SystemLinksIdEndpoint
 from pyconnectwise.models.manage import Link
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemLinksCountEndpoint import SystemLinksCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemLinksIdEndpoint import SystemLinksIdEndpoint
+
 
 class SystemLinksEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "links", parent_endpoint=parent_endpoint)
+    endpoint_base = "links"
+    _route = "system/links"
 
-        self.count = self._register_child_endpoint(SystemLinksCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemLinksIdEndpoint:
+    def id(self, id: int) -> "SystemLinksIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemLinksIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemLinksIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemLinksIdEndpoint: The initialized SystemLinksIdEndpoint object.
+            SystemLinksIdEndpoint: The SystemLinksIdEndpoint view bound to the ID.
         """
-        child = SystemLinksIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemLinksIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Link]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Link]:
         """
         Performs a GET request against the /system/links endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Link]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Link,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Link, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Link]:
         """
@@ -57,7 +54,7 @@ class SystemLinksEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Link]: The parsed response data.
         """
-        return self._parse_many(Link, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Link, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Link:
         """
@@ -69,4 +66,8 @@ class SystemLinksEndpoint(ConnectWiseEndpoint):
         Returns:
             Link: The parsed response data.
         """
-        return self._parse_one(Link, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Link, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemLinksCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLinksCountEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemLocationsCountEndpoint import SystemLocationsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemLocationsIdEndpoint import SystemLocationsIdEndpoint
 from pyconnectwise.models.manage import Location
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemLocationsCountEndpoint import SystemLocationsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemLocationsIdEndpoint import SystemLocationsIdEndpoint
+
 
 class SystemLocationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "locations", parent_endpoint=parent_endpoint)
+    endpoint_base = "locations"
+    _route = "system/locations"
 
-        self.count = self._register_child_endpoint(SystemLocationsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemLocationsIdEndpoint:
+    def id(self, id: int) -> "SystemLocationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemLocationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemLocationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemLocationsIdEndpoint: The initialized SystemLocationsIdEndpoint object.
+            SystemLocationsIdEndpoint: The SystemLocationsIdEndpoint view bound to the ID.
         """
-        child = SystemLocationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemLocationsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Location]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Location]:
         """
         Performs a GET request against the /system/locations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Location]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Location,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Location, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Location]:
         """
@@ -57,7 +54,7 @@ class SystemLocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Location]: The parsed response data.
         """
-        return self._parse_many(Location, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Location, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Location:
         """
@@ -69,4 +66,8 @@ class SystemLocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             Location: The parsed response data.
         """
-        return self._parse_one(Location, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Location, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemLocationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLocationsCountEndpoint")
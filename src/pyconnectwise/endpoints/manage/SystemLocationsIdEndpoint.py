@@ -1,45 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemLocationsIdDepartmentsEndpoint import SystemLocationsIdDepartmentsEndpoint
-from pyconnectwise.endpoints.manage.SystemLocationsIdUsagesEndpoint import SystemLocationsIdUsagesEndpoint
-from pyconnectwise.endpoints.manage.SystemLocationsIdWorkrolesEndpoint import SystemLocationsIdWorkrolesEndpoint
 from pyconnectwise.models.manage import Location
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemLocationsIdDepartmentsEndpoint import SystemLocationsIdDepartmentsEndpoint
+    from pyconnectwise.endpoints.manage.SystemLocationsIdUsagesEndpoint import SystemLocationsIdUsagesEndpoint
+    from pyconnectwise.endpoints.manage.SystemLocationsIdWorkrolesEndpoint import SystemLocationsIdWorkrolesEndpoint
+
 
 class SystemLocationsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/locations/{id}"
 
-        self.usages = self._register_child_endpoint(SystemLocationsIdUsagesEndpoint(client, parent_endpoint=self))
-        self.work_roles = self._register_child_endpoint(
-            SystemLocationsIdWorkrolesEndpoint(client, parent_endpoint=self)
-        )
-        self.departments = self._register_child_endpoint(
-            SystemLocationsIdDepartmentsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Location]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Location]:
         """
         Performs a GET request against the /system/locations/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Location]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Location,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Location, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Location:
         """
@@ -51,7 +44,7 @@ class SystemLocationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Location: The parsed response data.
         """
-        return self._parse_one(Location, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Location, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -73,7 +66,7 @@ class SystemLocationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Location: The parsed response data.
         """
-        return self._parse_one(Location, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Location, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Location:
         """
@@ -85,4 +78,16 @@ class SystemLocationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Location: The parsed response data.
         """
-        return self._parse_one(Location, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Location, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "SystemLocationsIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLocationsIdUsagesEndpoint")
+
+    @cached_property
+    def work_roles(self) -> "SystemLocationsIdWorkrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLocationsIdWorkrolesEndpoint")
+
+    @cached_property
+    def departments(self) -> "SystemLocationsIdDepartmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemLocationsIdDepartmentsEndpoint")
@@ -1,45 +1,58 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncAuthorizeEndpoint import SystemM365contactsyncAuthorizeEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncCheckvalidsyncEndpoint import \
-    SystemM365contactsyncCheckvalidsyncEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncIdEndpoint import SystemM365contactsyncIdEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncInfoEndpoint import SystemM365contactsyncInfoEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncNotifydeactivationEndpoint import \
-    SystemM365contactsyncNotifydeactivationEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncNotifyerrorEndpoint import \
-    SystemM365contactsyncNotifyerrorEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncAuthorizeEndpoint import \
+        SystemM365contactsyncAuthorizeEndpoint
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncCheckvalidsyncEndpoint import \
+        SystemM365contactsyncCheckvalidsyncEndpoint
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncIdEndpoint import SystemM365contactsyncIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncInfoEndpoint import SystemM365contactsyncInfoEndpoint
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncNotifydeactivationEndpoint import \
+        SystemM365contactsyncNotifydeactivationEndpoint
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncNotifyerrorEndpoint import \
+        SystemM365contactsyncNotifyerrorEndpoint
+
 
 class SystemM365contactsyncEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "m365contactsync", parent_endpoint=parent_endpoint)
+    endpoint_base = "m365contactsync"
+    _route = "system/m365contactsync"
 
-        self.info = self._register_child_endpoint(SystemM365contactsyncInfoEndpoint(client, parent_endpoint=self))
-        self.checkvalidsync = self._register_child_endpoint(
-            SystemM365contactsyncCheckvalidsyncEndpoint(client, parent_endpoint=self)
-        )
-        self.notifydeactivation = self._register_child_endpoint(
-            SystemM365contactsyncNotifydeactivationEndpoint(client, parent_endpoint=self)
-        )
-        self.notifyerror = self._register_child_endpoint(
-            SystemM365contactsyncNotifyerrorEndpoint(client, parent_endpoint=self)
-        )
-        self.authorize = self._register_child_endpoint(
-            SystemM365contactsyncAuthorizeEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemM365contactsyncIdEndpoint:
+    def id(self, id: int) -> "SystemM365contactsyncIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemM365contactsyncIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemM365contactsyncIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemM365contactsyncIdEndpoint: The initialized SystemM365contactsyncIdEndpoint object.
+            SystemM365contactsyncIdEndpoint: The SystemM365contactsyncIdEndpoint view bound to the ID.
         """
-        child = SystemM365contactsyncIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemM365contactsyncIdEndpoint", id)
+
+    @cached_property
+    def info(self) -> "SystemM365contactsyncInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemM365contactsyncInfoEndpoint")
+
+    @cached_property
+    def checkvalidsync(self) -> "SystemM365contactsyncCheckvalidsyncEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemM365contactsyncCheckvalidsyncEndpoint")
+
+    @cached_property
+    def notifydeactivation(self) -> "SystemM365contactsyncNotifydeactivationEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemM365contactsyncNotifydeactivationEndpoint"
+        )
+
+    @cached_property
+    def notifyerror(self) -> "SystemM365contactsyncNotifyerrorEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemM365contactsyncNotifyerrorEndpoint")
+
+    @cached_property
+    def authorize(self) -> "SystemM365contactsyncAuthorizeEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemM365contactsyncAuthorizeEndpoint")
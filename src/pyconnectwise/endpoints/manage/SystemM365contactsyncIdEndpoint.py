@@ -1,19 +1,31 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncIdInfoEndpoint import SystemM365contactsyncIdInfoEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncIdTestEndpoint import SystemM365contactsyncIdTestEndpoint
-from pyconnectwise.endpoints.manage.SystemM365contactsyncIdViewauthEndpoint import \
-    SystemM365contactsyncIdViewauthEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncIdInfoEndpoint import SystemM365contactsyncIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncIdTestEndpoint import SystemM365contactsyncIdTestEndpoint
+    from pyconnectwise.endpoints.manage.SystemM365contactsyncIdViewauthEndpoint import \
+        SystemM365contactsyncIdViewauthEndpoint
+
 
 class SystemM365contactsyncIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/m365contactsync/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def viewauth(self) -> "SystemM365contactsyncIdViewauthEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemM365contactsyncIdViewauthEndpoint")
+
+    @cached_property
+    def info(self) -> "SystemM365contactsyncIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemM365contactsyncIdInfoEndpoint")
 
-        self.viewauth = self._register_child_endpoint(
-            SystemM365contactsyncIdViewauthEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(SystemM365contactsyncIdInfoEndpoint(client, parent_endpoint=self))
-        self.test = self._register_child_endpoint(SystemM365contactsyncIdTestEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def test(self) -> "SystemM365contactsyncIdTestEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemM365contactsyncIdTestEndpoint")
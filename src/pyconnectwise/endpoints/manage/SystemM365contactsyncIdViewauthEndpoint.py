@@ -1,9 +1,13 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class SystemM365contactsyncIdViewauthEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "viewauth"
+    _route = "system/m365contactsync/{id}/viewauth"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "viewauth", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
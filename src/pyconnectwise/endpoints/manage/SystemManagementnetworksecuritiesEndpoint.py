@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesCountEndpoint import \
-    SystemManagementnetworksecuritiesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesIdEndpoint import \
-    SystemManagementnetworksecuritiesIdEndpoint
 from pyconnectwise.models.manage import ManagementNetworkSecurity
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesCountEndpoint import \
+        SystemManagementnetworksecuritiesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesIdEndpoint import \
+        SystemManagementnetworksecuritiesIdEndpoint
+
 
 class SystemManagementnetworksecuritiesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "managementNetworkSecurities", parent_endpoint=parent_endpoint)
+    endpoint_base = "managementNetworkSecurities"
+    _route = "system/managementNetworkSecurities"
 
-        self.count = self._register_child_endpoint(
-            SystemManagementnetworksecuritiesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemManagementnetworksecuritiesIdEndpoint:
+    def id(self, id: int) -> "SystemManagementnetworksecuritiesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemManagementnetworksecuritiesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemManagementnetworksecuritiesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemManagementnetworksecuritiesIdEndpoint: The initialized SystemManagementnetworksecuritiesIdEndpoint object.
+            SystemManagementnetworksecuritiesIdEndpoint: The SystemManagementnetworksecuritiesIdEndpoint view bound to the ID.
         """
-        child = SystemManagementnetworksecuritiesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ManagementNetworkSecurity]:
         """
         Performs a GET request against the /system/managementNetworkSecurities endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ManagementNetworkSecurity]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ManagementNetworkSecurity,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ManagementNetworkSecurity, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ManagementNetworkSecurity]:
         """
@@ -64,7 +57,7 @@ class SystemManagementnetworksecuritiesEndpoint(ConnectWiseEndpoint):
             list[ManagementNetworkSecurity]: The parsed response data.
         """
         return self._parse_many(
-            ManagementNetworkSecurity, super()._make_request("GET", data=data, params=params).json()
+            ManagementNetworkSecurity, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ManagementNetworkSecurity:
@@ -78,5 +71,11 @@ class SystemManagementnetworksecuritiesEndpoint(ConnectWiseEndpoint):
             ManagementNetworkSecurity: The parsed response data.
         """
         return self._parse_one(
-            ManagementNetworkSecurity, super()._make_request("POST", data=data, params=params).json()
+            ManagementNetworkSecurity, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "SystemManagementnetworksecuritiesCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemManagementnetworksecuritiesCountEndpoint"
         )
@@ -1,19 +1,29 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMarketplaceimportGetdefinitionEndpoint import \
-    SystemMarketplaceimportGetdefinitionEndpoint
-from pyconnectwise.endpoints.manage.SystemMarketplaceimportImportEndpoint import SystemMarketplaceimportImportEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMarketplaceimportGetdefinitionEndpoint import \
+        SystemMarketplaceimportGetdefinitionEndpoint
+    from pyconnectwise.endpoints.manage.SystemMarketplaceimportImportEndpoint import \
+        SystemMarketplaceimportImportEndpoint
+
 
 class SystemMarketplaceimportEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "marketplaceimport"
+    _route = "system/marketplaceimport"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "marketplaceimport", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.import_ = self._register_child_endpoint(
-            SystemMarketplaceimportImportEndpoint(client, parent_endpoint=self)
-        )
-        self.getdefinition = self._register_child_endpoint(
-            SystemMarketplaceimportGetdefinitionEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def import_(self) -> "SystemMarketplaceimportImportEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMarketplaceimportImportEndpoint")
+
+    @cached_property
+    def getdefinition(self) -> "SystemMarketplaceimportGetdefinitionEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemMarketplaceimportGetdefinitionEndpoint"
         )
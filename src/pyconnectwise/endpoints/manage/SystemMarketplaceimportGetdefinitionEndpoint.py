@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMarketplaceimportGetdefinitionIdEndpoint import \
-    SystemMarketplaceimportGetdefinitionIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMarketplaceimportGetdefinitionIdEndpoint import \
+        SystemMarketplaceimportGetdefinitionIdEndpoint
+
 
 class SystemMarketplaceimportGetdefinitionEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "getdefinition"
+    _route = "system/marketplaceimport/getdefinition"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "getdefinition", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMarketplaceimportGetdefinitionIdEndpoint:
+    def id(self, id: int) -> "SystemMarketplaceimportGetdefinitionIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMarketplaceimportGetdefinitionIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMarketplaceimportGetdefinitionIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMarketplaceimportGetdefinitionIdEndpoint: The initialized SystemMarketplaceimportGetdefinitionIdEndpoint object.
+            SystemMarketplaceimportGetdefinitionIdEndpoint: The SystemMarketplaceimportGetdefinitionIdEndpoint view bound to the ID.
         """
-        child = SystemMarketplaceimportGetdefinitionIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMarketplaceimportGetdefinitionIdEndpoint", id)
@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersCountEndpoint import SystemMembersCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdEndpoint import SystemMembersIdEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersTypesEndpoint import SystemMembersTypesEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersWithssoEndpoint import SystemMembersWithssoEndpoint
 from pyconnectwise.models.manage import Member
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMembersCountEndpoint import SystemMembersCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdEndpoint import SystemMembersIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersTypesEndpoint import SystemMembersTypesEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersWithssoEndpoint import SystemMembersWithssoEndpoint
+
 
 class SystemMembersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "members", parent_endpoint=parent_endpoint)
+    endpoint_base = "members"
+    _route = "system/members"
 
-        self.with_sso = self._register_child_endpoint(SystemMembersWithssoEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(SystemMembersTypesEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemMembersCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMembersIdEndpoint:
+    def id(self, id: int) -> "SystemMembersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMembersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMembersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMembersIdEndpoint: The initialized SystemMembersIdEndpoint object.
+            SystemMembersIdEndpoint: The SystemMembersIdEndpoint view bound to the ID.
         """
-        child = SystemMembersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMembersIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Member]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Member]:
         """
         Performs a GET request against the /system/members endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Member]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Member,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Member, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Member]:
         """
@@ -61,7 +56,7 @@ class SystemMembersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Member]: The parsed response data.
         """
-        return self._parse_many(Member, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Member, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Member:
         """
@@ -73,4 +68,16 @@ class SystemMembersEndpoint(ConnectWiseEndpoint):
         Returns:
             Member: The parsed response data.
         """
-        return self._parse_one(Member, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Member, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def with_sso(self) -> "SystemMembersWithssoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersWithssoEndpoint")
+
+    @cached_property
+    def types(self) -> "SystemMembersTypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersTypesEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemMembersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersCountEndpoint")
@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdAccrualsCountEndpoint import SystemMembersIdAccrualsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdAccrualsIdEndpoint import SystemMembersIdAccrualsIdEndpoint
 from pyconnectwise.models.manage import MemberAccrual
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMembersIdAccrualsCountEndpoint import SystemMembersIdAccrualsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdAccrualsIdEndpoint import SystemMembersIdAccrualsIdEndpoint
+
 
 class SystemMembersIdAccrualsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "accruals", parent_endpoint=parent_endpoint)
+    endpoint_base = "accruals"
+    _route = "system/members/{id}/accruals"
 
-        self.count = self._register_child_endpoint(SystemMembersIdAccrualsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMembersIdAccrualsIdEndpoint:
+    def id(self, id: int) -> "SystemMembersIdAccrualsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMembersIdAccrualsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMembersIdAccrualsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMembersIdAccrualsIdEndpoint: The initialized SystemMembersIdAccrualsIdEndpoint object.
+            SystemMembersIdAccrualsIdEndpoint: The SystemMembersIdAccrualsIdEndpoint view bound to the ID.
         """
-        child = SystemMembersIdAccrualsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMembersIdAccrualsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[MemberAccrual]:
         """
         Performs a GET request against the /system/members/{id}/accruals endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MemberAccrual]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MemberAccrual,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MemberAccrual, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MemberAccrual]:
         """
@@ -59,7 +54,7 @@ class SystemMembersIdAccrualsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[MemberAccrual]: The parsed response data.
         """
-        return self._parse_many(MemberAccrual, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberAccrual, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MemberAccrual:
         """
@@ -71,4 +66,8 @@ class SystemMembersIdAccrualsEndpoint(ConnectWiseEndpoint):
         Returns:
             MemberAccrual: The parsed response data.
         """
-        return self._parse_one(MemberAccrual, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberAccrual, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemMembersIdAccrualsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdAccrualsCountEndpoint")
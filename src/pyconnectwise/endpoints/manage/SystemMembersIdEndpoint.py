@@ -1,87 +1,56 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdAccrualsEndpoint import SystemMembersIdAccrualsEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdCertificationsEndpoint import SystemMembersIdCertificationsEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdDeactivateEndpoint import SystemMembersIdDeactivateEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdDelegationsEndpoint import SystemMembersIdDelegationsEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdImageEndpoint import SystemMembersIdImageEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdLinkssouserEndpoint import SystemMembersIdLinkssouserEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdManageddeviceaccountsEndpoint import \
-    SystemMembersIdManageddeviceaccountsEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsEndpoint import \
-    SystemMembersIdMycertificationsEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsEndpoint import \
-    SystemMembersIdNotificationsettingsEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdPersonasEndpoint import SystemMembersIdPersonasEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdSkillsEndpoint import SystemMembersIdSkillsEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdSubmitEndpoint import SystemMembersIdSubmitEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdTokensEndpoint import SystemMembersIdTokensEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdUnlinkssouserEndpoint import SystemMembersIdUnlinkssouserEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdUnusedtimesheetsEndpoint import \
-    SystemMembersIdUnusedtimesheetsEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdUsagesEndpoint import SystemMembersIdUsagesEndpoint
 from pyconnectwise.models.manage import Member
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMembersIdAccrualsEndpoint import SystemMembersIdAccrualsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdCertificationsEndpoint import \
+        SystemMembersIdCertificationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdDeactivateEndpoint import SystemMembersIdDeactivateEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdDelegationsEndpoint import SystemMembersIdDelegationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdImageEndpoint import SystemMembersIdImageEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdLinkssouserEndpoint import SystemMembersIdLinkssouserEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdManageddeviceaccountsEndpoint import \
+        SystemMembersIdManageddeviceaccountsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsEndpoint import \
+        SystemMembersIdMycertificationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsEndpoint import \
+        SystemMembersIdNotificationsettingsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdPersonasEndpoint import SystemMembersIdPersonasEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdSkillsEndpoint import SystemMembersIdSkillsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdSubmitEndpoint import SystemMembersIdSubmitEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdTokensEndpoint import SystemMembersIdTokensEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdUnlinkssouserEndpoint import SystemMembersIdUnlinkssouserEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdUnusedtimesheetsEndpoint import \
+        SystemMembersIdUnusedtimesheetsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdUsagesEndpoint import SystemMembersIdUsagesEndpoint
+
 
 class SystemMembersIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/members/{id}"
 
-        self.delegations = self._register_child_endpoint(
-            SystemMembersIdDelegationsEndpoint(client, parent_endpoint=self)
-        )
-        self.unlink_sso_user = self._register_child_endpoint(
-            SystemMembersIdUnlinkssouserEndpoint(client, parent_endpoint=self)
-        )
-        self.unused_time_sheets = self._register_child_endpoint(
-            SystemMembersIdUnusedtimesheetsEndpoint(client, parent_endpoint=self)
-        )
-        self.image = self._register_child_endpoint(SystemMembersIdImageEndpoint(client, parent_endpoint=self))
-        self.accruals = self._register_child_endpoint(SystemMembersIdAccrualsEndpoint(client, parent_endpoint=self))
-        self.submit = self._register_child_endpoint(SystemMembersIdSubmitEndpoint(client, parent_endpoint=self))
-        self.certifications = self._register_child_endpoint(
-            SystemMembersIdCertificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.managed_device_accounts = self._register_child_endpoint(
-            SystemMembersIdManageddeviceaccountsEndpoint(client, parent_endpoint=self)
-        )
-        self.mycertifications = self._register_child_endpoint(
-            SystemMembersIdMycertificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.notification_settings = self._register_child_endpoint(
-            SystemMembersIdNotificationsettingsEndpoint(client, parent_endpoint=self)
-        )
-        self.tokens = self._register_child_endpoint(SystemMembersIdTokensEndpoint(client, parent_endpoint=self))
-        self.personas = self._register_child_endpoint(SystemMembersIdPersonasEndpoint(client, parent_endpoint=self))
-        self.skills = self._register_child_endpoint(SystemMembersIdSkillsEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(SystemMembersIdUsagesEndpoint(client, parent_endpoint=self))
-        self.deactivate = self._register_child_endpoint(SystemMembersIdDeactivateEndpoint(client, parent_endpoint=self))
-        self.link_sso_user = self._register_child_endpoint(
-            SystemMembersIdLinkssouserEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Member]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Member]:
         """
         Performs a GET request against the /system/members/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Member]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Member,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Member, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Member:
         """
@@ -93,7 +62,7 @@ class SystemMembersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Member: The parsed response data.
         """
-        return self._parse_one(Member, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Member, super()._make_request("GET", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Member:
         """
@@ -105,7 +74,7 @@ class SystemMembersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Member: The parsed response data.
         """
-        return self._parse_one(Member, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Member, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Member:
         """
@@ -117,4 +86,70 @@ class SystemMembersIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Member: The parsed response data.
         """
-        return self._parse_one(Member, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Member, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def delegations(self) -> "SystemMembersIdDelegationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdDelegationsEndpoint")
+
+    @cached_property
+    def unlink_sso_user(self) -> "SystemMembersIdUnlinkssouserEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdUnlinkssouserEndpoint")
+
+    @cached_property
+    def unused_time_sheets(self) -> "SystemMembersIdUnusedtimesheetsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdUnusedtimesheetsEndpoint")
+
+    @cached_property
+    def image(self) -> "SystemMembersIdImageEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdImageEndpoint")
+
+    @cached_property
+    def accruals(self) -> "SystemMembersIdAccrualsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdAccrualsEndpoint")
+
+    @cached_property
+    def submit(self) -> "SystemMembersIdSubmitEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdSubmitEndpoint")
+
+    @cached_property
+    def certifications(self) -> "SystemMembersIdCertificationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdCertificationsEndpoint")
+
+    @cached_property
+    def managed_device_accounts(self) -> "SystemMembersIdManageddeviceaccountsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemMembersIdManageddeviceaccountsEndpoint"
+        )
+
+    @cached_property
+    def mycertifications(self) -> "SystemMembersIdMycertificationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsEndpoint")
+
+    @cached_property
+    def notification_settings(self) -> "SystemMembersIdNotificationsettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsEndpoint")
+
+    @cached_property
+    def tokens(self) -> "SystemMembersIdTokensEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdTokensEndpoint")
+
+    @cached_property
+    def personas(self) -> "SystemMembersIdPersonasEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdPersonasEndpoint")
+
+    @cached_property
+    def skills(self) -> "SystemMembersIdSkillsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdSkillsEndpoint")
+
+    @cached_property
+    def usages(self) -> "SystemMembersIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdUsagesEndpoint")
+
+    @cached_property
+    def deactivate(self) -> "SystemMembersIdDeactivateEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdDeactivateEndpoint")
+
+    @cached_property
+    def link_sso_user(self) -> "SystemMembersIdLinkssouserEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdLinkssouserEndpoint")
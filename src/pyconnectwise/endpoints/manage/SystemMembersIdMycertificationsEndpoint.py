@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsCountEndpoint import \
-    SystemMembersIdMycertificationsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsIdEndpoint import \
-    SystemMembersIdMycertificationsIdEndpoint
 from pyconnectwise.models.manage import MemberCertification
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsCountEndpoint import \
+        SystemMembersIdMycertificationsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsIdEndpoint import \
+        SystemMembersIdMycertificationsIdEndpoint
+
 
 class SystemMembersIdMycertificationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "mycertifications", parent_endpoint=parent_endpoint)
+    endpoint_base = "mycertifications"
+    _route = "system/members/{id}/mycertifications"
 
-        self.count = self._register_child_endpoint(
-            SystemMembersIdMycertificationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMembersIdMycertificationsIdEndpoint:
+    def id(self, id: int) -> "SystemMembersIdMycertificationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMembersIdMycertificationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMembersIdMycertificationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMembersIdMycertificationsIdEndpoint: The initialized SystemMembersIdMycertificationsIdEndpoint object.
+            SystemMembersIdMycertificationsIdEndpoint: The SystemMembersIdMycertificationsIdEndpoint view bound to the ID.
         """
-        child = SystemMembersIdMycertificationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[MemberCertification]:
         """
         Performs a GET request against the /system/members/{id}/mycertifications endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MemberCertification]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MemberCertification,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MemberCertification, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MemberCertification]:
         """
@@ -63,7 +56,7 @@ class SystemMembersIdMycertificationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[MemberCertification]: The parsed response data.
         """
-        return self._parse_many(MemberCertification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberCertification, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MemberCertification:
         """
@@ -75,4 +68,10 @@ class SystemMembersIdMycertificationsEndpoint(ConnectWiseEndpoint):
         Returns:
             MemberCertification: The parsed response data.
         """
-        return self._parse_one(MemberCertification, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberCertification, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemMembersIdMycertificationsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemMembersIdMycertificationsCountEndpoint"
+        )
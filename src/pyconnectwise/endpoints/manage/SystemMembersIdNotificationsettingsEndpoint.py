@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsCountEndpoint import \
-    SystemMembersIdNotificationsettingsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsIdEndpoint import \
-    SystemMembersIdNotificationsettingsIdEndpoint
 from pyconnectwise.models.manage import MemberNotificationSetting
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsCountEndpoint import \
+        SystemMembersIdNotificationsettingsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsIdEndpoint import \
+        SystemMembersIdNotificationsettingsIdEndpoint
+
 
 class SystemMembersIdNotificationsettingsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "notificationSettings", parent_endpoint=parent_endpoint)
+    endpoint_base = "notificationSettings"
+    _route = "system/members/{id}/notificationSettings"
 
-        self.count = self._register_child_endpoint(
-            SystemMembersIdNotificationsettingsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMembersIdNotificationsettingsIdEndpoint:
+    def id(self, id: int) -> "SystemMembersIdNotificationsettingsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMembersIdNotificationsettingsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMembersIdNotificationsettingsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMembersIdNotificationsettingsIdEndpoint: The initialized SystemMembersIdNotificationsettingsIdEndpoint object.
+            SystemMembersIdNotificationsettingsIdEndpoint: The SystemMembersIdNotificationsettingsIdEndpoint view bound to the ID.
         """
-        child = SystemMembersIdNotificationsettingsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[MemberNotificationSetting]:
         """
         Performs a GET request against the /system/members/{id}/notificationSettings endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MemberNotificationSetting]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MemberNotificationSetting,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MemberNotificationSetting, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MemberNotificationSetting]:
         """
@@ -64,7 +57,7 @@ class SystemMembersIdNotificationsettingsEndpoint(ConnectWiseEndpoint):
             list[MemberNotificationSetting]: The parsed response data.
         """
         return self._parse_many(
-            MemberNotificationSetting, super()._make_request("GET", data=data, params=params).json()
+            MemberNotificationSetting, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MemberNotificationSetting:
@@ -78,5 +71,11 @@ class SystemMembersIdNotificationsettingsEndpoint(ConnectWiseEndpoint):
             MemberNotificationSetting: The parsed response data.
         """
         return self._parse_one(
-            MemberNotificationSetting, super()._make_request("POST", data=data, params=params).json()
+            MemberNotificationSetting, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "SystemMembersIdNotificationsettingsCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemMembersIdNotificationsettingsCountEndpoint"
         )
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdSkillsCountEndpoint import SystemMembersIdSkillsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersIdSkillsIdEndpoint import SystemMembersIdSkillsIdEndpoint
 from pyconnectwise.models.manage import MemberSkill
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMembersIdSkillsCountEndpoint import SystemMembersIdSkillsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersIdSkillsIdEndpoint import SystemMembersIdSkillsIdEndpoint
+
 
 class SystemMembersIdSkillsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "skills", parent_endpoint=parent_endpoint)
+    endpoint_base = "skills"
+    _route = "system/members/{id}/skills"
 
-        self.count = self._register_child_endpoint(SystemMembersIdSkillsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMembersIdSkillsIdEndpoint:
+    def id(self, id: int) -> "SystemMembersIdSkillsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMembersIdSkillsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMembersIdSkillsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMembersIdSkillsIdEndpoint: The initialized SystemMembersIdSkillsIdEndpoint object.
+            SystemMembersIdSkillsIdEndpoint: The SystemMembersIdSkillsIdEndpoint view bound to the ID.
         """
-        child = SystemMembersIdSkillsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMembersIdSkillsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[MemberSkill]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[MemberSkill]:
         """
         Performs a GET request against the /system/members/{id}/skills endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MemberSkill]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MemberSkill,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MemberSkill, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MemberSkill]:
         """
@@ -57,7 +54,7 @@ class SystemMembersIdSkillsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[MemberSkill]: The parsed response data.
         """
-        return self._parse_many(MemberSkill, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberSkill, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MemberSkill:
         """
@@ -69,4 +66,8 @@ class SystemMembersIdSkillsEndpoint(ConnectWiseEndpoint):
         Returns:
             MemberSkill: The parsed response data.
         """
-        return self._parse_one(MemberSkill, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberSkill, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemMembersIdSkillsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersIdSkillsCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersTypesCountEndpoint import SystemMembersTypesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersTypesIdEndpoint import SystemMembersTypesIdEndpoint
-from pyconnectwise.endpoints.manage.SystemMembersTypesInfoEndpoint import SystemMembersTypesInfoEndpoint
 from pyconnectwise.models.manage import MemberType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMembersTypesCountEndpoint import SystemMembersTypesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersTypesIdEndpoint import SystemMembersTypesIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembersTypesInfoEndpoint import SystemMembersTypesInfoEndpoint
+
 
 class SystemMembersTypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "types", parent_endpoint=parent_endpoint)
+    endpoint_base = "types"
+    _route = "system/members/types"
 
-        self.info = self._register_child_endpoint(SystemMembersTypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemMembersTypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMembersTypesIdEndpoint:
+    def id(self, id: int) -> "SystemMembersTypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMembersTypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMembersTypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMembersTypesIdEndpoint: The initialized SystemMembersTypesIdEndpoint object.
+            SystemMembersTypesIdEndpoint: The SystemMembersTypesIdEndpoint view bound to the ID.
         """
-        child = SystemMembersTypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMembersTypesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[MemberType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[MemberType]:
         """
         Performs a GET request against the /system/members/types endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MemberType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MemberType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MemberType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MemberType]:
         """
@@ -59,7 +55,7 @@ class SystemMembersTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[MemberType]: The parsed response data.
         """
-        return self._parse_many(MemberType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MemberType:
         """
@@ -71,4 +67,12 @@ class SystemMembersTypesEndpoint(ConnectWiseEndpoint):
         Returns:
             MemberType: The parsed response data.
         """
-        return self._parse_one(MemberType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemMembersTypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersTypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemMembersTypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembersTypesCountEndpoint")
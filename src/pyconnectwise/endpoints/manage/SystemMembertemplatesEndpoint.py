@@ -1,26 +1,32 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMembertemplatesCountEndpoint import SystemMembertemplatesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMembertemplatesIdEndpoint import SystemMembertemplatesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMembertemplatesCountEndpoint import SystemMembertemplatesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMembertemplatesIdEndpoint import SystemMembertemplatesIdEndpoint
+
 
 class SystemMembertemplatesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "membertemplates", parent_endpoint=parent_endpoint)
+    endpoint_base = "membertemplates"
+    _route = "system/membertemplates"
 
-        self.count = self._register_child_endpoint(SystemMembertemplatesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMembertemplatesIdEndpoint:
+    def id(self, id: int) -> "SystemMembertemplatesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMembertemplatesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMembertemplatesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMembertemplatesIdEndpoint: The initialized SystemMembertemplatesIdEndpoint object.
+            SystemMembertemplatesIdEndpoint: The SystemMembertemplatesIdEndpoint view bound to the ID.
         """
-        child = SystemMembertemplatesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMembertemplatesIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "SystemMembertemplatesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMembertemplatesCountEndpoint")
@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMenuentriesIdEndpoint import SystemMenuentriesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMenuentriesIdEndpoint import SystemMenuentriesIdEndpoint
+
 
 class SystemMenuentriesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "menuEntries"
+    _route = "system/menuEntries"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "menuEntries", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMenuentriesIdEndpoint:
+    def id(self, id: int) -> "SystemMenuentriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMenuentriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMenuentriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMenuentriesIdEndpoint: The initialized SystemMenuentriesIdEndpoint object.
+            SystemMenuentriesIdEndpoint: The SystemMenuentriesIdEndpoint view bound to the ID.
         """
-        child = SystemMenuentriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMenuentriesIdEndpoint", id)
@@ -1,14 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMenuentriesIdLocationsEndpoint import SystemMenuentriesIdLocationsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMenuentriesIdLocationsEndpoint import SystemMenuentriesIdLocationsEndpoint
+
 
 class SystemMenuentriesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/menuEntries/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.locations = self._register_child_endpoint(
-            SystemMenuentriesIdLocationsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def locations(self) -> "SystemMenuentriesIdLocationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMenuentriesIdLocationsEndpoint")
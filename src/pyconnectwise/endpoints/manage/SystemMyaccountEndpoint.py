@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMyaccountIdEndpoint import SystemMyaccountIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMyaccountIdEndpoint import SystemMyaccountIdEndpoint
+
 
 class SystemMyaccountEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "myAccount"
+    _route = "system/myAccount"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "myAccount", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMyaccountIdEndpoint:
+    def id(self, id: int) -> "SystemMyaccountIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMyaccountIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMyaccountIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMyaccountIdEndpoint: The initialized SystemMyaccountIdEndpoint object.
+            SystemMyaccountIdEndpoint: The SystemMyaccountIdEndpoint view bound to the ID.
         """
-        child = SystemMyaccountIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMyaccountIdEndpoint", id)
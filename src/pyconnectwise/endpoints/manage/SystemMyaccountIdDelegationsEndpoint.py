@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsCountEndpoint import \
-    SystemMyaccountIdDelegationsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsIdEndpoint import SystemMyaccountIdDelegationsIdEndpoint
 from pyconnectwise.models.manage import MemberDelegation
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsCountEndpoint import \
+        SystemMyaccountIdDelegationsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsIdEndpoint import \
+        SystemMyaccountIdDelegationsIdEndpoint
+
 
 class SystemMyaccountIdDelegationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "delegations", parent_endpoint=parent_endpoint)
+    endpoint_base = "delegations"
+    _route = "system/myAccount/{id}/delegations"
 
-        self.count = self._register_child_endpoint(
-            SystemMyaccountIdDelegationsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMyaccountIdDelegationsIdEndpoint:
+    def id(self, id: int) -> "SystemMyaccountIdDelegationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMyaccountIdDelegationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMyaccountIdDelegationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMyaccountIdDelegationsIdEndpoint: The initialized SystemMyaccountIdDelegationsIdEndpoint object.
+            SystemMyaccountIdDelegationsIdEndpoint: The SystemMyaccountIdDelegationsIdEndpoint view bound to the ID.
         """
-        child = SystemMyaccountIdDelegationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[MemberDelegation]:
         """
         Performs a GET request against the /system/myAccount/{id}/delegations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MemberDelegation]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MemberDelegation,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MemberDelegation, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[MemberDelegation]:
         """
@@ -62,7 +56,7 @@ class SystemMyaccountIdDelegationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[MemberDelegation]: The parsed response data.
         """
-        return self._parse_many(MemberDelegation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberDelegation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MemberDelegation:
         """
@@ -74,4 +68,8 @@ class SystemMyaccountIdDelegationsEndpoint(ConnectWiseEndpoint):
         Returns:
             MemberDelegation: The parsed response data.
         """
-        return self._parse_one(MemberDelegation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberDelegation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemMyaccountIdDelegationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsCountEndpoint")
@@ -1,41 +1,37 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsEndpoint import SystemMyaccountIdDelegationsEndpoint
-from pyconnectwise.endpoints.manage.SystemMyaccountIdSkillsEndpoint import SystemMyaccountIdSkillsEndpoint
 from pyconnectwise.models.manage import MyAccount
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsEndpoint import SystemMyaccountIdDelegationsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMyaccountIdSkillsEndpoint import SystemMyaccountIdSkillsEndpoint
+
 
 class SystemMyaccountIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/myAccount/{id}"
 
-        self.skills = self._register_child_endpoint(SystemMyaccountIdSkillsEndpoint(client, parent_endpoint=self))
-        self.delegations = self._register_child_endpoint(
-            SystemMyaccountIdDelegationsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[MyAccount]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[MyAccount]:
         """
         Performs a GET request against the /system/myAccount/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[MyAccount]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            MyAccount,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(MyAccount, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MyAccount:
         """
@@ -47,7 +43,7 @@ class SystemMyaccountIdEndpoint(ConnectWiseEndpoint):
         Returns:
             MyAccount: The parsed response data.
         """
-        return self._parse_one(MyAccount, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MyAccount, super()._make_request("GET", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MyAccount:
         """
@@ -59,7 +55,7 @@ class SystemMyaccountIdEndpoint(ConnectWiseEndpoint):
         Returns:
             MyAccount: The parsed response data.
         """
-        return self._parse_one(MyAccount, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(MyAccount, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> MyAccount:
         """
@@ -71,4 +67,12 @@ class SystemMyaccountIdEndpoint(ConnectWiseEndpoint):
         Returns:
             MyAccount: The parsed response data.
         """
-        return self._parse_one(MyAccount, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(MyAccount, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def skills(self) -> "SystemMyaccountIdSkillsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMyaccountIdSkillsEndpoint")
+
+    @cached_property
+    def delegations(self) -> "SystemMyaccountIdDelegationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMyaccountIdDelegationsEndpoint")
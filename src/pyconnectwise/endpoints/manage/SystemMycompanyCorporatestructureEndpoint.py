@@ -1,62 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureCountEndpoint import \
-    SystemMycompanyCorporatestructureCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureIdEndpoint import \
-    SystemMycompanyCorporatestructureIdEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureInfoEndpoint import \
-    SystemMycompanyCorporatestructureInfoEndpoint
 from pyconnectwise.models.manage import CorporateStructure
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureCountEndpoint import \
+        SystemMycompanyCorporatestructureCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureIdEndpoint import \
+        SystemMycompanyCorporatestructureIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureInfoEndpoint import \
+        SystemMycompanyCorporatestructureInfoEndpoint
+
 
 class SystemMycompanyCorporatestructureEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "corporateStructure", parent_endpoint=parent_endpoint)
+    endpoint_base = "corporateStructure"
+    _route = "system/myCompany/corporateStructure"
 
-        self.info = self._register_child_endpoint(
-            SystemMycompanyCorporatestructureInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            SystemMycompanyCorporatestructureCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMycompanyCorporatestructureIdEndpoint:
+    def id(self, id: int) -> "SystemMycompanyCorporatestructureIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMycompanyCorporatestructureIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMycompanyCorporatestructureIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMycompanyCorporatestructureIdEndpoint: The initialized SystemMycompanyCorporatestructureIdEndpoint object.
+            SystemMycompanyCorporatestructureIdEndpoint: The SystemMycompanyCorporatestructureIdEndpoint view bound to the ID.
         """
-        child = SystemMycompanyCorporatestructureIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[CorporateStructure]:
         """
         Performs a GET request against the /system/myCompany/corporateStructure endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[CorporateStructure]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            CorporateStructure,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(CorporateStructure, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[CorporateStructure]:
         """
@@ -68,4 +58,16 @@ class SystemMycompanyCorporatestructureEndpoint(ConnectWiseEndpoint):
         Returns:
             list[CorporateStructure]: The parsed response data.
         """
-        return self._parse_many(CorporateStructure, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CorporateStructure, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemMycompanyCorporatestructureInfoEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureInfoEndpoint"
+        )
+
+    @cached_property
+    def count(self) -> "SystemMycompanyCorporatestructureCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemMycompanyCorporatestructureCountEndpoint"
+        )
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyCrmCountEndpoint import SystemMycompanyCrmCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyCrmIdEndpoint import SystemMycompanyCrmIdEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyCrmInfoEndpoint import SystemMycompanyCrmInfoEndpoint
 from pyconnectwise.models.manage import Crm
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMycompanyCrmCountEndpoint import SystemMycompanyCrmCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyCrmIdEndpoint import SystemMycompanyCrmIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyCrmInfoEndpoint import SystemMycompanyCrmInfoEndpoint
+
 
 class SystemMycompanyCrmEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "crm", parent_endpoint=parent_endpoint)
+    endpoint_base = "crm"
+    _route = "system/myCompany/crm"
 
-        self.info = self._register_child_endpoint(SystemMycompanyCrmInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemMycompanyCrmCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMycompanyCrmIdEndpoint:
+    def id(self, id: int) -> "SystemMycompanyCrmIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMycompanyCrmIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMycompanyCrmIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMycompanyCrmIdEndpoint: The initialized SystemMycompanyCrmIdEndpoint object.
+            SystemMycompanyCrmIdEndpoint: The SystemMycompanyCrmIdEndpoint view bound to the ID.
         """
-        child = SystemMycompanyCrmIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMycompanyCrmIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Crm]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Crm]:
         """
         Performs a GET request against the /system/myCompany/crm endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Crm]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Crm,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Crm, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Crm]:
         """
@@ -59,4 +55,12 @@ class SystemMycompanyCrmEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Crm]: The parsed response data.
         """
-        return self._parse_many(Crm, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Crm, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemMycompanyCrmInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyCrmInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemMycompanyCrmCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyCrmCountEndpoint")
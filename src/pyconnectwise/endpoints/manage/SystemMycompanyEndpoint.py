@@ -1,21 +1,36 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyDocumentsEndpoint import SystemMycompanyDocumentsEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyInfoEndpoint import SystemMycompanyInfoEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyReportingservicesEndpoint import \
-    SystemMycompanyReportingservicesEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyServicesEndpoint import SystemMycompanyServicesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMycompanyDocumentsEndpoint import SystemMycompanyDocumentsEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyInfoEndpoint import SystemMycompanyInfoEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyReportingservicesEndpoint import \
+        SystemMycompanyReportingservicesEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyServicesEndpoint import SystemMycompanyServicesEndpoint
+
 
 class SystemMycompanyEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "mycompany"
+    _route = "system/mycompany"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "mycompany", parent_endpoint=parent_endpoint)
-
-        self.reporting_services = self._register_child_endpoint(
-            SystemMycompanyReportingservicesEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(SystemMycompanyInfoEndpoint(client, parent_endpoint=self))
-        self.documents = self._register_child_endpoint(SystemMycompanyDocumentsEndpoint(client, parent_endpoint=self))
-        self.services = self._register_child_endpoint(SystemMycompanyServicesEndpoint(client, parent_endpoint=self))
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def reporting_services(self) -> "SystemMycompanyReportingservicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyReportingservicesEndpoint")
+
+    @cached_property
+    def info(self) -> "SystemMycompanyInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyInfoEndpoint")
+
+    @cached_property
+    def documents(self) -> "SystemMycompanyDocumentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyDocumentsEndpoint")
+
+    @cached_property
+    def services(self) -> "SystemMycompanyServicesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyServicesEndpoint")
@@ -1,48 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyInfoServicesIdEndpoint import SystemMycompanyInfoServicesIdEndpoint
 from pyconnectwise.models.manage import ServiceInfo
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMycompanyInfoServicesIdEndpoint import \
+        SystemMycompanyInfoServicesIdEndpoint
+
 
 class SystemMycompanyInfoServicesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "services"
+    _route = "system/mycompany/info/services"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "services", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMycompanyInfoServicesIdEndpoint:
+    def id(self, id: int) -> "SystemMycompanyInfoServicesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMycompanyInfoServicesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMycompanyInfoServicesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMycompanyInfoServicesIdEndpoint: The initialized SystemMycompanyInfoServicesIdEndpoint object.
+            SystemMycompanyInfoServicesIdEndpoint: The SystemMycompanyInfoServicesIdEndpoint view bound to the ID.
         """
-        child = SystemMycompanyInfoServicesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMycompanyInfoServicesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ServiceInfo]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ServiceInfo]:
         """
         Performs a GET request against the /system/mycompany/info/services endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ServiceInfo]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ServiceInfo,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ServiceInfo, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ServiceInfo]:
         """
@@ -54,4 +54,4 @@ class SystemMycompanyInfoServicesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ServiceInfo]: The parsed response data.
         """
-        return self._parse_many(ServiceInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyReportingservicesIdEndpoint import \
-    SystemMycompanyReportingservicesIdEndpoint
 from pyconnectwise.models.manage import ReportingService
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMycompanyReportingservicesIdEndpoint import \
+        SystemMycompanyReportingservicesIdEndpoint
+
 
 class SystemMycompanyReportingservicesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "reportingServices"
+    _route = "system/mycompany/reportingServices"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "reportingServices", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMycompanyReportingservicesIdEndpoint:
+    def id(self, id: int) -> "SystemMycompanyReportingservicesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMycompanyReportingservicesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMycompanyReportingservicesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMycompanyReportingservicesIdEndpoint: The initialized SystemMycompanyReportingservicesIdEndpoint object.
+            SystemMycompanyReportingservicesIdEndpoint: The SystemMycompanyReportingservicesIdEndpoint view bound to the ID.
         """
-        child = SystemMycompanyReportingservicesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMycompanyReportingservicesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ReportingService]:
         """
         Performs a GET request against the /system/mycompany/reportingServices endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ReportingService]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ReportingService,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ReportingService, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ReportingService]:
         """
@@ -57,4 +54,4 @@ class SystemMycompanyReportingservicesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ReportingService]: The parsed response data.
         """
-        return self._parse_many(ReportingService, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ReportingService, super()._make_request("GET", data=data, params=params).content)
@@ -1,54 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyTimeexpenseCountEndpoint import \
-    SystemMycompanyTimeexpenseCountEndpoint
-from pyconnectwise.endpoints.manage.SystemMycompanyTimeexpenseIdEndpoint import SystemMycompanyTimeexpenseIdEndpoint
 from pyconnectwise.models.manage import TimeExpense
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemMycompanyTimeexpenseCountEndpoint import \
+        SystemMycompanyTimeexpenseCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemMycompanyTimeexpenseIdEndpoint import SystemMycompanyTimeexpenseIdEndpoint
+
 
 class SystemMycompanyTimeexpenseEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "timeExpense", parent_endpoint=parent_endpoint)
+    endpoint_base = "timeExpense"
+    _route = "system/myCompany/timeExpense"
 
-        self.count = self._register_child_endpoint(
-            SystemMycompanyTimeexpenseCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemMycompanyTimeexpenseIdEndpoint:
+    def id(self, id: int) -> "SystemMycompanyTimeexpenseIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemMycompanyTimeexpenseIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemMycompanyTimeexpenseIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemMycompanyTimeexpenseIdEndpoint: The initialized SystemMycompanyTimeexpenseIdEndpoint object.
+            SystemMycompanyTimeexpenseIdEndpoint: The SystemMycompanyTimeexpenseIdEndpoint view bound to the ID.
         """
-        child = SystemMycompanyTimeexpenseIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemMycompanyTimeexpenseIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TimeExpense]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TimeExpense]:
         """
         Performs a GET request against the /system/myCompany/timeExpense endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TimeExpense]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TimeExpense,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TimeExpense, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TimeExpense]:
         """
@@ -60,4 +55,8 @@ class SystemMycompanyTimeexpenseEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TimeExpense]: The parsed response data.
         """
-        return self._parse_many(TimeExpense, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeExpense, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemMycompanyTimeexpenseCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemMycompanyTimeexpenseCountEndpoint")
@@ -1,9 +1,13 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class SystemMysecurityCustomizeitemsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "customizeItems"
+    _route = "system/mySecurity/customizeItems"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "customizeItems", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
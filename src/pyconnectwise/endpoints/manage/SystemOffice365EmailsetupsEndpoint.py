@@ -1,56 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsCountEndpoint import \
-    SystemOffice365EmailsetupsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdEndpoint import SystemOffice365EmailsetupsIdEndpoint
 from pyconnectwise.models.manage import Office365EmailSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsCountEndpoint import \
+        SystemOffice365EmailsetupsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdEndpoint import SystemOffice365EmailsetupsIdEndpoint
+
 
 class SystemOffice365EmailsetupsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "emailSetups", parent_endpoint=parent_endpoint)
+    endpoint_base = "emailSetups"
+    _route = "system/office365/emailSetups"
 
-        self.count = self._register_child_endpoint(
-            SystemOffice365EmailsetupsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemOffice365EmailsetupsIdEndpoint:
+    def id(self, id: int) -> "SystemOffice365EmailsetupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemOffice365EmailsetupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemOffice365EmailsetupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemOffice365EmailsetupsIdEndpoint: The initialized SystemOffice365EmailsetupsIdEndpoint object.
+            SystemOffice365EmailsetupsIdEndpoint: The SystemOffice365EmailsetupsIdEndpoint view bound to the ID.
         """
-        child = SystemOffice365EmailsetupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[Office365EmailSetup]:
         """
         Performs a GET request against the /system/office365/emailSetups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Office365EmailSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Office365EmailSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Office365EmailSetup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Office365EmailSetup]:
         """
@@ -62,7 +55,7 @@ class SystemOffice365EmailsetupsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Office365EmailSetup]: The parsed response data.
         """
-        return self._parse_many(Office365EmailSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Office365EmailSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Office365EmailSetup:
         """
@@ -74,4 +67,8 @@ class SystemOffice365EmailsetupsEndpoint(ConnectWiseEndpoint):
         Returns:
             Office365EmailSetup: The parsed response data.
         """
-        return self._parse_one(Office365EmailSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Office365EmailSetup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemOffice365EmailsetupsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsCountEndpoint")
@@ -1,47 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdAuthorizeEndpoint import \
-    SystemOffice365EmailsetupsIdAuthorizeEndpoint
-from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdTestconnectionEndpoint import \
-    SystemOffice365EmailsetupsIdTestconnectionEndpoint
 from pyconnectwise.models.manage import Office365EmailSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdAuthorizeEndpoint import \
+        SystemOffice365EmailsetupsIdAuthorizeEndpoint
+    from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdTestconnectionEndpoint import \
+        SystemOffice365EmailsetupsIdTestconnectionEndpoint
+
 
 class SystemOffice365EmailsetupsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/office365/emailSetups/{id}"
 
-        self.test_connection = self._register_child_endpoint(
-            SystemOffice365EmailsetupsIdTestconnectionEndpoint(client, parent_endpoint=self)
-        )
-        self.authorize = self._register_child_endpoint(
-            SystemOffice365EmailsetupsIdAuthorizeEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[Office365EmailSetup]:
         """
         Performs a GET request against the /system/office365/emailSetups/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Office365EmailSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Office365EmailSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Office365EmailSetup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Office365EmailSetup:
         """
@@ -53,7 +45,7 @@ class SystemOffice365EmailsetupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Office365EmailSetup: The parsed response data.
         """
-        return self._parse_one(Office365EmailSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Office365EmailSetup, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -75,7 +67,7 @@ class SystemOffice365EmailsetupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Office365EmailSetup: The parsed response data.
         """
-        return self._parse_one(Office365EmailSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Office365EmailSetup, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Office365EmailSetup:
         """
@@ -87,4 +79,16 @@ class SystemOffice365EmailsetupsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Office365EmailSetup: The parsed response data.
         """
-        return self._parse_one(Office365EmailSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Office365EmailSetup, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def test_connection(self) -> "SystemOffice365EmailsetupsIdTestconnectionEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdTestconnectionEndpoint"
+        )
+
+    @cached_property
+    def authorize(self) -> "SystemOffice365EmailsetupsIdAuthorizeEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsIdAuthorizeEndpoint"
+        )
@@ -1,14 +1,20 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsEndpoint import SystemOffice365EmailsetupsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsEndpoint import SystemOffice365EmailsetupsEndpoint
+
 
 class SystemOffice365Endpoint(ConnectWiseEndpoint):
+    endpoint_base = "office365"
+    _route = "system/office365"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "office365", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.email_setups = self._register_child_endpoint(
-            SystemOffice365EmailsetupsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def email_setups(self) -> "SystemOffice365EmailsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemOffice365EmailsetupsEndpoint")
@@ -1,29 +1,34 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingCountEndpoint import \
-    SystemOnpremisesearchsettingCountEndpoint
-from pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingIdEndpoint import SystemOnpremisesearchsettingIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingCountEndpoint import \
+        SystemOnpremisesearchsettingCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingIdEndpoint import \
+        SystemOnpremisesearchsettingIdEndpoint
+
 
 class SystemOnpremisesearchsettingEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "onPremiseSearchSetting", parent_endpoint=parent_endpoint)
+    endpoint_base = "onPremiseSearchSetting"
+    _route = "system/onPremiseSearchSetting"
 
-        self.count = self._register_child_endpoint(
-            SystemOnpremisesearchsettingCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemOnpremisesearchsettingIdEndpoint:
+    def id(self, id: int) -> "SystemOnpremisesearchsettingIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemOnpremisesearchsettingIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemOnpremisesearchsettingIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemOnpremisesearchsettingIdEndpoint: The initialized SystemOnpremisesearchsettingIdEndpoint object.
+            SystemOnpremisesearchsettingIdEndpoint: The SystemOnpremisesearchsettingIdEndpoint view bound to the ID.
         """
-        child = SystemOnpremisesearchsettingIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingIdEndpoint", id)
+
+    @cached_property
+    def count(self) -> "SystemOnpremisesearchsettingCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingCountEndpoint")
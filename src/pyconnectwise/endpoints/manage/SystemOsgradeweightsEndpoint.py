@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemOsgradeweightsCountEndpoint import SystemOsgradeweightsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemOsgradeweightsIdEndpoint import SystemOsgradeweightsIdEndpoint
 from pyconnectwise.models.manage import OsGradeWeight
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemOsgradeweightsCountEndpoint import SystemOsgradeweightsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemOsgradeweightsIdEndpoint import SystemOsgradeweightsIdEndpoint
+
 
 class SystemOsgradeweightsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "osgradeweights", parent_endpoint=parent_endpoint)
+    endpoint_base = "osgradeweights"
+    _route = "system/osgradeweights"
 
-        self.count = self._register_child_endpoint(SystemOsgradeweightsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemOsgradeweightsIdEndpoint:
+    def id(self, id: int) -> "SystemOsgradeweightsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemOsgradeweightsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemOsgradeweightsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemOsgradeweightsIdEndpoint: The initialized SystemOsgradeweightsIdEndpoint object.
+            SystemOsgradeweightsIdEndpoint: The SystemOsgradeweightsIdEndpoint view bound to the ID.
         """
-        child = SystemOsgradeweightsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemOsgradeweightsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[OsGradeWeight]:
         """
         Performs a GET request against the /system/osgradeweights endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[OsGradeWeight]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            OsGradeWeight,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(OsGradeWeight, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[OsGradeWeight]:
         """
@@ -59,4 +54,8 @@ class SystemOsgradeweightsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[OsGradeWeight]: The parsed response data.
         """
-        return self._parse_many(OsGradeWeight, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OsGradeWeight, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemOsgradeweightsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemOsgradeweightsCountEndpoint")
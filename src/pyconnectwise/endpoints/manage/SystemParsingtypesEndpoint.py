@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemParsingtypesCountEndpoint import SystemParsingtypesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemParsingtypesIdEndpoint import SystemParsingtypesIdEndpoint
 from pyconnectwise.models.manage import ParsingType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemParsingtypesCountEndpoint import SystemParsingtypesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemParsingtypesIdEndpoint import SystemParsingtypesIdEndpoint
+
 
 class SystemParsingtypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "parsingTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "parsingTypes"
+    _route = "system/parsingTypes"
 
-        self.count = self._register_child_endpoint(SystemParsingtypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemParsingtypesIdEndpoint:
+    def id(self, id: int) -> "SystemParsingtypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemParsingtypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemParsingtypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemParsingtypesIdEndpoint: The initialized SystemParsingtypesIdEndpoint object.
+            SystemParsingtypesIdEndpoint: The SystemParsingtypesIdEndpoint view bound to the ID.
         """
-        child = SystemParsingtypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemParsingtypesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ParsingType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ParsingType]:
         """
         Performs a GET request against the /system/parsingTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ParsingType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ParsingType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ParsingType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ParsingType]:
         """
@@ -57,4 +54,8 @@ class SystemParsingtypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ParsingType]: The parsed response data.
         """
-        return self._parse_many(ParsingType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ParsingType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemParsingtypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemParsingtypesCountEndpoint")
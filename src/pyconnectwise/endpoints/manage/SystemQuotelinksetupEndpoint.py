@@ -1,56 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemQuotelinksetupCountEndpoint import SystemQuotelinksetupCountEndpoint
-from pyconnectwise.endpoints.manage.SystemQuotelinksetupIdEndpoint import SystemQuotelinksetupIdEndpoint
-from pyconnectwise.endpoints.manage.SystemQuotelinksetupTestconnectionEndpoint import \
-    SystemQuotelinksetupTestconnectionEndpoint
 from pyconnectwise.models.manage import QuoteLink
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemQuotelinksetupCountEndpoint import SystemQuotelinksetupCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemQuotelinksetupIdEndpoint import SystemQuotelinksetupIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemQuotelinksetupTestconnectionEndpoint import \
+        SystemQuotelinksetupTestconnectionEndpoint
+
 
 class SystemQuotelinksetupEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "quoteLinkSetup", parent_endpoint=parent_endpoint)
+    endpoint_base = "quoteLinkSetup"
+    _route = "system/quoteLinkSetup"
 
-        self.test_connection = self._register_child_endpoint(
-            SystemQuotelinksetupTestconnectionEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(SystemQuotelinksetupCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemQuotelinksetupIdEndpoint:
+    def id(self, id: int) -> "SystemQuotelinksetupIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemQuotelinksetupIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemQuotelinksetupIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemQuotelinksetupIdEndpoint: The initialized SystemQuotelinksetupIdEndpoint object.
+            SystemQuotelinksetupIdEndpoint: The SystemQuotelinksetupIdEndpoint view bound to the ID.
         """
-        child = SystemQuotelinksetupIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemQuotelinksetupIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[QuoteLink]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[QuoteLink]:
         """
         Performs a GET request against the /system/quoteLinkSetup endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[QuoteLink]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            QuoteLink,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(QuoteLink, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[QuoteLink]:
         """
@@ -62,7 +56,7 @@ class SystemQuotelinksetupEndpoint(ConnectWiseEndpoint):
         Returns:
             list[QuoteLink]: The parsed response data.
         """
-        return self._parse_many(QuoteLink, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(QuoteLink, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> QuoteLink:
         """
@@ -74,4 +68,12 @@ class SystemQuotelinksetupEndpoint(ConnectWiseEndpoint):
         Returns:
             QuoteLink: The parsed response data.
         """
-        return self._parse_one(QuoteLink, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(QuoteLink, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def test_connection(self) -> "SystemQuotelinksetupTestconnectionEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemQuotelinksetupTestconnectionEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemQuotelinksetupCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemQuotelinksetupCountEndpoint")
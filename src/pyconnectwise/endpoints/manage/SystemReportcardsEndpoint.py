@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemReportcardsCountEndpoint import SystemReportcardsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemReportcardsIdEndpoint import SystemReportcardsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemReportcardsInfoEndpoint import SystemReportcardsInfoEndpoint
 from pyconnectwise.models.manage import ReportCard
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemReportcardsCountEndpoint import SystemReportcardsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemReportcardsIdEndpoint import SystemReportcardsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemReportcardsInfoEndpoint import SystemReportcardsInfoEndpoint
+
 
 class SystemReportcardsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "reportCards", parent_endpoint=parent_endpoint)
+    endpoint_base = "reportCards"
+    _route = "system/reportCards"
 
-        self.info = self._register_child_endpoint(SystemReportcardsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemReportcardsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemReportcardsIdEndpoint:
+    def id(self, id: int) -> "SystemReportcardsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemReportcardsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemReportcardsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemReportcardsIdEndpoint: The initialized SystemReportcardsIdEndpoint object.
+            SystemReportcardsIdEndpoint: The SystemReportcardsIdEndpoint view bound to the ID.
         """
-        child = SystemReportcardsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemReportcardsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ReportCard]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ReportCard]:
         """
         Performs a GET request against the /system/reportCards endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ReportCard]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ReportCard,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ReportCard, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ReportCard]:
         """
@@ -59,7 +55,7 @@ class SystemReportcardsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ReportCard]: The parsed response data.
         """
-        return self._parse_many(ReportCard, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ReportCard, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ReportCard:
         """
@@ -71,4 +67,12 @@ class SystemReportcardsEndpoint(ConnectWiseEndpoint):
         Returns:
             ReportCard: The parsed response data.
         """
-        return self._parse_one(ReportCard, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ReportCard, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemReportcardsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemReportcardsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemReportcardsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemReportcardsCountEndpoint")
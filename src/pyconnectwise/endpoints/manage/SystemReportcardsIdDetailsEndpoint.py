@@ -1,56 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemReportcardsIdDetailsCountEndpoint import \
-    SystemReportcardsIdDetailsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemReportcardsIdDetailsIdEndpoint import SystemReportcardsIdDetailsIdEndpoint
 from pyconnectwise.models.manage import ReportCardDetail
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemReportcardsIdDetailsCountEndpoint import \
+        SystemReportcardsIdDetailsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemReportcardsIdDetailsIdEndpoint import SystemReportcardsIdDetailsIdEndpoint
+
 
 class SystemReportcardsIdDetailsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "details", parent_endpoint=parent_endpoint)
+    endpoint_base = "details"
+    _route = "system/reportCards/{id}/details"
 
-        self.count = self._register_child_endpoint(
-            SystemReportcardsIdDetailsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemReportcardsIdDetailsIdEndpoint:
+    def id(self, id: int) -> "SystemReportcardsIdDetailsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemReportcardsIdDetailsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemReportcardsIdDetailsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemReportcardsIdDetailsIdEndpoint: The initialized SystemReportcardsIdDetailsIdEndpoint object.
+            SystemReportcardsIdDetailsIdEndpoint: The SystemReportcardsIdDetailsIdEndpoint view bound to the ID.
         """
-        child = SystemReportcardsIdDetailsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemReportcardsIdDetailsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ReportCardDetail]:
         """
         Performs a GET request against the /system/reportCards/{id}/details endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ReportCardDetail]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ReportCardDetail,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ReportCardDetail, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ReportCardDetail]:
         """
@@ -62,7 +55,7 @@ class SystemReportcardsIdDetailsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ReportCardDetail]: The parsed response data.
         """
-        return self._parse_many(ReportCardDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ReportCardDetail, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ReportCardDetail:
         """
@@ -74,4 +67,8 @@ class SystemReportcardsIdDetailsEndpoint(ConnectWiseEndpoint):
         Returns:
             ReportCardDetail: The parsed response data.
         """
-        return self._parse_one(ReportCardDetail, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ReportCardDetail, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemReportcardsIdDetailsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemReportcardsIdDetailsCountEndpoint")
@@ -1,48 +1,47 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemReportsIdEndpoint import SystemReportsIdEndpoint
 from pyconnectwise.models.manage import Report
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemReportsIdEndpoint import SystemReportsIdEndpoint
+
 
 class SystemReportsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "reports"
+    _route = "system/reports"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "reports", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemReportsIdEndpoint:
+    def id(self, id: int) -> "SystemReportsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemReportsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemReportsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemReportsIdEndpoint: The initialized SystemReportsIdEndpoint object.
+            SystemReportsIdEndpoint: The SystemReportsIdEndpoint view bound to the ID.
         """
-        child = SystemReportsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemReportsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Report]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Report]:
         """
         Performs a GET request against the /system/reports endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Report]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Report,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Report, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Report]:
         """
@@ -54,4 +53,4 @@ class SystemReportsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Report]: The parsed response data.
         """
-        return self._parse_many(Report, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Report, super()._make_request("GET", data=data, params=params).content)
@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSecurityrolesIdEndpoint import SystemSecurityrolesIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSecurityrolesIdEndpoint import SystemSecurityrolesIdEndpoint
+
 
 class SystemSecurityrolesEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "securityRoles"
+    _route = "system/securityRoles"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "securityRoles", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemSecurityrolesIdEndpoint:
+    def id(self, id: int) -> "SystemSecurityrolesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemSecurityrolesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemSecurityrolesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemSecurityrolesIdEndpoint: The initialized SystemSecurityrolesIdEndpoint object.
+            SystemSecurityrolesIdEndpoint: The SystemSecurityrolesIdEndpoint view bound to the ID.
         """
-        child = SystemSecurityrolesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemSecurityrolesIdEndpoint", id)
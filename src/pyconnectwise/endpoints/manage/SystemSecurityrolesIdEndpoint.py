@@ -1,14 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSecurityrolesIdSettingsEndpoint import SystemSecurityrolesIdSettingsEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSecurityrolesIdSettingsEndpoint import \
+        SystemSecurityrolesIdSettingsEndpoint
+
 
 class SystemSecurityrolesIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/securityRoles/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.settings = self._register_child_endpoint(
-            SystemSecurityrolesIdSettingsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def settings(self) -> "SystemSecurityrolesIdSettingsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSecurityrolesIdSettingsEndpoint")
@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSettingsCountEndpoint import SystemSettingsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemSettingsIdEndpoint import SystemSettingsIdEndpoint
 from pyconnectwise.models.manage import SystemSetting
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSettingsCountEndpoint import SystemSettingsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemSettingsIdEndpoint import SystemSettingsIdEndpoint
+
 
 class SystemSettingsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "settings", parent_endpoint=parent_endpoint)
+    endpoint_base = "settings"
+    _route = "system/settings"
 
-        self.count = self._register_child_endpoint(SystemSettingsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemSettingsIdEndpoint:
+    def id(self, id: int) -> "SystemSettingsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemSettingsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemSettingsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemSettingsIdEndpoint: The initialized SystemSettingsIdEndpoint object.
+            SystemSettingsIdEndpoint: The SystemSettingsIdEndpoint view bound to the ID.
         """
-        child = SystemSettingsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemSettingsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[SystemSetting]:
         """
         Performs a GET request against the /system/settings endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SystemSetting]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SystemSetting,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SystemSetting, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SystemSetting]:
         """
@@ -59,4 +54,8 @@ class SystemSettingsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SystemSetting]: The parsed response data.
         """
-        return self._parse_many(SystemSetting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SystemSetting, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemSettingsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSettingsCountEndpoint")
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSetupscreensCountEndpoint import SystemSetupscreensCountEndpoint
-from pyconnectwise.endpoints.manage.SystemSetupscreensIdEndpoint import SystemSetupscreensIdEndpoint
 from pyconnectwise.models.manage import SetupScreen
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSetupscreensCountEndpoint import SystemSetupscreensCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemSetupscreensIdEndpoint import SystemSetupscreensIdEndpoint
+
 
 class SystemSetupscreensEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "setupScreens", parent_endpoint=parent_endpoint)
+    endpoint_base = "setupScreens"
+    _route = "system/setupScreens"
 
-        self.count = self._register_child_endpoint(SystemSetupscreensCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemSetupscreensIdEndpoint:
+    def id(self, id: int) -> "SystemSetupscreensIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemSetupscreensIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemSetupscreensIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemSetupscreensIdEndpoint: The initialized SystemSetupscreensIdEndpoint object.
+            SystemSetupscreensIdEndpoint: The SystemSetupscreensIdEndpoint view bound to the ID.
         """
-        child = SystemSetupscreensIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemSetupscreensIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[SetupScreen]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[SetupScreen]:
         """
         Performs a GET request against the /system/setupScreens endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SetupScreen]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SetupScreen,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SetupScreen, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SetupScreen]:
         """
@@ -57,4 +54,8 @@ class SystemSetupscreensEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SetupScreen]: The parsed response data.
         """
-        return self._parse_many(SetupScreen, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SetupScreen, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemSetupscreensCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSetupscreensCountEndpoint")
@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSkillcategoriesCountEndpoint import SystemSkillcategoriesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemSkillcategoriesIdEndpoint import SystemSkillcategoriesIdEndpoint
 from pyconnectwise.models.manage import SkillCategory
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSkillcategoriesCountEndpoint import SystemSkillcategoriesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemSkillcategoriesIdEndpoint import SystemSkillcategoriesIdEndpoint
+
 
 class SystemSkillcategoriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "skillCategories", parent_endpoint=parent_endpoint)
+    endpoint_base = "skillCategories"
+    _route = "system/skillCategories"
 
-        self.count = self._register_child_endpoint(SystemSkillcategoriesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemSkillcategoriesIdEndpoint:
+    def id(self, id: int) -> "SystemSkillcategoriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemSkillcategoriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemSkillcategoriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemSkillcategoriesIdEndpoint: The initialized SystemSkillcategoriesIdEndpoint object.
+            SystemSkillcategoriesIdEndpoint: The SystemSkillcategoriesIdEndpoint view bound to the ID.
         """
-        child = SystemSkillcategoriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemSkillcategoriesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[SkillCategory]:
         """
         Performs a GET request against the /system/skillCategories endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SkillCategory]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SkillCategory,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SkillCategory, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SkillCategory]:
         """
@@ -59,7 +54,7 @@ class SystemSkillcategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SkillCategory]: The parsed response data.
         """
-        return self._parse_many(SkillCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SkillCategory, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SkillCategory:
         """
@@ -71,4 +66,8 @@ class SystemSkillcategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             SkillCategory: The parsed response data.
         """
-        return self._parse_one(SkillCategory, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SkillCategory, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemSkillcategoriesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSkillcategoriesCountEndpoint")
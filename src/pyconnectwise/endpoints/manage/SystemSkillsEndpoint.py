@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSkillsCountEndpoint import SystemSkillsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemSkillsIdEndpoint import SystemSkillsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemSkillsInfoEndpoint import SystemSkillsInfoEndpoint
 from pyconnectwise.models.manage import Skill
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSkillsCountEndpoint import SystemSkillsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemSkillsIdEndpoint import SystemSkillsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemSkillsInfoEndpoint import SystemSkillsInfoEndpoint
+
 
 class SystemSkillsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "skills", parent_endpoint=parent_endpoint)
+    endpoint_base = "skills"
+    _route = "system/skills"
 
-        self.info = self._register_child_endpoint(SystemSkillsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemSkillsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemSkillsIdEndpoint:
+    def id(self, id: int) -> "SystemSkillsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemSkillsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemSkillsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemSkillsIdEndpoint: The initialized SystemSkillsIdEndpoint object.
+            SystemSkillsIdEndpoint: The SystemSkillsIdEndpoint view bound to the ID.
         """
-        child = SystemSkillsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemSkillsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Skill]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Skill]:
         """
         Performs a GET request against the /system/skills endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Skill]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Skill,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Skill, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Skill]:
         """
@@ -59,7 +55,7 @@ class SystemSkillsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Skill]: The parsed response data.
         """
-        return self._parse_many(Skill, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Skill, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Skill:
         """
@@ -71,4 +67,12 @@ class SystemSkillsEndpoint(ConnectWiseEndpoint):
         Returns:
             Skill: The parsed response data.
         """
-        return self._parse_one(Skill, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Skill, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemSkillsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSkillsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemSkillsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSkillsCountEndpoint")
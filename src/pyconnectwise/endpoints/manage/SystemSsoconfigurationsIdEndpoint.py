@@ -1,47 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSsoconfigurationsIdRegistertokenEndpoint import \
-    SystemSsoconfigurationsIdRegistertokenEndpoint
-from pyconnectwise.endpoints.manage.SystemSsoconfigurationsIdSubmitmembersEndpoint import \
-    SystemSsoconfigurationsIdSubmitmembersEndpoint
 from pyconnectwise.models.manage import SsoConfiguration
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSsoconfigurationsIdRegistertokenEndpoint import \
+        SystemSsoconfigurationsIdRegistertokenEndpoint
+    from pyconnectwise.endpoints.manage.SystemSsoconfigurationsIdSubmitmembersEndpoint import \
+        SystemSsoconfigurationsIdSubmitmembersEndpoint
+
 
 class SystemSsoconfigurationsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/ssoConfigurations/{id}"
 
-        self.submitmembers = self._register_child_endpoint(
-            SystemSsoconfigurationsIdSubmitmembersEndpoint(client, parent_endpoint=self)
-        )
-        self.registertoken = self._register_child_endpoint(
-            SystemSsoconfigurationsIdRegistertokenEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[SsoConfiguration]:
         """
         Performs a GET request against the /system/ssoConfigurations/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SsoConfiguration]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SsoConfiguration,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SsoConfiguration, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SsoConfiguration:
         """
@@ -53,7 +45,7 @@ class SystemSsoconfigurationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             SsoConfiguration: The parsed response data.
         """
-        return self._parse_one(SsoConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SsoConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SsoConfiguration:
         """
@@ -65,7 +57,7 @@ class SystemSsoconfigurationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             SsoConfiguration: The parsed response data.
         """
-        return self._parse_one(SsoConfiguration, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(SsoConfiguration, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SsoConfiguration:
         """
@@ -77,7 +69,7 @@ class SystemSsoconfigurationsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             SsoConfiguration: The parsed response data.
         """
-        return self._parse_one(SsoConfiguration, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(SsoConfiguration, super()._make_request("PATCH", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -88,3 +80,15 @@ class SystemSsoconfigurationsIdEndpoint(ConnectWiseEndpoint):
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def submitmembers(self) -> "SystemSsoconfigurationsIdSubmitmembersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemSsoconfigurationsIdSubmitmembersEndpoint"
+        )
+
+    @cached_property
+    def registertoken(self) -> "SystemSsoconfigurationsIdRegistertokenEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemSsoconfigurationsIdRegistertokenEndpoint"
+        )
@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSsousersCountEndpoint import SystemSsousersCountEndpoint
-from pyconnectwise.endpoints.manage.SystemSsousersIdEndpoint import SystemSsousersIdEndpoint
 from pyconnectwise.models.manage import SsoUser
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSsousersCountEndpoint import SystemSsousersCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemSsousersIdEndpoint import SystemSsousersIdEndpoint
+
 
 class SystemSsousersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "ssoUsers", parent_endpoint=parent_endpoint)
+    endpoint_base = "ssoUsers"
+    _route = "system/ssoUsers"
 
-        self.count = self._register_child_endpoint(SystemSsousersCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemSsousersIdEndpoint:
+    def id(self, id: int) -> "SystemSsousersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemSsousersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemSsousersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemSsousersIdEndpoint: The initialized SystemSsousersIdEndpoint object.
+            SystemSsousersIdEndpoint: The SystemSsousersIdEndpoint view bound to the ID.
         """
-        child = SystemSsousersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemSsousersIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[SsoUser]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[SsoUser]:
         """
         Performs a GET request against the /system/ssoUsers endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SsoUser]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SsoUser,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SsoUser, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SsoUser]:
         """
@@ -57,4 +54,8 @@ class SystemSsousersEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SsoUser]: The parsed response data.
         """
-        return self._parse_many(SsoUser, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SsoUser, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemSsousersCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSsousersCountEndpoint")
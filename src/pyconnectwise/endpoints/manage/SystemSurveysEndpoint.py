@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysCountEndpoint import SystemSurveysCountEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysIdEndpoint import SystemSurveysIdEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysInfoEndpoint import SystemSurveysInfoEndpoint
 from pyconnectwise.models.manage import Survey
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSurveysCountEndpoint import SystemSurveysCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemSurveysIdEndpoint import SystemSurveysIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemSurveysInfoEndpoint import SystemSurveysInfoEndpoint
+
 
 class SystemSurveysEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "surveys", parent_endpoint=parent_endpoint)
+    endpoint_base = "surveys"
+    _route = "system/surveys"
 
-        self.info = self._register_child_endpoint(SystemSurveysInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemSurveysCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemSurveysIdEndpoint:
+    def id(self, id: int) -> "SystemSurveysIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemSurveysIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemSurveysIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemSurveysIdEndpoint: The initialized SystemSurveysIdEndpoint object.
+            SystemSurveysIdEndpoint: The SystemSurveysIdEndpoint view bound to the ID.
         """
-        child = SystemSurveysIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemSurveysIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Survey]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Survey]:
         """
         Performs a GET request against the /system/surveys endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Survey]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Survey,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Survey, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Survey]:
         """
@@ -59,7 +55,7 @@ class SystemSurveysEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Survey]: The parsed response data.
         """
-        return self._parse_many(Survey, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Survey, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Survey:
         """
@@ -71,4 +67,12 @@ class SystemSurveysEndpoint(ConnectWiseEndpoint):
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemSurveysInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSurveysInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemSurveysCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSurveysCountEndpoint")
@@ -1,41 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysIdCopyEndpoint import SystemSurveysIdCopyEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysIdInfoEndpoint import SystemSurveysIdInfoEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsEndpoint import SystemSurveysIdQuestionsEndpoint
 from pyconnectwise.models.manage import Survey
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSurveysIdCopyEndpoint import SystemSurveysIdCopyEndpoint
+    from pyconnectwise.endpoints.manage.SystemSurveysIdInfoEndpoint import SystemSurveysIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsEndpoint import SystemSurveysIdQuestionsEndpoint
+
 
 class SystemSurveysIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/surveys/{id}"
 
-        self.copy = self._register_child_endpoint(SystemSurveysIdCopyEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemSurveysIdInfoEndpoint(client, parent_endpoint=self))
-        self.questions = self._register_child_endpoint(SystemSurveysIdQuestionsEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Survey]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Survey]:
         """
         Performs a GET request against the /system/surveys/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Survey]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Survey,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Survey, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Survey:
         """
@@ -47,7 +44,7 @@ class SystemSurveysIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -69,7 +66,7 @@ class SystemSurveysIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Survey:
         """
@@ -81,4 +78,16 @@ class SystemSurveysIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> "SystemSurveysIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSurveysIdCopyEndpoint")
+
+    @cached_property
+    def info(self) -> "SystemSurveysIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSurveysIdInfoEndpoint")
+
+    @cached_property
+    def questions(self) -> "SystemSurveysIdQuestionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsEndpoint")
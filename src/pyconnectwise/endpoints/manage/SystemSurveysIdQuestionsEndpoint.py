@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsCountEndpoint import SystemSurveysIdQuestionsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsIdEndpoint import SystemSurveysIdQuestionsIdEndpoint
 from pyconnectwise.models.manage import SurveyQuestion
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsCountEndpoint import \
+        SystemSurveysIdQuestionsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsIdEndpoint import SystemSurveysIdQuestionsIdEndpoint
+
 
 class SystemSurveysIdQuestionsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "questions", parent_endpoint=parent_endpoint)
+    endpoint_base = "questions"
+    _route = "system/surveys/{id}/questions"
 
-        self.count = self._register_child_endpoint(SystemSurveysIdQuestionsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemSurveysIdQuestionsIdEndpoint:
+    def id(self, id: int) -> "SystemSurveysIdQuestionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemSurveysIdQuestionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemSurveysIdQuestionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemSurveysIdQuestionsIdEndpoint: The initialized SystemSurveysIdQuestionsIdEndpoint object.
+            SystemSurveysIdQuestionsIdEndpoint: The SystemSurveysIdQuestionsIdEndpoint view bound to the ID.
         """
-        child = SystemSurveysIdQuestionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[SurveyQuestion]:
         """
         Performs a GET request against the /system/surveys/{id}/questions endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[SurveyQuestion]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            SurveyQuestion,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(SurveyQuestion, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[SurveyQuestion]:
         """
@@ -59,7 +55,7 @@ class SystemSurveysIdQuestionsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[SurveyQuestion]: The parsed response data.
         """
-        return self._parse_many(SurveyQuestion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SurveyQuestion, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> SurveyQuestion:
         """
@@ -71,4 +67,8 @@ class SystemSurveysIdQuestionsEndpoint(ConnectWiseEndpoint):
         Returns:
             SurveyQuestion: The parsed response data.
         """
-        return self._parse_one(SurveyQuestion, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SurveyQuestion, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemSurveysIdQuestionsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemSurveysIdQuestionsCountEndpoint")
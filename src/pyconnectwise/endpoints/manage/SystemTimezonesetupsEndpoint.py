@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemTimezonesetupsCountEndpoint import SystemTimezonesetupsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemTimezonesetupsIdEndpoint import SystemTimezonesetupsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemTimezonesetupsInfoEndpoint import SystemTimezonesetupsInfoEndpoint
 from pyconnectwise.models.manage import TimeZoneSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemTimezonesetupsCountEndpoint import SystemTimezonesetupsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemTimezonesetupsIdEndpoint import SystemTimezonesetupsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemTimezonesetupsInfoEndpoint import SystemTimezonesetupsInfoEndpoint
+
 
 class SystemTimezonesetupsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "timeZoneSetups", parent_endpoint=parent_endpoint)
+    endpoint_base = "timeZoneSetups"
+    _route = "system/timeZoneSetups"
 
-        self.info = self._register_child_endpoint(SystemTimezonesetupsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemTimezonesetupsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemTimezonesetupsIdEndpoint:
+    def id(self, id: int) -> "SystemTimezonesetupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemTimezonesetupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemTimezonesetupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemTimezonesetupsIdEndpoint: The initialized SystemTimezonesetupsIdEndpoint object.
+            SystemTimezonesetupsIdEndpoint: The SystemTimezonesetupsIdEndpoint view bound to the ID.
         """
-        child = SystemTimezonesetupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemTimezonesetupsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[TimeZoneSetup]:
         """
         Performs a GET request against the /system/timeZoneSetups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TimeZoneSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TimeZoneSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TimeZoneSetup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TimeZoneSetup]:
         """
@@ -61,7 +55,7 @@ class SystemTimezonesetupsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TimeZoneSetup]: The parsed response data.
         """
-        return self._parse_many(TimeZoneSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeZoneSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TimeZoneSetup:
         """
@@ -73,4 +67,12 @@ class SystemTimezonesetupsEndpoint(ConnectWiseEndpoint):
         Returns:
             TimeZoneSetup: The parsed response data.
         """
-        return self._parse_one(TimeZoneSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TimeZoneSetup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemTimezonesetupsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemTimezonesetupsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemTimezonesetupsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemTimezonesetupsCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemTodaypagecategoriesCountEndpoint import SystemTodaypagecategoriesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemTodaypagecategoriesIdEndpoint import SystemTodaypagecategoriesIdEndpoint
 from pyconnectwise.models.manage import TodayPageCategory
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemTodaypagecategoriesCountEndpoint import \
+        SystemTodaypagecategoriesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemTodaypagecategoriesIdEndpoint import SystemTodaypagecategoriesIdEndpoint
+
 
 class SystemTodaypagecategoriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "todayPageCategories", parent_endpoint=parent_endpoint)
+    endpoint_base = "todayPageCategories"
+    _route = "system/todayPageCategories"
 
-        self.count = self._register_child_endpoint(SystemTodaypagecategoriesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemTodaypagecategoriesIdEndpoint:
+    def id(self, id: int) -> "SystemTodaypagecategoriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemTodaypagecategoriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemTodaypagecategoriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemTodaypagecategoriesIdEndpoint: The initialized SystemTodaypagecategoriesIdEndpoint object.
+            SystemTodaypagecategoriesIdEndpoint: The SystemTodaypagecategoriesIdEndpoint view bound to the ID.
         """
-        child = SystemTodaypagecategoriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemTodaypagecategoriesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[TodayPageCategory]:
         """
         Performs a GET request against the /system/todayPageCategories endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TodayPageCategory]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TodayPageCategory,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TodayPageCategory, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TodayPageCategory]:
         """
@@ -59,7 +55,7 @@ class SystemTodaypagecategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TodayPageCategory]: The parsed response data.
         """
-        return self._parse_many(TodayPageCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TodayPageCategory, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TodayPageCategory:
         """
@@ -71,4 +67,8 @@ class SystemTodaypagecategoriesEndpoint(ConnectWiseEndpoint):
         Returns:
             TodayPageCategory: The parsed response data.
         """
-        return self._parse_one(TodayPageCategory, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TodayPageCategory, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemTodaypagecategoriesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemTodaypagecategoriesCountEndpoint")
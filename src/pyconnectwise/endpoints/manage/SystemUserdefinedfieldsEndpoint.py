@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemUserdefinedfieldsCountEndpoint import SystemUserdefinedfieldsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemUserdefinedfieldsIdEndpoint import SystemUserdefinedfieldsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemUserdefinedfieldsInfoEndpoint import SystemUserdefinedfieldsInfoEndpoint
 from pyconnectwise.models.manage import UserDefinedField
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemUserdefinedfieldsCountEndpoint import SystemUserdefinedfieldsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemUserdefinedfieldsIdEndpoint import SystemUserdefinedfieldsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemUserdefinedfieldsInfoEndpoint import SystemUserdefinedfieldsInfoEndpoint
+
 
 class SystemUserdefinedfieldsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "userDefinedFields", parent_endpoint=parent_endpoint)
+    endpoint_base = "userDefinedFields"
+    _route = "system/userDefinedFields"
 
-        self.info = self._register_child_endpoint(SystemUserdefinedfieldsInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemUserdefinedfieldsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemUserdefinedfieldsIdEndpoint:
+    def id(self, id: int) -> "SystemUserdefinedfieldsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemUserdefinedfieldsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemUserdefinedfieldsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemUserdefinedfieldsIdEndpoint: The initialized SystemUserdefinedfieldsIdEndpoint object.
+            SystemUserdefinedfieldsIdEndpoint: The SystemUserdefinedfieldsIdEndpoint view bound to the ID.
         """
-        child = SystemUserdefinedfieldsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemUserdefinedfieldsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[UserDefinedField]:
         """
         Performs a GET request against the /system/userDefinedFields endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[UserDefinedField]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            UserDefinedField,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(UserDefinedField, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[UserDefinedField]:
         """
@@ -61,7 +55,7 @@ class SystemUserdefinedfieldsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[UserDefinedField]: The parsed response data.
         """
-        return self._parse_many(UserDefinedField, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(UserDefinedField, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> UserDefinedField:
         """
@@ -73,4 +67,12 @@ class SystemUserdefinedfieldsEndpoint(ConnectWiseEndpoint):
         Returns:
             UserDefinedField: The parsed response data.
         """
-        return self._parse_one(UserDefinedField, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(UserDefinedField, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemUserdefinedfieldsInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemUserdefinedfieldsInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemUserdefinedfieldsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemUserdefinedfieldsCountEndpoint")
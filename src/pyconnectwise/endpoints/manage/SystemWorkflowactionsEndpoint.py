@@ -1,23 +1,27 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowactionsIdEndpoint import SystemWorkflowactionsIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowactionsIdEndpoint import SystemWorkflowactionsIdEndpoint
+
 
 class SystemWorkflowactionsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "workflowActions"
+    _route = "system/workflowActions"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "workflowActions", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowactionsIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowactionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowactionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowactionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowactionsIdEndpoint: The initialized SystemWorkflowactionsIdEndpoint object.
+            SystemWorkflowactionsIdEndpoint: The SystemWorkflowactionsIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowactionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowactionsIdEndpoint", id)
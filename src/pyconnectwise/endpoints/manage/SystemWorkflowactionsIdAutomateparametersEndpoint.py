@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersCountEndpoint import \
-    SystemWorkflowactionsIdAutomateparametersCountEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersIdEndpoint import \
-    SystemWorkflowactionsIdAutomateparametersIdEndpoint
 from pyconnectwise.models.manage import WorkflowActionAutomateParameter
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersCountEndpoint import \
+        SystemWorkflowactionsIdAutomateparametersCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersIdEndpoint import \
+        SystemWorkflowactionsIdAutomateparametersIdEndpoint
+
 
 class SystemWorkflowactionsIdAutomateparametersEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "automateParameters", parent_endpoint=parent_endpoint)
+    endpoint_base = "automateParameters"
+    _route = "system/workflowActions/{id}/automateParameters"
 
-        self.count = self._register_child_endpoint(
-            SystemWorkflowactionsIdAutomateparametersCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowactionsIdAutomateparametersIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowactionsIdAutomateparametersIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowactionsIdAutomateparametersIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowactionsIdAutomateparametersIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowactionsIdAutomateparametersIdEndpoint: The initialized SystemWorkflowactionsIdAutomateparametersIdEndpoint object.
+            SystemWorkflowactionsIdAutomateparametersIdEndpoint: The SystemWorkflowactionsIdAutomateparametersIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowactionsIdAutomateparametersIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[WorkflowActionAutomateParameter]:
         """
         Performs a GET request against the /system/workflowActions/{id}/automateParameters endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkflowActionAutomateParameter]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkflowActionAutomateParameter,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkflowActionAutomateParameter, page, page_size, params, forward_only)
 
     def get(
         self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}
@@ -66,7 +59,7 @@ class SystemWorkflowactionsIdAutomateparametersEndpoint(ConnectWiseEndpoint):
             list[WorkflowActionAutomateParameter]: The parsed response data.
         """
         return self._parse_many(
-            WorkflowActionAutomateParameter, super()._make_request("GET", data=data, params=params).json()
+            WorkflowActionAutomateParameter, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowActionAutomateParameter:
@@ -80,5 +73,11 @@ class SystemWorkflowactionsIdAutomateparametersEndpoint(ConnectWiseEndpoint):
             WorkflowActionAutomateParameter: The parsed response data.
         """
         return self._parse_one(
-            WorkflowActionAutomateParameter, super()._make_request("POST", data=data, params=params).json()
+            WorkflowActionAutomateParameter, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> "SystemWorkflowactionsIdAutomateparametersCountEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersCountEndpoint"
         )
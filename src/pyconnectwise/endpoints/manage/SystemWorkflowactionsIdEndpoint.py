@@ -1,15 +1,23 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersEndpoint import \
-    SystemWorkflowactionsIdAutomateparametersEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersEndpoint import \
+        SystemWorkflowactionsIdAutomateparametersEndpoint
+
 
 class SystemWorkflowactionsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/workflowActions/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.automate_parameters = self._register_child_endpoint(
-            SystemWorkflowactionsIdAutomateparametersEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def automate_parameters(self) -> "SystemWorkflowactionsIdAutomateparametersEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemWorkflowactionsIdAutomateparametersEndpoint"
         )
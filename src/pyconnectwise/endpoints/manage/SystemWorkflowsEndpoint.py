@@ -1,60 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsCountEndpoint import SystemWorkflowsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdEndpoint import SystemWorkflowsIdEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesEndpoint import SystemWorkflowsTabletypesEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEndpoint import \
-    SystemWorkflowsUserdefinedfieldsEndpoint
 from pyconnectwise.models.manage import Workflow
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsCountEndpoint import SystemWorkflowsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdEndpoint import SystemWorkflowsIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesEndpoint import SystemWorkflowsTabletypesEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEndpoint import \
+        SystemWorkflowsUserdefinedfieldsEndpoint
+
 
 class SystemWorkflowsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "workflows", parent_endpoint=parent_endpoint)
+    endpoint_base = "workflows"
+    _route = "system/workflows"
 
-        self.userdefinedfields = self._register_child_endpoint(
-            SystemWorkflowsUserdefinedfieldsEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(SystemWorkflowsCountEndpoint(client, parent_endpoint=self))
-        self.table_types = self._register_child_endpoint(
-            SystemWorkflowsTabletypesEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowsIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowsIdEndpoint: The initialized SystemWorkflowsIdEndpoint object.
+            SystemWorkflowsIdEndpoint: The SystemWorkflowsIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Workflow]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Workflow]:
         """
         Performs a GET request against the /system/workflows endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Workflow]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Workflow,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Workflow, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[Workflow]:
         """
@@ -66,7 +57,7 @@ class SystemWorkflowsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[Workflow]: The parsed response data.
         """
-        return self._parse_many(Workflow, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Workflow, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Workflow:
         """
@@ -78,4 +69,16 @@ class SystemWorkflowsEndpoint(ConnectWiseEndpoint):
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def userdefinedfields(self) -> "SystemWorkflowsUserdefinedfieldsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemWorkflowsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsCountEndpoint")
+
+    @cached_property
+    def table_types(self) -> "SystemWorkflowsTabletypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesEndpoint")
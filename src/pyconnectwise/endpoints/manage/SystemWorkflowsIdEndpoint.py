@@ -1,49 +1,40 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdAttachmentsEndpoint import SystemWorkflowsIdAttachmentsEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdCopyEndpoint import SystemWorkflowsIdCopyEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsEndpoint import SystemWorkflowsIdEventsEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesEndpoint import SystemWorkflowsIdNotifytypesEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdTriggersEndpoint import SystemWorkflowsIdTriggersEndpoint
 from pyconnectwise.models.manage import Workflow
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdAttachmentsEndpoint import SystemWorkflowsIdAttachmentsEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdCopyEndpoint import SystemWorkflowsIdCopyEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsEndpoint import SystemWorkflowsIdEventsEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesEndpoint import SystemWorkflowsIdNotifytypesEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdTriggersEndpoint import SystemWorkflowsIdTriggersEndpoint
+
 
 class SystemWorkflowsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/workflows/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
-
-        self.triggers = self._register_child_endpoint(SystemWorkflowsIdTriggersEndpoint(client, parent_endpoint=self))
-        self.notify_types = self._register_child_endpoint(
-            SystemWorkflowsIdNotifytypesEndpoint(client, parent_endpoint=self)
-        )
-        self.copy = self._register_child_endpoint(SystemWorkflowsIdCopyEndpoint(client, parent_endpoint=self))
-        self.attachments = self._register_child_endpoint(
-            SystemWorkflowsIdAttachmentsEndpoint(client, parent_endpoint=self)
-        )
-        self.events = self._register_child_endpoint(SystemWorkflowsIdEventsEndpoint(client, parent_endpoint=self))
-
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[Workflow]:
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[Workflow]:
         """
         Performs a GET request against the /system/workflows/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[Workflow]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            Workflow,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(Workflow, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Workflow:
         """
@@ -55,7 +46,7 @@ class SystemWorkflowsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -77,7 +68,7 @@ class SystemWorkflowsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> Workflow:
         """
@@ -89,4 +80,24 @@ class SystemWorkflowsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def triggers(self) -> "SystemWorkflowsIdTriggersEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdTriggersEndpoint")
+
+    @cached_property
+    def notify_types(self) -> "SystemWorkflowsIdNotifytypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesEndpoint")
+
+    @cached_property
+    def copy(self) -> "SystemWorkflowsIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdCopyEndpoint")
+
+    @cached_property
+    def attachments(self) -> "SystemWorkflowsIdAttachmentsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdAttachmentsEndpoint")
+
+    @cached_property
+    def events(self) -> "SystemWorkflowsIdEventsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsEndpoint")
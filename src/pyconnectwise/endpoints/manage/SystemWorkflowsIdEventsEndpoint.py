@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsCountEndpoint import SystemWorkflowsIdEventsCountEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdEndpoint import SystemWorkflowsIdEventsIdEndpoint
 from pyconnectwise.models.manage import WorkflowEvent
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsCountEndpoint import SystemWorkflowsIdEventsCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdEndpoint import SystemWorkflowsIdEventsIdEndpoint
+
 
 class SystemWorkflowsIdEventsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "events", parent_endpoint=parent_endpoint)
+    endpoint_base = "events"
+    _route = "system/workflows/{id}/events"
 
-        self.count = self._register_child_endpoint(SystemWorkflowsIdEventsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowsIdEventsIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowsIdEventsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdEventsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowsIdEventsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowsIdEventsIdEndpoint: The initialized SystemWorkflowsIdEventsIdEndpoint object.
+            SystemWorkflowsIdEventsIdEndpoint: The SystemWorkflowsIdEventsIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowsIdEventsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[WorkflowEvent]:
         """
         Performs a GET request against the /system/workflows/{id}/events endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkflowEvent]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkflowEvent,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkflowEvent, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[WorkflowEvent]:
         """
@@ -59,7 +54,7 @@ class SystemWorkflowsIdEventsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[WorkflowEvent]: The parsed response data.
         """
-        return self._parse_many(WorkflowEvent, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowEvent, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowEvent:
         """
@@ -71,4 +66,8 @@ class SystemWorkflowsIdEventsEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "SystemWorkflowsIdEventsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsCountEndpoint")
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import WorkflowEvent
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class SystemWorkflowsIdEventsIdCopyEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "copy"
+    _route = "system/workflows/{id}/events/{id}/copy"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "copy", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowEvent:
         """
@@ -19,4 +23,4 @@ class SystemWorkflowsIdEventsIdCopyEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("POST", data=data, params=params).content)
@@ -1,46 +1,41 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdActionsEndpoint import \
-    SystemWorkflowsIdEventsIdActionsEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdCopyEndpoint import SystemWorkflowsIdEventsIdCopyEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdTestEndpoint import SystemWorkflowsIdEventsIdTestEndpoint
 from pyconnectwise.models.manage import WorkflowEvent
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdActionsEndpoint import \
+        SystemWorkflowsIdEventsIdActionsEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdCopyEndpoint import \
+        SystemWorkflowsIdEventsIdCopyEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdTestEndpoint import \
+        SystemWorkflowsIdEventsIdTestEndpoint
+
 
 class SystemWorkflowsIdEventsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/workflows/{id}/events/{id}"
 
-        self.copy = self._register_child_endpoint(SystemWorkflowsIdEventsIdCopyEndpoint(client, parent_endpoint=self))
-        self.actions = self._register_child_endpoint(
-            SystemWorkflowsIdEventsIdActionsEndpoint(client, parent_endpoint=self)
-        )
-        self.test = self._register_child_endpoint(SystemWorkflowsIdEventsIdTestEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[WorkflowEvent]:
         """
         Performs a GET request against the /system/workflows/{id}/events/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkflowEvent]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkflowEvent,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkflowEvent, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowEvent:
         """
@@ -52,7 +47,7 @@ class SystemWorkflowsIdEventsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -74,7 +69,7 @@ class SystemWorkflowsIdEventsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowEvent:
         """
@@ -86,4 +81,16 @@ class SystemWorkflowsIdEventsIdEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> "SystemWorkflowsIdEventsIdCopyEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdCopyEndpoint")
+
+    @cached_property
+    def actions(self) -> "SystemWorkflowsIdEventsIdActionsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdActionsEndpoint")
+
+    @cached_property
+    def test(self) -> "SystemWorkflowsIdEventsIdTestEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdEventsIdTestEndpoint")
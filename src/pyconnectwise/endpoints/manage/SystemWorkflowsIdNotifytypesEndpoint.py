@@ -1,61 +1,52 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesCountEndpoint import \
-    SystemWorkflowsIdNotifytypesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesIdEndpoint import SystemWorkflowsIdNotifytypesIdEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesInfoEndpoint import \
-    SystemWorkflowsIdNotifytypesInfoEndpoint
 from pyconnectwise.models.manage import WorkflowNotifyType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesCountEndpoint import \
+        SystemWorkflowsIdNotifytypesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesIdEndpoint import \
+        SystemWorkflowsIdNotifytypesIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesInfoEndpoint import \
+        SystemWorkflowsIdNotifytypesInfoEndpoint
+
 
 class SystemWorkflowsIdNotifytypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "notifyTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "notifyTypes"
+    _route = "system/workflows/{id}/notifyTypes"
 
-        self.info = self._register_child_endpoint(
-            SystemWorkflowsIdNotifytypesInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            SystemWorkflowsIdNotifytypesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowsIdNotifytypesIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowsIdNotifytypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdNotifytypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowsIdNotifytypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowsIdNotifytypesIdEndpoint: The initialized SystemWorkflowsIdNotifytypesIdEndpoint object.
+            SystemWorkflowsIdNotifytypesIdEndpoint: The SystemWorkflowsIdNotifytypesIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowsIdNotifytypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[WorkflowNotifyType]:
         """
         Performs a GET request against the /system/workflows/{id}/notifyTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkflowNotifyType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkflowNotifyType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkflowNotifyType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[WorkflowNotifyType]:
         """
@@ -67,4 +58,12 @@ class SystemWorkflowsIdNotifytypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[WorkflowNotifyType]: The parsed response data.
         """
-        return self._parse_many(WorkflowNotifyType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowNotifyType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemWorkflowsIdNotifytypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemWorkflowsIdNotifytypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsIdNotifytypesCountEndpoint")
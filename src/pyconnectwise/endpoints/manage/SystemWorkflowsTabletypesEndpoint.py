@@ -1,55 +1,51 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesCountEndpoint import SystemWorkflowsTabletypesCountEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesIdEndpoint import SystemWorkflowsTabletypesIdEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesInfoEndpoint import SystemWorkflowsTabletypesInfoEndpoint
 from pyconnectwise.models.manage import WorkflowTableType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesCountEndpoint import \
+        SystemWorkflowsTabletypesCountEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesIdEndpoint import SystemWorkflowsTabletypesIdEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesInfoEndpoint import \
+        SystemWorkflowsTabletypesInfoEndpoint
+
 
 class SystemWorkflowsTabletypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "tableTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "tableTypes"
+    _route = "system/workflows/tableTypes"
 
-        self.info = self._register_child_endpoint(SystemWorkflowsTabletypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemWorkflowsTabletypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowsTabletypesIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowsTabletypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowsTabletypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowsTabletypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowsTabletypesIdEndpoint: The initialized SystemWorkflowsTabletypesIdEndpoint object.
+            SystemWorkflowsTabletypesIdEndpoint: The SystemWorkflowsTabletypesIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowsTabletypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[WorkflowTableType]:
         """
         Performs a GET request against the /system/workflows/tableTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkflowTableType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkflowTableType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkflowTableType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[WorkflowTableType]:
         """
@@ -61,4 +57,12 @@ class SystemWorkflowsTabletypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[WorkflowTableType]: The parsed response data.
         """
-        return self._parse_many(WorkflowTableType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowTableType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "SystemWorkflowsTabletypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "SystemWorkflowsTabletypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.SystemWorkflowsTabletypesCountEndpoint")
@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsActionsIdEndpoint import \
-    SystemWorkflowsUserdefinedfieldsActionsIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsActionsIdEndpoint import \
+        SystemWorkflowsUserdefinedfieldsActionsIdEndpoint
+
 
 class SystemWorkflowsUserdefinedfieldsActionsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "actions"
+    _route = "system/workflows/userdefinedfields/actions"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "actions", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowsUserdefinedfieldsActionsIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowsUserdefinedfieldsActionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowsUserdefinedfieldsActionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowsUserdefinedfieldsActionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowsUserdefinedfieldsActionsIdEndpoint: The initialized SystemWorkflowsUserdefinedfieldsActionsIdEndpoint object.
+            SystemWorkflowsUserdefinedfieldsActionsIdEndpoint: The SystemWorkflowsUserdefinedfieldsActionsIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowsUserdefinedfieldsActionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsActionsIdEndpoint", id)
@@ -1,35 +1,44 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsActionsEndpoint import \
-    SystemWorkflowsUserdefinedfieldsActionsEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsEndpoint import \
-    SystemWorkflowsUserdefinedfieldsEventsEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsIdEndpoint import \
-    SystemWorkflowsUserdefinedfieldsIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsActionsEndpoint import \
+        SystemWorkflowsUserdefinedfieldsActionsEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsEndpoint import \
+        SystemWorkflowsUserdefinedfieldsEventsEndpoint
+    from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsIdEndpoint import \
+        SystemWorkflowsUserdefinedfieldsIdEndpoint
+
 
 class SystemWorkflowsUserdefinedfieldsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "userdefinedfields", parent_endpoint=parent_endpoint)
+    endpoint_base = "userdefinedfields"
+    _route = "system/workflows/userdefinedfields"
 
-        self.actions = self._register_child_endpoint(
-            SystemWorkflowsUserdefinedfieldsActionsEndpoint(client, parent_endpoint=self)
-        )
-        self.events = self._register_child_endpoint(
-            SystemWorkflowsUserdefinedfieldsEventsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowsUserdefinedfieldsIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowsUserdefinedfieldsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowsUserdefinedfieldsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowsUserdefinedfieldsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowsUserdefinedfieldsIdEndpoint: The initialized SystemWorkflowsUserdefinedfieldsIdEndpoint object.
+            SystemWorkflowsUserdefinedfieldsIdEndpoint: The SystemWorkflowsUserdefinedfieldsIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowsUserdefinedfieldsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsIdEndpoint", id)
+
+    @cached_property
+    def actions(self) -> "SystemWorkflowsUserdefinedfieldsActionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsActionsEndpoint"
+        )
+
+    @cached_property
+    def events(self) -> "SystemWorkflowsUserdefinedfieldsEventsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsEndpoint"
+        )
@@ -1,24 +1,28 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdEndpoint import \
-    SystemWorkflowsUserdefinedfieldsEventsIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdEndpoint import \
+        SystemWorkflowsUserdefinedfieldsEventsIdEndpoint
+
 
 class SystemWorkflowsUserdefinedfieldsEventsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "events"
+    _route = "system/workflows/userdefinedfields/events"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "events", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowsUserdefinedfieldsEventsIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowsUserdefinedfieldsEventsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowsUserdefinedfieldsEventsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowsUserdefinedfieldsEventsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowsUserdefinedfieldsEventsIdEndpoint: The initialized SystemWorkflowsUserdefinedfieldsEventsIdEndpoint object.
+            SystemWorkflowsUserdefinedfieldsEventsIdEndpoint: The SystemWorkflowsUserdefinedfieldsEventsIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowsUserdefinedfieldsEventsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdEndpoint", id)
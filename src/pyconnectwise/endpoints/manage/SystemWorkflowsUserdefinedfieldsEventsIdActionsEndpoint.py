@@ -1,24 +1,30 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint import \
-    SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint import \
+        SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint
+
 
 class SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "actions"
+    _route = "system/workflows/userdefinedfields/events/{id}/actions"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "actions", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint:
+    def id(self, id: int) -> "SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint: The initialized SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint object.
+            SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint: The SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint view bound to the ID.
         """
-        child = SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id(
+            "pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint", id
+        )
@@ -1,19 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint import \
-    SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint
 from pyconnectwise.models.manage import WorkflowActionUserDefinedField
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint import \
+        SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint
+
 
 class SystemWorkflowsUserdefinedfieldsEventsIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "system/workflows/userdefinedfields/events/{id}"
 
-        self.actions = self._register_child_endpoint(
-            SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowActionUserDefinedField:
         """
@@ -26,5 +28,11 @@ class SystemWorkflowsUserdefinedfieldsEventsIdEndpoint(ConnectWiseEndpoint):
             WorkflowActionUserDefinedField: The parsed response data.
         """
         return self._parse_one(
-            WorkflowActionUserDefinedField, super()._make_request("POST", data=data, params=params).json()
+            WorkflowActionUserDefinedField, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def actions(self) -> "SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint":
+        return self._create_child_endpoint(
+            "pyconnectwise.endpoints.manage.SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint"
         )
@@ -1,4 +1,5 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.models.manage import WorkflowActionUserDefinedField
@@ -6,8 +7,11 @@ from pyconnectwise.responses.paginated_response import PaginatedResponse
 
 
 class SystemWorkflowsUserdefinedfieldsIdEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "{id}"
+    _route = "system/workflows/userdefinedfields/{id}"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
     def put(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowActionUserDefinedField:
         """
@@ -20,7 +24,7 @@ class SystemWorkflowsUserdefinedfieldsIdEndpoint(ConnectWiseEndpoint):
             WorkflowActionUserDefinedField: The parsed response data.
         """
         return self._parse_one(
-            WorkflowActionUserDefinedField, super()._make_request("PUT", data=data, params=params).json()
+            WorkflowActionUserDefinedField, super()._make_request("PUT", data=data, params=params).content
         )
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkflowActionUserDefinedField:
@@ -34,5 +38,5 @@ class SystemWorkflowsUserdefinedfieldsIdEndpoint(ConnectWiseEndpoint):
             WorkflowActionUserDefinedField: The parsed response data.
         """
         return self._parse_one(
-            WorkflowActionUserDefinedField, super()._make_request("PATCH", data=data, params=params).json()
+            WorkflowActionUserDefinedField, super()._make_request("PATCH", data=data, params=params).content
         )
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesCountEndpoint import TimeChargecodesCountEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesIdEndpoint import TimeChargecodesIdEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesInfoEndpoint import TimeChargecodesInfoEndpoint
 from pyconnectwise.models.manage import ChargeCode
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeChargecodesCountEndpoint import TimeChargecodesCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeChargecodesIdEndpoint import TimeChargecodesIdEndpoint
+    from pyconnectwise.endpoints.manage.TimeChargecodesInfoEndpoint import TimeChargecodesInfoEndpoint
+
 
 class TimeChargecodesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "chargeCodes", parent_endpoint=parent_endpoint)
+    endpoint_base = "chargeCodes"
+    _route = "time/chargeCodes"
 
-        self.info = self._register_child_endpoint(TimeChargecodesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(TimeChargecodesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeChargecodesIdEndpoint:
+    def id(self, id: int) -> "TimeChargecodesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeChargecodesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeChargecodesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeChargecodesIdEndpoint: The initialized TimeChargecodesIdEndpoint object.
+            TimeChargecodesIdEndpoint: The TimeChargecodesIdEndpoint view bound to the ID.
         """
-        child = TimeChargecodesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeChargecodesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ChargeCode]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ChargeCode]:
         """
         Performs a GET request against the /time/chargeCodes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ChargeCode]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ChargeCode,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ChargeCode, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ChargeCode]:
         """
@@ -59,7 +55,7 @@ class TimeChargecodesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ChargeCode]: The parsed response data.
         """
-        return self._parse_many(ChargeCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ChargeCode, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ChargeCode:
         """
@@ -71,4 +67,12 @@ class TimeChargecodesEndpoint(ConnectWiseEndpoint):
         Returns:
             ChargeCode: The parsed response data.
         """
-        return self._parse_one(ChargeCode, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ChargeCode, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "TimeChargecodesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeChargecodesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "TimeChargecodesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeChargecodesCountEndpoint")
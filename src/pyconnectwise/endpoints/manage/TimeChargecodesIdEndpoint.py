@@ -1,43 +1,39 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesEndpoint import TimeChargecodesIdExpensetypesEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesIdInfoEndpoint import TimeChargecodesIdInfoEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesIdUsagesEndpoint import TimeChargecodesIdUsagesEndpoint
 from pyconnectwise.models.manage import ChargeCode
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesEndpoint import \
+        TimeChargecodesIdExpensetypesEndpoint
+    from pyconnectwise.endpoints.manage.TimeChargecodesIdInfoEndpoint import TimeChargecodesIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.TimeChargecodesIdUsagesEndpoint import TimeChargecodesIdUsagesEndpoint
+
 
 class TimeChargecodesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "time/chargeCodes/{id}"
 
-        self.usages = self._register_child_endpoint(TimeChargecodesIdUsagesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(TimeChargecodesIdInfoEndpoint(client, parent_endpoint=self))
-        self.expense_types = self._register_child_endpoint(
-            TimeChargecodesIdExpensetypesEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[ChargeCode]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[ChargeCode]:
         """
         Performs a GET request against the /time/chargeCodes/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ChargeCode]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ChargeCode,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ChargeCode, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ChargeCode:
         """
@@ -49,7 +45,7 @@ class TimeChargecodesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ChargeCode: The parsed response data.
         """
-        return self._parse_one(ChargeCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ChargeCode, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -71,7 +67,7 @@ class TimeChargecodesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ChargeCode: The parsed response data.
         """
-        return self._parse_one(ChargeCode, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ChargeCode, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ChargeCode:
         """
@@ -83,4 +79,16 @@ class TimeChargecodesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             ChargeCode: The parsed response data.
         """
-        return self._parse_one(ChargeCode, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ChargeCode, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "TimeChargecodesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeChargecodesIdUsagesEndpoint")
+
+    @cached_property
+    def info(self) -> "TimeChargecodesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeChargecodesIdInfoEndpoint")
+
+    @cached_property
+    def expense_types(self) -> "TimeChargecodesIdExpensetypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesEndpoint")
@@ -1,57 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesCountEndpoint import \
-    TimeChargecodesIdExpensetypesCountEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesIdEndpoint import \
-    TimeChargecodesIdExpensetypesIdEndpoint
 from pyconnectwise.models.manage import ChargeCodeExpenseType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesCountEndpoint import \
+        TimeChargecodesIdExpensetypesCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesIdEndpoint import \
+        TimeChargecodesIdExpensetypesIdEndpoint
+
 
 class TimeChargecodesIdExpensetypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "expenseTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "expenseTypes"
+    _route = "time/chargeCodes/{id}/expenseTypes"
 
-        self.count = self._register_child_endpoint(
-            TimeChargecodesIdExpensetypesCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeChargecodesIdExpensetypesIdEndpoint:
+    def id(self, id: int) -> "TimeChargecodesIdExpensetypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeChargecodesIdExpensetypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeChargecodesIdExpensetypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeChargecodesIdExpensetypesIdEndpoint: The initialized TimeChargecodesIdExpensetypesIdEndpoint object.
+            TimeChargecodesIdExpensetypesIdEndpoint: The TimeChargecodesIdExpensetypesIdEndpoint view bound to the ID.
         """
-        child = TimeChargecodesIdExpensetypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[ChargeCodeExpenseType]:
         """
         Performs a GET request against the /time/chargeCodes/{id}/expenseTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[ChargeCodeExpenseType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            ChargeCodeExpenseType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(ChargeCodeExpenseType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[ChargeCodeExpenseType]:
         """
@@ -63,7 +56,7 @@ class TimeChargecodesIdExpensetypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[ChargeCodeExpenseType]: The parsed response data.
         """
-        return self._parse_many(ChargeCodeExpenseType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ChargeCodeExpenseType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> ChargeCodeExpenseType:
         """
@@ -75,4 +68,8 @@ class TimeChargecodesIdExpensetypesEndpoint(ConnectWiseEndpoint):
         Returns:
             ChargeCodeExpenseType: The parsed response data.
         """
-        return self._parse_one(ChargeCodeExpenseType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ChargeCodeExpenseType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "TimeChargecodesIdExpensetypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeChargecodesIdExpensetypesCountEndpoint")
@@ -1,40 +1,70 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeAccrualsEndpoint import TimeAccrualsEndpoint
-from pyconnectwise.endpoints.manage.TimeActivitystopwatchesEndpoint import TimeActivitystopwatchesEndpoint
-from pyconnectwise.endpoints.manage.TimeChargecodesEndpoint import TimeChargecodesEndpoint
-from pyconnectwise.endpoints.manage.TimeEntriesEndpoint import TimeEntriesEndpoint
-from pyconnectwise.endpoints.manage.TimeInfoEndpoint import TimeInfoEndpoint
-from pyconnectwise.endpoints.manage.TimeSchedulestopwatchesEndpoint import TimeSchedulestopwatchesEndpoint
-from pyconnectwise.endpoints.manage.TimeSheetsEndpoint import TimeSheetsEndpoint
-from pyconnectwise.endpoints.manage.TimeTicketstopwatchesEndpoint import TimeTicketstopwatchesEndpoint
-from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsEndpoint import TimeTimeperiodsetupsEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesEndpoint import TimeWorkrolesEndpoint
-from pyconnectwise.endpoints.manage.TimeWorktypesEndpoint import TimeWorktypesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeAccrualsEndpoint import TimeAccrualsEndpoint
+    from pyconnectwise.endpoints.manage.TimeActivitystopwatchesEndpoint import TimeActivitystopwatchesEndpoint
+    from pyconnectwise.endpoints.manage.TimeChargecodesEndpoint import TimeChargecodesEndpoint
+    from pyconnectwise.endpoints.manage.TimeEntriesEndpoint import TimeEntriesEndpoint
+    from pyconnectwise.endpoints.manage.TimeInfoEndpoint import TimeInfoEndpoint
+    from pyconnectwise.endpoints.manage.TimeSchedulestopwatchesEndpoint import TimeSchedulestopwatchesEndpoint
+    from pyconnectwise.endpoints.manage.TimeSheetsEndpoint import TimeSheetsEndpoint
+    from pyconnectwise.endpoints.manage.TimeTicketstopwatchesEndpoint import TimeTicketstopwatchesEndpoint
+    from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsEndpoint import TimeTimeperiodsetupsEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorkrolesEndpoint import TimeWorkrolesEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorktypesEndpoint import TimeWorktypesEndpoint
+
 
 class TimeEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "time"
+    _route = "time"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "time", parent_endpoint=parent_endpoint)
-
-        self.info = self._register_child_endpoint(TimeInfoEndpoint(client, parent_endpoint=self))
-        self.accruals = self._register_child_endpoint(TimeAccrualsEndpoint(client, parent_endpoint=self))
-        self.time_period_setups = self._register_child_endpoint(
-            TimeTimeperiodsetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.activitystopwatches = self._register_child_endpoint(
-            TimeActivitystopwatchesEndpoint(client, parent_endpoint=self)
-        )
-        self.entries = self._register_child_endpoint(TimeEntriesEndpoint(client, parent_endpoint=self))
-        self.work_types = self._register_child_endpoint(TimeWorktypesEndpoint(client, parent_endpoint=self))
-        self.sheets = self._register_child_endpoint(TimeSheetsEndpoint(client, parent_endpoint=self))
-        self.schedulestopwatches = self._register_child_endpoint(
-            TimeSchedulestopwatchesEndpoint(client, parent_endpoint=self)
-        )
-        self.charge_codes = self._register_child_endpoint(TimeChargecodesEndpoint(client, parent_endpoint=self))
-        self.work_roles = self._register_child_endpoint(TimeWorkrolesEndpoint(client, parent_endpoint=self))
-        self.ticketstopwatches = self._register_child_endpoint(
-            TimeTicketstopwatchesEndpoint(client, parent_endpoint=self)
-        )
+        super().__init__(client, parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def info(self) -> "TimeInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeInfoEndpoint")
+
+    @cached_property
+    def accruals(self) -> "TimeAccrualsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeAccrualsEndpoint")
+
+    @cached_property
+    def time_period_setups(self) -> "TimeTimeperiodsetupsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeTimeperiodsetupsEndpoint")
+
+    @cached_property
+    def activitystopwatches(self) -> "TimeActivitystopwatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeActivitystopwatchesEndpoint")
+
+    @cached_property
+    def entries(self) -> "TimeEntriesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeEntriesEndpoint")
+
+    @cached_property
+    def work_types(self) -> "TimeWorktypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorktypesEndpoint")
+
+    @cached_property
+    def sheets(self) -> "TimeSheetsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeSheetsEndpoint")
+
+    @cached_property
+    def schedulestopwatches(self) -> "TimeSchedulestopwatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeSchedulestopwatchesEndpoint")
+
+    @cached_property
+    def charge_codes(self) -> "TimeChargecodesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeChargecodesEndpoint")
+
+    @cached_property
+    def work_roles(self) -> "TimeWorkrolesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorkrolesEndpoint")
+
+    @cached_property
+    def ticketstopwatches(self) -> "TimeTicketstopwatchesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeTicketstopwatchesEndpoint")
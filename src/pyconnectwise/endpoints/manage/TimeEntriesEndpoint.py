@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeEntriesCountEndpoint import TimeEntriesCountEndpoint
-from pyconnectwise.endpoints.manage.TimeEntriesDefaultsEndpoint import TimeEntriesDefaultsEndpoint
-from pyconnectwise.endpoints.manage.TimeEntriesIdEndpoint import TimeEntriesIdEndpoint
 from pyconnectwise.models.manage import TimeEntry
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeEntriesCountEndpoint import TimeEntriesCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeEntriesDefaultsEndpoint import TimeEntriesDefaultsEndpoint
+    from pyconnectwise.endpoints.manage.TimeEntriesIdEndpoint import TimeEntriesIdEndpoint
+
 
 class TimeEntriesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "entries", parent_endpoint=parent_endpoint)
+    endpoint_base = "entries"
+    _route = "time/entries"
 
-        self.count = self._register_child_endpoint(TimeEntriesCountEndpoint(client, parent_endpoint=self))
-        self.defaults = self._register_child_endpoint(TimeEntriesDefaultsEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeEntriesIdEndpoint:
+    def id(self, id: int) -> "TimeEntriesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeEntriesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeEntriesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeEntriesIdEndpoint: The initialized TimeEntriesIdEndpoint object.
+            TimeEntriesIdEndpoint: The TimeEntriesIdEndpoint view bound to the ID.
         """
-        child = TimeEntriesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeEntriesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TimeEntry]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TimeEntry]:
         """
         Performs a GET request against the /time/entries endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TimeEntry]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TimeEntry,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TimeEntry, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TimeEntry]:
         """
@@ -59,7 +55,7 @@ class TimeEntriesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TimeEntry]: The parsed response data.
         """
-        return self._parse_many(TimeEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeEntry, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TimeEntry:
         """
@@ -71,4 +67,12 @@ class TimeEntriesEndpoint(ConnectWiseEndpoint):
         Returns:
             TimeEntry: The parsed response data.
         """
-        return self._parse_one(TimeEntry, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TimeEntry, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "TimeEntriesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeEntriesCountEndpoint")
+
+    @cached_property
+    def defaults(self) -> "TimeEntriesDefaultsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeEntriesDefaultsEndpoint")
@@ -1,53 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeEntriesIdAuditsCountEndpoint import TimeEntriesIdAuditsCountEndpoint
-from pyconnectwise.endpoints.manage.TimeEntriesIdAuditsIdEndpoint import TimeEntriesIdAuditsIdEndpoint
 from pyconnectwise.models.manage import TimeEntryAudit
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeEntriesIdAuditsCountEndpoint import TimeEntriesIdAuditsCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeEntriesIdAuditsIdEndpoint import TimeEntriesIdAuditsIdEndpoint
+
 
 class TimeEntriesIdAuditsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "audits", parent_endpoint=parent_endpoint)
+    endpoint_base = "audits"
+    _route = "time/entries/{id}/audits"
 
-        self.count = self._register_child_endpoint(TimeEntriesIdAuditsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeEntriesIdAuditsIdEndpoint:
+    def id(self, id: int) -> "TimeEntriesIdAuditsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeEntriesIdAuditsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeEntriesIdAuditsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeEntriesIdAuditsIdEndpoint: The initialized TimeEntriesIdAuditsIdEndpoint object.
+            TimeEntriesIdAuditsIdEndpoint: The TimeEntriesIdAuditsIdEndpoint view bound to the ID.
         """
-        child = TimeEntriesIdAuditsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeEntriesIdAuditsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[TimeEntryAudit]:
         """
         Performs a GET request against the /time/entries/{id}/audits endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TimeEntryAudit]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TimeEntryAudit,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TimeEntryAudit, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TimeEntryAudit]:
         """
@@ -59,4 +54,8 @@ class TimeEntriesIdAuditsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TimeEntryAudit]: The parsed response data.
         """
-        return self._parse_many(TimeEntryAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeEntryAudit, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "TimeEntriesIdAuditsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeEntriesIdAuditsCountEndpoint")
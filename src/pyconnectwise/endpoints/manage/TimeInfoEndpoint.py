@@ -1,14 +1,21 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeInfoChargecodeexpensetypesEndpoint import TimeInfoChargecodeexpensetypesEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeInfoChargecodeexpensetypesEndpoint import \
+        TimeInfoChargecodeexpensetypesEndpoint
+
 
 class TimeInfoEndpoint(ConnectWiseEndpoint):
+    endpoint_base = "info"
+    _route = "time/info"
+
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "info", parent_endpoint=parent_endpoint)
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-        self.charge_code_expense_types = self._register_child_endpoint(
-            TimeInfoChargecodeexpensetypesEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def charge_code_expense_types(self) -> "TimeInfoChargecodeexpensetypesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeInfoChargecodeexpensetypesEndpoint")
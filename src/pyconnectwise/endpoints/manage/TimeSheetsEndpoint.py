@@ -1,51 +1,48 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeSheetsCountEndpoint import TimeSheetsCountEndpoint
-from pyconnectwise.endpoints.manage.TimeSheetsIdEndpoint import TimeSheetsIdEndpoint
 from pyconnectwise.models.manage import TimeSheet
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeSheetsCountEndpoint import TimeSheetsCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeSheetsIdEndpoint import TimeSheetsIdEndpoint
+
 
 class TimeSheetsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "sheets", parent_endpoint=parent_endpoint)
+    endpoint_base = "sheets"
+    _route = "time/sheets"
 
-        self.count = self._register_child_endpoint(TimeSheetsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeSheetsIdEndpoint:
+    def id(self, id: int) -> "TimeSheetsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeSheetsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeSheetsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeSheetsIdEndpoint: The initialized TimeSheetsIdEndpoint object.
+            TimeSheetsIdEndpoint: The TimeSheetsIdEndpoint view bound to the ID.
         """
-        child = TimeSheetsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeSheetsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TimeSheet]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TimeSheet]:
         """
         Performs a GET request against the /time/sheets endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TimeSheet]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TimeSheet,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TimeSheet, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TimeSheet]:
         """
@@ -57,4 +54,8 @@ class TimeSheetsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TimeSheet]: The parsed response data.
         """
-        return self._parse_many(TimeSheet, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeSheet, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "TimeSheetsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeSheetsCountEndpoint")
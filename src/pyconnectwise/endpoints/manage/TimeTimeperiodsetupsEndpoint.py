@@ -1,55 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsCountEndpoint import TimeTimeperiodsetupsCountEndpoint
-from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsDefaultEndpoint import TimeTimeperiodsetupsDefaultEndpoint
-from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdEndpoint import TimeTimeperiodsetupsIdEndpoint
 from pyconnectwise.models.manage import TimePeriodSetup
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsCountEndpoint import TimeTimeperiodsetupsCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsDefaultEndpoint import TimeTimeperiodsetupsDefaultEndpoint
+    from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdEndpoint import TimeTimeperiodsetupsIdEndpoint
+
 
 class TimeTimeperiodsetupsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "timePeriodSetups", parent_endpoint=parent_endpoint)
+    endpoint_base = "timePeriodSetups"
+    _route = "time/timePeriodSetups"
 
-        self.default = self._register_child_endpoint(TimeTimeperiodsetupsDefaultEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(TimeTimeperiodsetupsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeTimeperiodsetupsIdEndpoint:
+    def id(self, id: int) -> "TimeTimeperiodsetupsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeTimeperiodsetupsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeTimeperiodsetupsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeTimeperiodsetupsIdEndpoint: The initialized TimeTimeperiodsetupsIdEndpoint object.
+            TimeTimeperiodsetupsIdEndpoint: The TimeTimeperiodsetupsIdEndpoint view bound to the ID.
         """
-        child = TimeTimeperiodsetupsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[TimePeriodSetup]:
         """
         Performs a GET request against the /time/timePeriodSetups endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TimePeriodSetup]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TimePeriodSetup,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TimePeriodSetup, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TimePeriodSetup]:
         """
@@ -61,7 +55,7 @@ class TimeTimeperiodsetupsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TimePeriodSetup]: The parsed response data.
         """
-        return self._parse_many(TimePeriodSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimePeriodSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> TimePeriodSetup:
         """
@@ -73,4 +67,12 @@ class TimeTimeperiodsetupsEndpoint(ConnectWiseEndpoint):
         Returns:
             TimePeriodSetup: The parsed response data.
         """
-        return self._parse_one(TimePeriodSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TimePeriodSetup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def default(self) -> "TimeTimeperiodsetupsDefaultEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeTimeperiodsetupsDefaultEndpoint")
+
+    @cached_property
+    def count(self) -> "TimeTimeperiodsetupsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeTimeperiodsetupsCountEndpoint")
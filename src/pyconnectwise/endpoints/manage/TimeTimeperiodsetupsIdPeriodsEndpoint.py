@@ -1,55 +1,50 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdPeriodsCountEndpoint import \
-    TimeTimeperiodsetupsIdPeriodsCountEndpoint
-from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdPeriodsIdEndpoint import \
-    TimeTimeperiodsetupsIdPeriodsIdEndpoint
 from pyconnectwise.models.manage import TimePeriod
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdPeriodsCountEndpoint import \
+        TimeTimeperiodsetupsIdPeriodsCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdPeriodsIdEndpoint import \
+        TimeTimeperiodsetupsIdPeriodsIdEndpoint
+
 
 class TimeTimeperiodsetupsIdPeriodsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "periods", parent_endpoint=parent_endpoint)
+    endpoint_base = "periods"
+    _route = "time/timePeriodSetups/{id}/periods"
 
-        self.count = self._register_child_endpoint(
-            TimeTimeperiodsetupsIdPeriodsCountEndpoint(client, parent_endpoint=self)
-        )
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeTimeperiodsetupsIdPeriodsIdEndpoint:
+    def id(self, id: int) -> "TimeTimeperiodsetupsIdPeriodsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeTimeperiodsetupsIdPeriodsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeTimeperiodsetupsIdPeriodsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeTimeperiodsetupsIdPeriodsIdEndpoint: The initialized TimeTimeperiodsetupsIdPeriodsIdEndpoint object.
+            TimeTimeperiodsetupsIdPeriodsIdEndpoint: The TimeTimeperiodsetupsIdPeriodsIdEndpoint view bound to the ID.
         """
-        child = TimeTimeperiodsetupsIdPeriodsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdPeriodsIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[TimePeriod]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[TimePeriod]:
         """
         Performs a GET request against the /time/timePeriodSetups/{id}/periods endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[TimePeriod]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            TimePeriod,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(TimePeriod, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[TimePeriod]:
         """
@@ -61,4 +56,8 @@ class TimeTimeperiodsetupsIdPeriodsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[TimePeriod]: The parsed response data.
         """
-        return self._parse_many(TimePeriod, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimePeriod, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "TimeTimeperiodsetupsIdPeriodsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeTimeperiodsetupsIdPeriodsCountEndpoint")
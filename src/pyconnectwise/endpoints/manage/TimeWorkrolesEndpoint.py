@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesCountEndpoint import TimeWorkrolesCountEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesIdEndpoint import TimeWorkrolesIdEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesInfoEndpoint import TimeWorkrolesInfoEndpoint
 from pyconnectwise.models.manage import WorkRole
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeWorkrolesCountEndpoint import TimeWorkrolesCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorkrolesIdEndpoint import TimeWorkrolesIdEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorkrolesInfoEndpoint import TimeWorkrolesInfoEndpoint
+
 
 class TimeWorkrolesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "workRoles", parent_endpoint=parent_endpoint)
+    endpoint_base = "workRoles"
+    _route = "time/workRoles"
 
-        self.info = self._register_child_endpoint(TimeWorkrolesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(TimeWorkrolesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeWorkrolesIdEndpoint:
+    def id(self, id: int) -> "TimeWorkrolesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeWorkrolesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeWorkrolesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeWorkrolesIdEndpoint: The initialized TimeWorkrolesIdEndpoint object.
+            TimeWorkrolesIdEndpoint: The TimeWorkrolesIdEndpoint view bound to the ID.
         """
-        child = TimeWorkrolesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeWorkrolesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[WorkRole]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[WorkRole]:
         """
         Performs a GET request against the /time/workRoles endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkRole]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkRole,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkRole, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[WorkRole]:
         """
@@ -59,7 +55,7 @@ class TimeWorkrolesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[WorkRole]: The parsed response data.
         """
-        return self._parse_many(WorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkRole:
         """
@@ -71,4 +67,12 @@ class TimeWorkrolesEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkRole: The parsed response data.
         """
-        return self._parse_one(WorkRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "TimeWorkrolesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorkrolesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "TimeWorkrolesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorkrolesCountEndpoint")
@@ -1,41 +1,38 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesIdInfoEndpoint import TimeWorkrolesIdInfoEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsEndpoint import TimeWorkrolesIdLocationsEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesIdUsagesEndpoint import TimeWorkrolesIdUsagesEndpoint
 from pyconnectwise.models.manage import WorkRole
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeWorkrolesIdInfoEndpoint import TimeWorkrolesIdInfoEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsEndpoint import TimeWorkrolesIdLocationsEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorkrolesIdUsagesEndpoint import TimeWorkrolesIdUsagesEndpoint
+
 
 class TimeWorkrolesIdEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{id}", parent_endpoint=parent_endpoint)
+    endpoint_base = "{id}"
+    _route = "time/workRoles/{id}"
 
-        self.usages = self._register_child_endpoint(TimeWorkrolesIdUsagesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(TimeWorkrolesIdInfoEndpoint(client, parent_endpoint=self))
-        self.locations = self._register_child_endpoint(TimeWorkrolesIdLocationsEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[WorkRole]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[WorkRole]:
         """
         Performs a GET request against the /time/workRoles/{id} endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkRole]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkRole,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkRole, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkRole:
         """
@@ -47,7 +44,7 @@ class TimeWorkrolesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkRole: The parsed response data.
         """
-        return self._parse_one(WorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkRole, super()._make_request("GET", data=data, params=params).content)
 
     def delete(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> None:
         """
@@ -69,7 +66,7 @@ class TimeWorkrolesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkRole: The parsed response data.
         """
-        return self._parse_one(WorkRole, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(WorkRole, super()._make_request("PUT", data=data, params=params).content)
 
     def patch(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkRole:
         """
@@ -81,4 +78,16 @@ class TimeWorkrolesIdEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkRole: The parsed response data.
         """
-        return self._parse_one(WorkRole, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(WorkRole, super()._make_request("PATCH", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> "TimeWorkrolesIdUsagesEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorkrolesIdUsagesEndpoint")
+
+    @cached_property
+    def info(self) -> "TimeWorkrolesIdInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorkrolesIdInfoEndpoint")
+
+    @cached_property
+    def locations(self) -> "TimeWorkrolesIdLocationsEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsEndpoint")
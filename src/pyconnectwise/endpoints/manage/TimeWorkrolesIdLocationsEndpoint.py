@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsCountEndpoint import TimeWorkrolesIdLocationsCountEndpoint
-from pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsIdEndpoint import TimeWorkrolesIdLocationsIdEndpoint
 from pyconnectwise.models.manage import WorkRoleLocation
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsCountEndpoint import \
+        TimeWorkrolesIdLocationsCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsIdEndpoint import TimeWorkrolesIdLocationsIdEndpoint
+
 
 class TimeWorkrolesIdLocationsEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "locations", parent_endpoint=parent_endpoint)
+    endpoint_base = "locations"
+    _route = "time/workRoles/{id}/locations"
 
-        self.count = self._register_child_endpoint(TimeWorkrolesIdLocationsCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeWorkrolesIdLocationsIdEndpoint:
+    def id(self, id: int) -> "TimeWorkrolesIdLocationsIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeWorkrolesIdLocationsIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeWorkrolesIdLocationsIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeWorkrolesIdLocationsIdEndpoint: The initialized TimeWorkrolesIdLocationsIdEndpoint object.
+            TimeWorkrolesIdLocationsIdEndpoint: The TimeWorkrolesIdLocationsIdEndpoint view bound to the ID.
         """
-        child = TimeWorkrolesIdLocationsIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsIdEndpoint", id)
 
     def paginated(
-        self, page: int, page_size: int, params: dict[str, int | str] = {}
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
     ) -> PaginatedResponse[WorkRoleLocation]:
         """
         Performs a GET request against the /time/workRoles/{id}/locations endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkRoleLocation]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkRoleLocation,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkRoleLocation, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[WorkRoleLocation]:
         """
@@ -59,7 +55,7 @@ class TimeWorkrolesIdLocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             list[WorkRoleLocation]: The parsed response data.
         """
-        return self._parse_many(WorkRoleLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkRoleLocation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkRoleLocation:
         """
@@ -71,4 +67,8 @@ class TimeWorkrolesIdLocationsEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkRoleLocation: The parsed response data.
         """
-        return self._parse_one(WorkRoleLocation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkRoleLocation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> "TimeWorkrolesIdLocationsCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorkrolesIdLocationsCountEndpoint")
@@ -1,53 +1,49 @@
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
-from pyconnectwise.endpoints.manage.TimeWorktypesCountEndpoint import TimeWorktypesCountEndpoint
-from pyconnectwise.endpoints.manage.TimeWorktypesIdEndpoint import TimeWorktypesIdEndpoint
-from pyconnectwise.endpoints.manage.TimeWorktypesInfoEndpoint import TimeWorktypesInfoEndpoint
 from pyconnectwise.models.manage import WorkType
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage.TimeWorktypesCountEndpoint import TimeWorktypesCountEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorktypesIdEndpoint import TimeWorktypesIdEndpoint
+    from pyconnectwise.endpoints.manage.TimeWorktypesInfoEndpoint import TimeWorktypesInfoEndpoint
+
 
 class TimeWorktypesEndpoint(ConnectWiseEndpoint):
-    def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "workTypes", parent_endpoint=parent_endpoint)
+    endpoint_base = "workTypes"
+    _route = "time/workTypes"
 
-        self.info = self._register_child_endpoint(TimeWorktypesInfoEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(TimeWorktypesCountEndpoint(client, parent_endpoint=self))
+    def __init__(self, client, parent_endpoint=None):
+        super().__init__(client, parent_endpoint=parent_endpoint)
 
-    def id(self, id: int) -> TimeWorktypesIdEndpoint:
+    def id(self, id: int) -> "TimeWorktypesIdEndpoint":
         """
-        Sets the ID for this endpoint and returns an initialized TimeWorktypesIdEndpoint object to move down the chain.
+        Sets the ID for this endpoint and returns a TimeWorktypesIdEndpoint view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            TimeWorktypesIdEndpoint: The initialized TimeWorktypesIdEndpoint object.
+            TimeWorktypesIdEndpoint: The TimeWorktypesIdEndpoint view bound to the ID.
         """
-        child = TimeWorktypesIdEndpoint(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("pyconnectwise.endpoints.manage.TimeWorktypesIdEndpoint", id)
 
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[WorkType]:
+    def paginated(
+        self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False
+    ) -> PaginatedResponse[WorkType]:
         """
         Performs a GET request against the /time/workTypes endpoint and returns an initialized PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
             PaginatedResponse[WorkType]: The initialized PaginatedResponse object.
         """
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request("GET", params=params),
-            WorkType,
-            self,
-            page,
-            page_size,
-        )
+        return super()._paginated(WorkType, page, page_size, params, forward_only)
 
     def get(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> list[WorkType]:
         """
@@ -59,7 +55,7 @@ class TimeWorktypesEndpoint(ConnectWiseEndpoint):
         Returns:
             list[WorkType]: The parsed response data.
         """
-        return self._parse_many(WorkType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> WorkType:
         """
@@ -71,4 +67,12 @@ class TimeWorktypesEndpoint(ConnectWiseEndpoint):
         Returns:
             WorkType: The parsed response data.
         """
-        return self._parse_one(WorkType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> "TimeWorktypesInfoEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorktypesInfoEndpoint")
+
+    @cached_property
+    def count(self) -> "TimeWorktypesCountEndpoint":
+        return self._create_child_endpoint("pyconnectwise.endpoints.manage.TimeWorktypesCountEndpoint")
@@ -0,0 +1,20 @@
+class ConnectWiseRequestException(Exception):
+    """
+    Raised when a request to the ConnectWise API fails with a status code >= 400,
+    after any retries allowed by the client's retry policy.
+
+    Attributes:
+        status_code (int): The status code of the failed response.
+        response: The failed response object.
+    """
+
+    def __init__(self, response):
+        self.status_code: int = response.status_code
+        self.response = response
+        super().__init__(f"Request failed with status code {response.status_code}: {response.text}")
+
+
+class ConnectWiseCassetteException(Exception):
+    """
+    Raised when a replaying CassetteTransport receives a request that was never recorded.
+    """
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAddIpRestrictionsBatchResult(ConnectWiseModel):
+    ip_address_guid: UUID | None = Field(
+        default=None,
+        alias='IpAddressGuid',
+        example='00000000-0000-0000-0000-000000000000',
+    )
+    name: str | None = Field(default=None, alias='Name')
+    ip_address: str | None = Field(default=None, alias='IpAddress')
+    windows_client_access: bool | None = Field(
+        default=None, alias='WindowsClientAccess'
+    )
+    web_client_access: bool | None = Field(default=None, alias='WebClientAccess')
+    result_details: AutomateResponseResult | None = Field(
+        default=None, alias='ResultDetails'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateresponseresult import AutomateResponseResult
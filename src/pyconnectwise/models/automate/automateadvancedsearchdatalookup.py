@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.automate.automatecomputerserviceitem import AutomateComputerServiceItem
+
+
+class AutomateAdvancedSearchDataLookup(AutomateComputerServiceItem):
+    pass
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAdvancedSearchDetails(ConnectWiseModel):
+    search: AutomateSearch | None = Field(default=None, alias='Search')
+    advanced_search_filter: AutomateAdvancedSearchFilter | None = Field(
+        default=None, alias='AdvancedSearchFilter'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateadvancedsearchfilter import AutomateAdvancedSearchFilter
+from pyconnectwise.models.automate.automatesearch import AutomateSearch
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAdvancedSearchDynamicLookup(ConnectWiseModel):
+    search_key: str | None = Field(default=None, alias='SearchKey')
+    advanced_search_data_lookups: list[AutomateAdvancedSearchDataLookup] | None = Field(
+        default=None, alias='AdvancedSearchDataLookups'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateadvancedsearchdatalookup import AutomateAdvancedSearchDataLookup
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAdvancedSearchLookUp(ConnectWiseModel):
+    look_up_nodes: list[AutomateSearchLookUpBase] | None = Field(
+        default=None, alias='LookUpNodes'
+    )
+    collection_nodes: list[str] | None = Field(default=None, alias='CollectionNodes')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatesearchlookupbase import AutomateSearchLookUpBase
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAlert(ConnectWiseModel):
+    alert_id: int | None = Field(default=None, alias='AlertId')
+    client: AutomateAlertClient | None = Field(default=None, alias='Client')
+    computer: AutomateAlertComputer | None = Field(default=None, alias='Computer')
+    device: AutomateAlertDevice | None = Field(default=None, alias='Device')
+    location: AutomateAlertLocation | None = Field(default=None, alias='Location')
+    monitor: AutomateAlertMonitor | None = Field(default=None, alias='Monitor')
+    alert_date: datetime | None = Field(default=None, alias='AlertDate')
+    severity: AutomateAlertSeverityItem | None = Field(default=None, alias='Severity')
+    source: str | None = Field(default=None, alias='Source')
+    message: str | None = Field(default=None, alias='Message')
+    field_name: str | None = Field(default=None, alias='FieldName')
+    alert_age: str | None = Field(default=None, alias='AlertAge')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatealertclient import AutomateAlertClient
+from pyconnectwise.models.automate.automatealertcomputer import AutomateAlertComputer
+from pyconnectwise.models.automate.automatealertdevice import AutomateAlertDevice
+from pyconnectwise.models.automate.automatealertlocation import AutomateAlertLocation
+from pyconnectwise.models.automate.automatealertmonitor import AutomateAlertMonitor
+from pyconnectwise.models.automate.automatealertseverityitem import AutomateAlertSeverityItem
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAlertingOverride(ConnectWiseModel):
+    alert_template: AutomateAlertTemplate | None = Field(
+        default=None, alias='AlertTemplate'
+    )
+    ticket_category: AutomateTicketCategory | None = Field(
+        default=None, alias='TicketCategory'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatealerttemplate import AutomateAlertTemplate
+from pyconnectwise.models.automate.automateticketcategory import AutomateTicketCategory
@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAlertingSettings(ConnectWiseModel):
+    is_alerting_enabled: bool | None = Field(default=None, alias='IsAlertingEnabled')
+    alert_template: AutomateAlertTemplate | None = Field(
+        default=None, alias='AlertTemplate'
+    )
+    alert_style_type: AutomateAlertStyleType | None = Field(
+        default=None, alias='AlertStyleType'
+    )
+    alert_success_subject: str | None = Field(default=None, alias='AlertSuccessSubject')
+    alert_success_message: str | None = Field(default=None, alias='AlertSuccessMessage')
+    alert_failure_subject: str | None = Field(default=None, alias='AlertFailureSubject')
+    alert_failure_message: str | None = Field(default=None, alias='AlertFailureMessage')
+    should_run_script: bool | None = Field(default=None, alias='ShouldRunScript')
+    alert_script: AutomateAlertScript | None = Field(default=None, alias='AlertScript')
+    ticket_category: AutomateTicketCategory | None = Field(
+        default=None, alias='TicketCategory'
+    )
+    report_category: AutomateReportCategory | None = Field(
+        default=None, alias='ReportCategory'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatealertscript import AutomateAlertScript
+from pyconnectwise.models.automate.automatealertstyletype import AutomateAlertStyleType
+from pyconnectwise.models.automate.automatealerttemplate import AutomateAlertTemplate
+from pyconnectwise.models.automate.automatereportcategory import AutomateReportCategory
+from pyconnectwise.models.automate.automateticketcategory import AutomateTicketCategory
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateApprovalPolicyStats(ConnectWiseModel):
+    approval_policy_id: int | None = Field(default=None, alias='ApprovalPolicyId')
+    approval_policy_name: str | None = Field(default=None, alias='ApprovalPolicyName')
+    pending_approval_count: int | None = Field(
+        default=None, alias='PendingApprovalCount'
+    )
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateApprovalPolicyThirdPartyPatchRequest(ConnectWiseModel):
+    patch_policies: list[AutomateApprovalPolicyThirdPartyPatchSetting] | None = Field(
+        default=None, alias='PatchPolicies'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateapprovalpolicythirdpartypatchsetting import AutomateApprovalPolicyThirdPartyPatchSetting
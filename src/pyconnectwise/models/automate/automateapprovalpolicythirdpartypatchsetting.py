@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateApprovalPolicyThirdPartyPatchSetting(ConnectWiseModel):
+    patch_approval: int | None = Field(default=None, alias='PatchApproval')
+    lt_product_key: UUID | None = Field(
+        default=None,
+        alias='LTProductKey',
+        example='00000000-0000-0000-0000-000000000000',
+    )
+    version: str | None = Field(default=None, alias='Version')
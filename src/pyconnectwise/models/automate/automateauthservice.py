@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAuthService(ConnectWiseModel):
+    service_id: int | None = Field(default=None, alias='ServiceId')
+    service_name: str | None = Field(default=None, alias='ServiceName')
+    service_uri: str | None = Field(default=None, alias='ServiceURI')
+    service_type: int | None = Field(default=None, alias='ServiceType')
+    client_id: str | None = Field(default=None, alias='ClientId')
+    is_default: bool | None = Field(default=None, alias='IsDefault')
+    is_automatic: bool | None = Field(default=None, alias='IsAutomatic')
+    service_guid: str | None = Field(default=None, alias='ServiceGuid')
+    is_enabled: bool | None = Field(default=None, alias='IsEnabled')
+    is_local_login_enabled: bool | None = Field(
+        default=None, alias='IsLocalLoginEnabled'
+    )
+    authentication_type: int | None = Field(default=None, alias='AuthenticationType')
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAutoJoinSettings(ConnectWiseModel):
+    computer_search_settings: AutomateSearchSettings | None = Field(
+        default=None, alias='ComputerSearchSettings'
+    )
+    network_device_search_settings: AutomateSearchSettings | None = Field(
+        default=None, alias='NetworkDeviceSearchSettings'
+    )
+    contact_search_settings: AutomateContactSearchSettings | None = Field(
+        default=None, alias='ContactSearchSettings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatecontactsearchsettings import AutomateContactSearchSettings
+from pyconnectwise.models.automate.automatesearchsettings import AutomateSearchSettings
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAutomaticPolicySettings(ConnectWiseModel):
+    severities: list[str] | None = Field(default=None, alias='Severities')
+    categories: list[AutomateWindowsUpdateCategory] | None = Field(
+        default=None, alias='Categories'
+    )
+    titles: list[str] | None = Field(default=None, alias='Titles')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatewindowsupdatecategory import AutomateWindowsUpdateCategory
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCheckboxSettings(ConnectWiseModel):
+    is_checked: bool | None = Field(default=None, alias='IsChecked')
+    default_value: bool | None = Field(default=None, alias='DefaultValue')
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCommandHistory(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    date_executed: datetime | None = Field(default=None, alias='DateExecuted')
+    command_id: int | None = Field(default=None, alias='CommandId')
+    command: str | None = Field(default=None, alias='Command')
+    status: str | None = Field(default=None, alias='Status')
+    output: str | None = Field(default=None, alias='Output')
+    parameters: str | None = Field(default=None, alias='Parameters')
+    user: str | None = Field(default=None, alias='User')
+    date_finished: datetime | None = Field(default=None, alias='DateFinished')
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateComputer(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    name: str | None = Field(default=None, alias='Name')
+    friendly_name: str | None = Field(default=None, alias='FriendlyName')
+    is_online: bool | None = Field(default=None, alias='IsOnline')
+    location: AutomateLocation | None = Field(default=None, alias='Location')
+    client: AutomateClient | None = Field(default=None, alias='Client')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclient import AutomateClient
+from pyconnectwise.models.automate.automatelocation import AutomateLocation
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateComputerSearchInformation(ConnectWiseModel):
+    is_modifiable: bool | None = Field(default=None, alias='IsModifiable')
+    searches: list[AutomateSearch] | None = Field(default=None, alias='Searches')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatesearch import AutomateSearch
@@ -0,0 +1,78 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateConfiguration(ConnectWiseModel):
+    check_type: AutomateCheckType | None = Field(default=None, alias='CheckType')
+    interval: AutomateCheckInterval | None = Field(default=None, alias='Interval')
+    condition: AutomateCondition | None = Field(default=None, alias='Condition')
+    ping_settings: AutomatePingSettings | None = Field(
+        default=None, alias='PingSettings'
+    )
+    latency_settings: AutomateLatencySettings | None = Field(
+        default=None, alias='LatencySettings'
+    )
+    tcp_settings: AutomateTcpSettings | None = Field(default=None, alias='TcpSettings')
+    udp_settings: AutomateUdpSettings | None = Field(default=None, alias='UdpSettings')
+    snmp_settings: AutomateSnmpSettings | None = Field(
+        default=None, alias='SnmpSettings'
+    )
+    performance_counter_settings: AutomatePerformanceCounterSettings | None = Field(
+        default=None, alias='PerformanceCounterSettings'
+    )
+    file_or_directory_settings: AutomateFileOrDirectorySettings | None = Field(
+        default=None, alias='FileOrDirectorySettings'
+    )
+    service_settings: AutomateServiceSettings | None = Field(
+        default=None, alias='ServiceSettings'
+    )
+    disk_space_settings: AutomateDiskSpaceSettings | None = Field(
+        default=None, alias='DiskSpaceSettings'
+    )
+    registry_settings: AutomateRegistrySettings | None = Field(
+        default=None, alias='RegistrySettings'
+    )
+    process_settings: AutomateProcessSettings | None = Field(
+        default=None, alias='ProcessSettings'
+    )
+    event_log_settings: AutomateEventLogSettings | None = Field(
+        default=None, alias='EventLogSettings'
+    )
+    executable_settings: AutomateExecutableSettings | None = Field(
+        default=None, alias='ExecutableSettings'
+    )
+    wmi_settings: AutomateWmiSettings | None = Field(default=None, alias='WmiSettings')
+    bandwidth_settings: AutomateBandwidthSettings | None = Field(
+        default=None, alias='BandwidthSettings'
+    )
+    sensor_settings: AutomateSensorSettings | None = Field(
+        default=None, alias='SensorSettings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatebandwidthsettings import AutomateBandwidthSettings
+from pyconnectwise.models.automate.automatecheckinterval import AutomateCheckInterval
+from pyconnectwise.models.automate.automatechecktype import AutomateCheckType
+from pyconnectwise.models.automate.automatecondition import AutomateCondition
+from pyconnectwise.models.automate.automatediskspacesettings import AutomateDiskSpaceSettings
+from pyconnectwise.models.automate.automateeventlogsettings import AutomateEventLogSettings
+from pyconnectwise.models.automate.automateexecutablesettings import AutomateExecutableSettings
+from pyconnectwise.models.automate.automatefileordirectorysettings import AutomateFileOrDirectorySettings
+from pyconnectwise.models.automate.automatelatencysettings import AutomateLatencySettings
+from pyconnectwise.models.automate.automateperformancecountersettings import AutomatePerformanceCounterSettings
+from pyconnectwise.models.automate.automatepingsettings import AutomatePingSettings
+from pyconnectwise.models.automate.automateprocesssettings import AutomateProcessSettings
+from pyconnectwise.models.automate.automateregistrysettings import AutomateRegistrySettings
+from pyconnectwise.models.automate.automatesensorsettings import AutomateSensorSettings
+from pyconnectwise.models.automate.automateservicesettings import AutomateServiceSettings
+from pyconnectwise.models.automate.automatesnmpsettings import AutomateSnmpSettings
+from pyconnectwise.models.automate.automatetcpsettings import AutomateTcpSettings
+from pyconnectwise.models.automate.automateudpsettings import AutomateUdpSettings
+from pyconnectwise.models.automate.automatewmisettings import AutomateWmiSettings
@@ -0,0 +1,45 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateContact(ConnectWiseModel):
+    contact_id: int | None = Field(default=None, alias='ContactId')
+    first_name: str | None = Field(default=None, alias='FirstName')
+    last_name: str | None = Field(default=None, alias='LastName')
+    email_address: str | None = Field(default=None, alias='EmailAddress')
+    phone_number: str | None = Field(default=None, alias='PhoneNumber')
+    mobile_number: str | None = Field(default=None, alias='MobileNumber')
+    pager_number: str | None = Field(default=None, alias='PagerNumber')
+    fax_number: str | None = Field(default=None, alias='FaxNumber')
+    address1: str | None = Field(default=None, alias='Address1')
+    address2: str | None = Field(default=None, alias='Address2')
+    city: str | None = Field(default=None, alias='City')
+    state: str | None = Field(default=None, alias='State')
+    zip_code: str | None = Field(default=None, alias='ZipCode')
+    client: AutomateClient | None = Field(default=None, alias='Client')
+    location: AutomateLocation | None = Field(default=None, alias='Location')
+    password: str | None = Field(default=None, alias='Password')
+    permissions: list[str] | None = Field(default=None, alias='Permissions')
+    is_managed: bool | None = Field(default=None, alias='IsManaged')
+    is_activated: bool | None = Field(default=None, alias='IsActivated')
+    date_created: datetime | None = Field(default=None, alias='DateCreated')
+    last_update_date: datetime | None = Field(default=None, alias='LastUpdateDate')
+    plugin_data: dict[str, dict[str, dict[str, Any]]] | None = Field(
+        default=None, alias='PluginData'
+    )
+    source: AutomateContactSource | None = Field(default=None, alias='Source')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclient import AutomateClient
+from pyconnectwise.models.automate.automatecontactsource import AutomateContactSource
+from pyconnectwise.models.automate.automatelocation import AutomateLocation
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateContactPermissionBatchRequest(ConnectWiseModel):
+    request_type: Literal['Add', 'Remove'] | None = Field(
+        default=None, alias='RequestType'
+    )
+    contact_ids: list[int] | None = Field(default=None, alias='ContactIds')
+    permissions: list[str] | None = Field(default=None, alias='Permissions')
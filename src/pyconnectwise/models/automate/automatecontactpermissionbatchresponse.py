@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateContactPermissionBatchResponse(ConnectWiseModel):
+    contact_permission_results: list[
+        AutomateContactPermissionBatchResult
+    ] | None = Field(default=None, alias='ContactPermissionResults')
+    contains_unsuccessful_results: bool | None = Field(
+        default=None, alias='ContainsUnsuccessfulResults'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatecontactpermissionbatchresult import AutomateContactPermissionBatchResult
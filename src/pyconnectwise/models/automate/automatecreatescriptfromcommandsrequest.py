@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCreateScriptFromCommandsRequest(ConnectWiseModel):
+    script_folder_id: int | None = Field(default=None, alias='ScriptFolderId')
+    commands: list[AutomateRemoteCommand] | None = Field(default=None, alias='Commands')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateremotecommand import AutomateRemoteCommand
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDailyRepeatSettings(ConnectWiseModel):
+    daily_script_repeat_frequency: AutomateDailyScriptRepeatFrequency | None = Field(
+        default=None, alias='DailyScriptRepeatFrequency'
+    )
+    daily_repeat_interval: int | None = Field(default=None, alias='DailyRepeatInterval')
+    maximum_repetitions: int | None = Field(default=None, alias='MaximumRepetitions')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedailyscriptrepeatfrequency import AutomateDailyScriptRepeatFrequency
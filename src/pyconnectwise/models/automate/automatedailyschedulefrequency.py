@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDailyScheduleFrequency(ConnectWiseModel):
+    runs_at: str | None = Field(default=None, alias='RunsAt')
+    daily_interval: int | None = Field(default=None, alias='DailyInterval')
+    days_of_week_settings: AutomateDaysOfWeekSettings | None = Field(
+        default=None, alias='DaysOfWeekSettings'
+    )
+    daily_repeat_settings: AutomateDailyRepeatSettings | None = Field(
+        default=None, alias='DailyRepeatSettings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedailyrepeatsettings import AutomateDailyRepeatSettings
+from pyconnectwise.models.automate.automatedaysofweeksettings import AutomateDaysOfWeekSettings
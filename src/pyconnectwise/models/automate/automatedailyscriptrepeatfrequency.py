@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDailyScriptRepeatFrequency(ConnectWiseModel):
+    daily_script_repeat_frequency_id: int | None = Field(
+        default=None, alias='DailyScriptRepeatFrequencyId'
+    )
+    name: str | None = Field(default=None, alias='Name')
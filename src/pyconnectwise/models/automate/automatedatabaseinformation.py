@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDatabaseInformation(ConnectWiseModel):
+    database_id: int | None = Field(default=None, alias='DatabaseId')
+    database_version: str | None = Field(default=None, alias='DatabaseVersion')
+    uptime: str | None = Field(default=None, alias='Uptime')
+    current_connections: int | None = Field(default=None, alias='CurrentConnections')
+    max_connections: int | None = Field(default=None, alias='MaxConnections')
+    peak_connections: int | None = Field(default=None, alias='PeakConnections')
+    running_queries: int | None = Field(default=None, alias='RunningQueries')
+    last_backup_file_path: str | None = Field(default=None, alias='LastBackupFilePath')
+    last_backup_date: datetime | None = Field(default=None, alias='LastBackupDate')
+    last_backup_size: str | None = Field(default=None, alias='LastBackupSize')
+    last_backup_status: int | None = Field(default=None, alias='LastBackupStatus')
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDatesScheduleSettings(ConnectWiseModel):
+    monthly_occurrence: list[str] | None = Field(
+        default=None, alias='MonthlyOccurrence'
+    )
+    dates: list[int] | None = Field(default=None, alias='Dates')
+    last_day_of_month: bool | None = Field(default=None, alias='LastDayOfMonth')
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDaysOfWeekSettings(ConnectWiseModel):
+    sunday: bool | None = Field(default=None, alias='Sunday')
+    monday: bool | None = Field(default=None, alias='Monday')
+    tuesday: bool | None = Field(default=None, alias='Tuesday')
+    wednesday: bool | None = Field(default=None, alias='Wednesday')
+    thursday: bool | None = Field(default=None, alias='Thursday')
+    friday: bool | None = Field(default=None, alias='Friday')
+    saturday: bool | None = Field(default=None, alias='Saturday')
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeleteIpRestrictionsBatchRequest(ConnectWiseModel):
+    ip_restrictions_ids: list[UUID] | None = Field(
+        default=None, alias='IpRestrictionsIds'
+    )
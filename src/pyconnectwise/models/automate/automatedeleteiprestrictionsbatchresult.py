@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeleteIpRestrictionsBatchResult(ConnectWiseModel):
+    ip_restrictions_id: UUID | None = Field(
+        default=None,
+        alias='IpRestrictionsId',
+        example='00000000-0000-0000-0000-000000000000',
+    )
+    result_details: AutomateResponseResult | None = Field(
+        default=None, alias='ResultDetails'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateresponseresult import AutomateResponseResult
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeleteRemoteMonitorBatchResult(ConnectWiseModel):
+    remote_monitor_id: int | None = Field(default=None, alias='RemoteMonitorId')
+    result_details: AutomateResponseResult | None = Field(
+        default=None, alias='ResultDetails'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateresponseresult import AutomateResponseResult
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeleteScriptBatchResponse(ConnectWiseModel):
+    script_results: list[AutomateDeleteScriptBatchResult] | None = Field(
+        default=None, alias='ScriptResults'
+    )
+    contains_unsuccessful_results: bool | None = Field(
+        default=None, alias='ContainsUnsuccessfulResults'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedeletescriptbatchresult import AutomateDeleteScriptBatchResult
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeploymentLogin(ConnectWiseModel):
+    deployment_login_id: int | None = Field(default=None, alias='DeploymentLoginId')
+    client: AutomateClient | None = Field(default=None, alias='Client')
+    location: AutomateLocation | None = Field(default=None, alias='Location')
+    title: str | None = Field(default=None, alias='Title')
+    username: str | None = Field(default=None, alias='Username')
+    password: str | None = Field(default=None, alias='Password')
+    url: str | None = Field(default=None, alias='Url')
+    notes: str | None = Field(default=None, alias='Notes')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclient import AutomateClient
+from pyconnectwise.models.automate.automatelocation import AutomateLocation
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDisableServerPatchRebootServerSettings(ConnectWiseModel):
+    alert_template: AutomateAlertTemplate | None = Field(
+        default=None, alias='AlertTemplate'
+    )
+    alert_message: str | None = Field(default=None, alias='AlertMessage')
+    ticket_category: AutomateTicketCategory | None = Field(
+        default=None, alias='TicketCategory'
+    )
+    report_category: AutomateReportCategory | None = Field(
+        default=None, alias='ReportCategory'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatealerttemplate import AutomateAlertTemplate
+from pyconnectwise.models.automate.automatereportcategory import AutomateReportCategory
+from pyconnectwise.models.automate.automateticketcategory import AutomateTicketCategory
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDisableServerPatchRebootSettings(ConnectWiseModel):
+    server_settings: AutomateDisableServerPatchRebootServerSettings | None = Field(
+        default=None, alias='ServerSettings'
+    )
+    workstation_settings: AutomateDisableServerPatchRebootWorkstationSettings | None = (
+        Field(default=None, alias='WorkstationSettings')
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedisableserverpatchrebootserversettings import AutomateDisableServerPatchRebootServerSettings
+from pyconnectwise.models.automate.automatedisableserverpatchrebootworkstationsettings import AutomateDisableServerPatchRebootWorkstationSettings
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDisableServerPatchRebootWorkstationSettings(ConnectWiseModel):
+    prompt_message: str | None = Field(default=None, alias='PromptMessage')
+    prompt_interval: str | None = Field(default=None, alias='PromptInterval')
+    reboot_deadline: str | None = Field(default=None, alias='RebootDeadline')
+    reboot_deadline_prompt_message: str | None = Field(
+        default=None, alias='RebootDeadlinePromptMessage'
+    )
+    reboot_deadline_prompt_duration: str | None = Field(
+        default=None, alias='RebootDeadlinePromptDuration'
+    )
+    send_wake_on_lan_packet: bool | None = Field(
+        default=None, alias='SendWakeOnLanPacket'
+    )
+    reboot_if_no_user_logged_in: bool | None = Field(
+        default=None, alias='RebootIfNoUserLoggedIn'
+    )
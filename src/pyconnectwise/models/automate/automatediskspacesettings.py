@@ -0,0 +1,12 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDiskSpaceSettings(ConnectWiseModel):
+    drive_letter: str | None = Field(default=None, alias='DriveLetter')
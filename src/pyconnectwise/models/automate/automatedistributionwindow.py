@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDistributionWindow(ConnectWiseModel):
+    distribution_window_type: AutomateDistributionWindowType | None = Field(
+        default=None, alias='DistributionWindowType'
+    )
+    amount: int | None = Field(default=None, alias='Amount')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedistributionwindowtype import AutomateDistributionWindowType
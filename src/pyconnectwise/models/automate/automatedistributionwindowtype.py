@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDistributionWindowType(ConnectWiseModel):
+    distribution_window_type_id: int | None = Field(
+        default=None, alias='DistributionWindowTypeId'
+    )
+    name: str | None = Field(default=None, alias='Name')
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExecuteDeviceCommandResponse(ConnectWiseModel):
+    command_result_list: list[AutomateExecuteDeviceCommandResult] | None = Field(
+        default=None, alias='CommandResultList'
+    )
+    contains_unsuccessful_results: bool | None = Field(
+        default=None, alias='ContainsUnsuccessfulResults'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateexecutedevicecommandresult import AutomateExecuteDeviceCommandResult
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.automate.automateexecutedevicecommandresult import AutomateExecuteDeviceCommandResult
+
+
+class AutomateExecuteDeviceScriptResult(AutomateExecuteDeviceCommandResult):
+    pass
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateresponseresult import AutomateResponseResult
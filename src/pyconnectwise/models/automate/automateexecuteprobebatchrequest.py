@@ -0,0 +1,12 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExecuteProbeBatchRequest(ConnectWiseModel):
+    probe_ids: list[int] | None = Field(default=None, alias='ProbeIds')
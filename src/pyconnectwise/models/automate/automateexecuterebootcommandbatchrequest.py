@@ -0,0 +1,45 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExecuteRebootCommandBatchRequest(ConnectWiseModel):
+    reboot_type: int | None = Field(default=None, alias='RebootType')
+    entity_type: Literal[
+        'System',
+        'Computer',
+        'Site',
+        'Company',
+        'Probe',
+        'NetworkDevice',
+        'Ticket',
+        'Group',
+        'MobileDevice',
+        'Vendor',
+        'VendorProduct',
+        'Possibility',
+        'Opportunity',
+        'Contact',
+        'User',
+        'Script',
+        'Plugin',
+        'Service',
+        'ServiceBundle',
+        'Search',
+        'SearchFolder',
+        'Dataview',
+        'DataviewFolder',
+        'UserFolder',
+        'UserClass',
+        'ScriptFolder',
+        'RemoteMonitorTemplate',
+        'ExtraField',
+    ] | None = Field(default=None, alias='EntityType')
+    entity_ids: list[int] | None = Field(default=None, alias='EntityIds')
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExtensionClaimType(ConnectWiseModel):
+    extension_claim_type_id: int | None = Field(
+        default=None, alias='ExtensionClaimTypeId'
+    )
+    web_extension_id: int | None = Field(default=None, alias='WebExtensionId')
+    display_name: str | None = Field(default=None, alias='DisplayName')
+    claim_key: str | None = Field(default=None, alias='ClaimKey')
+    description: str | None = Field(default=None, alias='Description')
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExtensionClaimViewModel(ConnectWiseModel):
+    extension_claim_type_id: int | None = Field(
+        default=None, alias='ExtensionClaimTypeId'
+    )
+    display_name: str | None = Field(default=None, alias='DisplayName')
+    description: str | None = Field(default=None, alias='Description')
+    is_assigned: bool | None = Field(default=None, alias='IsAssigned')
+    is_default_claim: bool | None = Field(default=None, alias='IsDefaultClaim')
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExtensionSolution(ConnectWiseModel):
+    extension_solution_id: int | None = Field(default=None, alias='ExtensionSolutionId')
+    solution_guid: UUID | None = Field(
+        default=None,
+        alias='SolutionGuid',
+        example='00000000-0000-0000-0000-000000000000',
+    )
+    solution_name: str | None = Field(default=None, alias='SolutionName')
+    is_installed: bool | None = Field(default=None, alias='IsInstalled')
+    installed_version: str | None = Field(default=None, alias='InstalledVersion')
+    latest_version: str | None = Field(default=None, alias='LatestVersion')
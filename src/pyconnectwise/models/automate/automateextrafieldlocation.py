@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExtraFieldLocation(ConnectWiseModel):
+    extra_field_location_id: int | None = Field(
+        default=None, alias='ExtraFieldLocationId'
+    )
+    name: str | None = Field(default=None, alias='Name')
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExtraFieldTitleFormat(ConnectWiseModel):
+    extra_field_title_format_id: int | None = Field(
+        default=None, alias='ExtraFieldTitleFormatId'
+    )
+    name: str | None = Field(default=None, alias='Name')
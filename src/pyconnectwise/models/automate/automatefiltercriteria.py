@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateFilterCriteria(ConnectWiseModel):
+    left_operand: str | None = Field(default=None, alias='LeftOperand')
+    operator: Literal[
+        'IsTrue',
+        'IsFalse',
+        'Equals',
+        'GreaterThan',
+        'GreaterThanEqual',
+        'LessThan',
+        'LessThanEqual',
+        'TextLike',
+        'NotEqual',
+        'NotTextLike',
+        'Contains',
+        'NotContains',
+        'IsAssigned',
+        'IsNotAssigned',
+        'HasRole',
+        'NotHasRole',
+    ] | None = Field(default=None, alias='Operator')
+    right_operand: dict[str, Any] | None = Field(default=None, alias='RightOperand')
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGetCommandStatisticsResponse(ConnectWiseModel):
+    command_pending_count: int | None = Field(default=None, alias='CommandPendingCount')
+    command_failure_count: int | None = Field(default=None, alias='CommandFailureCount')
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroup(ConnectWiseModel):
+    group_id: int | None = Field(default=None, alias='GroupId')
+    name: str | None = Field(default=None, alias='Name')
+    full_name: str | None = Field(default=None, alias='FullName')
+    description: str | None = Field(default=None, alias='Description')
+    group_type: AutomateGroupType | None = Field(default=None, alias='GroupType')
+    template_settings: AutomateTemplateSettings | None = Field(
+        default=None, alias='TemplateSettings'
+    )
+    auto_join_settings: AutomateAutoJoinSettings | None = Field(
+        default=None, alias='AutoJoinSettings'
+    )
+    linking_settings: AutomateLinkingSettings | None = Field(
+        default=None, alias='LinkingSettings'
+    )
+    master_status: AutomateMasterStatus | None = Field(
+        default=None, alias='MasterStatus'
+    )
+    maintenance_window_settings: AutomateMaintenanceWindowSettings | None = Field(
+        default=None, alias='MaintenanceWindowSettings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateautojoinsettings import AutomateAutoJoinSettings
+from pyconnectwise.models.automate.automategrouptype import AutomateGroupType
+from pyconnectwise.models.automate.automatelinkingsettings import AutomateLinkingSettings
+from pyconnectwise.models.automate.automatemaintenancewindowsettings import AutomateMaintenanceWindowSettings
+from pyconnectwise.models.automate.automatemasterstatus import AutomateMasterStatus
+from pyconnectwise.models.automate.automatetemplatesettings import AutomateTemplateSettings
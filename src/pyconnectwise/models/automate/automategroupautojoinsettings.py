@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupAutoJoinSettings(ConnectWiseModel):
+    computer_auto_join_search: AutomateSearch | None = Field(
+        default=None, alias='ComputerAutoJoinSearch'
+    )
+    is_limited_to_computer_auto_join: bool | None = Field(
+        default=None, alias='IsLimitedToComputerAutoJoin'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatesearch import AutomateSearch
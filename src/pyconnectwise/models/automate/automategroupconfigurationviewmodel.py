@@ -0,0 +1,45 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupConfigurationViewModel(ConnectWiseModel):
+    group_type_information: AutomateGroupTypeInformation | None = Field(
+        default=None, alias='GroupTypeInformation'
+    )
+    remote_agent_template_information: AutomateRemoteAgentTemplateInformation | None = (
+        Field(default=None, alias='RemoteAgentTemplateInformation')
+    )
+    computer_search_information: AutomateComputerSearchInformation | None = Field(
+        default=None, alias='ComputerSearchInformation'
+    )
+    network_device_searches: list[AutomateSearch] | None = Field(
+        default=None, alias='NetworkDeviceSearches'
+    )
+    contact_searches: list[AutomateSearch] | None = Field(
+        default=None, alias='ContactSearches'
+    )
+    clients: list[AutomateClient] | None = Field(default=None, alias='Clients')
+    locations: list[AutomateLocation] | None = Field(default=None, alias='Locations')
+    maintenance_windows: list[AutomateMaintenanceWindow] | None = Field(
+        default=None, alias='MaintenanceWindows'
+    )
+    user_classes: list[AutomateUserClass] | None = Field(
+        default=None, alias='UserClasses'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclient import AutomateClient
+from pyconnectwise.models.automate.automatecomputersearchinformation import AutomateComputerSearchInformation
+from pyconnectwise.models.automate.automategrouptypeinformation import AutomateGroupTypeInformation
+from pyconnectwise.models.automate.automatelocation import AutomateLocation
+from pyconnectwise.models.automate.automatemaintenancewindow import AutomateMaintenanceWindow
+from pyconnectwise.models.automate.automateremoteagenttemplateinformation import AutomateRemoteAgentTemplateInformation
+from pyconnectwise.models.automate.automatesearch import AutomateSearch
+from pyconnectwise.models.automate.automateuserclass import AutomateUserClass
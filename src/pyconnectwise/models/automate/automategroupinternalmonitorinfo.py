@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupInternalMonitorInfo(ConnectWiseModel):
+    monitor_id: int | None = Field(default=None, alias='MonitorId')
+    monitor_name: str | None = Field(default=None, alias='MonitorName')
+    is_monitor_globally_applied: bool | None = Field(
+        default=None, alias='IsMonitorGloballyApplied'
+    )
+    is_subscription_inherited: bool | None = Field(
+        default=None, alias='IsSubscriptionInherited'
+    )
+    is_group_subscribed: bool | None = Field(default=None, alias='IsGroupSubscribed')
+    monitor_interval: str | None = Field(default=None, alias='MonitorInterval')
+    monitor_next_scan_date: datetime | None = Field(
+        default=None, alias='MonitorNextScanDate'
+    )
+    effective_alert_policy: AutomateMonitorAlertPolicy | None = Field(
+        default=None, alias='EffectiveAlertPolicy'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatemonitoralertpolicy import AutomateMonitorAlertPolicy
@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupPatchingPolicy(ConnectWiseModel):
+    approval_policies: list[AutomateApprovalPolicy] | None = Field(
+        default=None, alias='ApprovalPolicies'
+    )
+    group_id: int | None = Field(default=None, alias='GroupId')
+    group_name: str | None = Field(default=None, alias='GroupName')
+    is_manual: bool | None = Field(default=None, alias='IsManual')
+    is_patching_group: bool | None = Field(default=None, alias='IsPatchingGroup')
+    microsoft_update_policy: AutomateMicrosoftUpdatePolicy | None = Field(
+        default=None, alias='MicrosoftUpdatePolicy'
+    )
+    priority: int | None = Field(default=None, alias='Priority')
+    reboot_policy: AutomateRebootPolicy | None = Field(
+        default=None, alias='RebootPolicy'
+    )
+    third_party_update_policy: AutomateThirdPartyUpdatePolicy | None = Field(
+        default=None, alias='ThirdPartyUpdatePolicy'
+    )
+    auto_join_settings: AutomateGroupAutoJoinSettings | None = Field(
+        default=None, alias='AutoJoinSettings'
+    )
+    windows_computer_count: int | None = Field(
+        default=None, alias='WindowsComputerCount'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateapprovalpolicy import AutomateApprovalPolicy
+from pyconnectwise.models.automate.automategroupautojoinsettings import AutomateGroupAutoJoinSettings
+from pyconnectwise.models.automate.automatemicrosoftupdatepolicy import AutomateMicrosoftUpdatePolicy
+from pyconnectwise.models.automate.automaterebootpolicy import AutomateRebootPolicy
+from pyconnectwise.models.automate.automatethirdpartyupdatepolicy import AutomateThirdPartyUpdatePolicy
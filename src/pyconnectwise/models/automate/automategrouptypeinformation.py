@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupTypeInformation(ConnectWiseModel):
+    inherited_group_type_id: int | None = Field(
+        default=None, alias='InheritedGroupTypeId'
+    )
+    is_modifiable: bool | None = Field(default=None, alias='IsModifiable')
+    group_types: list[AutomateGroupType] | None = Field(
+        default=None, alias='GroupTypes'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automategrouptype import AutomateGroupType
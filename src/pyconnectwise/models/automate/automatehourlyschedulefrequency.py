@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateHourlyScheduleFrequency(ConnectWiseModel):
+    hourly_interval: int | None = Field(default=None, alias='HourlyInterval')
+    exclusion_start_time: str | None = Field(default=None, alias='ExclusionStartTime')
+    exclusion_end_time: str | None = Field(default=None, alias='ExclusionEndTime')
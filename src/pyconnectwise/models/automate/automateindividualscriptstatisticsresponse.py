@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateIndividualScriptStatisticsResponse(ConnectWiseModel):
+    success_count: int | None = Field(default=None, alias='SuccessCount')
+    total_run_count: int | None = Field(default=None, alias='TotalRunCount')
+    last_run_target: str | None = Field(default=None, alias='LastRunTarget')
+    last_run_date: datetime | None = Field(default=None, alias='LastRunDate')
+    total_value: int | None = Field(default=None, alias='TotalValue')
+    last_history_date_available: datetime | None = Field(
+        default=None, alias='LastHistoryDateAvailable'
+    )
+    last_run_status: str | None = Field(default=None, alias='LastRunStatus')
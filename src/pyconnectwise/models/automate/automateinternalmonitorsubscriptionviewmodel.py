@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateInternalMonitorSubscriptionViewModel(ConnectWiseModel):
+    alert_templates: list[AutomateAlertTemplate] | None = Field(
+        default=None, alias='AlertTemplates'
+    )
+    ticket_categories: list[AutomateTicketCategory] | None = Field(
+        default=None, alias='TicketCategories'
+    )
+    is_group_subscribed: bool | None = Field(default=None, alias='IsGroupSubscribed')
+    is_subscription_inherited: bool | None = Field(
+        default=None, alias='IsSubscriptionInherited'
+    )
+    is_override_applied: bool | None = Field(default=None, alias='IsOverrideApplied')
+    monitor_alert_template_id: int | None = Field(
+        default=None, alias='MonitorAlertTemplateId'
+    )
+    monitor_ticket_category_id: int | None = Field(
+        default=None, alias='MonitorTicketCategoryId'
+    )
+    overridden_alert_template_id: int | None = Field(
+        default=None, alias='OverriddenAlertTemplateId'
+    )
+    overridden_ticket_category_id: int | None = Field(
+        default=None, alias='OverriddenTicketCategoryId'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatealerttemplate import AutomateAlertTemplate
+from pyconnectwise.models.automate.automateticketcategory import AutomateTicketCategory
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateIpRestrictionRule(ConnectWiseModel):
+    ip_address_guid: UUID | None = Field(
+        default=None,
+        alias='IpAddressGuid',
+        example='00000000-0000-0000-0000-000000000000',
+    )
+    name: str | None = Field(default=None, alias='Name')
+    ip_address: str | None = Field(default=None, alias='IpAddress')
+    windows_client_access: bool | None = Field(
+        default=None, alias='WindowsClientAccess'
+    )
+    web_client_access: bool | None = Field(default=None, alias='WebClientAccess')
+    created_by: str | None = Field(default=None, alias='CreatedBy')
+    create_date: datetime | None = Field(default=None, alias='CreateDate')
+    updated_by: str | None = Field(default=None, alias='UpdatedBy')
+    update_date: datetime | None = Field(default=None, alias='UpdateDate')
@@ -0,0 +1,12 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateIpRestrictionStatus(ConnectWiseModel):
+    is_enabled: bool | None = Field(default=None, alias='IsEnabled')
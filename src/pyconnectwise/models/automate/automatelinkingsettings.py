@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateLinkingSettings(ConnectWiseModel):
+    group_link_type_id: int | None = Field(default=None, alias='GroupLinkTypeId')
+    group_link_type_name: str | None = Field(default=None, alias='GroupLinkTypeName')
+    linked_entity_id: int | None = Field(default=None, alias='LinkedEntityId')
+    linked_entity_name: str | None = Field(default=None, alias='LinkedEntityName')
+    is_synchronized: bool | None = Field(default=None, alias='IsSynchronized')
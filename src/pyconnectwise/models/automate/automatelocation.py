@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateLocation(ConnectWiseModel):
+    location_id: int | None = Field(default=None, alias='LocationId')
+    name: str | None = Field(default=None, alias='Name')
+    client: AutomateClient | None = Field(default=None, alias='Client')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclient import AutomateClient
@@ -0,0 +1,49 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMaintenanceModeQueueBatchRequest(ConnectWiseModel):
+    entity_type: Literal[
+        'System',
+        'Computer',
+        'Site',
+        'Company',
+        'Probe',
+        'NetworkDevice',
+        'Ticket',
+        'Group',
+        'MobileDevice',
+        'Vendor',
+        'VendorProduct',
+        'Possibility',
+        'Opportunity',
+        'Contact',
+        'User',
+        'Script',
+        'Plugin',
+        'Service',
+        'ServiceBundle',
+        'Search',
+        'SearchFolder',
+        'Dataview',
+        'DataviewFolder',
+        'UserFolder',
+        'UserClass',
+        'ScriptFolder',
+        'RemoteMonitorTemplate',
+        'ExtraField',
+    ] | None = Field(default=None, alias='EntityType')
+    entity_ids: list[int] | None = Field(default=None, alias='EntityIds')
+    start_date: datetime | None = Field(default=None, alias='StartDate')
+    duration_in_minutes: int | None = Field(default=None, alias='DurationInMinutes')
+    mode: str | None = Field(default=None, alias='Mode')
+    comments: str | None = Field(default=None, alias='Comments')
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateManagementPackQuickSettingsRequest(ConnectWiseModel):
+    is_core_services_enabled: bool | None = Field(
+        default=None, alias='IsCoreServicesEnabled'
+    )
+    is_database_enabled: bool | None = Field(default=None, alias='IsDatabaseEnabled')
+    is_messaging_services_enabled: bool | None = Field(
+        default=None, alias='IsMessagingServicesEnabled'
+    )
+    is_network_ports_enabled: bool | None = Field(
+        default=None, alias='IsNetworkPortsEnabled'
+    )
+    is_websites_and_proxies_enabled: bool | None = Field(
+        default=None, alias='IsWebsitesAndProxiesEnabled'
+    )
+    alert_level: str | None = Field(default=None, alias='AlertLevel')
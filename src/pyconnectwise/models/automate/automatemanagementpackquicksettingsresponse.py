@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateManagementPackQuickSettingsResponse(ConnectWiseModel):
+    core_services_status: AutomateManagementPackStatus | None = Field(
+        default=None, alias='CoreServicesStatus'
+    )
+    database_status: AutomateManagementPackStatus | None = Field(
+        default=None, alias='DatabaseStatus'
+    )
+    messaging_services_status: AutomateManagementPackStatus | None = Field(
+        default=None, alias='MessagingServicesStatus'
+    )
+    network_port_status: AutomateManagementPackStatus | None = Field(
+        default=None, alias='NetworkPortStatus'
+    )
+    websites_and_proxies_status: AutomateManagementPackStatus | None = Field(
+        default=None, alias='WebsitesAndProxiesStatus'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatemanagementpackstatus import AutomateManagementPackStatus
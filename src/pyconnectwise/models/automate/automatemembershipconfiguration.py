@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMembershipConfiguration(ConnectWiseModel):
+    membership_type: str | None = Field(default=None, alias='MembershipType')
+    computer_search_name: str | None = Field(default=None, alias='ComputerSearchName')
+    is_limited_to_computer_search: bool | None = Field(
+        default=None, alias='IsLimitedToComputerSearch'
+    )
+    network_device_search_name: str | None = Field(
+        default=None, alias='NetworkDeviceSearchName'
+    )
+    is_limited_to_network_device_search: bool | None = Field(
+        default=None, alias='IsLimitedToNetworkDeviceSearch'
+    )
+    contact_search_name: str | None = Field(default=None, alias='ContactSearchName')
+    is_limited_to_contact_search: bool | None = Field(
+        default=None, alias='IsLimitedToContactSearch'
+    )
+    includes_contact_associated_computers: bool | None = Field(
+        default=None, alias='IncludesContactAssociatedComputers'
+    )
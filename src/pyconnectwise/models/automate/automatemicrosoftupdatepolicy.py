@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMicrosoftUpdatePolicy(ConnectWiseModel):
+    policy_id: int | None = Field(default=None, alias='PolicyId')
+    policy_name: str | None = Field(default=None, alias='PolicyName')
+    schedule_settings: AutomatePatchingPolicySchedule | None = Field(
+        default=None, alias='ScheduleSettings'
+    )
+    windows_update_agent_settings: AutomateWindowsUpdateAgentSettings | None = Field(
+        default=None, alias='WindowsUpdateAgentSettings'
+    )
+    policy_options: AutomateMicrosoftUpdatePolicyOptions | None = Field(
+        default=None, alias='PolicyOptions'
+    )
+    workstation_options: AutomatePatchingPolicyWorkstationOptions | None = Field(
+        default=None, alias='WorkstationOptions'
+    )
+    windows10_update_options: AutomateMicrosoftUpdatePolicyWindows10Options | None = (
+        Field(default=None, alias='Windows10UpdateOptions')
+    )
+    script_options: AutomatePatchingPolicyScriptOptions | None = Field(
+        default=None, alias='ScriptOptions'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatemicrosoftupdatepolicyoptions import AutomateMicrosoftUpdatePolicyOptions
+from pyconnectwise.models.automate.automatemicrosoftupdatepolicywindows10options import AutomateMicrosoftUpdatePolicyWindows10Options
+from pyconnectwise.models.automate.automatepatchingpolicyschedule import AutomatePatchingPolicySchedule
+from pyconnectwise.models.automate.automatepatchingpolicyscriptoptions import AutomatePatchingPolicyScriptOptions
+from pyconnectwise.models.automate.automatepatchingpolicyworkstationoptions import AutomatePatchingPolicyWorkstationOptions
+from pyconnectwise.models.automate.automatewindowsupdateagentsettings import AutomateWindowsUpdateAgentSettings
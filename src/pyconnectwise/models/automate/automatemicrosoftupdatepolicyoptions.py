@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMicrosoftUpdatePolicyOptions(ConnectWiseModel):
+    install_missing_baseline_patches: bool | None = Field(
+        default=None, alias='InstallMissingBaselinePatches'
+    )
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMicrosoftUpdatePolicyWindows10Options(ConnectWiseModel):
+    service_branch_settings: AutomateServiceBranchSettings | None = Field(
+        default=None, alias='ServiceBranchSettings'
+    )
+    feature_update_deferment_settings: AutomateUpdateDefermentSettings | None = Field(
+        default=None, alias='FeatureUpdateDefermentSettings'
+    )
+    quality_update_deferment_settings: AutomateUpdateDefermentSettings | None = Field(
+        default=None, alias='QualityUpdateDefermentSettings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateservicebranchsettings import AutomateServiceBranchSettings
+from pyconnectwise.models.automate.automateupdatedefermentsettings import AutomateUpdateDefermentSettings
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMonitor(ConnectWiseModel):
+    monitor_id: int | None = Field(default=None, alias='MonitorId')
+    name: str | None = Field(default=None, alias='Name')
+    groups: list[AutomateGroup] | None = Field(default=None, alias='Groups')
+    target_computer: AutomateComputer | None = Field(
+        default=None, alias='TargetComputer'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatecomputer import AutomateComputer
+from pyconnectwise.models.automate.automategroup import AutomateGroup
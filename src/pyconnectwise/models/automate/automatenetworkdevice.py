@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateNetworkDevice(ConnectWiseModel):
+    network_device_id: int | None = Field(default=None, alias='NetworkDeviceId')
+    name: str | None = Field(default=None, alias='Name')
+    friendly_name: str | None = Field(default=None, alias='FriendlyName')
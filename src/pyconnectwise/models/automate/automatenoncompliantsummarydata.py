@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateNonCompliantSummaryData(ConnectWiseModel):
+    low_severity_count: int | None = Field(default=None, alias='LowSeverityCount')
+    moderate_severity_count: int | None = Field(
+        default=None, alias='ModerateSeverityCount'
+    )
+    important_severity_count: int | None = Field(
+        default=None, alias='ImportantSeverityCount'
+    )
+    critical_severity_count: int | None = Field(
+        default=None, alias='CriticalSeverityCount'
+    )
+    unspecified_severity_count: int | None = Field(
+        default=None, alias='UnspecifiedSeverityCount'
+    )
+    low_cvss_count: int | None = Field(default=None, alias='LowCvssCount')
+    medium_cvss_count: int | None = Field(default=None, alias='MediumCvssCount')
+    high_cvss_count: int | None = Field(default=None, alias='HighCvssCount')
+    total_non_compliant_count: int | None = Field(
+        default=None, alias='TotalNonCompliantCount'
+    )
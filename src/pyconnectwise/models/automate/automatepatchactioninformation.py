@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePatchActionInformation(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    product_key_id_list: list[str] | None = Field(
+        default=None, alias='ProductKeyIdList'
+    )
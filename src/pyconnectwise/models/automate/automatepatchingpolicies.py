@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePatchingPolicies(ConnectWiseModel):
+    microsoft_update_policy: AutomateMicrosoftUpdatePolicy | None = Field(
+        default=None, alias='MicrosoftUpdatePolicy'
+    )
+    reboot_policy: AutomateRebootPolicy | None = Field(
+        default=None, alias='RebootPolicy'
+    )
+    third_party_update_policy: AutomateThirdPartyUpdatePolicy | None = Field(
+        default=None, alias='ThirdPartyUpdatePolicy'
+    )
+    approval_policies: list[AutomateApprovalPolicy] | None = Field(
+        default=None, alias='ApprovalPolicies'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateapprovalpolicy import AutomateApprovalPolicy
+from pyconnectwise.models.automate.automatemicrosoftupdatepolicy import AutomateMicrosoftUpdatePolicy
+from pyconnectwise.models.automate.automaterebootpolicy import AutomateRebootPolicy
+from pyconnectwise.models.automate.automatethirdpartyupdatepolicy import AutomateThirdPartyUpdatePolicy
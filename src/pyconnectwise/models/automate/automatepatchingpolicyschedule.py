@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePatchingPolicySchedule(ConnectWiseModel):
+    use_schedule: bool | None = Field(default=None, alias='UseSchedule')
+    window_start: str | None = Field(default=None, alias='WindowStart')
+    window_duration: str | None = Field(default=None, alias='WindowDuration')
+    policy_schedule_type: str | None = Field(default=None, alias='PolicyScheduleType')
+    dates_settings: AutomateDatesScheduleSettings | None = Field(
+        default=None, alias='DatesSettings'
+    )
+    days_settings: AutomateDaysScheduleSettings | None = Field(
+        default=None, alias='DaysSettings'
+    )
+    patch_tuesday_settings: AutomatePatchTuesdayScheduleSettings | None = Field(
+        default=None, alias='PatchTuesdaySettings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedatesschedulesettings import AutomateDatesScheduleSettings
+from pyconnectwise.models.automate.automatedaysschedulesettings import AutomateDaysScheduleSettings
+from pyconnectwise.models.automate.automatepatchtuesdayschedulesettings import AutomatePatchTuesdayScheduleSettings
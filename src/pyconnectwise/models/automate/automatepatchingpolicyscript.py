@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePatchingPolicyScript(ConnectWiseModel):
+    run_script: bool | None = Field(default=None, alias='RunScript')
+    script_guid: UUID | None = Field(
+        default=None, alias='ScriptGuid', example='00000000-0000-0000-0000-000000000000'
+    )
+    script_name: str | None = Field(default=None, alias='ScriptName')
+    cancel_action_on_script_failure: bool | None = Field(
+        default=None, alias='CancelActionOnScriptFailure'
+    )
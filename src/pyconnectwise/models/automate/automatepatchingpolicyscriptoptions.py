@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePatchingPolicyScriptOptions(ConnectWiseModel):
+    before_script_options: AutomatePatchingPolicyScript | None = Field(
+        default=None, alias='BeforeScriptOptions'
+    )
+    after_script_options: AutomatePatchingPolicyScript | None = Field(
+        default=None, alias='AfterScriptOptions'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatepatchingpolicyscript import AutomatePatchingPolicyScript
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePatchingPolicyWorkstationOptions(ConnectWiseModel):
+    send_wake_on_lan_packet: bool | None = Field(
+        default=None, alias='SendWakeOnLanPacket'
+    )
+    create_windows_restore_point: bool | None = Field(
+        default=None, alias='CreateWindowsRestorePoint'
+    )
+    daytime_patching_options: AutomateDaytimePatchingOptions | None = Field(
+        default=None, alias='DaytimePatchingOptions'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedaytimepatchingoptions import AutomateDaytimePatchingOptions
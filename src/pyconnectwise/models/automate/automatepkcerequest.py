@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePkceRequest(ConnectWiseModel):
+    authorization_code: str | None = Field(default=None, alias='AuthorizationCode')
+    code_verifier: str | None = Field(default=None, alias='CodeVerifier')
+    client_id: str | None = Field(default=None, alias='ClientId')
+    redirect_uri: str | None = Field(default=None, alias='RedirectUri')
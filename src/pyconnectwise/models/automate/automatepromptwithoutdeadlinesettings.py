@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePromptWithoutDeadlineSettings(ConnectWiseModel):
+    reboot_trigger_type: str | None = Field(default=None, alias='RebootTriggerType')
+    post_patch_install_trigger_settings: AutomatePostPatchInstallTriggerSettings | None = Field(
+        default=None, alias='PostPatchInstallTriggerSettings'
+    )
+    schedule_trigger_settings: AutomatePatchingPolicySchedule | None = Field(
+        default=None, alias='ScheduleTriggerSettings'
+    )
+    prompt_settings: AutomateRebootPolicyPromptSettings | None = Field(
+        default=None, alias='PromptSettings'
+    )
+    reboot_prior_to_patch_job_installs: bool | None = Field(
+        default=None, alias='RebootPriorToPatchJobInstalls'
+    )
+    maintenance_mode_options: AutomateRebootPolicyMaintenanceModeOptions | None = Field(
+        default=None, alias='MaintenanceModeOptions'
+    )
+    script_options: AutomatePatchingPolicyScriptOptions | None = Field(
+        default=None, alias='ScriptOptions'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatepatchingpolicyschedule import AutomatePatchingPolicySchedule
+from pyconnectwise.models.automate.automatepatchingpolicyscriptoptions import AutomatePatchingPolicyScriptOptions
+from pyconnectwise.models.automate.automatepostpatchinstalltriggersettings import AutomatePostPatchInstallTriggerSettings
+from pyconnectwise.models.automate.automaterebootpolicymaintenancemodeoptions import AutomateRebootPolicyMaintenanceModeOptions
+from pyconnectwise.models.automate.automaterebootpolicypromptsettings import AutomateRebootPolicyPromptSettings
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRebootPolicy(ConnectWiseModel):
+    policy_id: int | None = Field(default=None, alias='PolicyId')
+    policy_name: str | None = Field(default=None, alias='PolicyName')
+    reboot_policy_type: str | None = Field(default=None, alias='RebootPolicyType')
+    disable_server_patch_reboot_settings: AutomateDisableServerPatchRebootSettings | None = Field(
+        default=None, alias='DisableServerPatchRebootSettings'
+    )
+    prompt_without_deadline_settings: AutomatePromptWithoutDeadlineSettings | None = (
+        Field(default=None, alias='PromptWithoutDeadlineSettings')
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedisableserverpatchrebootsettings import AutomateDisableServerPatchRebootSettings
+from pyconnectwise.models.automate.automatepromptwithoutdeadlinesettings import AutomatePromptWithoutDeadlineSettings
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRebootPolicyMaintenanceModeOptions(ConnectWiseModel):
+    set_window: bool | None = Field(default=None, alias='SetWindow')
+    window_ignore_types: list[str] | None = Field(
+        default=None, alias='WindowIgnoreTypes'
+    )
+    window_duration: str | None = Field(default=None, alias='WindowDuration')
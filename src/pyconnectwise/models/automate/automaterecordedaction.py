@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRecordedAction(ConnectWiseModel):
+    type: AutomateRecordedActionType | None = Field(default=None, alias='Type')
+    object_id: int | None = Field(default=None, alias='ObjectId')
+    secondary_identifier: str | None = Field(default=None, alias='SecondaryIdentifier')
+    description: str | None = Field(default=None, alias='Description')
+    source: AutomateRecordedActionSource | None = Field(default=None, alias='Source')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automaterecordedactionsource import AutomateRecordedActionSource
+from pyconnectwise.models.automate.automaterecordedactiontype import AutomateRecordedActionType
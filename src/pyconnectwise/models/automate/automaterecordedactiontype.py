@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRecordedActionType(ConnectWiseModel):
+    recorded_action_type_id: int | None = Field(
+        default=None, alias='RecordedActionTypeId'
+    )
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRegistrySettings(ConnectWiseModel):
+    registry_hive_type_id: int | None = Field(default=None, alias='RegistryHiveTypeId')
+    registry_key: str | None = Field(default=None, alias='RegistryKey')
+    value_name: str | None = Field(default=None, alias='ValueName')
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRemoteAgentTemplateInformation(ConnectWiseModel):
+    inherited_remote_agent_template_id: int | None = Field(
+        default=None, alias='InheritedRemoteAgentTemplateId'
+    )
+    is_modifiable: bool | None = Field(default=None, alias='IsModifiable')
+    remote_agent_templates: list[AutomateRemoteAgentTemplate] | None = Field(
+        default=None, alias='RemoteAgentTemplates'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateremoteagenttemplate import AutomateRemoteAgentTemplate
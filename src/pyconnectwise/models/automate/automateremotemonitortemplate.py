@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRemoteMonitorTemplate(ConnectWiseModel):
+    limiting_search: AutomateSearch | None = Field(default=None, alias='LimitingSearch')
+    group_id: int | None = Field(default=None, alias='GroupId')
+    target_type: AutomateTargetType | None = Field(default=None, alias='TargetType')
+    install_count: int | None = Field(default=None, alias='InstallCount')
+    sub_type: str | None = Field(default=None, alias='SubType')
+    details: str | None = Field(default=None, alias='Details')
+    last_edited_by: str | None = Field(default=None, alias='LastEditedBy')
+    last_edited_time: datetime | None = Field(default=None, alias='LastEditedTime')
+    remote_monitor_id: int | None = Field(default=None, alias='RemoteMonitorId')
+    name: str | None = Field(default=None, alias='Name')
+    alerting_settings: AutomateAlertingSettings | None = Field(
+        default=None, alias='AlertingSettings'
+    )
+    configuration: AutomateConfiguration | None = Field(
+        default=None, alias='Configuration'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatealertingsettings import AutomateAlertingSettings
+from pyconnectwise.models.automate.automateconfiguration import AutomateConfiguration
+from pyconnectwise.models.automate.automatesearch import AutomateSearch
+from pyconnectwise.models.automate.automatetargettype import AutomateTargetType
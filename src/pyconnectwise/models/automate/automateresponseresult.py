@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateResponseResult(ConnectWiseModel):
+    result_status: int | None = Field(default=None, alias='ResultStatus')
+    reason_code: int | None = Field(default=None, alias='ReasonCode')
+    message: str | None = Field(default=None, alias='Message')
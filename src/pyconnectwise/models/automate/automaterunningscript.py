@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRunningScript(ConnectWiseModel):
+    script_instance_id: int | None = Field(default=None, alias='ScriptInstanceId')
+    target: AutomateRunningScriptTarget | None = Field(default=None, alias='Target')
+    script: AutomateScript | None = Field(default=None, alias='Script')
+    source: AutomateScriptSource | None = Field(default=None, alias='Source')
+    state: AutomateScriptState | None = Field(default=None, alias='State')
+    start_date: datetime | None = Field(default=None, alias='StartDate')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automaterunningscripttarget import AutomateRunningScriptTarget
+from pyconnectwise.models.automate.automatescript import AutomateScript
+from pyconnectwise.models.automate.automatescriptsource import AutomateScriptSource
+from pyconnectwise.models.automate.automatescriptstate import AutomateScriptState
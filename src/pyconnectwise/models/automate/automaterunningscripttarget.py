@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRunningScriptTarget(ConnectWiseModel):
+    target_type: AutomateRunningScriptTargetType | None = Field(
+        default=None, alias='TargetType'
+    )
+    computer: AutomateComputer | None = Field(default=None, alias='Computer')
+    client: AutomateClient | None = Field(default=None, alias='Client')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclient import AutomateClient
+from pyconnectwise.models.automate.automatecomputer import AutomateComputer
+from pyconnectwise.models.automate.automaterunningscripttargettype import AutomateRunningScriptTargetType
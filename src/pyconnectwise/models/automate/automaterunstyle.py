@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRunStyle(ConnectWiseModel):
+    run_style_id: int | None = Field(default=None, alias='RunStyleId')
+    name: str | None = Field(default=None, alias='Name')
@@ -0,0 +1,49 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScheduledScript(ConnectWiseModel):
+    scheduled_script_id: int | None = Field(default=None, alias='ScheduledScriptId')
+    script: AutomateScript | None = Field(default=None, alias='Script')
+    schedule_target: AutomateScheduledScriptTarget | None = Field(
+        default=None, alias='ScheduleTarget'
+    )
+    schedule: AutomateScriptScheduleSettings | None = Field(
+        default=None, alias='Schedule'
+    )
+    limiting_search: AutomateSearch | None = Field(default=None, alias='LimitingSearch')
+    offline_action_flags: AutomateScheduledScriptOfflineActionFlags | None = Field(
+        default=None, alias='OfflineActionFlags'
+    )
+    distribution_window: AutomateDistributionWindow | None = Field(
+        default=None, alias='DistributionWindow'
+    )
+    parameters: list[SystemString] | None = Field(default=None, alias='Parameters')
+    use_agent_time: bool | None = Field(default=None, alias='UseAgentTime')
+    scheduled_by: str | None = Field(default=None, alias='ScheduledBy')
+    occurrences: int | None = Field(default=None, alias='Occurrences')
+    start_date: datetime | None = Field(default=None, alias='StartDate')
+    expire_date: datetime | None = Field(default=None, alias='ExpireDate')
+    next_run_date: datetime | None = Field(default=None, alias='NextRunDate')
+    is_disabled: bool | None = Field(default=None, alias='IsDisabled')
+    priority: int | None = Field(default=None, alias='Priority')
+    include_sub_groups: bool | None = Field(default=None, alias='IncludeSubGroups')
+    is_inherited: bool | None = Field(default=None, alias='IsInherited')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedistributionwindow import AutomateDistributionWindow
+from pyconnectwise.models.automate.automatescheduledscriptofflineactionflags import AutomateScheduledScriptOfflineActionFlags
+from pyconnectwise.models.automate.automatescheduledscripttarget import AutomateScheduledScriptTarget
+from pyconnectwise.models.automate.automatescript import AutomateScript
+from pyconnectwise.models.automate.automatescriptschedulesettings import AutomateScriptScheduleSettings
+from pyconnectwise.models.automate.automatesearch import AutomateSearch
+from pyconnectwise.models.automate.systemstring import SystemString
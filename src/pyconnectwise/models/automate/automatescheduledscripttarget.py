@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScheduledScriptTarget(ConnectWiseModel):
+    schedule_target_type: AutomateScheduleTargetType | None = Field(
+        default=None, alias='ScheduleTargetType'
+    )
+    group: AutomateGroup | None = Field(default=None, alias='Group')
+    client: AutomateClient | None = Field(default=None, alias='Client')
+    location: AutomateLocation | None = Field(default=None, alias='Location')
+    computer: AutomateComputer | None = Field(default=None, alias='Computer')
+    network_device: AutomateNetworkDevice | None = Field(
+        default=None, alias='NetworkDevice'
+    )
+    contact: AutomateContact | None = Field(default=None, alias='Contact')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclient import AutomateClient
+from pyconnectwise.models.automate.automatecomputer import AutomateComputer
+from pyconnectwise.models.automate.automatecontact import AutomateContact
+from pyconnectwise.models.automate.automategroup import AutomateGroup
+from pyconnectwise.models.automate.automatelocation import AutomateLocation
+from pyconnectwise.models.automate.automatenetworkdevice import AutomateNetworkDevice
+from pyconnectwise.models.automate.automatescheduletargettype import AutomateScheduleTargetType
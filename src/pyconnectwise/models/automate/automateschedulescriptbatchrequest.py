@@ -0,0 +1,69 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScheduleScriptBatchRequest(ConnectWiseModel):
+    entity_type: Literal[
+        'System',
+        'Computer',
+        'Site',
+        'Company',
+        'Probe',
+        'NetworkDevice',
+        'Ticket',
+        'Group',
+        'MobileDevice',
+        'Vendor',
+        'VendorProduct',
+        'Possibility',
+        'Opportunity',
+        'Contact',
+        'User',
+        'Script',
+        'Plugin',
+        'Service',
+        'ServiceBundle',
+        'Search',
+        'SearchFolder',
+        'Dataview',
+        'DataviewFolder',
+        'UserFolder',
+        'UserClass',
+        'ScriptFolder',
+        'RemoteMonitorTemplate',
+        'ExtraField',
+    ] | None = Field(default=None, alias='EntityType')
+    entity_ids: list[int] | None = Field(default=None, alias='EntityIds')
+    script_id: int | None = Field(default=None, alias='ScriptId')
+    script_guid: str | None = Field(default=None, alias='ScriptGuid')
+    schedule: AutomateScriptScheduleSettings | None = Field(
+        default=None, alias='Schedule'
+    )
+    parameters: list[SystemString] | None = Field(default=None, alias='Parameters')
+    use_agent_time: bool | None = Field(default=None, alias='UseAgentTime')
+    start_date: datetime | None = Field(default=None, alias='StartDate')
+    expire_date: datetime | None = Field(default=None, alias='ExpireDate')
+    offline_action_flags: AutomateScheduledScriptOfflineActionFlags | None = Field(
+        default=None, alias='OfflineActionFlags'
+    )
+    distribution_window: AutomateDistributionWindow | None = Field(
+        default=None, alias='DistributionWindow'
+    )
+    priority: int | None = Field(default=None, alias='Priority')
+    include_sub_groups: bool | None = Field(default=None, alias='IncludeSubGroups')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedistributionwindow import AutomateDistributionWindow
+from pyconnectwise.models.automate.automatescheduledscriptofflineactionflags import AutomateScheduledScriptOfflineActionFlags
+from pyconnectwise.models.automate.automatescriptschedulesettings import AutomateScriptScheduleSettings
+from pyconnectwise.models.automate.systemstring import SystemString
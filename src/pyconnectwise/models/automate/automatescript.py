@@ -0,0 +1,50 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScript(ConnectWiseModel):
+    script_id: int | None = Field(default=None, alias='ScriptId')
+    ticket_entry_settings: AutomateTicketEntrySettings | None = Field(
+        default=None, alias='TicketEntrySettings'
+    )
+    time_entry_settings: AutomateTimeEntrySettings | None = Field(
+        default=None, alias='TimeEntrySettings'
+    )
+    user_class_access_settings: list[AutomateUserClassAccess] | None = Field(
+        default=None, alias='UserClassAccessSettings'
+    )
+    is_protected: bool | None = Field(default=None, alias='IsProtected')
+    uses_enhanced_logging: bool | None = Field(
+        default=None, alias='UsesEnhancedLogging'
+    )
+    steps: list[AutomateScriptStep] | None = Field(default=None, alias='Steps')
+    global_variables: dict[str, str] | None = Field(
+        default=None, alias='GlobalVariables'
+    )
+    parameters: list[str] | None = Field(default=None, alias='Parameters')
+    name: str | None = Field(default=None, alias='Name')
+    description: str | None = Field(default=None, alias='Description')
+    folder: AutomateScriptFolder | None = Field(default=None, alias='Folder')
+    script_target_type: AutomateScriptTarget | None = Field(
+        default=None, alias='ScriptTargetType'
+    )
+    script_options: AutomateScriptOptions | None = Field(
+        default=None, alias='ScriptOptions'
+    )
+    automation_minutes: int | None = Field(default=None, alias='AutomationMinutes')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatescriptfolder import AutomateScriptFolder
+from pyconnectwise.models.automate.automatescriptoptions import AutomateScriptOptions
+from pyconnectwise.models.automate.automatescriptstep import AutomateScriptStep
+from pyconnectwise.models.automate.automatescripttarget import AutomateScriptTarget
+from pyconnectwise.models.automate.automateticketentrysettings import AutomateTicketEntrySettings
+from pyconnectwise.models.automate.automatetimeentrysettings import AutomateTimeEntrySettings
+from pyconnectwise.models.automate.automateuserclassaccess import AutomateUserClassAccess
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptAutomationTimeCategoryResponse(ConnectWiseModel):
+    total: AutomateScriptAutomationTimeResult | None = Field(
+        default=None, alias='Total'
+    )
+    system: AutomateScriptAutomationTimeResult | None = Field(
+        default=None, alias='System'
+    )
+    users: AutomateScriptAutomationTimeResult | None = Field(
+        default=None, alias='Users'
+    )
+    maximum_history_days_available: int | None = Field(
+        default=None, alias='MaximumHistoryDaysAvailable'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatescriptautomationtimeresult import AutomateScriptAutomationTimeResult
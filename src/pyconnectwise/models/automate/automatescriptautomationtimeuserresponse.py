@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptAutomationTimeUserResponse(ConnectWiseModel):
+    user_list: list[AutomateScriptAutomationTimeUserResult] | None = Field(
+        default=None, alias='UserList'
+    )
+    maximum_history_days_available: int | None = Field(
+        default=None, alias='MaximumHistoryDaysAvailable'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatescriptautomationtimeuserresult import AutomateScriptAutomationTimeUserResult
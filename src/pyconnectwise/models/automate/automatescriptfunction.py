@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptFunction(ConnectWiseModel):
+    function_id: int | None = Field(default=None, alias='FunctionId')
+    name: str | None = Field(default=None, alias='Name')
+    is_conditional_function: bool | None = Field(
+        default=None, alias='IsConditionalFunction'
+    )
+    description: str | None = Field(default=None, alias='Description')
+    target_type: AutomateScriptFunctionTarget | None = Field(
+        default=None, alias='TargetType'
+    )
+    parameters: list[AutomateScriptFunctionParameter] | None = Field(
+        default=None, alias='Parameters'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatescriptfunctionparameter import AutomateScriptFunctionParameter
+from pyconnectwise.models.automate.automatescriptfunctiontarget import AutomateScriptFunctionTarget
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptFunctionParameter(ConnectWiseModel):
+    name: str | None = Field(default=None, alias='Name')
+    description: str | None = Field(default=None, alias='Description')
+    type: str | None = Field(default=None, alias='Type')
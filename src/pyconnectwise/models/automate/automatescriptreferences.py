@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptReferences(ConnectWiseModel):
+    schedule_count: int | None = Field(default=None, alias='ScheduleCount')
+    internal_monitors: list[AutomateMonitor] | None = Field(
+        default=None, alias='InternalMonitors'
+    )
+    remote_monitors: list[AutomateMonitor] | None = Field(
+        default=None, alias='RemoteMonitors'
+    )
+    alert_templates: list[AutomateAlertTemplate] | None = Field(
+        default=None, alias='AlertTemplates'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatealerttemplate import AutomateAlertTemplate
+from pyconnectwise.models.automate.automatemonitor import AutomateMonitor
@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptScheduleSettings(ConnectWiseModel):
+    script_schedule_frequency: AutomateScriptScheduleFrequency | None = Field(
+        default=None, alias='ScriptScheduleFrequency'
+    )
+    minutely_settings: AutomateMinutelyScheduleFrequency | None = Field(
+        default=None, alias='MinutelySettings'
+    )
+    hourly_settings: AutomateHourlyScheduleFrequency | None = Field(
+        default=None, alias='HourlySettings'
+    )
+    daily_settings: AutomateDailyScheduleFrequency | None = Field(
+        default=None, alias='DailySettings'
+    )
+    weekly_settings: AutomateWeeklyScheduleFrequency | None = Field(
+        default=None, alias='WeeklySettings'
+    )
+    monthly_settings: AutomateMonthlyScheduleFrequency | None = Field(
+        default=None, alias='MonthlySettings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedailyschedulefrequency import AutomateDailyScheduleFrequency
+from pyconnectwise.models.automate.automatehourlyschedulefrequency import AutomateHourlyScheduleFrequency
+from pyconnectwise.models.automate.automateminutelyschedulefrequency import AutomateMinutelyScheduleFrequency
+from pyconnectwise.models.automate.automatemonthlyschedulefrequency import AutomateMonthlyScheduleFrequency
+from pyconnectwise.models.automate.automatescriptschedulefrequency import AutomateScriptScheduleFrequency
+from pyconnectwise.models.automate.automateweeklyschedulefrequency import AutomateWeeklyScheduleFrequency
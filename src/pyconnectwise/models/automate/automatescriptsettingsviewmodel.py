@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptSettingsViewModel(ConnectWiseModel):
+    user_classes: list[AutomateUserClass] | None = Field(
+        default=None, alias='UserClasses'
+    )
+    ticket_categories: list[AutomateTicketEntryCategory] | None = Field(
+        default=None, alias='TicketCategories'
+    )
+    close_ticket_triggers: list[AutomateCloseTicketTrigger] | None = Field(
+        default=None, alias='CloseTicketTriggers'
+    )
+    users: list[AutomateTimeEntryTechnician] | None = Field(default=None, alias='Users')
+    stop_timer_triggers: list[AutomateStopTimerTrigger] | None = Field(
+        default=None, alias='StopTimerTriggers'
+    )
+    ticket_time_categories: list[AutomateTimeEntryCategory] | None = Field(
+        default=None, alias='TicketTimeCategories'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclosetickettrigger import AutomateCloseTicketTrigger
+from pyconnectwise.models.automate.automatestoptimertrigger import AutomateStopTimerTrigger
+from pyconnectwise.models.automate.automateticketentrycategory import AutomateTicketEntryCategory
+from pyconnectwise.models.automate.automatetimeentrycategory import AutomateTimeEntryCategory
+from pyconnectwise.models.automate.automatetimeentrytechnician import AutomateTimeEntryTechnician
+from pyconnectwise.models.automate.automateuserclass import AutomateUserClass
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptSource(ConnectWiseModel):
+    source_type: AutomateSourceType | None = Field(default=None, alias='SourceType')
+    name: str | None = Field(default=None, alias='Name')
+    alternative_name: str | None = Field(default=None, alias='AlternativeName')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatesourcetype import AutomateSourceType
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptStep(ConnectWiseModel):
+    operating_system: int | None = Field(default=None, alias='OperatingSystem')
+    is_enabled: bool | None = Field(default=None, alias='IsEnabled')
+    should_continue_on_failure: bool | None = Field(
+        default=None, alias='ShouldContinueOnFailure'
+    )
+    indentation_level: int | None = Field(default=None, alias='IndentationLevel')
+    function: AutomateScriptFunctionBase | None = Field(default=None, alias='Function')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatescriptfunctionbase import AutomateScriptFunctionBase
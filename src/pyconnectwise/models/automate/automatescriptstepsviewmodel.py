@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptStepsViewModel(ConnectWiseModel):
+    disallowed_script_function_ids: list[int] | None = Field(
+        default=None, alias='DisallowedScriptFunctionIds'
+    )
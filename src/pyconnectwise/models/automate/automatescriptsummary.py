@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptSummary(ConnectWiseModel):
+    name: str | None = Field(default=None, alias='Name')
+    description: str | None = Field(default=None, alias='Description')
+    folder: AutomateScriptFolder | None = Field(default=None, alias='Folder')
+    script_target_type: AutomateScriptTarget | None = Field(
+        default=None, alias='ScriptTargetType'
+    )
+    script_options: AutomateScriptOptions | None = Field(
+        default=None, alias='ScriptOptions'
+    )
+    automation_minutes: int | None = Field(default=None, alias='AutomationMinutes')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatescriptfolder import AutomateScriptFolder
+from pyconnectwise.models.automate.automatescriptoptions import AutomateScriptOptions
+from pyconnectwise.models.automate.automatescripttarget import AutomateScriptTarget
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSearch(ConnectWiseModel):
+    search_id: int | None = Field(default=None, alias='SearchId')
+    name: str | None = Field(default=None, alias='Name')
+    folder_name: str | None = Field(default=None, alias='FolderName')
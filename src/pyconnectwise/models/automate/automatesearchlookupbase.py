@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSearchLookUpBase(ConnectWiseModel):
+    search_node: str | None = Field(default=None, alias='SearchNode')
+    is_leaf_node: bool | None = Field(default=None, alias='IsLeafNode')
+    child_nodes: list[AutomateSearchLookUpBase] | None = Field(
+        default=None, alias='ChildNodes'
+    )
+    attributes: AutomateSearchAttributes | None = Field(
+        default=None, alias='Attributes'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatesearchattributes import AutomateSearchAttributes
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSearchSettings(ConnectWiseModel):
+    auto_join_search_id: int | None = Field(default=None, alias='AutoJoinSearchId')
+    name: str | None = Field(default=None, alias='Name')
+    is_limited_to_search: bool | None = Field(default=None, alias='IsLimitedToSearch')
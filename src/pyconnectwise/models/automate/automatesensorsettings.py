@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSensorSettings(ConnectWiseModel):
+    sensor_number: int | None = Field(default=None, alias='SensorNumber')
+    sensor_type_id: int | None = Field(default=None, alias='SensorTypeId')
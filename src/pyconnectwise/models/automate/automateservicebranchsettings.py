@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateServiceBranchSettings(ConnectWiseModel):
+    use_service_branch: bool | None = Field(default=None, alias='UseServiceBranch')
+    is_targeted: bool | None = Field(default=None, alias='IsTargeted')
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSessionViewerSettings(ConnectWiseModel):
+    domain: str | None = Field(default=None, alias='Domain')
+    port: int | None = Field(default=None, alias='Port')
+    api_token: str | None = Field(default=None, alias='ApiToken')
+    instance_id: str | None = Field(default=None, alias='InstanceId')
+    extension_id: str | None = Field(default=None, alias='ExtensionId')
+    enable_wcc_element: bool | None = Field(default=None, alias='EnableWccElement')
+    user: AutomateSessionViewerUser | None = Field(default=None, alias='User')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatesessionvieweruser import AutomateSessionViewerUser
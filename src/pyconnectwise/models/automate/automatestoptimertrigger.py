@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateStopTimerTrigger(ConnectWiseModel):
+    stop_timer_trigger_type_id: int | None = Field(
+        default=None, alias='StopTimerTriggerTypeId'
+    )
+    name: str | None = Field(default=None, alias='Name')
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSubmittableScriptFolder(ConnectWiseModel):
+    script_folder_id: int | None = Field(default=None, alias='ScriptFolderId')
+    name: str | None = Field(default=None, alias='Name')
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSystemWorkflowProgressEntry(ConnectWiseModel):
+    system_workflow_progress_id: int | None = Field(
+        default=None, alias='SystemWorkflowProgressId'
+    )
+    description: str | None = Field(default=None, alias='Description')
+    workflow_step: AutomateWorkflowStep | None = Field(
+        default=None, alias='WorkflowStep'
+    )
+    workflow_status: AutomateWorkflowStatus | None = Field(
+        default=None, alias='WorkflowStatus'
+    )
+    workflow_metadata: list[AutomateWorkflowMetadata] | None = Field(
+        default=None, alias='WorkflowMetadata'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateworkflowmetadata import AutomateWorkflowMetadata
+from pyconnectwise.models.automate.automateworkflowstatus import AutomateWorkflowStatus
+from pyconnectwise.models.automate.automateworkflowstep import AutomateWorkflowStep
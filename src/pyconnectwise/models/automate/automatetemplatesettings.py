@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTemplateSettings(ConnectWiseModel):
+    remote_agent_template: AutomateRemoteAgentTemplate | None = Field(
+        default=None, alias='RemoteAgentTemplate'
+    )
+    priority: int | None = Field(default=None, alias='Priority')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateremoteagenttemplate import AutomateRemoteAgentTemplate
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTextFieldSettings(ConnectWiseModel):
+    is_masked: bool | None = Field(default=None, alias='IsMasked')
+    value: str | None = Field(default=None, alias='Value')
+    default_value: str | None = Field(default=None, alias='DefaultValue')
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateThirdPartyPatchesSummaryData(ConnectWiseModel):
+    third_party_compliance_score: float | None = Field(
+        default=None, alias='ThirdPartyComplianceScore'
+    )
+    third_party_server_compliance_score: float | None = Field(
+        default=None, alias='ThirdPartyServerComplianceScore'
+    )
+    third_party_workstation_compliance_score: float | None = Field(
+        default=None, alias='ThirdPartyWorkstationComplianceScore'
+    )
+    devices_affecting_compliance_count: int | None = Field(
+        default=None, alias='DevicesAffectingComplianceCount'
+    )
+    servers_affecting_compliance_count: int | None = Field(
+        default=None, alias='ServersAffectingComplianceCount'
+    )
+    workstations_affecting_compliance_count: int | None = Field(
+        default=None, alias='WorkstationsAffectingComplianceCount'
+    )
+    approved_count: int | None = Field(default=None, alias='ApprovedCount')
+    compliant_count: int | None = Field(default=None, alias='CompliantCount')
+    failed_count: int | None = Field(default=None, alias='FailedCount')
+    incorrect_version_count: int | None = Field(
+        default=None, alias='IncorrectVersionCount'
+    )
+    non_compliant_count: int | None = Field(default=None, alias='NonCompliantCount')
+    not_attempted_count: int | None = Field(default=None, alias='NotAttemptedCount')
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateThirdPartyUpdatePolicy(ConnectWiseModel):
+    policy_id: int | None = Field(default=None, alias='PolicyId')
+    policy_name: str | None = Field(default=None, alias='PolicyName')
+    patching_policy_schedule: AutomatePatchingPolicySchedule | None = Field(
+        default=None, alias='PatchingPolicySchedule'
+    )
+    workstation_options: AutomatePatchingPolicyWorkstationOptions | None = Field(
+        default=None, alias='WorkstationOptions'
+    )
+    script_options: AutomatePatchingPolicyScriptOptions | None = Field(
+        default=None, alias='ScriptOptions'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatepatchingpolicyschedule import AutomatePatchingPolicySchedule
+from pyconnectwise.models.automate.automatepatchingpolicyscriptoptions import AutomatePatchingPolicyScriptOptions
+from pyconnectwise.models.automate.automatepatchingpolicyworkstationoptions import AutomatePatchingPolicyWorkstationOptions
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTicketEntrySettings(ConnectWiseModel):
+    ticket_subject: str | None = Field(default=None, alias='TicketSubject')
+    ticket_requestor: str | None = Field(default=None, alias='TicketRequestor')
+    ticket_category: AutomateTicketEntryCategory | None = Field(
+        default=None, alias='TicketCategory'
+    )
+    close_ticket_trigger: AutomateCloseTicketTrigger | None = Field(
+        default=None, alias='CloseTicketTrigger'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclosetickettrigger import AutomateCloseTicketTrigger
+from pyconnectwise.models.automate.automateticketentrycategory import AutomateTicketEntryCategory
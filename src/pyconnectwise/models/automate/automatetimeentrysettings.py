@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTimeEntrySettings(ConnectWiseModel):
+    ticket_id: str | None = Field(default=None, alias='TicketId')
+    minutes_to_log: str | None = Field(default=None, alias='MinutesToLog')
+    time_category: AutomateTimeEntryCategory | None = Field(
+        default=None, alias='TimeCategory'
+    )
+    stop_timer_trigger: AutomateStopTimerTrigger | None = Field(
+        default=None, alias='StopTimerTrigger'
+    )
+    notes: str | None = Field(default=None, alias='Notes')
+    technician: AutomateTimeEntryTechnician | None = Field(
+        default=None, alias='Technician'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatestoptimertrigger import AutomateStopTimerTrigger
+from pyconnectwise.models.automate.automatetimeentrycategory import AutomateTimeEntryCategory
+from pyconnectwise.models.automate.automatetimeentrytechnician import AutomateTimeEntryTechnician
@@ -0,0 +1,69 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUser(ConnectWiseModel):
+    user_id: int | None = Field(default=None, alias='UserId')
+    name: str | None = Field(default=None, alias='Name')
+    first_name: str | None = Field(default=None, alias='FirstName')
+    last_name: str | None = Field(default=None, alias='LastName')
+    last_successful_login: datetime | None = Field(
+        default=None, alias='LastSuccessfulLogin'
+    )
+    password: str | None = Field(default=None, alias='Password')
+    folder: AutomateUserFolder | None = Field(default=None, alias='Folder')
+    email_address: str | None = Field(default=None, alias='EmailAddress')
+    auditing_level: int | None = Field(default=None, alias='AuditingLevel')
+    command_level: int | None = Field(default=None, alias='CommandLevel')
+    uses_ticket_based_security: bool | None = Field(
+        default=None, alias='UsesTicketBasedSecurity'
+    )
+    new_ticket_display_limit: int | None = Field(
+        default=None, alias='NewTicketDisplayLimit'
+    )
+    open_ticket_limit: int | None = Field(default=None, alias='OpenTicketLimit')
+    is_integrator: bool | None = Field(default=None, alias='IsIntegrator')
+    is_locked: bool | None = Field(default=None, alias='IsLocked')
+    is_ticket_router: bool | None = Field(default=None, alias='IsTicketRouter')
+    is_ticket_supervisor: bool | None = Field(default=None, alias='IsTicketSupervisor')
+    ticket_level: AutomateTicketLevel | None = Field(default=None, alias='TicketLevel')
+    requires_login_report: bool | None = Field(
+        default=None, alias='RequiresLoginReport'
+    )
+    requires_logout_report: bool | None = Field(
+        default=None, alias='RequiresLogoutReport'
+    )
+    last_updated: datetime | None = Field(default=None, alias='LastUpdated')
+    primary_clients: list[AutomateClient] | None = Field(
+        default=None, alias='PrimaryClients'
+    )
+    user_classes: list[AutomateUserClass] | None = Field(
+        default=None, alias='UserClasses'
+    )
+    associated_groups: list[AutomateGroup] | None = Field(
+        default=None, alias='AssociatedGroups'
+    )
+    sso_status: AutomateUserSingleSignOnStatus | None = Field(
+        default=None, alias='SsoStatus'
+    )
+    sso_email: str | None = Field(default=None, alias='SsoEmail')
+    allow_legacy_api_access: bool | None = Field(
+        default=None, alias='AllowLegacyApiAccess'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateclient import AutomateClient
+from pyconnectwise.models.automate.automategroup import AutomateGroup
+from pyconnectwise.models.automate.automateticketlevel import AutomateTicketLevel
+from pyconnectwise.models.automate.automateuserclass import AutomateUserClass
+from pyconnectwise.models.automate.automateuserfolder import AutomateUserFolder
+from pyconnectwise.models.automate.automateusersinglesignonstatus import AutomateUserSingleSignOnStatus
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserAccess(ConnectWiseModel):
+    user_id: int | None = Field(default=None, alias='UserId')
+    user_permissions: list[str] | None = Field(default=None, alias='UserPermissions')
+    plugin_permissions: list[AutomateUserBinaryExtensionPermission] | None = Field(
+        default=None, alias='PluginPermissions'
+    )
+    web_extension_claims: list[AutomateUserExtensionClaimType] | None = Field(
+        default=None, alias='WebExtensionClaims'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateuserbinaryextensionpermission import AutomateUserBinaryExtensionPermission
+from pyconnectwise.models.automate.automateuserextensionclaimtype import AutomateUserExtensionClaimType
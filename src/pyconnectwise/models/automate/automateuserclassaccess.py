@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserClassAccess(ConnectWiseModel):
+    user_class_id: int | None = Field(default=None, alias='UserClassId')
+    name: str | None = Field(default=None, alias='Name')
+    can_execute: bool | None = Field(default=None, alias='CanExecute')
+    can_edit: bool | None = Field(default=None, alias='CanEdit')
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserClassWebExtensionRequest(ConnectWiseModel):
+    assigned_extensions: list[AutomateAssignedWebExtension] | None = Field(
+        default=None, alias='AssignedExtensions'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateassignedwebextension import AutomateAssignedWebExtension
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserFolder(ConnectWiseModel):
+    user_folder_id: int | None = Field(default=None, alias='UserFolderId')
+    name: str | None = Field(default=None, alias='Name')
+    is_sso_enabled: bool | None = Field(default=None, alias='IsSsoEnabled')
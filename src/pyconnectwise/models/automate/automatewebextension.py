@@ -0,0 +1,62 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtension(ConnectWiseModel):
+    web_extension_id: int | None = Field(default=None, alias='WebExtensionId')
+    extension_solution: AutomateExtensionSolution | None = Field(
+        default=None, alias='ExtensionSolution'
+    )
+    extension_status: AutomateExtensionStatus | None = Field(
+        default=None, alias='ExtensionStatus'
+    )
+    web_extension_guid: UUID | None = Field(
+        default=None,
+        alias='WebExtensionGuid',
+        example='00000000-0000-0000-0000-000000000000',
+    )
+    web_extension_name: str | None = Field(default=None, alias='WebExtensionName')
+    author: str | None = Field(default=None, alias='Author')
+    description: str | None = Field(default=None, alias='Description')
+    version: str | None = Field(default=None, alias='Version')
+    file_url: str | None = Field(default=None, alias='FileUrl')
+    filename: str | None = Field(default=None, alias='Filename')
+    file_check_sum: str | None = Field(default=None, alias='FileCheckSum')
+    has_static_files: bool | None = Field(default=None, alias='HasStaticFiles')
+    has_graph_files: bool | None = Field(default=None, alias='HasGraphFiles')
+    is_core_extension: bool | None = Field(default=None, alias='IsCoreExtension')
+    extension_claim_types: list[AutomateExtensionClaimType] | None = Field(
+        default=None, alias='ExtensionClaimTypes'
+    )
+    redirects: list[AutomateWebExtensionRedirect] | None = Field(
+        default=None, alias='Redirects'
+    )
+    tiles: list[AutomateWebExtensionTile] | None = Field(default=None, alias='Tiles')
+    inline_frames: list[AutomateWebExtensionInlineFrame] | None = Field(
+        default=None, alias='InlineFrames'
+    )
+    menu_buttons: list[AutomateWebExtensionMenuButton] | None = Field(
+        default=None, alias='MenuButtons'
+    )
+    click_buttons: list[AutomateWebExtensionClickButton] | None = Field(
+        default=None, alias='ClickButtons'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateextensionclaimtype import AutomateExtensionClaimType
+from pyconnectwise.models.automate.automateextensionsolution import AutomateExtensionSolution
+from pyconnectwise.models.automate.automateextensionstatus import AutomateExtensionStatus
+from pyconnectwise.models.automate.automatewebextensionclickbutton import AutomateWebExtensionClickButton
+from pyconnectwise.models.automate.automatewebextensioninlineframe import AutomateWebExtensionInlineFrame
+from pyconnectwise.models.automate.automatewebextensionmenubutton import AutomateWebExtensionMenuButton
+from pyconnectwise.models.automate.automatewebextensionredirect import AutomateWebExtensionRedirect
+from pyconnectwise.models.automate.automatewebextensiontile import AutomateWebExtensionTile
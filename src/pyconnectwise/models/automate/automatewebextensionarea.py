@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionArea(ConnectWiseModel):
+    web_extension_area_id: int | None = Field(default=None, alias='WebExtensionAreaId')
+    web_extension_area_name: str | None = Field(
+        default=None, alias='WebExtensionAreaName'
+    )
+    web_extension_screen_id: int | None = Field(
+        default=None, alias='WebExtensionScreenId'
+    )
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionAreaControls(ConnectWiseModel):
+    web_extension_area: AutomateWebExtensionArea | None = Field(
+        default=None, alias='WebExtensionArea'
+    )
+    click_buttons: list[AutomateWebExtensionClickButton] | None = Field(
+        default=None, alias='ClickButtons'
+    )
+    menu_buttons: list[AutomateWebExtensionMenuButton] | None = Field(
+        default=None, alias='MenuButtons'
+    )
+    tiles: list[AutomateWebExtensionTile] | None = Field(default=None, alias='Tiles')
+    redirects: list[AutomateWebExtensionRedirect] | None = Field(
+        default=None, alias='Redirects'
+    )
+    inline_frames: list[AutomateWebExtensionInlineFrame] | None = Field(
+        default=None, alias='InlineFrames'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatewebextensionarea import AutomateWebExtensionArea
+from pyconnectwise.models.automate.automatewebextensionclickbutton import AutomateWebExtensionClickButton
+from pyconnectwise.models.automate.automatewebextensioninlineframe import AutomateWebExtensionInlineFrame
+from pyconnectwise.models.automate.automatewebextensionmenubutton import AutomateWebExtensionMenuButton
+from pyconnectwise.models.automate.automatewebextensionredirect import AutomateWebExtensionRedirect
+from pyconnectwise.models.automate.automatewebextensiontile import AutomateWebExtensionTile
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionMenuItem(ConnectWiseModel):
+    web_extension_menu_item_id: int | None = Field(
+        default=None, alias='WebExtensionMenuItemId'
+    )
+    web_extension_menu_item_parent_id: int | None = Field(
+        default=None, alias='WebExtensionMenuItemParentId'
+    )
+    menu_text: str | None = Field(default=None, alias='MenuText')
+    click_action: AutomateWebExtensionClickAction | None = Field(
+        default=None, alias='ClickAction'
+    )
+    menu_items: list[AutomateWebExtensionMenuItem] | None = Field(
+        default=None, alias='MenuItems'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatewebextensionclickaction import AutomateWebExtensionClickAction
@@ -0,0 +1,50 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionTile(ConnectWiseModel):
+    tile_guid: UUID | None = Field(
+        default=None, alias='TileGuid', example='00000000-0000-0000-0000-000000000000'
+    )
+    normal_tile_source_url: str | None = Field(
+        default=None, alias='NormalTileSourceUrl'
+    )
+    normal_tile_header_url: str | None = Field(
+        default=None, alias='NormalTileHeaderUrl'
+    )
+    max_tile_source_url: str | None = Field(default=None, alias='MaxTileSourceUrl')
+    tile_title: str | None = Field(default=None, alias='TileTitle')
+    tile_size: AutomateWebExtensionTileSize | None = Field(
+        default=None, alias='TileSize'
+    )
+    web_extension_control_id: int | None = Field(
+        default=None, alias='WebExtensionControlId'
+    )
+    web_extension_control_name: str | None = Field(
+        default=None, alias='WebExtensionControlName'
+    )
+    web_extension_guid: UUID | None = Field(
+        default=None,
+        alias='WebExtensionGuid',
+        example='00000000-0000-0000-0000-000000000000',
+    )
+    extension_claim_type: AutomateExtensionClaimType | None = Field(
+        default=None, alias='ExtensionClaimType'
+    )
+    is_core_extension: bool | None = Field(default=None, alias='IsCoreExtension')
+    web_extension_area_control_type_ids: list[int] | None = Field(
+        default=None, alias='WebExtensionAreaControlTypeIds'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateextensionclaimtype import AutomateExtensionClaimType
+from pyconnectwise.models.automate.automatewebextensiontilesize import AutomateWebExtensionTileSize
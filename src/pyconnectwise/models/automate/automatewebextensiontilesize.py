@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionTileSize(ConnectWiseModel):
+    tile_size_id: int | None = Field(default=None, alias='TileSizeId')
+    description: str | None = Field(default=None, alias='Description')
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWeeklyScheduleFrequency(ConnectWiseModel):
+    runs_at: str | None = Field(default=None, alias='RunsAt')
+    weeks_of_month_settings: AutomateWeeksOfMonthSettings | None = Field(
+        default=None, alias='WeeksOfMonthSettings'
+    )
+    days_of_week_settings: AutomateDaysOfWeekSettings | None = Field(
+        default=None, alias='DaysOfWeekSettings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatedaysofweeksettings import AutomateDaysOfWeekSettings
+from pyconnectwise.models.automate.automateweeksofmonthsettings import AutomateWeeksOfMonthSettings
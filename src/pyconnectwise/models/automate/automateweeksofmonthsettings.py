@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWeeksOfMonthSettings(ConnectWiseModel):
+    first: bool | None = Field(default=None, alias='First')
+    second: bool | None = Field(default=None, alias='Second')
+    third: bool | None = Field(default=None, alias='Third')
+    fourth: bool | None = Field(default=None, alias='Fourth')
+    last: bool | None = Field(default=None, alias='Last')
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWindows10UpdatePolicySettings(ConnectWiseModel):
+    service_branch: str | None = Field(default=None, alias='ServiceBranch')
+    feature_update_deferment: int | None = Field(
+        default=None, alias='FeatureUpdateDeferment'
+    )
+    quality_update_deferment: int | None = Field(
+        default=None, alias='QualityUpdateDeferment'
+    )
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWindowsApprovalPolicyPatch(ConnectWiseModel):
+    approval_action_id: int | None = Field(default=None, alias='ApprovalActionId')
+    hotfix_id: UUID | None = Field(
+        default=None, alias='HotfixId', example='00000000-0000-0000-0000-000000000000'
+    )
+    operating_system: str | None = Field(default=None, alias='OperatingSystem')
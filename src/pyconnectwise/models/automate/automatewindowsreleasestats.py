@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWindowsReleaseStats(ConnectWiseModel):
+    release_id: int | None = Field(default=None, alias='ReleaseId')
+    release_count: int | None = Field(default=None, alias='ReleaseCount')
@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWindowsServiceBranchStats(ConnectWiseModel):
+    server_release_counts: list[AutomateWindowsReleaseStats] | None = Field(
+        default=None, alias='ServerReleaseCounts'
+    )
+    server_no_channel_count: int | None = Field(
+        default=None, alias='ServerNoChannelCount'
+    )
+    server_semi_annual_channel_count: int | None = Field(
+        default=None, alias='ServerSemiAnnualChannelCount'
+    )
+    server_semi_annual_channel_targeted_count: int | None = Field(
+        default=None, alias='ServerSemiAnnualChannelTargetedCount'
+    )
+    workstation_release_counts: list[AutomateWindowsReleaseStats] | None = Field(
+        default=None, alias='WorkstationReleaseCounts'
+    )
+    workstation_no_channel_count: int | None = Field(
+        default=None, alias='WorkstationNoChannelCount'
+    )
+    workstation_semi_annual_channel_count: int | None = Field(
+        default=None, alias='WorkstationSemiAnnualChannelCount'
+    )
+    workstation_semi_annual_channel_targeted_count: int | None = Field(
+        default=None, alias='WorkstationSemiAnnualChannelTargetedCount'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automatewindowsreleasestats import AutomateWindowsReleaseStats
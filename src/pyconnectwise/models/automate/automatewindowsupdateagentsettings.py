@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWindowsUpdateAgentSettings(ConnectWiseModel):
+    use_windows_update_agent_mode: bool | None = Field(
+        default=None, alias='UseWindowsUpdateAgentMode'
+    )
+    mode: str | None = Field(default=None, alias='Mode')
+    disable_user_interface: bool | None = Field(
+        default=None, alias='DisableUserInterface'
+    )
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWorkflowMetadata(ConnectWiseModel):
+    system_workflow_progress_metadata_id: int | None = Field(
+        default=None, alias='SystemWorkflowProgressMetadataId'
+    )
+    metadata_key: str | None = Field(default=None, alias='MetadataKey')
+    metadata_value: str | None = Field(default=None, alias='MetadataValue')
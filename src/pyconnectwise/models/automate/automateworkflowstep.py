@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWorkflowStep(ConnectWiseModel):
+    workflow_step_id: int | None = Field(default=None, alias='WorkflowStepId')
+    description: str | None = Field(default=None, alias='Description')
+    is_required: bool | None = Field(default=None, alias='IsRequired')
+    prerequisite_id: int | None = Field(default=None, alias='PrerequisiteId')
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechAgentDeploymentReadinessCheck(ConnectWiseModel):
+    agent_deployment_readiness_check_id: int | None = Field(
+        default=None, alias='AgentDeploymentReadinessCheckId'
+    )
+    network_device_id: int | None = Field(default=None, alias='NetworkDeviceId')
+    agent_deployment_readiness_check_status_id: int | None = Field(
+        default=None, alias='AgentDeploymentReadinessCheckStatusId'
+    )
+    readiness_check_status: str | None = Field(
+        default=None, alias='ReadinessCheckStatus'
+    )
+    deployment_attempt_count: int | None = Field(
+        default=None, alias='DeploymentAttemptCount'
+    )
+    date_last_checked_for_readiness: datetime | None = Field(
+        default=None, alias='DateLastCheckedForReadiness'
+    )
+    date_last_deployment_attempted: datetime | None = Field(
+        default=None, alias='DateLastDeploymentAttempted'
+    )
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechAlertAction(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    name: str | None = Field(default=None, alias='Name')
+    comment: str | None = Field(default=None, alias='Comment')
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechAVTemplatePolicy(ConnectWiseModel):
+    template_policy_id: str | None = Field(default=None, alias='TemplatePolicyId')
+    name: str | None = Field(default=None, alias='Name')
+    description: str | None = Field(default=None, alias='Description')
+    guid: str | None = Field(default=None, alias='GUID')
@@ -0,0 +1,57 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechCacheControl(ConnectWiseModel):
+    cache_id: str | None = Field(default=None, alias='CacheId')
+    custom_commands: datetime | None = Field(default=None, alias='CustomCommands')
+    custom_menus: datetime | None = Field(default=None, alias='CustomMenus')
+    huds: datetime | None = Field(default=None, alias='Huds')
+    apps: datetime | None = Field(default=None, alias='Apps')
+    user_folders: datetime | None = Field(default=None, alias='UserFolders')
+    users: datetime | None = Field(default=None, alias='Users')
+    schedules: datetime | None = Field(default=None, alias='Schedules')
+    templates: datetime | None = Field(default=None, alias='Templates')
+    data_view_folders: datetime | None = Field(default=None, alias='DataViewFolders')
+    dataviews: datetime | None = Field(default=None, alias='Dataviews')
+    report_folders: datetime | None = Field(default=None, alias='ReportFolders')
+    reports: datetime | None = Field(default=None, alias='Reports')
+    links: datetime | None = Field(default=None, alias='Links')
+    script_folders: datetime | None = Field(default=None, alias='ScriptFolders')
+    scripts: datetime | None = Field(default=None, alias='Scripts')
+    sensor_checks: datetime | None = Field(default=None, alias='SensorChecks')
+    audit_actions: datetime | None = Field(default=None, alias='AuditActions')
+    remote_commands: datetime | None = Field(default=None, alias='RemoteCommands')
+    contacts: datetime | None = Field(default=None, alias='Contacts')
+    time_category: datetime | None = Field(default=None, alias='TimeCategory')
+    ticket_data: datetime | None = Field(default=None, alias='TicketData')
+    ticket_category: datetime | None = Field(default=None, alias='TicketCategory')
+    functions: datetime | None = Field(default=None, alias='Functions')
+    redirectors: datetime | None = Field(default=None, alias='Redirectors')
+    virus_scanners: datetime | None = Field(default=None, alias='VirusScanners')
+    control_center_config: datetime | None = Field(
+        default=None, alias='ControlCenterConfig'
+    )
+    properties: datetime | None = Field(default=None, alias='Properties')
+    config: datetime | None = Field(default=None, alias='Config')
+    regions: datetime | None = Field(default=None, alias='Regions')
+    config_outlook: datetime | None = Field(default=None, alias='ConfigOutlook')
+    computers: datetime | None = Field(default=None, alias='Computers')
+    locations: datetime | None = Field(default=None, alias='Locations')
+    clients: datetime | None = Field(default=None, alias='Clients')
+    groups: datetime | None = Field(default=None, alias='Groups')
+    agents: datetime | None = Field(default=None, alias='Agents')
+    permissions: datetime | None = Field(default=None, alias='Permissions')
+    write_config_control: datetime | None = Field(
+        default=None, alias='WriteConfigControl'
+    )
+    alert_templates: datetime | None = Field(default=None, alias='AlertTemplates')
+    role_definitions: datetime | None = Field(default=None, alias='RoleDefinitions')
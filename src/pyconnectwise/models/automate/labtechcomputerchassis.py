@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerChassis(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    manufacturer: str | None = Field(default=None, alias='Manufacturer')
+    product_name: str | None = Field(default=None, alias='ProductName')
+    version: str | None = Field(default=None, alias='Version')
+    serial_number: str | None = Field(default=None, alias='SerialNumber')
+    uuid: str | None = Field(default=None, alias='UUID')
+    sku_number: str | None = Field(default=None, alias='SkuNumber')
+    family: str | None = Field(default=None, alias='Family')
+    chassis_type: str | None = Field(default=None, alias='ChassisType')
+    chassis_lock: bool | None = Field(default=None, alias='ChassisLock')
+    asset_tag: str | None = Field(default=None, alias='AssetTag')
+    height_units: int | None = Field(default=None, alias='HeightUnits')
+    system_boot_state: int | None = Field(default=None, alias='SystemBootState')
+    power_supply_boot_state: int | None = Field(
+        default=None, alias='PowerSupplyBootState'
+    )
+    thermal_boot_state: int | None = Field(default=None, alias='ThermalBootState')
+    main_board_product: str | None = Field(default=None, alias='MainBoardProduct')
+    main_board_serial_number: str | None = Field(
+        default=None, alias='MainBoardSerialNumber'
+    )
+    main_board_version: str | None = Field(default=None, alias='MainBoardVersion')
+    main_board_manufacturer: str | None = Field(
+        default=None, alias='MainBoardManufacturer'
+    )
+    last_update: datetime | None = Field(default=None, alias='LastUpdate')
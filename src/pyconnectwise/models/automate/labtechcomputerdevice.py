@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerDevice(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    pnp_device_id: str | None = Field(default=None, alias='PnpDeviceId')
+    device_name: str | None = Field(default=None, alias='DeviceName')
+    device_type: str | None = Field(default=None, alias='DeviceType')
+    driver_version: str | None = Field(default=None, alias='DriverVersion')
+    driver_date: datetime | None = Field(default=None, alias='DriverDate')
+    driver_name: str | None = Field(default=None, alias='DriverName')
+    driver_file: str | None = Field(default=None, alias='DriverFile')
+    manufacturer: str | None = Field(default=None, alias='Manufacturer')
+    update_date: datetime | None = Field(default=None, alias='UpdateDate')
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerDriver(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    name: str | None = Field(default=None, alias='Name')
+    description: str | None = Field(default=None, alias='Description')
+    state: str | None = Field(default=None, alias='State')
+    startup: str | None = Field(default=None, alias='Startup')
+    path_name: str | None = Field(default=None, alias='PathName')
+    service_type: str | None = Field(default=None, alias='ServiceType')
+    username: str | None = Field(default=None, alias='Username')
+    date_last_inventoried: datetime | None = Field(
+        default=None, alias='DateLastInventoried'
+    )
+    run_levels: str | None = Field(default=None, alias='RunLevels')
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerEffectivePatchingPolicy(ConnectWiseModel):
+    approval_policy_count: int | None = Field(default=None, alias='ApprovalPolicyCount')
+    microsoft_update_policy_name: str | None = Field(
+        default=None, alias='MicrosoftUpdatePolicyName'
+    )
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    reboot_policy_name: str | None = Field(default=None, alias='RebootPolicyName')
+    third_party_update_policy_name: str | None = Field(
+        default=None, alias='ThirdPartyUpdatePolicyName'
+    )
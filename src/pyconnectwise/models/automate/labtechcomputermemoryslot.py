@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerMemorySlot(ConnectWiseModel):
+    slot_handle: int | None = Field(default=None, alias='SlotHandle')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    slot_name: str | None = Field(default=None, alias='SlotName')
+    bank: str | None = Field(default=None, alias='Bank')
+    form_factor: LabTechMemoryFormFactor | None = Field(
+        default=None, alias='FormFactor'
+    )
+    total_width: int | None = Field(default=None, alias='TotalWidth')
+    data_width: int | None = Field(default=None, alias='DataWidth')
+    size: int | None = Field(default=None, alias='Size')
+    type: LabTechMemoryType | None = Field(default=None, alias='Type')
+    speed: int | None = Field(default=None, alias='Speed')
+    manufacturer: str | None = Field(default=None, alias='Manufacturer')
+    serial_number: str | None = Field(default=None, alias='SerialNumber')
+    part_number: str | None = Field(default=None, alias='PartNumber')
+    asset_tag: str | None = Field(default=None, alias='AssetTag')
+    update_date: datetime | None = Field(default=None, alias='UpdateDate')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechmemoryformfactor import LabTechMemoryFormFactor
+from pyconnectwise.models.automate.labtechmemorytype import LabTechMemoryType
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerMicrosoftUpdateData(ConnectWiseModel):
+    category: str | None = Field(default=None, alias='Category')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    install_date: datetime | None = Field(default=None, alias='InstallDate')
+    install_state: str | None = Field(default=None, alias='InstallState')
+    is_compliant: bool | None = Field(default=None, alias='IsCompliant')
+    is_failed: bool | None = Field(default=None, alias='IsFailed')
+    is_installed: bool | None = Field(default=None, alias='IsInstalled')
+    is_non_compliant: bool | None = Field(default=None, alias='IsNonCompliant')
+    knowledge_base_id: int | None = Field(default=None, alias='KnowledgeBaseId')
+    microsoft_update_id: str | None = Field(default=None, alias='MicrosoftUpdateId')
+    policy_approval: LabTechPolicyApprovalSetting | None = Field(
+        default=None, alias='PolicyApproval'
+    )
+    release_date: datetime | None = Field(default=None, alias='ReleaseDate')
+    severity: str | None = Field(default=None, alias='Severity')
+    title: str | None = Field(default=None, alias='Title')
+    cvss: float | None = Field(default=None, alias='Cvss')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechpolicyapprovalsetting import LabTechPolicyApprovalSetting
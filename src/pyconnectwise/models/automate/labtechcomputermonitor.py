@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerMonitor(ConnectWiseModel):
+    monitor_id: int | None = Field(default=None, alias='MonitorId')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    device_id: int | None = Field(default=None, alias='DeviceId')
+    name: str | None = Field(default=None, alias='Name')
+    state: str | None = Field(default=None, alias='State')
+    last_scanned: datetime | None = Field(default=None, alias='LastScanned')
+    last_failed: datetime | None = Field(default=None, alias='LastFailed')
+    last_inventory_date: datetime | None = Field(
+        default=None, alias='LastInventoryDate'
+    )
+    alert_action: LabTechAlertAction | None = Field(default=None, alias='AlertAction')
+    monitor_history: LabTechComputerMonitorHistory | None = Field(
+        default=None, alias='MonitorHistory'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechalertaction import LabTechAlertAction
+from pyconnectwise.models.automate.labtechcomputermonitorhistory import LabTechComputerMonitorHistory
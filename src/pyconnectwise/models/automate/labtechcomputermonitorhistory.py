@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerMonitorHistory(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    failure_rate: float | None = Field(default=None, alias='FailureRate')
+    last_success_data: str | None = Field(default=None, alias='LastSuccessData')
+    last_warning_data: str | None = Field(default=None, alias='LastWarningData')
+    last_fail_data: str | None = Field(default=None, alias='LastFailData')
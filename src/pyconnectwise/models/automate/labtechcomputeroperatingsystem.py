@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerOperatingSystem(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    name: str | None = Field(default=None, alias='Name')
+    major_version: int | None = Field(default=None, alias='MajorVersion')
+    minor_version: int | None = Field(default=None, alias='MinorVersion')
+    version: str | None = Field(default=None, alias='Version')
+    dot_net_version: str | None = Field(default=None, alias='DotNetVersion')
+    service_pack: str | None = Field(default=None, alias='ServicePack')
+    service_pack_name: str | None = Field(default=None, alias='ServicePackName')
+    product_type: int | None = Field(default=None, alias='ProductType')
+    suite: int | None = Field(default=None, alias='Suite')
+    product_info: int | None = Field(default=None, alias='ProductInfo')
+    is_licensed: bool | None = Field(default=None, alias='IsLicensed')
+    is_tablet: bool | None = Field(default=None, alias='IsTablet')
+    is_starter: bool | None = Field(default=None, alias='IsStarter')
+    is_media_center: bool | None = Field(default=None, alias='IsMediaCenter')
+    base_folder: str | None = Field(default=None, alias='BaseFolder')
+    system_drive: str | None = Field(default=None, alias='SystemDrive')
+    has_gui: bool | None = Field(default=None, alias='HasGui')
+    is64_bit: bool | None = Field(default=None, alias='Is64Bit')
+    domain: str | None = Field(default=None, alias='Domain')
+    is_domain_controller: bool | None = Field(default=None, alias='IsDomainController')
+    is_server: bool | None = Field(default=None, alias='IsServer')
+    install_date: datetime | None = Field(default=None, alias='InstallDate')
+    date_updated: datetime | None = Field(default=None, alias='DateUpdated')
+    release_id: int | None = Field(default=None, alias='ReleaseId')
+    edition: str | None = Field(default=None, alias='Edition')
+    branch_readiness_level: int | None = Field(
+        default=None, alias='BranchReadinessLevel'
+    )
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerPermissions(ConnectWiseModel):
+    edit_config: bool | None = Field(default=None, alias='EditConfig')
+    edit_info: bool | None = Field(default=None, alias='EditInfo')
+    send_commands: bool | None = Field(default=None, alias='SendCommands')
+    allow_remote_control: bool | None = Field(default=None, alias='AllowRemoteControl')
+    allow_redir: bool | None = Field(default=None, alias='AllowRedir')
+    allow_file_explorer: bool | None = Field(default=None, alias='AllowFileExplorer')
+    allow_registry_edit: bool | None = Field(default=None, alias='AllowRegistryEdit')
+    command_prompt: bool | None = Field(default=None, alias='CommandPrompt')
+    sniff_network: bool | None = Field(default=None, alias='SniffNetwork')
+    install: bool | None = Field(default=None, alias='Install')
+    history: bool | None = Field(default=None, alias='History')
+    view_commands: bool | None = Field(default=None, alias='ViewCommands')
+    monitor_delete: bool | None = Field(default=None, alias='MonitorDelete')
+    monitor_add: bool | None = Field(default=None, alias='MonitorAdd')
+    monitor_edit: bool | None = Field(default=None, alias='MonitorEdit')
+    clear_alerts: bool | None = Field(default=None, alias='ClearAlerts')
+    schedule_scripts: bool | None = Field(default=None, alias='ScheduleScripts')
+    delete_schedule_scripts: bool | None = Field(
+        default=None, alias='DeleteScheduleScripts'
+    )
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerProcessor(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    processor_handle: int | None = Field(default=None, alias='ProcessorHandle')
+    socket: LabTechProcessorSocket | None = Field(default=None, alias='Socket')
+    is_enabled: bool | None = Field(default=None, alias='IsEnabled')
+    family: LabTechProcessorFamily | None = Field(default=None, alias='Family')
+    manufacturer: str | None = Field(default=None, alias='Manufacturer')
+    speed: int | None = Field(default=None, alias='Speed')
+    cache_list: list[LabTechComputerProcessorCache] | None = Field(
+        default=None, alias='CacheList'
+    )
+    serial_number: str | None = Field(default=None, alias='SerialNumber')
+    part_number: str | None = Field(default=None, alias='PartNumber')
+    cores: int | None = Field(default=None, alias='Cores')
+    threads: int | None = Field(default=None, alias='Threads')
+    is64_bit: bool | None = Field(default=None, alias='Is64Bit')
+    dep: bool | None = Field(default=None, alias='DEP')
+    is_virtualized: bool | None = Field(default=None, alias='IsVirtualized')
+    has_power_control: bool | None = Field(default=None, alias='HasPowerControl')
+    has_hardware_thread: bool | None = Field(default=None, alias='HasHardwareThread')
+    processor_name: str | None = Field(default=None, alias='ProcessorName')
+    update_date: datetime | None = Field(default=None, alias='UpdateDate')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechcomputerprocessorcache import LabTechComputerProcessorCache
+from pyconnectwise.models.automate.labtechprocessorfamily import LabTechProcessorFamily
+from pyconnectwise.models.automate.labtechprocessorsocket import LabTechProcessorSocket
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerRunningScript(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    script_id: int | None = Field(default=None, alias='ScriptId')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    name: str | None = Field(default=None, alias='Name')
+    status: Literal['Running', 'Completed'] | None = Field(default=None, alias='Status')
+    start_date: datetime | None = Field(default=None, alias='StartDate')
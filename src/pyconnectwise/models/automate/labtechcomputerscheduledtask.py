@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerScheduledTask(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    name: str | None = Field(default=None, alias='Name')
+    command: str | None = Field(default=None, alias='Command')
+    is_interactive: bool | None = Field(default=None, alias='IsInteractive')
+    start_time: str | None = Field(default=None, alias='StartTime')
+    does_repeat: bool | None = Field(default=None, alias='DoesRepeat')
+    days_of_week: list[str] | None = Field(default=None, alias='DaysOfWeek')
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerSensor(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    sensor_id: int | None = Field(default=None, alias='SensorId')
+    sensor_name: str | None = Field(default=None, alias='SensorName')
+    device_type: LabTechSensorDeviceType | None = Field(
+        default=None, alias='DeviceType'
+    )
+    monitor: str | None = Field(default=None, alias='Monitor')
+    value: float | None = Field(default=None, alias='Value')
+    max_value: float | None = Field(default=None, alias='MaxValue')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechsensordevicetype import LabTechSensorDeviceType
@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerSoftware(ConnectWiseModel):
+    application_id: int | None = Field(default=None, alias='ApplicationId')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    name: str | None = Field(default=None, alias='Name')
+    installation_path: str | None = Field(default=None, alias='InstallationPath')
+    date_installed: datetime | None = Field(default=None, alias='DateInstalled')
+    size: int | None = Field(default=None, alias='Size')
+    uninstaller_path: str | None = Field(default=None, alias='UninstallerPath')
+    version: str | None = Field(default=None, alias='Version')
+    classification: LabTechSoftwareClassification | None = Field(
+        default=None, alias='Classification'
+    )
+    date_last_inventoried: datetime | None = Field(
+        default=None, alias='DateLastInventoried'
+    )
+    client_id: int | None = Field(default=None, alias='ClientId')
+    computer_name: str | None = Field(default=None, alias='ComputerName')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechsoftwareclassification import LabTechSoftwareClassification
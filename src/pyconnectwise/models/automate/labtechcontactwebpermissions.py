@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechContactWebPermissions(ConnectWiseModel):
+    tickets: bool | None = Field(default=None, alias='Tickets')
+    remote_access: bool | None = Field(default=None, alias='RemoteAccess')
+    install_agent: bool | None = Field(default=None, alias='InstallAgent')
+    reboot: bool | None = Field(default=None, alias='Reboot')
+    shutdown: bool | None = Field(default=None, alias='Shutdown')
+    wake_on_lan: bool | None = Field(default=None, alias='WakeOnLAN')
+    multi_factor_required: bool | None = Field(
+        default=None, alias='MultiFactorRequired'
+    )
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechDiscoveryScanSettings(ConnectWiseModel):
+    discovery_scan_frequency: LabTechScanFrequency | None = Field(
+        default=None, alias='DiscoveryScanFrequency'
+    )
+    limit_discovery_to_scan_window: bool | None = Field(
+        default=None, alias='LimitDiscoveryToScanWindow'
+    )
+    discovery_window_start: str | None = Field(
+        default=None, alias='DiscoveryWindowStart'
+    )
+    discovery_window_end: str | None = Field(default=None, alias='DiscoveryWindowEnd')
+    is_mac_addres_scanning_enabled: bool | None = Field(
+        default=None, alias='IsMacAddresScanningEnabled'
+    )
+    concurrent_thread_count: int | None = Field(
+        default=None, alias='ConcurrentThreadCount'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechscanfrequency import LabTechScanFrequency
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechDocument(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    client_id: int | None = Field(default=None, alias='ClientId')
+    name: str | None = Field(default=None, alias='Name')
+    size: int | None = Field(default=None, alias='Size')
+    data: str | None = Field(default=None, alias='Data')
+    last_user: str | None = Field(default=None, alias='LastUser')
+    last_edit_date: datetime | None = Field(default=None, alias='LastEditDate')
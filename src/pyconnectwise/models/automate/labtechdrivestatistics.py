@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechDriveStatistics(ConnectWiseModel):
+    drive_id: int | None = Field(default=None, alias='DriveId')
+    percentage_used_difference: float | None = Field(
+        default=None, alias='PercentageUsedDifference'
+    )
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechEventLog(ConnectWiseModel):
+    blacklist_id: int | None = Field(default=None, alias='BlacklistId')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    event_id: int | None = Field(default=None, alias='EventId')
+    last_date: datetime | None = Field(default=None, alias='LastDate')
+    log_name: str | None = Field(default=None, alias='LogName')
+    log_type: LabTechEventLogType | None = Field(default=None, alias='LogType')
+    message: str | None = Field(default=None, alias='Message')
+    source: str | None = Field(default=None, alias='Source')
+    time_generated: datetime | None = Field(default=None, alias='TimeGenerated')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtecheventlogtype import LabTechEventLogType
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechEventLogQueryEventLevelFilter(ConnectWiseModel):
+    match_verbose: bool | None = Field(default=None, alias='MatchVerbose')
+    match_informational: bool | None = Field(default=None, alias='MatchInformational')
+    match_warning: bool | None = Field(default=None, alias='MatchWarning')
+    match_error: bool | None = Field(default=None, alias='MatchError')
+    match_critical: bool | None = Field(default=None, alias='MatchCritical')
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechEventLogQueryParameters(ConnectWiseModel):
+    log: str | None = Field(default=None, alias='Log')
+    level_filter: LabTechEventLogQueryEventLevelFilter | None = Field(
+        default=None, alias='LevelFilter'
+    )
+    keywords: int | None = Field(default=None, alias='Keywords')
+    source: str | None = Field(default=None, alias='Source')
+    event_id: int | None = Field(default=None, alias='EventId')
+    regular_expression_filter: str | None = Field(
+        default=None, alias='RegularExpressionFilter'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtecheventlogqueryeventlevelfilter import LabTechEventLogQueryEventLevelFilter
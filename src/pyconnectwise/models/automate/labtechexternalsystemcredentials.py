@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechExternalSystemCredentials(ConnectWiseModel):
+    credentials_id: int | None = Field(default=None, alias='CredentialsId')
+    client_id: int | None = Field(default=None, alias='ClientId')
+    title: str | None = Field(default=None, alias='Title')
+    expiration_date: datetime | None = Field(default=None, alias='ExpirationDate')
+    is_active: bool | None = Field(default=None, alias='IsActive')
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechFileOrDirectoryQueryParameters(ConnectWiseModel):
+    directory: str | None = Field(default=None, alias='Directory')
+    file: str | None = Field(default=None, alias='File')
@@ -0,0 +1,81 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechGroup(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    parent_id: str | None = Field(default=None, alias='ParentId')
+    sub_groups: list[int] | None = Field(default=None, alias='SubGroups')
+    parent_groups: list[int] | None = Field(default=None, alias='ParentGroups')
+    parents: list[LabTechGroupPartial] | None = Field(default=None, alias='Parents')
+    depth: int | None = Field(default=None, alias='Depth')
+    name: str | None = Field(default=None, alias='Name')
+    full_name: str | None = Field(default=None, alias='FullName')
+    type_id: int | None = Field(default=None, alias='TypeId')
+    type_name: str | None = Field(default=None, alias='TypeName')
+    template_priority: int | None = Field(default=None, alias='TemplatePriority')
+    guid: str | None = Field(default=None, alias='GUID')
+    computers_auto_join_search: LabTechSearch | None = Field(
+        default=None, alias='ComputersAutoJoinSearch'
+    )
+    network_devices_auto_join_search: LabTechSearch | None = Field(
+        default=None, alias='NetworkDevicesAutoJoinSearch'
+    )
+    contacts_auto_join_search: LabTechSearch | None = Field(
+        default=None, alias='ContactsAutoJoinSearch'
+    )
+    maintenance_window: LabTechMaintenanceWindow | None = Field(
+        default=None, alias='MaintenanceWindow'
+    )
+    maintenance_window_last_applied: datetime | None = Field(
+        default=None, alias='MaintenanceWindowLastApplied'
+    )
+    computers_limit_to_search: bool | None = Field(
+        default=None, alias='ComputersLimitToSearch'
+    )
+    network_devices_limit_to_search: bool | None = Field(
+        default=None, alias='NetworkDevicesLimitToSearch'
+    )
+    contacts_limit_to_search: bool | None = Field(
+        default=None, alias='ContactsLimitToSearch'
+    )
+    contacts_join_computers: bool | None = Field(
+        default=None, alias='ContactsJoinComputers'
+    )
+    remote_agent_template: LabTechRemoteAgentTemplate | None = Field(
+        default=None, alias='RemoteAgentTemplate'
+    )
+    client_to_sync: LabTechClient | None = Field(default=None, alias='ClientToSync')
+    location_to_sync: LabTechLocation | None = Field(
+        default=None, alias='LocationToSync'
+    )
+    comments: str | None = Field(default=None, alias='Comments')
+    computer_permissions: list[LabTechUserClassComputerPermissions] | None = Field(
+        default=None, alias='ComputerPermissions'
+    )
+    computers: list[LabTechComputer] | None = Field(default=None, alias='Computers')
+    network_devices: list[LabTechNetworkDevice] | None = Field(
+        default=None, alias='NetworkDevices'
+    )
+    contacts: list[LabTechContact] | None = Field(default=None, alias='Contacts')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechclient import LabTechClient
+from pyconnectwise.models.automate.labtechcomputer import LabTechComputer
+from pyconnectwise.models.automate.labtechcontact import LabTechContact
+from pyconnectwise.models.automate.labtechgrouppartial import LabTechGroupPartial
+from pyconnectwise.models.automate.labtechlocation import LabTechLocation
+from pyconnectwise.models.automate.labtechmaintenancewindow import LabTechMaintenanceWindow
+from pyconnectwise.models.automate.labtechnetworkdevice import LabTechNetworkDevice
+from pyconnectwise.models.automate.labtechremoteagenttemplate import LabTechRemoteAgentTemplate
+from pyconnectwise.models.automate.labtechsearch import LabTechSearch
+from pyconnectwise.models.automate.labtechuserclasscomputerpermissions import LabTechUserClassComputerPermissions
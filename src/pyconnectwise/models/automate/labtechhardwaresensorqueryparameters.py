@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechHardwareSensorQueryParameters(ConnectWiseModel):
+    sensor: LabTechHardwareSensorQuerySensor | None = Field(
+        default=None, alias='Sensor'
+    )
+    sensor_number: str | None = Field(default=None, alias='SensorNumber')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechhardwaresensorquerysensor import LabTechHardwareSensorQuerySensor
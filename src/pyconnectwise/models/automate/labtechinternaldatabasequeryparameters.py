@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechInternalDatabaseQueryParameters(ConnectWiseModel):
+    field_to_check: str | None = Field(default=None, alias='FieldToCheck')
+    table_or_view_to_query: str | None = Field(default=None, alias='TableOrViewToQuery')
+    additional_conditions: str | None = Field(
+        default=None, alias='AdditionalConditions'
+    )
+    identity_field: str | None = Field(default=None, alias='IdentityField')
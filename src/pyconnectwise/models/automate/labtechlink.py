@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechLink(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    name: str | None = Field(default=None, alias='Name')
+    url: str | None = Field(default=None, alias='URL')
+    category: str | None = Field(default=None, alias='Category')
@@ -0,0 +1,56 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechLocation(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    client: LabTechClient | None = Field(default=None, alias='Client')
+    name: str | None = Field(default=None, alias='Name')
+    address1: str | None = Field(default=None, alias='Address1')
+    address2: str | None = Field(default=None, alias='Address2')
+    city: str | None = Field(default=None, alias='City')
+    state: str | None = Field(default=None, alias='State')
+    zip_code: str | None = Field(default=None, alias='ZipCode')
+    country: str | None = Field(default=None, alias='Country')
+    phone_number: str | None = Field(default=None, alias='PhoneNumber')
+    fax_number: str | None = Field(default=None, alias='FaxNumber')
+    contact: LabTechContact | None = Field(default=None, alias='Contact')
+    comments: str | None = Field(default=None, alias='Comments')
+    router_port: int | None = Field(default=None, alias='RouterPort')
+    script_drive: str | None = Field(default=None, alias='ScriptDrive')
+    script_username: str | None = Field(default=None, alias='ScriptUsername')
+    script_password: str | None = Field(default=None, alias='ScriptPassword')
+    script_router_address: str | None = Field(default=None, alias='ScriptRouterAddress')
+    script_extra1: str | None = Field(default=None, alias='ScriptExtra1')
+    script_extra2: str | None = Field(default=None, alias='ScriptExtra2')
+    probe_id: int | None = Field(default=None, alias='ProbeId')
+    external_id: int | None = Field(default=None, alias='ExternalId')
+    router: LabTechRouter | None = Field(default=None, alias='Router')
+    deployment_template: LabTechRemoteAgentTemplate | None = Field(
+        default=None, alias='DeploymentTemplate'
+    )
+    maintenance_window: LabTechMaintenanceWindowDefinition | None = Field(
+        default=None, alias='MaintenanceWindow'
+    )
+    default_deployment_group: LabTechGroup | None = Field(
+        default=None, alias='DefaultDeploymentGroup'
+    )
+    default_deployment_login: LabTechDeploymentLogin | None = Field(
+        default=None, alias='DefaultDeploymentLogin'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechclient import LabTechClient
+from pyconnectwise.models.automate.labtechcontact import LabTechContact
+from pyconnectwise.models.automate.labtechdeploymentlogin import LabTechDeploymentLogin
+from pyconnectwise.models.automate.labtechgroup import LabTechGroup
+from pyconnectwise.models.automate.labtechmaintenancewindowdefinition import LabTechMaintenanceWindowDefinition
+from pyconnectwise.models.automate.labtechremoteagenttemplate import LabTechRemoteAgentTemplate
+from pyconnectwise.models.automate.labtechrouter import LabTechRouter
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMaintenanceMode(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias='ComputerID')
+    time_start: datetime | None = Field(default=None, alias='TimeStart')
+    duration: int | None = Field(default=None, alias='Duration')
+    mode: int | None = Field(default=None, alias='Mode')
+    user_id: int | None = Field(default=None, alias='UserID')
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorAlertStyle(ConnectWiseModel):
+    internal_monitor_alert_style: LabTechInternalMonitorAlertStyle | None = Field(
+        default=None, alias='InternalMonitorAlertStyle'
+    )
+    remote_monitor_alert_style: LabTechRemoteMonitorAlertStyle | None = Field(
+        default=None, alias='RemoteMonitorAlertStyle'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechinternalmonitoralertstyle import LabTechInternalMonitorAlertStyle
+from pyconnectwise.models.automate.labtechremotemonitoralertstyle import LabTechRemoteMonitorAlertStyle
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorAlertSuspension(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    monitor: LabTechMonitor | None = Field(default=None, alias='Monitor')
+    suspension_date: datetime | None = Field(default=None, alias='SuspensionDate')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechmonitor import LabTechMonitor
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorComparerSettings(ConnectWiseModel):
+    comparer: LabTechMonitorComparer | None = Field(default=None, alias='Comparer')
+    format: LabTechMonitorComparerSettingsFormat | None = Field(
+        default=None, alias='Format'
+    )
+    value: LabTechMonitorComparerValue | None = Field(default=None, alias='Value')
+    smoothing_coefficient: float | None = Field(
+        default=None, alias='SmoothingCoefficient'
+    )
+    is_expression: bool | None = Field(default=None, alias='IsExpression')
+    smoothing_style: LabTechMonitorComparerSettingsSmoothingStyle | None = Field(
+        default=None, alias='SmoothingStyle'
+    )
+    language_overrides: dict[str, str] | None = Field(
+        default=None, alias='LanguageOverrides'
+    )
+    result_format: LabTechMonitorComparerSettingsResultFormat | None = Field(
+        default=None, alias='ResultFormat'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechmonitorcomparer import LabTechMonitorComparer
+from pyconnectwise.models.automate.labtechmonitorcomparersettingsformat import LabTechMonitorComparerSettingsFormat
+from pyconnectwise.models.automate.labtechmonitorcomparersettingsresultformat import LabTechMonitorComparerSettingsResultFormat
+from pyconnectwise.models.automate.labtechmonitorcomparersettingssmoothingstyle import LabTechMonitorComparerSettingsSmoothingStyle
+from pyconnectwise.models.automate.labtechmonitorcomparervalue import LabTechMonitorComparerValue
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorComparerStateBasedValueFormat(ConnectWiseModel):
+    normal_comparer: LabTechMonitorComparerSettings | None = Field(
+        default=None, alias='NormalComparer'
+    )
+    warning_comparer: LabTechMonitorComparerSettings | None = Field(
+        default=None, alias='WarningComparer'
+    )
+    error_comparer: LabTechMonitorComparerSettings | None = Field(
+        default=None, alias='ErrorComparer'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechmonitorcomparersettings import LabTechMonitorComparerSettings
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorComparerValue(ConnectWiseModel):
+    format: LabTechMonitorComparerValueFormat | None = Field(
+        default=None, alias='Format'
+    )
+    multi_value_format: LabTechMonitorComparerMultiValueFormat | None = Field(
+        default=None, alias='MultiValueFormat'
+    )
+    state_based_value_format: LabTechMonitorComparerStateBasedValueFormat | None = (
+        Field(default=None, alias='StateBasedValueFormat')
+    )
+    single_value_format: LabTechMonitorComparerSingleValueFormat | None = Field(
+        default=None, alias='SingleValueFormat'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechmonitorcomparermultivalueformat import LabTechMonitorComparerMultiValueFormat
+from pyconnectwise.models.automate.labtechmonitorcomparersinglevalueformat import LabTechMonitorComparerSingleValueFormat
+from pyconnectwise.models.automate.labtechmonitorcomparerstatebasedvalueformat import LabTechMonitorComparerStateBasedValueFormat
+from pyconnectwise.models.automate.labtechmonitorcomparervalueformat import LabTechMonitorComparerValueFormat
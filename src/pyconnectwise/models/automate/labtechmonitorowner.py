@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorOwner(ConnectWiseModel):
+    owner_type: int | None = Field(default=None, alias='OwnerType')
+    description: str | None = Field(default=None, alias='Description')
+    owning_group: LabTechGroup | None = Field(default=None, alias='OwningGroup')
+    owning_script: LabTechScript | None = Field(default=None, alias='OwningScript')
+    owning_plugin: LabTechMonitorPluginOwner | None = Field(
+        default=None, alias='OwningPlugin'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechgroup import LabTechGroup
+from pyconnectwise.models.automate.labtechmonitorpluginowner import LabTechMonitorPluginOwner
+from pyconnectwise.models.automate.labtechscript import LabTechScript
@@ -0,0 +1,71 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorRoutineParameters(ConnectWiseModel):
+    format: LabTechMonitorRoutineParametersFormat | None = Field(
+        default=None, alias='Format'
+    )
+    unformatted_monitor_parameters: LabTechUnformattedMonitorRoutineParameters | None = Field(
+        default=None, alias='UnformattedMonitorParameters'
+    )
+    internal_database_query_parameters: LabTechInternalDatabaseQueryParameters | None = Field(
+        default=None, alias='InternalDatabaseQueryParameters'
+    )
+    latency_target: str | None = Field(default=None, alias='LatencyTarget')
+    get_network_response_parameters: LabTechGetNetworkResponseParameters | None = Field(
+        default=None, alias='GetNetworkResponseParameters'
+    )
+    snmp_oid_query_parameters: LabTechSnmpOidQueryParameters | None = Field(
+        default=None, alias='SnmpOidQueryParameters'
+    )
+    performance_counter_query_parameters: LabTechPerformanceCounterQueryParameters | None = Field(
+        default=None, alias='PerformanceCounterQueryParameters'
+    )
+    hardware_sensor_query_parameters: LabTechHardwareSensorQueryParameters | None = (
+        Field(default=None, alias='HardwareSensorQueryParameters')
+    )
+    network_device_wbem_query_parameters: LabTechNetworkDeviceWbemQueryParameters | None = Field(
+        default=None, alias='NetworkDeviceWbemQueryParameters'
+    )
+    get_plugin_command_result_parameters: LabTechGetPluginCommandResultParameters | None = Field(
+        default=None, alias='GetPluginCommandResultParameters'
+    )
+    file_or_directory_query_parameters: LabTechFileOrDirectoryQueryParameters | None = (
+        Field(default=None, alias='FileOrDirectoryQueryParameters')
+    )
+    service_name: str | None = Field(default=None, alias='ServiceName')
+    volume_mountpoint: str | None = Field(default=None, alias='VolumeMountpoint')
+    registry_value_query_parameters: LabTechRegistryValueQueryParameters | None = Field(
+        default=None, alias='RegistryValueQueryParameters'
+    )
+    process_name: str | None = Field(default=None, alias='ProcessName')
+    event_log_listener_parameters: LabTechEventLogQueryParameters | None = Field(
+        default=None, alias='EventLogListenerParameters'
+    )
+    get_executable_result_parameters: LabTechGetExecutableResultParameters | None = (
+        Field(default=None, alias='GetExecutableResultParameters')
+    )
+    wmi_query: str | None = Field(default=None, alias='WmiQuery')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtecheventlogqueryparameters import LabTechEventLogQueryParameters
+from pyconnectwise.models.automate.labtechfileordirectoryqueryparameters import LabTechFileOrDirectoryQueryParameters
+from pyconnectwise.models.automate.labtechgetexecutableresultparameters import LabTechGetExecutableResultParameters
+from pyconnectwise.models.automate.labtechgetnetworkresponseparameters import LabTechGetNetworkResponseParameters
+from pyconnectwise.models.automate.labtechgetplugincommandresultparameters import LabTechGetPluginCommandResultParameters
+from pyconnectwise.models.automate.labtechhardwaresensorqueryparameters import LabTechHardwareSensorQueryParameters
+from pyconnectwise.models.automate.labtechinternaldatabasequeryparameters import LabTechInternalDatabaseQueryParameters
+from pyconnectwise.models.automate.labtechmonitorroutineparametersformat import LabTechMonitorRoutineParametersFormat
+from pyconnectwise.models.automate.labtechnetworkdevicewbemqueryparameters import LabTechNetworkDeviceWbemQueryParameters
+from pyconnectwise.models.automate.labtechperformancecounterqueryparameters import LabTechPerformanceCounterQueryParameters
+from pyconnectwise.models.automate.labtechregistryvaluequeryparameters import LabTechRegistryValueQueryParameters
+from pyconnectwise.models.automate.labtechsnmpoidqueryparameters import LabTechSnmpOidQueryParameters
+from pyconnectwise.models.automate.labtechunformattedmonitorroutineparameters import LabTechUnformattedMonitorRoutineParameters
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorTarget(ConnectWiseModel):
+    location: LabTechLocation | None = Field(default=None, alias='Location')
+    client: LabTechClient | None = Field(default=None, alias='Client')
+    computer: LabTechComputer | None = Field(default=None, alias='Computer')
+    network_device: LabTechNetworkDevice | None = Field(
+        default=None, alias='NetworkDevice'
+    )
+    group_ids: list[int] | None = Field(default=None, alias='GroupIds')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechclient import LabTechClient
+from pyconnectwise.models.automate.labtechcomputer import LabTechComputer
+from pyconnectwise.models.automate.labtechlocation import LabTechLocation
+from pyconnectwise.models.automate.labtechnetworkdevice import LabTechNetworkDevice
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechNetworkMapNode(ConnectWiseModel):
+    device_id: int | None = Field(default=None, alias='DeviceId')
+    device_name: str | None = Field(default=None, alias='DeviceName')
+    device_friendly_name: str | None = Field(default=None, alias='DeviceFriendlyName')
+    description: str | None = Field(default=None, alias='Description')
+    device_type: str | None = Field(default=None, alias='DeviceType')
+    child_node_list: list[LabTechNetworkMapNode] | None = Field(
+        default=None, alias='ChildNodeList'
+    )
+    device_mac_address: str | None = Field(default=None, alias='DeviceMacAddress')
+    ip_address: str | None = Field(default=None, alias='IpAddress')
+    status: str | None = Field(default=None, alias='Status')
+    device_classification: Literal[
+        'Unknown', 'Computer', 'NetworkDevice', 'InternetConnection', 'BlackBox'
+    ] | None = Field(default=None, alias='DeviceClassification')
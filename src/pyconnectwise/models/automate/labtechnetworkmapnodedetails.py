@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechNetworkMapNodeDetails(ConnectWiseModel):
+    device_id: int | None = Field(default=None, alias='DeviceId')
+    device_type: str | None = Field(default=None, alias='DeviceType')
+    uptime: int | None = Field(default=None, alias='Uptime')
+    ignore_device_scan: bool | None = Field(default=None, alias='IgnoreDeviceScan')
+    asset_date: datetime | None = Field(default=None, alias='AssetDate')
+    date_last_inventoried: datetime | None = Field(
+        default=None, alias='DateLastInventoried'
+    )
+    last_contact_date: datetime | None = Field(default=None, alias='LastContactDate')
+    ip_address: str | None = Field(default=None, alias='IpAddress')
+    device_mac_address: str | None = Field(default=None, alias='DeviceMacAddress')
+    operating_system: str | None = Field(default=None, alias='OperatingSystem')
+    model: str | None = Field(default=None, alias='Model')
+    location_probe: str | None = Field(default=None, alias='LocationProbe')
+    manufacturer: str | None = Field(default=None, alias='Manufacturer')
+    uplink_port: str | None = Field(default=None, alias='UplinkPort')
+    uplink_name: str | None = Field(default=None, alias='UplinkName')
+    uplink_ip_address: str | None = Field(default=None, alias='UplinkIpAddress')
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechNewProbeConfiguration(ConnectWiseModel):
+    is_agent_push_enabled: bool | None = Field(default=None, alias='IsAgentPushEnabled')
+    is_automated_deployment_enabled: bool | None = Field(
+        default=None, alias='IsAutomatedDeploymentEnabled'
+    )
+    is_data_collection_enabled: bool | None = Field(
+        default=None, alias='IsDataCollectionEnabled'
+    )
+    is_snmp_trap_server_enabled: bool | None = Field(
+        default=None, alias='IsSnmpTrapServerEnabled'
+    )
+    is_syslog_server_enabled: bool | None = Field(
+        default=None, alias='IsSyslogServerEnabled'
+    )
+    is_tftp_server_enabled: bool | None = Field(
+        default=None, alias='IsTftpServerEnabled'
+    )
+    credentials_list: list[LabTechProbeConfigurationCredentials] | None = Field(
+        default=None, alias='CredentialsList'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechprobeconfigurationcredentials import LabTechProbeConfigurationCredentials
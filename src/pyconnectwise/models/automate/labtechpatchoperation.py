@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechPatchOperation(ConnectWiseModel):
+    op: str | None = Field(default=None, alias='Op')
+    path: str | None = Field(default=None, alias='Path')
+    value: dict[str, Any] | None = Field(default=None, alias='Value')
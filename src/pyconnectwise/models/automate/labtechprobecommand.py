@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeCommand(ConnectWiseModel):
+    probe_command_id: int | None = Field(default=None, alias='ProbeCommandId')
+    probe_id: int | None = Field(default=None, alias='ProbeId')
+    command: AutomateProbeRemoteCommand | None = Field(default=None, alias='Command')
+    status: AutomateProbeCommandStatus | None = Field(default=None, alias='Status')
+    parameters: list[str] | None = Field(default=None, alias='Parameters')
+    output: str | None = Field(default=None, alias='Output')
+    is_fastalk: bool | None = Field(default=None, alias='IsFastalk')
+    date_updated: datetime | None = Field(default=None, alias='DateUpdated')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateprobecommandstatus import AutomateProbeCommandStatus
+from pyconnectwise.models.automate.automateproberemotecommand import AutomateProbeRemoteCommand
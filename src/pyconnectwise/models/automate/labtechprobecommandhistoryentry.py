@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeCommandHistoryEntry(ConnectWiseModel):
+    result_set: list[AutomateProbeCommandHistoryEntry] | None = Field(
+        default=None, alias='ResultSet'
+    )
+    total_record_count: int | None = Field(default=None, alias='TotalRecordCount')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.automateprobecommandhistoryentry import AutomateProbeCommandHistoryEntry
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeDiscoveryScanStatus(ConnectWiseModel):
+    probe_discovery_scan_status_id: int | None = Field(
+        default=None, alias='ProbeDiscoveryScanStatusId'
+    )
+    location_id: int | None = Field(default=None, alias='LocationId')
+    probe_id: int | None = Field(default=None, alias='ProbeId')
+    is_discovery_scan_running: bool | None = Field(
+        default=None, alias='IsDiscoveryScanRunning'
+    )
+    discovery_scan_start: datetime | None = Field(
+        default=None, alias='DiscoveryScanStart'
+    )
+    last_discovery_scan: datetime | None = Field(
+        default=None, alias='LastDiscoveryScan'
+    )
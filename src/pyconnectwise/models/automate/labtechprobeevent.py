@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeEvent(ConnectWiseModel):
+    probe_id: int | None = Field(default=None, alias='ProbeId')
+    event_level: LabTechProbeEventLevel | None = Field(default=None, alias='EventLevel')
+    message: str | None = Field(default=None, alias='Message')
+    event_time: datetime | None = Field(default=None, alias='EventTime')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechprobeeventlevel import LabTechProbeEventLevel
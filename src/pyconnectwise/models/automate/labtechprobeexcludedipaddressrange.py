@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeExcludedIpAddressRange(ConnectWiseModel):
+    excluded_ip_range_id: int | None = Field(default=None, alias='ExcludedIpRangeId')
+    probe_subnet_id: int | None = Field(default=None, alias='ProbeSubnetId')
+    excluded_ip_range: str | None = Field(default=None, alias='ExcludedIpRange')
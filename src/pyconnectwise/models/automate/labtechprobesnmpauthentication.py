@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSnmpAuthentication(ConnectWiseModel):
+    snmp_authentication_id: int | None = Field(
+        default=None, alias='SnmpAuthenticationId'
+    )
+    probe_snmp_configuration_id: int | None = Field(
+        default=None, alias='ProbeSnmpConfigurationId'
+    )
+    authentication_secret: str | None = Field(
+        default=None, alias='AuthenticationSecret'
+    )
+    hash_method: LabTechHashMethod | None = Field(default=None, alias='HashMethod')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechhashmethod import LabTechHashMethod
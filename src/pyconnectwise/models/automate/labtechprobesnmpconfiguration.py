@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSnmpConfiguration(ConnectWiseModel):
+    probe_snmp_configuration_id: int | None = Field(
+        default=None, alias='ProbeSnmpConfigurationId'
+    )
+    probe_configuration_id: int | None = Field(
+        default=None, alias='ProbeConfigurationId'
+    )
+    snmp_timeout_in_seconds: int | None = Field(
+        default=None, alias='SnmpTimeoutInSeconds'
+    )
+    community_string_get_list: str | None = Field(
+        default=None, alias='CommunityStringGetList'
+    )
+    snmp_v3_settings: LabTechProbeSnmpV3Configuration | None = Field(
+        default=None, alias='SnmpV3Settings'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechprobesnmpv3configuration import LabTechProbeSnmpV3Configuration
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSnmpEncryption(ConnectWiseModel):
+    snmp_encryption_id: int | None = Field(default=None, alias='SnmpEncryptionId')
+    probe_snmp_configuration_id: int | None = Field(
+        default=None, alias='ProbeSnmpConfigurationId'
+    )
+    encryption_password: str | None = Field(default=None, alias='EncryptionPassword')
+    encryption_method: LabTechEncryptionMethod | None = Field(
+        default=None, alias='EncryptionMethod'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechencryptionmethod import LabTechEncryptionMethod
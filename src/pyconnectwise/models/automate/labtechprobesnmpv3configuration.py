@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSnmpV3Configuration(ConnectWiseModel):
+    probe_snmp_configuration_id: int | None = Field(
+        default=None, alias='ProbeSnmpConfigurationId'
+    )
+    snmp_v3_username: str | None = Field(default=None, alias='SnmpV3Username')
+    authentication: LabTechProbeSnmpAuthentication | None = Field(
+        default=None, alias='Authentication'
+    )
+    encryption: LabTechProbeSnmpEncryption | None = Field(
+        default=None, alias='Encryption'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechprobesnmpauthentication import LabTechProbeSnmpAuthentication
+from pyconnectwise.models.automate.labtechprobesnmpencryption import LabTechProbeSnmpEncryption
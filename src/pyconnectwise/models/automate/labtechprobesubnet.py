@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSubnet(ConnectWiseModel):
+    probe_subnet_id: int | None = Field(default=None, alias='ProbeSubnetId')
+    probe_configuration_id: int | None = Field(
+        default=None, alias='ProbeConfigurationId'
+    )
+    network: str | None = Field(default=None, alias='Network')
+    subnet_mask: str | None = Field(default=None, alias='SubnetMask')
+    label: str | None = Field(default=None, alias='Label')
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechQueryOptionOrderBy(ConnectWiseModel):
+    name: str | None = Field(default=None, alias='Name')
+    type: Literal['Undefined', 'Ascending', 'Descending'] | None = Field(
+        default=None, alias='Type'
+    )
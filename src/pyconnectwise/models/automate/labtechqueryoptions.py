@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechQueryOptions(ConnectWiseModel):
+    order_by: LabTechQueryOptionOrderBy | None = Field(default=None, alias='OrderBy')
+    page: int | None = Field(default=None, alias='Page')
+    page_size: int | None = Field(default=None, alias='PageSize')
+    condition: str | None = Field(default=None, alias='Condition')
+    expands: dict[str, LabTechQueryOptionExpand] | None = Field(
+        default=None, alias='Expands'
+    )
+    included_fields: list[str] | None = Field(default=None, alias='IncludedFields')
+    excluded_fields: list[str] | None = Field(default=None, alias='ExcludedFields')
+    ids: list[str] | None = Field(default=None, alias='Ids')
+    timeout: int | None = Field(default=None, alias='Timeout')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechqueryoptionexpand import LabTechQueryOptionExpand
+from pyconnectwise.models.automate.labtechqueryoptionorderby import LabTechQueryOptionOrderBy
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechRegistryValueQueryParameters(ConnectWiseModel):
+    hive: LabTechRegistryValueQueryRegistryHive | None = Field(
+        default=None, alias='Hive'
+    )
+    key: str | None = Field(default=None, alias='Key')
+    value: str | None = Field(default=None, alias='Value')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechregistryvaluequeryregistryhive import LabTechRegistryValueQueryRegistryHive
@@ -0,0 +1,61 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechRemoteAgentSchedule(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    name: str | None = Field(default=None, alias='Name')
+    update_config: LabTechSchedule | None = Field(default=None, alias='UpdateConfig')
+    hardware_inventory: LabTechSchedule | None = Field(
+        default=None, alias='HardwareInventory'
+    )
+    system_inventory: LabTechSchedule | None = Field(
+        default=None, alias='SystemInventory'
+    )
+    drive_inventory: LabTechSchedule | None = Field(
+        default=None, alias='DriveInventory'
+    )
+    process_inventory: LabTechSchedule | None = Field(
+        default=None, alias='ProcessInventory'
+    )
+    maleware_inventory: LabTechSchedule | None = Field(
+        default=None, alias='MalewareInventory'
+    )
+    software_inventory: LabTechSchedule | None = Field(
+        default=None, alias='SoftwareInventory'
+    )
+    event_inventory: LabTechSchedule | None = Field(
+        default=None, alias='EventInventory'
+    )
+    printer_inventory: LabTechSchedule | None = Field(
+        default=None, alias='PrinterInventory'
+    )
+    network_inventory: LabTechSchedule | None = Field(
+        default=None, alias='NetworkInventory'
+    )
+    network_analysis: LabTechSchedule | None = Field(
+        default=None, alias='NetworkAnalysis'
+    )
+    hotfix_inventory: LabTechSchedule | None = Field(
+        default=None, alias='HotfixInventory'
+    )
+    service_inventory: LabTechSchedule | None = Field(
+        default=None, alias='ServiceInventory'
+    )
+    network_probe_inventory: LabTechSchedule | None = Field(
+        default=None, alias='NetworkProbeInventory'
+    )
+    last_update: datetime | None = Field(default=None, alias='LastUpdate')
+    last_user: str | None = Field(default=None, alias='LastUser')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechschedule import LabTechSchedule
@@ -0,0 +1,188 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechRemoteAgentTemplate(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    name: str | None = Field(default=None, alias='Name')
+    template_guid: str | None = Field(default=None, alias='TemplateGUID')
+    server_address: str | None = Field(default=None, alias='ServerAddress')
+    event_log_inventory_mode: Literal[
+        'InventoryOnlyUsesSchedule',
+        'ImmediatelySendErrors',
+        'ImmediatelySendErrorsAndWarnings',
+        'ImmediatelySendAllButSecurity',
+        'ImmediatelySendAll',
+    ] | None = Field(default=None, alias='EventLogInventoryMode')
+    windows_update: Literal[
+        'DoNothing',
+        'EnableWindowsUpdateDefaults',
+        'SetToDownloadOnly',
+        'DisableWindowsUpdate',
+        'LabtechModeLabtechModeUIAccessDisabled',
+    ] | None = Field(default=None, alias='WindowsUpdate')
+    ssl_accept_expired_certificates: bool | None = Field(
+        default=None, alias='SSLAcceptExpiredCertificates'
+    )
+    ssl_access_untrusted_certificate_authorities: bool | None = Field(
+        default=None, alias='SSLAccessUntrustedCertificateAuthorities'
+    )
+    ssl_accept_mismatched_names: bool | None = Field(
+        default=None, alias='SSLAcceptMismatchedNames'
+    )
+    ssl_accept_revoked_certificates: bool | None = Field(
+        default=None, alias='SSLAcceptRevokedCertificates'
+    )
+    ssl_accept_all: bool | None = Field(default=None, alias='SSLAcceptAll')
+    default_language_pack: str | None = Field(default=None, alias='DefaultLanguagePack')
+    heartbeat_enabled: bool | None = Field(default=None, alias='HeartbeatEnabled')
+    heartbeat_frequency: int | None = Field(default=None, alias='HeartbeatFrequency')
+    remote_agent_log_debug: bool | None = Field(
+        default=None, alias='RemoteAgentLogDebug'
+    )
+    schedule: LabTechRemoteAgentSchedule | None = Field(default=None, alias='Schedule')
+    agent_update_window: LabTechSchedule | None = Field(
+        default=None, alias='AgentUpdateWindow'
+    )
+    temp_directory: str | None = Field(default=None, alias='TempDirectory')
+    cache_directory: str | None = Field(default=None, alias='CacheDirectory')
+    cache_username: str | None = Field(default=None, alias='CacheUsername')
+    cache_password: str | None = Field(default=None, alias='CachePassword')
+    cache_patch: bool | None = Field(default=None, alias='CachePatch')
+    cache_software: bool | None = Field(default=None, alias='CacheSoftware')
+    cache_update: bool | None = Field(default=None, alias='CacheUpdate')
+    tray_title: str | None = Field(default=None, alias='TrayTitle')
+    remote_agent_name: str | None = Field(default=None, alias='RemoteAgentName')
+    show_tray: bool | None = Field(default=None, alias='ShowTray')
+    tray_disable_powered_by: bool | None = Field(
+        default=None, alias='TrayDisablePoweredBy'
+    )
+    tray_icon: str | None = Field(default=None, alias='TrayIcon')
+    agent_reboot_mode: Literal[
+        'Now', 'Ask', 'AskThenAllow', 'AskThenDeny', 'Deny'
+    ] | None = Field(default=None, alias='AgentRebootMode')
+    remote_access_mode: Literal[
+        'Silent', 'Ask', 'AskThenAllow', 'AskThenDeny', 'Deny'
+    ] | None = Field(default=None, alias='RemoteAccessMode')
+    file_explorer_access_mode: Literal[
+        'Now', 'Ask', 'AskThenAllow', 'AskThenDeny', 'Deny'
+    ] | None = Field(default=None, alias='FileExplorerAccessMode')
+    registry_editor_access_mode: Literal[
+        'Now', 'Ask', 'AskThenAllow', 'AskThenDeny', 'Deny'
+    ] | None = Field(default=None, alias='RegistryEditorAccessMode')
+    screen_capture_access_mode: Literal[
+        'Now', 'Ask', 'AskThenAllow', 'AskThenDeny', 'Deny'
+    ] | None = Field(default=None, alias='ScreenCaptureAccessMode')
+    disallow_user_close_tray: bool | None = Field(
+        default=None, alias='DisallowUserCloseTray'
+    )
+    allow_user_disable_remote_access: bool | None = Field(
+        default=None, alias='AllowUserDisableRemoteAccess'
+    )
+    tray_help_url: str | None = Field(default=None, alias='TrayHelpURL')
+    tray_custom_menu_title: str | None = Field(
+        default=None, alias='TrayCustomMenuTitle'
+    )
+    tray_custom_menu_url: str | None = Field(default=None, alias='TrayCustomMenuURL')
+    tray_show_custom_menu: bool | None = Field(default=None, alias='TrayShowCustomMenu')
+    tray_show_help: bool | None = Field(default=None, alias='TrayShowHelp')
+    tray_menus: list[LabTechComputerMenu] | None = Field(
+        default=None, alias='TrayMenus'
+    )
+    tray_reboot_log_off_notification_text: str | None = Field(
+        default=None, alias='TrayRebootLogOffNotificationText'
+    )
+    tray_shutdown_notification_text: str | None = Field(
+        default=None, alias='TrayShutdownNotificationText'
+    )
+    tray_remote_access_notification_text: str | None = Field(
+        default=None, alias='TrayRemoteAccessNotificationText'
+    )
+    tray_file_explorer_access_notification_text: str | None = Field(
+        default=None, alias='TrayFileExplorerAccessNotificationText'
+    )
+    tray_registry_editor_access_notification_text: str | None = Field(
+        default=None, alias='TrayRegistryEditorAccessNotificationText'
+    )
+    tray_screen_capture_access_notification_text: str | None = Field(
+        default=None, alias='TrayScreenCaptureAccessNotificationText'
+    )
+    service_ticket_title: str | None = Field(default=None, alias='ServiceTicketTitle')
+    tray_ticket_from_label_text: str | None = Field(
+        default=None, alias='TrayTicketFromLabelText'
+    )
+    tray_ticket_subject_label_text: str | None = Field(
+        default=None, alias='TrayTicketSubjectLabelText'
+    )
+    tray_show_service_ticket_menu: bool | None = Field(
+        default=None, alias='TrayShowServiceTicketMenu'
+    )
+    tray_show_messages_and_tickets: bool | None = Field(
+        default=None, alias='TrayShowMessagesAndTickets'
+    )
+    tray_ticket_verify_email: bool | None = Field(
+        default=None, alias='TrayTicketVerifyEmail'
+    )
+    support_url: str | None = Field(default=None, alias='SupportURL')
+    rss_feed_address1: str | None = Field(default=None, alias='RSSFeedAddress1')
+    rss_feed_address2: str | None = Field(default=None, alias='RSSFeedAddress2')
+    rss_feed_address3: str | None = Field(default=None, alias='RSSFeedAddress3')
+    rss_feed_address4: str | None = Field(default=None, alias='RSSFeedAddress4')
+    enable_rss: bool | None = Field(default=None, alias='EnableRSS')
+    tray_chat_notification_text: str | None = Field(
+        default=None, alias='TrayChatNotificationText'
+    )
+    tray_chat_notification_title: str | None = Field(
+        default=None, alias='TrayChatNotificationTitle'
+    )
+    tray_interrupt_user_with_chat: bool | None = Field(
+        default=None, alias='TrayInterruptUserWithChat'
+    )
+    proxy_server_url: str | None = Field(default=None, alias='ProxyServerURL')
+    proxy_server_user: str | None = Field(default=None, alias='ProxyServerUser')
+    proxy_server_password: str | None = Field(default=None, alias='ProxyServerPassword')
+    tray_notification_title: str | None = Field(
+        default=None, alias='TrayNotificationTitle'
+    )
+    tray_new_message_notification_text: str | None = Field(
+        default=None, alias='TrayNewMessageNotificationText'
+    )
+    tray_new_rss_feed_notification_text: str | None = Field(
+        default=None, alias='TrayNewRSSFeedNotificationText'
+    )
+    tray_remote_access_notification_title: str | None = Field(
+        default=None, alias='TrayRemoteAccessNotificationTitle'
+    )
+    tray_system_message_notification_title: str | None = Field(
+        default=None, alias='TraySystemMessageNotificationTitle'
+    )
+    backup_server_url: str | None = Field(default=None, alias='BackupServerURL')
+    backup_server_user: str | None = Field(default=None, alias='BackupServerUser')
+    backup_server_password: str | None = Field(
+        default=None, alias='BackupServerPassword'
+    )
+    network_access_storage_path: str | None = Field(
+        default=None, alias='NetworkAccessStoragePath'
+    )
+    template_properties: list[LabTechTemplateProperty] | None = Field(
+        default=None, alias='TemplateProperties'
+    )
+    antivirus_template: LabTechAVTemplatePolicy | None = Field(
+        default=None, alias='AntivirusTemplate'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechavtemplatepolicy import LabTechAVTemplatePolicy
+from pyconnectwise.models.automate.labtechcomputermenu import LabTechComputerMenu
+from pyconnectwise.models.automate.labtechremoteagentschedule import LabTechRemoteAgentSchedule
+from pyconnectwise.models.automate.labtechschedule import LabTechSchedule
+from pyconnectwise.models.automate.labtechtemplateproperty import LabTechTemplateProperty
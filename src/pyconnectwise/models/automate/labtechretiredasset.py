@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechRetiredAsset(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    client: LabTechClient | None = Field(default=None, alias='Client')
+    location: LabTechLocation | None = Field(default=None, alias='Location')
+    computer_name: str | None = Field(default=None, alias='ComputerName')
+    operating_system_name: str | None = Field(default=None, alias='OperatingSystemName')
+    operating_system_version: str | None = Field(
+        default=None, alias='OperatingSystemVersion'
+    )
+    comment: str | None = Field(default=None, alias='Comment')
+    local_ip_address: str | None = Field(default=None, alias='LocalIPAddress')
+    gateway_ip_address: str | None = Field(default=None, alias='GatewayIPAddress')
+    asset_tag: str | None = Field(default=None, alias='AssetTag')
+    asset_date: datetime | None = Field(default=None, alias='AssetDate')
+    retired_date: datetime | None = Field(default=None, alias='RetiredDate')
+    retire_comment: str | None = Field(default=None, alias='RetireComment')
+    computer_id: str | None = Field(default=None, alias='ComputerId')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechclient import LabTechClient
+from pyconnectwise.models.automate.labtechlocation import LabTechLocation
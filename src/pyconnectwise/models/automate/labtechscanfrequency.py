@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScanFrequency(ConnectWiseModel):
+    scan_frequency_id: int | None = Field(default=None, alias='ScanFrequencyId')
+    frequency_in_minutes: int | None = Field(default=None, alias='FrequencyInMinutes')
+    display_name: str | None = Field(default=None, alias='DisplayName')
+    frequency_category: LabTechScanFrequencyCategory | None = Field(
+        default=None, alias='FrequencyCategory'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechscanfrequencycategory import LabTechScanFrequencyCategory
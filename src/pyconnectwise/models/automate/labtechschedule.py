@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSchedule(ConnectWiseModel):
+    day_id: Literal[
+        'Everyday',
+        'Sunday',
+        'Monday',
+        'Tuesday',
+        'Wednesday',
+        'Thursday',
+        'Friday',
+        'Saturday',
+    ] | None = Field(default=None, alias='DayId')
+    day_name: str | None = Field(default=None, alias='DayName')
+    repeat_every_hour: int | None = Field(default=None, alias='RepeatEveryHour')
+    date: datetime | None = Field(default=None, alias='Date')
@@ -0,0 +1,52 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScript(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    folder: LabTechScriptFolder | None = Field(default=None, alias='Folder')
+    name: str | None = Field(default=None, alias='Name')
+    comments: str | None = Field(default=None, alias='Comments')
+    is_computer_script: bool | None = Field(default=None, alias='IsComputerScript')
+    is_location_script: bool | None = Field(default=None, alias='IsLocationScript')
+    is_maintenance_script: bool | None = Field(
+        default=None, alias='IsMaintenanceScript'
+    )
+    is_function_script: bool | None = Field(default=None, alias='IsFunctionScript')
+    is_offline: bool | None = Field(default=None, alias='IsOffline')
+    ignore_for_mobile_devices: bool | None = Field(
+        default=None, alias='IgnoreForMobileDevices'
+    )
+    is_public_sharable: bool | None = Field(default=None, alias='IsPublicSharable')
+    is_user_response: bool | None = Field(default=None, alias='IsUserResponse')
+    is_system_script: bool | None = Field(default=None, alias='IsSystemScript')
+    is_mobile_device_script: bool | None = Field(
+        default=None, alias='IsMobileDeviceScript'
+    )
+    is_network_device_script: bool | None = Field(
+        default=None, alias='IsNetworkDeviceScript'
+    )
+    is_contact_script: bool | None = Field(default=None, alias='IsContactScript')
+    version: int | None = Field(default=None, alias='Version')
+    guid: str | None = Field(default=None, alias='GUID')
+    parameters: list[str] | None = Field(default=None, alias='Parameters')
+    edit_permission: list[int] | None = Field(default=None, alias='EditPermission')
+    permission: list[int] | None = Field(default=None, alias='Permission')
+    automation_time: int | None = Field(default=None, alias='AutomationTime')
+    update_date: datetime | None = Field(default=None, alias='UpdateDate')
+    updated_by: str | None = Field(default=None, alias='UpdatedBy')
+    full_folder_path: str | None = Field(default=None, alias='FullFolderPath')
+    script_data: LabTechScriptData | None = Field(default=None, alias='ScriptData')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechscriptdata import LabTechScriptData
+from pyconnectwise.models.automate.labtechscriptfolder import LabTechScriptFolder
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScriptData(ConnectWiseModel):
+    script_metadata: LabTechScriptMetadata | None = Field(
+        default=None, alias='ScriptMetadata'
+    )
+    script_steps: list[LabTechScriptStep] | None = Field(
+        default=None, alias='ScriptSteps'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechscriptmetadata import LabTechScriptMetadata
+from pyconnectwise.models.automate.labtechscriptstep import LabTechScriptStep
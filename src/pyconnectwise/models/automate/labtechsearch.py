@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSearch(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    name: str | None = Field(default=None, alias='Name')
+    search_folder: LabTechSearchFolder | None = Field(
+        default=None, alias='SearchFolder'
+    )
+    is_read_only: bool | None = Field(default=None, alias='IsReadOnly')
+    search_type: Literal[
+        'AdvancedComputers',
+        'AdvancedNetDevices',
+        'AdvancedContacts',
+        'AdvancedMobileDevices',
+    ] | None = Field(default=None, alias='SearchType')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechsearchfolder import LabTechSearchFolder
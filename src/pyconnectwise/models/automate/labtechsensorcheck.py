@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSensorCheck(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    name: str | None = Field(default=None, alias='Name')
+    sensor_check_type: Literal[
+        'SystemAverages', 'SystemCounts', 'Trends', 'PerDayCounts'
+    ] | None = Field(default=None, alias='SensorCheckType')
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSmartData(ConnectWiseModel):
+    drive_id: int | None = Field(default=None, alias='DriveId')
+    computer_id: int | None = Field(default=None, alias='ComputerId')
+    attribute: LabTechSmartAttribute | None = Field(default=None, alias='Attribute')
+    value: int | None = Field(default=None, alias='Value')
+    worst: int | None = Field(default=None, alias='Worst')
+    threshold: int | None = Field(default=None, alias='Threshold')
+    raw_value: int | None = Field(default=None, alias='RawValue')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechsmartattribute import LabTechSmartAttribute
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSnmpOidQueryParameters(ConnectWiseModel):
+    ip_address: str | None = Field(default=None, alias='IpAddress')
+    snmp_version: LabTechSnmpOidQuerySnmpVersion | None = Field(
+        default=None, alias='SnmpVersion'
+    )
+    community: str | None = Field(default=None, alias='Community')
+    username: str | None = Field(default=None, alias='Username')
+    encryption_method: LabTechSnmpOidQueryEncryptionMethod | None = Field(
+        default=None, alias='EncryptionMethod'
+    )
+    encryption_password: str | None = Field(default=None, alias='EncryptionPassword')
+    authentication_method: LabTechSnmpOidQueryAuthenticationMethod | None = Field(
+        default=None, alias='AuthenticationMethod'
+    )
+    authentication_password: str | None = Field(
+        default=None, alias='AuthenticationPassword'
+    )
+    object_identifier: str | None = Field(default=None, alias='ObjectIdentifier')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechsnmpoidqueryauthenticationmethod import LabTechSnmpOidQueryAuthenticationMethod
+from pyconnectwise.models.automate.labtechsnmpoidqueryencryptionmethod import LabTechSnmpOidQueryEncryptionMethod
+from pyconnectwise.models.automate.labtechsnmpoidquerysnmpversion import LabTechSnmpOidQuerySnmpVersion
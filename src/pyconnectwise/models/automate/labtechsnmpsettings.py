@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSnmpSettings(ConnectWiseModel):
+    community_strings_get: str | None = Field(default=None, alias='CommunityStringsGet')
+    timeout_in_seconds: int | None = Field(default=None, alias='TimeoutInSeconds')
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechStatusScanSettings(ConnectWiseModel):
+    status_scan_frequency: LabTechScanFrequency | None = Field(
+        default=None, alias='StatusScanFrequency'
+    )
+    status_scan_network_port_list: str | None = Field(
+        default=None, alias='StatusScanNetworkPortList'
+    )
+    network_port_option: LabTechStatusScanNetworkPortOption | None = Field(
+        default=None, alias='NetworkPortOption'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechscanfrequency import LabTechScanFrequency
+from pyconnectwise.models.automate.labtechstatusscannetworkportoption import LabTechStatusScanNetworkPortOption
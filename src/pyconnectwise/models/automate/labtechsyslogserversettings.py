@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSyslogServerSettings(ConnectWiseModel):
+    syslog_server_listening_port: int | None = Field(
+        default=None, alias='SyslogServerListeningPort'
+    )
+    syslog_server_ip_filter: str | None = Field(
+        default=None, alias='SyslogServerIpFilter'
+    )
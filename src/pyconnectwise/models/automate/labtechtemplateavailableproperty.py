@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechTemplateAvailableProperty(ConnectWiseModel):
+    property_id: str | None = Field(default=None, alias='PropertyId')
+    property_name: str | None = Field(default=None, alias='PropertyName')
+    property_description: str | None = Field(default=None, alias='PropertyDescription')
+    property_guid: str | None = Field(default=None, alias='PropertyGuid')
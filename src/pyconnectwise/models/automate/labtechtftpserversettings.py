@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechTftpServerSettings(ConnectWiseModel):
+    tftp_server_ip_filter: str | None = Field(default=None, alias='TftpServerIpFilter')
+    tftp_server_listening_port: int | None = Field(
+        default=None, alias='TftpServerListeningPort'
+    )
+    allow_tftp_uploads: bool | None = Field(default=None, alias='AllowTftpUploads')
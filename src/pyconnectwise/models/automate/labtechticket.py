@@ -0,0 +1,52 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechTicket(ConnectWiseModel):
+    ticket_id: int | None = Field(default=None, alias='TicketId')
+    client: LabTechClient | None = Field(default=None, alias='Client')
+    computer: LabTechComputer | None = Field(default=None, alias='Computer')
+    status: LabTechTicketStatus | None = Field(default=None, alias='Status')
+    subject: str | None = Field(default=None, alias='Subject')
+    priority: LabTechTicketPriority | None = Field(default=None, alias='Priority')
+    user: LabTechUser | None = Field(default=None, alias='User')
+    due_date: datetime | None = Field(default=None, alias='DueDate')
+    start_date: datetime | None = Field(default=None, alias='StartDate')
+    contact_date: datetime | None = Field(default=None, alias='ContactDate')
+    update_date: datetime | None = Field(default=None, alias='UpdateDate')
+    from_: str | None = Field(default=None, alias='From')
+    cc: str | None = Field(default=None, alias='CC')
+    support_level: int | None = Field(default=None, alias='SupportLevel')
+    category: LabTechTicketCategory | None = Field(default=None, alias='Category')
+    category_id: int | None = Field(default=None, alias='CategoryId')
+    category_name: str | None = Field(default=None, alias='CategoryName')
+    location: LabTechLocation | None = Field(default=None, alias='Location')
+    external_id: int | None = Field(default=None, alias='ExternalId')
+    monitor_id: int | None = Field(default=None, alias='MonitorId')
+    guid: str | None = Field(default=None, alias='Guid')
+    agent: LabTechComputerMonitor | None = Field(default=None, alias='Agent')
+    network_device: LabTechNetworkDevice | None = Field(
+        default=None, alias='NetworkDevice'
+    )
+    comments: list[LabTechTicketComment] | None = Field(default=None, alias='Comments')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechclient import LabTechClient
+from pyconnectwise.models.automate.labtechcomputer import LabTechComputer
+from pyconnectwise.models.automate.labtechcomputermonitor import LabTechComputerMonitor
+from pyconnectwise.models.automate.labtechlocation import LabTechLocation
+from pyconnectwise.models.automate.labtechnetworkdevice import LabTechNetworkDevice
+from pyconnectwise.models.automate.labtechticketcategory import LabTechTicketCategory
+from pyconnectwise.models.automate.labtechticketcomment import LabTechTicketComment
+from pyconnectwise.models.automate.labtechticketpriority import LabTechTicketPriority
+from pyconnectwise.models.automate.labtechticketstatus import LabTechTicketStatus
+from pyconnectwise.models.automate.labtechuser import LabTechUser
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechTicketCategory(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    name: str | None = Field(default=None, alias='Name')
+    parent_category_id: int | None = Field(default=None, alias='ParentCategoryId')
+    keywords: str | None = Field(default=None, alias='Keywords')
+    description: str | None = Field(default=None, alias='Description')
+    image: str | None = Field(default=None, alias='Image')
+    is_visible_in_list: bool | None = Field(default=None, alias='IsVisibleInList')
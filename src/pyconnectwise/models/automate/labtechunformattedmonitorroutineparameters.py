@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUnformattedMonitorRoutineParameters(ConnectWiseModel):
+    where: str | None = Field(default=None, alias='Where')
+    what: str | None = Field(default=None, alias='What')
+    data_out: str | None = Field(default=None, alias='DataOut')
+    id_field: str | None = Field(default=None, alias='IdField')
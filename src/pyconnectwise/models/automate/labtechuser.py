@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUser(ConnectWiseModel):
+    user_id: str | None = Field(default=None, alias='UserId')
+    folder: LabTechUserFolder | None = Field(default=None, alias='Folder')
+    name: str | None = Field(default=None, alias='Name')
+    email_address: str | None = Field(default=None, alias='EmailAddress')
+    sso_status: LabTechUserSingleSignOnStatus | None = Field(
+        default=None, alias='SsoStatus'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechuserfolder import LabTechUserFolder
+from pyconnectwise.models.automate.labtechusersinglesignonstatus import LabTechUserSingleSignOnStatus
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUserAudit(ConnectWiseModel):
+    id: int | None = Field(default=None, alias='Id')
+    user: LabTechUser | None = Field(default=None, alias='User')
+    message: str | None = Field(default=None, alias='Message')
+    date_created: datetime | None = Field(default=None, alias='DateCreated')
+    external_id: int | None = Field(default=None, alias='ExternalId')
+    audit_action: LabTechAuditAction | None = Field(default=None, alias='AuditAction')
+    source: LabTechAuditSource | None = Field(default=None, alias='Source')
+    secondary_identifier: str | None = Field(default=None, alias='SecondaryIdentifier')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechauditaction import LabTechAuditAction
+from pyconnectwise.models.automate.labtechauditsource import LabTechAuditSource
+from pyconnectwise.models.automate.labtechuser import LabTechUser
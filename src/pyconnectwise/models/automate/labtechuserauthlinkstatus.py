@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUserAuthLinkStatus(ConnectWiseModel):
+    service_id: int | None = Field(default=None, alias='ServiceId')
+    is_sso_enabled: bool | None = Field(default=None, alias='IsSsoEnabled')
+    is_local_login_enabled: bool | None = Field(
+        default=None, alias='IsLocalLoginEnabled'
+    )
+    is_eligible_for_sso: bool | None = Field(default=None, alias='IsEligibleForSso')
+    is_account_linked: bool | None = Field(default=None, alias='IsAccountLinked')
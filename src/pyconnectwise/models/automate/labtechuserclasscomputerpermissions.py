@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUserClassComputerPermissions(ConnectWiseModel):
+    id: str | None = Field(default=None, alias='Id')
+    user_class: LabTechUserClass | None = Field(default=None, alias='UserClass')
+    permissions: LabTechComputerPermissions | None = Field(
+        default=None, alias='Permissions'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.automate.labtechcomputerpermissions import LabTechComputerPermissions
+from pyconnectwise.models.automate.labtechuserclass import LabTechUserClass
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUserSetting(ConnectWiseModel):
+    user_id: int | None = Field(default=None, alias='UserId')
+    name: str | None = Field(default=None, alias='Name')
+    value: str | None = Field(default=None, alias='Value')
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import sys
+from typing import Iterable
 from pydantic import BaseModel, ConfigDict
 from pyconnectwise.utils.naming import to_camel_case
 
@@ -8,4 +10,33 @@ class ConnectWiseModel(BaseModel):
         populate_by_name=True,
         use_enum_values=True,
         protected_namespaces=(),
+        # Build a model's validator the first time it's used rather than when its class is
+        # defined, as most programs only ever use a handful of the API's models (see build_model)
+        defer_build=True,
     )
+
+
+def build_model(model: type[BaseModel]) -> None:
+    """
+    Build a model's validator if it hasn't been built yet, resolving the names the model refers to in
+    its own module. The endpoints build models this way before using them. Pydantic would otherwise
+    build a deferred model on its first use by also looking the names up in the namespace of the code
+    using it, where they can be shadowed (e.g. by pydantic's own ValidationError).
+
+    Args:
+        model (type[BaseModel]): The model to build, e.g. Ticket.
+    """
+    if not model.__pydantic_complete__:
+        model.model_rebuild(_types_namespace=vars(sys.modules[model.__module__]))
+
+
+def warm_up_models(models: Iterable[type[BaseModel]]) -> None:
+    """
+    Build the validators of models now rather than on first use, e.g. while a service starts up or
+    from a background thread, so the first requests that return them don't pay for it.
+
+    Args:
+        models (Iterable[type[BaseModel]]): The models to build, e.g. [Ticket, Company].
+    """
+    for model in models:
+        build_model(model)
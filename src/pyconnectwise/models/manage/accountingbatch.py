@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AccountingBatch(ConnectWiseModel):
+    id: int | None = None
+    batch_identifier: str | None = Field(default=None, alias='batchIdentifier')
+    export_invoices_flag: bool | None = Field(default=None, alias='exportInvoicesFlag')
+    export_expenses_flag: bool | None = Field(default=None, alias='exportExpensesFlag')
+    export_products_flag: bool | None = Field(default=None, alias='exportProductsFlag')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
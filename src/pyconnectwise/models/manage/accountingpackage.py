@@ -0,0 +1,12 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AccountingPackage(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    name: str | None = None
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AccountingPackageReference(ConnectWiseModel):
+    id: int | None = None
+    identifier: Literal[
+        'QB99', 'Mas200', 'GPlains', 'SBA', 'Mas200v4', 'Other'
+    ] | None = None
+    name: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
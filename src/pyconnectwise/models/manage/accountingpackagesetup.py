@@ -0,0 +1,66 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AccountingPackageSetup(ConnectWiseModel):
+    id: int | None = None
+    accounting_package: AccountingPackageReference | None = Field(
+        default=None, alias='accountingPackage'
+    )
+    direct_transfer_flag: bool | None = Field(default=None, alias='directTransferFlag')
+    include_invoices_flag: bool | None = Field(
+        default=None, alias='includeInvoicesFlag'
+    )
+    invoice_format: Literal['Default', 'Condensed', 'Detailed'] | None = Field(
+        default=None, alias='invoiceFormat'
+    )
+    include_expenses_flag: bool | None = Field(
+        default=None, alias='includeExpensesFlag'
+    )
+    transfer_expenses_as_bill_flag: bool | None = Field(
+        default=None, alias='transferExpensesAsBillFlag'
+    )
+    expense_format: Literal['Default', 'Condensed'] | None = Field(
+        default=None, alias='expenseFormat'
+    )
+    suppress_memo_flag: bool | None = Field(default=None, alias='suppressMemoFlag')
+    sync_payment_info_flag: bool | None = Field(
+        default=None, alias='syncPaymentInfoFlag'
+    )
+    sync_wise_pay_payment_info_flag: bool | None = Field(
+        default=None, alias='syncWisePayPaymentInfoFlag'
+    )
+    wise_pay_lab_flag: bool | None = Field(default=None, alias='wisePayLabFlag')
+    include_sales_tax_flag: bool | None = Field(
+        default=None, alias='includeSalesTaxFlag'
+    )
+    enable_tax_groups_flag: bool | None = Field(
+        default=None, alias='enableTaxGroupsFlag'
+    )
+    zero_dollar_tax_amounts_flag: bool | None = Field(
+        default=None, alias='zeroDollarTaxAmountsFlag'
+    )
+    include_items_flag: bool | None = Field(default=None, alias='includeItemsFlag')
+    inventory_soh_flag: bool | None = Field(default=None, alias='inventorySOHFlag')
+    send_component_amount_flag: bool | None = Field(
+        default=None, alias='sendComponentAmountFlag'
+    )
+    send_uom_flag: bool | None = Field(default=None, alias='sendUomFlag')
+    include_cogs_entries_flag: bool | None = Field(
+        default=None, alias='includeCogsEntriesFlag'
+    )
+    include_cogs_drop_ship_flag: bool | None = Field(
+        default=None, alias='includeCogsDropShipFlag'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.accountingpackagereference import AccountingPackageReference
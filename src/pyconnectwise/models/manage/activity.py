@@ -0,0 +1,69 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Activity(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    type: ActivityTypeReference | None = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    phone_number: str | None = Field(default=None, alias='phoneNumber')
+    """
+     Max length: 30;
+    """
+    email: str | None = None
+    """
+     Max length: 250;
+    """
+    status: ActivityStatusReference | None = None
+    opportunity: OpportunityReference | None = None
+    ticket: TicketReference | None = None
+    agreement: AgreementReference | None = None
+    campaign: CampaignReference | None = None
+    notes: str | None = None
+    date_start: datetime | None = Field(default=None, alias='dateStart')
+    date_end: datetime | None = Field(default=None, alias='dateEnd')
+    assigned_by: MemberReference | None = Field(default=None, alias='assignedBy')
+    assign_to: MemberReference | None = Field(default=None, alias='assignTo')
+    schedule_status: ScheduleStatusReference | None = Field(
+        default=None, alias='scheduleStatus'
+    )
+    reminder: ReminderReference | None = None
+    where: ServiceLocationReference | None = None
+    notify_flag: bool | None = Field(default=None, alias='notifyFlag')
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    currency: CurrencyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.activitystatusreference import ActivityStatusReference
+from pyconnectwise.models.manage.activitytypereference import ActivityTypeReference
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.campaignreference import CampaignReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.reminderreference import ReminderReference
+from pyconnectwise.models.manage.schedulestatusreference import ScheduleStatusReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ActivityStatus(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    spawn_followup_flag: bool | None = Field(default=None, alias='spawnFollowupFlag')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
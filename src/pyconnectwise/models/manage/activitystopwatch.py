@@ -0,0 +1,46 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ActivityStopwatch(ConnectWiseModel):
+    activity_id: int = Field(..., alias='activityId')
+    activity_mobile_guid: UUID | None = Field(default=None, alias='activityMobileGuid')
+    agreement: AgreementReference | None = None
+    billable_option: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billableOption')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    date_entered: datetime | None = Field(default=None, alias='dateEntered')
+    end_time: datetime | None = Field(default=None, alias='endTime')
+    id: int | None = None
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    location_id: int | None = Field(default=None, alias='locationId')
+    member: MemberReference | None = None
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    notes: str | None = None
+    """
+     Max length: 4000;
+    """
+    start_time: datetime | None = Field(default=None, alias='startTime')
+    status: Literal['Reset', 'Running', 'Paused', 'Stopped']
+    total_pause_time: int | None = Field(default=None, alias='totalPauseTime')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
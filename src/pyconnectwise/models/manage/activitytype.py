@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ActivityType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    points: int | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    email_flag: bool | None = Field(default=None, alias='emailFlag')
+    memo_flag: bool | None = Field(default=None, alias='memoFlag')
+    history_flag: bool | None = Field(default=None, alias='historyFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
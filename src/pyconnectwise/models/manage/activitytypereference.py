@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.activityreference import ActivityReference
+
+
+class ActivityTypeReference(ActivityReference):
+    pass
@@ -0,0 +1,73 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Addition(ConnectWiseModel):
+    id: int | None = None
+    product: IvItemReference | None = None
+    quantity: float | None = None
+    less_included: float | None = Field(default=None, alias='lessIncluded')
+    unit_price: float | None = Field(default=None, alias='unitPrice')
+    unit_cost: float | None = Field(default=None, alias='unitCost')
+    bill_customer: Literal['Billable', 'DoNotBill', 'NoCharge'] = Field(
+        ..., alias='billCustomer'
+    )
+    effective_date: datetime | None = Field(default=None, alias='effectiveDate')
+    cancelled_date: datetime | None = Field(default=None, alias='cancelledDate')
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    serial_number: str | None = Field(default=None, alias='serialNumber')
+    """
+     Max length: 50;
+    """
+    invoice_description: str | None = Field(default=None, alias='invoiceDescription')
+    """
+     Max length: 6000;
+    """
+    purchase_item_flag: bool | None = Field(default=None, alias='purchaseItemFlag')
+    special_order_flag: bool | None = Field(default=None, alias='specialOrderFlag')
+    agreement_id: int | None = Field(default=None, alias='agreementId')
+    description: str | None = None
+    billed_quantity: float | None = Field(default=None, alias='billedQuantity')
+    uom: str | None = None
+    ext_price: float | None = Field(default=None, alias='extPrice')
+    ext_cost: float | None = Field(default=None, alias='extCost')
+    sequence_number: float | None = Field(default=None, alias='sequenceNumber')
+    margin: float | None = None
+    prorate_cost: float | None = Field(default=None, alias='prorateCost')
+    prorate_price: float | None = Field(default=None, alias='proratePrice')
+    extended_prorate_cost: float | None = Field(
+        default=None, alias='extendedProrateCost'
+    )
+    extended_prorate_price: float | None = Field(
+        default=None, alias='extendedProratePrice'
+    )
+    prorate_current_period_flag: bool | None = Field(
+        default=None, alias='prorateCurrentPeriodFlag'
+    )
+    opportunity: OpportunityReference | None = None
+    agreement_status: Literal[
+        'Active', 'Cancelled', 'Expired', 'Inactive'
+    ] | None = Field(default=None, alias='agreementStatus')
+    invoice_grouping: InvoiceGroupingReference | None = Field(
+        default=None, alias='invoiceGrouping'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.invoicegroupingreference import InvoiceGroupingReference
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AddressFormat(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    format: str
+    """
+     Max length: 250;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    country_ids: list[int] | None = Field(default=None, alias='countryIds')
+    add_all_countries: bool | None = Field(default=None, alias='addAllCountries')
+    remove_all_countries: bool | None = Field(default=None, alias='removeAllCountries')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
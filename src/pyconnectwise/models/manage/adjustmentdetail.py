@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AdjustmentDetail(ConnectWiseModel):
+    id: int | None = None
+    catalog_item: CatalogItemReference | None = Field(default=None, alias='catalogItem')
+    description: str | None = None
+    """
+     Max length: 50;
+    """
+    quantity_on_hand: float | None = Field(default=None, alias='quantityOnHand')
+    unit_cost: float | None = Field(default=None, alias='unitCost')
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    quantity_adjusted: int = Field(..., alias='quantityAdjusted')
+    serial_number: str | None = Field(default=None, alias='serialNumber')
+    """
+     Max length: 1000;
+    """
+    adjustment: AdjustmentReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.adjustmentreference import AdjustmentReference
+from pyconnectwise.models.manage.catalogitemreference import CatalogItemReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AdjustmentType(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 50;
+    """
+    name: str | None = None
+    """
+     Max length: 100;
+    """
+    audit_trail_flag: bool | None = Field(default=None, alias='auditTrailFlag')
+    date_created: datetime | None = Field(default=None, alias='dateCreated')
+    created_by: str | None = Field(default=None, alias='createdBy')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
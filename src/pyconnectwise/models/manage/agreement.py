@@ -0,0 +1,215 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Agreement(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    type: AgreementTypeReference | None = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    site: SiteReference | None = None
+    sub_contract_company: CompanyReference | None = Field(
+        default=None, alias='subContractCompany'
+    )
+    sub_contract_contact: ContactReference | None = Field(
+        default=None, alias='subContractContact'
+    )
+    parent_agreement: AgreementReference | None = Field(
+        default=None, alias='parentAgreement'
+    )
+    customer_po: str | None = Field(default=None, alias='customerPO')
+    """
+     Max length: 50;
+    """
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    restrict_location_flag: bool | None = Field(
+        default=None, alias='restrictLocationFlag'
+    )
+    restrict_department_flag: bool | None = Field(
+        default=None, alias='restrictDepartmentFlag'
+    )
+    start_date: datetime | None = Field(default=None, alias='startDate')
+    end_date: datetime | None = Field(default=None, alias='endDate')
+    no_ending_date_flag: bool | None = Field(default=None, alias='noEndingDateFlag')
+    opportunity: OpportunityReference | None = None
+    cancelled_flag: bool | None = Field(default=None, alias='cancelledFlag')
+    date_cancelled: datetime | None = Field(default=None, alias='dateCancelled')
+    reason_cancelled: str | None = Field(default=None, alias='reasonCancelled')
+    """
+     Max length: 100;
+    """
+    sla: SLAReference | None = None
+    work_order: str | None = Field(default=None, alias='workOrder')
+    """
+     Max length: 20;
+    """
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    application_units: Literal['Amount', 'Hours', 'Incidents'] | None = Field(
+        default=None, alias='applicationUnits'
+    )
+    application_limit: float | None = Field(default=None, alias='applicationLimit')
+    application_cycle: Literal[
+        'Contract2Weeks',
+        'Contract4Weeks',
+        'ContractYear',
+        'CalendarMonth',
+        'CalendarQuarter',
+        'CalendarWeek',
+        'ContractQuarter',
+        'CalendarYear',
+    ] | None = Field(default=None, alias='applicationCycle')
+    application_unlimited_flag: bool | None = Field(
+        default=None, alias='applicationUnlimitedFlag'
+    )
+    one_time_flag: bool | None = Field(default=None, alias='oneTimeFlag')
+    cover_agreement_time: bool | None = Field(default=None, alias='coverAgreementTime')
+    cover_agreement_product: bool | None = Field(
+        default=None, alias='coverAgreementProduct'
+    )
+    cover_agreement_expense: bool | None = Field(
+        default=None, alias='coverAgreementExpense'
+    )
+    cover_sales_tax: bool | None = Field(default=None, alias='coverSalesTax')
+    carry_over_unused: bool | None = Field(default=None, alias='carryOverUnused')
+    allow_overruns: bool | None = Field(default=None, alias='allowOverruns')
+    expired_days: int | None = Field(default=None, alias='expiredDays')
+    limit: int | None = None
+    expire_when_zero: bool | None = Field(default=None, alias='expireWhenZero')
+    charge_to_firm: bool | None = Field(default=None, alias='chargeToFirm')
+    employee_comp_rate: Literal['Actual', 'Hourly'] | None = Field(
+        default=None, alias='employeeCompRate'
+    )
+    """
+     Required On Updates;
+    """
+    employee_comp_not_exceed: Literal['Billing', 'Amount', 'Percent'] | None = Field(
+        default=None, alias='employeeCompNotExceed'
+    )
+    comp_hourly_rate: float | None = Field(default=None, alias='compHourlyRate')
+    comp_limit_amount: float | None = Field(default=None, alias='compLimitAmount')
+    billing_cycle: BillingCycleReference | None = Field(
+        default=None, alias='billingCycle'
+    )
+    bill_one_time_flag: bool | None = Field(default=None, alias='billOneTimeFlag')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    invoicing_cycle: Literal['ContractYear', 'CalendarYear'] | None = Field(
+        default=None, alias='invoicingCycle'
+    )
+    """
+     Required On Updates;
+    """
+    bill_to_company: CompanyReference | None = Field(
+        default=None, alias='billToCompany'
+    )
+    bill_to_contact: ContactReference | None = Field(
+        default=None, alias='billToContact'
+    )
+    bill_to_site: SiteReference | None = Field(default=None, alias='billToSite')
+    bill_amount: float | None = Field(default=None, alias='billAmount')
+    taxable: bool | None = None
+    prorate_first_bill: float | None = Field(default=None, alias='prorateFirstBill')
+    bill_start_date: datetime | None = Field(default=None, alias='billStartDate')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    restrict_down_payment: bool | None = Field(
+        default=None, alias='restrictDownPayment'
+    )
+    prorate_flag: bool | None = Field(default=None, alias='prorateFlag')
+    invoice_prorated_additions_flag: bool | None = Field(
+        default=None, alias='invoiceProratedAdditionsFlag'
+    )
+    invoice_description: str | None = Field(default=None, alias='invoiceDescription')
+    top_comment: bool | None = Field(default=None, alias='topComment')
+    bottom_comment: bool | None = Field(default=None, alias='bottomComment')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    project_type: ProjectTypeReference | None = Field(default=None, alias='projectType')
+    invoice_template: InvoiceTemplateReference | None = Field(
+        default=None, alias='invoiceTemplate'
+    )
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] | None = Field(
+        default=None, alias='billTime'
+    )
+    """
+     Required On Updates;
+    """
+    bill_expenses: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billExpenses')
+    """
+     Required On Updates;
+    """
+    bill_products: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billProducts')
+    """
+     Required On Updates;
+    """
+    billable_time_invoice: bool | None = Field(
+        default=None, alias='billableTimeInvoice'
+    )
+    billable_expense_invoice: bool | None = Field(
+        default=None, alias='billableExpenseInvoice'
+    )
+    billable_product_invoice: bool | None = Field(
+        default=None, alias='billableProductInvoice'
+    )
+    currency: CurrencyReference | None = None
+    period_type: Literal['Current', 'Future', 'Both', 'Undefined'] | None = Field(
+        default=None, alias='periodType'
+    )
+    auto_invoice_flag: bool | None = Field(default=None, alias='autoInvoiceFlag')
+    next_invoice_date: str | None = Field(default=None, alias='nextInvoiceDate')
+    company_location: SystemLocationReference | None = Field(
+        default=None, alias='companyLocation'
+    )
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    ship_to_contact: ContactReference | None = Field(
+        default=None, alias='shipToContact'
+    )
+    ship_to_site: SiteReference | None = Field(default=None, alias='shipToSite')
+    agreement_status: Literal[
+        'Active', 'Cancelled', 'Expired', 'Inactive'
+    ] | None = Field(default=None, alias='agreementStatus')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
+from pyconnectwise.models.manage.billingcyclereference import BillingCycleReference
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.invoicetemplatereference import InvoiceTemplateReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.projecttypereference import ProjectTypeReference
+from pyconnectwise.models.manage.slareference import SLAReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementAdjustment(ConnectWiseModel):
+    id: int | None = None
+    amount: float | None = None
+    description: str | None = None
+    """
+     Max length: 1000;
+    """
+    effective_date: datetime | None = Field(default=None, alias='effectiveDate')
+    agreement_id: int | None = Field(default=None, alias='agreementId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
@@ -0,0 +1,54 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementApplicationParameters(ConnectWiseModel):
+    application_unit: AgreementApplicationUnit | None = Field(
+        default=None, alias='applicationUnit'
+    )
+    application_limit: AgreementApplicationLimit | None = Field(
+        default=None, alias='applicationLimit'
+    )
+    application_limit_amount: float | None = Field(
+        default=None, alias='applicationLimitAmount'
+    )
+    available_per: AgreementApplicationAviablePer | None = Field(
+        default=None, alias='availablePer'
+    )
+    covers_time_flag: bool | None = Field(default=None, alias='coversTimeFlag')
+    covers_expenses_flag: bool | None = Field(default=None, alias='coversExpensesFlag')
+    covers_products_flag: bool | None = Field(default=None, alias='coversProductsFlag')
+    covers_tax_flag: bool | None = Field(default=None, alias='coversTaxFlag')
+    carryover_unused_flag: bool | None = Field(
+        default=None, alias='carryoverUnusedFlag'
+    )
+    carry_over_days: int | None = Field(default=None, alias='carryOverDays')
+    allow_overruns_flag: bool | None = Field(default=None, alias='allowOverrunsFlag')
+    overrun_limit: int | None = Field(default=None, alias='overrunLimit')
+    agreement_expires_flag: bool | None = Field(
+        default=None, alias='agreementExpiresFlag'
+    )
+    charge_adjustments_flag: bool | None = Field(
+        default=None, alias='chargeAdjustmentsFlag'
+    )
+    prepay_flag: bool | None = Field(default=None, alias='prepayFlag')
+    agr_billing_cycle: AgreementApplicationBillingCycle | None = Field(
+        default=None, alias='agrBillingCycle'
+    )
+    user_defined_field_values: list[UserDefinedFieldValueModel] | None = Field(
+        default=None, alias='userDefinedFieldValues'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementapplicationaviableper import AgreementApplicationAviablePer
+from pyconnectwise.models.manage.agreementapplicationbillingcycle import AgreementApplicationBillingCycle
+from pyconnectwise.models.manage.agreementapplicationlimit import AgreementApplicationLimit
+from pyconnectwise.models.manage.agreementapplicationunit import AgreementApplicationUnit
+from pyconnectwise.models.manage.userdefinedfieldvaluemodel import UserDefinedFieldValueModel
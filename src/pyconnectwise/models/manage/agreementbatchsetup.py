@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementBatchSetup(ConnectWiseModel):
+    id: int | None = None
+    next_run_date: datetime = Field(..., alias='nextRunDate')
+    days_in_advance: int = Field(..., alias='daysInAdvance')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementBillingInfo(ConnectWiseModel):
+    agreement_name: str | None = Field(default=None, alias='agreementName')
+    agreement_type: str | None = Field(default=None, alias='agreementType')
+    agreement_amount: float | None = Field(default=None, alias='agreementAmount')
+    agreement_rec_id: int | None = Field(default=None, alias='agreementRecId')
+    parent_rec_id: int | None = Field(default=None, alias='parentRecId')
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementRecap(ConnectWiseModel):
+    id: int | None = None
+    adjustment_amount: float | None = Field(default=None, alias='adjustmentAmount')
+    agreement_status: str | None = Field(default=None, alias='agreementStatus')
+    name: str | None = None
+    available_amount: float | None = Field(default=None, alias='availableAmount')
+    company_name: str | None = Field(default=None, alias='companyName')
+    is_unlimited: str | None = Field(default=None, alias='isUnlimited')
+    last_invoice_amount: str | None = Field(default=None, alias='lastInvoiceAmount')
+    last_invoice_date: str | None = Field(default=None, alias='lastInvoiceDate')
+    last_invoice_number: str | None = Field(default=None, alias='lastInvoiceNumber')
+    next_invoice_amount: float | None = Field(default=None, alias='nextInvoiceAmount')
+    next_invoice_date: str | None = Field(default=None, alias='nextInvoiceDate')
+    overrun_amount: float | None = Field(default=None, alias='overrunAmount')
+    remaining_amount: float | None = Field(default=None, alias='remainingAmount')
+    starting_amount: float | None = Field(default=None, alias='startingAmount')
+    unbilled_overage_amount: float | None = Field(
+        default=None, alias='unbilledOverageAmount'
+    )
+    unbilled_periods: int | None = Field(default=None, alias='unbilledPeriods')
+    used_amount: float | None = Field(default=None, alias='usedAmount')
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementRecurringParameters(ConnectWiseModel):
+    billing_cycle: GenericNameIdDTO | None = Field(default=None, alias='billingCycle')
+    cycle_base: GenericNameIdDTO | None = Field(default=None, alias='cycleBase')
+    a_gr_amount: float | None = Field(default=None, alias='aGRAmount')
+    taxable: bool | None = None
+    children_amount: float | None = Field(default=None, alias='childrenAmount')
+    additions_amount: float | None = Field(default=None, alias='additionsAmount')
+    total_amount: float | None = Field(default=None, alias='totalAmount')
+    a_gr_prorate: float | None = Field(default=None, alias='aGRProrate')
+    bill_start_date: str | None = Field(default=None, alias='billStartDate')
+    tax_code: GenericNameIdDTO | None = Field(default=None, alias='taxCode')
+    terms: GenericNameIdDTO | None = None
+    prorate_flag: bool | None = Field(default=None, alias='prorateFlag')
+    invoice_prorated_additions_flag: bool | None = Field(
+        default=None, alias='invoiceProratedAdditionsFlag'
+    )
+    restrict_downpayment: bool | None = Field(default=None, alias='restrictDownpayment')
+    currency: GenericNameIdDTO | None = None
+    auto_invoice_flag: bool | None = Field(default=None, alias='autoInvoiceFlag')
+    user_defined_field_values: list[UserDefinedFieldValueModel] | None = Field(
+        default=None, alias='userDefinedFieldValues'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.genericnameiddto import GenericNameIdDTO
+from pyconnectwise.models.manage.userdefinedfieldvaluemodel import UserDefinedFieldValueModel
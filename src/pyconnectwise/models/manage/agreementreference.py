@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementReference(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    type: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
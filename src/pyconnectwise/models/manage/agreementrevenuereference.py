@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementRevenueReference(ConnectWiseModel):
+    id: int | None = None
+    revenue: float | None = None
+    cost: float | None = None
+    margin: float | None = None
+    percentage: float | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementSite(ConnectWiseModel):
+    id: int | None = None
+    company: CompanyReference | None = None
+    site: SiteReference | None = None
+    agreement_id: int | None = Field(default=None, alias='agreementId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.sitereference import SiteReference
@@ -0,0 +1,172 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    prefix_suffix_option: Literal['Prefix', 'Suffix'] | None = Field(
+        default=None, alias='prefixSuffixOption'
+    )
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    pre_payment_flag: bool | None = Field(default=None, alias='prePaymentFlag')
+    invoice_pre_suffix: str | None = Field(default=None, alias='invoicePreSuffix')
+    """
+     Max length: 5;
+    """
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    restrict_location_flag: bool | None = Field(
+        default=None, alias='restrictLocationFlag'
+    )
+    restrict_department_flag: bool | None = Field(
+        default=None, alias='restrictDepartmentFlag'
+    )
+    sla: SLAReference | None = None
+    application_units: Literal['Amount', 'Hours', 'Incidents'] | None = Field(
+        default=None, alias='applicationUnits'
+    )
+    application_limit: float | None = Field(default=None, alias='applicationLimit')
+    application_cycle: Literal[
+        'Contract2Weeks',
+        'Contract4Weeks',
+        'ContractYear',
+        'CalendarMonth',
+        'CalendarQuarter',
+        'CalendarWeek',
+        'ContractQuarter',
+        'CalendarYear',
+    ] | None = Field(default=None, alias='applicationCycle')
+    application_unlimited_flag: bool | None = Field(
+        default=None, alias='applicationUnlimitedFlag'
+    )
+    one_time_flag: bool | None = Field(default=None, alias='oneTimeFlag')
+    cover_agreement_time_flag: bool | None = Field(
+        default=None, alias='coverAgreementTimeFlag'
+    )
+    cover_agreement_product_flag: bool | None = Field(
+        default=None, alias='coverAgreementProductFlag'
+    )
+    cover_agreement_expense_flag: bool | None = Field(
+        default=None, alias='coverAgreementExpenseFlag'
+    )
+    cover_sales_tax_flag: bool | None = Field(default=None, alias='coverSalesTaxFlag')
+    carry_over_unused_flag: bool | None = Field(
+        default=None, alias='carryOverUnusedFlag'
+    )
+    allow_overruns_flag: bool | None = Field(default=None, alias='allowOverrunsFlag')
+    expired_days: int | None = Field(default=None, alias='expiredDays')
+    limit: int | None = None
+    expire_when_zero: bool | None = Field(default=None, alias='expireWhenZero')
+    charge_to_firm_flag: bool | None = Field(default=None, alias='chargeToFirmFlag')
+    employee_comp_rate: Literal['Actual', 'Hourly'] = Field(
+        ..., alias='employeeCompRate'
+    )
+    employee_comp_not_exceed: Literal['Billing', 'Amount', 'Percent'] = Field(
+        ..., alias='employeeCompNotExceed'
+    )
+    comp_hourly_rate: float | None = Field(default=None, alias='compHourlyRate')
+    comp_limit_amount: float | None = Field(default=None, alias='compLimitAmount')
+    billing_cycle: BillingCycleReference | None = Field(
+        default=None, alias='billingCycle'
+    )
+    bill_one_time_flag: bool | None = Field(default=None, alias='billOneTimeFlag')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    invoicing_cycle: Literal['ContractYear', 'CalendarYear'] = Field(
+        ..., alias='invoicingCycle'
+    )
+    bill_amount: float | None = Field(default=None, alias='billAmount')
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    restrict_down_payment_flag: bool | None = Field(
+        default=None, alias='restrictDownPaymentFlag'
+    )
+    invoice_description: str | None = Field(default=None, alias='invoiceDescription')
+    """
+     Max length: 4000;
+    """
+    top_comment_flag: bool | None = Field(default=None, alias='topCommentFlag')
+    bottom_comment_flag: bool | None = Field(default=None, alias='bottomCommentFlag')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    project_type: ProjectTypeReference | None = Field(default=None, alias='projectType')
+    invoice_template: InvoiceTemplateReference | None = Field(
+        default=None, alias='invoiceTemplate'
+    )
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] = Field(
+        ..., alias='billTime'
+    )
+    bill_expenses: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] = Field(
+        ..., alias='billExpenses'
+    )
+    bill_products: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] = Field(
+        ..., alias='billProducts'
+    )
+    billable_time_invoice_flag: bool | None = Field(
+        default=None, alias='billableTimeInvoiceFlag'
+    )
+    billable_expense_invoice_flag: bool | None = Field(
+        default=None, alias='billableExpenseInvoiceFlag'
+    )
+    billable_product_invoice_flag: bool | None = Field(
+        default=None, alias='billableProductInvoiceFlag'
+    )
+    copy_work_roles_flag: bool | None = Field(default=None, alias='copyWorkRolesFlag')
+    copy_work_types_flag: bool | None = Field(default=None, alias='copyWorkTypesFlag')
+    exclusion_work_role_ids: list[int] | None = Field(
+        default=None, alias='exclusionWorkRoleIds'
+    )
+    add_all_work_role_exclusions: bool | None = Field(
+        default=None, alias='addAllWorkRoleExclusions'
+    )
+    remove_all_work_role_exclusions: bool | None = Field(
+        default=None, alias='removeAllWorkRoleExclusions'
+    )
+    exclusion_work_type_ids: list[int] | None = Field(
+        default=None, alias='exclusionWorkTypeIds'
+    )
+    add_all_work_type_exclusions: bool | None = Field(
+        default=None, alias='addAllWorkTypeExclusions'
+    )
+    remove_all_work_type_exclusions: bool | None = Field(
+        default=None, alias='removeAllWorkTypeExclusions'
+    )
+    integration_x_ref: str | None = Field(default=None, alias='integrationXRef')
+    """
+     Max length: 50;
+    """
+    prorate_flag: bool | None = Field(default=None, alias='prorateFlag')
+    email_template: EmailTemplateReference | None = Field(
+        default=None, alias='emailTemplate'
+    )
+    auto_invoice_flag: bool | None = Field(default=None, alias='autoInvoiceFlag')
+    invoice_prorated_additions_flag: bool | None = Field(
+        default=None, alias='invoiceProratedAdditionsFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingcyclereference import BillingCycleReference
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.emailtemplatereference import EmailTemplateReference
+from pyconnectwise.models.manage.invoicetemplatereference import InvoiceTemplateReference
+from pyconnectwise.models.manage.projecttypereference import ProjectTypeReference
+from pyconnectwise.models.manage.slareference import SLAReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementTypeBoardDefault(ConnectWiseModel):
+    id: int | None = None
+    type: AgreementTypeReference | None = None
+    location: SystemLocationReference
+    department: SystemDepartmentReference | None = None
+    board: BoardReference | None = None
+    service_type: ServiceTypeReference | None = Field(default=None, alias='serviceType')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementTypeInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    application_units: Literal['Amount', 'Hours', 'Incidents'] | None = Field(
+        default=None, alias='applicationUnits'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.agreementtypeworkroleexclusion import AgreementTypeWorkRoleExclusion
+
+
+class AgreementTypeWorkRoleInfo(AgreementTypeWorkRoleExclusion):
+    pass
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementTypeWorkType(ConnectWiseModel):
+    id: int | None = None
+    type: AgreementTypeReference | None = None
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    effective_date: datetime | None = Field(default=None, alias='effectiveDate')
+    ending_date: datetime | None = Field(default=None, alias='endingDate')
+    rate: float | None = None
+    rate_type: Literal['AdjAmount', 'Custom', 'Multiplier'] = Field(
+        ..., alias='rateType'
+    )
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] = Field(
+        ..., alias='billTime'
+    )
+    hours_min: float | None = Field(default=None, alias='hoursMin')
+    hours_max: float | None = Field(default=None, alias='hoursMax')
+    round_bill_hours: float | None = Field(default=None, alias='roundBillHours')
+    overage_rate: float | None = Field(default=None, alias='overageRate')
+    overage_rate_type: Literal['AdjAmount', 'Custom', 'Multiplier'] = Field(
+        ..., alias='overageRateType'
+    )
+    limit_to: float | None = Field(default=None, alias='limitTo')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementWorkRole(ConnectWiseModel):
+    id: int | None = None
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    location_id: int | None = Field(default=None, alias='locationId')
+    rate_type: Literal['AdjAmount', 'Custom', 'Multiplier'] = Field(
+        ..., alias='rateType'
+    )
+    rate: float | None = None
+    limit_to: float | None = Field(default=None, alias='limitTo')
+    effective_date: datetime | None = Field(default=None, alias='effectiveDate')
+    ending_date: datetime | None = Field(default=None, alias='endingDate')
+    agreement_id: int | None = Field(default=None, alias='agreementId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
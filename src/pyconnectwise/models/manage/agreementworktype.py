@@ -0,0 +1,48 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementWorkType(ConnectWiseModel):
+    id: int | None = None
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    location: OwnerLevelReference | None = None
+    location_id: int | None = Field(default=None, alias='locationId')
+    rate_type: Literal['AdjAmount', 'Custom', 'Multiplier'] = Field(
+        ..., alias='rateType'
+    )
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] = Field(
+        ..., alias='billTime'
+    )
+    rate: float | None = None
+    hours_max: float | None = Field(default=None, alias='hoursMax')
+    hours_min: float | None = Field(default=None, alias='hoursMin')
+    round_bill_hours: float | None = Field(default=None, alias='roundBillHours')
+    overage_rate: float | None = Field(default=None, alias='overageRate')
+    overage_rate_type: Literal['AdjAmount', 'Custom', 'Multiplier'] | None = Field(
+        default=None, alias='overageRateType'
+    )
+    agreement_limit: float | None = Field(default=None, alias='agreementLimit')
+    site: SiteReference | None = None
+    effective_date: datetime | None = Field(default=None, alias='effectiveDate')
+    ending_date: datetime | None = Field(default=None, alias='endingDate')
+    agreement: AgreementReference | None = None
+    agreement_id: int | None = Field(default=None, alias='agreementId')
+    company: CompanyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.ownerlevelreference import OwnerLevelReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementWorkTypeExclusion(ConnectWiseModel):
+    id: int | None = None
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    agreement_id: int | None = Field(default=None, alias='agreementId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AllowedFileType(ConnectWiseModel):
+    id: int | None = None
+    file_type: str = Field(..., alias='fileType')
+    size_limit: int | None = Field(default=None, alias='sizeLimit')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
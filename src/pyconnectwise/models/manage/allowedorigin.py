@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AllowedOrigin(ConnectWiseModel):
+    id: int | None = None
+    origin: str
+    """
+     Max length: 2000;
+    """
+    description: str
+    """
+     Max length: 2000;
+    """
+    last_update_utc: datetime | None = Field(default=None, alias='lastUpdateUtc')
+    updated_by: str | None = Field(default=None, alias='updatedBy')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,66 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ApiMember(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 15;
+    """
+    name: str | None = None
+    """
+     Max length: 30; Required On Updates;
+    """
+    email_address: str | None = Field(default=None, alias='emailAddress')
+    """
+     Max length: 250;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    inactive_date: datetime | None = Field(default=None, alias='inactiveDate')
+    time_zone: TimeZoneSetupReference | None = Field(default=None, alias='timeZone')
+    security_role: SecurityRoleReference | None = Field(
+        default=None, alias='securityRole'
+    )
+    structure_level: StructureReference | None = Field(
+        default=None, alias='structureLevel'
+    )
+    security_location: SystemLocationReference | None = Field(
+        default=None, alias='securityLocation'
+    )
+    default_location: SystemLocationReference | None = Field(
+        default=None, alias='defaultLocation'
+    )
+    default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='defaultDepartment'
+    )
+    sales_default_location: SystemLocationReference | None = Field(
+        default=None, alias='salesDefaultLocation'
+    )
+    service_default_board: BoardReference | None = Field(
+        default=None, alias='serviceDefaultBoard'
+    )
+    notes: str | None = None
+    excluded_service_board_ids: list[int] | None = Field(
+        default=None, alias='excludedServiceBoardIds'
+    )
+    block_price_flag: bool | None = Field(default=None, alias='blockPriceFlag')
+    block_cost_flag: bool | None = Field(default=None, alias='blockCostFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.securityrolereference import SecurityRoleReference
+from pyconnectwise.models.manage.structurereference import StructureReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ApiRequest(ConnectWiseModel):
+    id: int | None = None
+    external_id: str | None = Field(default=None, alias='externalId')
+    parent_id: int | None = Field(default=None, alias='parentId')
+    grand_parent_id: int | None = Field(default=None, alias='grandParentId')
+    entity: IRestIdentifiedItem | None = None
+    filters: FilterValues | None = None
+    page: PageValues | None = None
+    format: str | None = None
+    fields: str | None = None
+    misc_properties: dict[str, dict[str, Any]] | None = Field(
+        default=None, alias='miscProperties'
+    )
+    member_context: str | None = Field(default=None, alias='memberContext')
+    update_only_ces_properties: bool | None = Field(
+        default=None, alias='updateOnlyCesProperties'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.filtervalues import FilterValues
+from pyconnectwise.models.manage.irestidentifieditem import IRestIdentifiedItem
+from pyconnectwise.models.manage.pagevalues import PageValues
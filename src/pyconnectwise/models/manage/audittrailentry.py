@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AuditTrailEntry(ConnectWiseModel):
+    text: str | None = None
+    entered_date: str | None = Field(default=None, alias='enteredDate')
+    entered_by: str | None = Field(default=None, alias='enteredBy')
+    audit_type: str | None = Field(default=None, alias='auditType')
+    audit_sub_type: str | None = Field(default=None, alias='auditSubType')
+    audit_source: str | None = Field(default=None, alias='auditSource')
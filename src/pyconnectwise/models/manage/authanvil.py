@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AuthAnvil(ConnectWiseModel):
+    id: int | None = None
+    server_location_url: str = Field(..., alias='serverLocationUrl')
+    site_id: int = Field(..., alias='siteId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutoSyncTime(ConnectWiseModel):
+    id: int | None = None
+    sync_time: str = Field(..., alias='syncTime')
+    time_zone: TimeZoneSetupReference | None = Field(default=None, alias='timeZone')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
@@ -0,0 +1,44 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BatchEntry(ConnectWiseModel):
+    id: int | None = None
+    account_type: str | None = Field(default=None, alias='accountType')
+    name: str | None = None
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    debit: float | None = None
+    credit: float | None = None
+    cost: float | None = None
+    item: str | None = None
+    sales_code: str | None = Field(default=None, alias='salesCode')
+    cost_of_goods_sold_account_number: str | None = Field(
+        default=None, alias='costOfGoodsSoldAccountNumber'
+    )
+    invoice: InvoiceReference | None = None
+    purchase_order: PurchaseOrderReference | None = Field(
+        default=None, alias='purchaseOrder'
+    )
+    line_item: PurchaseOrderLineItemReference | None = Field(
+        default=None, alias='lineItem'
+    )
+    transfer: str | None = None
+    expense: ExpenseDetailReference | None = None
+    adjustment_detail: AdjustmentDetailReference | None = Field(
+        default=None, alias='adjustmentDetail'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.adjustmentdetailreference import AdjustmentDetailReference
+from pyconnectwise.models.manage.expensedetailreference import ExpenseDetailReference
+from pyconnectwise.models.manage.invoicereference import InvoiceReference
+from pyconnectwise.models.manage.purchaseorderlineitemreference import PurchaseOrderLineItemReference
+from pyconnectwise.models.manage.purchaseorderreference import PurchaseOrderReference
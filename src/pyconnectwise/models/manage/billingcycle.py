@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingCycle(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 5;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    billing_options: Literal[
+        'BiMonthly',
+        'BiWeekly',
+        'Monthly',
+        'NotRecurring',
+        'Quarterly',
+        'SemiAnnual',
+        'Weekly',
+        'Yearly',
+    ] = Field(..., alias='billingOptions')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,192 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingSetup(ConnectWiseModel):
+    id: int | None = None
+    remit_name: str = Field(..., alias='remitName')
+    """
+     Max length: 50;
+    """
+    location: SystemLocationReference
+    address_one: str | None = Field(default=None, alias='addressOne')
+    """
+     Max length: 50;
+    """
+    address_two: str | None = Field(default=None, alias='addressTwo')
+    """
+     Max length: 50;
+    """
+    city: str | None = None
+    """
+     Max length: 50;
+    """
+    state: StateReference | None = None
+    zip: str | None = None
+    """
+     Max length: 12;
+    """
+    country: CountryReference | None = None
+    phone: str | None = None
+    """
+     Max length: 15;
+    """
+    invoice_title: str = Field(..., alias='invoiceTitle')
+    """
+     Max length: 50;
+    """
+    payable_name: str = Field(..., alias='payableName')
+    """
+     Max length: 50;
+    """
+    topcomment: str | None = None
+    """
+     Max length: 4000;
+    """
+    invoice_footer: str | None = Field(default=None, alias='invoiceFooter')
+    """
+     Max length: 500;
+    """
+    quote_footer: str | None = Field(default=None, alias='quoteFooter')
+    """
+     Max length: 1000;
+    """
+    overall_invoice_default: InvoiceTemplateReference | None = Field(
+        default=None, alias='overallInvoiceDefault'
+    )
+    standard_invoice_actual: InvoiceTemplateReference | None = Field(
+        default=None, alias='standardInvoiceActual'
+    )
+    standard_invoice_fixed: InvoiceTemplateReference | None = Field(
+        default=None, alias='standardInvoiceFixed'
+    )
+    progress_invoice: InvoiceTemplateReference | None = Field(
+        default=None, alias='progressInvoice'
+    )
+    agreement_invoice: InvoiceTemplateReference | None = Field(
+        default=None, alias='agreementInvoice'
+    )
+    credit_memo_invoice: InvoiceTemplateReference | None = Field(
+        default=None, alias='creditMemoInvoice'
+    )
+    down_payment_invoice: InvoiceTemplateReference | None = Field(
+        default=None, alias='downPaymentInvoice'
+    )
+    misc_invoice: InvoiceTemplateReference | None = Field(
+        default=None, alias='miscInvoice'
+    )
+    sales_order_invoice: InvoiceTemplateReference | None = Field(
+        default=None, alias='salesOrderInvoice'
+    )
+    exclude_do_not_bill_time_flag: bool | None = Field(
+        default=None, alias='excludeDoNotBillTimeFlag'
+    )
+    exclude_do_not_bill_expense_flag: bool | None = Field(
+        default=None, alias='excludeDoNotBillExpenseFlag'
+    )
+    exclude_do_not_bill_product_flag: bool | None = Field(
+        default=None, alias='excludeDoNotBillProductFlag'
+    )
+    prefix_suffix_flag: Literal['Prefix', 'Suffix'] | None = Field(
+        default=None, alias='prefixSuffixFlag'
+    )
+    prefix_suffix_text: str | None = Field(default=None, alias='prefixSuffixText')
+    """
+     Max length: 5;
+    """
+    charge_adj_to_firm_flag: bool | None = Field(
+        default=None, alias='chargeAdjToFirmFlag'
+    )
+    no_watermark_flag: bool | None = Field(default=None, alias='noWatermarkFlag')
+    display_tax_flag: bool | None = Field(default=None, alias='displayTaxFlag')
+    allow_restricted_dept_on_routing_flag: bool | None = Field(
+        default=None, alias='allowRestrictedDeptOnRoutingFlag'
+    )
+    bill_ticket_separately_flag: bool | None = Field(
+        default=None, alias='billTicketSeparatelyFlag'
+    )
+    bill_ticket_complete_flag: bool | None = Field(
+        default=None, alias='billTicketCompleteFlag'
+    )
+    bill_ticket_unapproved_flag: bool | None = Field(
+        default=None, alias='billTicketUnapprovedFlag'
+    )
+    bill_project_complete_flag: bool | None = Field(
+        default=None, alias='billProjectCompleteFlag'
+    )
+    bill_project_unapproved_flag: bool | None = Field(
+        default=None, alias='billProjectUnapprovedFlag'
+    )
+    progress_time_flag: bool | None = Field(default=None, alias='progressTimeFlag')
+    restrict_project_downpayment_flag: bool | None = Field(
+        default=None, alias='restrictProjectDownpaymentFlag'
+    )
+    bill_sales_order_complete_flag: bool | None = Field(
+        default=None, alias='billSalesOrderCompleteFlag'
+    )
+    bill_product_after_ship_flag: bool | None = Field(
+        default=None, alias='billProductAfterShipFlag'
+    )
+    restrict_downpayment_flag: bool | None = Field(
+        default=None, alias='restrictDownpaymentFlag'
+    )
+    copy_non_service_products_flag: bool | None = Field(
+        default=None, alias='copyNonServiceProductsFlag'
+    )
+    copy_service_products_flag: bool | None = Field(
+        default=None, alias='copyServiceProductsFlag'
+    )
+    copy_agreement_products_flag: bool | None = Field(
+        default=None, alias='copyAgreementProductsFlag'
+    )
+    print_logo_flag: bool | None = Field(default=None, alias='printLogoFlag')
+    read_receipt_flag: bool | None = Field(default=None, alias='readReceiptFlag')
+    delivery_receipt_flag: bool | None = Field(
+        default=None, alias='deliveryReceiptFlag'
+    )
+    attach_xml_invoice_flag: bool | None = Field(
+        default=None, alias='attachXmlInvoiceFlag'
+    )
+    disable_routing_email_flag: bool | None = Field(
+        default=None, alias='disableRoutingEmailFlag'
+    )
+    email_template: EmailTemplateReference = Field(..., alias='emailTemplate')
+    localized_country: CountryReference | None = Field(
+        default=None, alias='localizedCountry'
+    )
+    business_number: str | None = Field(default=None, alias='businessNumber')
+    """
+     Max length: 50;
+    """
+    currency: CurrencyReference | None = None
+    custom_label: str | None = Field(default=None, alias='customLabel')
+    """
+     Max length: 50;
+    """
+    custom_text: str | None = Field(default=None, alias='customText')
+    """
+     Max length: 500;
+    """
+    company_code: str | None = Field(default=None, alias='companyCode')
+    """
+     Max length: 250;
+    """
+    exclude_avalara_flag: bool | None = Field(default=None, alias='excludeAvalaraFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.emailtemplatereference import EmailTemplateReference
+from pyconnectwise.models.manage.invoicetemplatereference import InvoiceTemplateReference
+from pyconnectwise.models.manage.statereference import StateReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingSetupInfo(ConnectWiseModel):
+    id: int | None = None
+    remit_name: str | None = Field(default=None, alias='remitName')
+    location: SystemLocationReference | None = None
+    currency: CurrencyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
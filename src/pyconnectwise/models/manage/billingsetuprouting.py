@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingSetupRouting(ConnectWiseModel):
+    id: int | None = None
+    sequence_number: int = Field(..., alias='sequenceNumber')
+    invoice_rule: Literal['All', 'Standard', 'Project', 'Agreement'] = Field(
+        ..., alias='invoiceRule'
+    )
+    routing_rule: Literal[
+        'Account',
+        'Territory',
+        'Creator',
+        'Department',
+        'Location',
+        'Member',
+        'Project',
+        'Sales',
+    ] = Field(..., alias='routingRule')
+    member: MemberReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
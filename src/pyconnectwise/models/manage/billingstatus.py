@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingStatus(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    sort_order: int | None = Field(default=None, alias='sortOrder')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    sent_flag: bool | None = Field(default=None, alias='sentFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
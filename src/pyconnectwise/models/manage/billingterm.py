@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingTerm(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    due_days: int = Field(..., alias='dueDays')
+    terms_xref: str | None = Field(default=None, alias='termsXref')
+    """
+     Max length: 50;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,218 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Board(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    sign_off_template: ServiceSignoffReference | None = Field(
+        default=None, alias='signOffTemplate'
+    )
+    send_to_contact_flag: bool | None = Field(default=None, alias='sendToContactFlag')
+    contact_template: ServiceEmailTemplateReference | None = Field(
+        default=None, alias='contactTemplate'
+    )
+    send_to_resource_flag: bool | None = Field(default=None, alias='sendToResourceFlag')
+    resource_template: ServiceEmailTemplateReference | None = Field(
+        default=None, alias='resourceTemplate'
+    )
+    project_flag: bool | None = Field(default=None, alias='projectFlag')
+    show_dependencies_flag: bool | None = Field(
+        default=None, alias='showDependenciesFlag'
+    )
+    """
+    This field only shows if it is Project Board.
+    """
+    show_estimates_flag: bool | None = Field(default=None, alias='showEstimatesFlag')
+    """
+    This field only shows if it is Project Board.
+    """
+    board_icon: DocumentReference | None = Field(default=None, alias='boardIcon')
+    bill_tickets_after_closed_flag: bool | None = Field(
+        default=None, alias='billTicketsAfterClosedFlag'
+    )
+    bill_ticket_separately_flag: bool | None = Field(
+        default=None, alias='billTicketSeparatelyFlag'
+    )
+    bill_unapproved_time_expense_flag: bool | None = Field(
+        default=None, alias='billUnapprovedTimeExpenseFlag'
+    )
+    override_billing_setup_flag: bool | None = Field(
+        default=None, alias='overrideBillingSetupFlag'
+    )
+    dispatch_member: MemberReference | None = Field(
+        default=None, alias='dispatchMember'
+    )
+    service_manager_member: MemberReference | None = Field(
+        default=None, alias='serviceManagerMember'
+    )
+    duty_manager_member: MemberReference | None = Field(
+        default=None, alias='dutyManagerMember'
+    )
+    oncall_member: MemberReference | None = Field(default=None, alias='oncallMember')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] | None = Field(
+        default=None, alias='billTime'
+    )
+    bill_expense: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billExpense')
+    bill_product: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billProduct')
+    auto_close_status: ServiceStatusReference | None = Field(
+        default=None, alias='autoCloseStatus'
+    )
+    auto_assign_new_tickets_flag: bool | None = Field(
+        default=None, alias='autoAssignNewTicketsFlag'
+    )
+    auto_assign_new_ec_tickets_flag: bool | None = Field(
+        default=None, alias='autoAssignNewECTicketsFlag'
+    )
+    auto_assign_new_portal_tickets_flag: bool | None = Field(
+        default=None, alias='autoAssignNewPortalTicketsFlag'
+    )
+    discussions_locked_flag: bool | None = Field(
+        default=None, alias='discussionsLockedFlag'
+    )
+    time_entry_locked_flag: bool | None = Field(
+        default=None, alias='timeEntryLockedFlag'
+    )
+    notify_email_from: str | None = Field(default=None, alias='notifyEmailFrom')
+    """
+     Max length: 50;
+    """
+    notify_email_from_name: str | None = Field(
+        default=None, alias='notifyEmailFromName'
+    )
+    """
+     Max length: 60;
+    """
+    closed_loop_discussions_flag: bool | None = Field(
+        default=None, alias='closedLoopDiscussionsFlag'
+    )
+    closed_loop_resolution_flag: bool | None = Field(
+        default=None, alias='closedLoopResolutionFlag'
+    )
+    closed_loop_internal_analysis_flag: bool | None = Field(
+        default=None, alias='closedLoopInternalAnalysisFlag'
+    )
+    time_entry_discussion_flag: bool | None = Field(
+        default=None, alias='timeEntryDiscussionFlag'
+    )
+    time_entry_resolution_flag: bool | None = Field(
+        default=None, alias='timeEntryResolutionFlag'
+    )
+    time_entry_internal_analysis_flag: bool | None = Field(
+        default=None, alias='timeEntryInternalAnalysisFlag'
+    )
+    problem_sort: Literal['Ascending', 'Descending'] | None = Field(
+        default=None, alias='problemSort'
+    )
+    resolution_sort: Literal['Ascending', 'Descending'] | None = Field(
+        default=None, alias='resolutionSort'
+    )
+    internal_analysis_sort: Literal['Ascending', 'Descending'] | None = Field(
+        default=None, alias='internalAnalysisSort'
+    )
+    email_connector_allow_reopen_closed_flag: bool | None = Field(
+        default=None, alias='emailConnectorAllowReopenClosedFlag'
+    )
+    email_connector_reopen_status: ServiceStatusReference | None = Field(
+        default=None, alias='emailConnectorReopenStatus'
+    )
+    email_connector_reopen_resources_flag: bool | None = Field(
+        default=None, alias='emailConnectorReopenResourcesFlag'
+    )
+    """
+    This field can only be set when emailConnectorAllowReopenClosed is true.
+    """
+    email_connector_new_ticket_no_match_flag: bool | None = Field(
+        default=None, alias='emailConnectorNewTicketNoMatchFlag'
+    )
+    """
+    This field can only be set when emailConnectorAllowReopenClosed is true.
+    """
+    email_connector_never_reopen_by_days_flag: bool | None = Field(
+        default=None, alias='emailConnectorNeverReopenByDaysFlag'
+    )
+    """
+    This field can only be set when emailConnectorAllowReopenClosed is true.
+    """
+    email_connector_reopen_days_limit: int | None = Field(
+        default=None, alias='emailConnectorReopenDaysLimit'
+    )
+    """
+    This field can only be set when emailConnectorNeverReopenByDaysFlag and emailConnectorAllowReopenClosed are both true
+                This field is required when emailConnectorNeverReopenByDaysFlag is true.
+    """
+    email_connector_never_reopen_by_days_closed_flag: bool | None = Field(
+        default=None, alias='emailConnectorNeverReopenByDaysClosedFlag'
+    )
+    """
+    This field can only be set when emailConnectorAllowReopenClosed is true.
+    """
+    email_connector_reopen_days_closed_limit: int | None = Field(
+        default=None, alias='emailConnectorReopenDaysClosedLimit'
+    )
+    """
+    This field can only be set when emailConnectorNeverReopenByDaysClosedFlag and emailConnectorAllowReopenClosed are both true
+                This field is required when emailConnectorNeverReopenByDaysClosedFlag is true.
+    """
+    use_member_display_name_flag: bool | None = Field(
+        default=None, alias='useMemberDisplayNameFlag'
+    )
+    send_to_cc_flag: bool | None = Field(default=None, alias='sendToCCFlag')
+    auto_assign_ticket_owner_flag: bool | None = Field(
+        default=None, alias='autoAssignTicketOwnerFlag'
+    )
+    auto_assign_limit_flag: bool | None = Field(
+        default=None, alias='autoAssignLimitFlag'
+    )
+    auto_assign_limit_amount: int | None = Field(
+        default=None, alias='autoAssignLimitAmount'
+    )
+    """
+    This field can only be set when autoAssignLimitFlag is true
+    """
+    closed_loop_all_flag: bool | None = Field(default=None, alias='closedLoopAllFlag')
+    percentage_calculation: Literal[
+        'ActualHours', 'Manual', 'ClosedPhases', 'ClosedTickets'
+    ] | None = Field(default=None, alias='percentageCalculation')
+    all_sort: Literal['Ascending', 'Descending'] | None = Field(
+        default=None, alias='allSort'
+    )
+    mark_first_note_issue_flag: bool | None = Field(
+        default=None, alias='markFirstNoteIssueFlag'
+    )
+    restrict_board_by_default_flag: bool | None = Field(
+        default=None, alias='restrictBoardByDefaultFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.documentreference import DocumentReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.serviceemailtemplatereference import ServiceEmailTemplateReference
+from pyconnectwise.models.manage.servicesignoffreference import ServiceSignoffReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardAutoAssignResource(ConnectWiseModel):
+    id: int | None = None
+    notify_who: NotificationRecipientReference | None = Field(
+        default=None, alias='notifyWho'
+    )
+    member: MemberReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.notificationrecipientreference import NotificationRecipientReference
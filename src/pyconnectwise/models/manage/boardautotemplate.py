@@ -0,0 +1,67 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardAutoTemplate(ConnectWiseModel):
+    id: int | None = None
+    type: ServiceTypeReference | None = None
+    subtype: ServiceSubTypeReference | None = None
+    item: ServiceItemReference | None = None
+    service_template: ServiceTemplateReference | None = Field(
+        default=None, alias='serviceTemplate'
+    )
+    board: BoardReference | None = None
+    summary_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='summarySetting'
+    )
+    discussion_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='discussionSetting'
+    )
+    internal_analysis_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='internalAnalysisSetting'
+    )
+    resolution_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='resolutionSetting'
+    )
+    tasks_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='tasksSetting'
+    )
+    documents_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='documentsSetting'
+    )
+    resources_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='resourcesSetting'
+    )
+    budget_hours_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='budgetHoursSetting'
+    )
+    finance_information_setting: Literal[
+        'Append', 'Overwrite', 'Ignore'
+    ] | None = Field(default=None, alias='financeInformationSetting')
+    send_notes_as_email_setting: Literal[
+        'Append', 'Overwrite', 'Ignore'
+    ] | None = Field(default=None, alias='sendNotesAsEmailSetting')
+    impact_urgency_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='impactUrgencySetting'
+    )
+    template_priority_setting: Literal['Append', 'Overwrite', 'Ignore'] | None = Field(
+        default=None, alias='templatePrioritySetting'
+    )
+    auto_apply_flag: bool | None = Field(default=None, alias='autoApplyFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
+from pyconnectwise.models.manage.servicesubtypereference import ServiceSubTypeReference
+from pyconnectwise.models.manage.servicetemplatereference import ServiceTemplateReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardCopy(ConnectWiseModel):
+    id: int
+    name: str
+    """
+     Max length: 50;
+    """
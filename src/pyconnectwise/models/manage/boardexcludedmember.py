@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardExcludedMember(ConnectWiseModel):
+    id: int | None = None
+    member_id: int | None = Field(default=None, alias='memberId')
+    board_id: int | None = Field(default=None, alias='boardId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
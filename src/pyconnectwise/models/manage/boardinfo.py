@@ -0,0 +1,47 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    project_flag: bool | None = Field(default=None, alias='projectFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    closed_loop_discussions_flag: bool | None = Field(
+        default=None, alias='closedLoopDiscussionsFlag'
+    )
+    closed_loop_internal_analysis_flag: bool | None = Field(
+        default=None, alias='closedLoopInternalAnalysisFlag'
+    )
+    closed_loop_resolution_flag: bool | None = Field(
+        default=None, alias='closedLoopResolutionFlag'
+    )
+    closed_loop_all_flag: bool | None = Field(default=None, alias='closedLoopAllFlag')
+    problem_sort: Literal['Ascending', 'Descending'] | None = Field(
+        default=None, alias='problemSort'
+    )
+    internal_analysis_sort: Literal['Ascending', 'Descending'] | None = Field(
+        default=None, alias='internalAnalysisSort'
+    )
+    resolution_sort: Literal['Ascending', 'Descending'] | None = Field(
+        default=None, alias='resolutionSort'
+    )
+    all_sort: Literal['Ascending', 'Descending'] | None = Field(
+        default=None, alias='allSort'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
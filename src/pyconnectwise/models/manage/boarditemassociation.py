@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardItemAssociation(ConnectWiseModel):
+    id: int
+    sub_type_association_ids: list[int] | None = Field(
+        default=None, alias='subTypeAssociationIds'
+    )
+    """
+    If addAllSubTypesFlag and removeAllSubTypesFlag are both false, this field is required.
+    """
+    add_all_sub_types_flag: bool | None = Field(
+        default=None, alias='addAllSubTypesFlag'
+    )
+    remove_all_sub_types_flag: bool | None = Field(
+        default=None, alias='removeAllSubTypesFlag'
+    )
+    item: ServiceItemReference | None = None
+    board: BoardReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
@@ -0,0 +1,58 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardStatus(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    board: BoardReference | None = None
+    sort_order: int | None = Field(default=None, alias='sortOrder')
+    display_on_board: bool | None = Field(default=None, alias='displayOnBoard')
+    inactive: bool | None = None
+    closed_status: bool | None = Field(default=None, alias='closedStatus')
+    time_entry_not_allowed: bool | None = Field(
+        default=None, alias='timeEntryNotAllowed'
+    )
+    round_robin_catchall: bool | None = Field(default=None, alias='roundRobinCatchall')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    escalation_status: Literal[
+        'NotResponded', 'Responded', 'ResolutionPlan', 'Resolved', 'NoEscalation'
+    ] | None = Field(default=None, alias='escalationStatus')
+    customer_portal_description: str | None = Field(
+        default=None, alias='customerPortalDescription'
+    )
+    """
+     Max length: 500;
+    """
+    customer_portal_flag: bool | None = Field(default=None, alias='customerPortalFlag')
+    email_template: ServiceEmailTemplateReference | None = Field(
+        default=None, alias='emailTemplate'
+    )
+    status_indicator: StatusIndicatorReference | None = Field(
+        default=None, alias='statusIndicator'
+    )
+    custom_status_indicator_name: str | None = Field(
+        default=None, alias='customStatusIndicatorName'
+    )
+    """
+     Max length: 30;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    save_time_as_note: bool | None = Field(default=None, alias='saveTimeAsNote')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.serviceemailtemplatereference import ServiceEmailTemplateReference
+from pyconnectwise.models.manage.statusindicatorreference import StatusIndicatorReference
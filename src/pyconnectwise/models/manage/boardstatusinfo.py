@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardStatusInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    sort_order: int | None = Field(default=None, alias='sortOrder')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
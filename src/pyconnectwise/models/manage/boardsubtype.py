@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardSubType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    type_association_ids: list[int] | None = Field(
+        default=None, alias='typeAssociationIds'
+    )
+    add_all_types_flag: bool | None = Field(default=None, alias='addAllTypesFlag')
+    remove_all_types_flag: bool | None = Field(default=None, alias='removeAllTypesFlag')
+    board: BoardReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardSubTypeInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    type_association_ids: list[int] | None = Field(
+        default=None, alias='typeAssociationIds'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
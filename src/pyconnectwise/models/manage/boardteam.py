@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardTeam(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    team_leader: MemberReference | None = Field(default=None, alias='teamLeader')
+    members: list[int] | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    notify_on_ticket_delete: bool | None = Field(
+        default=None, alias='notifyOnTicketDelete'
+    )
+    default_round_robin_flag: bool | None = Field(
+        default=None, alias='defaultRoundRobinFlag'
+    )
+    round_robin_flag: bool | None = Field(default=None, alias='roundRobinFlag')
+    board_id: int | None = Field(default=None, alias='boardId')
+    location_id: int | None = Field(default=None, alias='locationId')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,44 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    category: Literal['Reactive', 'Proactive'] | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    request_for_change_flag: bool | None = Field(
+        default=None, alias='requestForChangeFlag'
+    )
+    integration_xref: str | None = Field(default=None, alias='integrationXref')
+    """
+     Max length: 50;
+    """
+    skill_category: SkillCategoryReference | None = Field(
+        default=None, alias='skillCategory'
+    )
+    skill: SkillReference | None = None
+    board: BoardReference | None = None
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.skillcategoryreference import SkillCategoryReference
+from pyconnectwise.models.manage.skillreference import SkillReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
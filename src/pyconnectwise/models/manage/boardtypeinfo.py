@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardTypeInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    board: BoardReference | None = None
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
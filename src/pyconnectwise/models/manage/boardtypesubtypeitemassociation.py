@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardTypeSubTypeItemAssociation(ConnectWiseModel):
+    id: int | None = None
+    type: ServiceTypeReference | None = None
+    sub_type: ServiceSubTypeReference | None = Field(default=None, alias='subType')
+    item: ServiceItemReference | None = None
+    board: BoardReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
+from pyconnectwise.models.manage.servicesubtypereference import ServiceSubTypeReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BundleRequest(ConnectWiseModel):
+    sequence_number: int | None = Field(default=None, alias='sequenceNumber')
+    resource_type: str | None = Field(default=None, alias='resourceType')
+    version: str | None = None
+    api_request: ApiRequest | None = Field(default=None, alias='apiRequest')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.apirequest import ApiRequest
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BundleRequestsCollection(ConnectWiseModel):
+    requests: list[BundleRequest]
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.bundlerequest import BundleRequest
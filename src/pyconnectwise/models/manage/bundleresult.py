@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BundleResult(ConnectWiseModel):
+    sequence_number: int | None = Field(default=None, alias='sequenceNumber')
+    resource_type: str | None = Field(default=None, alias='resourceType')
+    entities: list[IRestIdentifiedItem] | None = None
+    count: int | None = None
+    version: str | None = None
+    success: bool | None = None
+    status_code: int | None = Field(default=None, alias='statusCode')
+    error: ErrorResponseMessage | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.errorresponsemessage import ErrorResponseMessage
+from pyconnectwise.models.manage.irestidentifieditem import IRestIdentifiedItem
@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Calendar(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    holiday_list: HolidayListReference | None = Field(default=None, alias='holidayList')
+    monday_start_time: str | None = Field(default=None, alias='mondayStartTime')
+    monday_end_time: str | None = Field(default=None, alias='mondayEndTime')
+    tuesday_start_time: str | None = Field(default=None, alias='tuesdayStartTime')
+    tuesday_end_time: str | None = Field(default=None, alias='tuesdayEndTime')
+    wednesday_start_time: str | None = Field(default=None, alias='wednesdayStartTime')
+    wednesday_end_time: str | None = Field(default=None, alias='wednesdayEndTime')
+    thursday_start_time: str | None = Field(default=None, alias='thursdayStartTime')
+    thursday_end_time: str | None = Field(default=None, alias='thursdayEndTime')
+    friday_start_time: str | None = Field(default=None, alias='fridayStartTime')
+    friday_end_time: str | None = Field(default=None, alias='fridayEndTime')
+    saturday_start_time: str | None = Field(default=None, alias='saturdayStartTime')
+    saturday_end_time: str | None = Field(default=None, alias='saturdayEndTime')
+    sunday_start_time: str | None = Field(default=None, alias='sundayStartTime')
+    sunday_end_time: str | None = Field(default=None, alias='sundayEndTime')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.holidaylistreference import HolidayListReference
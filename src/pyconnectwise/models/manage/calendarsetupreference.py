@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CalendarSetupReference(ConnectWiseModel):
+    id: int | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CallbackEntry(ConnectWiseModel):
+    id: int | None = None
+    description: str | None = None
+    """
+     Max length: 100;
+    """
+    url: str | None = None
+    """
+     Required Reference
+    """
+    object_id: int | None = Field(default=None, alias='objectId')
+    """
+     Required Reference
+    """
+    type: str | None = None
+    """
+     Required Reference
+    """
+    level: str | None = None
+    """
+     Required Reference
+    """
+    member_id: int | None = Field(default=None, alias='memberId')
+    payload_version: str | None = Field(default=None, alias='payloadVersion')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    is_soap_callback_flag: bool | None = Field(default=None, alias='isSoapCallbackFlag')
+    is_self_suppressed_flag: bool | None = Field(
+        default=None, alias='isSelfSuppressedFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,56 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Campaign(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    type: CampaignTypeReference | None = None
+    sub_type: CampaignSubTypeReference | None = Field(default=None, alias='subType')
+    status: CampaignStatusReference | None = None
+    start_date: datetime = Field(..., alias='startDate')
+    end_date: datetime | None = Field(default=None, alias='endDate')
+    location_id: int | None = Field(default=None, alias='locationId')
+    member: MemberReference | None = None
+    inactive: bool | None = None
+    inactive_days_after_end: int | None = Field(
+        default=None, alias='inactiveDaysAfterEnd'
+    )
+    notes: str | None = None
+    default_group: GroupReference | None = Field(default=None, alias='defaultGroup')
+    marketing_manager_default_track_id: int | None = Field(
+        default=None, alias='marketingManagerDefaultTrackId'
+    )
+    opportunity_default_track_id: int | None = Field(
+        default=None, alias='opportunityDefaultTrackId'
+    )
+    impressions: int | None = None
+    budget_revenue: float | None = Field(default=None, alias='budgetRevenue')
+    budget_cost: float | None = Field(default=None, alias='budgetCost')
+    actual_cost: float | None = Field(default=None, alias='actualCost')
+    budget_gross_margin: float | None = Field(default=None, alias='budgetGrossMargin')
+    budget_roi: float | None = Field(default=None, alias='budgetROI')
+    actual_revenue: float | None = Field(default=None, alias='actualRevenue')
+    actual_gross_margin: float | None = Field(default=None, alias='actualGrossMargin')
+    actual_roi: float | None = Field(default=None, alias='actualROI')
+    emails_sent: int | None = Field(default=None, alias='emailsSent')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.campaignstatusreference import CampaignStatusReference
+from pyconnectwise.models.manage.campaignsubtypereference import CampaignSubTypeReference
+from pyconnectwise.models.manage.campaigntypereference import CampaignTypeReference
+from pyconnectwise.models.manage.groupreference import GroupReference
+from pyconnectwise.models.manage.memberreference import MemberReference
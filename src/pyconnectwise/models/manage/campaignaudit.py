@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CampaignAudit(ConnectWiseModel):
+    id: int | None = None
+    emails_sent: int = Field(..., alias='emailsSent')
+    emails_unsent: int | None = Field(default=None, alias='emailsUnsent')
+    documents_created: int | None = Field(default=None, alias='documentsCreated')
+    email_subject: str | None = Field(default=None, alias='emailSubject')
+    """
+     Max length: 1000;
+    """
+    group: GroupReference | None = None
+    campaign_id: int | None = Field(default=None, alias='campaignId')
+    created_by: str | None = Field(default=None, alias='createdBy')
+    date_created: str | None = Field(default=None, alias='dateCreated')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.groupreference import GroupReference
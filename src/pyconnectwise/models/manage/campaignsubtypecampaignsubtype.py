@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CampaignSubTypeCampaignSubType(ConnectWiseModel):
+    id: int | None = None
+    type: CampaignTypeReference | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.campaigntypereference import CampaignTypeReference
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CampaignType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
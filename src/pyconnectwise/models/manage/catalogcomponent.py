@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogComponent(ConnectWiseModel):
+    id: int | None = None
+    sequence_number: int | None = Field(default=None, alias='sequenceNumber')
+    quantity: float
+    catalog_item: CatalogItemReference | None = Field(default=None, alias='catalogItem')
+    hide_price_flag: bool | None = Field(default=None, alias='hidePriceFlag')
+    hide_item_identifier_flag: bool | None = Field(
+        default=None, alias='hideItemIdentifierFlag'
+    )
+    hide_description_flag: bool | None = Field(
+        default=None, alias='hideDescriptionFlag'
+    )
+    hide_quantity_flag: bool | None = Field(default=None, alias='hideQuantityFlag')
+    hide_extended_price_flag: bool | None = Field(
+        default=None, alias='hideExtendedPriceFlag'
+    )
+    parent_catalog_item: CatalogItemReference | None = Field(
+        default=None, alias='parentCatalogItem'
+    )
+    price: float | None = None
+    cost: float | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.catalogitemreference import CatalogItemReference
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogInventory(ConnectWiseModel):
+    id: int | None = None
+    catalog_item: CatalogItemReference | None = Field(default=None, alias='catalogItem')
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    on_hand: int | None = Field(default=None, alias='onHand')
+    serial_numbers: list[OnHandSerialNumberReference] | None = Field(
+        default=None, alias='serialNumbers'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.catalogitemreference import CatalogItemReference
+from pyconnectwise.models.manage.onhandserialnumberreference import OnHandSerialNumberReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
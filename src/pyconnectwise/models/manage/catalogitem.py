@@ -0,0 +1,109 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogItem(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 60;
+    """
+    description: str
+    """
+     Max length: 60;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    subcategory: ProductSubCategoryReference | None = None
+    type: ProductTypeReference | None = None
+    product_class: Literal[
+        'Agreement', 'Bundle', 'Inventory', 'NonInventory', 'Service'
+    ] | None = Field(default=None, alias='productClass')
+    """
+    Defaults to Non-Inventory.
+    """
+    serialized_flag: bool | None = Field(default=None, alias='serializedFlag')
+    serialized_cost_flag: bool | None = Field(default=None, alias='serializedCostFlag')
+    phase_product_flag: bool | None = Field(default=None, alias='phaseProductFlag')
+    unit_of_measure: UnitOfMeasureReference | None = Field(
+        default=None, alias='unitOfMeasure'
+    )
+    min_stock_level: int | None = Field(default=None, alias='minStockLevel')
+    price: float | None = None
+    cost: float | None = None
+    price_attribute: Literal[
+        'FixedFee', 'NotToExceed', 'OverrideRate', 'TimeAndMaterials'
+    ] | None = Field(default=None, alias='priceAttribute')
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    drop_ship_flag: bool | None = Field(default=None, alias='dropShipFlag')
+    special_order_flag: bool | None = Field(default=None, alias='specialOrderFlag')
+    customer_description: str = Field(..., alias='customerDescription')
+    """
+     Max length: 6000;
+    """
+    manufacturer: ManufacturerReference | None = None
+    manufacturer_part_number: str | None = Field(
+        default=None, alias='manufacturerPartNumber'
+    )
+    """
+     Max length: 50;
+    """
+    vendor: CompanyReference | None = None
+    vendor_sku: str | None = Field(default=None, alias='vendorSku')
+    """
+     Max length: 50;
+    """
+    notes: str | None = None
+    integration_x_ref: str | None = Field(default=None, alias='integrationXRef')
+    """
+     Max length: 50;
+    """
+    sla: SLAReference | None = None
+    entity_type: EntityTypeReference | None = Field(default=None, alias='entityType')
+    recurring_flag: bool | None = Field(default=None, alias='recurringFlag')
+    recurring_revenue: float | None = Field(default=None, alias='recurringRevenue')
+    recurring_cost: float | None = Field(default=None, alias='recurringCost')
+    recurring_one_time_flag: bool | None = Field(
+        default=None, alias='recurringOneTimeFlag'
+    )
+    recurring_bill_cycle: BillingCycleReference | None = Field(
+        default=None, alias='recurringBillCycle'
+    )
+    recurring_cycle_type: Literal['ContractYear', 'CalendarYear'] | None = Field(
+        default=None, alias='recurringCycleType'
+    )
+    date_entered: str | None = Field(default=None, alias='dateEntered')
+    calculated_price_flag: bool | None = Field(
+        default=None, alias='calculatedPriceFlag'
+    )
+    calculated_cost_flag: bool | None = Field(default=None, alias='calculatedCostFlag')
+    category: ProductCategoryReference | None = None
+    calculated_price: float | None = Field(default=None, alias='calculatedPrice')
+    calculated_cost: float | None = Field(default=None, alias='calculatedCost')
+    billable_option: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billableOption')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingcyclereference import BillingCycleReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.entitytypereference import EntityTypeReference
+from pyconnectwise.models.manage.manufacturerreference import ManufacturerReference
+from pyconnectwise.models.manage.productcategoryreference import ProductCategoryReference
+from pyconnectwise.models.manage.productsubcategoryreference import ProductSubCategoryReference
+from pyconnectwise.models.manage.producttypereference import ProductTypeReference
+from pyconnectwise.models.manage.slareference import SLAReference
+from pyconnectwise.models.manage.unitofmeasurereference import UnitOfMeasureReference
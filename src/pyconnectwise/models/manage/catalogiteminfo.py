@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogItemInfo(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    description: str | None = None
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    product_class: Literal[
+        'Agreement', 'Bundle', 'Inventory', 'NonInventory', 'Service'
+    ] | None = Field(default=None, alias='productClass')
+    serialized_cost_flag: bool | None = Field(default=None, alias='serializedCostFlag')
+    price: float | None = None
+    cost: float | None = None
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    drop_ship_flag: bool | None = Field(default=None, alias='dropShipFlag')
+    special_order_flag: bool | None = Field(default=None, alias='specialOrderFlag')
+    customer_description: str | None = Field(default=None, alias='customerDescription')
+    manufacturer_part_number: str | None = Field(
+        default=None, alias='manufacturerPartNumber'
+    )
+    vendor_sku: str | None = Field(default=None, alias='vendorSku')
+    billable_option: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billableOption')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogPricing(ConnectWiseModel):
+    catalog_item: CatalogItemReference | None = Field(default=None, alias='catalogItem')
+    company: CompanyReference | None = None
+    location: SystemLocationReference | None = None
+    quantity: int | None = None
+    date: str | None = None
+    price: float | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.catalogitemreference import CatalogItemReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Category(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    price_level_xref: str | None = Field(default=None, alias='priceLevelXref')
+    """
+     Max length: 10;
+    """
+    integration_xref: str | None = Field(default=None, alias='integrationXref')
+    """
+     Max length: 50;
+    """
+    location_ids: list[int] | None = Field(default=None, alias='locationIds')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    add_all_locations: bool | None = Field(default=None, alias='addAllLocations')
+    remove_all_locations: bool | None = Field(default=None, alias='removeAllLocations')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
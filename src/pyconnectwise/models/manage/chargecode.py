@@ -0,0 +1,45 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ChargeCode(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    company: CompanyReference | None = None
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] | None = Field(
+        default=None, alias='billTime'
+    )
+    expense_entry_flag: bool | None = Field(default=None, alias='expenseEntryFlag')
+    allow_all_expense_type_flag: bool | None = Field(
+        default=None, alias='allowAllExpenseTypeFlag'
+    )
+    time_entry_flag: bool | None = Field(default=None, alias='timeEntryFlag')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    integration_xref: str | None = Field(default=None, alias='integrationXref')
+    """
+     Max length: 50;
+    """
+    expense_type_ids: list[int] | None = Field(default=None, alias='expenseTypeIds')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
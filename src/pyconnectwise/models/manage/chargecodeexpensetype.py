@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ChargeCodeExpenseType(ConnectWiseModel):
+    id: int | None = None
+    type: ExpenseTypeReference | None = None
+    charge_code: ChargeCodeReference | None = Field(default=None, alias='chargeCode')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.chargecodereference import ChargeCodeReference
+from pyconnectwise.models.manage.expensetypereference import ExpenseTypeReference
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Classification(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    multiplier: float | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    company_flag: bool | None = Field(default=None, alias='companyFlag')
+    employee_flag: bool | None = Field(default=None, alias='employeeFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
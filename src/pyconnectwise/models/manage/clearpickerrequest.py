@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ClearPickerRequest(ConnectWiseModel):
+    member: MemberReference | None = None
+    type: Literal['Company', 'Vendor'] | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
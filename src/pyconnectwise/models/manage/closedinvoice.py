@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ClosedInvoice(ConnectWiseModel):
+    id: int | None = None
+    status: BillingStatusReference | None = None
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingstatusreference import BillingStatusReference
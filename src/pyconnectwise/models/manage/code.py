@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Code(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    description: str
+    board_id: int | None = Field(default=None, alias='boardId')
+    location_id: int | None = Field(default=None, alias='locationId')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,84 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Commission(ConnectWiseModel):
+    id: int | None = None
+    member: MemberReference | None = None
+    commission_percent: float | None = Field(default=None, alias='commissionPercent')
+    date_start: datetime | None = Field(default=None, alias='dateStart')
+    date_end: datetime | None = Field(default=None, alias='dateEnd')
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    company: CompanyReference | None = None
+    site: SiteReference | None = None
+    agreement: AgreementReference | None = None
+    project: ProjectReference | None = None
+    service_board: BoardReference | None = Field(default=None, alias='serviceBoard')
+    ticket: TicketReference | None = None
+    territory: SystemLocationReference | None = None
+    billing_method: Literal[
+        'Agreement',
+        'CreditMemo',
+        'DownPayment',
+        'Miscellaneous',
+        'Progress',
+        'Standard',
+    ] | None = Field(default=None, alias='billingMethod')
+    service_type: ServiceTypeReference | None = Field(default=None, alias='serviceType')
+    project_board: ProjectBoardReference | None = Field(
+        default=None, alias='projectBoard'
+    )
+    project_type: ProjectTypeReference | None = Field(default=None, alias='projectType')
+    agreement_type: AgreementTypeReference | None = Field(
+        default=None, alias='agreementType'
+    )
+    number_of_months: int | None = Field(default=None, alias='numberOfMonths')
+    product_category: ProductCategoryReference | None = Field(
+        default=None, alias='productCategory'
+    )
+    product_sub_category: ProductSubCategoryReference | None = Field(
+        default=None, alias='productSubCategory'
+    )
+    item: IvItemReference | None = None
+    commission_basis: Literal['GrossProfit', 'SalesAmount'] | None = Field(
+        default=None, alias='commissionBasis'
+    )
+    invoice_option: Literal['AllInvoices', 'PaidInvoices'] | None = Field(
+        default=None, alias='invoiceOption'
+    )
+    services_flag: bool | None = Field(default=None, alias='servicesFlag')
+    agreements_flag: bool | None = Field(default=None, alias='agreementsFlag')
+    products_flag: bool | None = Field(default=None, alias='productsFlag')
+    my_opportunities_flag: bool | None = Field(
+        default=None, alias='myOpportunitiesFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.productcategoryreference import ProductCategoryReference
+from pyconnectwise.models.manage.productsubcategoryreference import ProductSubCategoryReference
+from pyconnectwise.models.manage.projectboardreference import ProjectBoardReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.projecttypereference import ProjectTypeReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
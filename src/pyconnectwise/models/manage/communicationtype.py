@@ -0,0 +1,43 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CommunicationType(ConnectWiseModel):
+    id: int | None = None
+    description: str
+    phone_flag: bool | None = Field(default=None, alias='phoneFlag')
+    """
+    Gets or sets at least one flag is required to be true -- phone, fax, or email.
+    """
+    fax_flag: bool | None = Field(default=None, alias='faxFlag')
+    """
+    Gets or sets at least one flag is required to be true -- phone, fax, or email.
+    """
+    email_flag: bool | None = Field(default=None, alias='emailFlag')
+    """
+    Gets or sets at least one flag is required to be true -- phone, fax, or email.
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    exchange_xref: str | None = Field(default=None, alias='exchangeXref')
+    """
+     Max length: 50;
+    """
+    iphone_xref: str | None = Field(default=None, alias='iphoneXref')
+    """
+     Max length: 50;
+    """
+    android_xref: str | None = Field(default=None, alias='androidXref')
+    """
+     Max length: 50;
+    """
+    google_xref: str | None = Field(default=None, alias='googleXref')
+    """
+     Max length: 50;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CommunicationTypeInfo(ConnectWiseModel):
+    id: int | None = None
+    description: str | None = None
+    phone_flag: bool | None = Field(default=None, alias='phoneFlag')
+    fax_flag: bool | None = Field(default=None, alias='faxFlag')
+    email_flag: bool | None = Field(default=None, alias='emailFlag')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
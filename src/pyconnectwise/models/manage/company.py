@@ -0,0 +1,202 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Company(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 30;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    status: CompanyStatusReference | None = None
+    address_line1: str | None = Field(default=None, alias='addressLine1')
+    """
+    Gets or sets at least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country. Max length: 50;
+    """
+    address_line2: str | None = Field(default=None, alias='addressLine2')
+    """
+    Gets or sets at least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country. Max length: 50;
+    """
+    city: str | None = None
+    """
+    Gets or sets at least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country. Max length: 50;
+    """
+    state: str | None = None
+    """
+    Gets or sets at least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country. Max length: 50;
+    """
+    zip: str | None = None
+    """
+    Gets or sets at least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country. Max length: 12;
+    """
+    country: CountryReference | None = None
+    phone_number: str | None = Field(default=None, alias='phoneNumber')
+    """
+     Max length: 30;
+    """
+    fax_number: str | None = Field(default=None, alias='faxNumber')
+    """
+     Max length: 30;
+    """
+    website: str | None = None
+    """
+     Max length: 255;
+    """
+    territory: SystemLocationReference | None = None
+    market: MarketDescriptionReference | None = None
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    default_contact: ContactReference | None = Field(
+        default=None, alias='defaultContact'
+    )
+    date_acquired: datetime | None = Field(default=None, alias='dateAcquired')
+    sic_code: SicCodeReference | None = Field(default=None, alias='sicCode')
+    parent_company: CompanyReference | None = Field(default=None, alias='parentCompany')
+    annual_revenue: float | None = Field(default=None, alias='annualRevenue')
+    number_of_employees: int | None = Field(default=None, alias='numberOfEmployees')
+    year_established: int | None = Field(default=None, alias='yearEstablished')
+    revenue_year: int | None = Field(default=None, alias='revenueYear')
+    ownership_type: OwnershipTypeReference | None = Field(
+        default=None, alias='ownershipType'
+    )
+    time_zone_setup: TimeZoneSetupReference | None = Field(
+        default=None, alias='timeZoneSetup'
+    )
+    lead_source: str | None = Field(default=None, alias='leadSource')
+    """
+     Max length: 50;
+    """
+    lead_flag: bool | None = Field(default=None, alias='leadFlag')
+    unsubscribe_flag: bool | None = Field(default=None, alias='unsubscribeFlag')
+    calendar: CalendarReference | None = None
+    user_defined_field1: str | None = Field(default=None, alias='userDefinedField1')
+    """
+     Max length: 50;
+    """
+    user_defined_field2: str | None = Field(default=None, alias='userDefinedField2')
+    """
+     Max length: 50;
+    """
+    user_defined_field3: str | None = Field(default=None, alias='userDefinedField3')
+    """
+     Max length: 50;
+    """
+    user_defined_field4: str | None = Field(default=None, alias='userDefinedField4')
+    """
+     Max length: 50;
+    """
+    user_defined_field5: str | None = Field(default=None, alias='userDefinedField5')
+    """
+     Max length: 50;
+    """
+    user_defined_field6: str | None = Field(default=None, alias='userDefinedField6')
+    """
+     Max length: 50;
+    """
+    user_defined_field7: str | None = Field(default=None, alias='userDefinedField7')
+    """
+     Max length: 50;
+    """
+    user_defined_field8: str | None = Field(default=None, alias='userDefinedField8')
+    """
+     Max length: 50;
+    """
+    user_defined_field9: str | None = Field(default=None, alias='userDefinedField9')
+    """
+     Max length: 50;
+    """
+    user_defined_field10: str | None = Field(default=None, alias='userDefinedField10')
+    """
+     Max length: 50;
+    """
+    vendor_identifier: str | None = Field(default=None, alias='vendorIdentifier')
+    tax_identifier: str | None = Field(default=None, alias='taxIdentifier')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    invoice_template: InvoiceTemplateReference | None = Field(
+        default=None, alias='invoiceTemplate'
+    )
+    pricing_schedule: PricingScheduleReference | None = Field(
+        default=None, alias='pricingSchedule'
+    )
+    company_entity_type: EntityTypeReference | None = Field(
+        default=None, alias='companyEntityType'
+    )
+    bill_to_company: CompanyReference | None = Field(
+        default=None, alias='billToCompany'
+    )
+    billing_site: SiteReference | None = Field(default=None, alias='billingSite')
+    billing_contact: ContactReference | None = Field(
+        default=None, alias='billingContact'
+    )
+    invoice_delivery_method: BillingDeliveryReference | None = Field(
+        default=None, alias='invoiceDeliveryMethod'
+    )
+    invoice_to_email_address: str | None = Field(
+        default=None, alias='invoiceToEmailAddress'
+    )
+    invoice_cc_email_address: str | None = Field(
+        default=None, alias='invoiceCCEmailAddress'
+    )
+    deleted_flag: bool | None = Field(default=None, alias='deletedFlag')
+    date_deleted: datetime | None = Field(default=None, alias='dateDeleted')
+    deleted_by: str | None = Field(default=None, alias='deletedBy')
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    facebook_url: str | None = Field(default=None, alias='facebookUrl')
+    twitter_url: str | None = Field(default=None, alias='twitterUrl')
+    linked_in_url: str | None = Field(default=None, alias='linkedInUrl')
+    currency: CurrencyReference | None = None
+    territory_manager: MemberReference | None = Field(
+        default=None, alias='territoryManager'
+    )
+    reseller_identifier: str | None = Field(default=None, alias='resellerIdentifier')
+    is_vendor_flag: bool | None = Field(default=None, alias='isVendorFlag')
+    types: list[CompanyTypeReference] | None = None
+    """
+    Gets or sets integrer array of Company_Type_Recids to be assigned to company that can be passed in only during new company creation (post)
+                To update existing companies type, use the /company/companyTypeAssociations or /company/companies/{ID}/typeAssociations endpoints.
+    """
+    site: SiteReference | None = None
+    integrator_tags: list[str] | None = Field(default=None, alias='integratorTags')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingdeliveryreference import BillingDeliveryReference
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.calendarreference import CalendarReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.companystatusreference import CompanyStatusReference
+from pyconnectwise.models.manage.companytypereference import CompanyTypeReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.entitytypereference import EntityTypeReference
+from pyconnectwise.models.manage.invoicetemplatereference import InvoiceTemplateReference
+from pyconnectwise.models.manage.marketdescriptionreference import MarketDescriptionReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.ownershiptypereference import OwnershipTypeReference
+from pyconnectwise.models.manage.pricingschedulereference import PricingScheduleReference
+from pyconnectwise.models.manage.siccodereference import SicCodeReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
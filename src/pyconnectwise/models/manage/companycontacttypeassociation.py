@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyContactTypeAssociation(ConnectWiseModel):
+    id: int | None = None
+    type: ContactTypeReference | None = None
+    contact: ContactReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.contacttypereference import ContactTypeReference
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyCustomNote(ConnectWiseModel):
+    id: int | None = None
+    custom_note: str = Field(..., alias='customNote')
+    """
+     Max length: 1500;
+    """
+    status: CompanyStatusReference | None = None
+    company: CompanyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.companystatusreference import CompanyStatusReference
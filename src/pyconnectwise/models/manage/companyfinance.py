@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyFinance(ConnectWiseModel):
+    id: int | None = None
+    bill_override_flag: bool | None = Field(default=None, alias='billOverrideFlag')
+    bill_sr_flag: bool | None = Field(default=None, alias='billSrFlag')
+    bill_complete_sr_flag: bool | None = Field(default=None, alias='billCompleteSrFlag')
+    bill_unapproved_sr_flag: bool | None = Field(
+        default=None, alias='billUnapprovedSrFlag'
+    )
+    bill_restrict_pm_flag: bool | None = Field(default=None, alias='billRestrictPmFlag')
+    bill_complete_pm_flag: bool | None = Field(default=None, alias='billCompletePmFlag')
+    bill_unapproved_pm_flag: bool | None = Field(
+        default=None, alias='billUnapprovedPmFlag'
+    )
+    email_template: EmailTemplateReference | None = Field(
+        default=None, alias='emailTemplate'
+    )
+    company: CompanyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.emailtemplatereference import EmailTemplateReference
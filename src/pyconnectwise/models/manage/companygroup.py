@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyGroup(ConnectWiseModel):
+    id: int | None = None
+    """
+     Required On Updates;
+    """
+    group: GroupReference | None = None
+    company: CompanyReference | None = None
+    default_contact_flag: bool | None = Field(default=None, alias='defaultContactFlag')
+    all_contacts_flag: bool | None = Field(default=None, alias='allContactsFlag')
+    remove_all_contacts_flag: bool | None = Field(
+        default=None, alias='removeAllContactsFlag'
+    )
+    unsubscribe_flag: bool | None = Field(default=None, alias='unsubscribeFlag')
+    contact_ids: list[int] | None = Field(default=None, alias='contactIds')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.groupreference import GroupReference
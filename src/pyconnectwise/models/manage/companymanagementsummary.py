@@ -0,0 +1,90 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyManagementSummary(ConnectWiseModel):
+    id: int | None = None
+    management_solution: ManagementSolutionReference | None = Field(
+        default=None, alias='managementSolution'
+    )
+    group_identifier: str = Field(..., alias='groupIdentifier')
+    """
+     Max length: 100;
+    """
+    device_type: Literal[
+        'WorkstationsAndServers', 'BackupStats', 'Servers', 'Workstations'
+    ] | None = Field(default=None, alias='deviceType')
+    """
+    Gets or sets deviceType is required if the managementSolution is Legacy.
+    """
+    agreement: AgreementReference | None = None
+    snmp_machines: int | None = Field(default=None, alias='snmpMachines')
+    total_workstations: int | None = Field(default=None, alias='totalWorkstations')
+    total_servers: int | None = Field(default=None, alias='totalServers')
+    total_windows_servers: int | None = Field(default=None, alias='totalWindowsServers')
+    total_windows_workstations: int | None = Field(
+        default=None, alias='totalWindowsWorkstations'
+    )
+    total_managed_machines: int | None = Field(
+        default=None, alias='totalManagedMachines'
+    )
+    servers_offline: int | None = Field(default=None, alias='serversOffline')
+    servers_disk_space_low: int | None = Field(
+        default=None, alias='serversDiskSpaceLow'
+    )
+    failed_backup_jobs: int | None = Field(default=None, alias='failedBackupJobs')
+    total_notifications: int | None = Field(default=None, alias='totalNotifications')
+    successful_backup_jobs: int | None = Field(
+        default=None, alias='successfulBackupJobs'
+    )
+    server_availability: int | None = Field(default=None, alias='serverAvailability')
+    viruses_removed: int | None = Field(default=None, alias='virusesRemoved')
+    spyware_items_removed: int | None = Field(default=None, alias='spywareItemsRemoved')
+    windows_patches_installed: int | None = Field(
+        default=None, alias='windowsPatchesInstalled'
+    )
+    disk_cleanups: int | None = Field(default=None, alias='diskCleanups')
+    disk_defragmentations: int | None = Field(
+        default=None, alias='diskDefragmentations'
+    )
+    fully_patched_machines: int | None = Field(
+        default=None, alias='fullyPatchedMachines'
+    )
+    missing_one_two_patches_machines: int | None = Field(
+        default=None, alias='missingOneTwoPatchesMachines'
+    )
+    missing_three_five_patches_machines: int | None = Field(
+        default=None, alias='missingThreeFivePatchesMachines'
+    )
+    missing_more_five_patches_machines: int | None = Field(
+        default=None, alias='missingMoreFivePatchesMachines'
+    )
+    missing_unscanned_patches_machines: int | None = Field(
+        default=None, alias='missingUnscannedPatchesMachines'
+    )
+    alerts_generated: str | None = Field(default=None, alias='alertsGenerated')
+    internet_connectivity: float | None = Field(
+        default=None, alias='internetConnectivity'
+    )
+    disk_space_cleaned_mb: int | None = Field(default=None, alias='diskSpaceCleanedMb')
+    missing_security_patches: str | None = Field(
+        default=None, alias='missingSecurityPatches'
+    )
+    cpu_utilization: float | None = Field(default=None, alias='cpuUtilization')
+    memory_utilization: float | None = Field(default=None, alias='memoryUtilization')
+    company: CompanyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.managementsolutionreference import ManagementSolutionReference
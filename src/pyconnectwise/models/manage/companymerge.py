@@ -0,0 +1,93 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyMerge(ConnectWiseModel):
+    to_company_id: int = Field(..., alias='toCompanyId')
+    name: Literal['From', 'To'] | None = None
+    identifier: Literal['From', 'To'] | None = None
+    status: Literal['From', 'To'] | None = None
+    type: Literal['From', 'To'] | None = None
+    primary_address: Literal['From', 'To'] | None = Field(
+        default=None, alias='primaryAddress'
+    )
+    primary_contact: Literal['From', 'To'] | None = Field(
+        default=None, alias='primaryContact'
+    )
+    phone: Literal['From', 'To'] | None = None
+    fax: Literal['From', 'To'] | None = None
+    website: Literal['From', 'To'] | None = None
+    market: Literal['From', 'To'] | None = None
+    territory: Literal['From', 'To'] | None = None
+    revenue: Literal['From', 'To'] | None = None
+    revenue_year: Literal['From', 'To'] | None = Field(
+        default=None, alias='revenueYear'
+    )
+    number_of_employees: Literal['From', 'To'] | None = Field(
+        default=None, alias='numberOfEmployees'
+    )
+    sic_code: Literal['From', 'To'] | None = Field(default=None, alias='sicCode')
+    date_acquired: Literal['From', 'To'] | None = Field(
+        default=None, alias='dateAcquired'
+    )
+    time_zone: Literal['From', 'To'] | None = Field(default=None, alias='timeZone')
+    source_list: Literal['From', 'To'] | None = Field(default=None, alias='sourceList')
+    user_defined_field1: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField1'
+    )
+    user_defined_field2: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField2'
+    )
+    user_defined_field3: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField3'
+    )
+    user_defined_field4: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField4'
+    )
+    user_defined_field5: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField5'
+    )
+    user_defined_field6: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField6'
+    )
+    user_defined_field7: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField7'
+    )
+    user_defined_field8: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField8'
+    )
+    user_defined_field9: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField9'
+    )
+    user_defined_field10: Literal['From', 'To'] | None = Field(
+        default=None, alias='userDefinedField10'
+    )
+    billing_address: Literal['From', 'To'] | None = Field(
+        default=None, alias='billingAddress'
+    )
+    billing_contact: Literal['From', 'To'] | None = Field(
+        default=None, alias='billingContact'
+    )
+    tax_code: Literal['From', 'To'] | None = Field(default=None, alias='taxCode')
+    account_number: Literal['From', 'To'] | None = Field(
+        default=None, alias='accountNumber'
+    )
+    billing_terms: Literal['From', 'To'] | None = Field(
+        default=None, alias='billingTerms'
+    )
+    notes: Literal['Discard', 'Merge'] | None = None
+    sites: Literal['Discard', 'Merge'] | None = None
+    activities: Literal['Discard', 'Merge'] | None = None
+    opportunities: Literal['Discard', 'Merge'] | None = None
+    services: Literal['Discard', 'Merge'] | None = None
+    projects: Literal['Discard', 'Merge'] | None = None
+    contacts: Literal['Discard', 'Merge'] | None = None
+    documents: Literal['Discard', 'Merge'] | None = None
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyNote(ConnectWiseModel):
+    id: int | None = None
+    text: str
+    type: NoteTypeReference | None = None
+    flagged: bool | None = None
+    entered_by: str | None = Field(default=None, alias='enteredBy')
+    company: CompanyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.notetypereference import NoteTypeReference
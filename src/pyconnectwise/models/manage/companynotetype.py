@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyNoteType(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    """
+     Max length: 15;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    import_flag: bool | None = Field(default=None, alias='importFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyPickerItem(ConnectWiseModel):
+    id: int | None = None
+    member: MemberReference | None = None
+    company: CompanyReference | None = None
+    company_status: CompanyStatusReference | None = Field(
+        default=None, alias='companyStatus'
+    )
+    company_type: CompanyTypeReference | None = Field(default=None, alias='companyType')
+    company_site: SiteReference | None = Field(default=None, alias='companySite')
+    company_location: SystemLocationReference | None = Field(
+        default=None, alias='companyLocation'
+    )
+    company_country: CountryReference | None = Field(
+        default=None, alias='companyCountry'
+    )
+    vendor_picker_flag: bool | None = Field(default=None, alias='vendorPickerFlag')
+    """
+    Gets or sets if true, this record was created by the vendor picker component. Otherwise, the record was created by the company picker component.
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.companystatusreference import CompanyStatusReference
+from pyconnectwise.models.manage.companytypereference import CompanyTypeReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
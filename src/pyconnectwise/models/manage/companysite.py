@@ -0,0 +1,81 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanySite(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    address_line1: str | None = Field(default=None, alias='addressLine1')
+    """
+     Max length: 50;
+    """
+    address_line2: str | None = Field(default=None, alias='addressLine2')
+    """
+     Max length: 50;
+    """
+    city: str | None = None
+    """
+     Max length: 50;
+    """
+    state_reference: StateReference | None = Field(default=None, alias='stateReference')
+    zip: str | None = None
+    """
+     Max length: 12;
+    """
+    country: CountryReference | None = None
+    address_format: str | None = Field(default=None, alias='addressFormat')
+    phone_number: str | None = Field(default=None, alias='phoneNumber')
+    """
+     Max length: 30;
+    """
+    phone_number_ext: str | None = Field(default=None, alias='phoneNumberExt')
+    """
+     Max length: 30;
+    """
+    fax_number: str | None = Field(default=None, alias='faxNumber')
+    """
+     Max length: 30;
+    """
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    entity_type: EntityTypeReference | None = Field(default=None, alias='entityType')
+    expense_reimbursement: float | None = Field(
+        default=None, alias='expenseReimbursement'
+    )
+    primary_address_flag: bool | None = Field(default=None, alias='primaryAddressFlag')
+    default_shipping_flag: bool | None = Field(
+        default=None, alias='defaultShippingFlag'
+    )
+    default_billing_flag: bool | None = Field(default=None, alias='defaultBillingFlag')
+    default_mailing_flag: bool | None = Field(default=None, alias='defaultMailingFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    bill_separate_flag: bool | None = Field(default=None, alias='billSeparateFlag')
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    calendar: CalendarReference | None = None
+    time_zone: TimeZoneSetupReference | None = Field(default=None, alias='timeZone')
+    company: CompanyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.calendarreference import CalendarReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.entitytypereference import EntityTypeReference
+from pyconnectwise.models.manage.statereference import StateReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyStatus(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    notify_flag: bool | None = Field(default=None, alias='notifyFlag')
+    disallow_saving_flag: bool | None = Field(default=None, alias='disallowSavingFlag')
+    notification_message: str | None = Field(default=None, alias='notificationMessage')
+    """
+     Max length: 500;
+    """
+    custom_note_flag: bool | None = Field(default=None, alias='customNoteFlag')
+    cancel_open_tracks_flag: bool | None = Field(
+        default=None, alias='cancelOpenTracksFlag'
+    )
+    track: TrackReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.trackreference import TrackReference
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyTeam(ConnectWiseModel):
+    id: int | None = None
+    company: CompanyReference | None = None
+    team_role: TeamRoleReference | None = Field(default=None, alias='teamRole')
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    contact: ContactReference | None = None
+    member: MemberReference | None = None
+    account_manager_flag: bool | None = Field(default=None, alias='accountManagerFlag')
+    tech_flag: bool | None = Field(default=None, alias='techFlag')
+    sales_flag: bool | None = Field(default=None, alias='salesFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.teamrolereference import TeamRoleReference
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    vendor_flag: bool | None = Field(default=None, alias='vendorFlag')
+    service_alert_flag: bool | None = Field(default=None, alias='serviceAlertFlag')
+    service_alert_message: str | None = Field(default=None, alias='serviceAlertMessage')
+    """
+     Max length: 150;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyTypeInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    is_vendor: bool | None = Field(default=None, alias='isVendor')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
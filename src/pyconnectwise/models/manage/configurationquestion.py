@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationQuestion(ConnectWiseModel):
+    answer_id: int | None = Field(default=None, alias='answerId')
+    question_id: int | None = Field(default=None, alias='questionId')
+    question: str | None = None
+    answer: dict[str, Any] | None = None
+    sequence_number: float | None = Field(default=None, alias='sequenceNumber')
+    number_of_decimals: int | None = Field(default=None, alias='numberOfDecimals')
+    field_type: Literal[
+        'TextArea',
+        'Currency',
+        'Date',
+        'Hyperlink',
+        'IPAddress',
+        'Checkbox',
+        'Number',
+        'Percent',
+        'Text',
+        'Password',
+    ] | None = Field(default=None, alias='fieldType')
+    required_flag: bool | None = Field(default=None, alias='requiredFlag')
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationReference(ConnectWiseModel):
+    id: int | None = None
+    device_identifier: str | None = Field(default=None, alias='deviceIdentifier')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
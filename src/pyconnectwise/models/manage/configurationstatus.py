@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationStatus(ConnectWiseModel):
+    id: int | None = None
+    description: str
+    """
+     Max length: 50;
+    """
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    system_flag: bool | None = Field(default=None, alias='systemFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,45 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationTypeQuestion(ConnectWiseModel):
+    id: int | None = None
+    configuration_type: ConfigurationTypeReference | None = Field(
+        default=None, alias='configurationType'
+    )
+    field_type: Literal[
+        'TextArea',
+        'Currency',
+        'Date',
+        'Hyperlink',
+        'IPAddress',
+        'Checkbox',
+        'Number',
+        'Percent',
+        'Text',
+        'Password',
+    ] = Field(..., alias='fieldType')
+    entry_type: Literal['Date', 'EntryField', 'List', 'Option'] = Field(
+        ..., alias='entryType'
+    )
+    sequence_number: float = Field(..., alias='sequenceNumber')
+    question: str
+    """
+     Max length: 1000;
+    """
+    number_of_decimals: int | None = Field(default=None, alias='numberOfDecimals')
+    required_flag: bool | None = Field(default=None, alias='requiredFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.configurationtypereference import ConfigurationTypeReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationTypeQuestionValueInfo(ConnectWiseModel):
+    id: int | None = None
+    configuration_type: ConfigurationTypeReference | None = Field(
+        default=None, alias='configurationType'
+    )
+    question: ConfigurationTypeQuestionReference | None = None
+    value: str | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.configurationtypequestionreference import ConfigurationTypeQuestionReference
+from pyconnectwise.models.manage.configurationtypereference import ConfigurationTypeReference
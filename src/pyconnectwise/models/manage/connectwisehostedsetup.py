@@ -0,0 +1,63 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConnectWiseHostedSetup(ConnectWiseModel):
+    id: int | None = None
+    screen_id: int = Field(..., alias='screenId')
+    """
+    Can be obtained via ConnectWiseHostedApiScreen report.
+    """
+    description: str
+    """
+     Max length: 50;
+    """
+    url: str
+    """
+     Max length: 1024;
+    """
+    type: Literal['Tab', 'Pod', 'ToolbarButton']
+    client_id: str | None = Field(default=None, alias='clientId')
+    """
+    Only required if not already set. Max length: 36;
+    """
+    origin: str | None = None
+    """
+     Max length: 100;
+    """
+    pod_height: int | None = Field(default=None, alias='podHeight')
+    toolbar_button_dialog_height: int | None = Field(
+        default=None, alias='toolbarButtonDialogHeight'
+    )
+    toolbar_button_dialog_width: int | None = Field(
+        default=None, alias='toolbarButtonDialogWidth'
+    )
+    toolbar_button_text: str | None = Field(default=None, alias='toolbarButtonText')
+    """
+    Only required for ToolbarButtons. Max length: 50;
+    """
+    toolbar_button_tool_tip: str | None = Field(
+        default=None, alias='toolbarButtonToolTip'
+    )
+    """
+     Max length: 50;
+    """
+    toolbar_button_icon_document_id: int | None = Field(
+        default=None, alias='toolbarButtonIconDocumentId'
+    )
+    disabled_flag: bool | None = Field(default=None, alias='disabledFlag')
+    location_ids: list[int] | None = Field(default=None, alias='locationIds')
+    locations_enabled_flag: bool | None = Field(
+        default=None, alias='locationsEnabledFlag'
+    )
+    created_by: str | None = Field(default=None, alias='createdBy')
+    date_created: str | None = Field(default=None, alias='dateCreated')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
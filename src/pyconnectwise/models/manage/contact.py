@@ -0,0 +1,144 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Contact(ConnectWiseModel):
+    id: int | None = None
+    first_name: str | None = Field(default=None, alias='firstName')
+    last_name: str | None = Field(default=None, alias='lastName')
+    company: CompanyReference | None = None
+    site: SiteReference | None = None
+    address_line1: str | None = Field(default=None, alias='addressLine1')
+    address_line2: str | None = Field(default=None, alias='addressLine2')
+    city: str | None = None
+    state: str | None = None
+    zip: str | None = None
+    country: CountryReference | None = None
+    relationship: RelationshipReference | None = None
+    relationship_override: str | None = Field(
+        default=None, alias='relationshipOverride'
+    )
+    department: ContactDepartmentReference | None = None
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    default_merge_contact_id: int | None = Field(
+        default=None, alias='defaultMergeContactId'
+    )
+    security_identifier: str | None = Field(default=None, alias='securityIdentifier')
+    manager_contact: ContactReference | None = Field(
+        default=None, alias='managerContact'
+    )
+    assistant_contact: ContactReference | None = Field(
+        default=None, alias='assistantContact'
+    )
+    title: str | None = None
+    school: str | None = None
+    nick_name: str | None = Field(default=None, alias='nickName')
+    married_flag: bool | None = Field(default=None, alias='marriedFlag')
+    children_flag: bool | None = Field(default=None, alias='childrenFlag')
+    children: str | None = None
+    significant_other: str | None = Field(default=None, alias='significantOther')
+    portal_password: str | None = Field(default=None, alias='portalPassword')
+    portal_security_level: int | None = Field(default=None, alias='portalSecurityLevel')
+    disable_portal_login_flag: bool | None = Field(
+        default=None, alias='disablePortalLoginFlag'
+    )
+    unsubscribe_flag: bool | None = Field(default=None, alias='unsubscribeFlag')
+    gender: Literal['Female', 'Male'] | None = None
+    birth_day: str | None = Field(default=None, alias='birthDay')
+    anniversary: str | None = None
+    presence: Literal[
+        'NoAgent', 'Online', 'DoNotDisturb', 'Away', 'Offline'
+    ] | None = None
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    facebook_url: str | None = Field(default=None, alias='facebookUrl')
+    twitter_url: str | None = Field(default=None, alias='twitterUrl')
+    linked_in_url: str | None = Field(default=None, alias='linkedInUrl')
+    default_phone_type: str | None = Field(default=None, alias='defaultPhoneType')
+    default_phone_nbr: str | None = Field(default=None, alias='defaultPhoneNbr')
+    default_phone_extension: str | None = Field(
+        default=None, alias='defaultPhoneExtension'
+    )
+    default_billing_flag: bool | None = Field(default=None, alias='defaultBillingFlag')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    user_defined_field1: str | None = Field(default=None, alias='userDefinedField1')
+    """
+     Max length: 50;
+    """
+    user_defined_field2: str | None = Field(default=None, alias='userDefinedField2')
+    """
+     Max length: 50;
+    """
+    user_defined_field3: str | None = Field(default=None, alias='userDefinedField3')
+    """
+     Max length: 50;
+    """
+    user_defined_field4: str | None = Field(default=None, alias='userDefinedField4')
+    """
+     Max length: 50;
+    """
+    user_defined_field5: str | None = Field(default=None, alias='userDefinedField5')
+    """
+     Max length: 50;
+    """
+    user_defined_field6: str | None = Field(default=None, alias='userDefinedField6')
+    """
+     Max length: 50;
+    """
+    user_defined_field7: str | None = Field(default=None, alias='userDefinedField7')
+    """
+     Max length: 50;
+    """
+    user_defined_field8: str | None = Field(default=None, alias='userDefinedField8')
+    """
+     Max length: 50;
+    """
+    user_defined_field9: str | None = Field(default=None, alias='userDefinedField9')
+    """
+     Max length: 50;
+    """
+    user_defined_field10: str | None = Field(default=None, alias='userDefinedField10')
+    """
+     Max length: 50;
+    """
+    company_location: SystemLocationReference | None = Field(
+        default=None, alias='companyLocation'
+    )
+    communication_items: list[ContactCommunicationItem] | None = Field(
+        default=None, alias='communicationItems'
+    )
+    types: list[ContactTypeReference] | None = None
+    integrator_tags: list[str] | None = Field(default=None, alias='integratorTags')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+    photo: DocumentReference | None = None
+    ignore_duplicates: bool | None = Field(default=None, alias='ignoreDuplicates')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    type_ids: list[int] | None = Field(default=None, alias='typeIds')
+    """
+    Gets or sets integrer array of Contact_Type_Recids to be assigned to contact that can be passed in only during new contact creation (post)
+                To update existing contacts type, use the /company/contactTypeAssociations or /company/contacts/{ID}/typeAssociations endpoints.
+    """
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactcommunicationitem import ContactCommunicationItem
+from pyconnectwise.models.manage.contactdepartmentreference import ContactDepartmentReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.contacttypereference import ContactTypeReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.documentreference import DocumentReference
+from pyconnectwise.models.manage.relationshipreference import RelationshipReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
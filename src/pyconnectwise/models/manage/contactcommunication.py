@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactCommunication(ConnectWiseModel):
+    id: int | None = None
+    contact_id: int | None = Field(default=None, alias='contactId')
+    type: CommunicationTypeReference | None = None
+    value: str
+    """
+     Max length: 250;
+    """
+    extension: str | None = None
+    """
+     Max length: 15;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    communication_type: Literal['Email', 'Fax', 'Phone'] | None = Field(
+        default=None, alias='communicationType'
+    )
+    domain: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.communicationtypereference import CommunicationTypeReference
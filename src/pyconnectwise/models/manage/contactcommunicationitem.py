@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactCommunicationItem(ConnectWiseModel):
+    id: int | None = None
+    type: CommunicationTypeReference | None = None
+    value: str | None = None
+    extension: str | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    domain: str | None = None
+    communication_type: Literal['Email', 'Fax', 'Phone'] | None = Field(
+        default=None, alias='communicationType'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.communicationtypereference import CommunicationTypeReference
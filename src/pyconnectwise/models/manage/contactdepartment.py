@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactDepartment(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
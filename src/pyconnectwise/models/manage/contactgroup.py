@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactGroup(ConnectWiseModel):
+    id: int | None = None
+    group: GroupReference | None = None
+    contact: ContactReference | None = None
+    description: str | None = None
+    """
+     Max length: 50;
+    """
+    unsubscribe_flag: bool | None = Field(default=None, alias='unsubscribeFlag')
+    company_unsubcribed_email_message: str | None = Field(
+        default=None, alias='companyUnsubcribedEmailMessage'
+    )
+    company_group_unsubscribed_email_message: str | None = Field(
+        default=None, alias='companyGroupUnsubscribedEmailMessage'
+    )
+    contact_unsubscribed_email_message: str | None = Field(
+        default=None, alias='contactUnsubscribedEmailMessage'
+    )
+    contact_group_unsubscribed_email_message: str | None = Field(
+        default=None, alias='contactGroupUnsubscribedEmailMessage'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.groupreference import GroupReference
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactNote(ConnectWiseModel):
+    id: int | None = None
+    contact_id: int | None = Field(default=None, alias='contactId')
+    text: str
+    type: NoteTypeReference | None = None
+    flagged: bool | None = None
+    entered_by: str | None = Field(default=None, alias='enteredBy')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.notetypereference import NoteTypeReference
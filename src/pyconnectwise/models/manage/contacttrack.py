@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactTrack(ConnectWiseModel):
+    id: int | None = None
+    track_id: int | None = Field(default=None, alias='trackId')
+    name: str | None = None
+    start_date: str | None = Field(default=None, alias='startDate')
+    end_date: str | None = Field(default=None, alias='endDate')
+    action_taken: int | None = Field(default=None, alias='actionTaken')
+    action_remaining: int | None = Field(default=None, alias='actionRemaining')
+    started_by: str | None = Field(default=None, alias='startedBy')
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
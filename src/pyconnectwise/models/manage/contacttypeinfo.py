@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactTypeInfo(ConnectWiseModel):
+    id: int | None = None
+    description: str | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    service_alert_flag: bool | None = Field(default=None, alias='serviceAlertFlag')
+    service_alert_message: str | None = Field(default=None, alias='serviceAlertMessage')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Conversion(ConnectWiseModel):
+    id: int | None = None
+    quantity: float | None = None
+    uom_type: UnitOfMeasureReference | None = Field(default=None, alias='uomType')
+    parent_uom: UnitOfMeasureReference | None = Field(default=None, alias='parentUOM')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.unitofmeasurereference import UnitOfMeasureReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConvertToProject(ConnectWiseModel):
+    id: int | None = None
+    record_type: Literal[
+        'ProjectIssue', 'ProjectTicket', 'ServiceTicket'
+    ] | None = Field(default=None, alias='recordType')
+    project: ProjectReference | None = None
+    phase: ProjectPhaseReference | None = None
+    wbs_code: str = Field(..., alias='wbsCode')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.projectphasereference import ProjectPhaseReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
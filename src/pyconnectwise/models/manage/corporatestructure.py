@@ -0,0 +1,76 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CorporateStructure(ConnectWiseModel):
+    id: int | None = None
+    level_count: Literal[
+        'Level1', 'Level2', 'Level3', 'Level4', 'Level5'
+    ] | None = Field(default=None, alias='levelCount')
+    level1_name: str | None = Field(default=None, alias='level1Name')
+    """
+     Max length: 20;
+    """
+    level2_name: str | None = Field(default=None, alias='level2Name')
+    """
+     Max length: 20;
+    """
+    level3_name: str | None = Field(default=None, alias='level3Name')
+    """
+     Max length: 20;
+    """
+    level4_name: str | None = Field(default=None, alias='level4Name')
+    """
+     Max length: 20;
+    """
+    level5_name: str | None = Field(default=None, alias='level5Name')
+    """
+     Max length: 20;
+    """
+    fiscal_year_start: Literal[
+        'January',
+        'February',
+        'March',
+        'April',
+        'May',
+        'June',
+        'July',
+        'August',
+        'September',
+        'October',
+        'November',
+        'December',
+    ] = Field(..., alias='fiscalYearStart')
+    location_caption: str = Field(..., alias='locationCaption')
+    """
+     Max length: 50;
+    """
+    group_caption: str = Field(..., alias='groupCaption')
+    """
+     Max length: 50;
+    """
+    base_currency: CurrencyReference = Field(..., alias='baseCurrency')
+    president: MemberReference | None = None
+    chief_operating_officer: MemberReference | None = Field(
+        default=None, alias='chiefOperatingOfficer'
+    )
+    controller: MemberReference | None = None
+    dispatcher: MemberReference | None = None
+    service_manager: MemberReference | None = Field(
+        default=None, alias='serviceManager'
+    )
+    duty_manager: MemberReference | None = Field(default=None, alias='dutyManager')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.memberreference import MemberReference
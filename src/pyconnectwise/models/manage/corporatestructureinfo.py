@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CorporateStructureInfo(ConnectWiseModel):
+    id: int | None = None
+    location_caption: str | None = Field(default=None, alias='locationCaption')
+    group_caption: str | None = Field(default=None, alias='groupCaption')
+    base_currency: CurrencyReference | None = Field(default=None, alias='baseCurrency')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
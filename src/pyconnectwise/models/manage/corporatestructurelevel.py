@@ -0,0 +1,11 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CorporateStructureLevel(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
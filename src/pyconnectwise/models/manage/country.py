@@ -0,0 +1,316 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Country(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    currency: CurrencyReference | None = None
+    city_caption: str | None = Field(default=None, alias='cityCaption')
+    """
+     Max length: 25;
+    """
+    state_caption: str | None = Field(default=None, alias='stateCaption')
+    """
+     Max length: 25;
+    """
+    zip_caption: str | None = Field(default=None, alias='zipCaption')
+    """
+     Max length: 25;
+    """
+    zip_minimum_length: int | None = Field(default=None, alias='zipMinimumLength')
+    dialing_prefix: str | None = Field(default=None, alias='dialingPrefix')
+    """
+     Max length: 5;
+    """
+    address_format: AddressFormatReference | None = Field(
+        default=None, alias='addressFormat'
+    )
+    country_code: str | None = Field(default=None, alias='countryCode')
+    """
+     Max length: 2;
+    """
+    core_entity_country_code: Literal[
+        'AF',
+        'AX',
+        'AL',
+        'DZ',
+        'AS',
+        'AD',
+        'AO',
+        'AI',
+        'AQ',
+        'AR',
+        'AM',
+        'AW',
+        'AT',
+        'AZ',
+        'BH',
+        'BD',
+        'BB',
+        'BY',
+        'BZ',
+        'BJ',
+        'BM',
+        'BT',
+        'BO',
+        'BQ',
+        'BA',
+        'BW',
+        'BV',
+        'IO',
+        'BN',
+        'BG',
+        'BF',
+        'BI',
+        'CM',
+        'CV',
+        'KY',
+        'CF',
+        'TD',
+        'CL',
+        'CX',
+        'CC',
+        'CO',
+        'KM',
+        'CG',
+        'CK',
+        'CI',
+        'HR',
+        'CU',
+        'CW',
+        'CY',
+        'CZ',
+        'CD',
+        'DK',
+        'DJ',
+        'DM',
+        'EC',
+        'EG',
+        'GQ',
+        'ER',
+        'EE',
+        'ET',
+        'FK',
+        'FO',
+        'FJ',
+        'FI',
+        'FR',
+        'GF',
+        'PF',
+        'TF',
+        'GA',
+        'GM',
+        'GE',
+        'GH',
+        'GI',
+        'GR',
+        'GL',
+        'GD',
+        'GP',
+        'GU',
+        'GT',
+        'GG',
+        'GN',
+        'GW',
+        'GY',
+        'HT',
+        'HM',
+        'HN',
+        'HK',
+        'HU',
+        'IS',
+        'IN',
+        'IR',
+        'IQ',
+        'IE',
+        'IM',
+        'IT',
+        'JM',
+        'JP',
+        'JE',
+        'JO',
+        'KZ',
+        'KE',
+        'KI',
+        'XK',
+        'KW',
+        'KG',
+        'LA',
+        'LV',
+        'LB',
+        'LS',
+        'LR',
+        'LY',
+        'LI',
+        'LT',
+        'LU',
+        'MO',
+        'MK',
+        'MG',
+        'MW',
+        'MY',
+        'ML',
+        'MT',
+        'MH',
+        'MQ',
+        'MR',
+        'MU',
+        'YT',
+        'FM',
+        'MD',
+        'MC',
+        'MN',
+        'ME',
+        'MS',
+        'MZ',
+        'NA',
+        'NR',
+        'NP',
+        'NC',
+        'NZ',
+        'NI',
+        'NE',
+        'NG',
+        'NU',
+        'NF',
+        'KP',
+        'MP',
+        'OM',
+        'PK',
+        'PW',
+        'PS',
+        'PG',
+        'PY',
+        'PE',
+        'PN',
+        'PL',
+        'PT',
+        'PR',
+        'RE',
+        'RO',
+        'RU',
+        'RW',
+        'BL',
+        'SH',
+        'PM',
+        'VC',
+        'WS',
+        'SM',
+        'ST',
+        'SN',
+        'RS',
+        'SC',
+        'SL',
+        'SX',
+        'SK',
+        'SI',
+        'SB',
+        'SO',
+        'ZA',
+        'GS',
+        'KR',
+        'SS',
+        'ES',
+        'LK',
+        'SD',
+        'SR',
+        'SJ',
+        'SZ',
+        'SE',
+        'SY',
+        'TJ',
+        'TZ',
+        'TH',
+        'TL',
+        'TG',
+        'TK',
+        'TO',
+        'TN',
+        'TR',
+        'TV',
+        'UG',
+        'UA',
+        'GB',
+        'UM',
+        'UZ',
+        'VU',
+        'VN',
+        'WF',
+        'EH',
+        'YE',
+        'ZM',
+        'ZW',
+        'US',
+        'CR',
+        'MX',
+        'AE',
+        'VI',
+        'VG',
+        'SA',
+        'KH',
+        'AU',
+        'ID',
+        'CA',
+        'BR',
+        'TW',
+        'TM',
+        'TC',
+        'QA',
+        'MM',
+        'CN',
+        'SG',
+        'IL',
+        'VA',
+        'DE',
+        'NL',
+        'AG',
+        'BE',
+        'LC',
+        'UY',
+        'PH',
+        'BS',
+        'VE',
+        'CH',
+        'MF',
+        'KN',
+        'TT',
+        'DO',
+        'PA',
+        'MV',
+        'SV',
+        'NO',
+        'MA',
+        'AC',
+        'TA',
+    ] | None = Field(default=None, alias='coreEntityCountryCode')
+    localization_caption_one: str | None = Field(
+        default=None, alias='localizationCaptionOne'
+    )
+    """
+     Max length: 25;
+    """
+    localization_value_one: str | None = Field(
+        default=None, alias='localizationValueOne'
+    )
+    """
+     Max length: 50;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.addressformatreference import AddressFormatReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
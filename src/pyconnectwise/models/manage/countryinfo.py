@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CountryInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    city_caption: str | None = Field(default=None, alias='cityCaption')
+    state_caption: str | None = Field(default=None, alias='stateCaption')
+    zip_caption: str | None = Field(default=None, alias='zipCaption')
+    dialing_prefix: str | None = Field(default=None, alias='dialingPrefix')
+    localization_caption_one: str | None = Field(
+        default=None, alias='localizationCaptionOne'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
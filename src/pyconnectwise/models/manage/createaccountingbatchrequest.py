@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CreateAccountingBatchRequest(ConnectWiseModel):
+    id: int | None = None
+    batch_identifier: str | None = Field(default=None, alias='batchIdentifier')
+    """
+     Max length: 50;
+    """
+    gl_interface_identifier: str | None = Field(
+        default=None, alias='glInterfaceIdentifier'
+    )
+    export_invoices_flag: bool | None = Field(default=None, alias='exportInvoicesFlag')
+    """
+    Batch must export Invoices, Expenses or Products.
+    """
+    export_expenses_flag: bool | None = Field(default=None, alias='exportExpensesFlag')
+    """
+    Batch must export Invoices, Expenses or Products.
+    """
+    export_products_flag: bool | None = Field(default=None, alias='exportProductsFlag')
+    """
+    Batch must export Invoices, Expenses or Products.
+    """
+    processed_record_ids: list[int] = Field(..., alias='processedRecordIds')
+    """
+    GL Entry RecIDs.
+    """
+    summarize_expenses: bool | None = Field(default=None, alias='summarizeExpenses')
@@ -0,0 +1,89 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Crm(ConnectWiseModel):
+    id: int | None = None
+    company_list_count: int | None = Field(default=None, alias='companyListCount')
+    lock_probability_flag: bool | None = Field(
+        default=None, alias='lockProbabilityFlag'
+    )
+    account_manager_role: TeamRoleReference | None = Field(
+        default=None, alias='accountManagerRole'
+    )
+    technical_contact_role: TeamRoleReference | None = Field(
+        default=None, alias='technicalContactRole'
+    )
+    sales_rep_role: TeamRoleReference | None = Field(default=None, alias='salesRepRole')
+    company_id_generation_flag: bool | None = Field(
+        default=None, alias='companyIdGenerationFlag'
+    )
+    exclude_spaces_flag: bool | None = Field(default=None, alias='excludeSpacesFlag')
+    field1_caption: str | None = Field(default=None, alias='field1Caption')
+    """
+     Max length: 25;
+    """
+    field2_caption: str | None = Field(default=None, alias='field2Caption')
+    """
+     Max length: 25;
+    """
+    field3_caption: str | None = Field(default=None, alias='field3Caption')
+    """
+     Max length: 25;
+    """
+    field4_caption: str | None = Field(default=None, alias='field4Caption')
+    """
+     Max length: 25;
+    """
+    field5_caption: str | None = Field(default=None, alias='field5Caption')
+    """
+     Max length: 25;
+    """
+    field6_caption: str | None = Field(default=None, alias='field6Caption')
+    """
+     Max length: 25;
+    """
+    field7_caption: str | None = Field(default=None, alias='field7Caption')
+    """
+     Max length: 25;
+    """
+    field8_caption: str | None = Field(default=None, alias='field8Caption')
+    """
+     Max length: 25;
+    """
+    field9_caption: str | None = Field(default=None, alias='field9Caption')
+    """
+     Max length: 25;
+    """
+    field10_caption: str | None = Field(default=None, alias='field10Caption')
+    """
+     Max length: 25;
+    """
+    primary_rep_caption: str | None = Field(default=None, alias='primaryRepCaption')
+    """
+     Max length: 50;
+    """
+    secondary_rep_caption: str | None = Field(default=None, alias='secondaryRepCaption')
+    """
+     Max length: 50;
+    """
+    other1_caption: str | None = Field(default=None, alias='other1Caption')
+    """
+     Max length: 50;
+    """
+    other2_caption: str | None = Field(default=None, alias='other2Caption')
+    """
+     Max length: 50;
+    """
+    default_year: bool | None = Field(default=None, alias='defaultYear')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.teamrolereference import TeamRoleReference
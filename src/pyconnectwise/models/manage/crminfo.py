@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CrmInfo(ConnectWiseModel):
+    id: int | None = None
+    account_manager_role: TeamRoleReference | None = Field(
+        default=None, alias='accountManagerRole'
+    )
+    technical_contact_role: TeamRoleReference | None = Field(
+        default=None, alias='technicalContactRole'
+    )
+    sales_rep_role: TeamRoleReference | None = Field(default=None, alias='salesRepRole')
+    field1_caption: str | None = Field(default=None, alias='field1Caption')
+    field2_caption: str | None = Field(default=None, alias='field2Caption')
+    field3_caption: str | None = Field(default=None, alias='field3Caption')
+    field4_caption: str | None = Field(default=None, alias='field4Caption')
+    field5_caption: str | None = Field(default=None, alias='field5Caption')
+    field6_caption: str | None = Field(default=None, alias='field6Caption')
+    field7_caption: str | None = Field(default=None, alias='field7Caption')
+    field8_caption: str | None = Field(default=None, alias='field8Caption')
+    field9_caption: str | None = Field(default=None, alias='field9Caption')
+    field10_caption: str | None = Field(default=None, alias='field10Caption')
+    primary_rep_caption: str | None = Field(default=None, alias='primaryRepCaption')
+    secondary_rep_caption: str | None = Field(default=None, alias='secondaryRepCaption')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.teamrolereference import TeamRoleReference
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CurrencyReference(ConnectWiseModel):
+    id: int | None = None
+    symbol: str | None = None
+    currency_code: str | None = Field(default=None, alias='currencyCode')
+    decimal_separator: str | None = Field(default=None, alias='decimalSeparator')
+    number_of_decimals: int | None = Field(default=None, alias='numberOfDecimals')
+    thousands_separator: str | None = Field(default=None, alias='thousandsSeparator')
+    negative_parentheses_flag: bool | None = Field(
+        default=None, alias='negativeParenthesesFlag'
+    )
+    display_symbol_flag: bool | None = Field(default=None, alias='displaySymbolFlag')
+    currency_identifier: str | None = Field(default=None, alias='currencyIdentifier')
+    display_id_flag: bool | None = Field(default=None, alias='displayIdFlag')
+    right_align: bool | None = Field(default=None, alias='rightAlign')
+    name: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
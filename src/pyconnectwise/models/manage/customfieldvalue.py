@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CustomFieldValue(ConnectWiseModel):
+    id: int | None = None
+    caption: str | None = None
+    type: Literal[
+        'TextArea',
+        'Button',
+        'Currency',
+        'Date',
+        'Hyperlink',
+        'IPAddress',
+        'Checkbox',
+        'Number',
+        'Percent',
+        'Text',
+        'Password',
+    ] | None = None
+    entry_method: Literal['Date', 'EntryField', 'List', 'Option'] | None = Field(
+        default=None, alias='entryMethod'
+    )
+    number_of_decimals: int | None = Field(default=None, alias='numberOfDecimals')
+    value: str | bool | int | None = None
@@ -0,0 +1,206 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CustomReport(ConnectWiseModel):
+    id: int | None = None
+    report_link: str = Field(..., alias='reportLink')
+    name: str
+    """
+     Max length: 100;
+    """
+    module: Literal[
+        'Companies',
+        'Finance',
+        'Marketing',
+        'Procurement',
+        'Project',
+        'Sales',
+        'ServiceDesk',
+        'TimeExpense',
+    ]
+    """
+    The Module Name.
+    """
+    description: str
+    """
+     Max length: 150;
+    """
+    generated_flag: bool | None = Field(default=None, alias='generatedFlag')
+    parameter_prefix: str | None = Field(default=None, alias='parameterPrefix')
+    """
+     Max length: 50;
+    """
+    parameter_separator: str | None = Field(default=None, alias='parameterSeparator')
+    """
+     Max length: 50;
+    """
+    parameter_name_separator: str | None = Field(
+        default=None, alias='parameterNameSeparator'
+    )
+    """
+     Max length: 50;
+    """
+    parameter_suffix: str | None = Field(default=None, alias='parameterSuffix')
+    """
+     Max length: 50;
+    """
+    location_flag: bool | None = Field(default=None, alias='locationFlag')
+    location_param_id: int | None = Field(default=None, alias='locationParamId')
+    """
+    Parameter unique identifier for the Custom Report's Location parameter.
+    """
+    location_default_flag: bool | None = Field(
+        default=None, alias='locationDefaultFlag'
+    )
+    location_override: str | None = Field(default=None, alias='locationOverride')
+    department_flag: bool | None = Field(default=None, alias='departmentFlag')
+    department_param_id: int | None = Field(default=None, alias='departmentParamId')
+    """
+    Parameter unique identifier for the Custom Report's Department parameter.
+    """
+    department_default_flag: bool | None = Field(
+        default=None, alias='departmentDefaultFlag'
+    )
+    department_override: str | None = Field(default=None, alias='departmentOverride')
+    territory_flag: bool | None = Field(default=None, alias='territoryFlag')
+    territory_param_id: int | None = Field(default=None, alias='territoryParamId')
+    """
+    Parameter unique identifier for the Custom Report's Terriroty parameter.
+    """
+    territory_default_flag: bool | None = Field(
+        default=None, alias='territoryDefaultFlag'
+    )
+    territory_override: str | None = Field(default=None, alias='territoryOverride')
+    company_flag: bool | None = Field(default=None, alias='companyFlag')
+    company_param_id: int | None = Field(default=None, alias='companyParamId')
+    """
+    Parameter unique identifier for the Custom Report's Company parameter.
+    """
+    company_override: str | None = Field(default=None, alias='companyOverride')
+    member_flag: bool | None = Field(default=None, alias='memberFlag')
+    member_param_id: int | None = Field(default=None, alias='memberParamId')
+    """
+    Parameter unique identifier for the Custom Report's Member parameter.
+    """
+    member_override: str | None = Field(default=None, alias='memberOverride')
+    start_date_flag: bool | None = Field(default=None, alias='startDateFlag')
+    start_date_param_id: int | None = Field(default=None, alias='startDateParamId')
+    """
+    Parameter unique identifier for the Custom Report's Start Date parameter.
+    """
+    start_date_override: str | None = Field(default=None, alias='startDateOverride')
+    end_date_flag: bool | None = Field(default=None, alias='endDateFlag')
+    end_date_param_id: int | None = Field(default=None, alias='endDateParamId')
+    """
+    Parameter unique identifier for the Custom Report's End Date parameter.
+    """
+    end_date_override: str | None = Field(default=None, alias='endDateOverride')
+    opp_type_flag: bool | None = Field(default=None, alias='oppTypeFlag')
+    opp_type_param_id: int | None = Field(default=None, alias='oppTypeParamId')
+    """
+    Parameter unique identifier for the Custom Report's Opportunity Type parameter.
+    """
+    opp_type_override: str | None = Field(default=None, alias='oppTypeOverride')
+    opportunity_flag: bool | None = Field(default=None, alias='opportunityFlag')
+    opportunity_param_id: int | None = Field(default=None, alias='opportunityParamId')
+    """
+    Parameter unique identifier for the Custom Report's Opportunity parameter.
+    """
+    opportunity_override: str | None = Field(default=None, alias='opportunityOverride')
+    marketing_campaign_flag: bool | None = Field(
+        default=None, alias='marketingCampaignFlag'
+    )
+    marketing_campaign_param_id: int | None = Field(
+        default=None, alias='marketingCampaignParamId'
+    )
+    """
+    Parameter unique identifier for the Custom Report's Marketing Campaign parameter.
+    """
+    marketing_campaign_override: str | None = Field(
+        default=None, alias='marketingCampaignOverride'
+    )
+    service_board_flag: bool | None = Field(default=None, alias='serviceBoardFlag')
+    service_board_param_id: int | None = Field(
+        default=None, alias='serviceBoardParamId'
+    )
+    """
+    Parameter unique identifier for the Custom Report's Service Board parameter.
+    """
+    service_board_default_flag: bool | None = Field(
+        default=None, alias='serviceBoardDefaultFlag'
+    )
+    service_board_override: str | None = Field(
+        default=None, alias='serviceBoardOverride'
+    )
+    service_type_flag: bool | None = Field(default=None, alias='serviceTypeFlag')
+    service_type_param_id: int | None = Field(default=None, alias='serviceTypeParamId')
+    """
+    Parameter unique identifier for the Custom Report's Service Type parameter.
+    """
+    service_type_override: str | None = Field(default=None, alias='serviceTypeOverride')
+    service_status_flag: bool | None = Field(default=None, alias='serviceStatusFlag')
+    service_status_param_id: int | None = Field(
+        default=None, alias='serviceStatusParamId'
+    )
+    """
+    Parameter unique identifier for the Custom Report's Service Status parameter.
+    """
+    service_status_override: str | None = Field(
+        default=None, alias='serviceStatusOverride'
+    )
+    agreement_type_flag: bool | None = Field(default=None, alias='agreementTypeFlag')
+    agreement_type_param_id: int | None = Field(
+        default=None, alias='agreementTypeParamId'
+    )
+    """
+    Parameter unique identifier for the Custom Report's Agreement Type parameter.
+    """
+    agreement_type_override: str | None = Field(
+        default=None, alias='agreementTypeOverride'
+    )
+    agreement_flag: bool | None = Field(default=None, alias='agreementFlag')
+    agreement_param_id: int | None = Field(default=None, alias='agreementParamId')
+    """
+    Parameter unique identifier for the Custom Report's Agreement parameter.
+    """
+    agreement_override: str | None = Field(default=None, alias='agreementOverride')
+    project_type_flag: bool | None = Field(default=None, alias='projectTypeFlag')
+    project_type_param_id: int | None = Field(default=None, alias='projectTypeParamId')
+    """
+    Parameter unique identifier for the Custom Report's Project Type parameter.
+    """
+    project_type_override: str | None = Field(default=None, alias='projectTypeOverride')
+    project_flag: bool | None = Field(default=None, alias='projectFlag')
+    project_param_id: int | None = Field(default=None, alias='projectParamId')
+    """
+    Parameter unique identifier for the Custom Report's Project parameter.
+    """
+    project_override: str | None = Field(default=None, alias='projectOverride')
+    work_role_flag: bool | None = Field(default=None, alias='workRoleFlag')
+    work_role_param_id: int | None = Field(default=None, alias='workRoleParamId')
+    """
+    Parameter unique identifier for the Custom Report's Work Role parameter.
+    """
+    work_role_override: str | None = Field(default=None, alias='workRoleOverride')
+    work_type_flag: bool | None = Field(default=None, alias='workTypeFlag')
+    work_type_param_id: int | None = Field(default=None, alias='workTypeParamId')
+    """
+    Parameter unique identifier for the Custom Report's Work Type parameter.
+    """
+    work_type_override: str | None = Field(default=None, alias='workTypeOverride')
+    invoice_flag: bool | None = Field(default=None, alias='invoiceFlag')
+    invoice_param_id: int | None = Field(default=None, alias='invoiceParamId')
+    """
+    Parameter unique identifier for the Custom Report's Invoice Type parameter.
+    """
+    invoice_override: str | None = Field(default=None, alias='invoiceOverride')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
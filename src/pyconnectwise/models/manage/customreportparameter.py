@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CustomReportParameter(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    """
+    Either a caption name or parameter name is required. Max length: 50;
+    """
+    caption_name: str | None = Field(default=None, alias='captionName')
+    """
+    Either a caption name or parameter name is required. Max length: 50;
+    """
+    custom_report: CustomReportReference | None = Field(
+        default=None, alias='customReport'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.customreportreference import CustomReportReference
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CwTimeZone(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    offset: float | None = None
+    """
+    The hours offset (+/-).
+    """
+    start_date: str | None = Field(default=None, alias='startDate')
+    end_date: str | None = Field(default=None, alias='endDate')
+    daylight_savings_flag: bool | None = Field(
+        default=None, alias='daylightSavingsFlag'
+    )
+    """
+    Determined based on system library value for specified timeZone.
+                Not able to be used in query params at this time.
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
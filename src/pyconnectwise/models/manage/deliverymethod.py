@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DeliveryMethod(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    email_flag: bool | None = Field(default=None, alias='emailFlag')
+    integration_email_flag: bool | None = Field(
+        default=None, alias='integrationEmailFlag'
+    )
+    integration_print_flag: bool | None = Field(
+        default=None, alias='integrationPrintFlag'
+    )
+    integration_active_flag: bool | None = Field(
+        default=None, alias='integrationActiveFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
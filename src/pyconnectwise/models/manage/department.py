@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Department(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 15;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DepartmentLocation(ConnectWiseModel):
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    department_manager: MemberReference | None = Field(
+        default=None, alias='departmentManager'
+    )
+    dispatch: MemberReference | None = None
+    service_manager: MemberReference | None = Field(
+        default=None, alias='serviceManager'
+    )
+    duty_manager: MemberReference | None = Field(default=None, alias='dutyManager')
+    ldap_config: LdapConfigurationReference | None = Field(
+        default=None, alias='ldapConfig'
+    )
+    add_all_locations: bool | None = Field(default=None, alias='addAllLocations')
+    remove_all_locations: bool | None = Field(default=None, alias='removeAllLocations')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.ldapconfigurationreference import LdapConfigurationReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
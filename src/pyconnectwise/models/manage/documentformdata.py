@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DocumentFormData(ConnectWiseModel):
+    file: bytes | None = None
+    record_id: int | None = Field(default=None, alias='recordId')
+    record_type: str | None = Field(default=None, alias='recordType')
+    title: str | None = None
+    url: str | None = None
+    private_flag: bool | None = Field(default=None, alias='privateFlag')
+    read_only_flay: bool | None = Field(default=None, alias='readOnlyFlay')
+    is_avatar: bool | None = Field(default=None, alias='isAvatar')
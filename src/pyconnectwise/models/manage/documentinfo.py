@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DocumentInfo(ConnectWiseModel):
+    id: int | None = None
+    title: str | None = None
+    file_name: str | None = Field(default=None, alias='fileName')
+    server_file_name: str | None = Field(default=None, alias='serverFileName')
+    owner: str | None = None
+    link_flag: bool | None = Field(default=None, alias='linkFlag')
+    image_flag: bool | None = Field(default=None, alias='imageFlag')
+    public_flag: bool | None = Field(default=None, alias='publicFlag')
+    html_template_flag: bool | None = Field(default=None, alias='htmlTemplateFlag')
+    read_only_flag: bool | None = Field(default=None, alias='readOnlyFlag')
+    size: int | None = None
+    url_flag: bool | None = Field(default=None, alias='urlFlag')
+    created_on_date: str | None = Field(default=None, alias='createdOnDate')
+    document_type: DocumentTypeReference | None = Field(
+        default=None, alias='documentType'
+    )
+    guid: UUID | None = Field(
+        default=None, example='00000000-0000-0000-0000-000000000000'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.documenttypereference import DocumentTypeReference
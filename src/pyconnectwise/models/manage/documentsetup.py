@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DocumentSetup(ConnectWiseModel):
+    id: int | None = None
+    upload_as_link_flag: bool | None = Field(default=None, alias='uploadAsLinkFlag')
+    is_public_flag: bool | None = Field(default=None, alias='isPublicFlag')
+    doc_path: str | None = Field(default=None, alias='docPath')
+    """
+     Max length: 100;
+    """
+    template_path: str | None = Field(default=None, alias='templatePath')
+    """
+     Max length: 200;
+    """
+    template_output_path: str | None = Field(default=None, alias='templateOutputPath')
+    """
+     Max length: 200;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DocumentType(ConnectWiseModel):
+    id: int | None = None
+    file_extension: str | None = Field(default=None, alias='fileExtension')
+    icon: str | None = None
+    mime_type: str | None = Field(default=None, alias='mimeType')
+    description: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
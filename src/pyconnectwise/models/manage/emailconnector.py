@@ -0,0 +1,101 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailConnector(ConnectWiseModel):
+    id: int | None = None
+    email_server_type: Literal['IMAP', 'Office365', 'Google', 'Asio365'] | None = Field(
+        default=None, alias='emailServerType'
+    )
+    imap_setup: ImapSetupReference | None = Field(default=None, alias='imapSetup')
+    office365_email_setup: Office365EmailSetupReference | None = Field(
+        default=None, alias='office365EmailSetup'
+    )
+    asio365_email_setup: Office365EmailSetupReference | None = Field(
+        default=None, alias='asio365EmailSetup'
+    )
+    google_email_setup: GoogleEmailSetupReference | None = Field(
+        default=None, alias='googleEmailSetup'
+    )
+    service_board: BoardReference | None = Field(default=None, alias='serviceBoard')
+    default_company: CompanyReference | None = Field(
+        default=None, alias='defaultCompany'
+    )
+    default_member: MemberReference | None = Field(default=None, alias='defaultMember')
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    email_notify_from: str | None = Field(default=None, alias='emailNotifyFrom')
+    """
+     Max length: 50;
+    """
+    bcc_email_to: str | None = Field(default=None, alias='bccEmailTo')
+    """
+     Max length: 250;
+    """
+    email_errors_to: str = Field(..., alias='emailErrorsTo')
+    """
+     Max length: 50;
+    """
+    set_email_to_default_contact_flag: bool | None = Field(
+        default=None, alias='setEmailToDefaultContactFlag'
+    )
+    no_response_flag: bool | None = Field(default=None, alias='noResponseFlag')
+    never_respond_flag: bool | None = Field(default=None, alias='neverRespondFlag')
+    discard_duplicates_flag: bool | None = Field(
+        default=None, alias='discardDuplicatesFlag'
+    )
+    post_replies_to_ticket_flag: bool | None = Field(
+        default=None, alias='postRepliesToTicketFlag'
+    )
+    create_contact_flag: bool | None = Field(default=None, alias='createContactFlag')
+    response_email_for_new: str | None = Field(
+        default=None, alias='responseEmailForNew'
+    )
+    response_email_for_existing: str | None = Field(
+        default=None, alias='responseEmailForExisting'
+    )
+    source_override: ServiceSourceReference | None = Field(
+        default=None, alias='sourceOverride'
+    )
+    priority_override: PriorityReference | None = Field(
+        default=None, alias='priorityOverride'
+    )
+    type_override: ServiceTypeReference | None = Field(
+        default=None, alias='typeOverride'
+    )
+    sub_type_override: ServiceSubTypeReference | None = Field(
+        default=None, alias='subTypeOverride'
+    )
+    item_override: ServiceItemReference | None = Field(
+        default=None, alias='itemOverride'
+    )
+    status_override: ServiceStatusReference | None = Field(
+        default=None, alias='statusOverride'
+    )
+    add_cc_flag: bool | None = Field(default=None, alias='addCcFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.googleemailsetupreference import GoogleEmailSetupReference
+from pyconnectwise.models.manage.imapsetupreference import ImapSetupReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.office365emailsetupreference import Office365EmailSetupReference
+from pyconnectwise.models.manage.priorityreference import PriorityReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
+from pyconnectwise.models.manage.servicesourcereference import ServiceSourceReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.servicesubtypereference import ServiceSubTypeReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
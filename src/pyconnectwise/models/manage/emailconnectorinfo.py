@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailConnectorInfo(ConnectWiseModel):
+    id: int | None = None
+    imap_setup: ImapSetupReference | None = Field(default=None, alias='imapSetup')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.imapsetupreference import ImapSetupReference
@@ -0,0 +1,47 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailConnectorParsingRule(ConnectWiseModel):
+    id: int | None = None
+    parsing_style: EmailConnectorParsingStyleReference | None = Field(
+        default=None, alias='parsingStyle'
+    )
+    priority: int
+    parsing_variable: EmailConnectorParsingVariableReference | None = Field(
+        default=None, alias='parsingVariable'
+    )
+    search_term: str = Field(..., alias='searchTerm')
+    """
+     Max length: 250;
+    """
+    service_priority: PriorityReference | None = Field(
+        default=None, alias='servicePriority'
+    )
+    service_status: ServiceStatusReference | None = Field(
+        default=None, alias='serviceStatus'
+    )
+    service_type: ServiceTypeReference | None = Field(default=None, alias='serviceType')
+    service_sub_type: ServiceSubTypeReference | None = Field(
+        default=None, alias='serviceSubType'
+    )
+    service_item: ServiceItemReference | None = Field(default=None, alias='serviceItem')
+    service_board: BoardReference | None = Field(default=None, alias='serviceBoard')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.emailconnectorparsingstylereference import EmailConnectorParsingStyleReference
+from pyconnectwise.models.manage.emailconnectorparsingvariablereference import EmailConnectorParsingVariableReference
+from pyconnectwise.models.manage.priorityreference import PriorityReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.servicesubtypereference import ServiceSubTypeReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
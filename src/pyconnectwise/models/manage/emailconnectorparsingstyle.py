@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailConnectorParsingStyle(ConnectWiseModel):
+    id: int | None = None
+    parsing_type: EmailConnectorParsingTypeReference | None = Field(
+        default=None, alias='parsingType'
+    )
+    parse_rule: str = Field(..., alias='parseRule')
+    """
+     Max length: 500;
+    """
+    priority: int
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.emailconnectorparsingtypereference import EmailConnectorParsingTypeReference
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailExclusion(ConnectWiseModel):
+    id: int | None = None
+    description: str
+    """
+     Max length: 100;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
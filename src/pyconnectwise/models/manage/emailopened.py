@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailOpened(ConnectWiseModel):
+    id: int | None = None
+    campaign_id: int | None = Field(default=None, alias='campaignId')
+    contact_id: int = Field(..., alias='contactId')
+    date_opened: datetime | None = Field(default=None, alias='dateOpened')
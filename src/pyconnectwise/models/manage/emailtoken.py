@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailToken(ConnectWiseModel):
+    id: int | None = None
+    token: str | None = None
+    description: str | None = None
+    address_flag: bool | None = Field(default=None, alias='addressFlag')
+    agreement_flag: bool | None = Field(default=None, alias='agreementFlag')
+    company_flag: bool | None = Field(default=None, alias='companyFlag')
+    config_flag: bool | None = Field(default=None, alias='configFlag')
+    contact_flag: bool | None = Field(default=None, alias='contactFlag')
+    invoice_flag: bool | None = Field(default=None, alias='invoiceFlag')
+    purchase_order_flag: bool | None = Field(default=None, alias='purchaseOrderFlag')
+    purchase_order_status_flag: bool | None = Field(
+        default=None, alias='purchaseOrderStatusFlag'
+    )
+    rma_flag: bool | None = Field(default=None, alias='rmaFlag')
+    sales_flag: bool | None = Field(default=None, alias='salesFlag')
+    service_flag: bool | None = Field(default=None, alias='serviceFlag')
+    tracks_flag: bool | None = Field(default=None, alias='tracksFlag')
+    workflow_flag: bool | None = Field(default=None, alias='workflowFlag')
+    portal_password_flag: bool | None = Field(default=None, alias='portalPasswordFlag')
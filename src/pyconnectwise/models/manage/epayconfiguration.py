@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EPayConfiguration(ConnectWiseModel):
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    currency: CurrencyReference | None = None
+    url: str
+    """
+     Max length: 400;
+    """
+    store_identifier: str = Field(..., alias='storeIdentifier')
+    """
+     Max length: 500;
+    """
+    encryption_key: str | None = Field(default=None, alias='encryptionKey')
+    """
+     Max length: 500;
+    """
+    initialization_vector: str | None = Field(
+        default=None, alias='initializationVector'
+    )
+    """
+     Max length: 500;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ErrorResponseMessage(ConnectWiseModel):
+    code: str | None = None
+    message: str | None = None
+    errors: list[ValidationError] | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.validationerror import ValidationError
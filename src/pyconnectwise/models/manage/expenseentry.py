@@ -0,0 +1,90 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseEntry(ConnectWiseModel):
+    id: int | None = None
+    expense_report: ExpenseReportReference | None = Field(
+        default=None, alias='expenseReport'
+    )
+    company: CompanyReference | None = None
+    charge_to_id: int | None = Field(default=None, alias='chargeToId')
+    charge_to_type: Literal[
+        'ServiceTicket', 'ProjectTicket', 'ChargeCode', 'Activity'
+    ] | None = Field(default=None, alias='chargeToType')
+    """
+    Gets or sets
+                company or chargeToType is required.
+    """
+    type: ExpenseTypeReference | None = None
+    member: MemberReference | None = None
+    payment_method: PaymentMethodReference | None = Field(
+        default=None, alias='paymentMethod'
+    )
+    classification: ClassificationReference | None = None
+    amount: float
+    billable_option: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billableOption')
+    date: datetime
+    location_id: int | None = Field(default=None, alias='locationId')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    notes: str | None = None
+    agreement: AgreementReference | None = None
+    invoice_amount: float | None = Field(default=None, alias='invoiceAmount')
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    taxes: list[ExpenseTax] | None = None
+    invoice: InvoiceReference | None = None
+    currency: CurrencyReference | None = None
+    status: Literal[
+        'Open',
+        'Rejected',
+        'PendingApproval',
+        'ErrorsCorrected',
+        'PendingProjectApproval',
+        'ApprovedByTierOne',
+        'RejectBySecondTier',
+        'ApprovedByTierTwo',
+        'ReadyToBill',
+        'Billed',
+        'WrittenOff',
+        'BilledAgreement',
+    ] | None = None
+    bill_amount: float | None = Field(default=None, alias='billAmount')
+    agreement_amount: float | None = Field(default=None, alias='agreementAmount')
+    odometer_start: float | None = Field(default=None, alias='odometerStart')
+    odometer_end: float | None = Field(default=None, alias='odometerEnd')
+    ticket: TicketReference | None = None
+    project: ProjectReference | None = None
+    phase: ProjectPhaseReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.classificationreference import ClassificationReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.expensereportreference import ExpenseReportReference
+from pyconnectwise.models.manage.expensetax import ExpenseTax
+from pyconnectwise.models.manage.expensetypereference import ExpenseTypeReference
+from pyconnectwise.models.manage.invoicereference import InvoiceReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.paymentmethodreference import PaymentMethodReference
+from pyconnectwise.models.manage.projectphasereference import ProjectPhaseReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseReportTierUpdate(ConnectWiseModel):
+    id: int | None = None
+    approval_type: Literal[
+        'DataEntry',
+        'Tier1Update',
+        'Tier2Update',
+        'Billing',
+        'Service',
+        'Project',
+        'MonthlySummary',
+        'SalesActivity',
+        'Schedule',
+    ] | None = Field(default=None, alias='approvalType')
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseTax(ConnectWiseModel):
+    id: int | None = None
+    amount: float | None = None
+    type: ExpenseTaxTypeReference | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.expensetaxtypereference import ExpenseTaxTypeReference
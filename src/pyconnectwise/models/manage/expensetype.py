@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    amount_caption: str = Field(..., alias='amountCaption')
+    reimbursement_rate: float | None = Field(default=None, alias='reimbursementRate')
+    bill_expenses: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] = Field(
+        ..., alias='billExpenses'
+    )
+    invoice_markup_option: Literal['Amount', 'Mile', 'Percent'] = Field(
+        ..., alias='invoiceMarkupOption'
+    )
+    invoice_markup_amount: float | None = Field(
+        default=None, alias='invoiceMarkupAmount'
+    )
+    advanced_amount_flag: bool | None = Field(default=None, alias='advancedAmountFlag')
+    mileage_flag: bool | None = Field(default=None, alias='mileageFlag')
+    quantity_flag: bool | None = Field(default=None, alias='quantityFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    max_amount: float | None = Field(default=None, alias='maxAmount')
+    integration_x_ref: str | None = Field(default=None, alias='integrationXRef')
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseTypeExemption(ConnectWiseModel):
+    id: int | None = None
+    expense_type: ExpenseTypeReference = Field(..., alias='expenseType')
+    taxable_levels: list[int] | None = Field(default=None, alias='taxableLevels')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.expensetypereference import ExpenseTypeReference
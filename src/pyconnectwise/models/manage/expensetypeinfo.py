@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseTypeInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    amount_caption: str | None = Field(default=None, alias='amountCaption')
+    mileage_flag: bool | None = Field(default=None, alias='mileageFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Experiment(ConnectWiseModel):
+    id: int | None = None
+    experiment_id: str | None = Field(default=None, alias='experimentId')
+    name: str | None = None
+    description: str | None = None
+    properties: str | None = None
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    member_inactive_flag: bool | None = Field(default=None, alias='memberInactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,63 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExportAccountingBatchRequest(ConnectWiseModel):
+    batch_identifier: str | None = Field(default=None, alias='batchIdentifier')
+    """
+     Max length: 50;
+    """
+    gl_interface_identifier: str | None = Field(
+        default=None, alias='glInterfaceIdentifier'
+    )
+    thru_date: datetime | None = Field(default=None, alias='thruDate')
+    location_id: int | None = Field(default=None, alias='locationId')
+    summarize_invoices: Literal['Default', 'Condensed', 'Detailed'] | None = Field(
+        default=None, alias='summarizeInvoices'
+    )
+    export_invoices_flag: bool | None = Field(default=None, alias='exportInvoicesFlag')
+    """
+    Batch export must include invoices, expenses, or products (procurement).
+    """
+    included_invoice_ids: list[int] | None = Field(
+        default=None, alias='includedInvoiceIds'
+    )
+    excluded_invoice_ids: list[int] | None = Field(
+        default=None, alias='excludedInvoiceIds'
+    )
+    export_expenses_flag: bool | None = Field(default=None, alias='exportExpensesFlag')
+    """
+    Batch export must include invoices, expenses, or products (procurement).
+    """
+    included_expense_ids: list[int] | None = Field(
+        default=None, alias='includedExpenseIds'
+    )
+    excluded_expense_ids: list[int] | None = Field(
+        default=None, alias='excludedExpenseIds'
+    )
+    export_payments_flag: bool | None = Field(default=None, alias='exportPaymentsFlag')
+    """
+    Batch export must include invoices, expenses, or products (procurement).
+    """
+    included_payment_ids: list[int] | None = Field(
+        default=None, alias='includedPaymentIds'
+    )
+    export_products_flag: bool | None = Field(default=None, alias='exportProductsFlag')
+    """
+    Batch export must include invoices, expenses, or products (procurement).
+    """
+    included_product_ids: list[str] | None = Field(
+        default=None, alias='includedProductIds'
+    )
+    excluded_product_ids: list[str] | None = Field(
+        default=None, alias='excludedProductIds'
+    )
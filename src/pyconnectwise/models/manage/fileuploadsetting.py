@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class FileUploadSetting(ConnectWiseModel):
+    id: int | None = None
+    restrict_file_types_flag: bool = Field(..., alias='restrictFileTypesFlag')
+    global_file_size_limit: int | None = Field(
+        default=None, alias='globalFileSizeLimit'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class FilterValues(ConnectWiseModel):
+    conditions: str | None = None
+    order_by: str | None = Field(default=None, alias='orderBy')
+    childconditions: str | None = None
+    customfieldconditions: str | None = None
@@ -0,0 +1,74 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Forecast(ConnectWiseModel):
+    id: int | None = None
+    forecast_items: list[ForecastItem] | None = Field(
+        default=None, alias='forecastItems'
+    )
+    product_revenue: ProductRevenueReference | None = Field(
+        default=None, alias='productRevenue'
+    )
+    service_revenue: ServiceRevenueReference | None = Field(
+        default=None, alias='serviceRevenue'
+    )
+    agreement_revenue: AgreementRevenueReference | None = Field(
+        default=None, alias='agreementRevenue'
+    )
+    time_revenue: TimeRevenueReference | None = Field(default=None, alias='timeRevenue')
+    expense_revenue: ExpenseRevenueReference | None = Field(
+        default=None, alias='expenseRevenue'
+    )
+    forecast_revenue_totals: ForecastRevenueReference | None = Field(
+        default=None, alias='forecastRevenueTotals'
+    )
+    inclusive_revenue_totals: InclusiveRevenueReference | None = Field(
+        default=None, alias='inclusiveRevenueTotals'
+    )
+    recurring_total: float | None = Field(default=None, alias='recurringTotal')
+    won_revenue: WonRevenueReference | None = Field(default=None, alias='wonRevenue')
+    lost_revenue: LostRevenueReference | None = Field(default=None, alias='lostRevenue')
+    open_revenue: OpenRevenueReference | None = Field(default=None, alias='openRevenue')
+    other_revenue1: Other1RevenueReference | None = Field(
+        default=None, alias='otherRevenue1'
+    )
+    other_revenue2: Other2RevenueReference | None = Field(
+        default=None, alias='otherRevenue2'
+    )
+    sales_tax_revenue: float | None = Field(default=None, alias='salesTaxRevenue')
+    forecast_total_with_taxes: float | None = Field(
+        default=None, alias='forecastTotalWithTaxes'
+    )
+    expected_probability: int | None = Field(default=None, alias='expectedProbability')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    currency: CurrencyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementrevenuereference import AgreementRevenueReference
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.expenserevenuereference import ExpenseRevenueReference
+from pyconnectwise.models.manage.forecastitem import ForecastItem
+from pyconnectwise.models.manage.forecastrevenuereference import ForecastRevenueReference
+from pyconnectwise.models.manage.inclusiverevenuereference import InclusiveRevenueReference
+from pyconnectwise.models.manage.lostrevenuereference import LostRevenueReference
+from pyconnectwise.models.manage.openrevenuereference import OpenRevenueReference
+from pyconnectwise.models.manage.other1revenuereference import Other1RevenueReference
+from pyconnectwise.models.manage.other2revenuereference import Other2RevenueReference
+from pyconnectwise.models.manage.productrevenuereference import ProductRevenueReference
+from pyconnectwise.models.manage.servicerevenuereference import ServiceRevenueReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.timerevenuereference import TimeRevenueReference
+from pyconnectwise.models.manage.wonrevenuereference import WonRevenueReference
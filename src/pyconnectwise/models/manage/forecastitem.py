@@ -0,0 +1,64 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ForecastItem(ConnectWiseModel):
+    id: int | None = None
+    forecast_description: str | None = Field(default=None, alias='forecastDescription')
+    """
+     Max length: 50;
+    """
+    opportunity: OpportunityReference | None = None
+    quantity: float | None = None
+    status: OpportunityStatusReference | None = None
+    catalog_item: IvItemReference | None = Field(default=None, alias='catalogItem')
+    product_description: str | None = Field(default=None, alias='productDescription')
+    product_class: str | None = Field(default=None, alias='productClass')
+    revenue: float | None = None
+    cost: float | None = None
+    margin: float | None = None
+    percentage: int | None = None
+    include_flag: bool | None = Field(default=None, alias='includeFlag')
+    quote_werks_doc_no: str | None = Field(default=None, alias='quoteWerksDocNo')
+    """
+     Max length: 20;
+    """
+    quote_werks_doc_name: str | None = Field(default=None, alias='quoteWerksDocName')
+    """
+     Max length: 255;
+    """
+    quote_werks_quantity: int | None = Field(default=None, alias='quoteWerksQuantity')
+    forecast_type: Literal[
+        'Other1', 'Other2', 'Agreement', 'Product', 'Service'
+    ] = Field(..., alias='forecastType')
+    link_flag: bool | None = Field(default=None, alias='linkFlag')
+    recurring_revenue: float | None = Field(default=None, alias='recurringRevenue')
+    recurring_cost: float | None = Field(default=None, alias='recurringCost')
+    recurring_date_start: datetime | None = Field(
+        default=None, alias='recurringDateStart'
+    )
+    recurring_date_end: datetime | None = Field(default=None, alias='recurringDateEnd')
+    bill_cycle: BillingCycleReference | None = Field(default=None, alias='billCycle')
+    cycle_basis: str | None = Field(default=None, alias='cycleBasis')
+    cycles: int | None = None
+    recurring_flag: bool | None = Field(default=None, alias='recurringFlag')
+    sequence_number: float | None = Field(default=None, alias='sequenceNumber')
+    sub_number: int | None = Field(default=None, alias='subNumber')
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingcyclereference import BillingCycleReference
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.opportunitystatusreference import OpportunityStatusReference
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class FormSubmitted(ConnectWiseModel):
+    id: int | None = None
+    campaign_id: int | None = Field(default=None, alias='campaignId')
+    contact_id: int = Field(..., alias='contactId')
+    date_submitted: datetime | None = Field(default=None, alias='dateSubmitted')
+    url: str
+    """
+     Max length: 2083;
+    """
+    query_string: str | None = Field(default=None, alias='queryString')
+    page_type: str | None = Field(default=None, alias='pageType')
+    page_sub_type: str | None = Field(default=None, alias='pageSubType')
+    topic: str | None = None
+    version: str | None = None
+    status: str | None = None
@@ -0,0 +1,137 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLAccount(ConnectWiseModel):
+    id: int | None = None
+    gl_type: Literal[
+        'AP',
+        'AR',
+        'EE',
+        'EI',
+        'EO',
+        'IA',
+        'IT',
+        'P',
+        'PF',
+        'R',
+        'RA',
+        'RD',
+        'RE',
+        'RP',
+        'ST',
+        'SD',
+        'ET',
+        'FT',
+        'PT',
+        'WP',
+        'WR',
+    ] = Field(..., alias='glType')
+    mapped_type: MappedTypeReference = Field(..., alias='mappedType')
+    mapped_record: MappedRecordReference = Field(..., alias='mappedRecord')
+    segment1: str | None = None
+    """
+     Max length: 255;
+    """
+    segment2: str | None = None
+    """
+     Max length: 255;
+    """
+    segment3: str | None = None
+    """
+     Max length: 255;
+    """
+    segment4: str | None = None
+    """
+     Max length: 255;
+    """
+    segment5: str | None = None
+    """
+     Max length: 255;
+    """
+    segment6: str | None = None
+    """
+     Max length: 255;
+    """
+    segment7: str | None = None
+    """
+     Max length: 255;
+    """
+    segment8: str | None = None
+    """
+     Max length: 255;
+    """
+    segment9: str | None = None
+    """
+     Max length: 255;
+    """
+    segment10: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs1: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs2: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs3: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs4: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs5: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs6: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs7: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs8: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs9: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs10: str | None = None
+    """
+     Max length: 255;
+    """
+    product_id: str | None = Field(default=None, alias='productId')
+    """
+     Max length: 255;
+    """
+    inventory: str | None = None
+    """
+     Max length: 255;
+    """
+    sales_code: str | None = Field(default=None, alias='salesCode')
+    """
+     Max length: 255;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.mappedrecordreference import MappedRecordReference
+from pyconnectwise.models.manage.mappedtypereference import MappedTypeReference
@@ -0,0 +1,105 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLCaption(ConnectWiseModel):
+    id: int | None = None
+    segment1: str | None = None
+    """
+     Max length: 255;
+    """
+    segment2: str | None = None
+    """
+     Max length: 255;
+    """
+    segment3: str | None = None
+    """
+     Max length: 255;
+    """
+    segment4: str | None = None
+    """
+     Max length: 255;
+    """
+    segment5: str | None = None
+    """
+     Max length: 255;
+    """
+    segment6: str | None = None
+    """
+     Max length: 255;
+    """
+    segment7: str | None = None
+    """
+     Max length: 255;
+    """
+    segment8: str | None = None
+    """
+     Max length: 255;
+    """
+    segment9: str | None = None
+    """
+     Max length: 255;
+    """
+    segment10: str | None = None
+    """
+     Max length: 255;
+    """
+    segment1type: Literal['Account', 'Class'] | None = None
+    segment2type: Literal['Account', 'Class'] | None = None
+    segment3type: Literal['Account', 'Class'] | None = None
+    segment4type: Literal['Account', 'Class'] | None = None
+    segment5type: Literal['Account', 'Class'] | None = None
+    segment6type: Literal['Account', 'Class'] | None = None
+    segment7type: Literal['Account', 'Class'] | None = None
+    segment8type: Literal['Account', 'Class'] | None = None
+    segment9type: Literal['Account', 'Class'] | None = None
+    segment10type: Literal['Account', 'Class'] | None = None
+    cogs1: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs2: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs3: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs4: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs5: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs6: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs7: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs8: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs9: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs10: str | None = None
+    """
+     Max length: 255;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
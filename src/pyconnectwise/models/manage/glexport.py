@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExport(ConnectWiseModel):
+    export_settings: GLExportSettings | None = Field(
+        default=None, alias='exportSettings'
+    )
+    vendors: list[GLExportVendor] | None = None
+    customers: list[GLExportCustomer] | None = None
+    transactions: list[GLExportTransaction] | None = None
+    expenses: list[GLExportExpense] | None = None
+    expense_bills: list[GLExportExpenseBill] | None = Field(
+        default=None, alias='expenseBills'
+    )
+    purchase_transactions: list[GLExportPurchaseTransaction] | None = Field(
+        default=None, alias='purchaseTransactions'
+    )
+    adjustment_transactions: list[GLExportAdjustmentTransaction] | None = Field(
+        default=None, alias='adjustmentTransactions'
+    )
+    inventory_transfers: list[GLExportInventoryTransfer] | None = Field(
+        default=None, alias='inventoryTransfers'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.glexportadjustmenttransaction import GLExportAdjustmentTransaction
+from pyconnectwise.models.manage.glexportcustomer import GLExportCustomer
+from pyconnectwise.models.manage.glexportexpense import GLExportExpense
+from pyconnectwise.models.manage.glexportexpensebill import GLExportExpenseBill
+from pyconnectwise.models.manage.glexportinventorytransfer import GLExportInventoryTransfer
+from pyconnectwise.models.manage.glexportpurchasetransaction import GLExportPurchaseTransaction
+from pyconnectwise.models.manage.glexportsettings import GLExportSettings
+from pyconnectwise.models.manage.glexporttransaction import GLExportTransaction
+from pyconnectwise.models.manage.glexportvendor import GLExportVendor
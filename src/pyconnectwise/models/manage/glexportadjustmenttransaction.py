@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportAdjustmentTransaction(ConnectWiseModel):
+    id: str | None = None
+    document_type: str | None = Field(default=None, alias='documentType')
+    document_date: str | None = Field(default=None, alias='documentDate')
+    gl_type_id: str | None = Field(default=None, alias='glTypeID')
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    memo: str | None = None
+    gl_class: str | None = Field(default=None, alias='glClass')
+    adjustment_description: str | None = Field(
+        default=None, alias='adjustmentDescription'
+    )
+    adjustment_detail: list[GLExportAdjustmentTransactionDetail] | None = Field(
+        default=None, alias='adjustmentDetail'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.glexportadjustmenttransactiondetail import GLExportAdjustmentTransactionDetail
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportAdjustmentTransactionDetail(ConnectWiseModel):
+    gl_class: str | None = Field(default=None, alias='glClass')
+    description: str | None = None
+    memo: str | None = None
+    item: IvItemReference | None = None
+    quantity: int | None = None
+    total: float | None = None
+    cost: float | None = None
+    cost_account_number: str | None = Field(default=None, alias='costAccountNumber')
+    inventory_account_number: str | None = Field(
+        default=None, alias='inventoryAccountNumber'
+    )
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    product_account_number: str | None = Field(
+        default=None, alias='productAccountNumber'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
@@ -0,0 +1,61 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportCustomer(ConnectWiseModel):
+    company: CompanyReference | None = None
+    company_type: CompanyTypeReference | None = Field(default=None, alias='companyType')
+    contact: ContactReference | None = None
+    site: SiteReference | None = None
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    billing_terms_xref: str | None = Field(default=None, alias='billingTermsXref')
+    due_days: int | None = Field(default=None, alias='dueDays')
+    taxable: bool | None = None
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    currency: CurrencyReference | None = None
+    state_tax_xref: str | None = Field(default=None, alias='stateTaxXref')
+    county_tax_xref: str | None = Field(default=None, alias='countyTaxXref')
+    city_tax_xref: str | None = Field(default=None, alias='cityTaxXref')
+    country_tax_xref: str | None = Field(default=None, alias='countryTaxXref')
+    composite_tax_xref: str | None = Field(default=None, alias='compositeTaxXref')
+    state_tax_rate: float | None = Field(default=None, alias='stateTaxRate')
+    county_tax_rate: float | None = Field(default=None, alias='countyTaxRate')
+    city_tax_rate: float | None = Field(default=None, alias='cityTaxRate')
+    country_tax_rate: float | None = Field(default=None, alias='countryTaxRate')
+    composite_tax_rate: float | None = Field(default=None, alias='compositeTaxRate')
+    tax_group_rate: float | None = Field(default=None, alias='taxGroupRate')
+    tax_agency_xref: str | None = Field(default=None, alias='taxAgencyXref')
+    state_tax_agency_xref: str | None = Field(default=None, alias='stateTaxAgencyXref')
+    county_tax_agency_xref: str | None = Field(
+        default=None, alias='countyTaxAgencyXref'
+    )
+    city_tax_agency_xref: str | None = Field(default=None, alias='cityTaxAgencyXref')
+    country_tax_agency_xref: str | None = Field(
+        default=None, alias='countryTaxAgencyXref'
+    )
+    composite_tax_agency_xref: str | None = Field(
+        default=None, alias='compositeTaxAgencyXref'
+    )
+    tax_levels: list[GLExportCustomerTaxLevel] | None = Field(
+        default=None, alias='taxLevels'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.companytypereference import CompanyTypeReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.glexportcustomertaxlevel import GLExportCustomerTaxLevel
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
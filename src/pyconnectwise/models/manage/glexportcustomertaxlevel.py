@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportCustomerTaxLevel(ConnectWiseModel):
+    tax_rate: float | None = Field(default=None, alias='taxRate')
+    tax_code_xref: str | None = Field(default=None, alias='taxCodeXref')
+    agency_xref: str | None = Field(default=None, alias='agencyXref')
+    tax_level: int | None = Field(default=None, alias='taxLevel')
@@ -0,0 +1,41 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportExpense(ConnectWiseModel):
+    id: int | None = None
+    document_date: str | None = Field(default=None, alias='documentDate')
+    document_type: str | None = Field(default=None, alias='documentType')
+    ap_account_number: str | None = Field(default=None, alias='apAccountNumber')
+    ap_class: str | None = Field(default=None, alias='apClass')
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    gl_class: str | None = Field(default=None, alias='glClass')
+    gl_type_id: str | None = Field(default=None, alias='glTypeId')
+    memo: str | None = None
+    description: str | None = None
+    period_start_date: str | None = Field(default=None, alias='periodStartDate')
+    period_end_date: str | None = Field(default=None, alias='periodEndDate')
+    member: MemberReference | None = None
+    vendor_number: str | None = Field(default=None, alias='vendorNumber')
+    company: CompanyReference | None = None
+    company_account_number: str | None = Field(
+        default=None, alias='companyAccountNumber'
+    )
+    project: ProjectReference | None = None
+    currency: CurrencyReference | None = None
+    total: float | None = None
+    offset: GLExportExpenseOffset | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.glexportexpenseoffset import GLExportExpenseOffset
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
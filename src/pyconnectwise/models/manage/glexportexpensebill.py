@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportExpenseBill(ConnectWiseModel):
+    id: int | None = None
+    document_date: str | None = Field(default=None, alias='documentDate')
+    document_type: str | None = Field(default=None, alias='documentType')
+    document_number: str | None = Field(default=None, alias='documentNumber')
+    memo: str | None = None
+    gl_class: str | None = Field(default=None, alias='glClass')
+    ap_account_number: str | None = Field(default=None, alias='apAccountNumber')
+    member: MemberReference | None = None
+    vendor_number: str | None = Field(default=None, alias='vendorNumber')
+    currency: CurrencyReference | None = None
+    total: float | None = None
+    detail: list[GLExportExpenseBillDetail] | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.glexportexpensebilldetail import GLExportExpenseBillDetail
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportExpenseBillDetail(ConnectWiseModel):
+    id: list[int] | None = None
+    document_date: str | None = Field(default=None, alias='documentDate')
+    gl_type_id: str | None = Field(default=None, alias='glTypeId')
+    memo: str | None = None
+    company: CompanyReference | None = None
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    expense_class: ClassificationReference | None = Field(
+        default=None, alias='expenseClass'
+    )
+    currency: CurrencyReference | None = None
+    total: float | None = None
+    billable: bool | None = None
+    reimbursable: bool | None = None
+    company_advance: bool | None = Field(default=None, alias='companyAdvance')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.classificationreference import ClassificationReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
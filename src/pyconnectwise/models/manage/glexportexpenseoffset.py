@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportExpenseOffset(ConnectWiseModel):
+    id: int | None = None
+    document_date: str | None = Field(default=None, alias='documentDate')
+    document_type: str | None = Field(default=None, alias='documentType')
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    gl_type_id: str | None = Field(default=None, alias='glTypeId')
+    gl_class: str | None = Field(default=None, alias='glClass')
+    member: MemberReference | None = None
+    memo: str | None = None
+    description: str | None = None
+    total: float | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,75 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportInventoryTransfer(ConnectWiseModel):
+    id: str | None = None
+    document_type: str | None = Field(default=None, alias='documentType')
+    document_date: str | None = Field(default=None, alias='documentDate')
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    gl_class: str | None = Field(default=None, alias='glClass')
+    gl_type_id: str | None = Field(default=None, alias='glTypeId')
+    description: str | None = None
+    sales_code: str | None = Field(default=None, alias='salesCode')
+    memo: str | None = None
+    cost_account_number: str | None = Field(default=None, alias='costAccountNumber')
+    inventory_account_number: str | None = Field(
+        default=None, alias='inventoryAccountNumber'
+    )
+    transfer_id: int | None = Field(default=None, alias='transferId')
+    item: IvItemReference | None = None
+    gl_item_id: str | None = Field(default=None, alias='glItemId')
+    sales_description: str | None = Field(default=None, alias='salesDescription')
+    item_description: str | None = Field(default=None, alias='itemDescription')
+    currency: CurrencyReference | None = None
+    item_price: float | None = Field(default=None, alias='itemPrice')
+    taxable: bool | None = None
+    unit_of_measure: UnitOfMeasureReference | None = Field(
+        default=None, alias='unitOfMeasure'
+    )
+    quantity: float | None = None
+    cost: float | None = None
+    total: float | None = None
+    sub_category: ProductSubCategoryReference | None = Field(
+        default=None, alias='subCategory'
+    )
+    serialized_flag: bool | None = Field(default=None, alias='serializedFlag')
+    serial_numbers: str | None = Field(default=None, alias='serialNumbers')
+    bin: WarehouseBinReference | None = None
+    warehouse: WarehouseReference | None = None
+    transfer_from_bin: WarehouseBinReference | None = Field(
+        default=None, alias='transferFromBin'
+    )
+    transfer_from_location_xref: str | None = Field(
+        default=None, alias='transferFromLocationXref'
+    )
+    transfer_to_bin: WarehouseBinReference | None = Field(
+        default=None, alias='transferToBin'
+    )
+    transfer_to_location_xref: str | None = Field(
+        default=None, alias='transferToLocationXref'
+    )
+    location_xref: str | None = Field(default=None, alias='locationXref')
+    price_level_xref: str | None = Field(default=None, alias='priceLevelXref')
+    uom_schedule_xref: str | None = Field(default=None, alias='uomScheduleXref')
+    item_type_xref: str | None = Field(default=None, alias='itemTypeXref')
+    inventory_xref: str | None = Field(default=None, alias='inventoryXref')
+    cogs_xref: str | None = Field(default=None, alias='cogsXref')
+    tax_note: str | None = Field(default=None, alias='taxNote')
+    offset: GLExportInventoryTransferOffset | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.glexportinventorytransferoffset import GLExportInventoryTransferOffset
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.productsubcategoryreference import ProductSubCategoryReference
+from pyconnectwise.models.manage.unitofmeasurereference import UnitOfMeasureReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
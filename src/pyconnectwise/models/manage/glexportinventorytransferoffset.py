@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportInventoryTransferOffset(ConnectWiseModel):
+    id: int | None = None
+    document_type: str | None = Field(default=None, alias='documentType')
+    document_date: str | None = Field(default=None, alias='documentDate')
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    gl_class: str | None = Field(default=None, alias='glClass')
+    total: float | None = None
+    memo: str | None = None
+    description: str | None = None
+    gl_type_id: str | None = Field(default=None, alias='glTypeId')
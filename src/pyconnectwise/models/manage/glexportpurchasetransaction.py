@@ -0,0 +1,90 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportPurchaseTransaction(ConnectWiseModel):
+    id: str | None = None
+    document_date: str | None = Field(default=None, alias='documentDate')
+    document_number: str | None = Field(default=None, alias='documentNumber')
+    description: str | None = None
+    memo: str | None = None
+    ap_account_number: str | None = Field(default=None, alias='apAccountNumber')
+    purchase_date: str | None = Field(default=None, alias='purchaseDate')
+    company: CompanyReference | None = None
+    company_type: CompanyTypeReference | None = Field(default=None, alias='companyType')
+    contact: ContactReference | None = None
+    site: SiteReference | None = None
+    purchase_class: str | None = Field(default=None, alias='purchaseClass')
+    freight_amount: float | None = Field(default=None, alias='freightAmount')
+    freight_packing_slip: str | None = Field(default=None, alias='freightPackingSlip')
+    packing_slip: str | None = Field(default=None, alias='packingSlip')
+    dropship_flag: bool | None = Field(default=None, alias='dropshipFlag')
+    currency: CurrencyReference | None = None
+    total: float | None = None
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    billing_terms_xref: str | None = Field(default=None, alias='billingTermsXref')
+    due_days: int | None = Field(default=None, alias='dueDays')
+    vendor_number: str | None = Field(default=None, alias='vendorNumber')
+    vendor_account_number: str | None = Field(default=None, alias='vendorAccountNumber')
+    vendor_invoice_date: str | None = Field(default=None, alias='vendorInvoiceDate')
+    vendor_invoice_number: str | None = Field(default=None, alias='vendorInvoiceNumber')
+    tax_agency_xref: str | None = Field(default=None, alias='taxAgencyXref')
+    state_tax_xref: str | None = Field(default=None, alias='stateTaxXref')
+    county_tax_xref: str | None = Field(default=None, alias='countyTaxXref')
+    city_tax_xref: str | None = Field(default=None, alias='cityTaxXref')
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    ship_to_company_account_number: str | None = Field(
+        default=None, alias='shipToCompanyAccountNumber'
+    )
+    ship_to_company_type: CompanyTypeReference | None = Field(
+        default=None, alias='shipToCompanyType'
+    )
+    ship_to_contact: ContactReference | None = Field(
+        default=None, alias='shipToContact'
+    )
+    ship_to_site: SiteReference | None = Field(default=None, alias='shipToSite')
+    ship_to_tax_group: str | None = Field(default=None, alias='shipToTaxGroup')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    tax_group_rate: float | None = Field(default=None, alias='taxGroupRate')
+    use_avalara_tax_flag: bool | None = Field(default=None, alias='useAvalaraTaxFlag')
+    purchase_header_tax_group: str | None = Field(
+        default=None, alias='purchaseHeaderTaxGroup'
+    )
+    purchase_header_taxable_flag: bool | None = Field(
+        default=None, alias='purchaseHeaderTaxableFlag'
+    )
+    purchase_header_freight_taxable_flag: bool | None = Field(
+        default=None, alias='purchaseHeaderFreightTaxableFlag'
+    )
+    tax_levels: list[GLExportPurchaseTransactionTaxLevel] | None = Field(
+        default=None, alias='taxLevels'
+    )
+    purchase_detail: list[GLExportPurchaseTransactionDetail] | None = Field(
+        default=None, alias='purchaseDetail'
+    )
+    purchase_detail_tax: list[GLExportPurchaseTransactionDetailTax] | None = Field(
+        default=None, alias='purchaseDetailTax'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.companytypereference import CompanyTypeReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.glexportpurchasetransactiondetail import GLExportPurchaseTransactionDetail
+from pyconnectwise.models.manage.glexportpurchasetransactiondetailtax import GLExportPurchaseTransactionDetailTax
+from pyconnectwise.models.manage.glexportpurchasetransactiontaxlevel import GLExportPurchaseTransactionTaxLevel
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
@@ -0,0 +1,78 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportPurchaseTransactionDetail(ConnectWiseModel):
+    id: int | None = None
+    document_date: str | None = Field(default=None, alias='documentDate')
+    gl_class: str | None = Field(default=None, alias='glClass')
+    gl_type_id: str | None = Field(default=None, alias='glTypeId')
+    gl_item_id: str | None = Field(default=None, alias='glItemId')
+    sales_code: str | None = Field(default=None, alias='salesCode')
+    description: str | None = None
+    cost: float | None = None
+    memo: str | None = None
+    tax_note: str | None = Field(default=None, alias='taxNote')
+    vendor_number: str | None = Field(default=None, alias='vendorNumber')
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    cost_account_number: str | None = Field(default=None, alias='costAccountNumber')
+    inventory_account_number: str | None = Field(
+        default=None, alias='inventoryAccountNumber'
+    )
+    vendor_account_number: str | None = Field(default=None, alias='vendorAccountNumber')
+    item: IvItemReference | None = None
+    item_description: str | None = Field(default=None, alias='itemDescription')
+    sales_description: str | None = Field(default=None, alias='salesDescription')
+    taxable: bool | None = None
+    item_price: float | None = Field(default=None, alias='itemPrice')
+    item_cost: float | None = Field(default=None, alias='itemCost')
+    unit_of_measure: UnitOfMeasureReference | None = Field(
+        default=None, alias='unitOfMeasure'
+    )
+    quantity: float | None = None
+    total: float | None = None
+    currency: CurrencyReference | None = None
+    serialized_flag: bool | None = Field(default=None, alias='serializedFlag')
+    serial_numbers: str | None = Field(default=None, alias='serialNumbers')
+    drop_shipped_flag: bool | None = Field(default=None, alias='dropShippedFlag')
+    line_number: int | None = Field(default=None, alias='lineNumber')
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    warehouse_site: SiteReference | None = Field(default=None, alias='warehouseSite')
+    sub_category: ProductSubCategoryReference | None = Field(
+        default=None, alias='subCategory'
+    )
+    shipment_method: ShipmentMethodReference | None = Field(
+        default=None, alias='shipmentMethod'
+    )
+    item_type_xref: str | None = Field(default=None, alias='itemTypeXref')
+    inventory_xref: str | None = Field(default=None, alias='inventoryXref')
+    cogs_xref: str | None = Field(default=None, alias='cogsXref')
+    uom_schedule_xref: str | None = Field(default=None, alias='uomScheduleXref')
+    price_level_xref: str | None = Field(default=None, alias='priceLevelXref')
+    location_xref: str | None = Field(default=None, alias='locationXref')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    purchase_header_tax_group: str | None = Field(
+        default=None, alias='purchaseHeaderTaxGroup'
+    )
+    tax_code_xref: str | None = Field(default=None, alias='taxCodeXref')
+    tax_rate: float | None = Field(default=None, alias='taxRate')
+    tax_agency_xref: str | None = Field(default=None, alias='taxAgencyXref')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.productsubcategoryreference import ProductSubCategoryReference
+from pyconnectwise.models.manage.shipmentmethodreference import ShipmentMethodReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.unitofmeasurereference import UnitOfMeasureReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportPurchaseTransactionTaxLevel(ConnectWiseModel):
+    tax_code_xref: str | None = Field(default=None, alias='taxCodeXref')
+    tax_level: int | None = Field(default=None, alias='taxLevel')
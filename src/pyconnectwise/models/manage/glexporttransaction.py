@@ -0,0 +1,100 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportTransaction(ConnectWiseModel):
+    id: int | None = None
+    gl_class: str | None = Field(default=None, alias='glClass')
+    gl_type_id: str | None = Field(default=None, alias='glTypeId')
+    document_date: str | None = Field(default=None, alias='documentDate')
+    document_number: str | None = Field(default=None, alias='documentNumber')
+    document_type: str | None = Field(default=None, alias='documentType')
+    memo: str | None = None
+    description: str | None = None
+    attention: str | None = None
+    sales_territory: str | None = Field(default=None, alias='salesTerritory')
+    company: CompanyReference | None = None
+    company_type: CompanyTypeReference | None = Field(default=None, alias='companyType')
+    company_account_number: str | None = Field(
+        default=None, alias='companyAccountNumber'
+    )
+    site: SiteReference | None = None
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    billing_terms_xref: str | None = Field(default=None, alias='billingTermsXref')
+    due_days: int | None = Field(default=None, alias='dueDays')
+    due_date: str | None = Field(default=None, alias='dueDate')
+    email_delivery_flag: bool | None = Field(default=None, alias='emailDeliveryFlag')
+    print_delivery_flag: bool | None = Field(default=None, alias='printDeliveryFlag')
+    agreement_pre_payment_flag: bool | None = Field(
+        default=None, alias='agreementPrePaymentFlag'
+    )
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    billing_type: str | None = Field(default=None, alias='billingType')
+    gl_entry_ids: str | None = Field(default=None, alias='glEntryIds')
+    purchase_order: PurchaseOrderReference | None = Field(
+        default=None, alias='purchaseOrder'
+    )
+    project: ProjectReference | None = None
+    currency: CurrencyReference | None = None
+    total: float | None = None
+    sales_rep_id: str | None = Field(default=None, alias='salesRepId')
+    sales_rep_name: str | None = Field(default=None, alias='salesRepName')
+    taxable: bool | None = None
+    taxable_total: float | None = Field(default=None, alias='taxableTotal')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    tax_group_rate: float | None = Field(default=None, alias='taxGroupRate')
+    piggy_back_flag: bool | None = Field(default=None, alias='piggyBackFlag')
+    tax_account_number: str | None = Field(default=None, alias='taxAccountNumber')
+    sales_tax: float | None = Field(default=None, alias='salesTax')
+    state_tax: float | None = Field(default=None, alias='stateTax')
+    county_tax: float | None = Field(default=None, alias='countyTax')
+    city_tax: float | None = Field(default=None, alias='cityTax')
+    taxable_amount1: float | None = Field(default=None, alias='taxableAmount1')
+    taxable_amount2: float | None = Field(default=None, alias='taxableAmount2')
+    taxable_amount3: float | None = Field(default=None, alias='taxableAmount3')
+    taxable_amount4: float | None = Field(default=None, alias='taxableAmount4')
+    taxable_amount5: float | None = Field(default=None, alias='taxableAmount5')
+    tax_agency_xref: str | None = Field(default=None, alias='taxAgencyXref')
+    state_tax_xref: str | None = Field(default=None, alias='stateTaxXref')
+    county_tax_xref: str | None = Field(default=None, alias='countyTaxXref')
+    tax_id: str | None = Field(default=None, alias='taxId')
+    tax_dp_applied_flag: bool | None = Field(default=None, alias='taxDpAppliedFlag')
+    use_avalara_flag: bool | None = Field(default=None, alias='useAvalaraFlag')
+    send_avalara_tax_flag: bool | None = Field(default=None, alias='sendAvalaraTaxFlag')
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    ship_to_company_account_number: str | None = Field(
+        default=None, alias='shipToCompanyAccountNumber'
+    )
+    ship_to_company_type: CompanyTypeReference | None = Field(
+        default=None, alias='shipToCompanyType'
+    )
+    ship_to_tax_id: str | None = Field(default=None, alias='shipToTaxId')
+    ship_site: SiteReference | None = Field(default=None, alias='shipSite')
+    ship_contact: str | None = Field(default=None, alias='shipContact')
+    detail: list[GLExportTransactionDetail] | None = None
+    tax_levels: list[GLExportTransactionTaxLevel] | None = Field(
+        default=None, alias='taxLevels'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.companytypereference import CompanyTypeReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.glexporttransactiondetail import GLExportTransactionDetail
+from pyconnectwise.models.manage.glexporttransactiontaxlevel import GLExportTransactionTaxLevel
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.purchaseorderreference import PurchaseOrderReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
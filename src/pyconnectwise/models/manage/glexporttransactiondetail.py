@@ -0,0 +1,93 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportTransactionDetail(ConnectWiseModel):
+    id: int | None = None
+    document_date: str | None = Field(default=None, alias='documentDate')
+    document_type: str | None = Field(default=None, alias='documentType')
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    gl_class: str | None = Field(default=None, alias='glClass')
+    gl_type_id: str | None = Field(default=None, alias='glTypeId')
+    gl_item_id: str | None = Field(default=None, alias='glItemId')
+    invoice_summary_option: str | None = Field(
+        default=None, alias='invoiceSummaryOption'
+    )
+    cost: float | None = None
+    sales_code: str | None = Field(default=None, alias='salesCode')
+    memo: str | None = None
+    description: str | None = None
+    quantity: float | None = None
+    total: float | None = None
+    currency: CurrencyReference | None = None
+    time_entry: TimeEntryReference | None = Field(default=None, alias='timeEntry')
+    cost_account_number: str | None = Field(default=None, alias='costAccountNumber')
+    inventory_account_number: str | None = Field(
+        default=None, alias='inventoryAccountNumber'
+    )
+    product_account_number: str | None = Field(
+        default=None, alias='productAccountNumber'
+    )
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    tax_code_xref: str | None = Field(default=None, alias='taxCodeXref')
+    tax_agency_xref: str | None = Field(default=None, alias='taxAgencyXref')
+    tax_note: str | None = Field(default=None, alias='taxNote')
+    tax_rate: float | None = Field(default=None, alias='taxRate')
+    tax_rate_percent: float | None = Field(default=None, alias='taxRatePercent')
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    taxable2_flag: bool | None = Field(default=None, alias='taxable2Flag')
+    taxable3_flag: bool | None = Field(default=None, alias='taxable3Flag')
+    taxable4_flag: bool | None = Field(default=None, alias='taxable4Flag')
+    taxable5_flag: bool | None = Field(default=None, alias='taxable5Flag')
+    item: IvItemReference | None = None
+    product: ProductReference | None = None
+    item_taxable_flag: bool | None = Field(default=None, alias='itemTaxableFlag')
+    item_price: float | None = Field(default=None, alias='itemPrice')
+    item_cost: float | None = Field(default=None, alias='itemCost')
+    item_description: str | None = Field(default=None, alias='itemDescription')
+    sales_description: str | None = Field(default=None, alias='salesDescription')
+    unit_of_measure: UnitOfMeasureReference | None = Field(
+        default=None, alias='unitOfMeasure'
+    )
+    sub_category: ProductSubCategoryReference | None = Field(
+        default=None, alias='subCategory'
+    )
+    serialized_flag: bool | None = Field(default=None, alias='serializedFlag')
+    serial_numbers: str | None = Field(default=None, alias='serialNumbers')
+    warehouse_site: SiteReference | None = Field(default=None, alias='warehouseSite')
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    shipment_method: ShipmentMethodReference | None = Field(
+        default=None, alias='shipmentMethod'
+    )
+    drop_shipped_flag: bool | None = Field(default=None, alias='dropShippedFlag')
+    item_type_xref: str | None = Field(default=None, alias='itemTypeXref')
+    inventory_xref: str | None = Field(default=None, alias='inventoryXref')
+    cogs_xref: str | None = Field(default=None, alias='cogsXref')
+    uom_schedule_xref: str | None = Field(default=None, alias='uomScheduleXref')
+    price_level_xref: str | None = Field(default=None, alias='priceLevelXref')
+    location_xref: str | None = Field(default=None, alias='locationXref')
+    tax_levels: list[GLExportTransactionDetailTaxLevel] | None = Field(
+        default=None, alias='taxLevels'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.glexporttransactiondetailtaxlevel import GLExportTransactionDetailTaxLevel
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.productreference import ProductReference
+from pyconnectwise.models.manage.productsubcategoryreference import ProductSubCategoryReference
+from pyconnectwise.models.manage.shipmentmethodreference import ShipmentMethodReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.timeentryreference import TimeEntryReference
+from pyconnectwise.models.manage.unitofmeasurereference import UnitOfMeasureReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
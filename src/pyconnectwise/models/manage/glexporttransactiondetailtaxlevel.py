@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportTransactionDetailTaxLevel(ConnectWiseModel):
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    tax_level: int | None = Field(default=None, alias='taxLevel')
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportTransactionTaxLevel(ConnectWiseModel):
+    tax_amount: float | None = Field(default=None, alias='taxAmount')
+    taxable_amount: float | None = Field(default=None, alias='taxableAmount')
+    tax_code_xref: str | None = Field(default=None, alias='taxCodeXref')
+    tax_level: int | None = Field(default=None, alias='taxLevel')
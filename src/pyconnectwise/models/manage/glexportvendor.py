@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportVendor(ConnectWiseModel):
+    member: MemberReference | None = None
+    vendor: CompanyReference | None = None
+    vendor_number: str | None = Field(default=None, alias='vendorNumber')
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    due_days: int | None = Field(default=None, alias='dueDays')
+    site: SiteReference | None = None
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLPath(ConnectWiseModel):
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    path: str | None = None
+    """
+     Max length: 255;
+    """
+    sql_server_name: str | None = Field(default=None, alias='sqlServerName')
+    """
+     Max length: 255;
+    """
+    database_name: str | None = Field(default=None, alias='databaseName')
+    """
+     Max length: 100;
+    """
+    last_payment_sync: datetime | None = Field(default=None, alias='lastPaymentSync')
+    last_payment_sync_by: MemberReference | None = Field(
+        default=None, alias='lastPaymentSyncBy'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
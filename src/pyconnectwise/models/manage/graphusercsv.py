@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GraphUserCsv(ConnectWiseModel):
+    id: str | None = None
+    display_name: str | None = Field(default=None, alias='displayName')
+    principal_name: str | None = Field(default=None, alias='principalName')
+    country: str | None = None
+    state: str | None = None
+    city: str | None = None
+    department: str | None = None
+    first_name: str | None = Field(default=None, alias='firstName')
+    last_name: str | None = Field(default=None, alias='lastName')
+    address: str | None = None
+    postal_code: str | None = Field(default=None, alias='postalCode')
+    mail: str | None = None
+    is_matched_contact: bool | None = Field(default=None, alias='isMatchedContact')
+    account_enabled: bool | None = Field(default=None, alias='accountEnabled')
+    manage_contact_rec_id: int | None = Field(default=None, alias='manageContactRecId')
+    manage_contact_name: str | None = Field(default=None, alias='manageContactName')
+    job_title: str | None = Field(default=None, alias='jobTitle')
+    proxy_addresses: list[str] | None = Field(default=None, alias='proxyAddresses')
+    nick_name: str | None = Field(default=None, alias='nickName')
+    manager: Manager | None = None
+    employee_type: str | None = Field(default=None, alias='employeeType')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.manager import Manager
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Group(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    public_description: str | None = Field(default=None, alias='publicDescription')
+    """
+     Max length: 255;
+    """
+    public_flag: bool | None = Field(default=None, alias='publicFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
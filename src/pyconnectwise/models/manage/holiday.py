@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import date
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Holiday(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    all_day_flag: bool | None = Field(default=None, alias='allDayFlag')
+    """
+    Can be set to false to set a holiday for specific hours (Defaults to True).
+    """
+    date: date
+    time_start: str | None = Field(default=None, alias='timeStart')
+    time_end: str | None = Field(default=None, alias='timeEnd')
+    holiday_list: HolidayListReference | None = Field(default=None, alias='holidayList')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.holidaylistreference import HolidayListReference
@@ -0,0 +1,50 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Imap(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 200;
+    """
+    imap_name: str = Field(..., alias='imapName')
+    """
+     Max length: 40;
+    """
+    processed_name: str = Field(..., alias='processedName')
+    """
+     Max length: 40;
+    """
+    failed_folder: str = Field(..., alias='failedFolder')
+    """
+     Max length: 40;
+    """
+    server: str
+    """
+     Max length: 200;
+    """
+    user_name: str = Field(..., alias='userName')
+    """
+     Max length: 80;
+    """
+    password: str | None = None
+    """
+     Max length: 80;
+    """
+    port: int
+    ssl_flag: bool | None = Field(default=None, alias='sslFlag')
+    email_connector: EmailConnectorReference | None = Field(
+        default=None, alias='emailConnector'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.emailconnectorreference import EmailConnectorReference
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ImportMassMaintenance(ConnectWiseModel):
+    deleted_contact_count: int | None = Field(default=None, alias='deletedContactCount')
+    deleted_company_count: int | None = Field(default=None, alias='deletedCompanyCount')
+    message: str | None = None
+    success: bool | None = None
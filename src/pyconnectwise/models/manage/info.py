@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Info(ConnectWiseModel):
+    version: str | None = None
+    is_cloud: bool | None = Field(default=None, alias='isCloud')
+    server_time_zone: str | None = Field(default=None, alias='serverTimeZone')
+    license_bits: list[LicenseBit] | None = Field(default=None, alias='licenseBits')
+    cloud_region: str | None = Field(default=None, alias='cloudRegion')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.licensebit import LicenseBit
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InOutBoard(ConnectWiseModel):
+    id: int | None = None
+    member: MemberReference | None = None
+    in_out_type: InOutTypeReference | None = Field(default=None, alias='inOutType')
+    additional_info: str | None = Field(default=None, alias='additionalInfo')
+    """
+     Max length: 100;
+    """
+    date_back: datetime = Field(..., alias='dateBack')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.inouttypereference import InOutTypeReference
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,191 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class IntegratorLogin(ConnectWiseModel):
+    id: int | None = None
+    username: str
+    """
+     Max length: 50;
+    """
+    password: str | None = None
+    """
+    The password will never be returned in response. Max length: 50;
+    """
+    can_access_all_records_flag: bool | None = Field(
+        default=None, alias='canAccessAllRecordsFlag'
+    )
+    """
+    This flag controls whether the integrator can access only the db records it created, or all system records.
+    """
+    can_access_all_apis_flag: bool | None = Field(
+        default=None, alias='canAccessAllApisFlag'
+    )
+    """
+    Setting this flag to true will create an integrator that can access all of the available apis in the system.
+                If this field is set to true, both the member and board fields are required.
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    date_inactivated: datetime | None = Field(default=None, alias='dateInactivated')
+    inactivated_by: MemberReference | None = Field(default=None, alias='inactivatedBy')
+    service_ticket_api_flag: bool | None = Field(
+        default=None, alias='serviceTicketApiFlag'
+    )
+    board: BoardReference | None = None
+    service_board_callback_url: str | None = Field(
+        default=None, alias='serviceBoardCallbackUrl'
+    )
+    """
+     Max length: 1000;
+    """
+    service_board_legacy_callback_flag: bool | None = Field(
+        default=None, alias='serviceBoardLegacyCallbackFlag'
+    )
+    time_entry_api_flag: bool | None = Field(default=None, alias='timeEntryApiFlag')
+    member: MemberReference | None = None
+    time_entry_callback_url: str | None = Field(
+        default=None, alias='timeEntryCallbackUrl'
+    )
+    """
+     Max length: 1000;
+    """
+    time_entry_legacy_callback_flag: bool | None = Field(
+        default=None, alias='timeEntryLegacyCallbackFlag'
+    )
+    managed_services_api_flag: bool | None = Field(
+        default=None, alias='managedServicesApiFlag'
+    )
+    managed_services_auto_child_flag: bool | None = Field(
+        default=None, alias='managedServicesAutoChildFlag'
+    )
+    managed_services_childing_flag: bool | None = Field(
+        default=None, alias='managedServicesChildingFlag'
+    )
+    """
+    True if integrator is allowed to child configurations.
+    """
+    contact_api_flag: bool | None = Field(default=None, alias='contactApiFlag')
+    contact_callback_url: str | None = Field(default=None, alias='contactCallbackUrl')
+    """
+     Max length: 1000;
+    """
+    contact_legacy_callback_flag: bool | None = Field(
+        default=None, alias='contactLegacyCallbackFlag'
+    )
+    company_api_flag: bool | None = Field(default=None, alias='companyApiFlag')
+    company_callback_url: str | None = Field(default=None, alias='companyCallbackUrl')
+    """
+     Max length: 1000;
+    """
+    company_legacy_callback_flag: bool | None = Field(
+        default=None, alias='companyLegacyCallbackFlag'
+    )
+    activity_api_flag: bool | None = Field(default=None, alias='activityApiFlag')
+    activity_callback_url: str | None = Field(default=None, alias='activityCallbackUrl')
+    """
+     Max length: 1000;
+    """
+    activity_legacy_callback_flag: bool | None = Field(
+        default=None, alias='activityLegacyCallbackFlag'
+    )
+    invoice_api_flag: bool | None = Field(default=None, alias='invoiceApiFlag')
+    product_api_flag: bool | None = Field(default=None, alias='productApiFlag')
+    product_callback_url: str | None = Field(default=None, alias='productCallbackUrl')
+    """
+     Max length: 1000;
+    """
+    product_legacy_callback_flag: bool | None = Field(
+        default=None, alias='productLegacyCallbackFlag'
+    )
+    opportunity_api_flag: bool | None = Field(default=None, alias='opportunityApiFlag')
+    opportunity_callback_url: str | None = Field(
+        default=None, alias='opportunityCallbackUrl'
+    )
+    """
+     Max length: 1000;
+    """
+    opportunity_legacy_callback_flag: bool | None = Field(
+        default=None, alias='opportunityLegacyCallbackFlag'
+    )
+    opportunity_conversion_api_flag: bool | None = Field(
+        default=None, alias='opportunityConversionApiFlag'
+    )
+    """
+    True if the member has access to the Opportunity Conversion Api.
+    """
+    member_api_flag: bool | None = Field(default=None, alias='memberApiFlag')
+    marketing_api_flag: bool | None = Field(default=None, alias='marketingApiFlag')
+    purchasing_api_flag: bool | None = Field(default=None, alias='purchasingApiFlag')
+    purchasing_callback_url: str | None = Field(
+        default=None, alias='purchasingCallbackUrl'
+    )
+    """
+     Max length: 1000;
+    """
+    purchasing_legacy_callback_flag: bool | None = Field(
+        default=None, alias='purchasingLegacyCallbackFlag'
+    )
+    reporting_api_flag: bool | None = Field(default=None, alias='reportingApiFlag')
+    system_api_flag: bool | None = Field(default=None, alias='systemApiFlag')
+    project_api_flag: bool | None = Field(default=None, alias='projectApiFlag')
+    project_callback_url: str | None = Field(default=None, alias='projectCallbackUrl')
+    """
+     Max length: 1000;
+    """
+    project_legacy_callback_flag: bool | None = Field(
+        default=None, alias='projectLegacyCallbackFlag'
+    )
+    configuration_api_flag: bool | None = Field(
+        default=None, alias='configurationApiFlag'
+    )
+    configuration_auto_child_flag: bool | None = Field(
+        default=None, alias='configurationAutoChildFlag'
+    )
+    configuration_childling_flag: bool | None = Field(
+        default=None, alias='configurationChildlingFlag'
+    )
+    """
+    True if integrator is allowed to child configurations.
+    """
+    configuration_callback_url: str | None = Field(
+        default=None, alias='configurationCallbackUrl'
+    )
+    """
+     Max length: 1000;
+    """
+    configuration_legacy_callback_flag: bool | None = Field(
+        default=None, alias='configurationLegacyCallbackFlag'
+    )
+    schedule_api_flag: bool | None = Field(default=None, alias='scheduleApiFlag')
+    schedule_callback_url: str | None = Field(default=None, alias='scheduleCallbackUrl')
+    """
+     Max length: 1000;
+    """
+    schedule_legacy_callback_flag: bool | None = Field(
+        default=None, alias='scheduleLegacyCallbackFlag'
+    )
+    agreement_api_flag: bool | None = Field(default=None, alias='agreementApiFlag')
+    agreement_callback_url: str | None = Field(
+        default=None, alias='agreementCallbackUrl'
+    )
+    """
+     Max length: 1000;
+    """
+    agreement_callback_legacy_flag: bool | None = Field(
+        default=None, alias='agreementCallbackLegacyFlag'
+    )
+    document_api_flag: bool | None = Field(default=None, alias='documentApiFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.memberreference import MemberReference
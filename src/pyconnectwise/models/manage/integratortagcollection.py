@@ -0,0 +1,10 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class IntegratorTagCollection(ConnectWiseModel):
+    tags: list[str] | None = None
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.cataloginventory import CatalogInventory
+
+
+class InventoryOnHand(CatalogInventory):
+    pass
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.catalogitemreference import CatalogItemReference
+from pyconnectwise.models.manage.onhandserialnumberreference import OnHandSerialNumberReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
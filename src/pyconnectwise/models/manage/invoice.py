@@ -0,0 +1,173 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Invoice(ConnectWiseModel):
+    id: int | None = None
+    invoice_number: str | None = Field(default=None, alias='invoiceNumber')
+    """
+     Max length: 15; Required On Updates;
+    """
+    type: Literal[
+        'Agreement',
+        'CreditMemo',
+        'DownPayment',
+        'Miscellaneous',
+        'Progress',
+        'Standard',
+    ]
+    status: BillingStatusReference | None = None
+    company: CompanyReference | None = None
+    bill_to_company: CompanyReference | None = Field(
+        default=None, alias='billToCompany'
+    )
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    apply_to_type: Literal[
+        'All', 'Agreement', 'Project', 'ProjectPhase', 'SalesOrder', 'Ticket'
+    ] | None = Field(default=None, alias='applyToType')
+    apply_to_id: int | None = Field(default=None, alias='applyToId')
+    attention: str | None = None
+    """
+     Max length: 60;
+    """
+    ship_to_attention: str | None = Field(default=None, alias='shipToAttention')
+    """
+     Max length: 60;
+    """
+    billing_site: SiteReference | None = Field(default=None, alias='billingSite')
+    billing_site_address_line1: str | None = Field(
+        default=None, alias='billingSiteAddressLine1'
+    )
+    billing_site_address_line2: str | None = Field(
+        default=None, alias='billingSiteAddressLine2'
+    )
+    billing_site_city: str | None = Field(default=None, alias='billingSiteCity')
+    billing_site_state: str | None = Field(default=None, alias='billingSiteState')
+    billing_site_zip: str | None = Field(default=None, alias='billingSiteZip')
+    billing_site_country: str | None = Field(default=None, alias='billingSiteCountry')
+    shipping_site: SiteReference | None = Field(default=None, alias='shippingSite')
+    shipping_site_address_line1: str | None = Field(
+        default=None, alias='shippingSiteAddressLine1'
+    )
+    shipping_site_address_line2: str | None = Field(
+        default=None, alias='shippingSiteAddressLine2'
+    )
+    shipping_site_city: str | None = Field(default=None, alias='shippingSiteCity')
+    shipping_site_state: str | None = Field(default=None, alias='shippingSiteState')
+    shipping_site_zip: str | None = Field(default=None, alias='shippingSiteZip')
+    shipping_site_country: str | None = Field(default=None, alias='shippingSiteCountry')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    reference: str | None = None
+    """
+     Max length: 50;
+    """
+    customer_po: str | None = Field(default=None, alias='customerPO')
+    """
+     Max length: 50;
+    """
+    template_setup_id: int | None = Field(default=None, alias='templateSetupId')
+    """
+    Can be obtained via InvoiceTemplate report.
+    """
+    invoice_template: InvoiceTemplateDetailReference | None = Field(
+        default=None, alias='invoiceTemplate'
+    )
+    email_template_id: int | None = Field(default=None, alias='emailTemplateId')
+    """
+    Can be obtained via InvoiceEmailTemplate report.
+    """
+    add_to_batch_email_list: bool | None = Field(
+        default=None, alias='addToBatchEmailList'
+    )
+    date: datetime | None = None
+    restrict_downpayment_flag: bool | None = Field(
+        default=None, alias='restrictDownpaymentFlag'
+    )
+    location_id: int | None = Field(default=None, alias='locationId')
+    """
+     Required On Updates;
+    """
+    department_id: int | None = Field(default=None, alias='departmentId')
+    """
+    departmentId is only required for special invoices.
+    """
+    territory_id: int | None = Field(default=None, alias='territoryId')
+    top_comment: str | None = Field(default=None, alias='topComment')
+    bottom_comment: str | None = Field(default=None, alias='bottomComment')
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    downpayment_previously_taxed_flag: bool | None = Field(
+        default=None, alias='downpaymentPreviouslyTaxedFlag'
+    )
+    service_total: float | None = Field(default=None, alias='serviceTotal')
+    override_down_payment_amount_flag: bool | None = Field(
+        default=None, alias='overrideDownPaymentAmountFlag'
+    )
+    currency: CurrencyReference | None = None
+    due_date: datetime | None = Field(default=None, alias='dueDate')
+    expense_total: float | None = Field(default=None, alias='expenseTotal')
+    product_total: float | None = Field(default=None, alias='productTotal')
+    previous_progress_applied: float | None = Field(
+        default=None, alias='previousProgressApplied'
+    )
+    service_adjustment_amount: float | None = Field(
+        default=None, alias='serviceAdjustmentAmount'
+    )
+    agreement_amount: float | None = Field(default=None, alias='agreementAmount')
+    downpayment_applied: float | None = Field(default=None, alias='downpaymentApplied')
+    subtotal: float | None = None
+    total: float | None = None
+    remaining_downpayment: float | None = Field(
+        default=None, alias='remainingDownpayment'
+    )
+    sales_tax: float | None = Field(default=None, alias='salesTax')
+    adjustment_reason: str | None = Field(default=None, alias='adjustmentReason')
+    adjusted_by: str | None = Field(default=None, alias='adjustedBy')
+    payments: float | None = None
+    credits: float | None = None
+    balance: float | None = None
+    special_invoice_flag: bool | None = Field(default=None, alias='specialInvoiceFlag')
+    billing_setup_reference: BillingSetupReference | None = Field(
+        default=None, alias='billingSetupReference'
+    )
+    ticket: TicketReference | None = None
+    project: ProjectReference | None = None
+    phase: ProjectPhaseReference | None = None
+    sales_order: SalesOrderReference | None = Field(default=None, alias='salesOrder')
+    agreement: AgreementReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.billingsetupreference import BillingSetupReference
+from pyconnectwise.models.manage.billingstatusreference import BillingStatusReference
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.invoicetemplatedetailreference import InvoiceTemplateDetailReference
+from pyconnectwise.models.manage.projectphasereference import ProjectPhaseReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.salesorderreference import SalesOrderReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
@@ -0,0 +1,48 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceEmailTemplate(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    service_survey: ServiceSurveyReference | None = Field(
+        default=None, alias='serviceSurvey'
+    )
+    use_sender_flag: bool | None = Field(default=None, alias='useSenderFlag')
+    first_name: str | None = Field(default=None, alias='firstName')
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    last_name: str | None = Field(default=None, alias='lastName')
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    email_address: str | None = Field(default=None, alias='emailAddress')
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    subject: str
+    """
+     Max length: 200;
+    """
+    body: str | None = None
+    copy_sender_flag: bool | None = Field(default=None, alias='copySenderFlag')
+    invoice_status: BillingStatusReference | None = Field(
+        default=None, alias='invoiceStatus'
+    )
+    attach_invoice_flag: bool | None = Field(default=None, alias='attachInvoiceFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingstatusreference import BillingStatusReference
+from pyconnectwise.models.manage.servicesurveyreference import ServiceSurveyReference
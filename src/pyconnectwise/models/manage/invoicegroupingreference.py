@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceGroupingReference(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    description: str | None = None
+    show_price_flag: bool | None = Field(default=None, alias='showPriceFlag')
+    show_sub_items_flag: bool | None = Field(default=None, alias='showSubItemsFlag')
+    group_parent_child_additions_flag: bool | None = Field(
+        default=None, alias='groupParentChildAdditionsFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceInfo(ConnectWiseModel):
+    id: int | None = None
+    invoice: Invoice | None = None
+    invoice_template: InvoiceTemplate | None = Field(
+        default=None, alias='invoiceTemplate'
+    )
+    products: list[ProductItem] | None = None
+    bundled_components_info: list[ProductComponent] | None = Field(
+        default=None, alias='bundledComponentsInfo'
+    )
+    expenses: list[ExpenseEntry] | None = None
+    time_entries: list[TimeEntry] | None = Field(default=None, alias='timeEntries')
+    logo: DocumentInfo | None = None
+    billing_setup: BillingSetup | None = Field(default=None, alias='billingSetup')
+    agreement_billing_info: list[AgreementBillingInfo] | None = Field(
+        default=None, alias='agreementBillingInfo'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementbillinginfo import AgreementBillingInfo
+from pyconnectwise.models.manage.billingsetup import BillingSetup
+from pyconnectwise.models.manage.documentinfo import DocumentInfo
+from pyconnectwise.models.manage.expenseentry import ExpenseEntry
+from pyconnectwise.models.manage.invoice import Invoice
+from pyconnectwise.models.manage.invoicetemplate import InvoiceTemplate
+from pyconnectwise.models.manage.productcomponent import ProductComponent
+from pyconnectwise.models.manage.productitem import ProductItem
+from pyconnectwise.models.manage.timeentry import TimeEntry
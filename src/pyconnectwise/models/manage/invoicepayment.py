@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoicePayment(ConnectWiseModel):
+    id: int | None = None
+    type: str | None = None
+    source: Literal['Default', 'WisePay'] | None = None
+    invoice: InvoiceReference | None = None
+    credit: InvoiceReference | None = None
+    amount: float | None = None
+    payment_date: datetime | None = Field(default=None, alias='paymentDate')
+    applied_by: str | None = Field(default=None, alias='appliedBy')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    wise_pay_payment: WisePayPayment | None = Field(
+        default=None, alias='wisePayPayment'
+    )
+    payment_sync_status: str | None = Field(default=None, alias='paymentSyncStatus')
+    payment_sync_date: str | None = Field(default=None, alias='paymentSyncDate')
+    payment_account: str | None = Field(default=None, alias='paymentAccount')
+    a_r_payment_account: str | None = Field(default=None, alias='aRPaymentAccount')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.invoicereference import InvoiceReference
+from pyconnectwise.models.manage.wisepaypayment import WisePayPayment
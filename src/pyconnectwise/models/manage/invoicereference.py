@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceReference(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    billing_type: str | None = Field(default=None, alias='billingType')
+    apply_to_type: str | None = Field(default=None, alias='applyToType')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,653 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceTemplate(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    margin_left: float | None = Field(default=None, alias='marginLeft')
+    margin_right: float | None = Field(default=None, alias='marginRight')
+    margin_top: float | None = Field(default=None, alias='marginTop')
+    margin_bottom: float | None = Field(default=None, alias='marginBottom')
+    logo_visible_flag: bool | None = Field(default=None, alias='logoVisibleFlag')
+    header_logo_position: Literal['Center', 'LeftSide', 'RightSide'] | None = Field(
+        default=None, alias='headerLogoPosition'
+    )
+    remit_to_visible_flag: bool | None = Field(default=None, alias='remitToVisibleFlag')
+    header_address_position: Literal['Center', 'LeftSide', 'RightSide'] | None = Field(
+        default=None, alias='headerAddressPosition'
+    )
+    header_title_visible_flag: bool | None = Field(
+        default=None, alias='headerTitleVisibleFlag'
+    )
+    header_title_caption: str | None = Field(default=None, alias='headerTitleCaption')
+    """
+     Max length: 50;
+    """
+    header_title_position: Literal['Center', 'LeftSide', 'RightSide'] | None = Field(
+        default=None, alias='headerTitlePosition'
+    )
+    header_title_font: Literal[
+        'Regular', 'RegularBold', 'Large', 'LargeBold', 'ExtraLarge', 'ExtraLargeBold'
+    ] | None = Field(default=None, alias='headerTitleFont')
+    header_terms_visible_flag: bool | None = Field(
+        default=None, alias='headerTermsVisibleFlag'
+    )
+    header_terms_caption: str | None = Field(default=None, alias='headerTermsCaption')
+    """
+     Max length: 50;
+    """
+    header_due_date_visible_flag: bool | None = Field(
+        default=None, alias='headerDueDateVisibleFlag'
+    )
+    header_due_date_caption: str | None = Field(
+        default=None, alias='headerDueDateCaption'
+    )
+    """
+     Max length: 50;
+    """
+    header_po_number_visible_flag: bool | None = Field(
+        default=None, alias='headerPoNumberVisibleFlag'
+    )
+    header_po_number_caption: str | None = Field(
+        default=None, alias='headerPoNumberCaption'
+    )
+    """
+     Max length: 50;
+    """
+    header_reference_visible_flag: bool | None = Field(
+        default=None, alias='headerReferenceVisibleFlag'
+    )
+    header_reference_caption: str | None = Field(
+        default=None, alias='headerReferenceCaption'
+    )
+    """
+     Max length: 50;
+    """
+    header_account_visible_flag: bool | None = Field(
+        default=None, alias='headerAccountVisibleFlag'
+    )
+    header_account_caption: str | None = Field(
+        default=None, alias='headerAccountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    header_tax_id_visible_flag: bool | None = Field(
+        default=None, alias='headerTaxIdVisibleFlag'
+    )
+    header_tax_id_caption: str | None = Field(default=None, alias='headerTaxIdCaption')
+    """
+     Max length: 50;
+    """
+    header_ship_to_visible_flag: bool | None = Field(
+        default=None, alias='headerShipToVisibleFlag'
+    )
+    header_ship_to_caption: str | None = Field(
+        default=None, alias='headerShipToCaption'
+    )
+    """
+     Max length: 50;
+    """
+    header_hours_based_extended_amount_visible_flag: bool | None = Field(
+        default=None, alias='headerHoursBasedExtendedAmountVisibleFlag'
+    )
+    payable_caption: str | None = Field(default=None, alias='payableCaption')
+    """
+     Max length: 1000;
+    """
+    service_header_ticket_number_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderTicketNumberVisibleFlag'
+    )
+    service_header_ticket_number_caption: str | None = Field(
+        default=None, alias='serviceHeaderTicketNumberCaption'
+    )
+    """
+     Max length: 50;
+    """
+    service_header_company_name_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderCompanyNameVisibleFlag'
+    )
+    service_header_company_name_caption: str | None = Field(
+        default=None, alias='serviceHeaderCompanyNameCaption'
+    )
+    """
+     Max length: 50;
+    """
+    service_header_summary_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderSummaryVisibleFlag'
+    )
+    service_header_summary_caption: str | None = Field(
+        default=None, alias='serviceHeaderSummaryCaption'
+    )
+    """
+     Max length: 50;
+    """
+    service_header_contact_name_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderContactNameVisibleFlag'
+    )
+    service_header_contact_name_caption: str | None = Field(
+        default=None, alias='serviceHeaderContactNameCaption'
+    )
+    """
+     Max length: 50;
+    """
+    service_header_detail_description_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderDetailDescriptionVisibleFlag'
+    )
+    service_header_detail_description_caption: str | None = Field(
+        default=None, alias='serviceHeaderDetailDescriptionCaption'
+    )
+    """
+     Max length: 50;
+    """
+    service_header_resolution_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderResolutionVisibleFlag'
+    )
+    service_header_resolution_caption: str | None = Field(
+        default=None, alias='serviceHeaderResolutionCaption'
+    )
+    """
+     Max length: 50;
+    """
+    service_header_amount_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderAmountVisibleFlag'
+    )
+    service_header_amount_caption: str | None = Field(
+        default=None, alias='serviceHeaderAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    service_header_billing_method_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderBillingMethodVisibleFlag'
+    )
+    service_header_billing_method_caption: str | None = Field(
+        default=None, alias='serviceHeaderBillingMethodCaption'
+    )
+    """
+     Max length: 50;
+    """
+    service_header_closed_tasks_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderClosedTasksVisibleFlag'
+    )
+    service_header_open_tasks_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderOpenTasksVisibleFlag'
+    )
+    service_header_bundled_tickets_visible_flag: bool | None = Field(
+        default=None, alias='serviceHeaderBundledTicketsVisibleFlag'
+    )
+    project_header_project_name_visible_flag: bool | None = Field(
+        default=None, alias='projectHeaderProjectNameVisibleFlag'
+    )
+    project_header_project_name_caption: str | None = Field(
+        default=None, alias='projectHeaderProjectNameCaption'
+    )
+    """
+     Max length: 50;
+    """
+    project_header_company_name_visible_flag: bool | None = Field(
+        default=None, alias='projectHeaderCompanyNameVisibleFlag'
+    )
+    project_header_company_name_caption: str | None = Field(
+        default=None, alias='projectHeaderCompanyNameCaption'
+    )
+    """
+     Max length: 50;
+    """
+    project_header_original_downpayment_visible_flag: bool | None = Field(
+        default=None, alias='projectHeaderOriginalDownpaymentVisibleFlag'
+    )
+    project_header_original_downpayment_caption: str | None = Field(
+        default=None, alias='projectHeaderOriginalDownpaymentCaption'
+    )
+    """
+     Max length: 50;
+    """
+    project_header_contact_name_visible_flag: bool | None = Field(
+        default=None, alias='projectHeaderContactNameVisibleFlag'
+    )
+    project_header_contact_name_caption: str | None = Field(
+        default=None, alias='projectHeaderContactNameCaption'
+    )
+    """
+     Max length: 50;
+    """
+    project_header_amount_visible_flag: bool | None = Field(
+        default=None, alias='projectHeaderAmountVisibleFlag'
+    )
+    project_header_amount_caption: str | None = Field(
+        default=None, alias='projectHeaderAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    project_header_billing_method_visible_flag: bool | None = Field(
+        default=None, alias='projectHeaderBillingMethodVisibleFlag'
+    )
+    project_header_billing_method_caption: str | None = Field(
+        default=None, alias='projectHeaderBillingMethodCaption'
+    )
+    """
+     Max length: 50;
+    """
+    project_header_billing_type_visible_flag: bool | None = Field(
+        default=None, alias='projectHeaderBillingTypeVisibleFlag'
+    )
+    project_header_billing_type_caption: str | None = Field(
+        default=None, alias='projectHeaderBillingTypeCaption'
+    )
+    """
+     Max length: 50;
+    """
+    invoice_payment_amount_visible_flag: bool | None = Field(
+        default=None, alias='invoicePaymentAmountVisibleFlag'
+    )
+    invoice_payment_amount_caption: str | None = Field(
+        default=None, alias='invoicePaymentAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    invoice_credit_amount_visible_flag: bool | None = Field(
+        default=None, alias='invoiceCreditAmountVisibleFlag'
+    )
+    invoice_credit_amount_caption: str | None = Field(
+        default=None, alias='invoiceCreditAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    invoice_balance_due_visible_flag: bool | None = Field(
+        default=None, alias='invoiceBalanceDueVisibleFlag'
+    )
+    invoice_balance_due_caption: str | None = Field(
+        default=None, alias='invoiceBalanceDueCaption'
+    )
+    """
+     Max length: 50;
+    """
+    credit_credit_amount_visible_flag: bool | None = Field(
+        default=None, alias='creditCreditAmountVisibleFlag'
+    )
+    credit_credit_amount_caption: str | None = Field(
+        default=None, alias='creditCreditAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    credit_remaining_amount_visible_flag: bool | None = Field(
+        default=None, alias='creditRemainingAmountVisibleFlag'
+    )
+    credit_remaining_amount_caption: str | None = Field(
+        default=None, alias='creditRemainingAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    time_detail_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailVisibleFlag'
+    )
+    time_detail_primary_sort_field: str | None = Field(
+        default=None, alias='timeDetailPrimarySortField'
+    )
+    time_detail_primary_sort_direction: str | None = Field(
+        default=None, alias='timeDetailPrimarySortDirection'
+    )
+    time_detail_secondary_sort_field: str | None = Field(
+        default=None, alias='timeDetailSecondarySortField'
+    )
+    time_detail_secondary_sort_direction: str | None = Field(
+        default=None, alias='timeDetailSecondarySortDirection'
+    )
+    time_detail_subtotal_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailSubtotalVisibleFlag'
+    )
+    time_detail_start_end_time_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailStartEndTimeVisibleFlag'
+    )
+    time_detail_hours_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailHoursVisibleFlag'
+    )
+    time_detail_members_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailMembersVisibleFlag'
+    )
+    time_detail_billable_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailBillableVisibleFlag'
+    )
+    time_detail_extended_amount_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailExtendedAmountVisibleFlag'
+    )
+    time_detail_dollar_amounts_on_hourse_based_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailDollarAmountsOnHourseBasedVisibleFlag'
+    )
+    time_detail_hourly_rate_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailHourlyRateVisibleFlag'
+    )
+    time_detail_contacts_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailContactsVisibleFlag'
+    )
+    time_detail_notes_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailNotesVisibleFlag'
+    )
+    time_detail_non_billable_caption: str | None = Field(
+        default=None, alias='timeDetailNonBillableCaption'
+    )
+    """
+     Max length: 50;
+    """
+    time_detail_agreement_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailAgreementVisibleFlag'
+    )
+    time_detail_hours_based_hours_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailHoursBasedHoursVisibleFlag'
+    )
+    time_detail_hours_based_ext_amount_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailHoursBasedExtAmountVisibleFlag'
+    )
+    time_detail_hoursbased_hourly_rate_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailHoursbasedHourlyRateVisibleFlag'
+    )
+    time_detail_amount_based_hours_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailAmountBasedHoursVisibleFlag'
+    )
+    time_detail_amount_based_ext_amount_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailAmountBasedExtAmountVisibleFlag'
+    )
+    time_detail_amount_based_hourly_rate_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailAmountBasedHourlyRateVisibleFlag'
+    )
+    time_detail_sr_ticket_summary_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailSRTicketSummaryVisibleFlag'
+    )
+    time_detail_sr_contact_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailSRContactVisibleFlag'
+    )
+    time_detail_sr_address_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailSRAddressVisibleFlag'
+    )
+    time_detail_pm_phase_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailPmPhaseVisibleFlag'
+    )
+    time_detail_pm_summary_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailPmSummaryVisibleFlag'
+    )
+    time_detail_ticket_number_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailTicketNumberVisibleFlag'
+    )
+    time_detail_dates_visible_flag: bool | None = Field(
+        default=None, alias='timeDetailDatesVisibleFlag'
+    )
+    services_staff_caption: str | None = Field(
+        default=None, alias='servicesStaffCaption'
+    )
+    """
+     Max length: 50;
+    """
+    services_staff_visible_flag: bool | None = Field(
+        default=None, alias='servicesStaffVisibleFlag'
+    )
+    services_amount_caption: str | None = Field(
+        default=None, alias='servicesAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    services_amount_visible_flag: bool | None = Field(
+        default=None, alias='servicesAmountVisibleFlag'
+    )
+    services_hours_caption: str | None = Field(
+        default=None, alias='servicesHoursCaption'
+    )
+    """
+     Max length: 50;
+    """
+    services_hours_visible_flag: bool | None = Field(
+        default=None, alias='servicesHoursVisibleFlag'
+    )
+    services_rate_caption: str | None = Field(default=None, alias='servicesRateCaption')
+    """
+     Max length: 50;
+    """
+    services_rate_visible_flag: bool | None = Field(
+        default=None, alias='servicesRateVisibleFlag'
+    )
+    services_work_role_caption: str | None = Field(
+        default=None, alias='servicesWorkRoleCaption'
+    )
+    """
+     Max length: 50;
+    """
+    services_work_role_visible_flag: bool | None = Field(
+        default=None, alias='servicesWorkRoleVisibleFlag'
+    )
+    services_work_type_caption: str | None = Field(
+        default=None, alias='servicesWorkTypeCaption'
+    )
+    """
+     Max length: 50;
+    """
+    services_work_type_visible_flag: bool | None = Field(
+        default=None, alias='servicesWorkTypeVisibleFlag'
+    )
+    services_total_visible_flag: bool | None = Field(
+        default=None, alias='servicesTotalVisibleFlag'
+    )
+    services_member_name_visible_flag: bool | None = Field(
+        default=None, alias='servicesMemberNameVisibleFlag'
+    )
+    services_member_name_caption: str | None = Field(
+        default=None, alias='servicesMemberNameCaption'
+    )
+    """
+     Max length: 50;
+    """
+    currency_id_visible_flag: bool | None = Field(
+        default=None, alias='currencyIdVisibleFlag'
+    )
+    currency_symbol_visible_flag: bool | None = Field(
+        default=None, alias='currencySymbolVisibleFlag'
+    )
+    portal_flag: bool | None = Field(default=None, alias='portalFlag')
+    services_collapsed_flag: bool | None = Field(
+        default=None, alias='servicesCollapsedFlag'
+    )
+    expenses_collapsed_flag: bool | None = Field(
+        default=None, alias='expensesCollapsedFlag'
+    )
+    other_charges_collapsed_flag: bool | None = Field(
+        default=None, alias='otherChargesCollapsedFlag'
+    )
+    expenses_type_caption: str | None = Field(default=None, alias='expensesTypeCaption')
+    """
+     Max length: 50;
+    """
+    expenses_staff_caption: str | None = Field(
+        default=None, alias='expensesStaffCaption'
+    )
+    """
+     Max length: 50;
+    """
+    expenses_amount_caption: str | None = Field(
+        default=None, alias='expensesAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    expenses_type_visible_flag: bool | None = Field(
+        default=None, alias='expensesTypeVisibleFlag'
+    )
+    expenses_staff_visible_flag: bool | None = Field(
+        default=None, alias='expensesStaffVisibleFlag'
+    )
+    expenses_amount_visible_flag: bool | None = Field(
+        default=None, alias='expensesAmountVisibleFlag'
+    )
+    expenses_total_visible_flag: bool | None = Field(
+        default=None, alias='expensesTotalVisibleFlag'
+    )
+    expense_detail_subtotal_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailSubtotalVisibleFlag'
+    )
+    expense_detail_members_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailMembersVisibleFlag'
+    )
+    expense_detail_contacts_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailContactsVisibleFlag'
+    )
+    expense_detail_billable_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailBillableVisibleFlag'
+    )
+    expense_detail_ext_amount_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailExtAmountVisibleFlag'
+    )
+    expense_detail_notes_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailNotesVisibleFlag'
+    )
+    expense_detail_primary_sort_field: str | None = Field(
+        default=None, alias='expenseDetailPrimarySortField'
+    )
+    expense_detail_primary_sort_direction: str | None = Field(
+        default=None, alias='expenseDetailPrimarySortDirection'
+    )
+    expense_detail_secondary_sort_field: str | None = Field(
+        default=None, alias='expenseDetailSecondarySortField'
+    )
+    expense_detail_secondary_sort_direction: str | None = Field(
+        default=None, alias='expenseDetailSecondarySortDirection'
+    )
+    expense_detail_nonbillable_caption: str | None = Field(
+        default=None, alias='expenseDetailNonbillableCaption'
+    )
+    """
+     Max length: 50;
+    """
+    expense_detail_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailVisibleFlag'
+    )
+    expense_detail_agreement_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailAgreementVisibleFlag'
+    )
+    expense_detail_agreement_ext_amount_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailAgreementExtAmountVisibleFlag'
+    )
+    expense_detail_ticket_number_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailTicketNumberVisibleFlag'
+    )
+    expense_detail_sr_ticket_summary_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailSrTicketSummaryVisibleFlag'
+    )
+    expense_detail_sr_contact_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailSrContactVisibleFlag'
+    )
+    expense_detail_sr_address_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailSrAddressVisibleFlag'
+    )
+    expense_detail_pm_phase_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailPmPhaseVisibleFlag'
+    )
+    expense_detail_pm_summary_visible_flag: bool | None = Field(
+        default=None, alias='expenseDetailPmSummaryVisibleFlag'
+    )
+    other_charges_amount_caption: str | None = Field(
+        default=None, alias='otherChargesAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    other_charges_amount_visible_flag: bool | None = Field(
+        default=None, alias='otherChargesAmountVisibleFlag'
+    )
+    other_charges_description_caption: str | None = Field(
+        default=None, alias='otherChargesDescriptionCaption'
+    )
+    """
+     Max length: 50;
+    """
+    other_charges_description_visible_flag: bool | None = Field(
+        default=None, alias='otherChargesDescriptionVisibleFlag'
+    )
+    other_charges_display_six_decimals: bool | None = Field(
+        default=None, alias='otherChargesDisplaySixDecimals'
+    )
+    other_charges_item_id_visible_flag: bool | None = Field(
+        default=None, alias='otherChargesItemIdVisibleFlag'
+    )
+    other_charges_price_caption: str | None = Field(
+        default=None, alias='otherChargesPriceCaption'
+    )
+    """
+     Max length: 50;
+    """
+    other_charges_price_visible_flag: bool | None = Field(
+        default=None, alias='otherChargesPriceVisibleFlag'
+    )
+    other_charges_quantity_caption: str | None = Field(
+        default=None, alias='otherChargesQuantityCaption'
+    )
+    """
+     Max length: 50;
+    """
+    other_charges_quantity_visible_flag: bool | None = Field(
+        default=None, alias='otherChargesQuantityVisibleFlag'
+    )
+    other_charges_serial_number_visible_flag: bool | None = Field(
+        default=None, alias='otherChargesSerialNumberVisibleFlag'
+    )
+    other_charges_total_visible_flag: bool | None = Field(
+        default=None, alias='otherChargesTotalVisibleFlag'
+    )
+    adjustment_description_visible_flag: bool | None = Field(
+        default=None, alias='adjustmentDescriptionVisibleFlag'
+    )
+    adjustment_description_caption: str | None = Field(
+        default=None, alias='adjustmentDescriptionCaption'
+    )
+    """
+     Max length: 50;
+    """
+    adjustment_quantity_visible_flag: bool | None = Field(
+        default=None, alias='adjustmentQuantityVisibleFlag'
+    )
+    adjustment_quantity_caption: str | None = Field(
+        default=None, alias='adjustmentQuantityCaption'
+    )
+    """
+     Max length: 50;
+    """
+    adjustment_amount_visible_flag: bool | None = Field(
+        default=None, alias='adjustmentAmountVisibleFlag'
+    )
+    adjustment_amount_caption: str | None = Field(
+        default=None, alias='adjustmentAmountCaption'
+    )
+    """
+     Max length: 50;
+    """
+    adjustment_agr_type_visible_flag: bool | None = Field(
+        default=None, alias='adjustmentAgrTypeVisibleFlag'
+    )
+    adjustment_total_visible_flag: bool | None = Field(
+        default=None, alias='adjustmentTotalVisibleFlag'
+    )
+    adjustment_price_visible_flag: bool | None = Field(
+        default=None, alias='adjustmentPriceVisibleFlag'
+    )
+    adjustment_price_caption: str | None = Field(
+        default=None, alias='adjustmentPriceCaption'
+    )
+    """
+     Max length: 50;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class KnowledgeBaseArticle(ConnectWiseModel):
+    id: int | None = None
+    title: str
+    issue: str
+    resolution: str
+    location_id: int | None = Field(default=None, alias='locationId')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    board: BoardReference | None = None
+    category_id: int | None = Field(default=None, alias='categoryId')
+    sub_category_id: int | None = Field(default=None, alias='subCategoryId')
+    date_created: str | None = Field(default=None, alias='dateCreated')
+    created_by: str | None = Field(default=None, alias='createdBy')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class KnowledgeBaseSettings(ConnectWiseModel):
+    id: int | None = None
+    require_approval: bool = Field(..., alias='requireApproval')
+    default_approver: MemberReference | None = Field(
+        default=None, alias='defaultApprover'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class KPI(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    category: KPICategoryReference | None = None
+    date_filter: str | None = Field(default=None, alias='dateFilter')
+    sort_order: int | None = Field(default=None, alias='sortOrder')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.kpicategoryreference import KPICategoryReference
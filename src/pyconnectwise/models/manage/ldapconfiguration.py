@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LdapConfiguration(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    server: str
+    """
+    FQDN of the Server. Max length: 200;
+    """
+    domain: str
+    """
+    Domain Name of the server. Max length: 50;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
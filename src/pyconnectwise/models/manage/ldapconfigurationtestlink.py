@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LdapConfigurationTestLink(ConnectWiseModel):
+    server: str | None = None
+    """
+     Max length: 200;
+    """
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Link(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    table_reference_id: int | None = Field(default=None, alias='tableReferenceId')
+    url: str | None = None
+    """
+     Max length: 1000;
+    """
+    screen_link: Literal[
+        'Company', 'Contact', 'Service', 'Invoice', 'PurchaseOrder', 'SalesOrder'
+    ] | None = Field(default=None, alias='screenLink')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
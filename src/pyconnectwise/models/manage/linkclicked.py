@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LinkClicked(ConnectWiseModel):
+    id: int | None = None
+    campaign_id: int | None = Field(default=None, alias='campaignId')
+    contact_id: int = Field(..., alias='contactId')
+    date_clicked: datetime | None = Field(default=None, alias='dateClicked')
+    url: str
+    """
+     Max length: 2083;
+    """
+    query_string: str | None = Field(default=None, alias='queryString')
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LinkInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    screen_link: Literal[
+        'Company', 'Contact', 'Service', 'Invoice', 'PurchaseOrder', 'SalesOrder'
+    ] | None = Field(default=None, alias='screenLink')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
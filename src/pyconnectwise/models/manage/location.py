@@ -0,0 +1,87 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Location(ConnectWiseModel):
+    id: int | None = None
+    owner_level_id: int | None = Field(default=None, alias='ownerLevelId')
+    structure_level: CorporateStructureLevelReference | None = Field(
+        default=None, alias='structureLevel'
+    )
+    name: str
+    """
+     Max length: 50;
+    """
+    manager: MemberReference | None = None
+    reports_to: SystemLocationReference | None = Field(default=None, alias='reportsTo')
+    sales_rep: str | None = Field(default=None, alias='salesRep')
+    """
+     Max length: 50;
+    """
+    time_zone_setup: TimeZoneSetupReference | None = Field(
+        default=None, alias='timeZoneSetup'
+    )
+    calendar: CalendarReference | None = None
+    override_address_line1: str | None = Field(
+        default=None, alias='overrideAddressLine1'
+    )
+    """
+     Max length: 50;
+    """
+    override_address_line2: str | None = Field(
+        default=None, alias='overrideAddressLine2'
+    )
+    """
+     Max length: 50;
+    """
+    override_city: str | None = Field(default=None, alias='overrideCity')
+    """
+     Max length: 50;
+    """
+    override_state: str | None = Field(default=None, alias='overrideState')
+    """
+     Max length: 50;
+    """
+    override_zip: str | None = Field(default=None, alias='overrideZip')
+    """
+     Max length: 12;
+    """
+    override_country: CountryReference | None = Field(
+        default=None, alias='overrideCountry'
+    )
+    override_phone_number: str | None = Field(default=None, alias='overridePhoneNumber')
+    """
+     Max length: 15;
+    """
+    override_fax_number: str | None = Field(default=None, alias='overrideFaxNumber')
+    """
+     Max length: 15;
+    """
+    owa_url: str | None = Field(default=None, alias='owaUrl')
+    """
+     Max length: 100;
+    """
+    payroll_xref: str | None = Field(default=None, alias='payrollXref')
+    """
+     Max length: 10;
+    """
+    location_flag: bool | None = Field(default=None, alias='locationFlag')
+    client_flag: bool | None = Field(default=None, alias='clientFlag')
+    work_role_ids: list[int] | None = Field(default=None, alias='workRoleIds')
+    department_ids: list[int] | None = Field(default=None, alias='departmentIds')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.calendarreference import CalendarReference
+from pyconnectwise.models.manage.corporatestructurelevelreference import CorporateStructureLevelReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
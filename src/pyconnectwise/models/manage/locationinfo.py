@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LocationInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    location_flag: bool | None = None
+    structure_level: CorporateStructureLevelReference | None = Field(
+        default=None, alias='structureLevel'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.corporatestructurelevelreference import CorporateStructureLevelReference
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LocationWorkRole(ConnectWiseModel):
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_role_inactive_flag: bool | None = Field(
+        default=None, alias='workRoleInactiveFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
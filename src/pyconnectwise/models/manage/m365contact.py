@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class M365Contact(ConnectWiseModel):
+    id: int | None = None
+    user_principal_name: str | None = Field(default=None, alias='userPrincipalName')
+    display_name: str | None = Field(default=None, alias='displayName')
+    contact_rec_id: int | None = Field(default=None, alias='contactRecId')
+    tenant_id: str | None = Field(default=None, alias='tenantId')
+    m365_contact_id: str | None = Field(default=None, alias='m365ContactId')
+    department: str | None = None
+    employee_type: str | None = Field(default=None, alias='employeeType')
+    manager_id: str | None = Field(default=None, alias='managerId')
+    proxy_addresses: str | None = Field(default=None, alias='proxyAddresses')
+    proxy_addresses_plain: str | None = Field(default=None, alias='proxyAddressesPlain')
+    groups: str | None = None
+    directory_roles: str | None = Field(default=None, alias='directoryRoles')
+    assigned_licenses: str | None = Field(default=None, alias='assignedLicenses')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class M365ContactSync(ConnectWiseModel):
+    id: int | None = None
+    tenant_id: str | None = Field(default=None, alias='tenantId')
+    client_id: str | None = Field(default=None, alias='clientId')
+    client_secret: str | None = Field(default=None, alias='clientSecret')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    primary_domain: str | None = Field(default=None, alias='primaryDomain')
+    display_name: str | None = Field(default=None, alias='displayName')
+    authorized_flag: bool | None = Field(default=None, alias='authorizedFlag')
+    server_url: str | None = Field(default=None, alias='serverUrl')
+    username: str | None = None
+    password: str | None = None
+    domain: str | None = None
+    company_contacts_folder: str | None = Field(
+        default=None, alias='companyContactsFolder'
+    )
+    service_account_email: str | None = Field(default=None, alias='serviceAccountEmail')
+    credential_file: str | None = Field(default=None, alias='credentialFile')
+    credential_file_name: str | None = Field(default=None, alias='credentialFileName')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class M365ContactSyncCompany(ConnectWiseModel):
+    id: int | None = None
+    company_rec_id: int | None = Field(default=None, alias='companyRecId')
+    tenant_id: str | None = Field(default=None, alias='tenantId')
+    parent_tenant_id: str | None = Field(default=None, alias='parentTenantId')
+    m365_tenant: M365Tenant | None = Field(default=None, alias='m365Tenant')
+    display_name: str | None = Field(default=None, alias='displayName')
+    sync_flag: bool | None = Field(default=None, alias='syncFlag')
+    company_id: str | None = Field(default=None, alias='companyId')
+    contacts: list[GraphUserCsv] | None = None
+    inactive_flag_tenant: bool | None = Field(default=None, alias='inactiveFlagTenant')
+    are_all_microsoft365_contact_sync_inactive: bool | None = Field(
+        default=None, alias='areAllMicrosoft365ContactSyncInactive'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.graphusercsv import GraphUserCsv
+from pyconnectwise.models.manage.m365tenant import M365Tenant
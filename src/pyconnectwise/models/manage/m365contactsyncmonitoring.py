@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class M365ContactSyncMonitoring(ConnectWiseModel):
+    id: int | None = None
+    monitoring_type_id: int | None = Field(default=None, alias='monitoringTypeId')
+    email_address: str | None = Field(default=None, alias='emailAddress')
+    service_board_id: int | None = Field(default=None, alias='serviceBoardId')
+    service_board_status_id: int | None = Field(
+        default=None, alias='serviceBoardStatusId'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
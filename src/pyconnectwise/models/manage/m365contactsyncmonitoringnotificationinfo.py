@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class M365ContactSyncMonitoringNotificationInfo(ConnectWiseModel):
+    company_rec_id: int | None = Field(default=None, alias='companyRecId')
+    company_name: str | None = Field(default=None, alias='companyName')
+    address_rec_id: int | None = Field(default=None, alias='addressRecId')
+    primary_contact_rec_id: int | None = Field(
+        default=None, alias='primaryContactRecId'
+    )
+    primary_contact_full_name: str | None = Field(
+        default=None, alias='primaryContactFullName'
+    )
+    tenant_id: str | None = Field(default=None, alias='tenantId')
+    tenant_name: str | None = Field(default=None, alias='tenantName')
@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class M365ContactSyncProperty(ConnectWiseModel):
+    id: int | None = None
+    include_exclude_type: Literal['All', 'M365Property', 'None'] | None = Field(
+        default=None, alias='includeExcludeType'
+    )
+    property_type: Literal[
+        'City',
+        'DepartmentContactSync',
+        'Email',
+        'DistributionGroup',
+        'JobTitle',
+        'AssignedLicenses',
+        'DisplayName',
+        'OfficeLocation',
+        'ReportManager',
+        'State',
+        'EmployeeType',
+        'UserType',
+    ] | None = Field(default=None, alias='propertyType')
+    exclude_include_flag: bool | None = Field(default=None, alias='excludeIncludeFlag')
+    wild_card: str | None = Field(default=None, alias='wildCard')
+    company_rec_id: int | None = Field(default=None, alias='companyRecID')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
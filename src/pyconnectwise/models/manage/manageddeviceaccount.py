@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDeviceAccount(ConnectWiseModel):
+    id: int | None = None
+    username: str | None = None
+    password: str | None = None
+    managed_devices_integration: ManagedDevicesIntegrationReference | None = Field(
+        default=None, alias='managedDevicesIntegration'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.manageddevicesintegrationreference import ManagedDevicesIntegrationReference
@@ -0,0 +1,68 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegration(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    solution: str
+    """
+     Max length: 30;
+    """
+    portal_url: str | None = Field(default=None, alias='portalUrl')
+    """
+     Max length: 200;
+    """
+    login_by: Literal['Global', 'Member'] = Field(..., alias='loginBy')
+    global_login_username: str | None = Field(default=None, alias='globalLoginUsername')
+    """
+    Gets or sets
+                this is only required when globalLoginFlag = true. Max length: 50;
+    """
+    global_login_password: str | None = Field(default=None, alias='globalLoginPassword')
+    """
+    Gets or sets
+                this is only required when globalLoginFlag = true. Max length: 50;
+    """
+    default_billing_level: Literal['Detail', 'Summary'] = Field(
+        ..., alias='defaultBillingLevel'
+    )
+    management_it_setup_type: str | None = Field(
+        default=None, alias='managementItSetupType'
+    )
+    default_location: SystemLocationReference | None = Field(
+        default=None, alias='defaultLocation'
+    )
+    default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='defaultDepartment'
+    )
+    integrator_login: IntegratorLoginReference | None = Field(
+        default=None, alias='integratorLogin'
+    )
+    match_on_serial_number_flag: bool | None = Field(
+        default=None, alias='matchOnSerialNumberFlag'
+    )
+    disable_new_cross_references_flag: bool | None = Field(
+        default=None, alias='disableNewCrossReferencesFlag'
+    )
+    config_bill_customer_flag: bool | None = Field(
+        default=None, alias='configBillCustomerFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.integratorloginreference import IntegratorLoginReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
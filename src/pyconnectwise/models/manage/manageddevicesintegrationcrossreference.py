@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegrationCrossReference(ConnectWiseModel):
+    id: int | None = None
+    managed_devices_integration: ManagedDevicesIntegrationReference | None = Field(
+        default=None, alias='managedDevicesIntegration'
+    )
+    vendor_type: str | None = Field(default=None, alias='vendorType')
+    """
+     Max length: 255;
+    """
+    vendor_level: str | None = Field(default=None, alias='vendorLevel')
+    """
+     Max length: 255;
+    """
+    agreement_type: AgreementTypeReference | None = Field(
+        default=None, alias='agreementType'
+    )
+    product: IvItemReference | None = None
+    configuration_type: ConfigurationTypeReference | None = Field(
+        default=None, alias='configurationType'
+    )
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
+from pyconnectwise.models.manage.configurationtypereference import ConfigurationTypeReference
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.manageddevicesintegrationreference import ManagedDevicesIntegrationReference
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegrationInfo(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    solution: str | None = None
+    management_it_setup_type: str | None = Field(
+        default=None, alias='managementItSetupType'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegrationLogin(ConnectWiseModel):
+    id: int | None = None
+    managed_devices_integration: ManagedDevicesIntegrationReference | None = Field(
+        default=None, alias='managedDevicesIntegration'
+    )
+    username: str
+    """
+     Max length: 50;
+    """
+    password: str | None = None
+    """
+     Max length: 50;
+    """
+    member: MemberReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.manageddevicesintegrationreference import ManagedDevicesIntegrationReference
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegrationNotification(ConnectWiseModel):
+    id: int | None = None
+    managed_devices_integration: ManagedDevicesIntegrationReference | None = Field(
+        default=None, alias='managedDevicesIntegration'
+    )
+    notify_who: NotificationRecipientReference | None = Field(
+        default=None, alias='notifyWho'
+    )
+    member: MemberReference | None = None
+    log_type: Literal[
+        'All',
+        'Error',
+        'NewManagedSolution',
+        'NewDeviceType',
+        'NewConfiguration',
+        'NewAddition',
+        'Info',
+    ] = Field(..., alias='logType')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.manageddevicesintegrationreference import ManagedDevicesIntegrationReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.notificationrecipientreference import NotificationRecipientReference
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedInformation(ConnectWiseModel):
+    management_solution_name: str | None = Field(
+        default=None, alias='managementSolutionName'
+    )
+    managed_identifier: str | None = Field(default=None, alias='managedIdentifier')
+    type: str | None = None
+    level: str | None = None
+    child_configurations_matching_on: str | None = Field(
+        default=None, alias='childConfigurationsMatchingOn'
+    )
+    inactivate_configurations_matching_on: str | None = Field(
+        default=None, alias='inactivateConfigurationsMatchingOn'
+    )
+    inactive_configuration_status_id: int | None = Field(
+        default=None, alias='inactiveConfigurationStatusId'
+    )
@@ -0,0 +1,54 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Management(ConnectWiseModel):
+    id: int | None = None
+    run_time: datetime | None = Field(default=None, alias='runTime')
+    added_configuration_status: ConfigurationStatusReference | None = Field(
+        default=None, alias='addedConfigurationStatus'
+    )
+    deleted_configuration_status: ConfigurationStatusReference | None = Field(
+        default=None, alias='deletedConfigurationStatus'
+    )
+    integrator_login: IntegratorLoginReference | None = Field(
+        default=None, alias='integratorLogin'
+    )
+    schedule_executive_summary_report_flag: bool = Field(
+        ..., alias='scheduleExecutiveSummaryReportFlag'
+    )
+    executive_summary_report_schedule_day: int | None = Field(
+        default=None, alias='executiveSummaryReportScheduleDay'
+    )
+    """
+    Gets or sets
+                this is only required when scheduleExecutiveSummaryReportFlag = true.
+    """
+    executive_summary_report_schedule_hour: int | None = Field(
+        default=None, alias='executiveSummaryReportScheduleHour'
+    )
+    """
+    Gets or sets
+                this is only required when scheduleExecutiveSummaryReportFlag = true. Input should be in 24 hour format, ie 2pm is 14.
+    """
+    executive_summary_report_schedule_minute: int | None = Field(
+        default=None, alias='executiveSummaryReportScheduleMinute'
+    )
+    """
+    Gets or sets
+                this is only required when scheduleExecutiveSummaryReportFlag = true.
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.configurationstatusreference import ConfigurationStatusReference
+from pyconnectwise.models.manage.integratorloginreference import IntegratorLoginReference
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementBackup(ConnectWiseModel):
+    id: int | None = None
+    type: AgreementTypeReference | None = None
+    item: CatalogItemReference | None = None
+    billing_level: Literal['Detail', 'Summary'] = Field(..., alias='billingLevel')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
+from pyconnectwise.models.manage.catalogitemreference import CatalogItemReference
@@ -0,0 +1,106 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementItSolution(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    management_it_solution_type: Literal[
+        'LevelPlatforms', 'NAble', 'Continuum', 'Custom'
+    ] = Field(..., alias='managementItSolutionType')
+    management_solution_name: str | None = Field(
+        default=None, alias='managementSolutionName'
+    )
+    """
+    Gets or sets
+                this is only required when managementItSolutionType is Custom. Max length: 30;
+    """
+    management_server_url: str | None = Field(default=None, alias='managementServerUrl')
+    """
+    Gets or sets
+                this is only required for Level Platforms. Max length: 200;
+    """
+    webservice_override_url: str | None = Field(
+        default=None, alias='webserviceOverrideUrl'
+    )
+    """
+    Gets or sets
+                this is only required for Level Platforms when overrideWebServiceLocationFlag is true. Max length: 200;
+    """
+    portal_override_login_url: str | None = Field(
+        default=None, alias='portalOverrideLoginUrl'
+    )
+    """
+    Gets or sets
+                this is only required for Level Platforms when overrideLoginLocationFlag is true. Max length: 200;
+    """
+    global_login_flag: bool | None = Field(default=None, alias='globalLoginFlag')
+    global_login_username: str | None = Field(default=None, alias='globalLoginUsername')
+    """
+    Gets or sets
+                this is only required when globalLoginFlag = true. Max length: 50;
+    """
+    global_login_password: str | None = Field(default=None, alias='globalLoginPassword')
+    """
+    Gets or sets
+                this is only required when globalLoginFlag = true. Max length: 50;
+    """
+    using_ssl_flag: bool | None = Field(default=None, alias='usingSslFlag')
+    n_able_username: str | None = Field(default=None, alias='nAbleUsername')
+    """
+    Gets or sets
+                this is only required for N-Able solution. Max length: 50;
+    """
+    n_able_password: str | None = Field(default=None, alias='nAblePassword')
+    """
+    Gets or sets
+                this is only required for N-Able solution. Max length: 50;
+    """
+    override_web_service_location_flag: bool | None = Field(
+        default=None, alias='overrideWebServiceLocationFlag'
+    )
+    override_login_location_flag: bool | None = Field(
+        default=None, alias='overrideLoginLocationFlag'
+    )
+    continuum_api_username: str | None = Field(
+        default=None, alias='continuumApiUsername'
+    )
+    """
+    Gets or sets
+                this is only required for Continuum solution. Max length: 100;
+    """
+    continuum_api_password: str | None = Field(
+        default=None, alias='continuumApiPassword'
+    )
+    """
+    Gets or sets
+                this is only required for Continuum solution. Max length: 100;
+    """
+    level_api_username: str | None = Field(default=None, alias='levelApiUsername')
+    """
+    Gets or sets
+                this is only required for Level Platforms solution. Max length: 100;
+    """
+    level_api_password: str | None = Field(default=None, alias='levelApiPassword')
+    """
+    Gets or sets
+                this is only required for Level Platforms solution. Max length: 100;
+    """
+    level_var_domain: str | None = Field(default=None, alias='levelVarDomain')
+    """
+    Gets or sets
+                this is only required for Level Platforms solution. Max length: 100;
+    """
+    no_display_flag: bool | None = Field(default=None, alias='noDisplayFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
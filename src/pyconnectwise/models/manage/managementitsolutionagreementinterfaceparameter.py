@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementItSolutionAgreementInterfaceParameter(ConnectWiseModel):
+    id: int | None = None
+    managed_devices_integration: ManagedDevicesIntegrationReference | None = Field(
+        default=None, alias='managedDevicesIntegration'
+    )
+    agreement_type: AgreementTypeReference | None = Field(
+        default=None, alias='agreementType'
+    )
+    server_product: IvItemReference | None = Field(default=None, alias='serverProduct')
+    workstation_product: IvItemReference | None = Field(
+        default=None, alias='workstationProduct'
+    )
+    spam_stats_product: IvItemReference | None = Field(
+        default=None, alias='spamStatsProduct'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.manageddevicesintegrationreference import ManagedDevicesIntegrationReference
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementLogDocumentInfo(ConnectWiseModel):
+    full_path_file_name: str | None = Field(default=None, alias='fullPathFileName')
+    file_size: str | None = Field(default=None, alias='fileSize')
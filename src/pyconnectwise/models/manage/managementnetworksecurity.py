@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementNetworkSecurity(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    username: str | None = None
+    """
+     Max length: 50;
+    """
+    password: str | None = None
+    """
+     Max length: 50;
+    """
+    site: str
+    """
+     Max length: 100;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
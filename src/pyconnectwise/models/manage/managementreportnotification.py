@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementReportNotification(ConnectWiseModel):
+    id: int | None = None
+    notify_who: NotificationRecipientReference | None = Field(
+        default=None, alias='notifyWho'
+    )
+    member: MemberReference | None = None
+    email: str | None = None
+    """
+     Max length: 50;
+    """
+    global_flag: bool | None = Field(default=None, alias='globalFlag')
+    company: CompanyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.notificationrecipientreference import NotificationRecipientReference
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementReportSetup(ConnectWiseModel):
+    id: int | None = None
+    scheduled_report_disabled_flag: bool = Field(
+        ..., alias='scheduledReportDisabledFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
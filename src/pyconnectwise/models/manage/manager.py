@@ -0,0 +1,56 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Manager(ConnectWiseModel):
+    manager_id: str | None = None
+    user_type: str | None = Field(default=None, alias='userType')
+    microsoft_365_contact_rec_id: int | None = Field(
+        default=None, alias='microsoft_365_Contact_RecID'
+    )
+    principal_name: str | None = Field(default=None, alias='principalName')
+    display_name: str | None = Field(default=None, alias='displayName')
+    contact_rec_id: int | None = Field(default=None, alias='contact_RecID')
+    tenant_id: str | None = Field(default=None, alias='tenant_ID')
+    id: str | None = None
+    department: str | None = None
+    manager_id_1: str | None = Field(default=None, alias='manager_ID')
+    employee_type: str | None = Field(default=None, alias='employeeType')
+    manager: Manager | None = None
+    date_entered_utc: datetime | None = Field(default=None, alias='date_Entered_UTC')
+    entered_by: str | None = Field(default=None, alias='entered_By')
+    last_update_utc: datetime | None = Field(default=None, alias='last_Update_UTC')
+    updated_by: str | None = Field(default=None, alias='updated_By')
+    first_name: str | None = Field(default=None, alias='firstName')
+    last_name: str | None = Field(default=None, alias='lastName')
+    groups: list[str] | None = None
+    directory_roles: list[str] | None = Field(default=None, alias='directoryRoles')
+    proxy_addresses: list[str] | None = Field(default=None, alias='proxyAddresses')
+    mail_nickname: str | None = Field(default=None, alias='mailNickname')
+    mail: str | None = None
+    country: str | None = None
+    state: str | None = None
+    city: str | None = None
+    address: str | None = None
+    fax: str | None = None
+    title: str | None = None
+    mobile_phone: str | None = Field(default=None, alias='mobilePhone')
+    office: str | None = None
+    phone_number: str | None = Field(default=None, alias='phoneNumber')
+    language: str | None = None
+    usage_location: str | None = Field(default=None, alias='usageLocation')
+    postal_code: str | None = Field(default=None, alias='postalCode')
+    licenses: list[M365License] | None = None
+    account_enabled: bool | None = Field(default=None, alias='accountEnabled')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.m365license import M365License
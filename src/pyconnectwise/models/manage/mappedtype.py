@@ -0,0 +1,41 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MappedType(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    table: str | None = None
+    rec_id_field: str | None = Field(default=None, alias='recIdField')
+    gl_type: Literal[
+        'AP',
+        'AR',
+        'EE',
+        'EI',
+        'EO',
+        'IA',
+        'IT',
+        'P',
+        'PF',
+        'R',
+        'RA',
+        'RD',
+        'RE',
+        'RP',
+        'ST',
+        'SD',
+        'ET',
+        'FT',
+        'PT',
+        'WP',
+        'WR',
+    ] | None = Field(default=None, alias='glType')
+    sort_order: int | None = Field(default=None, alias='sortOrder')
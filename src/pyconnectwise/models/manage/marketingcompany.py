@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MarketingCompany(ConnectWiseModel):
+    id: int | None = None
+    group_id: int | None = Field(default=None, alias='groupId')
+    default_contact_flag: bool | None = Field(default=None, alias='defaultContactFlag')
+    all_contacts_flag: bool | None = Field(default=None, alias='allContactsFlag')
+    unsubscribe_flag: bool | None = Field(default=None, alias='unsubscribeFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
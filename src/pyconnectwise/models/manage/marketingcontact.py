@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MarketingContact(ConnectWiseModel):
+    id: int | None = None
+    group_id: int | None = Field(default=None, alias='groupId')
+    note: str | None = None
+    """
+     Max length: 50;
+    """
+    unsubscribe_flag: bool | None = Field(default=None, alias='unsubscribeFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
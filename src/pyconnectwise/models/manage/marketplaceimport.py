@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MarketplaceImport(ConnectWiseModel):
+    id: int | None = None
+    marketplace_import_type: Literal[
+        'Agreements',
+        'Configurations',
+        'CRMSurveys',
+        'CustomReports',
+        'CustomerPortalTypes',
+        'HTMLEmailTemplates',
+        'Products',
+        'ProjectBoards',
+        'ProjectTemplates',
+        'ReportWriterReports',
+        'ServiceBoards',
+        'TicketTemplates',
+        'Views',
+    ] | None = Field(default=None, alias='marketplaceImportType')
+    marketplace_object: list | None = Field(default=None, alias='marketplaceObject')
+    required_fields: list[str] | None = Field(default=None, alias='requiredFields')
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberAccrual(ConnectWiseModel):
+    id: int | None = None
+    accrual_type: Literal['Holiday', 'PTO', 'Sick', 'Vacation'] = Field(
+        ..., alias='accrualType'
+    )
+    year: int
+    hours: float
+    reason: str
+    member: MemberReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberCertification(ConnectWiseModel):
+    id: int | None = None
+    certification: CertificationReference
+    percent_complete: int | None = Field(default=None, alias='percentComplete')
+    date_received: datetime | None = Field(default=None, alias='dateReceived')
+    date_expires: datetime | None = Field(default=None, alias='dateExpires')
+    certification_number: str | None = Field(default=None, alias='certificationNumber')
+    """
+     Max length: 50;
+    """
+    notes: str | None = None
+    member: MemberReference | None = None
+    company: CompanyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.certificationreference import CertificationReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,113 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberDeactivation(ConnectWiseModel):
+    activity: MemberDeactivationSalesActivity | None = None
+    service_team: MemberDeactivationServiceTeam | None = Field(
+        default=None, alias='serviceTeam'
+    )
+    company_team: list[MemberDeactivationCompanyTeam] | None = Field(
+        default=None, alias='companyTeam'
+    )
+    """
+    A list of customers for which the member holds a team role
+    """
+    workflow_email: MemberDeactivationWorkflow | None = Field(
+        default=None, alias='workflowEmail'
+    )
+    service_status_workflow: list[MemberDeactivationStatusWorkflow] | None = Field(
+        default=None, alias='serviceStatusWorkflow'
+    )
+    ticket_template: MemberDeactivationServiceTemplate | None = Field(
+        default=None, alias='ticketTemplate'
+    )
+    opportunity: MemberDeactivationOpportunity | None = None
+    sales_team: MemberDeactivationSalesTeam | None = Field(
+        default=None, alias='salesTeam'
+    )
+    project_manager: MemberDeactivationProjectManager | None = Field(
+        default=None, alias='projectManager'
+    )
+    project_time_approver: MemberDeactivationProjectManager | None = Field(
+        default=None, alias='projectTimeApprover'
+    )
+    project_expense_approver: MemberDeactivationProjectManager | None = Field(
+        default=None, alias='projectExpenseApprover'
+    )
+    knowledge_base_article: MemberDeactivationKnowledgebaseArticle | None = Field(
+        default=None, alias='knowledgeBaseArticle'
+    )
+    my_company_president: MemberDeactivationMyCompanyPresidentRole | None = Field(
+        default=None, alias='myCompanyPresident'
+    )
+    my_company_coo: MemberDeactivationMyCompanyCOORole | None = Field(
+        default=None, alias='myCompanyCOO'
+    )
+    my_company_controller: MemberDeactivationMyCompanyControllerRole | None = Field(
+        default=None, alias='myCompanyController'
+    )
+    my_company_dispatch: MemberDeactivationMyCompanyDispatchRole | None = Field(
+        default=None, alias='myCompanyDispatch'
+    )
+    my_company_service_manager: MemberDeactivationMyCompanyServiceManagerRole | None = (
+        Field(default=None, alias='myCompanyServiceManager')
+    )
+    my_company_duty_manager_role: MemberDeactivationMyCompanyDutyManagerRole | None = (
+        Field(default=None, alias='myCompanyDutyManagerRole')
+    )
+    department_manager: MemberDeactivationDepartmentMananager | None = Field(
+        default=None, alias='departmentManager'
+    )
+    dispatch_member: MemberDeactivationDispatchMember | None = Field(
+        default=None, alias='dispatchMember'
+    )
+    service_manager: MemberDeactivationServiceManger | None = Field(
+        default=None, alias='serviceManager'
+    )
+    duty_manager: MemberDeactivationDutyManager | None = Field(
+        default=None, alias='dutyManager'
+    )
+    send_from_email_notify: MemberDeactivationSendFromEmailNotify | None = Field(
+        default=None, alias='sendFromEmailNotify'
+    )
+    delete_open_time_sheets_flag: bool | None = Field(
+        default=None, alias='deleteOpenTimeSheetsFlag'
+    )
+    """
+    By default, this is set to false
+                If there is any open timesheets, system will return error message
+                that there is open timesheets still attached to this member
+                If user would like to delete member with open timesheets, they can set this boolean to TRUE
+                System will delete member and any associated open timesheets
+    """
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberdeactivationcompanyteam import MemberDeactivationCompanyTeam
+from pyconnectwise.models.manage.memberdeactivationdepartmentmananager import MemberDeactivationDepartmentMananager
+from pyconnectwise.models.manage.memberdeactivationdispatchmember import MemberDeactivationDispatchMember
+from pyconnectwise.models.manage.memberdeactivationdutymanager import MemberDeactivationDutyManager
+from pyconnectwise.models.manage.memberdeactivationknowledgebasearticle import MemberDeactivationKnowledgebaseArticle
+from pyconnectwise.models.manage.memberdeactivationmycompanycoorole import MemberDeactivationMyCompanyCOORole
+from pyconnectwise.models.manage.memberdeactivationmycompanycontrollerrole import MemberDeactivationMyCompanyControllerRole
+from pyconnectwise.models.manage.memberdeactivationmycompanydispatchrole import MemberDeactivationMyCompanyDispatchRole
+from pyconnectwise.models.manage.memberdeactivationmycompanydutymanagerrole import MemberDeactivationMyCompanyDutyManagerRole
+from pyconnectwise.models.manage.memberdeactivationmycompanypresidentrole import MemberDeactivationMyCompanyPresidentRole
+from pyconnectwise.models.manage.memberdeactivationmycompanyservicemanagerrole import MemberDeactivationMyCompanyServiceManagerRole
+from pyconnectwise.models.manage.memberdeactivationopportunity import MemberDeactivationOpportunity
+from pyconnectwise.models.manage.memberdeactivationprojectmanager import MemberDeactivationProjectManager
+from pyconnectwise.models.manage.memberdeactivationsalesactivity import MemberDeactivationSalesActivity
+from pyconnectwise.models.manage.memberdeactivationsalesteam import MemberDeactivationSalesTeam
+from pyconnectwise.models.manage.memberdeactivationsendfromemailnotify import MemberDeactivationSendFromEmailNotify
+from pyconnectwise.models.manage.memberdeactivationservicemanger import MemberDeactivationServiceManger
+from pyconnectwise.models.manage.memberdeactivationserviceteam import MemberDeactivationServiceTeam
+from pyconnectwise.models.manage.memberdeactivationservicetemplate import MemberDeactivationServiceTemplate
+from pyconnectwise.models.manage.memberdeactivationstatusworkflow import MemberDeactivationStatusWorkflow
+from pyconnectwise.models.manage.memberdeactivationworkflow import MemberDeactivationWorkflow
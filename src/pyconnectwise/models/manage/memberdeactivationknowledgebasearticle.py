@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.memberdeactivationdepartmentmananager import MemberDeactivationDepartmentMananager
+
+
+class MemberDeactivationKnowledgebaseArticle(MemberDeactivationDepartmentMananager):
+    pass
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
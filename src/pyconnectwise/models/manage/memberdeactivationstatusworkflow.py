@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberDeactivationStatusWorkflow(ConnectWiseModel):
+    count: int | None = None
+    id: int | None = None
+    name: str | None = None
+    re_assign_to_member: MemberReference | None = Field(
+        default=None, alias='reAssignToMember'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberDelegation(ConnectWiseModel):
+    id: int | None = None
+    delegation_type: Literal['Approval', 'Project'] = Field(..., alias='delegationType')
+    delegated_to: MemberReference | None = Field(default=None, alias='delegatedTo')
+    date_start: datetime = Field(..., alias='dateStart')
+    date_end: datetime = Field(..., alias='dateEnd')
+    member: MemberReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberInfo(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    first_name: str | None = Field(default=None, alias='firstName')
+    middle_initial: str | None = Field(default=None, alias='middleInitial')
+    last_name: str | None = Field(default=None, alias='lastName')
+    full_name: str | None = Field(default=None, alias='fullName')
+    default_email: str | None = Field(default=None, alias='defaultEmail')
+    photo: DocumentReference | None = None
+    license_class: Literal['A', 'C', 'F', 'X'] | None = Field(
+        default=None, alias='licenseClass'
+    )
+    """
+    F = Full Member, A = API Member, C = StreamlineIT Member, X = Subcontractor Member
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.documentreference import DocumentReference
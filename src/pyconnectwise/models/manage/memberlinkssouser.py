@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberLinkSsoUser(ConnectWiseModel):
+    sso_user_id: str | None = Field(default=None, alias='ssoUserId')
+    """
+     Max length: 100;
+    """
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberNotificationSetting(ConnectWiseModel):
+    id: int | None = None
+    notification_type: Literal['Email', 'Push'] = Field(..., alias='notificationType')
+    notification_trigger: Literal[
+        'ActivityStatusReq',
+        'CustomerUpdated',
+        'ExpenseReport',
+        'TicketStatusChange',
+        'TicketStatusRequest',
+        'TimeNagApprover',
+        'TimeNagMember',
+        'TimeSheet',
+        'WorkflowRules',
+    ] = Field(..., alias='notificationTrigger')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberPersona(ConnectWiseModel):
+    id: int | None = None
+    job_role_percentage: int | None = Field(default=None, alias='jobRolePercentage')
+    name: str | None = None
+    persona_id: int = Field(..., alias='personaId')
+    member: MemberReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberSkill(ConnectWiseModel):
+    id: int | None = None
+    skill: SkillReference
+    skill_level: Literal['Beginner', 'Intermediate', 'Advanced', 'Expert'] = Field(
+        ..., alias='skillLevel'
+    )
+    certified_flag: bool | None = Field(default=None, alias='certifiedFlag')
+    years_experience: int | None = Field(default=None, alias='yearsExperience')
+    notes: str | None = None
+    member: MemberReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.skillreference import SkillReference
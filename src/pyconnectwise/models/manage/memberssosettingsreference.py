@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberSsoSettingsReference(ConnectWiseModel):
+    id: int | None = None
+    sso_user_id: str | None = Field(default=None, alias='ssoUserId')
+    user_name: str | None = Field(default=None, alias='userName')
+    email: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
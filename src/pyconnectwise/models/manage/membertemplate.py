@@ -0,0 +1,223 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberTemplate(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 50;
+    """
+    template_description: str | None = Field(default=None, alias='templateDescription')
+    """
+     Max length: 1024;
+    """
+    title: str | None = None
+    report_card: ReportCardReference | None = Field(default=None, alias='reportCard')
+    enable_mobile_flag: bool | None = Field(default=None, alias='enableMobileFlag')
+    type: MemberTypeReference | None = None
+    time_zone: TimeZoneSetupReference | None = Field(default=None, alias='timeZone')
+    partner_portal_flag: bool | None = Field(default=None, alias='partnerPortalFlag')
+    sts_user_admin_url: str | None = Field(default=None, alias='stsUserAdminUrl')
+    toast_notification_flag: bool | None = Field(
+        default=None, alias='toastNotificationFlag'
+    )
+    member_personas: list[int] | None = Field(default=None, alias='memberPersonas')
+    admin_flag: bool | None = Field(default=None, alias='adminFlag')
+    structure_level: StructureReference | None = Field(
+        default=None, alias='structureLevel'
+    )
+    security_location: SystemLocationReference | None = Field(
+        default=None, alias='securityLocation'
+    )
+    default_location: SystemLocationReference | None = Field(
+        default=None, alias='defaultLocation'
+    )
+    default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='defaultDepartment'
+    )
+    reports_to: MemberReference | None = Field(default=None, alias='reportsTo')
+    restrict_location_flag: bool | None = Field(
+        default=None, alias='restrictLocationFlag'
+    )
+    restrict_department_flag: bool | None = Field(
+        default=None, alias='restrictDepartmentFlag'
+    )
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    time_approver: MemberReference | None = Field(default=None, alias='timeApprover')
+    expense_approver: MemberReference | None = Field(
+        default=None, alias='expenseApprover'
+    )
+    billable_forecast: float | None = Field(default=None, alias='billableForecast')
+    daily_capacity: float | None = Field(default=None, alias='dailyCapacity')
+    hourly_cost: float | None = Field(default=None, alias='hourlyCost')
+    hourly_rate: float | None = Field(default=None, alias='hourlyRate')
+    include_in_utilization_reporting_flag: bool | None = Field(
+        default=None, alias='includeInUtilizationReportingFlag'
+    )
+    require_expense_entry_flag: bool | None = Field(
+        default=None, alias='requireExpenseEntryFlag'
+    )
+    require_time_sheet_entry_flag: bool | None = Field(
+        default=None, alias='requireTimeSheetEntryFlag'
+    )
+    require_start_and_end_time_on_time_entry_flag: bool | None = Field(
+        default=None, alias='requireStartAndEndTimeOnTimeEntryFlag'
+    )
+    allow_in_cell_entry_on_time_sheet: bool | None = Field(
+        default=None, alias='allowInCellEntryOnTimeSheet'
+    )
+    enter_time_against_company_flag: bool | None = Field(
+        default=None, alias='enterTimeAgainstCompanyFlag'
+    )
+    allow_expenses_entered_against_companies_flag: bool | None = Field(
+        default=None, alias='allowExpensesEnteredAgainstCompaniesFlag'
+    )
+    time_reminder_email_flag: bool | None = Field(
+        default=None, alias='timeReminderEmailFlag'
+    )
+    days_tolerance: int | None = Field(default=None, alias='daysTolerance')
+    minimum_hours: float | None = Field(default=None, alias='minimumHours')
+    time_sheet_start_date: str | None = Field(default=None, alias='timeSheetStartDate')
+    service_default_location: SystemLocationReference | None = Field(
+        default=None, alias='serviceDefaultLocation'
+    )
+    service_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='serviceDefaultDepartment'
+    )
+    service_default_board: BoardReference | None = Field(
+        default=None, alias='serviceDefaultBoard'
+    )
+    restrict_service_default_location_flag: bool | None = Field(
+        default=None, alias='restrictServiceDefaultLocationFlag'
+    )
+    restrict_service_default_department_flag: bool | None = Field(
+        default=None, alias='restrictServiceDefaultDepartmentFlag'
+    )
+    excluded_service_board_ids: list[int] | None = Field(
+        default=None, alias='excludedServiceBoardIds'
+    )
+    teams: list[int] | None = None
+    service_board_team_ids: list[int] | None = Field(
+        default=None, alias='serviceBoardTeamIds'
+    )
+    project_default_location: SystemLocationReference | None = Field(
+        default=None, alias='projectDefaultLocation'
+    )
+    project_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='projectDefaultDepartment'
+    )
+    project_default_board: ProjectBoardReference | None = Field(
+        default=None, alias='projectDefaultBoard'
+    )
+    restrict_project_default_location_flag: bool | None = Field(
+        default=None, alias='restrictProjectDefaultLocationFlag'
+    )
+    restrict_project_default_department_flag: bool | None = Field(
+        default=None, alias='restrictProjectDefaultDepartmentFlag'
+    )
+    excluded_project_board_ids: list[int] | None = Field(
+        default=None, alias='excludedProjectBoardIds'
+    )
+    schedule_default_location: SystemLocationReference | None = Field(
+        default=None, alias='scheduleDefaultLocation'
+    )
+    schedule_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='scheduleDefaultDepartment'
+    )
+    schedule_capacity: float | None = Field(default=None, alias='scheduleCapacity')
+    service_location: ServiceLocationReference | None = Field(
+        default=None, alias='serviceLocation'
+    )
+    restrict_schedule_flag: bool | None = Field(
+        default=None, alias='restrictScheduleFlag'
+    )
+    hide_member_in_dispatch_portal_flag: bool | None = Field(
+        default=None, alias='hideMemberInDispatchPortalFlag'
+    )
+    calendar: CalendarReference | None = None
+    sales_default_location: SystemLocationReference | None = Field(
+        default=None, alias='salesDefaultLocation'
+    )
+    restrict_default_sales_territory_flag: bool | None = Field(
+        default=None, alias='restrictDefaultSalesTerritoryFlag'
+    )
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    restrict_default_warehouse_flag: bool | None = Field(
+        default=None, alias='restrictDefaultWarehouseFlag'
+    )
+    restrict_default_warehouse_bin_flag: bool | None = Field(
+        default=None, alias='restrictDefaultWarehouseBinFlag'
+    )
+    company_activity_tab_format: Literal['SummaryList', 'DetailList'] | None = Field(
+        default=None, alias='companyActivityTabFormat'
+    )
+    invoice_time_tab_format: Literal['SummaryList', 'DetailList'] | None = Field(
+        default=None, alias='invoiceTimeTabFormat'
+    )
+    invoice_screen_default_tab_format: Literal[
+        'ShowInvoicingTab', 'ShowAgreementInvoicingTab'
+    ] | None = Field(default=None, alias='invoiceScreenDefaultTabFormat')
+    invoicing_display_options: Literal[
+        'RemainOnInvoicingScreen', 'ShowRecentInvoices'
+    ] | None = Field(default=None, alias='invoicingDisplayOptions')
+    agreement_invoicing_display_options: Literal[
+        'RemainOnInvoicingScreen', 'ShowRecentInvoices'
+    ] | None = Field(default=None, alias='agreementInvoicingDisplayOptions')
+    auto_start_stopwatch: bool | None = Field(default=None, alias='autoStartStopwatch')
+    auto_popup_quick_notes_with_stopwatch: bool | None = Field(
+        default=None, alias='autoPopupQuickNotesWithStopwatch'
+    )
+    global_search_default_ticket_filter: Literal[
+        'OpenRecords', 'ClosedRecords', 'AllRecords'
+    ] | None = Field(default=None, alias='globalSearchDefaultTicketFilter')
+    global_search_default_sort: Literal[
+        'None', 'LastUpdatedDesc', 'LastUpdatedAsc', 'CreatedDesc', 'CreatedAsc'
+    ] | None = Field(default=None, alias='globalSearchDefaultSort')
+    phone_source: str | None = Field(default=None, alias='phoneSource')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    copy_pod_layouts: bool | None = Field(default=None, alias='copyPodLayouts')
+    copy_shared_default_views: bool | None = Field(
+        default=None, alias='copySharedDefaultViews'
+    )
+    copy_column_layouts_and_filters: bool | None = Field(
+        default=None, alias='copyColumnLayoutsAndFilters'
+    )
+    from_member_rec_id: int | None = Field(default=None, alias='fromMemberRecId')
+    from_member_template_rec_id: int | None = Field(
+        default=None, alias='fromMemberTemplateRecId'
+    )
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.calendarreference import CalendarReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.membertypereference import MemberTypeReference
+from pyconnectwise.models.manage.projectboardreference import ProjectBoardReference
+from pyconnectwise.models.manage.reportcardreference import ReportCardReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
+from pyconnectwise.models.manage.structurereference import StructureReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
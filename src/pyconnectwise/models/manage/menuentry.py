@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MenuEntry(ConnectWiseModel):
+    id: int | None = None
+    menu_location: MenuLocationReference | None = Field(
+        default=None, alias='menuLocation'
+    )
+    caption: str
+    """
+     Max length: 50;
+    """
+    link: str
+    """
+     Max length: 2000;
+    """
+    new_window_flag: bool = Field(..., alias='newWindowFlag')
+    location_ids: list[int] | None = Field(default=None, alias='locationIds')
+    origin: str | None = None
+    """
+     Max length: 2000;
+    """
+    client_id: str | None = Field(default=None, alias='clientId')
+    """
+    Only required if not already set Max length: 36;
+    """
+    add_all_locations: bool | None = Field(default=None, alias='addAllLocations')
+    remove_all_locations: bool | None = Field(default=None, alias='removeAllLocations')
+    small_menu_icon_id: int | None = Field(default=None, alias='smallMenuIconId')
+    large_menu_icon_id: int | None = Field(default=None, alias='largeMenuIconId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.menulocationreference import MenuLocationReference
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MenuEntryLocation(ConnectWiseModel):
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    menu_entry: SystemMenuEntryReference | None = Field(default=None, alias='menuEntry')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.systemmenuentryreference import SystemMenuEntryReference
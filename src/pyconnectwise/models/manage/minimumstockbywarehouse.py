@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MinimumStockByWarehouse(ConnectWiseModel):
+    id: int | None = None
+    warehouse: WarehouseReference
+    minimum_stock: int = Field(..., alias='minimumStock')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
@@ -0,0 +1,284 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MyAccount(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 15;
+    """
+    password: str | None = None
+    """
+    ConditionallyRequired. API Member will get random password generated Max length: 60;
+    """
+    first_name: str = Field(..., alias='firstName')
+    """
+     Max length: 30;
+    """
+    middle_initial: str | None = Field(default=None, alias='middleInitial')
+    """
+     Max length: 1;
+    """
+    last_name: str = Field(..., alias='lastName')
+    """
+     Max length: 30;
+    """
+    title: str | None = None
+    """
+     Max length: 50;
+    """
+    report_card: ReportCardReference | None = Field(default=None, alias='reportCard')
+    license_class: Literal['A', 'C', 'F', 'X'] = Field(..., alias='licenseClass')
+    """
+    F = Full Member, A = API Member, C = StreamlineIT Member, X = Subcontractor Member
+    """
+    disable_online_flag: bool | None = Field(default=None, alias='disableOnlineFlag')
+    enable_mobile_flag: bool | None = Field(default=None, alias='enableMobileFlag')
+    type: MemberTypeReference | None = None
+    employee_identifer: str | None = Field(default=None, alias='employeeIdentifer')
+    """
+     Max length: 10;
+    """
+    vendor_number: str | None = Field(default=None, alias='vendorNumber')
+    notes: str | None = None
+    time_zone: TimeZoneSetupReference | None = Field(default=None, alias='timeZone')
+    country: CountryReference | None = None
+    service_board_team_ids: list[int] | None = Field(
+        default=None, alias='serviceBoardTeamIds'
+    )
+    enable_mobile_gps_flag: bool | None = Field(
+        default=None, alias='enableMobileGpsFlag'
+    )
+    inactive_date: datetime | None = Field(default=None, alias='inactiveDate')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    last_login: str | None = Field(default=None, alias='lastLogin')
+    photo: DocumentReference | None = None
+    partner_portal_flag: bool | None = Field(default=None, alias='partnerPortalFlag')
+    client_id: str | None = Field(default=None, alias='clientId')
+    sts_user_admin_url: str | None = Field(default=None, alias='stsUserAdminUrl')
+    token: str | None = None
+    toast_notification_flag: bool | None = Field(
+        default=None, alias='toastNotificationFlag'
+    )
+    member_personas: list[int] | None = Field(default=None, alias='memberPersonas')
+    office365: MemberOffice365 | None = None
+    office_email: str | None = Field(default=None, alias='officeEmail')
+    """
+     Max length: 250;
+    """
+    office_phone: str | None = Field(default=None, alias='officePhone')
+    """
+     Max length: 15;
+    """
+    office_extension: str | None = Field(default=None, alias='officeExtension')
+    """
+     Max length: 10;
+    """
+    mobile_email: str | None = Field(default=None, alias='mobileEmail')
+    """
+     Max length: 250;
+    """
+    mobile_phone: str | None = Field(default=None, alias='mobilePhone')
+    """
+     Max length: 15;
+    """
+    mobile_extension: str | None = Field(default=None, alias='mobileExtension')
+    """
+     Max length: 10;
+    """
+    home_email: str | None = Field(default=None, alias='homeEmail')
+    """
+     Max length: 250;
+    """
+    home_phone: str | None = Field(default=None, alias='homePhone')
+    """
+     Max length: 15;
+    """
+    home_extension: str | None = Field(default=None, alias='homeExtension')
+    """
+     Max length: 10;
+    """
+    default_email: Literal['Office', 'Mobile', 'Home'] = Field(
+        ..., alias='defaultEmail'
+    )
+    primary_email: str | None = Field(default=None, alias='primaryEmail')
+    """
+     Max length: 250;
+    """
+    default_phone: Literal['Office', 'Mobile', 'Home'] = Field(
+        ..., alias='defaultPhone'
+    )
+    default_location: SystemLocationReference | None = Field(
+        default=None, alias='defaultLocation'
+    )
+    default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='defaultDepartment'
+    )
+    reports_to: MemberReference | None = Field(default=None, alias='reportsTo')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    time_approver: MemberReference | None = Field(default=None, alias='timeApprover')
+    expense_approver: MemberReference | None = Field(
+        default=None, alias='expenseApprover'
+    )
+    billable_forecast: float | None = Field(default=None, alias='billableForecast')
+    daily_capacity: float | None = Field(default=None, alias='dailyCapacity')
+    include_in_utilization_reporting_flag: bool | None = Field(
+        default=None, alias='includeInUtilizationReportingFlag'
+    )
+    require_expense_entry_flag: bool | None = Field(
+        default=None, alias='requireExpenseEntryFlag'
+    )
+    require_time_sheet_entry_flag: bool | None = Field(
+        default=None, alias='requireTimeSheetEntryFlag'
+    )
+    require_start_and_end_time_on_time_entry_flag: bool | None = Field(
+        default=None, alias='requireStartAndEndTimeOnTimeEntryFlag'
+    )
+    allow_in_cell_entry_on_time_sheet: bool | None = Field(
+        default=None, alias='allowInCellEntryOnTimeSheet'
+    )
+    enter_time_against_company_flag: bool | None = Field(
+        default=None, alias='enterTimeAgainstCompanyFlag'
+    )
+    allow_expenses_entered_against_companies_flag: bool | None = Field(
+        default=None, alias='allowExpensesEnteredAgainstCompaniesFlag'
+    )
+    time_reminder_email_flag: bool | None = Field(
+        default=None, alias='timeReminderEmailFlag'
+    )
+    days_tolerance: int | None = Field(default=None, alias='daysTolerance')
+    minimum_hours: float | None = Field(default=None, alias='minimumHours')
+    time_sheet_start_date: datetime | None = Field(
+        default=None, alias='timeSheetStartDate'
+    )
+    hire_date: datetime = Field(..., alias='hireDate')
+    service_default_location: SystemLocationReference | None = Field(
+        default=None, alias='serviceDefaultLocation'
+    )
+    service_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='serviceDefaultDepartment'
+    )
+    service_default_board: BoardReference | None = Field(
+        default=None, alias='serviceDefaultBoard'
+    )
+    project_default_location: SystemLocationReference | None = Field(
+        default=None, alias='projectDefaultLocation'
+    )
+    project_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='projectDefaultDepartment'
+    )
+    project_default_board: ProjectBoardReference | None = Field(
+        default=None, alias='projectDefaultBoard'
+    )
+    schedule_default_location: SystemLocationReference | None = Field(
+        default=None, alias='scheduleDefaultLocation'
+    )
+    schedule_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='scheduleDefaultDepartment'
+    )
+    schedule_capacity: float | None = Field(default=None, alias='scheduleCapacity')
+    service_location: ServiceLocationReference | None = Field(
+        default=None, alias='serviceLocation'
+    )
+    hide_member_in_dispatch_portal_flag: bool | None = Field(
+        default=None, alias='hideMemberInDispatchPortalFlag'
+    )
+    calendar: CalendarReference | None = None
+    sales_default_location: SystemLocationReference | None = Field(
+        default=None, alias='salesDefaultLocation'
+    )
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    mapi_name: str | None = Field(default=None, alias='mapiName')
+    calendar_sync_integration_flag: bool | None = Field(
+        default=None, alias='calendarSyncIntegrationFlag'
+    )
+    company_activity_tab_format: Literal['SummaryList', 'DetailList'] = Field(
+        ..., alias='companyActivityTabFormat'
+    )
+    invoice_time_tab_format: Literal['SummaryList', 'DetailList'] = Field(
+        ..., alias='invoiceTimeTabFormat'
+    )
+    invoice_screen_default_tab_format: Literal[
+        'ShowInvoicingTab', 'ShowAgreementInvoicingTab'
+    ] = Field(..., alias='invoiceScreenDefaultTabFormat')
+    invoicing_display_options: Literal[
+        'RemainOnInvoicingScreen', 'ShowRecentInvoices'
+    ] = Field(..., alias='invoicingDisplayOptions')
+    agreement_invoicing_display_options: Literal[
+        'RemainOnInvoicingScreen', 'ShowRecentInvoices'
+    ] = Field(..., alias='agreementInvoicingDisplayOptions')
+    authentication_service_type: Literal[
+        'AuthAnvil', 'GoogleAuthenticator', 'Email'
+    ] | None = Field(default=None, alias='authenticationServiceType')
+    timebased_one_time_password_activated: bool | None = Field(
+        default=None, alias='timebasedOneTimePasswordActivated'
+    )
+    directional_sync: DirectionalSyncReference | None = Field(
+        default=None, alias='directionalSync'
+    )
+    auto_start_stopwatch: bool | None = Field(default=None, alias='autoStartStopwatch')
+    auto_popup_quick_notes_with_stopwatch: bool | None = Field(
+        default=None, alias='autoPopupQuickNotesWithStopwatch'
+    )
+    signature: str | None = None
+    global_search_default_ticket_filter: Literal[
+        'OpenRecords', 'ClosedRecords', 'AllRecords'
+    ] | None = Field(default=None, alias='globalSearchDefaultTicketFilter')
+    global_search_default_sort: Literal[
+        'None', 'LastUpdatedDesc', 'LastUpdatedAsc', 'CreatedDesc', 'CreatedAsc'
+    ] | None = Field(default=None, alias='globalSearchDefaultSort')
+    phone_source: str | None = Field(default=None, alias='phoneSource')
+    phone_integration_type: Literal[
+        'TAPI', 'SKYPE', 'TEL', 'CALLTO', 'NONE'
+    ] | None = Field(default=None, alias='phoneIntegrationType')
+    use_browser_language_flag: bool | None = Field(
+        default=None, alias='useBrowserLanguageFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    copy_pod_layouts: bool | None = Field(default=None, alias='copyPodLayouts')
+    copy_shared_default_views: bool | None = Field(
+        default=None, alias='copySharedDefaultViews'
+    )
+    copy_column_layouts_and_filters: bool | None = Field(
+        default=None, alias='copyColumnLayoutsAndFilters'
+    )
+    from_member_rec_id: int | None = Field(default=None, alias='fromMemberRecId')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.calendarreference import CalendarReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.directionalsyncreference import DirectionalSyncReference
+from pyconnectwise.models.manage.documentreference import DocumentReference
+from pyconnectwise.models.manage.memberoffice365 import MemberOffice365
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.membertypereference import MemberTypeReference
+from pyconnectwise.models.manage.projectboardreference import ProjectBoardReference
+from pyconnectwise.models.manage.reportcardreference import ReportCardReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
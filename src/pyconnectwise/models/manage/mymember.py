@@ -0,0 +1,259 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MyMember(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    password: str | None = None
+    """
+    ConditionallyRequired. API Member will get random password generated
+    """
+    first_name: str | None = Field(default=None, alias='firstName')
+    middle_initial: str | None = Field(default=None, alias='middleInitial')
+    last_name: str | None = Field(default=None, alias='lastName')
+    title: str | None = None
+    report_card: ReportCardReference | None = Field(default=None, alias='reportCard')
+    license_class: Literal['A', 'C', 'F', 'X'] | None = Field(
+        default=None, alias='licenseClass'
+    )
+    """
+    F = Full Member, A = API Member, C = StreamlineIT Member, X = Subcontractor Member
+    """
+    disable_online_flag: bool | None = Field(default=None, alias='disableOnlineFlag')
+    enable_mobile_flag: bool | None = Field(default=None, alias='enableMobileFlag')
+    type: MemberTypeReference | None = None
+    employee_identifer: str | None = Field(default=None, alias='employeeIdentifer')
+    vendor_number: str | None = Field(default=None, alias='vendorNumber')
+    notes: str | None = None
+    time_zone: TimeZoneSetupReference | None = Field(default=None, alias='timeZone')
+    country: CountryReference | None = None
+    service_board_team_ids: list[int] | None = Field(
+        default=None, alias='serviceBoardTeamIds'
+    )
+    enable_mobile_gps_flag: bool | None = Field(
+        default=None, alias='enableMobileGpsFlag'
+    )
+    inactive_date: str | None = Field(default=None, alias='inactiveDate')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    last_login: str | None = Field(default=None, alias='lastLogin')
+    photo: DocumentReference | None = None
+    toast_notification_flag: bool | None = Field(
+        default=None, alias='toastNotificationFlag'
+    )
+    office_email: str | None = Field(default=None, alias='officeEmail')
+    office_phone: str | None = Field(default=None, alias='officePhone')
+    office_extension: str | None = Field(default=None, alias='officeExtension')
+    mobile_email: str | None = Field(default=None, alias='mobileEmail')
+    mobile_phone: str | None = Field(default=None, alias='mobilePhone')
+    mobile_extension: str | None = Field(default=None, alias='mobileExtension')
+    home_email: str | None = Field(default=None, alias='homeEmail')
+    home_phone: str | None = Field(default=None, alias='homePhone')
+    home_extension: str | None = Field(default=None, alias='homeExtension')
+    default_email: Literal['Office', 'Mobile', 'Home'] | None = Field(
+        default=None, alias='defaultEmail'
+    )
+    default_phone: Literal['Office', 'Mobile', 'Home'] | None = Field(
+        default=None, alias='defaultPhone'
+    )
+    security_role: SecurityRoleReference | None = Field(
+        default=None, alias='securityRole'
+    )
+    admin_flag: bool | None = Field(default=None, alias='adminFlag')
+    structure_level: StructureReference | None = Field(
+        default=None, alias='structureLevel'
+    )
+    security_location: SystemLocationReference | None = Field(
+        default=None, alias='securityLocation'
+    )
+    default_location: SystemLocationReference | None = Field(
+        default=None, alias='defaultLocation'
+    )
+    default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='defaultDepartment'
+    )
+    reports_to: MemberReference | None = Field(default=None, alias='reportsTo')
+    restrict_location_flag: bool | None = Field(
+        default=None, alias='restrictLocationFlag'
+    )
+    restrict_department_flag: bool | None = Field(
+        default=None, alias='restrictDepartmentFlag'
+    )
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    time_approver: MemberReference | None = Field(default=None, alias='timeApprover')
+    expense_approver: MemberReference | None = Field(
+        default=None, alias='expenseApprover'
+    )
+    billable_forecast: float | None = Field(default=None, alias='billableForecast')
+    daily_capacity: float | None = Field(default=None, alias='dailyCapacity')
+    hourly_cost: float | None = Field(default=None, alias='hourlyCost')
+    hourly_rate: float | None = Field(default=None, alias='hourlyRate')
+    include_in_utilization_reporting_flag: bool | None = Field(
+        default=None, alias='includeInUtilizationReportingFlag'
+    )
+    require_expense_entry_flag: bool | None = Field(
+        default=None, alias='requireExpenseEntryFlag'
+    )
+    require_time_sheet_entry_flag: bool | None = Field(
+        default=None, alias='requireTimeSheetEntryFlag'
+    )
+    require_start_and_end_time_on_time_entry_flag: bool | None = Field(
+        default=None, alias='requireStartAndEndTimeOnTimeEntryFlag'
+    )
+    allow_in_cell_entry_on_time_sheet: bool | None = Field(
+        default=None, alias='allowInCellEntryOnTimeSheet'
+    )
+    enter_time_against_company_flag: bool | None = Field(
+        default=None, alias='enterTimeAgainstCompanyFlag'
+    )
+    allow_expenses_entered_against_companies_flag: bool | None = Field(
+        default=None, alias='allowExpensesEnteredAgainstCompaniesFlag'
+    )
+    time_reminder_email_flag: bool | None = Field(
+        default=None, alias='timeReminderEmailFlag'
+    )
+    days_tolerance: int | None = Field(default=None, alias='daysTolerance')
+    minimum_hours: float | None = Field(default=None, alias='minimumHours')
+    time_sheet_start_date: str | None = Field(default=None, alias='timeSheetStartDate')
+    hire_date: str | None = Field(default=None, alias='hireDate')
+    service_default_location: SystemLocationReference | None = Field(
+        default=None, alias='serviceDefaultLocation'
+    )
+    service_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='serviceDefaultDepartment'
+    )
+    service_default_board: BoardReference | None = Field(
+        default=None, alias='serviceDefaultBoard'
+    )
+    restrict_service_default_location_flag: bool | None = Field(
+        default=None, alias='restrictServiceDefaultLocationFlag'
+    )
+    restrict_service_default_department_flag: bool | None = Field(
+        default=None, alias='restrictServiceDefaultDepartmentFlag'
+    )
+    excluded_service_board_ids: list[int] | None = Field(
+        default=None, alias='excludedServiceBoardIds'
+    )
+    project_default_location: SystemLocationReference | None = Field(
+        default=None, alias='projectDefaultLocation'
+    )
+    project_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='projectDefaultDepartment'
+    )
+    project_default_board: ProjectBoardReference | None = Field(
+        default=None, alias='projectDefaultBoard'
+    )
+    restrict_project_default_location_flag: bool | None = Field(
+        default=None, alias='restrictProjectDefaultLocationFlag'
+    )
+    restrict_project_default_department_flag: bool | None = Field(
+        default=None, alias='restrictProjectDefaultDepartmentFlag'
+    )
+    excluded_project_board_ids: list[int] | None = Field(
+        default=None, alias='excludedProjectBoardIds'
+    )
+    schedule_default_location: SystemLocationReference | None = Field(
+        default=None, alias='scheduleDefaultLocation'
+    )
+    schedule_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='scheduleDefaultDepartment'
+    )
+    schedule_capacity: float | None = Field(default=None, alias='scheduleCapacity')
+    service_location: ServiceLocationReference | None = Field(
+        default=None, alias='serviceLocation'
+    )
+    restrict_schedule_flag: bool | None = Field(
+        default=None, alias='restrictScheduleFlag'
+    )
+    hide_member_in_dispatch_portal_flag: bool | None = Field(
+        default=None, alias='hideMemberInDispatchPortalFlag'
+    )
+    calendar: CalendarReference | None = None
+    sales_default_location: SystemLocationReference | None = Field(
+        default=None, alias='salesDefaultLocation'
+    )
+    restrict_default_sales_territory_flag: bool | None = Field(
+        default=None, alias='restrictDefaultSalesTerritoryFlag'
+    )
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    restrict_default_warehouse_flag: bool | None = Field(
+        default=None, alias='restrictDefaultWarehouseFlag'
+    )
+    restrict_default_warehouse_bin_flag: bool | None = Field(
+        default=None, alias='restrictDefaultWarehouseBinFlag'
+    )
+    mapi_name: str | None = Field(default=None, alias='mapiName')
+    calendar_sync_integration_flag: bool | None = Field(
+        default=None, alias='calendarSyncIntegrationFlag'
+    )
+    enable_ldap_authentication_flag: bool | None = Field(
+        default=None, alias='enableLdapAuthenticationFlag'
+    )
+    ldap_configuration: LdapConfigurationReference | None = Field(
+        default=None, alias='ldapConfiguration'
+    )
+    ldap_user_name: str | None = Field(default=None, alias='ldapUserName')
+    company_activity_tab_format: Literal['SummaryList', 'DetailList'] | None = Field(
+        default=None, alias='companyActivityTabFormat'
+    )
+    invoice_time_tab_format: Literal['SummaryList', 'DetailList'] | None = Field(
+        default=None, alias='invoiceTimeTabFormat'
+    )
+    invoice_screen_default_tab_format: Literal[
+        'ShowInvoicingTab', 'ShowAgreementInvoicingTab'
+    ] | None = Field(default=None, alias='invoiceScreenDefaultTabFormat')
+    invoicing_display_options: Literal[
+        'RemainOnInvoicingScreen', 'ShowRecentInvoices'
+    ] | None = Field(default=None, alias='invoicingDisplayOptions')
+    agreement_invoicing_display_options: Literal[
+        'RemainOnInvoicingScreen', 'ShowRecentInvoices'
+    ] | None = Field(default=None, alias='agreementInvoicingDisplayOptions')
+    corelytics_username: str | None = Field(default=None, alias='corelyticsUsername')
+    corelytics_password: str | None = Field(default=None, alias='corelyticsPassword')
+    authentication_service_type: Literal[
+        'AuthAnvil', 'GoogleAuthenticator', 'Email'
+    ] | None = Field(default=None, alias='authenticationServiceType')
+    timebased_one_time_password_activated: bool | None = Field(
+        default=None, alias='timebasedOneTimePasswordActivated'
+    )
+    directional_sync: DirectionalSyncReference | None = Field(
+        default=None, alias='directionalSync'
+    )
+    sso_session_flag: bool | None = Field(default=None, alias='ssoSessionFlag')
+    sso_client_id: str | None = Field(default=None, alias='ssoClientId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.calendarreference import CalendarReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.directionalsyncreference import DirectionalSyncReference
+from pyconnectwise.models.manage.documentreference import DocumentReference
+from pyconnectwise.models.manage.ldapconfigurationreference import LdapConfigurationReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.membertypereference import MemberTypeReference
+from pyconnectwise.models.manage.projectboardreference import ProjectBoardReference
+from pyconnectwise.models.manage.reportcardreference import ReportCardReference
+from pyconnectwise.models.manage.securityrolereference import SecurityRoleReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
+from pyconnectwise.models.manage.structurereference import StructureReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
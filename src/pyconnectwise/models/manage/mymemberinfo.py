@@ -0,0 +1,132 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MyMemberInfo(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    first_name: str | None = Field(default=None, alias='firstName')
+    middle_initial: str | None = Field(default=None, alias='middleInitial')
+    last_name: str | None = Field(default=None, alias='lastName')
+    full_name: str | None = Field(default=None, alias='fullName')
+    default_email: str | None = Field(default=None, alias='defaultEmail')
+    photo: DocumentReference | None = None
+    license_class: Literal['A', 'C', 'F', 'X'] | None = Field(
+        default=None, alias='licenseClass'
+    )
+    """
+    F = Full Member, A = API Member, C = StreamlineIT Member, X = Subcontractor Member
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    time_zone: TimeZoneSetupReference | None = Field(default=None, alias='timeZone')
+    use_browser_language_flag: bool | None = Field(
+        default=None, alias='useBrowserLanguageFlag'
+    )
+    default_location: SystemLocationReference | None = Field(
+        default=None, alias='defaultLocation'
+    )
+    default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='defaultDepartment'
+    )
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    daily_capacity: float | None = Field(default=None, alias='dailyCapacity')
+    require_expense_entry_flag: bool | None = Field(
+        default=None, alias='requireExpenseEntryFlag'
+    )
+    require_time_sheet_entry_flag: bool | None = Field(
+        default=None, alias='requireTimeSheetEntryFlag'
+    )
+    require_start_and_end_time_on_time_entry_flag: bool | None = Field(
+        default=None, alias='requireStartAndEndTimeOnTimeEntryFlag'
+    )
+    enter_time_against_company_flag: bool | None = Field(
+        default=None, alias='enterTimeAgainstCompanyFlag'
+    )
+    allow_expenses_entered_against_companies_flag: bool | None = Field(
+        default=None, alias='allowExpensesEnteredAgainstCompaniesFlag'
+    )
+    service_default_board: BoardReference | None = Field(
+        default=None, alias='serviceDefaultBoard'
+    )
+    service_default_location: SystemLocationReference | None = Field(
+        default=None, alias='serviceDefaultLocation'
+    )
+    service_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='serviceDefaultDepartment'
+    )
+    restrict_service_default_location_flag: bool | None = Field(
+        default=None, alias='restrictServiceDefaultLocationFlag'
+    )
+    restrict_service_default_department_flag: bool | None = Field(
+        default=None, alias='restrictServiceDefaultDepartmentFlag'
+    )
+    excluded_service_board_ids: list[int] | None = Field(
+        default=None, alias='excludedServiceBoardIds'
+    )
+    project_default_location: SystemLocationReference | None = Field(
+        default=None, alias='projectDefaultLocation'
+    )
+    project_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='projectDefaultDepartment'
+    )
+    project_default_board: ProjectBoardReference | None = Field(
+        default=None, alias='projectDefaultBoard'
+    )
+    restrict_project_default_location_flag: bool | None = Field(
+        default=None, alias='restrictProjectDefaultLocationFlag'
+    )
+    restrict_project_default_department_flag: bool | None = Field(
+        default=None, alias='restrictProjectDefaultDepartmentFlag'
+    )
+    excluded_project_board_ids: list[int] | None = Field(
+        default=None, alias='excludedProjectBoardIds'
+    )
+    schedule_default_location: SystemLocationReference | None = Field(
+        default=None, alias='scheduleDefaultLocation'
+    )
+    schedule_default_department: SystemDepartmentReference | None = Field(
+        default=None, alias='scheduleDefaultDepartment'
+    )
+    schedule_capacity: float | None = Field(default=None, alias='scheduleCapacity')
+    service_location: ServiceLocationReference | None = Field(
+        default=None, alias='serviceLocation'
+    )
+    sales_default_location: SystemLocationReference | None = Field(
+        default=None, alias='salesDefaultLocation'
+    )
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    restrict_default_warehouse_flag: bool | None = Field(
+        default=None, alias='restrictDefaultWarehouseFlag'
+    )
+    restrict_default_warehouse_bin_flag: bool | None = Field(
+        default=None, alias='restrictDefaultWarehouseBinFlag'
+    )
+    sso_session_flag: bool | None = Field(default=None, alias='ssoSessionFlag')
+    sso_client_id: str | None = Field(default=None, alias='ssoClientId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.documentreference import DocumentReference
+from pyconnectwise.models.manage.projectboardreference import ProjectBoardReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
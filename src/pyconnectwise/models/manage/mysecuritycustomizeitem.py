@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MySecurityCustomizeItem(ConnectWiseModel):
+    id: int | None = None
+    customize_identifier: Literal[
+        'CompanyReports',
+        'FinanceReports',
+        'MarketingReports',
+        'ProcurementReports',
+        'ProjectReports',
+        'SalesReports',
+        'ServiceReports',
+        'SystemReports',
+        'TimeAndExpenseReports',
+        'CompanyConfigurations',
+        'FinanceAgreements',
+        'ProjectScheduling',
+        'ServiceResourceScheduling',
+        'SystemManageHostedApi',
+        'SystemMyAccount',
+        'SystemCustomMenuEntry',
+        'SystemMassMaintenance',
+        'SystemTableSetup',
+    ] | None = Field(default=None, alias='customizeIdentifier')
+    item_identifier: str | None = Field(default=None, alias='itemIdentifier')
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class NotificationRecipient(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    name: str | None = None
+    external_flag: bool | None = Field(default=None, alias='externalFlag')
+    service_flag: bool | None = Field(default=None, alias='serviceFlag')
+    sales_flag: bool | None = Field(default=None, alias='salesFlag')
+    invoice_flag: bool | None = Field(default=None, alias='invoiceFlag')
+    agreement_flag: bool | None = Field(default=None, alias='agreementFlag')
+    member_flag: bool | None = Field(default=None, alias='memberFlag')
+    config_flag: bool | None = Field(default=None, alias='configFlag')
+    msp_flag: bool | None = Field(default=None, alias='mspFlag')
+    track_flag: bool | None = Field(default=None, alias='trackFlag')
+    project_flag: bool | None = Field(default=None, alias='projectFlag')
+    procurement_flag: bool | None = Field(default=None, alias='procurementFlag')
+    knowledge_base_flag: bool | None = Field(default=None, alias='knowledgeBaseFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
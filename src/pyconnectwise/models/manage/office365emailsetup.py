@@ -0,0 +1,55 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Office365EmailSetup(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 200;
+    """
+    username: str
+    """
+     Max length: 100;
+    """
+    inbox_folder: str = Field(..., alias='inboxFolder')
+    """
+     Max length: 40;
+    """
+    processed_folder: str = Field(..., alias='processedFolder')
+    """
+     Max length: 40;
+    """
+    failed_folder: str = Field(..., alias='failedFolder')
+    """
+     Max length: 40;
+    """
+    tenant_id: str | None = Field(default=None, alias='tenantId')
+    """
+     Max length: 36;
+    """
+    client_id: str | None = Field(default=None, alias='clientId')
+    """
+     Max length: 36;
+    """
+    client_secret: str | None = Field(default=None, alias='clientSecret')
+    """
+     Max length: 4000;
+    """
+    authorized_flag: bool | None = Field(default=None, alias='authorizedFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    source: int | None = None
+    email_connector: EmailConnectorReference | None = Field(
+        default=None, alias='emailConnector'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.emailconnectorreference import EmailConnectorReference
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OnHandSerialNumberReference(ConnectWiseModel):
+    id: int | None = None
+    serial_number: str | None = Field(default=None, alias='serialNumber')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
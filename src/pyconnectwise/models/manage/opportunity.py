@@ -0,0 +1,109 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Opportunity(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    expected_close_date: datetime | None = Field(
+        default=None, alias='expectedCloseDate'
+    )
+    """
+     Required On Updates;
+    """
+    type: OpportunityTypeReference | None = None
+    stage: OpportunityStageReference | None = None
+    status: OpportunityStatusReference | None = None
+    priority: OpportunityPriorityReference | None = None
+    notes: str | None = None
+    probability: OpportunityProbabilityReference | None = None
+    source: str | None = None
+    """
+     Max length: 50;
+    """
+    rating: OpportunityRatingReference | None = None
+    campaign: CampaignReference | None = None
+    primary_sales_rep: MemberReference | None = Field(
+        default=None, alias='primarySalesRep'
+    )
+    secondary_sales_rep: MemberReference | None = Field(
+        default=None, alias='secondarySalesRep'
+    )
+    location_id: int | None = Field(default=None, alias='locationId')
+    """
+     Required On Updates;
+    """
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    """
+     Required On Updates;
+    """
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    site: SiteReference | None = None
+    customer_po: str | None = Field(default=None, alias='customerPO')
+    """
+     Max length: 25;
+    """
+    pipeline_change_date: datetime | None = Field(
+        default=None, alias='pipelineChangeDate'
+    )
+    date_became_lead: datetime | None = Field(default=None, alias='dateBecameLead')
+    closed_date: datetime | None = Field(default=None, alias='closedDate')
+    closed_by: MemberReference | None = Field(default=None, alias='closedBy')
+    total_sales_tax: float | None = Field(default=None, alias='totalSalesTax')
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    ship_to_contact: ContactReference | None = Field(
+        default=None, alias='shipToContact'
+    )
+    ship_to_site: SiteReference | None = Field(default=None, alias='shipToSite')
+    bill_to_company: CompanyReference | None = Field(
+        default=None, alias='billToCompany'
+    )
+    bill_to_contact: ContactReference | None = Field(
+        default=None, alias='billToContact'
+    )
+    bill_to_site: SiteReference | None = Field(default=None, alias='billToSite')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    currency: CurrencyReference | None = None
+    company_location_id: int | None = Field(default=None, alias='companyLocationId')
+    technical_contact: ContactReference | None = Field(
+        default=None, alias='technicalContact'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.campaignreference import CampaignReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.opportunitypriorityreference import OpportunityPriorityReference
+from pyconnectwise.models.manage.opportunityprobabilityreference import OpportunityProbabilityReference
+from pyconnectwise.models.manage.opportunityratingreference import OpportunityRatingReference
+from pyconnectwise.models.manage.opportunitystagereference import OpportunityStageReference
+from pyconnectwise.models.manage.opportunitystatusreference import OpportunityStatusReference
+from pyconnectwise.models.manage.opportunitytypereference import OpportunityTypeReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
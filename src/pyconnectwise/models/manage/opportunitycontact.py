@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityContact(ConnectWiseModel):
+    id: int | None = None
+    contact: ContactReference | None = None
+    company: CompanyReference | None = None
+    role: OpportunitySalesRoleReference | None = None
+    notes: str | None = None
+    referral_flag: bool | None = Field(default=None, alias='referralFlag')
+    opportunity_id: int | None = Field(default=None, alias='opportunityId')
+    phone_number: str | None = Field(default=None, alias='phoneNumber')
+    email_address: str | None = Field(default=None, alias='emailAddress')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.opportunitysalesrolereference import OpportunitySalesRoleReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityNote(ConnectWiseModel):
+    id: int | None = None
+    opportunity_id: int | None = Field(default=None, alias='opportunityId')
+    type: NoteTypeReference | None = None
+    text: str
+    flagged: bool | None = None
+    entered_by: str | None = Field(default=None, alias='enteredBy')
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.notetypereference import NoteTypeReference
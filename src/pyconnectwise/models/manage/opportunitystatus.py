@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityStatus(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    won_flag: bool | None = Field(default=None, alias='wonFlag')
+    lost_flag: bool | None = Field(default=None, alias='lostFlag')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    entered_by: str | None = Field(default=None, alias='enteredBy')
+    date_entered: datetime | None = Field(default=None, alias='dateEntered')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
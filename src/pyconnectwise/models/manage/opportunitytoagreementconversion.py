@@ -0,0 +1,41 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityToAgreementConversion(ConnectWiseModel):
+    agreement_id: int | None = Field(default=None, alias='agreementId')
+    name: str | None = None
+    type: AgreementTypeReference | None = None
+    start_date: str | None = Field(default=None, alias='startDate')
+    end_date: str | None = Field(default=None, alias='endDate')
+    no_ending_date_flag: bool | None = Field(default=None, alias='noEndingDateFlag')
+    bill_cycle_id: int | None = Field(default=None, alias='billCycleId')
+    bill_one_time_flag: bool | None = Field(default=None, alias='billOneTimeFlag')
+    location_id: int | None = Field(default=None, alias='locationId')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    include_all_notes_flag: bool | None = Field(
+        default=None, alias='includeAllNotesFlag'
+    )
+    include_all_documents_flag: bool | None = Field(
+        default=None, alias='includeAllDocumentsFlag'
+    )
+    include_all_products_flag: bool | None = Field(
+        default=None, alias='includeAllProductsFlag'
+    )
+    include_note_ids: list[int] | None = Field(default=None, alias='includeNoteIds')
+    include_document_ids: list[int] | None = Field(
+        default=None, alias='includeDocumentIds'
+    )
+    include_product_ids: list[int] | None = Field(
+        default=None, alias='includeProductIds'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementtypereference import AgreementTypeReference
@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityToProjectConversion(ConnectWiseModel):
+    project_id: int | None = Field(default=None, alias='projectId')
+    name: str | None = None
+    status: ProjectStatusReference | None = None
+    location_id: int | None = Field(default=None, alias='locationId')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    board: ProjectBoardReference | None = None
+    manager: MemberReference | None = None
+    estimated_start: str | None = Field(default=None, alias='estimatedStart')
+    estimated_end: str | None = Field(default=None, alias='estimatedEnd')
+    include_all_notes_flag: bool | None = Field(
+        default=None, alias='includeAllNotesFlag'
+    )
+    include_all_documents_flag: bool | None = Field(
+        default=None, alias='includeAllDocumentsFlag'
+    )
+    include_all_products_flag: bool | None = Field(
+        default=None, alias='includeAllProductsFlag'
+    )
+    include_note_ids: list[int] | None = Field(default=None, alias='includeNoteIds')
+    include_document_ids: list[int] | None = Field(
+        default=None, alias='includeDocumentIds'
+    )
+    include_product_ids: list[int] | None = Field(
+        default=None, alias='includeProductIds'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.projectboardreference import ProjectBoardReference
+from pyconnectwise.models.manage.projectstatusreference import ProjectStatusReference
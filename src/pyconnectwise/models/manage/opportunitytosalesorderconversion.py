@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityToSalesOrderConversion(ConnectWiseModel):
+    sales_order_id: int | None = Field(default=None, alias='salesOrderId')
+    name: str | None = None
+    include_all_notes_flag: bool | None = Field(
+        default=None, alias='includeAllNotesFlag'
+    )
+    include_all_documents_flag: bool | None = Field(
+        default=None, alias='includeAllDocumentsFlag'
+    )
+    include_all_products_flag: bool | None = Field(
+        default=None, alias='includeAllProductsFlag'
+    )
+    include_note_ids: list[int] | None = Field(default=None, alias='includeNoteIds')
+    include_document_ids: list[int] | None = Field(
+        default=None, alias='includeDocumentIds'
+    )
+    include_product_ids: list[int] | None = Field(
+        default=None, alias='includeProductIds'
+    )
@@ -0,0 +1,88 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Order(ConnectWiseModel):
+    id: int | None = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    phone: str | None = None
+    phone_ext: str | None = Field(default=None, alias='phoneExt')
+    email: str | None = None
+    site: SiteReference | None = None
+    status: OrderStatusReference | None = None
+    opportunity: OpportunityReference | None = None
+    order_date: datetime | None = Field(default=None, alias='orderDate')
+    due_date: datetime | None = Field(default=None, alias='dueDate')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    po_number: str | None = Field(default=None, alias='poNumber')
+    """
+     Max length: 50;
+    """
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    sales_rep: MemberReference | None = Field(default=None, alias='salesRep')
+    notes: str | None = None
+    bill_closed_flag: bool | None = Field(default=None, alias='billClosedFlag')
+    bill_shipped_flag: bool | None = Field(default=None, alias='billShippedFlag')
+    restrict_downpayment_flag: bool | None = Field(
+        default=None, alias='restrictDownpaymentFlag'
+    )
+    description: str | None = None
+    top_comment_flag: bool | None = Field(default=None, alias='topCommentFlag')
+    bottom_comment_flag: bool | None = Field(default=None, alias='bottomCommentFlag')
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    ship_to_contact: ContactReference | None = Field(
+        default=None, alias='shipToContact'
+    )
+    ship_to_site: SiteReference | None = Field(default=None, alias='shipToSite')
+    bill_to_company: CompanyReference | None = Field(
+        default=None, alias='billToCompany'
+    )
+    bill_to_contact: ContactReference | None = Field(
+        default=None, alias='billToContact'
+    )
+    bill_to_site: SiteReference | None = Field(default=None, alias='billToSite')
+    product_ids: list[int] | None = Field(default=None, alias='productIds')
+    document_ids: list[int] | None = Field(default=None, alias='documentIds')
+    invoice_ids: list[int] | None = Field(default=None, alias='invoiceIds')
+    config_ids: list[int] | None = Field(default=None, alias='configIds')
+    total: float | None = None
+    tax_total: float | None = Field(default=None, alias='taxTotal')
+    currency: CurrencyReference | None = None
+    company_location: SystemLocationReference | None = Field(
+        default=None, alias='companyLocation'
+    )
+    sub_total: float | None = Field(default=None, alias='subTotal')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.orderstatusreference import OrderStatusReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OsGradeWeight(ConnectWiseModel):
+    id: int | None = None
+    os_grade_weight: float | None = Field(default=None, alias='osGradeWeight')
+    os_name: str | None = Field(default=None, alias='osName')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,75 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Other(ConnectWiseModel):
+    id: int | None = None
+    default_ldap: LdapConfigurationReference | None = Field(
+        default=None, alias='defaultLdap'
+    )
+    default_from_address: str = Field(..., alias='defaultFromAddress')
+    """
+     Max length: 50;
+    """
+    portal_url_override: str = Field(..., alias='portalUrlOverride')
+    """
+     Max length: 100;
+    """
+    site_url: str = Field(..., alias='siteUrl')
+    """
+     Max length: 100;
+    """
+    logo_path: str | None = Field(default=None, alias='logoPath')
+    """
+     Max length: 200;
+    """
+    contact_sync: Literal['FL', 'LF', 'CFL', 'CLF'] | None = Field(
+        default=None, alias='contactSync'
+    )
+    server_time_zone: TimeZoneSetupReference | None = Field(
+        default=None, alias='serverTimeZone'
+    )
+    default_calendar: CalendarReference | None = Field(
+        default=None, alias='defaultCalendar'
+    )
+    default_address_format: AddressFormatReference | None = Field(
+        default=None, alias='defaultAddressFormat'
+    )
+    use_ssl_flag: bool | None = Field(default=None, alias='useSslFlag')
+    sync_leads_flag: bool | None = Field(default=None, alias='syncLeadsFlag')
+    include_portal_link_flag: bool | None = Field(
+        default=None, alias='includePortalLinkFlag'
+    )
+    use_expanded_format_time_flag: bool | None = Field(
+        default=None, alias='useExpandedFormatTimeFlag'
+    )
+    use_expanded_format_activity_flag: bool | None = Field(
+        default=None, alias='useExpandedFormatActivityFlag'
+    )
+    disable_z_admin_login_flag: bool | None = Field(
+        default=None, alias='disableZAdminLoginFlag'
+    )
+    locale: LocaleReference | None = None
+    update_member_time_zones_flag: bool | None = Field(
+        default=None, alias='updateMemberTimeZonesFlag'
+    )
+    """
+    If true, all Members time zone will also be set to serverTimeZone. Otherwise, only My Company time zone will be updated.
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.addressformatreference import AddressFormatReference
+from pyconnectwise.models.manage.calendarreference import CalendarReference
+from pyconnectwise.models.manage.ldapconfigurationreference import LdapConfigurationReference
+from pyconnectwise.models.manage.localereference import LocaleReference
+from pyconnectwise.models.manage.timezonesetupreference import TimeZoneSetupReference
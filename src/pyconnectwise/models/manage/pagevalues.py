@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PageValues(ConnectWiseModel):
+    page: int | None = None
+    page_size: int | None = Field(default=None, alias='pageSize')
+    page_id: int | None = Field(default=None, alias='pageId')
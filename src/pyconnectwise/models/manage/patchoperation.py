@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Any
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PatchOperation(ConnectWiseModel):
+    op: str | None = None
+    path: str | None = None
+    value: dict[str, Any] | None = None
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PaymentType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    classification: ClassificationReference | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    company_flag: bool | None = Field(default=None, alias='companyFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.classificationreference import ClassificationReference
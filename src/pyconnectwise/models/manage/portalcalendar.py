@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalCalendar(ConnectWiseModel):
+    id: int | None = None
+    week_start: Literal[
+        'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'
+    ] = Field(..., alias='weekStart')
+    adjust1_start: str | None = Field(default=None, alias='adjust1Start')
+    adjust1_end: str | None = Field(default=None, alias='adjust1End')
+    adjust1_hours: float | None = Field(default=None, alias='adjust1Hours')
+    adjust2_start: str | None = Field(default=None, alias='adjust2Start')
+    adjust2_end: str | None = Field(default=None, alias='adjust2End')
+    adjust2_hours: float | None = Field(default=None, alias='adjust2Hours')
+    adjust3_start: str | None = Field(default=None, alias='adjust3Start')
+    adjust3_end: str | None = Field(default=None, alias='adjust3End')
+    adjust3_hours: float | None = Field(default=None, alias='adjust3Hours')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
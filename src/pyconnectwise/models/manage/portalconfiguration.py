@@ -0,0 +1,81 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfiguration(ConnectWiseModel):
+    id: int | None = None
+    """
+    Gets or sets and Sets
+                An existing Portal Configuration id is required when copying a Portal Configuration.
+    """
+    name: str
+    """
+     Max length: 150;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    company: CompanyReference | None = None
+    login_background_color: str | None = Field(
+        default=None, alias='loginBackgroundColor'
+    )
+    """
+     Max length: 7;
+    """
+    portal_background_color: str | None = Field(
+        default=None, alias='portalBackgroundColor'
+    )
+    """
+     Max length: 7;
+    """
+    menu_color: str | None = Field(default=None, alias='menuColor')
+    """
+     Max length: 7;
+    """
+    button_color: str | None = Field(default=None, alias='buttonColor')
+    """
+     Max length: 7;
+    """
+    header_color: str | None = Field(default=None, alias='headerColor')
+    """
+     Max length: 7;
+    """
+    url: str | None = None
+    """
+     Max length: 1000;
+    """
+    language: Literal[
+        'English',
+        'Spanish',
+        'French',
+        'British',
+        'Australian',
+        'BrazilianPortuguese',
+        'CanadianFrench',
+        'German',
+        'NewZealand',
+        'Dutch',
+    ] | None = None
+    welcome_text: str | None = Field(default=None, alias='welcomeText')
+    """
+     Max length: 4000;
+    """
+    board_ids: list[int] | None = Field(default=None, alias='boardIds')
+    agreement_type_ids: list[int] | None = Field(default=None, alias='agreementTypeIds')
+    config_type_ids: list[int] | None = Field(default=None, alias='configTypeIds')
+    location_ids: list[int] | None = Field(default=None, alias='locationIds')
+    portal_image_copy_success_flag: bool | None = Field(
+        default=None, alias='portalImageCopySuccessFlag'
+    )
+    display_vendor_flag: bool | None = Field(default=None, alias='displayVendorFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationInvoiceSetup(ConnectWiseModel):
+    id: int | None = None
+    portal_configuration: PortalConfigurationReference | None = Field(
+        default=None, alias='portalConfiguration'
+    )
+    display_inv_pmt_flag: bool | None = Field(default=None, alias='displayInvPmtFlag')
+    allow_inv_pmt_flag: bool | None = Field(default=None, alias='allowInvPmtFlag')
+    location: SystemLocationReference | None = None
+    payment_processor: PortalConfigurationPaymentProcessorReference | None = Field(
+        default=None, alias='paymentProcessor'
+    )
+    login: str | None = None
+    password: str | None = None
+    url_override: str | None = Field(default=None, alias='urlOverride')
+    billing_status_ids: list[int] | None = Field(default=None, alias='billingStatusIds')
+    add_all_statuses: bool | None = Field(default=None, alias='addAllStatuses')
+    remove_all_statuses: bool | None = Field(default=None, alias='removeAllStatuses')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.portalconfigurationpaymentprocessorreference import PortalConfigurationPaymentProcessorReference
+from pyconnectwise.models.manage.portalconfigurationreference import PortalConfigurationReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,134 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationOpportunitySetup(ConnectWiseModel):
+    id: int | None = None
+    opportunity_status_rec_i_ds: list[int] | None = Field(
+        default=None, alias='opportunityStatusRecIDs'
+    )
+    add_all_opportunity_statuses: bool | None = Field(
+        default=None, alias='addAllOpportunityStatuses'
+    )
+    remove_all_opportunity_statuses: bool | None = Field(
+        default=None, alias='removeAllOpportunityStatuses'
+    )
+    opportunity_type_rec_i_ds: list[int] | None = Field(
+        default=None, alias='opportunityTypeRecIDs'
+    )
+    add_all_opportunity_types: bool | None = Field(
+        default=None, alias='addAllOpportunityTypes'
+    )
+    remove_all_opportunity_types: bool | None = Field(
+        default=None, alias='removeAllOpportunityTypes'
+    )
+    restrict_view_by_opportunity_status_flag: bool | None = Field(
+        default=None, alias='restrictViewByOpportunityStatusFlag'
+    )
+    restrict_view_by_opportunity_type_flag: bool | None = Field(
+        default=None, alias='restrictViewByOpportunityTypeFlag'
+    )
+    acceptance_change_status_flag: bool | None = Field(
+        default=None, alias='acceptanceChangeStatusFlag'
+    )
+    acceptance_create_activity_flag: bool | None = Field(
+        default=None, alias='acceptanceCreateActivityFlag'
+    )
+    acceptance_opportunity_status: OpportunityStatusReference | None = Field(
+        default=None, alias='acceptanceOpportunityStatus'
+    )
+    acceptance_send_email_flag: bool | None = Field(
+        default=None, alias='acceptanceSendEmailFlag'
+    )
+    acceptance_email_from_first_name: str | None = Field(
+        default=None, alias='acceptanceEmailFromFirstName'
+    )
+    acceptance_email_from_last_name: str | None = Field(
+        default=None, alias='acceptanceEmailFromLastName'
+    )
+    acceptance_email_subject: str | None = Field(
+        default=None, alias='acceptanceEmailSubject'
+    )
+    acceptance_email_body: str | None = Field(default=None, alias='acceptanceEmailBody')
+    acceptance_from_email: str | None = Field(default=None, alias='acceptanceFromEmail')
+    """
+    Gets or sets
+                required when acceptanceSendEmailFlag is true.
+    """
+    acceptance_email_activity_type: ActivityTypeReference | None = Field(
+        default=None, alias='acceptanceEmailActivityType'
+    )
+    acceptance_email_assigned_by_member: MemberReference | None = Field(
+        default=None, alias='acceptanceEmailAssignedByMember'
+    )
+    rejection_change_status_flag: bool | None = Field(
+        default=None, alias='rejectionChangeStatusFlag'
+    )
+    rejection_create_activity_flag: bool | None = Field(
+        default=None, alias='rejectionCreateActivityFlag'
+    )
+    rejection_opportunity_status: OpportunityStatusReference | None = Field(
+        default=None, alias='rejectionOpportunityStatus'
+    )
+    rejection_send_email_flag: bool | None = Field(
+        default=None, alias='rejectionSendEmailFlag'
+    )
+    rejection_email_from_first_name: str | None = Field(
+        default=None, alias='rejectionEmailFromFirstName'
+    )
+    rejection_email_from_last_name: str | None = Field(
+        default=None, alias='rejectionEmailFromLastName'
+    )
+    rejection_from_email: str | None = Field(default=None, alias='rejectionFromEmail')
+    """
+    Gets or sets
+                required when rejectionSendEmailFlag is true.
+    """
+    rejection_email_subject: str | None = Field(
+        default=None, alias='rejectionEmailSubject'
+    )
+    rejection_email_body: str | None = Field(default=None, alias='rejectionEmailBody')
+    rejection_email_activity_type: ActivityTypeReference | None = Field(
+        default=None, alias='rejectionEmailActivityType'
+    )
+    rejection_email_assigned_by_member: MemberReference | None = Field(
+        default=None, alias='rejectionEmailAssignedByMember'
+    )
+    confirmation_send_email_flag: bool | None = Field(
+        default=None, alias='confirmationSendEmailFlag'
+    )
+    confirmation_email_use_default_company_email_address_flag: bool | None = Field(
+        default=None, alias='confirmationEmailUseDefaultCompanyEmailAddressFlag'
+    )
+    confirmation_email_from_first_name: str | None = Field(
+        default=None, alias='confirmationEmailFromFirstName'
+    )
+    confirmation_email_from_last_name: str | None = Field(
+        default=None, alias='confirmationEmailFromLastName'
+    )
+    confirmation_from_email: str | None = Field(
+        default=None, alias='confirmationFromEmail'
+    )
+    """
+    Gets or sets
+                required when confirmationSendEmailFlag is true.
+    """
+    confirmation_email_subject: str | None = Field(
+        default=None, alias='confirmationEmailSubject'
+    )
+    confirmation_email_body: str | None = Field(
+        default=None, alias='confirmationEmailBody'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.activitytypereference import ActivityTypeReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.opportunitystatusreference import OpportunityStatusReference
@@ -0,0 +1,57 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationPasswordEmailSetup(ConnectWiseModel):
+    id: int | None = None
+    valid_password_email_use_custom_email_flag: bool | None = Field(
+        default=None, alias='validPasswordEmailUseCustomEmailFlag'
+    )
+    valid_password_email_from_first_name: str | None = Field(
+        default=None, alias='validPasswordEmailFromFirstName'
+    )
+    valid_password_email_from_last_name: str | None = Field(
+        default=None, alias='validPasswordEmailFromLastName'
+    )
+    valid_password_email_from_email: str | None = Field(
+        default=None, alias='validPasswordEmailFromEmail'
+    )
+    """
+    Gets or sets
+                required when validPasswordEmailUseCustomEmailFlag is true.
+    """
+    valid_password_email_subject: str | None = Field(
+        default=None, alias='validPasswordEmailSubject'
+    )
+    valid_password_email_body: str | None = Field(
+        default=None, alias='validPasswordEmailBody'
+    )
+    invalid_password_email_use_custom_email_flag: bool | None = Field(
+        default=None, alias='invalidPasswordEmailUseCustomEmailFlag'
+    )
+    invalid_password_email_from_first_name: str | None = Field(
+        default=None, alias='invalidPasswordEmailFromFirstName'
+    )
+    invalid_password_email_from_last_name: str | None = Field(
+        default=None, alias='invalidPasswordEmailFromLastName'
+    )
+    invalid_password_email_from_email: str | None = Field(
+        default=None, alias='invalidPasswordEmailFromEmail'
+    )
+    """
+    Gets or sets
+                required when invalidPasswordEmailUseCustomEmailFlag is true.
+    """
+    invalid_password_email_subject: str | None = Field(
+        default=None, alias='invalidPasswordEmailSubject'
+    )
+    invalid_password_email_body: str | None = Field(
+        default=None, alias='invalidPasswordEmailBody'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
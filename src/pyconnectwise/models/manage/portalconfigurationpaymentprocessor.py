@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationPaymentProcessor(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    test_url: str | None = Field(default=None, alias='testURL')
@@ -0,0 +1,129 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationProjectSetup(ConnectWiseModel):
+    id: int | None = None
+    portal_config: PortalConfigurationReference | None = Field(
+        default=None, alias='portalConfig'
+    )
+    project_name_flag: bool | None = Field(default=None, alias='projectNameFlag')
+    project_type_flag: bool | None = Field(default=None, alias='projectTypeFlag')
+    status_flag: bool | None = Field(default=None, alias='statusFlag')
+    project_manager_flag: bool | None = Field(default=None, alias='projectManagerFlag')
+    billing_method_flag: bool | None = Field(default=None, alias='billingMethodFlag')
+    contact_flag: bool | None = Field(default=None, alias='contactFlag')
+    estimated_start_flag: bool | None = Field(default=None, alias='estimatedStartFlag')
+    estimated_end_flag: bool | None = Field(default=None, alias='estimatedEndFlag')
+    description_flag: bool | None = Field(default=None, alias='descriptionFlag')
+    last_updated_flag: bool | None = Field(default=None, alias='lastUpdatedFlag')
+    only_display: Literal[
+        'DoNotDisplay',
+        'Closed30Days',
+        'Closed60Days',
+        'Closed90Days',
+        'Closed120Days',
+        'AllClosed',
+    ] = Field(..., alias='onlyDisplay')
+    time_material_budget_hrs_flag: bool | None = Field(
+        default=None, alias='timeMaterialBudgetHrsFlag'
+    )
+    time_material_scheduled_start_flag: bool | None = Field(
+        default=None, alias='timeMaterialScheduledStartFlag'
+    )
+    time_material_scheduled_finish_flag: bool | None = Field(
+        default=None, alias='timeMaterialScheduledFinishFlag'
+    )
+    time_material_scheduled_hrs_flag: bool | None = Field(
+        default=None, alias='timeMaterialScheduledHrsFlag'
+    )
+    time_material_actual_start_flag: bool | None = Field(
+        default=None, alias='timeMaterialActualStartFlag'
+    )
+    time_material_actual_finish_flag: bool | None = Field(
+        default=None, alias='timeMaterialActualFinishFlag'
+    )
+    time_material_actual_hrs_flag: bool | None = Field(
+        default=None, alias='timeMaterialActualHrsFlag'
+    )
+    time_material_bill_flag: bool | None = Field(
+        default=None, alias='timeMaterialBillFlag'
+    )
+    time_material_status_flag: bool | None = Field(
+        default=None, alias='timeMaterialStatusFlag'
+    )
+    time_material_assigned_flag: bool | None = Field(
+        default=None, alias='timeMaterialAssignedFlag'
+    )
+    fixed_fee_budget_hrs_flag: bool | None = Field(
+        default=None, alias='fixedFeeBudgetHrsFlag'
+    )
+    fixed_fee_scheduled_start_flag: bool | None = Field(
+        default=None, alias='fixedFeeScheduledStartFlag'
+    )
+    fixed_fee_scheduled_finish_flag: bool | None = Field(
+        default=None, alias='fixedFeeScheduledFinishFlag'
+    )
+    fixed_fee_scheduled_hrs_flag: bool | None = Field(
+        default=None, alias='fixedFeeScheduledHrsFlag'
+    )
+    fixed_fee_actual_start_flag: bool | None = Field(
+        default=None, alias='fixedFeeActualStartFlag'
+    )
+    fixed_fee_actual_finish_flag: bool | None = Field(
+        default=None, alias='fixedFeeActualFinishFlag'
+    )
+    fixed_fee_actual_hrs_flag: bool | None = Field(
+        default=None, alias='fixedFeeActualHrsFlag'
+    )
+    fixed_fee_bill_flag: bool | None = Field(default=None, alias='fixedFeeBillFlag')
+    fixed_fee_status_flag: bool | None = Field(default=None, alias='fixedFeeStatusFlag')
+    fixed_fee_assigned_flag: bool | None = Field(
+        default=None, alias='fixedFeeAssignedFlag'
+    )
+    project_issue_budget_hrs_flag: bool | None = Field(
+        default=None, alias='projectIssueBudgetHrsFlag'
+    )
+    project_issue_scheduled_start_flag: bool | None = Field(
+        default=None, alias='projectIssueScheduledStartFlag'
+    )
+    project_issue_scheduled_finish_flag: bool | None = Field(
+        default=None, alias='projectIssueScheduledFinishFlag'
+    )
+    project_issue_scheduled_hrs_flag: bool | None = Field(
+        default=None, alias='projectIssueScheduledHrsFlag'
+    )
+    project_issue_actual_start_flag: bool | None = Field(
+        default=None, alias='projectIssueActualStartFlag'
+    )
+    project_issue_actual_finish_flag: bool | None = Field(
+        default=None, alias='projectIssueActualFinishFlag'
+    )
+    project_issue_actual_hrs_flag: bool | None = Field(
+        default=None, alias='projectIssueActualHrsFlag'
+    )
+    project_issue_bill_flag: bool | None = Field(
+        default=None, alias='projectIssueBillFlag'
+    )
+    project_issue_status_flag: bool | None = Field(
+        default=None, alias='projectIssueStatusFlag'
+    )
+    project_issue_assigned_flag: bool | None = Field(
+        default=None, alias='projectIssueAssignedFlag'
+    )
+    project_detail_total_hours_flag: bool | None = Field(
+        default=None, alias='projectDetailTotalHoursFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.portalconfigurationreference import PortalConfigurationReference
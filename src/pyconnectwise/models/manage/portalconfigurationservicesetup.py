@@ -0,0 +1,57 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationServiceSetup(ConnectWiseModel):
+    id: int | None = None
+    service_type_flag: bool | None = Field(default=None, alias='serviceTypeFlag')
+    service_sub_type_flag: bool | None = Field(default=None, alias='serviceSubTypeFlag')
+    service_sub_type_item_flag: bool | None = Field(
+        default=None, alias='serviceSubTypeItemFlag'
+    )
+    status_flag: bool | None = Field(default=None, alias='statusFlag')
+    site_name_flag: bool | None = Field(default=None, alias='siteNameFlag')
+    entered_date_flag: bool | None = Field(default=None, alias='enteredDateFlag')
+    last_update_flag: bool | None = Field(default=None, alias='lastUpdateFlag')
+    required_date_flag: bool | None = Field(default=None, alias='requiredDateFlag')
+    contact_flag: bool | None = Field(default=None, alias='contactFlag')
+    assigned_resources_flag: bool | None = Field(
+        default=None, alias='assignedResourcesFlag'
+    )
+    sla_info_flag: bool | None = Field(default=None, alias='slaInfoFlag')
+    service_board_flag: bool | None = Field(default=None, alias='serviceBoardFlag')
+    budget_hours_flag: bool | None = Field(default=None, alias='budgetHoursFlag')
+    actual_hours_flag: bool | None = Field(default=None, alias='actualHoursFlag')
+    approval_status_flag: bool | None = Field(default=None, alias='approvalStatusFlag')
+    open_tasks_flag: bool | None = Field(default=None, alias='openTasksFlag')
+    closed_tasks_flag: bool | None = Field(default=None, alias='closedTasksFlag')
+    enable_chat_assist_flag: bool | None = Field(
+        default=None, alias='enableChatAssistFlag'
+    )
+    display_closed_tickets_option: Literal[
+        'DoNotDisplay',
+        'Closed30Days',
+        'Closed60Days',
+        'Closed90Days',
+        'Closed120Days',
+        'AllClosed',
+    ] = Field(..., alias='displayClosedTicketsOption')
+    time_materials_ticket_template: ServiceSignoffReference | None = Field(
+        default=None, alias='timeMaterialsTicketTemplate'
+    )
+    fixed_fee_ticket_template: ServiceSignoffReference | None = Field(
+        default=None, alias='fixedFeeTicketTemplate'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.servicesignoffreference import ServiceSignoffReference
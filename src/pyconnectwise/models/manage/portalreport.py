@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalReport(ConnectWiseModel):
+    id: int | None = None
+    portal_configuration: PortalConfigurationReference | None = Field(
+        default=None, alias='portalConfiguration'
+    )
+    name: str
+    """
+     Max length: 255;
+    """
+    url: str
+    """
+     Max length: 255;
+    """
+    open_same_window_flag: bool | None = Field(default=None, alias='openSameWindowFlag')
+    custom_flag: bool | None = Field(default=None, alias='customFlag')
+    display_flag: bool | None = Field(default=None, alias='displayFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.portalconfigurationreference import PortalConfigurationReference
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalSecurityLevel(ConnectWiseModel):
+    id: int | None = None
+    caption_identifier: str | None = Field(default=None, alias='captionIdentifier')
+    is_default_flag: bool | None = Field(default=None, alias='isDefaultFlag')
+    caption: str | None = None
+    """
+     Max length: 50;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
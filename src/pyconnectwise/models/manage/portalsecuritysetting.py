@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalSecuritySetting(ConnectWiseModel):
+    id: int | None = None
+    function_identifier: str | None = Field(default=None, alias='functionIdentifier')
+    function_description: str | None = Field(default=None, alias='functionDescription')
+    level_one: bool | None = Field(default=None, alias='levelOne')
+    level_two: bool | None = Field(default=None, alias='levelTwo')
+    level_three: bool | None = Field(default=None, alias='levelThree')
+    level_four: bool | None = Field(default=None, alias='levelFour')
+    level_five: bool | None = Field(default=None, alias='levelFive')
+    level_six: bool | None = Field(default=None, alias='levelSix')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
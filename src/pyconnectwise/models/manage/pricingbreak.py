@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PricingBreak(ConnectWiseModel):
+    id: int | None = None
+    detail_id: int | None = Field(default=None, alias='detailId')
+    amount: float | None = None
+    quantity_start: float = Field(..., alias='quantityStart')
+    quantity_end: float | None = Field(default=None, alias='quantityEnd')
+    unlimited: bool | None = None
+    price_method: Literal[
+        'FlatRateForRange',
+        'PercentMarkupFromCost',
+        'PercentMarkdownFromPrice',
+        'PricePerUnit',
+    ] = Field(..., alias='priceMethod')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PricingDetail(ConnectWiseModel):
+    id: int | None = None
+    product: CatalogItemReference | None = None
+    category: ProductCategoryReference | None = None
+    sub_category: ProductSubCategoryReference | None = Field(
+        default=None, alias='subCategory'
+    )
+    start_date: datetime = Field(..., alias='startDate')
+    end_date: datetime | None = Field(default=None, alias='endDate')
+    no_end_date: bool | None = Field(default=None, alias='noEndDate')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.catalogitemreference import CatalogItemReference
+from pyconnectwise.models.manage.productcategoryreference import ProductCategoryReference
+from pyconnectwise.models.manage.productsubcategoryreference import ProductSubCategoryReference
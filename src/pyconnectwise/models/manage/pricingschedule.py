@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PricingSchedule(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    currency: CurrencyReference | None = None
+    companies: list[int] | None = None
+    set_all_companies_flag: bool | None = Field(
+        default=None, alias='setAllCompaniesFlag'
+    )
+    remove_all_companies_flag: bool | None = Field(
+        default=None, alias='removeAllCompaniesFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Priority(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    color: Literal[
+        'Black',
+        'Blue',
+        'Cyan',
+        'Gray',
+        'Green',
+        'Lime',
+        'Orange',
+        'Pink',
+        'Purple',
+        'Red',
+        'White',
+        'Yellow',
+        'Custom',
+    ]
+    sort_order: int | None = Field(default=None, alias='sortOrder')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    image_link: str | None = Field(default=None, alias='imageLink')
+    urgency_sort_order: str | None = Field(default=None, alias='urgencySortOrder')
+    level: Literal['Critical', 'High', 'Medium', 'Low'] | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
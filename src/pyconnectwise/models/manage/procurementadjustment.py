@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProcurementAdjustment(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 50;
+    """
+    type: AdjustmentTypeReference | None = None
+    reason: str | None = None
+    """
+     Max length: 100;
+    """
+    notes: str | None = None
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    closed_by: str | None = Field(default=None, alias='closedBy')
+    closed_date: datetime | None = Field(default=None, alias='closedDate')
+    adjustment_details: list[AdjustmentDetail] | None = Field(
+        default=None, alias='adjustmentDetails'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.adjustmentdetail import AdjustmentDetail
+from pyconnectwise.models.manage.adjustmenttypereference import AdjustmentTypeReference
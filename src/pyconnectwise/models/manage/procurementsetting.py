@@ -0,0 +1,63 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProcurementSetting(ConnectWiseModel):
+    id: int | None = None
+    starting_purchase_order_num: int = Field(..., alias='startingPurchaseOrderNum')
+    purchase_order_prefix: str | None = Field(default=None, alias='purchaseOrderPrefix')
+    """
+     Max length: 5;
+    """
+    purchase_order_suffix: str | None = Field(default=None, alias='purchaseOrderSuffix')
+    """
+     Max length: 5;
+    """
+    prefix_suffix_type: Literal['Prefix', 'Suffix'] | None = Field(
+        default=None, alias='prefixSuffixType'
+    )
+    disable_cost_updates_flag: bool | None = Field(
+        default=None, alias='disableCostUpdatesFlag'
+    )
+    disable_negative_inventory_flag: bool | None = Field(
+        default=None, alias='disableNegativeInventoryFlag'
+    )
+    costing_method: Literal['FIFO', 'LIFO', 'AverageCosting'] = Field(
+        ..., alias='costingMethod'
+    )
+    auto_close_purchase_order_flag: bool | None = Field(
+        default=None, alias='autoClosePurchaseOrderFlag'
+    )
+    auto_close_purchase_order_item_flag: bool | None = Field(
+        default=None, alias='autoClosePurchaseOrderItemFlag'
+    )
+    auto_approve_purchase_order_flag: bool | None = Field(
+        default=None, alias='autoApprovePurchaseOrderFlag'
+    )
+    tax_purchase_order_flag: bool | None = Field(
+        default=None, alias='taxPurchaseOrderFlag'
+    )
+    tax_freight_flag: bool | None = Field(default=None, alias='taxFreightFlag')
+    use_vendor_tax_code_flag: bool | None = Field(
+        default=None, alias='useVendorTaxCodeFlag'
+    )
+    num_decimal_places: int | None = Field(default=None, alias='numDecimalPlaces')
+    disable_auto_pick_flag: bool | None = Field(
+        default=None, alias='disableAutoPickFlag'
+    )
+    default_product_taxable_flag: bool | None = Field(
+        default=None, alias='defaultProductTaxableFlag'
+    )
+    eori_number: str | None = Field(default=None, alias='eoriNumber')
+    """
+     Max length: 50;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
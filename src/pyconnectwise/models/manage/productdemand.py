@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductDemand(ConnectWiseModel):
+    product_rec_id: int | None = Field(default=None, alias='productRecId')
+    quantity: int | None = None
+    cost: float | None = None
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductDetach(ConnectWiseModel):
+    remove_from_ticket: bool | None = Field(default=None, alias='removeFromTicket')
+    remove_from_invoice: bool | None = Field(default=None, alias='removeFromInvoice')
+    remove_from_opportunity: bool | None = Field(
+        default=None, alias='removeFromOpportunity'
+    )
+    remove_from_sales_order: bool | None = Field(
+        default=None, alias='removeFromSalesOrder'
+    )
+    remove_from_project: bool | None = Field(default=None, alias='removeFromProject')
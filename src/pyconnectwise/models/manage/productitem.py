@@ -0,0 +1,152 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductItem(ConnectWiseModel):
+    id: int | None = None
+    catalog_item: CatalogItemReference | None = Field(default=None, alias='catalogItem')
+    description: str | None = None
+    """
+     Max length: 2000;
+    """
+    sequence_number: float | None = Field(default=None, alias='sequenceNumber')
+    quantity: float | None = None
+    price: float | None = None
+    cost: float | None = None
+    discount: float | None = None
+    agreement_amount: float | None = Field(default=None, alias='agreementAmount')
+    price_method: Literal[
+        'FlatRateForRange',
+        'PercentMarkupFromCost',
+        'PercentMarkdownFromPrice',
+        'PricePerUnit',
+    ] | None = Field(default=None, alias='priceMethod')
+    billable_option: Literal['Billable', 'DoNotBill', 'NoCharge'] = Field(
+        ..., alias='billableOption'
+    )
+    agreement: AgreementReference | None = None
+    location_id: int | None = Field(default=None, alias='locationId')
+    """
+     Required On Updates;
+    """
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    """
+     Required On Updates;
+    """
+    vendor: CompanyReference | None = None
+    vendor_sku: str | None = Field(default=None, alias='vendorSku')
+    """
+     Max length: 50;
+    """
+    taxable_flag: bool | None = Field(default=None, alias='taxableFlag')
+    dropship_flag: bool | None = Field(default=None, alias='dropshipFlag')
+    special_order_flag: bool | None = Field(default=None, alias='specialOrderFlag')
+    phase_product_flag: bool | None = Field(default=None, alias='phaseProductFlag')
+    cancelled_flag: bool | None = Field(default=None, alias='cancelledFlag')
+    quantity_cancelled: float | None = Field(default=None, alias='quantityCancelled')
+    cancelled_reason: str | None = Field(default=None, alias='cancelledReason')
+    """
+     Max length: 100;
+    """
+    customer_description: str | None = Field(default=None, alias='customerDescription')
+    """
+     Max length: 6000; Required On Updates;
+    """
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    """
+     Max length: 1000;
+    """
+    product_supplied_flag: bool | None = Field(
+        default=None, alias='productSuppliedFlag'
+    )
+    sub_contractor_ship_to_id: int | None = Field(
+        default=None, alias='subContractorShipToId'
+    )
+    sub_contractor_amount_limit: float | None = Field(
+        default=None, alias='subContractorAmountLimit'
+    )
+    recurring: ProductRecurring | None = None
+    sla: SLAReference | None = None
+    entity_type: EntityTypeReference | None = Field(default=None, alias='entityType')
+    ticket: TicketReference | None = None
+    project: ProjectReference | None = None
+    phase: ProjectPhaseReference | None = None
+    sales_order: SalesOrderReference | None = Field(default=None, alias='salesOrder')
+    opportunity: OpportunityReference | None = None
+    invoice: InvoiceReference | None = None
+    warehouse_id: int | None = Field(default=None, alias='warehouseId')
+    warehouse_bin_id: int | None = Field(default=None, alias='warehouseBinId')
+    calculated_price_flag: bool | None = Field(
+        default=None, alias='calculatedPriceFlag'
+    )
+    calculated_cost_flag: bool | None = Field(default=None, alias='calculatedCostFlag')
+    forecast_detail_id: int | None = Field(default=None, alias='forecastDetailId')
+    cancelled_by: int | None = Field(default=None, alias='cancelledBy')
+    cancelled_date: datetime | None = Field(default=None, alias='cancelledDate')
+    warehouse: str | None = None
+    warehouse_bin: str | None = Field(default=None, alias='warehouseBin')
+    purchase_date: datetime | None = Field(default=None, alias='purchaseDate')
+    integration_x_ref: str | None = Field(default=None, alias='integrationXRef')
+    list_price: float | None = Field(default=None, alias='listPrice')
+    serial_number_ids: list[int] | None = Field(default=None, alias='serialNumberIds')
+    serial_numbers: list[str] | None = Field(default=None, alias='serialNumbers')
+    company: CompanyReference | None = None
+    forecast_status: OpportunityStatusReference | None = Field(
+        default=None, alias='forecastStatus'
+    )
+    product_class: Literal[
+        'Agreement', 'Bundle', 'Inventory', 'NonInventory', 'Service'
+    ] | None = Field(default=None, alias='productClass')
+    need_to_purchase_flag: bool | None = Field(default=None, alias='needToPurchaseFlag')
+    need_to_order_quantity: int | None = Field(
+        default=None, alias='needToOrderQuantity'
+    )
+    minimum_stock_flag: bool | None = Field(default=None, alias='minimumStockFlag')
+    ship_set: str | None = Field(default=None, alias='shipSet')
+    """
+     Max length: 10;
+    """
+    calculated_price: float | None = Field(default=None, alias='calculatedPrice')
+    calculated_cost: float | None = Field(default=None, alias='calculatedCost')
+    invoice_grouping: InvoiceGroupingReference | None = Field(
+        default=None, alias='invoiceGrouping'
+    )
+    po_approved_flag: bool | None = Field(default=None, alias='poApprovedFlag')
+    add_components_flag: bool | None = Field(default=None, alias='addComponentsFlag')
+    ignore_pricing_schedules_flag: bool | None = Field(
+        default=None, alias='ignorePricingSchedulesFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    bypass_forecast_update: bool | None = Field(
+        default=None, alias='bypassForecastUpdate'
+    )
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.catalogitemreference import CatalogItemReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.entitytypereference import EntityTypeReference
+from pyconnectwise.models.manage.invoicegroupingreference import InvoiceGroupingReference
+from pyconnectwise.models.manage.invoicereference import InvoiceReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.opportunitystatusreference import OpportunityStatusReference
+from pyconnectwise.models.manage.productrecurring import ProductRecurring
+from pyconnectwise.models.manage.projectphasereference import ProjectPhaseReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.slareference import SLAReference
+from pyconnectwise.models.manage.salesorderreference import SalesOrderReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
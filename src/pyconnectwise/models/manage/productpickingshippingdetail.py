@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductPickingShippingDetail(ConnectWiseModel):
+    id: int | None = None
+    picked_quantity: int | None = Field(default=None, alias='pickedQuantity')
+    shipped_quantity: int | None = Field(default=None, alias='shippedQuantity')
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    shipment_method: ShipmentMethodReference | None = Field(
+        default=None, alias='shipmentMethod'
+    )
+    serial_number: str | None = Field(default=None, alias='serialNumber')
+    serial_number_ids: list[int] | None = Field(default=None, alias='serialNumberIds')
+    tracking_number: str | None = Field(default=None, alias='trackingNumber')
+    product_item: ProductItemReference | None = Field(default=None, alias='productItem')
+    line_number: int | None = Field(default=None, alias='lineNumber')
+    quantity: int | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.productitemreference import ProductItemReference
+from pyconnectwise.models.manage.shipmentmethodreference import ShipmentMethodReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
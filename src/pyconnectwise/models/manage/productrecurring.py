@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductRecurring(ConnectWiseModel):
+    recurring_revenue: float | None = Field(default=None, alias='recurringRevenue')
+    recurring_cost: float | None = Field(default=None, alias='recurringCost')
+    start_date: str | None = Field(default=None, alias='startDate')
+    end_date: str | None = Field(default=None, alias='endDate')
+    """
+    The Recurring End Date is calculated based on the
+                start date, number of cycles, and cycle type.
+    """
+    bill_cycle_id: int | None = Field(default=None, alias='billCycleId')
+    cycles: int | None = None
+    cycle_type: Literal['ContractYear', 'CalendarYear'] | None = Field(
+        default=None, alias='cycleType'
+    )
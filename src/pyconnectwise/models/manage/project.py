@@ -0,0 +1,171 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Project(ConnectWiseModel):
+    id: int | None = None
+    actual_end: datetime | None = Field(default=None, alias='actualEnd')
+    actual_hours: float | None = Field(default=None, alias='actualHours')
+    actual_start: datetime | None = Field(default=None, alias='actualStart')
+    agreement: AgreementReference | None = None
+    bill_expenses: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billExpenses')
+    """
+     Required On Updates;
+    """
+    billing_amount: float | None = Field(default=None, alias='billingAmount')
+    billing_attention: str | None = Field(default=None, alias='billingAttention')
+    """
+     Max length: 50;
+    """
+    billing_method: Literal[
+        'ActualRates', 'FixedFee', 'NotToExceed', 'OverrideRate'
+    ] = Field(..., alias='billingMethod')
+    billing_rate_type: Literal['StaffMember', 'WorkRole'] | None = Field(
+        default=None, alias='billingRateType'
+    )
+    """
+     Required On Updates;
+    """
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    bill_products: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billProducts')
+    """
+     Required On Updates;
+    """
+    bill_project_after_closed_flag: bool | None = Field(
+        default=None, alias='billProjectAfterClosedFlag'
+    )
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] | None = Field(
+        default=None, alias='billTime'
+    )
+    """
+     Required On Updates;
+    """
+    bill_to_company: CompanyReference | None = Field(
+        default=None, alias='billToCompany'
+    )
+    bill_to_contact: ContactReference | None = Field(
+        default=None, alias='billToContact'
+    )
+    bill_to_site: SiteReference | None = Field(default=None, alias='billToSite')
+    bill_unapproved_time_and_expense: bool | None = Field(
+        default=None, alias='billUnapprovedTimeAndExpense'
+    )
+    board: ProjectBoardReference | None = None
+    budget_analysis: Literal['ActualHours', 'BillableHours'] | None = Field(
+        default=None, alias='budgetAnalysis'
+    )
+    """
+     Required On Updates;
+    """
+    budget_flag: bool | None = Field(default=None, alias='budgetFlag')
+    budget_hours: float | None = Field(default=None, alias='budgetHours')
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    customer_po: str | None = Field(default=None, alias='customerPO')
+    """
+     Max length: 50;
+    """
+    description: str | None = None
+    currency: CurrencyReference | None = None
+    downpayment: float | None = None
+    estimated_end: datetime = Field(..., alias='estimatedEnd')
+    percent_complete: float | None = Field(default=None, alias='percentComplete')
+    estimated_expense_revenue: float | None = Field(
+        default=None, alias='estimatedExpenseRevenue'
+    )
+    estimated_hours: float | None = Field(default=None, alias='estimatedHours')
+    estimated_product_revenue: float | None = Field(
+        default=None, alias='estimatedProductRevenue'
+    )
+    estimated_start: datetime = Field(..., alias='estimatedStart')
+    estimated_time_revenue: float | None = Field(
+        default=None, alias='estimatedTimeRevenue'
+    )
+    expense_approver: MemberReference | None = Field(
+        default=None, alias='expenseApprover'
+    )
+    include_dependencies_flag: bool | None = Field(
+        default=None, alias='includeDependenciesFlag'
+    )
+    include_estimates_flag: bool | None = Field(
+        default=None, alias='includeEstimatesFlag'
+    )
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    manager: MemberReference | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    opportunity: OpportunityReference | None = None
+    project_template_id: int | None = Field(default=None, alias='projectTemplateId')
+    restrict_down_payment_flag: bool | None = Field(
+        default=None, alias='restrictDownPaymentFlag'
+    )
+    scheduled_end: datetime | None = Field(default=None, alias='scheduledEnd')
+    scheduled_hours: float | None = Field(default=None, alias='scheduledHours')
+    scheduled_start: datetime | None = Field(default=None, alias='scheduledStart')
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    ship_to_contact: ContactReference | None = Field(
+        default=None, alias='shipToContact'
+    )
+    ship_to_site: SiteReference | None = Field(default=None, alias='shipToSite')
+    site: SiteReference | None = None
+    status: ProjectStatusReference | None = None
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    time_approver: MemberReference | None = Field(default=None, alias='timeApprover')
+    type: ProjectTypeReference | None = None
+    do_not_display_in_portal_flag: bool | None = Field(
+        default=None, alias='doNotDisplayInPortalFlag'
+    )
+    billing_start_date: datetime | None = Field(default=None, alias='billingStartDate')
+    estimated_time_cost: float | None = Field(default=None, alias='estimatedTimeCost')
+    estimated_expense_cost: float | None = Field(
+        default=None, alias='estimatedExpenseCost'
+    )
+    estimated_product_cost: float | None = Field(
+        default=None, alias='estimatedProductCost'
+    )
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    company_location: SystemLocationReference | None = Field(
+        default=None, alias='companyLocation'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.projectboardreference import ProjectBoardReference
+from pyconnectwise.models.manage.projectstatusreference import ProjectStatusReference
+from pyconnectwise.models.manage.projecttypereference import ProjectTypeReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
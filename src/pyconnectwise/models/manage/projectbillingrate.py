@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectBillingRate(ConnectWiseModel):
+    id: int | None = None
+    project_rec_id: int | None = Field(default=None, alias='projectRecId')
+    hourly_rate: float | None = Field(default=None, alias='hourlyRate')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    activity_class_rec_id: int | None = Field(default=None, alias='activityClassRecId')
+    member: MemberReference | None = None
+    member_rec_id: int | None = Field(default=None, alias='memberRecId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
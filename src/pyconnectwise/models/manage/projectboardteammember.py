@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectBoardTeamMember(ConnectWiseModel):
+    id: int | None = None
+    member: MemberReference | None = None
+    project_role: ProjectRoleReference | None = Field(default=None, alias='projectRole')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.projectrolereference import ProjectRoleReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectNote(ConnectWiseModel):
+    id: int | None = None
+    project_id: int | None = Field(default=None, alias='projectId')
+    text: str
+    type: NoteTypeReference | None = None
+    flagged: bool | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.notetypereference import NoteTypeReference
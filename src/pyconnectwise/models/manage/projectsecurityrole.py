@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectSecurityRole(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    manager_role_flag: bool | None = Field(default=None, alias='managerRoleFlag')
+    default_contact_flag: bool | None = Field(default=None, alias='defaultContactFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectSecurityRoleSetting(ConnectWiseModel):
+    id: int | None = None
+    add_level: Literal['None', 'My', 'All'] | None = Field(
+        default=None, alias='addLevel'
+    )
+    edit_level: Literal['None', 'My', 'All'] | None = Field(
+        default=None, alias='editLevel'
+    )
+    delete_level: Literal['None', 'My', 'All'] | None = Field(
+        default=None, alias='deleteLevel'
+    )
+    inquire_level: Literal['None', 'My', 'All'] | None = Field(
+        default=None, alias='inquireLevel'
+    )
+    module_identifier: str | None = Field(default=None, alias='moduleIdentifier')
+    """
+     Max length: 50;
+    """
+    my_flag: bool | None = Field(default=None, alias='myFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectStatus(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    no_time_flag: bool | None = Field(default=None, alias='noTimeFlag')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    status_indicator: StatusIndicatorReference | None = Field(
+        default=None, alias='statusIndicator'
+    )
+    custom_status_indicator_name: str | None = Field(
+        default=None, alias='customStatusIndicatorName'
+    )
+    """
+    Required when statusIndicator is Custom. Max length: 30;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.statusindicatorreference import StatusIndicatorReference
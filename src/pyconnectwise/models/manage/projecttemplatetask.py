@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectTemplateTask(ConnectWiseModel):
+    id: int | None = None
+    ticket_id: int | None = Field(default=None, alias='ticketId')
+    sequence: int | None = None
+    description: str | None = None
+    summary: str | None = None
+    code: ServiceCodeReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.servicecodereference import ServiceCodeReference
@@ -0,0 +1,51 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectTemplateTicket(ConnectWiseModel):
+    id: int | None = None
+    project_template_id: int | None = Field(default=None, alias='projectTemplateId')
+    project_template_phase_id: int | None = Field(
+        default=None, alias='projectTemplatePhaseId'
+    )
+    line_number: float | None = Field(default=None, alias='lineNumber')
+    description: str
+    """
+     Max length: 100;
+    """
+    notes: str | None = None
+    internal_analysis: str | None = Field(default=None, alias='internalAnalysis')
+    resolution: str | None = None
+    budget_hours: float | None = Field(default=None, alias='budgetHours')
+    duration: int | None = None
+    wbs_code: str | None = Field(default=None, alias='wbsCode')
+    """
+     Max length: 50;
+    """
+    bill_separately_flag: bool | None = Field(default=None, alias='billSeparatelyFlag')
+    mark_as_milestone_flag: bool | None = Field(
+        default=None, alias='markAsMilestoneFlag'
+    )
+    record_type: str | None = Field(default=None, alias='recordType')
+    """
+     Max length: 1;
+    """
+    pm_tmp_project_rec_id: int | None = Field(default=None, alias='pmTmpProjectRecID')
+    priority: PriorityReference | None = None
+    source: ServiceSourceReference | None = None
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.priorityreference import PriorityReference
+from pyconnectwise.models.manage.servicesourcereference import ServiceSourceReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectTemplateWorkPlan(ConnectWiseModel):
+    tree_id: str | None = Field(default=None, alias='treeID')
+    i_d: int | None = Field(default=None, alias='iD')
+    rec_id: int | None = Field(default=None, alias='recID')
+    display_id: str | None = Field(default=None, alias='displayID')
+    s_r_service_rec_id: int | None = Field(default=None, alias='sR_Service_RecID')
+    description: str | None = None
+    project_name: str | None = Field(default=None, alias='projectName')
+    budget_amount: float | None = Field(default=None, alias='budgetAmount')
+    is_project: bool | None = Field(default=None, alias='isProject')
+    is_phase: bool | None = Field(default=None, alias='isPhase')
+    is_ticket: bool | None = Field(default=None, alias='isTicket')
+    is_new_item: bool | None = Field(default=None, alias='isNewItem')
+    wbs_code: str | None = Field(default=None, alias='wbsCode')
+    parent_phase_rec_id: int | None = Field(default=None, alias='parentPhaseRecID')
@@ -0,0 +1,219 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectTicket(ConnectWiseModel):
+    id: int | None = None
+    summary: str
+    """
+     Max length: 100;
+    """
+    is_issue_flag: bool | None = Field(default=None, alias='isIssueFlag')
+    board: BoardReference | None = None
+    status: ServiceStatusReference | None = None
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    project: ProjectReference | None = None
+    phase: ProjectPhaseReference | None = None
+    wbs_code: str | None = Field(default=None, alias='wbsCode')
+    """
+     Max length: 50;
+    """
+    company: CompanyReference | None = None
+    site: SiteReference | None = None
+    site_name: str | None = Field(default=None, alias='siteName')
+    """
+     Max length: 50;
+    """
+    address_line1: str | None = Field(default=None, alias='addressLine1')
+    """
+     Max length: 50;
+    """
+    address_line2: str | None = Field(default=None, alias='addressLine2')
+    """
+     Max length: 50;
+    """
+    city: str | None = None
+    """
+     Max length: 50;
+    """
+    state_identifier: str | None = Field(default=None, alias='stateIdentifier')
+    """
+     Max length: 50;
+    """
+    zip: str | None = None
+    """
+     Max length: 12;
+    """
+    country: CountryReference | None = None
+    contact: ContactReference | None = None
+    contact_name: str | None = Field(default=None, alias='contactName')
+    """
+     Max length: 62;
+    """
+    contact_phone_number: str | None = Field(default=None, alias='contactPhoneNumber')
+    """
+     Max length: 20;
+    """
+    contact_phone_extension: str | None = Field(
+        default=None, alias='contactPhoneExtension'
+    )
+    """
+     Max length: 15;
+    """
+    contact_email_address: str | None = Field(default=None, alias='contactEmailAddress')
+    """
+     Max length: 250;
+    """
+    type: ServiceTypeReference | None = None
+    sub_type: ServiceSubTypeReference | None = Field(default=None, alias='subType')
+    item: ServiceItemReference | None = None
+    owner: MemberReference | None = None
+    priority: PriorityReference | None = None
+    service_location: ServiceLocationReference | None = Field(
+        default=None, alias='serviceLocation'
+    )
+    source: ServiceSourceReference | None = None
+    required_date: datetime | None = Field(default=None, alias='requiredDate')
+    budget_hours: float | None = Field(default=None, alias='budgetHours')
+    opportunity: OpportunityReference | None = None
+    agreement: AgreementReference | None = None
+    knowledge_base_category_id: int | None = Field(
+        default=None, alias='knowledgeBaseCategoryId'
+    )
+    knowledge_base_sub_category_id: int | None = Field(
+        default=None, alias='knowledgeBaseSubCategoryId'
+    )
+    knowledge_base_link_id: int | None = Field(
+        default=None, alias='knowledgeBaseLinkId'
+    )
+    knowledge_base_link_type: Literal[
+        'Activity',
+        'ProjectIssue',
+        'KnowledgeBaseArticle',
+        'ProjectTicket',
+        'ServiceTicket',
+        'Time',
+    ] | None = Field(default=None, alias='knowledgeBaseLinkType')
+    allow_all_clients_portal_view: bool | None = Field(
+        default=None, alias='allowAllClientsPortalView'
+    )
+    customer_updated_flag: bool | None = Field(
+        default=None, alias='customerUpdatedFlag'
+    )
+    automatic_email_contact_flag: bool | None = Field(
+        default=None, alias='automaticEmailContactFlag'
+    )
+    automatic_email_resource_flag: bool | None = Field(
+        default=None, alias='automaticEmailResourceFlag'
+    )
+    automatic_email_cc_flag: bool | None = Field(
+        default=None, alias='automaticEmailCcFlag'
+    )
+    automatic_email_cc: str | None = Field(default=None, alias='automaticEmailCc')
+    """
+     Max length: 1000;
+    """
+    closed_date: str | None = Field(default=None, alias='closedDate')
+    closed_by: str | None = Field(default=None, alias='closedBy')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    actual_hours: float | None = Field(default=None, alias='actualHours')
+    approved: bool | None = None
+    sub_billing_method: Literal[
+        'ActualRates', 'FixedFee', 'NotToExceed', 'OverrideRate'
+    ] | None = Field(default=None, alias='subBillingMethod')
+    sub_billing_amount: float | None = Field(default=None, alias='subBillingAmount')
+    sub_date_accepted: str | None = Field(default=None, alias='subDateAccepted')
+    resources: str | None = None
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] | None = Field(
+        default=None, alias='billTime'
+    )
+    bill_expenses: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billExpenses')
+    bill_products: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billProducts')
+    predecessor_type: Literal['Ticket', 'Phase'] | None = Field(
+        default=None, alias='predecessorType'
+    )
+    predecessor_id: int | None = Field(default=None, alias='predecessorId')
+    predecessor_closed_flag: bool | None = Field(
+        default=None, alias='predecessorClosedFlag'
+    )
+    lag_days: int | None = Field(default=None, alias='lagDays')
+    lag_nonworking_days_flag: bool | None = Field(
+        default=None, alias='lagNonworkingDaysFlag'
+    )
+    estimated_start_date: datetime | None = Field(
+        default=None, alias='estimatedStartDate'
+    )
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    duration: int | None = None
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    currency: CurrencyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    tasks: list[TicketTask] | None = None
+    initial_description: str | None = Field(default=None, alias='initialDescription')
+    """
+    Only available for POST, will not be returned in the response.
+    """
+    initial_internal_analysis: str | None = Field(
+        default=None, alias='initialInternalAnalysis'
+    )
+    """
+    Only available for POST, will not be returned in the response.
+    """
+    initial_resolution: str | None = Field(default=None, alias='initialResolution')
+    """
+    Only available for POST, will not be returned in the response.
+    """
+    contact_email_lookup: str | None = Field(default=None, alias='contactEmailLookup')
+    process_notifications: bool | None = Field(
+        default=None, alias='processNotifications'
+    )
+    """
+    Can be set to false to skip notification processing when adding or updating a ticket (Defaults to True).
+    """
+    skip_callback: bool | None = Field(default=None, alias='skipCallback')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.priorityreference import PriorityReference
+from pyconnectwise.models.manage.projectphasereference import ProjectPhaseReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
+from pyconnectwise.models.manage.servicesourcereference import ServiceSourceReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.servicesubtypereference import ServiceSubTypeReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.tickettask import TicketTask
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
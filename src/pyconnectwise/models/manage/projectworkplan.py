@@ -0,0 +1,121 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectWorkplan(ConnectWiseModel):
+    id: int | None = None
+    project_id: int | None = Field(default=None, alias='projectId')
+    description: str | None = None
+    board: ProjectBoardReference | None = None
+    status: PhaseStatusReference | None = None
+    agreement: AgreementReference | None = None
+    opportunity: OpportunityReference | None = None
+    parent_phase: ProjectPhaseReference | None = Field(
+        default=None, alias='parentPhase'
+    )
+    wbs_code: str | None = Field(default=None, alias='wbsCode')
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] | None = Field(
+        default=None, alias='billTime'
+    )
+    bill_expenses: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billExpenses')
+    bill_products: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billProducts')
+    mark_as_milestone_flag: bool | None = Field(
+        default=None, alias='markAsMilestoneFlag'
+    )
+    notes: str | None = None
+    deadline_date: str | None = Field(default=None, alias='deadlineDate')
+    bill_separately_flag: bool | None = Field(default=None, alias='billSeparatelyFlag')
+    billing_method: Literal[
+        'ActualRates', 'FixedFee', 'NotToExceed', 'OverrideRate'
+    ] | None = Field(default=None, alias='billingMethod')
+    """
+    billingMethod is required if the phase billSeparatelyFlag is true.
+    """
+    scheduled_hours: float | None = Field(default=None, alias='scheduledHours')
+    scheduled_start: str | None = Field(default=None, alias='scheduledStart')
+    scheduled_end: str | None = Field(default=None, alias='scheduledEnd')
+    actual_hours: float | None = Field(default=None, alias='actualHours')
+    actual_start: str | None = Field(default=None, alias='actualStart')
+    actual_end: str | None = Field(default=None, alias='actualEnd')
+    budget_hours: float | None = Field(default=None, alias='budgetHours')
+    location_id: int | None = Field(default=None, alias='locationId')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    hourly_rate: float | None = Field(default=None, alias='hourlyRate')
+    billing_start_date: str | None = Field(default=None, alias='billingStartDate')
+    bill_phase_closed_flag: bool | None = Field(
+        default=None, alias='billPhaseClosedFlag'
+    )
+    """
+    This phase can only be billed after it has been closed.
+    """
+    bill_project_closed_flag: bool | None = Field(
+        default=None, alias='billProjectClosedFlag'
+    )
+    """
+    This phase can only be billed after the project has been closed.
+    """
+    downpayment: float | None = None
+    po_number: str | None = Field(default=None, alias='poNumber')
+    po_amount: float | None = Field(default=None, alias='poAmount')
+    estimated_time_cost: float | None = Field(default=None, alias='estimatedTimeCost')
+    estimated_expense_cost: float | None = Field(
+        default=None, alias='estimatedExpenseCost'
+    )
+    estimated_product_cost: float | None = Field(
+        default=None, alias='estimatedProductCost'
+    )
+    estimated_time_revenue: float | None = Field(
+        default=None, alias='estimatedTimeRevenue'
+    )
+    estimated_expense_revenue: float | None = Field(
+        default=None, alias='estimatedExpenseRevenue'
+    )
+    estimated_product_revenue: float | None = Field(
+        default=None, alias='estimatedProductRevenue'
+    )
+    currency: CurrencyReference | None = None
+    bill_to_company: CompanyReference | None = Field(
+        default=None, alias='billToCompany'
+    )
+    bill_to_contact: ContactReference | None = Field(
+        default=None, alias='billToContact'
+    )
+    bill_to_site: SiteReference | None = Field(default=None, alias='billToSite')
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    ship_to_contact: ContactReference | None = Field(
+        default=None, alias='shipToContact'
+    )
+    ship_to_site: SiteReference | None = Field(default=None, alias='shipToSite')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    tickets: list[ProjectTicket] | None = None
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.phasestatusreference import PhaseStatusReference
+from pyconnectwise.models.manage.projectboardreference import ProjectBoardReference
+from pyconnectwise.models.manage.projectphasereference import ProjectPhaseReference
+from pyconnectwise.models.manage.projectticket import ProjectTicket
+from pyconnectwise.models.manage.sitereference import SiteReference
@@ -0,0 +1,124 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PurchaseOrder(ConnectWiseModel):
+    id: int | None = None
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    cancel_reason: str | None = Field(default=None, alias='cancelReason')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    """
+    The closed flag can only be updated via updating the purchase order status to a closed/open status.
+    """
+    closed_by: str | None = Field(default=None, alias='closedBy')
+    customer_city: str | None = Field(default=None, alias='customerCity')
+    customer_company: CompanyReference | None = Field(
+        default=None, alias='customerCompany'
+    )
+    customer_contact: ContactReference | None = Field(
+        default=None, alias='customerContact'
+    )
+    customer_country: CountryReference | None = Field(
+        default=None, alias='customerCountry'
+    )
+    customer_extension: str | None = Field(default=None, alias='customerExtension')
+    customer_name: str | None = Field(default=None, alias='customerName')
+    customer_phone: str | None = Field(default=None, alias='customerPhone')
+    customer_site: SiteReference | None = Field(default=None, alias='customerSite')
+    customer_site_name: str | None = Field(default=None, alias='customerSiteName')
+    customer_state: str | None = Field(default=None, alias='customerState')
+    customer_street_line1: str | None = Field(default=None, alias='customerStreetLine1')
+    customer_street_line2: str | None = Field(default=None, alias='customerStreetLine2')
+    customer_zip: str | None = Field(default=None, alias='customerZip')
+    date_closed: datetime | None = Field(default=None, alias='dateClosed')
+    drop_ship_customer_flag: bool | None = Field(
+        default=None, alias='dropShipCustomerFlag'
+    )
+    entered_by: str | None = Field(default=None, alias='enteredBy')
+    freight_cost: float | None = Field(default=None, alias='freightCost')
+    freight_packing_slip: str | None = Field(default=None, alias='freightPackingSlip')
+    freight_tax_total: float | None = Field(default=None, alias='freightTaxTotal')
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    location_id: int | None = Field(default=None, alias='locationId')
+    po_date: datetime | None = Field(default=None, alias='poDate')
+    """
+     Required On Updates;
+    """
+    po_number: str | None = Field(default=None, alias='poNumber')
+    """
+     Required On Updates; Max length: 50;
+    """
+    sales_tax: float | None = Field(default=None, alias='salesTax')
+    shipment_date: datetime | None = Field(default=None, alias='shipmentDate')
+    shipment_method: ShipmentMethodReference | None = Field(
+        default=None, alias='shipmentMethod'
+    )
+    shipping_instructions: str | None = Field(
+        default=None, alias='shippingInstructions'
+    )
+    status: PurchaseOrderStatusReference | None = None
+    sub_total: float | None = Field(default=None, alias='subTotal')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    tax_freight_flag: bool | None = Field(default=None, alias='taxFreightFlag')
+    tax_po_flag: bool | None = Field(default=None, alias='taxPoFlag')
+    terms: BillingTermsReference | None = None
+    total: float | None = None
+    tracking_number: str | None = Field(default=None, alias='trackingNumber')
+    """
+     Max length: 50;
+    """
+    update_shipment_info: bool | None = Field(default=None, alias='updateShipmentInfo')
+    """
+    Determines whether or not to update all of the shipment info for each associated line item when new shipment info is passed in.
+    """
+    update_vendor_order_number: bool | None = Field(
+        default=None, alias='updateVendorOrderNumber'
+    )
+    """
+    Determines whether or not to update vendor order number for each associated line item when new vendor order number is passed in.
+    """
+    vendor_company: CompanyReference | None = Field(default=None, alias='vendorCompany')
+    vendor_contact: ContactReference | None = Field(default=None, alias='vendorContact')
+    vendor_invoice_date: datetime | None = Field(
+        default=None, alias='vendorInvoiceDate'
+    )
+    vendor_invoice_number: str | None = Field(default=None, alias='vendorInvoiceNumber')
+    """
+     Max length: 50;
+    """
+    vendor_order_number: str | None = Field(default=None, alias='vendorOrderNumber')
+    """
+     Max length: 50;
+    """
+    vendor_site: SiteReference | None = Field(default=None, alias='vendorSite')
+    warehouse: WarehouseReference | None = None
+    warehouse_contact: ContactReference | None = Field(
+        default=None, alias='warehouseContact'
+    )
+    currency: CurrencyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.purchaseorderstatusreference import PurchaseOrderStatusReference
+from pyconnectwise.models.manage.shipmentmethodreference import ShipmentMethodReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
@@ -0,0 +1,96 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PurchaseOrderLineItem(ConnectWiseModel):
+    id: int | None = None
+    backordered_flag: bool | None = Field(default=None, alias='backorderedFlag')
+    canceled_by: str | None = Field(default=None, alias='canceledBy')
+    canceled_flag: bool | None = Field(default=None, alias='canceledFlag')
+    canceled_reason: str | None = Field(default=None, alias='canceledReason')
+    """
+     Max length: 100;
+    """
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    date_canceled: datetime | None = Field(default=None, alias='dateCanceled')
+    date_canceled_utc: datetime | None = Field(default=None, alias='dateCanceledUtc')
+    description: str
+    """
+     Max length: 6000;
+    """
+    display_internal_notes_flag: bool | None = Field(
+        default=None, alias='displayInternalNotesFlag'
+    )
+    expected_ship_date: datetime | None = Field(default=None, alias='expectedShipDate')
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    """
+     Max length: 1000;
+    """
+    line_number: int = Field(..., alias='lineNumber')
+    packing_slip: str | None = Field(default=None, alias='packingSlip')
+    """
+     Max length: 50;
+    """
+    product: IvItemReference | None = None
+    purchase_order_id: int | None = Field(default=None, alias='purchaseOrderId')
+    quantity: float
+    received_quantity: int | None = Field(default=None, alias='receivedQuantity')
+    serial_numbers: str | None = Field(default=None, alias='serialNumbers')
+    ship_date: datetime | None = Field(default=None, alias='shipDate')
+    shipment_method: ShipmentMethodReference | None = Field(
+        default=None, alias='shipmentMethod'
+    )
+    tax: float | None = None
+    tracking_number: str | None = Field(default=None, alias='trackingNumber')
+    """
+     Max length: 50;
+    """
+    unit_cost: float | None = Field(default=None, alias='unitCost')
+    unit_of_measure: UnitOfMeasureReference | None = Field(
+        default=None, alias='unitOfMeasure'
+    )
+    vendor_order_number: str | None = Field(default=None, alias='vendorOrderNumber')
+    """
+     Max length: 50;
+    """
+    vendor_sku: str | None = Field(default=None, alias='vendorSku')
+    """
+     Max length: 50;
+    """
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: WarehouseBinReference | None = Field(
+        default=None, alias='warehouseBin'
+    )
+    ship_set: str | None = Field(default=None, alias='shipSet')
+    """
+     Max length: 10;
+    """
+    date_received: datetime | None = Field(default=None, alias='dateReceived')
+    received_status: Literal[
+        'Waiting',
+        'FullyReceived',
+        'PartiallyReceiveCancelRest',
+        'PartiallyReceiveCloneRest',
+    ] | None = Field(default=None, alias='receivedStatus')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.shipmentmethodreference import ShipmentMethodReference
+from pyconnectwise.models.manage.unitofmeasurereference import UnitOfMeasureReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
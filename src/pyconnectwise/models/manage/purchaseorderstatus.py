@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PurchaseOrderStatus(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    default_closed_flag: bool | None = Field(default=None, alias='defaultClosedFlag')
+    sort_order: int | None = Field(default=None, alias='sortOrder')
+    email_template: PurchaseOrderStatusEmailTemplateReference | None = Field(
+        default=None, alias='emailTemplate'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.purchaseorderstatusemailtemplatereference import PurchaseOrderStatusEmailTemplateReference
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PurchaseOrderStatusEmailTemplate(ConnectWiseModel):
+    id: int | None = None
+    status: PurchaseOrderStatusReference | None = None
+    use_sender_flag: bool | None = Field(default=None, alias='useSenderFlag')
+    first_name: str | None = Field(default=None, alias='firstName')
+    """
+     Max length: 100;
+    """
+    last_name: str | None = Field(default=None, alias='lastName')
+    """
+     Max length: 100;
+    """
+    email_address: str | None = Field(default=None, alias='emailAddress')
+    """
+     Max length: 100;
+    """
+    subject: str
+    """
+     Max length: 200;
+    """
+    body: str | None = None
+    copy_sender_flag: bool | None = Field(default=None, alias='copySenderFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.purchaseorderstatusreference import PurchaseOrderStatusReference
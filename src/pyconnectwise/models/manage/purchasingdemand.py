@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PurchasingDemand(ConnectWiseModel):
+    warehouse: WarehouseReference | None = None
+    vendor: CompanyReference | None = None
+    products: list[ProductDemand] | None = None
+    purchase_order: PurchaseOrder | None = Field(default=None, alias='purchaseOrder')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.productdemand import ProductDemand
+from pyconnectwise.models.manage.purchaseorder import PurchaseOrder
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class QuoteLink(ConnectWiseModel):
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    link: str
+    """
+     Max length: 2000;
+    """
+    all_locations_flag: bool | None = Field(default=None, alias='allLocationsFlag')
+    new_window_flag: bool | None = Field(default=None, alias='newWindowFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ReportCardDetail(ConnectWiseModel):
+    id: int | None = None
+    kpi: KPIReference | None = None
+    sort_order: int | None = Field(default=None, alias='sortOrder')
+    report_card: ReportCardReference | None = Field(default=None, alias='reportCard')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.kpireference import KPIReference
+from pyconnectwise.models.manage.reportcardreference import ReportCardReference
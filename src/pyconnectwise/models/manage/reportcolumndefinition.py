@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ReportColumnDefinition(ConnectWiseModel):
+    type: str | None = None
+    is_nullable: bool | None = Field(default=None, alias='isNullable')
+    identity_column: bool | None = Field(default=None, alias='identityColumn')
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Any
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ReportDataResponse(ConnectWiseModel):
+    column_definitions: list[dict[str, ReportColumnDefinition]] | None = None
+    row_values: list[list[dict[str, Any]]] | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.reportcolumndefinition import ReportColumnDefinition
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ReportingService(ConnectWiseModel):
+    id: int | None = None
+    reporting_user_name: str | None = Field(default=None, alias='reportingUserName')
+    """
+     Max length: 50;
+    """
+    reporting_password: str | None = Field(default=None, alias='reportingPassword')
+    """
+    To blank out the password, enter an empty string here. Max length: 50;
+    """
+    reporting_domain: str | None = Field(default=None, alias='reportingDomain')
+    """
+     Max length: 50;
+    """
+    reporting_url: str | None = Field(default=None, alias='reportingUrl')
+    """
+     Max length: 100;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ResultInfo(ConnectWiseModel):
+    success: bool | None = None
+    original_index: int | None = Field(default=None, alias='originalIndex')
+    status_code: int | None = Field(default=None, alias='statusCode')
+    data: IRestIdentifiedItem | None = None
+    error: ErrorResponseMessage | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.errorresponsemessage import ErrorResponseMessage
+from pyconnectwise.models.manage.irestidentifieditem import IRestIdentifiedItem
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class RmaStatusNotification(ConnectWiseModel):
+    id: int | None = None
+    notify_who: NotificationRecipientReference | None = Field(
+        default=None, alias='notifyWho'
+    )
+    status: RmaStatusReference | None = None
+    member: MemberReference | None = None
+    email: str | None = None
+    """
+    RMA Status Notification sendEmail must be entered if the notify type is "Email Address". Max length: 50;
+    """
+    workflow_step: int | None = Field(default=None, alias='workflowStep')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.notificationrecipientreference import NotificationRecipientReference
+from pyconnectwise.models.manage.rmastatusreference import RmaStatusReference
@@ -0,0 +1,316 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import date
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class RmaTag(ConnectWiseModel):
+    id: int | None = None
+    service_ticket: TicketReference | None = Field(default=None, alias='serviceTicket')
+    sales_order: SalesOrderReference | None = Field(default=None, alias='salesOrder')
+    invoice: InvoiceReference | None = None
+    project: ProjectReference | None = None
+    summary: str | None = None
+    """
+     Max length: 150;
+    """
+    product: IvItemReference | None = None
+    iv_description: str | None = Field(default=None, alias='ivDescription')
+    product_description: str = Field(..., alias='productDescription')
+    """
+     Max length: 200;
+    """
+    serial_number: str | None = Field(default=None, alias='serialNumber')
+    mfg_item_id: str | None = Field(default=None, alias='mfgItemID')
+    """
+     Max length: 100;
+    """
+    status: RmaStatusReference | None = None
+    list_price: float | None = Field(default=None, alias='listPrice')
+    unit_price: float | None = Field(default=None, alias='unitPrice')
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    problem_description: str | None = Field(default=None, alias='problemDescription')
+    """
+     Max length: 1000;
+    """
+    returned_company: CompanyReference | None = Field(
+        default=None, alias='returnedCompany'
+    )
+    returned_contact: ContactReference | None = Field(
+        default=None, alias='returnedContact'
+    )
+    returned_contact_type: str | None = Field(default=None, alias='returnedContactType')
+    returned_contact_phone: str | None = Field(
+        default=None, alias='returnedContactPhone'
+    )
+    returned_contact_extension: str | None = Field(
+        default=None, alias='returnedContactExtension'
+    )
+    returned_contact_email: str | None = Field(
+        default=None, alias='returnedContactEmail'
+    )
+    returned_contact_address_line1: str | None = Field(
+        default=None, alias='returnedContactAddressLine1'
+    )
+    """
+     Max length: 50;
+    """
+    returned_contact_address_line2: str | None = Field(
+        default=None, alias='returnedContactAddressLine2'
+    )
+    """
+     Max length: 50;
+    """
+    returned_contact_city: str | None = Field(default=None, alias='returnedContactCity')
+    """
+     Max length: 50;
+    """
+    returned_contact_state: str | None = Field(
+        default=None, alias='returnedContactState'
+    )
+    """
+     Max length: 50;
+    """
+    returned_contact_zip: str | None = Field(default=None, alias='returnedContactZip')
+    """
+     Max length: 12;
+    """
+    returned_contact_country: CountryReference | None = Field(
+        default=None, alias='returnedContactCountry'
+    )
+    rma_disposition: RmaDispositionReference | None = Field(
+        default=None, alias='rmaDisposition'
+    )
+    returned_site: SiteReference | None = Field(default=None, alias='returnedSite')
+    purchased_company: CompanyReference | None = Field(
+        default=None, alias='purchasedCompany'
+    )
+    purchased_contact: ContactReference | None = Field(
+        default=None, alias='purchasedContact'
+    )
+    purchased_contact_type: str | None = Field(
+        default=None, alias='purchasedContactType'
+    )
+    purchased_contact_phone: str | None = Field(
+        default=None, alias='purchasedContactPhone'
+    )
+    purchased_contact_extension: str | None = Field(
+        default=None, alias='purchasedContactExtension'
+    )
+    purchased_contact_email: str | None = Field(
+        default=None, alias='purchasedContactEmail'
+    )
+    purchased_contact_address_line1: str | None = Field(
+        default=None, alias='purchasedContactAddressLine1'
+    )
+    """
+     Max length: 50;
+    """
+    purchased_contact_address_line2: str | None = Field(
+        default=None, alias='purchasedContactAddressLine2'
+    )
+    """
+     Max length: 50;
+    """
+    purchased_contact_city: str | None = Field(
+        default=None, alias='purchasedContactCity'
+    )
+    """
+     Max length: 50;
+    """
+    purchased_contact_state: str | None = Field(
+        default=None, alias='purchasedContactState'
+    )
+    """
+     Max length: 50;
+    """
+    purchased_contact_zip: str | None = Field(default=None, alias='purchasedContactZip')
+    """
+     Max length: 12;
+    """
+    purchased_contact_country: CountryReference | None = Field(
+        default=None, alias='purchasedContactCountry'
+    )
+    purchased_invoice_number: str | None = Field(
+        default=None, alias='purchasedInvoiceNumber'
+    )
+    """
+     Max length: 50;
+    """
+    purchased_invoice_date: date | None = Field(
+        default=None, alias='purchasedInvoiceDate'
+    )
+    purchased_order_number: str | None = Field(
+        default=None, alias='purchasedOrderNumber'
+    )
+    """
+     Max length: 50;
+    """
+    purchased_vendor_action: RmaActionReference | None = Field(
+        default=None, alias='purchasedVendorAction'
+    )
+    purchased_vendor_rma_number: str | None = Field(
+        default=None, alias='purchasedVendorRmaNumber'
+    )
+    """
+     Max length: 50;
+    """
+    purchased_site: SiteReference | None = Field(default=None, alias='purchasedSite')
+    purchased_notes: str | None = Field(default=None, alias='purchasedNotes')
+    """
+     Max length: 1000;
+    """
+    warranty_company: CompanyReference | None = Field(
+        default=None, alias='warrantyCompany'
+    )
+    warranty_contact: ContactReference | None = Field(
+        default=None, alias='warrantyContact'
+    )
+    warranty_contact_type: str | None = Field(default=None, alias='warrantyContactType')
+    warranty_contact_phone: str | None = Field(
+        default=None, alias='warrantyContactPhone'
+    )
+    warranty_contact_email: str | None = Field(
+        default=None, alias='warrantyContactEmail'
+    )
+    warranty_contact_extension: str | None = Field(
+        default=None, alias='warrantyContactExtension'
+    )
+    warranty_contact_address_line1: str | None = Field(
+        default=None, alias='warrantyContactAddressLine1'
+    )
+    """
+     Max length: 50;
+    """
+    warranty_contact_address_line2: str | None = Field(
+        default=None, alias='warrantyContactAddressLine2'
+    )
+    """
+     Max length: 50;
+    """
+    warranty_contact_city: str | None = Field(default=None, alias='warrantyContactCity')
+    """
+     Max length: 50;
+    """
+    warranty_contact_state: str | None = Field(
+        default=None, alias='warrantyContactState'
+    )
+    """
+     Max length: 50;
+    """
+    warranty_contact_zip: str | None = Field(default=None, alias='warrantyContactZip')
+    """
+     Max length: 12;
+    """
+    warranty_contact_country: CountryReference | None = Field(
+        default=None, alias='warrantyContactCountry'
+    )
+    warranty_site: SiteReference | None = Field(default=None, alias='warrantySite')
+    warranty_notes: str | None = Field(default=None, alias='warrantyNotes')
+    """
+     Max length: 1000;
+    """
+    repair_company: CompanyReference | None = Field(default=None, alias='repairCompany')
+    repair_contact: ContactReference | None = Field(default=None, alias='repairContact')
+    repair_contact_type: str | None = Field(default=None, alias='repairContactType')
+    repair_contact_phone: str | None = Field(default=None, alias='repairContactPhone')
+    repair_contact_extension: str | None = Field(
+        default=None, alias='repairContactExtension'
+    )
+    repair_contact_email: str | None = Field(default=None, alias='repairContactEmail')
+    repair_contact_address_line1: str | None = Field(
+        default=None, alias='repairContactAddressLine1'
+    )
+    """
+     Max length: 50;
+    """
+    repair_contact_address_line2: str | None = Field(
+        default=None, alias='repairContactAddressLine2'
+    )
+    """
+     Max length: 50;
+    """
+    repair_contact_city: str | None = Field(default=None, alias='repairContactCity')
+    """
+     Max length: 50;
+    """
+    repair_contact_state: str | None = Field(default=None, alias='repairContactState')
+    """
+     Max length: 50;
+    """
+    repair_contact_zip: str | None = Field(default=None, alias='repairContactZip')
+    """
+     Max length: 12;
+    """
+    repair_contact_country: CountryReference | None = Field(
+        default=None, alias='repairContactCountry'
+    )
+    repair_order_number: str | None = Field(default=None, alias='repairOrderNumber')
+    """
+     Max length: 50;
+    """
+    repair_site: SiteReference | None = Field(default=None, alias='repairSite')
+    repair_notes: str | None = Field(default=None, alias='repairNotes')
+    """
+     Max length: 1000;
+    """
+    drop_ship_flag: bool | None = Field(default=None, alias='dropShipFlag')
+    ship_method: ShipmentMethodReference | None = Field(
+        default=None, alias='shipMethod'
+    )
+    shipping_date: date | None = Field(default=None, alias='shippingDate')
+    shipping_tracking_number: str | None = Field(
+        default=None, alias='shippingTrackingNumber'
+    )
+    """
+     Max length: 50;
+    """
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    """
+     Max length: 1000;
+    """
+    closing_notes: str | None = Field(default=None, alias='closingNotes')
+    """
+     Max length: 1000;
+    """
+    date_closed: str | None = Field(default=None, alias='dateClosed')
+    account_manager: MemberReference | None = Field(
+        default=None, alias='accountManager'
+    )
+    technical_contact: MemberReference | None = Field(
+        default=None, alias='technicalContact'
+    )
+    currency: CurrencyReference | None = None
+    closed_by: MemberReference | None = Field(default=None, alias='closedBy')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.invoicereference import InvoiceReference
+from pyconnectwise.models.manage.ivitemreference import IvItemReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.rmaactionreference import RmaActionReference
+from pyconnectwise.models.manage.rmadispositionreference import RmaDispositionReference
+from pyconnectwise.models.manage.rmastatusreference import RmaStatusReference
+from pyconnectwise.models.manage.salesorderreference import SalesOrderReference
+from pyconnectwise.models.manage.shipmentmethodreference import ShipmentMethodReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
@@ -0,0 +1,55 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SalesQuota(ConnectWiseModel):
+    id: int | None = None
+    member: MemberReference | None = None
+    forecast_year: int | None = Field(default=None, alias='forecastYear')
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    category: ProductCategoryReference | None = None
+    sub_category: ProductSubCategoryReference | None = Field(
+        default=None, alias='subCategory'
+    )
+    january_revenue: float | None = Field(default=None, alias='januaryRevenue')
+    january_margin: float | None = Field(default=None, alias='januaryMargin')
+    february_revenue: float | None = Field(default=None, alias='februaryRevenue')
+    february_margin: float | None = Field(default=None, alias='februaryMargin')
+    march_revenue: float | None = Field(default=None, alias='marchRevenue')
+    march_margin: float | None = Field(default=None, alias='marchMargin')
+    april_revenue: float | None = Field(default=None, alias='aprilRevenue')
+    april_margin: float | None = Field(default=None, alias='aprilMargin')
+    may_revenue: float | None = Field(default=None, alias='mayRevenue')
+    may_margin: float | None = Field(default=None, alias='mayMargin')
+    june_revenue: float | None = Field(default=None, alias='juneRevenue')
+    june_margin: float | None = Field(default=None, alias='juneMargin')
+    july_revenue: float | None = Field(default=None, alias='julyRevenue')
+    july_margin: float | None = Field(default=None, alias='julyMargin')
+    august_revenue: float | None = Field(default=None, alias='augustRevenue')
+    august_margin: float | None = Field(default=None, alias='augustMargin')
+    september_revenue: float | None = Field(default=None, alias='septemberRevenue')
+    september_margin: float | None = Field(default=None, alias='septemberMargin')
+    october_revenue: float | None = Field(default=None, alias='octoberRevenue')
+    october_margin: float | None = Field(default=None, alias='octoberMargin')
+    november_revenue: float | None = Field(default=None, alias='novemberRevenue')
+    november_margin: float | None = Field(default=None, alias='novemberMargin')
+    december_revenue: float | None = Field(default=None, alias='decemberRevenue')
+    december_margin: float | None = Field(default=None, alias='decemberMargin')
+    currency: CurrencyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.productcategoryreference import ProductCategoryReference
+from pyconnectwise.models.manage.productsubcategoryreference import ProductSubCategoryReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
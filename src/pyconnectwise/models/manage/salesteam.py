@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SalesTeam(ConnectWiseModel):
+    id: int | None = None
+    sales_team_identifier: str = Field(..., alias='salesTeamIdentifier')
+    """
+     Max length: 20;
+    """
+    sales_team_description: str = Field(..., alias='salesTeamDescription')
+    """
+     Max length: 50;
+    """
+    sales_team_location: SystemLocationReference | None = Field(
+        default=None, alias='salesTeamLocation'
+    )
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleColor(ConnectWiseModel):
+    id: int | None = None
+    start_percent: int | None = Field(default=None, alias='startPercent')
+    """
+    A startPercent (0 or higher) is required if endPercent has value.
+    """
+    end_percent: int | None = Field(default=None, alias='endPercent')
+    """
+    A endPercent is required if startPercent has value.
+    """
+    color: str
+    """
+    Must be a valid Hexadecimal Color Code.
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
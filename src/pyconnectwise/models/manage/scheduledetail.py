@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleDetail(ConnectWiseModel):
+    id: int | None = None
+    schedule_entry: ScheduleEntryReference | None = Field(
+        default=None, alias='scheduleEntry'
+    )
+    date_start: str | None = Field(default=None, alias='dateStart')
+    date_end: str | None = Field(default=None, alias='dateEnd')
+    member: MemberReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.scheduleentryreference import ScheduleEntryReference
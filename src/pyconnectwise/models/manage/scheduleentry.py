@@ -0,0 +1,53 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleEntry(ConnectWiseModel):
+    id: int | None = None
+    object_id: int | None = Field(default=None, alias='objectId')
+    name: str | None = None
+    """
+     Max length: 250;
+    """
+    member: MemberReference | None = None
+    where: ServiceLocationReference | None = None
+    date_start: datetime | None = Field(default=None, alias='dateStart')
+    date_end: datetime | None = Field(default=None, alias='dateEnd')
+    reminder: ReminderReference | None = None
+    status: ScheduleStatusReference | None = None
+    type: ScheduleTypeReference | None = None
+    span: ScheduleSpanReference | None = None
+    done_flag: bool | None = Field(default=None, alias='doneFlag')
+    acknowledged_flag: bool | None = Field(default=None, alias='acknowledgedFlag')
+    owner_flag: bool | None = Field(default=None, alias='ownerFlag')
+    meeting_flag: bool | None = Field(default=None, alias='meetingFlag')
+    allow_schedule_conflicts_flag: bool | None = Field(
+        default=None, alias='allowScheduleConflictsFlag'
+    )
+    add_member_to_project_flag: bool | None = Field(
+        default=None, alias='addMemberToProjectFlag'
+    )
+    project_role_id: int | None = Field(default=None, alias='projectRoleId')
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    acknowledged_date: datetime | None = Field(default=None, alias='acknowledgedDate')
+    close_date: datetime | None = Field(default=None, alias='closeDate')
+    hours: float | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.reminderreference import ReminderReference
+from pyconnectwise.models.manage.schedulespanreference import ScheduleSpanReference
+from pyconnectwise.models.manage.schedulestatusreference import ScheduleStatusReference
+from pyconnectwise.models.manage.scheduletypereference import ScheduleTypeReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
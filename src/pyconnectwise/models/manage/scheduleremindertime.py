@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleReminderTime(ConnectWiseModel):
+    id: int | None = None
+    time: int | None = None
+    """
+    Time is calculated in minutes.
+    """
+    name: str | None = None
+    """
+     Max length: 10;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
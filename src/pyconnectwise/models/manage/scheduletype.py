@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    identifier: str
+    """
+     Max length: 1;
+    """
+    charge_code: ChargeCodeReference | None = Field(default=None, alias='chargeCode')
+    where: ServiceLocationReference | None = None
+    system_flag: bool | None = Field(default=None, alias='systemFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.chargecodereference import ChargeCodeReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SchedulingMemberInfo(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    first_name: str | None = Field(default=None, alias='firstName')
+    middle_initial: str | None = Field(default=None, alias='middleInitial')
+    last_name: str | None = Field(default=None, alias='lastName')
+    full_name: str | None = Field(default=None, alias='fullName')
+    default_email: str | None = Field(default=None, alias='defaultEmail')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SecurityRoleSetting(ConnectWiseModel):
+    id: int | None = None
+    add_level: Literal['None', 'My', 'All'] | None = Field(
+        default=None, alias='addLevel'
+    )
+    edit_level: Literal['None', 'My', 'All'] | None = Field(
+        default=None, alias='editLevel'
+    )
+    delete_level: Literal['None', 'My', 'All'] | None = Field(
+        default=None, alias='deleteLevel'
+    )
+    inquire_level: Literal['None', 'My', 'All'] | None = Field(
+        default=None, alias='inquireLevel'
+    )
+    module_function_name: str | None = Field(default=None, alias='moduleFunctionName')
+    module_function_description: str | None = Field(
+        default=None, alias='moduleFunctionDescription'
+    )
+    my_all_flag: bool | None = Field(default=None, alias='myAllFlag')
+    module_function_identifier: str | None = Field(
+        default=None, alias='moduleFunctionIdentifier'
+    )
+    report_flag: bool | None = Field(default=None, alias='reportFlag')
+    restrict_flag: bool | None = Field(default=None, alias='restrictFlag')
+    custom_flag: bool | None = Field(default=None, alias='customFlag')
+    module_description: str | None = Field(default=None, alias='moduleDescription')
+    module_identifier: str | None = Field(default=None, alias='moduleIdentifier')
+    module_name: str | None = Field(default=None, alias='moduleName')
+    sort_order: int | None = Field(default=None, alias='sortOrder')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
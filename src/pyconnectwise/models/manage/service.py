@@ -0,0 +1,59 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Service(ConnectWiseModel):
+    id: int | None = None
+    sr_notify: Literal[
+        'All', 'NewAndClosedRequests', 'ClosedRequestsOnly', 'NewRequestsOnly', 'None'
+    ] = Field(..., alias='srNotify')
+    schedule_span: Literal['Standard', 'OfficeHours', 'Overnight'] = Field(
+        ..., alias='scheduleSpan'
+    )
+    hide_delimiter_flag: bool | None = Field(default=None, alias='hideDelimiterFlag')
+    allow_cc_flag: bool | None = Field(default=None, alias='allowCCFlag')
+    allow_to_flag: bool | None = Field(default=None, alias='allowTOFlag')
+    header_color: str | None = Field(default=None, alias='headerColor')
+    """
+     Max length: 50;
+    """
+    member_color: str | None = Field(default=None, alias='memberColor')
+    """
+     Max length: 50;
+    """
+    contact_color: str | None = Field(default=None, alias='contactColor')
+    """
+     Max length: 50;
+    """
+    unknown_color: str | None = Field(default=None, alias='unknownColor')
+    """
+     Max length: 50;
+    """
+    calendar_setup: CalendarSetupReference | None = Field(
+        default=None, alias='calendarSetup'
+    )
+    header_color_disable_flag: bool | None = Field(
+        default=None, alias='headerColorDisableFlag'
+    )
+    member_color_disable_flag: bool | None = Field(
+        default=None, alias='memberColorDisableFlag'
+    )
+    contact_color_disable_flag: bool | None = Field(
+        default=None, alias='contactColorDisableFlag'
+    )
+    unknown_color_disable_flag: bool | None = Field(
+        default=None, alias='unknownColorDisableFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.calendarsetupreference import CalendarSetupReference
@@ -0,0 +1,67 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceEmailTemplate(ConnectWiseModel):
+    id: int | None = None
+    type: Literal[
+        'Any',
+        'Closed',
+        'Invoice',
+        'New',
+        'SalesOrder',
+        'PurchaseOrder',
+        'RMA',
+        'Specific',
+    ]
+    service_survey: ServiceSurveyReference | None = Field(
+        default=None, alias='serviceSurvey'
+    )
+    service_board: BoardReference | None = Field(default=None, alias='serviceBoard')
+    use_sender_flag: bool | None = Field(default=None, alias='useSenderFlag')
+    first_name: str | None = Field(default=None, alias='firstName')
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    last_name: str | None = Field(default=None, alias='lastName')
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    email_address: str | None = Field(default=None, alias='emailAddress')
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    subject: str | None = None
+    """
+     Max length: 200;
+    """
+    body: str | None = None
+    copy_sender_flag: bool | None = Field(default=None, alias='copySenderFlag')
+    tasks_flag: bool | None = Field(default=None, alias='tasksFlag')
+    resource_records_flag: bool | None = Field(
+        default=None, alias='resourceRecordsFlag'
+    )
+    external_contact_notifications: bool | None = Field(
+        default=None, alias='externalContactNotifications'
+    )
+    internal_contact_notifications: bool | None = Field(
+        default=None, alias='internalContactNotifications'
+    )
+    service_status: ServiceStatusReference | None = Field(
+        default=None, alias='serviceStatus'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.servicesurveyreference import ServiceSurveyReference
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceInfo(ConnectWiseModel):
+    id: int | None = None
+    header_color: str | None = Field(default=None, alias='headerColor')
+    member_color: str | None = Field(default=None, alias='memberColor')
+    contact_color: str | None = Field(default=None, alias='contactColor')
+    unknown_color: str | None = Field(default=None, alias='unknownColor')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
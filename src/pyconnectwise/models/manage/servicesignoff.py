@@ -0,0 +1,122 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSignoff(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    visible_logo_flag: bool | None = Field(default=None, alias='visibleLogoFlag')
+    company_info_flag: bool | None = Field(default=None, alias='companyInfoFlag')
+    billing_terms_flag: bool | None = Field(default=None, alias='billingTermsFlag')
+    summary_flag: bool | None = Field(default=None, alias='summaryFlag')
+    discussion_flag: bool | None = Field(default=None, alias='discussionFlag')
+    task_flag: bool | None = Field(default=None, alias='taskFlag')
+    """
+    On add/post, if this is set to true but no value is set for task, task is defaulted to ServiceTasks.All.
+    """
+    task: Literal['All', 'Closed', 'Open'] | None = None
+    """
+    On add/post, if this is set but no value is set for taskFlag, taskFlag is set to true.
+    """
+    configurations_flag: bool | None = Field(default=None, alias='configurationsFlag')
+    internal_notes_flag: bool | None = Field(default=None, alias='internalNotesFlag')
+    resolution_flag: bool | None = Field(default=None, alias='resolutionFlag')
+    time_flag: bool | None = Field(default=None, alias='timeFlag')
+    """
+    On add/post, if any time related flag is set to true, this is also set to true.
+    """
+    time_member_flag: bool | None = Field(default=None, alias='timeMemberFlag')
+    time_date_flag: bool | None = Field(default=None, alias='timeDateFlag')
+    time_start_end_flag: bool | None = Field(default=None, alias='timeStartEndFlag')
+    time_bill_flag: bool | None = Field(default=None, alias='timeBillFlag')
+    time_hours_flag: bool | None = Field(default=None, alias='timeHoursFlag')
+    time_rate_flag: bool | None = Field(default=None, alias='timeRateFlag')
+    time_extended_amount_flag: bool | None = Field(
+        default=None, alias='timeExtendedAmountFlag'
+    )
+    time_work_type_flag: bool | None = Field(default=None, alias='timeWorkTypeFlag')
+    time_agreement_flag: bool | None = Field(default=None, alias='timeAgreementFlag')
+    time_notes_flag: bool | None = Field(default=None, alias='timeNotesFlag')
+    time_manual_flag: bool | None = Field(default=None, alias='timeManualFlag')
+    time_manual_entry: int | None = Field(default=None, alias='timeManualEntry')
+    time_tax_flag: bool | None = Field(default=None, alias='timeTaxFlag')
+    expense_flag: bool | None = Field(default=None, alias='expenseFlag')
+    """
+    On add/post, if any expense related flag is set to true, this is also set to true.
+    """
+    expense_date_flag: bool | None = Field(default=None, alias='expenseDateFlag')
+    expense_member_flag: bool | None = Field(default=None, alias='expenseMemberFlag')
+    expense_type_flag: bool | None = Field(default=None, alias='expenseTypeFlag')
+    expense_bill_flag: bool | None = Field(default=None, alias='expenseBillFlag')
+    expense_amount_flag: bool | None = Field(default=None, alias='expenseAmountFlag')
+    expense_agreement_flag: bool | None = Field(
+        default=None, alias='expenseAgreementFlag'
+    )
+    expense_notes_flag: bool | None = Field(default=None, alias='expenseNotesFlag')
+    expense_tax_flag: bool | None = Field(default=None, alias='expenseTaxFlag')
+    expense_manual_flag: bool | None = Field(default=None, alias='expenseManualFlag')
+    expense_manual_entry: int | None = Field(default=None, alias='expenseManualEntry')
+    product_flag: bool | None = Field(default=None, alias='productFlag')
+    """
+    On add/post, if any product related flag is set to true, this is also set to true.
+    """
+    product_description_flag: bool | None = Field(
+        default=None, alias='productDescriptionFlag'
+    )
+    product_bill_flag: bool | None = Field(default=None, alias='productBillFlag')
+    product_quantity_flag: bool | None = Field(
+        default=None, alias='productQuantityFlag'
+    )
+    product_price_flag: bool | None = Field(default=None, alias='productPriceFlag')
+    product_extended_amount_flag: bool | None = Field(
+        default=None, alias='productExtendedAmountFlag'
+    )
+    product_agreement_flag: bool | None = Field(
+        default=None, alias='productAgreementFlag'
+    )
+    product_manual_flag: bool | None = Field(default=None, alias='productManualFlag')
+    product_manual_entry: int | None = Field(default=None, alias='productManualEntry')
+    product_tax_flag: bool | None = Field(default=None, alias='productTaxFlag')
+    technician_signoff_flag: bool | None = Field(
+        default=None, alias='technicianSignoffFlag'
+    )
+    customer_signoff_text_flag: bool | None = Field(
+        default=None, alias='customerSignoffTextFlag'
+    )
+    """
+    On add/post, if customerSignoffText.Length > 0, this is set to true.
+    """
+    customer_signoff_text: str | None = Field(default=None, alias='customerSignoffText')
+    """
+     Max length: 4000;
+    """
+    customer_signoff_fields_flag: bool | None = Field(
+        default=None, alias='customerSignoffFieldsFlag'
+    )
+    billing_methods_text_flag: bool | None = Field(
+        default=None, alias='billingMethodsTextFlag'
+    )
+    """
+    On add/post, if billingMethodsText.Length > 0, this is set to true.
+    """
+    billing_methods_text: str | None = Field(default=None, alias='billingMethodsText')
+    """
+     Max length: 2000;
+    """
+    credit_card_fields_flag: bool | None = Field(
+        default=None, alias='creditCardFieldsFlag'
+    )
+    default_ff_flag: bool | None = Field(default=None, alias='defaultFFFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSignoffCustomField(ConnectWiseModel):
+    id: int | None = None
+    sequence_number: float = Field(..., alias='sequenceNumber')
+    display_section: Literal[
+        'CustomerInformation',
+        'Detail',
+        'Expenses',
+        'Configurations',
+        'AdditionalSignOffFields',
+        'InternalNotes',
+        'Time',
+        'Products',
+        'Resolution',
+        'Summary',
+        'Tasks',
+    ] = Field(..., alias='displaySection')
+    user_defined_field: UserDefinedFieldReference | None = Field(
+        default=None, alias='userDefinedField'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.userdefinedfieldreference import UserDefinedFieldReference
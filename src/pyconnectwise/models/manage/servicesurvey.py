@@ -0,0 +1,51 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSurvey(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    header_include_logo_flag: bool | None = Field(
+        default=None, alias='headerIncludeLogoFlag'
+    )
+    header_text: str | None = Field(default=None, alias='headerText')
+    """
+     Max length: 4000;
+    """
+    header_text_visible_flag: bool | None = Field(
+        default=None, alias='headerTextVisibleFlag'
+    )
+    footer_text: str | None = Field(default=None, alias='footerText')
+    """
+     Max length: 500;
+    """
+    footer_text_visible_flag: bool | None = Field(
+        default=None, alias='footerTextVisibleFlag'
+    )
+    thank_you_text: str | None = Field(default=None, alias='thankYouText')
+    """
+     Max length: 4000;
+    """
+    notify_who: GenericIdIdentifierReference | None = Field(
+        default=None, alias='notifyWho'
+    )
+    notify_who_visible_flag: bool | None = Field(
+        default=None, alias='notifyWhoVisibleFlag'
+    )
+    notify_member: MemberReference | None = Field(default=None, alias='notifyMember')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.genericididentifierreference import GenericIdIdentifierReference
+from pyconnectwise.models.manage.memberreference import MemberReference
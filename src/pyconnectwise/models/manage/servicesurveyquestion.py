@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSurveyQuestion(ConnectWiseModel):
+    id: int | None = None
+    sequence_number: int | None = Field(default=None, alias='sequenceNumber')
+    type: Literal['OpenEnded', 'Selection']
+    question: str
+    """
+     Max length: 1000;
+    """
+    options: list[ServiceSurveyQuestionOption] | None = None
+    include_flag: bool | None = Field(default=None, alias='includeFlag')
+    required_flag: bool | None = Field(default=None, alias='requiredFlag')
+    no_answer_points: int | None = Field(default=None, alias='noAnswerPoints')
+    survey_id: int | None = Field(default=None, alias='surveyId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.servicesurveyquestionoption import ServiceSurveyQuestionOption
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSurveyQuestionOption(ConnectWiseModel):
+    include_flag: bool | None = Field(default=None, alias='includeFlag')
+    caption: str | None = None
+    points: int | None = None
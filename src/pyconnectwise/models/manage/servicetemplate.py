@@ -0,0 +1,94 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceTemplate(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    board: BoardReference | None = None
+    type: ServiceTypeReference | None = None
+    item: ServiceItemReference | None = None
+    subtype: ServiceSubTypeReference | None = None
+    service_location: ServiceLocationReference | None = Field(
+        default=None, alias='serviceLocation'
+    )
+    status: ServiceStatusReference | None = None
+    source: ServiceSourceReference | None = None
+    priority: PriorityReference | None = None
+    team: ServiceTeamReference | None = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    site: SiteReference | None = None
+    assigned_notify_flag: bool | None = Field(default=None, alias='assignedNotifyFlag')
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    summary: str | None = None
+    problem: str | None = None
+    hours_budget: float | None = Field(default=None, alias='hoursBudget')
+    internal_analysis: str | None = Field(default=None, alias='internalAnalysis')
+    time_billable_flag: bool | None = Field(default=None, alias='timeBillableFlag')
+    expense_billable_flag: bool | None = Field(
+        default=None, alias='expenseBillableFlag'
+    )
+    purchase_order_number: str | None = Field(default=None, alias='purchaseOrderNumber')
+    reference: str | None = None
+    bill_complete_flag: bool | None = Field(default=None, alias='billComplete_Flag')
+    bill_service_separately_flag: bool | None = Field(
+        default=None, alias='billServiceSeparatelyFlag'
+    )
+    billing_amount: float | None = Field(default=None, alias='billingAmount')
+    bill_unapproved_time_and_expenses_flag: bool | None = Field(
+        default=None, alias='billUnapprovedTimeAndExpensesFlag'
+    )
+    override_flag: bool | None = Field(default=None, alias='overrideFlag')
+    time_invoice_flag: bool | None = Field(default=None, alias='timeInvoiceFlag')
+    expense_invoice_flag: bool | None = Field(default=None, alias='expenseInvoiceFlag')
+    product_invoice_flag: bool | None = Field(default=None, alias='productInvoiceFlag')
+    agreement: AgreementReference | None = None
+    billing_method: Literal[
+        'ActualRates', 'FixedFee', 'NotToExceed', 'OverrideRate'
+    ] | None = Field(default=None, alias='billingMethod')
+    severity: Literal['Low', 'Medium', 'High'] | None = None
+    impact: Literal['Low', 'Medium', 'High'] | None = None
+    assigned_by: MemberReference | None = Field(default=None, alias='assignedBy')
+    schedule_days_before: int | None = Field(default=None, alias='scheduleDaysBefore')
+    service_days_before: int | None = Field(default=None, alias='serviceDaysBefore')
+    attach_schedule_to_new_service_flag: bool | None = Field(
+        default=None, alias='attachScheduleToNewServiceFlag'
+    )
+    template_flag: bool | None = Field(default=None, alias='templateFlag')
+    email_contact_flag: bool | None = Field(default=None, alias='emailContactFlag')
+    email_resource_flag: bool | None = Field(default=None, alias='emailResourceFlag')
+    email_cc_flag: bool | None = Field(default=None, alias='emailCCFlag')
+    email_cc: str | None = Field(default=None, alias='emailCC')
+    restrict_downpayment_flag: bool | None = Field(
+        default=None, alias='restrictDownpaymentFlag'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.priorityreference import PriorityReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
+from pyconnectwise.models.manage.servicesourcereference import ServiceSourceReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.servicesubtypereference import ServiceSubTypeReference
+from pyconnectwise.models.manage.serviceteamreference import ServiceTeamReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceTicketLink(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    enabled_flag: bool | None = Field(default=None, alias='enabledFlag')
+    link_text: str = Field(..., alias='linkText')
+    """
+     Max length: 50;
+    """
+    url: str
+    """
+     Max length: 1000;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceTicketNote(ConnectWiseModel):
+    id: int | None = None
+    note_type: Literal['TicketNote', 'TimeEntryNote', 'MeetingNote'] | None = Field(
+        default=None, alias='noteType'
+    )
+    ticket: TicketReference | None = None
+    text: str | None = None
+    is_markdown_flag: bool | None = Field(default=None, alias='isMarkdownFlag')
+    detail_description_flag: bool | None = Field(
+        default=None, alias='detailDescriptionFlag'
+    )
+    internal_analysis_flag: bool | None = Field(
+        default=None, alias='internalAnalysisFlag'
+    )
+    resolution_flag: bool | None = Field(default=None, alias='resolutionFlag')
+    time_start: str | None = Field(default=None, alias='timeStart')
+    time_end: str | None = Field(default=None, alias='timeEnd')
+    bundled_flag: bool | None = Field(default=None, alias='bundledFlag')
+    merged_flag: bool | None = Field(default=None, alias='mergedFlag')
+    issue_flag: bool | None = Field(default=None, alias='issueFlag')
+    original_author: str | None = Field(default=None, alias='originalAuthor')
+    member: MemberReference | None = None
+    contact: ContactReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SetupScreen(ConnectWiseModel):
+    id: int | None = None
+    category: str | None = None
+    name: str | None = None
+    description: str | None = None
+    module_description: str | None = Field(default=None, alias='moduleDescription')
+    module_identifier: str | None = Field(default=None, alias='moduleIdentifier')
+    module_name: str | None = Field(default=None, alias='moduleName')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
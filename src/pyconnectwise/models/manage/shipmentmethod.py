@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ShipmentMethod(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    tracking_url: str | None = Field(default=None, alias='trackingUrl')
+    """
+     Max length: 200;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
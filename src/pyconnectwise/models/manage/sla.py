@@ -0,0 +1,65 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SLA(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 25;
+    """
+    based_on: Literal['AllHours', 'Customer', 'MyCalendar', 'Custom'] = Field(
+        ..., alias='basedOn'
+    )
+    custom_calendar: CalendarReference | None = Field(
+        default=None, alias='customCalendar'
+    )
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    application_order: int | None = Field(default=None, alias='applicationOrder')
+    hi_impact_hi_urgency: PriorityReference | None = Field(
+        default=None, alias='hiImpactHiUrgency'
+    )
+    hi_impact_med_urgency: PriorityReference | None = Field(
+        default=None, alias='hiImpactMedUrgency'
+    )
+    hi_impact_low_urgency: PriorityReference | None = Field(
+        default=None, alias='hiImpactLowUrgency'
+    )
+    med_impact_hi_urgency: PriorityReference | None = Field(
+        default=None, alias='medImpactHiUrgency'
+    )
+    med_impact_med_urgency: PriorityReference | None = Field(
+        default=None, alias='medImpactMedUrgency'
+    )
+    med_impact_low_urgency: PriorityReference | None = Field(
+        default=None, alias='medImpactLowUrgency'
+    )
+    low_impact_hi_urgency: PriorityReference | None = Field(
+        default=None, alias='lowImpactHiUrgency'
+    )
+    low_impact_med_urgency: PriorityReference | None = Field(
+        default=None, alias='lowImpactMedUrgency'
+    )
+    low_impact_low_urgency: PriorityReference | None = Field(
+        default=None, alias='lowImpactLowUrgency'
+    )
+    respond_hours: float | None = Field(default=None, alias='respondHours')
+    respond_percent: int | None = Field(default=None, alias='respondPercent')
+    plan_within: float | None = Field(default=None, alias='planWithin')
+    plan_within_percent: int | None = Field(default=None, alias='planWithinPercent')
+    resolution_hours: float | None = Field(default=None, alias='resolutionHours')
+    resolution_percent: int | None = Field(default=None, alias='resolutionPercent')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.calendarreference import CalendarReference
+from pyconnectwise.models.manage.priorityreference import PriorityReference
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SLAPriority(ConnectWiseModel):
+    id: int | None = None
+    priority: PriorityReference | None = None
+    respond_hours: float | None = Field(default=None, alias='respondHours')
+    respond_percent: int | None = Field(default=None, alias='respondPercent')
+    plan_within: float | None = Field(default=None, alias='planWithin')
+    plan_within_percent: int | None = Field(default=None, alias='planWithinPercent')
+    resolution_hours: float | None = Field(default=None, alias='resolutionHours')
+    resolution_percent: int | None = Field(default=None, alias='resolutionPercent')
+    sla: SLAReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.priorityreference import PriorityReference
+from pyconnectwise.models.manage.slareference import SLAReference
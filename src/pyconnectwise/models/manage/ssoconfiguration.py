@@ -0,0 +1,95 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SsoConfiguration(ConnectWiseModel):
+    id: int | None = None
+    """
+    Unique identifier of the SSO Configuration
+    """
+    name: str
+    """
+    Descriptor of the SSO Configuration Max length: 100;
+    """
+    sso_type: Literal['CWSSO', 'SAML'] = Field(..., alias='ssoType')
+    """
+    Type of SSO Configuration
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    """
+    Whether the SSO configuration is not active
+    """
+    saml_entity_id: str | None = Field(default=None, alias='samlEntityId')
+    """
+    SAML Identity Provider Id Max length: 1000;
+    """
+    saml_sign_in_url: str | None = Field(default=None, alias='samlSignInUrl')
+    """
+    Sign in url for the SAML Identity Provider Max length: 1000;
+    """
+    saml_idp_certificate: str | None = Field(default=None, alias='samlIdpCertificate')
+    """
+    Public certificate for Identity Provider signatures
+    """
+    saml_certificate_name: str | None = Field(default=None, alias='samlCertificateName')
+    """
+    Name of the SAML certificate. Metadata on SAML_Idp_Certificate
+    """
+    saml_certificate_issued_to: str | None = Field(
+        default=None, alias='samlCertificateIssuedTo'
+    )
+    """
+    Who the SAML certificate was issued to. Metadata on SAML_Idp_Certificate
+    """
+    saml_certificate_thumbprint: str | None = Field(
+        default=None, alias='samlCertificateThumbprint'
+    )
+    """
+    Thumbprint of the SAML certificate. Metadata on SAML_Idp_Certificate
+    """
+    saml_certificate_valid_from: datetime | None = Field(
+        default=None, alias='samlCertificateValidFrom'
+    )
+    """
+    Date when the SAML certificate becomes valid. Metadata on SAML_Idp_Certificate
+    """
+    saml_certificate_valid_to: datetime | None = Field(
+        default=None, alias='samlCertificateValidTo'
+    )
+    """
+    Date when the SAML certificate is no longer valid. Metadata on SAML_Idp_Certificate
+    """
+    location_ids: list[int] = Field(..., alias='locationIds')
+    """
+    The locations where the SAML Idp Configuration is used
+    """
+    client_id: str | None = Field(default=None, alias='clientId')
+    """
+    Client identity for this configuration of ConnectWise SSO Max length: 1000;
+    """
+    sts_base_url: str | None = Field(default=None, alias='stsBaseUrl')
+    """
+    Sign in URL for ConnectWise SSO
+    """
+    sts_user_admin_url: str | None = Field(default=None, alias='stsUserAdminUrl')
+    """
+    User Admin Url for ConnectWise SSO
+    """
+    token: str | None = None
+    submitted_member_count: int | None = Field(
+        default=None, alias='submittedMemberCount'
+    )
+    all_members_submitted: bool | None = Field(
+        default=None, alias='allMembersSubmitted'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    is_sso_on_by_default: bool | None = Field(default=None, alias='isSsoOnByDefault')
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SsoUser(ConnectWiseModel):
+    id: int | None = None
+    sso_user_id: str | None = Field(default=None, alias='ssoUserId')
+    user_name: str | None = Field(default=None, alias='userName')
+    first_name: str | None = Field(default=None, alias='firstName')
+    last_name: str | None = Field(default=None, alias='lastName')
+    email: str | None = None
+    email_confirmed: bool | None = Field(default=None, alias='emailConfirmed')
+    disabled_flag: bool | None = Field(default=None, alias='disabledFlag')
+    linked_flag: bool | None = Field(default=None, alias='linkedFlag')
+    date_entered: str | None = Field(default=None, alias='dateEntered')
+    last_updated: str | None = Field(default=None, alias='lastUpdated')
+    linked_member: MemberReference | None = Field(default=None, alias='linkedMember')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class State(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 50;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    country: CountryReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.countryreference import CountryReference
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SurveyOption(ConnectWiseModel):
+    id: int | None = None
+    caption: str
+    """
+     Max length: 100;
+    """
+    points: int
+    visibleflag: bool | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SurveyQuestionValue(ConnectWiseModel):
+    id: int | None = None
+    survey: SurveyReference | None = None
+    question: SurveyQuestionReference | None = None
+    value: str
+    """
+     Max length: 1000;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    point_value: int | None = Field(default=None, alias='pointValue')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.surveyquestionreference import SurveyQuestionReference
+from pyconnectwise.models.manage.surveyreference import SurveyReference
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SurveyResult(ConnectWiseModel):
+    id: int | None = None
+    ticket_id: int = Field(..., alias='ticketId')
+    email_address: str | None = Field(default=None, alias='emailAddress')
+    footer_response: str | None = Field(default=None, alias='footerResponse')
+    contact_me_flag: bool | None = Field(default=None, alias='contactMeFlag')
+    contact: ContactReference | None = None
+    results: list[SurveyResultDetail] | None = None
+    total_points: int | None = Field(default=None, alias='totalPoints')
+    company: CompanyReference | None = None
+    survey_id: int | None = Field(default=None, alias='surveyId')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.surveyresultdetail import SurveyResultDetail
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SurveyResultDetail(ConnectWiseModel):
+    question_id: int | None = Field(default=None, alias='questionId')
+    answer: dict[str, Any] | None = None
+    """
+    If question type is Selection, this should be the option array index.
+    """
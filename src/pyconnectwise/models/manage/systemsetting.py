@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SystemSetting(ConnectWiseModel):
+    id: int | None = None
+    description: str | None = None
+    value: str
+    value_type: str | None = Field(default=None, alias='valueType')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Task(ConnectWiseModel):
+    id: int | None = None
+    ticket_id: int | None = Field(default=None, alias='ticketId')
+    notes: str | None = None
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    priority: int | None = None
+    schedule: ScheduleEntryReference | None = None
+    code: ServiceCodeReference | None = None
+    resolution: str | None = None
+    child_schedule_action: Literal['Transfer', 'Delete', 'Done'] | None = Field(
+        default=None, alias='childScheduleAction'
+    )
+    child_ticket_id: int | None = Field(default=None, alias='childTicketId')
+    summary: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.scheduleentryreference import ScheduleEntryReference
+from pyconnectwise.models.manage.servicecodereference import ServiceCodeReference
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxableExpenseTypeLevel(ConnectWiseModel):
+    id: int | None = None
+    tax_code_level: TaxCodeLevelReference | None = Field(
+        default=None, alias='taxCodeLevel'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.taxcodelevelreference import TaxCodeLevelReference
@@ -0,0 +1,304 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxCode(ConnectWiseModel):
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 8;
+    """
+    description: str
+    """
+     Max length: 50;
+    """
+    invoice_caption: str = Field(..., alias='invoiceCaption')
+    """
+     Max length: 25;
+    """
+    country: CountryReference | None = None
+    effective_date: datetime = Field(..., alias='effectiveDate')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    display_on_invoice_flag: bool | None = Field(
+        default=None, alias='displayOnInvoiceFlag'
+    )
+    canada_calculate_gst_flag: bool | None = Field(
+        default=None, alias='canadaCalculateGSTFlag'
+    )
+    cancel_date: datetime | None = Field(default=None, alias='cancelDate')
+    level_one_rate: float | None = Field(default=None, alias='levelOneRate')
+    level_one_rate_type: Literal['Amount', 'Percent'] | None = Field(
+        default=None, alias='levelOneRateType'
+    )
+    level_one_taxable_max: float | None = Field(
+        default=None, alias='levelOneTaxableMax'
+    )
+    level_one_caption: str | None = Field(default=None, alias='levelOneCaption')
+    """
+     Max length: 25;
+    """
+    level_one_tax_code_xref: str | None = Field(
+        default=None, alias='levelOneTaxCodeXref'
+    )
+    """
+     Max length: 50;
+    """
+    level_one_agency_xref: str | None = Field(default=None, alias='levelOneAgencyXref')
+    """
+     Max length: 100;
+    """
+    level_one_services_flag: bool | None = Field(
+        default=None, alias='levelOneServicesFlag'
+    )
+    level_one_expenses_flag: bool | None = Field(
+        default=None, alias='levelOneExpensesFlag'
+    )
+    level_one_products_flag: bool | None = Field(
+        default=None, alias='levelOneProductsFlag'
+    )
+    level_one_apply_single_unit_flag: bool | None = Field(
+        default=None, alias='levelOneApplySingleUnitFlag'
+    )
+    level_one_apply_single_unit_min: float | None = Field(
+        default=None, alias='levelOneApplySingleUnitMin'
+    )
+    level_one_apply_single_unit_max: float | None = Field(
+        default=None, alias='levelOneApplySingleUnitMax'
+    )
+    level_two_rate: float | None = Field(default=None, alias='levelTwoRate')
+    level_two_rate_type: Literal['Amount', 'Percent'] | None = Field(
+        default=None, alias='levelTwoRateType'
+    )
+    level_two_taxable_max: float | None = Field(
+        default=None, alias='levelTwoTaxableMax'
+    )
+    level_two_caption: str | None = Field(default=None, alias='levelTwoCaption')
+    """
+     Max length: 25;
+    """
+    level_two_tax_code_xref: str | None = Field(
+        default=None, alias='levelTwoTaxCodeXref'
+    )
+    """
+     Max length: 50;
+    """
+    level_two_agency_xref: str | None = Field(default=None, alias='levelTwoAgencyXref')
+    """
+     Max length: 100;
+    """
+    level_two_services_flag: bool | None = Field(
+        default=None, alias='levelTwoServicesFlag'
+    )
+    level_two_expenses_flag: bool | None = Field(
+        default=None, alias='levelTwoExpensesFlag'
+    )
+    level_two_products_flag: bool | None = Field(
+        default=None, alias='levelTwoProductsFlag'
+    )
+    level_two_apply_single_unit_flag: bool | None = Field(
+        default=None, alias='levelTwoApplySingleUnitFlag'
+    )
+    level_two_apply_single_unit_min: float | None = Field(
+        default=None, alias='levelTwoApplySingleUnitMin'
+    )
+    level_two_apply_single_unit_max: float | None = Field(
+        default=None, alias='levelTwoApplySingleUnitMax'
+    )
+    level_three_rate: float | None = Field(default=None, alias='levelThreeRate')
+    level_three_rate_type: Literal['Amount', 'Percent'] | None = Field(
+        default=None, alias='levelThreeRateType'
+    )
+    level_three_taxable_max: float | None = Field(
+        default=None, alias='levelThreeTaxableMax'
+    )
+    level_three_caption: str | None = Field(default=None, alias='levelThreeCaption')
+    """
+     Max length: 25;
+    """
+    level_three_tax_code_xref: str | None = Field(
+        default=None, alias='levelThreeTaxCodeXref'
+    )
+    """
+     Max length: 50;
+    """
+    level_three_agency_xref: str | None = Field(
+        default=None, alias='levelThreeAgencyXref'
+    )
+    """
+     Max length: 100;
+    """
+    level_three_services_flag: bool | None = Field(
+        default=None, alias='levelThreeServicesFlag'
+    )
+    level_three_expenses_flag: bool | None = Field(
+        default=None, alias='levelThreeExpensesFlag'
+    )
+    level_three_products_flag: bool | None = Field(
+        default=None, alias='levelThreeProductsFlag'
+    )
+    level_three_apply_single_unit_flag: bool | None = Field(
+        default=None, alias='levelThreeApplySingleUnitFlag'
+    )
+    level_three_apply_single_unit_min: float | None = Field(
+        default=None, alias='levelThreeApplySingleUnitMin'
+    )
+    level_three_apply_single_unit_max: float | None = Field(
+        default=None, alias='levelThreeApplySingleUnitMax'
+    )
+    level_four_rate: float | None = Field(default=None, alias='levelFourRate')
+    level_four_rate_type: Literal['Amount', 'Percent'] | None = Field(
+        default=None, alias='levelFourRateType'
+    )
+    level_four_taxable_max: float | None = Field(
+        default=None, alias='levelFourTaxableMax'
+    )
+    level_four_caption: str | None = Field(default=None, alias='levelFourCaption')
+    """
+     Max length: 25;
+    """
+    level_four_tax_code_xref: str | None = Field(
+        default=None, alias='levelFourTaxCodeXref'
+    )
+    """
+     Max length: 50;
+    """
+    level_four_agency_xref: str | None = Field(
+        default=None, alias='levelFourAgencyXref'
+    )
+    """
+     Max length: 100;
+    """
+    level_four_services_flag: bool | None = Field(
+        default=None, alias='levelFourServicesFlag'
+    )
+    level_four_expenses_flag: bool | None = Field(
+        default=None, alias='levelFourExpensesFlag'
+    )
+    level_four_products_flag: bool | None = Field(
+        default=None, alias='levelFourProductsFlag'
+    )
+    level_four_apply_single_unit_flag: bool | None = Field(
+        default=None, alias='levelFourApplySingleUnitFlag'
+    )
+    level_four_apply_single_unit_min: float | None = Field(
+        default=None, alias='levelFourApplySingleUnitMin'
+    )
+    level_four_apply_single_unit_max: float | None = Field(
+        default=None, alias='levelFourApplySingleUnitMax'
+    )
+    level_five_rate: float | None = Field(default=None, alias='levelFiveRate')
+    level_five_rate_type: Literal['Amount', 'Percent'] | None = Field(
+        default=None, alias='levelFiveRateType'
+    )
+    level_five_taxable_max: float | None = Field(
+        default=None, alias='levelFiveTaxableMax'
+    )
+    level_five_caption: str | None = Field(default=None, alias='levelFiveCaption')
+    """
+     Max length: 25;
+    """
+    level_five_tax_code_xref: str | None = Field(
+        default=None, alias='levelFiveTaxCodeXref'
+    )
+    """
+     Max length: 50;
+    """
+    level_five_agency_xref: str | None = Field(
+        default=None, alias='levelFiveAgencyXref'
+    )
+    """
+     Max length: 100;
+    """
+    level_five_services_flag: bool | None = Field(
+        default=None, alias='levelFiveServicesFlag'
+    )
+    level_five_expenses_flag: bool | None = Field(
+        default=None, alias='levelFiveExpensesFlag'
+    )
+    level_five_products_flag: bool | None = Field(
+        default=None, alias='levelFiveProductsFlag'
+    )
+    level_five_apply_single_unit_flag: bool | None = Field(
+        default=None, alias='levelFiveApplySingleUnitFlag'
+    )
+    level_five_apply_single_unit_min: float | None = Field(
+        default=None, alias='levelFiveApplySingleUnitMin'
+    )
+    level_five_apply_single_unit_max: float | None = Field(
+        default=None, alias='levelFiveApplySingleUnitMax'
+    )
+    level_six_rate: float | None = Field(default=None, alias='levelSixRate')
+    level_six_rate_type: Literal['Amount', 'Percent'] | None = Field(
+        default=None, alias='levelSixRateType'
+    )
+    level_six_taxable_max: float | None = Field(
+        default=None, alias='levelSixTaxableMax'
+    )
+    level_six_caption: str | None = Field(default=None, alias='levelSixCaption')
+    """
+     Max length: 25;
+    """
+    level_six_tax_code_xref: str | None = Field(
+        default=None, alias='levelSixTaxCodeXref'
+    )
+    """
+     Max length: 50;
+    """
+    level_six_agency_xref: str | None = Field(default=None, alias='levelSixAgencyXref')
+    """
+     Max length: 100;
+    """
+    level_six_services_flag: bool | None = Field(
+        default=None, alias='levelSixServicesFlag'
+    )
+    level_six_expenses_flag: bool | None = Field(
+        default=None, alias='levelSixExpensesFlag'
+    )
+    level_six_products_flag: bool | None = Field(
+        default=None, alias='levelSixProductsFlag'
+    )
+    level_six_apply_single_unit_flag: bool | None = Field(
+        default=None, alias='levelSixApplySingleUnitFlag'
+    )
+    level_six_apply_single_unit_min: float | None = Field(
+        default=None, alias='levelSixApplySingleUnitMin'
+    )
+    level_six_apply_single_unit_max: float | None = Field(
+        default=None, alias='levelSixApplySingleUnitMax'
+    )
+    work_role_ids: list[int] | None = Field(default=None, alias='workRoleIds')
+    """
+    Array of work role exemptions for the tax code.
+    """
+    add_all_work_roles: bool | None = Field(default=None, alias='addAllWorkRoles')
+    remove_all_work_roles: bool | None = Field(default=None, alias='removeAllWorkRoles')
+    expense_type_ids: list[int] | None = Field(default=None, alias='expenseTypeIds')
+    """
+    Array of expense type exemptions for the tax code.
+    """
+    add_all_expense_types: bool | None = Field(default=None, alias='addAllExpenseTypes')
+    remove_all_expense_types: bool | None = Field(
+        default=None, alias='removeAllExpenseTypes'
+    )
+    product_type_ids: list[int] | None = Field(default=None, alias='productTypeIds')
+    """
+    Array of product type exemptions for the tax code.
+    """
+    add_all_product_types: bool | None = Field(default=None, alias='addAllProductTypes')
+    remove_all_product_types: bool | None = Field(
+        default=None, alias='removeAllProductTypes'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.countryreference import CountryReference
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxCodeInfo(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    description: str | None = None
+    effective_date: str | None = Field(default=None, alias='effectiveDate')
+    cancel_date: str | None = Field(default=None, alias='cancelDate')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxCodeLevel(ConnectWiseModel):
+    id: int | None = None
+    tax_level: int | None = Field(default=None, alias='taxLevel')
+    tax_rate: float = Field(..., alias='taxRate')
+    rate_type: Literal['Amount', 'Percent'] = Field(..., alias='rateType')
+    taxable_max: float | None = Field(default=None, alias='taxableMax')
+    caption: str | None = None
+    """
+     Max length: 25;
+    """
+    tax_code_xref: str | None = Field(default=None, alias='taxCodeXref')
+    """
+     Max length: 50;
+    """
+    agency_xref: str | None = Field(default=None, alias='agencyXref')
+    """
+     Max length: 100;
+    """
+    tax_services_flag: bool | None = Field(default=None, alias='taxServicesFlag')
+    tax_expenses_flag: bool | None = Field(default=None, alias='taxExpensesFlag')
+    tax_products_flag: bool | None = Field(default=None, alias='taxProductsFlag')
+    single_unit_flag: bool | None = Field(default=None, alias='singleUnitFlag')
+    single_unit_minimum: float | None = Field(default=None, alias='singleUnitMinimum')
+    single_unit_maximum: float | None = Field(default=None, alias='singleUnitMaximum')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,44 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxCodeXRef(ConnectWiseModel):
+    id: int | None = None
+    description: str
+    """
+     Max length: 50;
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    level_one: Literal['NonTaxable', 'Taxable'] | None = Field(
+        default=None, alias='levelOne'
+    )
+    level_two: Literal['NonTaxable', 'Taxable'] | None = Field(
+        default=None, alias='levelTwo'
+    )
+    level_three: Literal['NonTaxable', 'Taxable'] | None = Field(
+        default=None, alias='levelThree'
+    )
+    level_four: Literal['NonTaxable', 'Taxable'] | None = Field(
+        default=None, alias='levelFour'
+    )
+    level_five: Literal['NonTaxable', 'Taxable'] | None = Field(
+        default=None, alias='levelFive'
+    )
+    level_six: Literal['NonTaxable', 'Taxable'] | None = Field(
+        default=None, alias='levelSix'
+    )
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    taxable_levels: list[int] | None = Field(default=None, alias='taxableLevels')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
@@ -0,0 +1,65 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxIntegration(ConnectWiseModel):
+    tax_integration_type: Literal['Avalara'] | None = Field(
+        default=None, alias='taxIntegrationType'
+    )
+    id: int | None = None
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    """
+     Max length: 50;
+    """
+    license_key: str | None = Field(default=None, alias='licenseKey')
+    """
+     Max length: 50;
+    """
+    service_url: str | None = Field(default=None, alias='serviceUrl')
+    """
+     Max length: 250;
+    """
+    company_code: str | None = Field(default=None, alias='companyCode')
+    """
+     Max length: 50;
+    """
+    time_tax_code: str | None = Field(default=None, alias='timeTaxCode')
+    """
+     Max length: 50;
+    """
+    expense_tax_code: str | None = Field(default=None, alias='expenseTaxCode')
+    """
+     Max length: 50;
+    """
+    product_tax_code: str | None = Field(default=None, alias='productTaxCode')
+    """
+     Max length: 50;
+    """
+    invoice_amount_tax_code: str | None = Field(
+        default=None, alias='invoiceAmountTaxCode'
+    )
+    """
+     Max length: 50;
+    """
+    enabled_flag: bool | None = Field(default=None, alias='enabledFlag')
+    commit_transactions_flag: bool | None = Field(
+        default=None, alias='commitTransactionsFlag'
+    )
+    sales_invoice_flag: bool | None = Field(default=None, alias='salesInvoiceFlag')
+    freight_tax_code: str | None = Field(default=None, alias='freightTaxCode')
+    """
+     Max length: 50;
+    """
+    accounting_integration_flag: bool | None = Field(
+        default=None, alias='accountingIntegrationFlag'
+    )
+    tax_line_flag: bool | None = Field(default=None, alias='taxLineFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxIntegrationInfo(ConnectWiseModel):
+    id: int | None = None
+    enabled_flag: bool | None = Field(default=None, alias='enabledFlag')
+    tax_integration_type: Literal['Avalara'] | None = Field(
+        default=None, alias='taxIntegrationType'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Team(ConnectWiseModel):
+    id: int | None = None
+    type: Literal['Individual', 'Team']
+    member: MemberReference | None = None
+    sales_team: SalesTeamReference | None = Field(default=None, alias='salesTeam')
+    commission_percent: int | None = Field(default=None, alias='commissionPercent')
+    referral_flag: bool | None = Field(default=None, alias='referralFlag')
+    opportunity_id: int | None = Field(default=None, alias='opportunityId')
+    responsible_flag: bool | None = Field(default=None, alias='responsibleFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.salesteamreference import SalesTeamReference
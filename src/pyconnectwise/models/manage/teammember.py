@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TeamMember(ConnectWiseModel):
+    id: int | None = None
+    board: BoardReference | None = None
+    team: ServiceTeamReference | None = None
+    member: MemberReference | None = None
+    team_leader_flag: bool | None = Field(default=None, alias='teamLeaderFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.serviceteamreference import ServiceTeamReference
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TeamRole(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 20;
+    """
+    account_manager_flag: bool | None = Field(default=None, alias='accountManagerFlag')
+    tech_flag: bool | None = Field(default=None, alias='techFlag')
+    sales_flag: bool | None = Field(default=None, alias='salesFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
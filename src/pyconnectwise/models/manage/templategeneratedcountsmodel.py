@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TemplateGeneratedCountsModel(ConnectWiseModel):
+    service_count: int | None = Field(default=None, alias='serviceCount')
+    schedule_count: int | None = Field(default=None, alias='scheduleCount')
@@ -0,0 +1,296 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Ticket(ConnectWiseModel):
+    id: int | None = None
+    summary: str
+    """
+     Max length: 100;
+    """
+    record_type: Literal[
+        'ProjectIssue', 'ProjectTicket', 'ServiceTicket'
+    ] | None = Field(default=None, alias='recordType')
+    board: BoardReference | None = None
+    status: ServiceStatusReference | None = None
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    company: CompanyReference | None = None
+    site: SiteReference | None = None
+    site_name: str | None = Field(default=None, alias='siteName')
+    """
+     Max length: 50;
+    """
+    address_line1: str | None = Field(default=None, alias='addressLine1')
+    """
+     Max length: 50;
+    """
+    address_line2: str | None = Field(default=None, alias='addressLine2')
+    """
+     Max length: 50;
+    """
+    city: str | None = None
+    """
+     Max length: 50;
+    """
+    state_identifier: str | None = Field(default=None, alias='stateIdentifier')
+    """
+     Max length: 50;
+    """
+    zip: str | None = None
+    """
+     Max length: 12;
+    """
+    country: CountryReference | None = None
+    contact: ContactReference | None = None
+    contact_name: str | None = Field(default=None, alias='contactName')
+    """
+     Max length: 62;
+    """
+    contact_phone_number: str | None = Field(default=None, alias='contactPhoneNumber')
+    """
+     Max length: 20;
+    """
+    contact_phone_extension: str | None = Field(
+        default=None, alias='contactPhoneExtension'
+    )
+    """
+     Max length: 15;
+    """
+    contact_email_address: str | None = Field(default=None, alias='contactEmailAddress')
+    """
+     Max length: 250;
+    """
+    type: ServiceTypeReference | None = None
+    sub_type: ServiceSubTypeReference | None = Field(default=None, alias='subType')
+    item: ServiceItemReference | None = None
+    team: ServiceTeamReference | None = None
+    owner: MemberReference | None = None
+    priority: PriorityReference | None = None
+    service_location: ServiceLocationReference | None = Field(
+        default=None, alias='serviceLocation'
+    )
+    source: ServiceSourceReference | None = None
+    required_date: datetime | None = Field(default=None, alias='requiredDate')
+    budget_hours: float | None = Field(default=None, alias='budgetHours')
+    opportunity: OpportunityReference | None = None
+    agreement: AgreementReference | None = None
+    severity: Literal['Low', 'Medium', 'High'] | None = None
+    """
+     Required On Updates;
+    """
+    impact: Literal['Low', 'Medium', 'High'] | None = None
+    """
+     Required On Updates;
+    """
+    external_x_ref: str | None = Field(default=None, alias='externalXRef')
+    """
+     Max length: 100;
+    """
+    po_number: str | None = Field(default=None, alias='poNumber')
+    """
+     Max length: 50;
+    """
+    knowledge_base_category_id: int | None = Field(
+        default=None, alias='knowledgeBaseCategoryId'
+    )
+    knowledge_base_sub_category_id: int | None = Field(
+        default=None, alias='knowledgeBaseSubCategoryId'
+    )
+    allow_all_clients_portal_view: bool | None = Field(
+        default=None, alias='allowAllClientsPortalView'
+    )
+    customer_updated_flag: bool | None = Field(
+        default=None, alias='customerUpdatedFlag'
+    )
+    automatic_email_contact_flag: bool | None = Field(
+        default=None, alias='automaticEmailContactFlag'
+    )
+    automatic_email_resource_flag: bool | None = Field(
+        default=None, alias='automaticEmailResourceFlag'
+    )
+    automatic_email_cc_flag: bool | None = Field(
+        default=None, alias='automaticEmailCcFlag'
+    )
+    automatic_email_cc: str | None = Field(default=None, alias='automaticEmailCc')
+    """
+     Max length: 1000;
+    """
+    initial_description: str | None = Field(default=None, alias='initialDescription')
+    """
+    Only available for POST, will not be returned in the response.
+    """
+    initial_internal_analysis: str | None = Field(
+        default=None, alias='initialInternalAnalysis'
+    )
+    """
+    Only available for POST, will not be returned in the response.
+    """
+    initial_resolution: str | None = Field(default=None, alias='initialResolution')
+    """
+    Only available for POST, will not be returned in the response.
+    """
+    initial_description_from: str | None = Field(
+        default=None, alias='initialDescriptionFrom'
+    )
+    contact_email_lookup: str | None = Field(default=None, alias='contactEmailLookup')
+    process_notifications: bool | None = Field(
+        default=None, alias='processNotifications'
+    )
+    """
+    Can be set to false to skip notification processing when adding or updating a ticket (Defaults to True).
+    """
+    skip_callback: bool | None = Field(default=None, alias='skipCallback')
+    closed_date: str | None = Field(default=None, alias='closedDate')
+    closed_by: str | None = Field(default=None, alias='closedBy')
+    closed_flag: bool | None = Field(default=None, alias='closedFlag')
+    actual_hours: float | None = Field(default=None, alias='actualHours')
+    approved: bool | None = None
+    estimated_expense_cost: float | None = Field(
+        default=None, alias='estimatedExpenseCost'
+    )
+    estimated_expense_revenue: float | None = Field(
+        default=None, alias='estimatedExpenseRevenue'
+    )
+    estimated_product_cost: float | None = Field(
+        default=None, alias='estimatedProductCost'
+    )
+    estimated_product_revenue: float | None = Field(
+        default=None, alias='estimatedProductRevenue'
+    )
+    estimated_time_cost: float | None = Field(default=None, alias='estimatedTimeCost')
+    estimated_time_revenue: float | None = Field(
+        default=None, alias='estimatedTimeRevenue'
+    )
+    billing_method: Literal[
+        'ActualRates', 'FixedFee', 'NotToExceed', 'OverrideRate'
+    ] | None = Field(default=None, alias='billingMethod')
+    billing_amount: float | None = Field(default=None, alias='billingAmount')
+    hourly_rate: float | None = Field(default=None, alias='hourlyRate')
+    sub_billing_method: Literal[
+        'ActualRates', 'FixedFee', 'NotToExceed', 'OverrideRate'
+    ] | None = Field(default=None, alias='subBillingMethod')
+    sub_billing_amount: float | None = Field(default=None, alias='subBillingAmount')
+    sub_date_accepted: str | None = Field(default=None, alias='subDateAccepted')
+    date_resolved: str | None = Field(default=None, alias='dateResolved')
+    date_resplan: str | None = Field(default=None, alias='dateResplan')
+    date_responded: str | None = Field(default=None, alias='dateResponded')
+    resolve_minutes: int | None = Field(default=None, alias='resolveMinutes')
+    res_plan_minutes: int | None = Field(default=None, alias='resPlanMinutes')
+    respond_minutes: int | None = Field(default=None, alias='respondMinutes')
+    is_in_sla: bool | None = Field(default=None, alias='isInSla')
+    knowledge_base_link_id: int | None = Field(
+        default=None, alias='knowledgeBaseLinkId'
+    )
+    resources: str | None = None
+    parent_ticket_id: int | None = Field(default=None, alias='parentTicketId')
+    has_child_ticket: bool | None = Field(default=None, alias='hasChildTicket')
+    has_merged_child_ticket_flag: bool | None = Field(
+        default=None, alias='hasMergedChildTicketFlag'
+    )
+    knowledge_base_link_type: Literal[
+        'Activity',
+        'ProjectIssue',
+        'KnowledgeBaseArticle',
+        'ProjectTicket',
+        'ServiceTicket',
+        'Time',
+    ] | None = Field(default=None, alias='knowledgeBaseLinkType')
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge', 'NoDefault'] | None = Field(
+        default=None, alias='billTime'
+    )
+    bill_expenses: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billExpenses')
+    bill_products: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billProducts')
+    predecessor_type: Literal['Ticket', 'Phase'] | None = Field(
+        default=None, alias='predecessorType'
+    )
+    predecessor_id: int | None = Field(default=None, alias='predecessorId')
+    predecessor_closed_flag: bool | None = Field(
+        default=None, alias='predecessorClosedFlag'
+    )
+    lag_days: int | None = Field(default=None, alias='lagDays')
+    lag_nonworking_days_flag: bool | None = Field(
+        default=None, alias='lagNonworkingDaysFlag'
+    )
+    estimated_start_date: datetime | None = Field(
+        default=None, alias='estimatedStartDate'
+    )
+    duration: int | None = None
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    sla: SLAReference | None = None
+    sla_status: str | None = Field(default=None, alias='slaStatus')
+    request_for_change_flag: bool | None = Field(
+        default=None, alias='requestForChangeFlag'
+    )
+    currency: CurrencyReference | None = None
+    merged_parent_ticket: TicketReference | None = Field(
+        default=None, alias='mergedParentTicket'
+    )
+    integrator_tags: list[str] | None = Field(default=None, alias='integratorTags')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    escalation_start_date_utc: str | None = Field(
+        default=None, alias='escalationStartDateUTC'
+    )
+    escalation_level: int | None = Field(default=None, alias='escalationLevel')
+    minutes_before_waiting: int | None = Field(
+        default=None, alias='minutesBeforeWaiting'
+    )
+    responded_skipped_minutes: int | None = Field(
+        default=None, alias='respondedSkippedMinutes'
+    )
+    resplan_skipped_minutes: int | None = Field(
+        default=None, alias='resplanSkippedMinutes'
+    )
+    responded_hours: float | None = Field(default=None, alias='respondedHours')
+    responded_by: str | None = Field(default=None, alias='respondedBy')
+    resplan_hours: float | None = Field(default=None, alias='resplanHours')
+    resplan_by: str | None = Field(default=None, alias='resplanBy')
+    resolution_hours: float | None = Field(default=None, alias='resolutionHours')
+    resolved_by: str | None = Field(default=None, alias='resolvedBy')
+    minutes_waiting: int | None = Field(default=None, alias='minutesWaiting')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.countryreference import CountryReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.opportunityreference import OpportunityReference
+from pyconnectwise.models.manage.priorityreference import PriorityReference
+from pyconnectwise.models.manage.slareference import SLAReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
+from pyconnectwise.models.manage.servicelocationreference import ServiceLocationReference
+from pyconnectwise.models.manage.servicesourcereference import ServiceSourceReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.servicesubtypereference import ServiceSubTypeReference
+from pyconnectwise.models.manage.serviceteamreference import ServiceTeamReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
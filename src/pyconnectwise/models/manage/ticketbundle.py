@@ -0,0 +1,12 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketBundle(ConnectWiseModel):
+    child_ticket_ids: list[int] | None = Field(default=None, alias='childTicketIds')
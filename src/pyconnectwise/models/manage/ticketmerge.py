@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketMerge(ConnectWiseModel):
+    merge_ticket_ids: list[int] = Field(..., alias='mergeTicketIds')
+    status: ServiceStatusReference | None = None
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketNote(ConnectWiseModel):
+    id: int | None = None
+    ticket_id: int | None = Field(default=None, alias='ticketId')
+    text: str | None = None
+    detail_description_flag: bool | None = Field(
+        default=None, alias='detailDescriptionFlag'
+    )
+    internal_analysis_flag: bool | None = Field(
+        default=None, alias='internalAnalysisFlag'
+    )
+    resolution_flag: bool | None = Field(default=None, alias='resolutionFlag')
+    issue_flag: bool | None = Field(default=None, alias='issueFlag')
+    member: MemberReference | None = None
+    contact: ContactReference | None = None
+    customer_updated_flag: bool | None = Field(
+        default=None, alias='customerUpdatedFlag'
+    )
+    process_notifications: bool | None = Field(
+        default=None, alias='processNotifications'
+    )
+    internal_flag: bool | None = Field(default=None, alias='internalFlag')
+    external_flag: bool | None = Field(default=None, alias='externalFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.memberreference import MemberReference
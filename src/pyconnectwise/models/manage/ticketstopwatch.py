@@ -0,0 +1,66 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketStopwatch(ConnectWiseModel):
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    agreement: AgreementReference | None = None
+    billable_option: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billableOption')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    date_entered: datetime | None = Field(default=None, alias='dateEntered')
+    end_time: datetime | None = Field(default=None, alias='endTime')
+    id: int | None = None
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    location_id: int | None = Field(default=None, alias='locationId')
+    member: MemberReference | None = None
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    notes: str | None = None
+    """
+     Max length: 4000;
+    """
+    service_status: ServiceStatusReference | None = Field(
+        default=None, alias='serviceStatus'
+    )
+    start_time: datetime | None = Field(default=None, alias='startTime')
+    status: Literal['Reset', 'Running', 'Paused', 'Stopped']
+    ticket: TicketReference | None = None
+    ticket_mobile_guid: UUID | None = Field(default=None, alias='ticketMobileGuid')
+    total_pause_time: int | None = Field(default=None, alias='totalPauseTime')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    show_notes_in_discussion_flag: bool | None = Field(
+        default=None, alias='showNotesInDiscussionFlag'
+    )
+    show_notes_in_internal_flag: bool | None = Field(
+        default=None, alias='showNotesInInternalFlag'
+    )
+    show_notes_in_resolution_flag: bool | None = Field(
+        default=None, alias='showNotesInResolutionFlag'
+    )
+    email_notes_to_contact_flag: bool | None = Field(
+        default=None, alias='emailNotesToContactFlag'
+    )
+    email_notes_to_resources_flag: bool | None = Field(
+        default=None, alias='emailNotesToResourcesFlag'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketSync(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 80;
+    """
+    vendor_type: Literal['Zenith'] = Field(..., alias='vendorType')
+    integrator_login: IntegratorLoginReference | None = Field(
+        default=None, alias='integratorLogin'
+    )
+    company: CompanyReference | None = None
+    url: str
+    user_name: str | None = Field(default=None, alias='userName')
+    password: str | None = None
+    psg: str | None = None
+    problem_description_flag: bool | None = Field(
+        default=None, alias='problemDescriptionFlag'
+    )
+    internal_analysis_flag: bool | None = Field(
+        default=None, alias='internalAnalysisFlag'
+    )
+    resolution_flag: bool | None = Field(default=None, alias='resolutionFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.integratorloginreference import IntegratorLoginReference
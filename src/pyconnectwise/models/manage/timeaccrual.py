@@ -0,0 +1,68 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeAccrual(ConnectWiseModel):
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    vacation_flag: bool | None = Field(default=None, alias='vacationFlag')
+    """
+    if vacationFlag is set to false, system will clear out or ingore the values of vacationAvailableType, vacationCarryoverAllowedFlag, vacationCarryoverLimit
+    """
+    vacation_available_type: Literal['AnniversaryYear', 'CalendarYear'] | None = Field(
+        default=None, alias='vacationAvailableType'
+    )
+    vacation_carryover_allowed_flag: bool | None = Field(
+        default=None, alias='vacationCarryoverAllowedFlag'
+    )
+    vacation_carryover_limit: float | None = Field(
+        default=None, alias='vacationCarryoverLimit'
+    )
+    sick_flag: bool | None = Field(default=None, alias='sickFlag')
+    """
+    if sickFlag is set to false, system will clear out or ignore the values of sickAvailableType, sickCarryoverAllowedFlag, sickCarryoverLimit
+    """
+    sick_available_type: Literal['AnniversaryYear', 'CalendarYear'] | None = Field(
+        default=None, alias='sickAvailableType'
+    )
+    sick_carryover_allowed_flag: bool | None = Field(
+        default=None, alias='sickCarryoverAllowedFlag'
+    )
+    sick_carryover_limit: float | None = Field(default=None, alias='sickCarryoverLimit')
+    pto_flag: bool | None = Field(default=None, alias='ptoFlag')
+    """
+    if ptoFlag is set to false, system will clear out or ignore the values of ptoAvailableType, ptoCarryoverAllowedFlag, ptoCarryoverLimit
+    """
+    pto_available_type: Literal['AnniversaryYear', 'CalendarYear'] | None = Field(
+        default=None, alias='ptoAvailableType'
+    )
+    pto_carryover_allowed_flag: bool | None = Field(
+        default=None, alias='ptoCarryoverAllowedFlag'
+    )
+    pto_carryover_limit: float | None = Field(default=None, alias='ptoCarryoverLimit')
+    holiday_flag: bool | None = Field(default=None, alias='holidayFlag')
+    """
+    if holidayFlag is set to false, system will clear out or ignore the values of holidayAvailableType, holidayCarryoverAllowedFlag, holidayCarryoverLimit
+    """
+    holiday_available_type: Literal['AnniversaryYear', 'CalendarYear'] | None = Field(
+        default=None, alias='holidayAvailableType'
+    )
+    holiday_carryover_allowed_flag: bool | None = Field(
+        default=None, alias='holidayCarryoverAllowedFlag'
+    )
+    holiday_carryover_limit: float | None = Field(
+        default=None, alias='holidayCarryoverLimit'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
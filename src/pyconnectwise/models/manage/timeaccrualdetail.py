@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeAccrualDetail(ConnectWiseModel):
+    id: int | None = None
+    accrual_type: Literal['Holiday', 'PTO', 'Sick', 'Vacation'] = Field(
+        ..., alias='accrualType'
+    )
+    """
+    Available types are: Holiday, PTO, Sick and Vacation.
+    """
+    start_year: int = Field(..., alias='startYear')
+    end_year: int = Field(..., alias='endYear')
+    hours: float
+    time_accrual: TimeAccrualReference | None = Field(default=None, alias='timeAccrual')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.timeaccrualreference import TimeAccrualReference
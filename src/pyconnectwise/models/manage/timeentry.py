@@ -0,0 +1,119 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeEntry(ConnectWiseModel):
+    id: int | None = None
+    company: CompanyReference | None = None
+    charge_to_id: int | None = Field(default=None, alias='chargeToId')
+    """
+    If chargeToId is not specified, we asume you enter time against the company specified
+    """
+    charge_to_type: Literal[
+        'ServiceTicket', 'ProjectTicket', 'ChargeCode', 'Activity'
+    ] | None = Field(default=None, alias='chargeToType')
+    """
+    If chargeToId is not specified, we asume you enter time against the company specified
+    """
+    member: MemberReference | None = None
+    location_id: int | None = Field(default=None, alias='locationId')
+    business_unit_id: int | None = Field(default=None, alias='businessUnitId')
+    work_type: WorkTypeReference | None = Field(default=None, alias='workType')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    agreement: AgreementReference | None = None
+    time_start: datetime = Field(..., alias='timeStart')
+    time_end: datetime | None = Field(default=None, alias='timeEnd')
+    hours_deduct: float | None = Field(default=None, alias='hoursDeduct')
+    actual_hours: float | None = Field(default=None, alias='actualHours')
+    billable_option: Literal[
+        'Billable', 'DoNotBill', 'NoCharge', 'NoDefault'
+    ] | None = Field(default=None, alias='billableOption')
+    """
+     Required On Updates;
+    """
+    notes: str | None = None
+    internal_notes: str | None = Field(default=None, alias='internalNotes')
+    add_to_detail_description_flag: bool | None = Field(
+        default=None, alias='addToDetailDescriptionFlag'
+    )
+    add_to_internal_analysis_flag: bool | None = Field(
+        default=None, alias='addToInternalAnalysisFlag'
+    )
+    add_to_resolution_flag: bool | None = Field(
+        default=None, alias='addToResolutionFlag'
+    )
+    email_resource_flag: bool | None = Field(default=None, alias='emailResourceFlag')
+    """
+    This is an action flag. To update this value use the /service/tickets endpoint automaticEmailResourceFlag field
+    """
+    email_contact_flag: bool | None = Field(default=None, alias='emailContactFlag')
+    """
+    This is an action flag. To update this value use the /service/tickets endpoint automaticEmailContactFlag field
+    """
+    email_cc_flag: bool | None = Field(default=None, alias='emailCcFlag')
+    """
+    This is an action flag. To update this value use the /service/tickets endpoint automaticEmailCcFlag field
+    """
+    email_cc: str | None = Field(default=None, alias='emailCc')
+    """
+    To update this value use the /service/tickets endpoint automaticEmailCc field
+    """
+    hours_billed: float | None = Field(default=None, alias='hoursBilled')
+    invoice_hours: float | None = Field(default=None, alias='invoiceHours')
+    entered_by: str | None = Field(default=None, alias='enteredBy')
+    date_entered: datetime | None = Field(default=None, alias='dateEntered')
+    invoice: InvoiceReference | None = None
+    mobile_guid: UUID | None = Field(default=None, alias='mobileGuid')
+    hourly_rate: float | None = Field(default=None, alias='hourlyRate')
+    """
+    This field may only be Updated, it is defaulted on Create
+    """
+    overage_rate: float | None = Field(default=None, alias='overageRate')
+    agreement_hours: float | None = Field(default=None, alias='agreementHours')
+    agreement_amount: float | None = Field(default=None, alias='agreementAmount')
+    time_sheet: TimeSheetReference | None = Field(default=None, alias='timeSheet')
+    status: Literal[
+        'Open',
+        'Rejected',
+        'PendingApproval',
+        'ErrorsCorrected',
+        'PendingProjectApproval',
+        'ApprovedByTierOne',
+        'RejectBySecondTier',
+        'ApprovedByTierTwo',
+        'ReadyToBill',
+        'Billed',
+        'WrittenOff',
+        'BilledAgreement',
+    ] | None = None
+    ticket: TicketReference | None = None
+    project: ProjectReference | None = None
+    phase: ProjectPhaseReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+    custom_fields: list[CustomFieldValue] | None = Field(
+        default=None, alias='customFields'
+    )
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.customfieldvalue import CustomFieldValue
+from pyconnectwise.models.manage.invoicereference import InvoiceReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.projectphasereference import ProjectPhaseReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
+from pyconnectwise.models.manage.timesheetreference import TimeSheetReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
+from pyconnectwise.models.manage.worktypereference import WorkTypeReference
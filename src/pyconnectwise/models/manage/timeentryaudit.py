@@ -0,0 +1,163 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeEntryAudit(ConnectWiseModel):
+    id: int | None = None
+    member: MemberReference | None = None
+    source: Literal[
+        'None',
+        'Member',
+        'API',
+        'Workflow',
+        'Portal',
+        'Mobile',
+        'Network',
+        'EmailConnector',
+        'MassMaintenance',
+        'Application',
+        'SystemAPI',
+        'Conversion',
+    ] | None = None
+    type: Literal[
+        'Activity',
+        'CloseDate',
+        'Company',
+        'Contact',
+        'Conversion',
+        'Document',
+        'Forecast',
+        'Note',
+        'Notes',
+        'Opportunity',
+        'Products',
+        'Stage',
+        'Status',
+        'Surveys',
+        'Team',
+        'Tracks',
+        'Configuration',
+        'ConfigurationQuestions',
+        'DeviceBackupDetails',
+        'Tickets',
+        'Subject',
+        'ActivityOverview',
+        'Schedule',
+        'Resources',
+        'ExpenseEntry',
+        'Member',
+        'Date',
+        'Classification',
+        'Amount',
+        'ExpenseType',
+        'WorkType',
+        'WorkRole',
+        'Mileage',
+        'Billing',
+        'ExpenseHeader',
+        'Project',
+        'TimeEntry',
+        'TicketStatus',
+        'DateTime',
+        'DeductHours',
+        'ActualHours',
+        'Invoice',
+        'CompanyFinance',
+        'Billable',
+        'SalesOrder',
+        'Shipping',
+        'Profile',
+        'Group',
+        'GroupContact',
+        'GroupCompany',
+        'Options',
+        'Site',
+        'Agreement',
+        'Addition',
+        'Adjustment',
+        'Microsoft365',
+        'API',
+        'ProjectFinance',
+        'CompanyProfile',
+        'CompanyTeam',
+        'CompanyMgmt',
+        'InvoiceTotal',
+        'BillingInformation',
+        'ShippingInformation',
+        'BillingStatus',
+        'Location',
+        'Department',
+        'Territory',
+        'Payment',
+        'Credit',
+        'SubcontractorInformation',
+        'InvoicingParameters',
+        'ApplicationParameters',
+        'Finance',
+        'Invoicing',
+        'Email',
+        'Batching',
+        'KnowledgeBase',
+        'KbArticle',
+        'KnowledgeBaseApproval',
+        'KnowledgeBaseTicket',
+        'ManageNetwork',
+        'Tasks',
+        'CustomField',
+        'ScreenConnect',
+        'SLA',
+        'Ticket',
+        'Workflow',
+        'Record',
+        'CombinedTickets',
+        'Template',
+        'PurchaseOrder',
+        'Meeting',
+        'RmaOverview',
+        'ReturnedBy',
+        'PurchasedFromVendor',
+        'WarrantyVendor',
+        'RepairVendor',
+        'AdditionalDetails',
+        'TicketTemplate',
+        'AutoGeneration',
+        'TimeInternalNote',
+        'TimeDiscussion',
+        'TimeInternal',
+        'TimeResolution',
+        'MemberTemplate',
+        'Delegation',
+        'Skill',
+        'Certification',
+        'Accrual',
+        'ApiKey',
+        'Login',
+        'Notifications',
+        'System',
+        'ServiceBoard',
+        'ProjectBoard',
+        'Scheduling',
+        'TimeBillingExpense',
+        'CRM',
+        'Procurement',
+        'JobRole',
+        'Details',
+        'Authentication',
+    ] | None = None
+    message: str | None = None
+    old_value: str | None = Field(default=None, alias='oldValue')
+    new_value: str | None = Field(default=None, alias='newValue')
+    value: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,43 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeExpense(ConnectWiseModel):
+    id: int | None = None
+    tier1_approval_flag: bool | None = Field(default=None, alias='tier1ApprovalFlag')
+    tier2_approval_flag: bool | None = Field(default=None, alias='tier2ApprovalFlag')
+    disable_time_entry_flag: bool | None = Field(
+        default=None, alias='disableTimeEntryFlag'
+    )
+    require_time_note_flag: bool | None = Field(
+        default=None, alias='requireTimeNoteFlag'
+    )
+    require_expense_note_flag: bool | None = Field(
+        default=None, alias='requireExpenseNoteFlag'
+    )
+    rounding_factor: float | None = Field(default=None, alias='roundingFactor')
+    invoice_start: int | None = Field(default=None, alias='invoiceStart')
+    default_special_invoice_type: Literal[
+        'Agreement',
+        'CreditMemo',
+        'DownPayment',
+        'Miscellaneous',
+        'Progress',
+        'Standard',
+    ] | None = Field(default=None, alias='defaultSpecialInvoiceType')
+    internal_company: CompanyReference | None = Field(
+        default=None, alias='internalCompany'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimePeriod(ConnectWiseModel):
+    id: int | None = None
+    time_period_setup: TimePeriodSetupReference | None = Field(
+        default=None, alias='timePeriodSetup'
+    )
+    period: int | None = None
+    start_date: str | None = Field(default=None, alias='startDate')
+    end_date: str | None = Field(default=None, alias='endDate')
+    deadline_date: str | None = Field(default=None, alias='deadlineDate')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.timeperiodsetupreference import TimePeriodSetupReference
@@ -0,0 +1,51 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimePeriodSetup(ConnectWiseModel):
+    id: int | None = None
+    period_apply_to: Literal['Both', 'Expense', 'Time'] = Field(
+        ..., alias='periodApplyTo'
+    )
+    year: int
+    number_future_periods: int = Field(..., alias='numberFuturePeriods')
+    type: Literal['Weekly', 'BiWeekly', 'SemiMonthly', 'Monthly']
+    description: str | None = None
+    """
+     Max length: 100;
+    """
+    first_period_end_date: date = Field(..., alias='firstPeriodEndDate')
+    monthly_period_ends: int | None = Field(default=None, alias='monthlyPeriodEnds')
+    """
+    Only needed when type is monthly
+    """
+    semi_monthly_first_period: int | None = Field(
+        default=None, alias='semiMonthlyFirstPeriod'
+    )
+    """
+    Only needed when type is semi-monthly
+    """
+    semi_monthly_second_period: int | None = Field(
+        default=None, alias='semiMonthlySecondPeriod'
+    )
+    """
+    Only needed when type is semi-monthly
+    """
+    semi_monthly_last_day_flag: bool | None = Field(
+        default=None, alias='semiMonthlyLastDayFlag'
+    )
+    last_day_flag: bool | None = Field(default=None, alias='lastDayFlag')
+    """
+    Only needed when type is monthly
+    """
+    days_past_end_date: int = Field(..., alias='daysPastEndDate')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeSheet(ConnectWiseModel):
+    id: int | None = None
+    member: MemberReference | None = None
+    year: int | None = None
+    period: int | None = None
+    date_start: str | None = Field(default=None, alias='dateStart')
+    date_end: str | None = Field(default=None, alias='dateEnd')
+    status: Literal[
+        'Open',
+        'Rejected',
+        'PendingApproval',
+        'ErrorsCorrected',
+        'PendingProjectApproval',
+        'ApprovedByTierOne',
+        'RejectBySecondTier',
+        'ApprovedByTierTwo',
+        'ReadyToBill',
+        'Billed',
+        'WrittenOff',
+        'BilledAgreement',
+    ] | None = None
+    hours: float | None = None
+    deadline: str | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.memberreference import MemberReference
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.expensereporttierupdate import ExpenseReportTierUpdate
+
+
+class TimeSheetTierUpdate(ExpenseReportTierUpdate):
+    pass
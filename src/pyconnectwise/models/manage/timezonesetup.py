@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeZoneSetup(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    time_zone: TimeZoneReference | None = Field(default=None, alias='timeZone')
+    offset: float | None = None
+    """
+    The hours offset from UTC (+/-)
+    """
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    """
+    Identifies the default system time zone setup
+    """
+    daylight_savings_flag: bool | None = Field(
+        default=None, alias='daylightSavingsFlag'
+    )
+    """
+    Determined based on system library value for specified timeZone.
+                Not able to be used in query params at this time
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.timezonereference import TimeZoneReference
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Token(ConnectWiseModel):
+    public_key: str | None = Field(default=None, alias='publicKey')
+    private_key: str | None = Field(default=None, alias='privateKey')
+    expiration: str | None = None
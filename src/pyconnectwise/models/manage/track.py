@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Track(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    notify_action_ids: list[int] | None = Field(default=None, alias='notifyActionIds')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
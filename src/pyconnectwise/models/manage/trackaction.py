@@ -0,0 +1,78 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TrackAction(ConnectWiseModel):
+    id: int | None = None
+    notify_type: Literal[
+        'CreateActivity',
+        'SendEmail',
+        'AddToGroup',
+        'AttachTrack',
+        'ChangeCompanyStatus',
+        'CreateServiceTicket',
+    ] = Field(..., alias='notifyType')
+    service_template: ServiceTemplateReference | None = Field(
+        default=None, alias='serviceTemplate'
+    )
+    specific_member_to: MemberReference | None = Field(
+        default=None, alias='specificMemberTo'
+    )
+    email_recipient: str | None = Field(default=None, alias='emailRecipient')
+    """
+     Max length: 250;
+    """
+    specific_member_from: MemberReference | None = Field(
+        default=None, alias='specificMemberFrom'
+    )
+    email_from: str | None = Field(default=None, alias='emailFrom')
+    """
+     Max length: 250;
+    """
+    subject: str | None = None
+    """
+     Max length: 100;
+    """
+    notes: str | None = None
+    activity_type: ActivityTypeReference | None = Field(
+        default=None, alias='activityType'
+    )
+    activity_status: ActivityStatusReference | None = Field(
+        default=None, alias='activityStatus'
+    )
+    company_status: CompanyStatusReference | None = Field(
+        default=None, alias='companyStatus'
+    )
+    track: TrackReference | None = None
+    attached_track: TrackReference | None = Field(default=None, alias='attachedTrack')
+    group: GroupReference | None = None
+    cc_contact: ContactReference | None = Field(default=None, alias='ccContact')
+    bcc_contact: ContactReference | None = Field(default=None, alias='bccContact')
+    days_to_execute: int | None = Field(default=None, alias='daysToExecute')
+    notify_who: NotificationRecipientReference | None = Field(
+        default=None, alias='notifyWho'
+    )
+    notify_from: NotificationRecipientReference | None = Field(
+        default=None, alias='notifyFrom'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.activitystatusreference import ActivityStatusReference
+from pyconnectwise.models.manage.activitytypereference import ActivityTypeReference
+from pyconnectwise.models.manage.companystatusreference import CompanyStatusReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.groupreference import GroupReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.notificationrecipientreference import NotificationRecipientReference
+from pyconnectwise.models.manage.servicetemplatereference import ServiceTemplateReference
+from pyconnectwise.models.manage.trackreference import TrackReference
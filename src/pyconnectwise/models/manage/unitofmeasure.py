@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnitOfMeasure(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    uom_schedule_xref: str | None = Field(default=None, alias='uomScheduleXref')
+    """
+     Max length: 31;
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,125 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnpostedExpense(ConnectWiseModel):
+    id: int | None = None
+    location_id: int | None = Field(default=None, alias='locationId')
+    department_id: int | None = Field(default=None, alias='departmentId')
+    company: CompanyReference | None = None
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    credit_account: str | None = Field(default=None, alias='creditAccount')
+    expense_detail_id: int | None = Field(default=None, alias='expenseDetailId')
+    expense_type: ExpenseTypeReference | None = Field(default=None, alias='expenseType')
+    classification: Literal['NonReimbursable', 'Reimbursable', 'Personal'] | None = None
+    gl_type: Literal[
+        'AP',
+        'AR',
+        'EE',
+        'EI',
+        'EO',
+        'IA',
+        'IT',
+        'P',
+        'PF',
+        'R',
+        'RA',
+        'RD',
+        'RE',
+        'RP',
+        'ST',
+        'SD',
+        'ET',
+        'FT',
+        'PT',
+        'WP',
+        'WR',
+    ] | None = Field(default=None, alias='glType')
+    member: MemberReference | None = None
+    date_expense: str | None = Field(default=None, alias='dateExpense')
+    charge_code: ChargeCodeReference | None = Field(default=None, alias='chargeCode')
+    charge_description: str | None = Field(default=None, alias='chargeDescription')
+    in_policy: bool | None = Field(default=None, alias='inPolicy')
+    payment_method: PaymentMethodReference | None = Field(
+        default=None, alias='paymentMethod'
+    )
+    currency: CurrencyReference | None = None
+    total: float | None = None
+    billable_amount: float | None = Field(default=None, alias='billableAmount')
+    non_billable_amount: float | None = Field(default=None, alias='nonBillableAmount')
+    agreement: AgreementReference | None = None
+    agreement_amount_covered: float | None = Field(
+        default=None, alias='agreementAmountCovered'
+    )
+    ticket: TicketReference | None = None
+    project: ProjectReference | None = None
+    project_phase: ProjectPhaseReference | None = Field(
+        default=None, alias='projectPhase'
+    )
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    avalara_tax_flag: bool | None = Field(default=None, alias='avalaraTaxFlag')
+    """
+    Used to determine if Avalara tax is enabled.
+    """
+    item_taxable_flag: bool | None = Field(default=None, alias='itemTaxableFlag')
+    sales_tax_amount: float | None = Field(default=None, alias='salesTaxAmount')
+    state_tax_flag: bool | None = Field(default=None, alias='stateTaxFlag')
+    """
+    Set to true if transaction is taxable at the state level.
+    """
+    state_tax_xref: str | None = Field(default=None, alias='stateTaxXref')
+    state_tax_amount: float | None = Field(default=None, alias='stateTaxAmount')
+    county_tax_flag: bool | None = Field(default=None, alias='countyTaxFlag')
+    """
+    Set to true if transaction is taxable at the county level.
+    """
+    county_tax_xref: str | None = Field(default=None, alias='countyTaxXref')
+    county_tax_amount: float | None = Field(default=None, alias='countyTaxAmount')
+    city_tax_flag: bool | None = Field(default=None, alias='cityTaxFlag')
+    """
+    Set to true if transaction is taxable at the city level.
+    """
+    city_tax_xref: str | None = Field(default=None, alias='cityTaxXref')
+    city_tax_amount: float | None = Field(default=None, alias='cityTaxAmount')
+    country_tax_flag: bool | None = Field(default=None, alias='countryTaxFlag')
+    """
+    Set to true if transaction is taxable at the country level.
+    """
+    country_tax_xref: str | None = Field(default=None, alias='countryTaxXref')
+    country_tax_amount: float | None = Field(default=None, alias='countryTaxAmount')
+    composite_tax_flag: bool | None = Field(default=None, alias='compositeTaxFlag')
+    """
+    Set to true if transaction is taxable at the composite level.
+    """
+    composite_tax_xref: str | None = Field(default=None, alias='compositeTaxXref')
+    composite_tax_amount: float | None = Field(default=None, alias='compositeTaxAmount')
+    level_six_tax_flag: bool | None = Field(default=None, alias='levelSixTaxFlag')
+    """
+    Set to true if transaction is taxable at level six.
+    """
+    level_six_tax_xref: str | None = Field(default=None, alias='levelSixTaxXref')
+    level_six_tax_amount: float | None = Field(default=None, alias='levelSixTaxAmount')
+    date_closed: str | None = Field(default=None, alias='dateClosed')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.agreementreference import AgreementReference
+from pyconnectwise.models.manage.chargecodereference import ChargeCodeReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.expensetypereference import ExpenseTypeReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.paymentmethodreference import PaymentMethodReference
+from pyconnectwise.models.manage.projectphasereference import ProjectPhaseReference
+from pyconnectwise.models.manage.projectreference import ProjectReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
+from pyconnectwise.models.manage.ticketreference import TicketReference
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnpostedExpenseTaxableLevel(ConnectWiseModel):
+    id: int | None = None
+    tax_level: int | None = Field(default=None, alias='taxLevel')
+    tax_code_xref: str | None = Field(default=None, alias='taxCodeXref')
+    tax_amount: float | None = Field(default=None, alias='taxAmount')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
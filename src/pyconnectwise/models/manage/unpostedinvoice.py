@@ -0,0 +1,101 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnpostedInvoice(ConnectWiseModel):
+    id: int | None = None
+    billing_log_id: int | None = Field(default=None, alias='billingLogId')
+    location_id: int | None = Field(default=None, alias='locationId')
+    department_id: int | None = Field(default=None, alias='departmentId')
+    company: CompanyReference | None = None
+    account_number: str | None = Field(default=None, alias='accountNumber')
+    bill_to_company: CompanyReference | None = Field(
+        default=None, alias='billToCompany'
+    )
+    bill_to_site: SiteReference | None = Field(default=None, alias='billToSite')
+    ship_to_company: CompanyReference | None = Field(
+        default=None, alias='shipToCompany'
+    )
+    ship_to_site: SiteReference | None = Field(default=None, alias='shipToSite')
+    invoice_number: str | None = Field(default=None, alias='invoiceNumber')
+    invoice_date: str | None = Field(default=None, alias='invoiceDate')
+    invoice_type: Literal[
+        'Agreement',
+        'CreditMemo',
+        'DownPayment',
+        'Miscellaneous',
+        'Progress',
+        'Standard',
+    ] | None = Field(default=None, alias='invoiceType')
+    description: str | None = None
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    due_days: str | None = Field(default=None, alias='dueDays')
+    due_date: str | None = Field(default=None, alias='dueDate')
+    currency: CurrencyReference | None = None
+    sub_total: float | None = Field(default=None, alias='subTotal')
+    total: float | None = None
+    invoice_taxable_flag: bool | None = Field(default=None, alias='invoiceTaxableFlag')
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    avalara_tax_flag: bool | None = Field(default=None, alias='avalaraTaxFlag')
+    """
+    Used to determine if Avalara tax is enabled.
+    """
+    item_taxable_flag: bool | None = Field(default=None, alias='itemTaxableFlag')
+    sales_tax_amount: float | None = Field(default=None, alias='salesTaxAmount')
+    state_tax_flag: bool | None = Field(default=None, alias='stateTaxFlag')
+    """
+    Set to true if transaction is taxable at the state level.
+    """
+    state_tax_xref: str | None = Field(default=None, alias='stateTaxXref')
+    state_tax_amount: float | None = Field(default=None, alias='stateTaxAmount')
+    county_tax_flag: bool | None = Field(default=None, alias='countyTaxFlag')
+    """
+    Set to true if transaction is taxable at the county level.
+    """
+    county_tax_xref: str | None = Field(default=None, alias='countyTaxXref')
+    county_tax_amount: float | None = Field(default=None, alias='countyTaxAmount')
+    city_tax_flag: bool | None = Field(default=None, alias='cityTaxFlag')
+    """
+    Set to true if transaction is taxable at the city level.
+    """
+    city_tax_xref: str | None = Field(default=None, alias='cityTaxXref')
+    city_tax_amount: float | None = Field(default=None, alias='cityTaxAmount')
+    country_tax_flag: bool | None = Field(default=None, alias='countryTaxFlag')
+    """
+    Set to true if transaction is taxable at the country level.
+    """
+    country_tax_xref: str | None = Field(default=None, alias='countryTaxXref')
+    country_tax_amount: float | None = Field(default=None, alias='countryTaxAmount')
+    composite_tax_flag: bool | None = Field(default=None, alias='compositeTaxFlag')
+    """
+    Set to true if transaction is taxable at the composite level.
+    """
+    composite_tax_xref: str | None = Field(default=None, alias='compositeTaxXref')
+    composite_tax_amount: float | None = Field(default=None, alias='compositeTaxAmount')
+    level_six_tax_flag: bool | None = Field(default=None, alias='levelSixTaxFlag')
+    """
+    Set to true if transaction is taxable at level six.
+    """
+    level_six_tax_xref: str | None = Field(default=None, alias='levelSixTaxXref')
+    level_six_tax_amount: float | None = Field(default=None, alias='levelSixTaxAmount')
+    created_by: str | None = Field(default=None, alias='createdBy')
+    date_closed: str | None = Field(default=None, alias='dateClosed')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
@@ -0,0 +1,95 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnpostedProcurement(ConnectWiseModel):
+    id: int | None = None
+    description: str | None = None
+    unposted_product_id: str | None = Field(default=None, alias='unpostedProductId')
+    location_id: int | None = Field(default=None, alias='locationId')
+    department_id: int | None = Field(default=None, alias='departmentId')
+    procurement_type: Literal['Purchase', 'Adjustment', 'Transfer'] | None = Field(
+        default=None, alias='procurementType'
+    )
+    purchase_order: PurchaseOrderReference | None = Field(
+        default=None, alias='purchaseOrder'
+    )
+    purchase_date: str | None = Field(default=None, alias='purchaseDate')
+    tracking_number: str | None = Field(default=None, alias='trackingNumber')
+    billing_terms: BillingTermsReference | None = Field(
+        default=None, alias='billingTerms'
+    )
+    currency: CurrencyReference | None = None
+    total: float | None = None
+    tax_code: TaxCodeReference | None = Field(default=None, alias='taxCode')
+    avalara_tax_flag: bool | None = Field(default=None, alias='avalaraTaxFlag')
+    """
+    Used to determine if Avalara tax is enabled.
+    """
+    item_taxable_flag: bool | None = Field(default=None, alias='itemTaxableFlag')
+    purchase_order_taxable_flag: bool | None = Field(
+        default=None, alias='purchaseOrderTaxableFlag'
+    )
+    state_tax_flag: bool | None = Field(default=None, alias='stateTaxFlag')
+    """
+    Set to true if transaction is taxable at the state level.
+    """
+    state_tax_xref: str | None = Field(default=None, alias='stateTaxXref')
+    state_tax_amount: float | None = Field(default=None, alias='stateTaxAmount')
+    county_tax_flag: bool | None = Field(default=None, alias='countyTaxFlag')
+    """
+    Set to true if transaction is taxable at the county level.
+    """
+    county_tax_xref: str | None = Field(default=None, alias='countyTaxXref')
+    county_tax_amount: float | None = Field(default=None, alias='countyTaxAmount')
+    city_tax_flag: bool | None = Field(default=None, alias='cityTaxFlag')
+    """
+    Set to true if transaction is taxable at the city level.
+    """
+    city_tax_xref: str | None = Field(default=None, alias='cityTaxXref')
+    city_tax_amount: float | None = Field(default=None, alias='cityTaxAmount')
+    country_tax_flag: bool | None = Field(default=None, alias='countryTaxFlag')
+    """
+    Set to true if transaction is taxable at the country level.
+    """
+    country_tax_xref: str | None = Field(default=None, alias='countryTaxXref')
+    country_tax_amount: float | None = Field(default=None, alias='countryTaxAmount')
+    composite_tax_flag: bool | None = Field(default=None, alias='compositeTaxFlag')
+    """
+    Set to true if transaction is taxable at the composite level.
+    """
+    composite_tax_xref: str | None = Field(default=None, alias='compositeTaxXref')
+    composite_tax_amount: float | None = Field(default=None, alias='compositeTaxAmount')
+    level_six_tax_flag: bool | None = Field(default=None, alias='levelSixTaxFlag')
+    """
+    Set to true if transaction is taxable at level six.
+    """
+    level_six_tax_xref: str | None = Field(default=None, alias='levelSixTaxXref')
+    level_six_tax_amount: float | None = Field(default=None, alias='levelSixTaxAmount')
+    tax_total: float | None = Field(default=None, alias='taxTotal')
+    customer: CompanyReference | None = None
+    vendor: CompanyReference | None = None
+    vendor_account_number: str | None = Field(default=None, alias='vendorAccountNumber')
+    vendor_invoice_number: str | None = Field(default=None, alias='vendorInvoiceNumber')
+    vendor_invoice_date: str | None = Field(default=None, alias='vendorInvoiceDate')
+    tax_freight_flag: bool | None = Field(default=None, alias='taxFreightFlag')
+    freight_tax_total: float | None = Field(default=None, alias='freightTaxTotal')
+    freight_cost: float | None = Field(default=None, alias='freightCost')
+    date_closed: str | None = Field(default=None, alias='dateClosed')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.billingtermsreference import BillingTermsReference
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.purchaseorderreference import PurchaseOrderReference
+from pyconnectwise.models.manage.taxcodereference import TaxCodeReference
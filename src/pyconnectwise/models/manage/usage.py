@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Usage(ConnectWiseModel):
+    type: str | None = None
+    count: int | None = None
+    id: int | None = None
+    description: str | None = None
+    hyperlink: str | None = None
+    type_key: str | None = Field(default=None, alias='typeKey')
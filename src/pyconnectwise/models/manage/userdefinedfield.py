@@ -0,0 +1,91 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UserDefinedField(ConnectWiseModel):
+    id: int | None = None
+    """
+    ID of the custom user defined field
+    """
+    pod_id: int = Field(..., alias='podId')
+    """
+    Id of the Pod where the custom field will be placed
+    """
+    caption: str
+    """
+    Field caption Max length: 25;
+    """
+    sequence_number: int = Field(..., alias='sequenceNumber')
+    """
+    Must be between 1 and 500.  This defines the order in which the custom fields will appear
+    """
+    screen_id: str | None = Field(default=None, alias='screenId')
+    """
+    Field ScreenID Max length: 25;
+    """
+    help_text: str | None = Field(default=None, alias='helpText')
+    """
+    Help text to accompany the custom field Max length: 1000;
+    """
+    field_type_identifier: Literal[
+        'TextArea',
+        'Button',
+        'Currency',
+        'Date',
+        'Hyperlink',
+        'IPAddress',
+        'Checkbox',
+        'Number',
+        'Percent',
+        'Text',
+        'Password',
+    ] = Field(..., alias='fieldTypeIdentifier')
+    number_decimals: int | None = Field(default=None, alias='numberDecimals')
+    """
+    Only valid for Number or percent
+    """
+    entry_type_identifier: Literal[
+        'Date', 'EntryField', 'List', 'Option'
+    ] | None = Field(default=None, alias='entryTypeIdentifier')
+    required_flag: bool | None = Field(default=None, alias='requiredFlag')
+    display_on_screen_flag: bool | None = Field(
+        default=None, alias='displayOnScreenFlag'
+    )
+    read_only_flag: bool | None = Field(default=None, alias='readOnlyFlag')
+    list_view_flag: bool | None = Field(default=None, alias='listViewFlag')
+    """
+    Denotes that this custom field is included on a list view
+    """
+    button_url: str | None = Field(default=None, alias='buttonUrl')
+    """
+    Only available with Button Field Type. Required when entryTypeIdentifier is button Max length: 1000;
+    """
+    options: list[UserDefinedFieldOption] | None = None
+    business_unit_ids: list[int] | None = Field(default=None, alias='businessUnitIds')
+    location_ids: list[int] | None = Field(default=None, alias='locationIds')
+    add_all_business_units: bool | None = Field(
+        default=None, alias='addAllBusinessUnits'
+    )
+    remove_all_business_units: bool | None = Field(
+        default=None, alias='removeAllBusinessUnits'
+    )
+    add_all_locations: bool | None = Field(default=None, alias='addAllLocations')
+    remove_all_locations: bool | None = Field(default=None, alias='removeAllLocations')
+    date_created: datetime | None = Field(default=None, alias='dateCreated')
+    """
+    Date in UTC the custom field was created
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.userdefinedfieldoption import UserDefinedFieldOption
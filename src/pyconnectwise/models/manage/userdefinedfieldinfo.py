@@ -0,0 +1,84 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UserDefinedFieldInfo(ConnectWiseModel):
+    id: int | None = None
+    """
+    ID of the custom user defined field
+    """
+    pod_id: int | None = Field(default=None, alias='podId')
+    """
+    Id of the Pod where the custom field will be placed
+    """
+    caption: str | None = None
+    """
+    Field caption
+    """
+    sequence_number: int | None = Field(default=None, alias='sequenceNumber')
+    """
+    Must be between 1 and 500.  This defines the order in which the custom fields will appear
+    """
+    help_text: str | None = Field(default=None, alias='helpText')
+    """
+    Help text to accompany the custom field
+    """
+    field_type_identifier: Literal[
+        'TextArea',
+        'Button',
+        'Currency',
+        'Date',
+        'Hyperlink',
+        'IPAddress',
+        'Checkbox',
+        'Number',
+        'Percent',
+        'Text',
+        'Password',
+    ] | None = Field(default=None, alias='fieldTypeIdentifier')
+    number_decimals: int | None = Field(default=None, alias='numberDecimals')
+    """
+    Only valid for Number or percent
+    """
+    entry_type_identifier: Literal[
+        'Date', 'EntryField', 'List', 'Option'
+    ] | None = Field(default=None, alias='entryTypeIdentifier')
+    required_flag: bool | None = Field(default=None, alias='requiredFlag')
+    display_on_screen_flag: bool | None = Field(
+        default=None, alias='displayOnScreenFlag'
+    )
+    read_only_flag: bool | None = Field(default=None, alias='readOnlyFlag')
+    list_view_flag: bool | None = Field(default=None, alias='listViewFlag')
+    """
+    Denotes that this custom field is included on a list view
+    """
+    button_url: str | None = Field(default=None, alias='buttonUrl')
+    """
+    Only available with Button Field Type. Required when entryTypeIdentifier is button
+    """
+    options: list[UserDefinedFieldOption] | None = None
+    business_unit_ids: list[int] | None = Field(default=None, alias='businessUnitIds')
+    """
+    List of business unit ids using custom field
+    """
+    location_ids: list[int] | None = Field(default=None, alias='locationIds')
+    """
+    List of locations ids using custom field
+    """
+    date_created: str | None = Field(default=None, alias='dateCreated')
+    """
+    Date in UTC the custom field was created
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.userdefinedfieldoption import UserDefinedFieldOption
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UserDefinedFieldOption(ConnectWiseModel):
+    id: int | None = None
+    option_value: str | None = Field(default=None, alias='optionValue')
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    sort_order: int | None = Field(default=None, alias='sortOrder')
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UserDefinedFieldValueModel(ConnectWiseModel):
+    user_defined_field_rec_id: int | None = Field(
+        default=None, alias='userDefinedFieldRecId'
+    )
+    value: str | None = None
+    row_num: int | None = Field(default=None, alias='rowNum')
+    skip_location_and_billing_unit: bool | None = Field(
+        default=None, alias='skipLocationAndBillingUnit'
+    )
+    filtered: bool | None = None
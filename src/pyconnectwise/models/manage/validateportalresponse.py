@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ValidatePortalResponse(ConnectWiseModel):
+    success: bool | None = None
+    contact_id: int | None = Field(default=None, alias='contactId')
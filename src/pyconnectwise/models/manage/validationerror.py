@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ValidationError(ConnectWiseModel):
+    code: str | None = None
+    message: str | None = None
+    resource: str | None = None
+    field: str | None = None
+    details: str | None = None
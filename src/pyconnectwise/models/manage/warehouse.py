@@ -0,0 +1,44 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Warehouse(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    company: CompanyReference | None = None
+    location: SystemLocationReference | None = None
+    contact: ContactReference | None = None
+    department: SystemDepartmentReference | None = None
+    manager: MemberReference | None = None
+    site: SiteReference | None = None
+    location_xref: str | None = Field(default=None, alias='locationXref')
+    """
+     Max length: 10;
+    """
+    location_default_flag: bool | None = Field(
+        default=None, alias='locationDefaultFlag'
+    )
+    overall_default_flag: bool | None = Field(default=None, alias='overallDefaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    locked_flag: bool | None = Field(default=None, alias='lockedFlag')
+    currency: CurrencyReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.currencyreference import CurrencyReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.sitereference import SiteReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
@@ -0,0 +1,46 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WarehouseBin(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    warehouse: WarehouseReference | None = None
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    min_quantity: float | None = Field(default=None, alias='minQuantity')
+    max_quantity: float | None = Field(default=None, alias='maxQuantity')
+    overflow_bin: WarehouseBinReference | None = Field(
+        default=None, alias='overflowBin'
+    )
+    manager: MemberReference | None = None
+    length: float | None = None
+    width: float | None = None
+    height: float | None = None
+    weight: float | None = None
+    default_flag: bool | None = Field(default=None, alias='defaultFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    quantity_on_hand: int | None = Field(default=None, alias='quantityOnHand')
+    company: CompanyReference | None = None
+    transfer_bin: WarehouseBinReference | None = Field(
+        default=None, alias='transferBin'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.companyreference import CompanyReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.warehousebinreference import WarehouseBinReference
+from pyconnectwise.models.manage.warehousereference import WarehouseReference
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WarehouseReference(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    locked_flag: bool | None = Field(default=None, alias='lockedFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WisePayBatchPayment(ConnectWiseModel):
+    amount: float | None = None
+    wise_pay_href: str | None = Field(default=None, alias='wisePayHref')
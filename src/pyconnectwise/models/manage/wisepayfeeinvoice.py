@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WisePayFeeInvoice(ConnectWiseModel):
+    id: int | None = None
+    invoice_number: str | None = Field(default=None, alias='invoiceNumber')
+    amount: float | None = None
+    invoice_href: str | None = Field(default=None, alias='invoiceHref')
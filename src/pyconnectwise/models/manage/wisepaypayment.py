@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WisePayPayment(ConnectWiseModel):
+    payment_date_utc: str | None = Field(default=None, alias='paymentDateUtc')
+    wise_pay_reference: str | None = Field(default=None, alias='wisePayReference')
+    batch_payment: WisePayBatchPayment | None = Field(
+        default=None, alias='batchPayment'
+    )
+    fee_invoice: WisePayFeeInvoice | None = Field(default=None, alias='feeInvoice')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.wisepaybatchpayment import WisePayBatchPayment
+from pyconnectwise.models.manage.wisepayfeeinvoice import WisePayFeeInvoice
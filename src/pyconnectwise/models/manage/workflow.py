@@ -0,0 +1,51 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Workflow(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    table_type: WorkflowTableTypeReference | None = Field(
+        default=None, alias='tableType'
+    )
+    location: SystemLocationReference | None = None
+    department: SystemDepartmentReference | None = None
+    activate_flag: bool | None = Field(default=None, alias='activateFlag')
+    """
+    Batches can not be turned on until after the workflow is created and it has atleast one event associated with it
+    """
+    batch_interval: int | None = Field(default=None, alias='batchInterval')
+    batch_frequency_unit: Literal['Minutes', 'Hours', 'Days'] | None = Field(
+        default=None, alias='batchFrequencyUnit'
+    )
+    """
+    If not specified, defaults to Minutes. Months is not supported as month length varies
+    """
+    batch_last_ran: datetime | None = Field(default=None, alias='batchLastRan')
+    batch_schedule: Literal[
+        'AnyTime', 'MyCompanyOfficeHours', 'SlaHours'
+    ] | None = Field(default=None, alias='batchSchedule')
+    """
+    If activateFlag is true, batchSchedule is required
+    """
+    board: BoardReference | None = None
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.systemdepartmentreference import SystemDepartmentReference
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.workflowtabletypereference import WorkflowTableTypeReference
@@ -0,0 +1,135 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowAction(ConnectWiseModel):
+    id: int | None = None
+    notify_type: NotifyTypeReference = Field(..., alias='notifyType')
+    notify_who: NotificationRecipientReference | None = Field(
+        default=None, alias='notifyWho'
+    )
+    specific_member_to: MemberReference | None = Field(
+        default=None, alias='specificMemberTo'
+    )
+    email_recipient: str | None = Field(default=None, alias='emailRecipient')
+    """
+    Required when notifyWho is set to: "Email Address" Max length: 250;
+    """
+    notify_from: NotificationRecipientReference | None = Field(
+        default=None, alias='notifyFrom'
+    )
+    specific_member_from: MemberReference | None = Field(
+        default=None, alias='specificMemberFrom'
+    )
+    email_from: str | None = Field(default=None, alias='emailFrom')
+    """
+    Required when notifyFrom is set to: "Email Address" Max length: 250;
+    """
+    cc_contact: ContactReference | None = Field(default=None, alias='ccContact')
+    bcc_contact: ContactReference | None = Field(default=None, alias='bccContact')
+    subject: str | None = None
+    """
+    Required when notifyType is set to: "Create Activity", "Send Email", "Assign Resource" Max length: 100;
+    """
+    notes: str | None = None
+    activity_status: ActivityStatusReference | None = Field(
+        default=None, alias='activityStatus'
+    )
+    activity_type: ActivityTypeReference | None = Field(
+        default=None, alias='activityType'
+    )
+    attached_track: TrackReference | None = Field(default=None, alias='attachedTrack')
+    days_to_execute: int | None = Field(default=None, alias='daysToExecute')
+    board: BoardReference | None = None
+    board_status: ServiceStatusReference | None = Field(
+        default=None, alias='boardStatus'
+    )
+    service_type: ServiceTypeReference | None = Field(default=None, alias='serviceType')
+    service_sub_type: ServiceSubTypeReference | None = Field(
+        default=None, alias='serviceSubType'
+    )
+    service_item: ServiceItemReference | None = Field(default=None, alias='serviceItem')
+    group: GroupReference | None = None
+    service_template: ServiceTemplateReference | None = Field(
+        default=None, alias='serviceTemplate'
+    )
+    invoice_min_days: int | None = Field(default=None, alias='invoiceMinDays')
+    automate_script: AutomateScriptReference | None = Field(
+        default=None, alias='automateScript'
+    )
+    script_success_status: ServiceStatusReference | None = Field(
+        default=None, alias='scriptSuccessStatus'
+    )
+    script_fail_status: ServiceStatusReference | None = Field(
+        default=None, alias='scriptFailStatus'
+    )
+    detail_notes_flag: bool | None = Field(default=None, alias='detailNotesFlag')
+    internal_notes_flag: bool | None = Field(default=None, alias='internalNotesFlag')
+    audit_notes_flag: bool | None = Field(default=None, alias='auditNotesFlag')
+    service_priority: PriorityReference | None = Field(
+        default=None, alias='servicePriority'
+    )
+    update_owner_flag: bool | None = Field(default=None, alias='updateOwnerFlag')
+    sales_order_status: OrderStatusReference | None = Field(
+        default=None, alias='salesOrderStatus'
+    )
+    project_status: ProjectStatusReference | None = Field(
+        default=None, alias='projectStatus'
+    )
+    company_status: CompanyStatusReference | None = Field(
+        default=None, alias='companyStatus'
+    )
+    attachments: list[int] | None = None
+    service_survey: ServiceSurveyReference | None = Field(
+        default=None, alias='serviceSurvey'
+    )
+    specific_team_to: GenericBoardTeamReference | None = Field(
+        default=None, alias='specificTeamTo'
+    )
+    attach_configurations_for: Literal['Company', 'Contact'] | None = Field(
+        default=None, alias='attachConfigurationsFor'
+    )
+    """
+    Required when notifyType is set to: "Attach Configuration"
+    """
+    configuration_type: ConfigurationTypeReference | None = Field(
+        default=None, alias='configurationType'
+    )
+    configuration_status: ConfigurationStatusReference | None = Field(
+        default=None, alias='configurationStatus'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.activitystatusreference import ActivityStatusReference
+from pyconnectwise.models.manage.activitytypereference import ActivityTypeReference
+from pyconnectwise.models.manage.automatescriptreference import AutomateScriptReference
+from pyconnectwise.models.manage.boardreference import BoardReference
+from pyconnectwise.models.manage.companystatusreference import CompanyStatusReference
+from pyconnectwise.models.manage.configurationstatusreference import ConfigurationStatusReference
+from pyconnectwise.models.manage.configurationtypereference import ConfigurationTypeReference
+from pyconnectwise.models.manage.contactreference import ContactReference
+from pyconnectwise.models.manage.genericboardteamreference import GenericBoardTeamReference
+from pyconnectwise.models.manage.groupreference import GroupReference
+from pyconnectwise.models.manage.memberreference import MemberReference
+from pyconnectwise.models.manage.notificationrecipientreference import NotificationRecipientReference
+from pyconnectwise.models.manage.notifytypereference import NotifyTypeReference
+from pyconnectwise.models.manage.orderstatusreference import OrderStatusReference
+from pyconnectwise.models.manage.priorityreference import PriorityReference
+from pyconnectwise.models.manage.projectstatusreference import ProjectStatusReference
+from pyconnectwise.models.manage.serviceitemreference import ServiceItemReference
+from pyconnectwise.models.manage.servicestatusreference import ServiceStatusReference
+from pyconnectwise.models.manage.servicesubtypereference import ServiceSubTypeReference
+from pyconnectwise.models.manage.servicesurveyreference import ServiceSurveyReference
+from pyconnectwise.models.manage.servicetemplatereference import ServiceTemplateReference
+from pyconnectwise.models.manage.servicetypereference import ServiceTypeReference
+from pyconnectwise.models.manage.trackreference import TrackReference
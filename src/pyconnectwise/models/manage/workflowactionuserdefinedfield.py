@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowActionUserDefinedField(ConnectWiseModel):
+    id: int | None = None
+    event_id: int | None = Field(default=None, alias='eventId')
+    action_id: int | None = Field(default=None, alias='actionId')
+    caption: str | None = None
+    user_defined_field_id: int | None = Field(default=None, alias='userDefinedFieldId')
+    value: str | None = None
+    overwrite_flag: bool | None = Field(default=None, alias='overwriteFlag')
+    pod_description: str | None = Field(default=None, alias='podDescription')
+    field_type_id: str | None = Field(default=None, alias='fieldTypeId')
+    entry_type_id: str | None = Field(default=None, alias='entryTypeId')
+    required_flag: bool | None = Field(default=None, alias='requiredFlag')
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
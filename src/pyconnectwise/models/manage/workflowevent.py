@@ -0,0 +1,41 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowEvent(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    event_condition: str = Field(..., alias='eventCondition')
+    frequency_unit: Literal['Minutes', 'Hours', 'Days', 'Months'] | None = Field(
+        default=None, alias='frequencyUnit'
+    )
+    """
+    Required when exectionTimes is set to MultipleTimes or Continuously
+    """
+    frequency_of_execution: int | None = Field(
+        default=None, alias='frequencyOfExecution'
+    )
+    """
+    Required when exectionTimes is set to MultipleTimes or Continuously
+    """
+    max_number_of_execution: int | None = Field(
+        default=None, alias='maxNumberOfExecution'
+    )
+    """
+    Required when exectionTimes is set to MultipleTimes
+    """
+    execution_time: Literal['Once', 'MultipleTimes', 'Continuously'] | None = Field(
+        default=None, alias='executionTime'
+    )
+    """
+    Defaults to Once when not specified
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
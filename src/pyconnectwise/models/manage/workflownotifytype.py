@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowNotifyType(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    name: str | None = None
+    is_setup_flag: bool | None = Field(default=None, alias='isSetupFlag')
+    """
+    If the current action is available because it is already set up. Pertains to integrations such as Automate
+    """
+    external_flag: bool | None = Field(default=None, alias='externalFlag')
+    """
+    If the current action effects external objects e.g. integrations or sending an email
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
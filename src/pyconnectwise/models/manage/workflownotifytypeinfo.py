@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowNotifyTypeInfo(ConnectWiseModel):
+    id: int | None = None
+    identifier: str | None = None
+    name: str | None = None
+    is_setup_flag: bool | None = Field(default=None, alias='isSetupFlag')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowTrigger(ConnectWiseModel):
+    id: int | None = None
+    name: str | None = None
+    description: str | None = None
+    has_options_flag: bool | None = Field(default=None, alias='hasOptionsFlag')
+    has_operator_flag: bool | None = Field(default=None, alias='hasOperatorFlag')
+    custom_field: UserDefinedFieldReference | None = Field(
+        default=None, alias='customField'
+    )
+    expected_type: str | None = Field(default=None, alias='expectedType')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.userdefinedfieldreference import UserDefinedFieldReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowTriggerOption(ConnectWiseModel):
+    value: str | None = None
+    name: str | None = None
+    custom_field: UserDefinedFieldReference | None = Field(
+        default=None, alias='customField'
+    )
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.userdefinedfieldreference import UserDefinedFieldReference
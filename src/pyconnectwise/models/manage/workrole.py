@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkRole(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    hourly_rate: float | None = Field(default=None, alias='hourlyRate')
+    integration_xref: str | None = Field(default=None, alias='integrationXref')
+    """
+     Max length: 50;
+    """
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    add_all_locations: bool | None = Field(default=None, alias='addAllLocations')
+    remove_all_locations: bool | None = Field(default=None, alias='removeAllLocations')
+    add_all_agreement_exclusions: bool | None = Field(
+        default=None, alias='addAllAgreementExclusions'
+    )
+    """
+    Used only on create to add the work role to all agreement and agreement type exclusion lists
+    """
+    location_ids: list[int] | None = Field(default=None, alias='locationIds')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
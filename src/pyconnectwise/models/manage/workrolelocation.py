@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkRoleLocation(ConnectWiseModel):
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    hourly_rate: float | None = Field(default=None, alias='hourlyRate')
+    work_role: WorkRoleReference | None = Field(default=None, alias='workRole')
+    info: dict[str, str] | None = Field(default=None, alias='_info')
+
+
+# Imported last, as models can refer to each other in cycles
+from pyconnectwise.models.manage.systemlocationreference import SystemLocationReference
+from pyconnectwise.models.manage.workrolereference import WorkRoleReference
@@ -0,0 +1,49 @@
+# generated by datamodel-codegen:
+#   filename:  All.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkType(ConnectWiseModel):
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    bill_time: Literal['Billable', 'DoNotBill', 'NoCharge'] = Field(
+        ..., alias='billTime'
+    )
+    rate_type: Literal['AdjAmount', 'Custom', 'Multiplier'] = Field(
+        ..., alias='rateType'
+    )
+    rate: float
+    hours_min: float | None = Field(default=None, alias='hoursMin')
+    hours_max: float | None = Field(default=None, alias='hoursMax')
+    round_bill_hours_to: float | None = Field(default=None, alias='roundBillHoursTo')
+    accrual_type: Literal['Holiday', 'PTO', 'Sick', 'Vacation'] | None = Field(
+        default=None, alias='accrualType'
+    )
+    inactive_flag: bool | None = Field(default=None, alias='inactiveFlag')
+    overall_default_flag: bool | None = Field(default=None, alias='overallDefaultFlag')
+    activity_default_flag: bool | None = Field(
+        default=None, alias='activityDefaultFlag'
+    )
+    utilization_flag: bool | None = Field(default=None, alias='utilizationFlag')
+    cost_multiplier: float | None = Field(default=None, alias='costMultiplier')
+    integration_x_ref: str | None = Field(default=None, alias='integrationXRef')
+    """
+     Max length: 50;
+    """
+    add_all_agreement_exclusions: bool | None = Field(
+        default=None, alias='addAllAgreementExclusions'
+    )
+    """
+    Used only on create to add the work type to all agreement and agreement type exclusion lists
+    """
+    info: dict[str, str] | None = Field(default=None, alias='_info')
@@ -0,0 +1,452 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from pyconnectwise.responses.pagination_cursor import PaginationCursor
+from pyconnectwise.responses.pagination_plan import PaginationPlan, PaginationProgress
+from pyconnectwise.responses.paginated_response import PaginatedResponse
+from pyconnectwise.utils.columnar import arrow_schema, import_pyarrow
+from typing import TYPE_CHECKING, Callable, TypeVar
+from pydantic import BaseModel
+
+TModel = TypeVar("TModel", bound="BaseModel")
+
+if TYPE_CHECKING:
+    from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+
+class AsyncPaginatedResponse(PaginatedResponse[TModel]):
+    """
+    AsyncPaginatedResponse is the asyncio counterpart of PaginatedResponse, returned by the
+    paginated() methods of the async endpoints.
+
+    Parsing of each page and iteration over the current page work exactly like
+    PaginatedResponse. Navigating between pages is awaitable, and all() is an async
+    generator that should be consumed with "async for".
+    """
+
+    async def get_next_page(self) -> AsyncPaginatedResponse[TModel]:
+        """
+        Fetch the next page of the paginated response.
+
+        Returns:
+            AsyncPaginatedResponse[TModel]: The updated AsyncPaginatedResponse instance
+            with the data from the next page or None if there is no next page.
+        """
+        if not self.has_next_page or not self.next_page:
+            self.has_data = False
+            return self
+
+        self._adopt(await self._request_next_page())
+        return self
+
+    async def get_previous_page(self) -> AsyncPaginatedResponse[TModel]:
+        """
+        Fetch the previous page of the paginated response.
+
+        Returns:
+            AsyncPaginatedResponse[TModel]: The updated AsyncPaginatedResponse instance
+            with the data from the previous page or None if there is no previous page.
+        """
+        if not self.has_prev_page or not self.prev_page:
+            self.has_data = False
+            return self
+
+        self._adopt(await self.endpoint.paginated(self.prev_page, self.page_size, self.params))
+        return self
+
+    async def all(self, concurrency: int = 1, prefetch: int = 0, checkpoint: Callable[[PaginationCursor], None] | None = None):
+        """
+        Iterate through all items in the paginated response, across all pages.
+
+        With a concurrency greater than 1, up to that many of the remaining pages are requested
+        at the same time, or as many as the client's adaptive concurrency limiter currently allows.
+        Items are still yielded in page order. Forward-only responses are always walked one page at a time.
+
+        When pages are walked one at a time, a prefetch greater than 0 requests the following pages
+        in a background task while the caller is still working through the current one.
+
+        In the "stream" response format, each page's items are parsed one at a time, without holding
+        the page's models in memory, and pages are fetched one at a time. The async clients read each
+        page's body whole before its items are parsed.
+
+        If fetching a page fails, calling all() again resumes from the page that failed, and a
+        checkpoint callback gets a cursor after every page to resume the walk from elsewhere
+        (see PaginatedResponse.all).
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time. Defaults to 1,
+            which walks the pages one at a time.
+            prefetch (int): The number of pages to read ahead of the page being consumed. Defaults to 0,
+            which only requests a page once the previous one has been consumed.
+            checkpoint (Callable[[PaginationCursor], None], optional): Called after every page with the
+            cursor to resume the walk from, e.g. to save it.
+
+        Yields:
+            TModel: An instance of the model class for each item in the paginated response.
+        """
+        if self._streamed():
+            concurrency, prefetch = 1, 0
+        if concurrency > 1 and not self.forward_only:
+            async for item in self._all_concurrent(concurrency, checkpoint):
+                yield item
+            return
+        if prefetch > 0:
+            async for item in self._all_prefetched(prefetch, checkpoint):
+                yield item
+            return
+
+        while self.has_data:
+            if not self._page_consumed:
+                for item in self.data:
+                    yield item
+                self._page_consumed = True
+                if checkpoint is not None:
+                    checkpoint(self._cursor_after())
+            await self.get_next_page()
+
+    async def iter_batches(self, batch_size: int, max_pending: int = 2, concurrency: int = 1, prefetch: int = 0):
+        """
+        Iterate through all items in the paginated response in lists of batch_size items, whatever
+        the page size (see PaginatedResponse.iter_batches). Pages are fetched and batched in a
+        background task, which waits whenever max_pending batches are waiting to be consumed.
+
+        Args:
+            batch_size (int): The number of items per batch.
+            max_pending (int): The number of batches that can wait to be consumed. Defaults to 2.
+            concurrency (int): The maximum number of pages to fetch at the same time (see all()).
+            prefetch (int): The number of pages to read ahead of the page being batched (see all()).
+
+        Yields:
+            list[TModel]: The next batch_size items.
+
+        Raises:
+            ValueError: If batch_size or max_pending is less than 1.
+        """
+        if batch_size < 1 or max_pending < 1:
+            raise ValueError("batch_size and max_pending must be at least 1")
+
+        end_of_batches = object()
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+        async def fetch_batches():
+            items = self.all(concurrency, prefetch)
+            batch: list[TModel] = []
+            try:
+                async for item in items:
+                    batch.append(item)
+                    if len(batch) == batch_size:
+                        await buffer.put(batch)
+                        batch = []
+            except Exception as e:
+                if batch:
+                    await buffer.put(batch)
+                await buffer.put(e)
+                return
+            finally:
+                await items.aclose()
+            if batch:
+                await buffer.put(batch)
+            await buffer.put(end_of_batches)
+
+        fetcher = asyncio.ensure_future(fetch_batches())
+        try:
+            while True:
+                batch = await buffer.get()
+                if batch is end_of_batches:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            fetcher.cancel()
+
+    async def iter_record_batches(self, concurrency: int = 1, prefetch: int = 0):
+        """
+        Iterate through all items in the paginated response as Arrow record batches, one per page
+        (see PaginatedResponse.iter_record_batches). Requires pyarrow.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time (see all()).
+            prefetch (int): The number of pages to read ahead of the page being consumed (see all()).
+
+        Yields:
+            pyarrow.RecordBatch: A record batch holding a page's items.
+        """
+        async for table in self._with_response_format("arrow").all(concurrency, prefetch):
+            for batch in table.to_batches():
+                yield batch
+
+    async def to_arrow(self, concurrency: int = 1, prefetch: int = 0):
+        """
+        Read all items in the paginated response into a single Arrow table
+        (see PaginatedResponse.to_arrow). Requires pyarrow.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time (see all()).
+            prefetch (int): The number of pages to read ahead of the page being consumed (see all()).
+
+        Returns:
+            pyarrow.Table: A table with a row per item and a column per model field.
+        """
+        pa = import_pyarrow()
+        batches = [batch async for batch in self.iter_record_batches(concurrency, prefetch)]
+        return pa.Table.from_batches(batches, schema=arrow_schema(self.response_model))
+
+    @classmethod
+    async def resume(cls, client, cursor: PaginationCursor) -> AsyncPaginatedResponse:
+        """
+        Carry on a walk from a cursor, e.g. one saved by a checkpoint callback of all()
+        (see PaginatedResponse.resume).
+
+        Args:
+            client: The async client to make the requests with.
+            cursor (PaginationCursor): The position to carry on from.
+
+        Returns:
+            AsyncPaginatedResponse: The response holding the page the cursor points at.
+
+        Raises:
+            ValueError: If the cursor has finished, i.e. there's nothing left to resume.
+        """
+        from pyconnectwise.endpoints.base.connectwise_endpoint import _load_endpoint_class
+
+        if cursor.finished:
+            raise ValueError(f"Nothing left to resume, {cursor!r} has finished")
+        endpoint = _load_endpoint_class(cursor.endpoint_module(asynchronous=True))._at_path(client, cursor.path_ids)
+        if cursor.forward_only:
+            return await endpoint._paginated_forward_only(
+                cursor.load_model(), cursor.page_size, cursor.params, cursor.page_id, cursor.page
+            )
+        return await endpoint.paginated(cursor.page, cursor.page_size, cursor.params)
+
+    async def _request_next_page(self) -> AsyncPaginatedResponse[TModel]:
+        """
+        Request the page following this one without changing the state of this instance.
+
+        Returns:
+            AsyncPaginatedResponse[TModel]: A new AsyncPaginatedResponse holding the next page.
+        """
+        if self.forward_only:
+            return await self.endpoint._paginated_forward_only(
+                self.response_model, self.page_size, self.params, self.next_page_id, self.next_page
+            )
+        return await self._fetch_page(self.next_page)
+
+    async def _all_prefetched(self, prefetch: int, checkpoint: Callable[[PaginationCursor], None] | None = None):
+        """
+        Yield the items of the current page and every page after it, while a background task
+        fetches up to `prefetch` pages ahead into a bounded queue. See PaginatedResponse._all_prefetched.
+
+        Args:
+            prefetch (int): The number of pages to read ahead of the page being consumed.
+            checkpoint (Callable[[PaginationCursor], None], optional): Called after every page (see all()).
+
+        Yields:
+            TModel: An instance of the model class for each item in the paginated response.
+        """
+        if not self.has_data:
+            return
+
+        end_of_pages = object()
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=prefetch)
+
+        async def fetch_pages():
+            page = self
+            try:
+                while page.has_next_page and page.next_page:
+                    page = await page._request_next_page()
+                    if not page.has_data:
+                        break
+                    await buffer.put(page)
+            except Exception as e:
+                await buffer.put(e)
+                return
+            await buffer.put(end_of_pages)
+
+        fetcher = asyncio.ensure_future(fetch_pages())
+        try:
+            if not self._page_consumed:
+                for item in self.data:
+                    yield item
+                self._page_consumed = True
+                if checkpoint is not None:
+                    checkpoint(self._cursor_after())
+            consumed = self
+            while True:
+                page = await buffer.get()
+                if page is end_of_pages:
+                    break
+                if isinstance(page, Exception):
+                    self._resume_after(consumed)
+                    raise page
+                for item in page.data:
+                    yield item
+                consumed = page
+                if checkpoint is not None:
+                    checkpoint(page._cursor_after())
+        finally:
+            fetcher.cancel()
+        self.has_data = False
+
+    async def _fetch_page(self, page: int) -> AsyncPaginatedResponse[TModel]:
+        """
+        Fetch a single page from the endpoint without changing the state of this instance.
+
+        Args:
+            page (int): The page number to fetch.
+
+        Returns:
+            AsyncPaginatedResponse[TModel]: A new AsyncPaginatedResponse holding the requested page.
+        """
+        return await self.endpoint.paginated(page, self.page_size, self.params)
+
+    async def _all_concurrent(
+        self,
+        concurrency: int,
+        checkpoint: Callable[[PaginationCursor], None] | None = None,
+        plan: PaginationPlan | None = None,
+        on_page: Callable[[AsyncPaginatedResponse[TModel]], None] | None = None,
+    ):
+        """
+        Yield the items of the current page, then fetch the following pages with up to `concurrency`
+        requests in flight, yielding each page's items in order. See PaginatedResponse._all_concurrent.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time.
+            checkpoint (Callable[[PaginationCursor], None], optional): Called after every page (see all()).
+            plan (PaginationPlan, optional): The extent of the walk (see extract()).
+            on_page (Callable[[AsyncPaginatedResponse[TModel]], None], optional): Called with every page once
+            its items have all been yielded.
+
+        Yields:
+            TModel: An instance of the model class for each item in the paginated response.
+        """
+        if not self.has_data:
+            return
+        if not self._page_consumed:
+            for item in self.data:
+                yield item
+            self._page_consumed = True
+            if checkpoint is not None:
+                checkpoint(self._cursor_after())
+            if on_page is not None:
+                on_page(self)
+        if plan is not None:
+            last_page = plan.last_page
+            if self.page >= last_page and not self._outgrew_plan(plan):
+                self.has_data = False
+                return
+        elif not self.has_next_page or not self.next_page:
+            self.has_data = False
+            return
+        else:
+            last_page = self.last_page if self.parsed_link_headers is not None else None
+
+        next_page = self.page + 1
+        concurrency_limiter = self.endpoint.client.concurrency_limiter
+        in_flight: deque[asyncio.Task[AsyncPaginatedResponse[TModel]]] = deque()
+        consumed = self
+        try:
+            while True:
+                # With an adaptive limiter, only as many pages as it currently allows are requested ahead
+                window = min(concurrency, concurrency_limiter.limit) if concurrency_limiter is not None else concurrency
+                while len(in_flight) < window and (last_page is None or next_page <= last_page):
+                    in_flight.append(asyncio.ensure_future(self._fetch_page(next_page)))
+                    next_page += 1
+                if not in_flight:
+                    if plan is not None and last_page is not None and consumed._outgrew_plan(plan):
+                        last_page = None
+                        continue
+                    break
+
+                try:
+                    page = await in_flight.popleft()
+                except Exception:
+                    self._resume_after(consumed)
+                    raise
+                for item in page.data:
+                    yield item
+                consumed = page
+                if checkpoint is not None:
+                    checkpoint(page._cursor_after())
+                if on_page is not None:
+                    on_page(page)
+                if last_page is None and page._is_last_page():
+                    break
+        finally:
+            for task in in_flight:
+                task.cancel()
+        self.has_data = False
+
+    async def plan(self, total_count: int | None = None) -> PaginationPlan:
+        """
+        Work out the extent of the walk from the current page to the end of the collection, counting
+        its items with the endpoint's count endpoint. See PaginatedResponse.plan.
+
+        Args:
+            total_count (int, optional): The number of items in the collection, if it's known. Defaults to
+            counting them.
+
+        Returns:
+            PaginationPlan: The plan.
+
+        Raises:
+            ValueError: If total_count isn't given and the endpoint has no count endpoint.
+        """
+        if total_count is None:
+            total_count = await self._count_items()
+        first_page = self.page + 1 if self._page_consumed else self.page
+        return PaginationPlan(total_count, self.page_size, first_page)
+
+    async def _count_items(self) -> int:
+        count_endpoint = getattr(self.endpoint, "count", None)
+        if count_endpoint is None:
+            raise ValueError(f"{type(self.endpoint).__name__} has no count endpoint, pass total_count instead")
+        # Counts are parsed into models whatever format the walk's pages are in
+        count = await count_endpoint.with_response_format("models").get(params=self.params.for_count())
+        return count.count or 0
+
+    async def extract(
+        self,
+        concurrency: int = 8,
+        progress: Callable[[PaginationProgress], None] | None = None,
+        checkpoint: Callable[[PaginationCursor], None] | None = None,
+        total_count: int | None = None,
+    ):
+        """
+        Iterate through all items in the paginated response, across all pages, after counting them,
+        with up to `concurrency` pages fetched at a time. See PaginatedResponse.extract.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time. Defaults to 8.
+            progress (Callable[[PaginationProgress], None], optional): Called after every page with the
+            walk's progress.
+            checkpoint (Callable[[PaginationCursor], None], optional): Called after every page with the
+            cursor to resume the walk from (see all()).
+            total_count (int, optional): The number of items in the collection, if it's known (see plan()).
+
+        Yields:
+            TModel: An instance of the model class for each item in the paginated response.
+
+        Raises:
+            ValueError: If the response uses forward-only pagination, or the collection can't be counted.
+        """
+        if self.forward_only:
+            raise ValueError("Forward-only pages can only be requested in order, walk them with all() instead")
+        if not self.has_data:
+            return
+        tracker = PaginationProgress(await self.plan(total_count))
+
+        def on_page(page: AsyncPaginatedResponse[TModel]):
+            if not page.has_data:
+                return
+            tracker.pages_done += 1
+            if page.item_count is not None:
+                tracker.items_done += page.item_count
+            if progress is not None:
+                progress(tracker)
+
+        if self._streamed():
+            concurrency = 1
+        async for item in self._all_concurrent(concurrency, checkpoint, tracker.plan, on_page):
+            yield item
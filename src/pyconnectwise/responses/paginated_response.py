@@ -1,15 +1,58 @@
 from __future__ import annotations
+import itertools
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.responses.pagination_cursor import PaginationCursor
+from pyconnectwise.responses.pagination_plan import PaginationPlan, PaginationProgress
+from pyconnectwise.responses.pagination_query import PaginationQuery
+from pyconnectwise.utils.columnar import arrow_schema, import_pyarrow
 from pyconnectwise.utils.helpers import parse_link_headers
-from typing import TYPE_CHECKING, Generic, TypeVar, Type
+from typing import TYPE_CHECKING, Callable, Generic, Iterator, Mapping, TypeVar, Type
 from pydantic import BaseModel
 
 TModel = TypeVar("TModel", bound="BaseModel")
 
+# The size of the chunks a streamed response's body is read and parsed in
+STREAM_CHUNK_SIZE: int = 64 * 1024
+
 if TYPE_CHECKING:
     from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 
 
+def _put_unless_stopped(buffer: queue.Queue, item, stopped: threading.Event) -> bool:
+    """
+    Put an item into a bounded queue, waiting for room in it, unless the consumer stops first.
+
+    Returns:
+        bool: Whether the item was put, False if the consumer stopped.
+    """
+    # Time out regularly so an abandoned iteration doesn't leave the producer blocked forever
+    while not stopped.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _iter_body(response) -> Iterator[bytes]:
+    """
+    Read a response's body in chunks, closing the response once it has been read or abandoned. Responses
+    without iter_content() (httpx's, which the async clients read whole) are served from their content.
+    """
+    if not hasattr(response, "iter_content"):
+        yield response.content
+        return
+    try:
+        yield from response.iter_content(STREAM_CHUNK_SIZE)
+    finally:
+        response.close()
+
+
 class PaginatedResponse(Generic[TModel]):
     """
     PaginatedResponse is a wrapper class for handling paginated responses from the
@@ -23,8 +66,14 @@ class PaginatedResponse(Generic[TModel]):
     PaginatedResponse uses a generic type variable TModel, which represents the
     expected model type for the response data. This allows for type-safe handling
     of model instances throughout the class.
+
+    When created with forward_only=True, the response walks ConnectWise Manage's forward-only
+    (keyset) pagination: the next page is requested by the pageId from the Link header rather
+    than by page number, and only forward navigation is available.
     """
 
+    FORWARD_ONLY_HEADERS: dict[str, str] = {"pagination-type": "forward-only"}
+
     def __init__(
         self,
         response,
@@ -32,6 +81,9 @@ class PaginatedResponse(Generic[TModel]):
         endpoint: ConnectWiseEndpoint,
         page,
         page_size,
+        forward_only: bool = False,
+        page_id: int | None = None,
+        params: Mapping[str, int | str] | None = None,
     ):
         """
         PaginatedResponse is a wrapper class for handling paginated responses from the
@@ -46,10 +98,44 @@ class PaginatedResponse(Generic[TModel]):
         expected model type for the response data. This allows for type-safe handling
         of model instances throughout the class.
         """
-        self._initialize(response, response_model, endpoint, page, page_size)
+        self._initialize(response, response_model, endpoint, page, page_size, forward_only, page_id, params)
+
+    # The attributes _initialize() parses a page into, which _adopt() takes over from another page
+    _PAGE_STATE: tuple[str, ...] = (
+        "response",
+        "response_model",
+        "endpoint",
+        "page",
+        "page_size",
+        "forward_only",
+        "page_id",
+        "params",
+        "parsed_link_headers",
+        "next_page_id",
+        "has_next_page",
+        "has_prev_page",
+        "first_page",
+        "prev_page",
+        "next_page",
+        "last_page",
+        "data",
+        "item_count",
+        "has_data",
+        "index",
+        "_page_consumed",
+        "_stream_items",
+    )
 
     def _initialize(
-        self, response, response_model, endpoint: ConnectWiseEndpoint, page, page_size
+        self,
+        response,
+        response_model,
+        endpoint: ConnectWiseEndpoint,
+        page,
+        page_size,
+        forward_only: bool = False,
+        page_id: int | None = None,
+        params: Mapping[str, int | str] | None = None,
     ):
         """
         Initialize the instance variables using the provided response, endpoint, and page size.
@@ -57,14 +143,34 @@ class PaginatedResponse(Generic[TModel]):
         Args:
             response: The raw response object from the API.
             endpoint (ConnectWiseEndpoint[TModel]): The endpoint associated with the response.
+            page (int): The number of the page held by the response.
             page_size (int): The number of items per page.
+            forward_only (bool): Whether the response uses forward-only (pageId) pagination.
+            page_id (int, optional): The pageId the page was requested with, in forward-only pagination.
+            params (Mapping, optional): The query parameters every page is requested with, other than the
+                pagination ones.
         """
         self.response = response
         self.response_model = response_model
         self.endpoint = endpoint
+        self.page = page
         self.page_size = page_size
+        self.forward_only = forward_only
+        self.page_id = page_id
+        self.params: PaginationQuery = PaginationQuery.of(params)
         self.parsed_link_headers = parse_link_headers(response.headers)
-        if self.parsed_link_headers is not None:
+        self.next_page_id: int | None = None
+        if forward_only:
+            # Forward-only pagination only ever links to the next page, by pageId
+            link_headers = self.parsed_link_headers or {}
+            self.next_page_id = link_headers.get("next_page_id", None)
+            self.has_next_page: bool = self.next_page_id is not None
+            self.has_prev_page: bool = False
+            self.first_page: int = 1
+            self.prev_page = None
+            self.next_page = page + 1 if self.has_next_page else None
+            self.last_page = None
+        elif self.parsed_link_headers is not None:
             # ConnectWise Manage API gives us handy headers to parse for Pagination
             self.has_next_page: bool = self.parsed_link_headers.get("has_next_page", False)
             self.has_prev_page: bool = self.parsed_link_headers.get("has_prev_page", False)
@@ -81,9 +187,38 @@ class PaginatedResponse(Generic[TModel]):
             self.prev_page = page - 1 if page > 1 else 1
             self.next_page = page + 1
             self.last_page = 999999
-        self.data: list[TModel] = endpoint._parse_many(response_model, response.json())
-        self.has_data = self.data and len(self.data) > 0
+        # In the "raw" and "arrow" response formats a page is yielded whole, as its undecoded body or as
+        # a table. A raw page's number of items isn't known without decoding it, so it's left as None
+        # and only an empty array counts as a page without data.
+        response_format = endpoint._get_response_format()
+        self._stream_items: Iterator[TModel] | None = None
+        if response_format == "raw":
+            self.data = [response.content] if response.content.strip() not in (b"", b"[]") else []
+            self.item_count: int | None = None
+        elif response_format == "stream":
+            # Items are parsed one at a time as the body is read, so the page's size is only known once
+            # it has been consumed. The first item is read now, so that an empty page has no data.
+            items = endpoint._stream_many(response_model, _iter_body(response))
+            first_item = next(items, None)
+            if first_item is None:
+                self._stream_items = None
+                self.data = []
+                self.item_count = 0
+            else:
+                self._stream_items = itertools.chain((first_item,), items)
+                self.data = self._stream_page(self._stream_items)
+                self.item_count = None
+        elif response_format == "arrow":
+            table = endpoint._parse_many(response_model, response.content)
+            self.data = [table] if table.num_rows else []
+            self.item_count = table.num_rows
+        else:
+            self.data: list[TModel] = endpoint._parse_many(response_model, response.content)
+            self.item_count = len(self.data)
+        self.has_data = bool(self.data)
         self.index = 0
+        # Set once all() has yielded every item of this page, so a resumed all() doesn't yield them twice
+        self._page_consumed = False
 
     def get_next_page(self) -> PaginatedResponse[TModel]:
         """
@@ -97,14 +232,7 @@ class PaginatedResponse(Generic[TModel]):
             self.has_data = False
             return self
 
-        next_response = self.endpoint.paginated(self.next_page, self.page_size)
-        self._initialize(
-            next_response.response,
-            next_response.response_model,
-            next_response.endpoint,
-            self.next_page,
-            next_response.page_size,
-        )
+        self._adopt(self._request_next_page())
         return self
 
     def get_previous_page(self) -> PaginatedResponse[TModel]:
@@ -119,28 +247,567 @@ class PaginatedResponse(Generic[TModel]):
             self.has_data = False
             return self
 
-        prev_response = self.endpoint.paginated(self.prev_page, self.page_size)
-        self._initialize(
-            prev_response.response,
-            prev_response.response_model,
-            prev_response.endpoint,
-            self.prev_page,
-            prev_response.page_size,
-        )
+        self._adopt(self.endpoint.paginated(self.prev_page, self.page_size, self.params))
         return self
 
-    def all(self):
+    def all(
+        self, concurrency: int = 1, prefetch: int = 0, checkpoint: Callable[[PaginationCursor], None] | None = None
+    ):
         """
         Iterate through all items in the paginated response, across all pages.
 
+        With a concurrency greater than 1, the remaining pages are fetched in parallel over a
+        bounded pool of worker threads (see _all_concurrent). Items are still yielded in page order.
+        If the client has an adaptive concurrency limiter, the number of pages fetched at once follows
+        the limiter's current limit, up to `concurrency`.
+        Forward-only responses can't know a page's pageId before the previous page has arrived,
+        so they are always walked one page at a time.
+
+        When pages are walked one at a time, a prefetch greater than 0 requests the following pages
+        on a background thread while the caller is still working through the current one
+        (see _all_prefetched).
+
+        In the "stream" response format (see ConnectWiseEndpoint.with_response_format), each page's
+        items are parsed and yielded one at a time as its body is read from the connection, so no more
+        than one item and a chunk of the body are held in memory at a time. Streamed walks always
+        fetch one page at a time, ignoring concurrency and prefetch.
+
+        If fetching a page fails (after the client's retry policy gives up), the instance is left
+        on the last page whose items were all yielded, so calling all() again resumes from the
+        page that failed instead of starting over. To resume a walk in another process, e.g. after a
+        crash, pass a checkpoint callback: it's called with a PaginationCursor each time the caller
+        has been through all the items of a page, and resume() carries the walk on from the last one.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time. Defaults to 1,
+            which walks the pages one at a time.
+            prefetch (int): The number of pages to read ahead of the page being consumed. Defaults to 0,
+            which only requests a page once the previous one has been consumed.
+            checkpoint (Callable[[PaginationCursor], None], optional): Called after every page with the
+            cursor to resume the walk from, e.g. to save it.
+
         Yields:
             TModel: An instance of the model class for each item in the paginated response.
         """
+        if self._streamed():
+            # Reading pages ahead would hold them in memory, which a streamed walk is meant to avoid
+            concurrency, prefetch = 1, 0
+        if concurrency > 1 and not self.forward_only:
+            yield from self._all_concurrent(concurrency, checkpoint)
+            return
+        if prefetch > 0:
+            yield from self._all_prefetched(prefetch, checkpoint)
+            return
+
         while self.has_data:
-            for item in self.data:
-                yield item
+            if not self._page_consumed:
+                yield from self.data
+                self._page_consumed = True
+                if checkpoint is not None:
+                    checkpoint(self._cursor_after())
             self.get_next_page()
 
+    def iter_batches(self, batch_size: int, max_pending: int = 2, concurrency: int = 1, prefetch: int = 0):
+        """
+        Iterate through all items in the paginated response in lists of batch_size items, whatever
+        the page size. The last batch holds whatever is left.
+
+        Pages are fetched, as all() fetches them, and batched on a background thread, which waits
+        whenever max_pending batches are waiting to be consumed. A slow consumer therefore never lets
+        more than max_pending batches, plus the one being filled, pile up in memory.
+
+        If fetching a page fails, the items fetched before it are yielded in a last, possibly short,
+        batch before the error is raised, and calling iter_batches() again resumes from the page
+        that failed (see all()).
+
+        Args:
+            batch_size (int): The number of items per batch.
+            max_pending (int): The number of batches that can wait to be consumed. Defaults to 2.
+            concurrency (int): The maximum number of pages to fetch at the same time (see all()).
+            prefetch (int): The number of pages to read ahead of the page being batched (see all()).
+
+        Yields:
+            list[TModel]: The next batch_size items.
+
+        Raises:
+            ValueError: If batch_size or max_pending is less than 1.
+        """
+        if batch_size < 1 or max_pending < 1:
+            raise ValueError("batch_size and max_pending must be at least 1")
+
+        end_of_batches = object()
+        buffer: queue.Queue = queue.Queue(maxsize=max_pending)
+        stopped = threading.Event()
+
+        def put(item) -> bool:
+            return _put_unless_stopped(buffer, item, stopped)
+
+        def fetch_batches():
+            items = self.all(concurrency, prefetch)
+            batch: list[TModel] = []
+            try:
+                for item in items:
+                    batch.append(item)
+                    if len(batch) == batch_size:
+                        if not put(batch):
+                            return
+                        batch = []
+            except Exception as e:
+                if not batch or put(batch):
+                    put(e)
+                return
+            finally:
+                items.close()
+            if not batch or put(batch):
+                put(end_of_batches)
+
+        fetcher = threading.Thread(target=fetch_batches, daemon=True)
+        fetcher.start()
+        try:
+            while True:
+                batch = buffer.get()
+                if batch is end_of_batches:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            stopped.set()
+
+    def _streamed(self) -> bool:
+        return not isinstance(self.data, list)
+
+    def _stream_page(self, items: Iterator[TModel]) -> Iterator[TModel]:
+        """
+        Yield the items of a streamed page, and once they've all been read, record how many there were.
+        """
+        response = self.response
+        item_count = 0
+        for item in items:
+            item_count += 1
+            yield item
+        # Unless this instance has moved on to another page in the meantime
+        if self.response is response:
+            self.item_count = item_count
+
+    def _resume_after(self, page: PaginatedResponse[TModel]):
+        """
+        Move this instance onto a page whose items have all been yielded, so that the next call
+        to all() carries on from the page after it.
+
+        Args:
+            page (PaginatedResponse[TModel]): The last page that was fully yielded.
+        """
+        if page is not self:
+            self._adopt(page)
+        self._page_consumed = True
+
+    def _adopt(self, page: PaginatedResponse[TModel]):
+        """
+        Move this instance onto another page, taking over the state the page was parsed into rather than
+        parsing its response again, which a streamed body can't be.
+
+        Args:
+            page (PaginatedResponse[TModel]): The page to move onto.
+        """
+        for name in self._PAGE_STATE:
+            setattr(self, name, getattr(page, name))
+        if self._stream_items is not None:
+            # Counted onto this instance once they've been read
+            self.data = self._stream_page(self._stream_items)
+
+    def _request_next_page(self) -> PaginatedResponse[TModel]:
+        """
+        Request the page following this one without changing the state of this instance.
+
+        Returns:
+            PaginatedResponse[TModel]: A new PaginatedResponse holding the next page.
+        """
+        if self.forward_only:
+            return self.endpoint._paginated_forward_only(
+                self.response_model, self.page_size, self.params, self.next_page_id, self.next_page
+            )
+        return self._fetch_page(self.next_page)
+
+    def _all_prefetched(self, prefetch: int, checkpoint: Callable[[PaginationCursor], None] | None = None):
+        """
+        Yield the items of the current page and every page after it, while a background thread
+        fetches up to `prefetch` pages ahead into a bounded buffer. The buffer caps memory use to
+        `prefetch` pages on top of the one being consumed, and the fetcher waits for room in it
+        before requesting more.
+
+        Args:
+            prefetch (int): The number of pages to read ahead of the page being consumed.
+            checkpoint (Callable[[PaginationCursor], None], optional): Called after every page (see all()).
+
+        Yields:
+            TModel: An instance of the model class for each item in the paginated response.
+        """
+        if not self.has_data:
+            return
+
+        end_of_pages = object()
+        buffer: queue.Queue = queue.Queue(maxsize=prefetch)
+        stopped = threading.Event()
+
+        def put(item) -> bool:
+            return _put_unless_stopped(buffer, item, stopped)
+
+        def fetch_pages():
+            page = self
+            try:
+                while page.has_next_page and page.next_page and not stopped.is_set():
+                    page = page._request_next_page()
+                    if not page.has_data or not put(page):
+                        break
+            except Exception as e:
+                put(e)
+                return
+            put(end_of_pages)
+
+        fetcher = threading.Thread(target=fetch_pages, daemon=True)
+        fetcher.start()
+        try:
+            if not self._page_consumed:
+                yield from self.data
+                self._page_consumed = True
+                if checkpoint is not None:
+                    checkpoint(self._cursor_after())
+            consumed = self
+            while True:
+                page = buffer.get()
+                if page is end_of_pages:
+                    break
+                if isinstance(page, Exception):
+                    self._resume_after(consumed)
+                    raise page
+                yield from page.data
+                consumed = page
+                if checkpoint is not None:
+                    checkpoint(page._cursor_after())
+        finally:
+            stopped.set()
+        self.has_data = False
+
+    def _fetch_page(self, page: int) -> PaginatedResponse[TModel]:
+        """
+        Fetch a single page from the endpoint without changing the state of this instance.
+
+        Args:
+            page (int): The page number to fetch.
+
+        Returns:
+            PaginatedResponse[TModel]: A new PaginatedResponse holding the requested page.
+        """
+        return self.endpoint.paginated(page, self.page_size, self.params)
+
+    def _all_concurrent(
+        self,
+        concurrency: int,
+        checkpoint: Callable[[PaginationCursor], None] | None = None,
+        plan: PaginationPlan | None = None,
+        on_page: Callable[[PaginatedResponse[TModel]], None] | None = None,
+    ):
+        """
+        Yield the items of the current page, then fetch the following pages with up to `concurrency`
+        requests in flight, yielding each page's items in order as soon as it (and every page before it) has arrived.
+
+        When a plan is given, or ConnectWise Manage reports the last page in its Link header, pages up
+        to it are fetched. Otherwise (ConnectWise Automate) pages are fetched until one comes back empty
+        or short. If the planned last page comes back full and with more items than planned, items were
+        added after the plan was made, so the walk carries on until a page comes back empty or short.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time.
+            checkpoint (Callable[[PaginationCursor], None], optional): Called after every page (see all()).
+            plan (PaginationPlan, optional): The extent of the walk (see extract()).
+            on_page (Callable[[PaginatedResponse[TModel]], None], optional): Called with every page once
+            its items have all been yielded.
+
+        Yields:
+            TModel: An instance of the model class for each item in the paginated response.
+        """
+        if not self.has_data:
+            return
+        if not self._page_consumed:
+            yield from self.data
+            self._page_consumed = True
+            if checkpoint is not None:
+                checkpoint(self._cursor_after())
+            if on_page is not None:
+                on_page(self)
+        if plan is not None:
+            last_page = plan.last_page
+            if self.page >= last_page and not self._outgrew_plan(plan):
+                self.has_data = False
+                return
+        elif not self.has_next_page or not self.next_page:
+            self.has_data = False
+            return
+        else:
+            last_page = self.last_page if self.parsed_link_headers is not None else None
+
+        next_page = self.page + 1
+        concurrency_limiter = self.endpoint.client.concurrency_limiter
+        in_flight: deque[Future[PaginatedResponse[TModel]]] = deque()
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        consumed = self
+        try:
+            while True:
+                # With an adaptive limiter, only as many pages as it currently allows are requested ahead
+                window = min(concurrency, concurrency_limiter.limit) if concurrency_limiter is not None else concurrency
+                while len(in_flight) < window and (last_page is None or next_page <= last_page):
+                    in_flight.append(executor.submit(self._fetch_page, next_page))
+                    next_page += 1
+                if not in_flight:
+                    if plan is not None and last_page is not None and consumed._outgrew_plan(plan):
+                        last_page = None
+                        continue
+                    break
+
+                try:
+                    page = in_flight.popleft().result()
+                except Exception:
+                    self._resume_after(consumed)
+                    raise
+                yield from page.data
+                consumed = page
+                if checkpoint is not None:
+                    checkpoint(page._cursor_after())
+                if on_page is not None:
+                    on_page(page)
+                if last_page is None and page._is_last_page():
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.has_data = False
+
+    def _is_last_page(self) -> bool:
+        """
+        Whether this page is the last one when the API doesn't say, i.e. it's empty or short.
+        The number of items on a raw page isn't known without decoding it, so raw walks stop at
+        the first empty page instead.
+        """
+        return not self.data or (self.item_count is not None and self.item_count < self.page_size)
+
+    def _outgrew_plan(self, plan: PaginationPlan) -> bool:
+        """
+        Whether this page, the last one of a plan, is full and holds more items than the plan expected,
+        i.e. items were added to the collection after they were counted and the pages go on.
+        """
+        planned_items = plan.total_count - (self.page - 1) * self.page_size
+        return not self._is_last_page() and self.item_count is not None and self.item_count > planned_items
+
+    def plan(self, total_count: int | None = None) -> PaginationPlan:
+        """
+        Work out the extent of the walk from the current page to the end of the collection. The
+        collection's items are counted with the endpoint's count endpoint (e.g. /service/tickets/count
+        for /service/tickets), with the walk's query params, so conditions count the same items the
+        walk yields.
+
+        Args:
+            total_count (int, optional): The number of items in the collection, for endpoints without a
+            count endpoint (e.g. ConnectWise Automate's) when it's known from elsewhere. Defaults to
+            counting them.
+
+        Returns:
+            PaginationPlan: The plan, starting from the current page, or the page after it if all()
+            has yielded all of the current page's items.
+
+        Raises:
+            ValueError: If total_count isn't given and the endpoint has no count endpoint.
+        """
+        if total_count is None:
+            total_count = self._count_items()
+        first_page = self.page + 1 if self._page_consumed else self.page
+        return PaginationPlan(total_count, self.page_size, first_page)
+
+    def _count_items(self) -> int:
+        count_endpoint = getattr(self.endpoint, "count", None)
+        if count_endpoint is None:
+            raise ValueError(f"{type(self.endpoint).__name__} has no count endpoint, pass total_count instead")
+        # Counts are parsed into models whatever format the walk's pages are in
+        count = count_endpoint.with_response_format("models").get(params=self.params.for_count())
+        return count.count or 0
+
+    def extract(
+        self,
+        concurrency: int = 8,
+        progress: Callable[[PaginationProgress], None] | None = None,
+        checkpoint: Callable[[PaginationCursor], None] | None = None,
+        total_count: int | None = None,
+    ):
+        """
+        Iterate through all items in the paginated response, across all pages, after counting them
+        (see plan()). With the last page known up front, every page can be requested as soon as there's
+        room in the `concurrency` window, even where the API's Link headers are missing, and progress
+        can be reported against the total. Items are yielded in page order, as all() yields them.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time. Defaults to 8.
+            progress (Callable[[PaginationProgress], None], optional): Called after every page with the
+            walk's progress, e.g. to update a progress bar or log an ETA.
+            checkpoint (Callable[[PaginationCursor], None], optional): Called after every page with the
+            cursor to resume the walk from (see all()).
+            total_count (int, optional): The number of items in the collection, if it's known (see plan()).
+
+        Yields:
+            TModel: An instance of the model class for each item in the paginated response.
+
+        Raises:
+            ValueError: If the response uses forward-only pagination, whose pages can't be requested
+            out of order, or the collection can't be counted (see plan()).
+        """
+        if self.forward_only:
+            raise ValueError("Forward-only pages can only be requested in order, walk them with all() instead")
+        if not self.has_data:
+            return
+        tracker = PaginationProgress(self.plan(total_count))
+
+        def on_page(page: PaginatedResponse[TModel]):
+            if not page.has_data:
+                # The empty page that ends a walk whose collection shrank, or grew, since it was counted
+                return
+            tracker.pages_done += 1
+            if page.item_count is not None:
+                tracker.items_done += page.item_count
+            if progress is not None:
+                progress(tracker)
+
+        if self._streamed():
+            # As in all(), streamed pages aren't read ahead
+            concurrency = 1
+        yield from self._all_concurrent(concurrency, checkpoint, tracker.plan, on_page)
+
+    def cursor(self) -> PaginationCursor:
+        """
+        Get the position of the walk: the current page if all() hasn't yielded all its items yet,
+        otherwise the page after it. Save it (see PaginationCursor.to_dict) to carry the walk on
+        later with resume().
+
+        Returns:
+            PaginationCursor: The cursor.
+        """
+        if self._page_consumed:
+            return self._cursor_after()
+        return self._cursor_at(self.page, self.page_id)
+
+    def _cursor_after(self) -> PaginationCursor:
+        """
+        The cursor to resume the walk from once all of this page's items have been yielded: the next page,
+        or a finished cursor if this page is the last one.
+        """
+        last = not self.has_next_page or not self.next_page
+        if self.parsed_link_headers is None and not self.forward_only:
+            # Without Link headers (ConnectWise Automate), a short page is the last one
+            last = self._is_last_page()
+        if last:
+            return self._cursor_at(None, None)
+        return self._cursor_at(self.next_page, self.next_page_id)
+
+    def _cursor_at(self, page: int | None, page_id: int | None) -> PaginationCursor:
+        endpoint = self.endpoint
+        endpoint_class = type(endpoint)
+        if endpoint._route_format is not None:
+            path = endpoint._route_format.format(*endpoint._path_ids)
+        else:
+            path = endpoint._get_replaced_url()
+        return PaginationCursor(
+            PaginationCursor.sync_endpoint_module(endpoint_class.__module__),
+            endpoint._path_ids,
+            path,
+            f"{self.response_model.__module__}.{self.response_model.__qualname__}",
+            self.params,
+            page,
+            self.page_size,
+            page_id,
+            self.forward_only,
+        )
+
+    @classmethod
+    def resume(cls, client, cursor: PaginationCursor) -> PaginatedResponse:
+        """
+        Carry on a walk from a cursor, e.g. one saved by a checkpoint callback of all() in a worker
+        that has since stopped. The page the cursor points at is requested with the cursor's query params
+        and page size, and the walk continues from it as if it had never stopped. The client must be
+        for the same API (Manage or Automate) as the one the cursor was made with.
+
+        Args:
+            client: The client to make the requests with.
+            cursor (PaginationCursor): The position to carry on from.
+
+        Returns:
+            PaginatedResponse: The response holding the page the cursor points at.
+
+        Raises:
+            ValueError: If the cursor has finished, i.e. there's nothing left to resume.
+        """
+        from pyconnectwise.endpoints.base.connectwise_endpoint import _load_endpoint_class
+
+        if cursor.finished:
+            raise ValueError(f"Nothing left to resume, {cursor!r} has finished")
+        endpoint = _load_endpoint_class(cursor.endpoint_module())._at_path(client, cursor.path_ids)
+        if cursor.forward_only:
+            return endpoint._paginated_forward_only(
+                cursor.load_model(), cursor.page_size, cursor.params, cursor.page_id, cursor.page
+            )
+        return endpoint.paginated(cursor.page, cursor.page_size, cursor.params)
+
+    def _with_response_format(self, response_format: str) -> PaginatedResponse[TModel]:
+        """
+        Get a copy of this response whose current page and following pages are in another response
+        format, without requesting the current page again. The copy carries on from where all() left
+        this instance. Returns this instance if it's already in the format.
+        """
+        if self.endpoint._get_response_format() == response_format:
+            return self
+        copy = self.__class__(
+            self.response,
+            self.response_model,
+            self.endpoint.with_response_format(response_format),
+            self.page,
+            self.page_size,
+            self.forward_only,
+            self.page_id,
+            self.params,
+        )
+        copy.has_data = copy.has_data and self.has_data
+        copy._page_consumed = self._page_consumed
+        return copy
+
+    def iter_record_batches(self, concurrency: int = 1, prefetch: int = 0):
+        """
+        Iterate through all items in the paginated response as Arrow record batches, one per page,
+        from where all() has got to. Pages are read straight into columns, without building a model
+        per item (see pyconnectwise.utils.columnar), and are fetched like all() fetches them.
+        Requires pyarrow.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time (see all()).
+            prefetch (int): The number of pages to read ahead of the page being consumed (see all()).
+
+        Yields:
+            pyarrow.RecordBatch: A record batch holding a page's items.
+        """
+        for table in self._with_response_format("arrow").all(concurrency, prefetch):
+            yield from table.to_batches()
+
+    def to_arrow(self, concurrency: int = 1, prefetch: int = 0):
+        """
+        Read all items in the paginated response, from where all() has got to, into a single Arrow
+        table (see iter_record_batches). Requires pyarrow.
+
+        Args:
+            concurrency (int): The maximum number of pages to fetch at the same time (see all()).
+            prefetch (int): The number of pages to read ahead of the page being consumed (see all()).
+
+        Returns:
+            pyarrow.Table: A table with a row per item and a column per model field.
+        """
+        pa = import_pyarrow()
+        batches = list(self.iter_record_batches(concurrency, prefetch))
+        return pa.Table.from_batches(batches, schema=arrow_schema(self.response_model))
+
     def __iter__(self):
         """
         Implement the iterator protocol for the PaginatedResponse class.
@@ -169,6 +836,10 @@ class PaginatedResponse(Generic[TModel]):
         Raises:
             StopIteration: If there are no more items in the data.
         """
+        if self._streamed():
+            result = next(self.data)
+            self.index += 1
+            return result
         if self.index < len(self.data):
             result = self.data[self.index]
             self.index += 1
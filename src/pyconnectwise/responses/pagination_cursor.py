@@ -0,0 +1,132 @@
+from __future__ import annotations
+import importlib
+from typing import Any
+
+
+class PaginationCursor:
+    """
+    PaginationCursor is the position of a walk over a paginated response: the endpoint, the query
+    params and the page to carry on from. It's plain data, so it can be saved (see to_dict) while a
+    long walk runs, e.g. from the checkpoint callback of PaginatedResponse.all(), and a crashed or
+    pre-empted worker can pick the walk up where it stopped with PaginatedResponse.resume().
+
+    Attributes:
+        endpoint (str): The module of the endpoint class, e.g. "pyconnectwise.endpoints.manage.ServiceTicketsEndpoint".
+            Always the synchronous class's, so a walk can be resumed by a sync or an async client.
+        path_ids (tuple[int, ...]): The IDs bound along the endpoint and its parents, outermost first.
+        path (str): The endpoint's path below the API root, e.g. "service/tickets/250/notes".
+        model (str): The model the items are parsed into, as "module.ClassName".
+        params (dict[str, Any]): The query parameters of the walk, other than the pagination ones.
+        page (int | None): The number of the page to carry on from, or None if the walk has finished.
+        page_size (int): The number of items per page.
+        page_id (int | None): The pageId to carry on from, when the walk uses forward-only pagination.
+        forward_only (bool): Whether the walk uses forward-only (pageId) pagination.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        path_ids: tuple[int, ...],
+        path: str,
+        model: str,
+        params: dict[str, Any],
+        page: int | None,
+        page_size: int,
+        page_id: int | None = None,
+        forward_only: bool = False,
+    ):
+        self.endpoint = endpoint
+        self.path_ids = tuple(path_ids)
+        self.path = path
+        self.model = model
+        self.params = dict(params)
+        self.page = page
+        self.page_size = page_size
+        self.page_id = page_id
+        self.forward_only = forward_only
+
+    @property
+    def finished(self) -> bool:
+        """
+        Whether the walk has gone through every page, leaving nothing to resume.
+        """
+        return self.page is None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the cursor as a dict of JSON-serializable values, e.g. to save it with json.dump().
+
+        Returns:
+            dict[str, Any]: The cursor's attributes.
+        """
+        return {
+            "endpoint": self.endpoint,
+            "path_ids": list(self.path_ids),
+            "path": self.path,
+            "model": self.model,
+            "params": self.params,
+            "page": self.page,
+            "page_size": self.page_size,
+            "page_id": self.page_id,
+            "forward_only": self.forward_only,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PaginationCursor:
+        """
+        Rebuild a cursor saved with to_dict().
+
+        Parameters:
+            data (dict[str, Any]): The cursor's attributes.
+
+        Returns:
+            PaginationCursor: The cursor.
+        """
+        return cls(
+            data["endpoint"],
+            tuple(data["path_ids"]),
+            data["path"],
+            data["model"],
+            data["params"],
+            data["page"],
+            data["page_size"],
+            data.get("page_id"),
+            data.get("forward_only", False),
+        )
+
+    @staticmethod
+    def sync_endpoint_module(module_name: str) -> str:
+        """
+        Get the module of the synchronous counterpart of a generated endpoint class, e.g.
+        "pyconnectwise.endpoints.manage.ServiceTicketsEndpoint" for
+        "pyconnectwise.endpoints.async_manage.AsyncServiceTicketsEndpoint".
+        """
+        package, _, class_name = module_name.rpartition(".")
+        parent, _, api = package.rpartition(".")
+        if not api.startswith("async_"):
+            return module_name
+        return f"{parent}.{api.removeprefix('async_')}.{class_name.removeprefix('Async')}"
+
+    def endpoint_module(self, asynchronous: bool = False) -> str:
+        """
+        Get the module of the endpoint class to resume the walk with.
+
+        Parameters:
+            asynchronous (bool, optional): Get the async endpoint class's module instead. Defaults to False.
+        """
+        if not asynchronous:
+            return self.endpoint
+        package, _, class_name = self.endpoint.rpartition(".")
+        parent, _, api = package.rpartition(".")
+        return f"{parent}.async_{api}.Async{class_name}"
+
+    def load_model(self) -> type:
+        """
+        Import the model the walk's items are parsed into.
+        """
+        module_name, _, class_name = self.model.rpartition(".")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def __repr__(self) -> str:
+        position = f"page_id={self.page_id}" if self.forward_only else f"page={self.page}"
+        return f"PaginationCursor({self.path!r}, {position}, page_size={self.page_size})"
@@ -0,0 +1,100 @@
+from __future__ import annotations
+import math
+import time
+
+
+class PaginationPlan:
+    """
+    PaginationPlan is the extent of a walk over a paginated response, worked out up front from the
+    number of items in the collection, e.g. as reported by a ConnectWise Manage count endpoint for the
+    walk's conditions. Knowing the last page lets every page be requested at once, without waiting for
+    Link headers or for a short page to find where the collection ends.
+
+    Attributes:
+        total_count (int): The number of items in the collection, across all pages.
+        page_size (int): The number of items per page.
+        first_page (int): The number of the page the walk starts from.
+    """
+
+    def __init__(self, total_count: int, page_size: int, first_page: int = 1):
+        self.total_count = total_count
+        self.page_size = page_size
+        self.first_page = first_page
+
+    @property
+    def last_page(self) -> int:
+        """
+        The number of the last page that holds items, or the first page if there are none.
+        """
+        return max(math.ceil(self.total_count / self.page_size), self.first_page)
+
+    @property
+    def page_count(self) -> int:
+        """
+        The number of pages the walk requests, from first_page to last_page.
+        """
+        return self.last_page - self.first_page + 1
+
+    @property
+    def item_count(self) -> int:
+        """
+        The number of items the walk yields, from first_page to the end of the collection.
+        """
+        return max(self.total_count - (self.first_page - 1) * self.page_size, 0)
+
+    def __repr__(self) -> str:
+        return (
+            f"PaginationPlan(total_count={self.total_count}, page_size={self.page_size}, "
+            f"pages={self.first_page}-{self.last_page})"
+        )
+
+
+class PaginationProgress:
+    """
+    PaginationProgress is how far a planned walk has got, passed to the progress callback of
+    PaginatedResponse.extract() after every page. The estimates are based on pages rather than
+    items, as every page but the last holds page_size items and raw pages aren't counted.
+
+    Attributes:
+        plan (PaginationPlan): The plan of the walk.
+        pages_done (int): The number of pages whose items have all been yielded.
+        items_done (int): The number of items yielded, counting only pages whose size is known.
+        started (float): When the walk started, as a time.monotonic() timestamp.
+    """
+
+    def __init__(self, plan: PaginationPlan, started: float | None = None):
+        self.plan = plan
+        self.pages_done = 0
+        self.items_done = 0
+        self.started = time.monotonic() if started is None else started
+
+    @property
+    def elapsed(self) -> float:
+        """
+        The number of seconds since the walk started.
+        """
+        return time.monotonic() - self.started
+
+    @property
+    def fraction(self) -> float:
+        """
+        The share of the planned pages that are done, from 0 to 1.
+        """
+        return min(self.pages_done / self.plan.page_count, 1.0)
+
+    @property
+    def eta(self) -> float | None:
+        """
+        The estimated number of seconds until the walk finishes, or None before the first page is done.
+        """
+        if not self.pages_done:
+            return None
+        pages_left = max(self.plan.page_count - self.pages_done, 0)
+        return self.elapsed / self.pages_done * pages_left
+
+    def __repr__(self) -> str:
+        eta = f"{self.eta:.1f}s" if self.eta is not None else "unknown"
+        return (
+            f"PaginationProgress({self.pages_done}/{self.plan.page_count} pages, "
+            f"{self.items_done}/{self.plan.item_count} items, eta={eta})"
+        )
@@ -0,0 +1,91 @@
+from __future__ import annotations
+from collections.abc import Iterator, Mapping
+
+
+class PaginationQuery(Mapping):
+    """
+    PaginationQuery is the query of a paginated walk: the query parameters every page is requested
+    with, e.g. conditions, orderBy, fields and childConditions, apart from the pagination ones. It's
+    immutable, so a walk requests every page with the query its first page was requested with, and
+    the caller's dict can be reused or changed without affecting walks already under way.
+
+    It's a read-only mapping of the parameters. The pagination parameters (page, pageSize and pageId)
+    are left out, and added per request by for_page() and for_page_id().
+    """
+
+    PAGINATION_PARAMS: frozenset[str] = frozenset({"page", "pageSize", "pageId"})
+    # The parameters that pick which items are in the collection, as opposed to how they're returned
+    FILTER_PARAMS: frozenset[str] = frozenset({"conditions", "childConditions", "customFieldConditions"})
+
+    __slots__ = ("_params",)
+
+    def __init__(self, params: Mapping[str, int | str] | None = None):
+        """
+        Parameters:
+            params (Mapping[str, int | str], optional): The query parameters. Pagination parameters are ignored.
+        """
+        self._params: dict[str, int | str] = {
+            name: value for name, value in (params or {}).items() if name not in self.PAGINATION_PARAMS
+        }
+
+    @classmethod
+    def of(cls, params: Mapping[str, int | str] | None) -> PaginationQuery:
+        """
+        Get the query of the given params, reusing params if it's a query already.
+        """
+        return params if isinstance(params, cls) else cls(params)
+
+    def for_page(self, page: int, page_size: int) -> dict[str, int | str]:
+        """
+        Get the query parameters to request a page by its number with.
+
+        Parameters:
+            page (int): The number of the page, counting from 1.
+            page_size (int): The number of items per page.
+
+        Returns:
+            dict[str, int | str]: A new dict of the parameters, including page and pageSize.
+        """
+        return {**self._params, "page": page, "pageSize": page_size}
+
+    def for_page_id(self, page_size: int, page_id: int | None = None) -> dict[str, int | str]:
+        """
+        Get the query parameters to request a page with forward-only (pageId) pagination.
+
+        Parameters:
+            page_size (int): The number of items per page.
+            page_id (int, optional): The pageId to continue from. Omit for the first page.
+
+        Returns:
+            dict[str, int | str]: A new dict of the parameters, including pageSize and pageId.
+        """
+        params = {**self._params, "pageSize": page_size}
+        if page_id is not None:
+            params["pageId"] = page_id
+        return params
+
+    def for_count(self) -> dict[str, int | str]:
+        """
+        Get the query parameters to count the walk's items with, e.g. from a ConnectWise Manage count
+        endpoint. Only the filter parameters (FILTER_PARAMS) are kept, as count endpoints don't accept
+        the others, such as orderBy and fields.
+
+        Returns:
+            dict[str, int | str]: A new dict of the parameters.
+        """
+        return {name: value for name, value in self._params.items() if name in self.FILTER_PARAMS}
+
+    def __getitem__(self, name: str) -> int | str:
+        return self._params[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._params)
+
+    def __len__(self) -> int:
+        return len(self._params)
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self._params.items()))
+
+    def __repr__(self) -> str:
+        return f"PaginationQuery({self._params!r})"
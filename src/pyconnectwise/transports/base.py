@@ -0,0 +1,74 @@
+from typing import Any
+
+
+class ConnectWiseTransport:
+    """
+    ConnectWiseTransport is the I/O layer a client sends its requests through. Clients use a
+    RequestsTransport unless another transport is passed in, which makes it possible to swap in
+    a different HTTP library, a recording proxy or an in-memory fake (see InMemoryTransport).
+
+    Subclasses implement request(), returning an object that behaves like requests.Response
+    (status_code, headers, text, content, json(), iter_content() and close()).
+    """
+
+    # Exceptions raised by request() for failures worth retrying, such as dropped connections
+    retryable_exceptions: tuple[type[Exception], ...] = ()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        stream: bool = False,
+    ):
+        """
+        Send a single request.
+
+        Parameters:
+            method (str): The HTTP method to use for the request.
+            url (str): The full URL to send the request to.
+            headers (dict[str, str], optional): The request headers.
+            params (dict[str, Any], optional): The query parameters to include in the request.
+            json (Any, optional): The request body, serialized as JSON. No body is sent when None.
+            stream (bool, optional): Return as soon as the response's headers have arrived and leave the body
+                to be read with iter_content(), as the "stream" response format does. Only passed when True,
+                and transports that hold bodies in memory can ignore it. Defaults to False.
+
+        Returns:
+            The response to the request.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Release any resources, such as pooled connections, held by the transport.
+        """
+
+
+class AsyncConnectWiseTransport:
+    """
+    AsyncConnectWiseTransport is the asyncio counterpart of ConnectWiseTransport, used by the
+    async clients. request() is awaitable and returns an object that behaves like httpx.Response.
+    """
+
+    retryable_exceptions: tuple[type[Exception], ...] = ()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ):
+        """
+        Send a single request. See ConnectWiseTransport.request.
+        """
+        raise NotImplementedError
+
+    async def close(self):
+        """
+        Release any resources, such as pooled connections, held by the transport.
+        """
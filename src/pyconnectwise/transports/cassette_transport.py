@@ -0,0 +1,332 @@
+import asyncio
+import gzip
+import json as jsonlib
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+from pyconnectwise.exceptions import ConnectWiseCassetteException
+from pyconnectwise.transports.base import AsyncConnectWiseTransport, ConnectWiseTransport
+from pyconnectwise.transports.httpx_transport import HttpxTransport
+from pyconnectwise.transports.memory_transport import AsyncInMemoryTransport, InMemoryTransport
+from pyconnectwise.transports.requests_transport import RequestsTransport
+
+REDACTED = "[REDACTED]"
+
+
+class Cassette:
+    """
+    Cassette holds the request/response pairs recorded by a CassetteTransport, and reads and
+    writes them in a compact on-disk format: gzipped JSON, keeping only the URL path, query
+    parameters and body of each request, and the status code, Link and Content-Type headers,
+    body and latency of each response.
+
+    Credentials are never written. Request headers, which carry the Authorization header and
+    client ID, aren't recorded at all, and any field named in `scrub_fields` is replaced with
+    "[REDACTED]" in request and response bodies. By default that covers the Automate login
+    (UserName, Password) and the access token it returns.
+
+    When replaying, a request is answered by a recorded interaction with the same method, path,
+    query parameters, pagination type and body. Failing that, the page size is ignored, so a cassette
+    recorded with one page size still replays when walked with another.
+    Repeated requests cycle through the matching interactions in the order they were recorded.
+    """
+
+    VERSION: int = 1
+    RECORDED_HEADERS: tuple[str, ...] = ("Content-Type", "Link")
+    DEFAULT_SCRUB_FIELDS: frozenset[str] = frozenset({"UserName", "Password", "AccessToken"})
+
+    def __init__(
+        self, interactions: list[dict[str, Any]] | None = None, scrub_fields: frozenset[str] = DEFAULT_SCRUB_FIELDS
+    ):
+        """
+        Parameters:
+            interactions (list[dict[str, Any]], optional): Previously recorded interactions. Defaults to None.
+            scrub_fields (frozenset[str], optional): Names of body fields to redact. Defaults to the Automate login fields.
+        """
+        self.scrub_fields = frozenset(scrub_fields)
+        self.interactions: list[dict[str, Any]] = []
+        self._by_request: dict[tuple, list[dict[str, Any]]] = {}
+        self._by_request_without_page_size: dict[tuple, list[dict[str, Any]]] = {}
+        self._replay_counts: dict[tuple, int] = {}
+        # The number of requests answered from the cassette so far
+        self.replayed: int = 0
+        self._lock = threading.Lock()
+        for interaction in interactions or []:
+            self._add(interaction)
+
+    @classmethod
+    def load(cls, path: str, scrub_fields: frozenset[str] = DEFAULT_SCRUB_FIELDS) -> "Cassette":
+        """
+        Read a cassette from disk.
+
+        Parameters:
+            path (str): The cassette file.
+            scrub_fields (frozenset[str], optional): Names of body fields to redact. Defaults to the Automate login fields.
+
+        Returns:
+            Cassette: The cassette.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            data = jsonlib.load(file)
+        return cls(data["interactions"], scrub_fields)
+
+    def save(self, path: str):
+        """
+        Write the cassette to disk.
+
+        Parameters:
+            path (str): The cassette file. It is overwritten if it exists.
+        """
+        with self._lock:
+            data = {"version": self.VERSION, "interactions": list(self.interactions)}
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            jsonlib.dump(data, file, separators=(",", ":"))
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        params: dict[str, Any] | None,
+        json: Any,
+        response,
+        latency: float,
+    ):
+        """
+        Add a request and the response it received to the cassette, scrubbing credentials.
+
+        Parameters:
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+            headers (dict[str, str], optional): The request headers. Only the pagination type is kept.
+            params (dict[str, Any], optional): The query parameters of the request.
+            json (Any): The request body.
+            response: The response, a requests.Response or httpx.Response.
+            latency (float): How long the request took, in seconds.
+        """
+        body = response.text
+        if any(f'"{field}"' in body for field in self.scrub_fields):
+            try:
+                body = jsonlib.dumps(self._scrub(jsonlib.loads(body)))
+            except ValueError:
+                pass
+        self._add(
+            {
+                "method": method.upper(),
+                "path": urlsplit(url).path,
+                "params": {key: str(value) for key, value in (params or {}).items()},
+                "pagination_type": (headers or {}).get("pagination-type"),
+                "json": self._scrub(json),
+                "status_code": response.status_code,
+                "headers": {
+                    header: response.headers[header] for header in self.RECORDED_HEADERS if header in response.headers
+                },
+                "body": body,
+                "latency": latency,
+            }
+        )
+
+    def find(
+        self, method: str, url: str, headers: dict[str, str] | None, params: dict[str, Any] | None, json: Any
+    ) -> dict[str, Any]:
+        """
+        Find the recorded interaction that answers a request.
+
+        Parameters:
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+            headers (dict[str, str], optional): The request headers.
+            params (dict[str, Any], optional): The query parameters of the request.
+            json (Any): The request body.
+
+        Returns:
+            dict[str, Any]: The recorded interaction.
+
+        Raises:
+            ConnectWiseCassetteException: If no interaction matches the request.
+        """
+        request_key = self._request_key(
+            method.upper(),
+            urlsplit(url).path,
+            {key: str(value) for key, value in (params or {}).items()},
+            (headers or {}).get("pagination-type"),
+            self._scrub(json),
+        )
+        for key, index in (
+            (request_key, self._by_request),
+            (self._without_page_size(request_key), self._by_request_without_page_size),
+        ):
+            matches = index.get(key)
+            if matches:
+                with self._lock:
+                    count = self._replay_counts.get(key, 0)
+                    self._replay_counts[key] = count + 1
+                    self.replayed += 1
+                return matches[count % len(matches)]
+        raise ConnectWiseCassetteException(f"No recorded interaction for {method.upper()} {url} with params {params}")
+
+    def _add(self, interaction: dict[str, Any]):
+        request_key = self._request_key(
+            interaction["method"],
+            interaction["path"],
+            interaction["params"],
+            interaction.get("pagination_type"),
+            interaction.get("json"),
+        )
+        with self._lock:
+            self.interactions.append(interaction)
+            self._by_request.setdefault(request_key, []).append(interaction)
+            self._by_request_without_page_size.setdefault(self._without_page_size(request_key), []).append(interaction)
+
+    def _request_key(
+        self, method: str, path: str, params: dict[str, str], pagination_type: str | None, json: Any
+    ) -> tuple:
+        return (method, path, tuple(sorted(params.items())), pagination_type, jsonlib.dumps(json, sort_keys=True))
+
+    def _without_page_size(self, request_key: tuple) -> tuple:
+        params = tuple((key, value) for key, value in request_key[2] if key != "pageSize")
+        return request_key[:2] + (params,) + request_key[3:]
+
+    def _scrub(self, data: Any) -> Any:
+        """
+        Return a copy of JSON data with the values of the scrubbed fields redacted.
+        """
+        if isinstance(data, dict):
+            return {key: REDACTED if key in self.scrub_fields else self._scrub(value) for key, value in data.items()}
+        if isinstance(data, list):
+            return [self._scrub(item) for item in data]
+        return data
+
+
+class CassetteTransport(ConnectWiseTransport):
+    """
+    A transport that records the requests a client makes, and their responses, to a cassette file,
+    or replays them from one without any network access. This makes it possible to run the client
+    offline against real-shaped data, for example to catch parsing and pagination regressions or
+    to benchmark them (see pyconnectwise.utils.benchmark).
+
+    Example:
+        # record against the real API
+        with ConnectWiseManageAPIClient(..., transport=CassetteTransport("tickets.cassette", record=True)) as client:
+            tickets = list(client.service.tickets.paginated(1, 1000).all())
+
+        # replay offline, as fast as possible
+        client = ConnectWiseManageAPIClient(..., codebase="v4_6_release", transport=CassetteTransport("tickets.cassette"))
+        tickets = list(client.service.tickets.paginated(1, 1000).all())
+    """
+
+    def __init__(
+        self,
+        path: str,
+        record: bool = False,
+        transport: ConnectWiseTransport | None = None,
+        replay_latency: bool = False,
+        scrub_fields: frozenset[str] = Cassette.DEFAULT_SCRUB_FIELDS,
+    ):
+        """
+        Parameters:
+            path (str): The cassette file.
+            record (bool, optional): Record a new cassette, saved when the transport is closed, instead of replaying one. Defaults to False.
+            transport (ConnectWiseTransport, optional): The transport real requests are sent through when recording. Defaults to a RequestsTransport.
+            replay_latency (bool, optional): Wait as long as each recorded request took before answering it, instead of answering at once. Defaults to False.
+            scrub_fields (frozenset[str], optional): Names of body fields to redact when recording. Defaults to the Automate login fields.
+        """
+        self.path = path
+        self.recording = record
+        self.replay_latency = replay_latency
+        if record:
+            self.transport: ConnectWiseTransport | None = transport if transport is not None else RequestsTransport()
+            self.retryable_exceptions = self.transport.retryable_exceptions
+            self.cassette = Cassette(scrub_fields=scrub_fields)
+        else:
+            self.transport = None
+            self.cassette = Cassette.load(path, scrub_fields)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        stream: bool = False,
+    ):
+        if self.recording:
+            started = time.perf_counter()
+            response = self.transport.request(method, url, headers=headers, params=params, json=json)
+            self.cassette.record(method, url, headers, params, json, response, time.perf_counter() - started)
+            return response
+
+        interaction = self.cassette.find(method, url, headers, params, json)
+        if self.replay_latency:
+            time.sleep(interaction["latency"])
+        return InMemoryTransport.build_response(
+            interaction["status_code"], interaction["headers"], interaction["body"].encode(), url
+        )
+
+    def close(self):
+        if self.recording:
+            self.cassette.save(self.path)
+            self.transport.close()
+
+
+class AsyncCassetteTransport(AsyncConnectWiseTransport):
+    """
+    The asyncio counterpart of CassetteTransport, for the async clients. Cassettes are
+    interchangeable between the two.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        record: bool = False,
+        transport: AsyncConnectWiseTransport | None = None,
+        replay_latency: bool = False,
+        scrub_fields: frozenset[str] = Cassette.DEFAULT_SCRUB_FIELDS,
+    ):
+        """
+        Parameters:
+            path (str): The cassette file.
+            record (bool, optional): Record a new cassette, saved when the transport is closed, instead of replaying one. Defaults to False.
+            transport (AsyncConnectWiseTransport, optional): The transport real requests are sent through when recording. Defaults to an HttpxTransport.
+            replay_latency (bool, optional): Wait as long as each recorded request took before answering it, instead of answering at once. Defaults to False.
+            scrub_fields (frozenset[str], optional): Names of body fields to redact when recording. Defaults to the Automate login fields.
+        """
+        self.path = path
+        self.recording = record
+        self.replay_latency = replay_latency
+        if record:
+            self.transport: AsyncConnectWiseTransport | None = transport if transport is not None else HttpxTransport()
+            self.retryable_exceptions = self.transport.retryable_exceptions
+            self.cassette = Cassette(scrub_fields=scrub_fields)
+        else:
+            self.transport = None
+            self.cassette = Cassette.load(path, scrub_fields)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ):
+        if self.recording:
+            started = time.perf_counter()
+            response = await self.transport.request(method, url, headers=headers, params=params, json=json)
+            self.cassette.record(method, url, headers, params, json, response, time.perf_counter() - started)
+            return response
+
+        interaction = self.cassette.find(method, url, headers, params, json)
+        if self.replay_latency:
+            await asyncio.sleep(interaction["latency"])
+        return AsyncInMemoryTransport.build_response(
+            interaction["status_code"], interaction["headers"], interaction["body"].encode(), method, url, params
+        )
+
+    async def close(self):
+        if self.recording:
+            self.cassette.save(self.path)
+            await self.transport.close()
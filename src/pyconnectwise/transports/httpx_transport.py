@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.transports.base import AsyncConnectWiseTransport
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def import_httpx():
+    """
+    Import httpx, which the async clients send their requests with.
+
+    Returns:
+        module: The httpx module.
+
+    Raises:
+        ImportError: If httpx isn't installed.
+    """
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "The async clients require httpx. Install it with: pip install pyconnectwise[async]"
+        ) from e
+    return httpx
+
+
+class HttpxTransport(AsyncConnectWiseTransport):
+    """
+    The default transport of the async clients. Requests are sent through a single pooled,
+    keep-alive httpx.AsyncClient. Requires httpx (pip install pyconnectwise[async]), which is
+    only imported when the transport is created.
+    """
+
+    def __init__(self, pool_maxsize: int = 100):
+        """
+        Parameters:
+            pool_maxsize (int, optional): Maximum number of concurrent keep-alive connections to the API. Defaults to 100.
+
+        Raises:
+            ImportError: If httpx isn't installed.
+        """
+        httpx = import_httpx()
+        self.retryable_exceptions = (httpx.TransportError,)
+        limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+        # ConnectWise can take a long time to answer large queries, so requests aren't timed out
+        self.session: httpx.AsyncClient = httpx.AsyncClient(limits=limits, timeout=None)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ) -> httpx.Response:
+        return await self.session.request(method, url, headers=headers, params=params, json=json)
+
+    async def close(self):
+        await self.session.aclose()
@@ -0,0 +1,248 @@
+from __future__ import annotations
+import bisect
+import json as jsonlib
+import math
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from pyconnectwise.transports.base import AsyncConnectWiseTransport, ConnectWiseTransport
+from pyconnectwise.transports.httpx_transport import import_httpx
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class TransportRequest:
+    """
+    A request received by an in-memory transport, as passed to route handlers and kept in the
+    transport's `requests` list.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        params: dict[str, Any] | None,
+        json: Any,
+    ):
+        self.method: str = method.upper()
+        self.url: str = url
+        self.path: str = urlsplit(url).path
+        self.headers: CaseInsensitiveDict = CaseInsensitiveDict(headers or {})
+        self.params: dict[str, Any] = params or {}
+        self.json: Any = json
+
+
+# A route handler takes the request and returns the status code, headers and JSON body of the response
+RouteHandler = Callable[[TransportRequest], tuple[int, dict[str, str], Any]]
+
+
+class _InMemoryRoutes:
+    """
+    The routing shared by InMemoryTransport and AsyncInMemoryTransport.
+    """
+
+    def __init__(self):
+        self.routes: list[tuple[str | None, str, RouteHandler]] = []
+        self.requests: list[TransportRequest] = []
+
+    def add_response(
+        self,
+        method: str | None,
+        path: str,
+        json: Any = None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ):
+        """
+        Serve the same response to every request for a path.
+
+        Parameters:
+            method (str, optional): The HTTP method to answer, or None for any method.
+            path (str): The end of the URL path to answer, e.g. "/service/tickets" or "/login/companyinfo/mycompany".
+            json (Any, optional): The response body, serialized as JSON. Defaults to None.
+            status_code (int, optional): The response status code. Defaults to 200.
+            headers (dict[str, str], optional): The response headers. Defaults to None.
+        """
+        # Serialized once up front, so replaying the response costs next to nothing
+        response = (status_code, headers or {}, jsonlib.dumps(json).encode())
+        self.add_handler(method, path, lambda request: response)
+
+    def add_handler(self, method: str | None, path: str, handler: RouteHandler):
+        """
+        Answer the requests for a path with a function of the request. Routes added later take
+        precedence over routes added earlier.
+
+        Parameters:
+            method (str, optional): The HTTP method to answer, or None for any method.
+            path (str): The end of the URL path to answer.
+            handler (RouteHandler): Takes the TransportRequest and returns a (status code, headers, JSON body) tuple.
+            The body may also be given as already serialized bytes.
+        """
+        self.routes.insert(0, (method.upper() if method else None, path.rstrip("/"), handler))
+
+    def add_pages(self, path: str, items: list[Any]):
+        """
+        Serve a list of items as a paginated collection, the way ConnectWise Manage does. The page and
+        pageSize query parameters pick the page and Link headers point to the neighbouring pages. Requests
+        sent with forward-only pagination are answered by pageId, which requires items sorted by "id".
+
+        Parameters:
+            path (str): The end of the URL path to answer, e.g. "/service/tickets".
+            items (list[Any]): The full collection, as JSON-compatible items.
+        """
+        ids = [item.get("id") for item in items] if items and isinstance(items[0], dict) else []
+
+        def handler(request: TransportRequest) -> tuple[int, dict[str, str], Any]:
+            page_size = int(request.params.get("pageSize", 25))
+            base_url = request.url.split("?")[0]
+            links = []
+            if request.headers.get("pagination-type") == "forward-only":
+                page_id = request.params.get("pageId")
+                start = 0 if page_id is None else bisect.bisect_right(ids, int(page_id))
+                page_items = items[start : start + page_size]
+                if start + page_size < len(items):
+                    links.append(f'<{base_url}?pageSize={page_size}&pageId={page_items[-1]["id"]}>; rel="next"')
+            else:
+                page = int(request.params.get("page", 1))
+                last_page = max(1, math.ceil(len(items) / page_size))
+                page_items = items[(page - 1) * page_size : page * page_size]
+                if page > 1:
+                    links.append(f'<{base_url}?pageSize={page_size}&page={page - 1}>; rel="prev"')
+                    links.append(f'<{base_url}?pageSize={page_size}&page=1>; rel="first"')
+                if page < last_page:
+                    links.append(f'<{base_url}?pageSize={page_size}&page={page + 1}>; rel="next"')
+                    links.append(f'<{base_url}?pageSize={page_size}&page={last_page}>; rel="last"')
+            return 200, {"Link": ", ".join(links)} if links else {}, page_items
+
+        self.add_handler("GET", path, handler)
+
+    def _respond(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None,
+        params: dict[str, Any] | None,
+        json: Any,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """
+        Record the request and find the response to it.
+
+        Returns:
+            tuple[int, dict[str, str], bytes]: The status code, headers and body of the response.
+        """
+        request = TransportRequest(method, url, headers, params, json)
+        self.requests.append(request)
+        for route_method, route_path, handler in self.routes:
+            if (route_method is None or route_method == request.method) and request.path.rstrip("/").endswith(
+                route_path
+            ):
+                status_code, response_headers, body = handler(request)
+                break
+        else:
+            status_code, response_headers, body = 404, {}, {"code": "NotFound", "message": f"No route for {url}"}
+        response_headers = {"Content-Type": "application/json", **response_headers}
+        if not isinstance(body, bytes):
+            body = jsonlib.dumps(body).encode()
+        return status_code, response_headers, body
+
+
+class InMemoryTransport(_InMemoryRoutes, ConnectWiseTransport):
+    """
+    A transport that answers requests from canned responses held in memory, without any network
+    access. Useful for tests, and for benchmarking pagination, parsing and the generated endpoints
+    without network noise. Requests with no matching route get a 404 response, and every request
+    is kept in `requests`.
+
+    Example:
+        transport = InMemoryTransport()
+        transport.add_pages("/service/tickets", [{"id": i, "summary": "Ticket"} for i in range(1000)])
+        client = ConnectWiseManageAPIClient(..., codebase="v4_6_release", transport=transport)
+        tickets = list(client.service.tickets.paginated(1, 100).all())
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        status_code, response_headers, body = self._respond(method, url, headers, params, json)
+        return self.build_response(status_code, response_headers, body, url)
+
+    @staticmethod
+    def build_response(status_code: int, headers: dict[str, str], body: bytes, url: str) -> requests.Response:
+        """
+        Build a requests.Response without any network access.
+
+        Parameters:
+            status_code (int): The response status code.
+            headers (dict[str, str]): The response headers.
+            body (bytes): The response body.
+            url (str): The URL the response is for.
+
+        Returns:
+            requests.Response: The response.
+        """
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = body
+        # Marks the body as read, so iter_content() serves it from memory
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = url
+        return response
+
+
+class AsyncInMemoryTransport(_InMemoryRoutes, AsyncConnectWiseTransport):
+    """
+    The asyncio counterpart of InMemoryTransport, for the async clients. Its responses are httpx
+    Responses, so it requires httpx (pip install pyconnectwise[async]).
+    """
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+    ) -> httpx.Response:
+        status_code, response_headers, body = self._respond(method, url, headers, params, json)
+        return self.build_response(status_code, response_headers, body, method, url, params)
+
+    @staticmethod
+    def build_response(
+        status_code: int,
+        headers: dict[str, str],
+        body: bytes,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """
+        Build an httpx.Response without any network access.
+
+        Parameters:
+            status_code (int): The response status code.
+            headers (dict[str, str]): The response headers.
+            body (bytes): The response body.
+            method (str): The HTTP method of the request the response is for.
+            url (str): The URL the response is for.
+            params (dict[str, Any], optional): The query parameters of the request.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        httpx = import_httpx()
+        return httpx.Response(
+            status_code, headers=headers, content=body, request=httpx.Request(method, url, params=params)
+        )
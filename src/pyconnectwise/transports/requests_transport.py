@@ -0,0 +1,43 @@
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ChunkedEncodingError, ConnectionError
+
+from pyconnectwise.transports.base import ConnectWiseTransport
+
+
+class RequestsTransport(ConnectWiseTransport):
+    """
+    The default transport of the synchronous clients. Requests are sent through a single
+    connection-pooled, keep-alive requests.Session, so consecutive requests reuse the same
+    TCP/TLS connection instead of opening a new one each time.
+    """
+
+    retryable_exceptions = (ConnectionError, ChunkedEncodingError)
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False):
+        """
+        Parameters:
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of keep-alive connections kept open per host. Defaults to 10.
+            pool_block (bool, optional): Block when all pooled connections to a host are in use instead of opening extra ones. Defaults to False.
+        """
+        self.session: requests.Session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        return self.session.request(method, url, headers=headers, params=params, json=json, stream=stream)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,187 @@
+"""
+Benchmark harness that replays a recorded cassette (see CassetteTransport) through a client and
+reports the throughput of get(), paginated().all(), model parsing, trusted parsing (models built
+without validation, see ConnectWiseEndpoint.with_trusted_parsing) and plain JSON decoding for an
+endpoint. Running it before and after an upgrade catches parsing and pagination regressions
+without touching a live ConnectWise instance.
+
+Usage:
+    python -m pyconnectwise.utils.benchmark --cassette tickets.cassette --endpoint service/tickets --codebase v4_6_release
+    python -m pyconnectwise.utils.benchmark --cassette computers.cassette --api automate --endpoint computers
+"""
+import argparse
+import json
+import time
+import typing
+from typing import Callable
+
+from pyconnectwise.clients.automate_client import ConnectWiseAutomateAPIClient
+from pyconnectwise.clients.manage_client import ConnectWiseManageAPIClient
+from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
+from pyconnectwise.exceptions import ConnectWiseCassetteException
+from pyconnectwise.transports.cassette_transport import CassetteTransport
+
+
+class BenchmarkResult:
+    """
+    The outcome of timing one operation.
+    """
+
+    def __init__(self, name: str, iterations: int, requests: int, items: int, seconds: float):
+        self.name = name
+        self.iterations = iterations
+        self.requests = requests
+        self.items = items
+        self.seconds = seconds
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<20} {self.iterations:>6} {self.requests:>9} {self.items:>10} {self.seconds:>9.3f} "
+            f"{self.items_per_second:>12.0f} {self.requests_per_second:>10.0f}"
+        )
+
+
+OPERATIONS = ("get()", "paginated().all()", "model parsing", "trusted parsing", "JSON decoding")
+HEADER = f"{'operation':<20} {'runs':>6} {'requests':>9} {'items':>10} {'seconds':>9} {'items/s':>12} {'req/s':>10}"
+
+
+def create_client(args: argparse.Namespace, transport: CassetteTransport):
+    """
+    Create a client that sends its requests through the cassette. Credentials are placeholders,
+    as the cassette never contains any.
+    """
+    if args.api == "automate":
+        return ConnectWiseAutomateAPIClient(args.url, "benchmark", "benchmark", "benchmark", transport=transport)
+    return ConnectWiseManageAPIClient(
+        args.company, args.url, "benchmark", "benchmark", "benchmark", codebase=args.codebase, transport=transport
+    )
+
+
+def resolve_endpoint(client, path: str) -> ConnectWiseEndpoint:
+    """
+    Walk the client's endpoint tree, e.g. "company/companies/250/sites". Numeric parts select an ID.
+    """
+    endpoint = client
+    for part in path.strip("/").split("/"):
+        endpoint = endpoint.id(int(part)) if part.isdigit() else getattr(endpoint, part)
+    return endpoint
+
+
+def get_model_type(endpoint: ConnectWiseEndpoint) -> type:
+    """
+    Find the model an endpoint parses its responses into, from the return annotation of its get().
+    """
+    return_type = typing.get_type_hints(endpoint.get)["return"]
+    args = typing.get_args(return_type)
+    return args[0] if args else return_type
+
+
+def time_operation(
+    name: str, operation: Callable[[], int], iterations: int, transport: CassetteTransport | None = None
+) -> BenchmarkResult | None:
+    """
+    Run an operation repeatedly and time it.
+
+    Parameters:
+        name (str): The name to report the operation under.
+        operation (Callable[[], int]): Runs the operation once and returns the number of items it produced.
+        iterations (int): The number of times to run the operation.
+        transport (CassetteTransport, optional): Counts the requests made by the operation, if given.
+
+    Returns:
+        BenchmarkResult: The timings, or None if the cassette doesn't hold the responses the operation needs.
+    """
+    requests_before = transport.cassette.replayed if transport else 0
+    items = 0
+    started = time.perf_counter()
+    try:
+        for _ in range(iterations):
+            items += operation()
+    except ConnectWiseCassetteException:
+        # The cassette doesn't cover this operation
+        return None
+    seconds = time.perf_counter() - started
+    requests = transport.cassette.replayed - requests_before if transport else 0
+    return BenchmarkResult(name, iterations, requests, items, seconds)
+
+
+def run(args: argparse.Namespace) -> list[BenchmarkResult | None]:
+    """
+    Run every benchmark against the cassette and return the results, with None for the operations
+    the cassette doesn't cover.
+    """
+    transport = CassetteTransport(args.cassette, replay_latency=args.replay_latency)
+    client = create_client(args, transport)
+    endpoint = resolve_endpoint(client, args.endpoint)
+    trusted_endpoint = endpoint.with_trusted_parsing()
+    model_type = get_model_type(endpoint)
+    path_suffix = "/" + args.endpoint.strip("/").lower()
+    bodies: list[bytes] = [
+        interaction["body"].encode()
+        for interaction in transport.cassette.interactions
+        if interaction["method"] == "GET"
+        and interaction["status_code"] < 400
+        and interaction["path"].rstrip("/").lower().endswith(path_suffix)
+        and interaction["body"].lstrip().startswith("[")
+    ]
+
+    results = [
+        time_operation(OPERATIONS[0], lambda: len(endpoint.get()), args.iterations, transport),
+        time_operation(
+            OPERATIONS[1],
+            lambda: sum(1 for _ in endpoint.paginated(1, args.page_size).all()),
+            args.iterations,
+            transport,
+        ),
+        time_operation(
+            OPERATIONS[2],
+            lambda: sum(len(endpoint._parse_many(model_type, body)) for body in bodies),
+            args.iterations,
+        ),
+        time_operation(
+            OPERATIONS[3],
+            lambda: sum(len(trusted_endpoint._parse_many(model_type, body)) for body in bodies),
+            args.iterations,
+        ),
+        # Decoding alone, for the share of the model parsing time spent building the models
+        time_operation(OPERATIONS[4], lambda: sum(len(json.loads(body)) for body in bodies), args.iterations),
+    ]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pyconnectwise against a recorded cassette.")
+    parser.add_argument(
+        "--cassette", type=str, required=True, help="Path to the cassette recorded with CassetteTransport."
+    )
+    parser.add_argument("--endpoint", type=str, required=True, help="Endpoint path, e.g. service/tickets.")
+    parser.add_argument(
+        "--api", choices=("manage", "automate"), default="manage", help="API the cassette was recorded from."
+    )
+    parser.add_argument("--company", type=str, default="benchmark", help="Company name used when recording (Manage).")
+    parser.add_argument("--codebase", type=str, default=None, help="Codebase used when recording (Manage).")
+    parser.add_argument("--url", type=str, default="benchmark.local", help="Any host name; it isn't matched on.")
+    parser.add_argument("--page-size", type=int, default=1000, help="Page size for paginated().all().")
+    parser.add_argument("--iterations", type=int, default=10, help="Number of times each operation is run.")
+    parser.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="Wait for each request's recorded latency instead of replaying at once.",
+    )
+    args = parser.parse_args()
+
+    print(HEADER)
+    for name, result in zip(OPERATIONS, run(args)):
+        print(result if result is not None else f"{name:<20} not recorded in the cassette")
+
+
+if __name__ == "__main__":
+    main()
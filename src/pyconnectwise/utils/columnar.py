@@ -0,0 +1,190 @@
+"""
+Columnar decoding of response bodies into Apache Arrow tables, used by the "arrow" response format.
+A page's JSON is read by pyarrow's native JSON reader straight into typed column buffers, with a
+schema derived from the model's fields, so no per-row Python objects are built. Requires pyarrow
+(pip install pyconnectwise[arrow]), which is only imported when the format is used.
+"""
+from __future__ import annotations
+import datetime
+import io
+import types
+import typing
+import uuid
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal, Union
+from pydantic import BaseModel
+from pyconnectwise.models.base.connectwise_model import build_model
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# .NET serializers write up to 7 fractional digits, more than microsecond timestamps hold
+_EXTRA_FRACTION_DIGITS = r"(\.\d{6})\d+"
+# Timestamps without an offset are taken as UTC, so a column never mixes local and UTC times
+_NO_OFFSET = r"(T[\d:.]+)$"
+
+
+def import_pyarrow():
+    """
+    Import pyarrow and the modules of it used here.
+
+    Returns:
+        module: The pyarrow module.
+
+    Raises:
+        ImportError: If pyarrow isn't installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.json
+    except ImportError as e:
+        raise ImportError(
+            'The "arrow" response format requires pyarrow. Install it with: pip install pyconnectwise[arrow]'
+        ) from e
+    return pyarrow
+
+
+def _arrow_type(annotation: Any, models: tuple[type[BaseModel], ...]) -> pyarrow.DataType | None:
+    """
+    Map a model field's annotation to an Arrow type, or None for fields that have no column: free-form
+    objects (dicts), untyped values and references back to a model being described (models).
+    """
+    pa = import_pyarrow()
+    origin = typing.get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _arrow_type(args[0], models) if len(args) == 1 else None
+    if origin is Literal:
+        return pa.string()
+    if origin is list:
+        args = typing.get_args(annotation)
+        value_type = _arrow_type(args[0], models) if args else None
+        return pa.list_(value_type) if value_type is not None else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return pa.struct(_arrow_fields(annotation, models)) if annotation not in models else None
+    scalar_types = {
+        str: pa.string(),
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        uuid.UUID: pa.string(),
+        bytes: pa.string(),
+        datetime.datetime: pa.timestamp("us", tz="UTC"),
+        datetime.date: pa.date32(),
+    }
+    return scalar_types.get(annotation)
+
+
+def _arrow_fields(model_type: type[BaseModel], models: tuple[type[BaseModel], ...] = ()) -> list[pyarrow.Field]:
+    pa = import_pyarrow()
+    # Resolves the annotations of a model whose validator hasn't been built yet
+    build_model(model_type)
+    fields = []
+    for name, field in model_type.model_fields.items():
+        arrow_type = _arrow_type(field.annotation, (*models, model_type))
+        if arrow_type is not None:
+            fields.append(pa.field(field.alias or name, arrow_type))
+    return fields
+
+
+@cache
+def arrow_schema(model_type: type[BaseModel]) -> pyarrow.Schema:
+    """
+    The Arrow schema of a model, built once per model. Columns are named after the fields' API names
+    (aliases). Nested models become structs and lists become list columns. Fields holding free-form
+    objects (dict[str, ...]) and references back to a model that contains them are left out.
+
+    Parameters:
+        model_type (type[BaseModel]): The model.
+
+    Returns:
+        pyarrow.Schema: The schema of the tables the model's responses are read into.
+    """
+    return import_pyarrow().schema(_arrow_fields(model_type))
+
+
+def _has_temporal(arrow_type: pyarrow.DataType) -> bool:
+    pa = import_pyarrow()
+    if pa.types.is_timestamp(arrow_type) or pa.types.is_date32(arrow_type):
+        return True
+    if pa.types.is_struct(arrow_type):
+        return any(_has_temporal(field.type) for field in arrow_type)
+    if pa.types.is_list(arrow_type):
+        return _has_temporal(arrow_type.value_type)
+    return False
+
+
+def _as_read(arrow_type: pyarrow.DataType) -> pyarrow.DataType:
+    """
+    The type the JSON reader reads a column as: its own, with timestamps and dates read as strings.
+    The reader's ISO 8601 parser rejects the 7 fractional digits .NET writes, so they are parsed
+    afterwards by _parse_temporal.
+    """
+    pa = import_pyarrow()
+    if not _has_temporal(arrow_type):
+        return arrow_type
+    if pa.types.is_struct(arrow_type):
+        return pa.struct([field.with_type(_as_read(field.type)) for field in arrow_type])
+    if pa.types.is_list(arrow_type):
+        return pa.list_(_as_read(arrow_type.value_type))
+    return pa.string()
+
+
+@cache
+def _read_schema(model_type: type[BaseModel]) -> pyarrow.Schema:
+    """
+    The schema the JSON reader reads a page with: a single row whose "items" column is the page.
+    """
+    pa = import_pyarrow()
+    item_type = pa.struct([field.with_type(_as_read(field.type)) for field in arrow_schema(model_type)])
+    return pa.schema([pa.field("items", pa.list_(item_type))])
+
+
+def _parse_temporal(array: pyarrow.Array, arrow_type: pyarrow.DataType) -> pyarrow.Array:
+    """
+    Parse the timestamp and date strings of an array read with _as_read into arrow_type.
+    """
+    pa = import_pyarrow()
+    pc = pa.compute
+    if not _has_temporal(arrow_type):
+        return array
+    if pa.types.is_struct(arrow_type):
+        children = [_parse_temporal(child, field.type) for child, field in zip(array.flatten(), arrow_type)]
+        return pa.StructArray.from_arrays(children, fields=list(arrow_type), mask=array.is_null())
+    if pa.types.is_list(arrow_type):
+        values = _parse_temporal(array.values, arrow_type.value_type)
+        return pa.ListArray.from_arrays(array.offsets, values, type=arrow_type, mask=array.is_null())
+    if pa.types.is_timestamp(arrow_type):
+        array = pc.replace_substring_regex(array, _EXTRA_FRACTION_DIGITS, r"\1")
+        array = pc.replace_substring_regex(array, _NO_OFFSET, r"\1Z")
+    return pc.cast(array, arrow_type)
+
+
+def read_arrow_table(model_type: type[BaseModel], data: bytes) -> pyarrow.Table:
+    """
+    Read a JSON array of a model's objects, e.g. a page's response body, into an Arrow table.
+
+    Parameters:
+        model_type (type[BaseModel]): The model the objects are instances of, which the table's schema
+            is derived from (see arrow_schema).
+        data (bytes): The JSON array.
+
+    Returns:
+        pyarrow.Table: A table with a row per object and a column per field of arrow_schema(model_type).
+    """
+    pa = import_pyarrow()
+    # The reader reads newline-delimited objects, so the array is wrapped into one object. A block
+    # as large as the document keeps the reader from splitting the array, which it can't do.
+    wrapped = b'{"items":' + data + b"}"
+    table = pa.json.read_json(
+        io.BytesIO(wrapped),
+        read_options=pa.json.ReadOptions(use_threads=False, block_size=len(wrapped) + 64),
+        parse_options=pa.json.ParseOptions(
+            explicit_schema=_read_schema(model_type), unexpected_field_behavior="ignore"
+        ),
+    )
+    items = table.column("items").combine_chunks().flatten()
+    schema = arrow_schema(model_type)
+    columns = [_parse_temporal(column, field.type) for column, field in zip(items.flatten(), schema)]
+    return pa.Table.from_arrays(columns, schema=schema)
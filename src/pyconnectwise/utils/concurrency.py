@@ -0,0 +1,183 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AdaptiveConcurrencyLimiter finds how many requests can be in flight at once without the API
+    slowing down or throttling, and keeps adjusting as the server's load changes.
+
+    It follows AIMD (additive increase, multiplicative decrease). Every time a full limit's worth
+    of requests completes while the p95 latency of recent requests stays close to its baseline,
+    the limit grows by one. A throttling response (429 or 503 by default), or a p95 latency above
+    `latency_tolerance` times the baseline, cuts the limit by `backoff_ratio`. Requests that were
+    already running when the limit was cut can't cut it again, so one burst of 429s only backs
+    off once.
+
+    The current limit is available as `limit`. Pass `on_limit_change` to publish it to a metrics
+    system whenever it changes.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=32)
+        client = ConnectWiseManageAPIClient(..., concurrency_limiter=limiter)
+        for ticket in client.service.tickets.paginated(1, 1000).all(concurrency=32):
+            ...
+    """
+
+    DEFAULT_BACKOFF_STATUSES: frozenset[int] = frozenset({429, 503})
+    ACQUIRE_POLL_INTERVAL: float = 0.01
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: int = 50,
+        backoff_statuses: frozenset[int] = DEFAULT_BACKOFF_STATUSES,
+        on_limit_change: Callable[[int], None] | None = None,
+    ):
+        """
+        Parameters:
+            initial_limit (int, optional): The number of concurrent requests to start with. Defaults to 4.
+            min_limit (int, optional): The limit never drops below this. Defaults to 1.
+            max_limit (int, optional): The limit never grows above this. Defaults to 32.
+            backoff_ratio (float, optional): The limit is multiplied by this when backing off. Defaults to 0.5.
+            latency_tolerance (float, optional): How many times the baseline p95 latency counts as a spike. Defaults to 2.
+            window (int, optional): The number of recent requests the p95 latency is calculated over. Defaults to 50.
+            backoff_statuses (frozenset[int], optional): Status codes that make the limit back off. Defaults to 429 and 503.
+            on_limit_change (Callable[[int], None], optional): Called with the new limit whenever it changes. Defaults to None.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.backoff_statuses = frozenset(backoff_statuses)
+        self.on_limit_change = on_limit_change
+        self._limit: int = initial_limit
+        self._in_flight: int = 0
+        self._completed_at_limit: int = 0
+        self._last_backoff: float = 0.0
+        self._baseline_latency: float | None = None
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """
+        The number of requests currently allowed in flight.
+        """
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """
+        The number of requests currently in flight.
+        """
+        return self._in_flight
+
+    def acquire(self):
+        """
+        Block until fewer than `limit` requests are in flight, then count a new one.
+        Every acquire() must be followed by a release() once the request has completed.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def acquire_async(self):
+        """
+        Wait, without blocking the event loop, until fewer than `limit` requests are in flight,
+        then count a new one.
+        """
+        while not self._try_acquire():
+            await asyncio.sleep(self.ACQUIRE_POLL_INTERVAL)
+
+    def release(self, latency: float | None, status_code: int | None):
+        """
+        Count a request as completed and adjust the limit based on how it went.
+
+        Parameters:
+            latency (float, optional): How long the request took in seconds, or None if it didn't complete.
+            status_code (int, optional): The response status code, or None if no response was received.
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if latency is not None and status_code is not None:
+                self._record(latency, status_code)
+            self._condition.notify_all()
+
+    def _try_acquire(self) -> bool:
+        with self._condition:
+            if self._in_flight >= self._limit:
+                return False
+            self._in_flight += 1
+            return True
+
+    def _record(self, latency: float, status_code: int):
+        """
+        Adjust the limit for a completed request. Must be called while holding the lock.
+
+        Parameters:
+            latency (float): How long the request took in seconds.
+            status_code (int): The response status code.
+        """
+        started = time.monotonic() - latency
+        if status_code in self.backoff_statuses:
+            self._back_off(started)
+            return
+        if status_code >= 400 or started < self._last_backoff:
+            # Requests that started before the last cut ran at the old limit, so they say nothing about the new one
+            return
+
+        self._latencies.append(latency)
+        if len(self._latencies) < self._latencies.maxlen:
+            return
+        p95 = _percentile(self._latencies, 0.95)
+        if self._baseline_latency is None:
+            self._baseline_latency = p95
+        elif p95 > self._baseline_latency * self.latency_tolerance:
+            self._back_off(started)
+            return
+        else:
+            # Drift towards the current p95 so the baseline follows slow changes in the server's load
+            self._baseline_latency = min(p95, 0.9 * self._baseline_latency + 0.1 * p95)
+
+        self._completed_at_limit += 1
+        if self._completed_at_limit >= self._limit:
+            self._set_limit(self._limit + 1)
+
+    def _back_off(self, started: float):
+        """
+        Cut the limit, unless the request started before the last cut.
+
+        Parameters:
+            started (float): When the request that triggered the back off started (time.monotonic()).
+        """
+        if started < self._last_backoff:
+            return
+        self._last_backoff = time.monotonic()
+        # Latencies measured at the old limit would hide a spike at the new one
+        self._latencies.clear()
+        self._set_limit(math.floor(self._limit * self.backoff_ratio))
+
+    def _set_limit(self, limit: int):
+        limit = max(self.min_limit, min(self.max_limit, limit))
+        self._completed_at_limit = 0
+        if limit == self._limit:
+            return
+        self._limit = limit
+        if self.on_limit_change is not None:
+            self.on_limit_change(limit)
+
+
+def _percentile(values, percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile))]
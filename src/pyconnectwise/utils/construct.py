@@ -0,0 +1,92 @@
+"""
+Construction of models from trusted data without validating it, used by endpoints in trusted parsing
+mode (see ConnectWiseEndpoint.with_trusted_parsing). Keys are mapped from the API's names (aliases) to
+field names and nested models, and lists of them, are constructed the same way. Nothing else is
+checked or converted, so values keep the types JSON decoded them to, e.g. timestamps stay strings.
+"""
+from __future__ import annotations
+import types
+import typing
+from functools import cache
+from typing import Any, TypeVar, Union
+from pydantic import BaseModel
+from pyconnectwise.models.base.connectwise_model import build_model
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def _nested_model(annotation: Any) -> tuple[type[BaseModel], bool] | None:
+    """
+    Find the model a field's annotation holds, and whether it holds a list of them, or None for fields
+    that hold no model.
+    """
+    origin = typing.get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _nested_model(args[0]) if len(args) == 1 else None
+    if origin is list:
+        args = typing.get_args(annotation)
+        nested = _nested_model(args[0]) if args else None
+        return (nested[0], True) if nested is not None and not nested[1] else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None
+
+
+@cache
+def _construct_plan(model_type: type[BaseModel]) -> dict[str, tuple[str, tuple[type[BaseModel], bool] | None]]:
+    """
+    The fields of a model by the keys they're read from, with their names and nested models, built once
+    per model. Fields are read from their alias and their name, as validation would.
+    """
+    # Resolves the annotations of a model whose validator hasn't been built yet
+    build_model(model_type)
+    plan = {}
+    for name, field in model_type.model_fields.items():
+        entry = (name, _nested_model(field.annotation))
+        plan[name] = entry
+        plan[field.alias or name] = entry
+    return plan
+
+
+@cache
+def _template(model_type: type[BaseModel]) -> BaseModel | None:
+    """
+    An instance of a model holding just its defaults, which constructed instances are copied from, or
+    None if a field's default is made per instance by a default factory.
+    """
+    if any(field.default_factory is not None for field in model_type.model_fields.values()):
+        return None
+    return model_type.model_construct()
+
+
+def construct_model(model_type: type[T], data: dict[str, Any]) -> T:
+    """
+    Construct a model from decoded JSON without validating it.
+
+    Parameters:
+        model_type (type[T]): The model to construct, e.g. Ticket.
+        data (dict[str, Any]): The object's decoded JSON, keyed by the API's field names.
+
+    Returns:
+        T: The model. Fields missing from data hold their defaults, and keys that aren't fields are dropped.
+    """
+    plan = _construct_plan(model_type)
+    values = {}
+    for key, value in data.items():
+        entry = plan.get(key)
+        if entry is None:
+            continue
+        name, nested = entry
+        if nested is not None and value is not None:
+            nested_type, is_list = nested
+            if is_list:
+                value = [construct_model(nested_type, item) for item in value]
+            else:
+                value = construct_model(nested_type, value)
+        values[name] = value
+    # Copying an instance of the defaults is cheaper than model_construct() filling them in field by field
+    template = _template(model_type)
+    if template is None:
+        return model_type.model_construct(**values)
+    return template.model_copy(update=values)
@@ -18,10 +18,13 @@ def generate_endpoint(
     path: str,
     path_info: dict,
     relationships: dict,
+    is_async: bool = False,
 ):
     print(path)
     formatted_path = format_endpoint_path(path)
-    endpoint_class_name = get_endpoint_class_name_from_path(formatted_path)
+    # Async endpoints share the sync naming scheme, prefixed with "Async"
+    class_prefix = "Async" if is_async else ""
+    endpoint_class_name = class_prefix + get_endpoint_class_name_from_path(formatted_path)
     model_class_name = endpoint_class_name.replace("Endpoint", "Model")
     model_module_name = model_class_name.lower()
     endpoint_import_directory = endpoint_output_directory.split("/")[-1]
@@ -51,16 +54,13 @@ def generate_endpoint(
             if endpoint_class_name == id_child_endpoint_class_name:
                 continue
 
-            additional_imports.append(
-                f"from pyconnectwise.endpoints.{endpoint_import_directory}.{id_child_endpoint_class_name} import {id_child_endpoint_class_name}"
-            )
             has_id_child = True
         else:
             child_endpoint_path = child_endpoint
             child_endpoint_class_name = get_endpoint_class_name_from_path(
                 child_endpoint
             )
-            if endpoint_class_name == child_endpoint_class_name:
+            if endpoint_class_name == class_prefix + child_endpoint_class_name:
                 continue
 
             child_endpoint_definitions.append(
@@ -74,9 +74,6 @@ def generate_endpoint(
                     "path": child_endpoint_path.split("/")[-1],
                 }
             )
-            additional_imports.append(
-                f"from pyconnectwise.endpoints.{endpoint_import_directory}.{endpoint_class_name.replace('Endpoint', child_endpoint_class_name)} import {endpoint_class_name.replace('Endpoint', child_endpoint_class_name)}"
-            )
 
     imported_models = []
     op_definitions = []
@@ -170,12 +167,16 @@ def generate_endpoint(
         pagination_model_class=pagination_model_class,
         endpoint_path=normalize_path_parameters(
             path.split("/")[-1]).rstrip("/"),
+        route=normalize_path_parameters(path).strip("/"),
         operations=op_definitions,
         child_endpoints=child_endpoint_definitions,
         additional_imports=additional_imports,
+        # Child endpoints are imported from this package lazily, on first access
+        endpoint_package=f"pyconnectwise.endpoints.{endpoint_import_directory}",
         id_child_endpoint_class=id_child_endpoint_class_name,
         has_id_child=has_id_child,
         raw_path=path,
+        is_async=is_async,
     )
 
     save_py_file(
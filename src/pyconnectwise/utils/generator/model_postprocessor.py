@@ -1,51 +1,133 @@
 import os
 import ast
 from ast import parse
-from astunparse import unparse
 import re
 
 
-def move_imports_to_bottom(filename):
-    exceptions = [
-        "pydantic",
-        "typing",
-        "enum",
-        "datetime",
-        "__future__",
-        "pyconnectwise.models.base.connectwise_model",
-    ]
-    with open(filename, "r") as file:
+def _referenced_names(node: ast.AST) -> set[str]:
+    """
+    Names a class refers to in its bases, annotations and values, leaving out the names of its fields.
+    """
+    return {child.id for child in ast.walk(node) if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load)}
+
+
+def split_models_module(package_dir: str):
+    """
+    Split the single module datamodel-codegen writes to a package's __init__.py into one
+    module per model, named after the model in lowercase, and replace __init__.py with a
+    loader that imports a model's module the first time the model is accessed. Importing one
+    model then only builds the models it refers to, instead of every model of the API.
+
+    Base classes are imported at the top of a model's module and the other models it refers
+    to at the bottom, as the models refer to each other in cycles. Pydantic resolves those
+    references when the model is first used.
+
+    Args:
+        package_dir (str): The model package, e.g. ./src/pyconnectwise/models/manage.
+    """
+    init_path = os.path.join(package_dir, "__init__.py")
+    package = "pyconnectwise." + os.path.relpath(package_dir, "./src/pyconnectwise").replace(os.sep, ".")
+    with open(init_path, "r") as file:
         source_code = file.read()
 
     module = parse(source_code)
-    body = module.body
+    source_lines = source_code.splitlines()
+    classes = [node for node in module.body if isinstance(node, ast.ClassDef)]
+    if not classes:
+        # Already split
+        return
+    model_names = {node.name for node in classes}
+    header_comments = re.match(r"(\s*#[^\n]*\n)*", source_code).group(0).strip()
+    header_imports = [
+        node for node in module.body if isinstance(node, (ast.Import, ast.ImportFrom)) and node.module != "__future__"
+    ]
+    # The model_rebuild() calls datamodel-codegen adds after the models are left out: pydantic
+    # rebuilds models with unresolved references on first use, while rebuilding at import
+    # time could run before the other side of an import cycle has defined its model.
 
-    # Check each statement in the body of the module
-    for i, statement in reversed(list(enumerate(body))):
-        # If the statement is an import
-        if isinstance(statement, ast.Import) or isinstance(statement, ast.ImportFrom):
-            # If the imported module is not in the list of exceptions
-            if not any(ex in unparse(statement) for ex in exceptions):
-                # Remove the import statement from its current position and append it to the end of the body
-                import_statement = body.pop(i)
-                body.append(import_statement)
+    nodes_by_name = {node.name: node for node in classes}
 
-    # Using astunparse to convert the ast back to source code
-    updated_source_code = unparse(module)
-    updated_source_code = re.sub(r"\n\s*\n", "\n\n", updated_source_code)
+    def inherited_names(node: ast.ClassDef) -> set[str]:
+        # Pydantic resolves the annotations a model inherits in the model's own module, so
+        # that module needs the names its base classes refer to as well
+        names = _referenced_names(node)
+        for base in node.bases:
+            if isinstance(base, ast.Name) and base.id in nodes_by_name:
+                names |= inherited_names(nodes_by_name[base.id])
+        return names
 
-    # Writing back the updated source code to the file
-    with open(filename, "w") as file:
-        file.write(updated_source_code)
+    for node in classes:
+        used = inherited_names(node)
+        bases = [base.id for base in node.bases if isinstance(base, ast.Name) and base.id in model_names]
+        references = sorted(used & model_names - set(bases) - {node.name})
 
+        lines = [header_comments, "", "from __future__ import annotations"]
+        previous_group = None
+        for header_import in header_imports:
+            aliases = [alias.name for alias in header_import.names if alias.name in used]
+            if aliases:
+                # Blank lines between the standard library, pydantic and pyconnectwise imports
+                group = header_import.module.split(".")[0] if header_import.module.startswith("py") else None
+                if group != previous_group or len(lines) == 3:
+                    lines.append("")
+                previous_group = group
+                lines.append(f"from {header_import.module} import {', '.join(aliases)}")
+        for base in bases:
+            lines.append(f"from {package}.{base.lower()} import {base}")
+        lines += ["", "", *source_lines[node.lineno - 1 : node.end_lineno], ""]
+        if references:
+            lines += ["", "# Imported last, as models can refer to each other in cycles"]
+            lines += [f"from {package}.{reference.lower()} import {reference}" for reference in references]
+        with open(os.path.join(package_dir, f"{node.name.lower()}.py"), "w") as file:
+            file.write("\n".join(lines).strip("\n") + "\n")
 
-def post_process_directory(dir_path):
-    for root, _, files in os.walk(dir_path):
-        for file in files:
-            if file.endswith(".py"):
-                file_path = os.path.join(root, file)
-                move_imports_to_bottom(file_path)
+    # Drop the modules of models that no longer exist
+    expected = {f"{name.lower()}.py" for name in model_names} | {"__init__.py"}
+    for file_name in os.listdir(package_dir):
+        if file_name.endswith(".py") and file_name not in expected:
+            os.remove(os.path.join(package_dir, file_name))
+
+    names = sorted(model_names)
+    lines = [
+        header_comments,
+        "",
+        '"""',
+        f"The {package.rsplit('.', 1)[1].title()} API models. Each model lives in its own module, which is",
+        "imported the first time the model is accessed.",
+        '"""',
+        "",
+        "from __future__ import annotations",
+        "",
+        "import importlib",
+        "from typing import TYPE_CHECKING, Any",
+        "",
+        "__all__ = [",
+        *[f"    '{name}'," for name in names],
+        "]",
+        "",
+        "_MODEL_NAMES = frozenset(__all__)",
+        "",
+        "",
+        "def __getattr__(name: str) -> Any:",
+        "    if name not in _MODEL_NAMES:",
+        '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+        '    model = getattr(importlib.import_module(f"{__name__}.{name.lower()}"), name)',
+        "    # Cached in the package, so later accesses skip __getattr__",
+        "    globals()[name] = model",
+        "    return model",
+        "",
+        "",
+        "def __dir__() -> list[str]:",
+        "    return sorted({*globals(), *__all__})",
+        "",
+        "",
+        "if TYPE_CHECKING:",
+        *[f"    from {package}.{name.lower()} import {name}" for name in names],
+    ]
+    with open(init_path, "w") as file:
+        file.write("\n".join(lines).strip("\n") + "\n")
 
 
 if __name__ == "__main__":
-    post_process_directory("./src/pyconnectwise/models/automate")
+    split_models_module("./src/pyconnectwise/models/manage")
+    split_models_module("./src/pyconnectwise/models/automate")
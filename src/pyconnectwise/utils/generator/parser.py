@@ -1,12 +1,18 @@
 import json
 from .endpoint_gen import generate_endpoint, normalize_path_parameters
-from .client_gen import generate_manage_client, generate_automate_client
+from .client_gen import (
+    generate_manage_client,
+    generate_automate_client,
+    generate_async_manage_client,
+    generate_async_automate_client,
+)
 from collections import defaultdict
 import re
 from typing import List, Dict
 
 import json
 import glob
+import os
 
 
 def capitalize_path(path):
@@ -89,6 +95,46 @@ def generate_automate_code(
     pass
 
 
+def _get_async_output_path(endpoint_output_path: str) -> str:
+    """
+    Returns the output directory for the async endpoint tree, which sits next to the sync one
+    (e.g. endpoints/manage -> endpoints/async_manage).
+    """
+    head, tail = os.path.split(endpoint_output_path.rstrip("/"))
+    return os.path.join(head, f"async_{tail}")
+
+
+def _generate_endpoint_tree(
+    endpoint_output_path: str,
+    model_output_path: str,
+    schema: dict,
+    relationships: dict,
+    top_level_endpoints: dict,
+    is_async: bool = False,
+) -> list[str]:
+    os.makedirs(endpoint_output_path, exist_ok=True)
+    client_top_level_endpoints = []
+    for endpoint, child in relationships.items():
+        path = f"{endpoint}"
+        path_info = {}
+        if schema["paths"].get(path) is not None:
+            path_info = {key: value for key, value in schema["paths"][path].items()}
+        generate_endpoint(
+            endpoint_output_path, model_output_path, path, path_info, relationships, is_async
+        )
+
+    for endpoint, children in top_level_endpoints.items():
+        path = f"/{endpoint}"
+        path_info = {}
+        if schema["paths"].get(path) is not None:
+            path_info = {key: value for key, value in schema["paths"][path].items()}
+        endpoint_class = generate_endpoint(
+            endpoint_output_path, model_output_path, path, path_info, relationships, is_async
+        )
+        client_top_level_endpoints.append(endpoint_class)
+    return client_top_level_endpoints
+
+
 def _pre_process_schema(schema: dict) -> list[str]:
     processed_schema = schema.copy()
     normalized_paths = {}
@@ -133,29 +179,21 @@ def _generate_manage(
 ):
     schema = _pre_process_schema(schema)
     relationships, top_level_endpoints = _parse_relationships(schema["paths"])
-    models = schema["components"]["schemas"]
-    client_top_level_endpoints = []
-    for endpoint, child in relationships.items():
-        path = f"{endpoint}"
-        path_info = {}
-        if schema["paths"].get(path) is not None:
-            path_info = {key: value for key, value in schema["paths"][path].items()}
-        generate_endpoint(
-            endpoint_output_path, model_output_path, path, path_info, relationships
-        )
-
-    for endpoint, children in top_level_endpoints.items():
-        path = f"/{endpoint}"
-        path_info = {}
-        if schema["paths"].get(path) is not None:
-            path_info = {key: value for key, value in schema["paths"][path].items()}
-        endpoint_class = generate_endpoint(
-            endpoint_output_path, model_output_path, path, path_info, relationships
-        )
-        client_top_level_endpoints.append(endpoint_class)
-
+    client_top_level_endpoints = _generate_endpoint_tree(
+        endpoint_output_path, model_output_path, schema, relationships, top_level_endpoints
+    )
     generate_manage_client(client_output_path, client_top_level_endpoints)
 
+    async_client_top_level_endpoints = _generate_endpoint_tree(
+        _get_async_output_path(endpoint_output_path),
+        model_output_path,
+        schema,
+        relationships,
+        top_level_endpoints,
+        is_async=True,
+    )
+    generate_async_manage_client(client_output_path, async_client_top_level_endpoints)
+
 
 def _generate_automate(
     endpoint_output_path: str,
@@ -165,26 +203,17 @@ def _generate_automate(
 ):
     schema = _pre_process_schema(schema)
     relationships, top_level_endpoints = _parse_relationships(schema["paths"])
-    models = schema["components"]["schemas"]
-    client_top_level_endpoints = []
-    for endpoint, child in relationships.items():
-        path = f"{endpoint}"
-        path_info = {}
-        if schema["paths"].get(path) is not None:
-            path_info = {key: value for key, value in schema["paths"][path].items()}
-        generate_endpoint(
-            endpoint_output_path, model_output_path, path, path_info, relationships
-        )
-
-    for endpoint, children in top_level_endpoints.items():
-        path = f"/{endpoint}"
-        path_info = {}
-        if schema["paths"].get(path) is not None:
-            path_info = {key: value for key, value in schema["paths"][path].items()}
-
-        endpoint_class = generate_endpoint(
-            endpoint_output_path, model_output_path, path, path_info, relationships
-        )
-        client_top_level_endpoints.append(endpoint_class)
-
+    client_top_level_endpoints = _generate_endpoint_tree(
+        endpoint_output_path, model_output_path, schema, relationships, top_level_endpoints
+    )
     generate_automate_client(client_output_path, client_top_level_endpoints)
+
+    async_client_top_level_endpoints = _generate_endpoint_tree(
+        _get_async_output_path(endpoint_output_path),
+        model_output_path,
+        schema,
+        relationships,
+        top_level_endpoints,
+        is_async=True,
+    )
+    generate_async_automate_client(client_output_path, async_client_top_level_endpoints)
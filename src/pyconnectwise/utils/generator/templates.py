@@ -1,69 +1,70 @@
 from jinja2 import Template
 
 endpoint_template = Template(
-    """from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
+    """{%- if is_async -%}
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+{%- else -%}
+from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.responses.paginated_response import PaginatedResponse
-from typing import Any
+{%- endif %}
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 {%- if additional_imports is defined %}
 {%- for additional_import in additional_imports %}
 {{ additional_import }}
 {%- endfor %}
 {%- endif %}
+{%- if has_id_child or child_endpoints %}
+
+if TYPE_CHECKING:
+    {%- if has_id_child %}
+    from {{ endpoint_package }}.{{ id_child_endpoint_class }} import {{ id_child_endpoint_class }}
+    {%- endif %}
+    {%- for child_endpoint in child_endpoints %}
+    from {{ endpoint_package }}.{{ child_endpoint.class_name }} import {{ child_endpoint.class_name }}
+    {%- endfor %}
+{%- endif %}
+
+class {{ endpoint_class }}({{ 'Async' if is_async }}ConnectWiseEndpoint):
+    endpoint_base = "{{ endpoint_path }}"
+    {%- if route %}
+    _route = "{{ route }}"
+    {%- endif %}
 
-class {{ endpoint_class }}(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None):
-        super().__init__(client, "{{ endpoint_path }}", parent_endpoint=parent_endpoint)
-        {% if child_endpoints is defined %}
-        {%- for child_endpoint in child_endpoints %}
-        self.{{ child_endpoint.field_name }} = self._register_child_endpoint(
-            {{ child_endpoint.class_name }}(client, parent_endpoint=self)
-        )
-        {%- endfor %}
-        {%- endif %}
-    
+        super().__init__(client, parent_endpoint=parent_endpoint)
     {% if has_id_child %}
-    def id(self, id: int) -> {{ id_child_endpoint_class }}:
+    def id(self, id: int) -> "{{ id_child_endpoint_class }}":
         \"""
-        Sets the ID for this endpoint and returns an initialized {{ id_child_endpoint_class }} object to move down the chain.
+        Sets the ID for this endpoint and returns a {{ id_child_endpoint_class }} view bound to it to move down the chain.
 
         Parameters:
             id (int): The ID to set.
         Returns:
-            {{ id_child_endpoint_class }}: The initialized {{ id_child_endpoint_class }} object.
+            {{ id_child_endpoint_class }}: The {{ id_child_endpoint_class }} view bound to the ID.
         \"""
-        child = {{ id_child_endpoint_class }}(self.client, parent_endpoint=self)
-        child._id = id
-        return child
+        return self._bind_id("{{ endpoint_package }}.{{ id_child_endpoint_class }}", id)
     {% endif %}
 
     {%- if pagination_model_class is not none %}
-    def paginated(self, page: int, page_size: int, params: dict[str, int | str] = {}) -> PaginatedResponse[{{ pagination_model_class }}]:
+    {{ 'async ' if is_async }}def paginated(self, page: int, page_size: int, params: dict[str, int | str] | None = None, forward_only: bool = False) -> {{ 'Async' if is_async }}PaginatedResponse[{{ pagination_model_class }}]:
         \"""
-        Performs a GET request against the {{ raw_path }} endpoint and returns an initialized PaginatedResponse object.
+        Performs a GET request against the {{ raw_path }} endpoint and returns an initialized {{ 'Async' if is_async }}PaginatedResponse object.
 
         Parameters:
-            page (int): The page number to request.
+            page (int): The page number to request. Ignored when forward_only is set.
             page_size (int): The number of results to return per page.
-            params (dict[str, int | str]): The parameters to send in the request query string.
+            params (dict[str, int | str], optional): The parameters to send in the query string of every page's request, e.g. conditions.
+            forward_only (bool): Walk the collection with forward-only (pageId keyset) pagination instead of page numbers. ConnectWise Manage only.
         Returns:
-            PaginatedResponse[{{ pagination_model_class }}]: The initialized PaginatedResponse object.
-        \"""
-        params["page"] = page
-        params["pageSize"] = page_size
-        return PaginatedResponse(
-            super()._make_request(
-                "GET",
-                params=params
-            ),
-            {{ pagination_model_class }},
-            self,
-            page,
-            page_size,
-        )
+            {{ 'Async' if is_async }}PaginatedResponse[{{ pagination_model_class }}]: The initialized {{ 'Async' if is_async }}PaginatedResponse object.
+        \"""
+        return {{ 'await ' if is_async }}super()._paginated({{ pagination_model_class }}, page, page_size, params, forward_only)
     {% endif %}
 
     {%- for operation in operations %}
-    def {{ operation.name }}(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> {{ 'None' if operation.void else operation.return_type }}:
+    {{ 'async ' if is_async }}def {{ operation.name }}(self, data: dict[str, Any] = {}, params: dict[str, int | str] = {}) -> {{ 'None' if operation.void else operation.return_type }}:
         \"""
         Performs a {{ operation.name.upper() }} request against the {{ raw_path }} endpoint.
 
@@ -77,24 +78,39 @@ class {{ endpoint_class }}(ConnectWiseEndpoint):
         \"""
 
         {%- if operation.returns_single %}
-        return self._parse_one({{operation.return_class}}, super()._make_request("{{ operation.name.upper() }}", data=data, params=params).json())
+        return self._parse_one({{operation.return_class}}, {{ '(await ' if is_async }}super()._make_request("{{ operation.name.upper() }}", data=data, params=params){{ ')' if is_async }}.content)
         {% elif operation.void %}
-        super()._make_request("{{ operation.name.upper() }}", data=data, params=params)
+        {{ 'await ' if is_async }}super()._make_request("{{ operation.name.upper() }}", data=data, params=params)
         {% else %}
-        return self._parse_many({{operation.return_class}}, super()._make_request("{{ operation.name.upper() }}", data=data, params=params).json())
+        return self._parse_many({{operation.return_class}}, {{ '(await ' if is_async }}super()._make_request("{{ operation.name.upper() }}", data=data, params=params){{ ')' if is_async }}.content)
         {% endif %}
     {%- endfor %}
+    {#- Child endpoints come last, as names like "list" or "type" would shadow the builtins in the annotations above #}
+    {%- for child_endpoint in child_endpoints %}
+
+    @cached_property
+    def {{ child_endpoint.field_name }}(self) -> "{{ child_endpoint.class_name }}":
+        return self._create_child_endpoint("{{ endpoint_package }}.{{ child_endpoint.class_name }}")
+    {%- endfor %}
 """
 )
 
 manage_client_template = Template(
     """import base64
-import requests
-{%- if imports is defined %}
-{%- for import in imports %}
-{{ import }}
-{%- endfor %}
-{%- endif %}
+from functools import cached_property
+from typing import TYPE_CHECKING
+from pyconnectwise.utils.concurrency import AdaptiveConcurrencyLimiter
+from pyconnectwise.utils.json_backend import JSONBackend, default_json_backend
+from pyconnectwise.utils.response_formats import validate_response_format
+from pyconnectwise.utils.rate_limit import RateLimiter
+from pyconnectwise.transports.base import ConnectWiseTransport
+from pyconnectwise.transports.requests_transport import RequestsTransport
+from pyconnectwise.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    {%- for endpoint in endpoints %}
+    from {{ endpoint_package }}.{{ endpoint.class_name }} import {{ endpoint.class_name }}
+    {%- endfor %}
 
 class ConnectWiseManageAPIClient:
     \"""
@@ -109,6 +125,16 @@ class ConnectWiseManageAPIClient:
         public_key: str,
         private_key: str,
         codebase: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        transport: ConnectWiseTransport | None = None,
+        response_format: str = \"models\",
+        json_backend: JSONBackend | None = None,
+        trusted_parsing: bool = False,
     ):
         \"""
         Initializes the client with the given credentials and optionally a specific codebase.
@@ -121,13 +147,32 @@ class ConnectWiseManageAPIClient:
             public_key (str): Your ConnectWise Manage API Public key.
             private_key (str): Your ConnectWise Manage API Private key.
             codebase (str, optional): Your ConnectWise Manage Codebase. If not provided, it will be fetched from the API. Defaults to None.
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of keep-alive connections kept open per host. Defaults to 10.
+            pool_block (bool, optional): Block when all pooled connections to a host are in use instead of opening extra ones. Defaults to False.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Limits the request rate and number of concurrent requests. Defaults to None (no limit).
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adapts the number of concurrent requests to the API's latency and throttling. Defaults to None (no limit).
+            transport (ConnectWiseTransport, optional): The transport requests are sent through. Defaults to a RequestsTransport using the pool arguments.
+            response_format (str, optional): What requests return: \"models\" (parsed models), \"stream\" (models parsed one at a time as the response body is read), \"json\" (decoded JSON), \"raw\" (undecoded response bodies) or \"arrow\" (pyarrow Tables, requires pyarrow). Endpoints can override it with with_response_format(). Defaults to \"models\".
+            json_backend (JSONBackend, optional): Decodes the responses that aren't parsed into models. Defaults to the fastest backend installed (see default_json_backend).
+            trusted_parsing (bool, optional): Parse responses into models without validating them (see ConnectWiseEndpoint.with_trusted_parsing). Only for data read straight from ConnectWise. Defaults to False.
         \"""
         self.client_id: str = client_id
         self.company_name: str = company_name
         self.manage_url: str = manage_url
         self.public_key: str = public_key
         self.private_key: str = private_key
+        self.transport: ConnectWiseTransport = transport if transport is not None else RequestsTransport(pool_connections, pool_maxsize, pool_block)
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self.response_format: str = validate_response_format(response_format)
+        self.json_backend: JSONBackend = json_backend if json_backend is not None else default_json_backend()
+        self.trusted_parsing: bool = trusted_parsing
         
+        self.codebase: str | None = codebase
+
         # Retrieve codebase from the API if not provided
         if not codebase:
             codebase_request = self._try_get_codebase_from_api(
@@ -139,13 +184,28 @@ class ConnectWiseManageAPIClient:
             if codebase_request is None:
                 # we need to except here
                 raise Exception("Could not retrieve codebase from API.")
-            self.codebase: str = codebase_request
+            self.codebase = codebase_request
             
 
-        # Initializing endpoints
-        {%- for endpoint in endpoints %}
-        self.{{ endpoint.field_name }} = {{ endpoint.class_name }}(self)
-        {%- endfor %}
+    # Endpoints are created, and their modules imported, on first access
+    {%- for endpoint in endpoints %}
+    @cached_property
+    def {{ endpoint.field_name }}(self) -> "{{ endpoint.class_name }}":
+        from {{ endpoint_package }}.{{ endpoint.class_name }} import {{ endpoint.class_name }}
+
+        return {{ endpoint.class_name }}(self)
+    {% endfor %}
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        \"""
+        Closes the client's transport and releases all pooled connections.
+        \"""
+        self.transport.close()
 
     def _get_url(self) -> str:
         \"""
@@ -172,7 +232,7 @@ class ConnectWiseManageAPIClient:
         try:
             url = f"https://{manage_url}/login/companyinfo/{company_name}"
             result = (
-                requests.request("GET", url, headers=headers).json().get("Codebase")
+                self.transport.request("GET", url, headers=headers).json().get("Codebase")
             )
         except:
             result = None
@@ -211,13 +271,22 @@ class ConnectWiseManageAPIClient:
 
 automate_client_template = Template(
     """import base64
-import requests
 from datetime import datetime
-{%- if imports is defined %}
-{%- for import in imports %}
-{{ import }}
-{%- endfor %}
-{%- endif %}
+from functools import cached_property
+from typing import TYPE_CHECKING
+from pyconnectwise.exceptions import ConnectWiseRequestException
+from pyconnectwise.utils.concurrency import AdaptiveConcurrencyLimiter
+from pyconnectwise.utils.json_backend import JSONBackend, default_json_backend
+from pyconnectwise.utils.response_formats import validate_response_format
+from pyconnectwise.utils.rate_limit import RateLimiter
+from pyconnectwise.transports.base import ConnectWiseTransport
+from pyconnectwise.transports.requests_transport import RequestsTransport
+from pyconnectwise.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    {%- for endpoint in endpoints %}
+    from {{ endpoint_package }}.{{ endpoint.class_name }} import {{ endpoint.class_name }}
+    {%- endfor %}
 
 class ConnectWiseAutomateAPIClient:
     \"""
@@ -230,6 +299,16 @@ class ConnectWiseAutomateAPIClient:
         client_id: str,
         username: str,
         password: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        transport: ConnectWiseTransport | None = None,
+        response_format: str = \"models\",
+        json_backend: JSONBackend | None = None,
+        trusted_parsing: bool = False,
     ):
         \"""
         Initializes the client with the given credentials and optionally a specific codebase.
@@ -240,20 +319,52 @@ class ConnectWiseAutomateAPIClient:
             client_id (str): Your ConnectWise Automate API Client ID.
             username (str): Your ConnectWise Automate API username.
             password (str): Your ConnectWise Automate API password.
+            pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of keep-alive connections kept open per host. Defaults to 10.
+            pool_block (bool, optional): Block when all pooled connections to a host are in use instead of opening extra ones. Defaults to False.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Limits the request rate and number of concurrent requests. Defaults to None (no limit).
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adapts the number of concurrent requests to the API's latency and throttling. Defaults to None (no limit).
+            transport (ConnectWiseTransport, optional): The transport requests are sent through. Defaults to a RequestsTransport using the pool arguments.
+            response_format (str, optional): What requests return: \"models\" (parsed models), \"stream\" (models parsed one at a time as the response body is read), \"json\" (decoded JSON), \"raw\" (undecoded response bodies) or \"arrow\" (pyarrow Tables, requires pyarrow). Endpoints can override it with with_response_format(). Defaults to \"models\".
+            json_backend (JSONBackend, optional): Decodes the responses that aren't parsed into models. Defaults to the fastest backend installed (see default_json_backend).
+            trusted_parsing (bool, optional): Parse responses into models without validating them (see ConnectWiseEndpoint.with_trusted_parsing). Only for data read straight from ConnectWise. Defaults to False.
         \"""
         self.client_id: str = client_id
         self.automate_url: str = automate_url
         self.username: str = username
         self.password: str = password
         self.token_expiry_time: datetime = datetime.utcnow()
+        self.transport: ConnectWiseTransport = transport if transport is not None else RequestsTransport(pool_connections, pool_maxsize, pool_block)
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self.response_format: str = validate_response_format(response_format)
+        self.json_backend: JSONBackend = json_backend if json_backend is not None else default_json_backend()
+        self.trusted_parsing: bool = trusted_parsing
 
         # Grab first access token
         self.access_token: str = self._get_access_token()
                 
-        # Initializing endpoints
-        {%- for endpoint in endpoints %}
-        self.{{ endpoint.field_name }} = {{ endpoint.class_name }}(self)
-        {%- endfor %}
+    # Endpoints are created, and their modules imported, on first access
+    {%- for endpoint in endpoints %}
+    @cached_property
+    def {{ endpoint.field_name }}(self) -> "{{ endpoint.class_name }}":
+        from {{ endpoint_package }}.{{ endpoint.class_name }} import {{ endpoint.class_name }}
+
+        return {{ endpoint.class_name }}(self)
+    {% endfor %}
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        \"""
+        Closes the client's transport and releases all pooled connections.
+        \"""
+        self.transport.close()
 
     def _get_url(self) -> str:
         \"""
@@ -267,19 +378,19 @@ class ConnectWiseAutomateAPIClient:
     def _get_access_token(self) -> str:
         \"""
         Performs a request to the ConnectWise Automate API to obtain an access token.
+
+        Raises:
+            ConnectWiseRequestException: If the API rejects the credentials or the request fails.
         \"""
-        token: str = ""
-        try:
-            auth_response = requests.post(f'{self._get_url()}/apitoken', json={
-                "UserName": self.username,
-                "Password": self.password
-            }, headers={'Content-Type': 'application/json', 'ClientId': self.client_id}).json()
-            token = auth_response['AccessToken']
-            self.token_expiry_time = datetime.fromisoformat(auth_response['ExpirationDate'])
-        except Exception as e:
-            print(e)
-            return token
-        return token
+        auth_response = self.transport.request('POST', f'{self._get_url()}/apitoken', json={
+            "UserName": self.username,
+            "Password": self.password
+        }, headers={'Content-Type': 'application/json', 'ClientId': self.client_id})
+        if auth_response.status_code >= 400:
+            raise ConnectWiseRequestException(auth_response)
+        auth_body = auth_response.json()
+        self.token_expiry_time = datetime.fromisoformat(auth_body['ExpirationDate'])
+        return auth_body['AccessToken']
     
     def _refresh_access_token_if_necessary(self):
         if datetime.utcnow() > self.token_expiry_time:
@@ -302,3 +413,322 @@ class ConnectWiseAutomateAPIClient:
 
 """
 )
+
+async_manage_client_template = Template(
+    """import asyncio
+import base64
+from functools import cached_property
+from typing import TYPE_CHECKING
+from pyconnectwise.utils.concurrency import AdaptiveConcurrencyLimiter
+from pyconnectwise.utils.json_backend import JSONBackend, default_json_backend
+from pyconnectwise.utils.response_formats import validate_response_format
+from pyconnectwise.utils.rate_limit import RateLimiter
+from pyconnectwise.transports.base import AsyncConnectWiseTransport
+from pyconnectwise.transports.httpx_transport import HttpxTransport
+from pyconnectwise.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    {%- for endpoint in endpoints %}
+    from {{ endpoint_package }}.{{ endpoint.class_name }} import {{ endpoint.class_name }}
+    {%- endfor %}
+
+class AsyncConnectWiseManageAPIClient:
+    \"""
+    Asynchronous ConnectWise Manage API client. Handles the connection to the ConnectWise Manage API
+    and the configuration of all the available endpoints, whose requests are awaitable.
+    \"""
+    def __init__(
+        self,
+        company_name: str,
+        manage_url: str,
+        client_id: str,
+        public_key: str,
+        private_key: str,
+        codebase: str | None = None,
+        pool_maxsize: int = 100,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        transport: AsyncConnectWiseTransport | None = None,
+        response_format: str = \"models\",
+        json_backend: JSONBackend | None = None,
+        trusted_parsing: bool = False,
+    ):
+        \"""
+        Initializes the client with the given credentials and optionally a specific codebase.
+        If no codebase is given, it is fetched from the API before the first request.
+
+        Parameters:
+            company_name (str): Name of your company.
+            manage_url (str): URL of your ConnectWise Manage instance.
+            client_id (str): Your ConnectWise Manage API Client ID.
+            public_key (str): Your ConnectWise Manage API Public key.
+            private_key (str): Your ConnectWise Manage API Private key.
+            codebase (str, optional): Your ConnectWise Manage Codebase. If not provided, it will be fetched from the API. Defaults to None.
+            pool_maxsize (int, optional): Maximum number of concurrent keep-alive connections to the API. Defaults to 100.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Limits the request rate and number of concurrent requests. Defaults to None (no limit).
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adapts the number of concurrent requests to the API's latency and throttling. Defaults to None (no limit).
+            transport (AsyncConnectWiseTransport, optional): The transport requests are sent through. Defaults to an HttpxTransport using pool_maxsize.
+            response_format (str, optional): What requests return: \"models\" (parsed models), \"stream\" (models parsed one at a time as the response body is read), \"json\" (decoded JSON), \"raw\" (undecoded response bodies) or \"arrow\" (pyarrow Tables, requires pyarrow). Endpoints can override it with with_response_format(). Defaults to \"models\".
+            json_backend (JSONBackend, optional): Decodes the responses that aren't parsed into models. Defaults to the fastest backend installed (see default_json_backend).
+            trusted_parsing (bool, optional): Parse responses into models without validating them (see ConnectWiseEndpoint.with_trusted_parsing). Only for data read straight from ConnectWise. Defaults to False.
+        \"""
+        self.client_id: str = client_id
+        self.company_name: str = company_name
+        self.manage_url: str = manage_url
+        self.public_key: str = public_key
+        self.private_key: str = private_key
+        self.codebase: str | None = codebase
+        self._codebase_lock: asyncio.Lock = asyncio.Lock()
+        self.transport: AsyncConnectWiseTransport = transport if transport is not None else HttpxTransport(pool_maxsize)
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self.response_format: str = validate_response_format(response_format)
+        self.json_backend: JSONBackend = json_backend if json_backend is not None else default_json_backend()
+        self.trusted_parsing: bool = trusted_parsing
+
+    # Endpoints are created, and their modules imported, on first access
+    {%- for endpoint in endpoints %}
+    @cached_property
+    def {{ endpoint.field_name }}(self) -> "{{ endpoint.class_name }}":
+        from {{ endpoint_package }}.{{ endpoint.class_name }} import {{ endpoint.class_name }}
+
+        return {{ endpoint.class_name }}(self)
+    {% endfor %}
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        \"""
+        Closes the client's transport and releases all pooled connections.
+        \"""
+        await self.transport.close()
+
+    def _get_url(self) -> str:
+        \"""
+        Generates and returns the URL for the ConnectWise Manage API endpoints based on the company url and codebase.
+
+        Returns:
+            str: API URL.
+        \"""
+        return f"https://{self.manage_url}/{self.codebase.strip('/')}/apis/3.0"
+
+    async def _try_get_codebase_from_api(self, manage_url: str, company_name: str, headers: dict[str, str]) -> str | None:
+        \"""
+        Tries to retrieve the codebase from the API using the provided company url, company name and headers.
+
+        Parameters:
+            company_url (str): URL of the company.
+            company_name (str): Name of the company.
+            headers (dict[str, str]): Headers to be sent in the request.
+
+        Returns:
+            str: Codebase string or None if an error occurs.
+        \"""
+        result = ""
+        try:
+            url = f"https://{manage_url}/login/companyinfo/{company_name}"
+            result = (
+                (await self.transport.request("GET", url, headers=headers)).json().get("Codebase")
+            )
+        except:
+            result = None
+        return result
+
+    async def _resolve_codebase_if_necessary(self, headers: dict[str, str]):
+        if self.codebase:
+            return
+        async with self._codebase_lock:
+            if self.codebase:
+                return
+            codebase_request = await self._try_get_codebase_from_api(
+                manage_url=self.manage_url,
+                company_name=self.company_name,
+                headers=headers,
+            )
+
+            if codebase_request is None:
+                # we need to except here
+                raise Exception("Could not retrieve codebase from API.")
+            self.codebase = codebase_request
+
+    def _get_auth_string(self) -> str:
+        \"""
+        Creates and returns the base64 encoded authorization string required for API requests.
+
+        Returns:
+            str: Base64 encoded authorization string.
+        \"""
+        return "Basic " + base64.b64encode(
+            bytes(
+                f"{self.company_name}+{self.public_key}:{self.private_key}",
+                encoding="utf8",
+            )
+        ).decode("ascii")
+
+    async def _get_headers(self) -> dict[str, str]:
+        \"""
+        Generates and returns the headers required for making API requests. The codebase is fetched if necessary before returning.
+
+        Returns:
+            dict[str, str]: Dictionary of headers including Content-Type, Client ID, and Authorization.
+        \"""
+        headers = {
+            "Content-Type": "application/json",
+            "clientId": self.client_id,
+            "Authorization": self._get_auth_string(),
+        }
+        await self._resolve_codebase_if_necessary(headers)
+        return headers
+
+"""
+)
+
+async_automate_client_template = Template(
+    """import asyncio
+from datetime import datetime
+from functools import cached_property
+from typing import TYPE_CHECKING
+from pyconnectwise.exceptions import ConnectWiseRequestException
+from pyconnectwise.utils.concurrency import AdaptiveConcurrencyLimiter
+from pyconnectwise.utils.json_backend import JSONBackend, default_json_backend
+from pyconnectwise.utils.response_formats import validate_response_format
+from pyconnectwise.utils.rate_limit import RateLimiter
+from pyconnectwise.transports.base import AsyncConnectWiseTransport
+from pyconnectwise.transports.httpx_transport import HttpxTransport
+from pyconnectwise.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    {%- for endpoint in endpoints %}
+    from {{ endpoint_package }}.{{ endpoint.class_name }} import {{ endpoint.class_name }}
+    {%- endfor %}
+
+class AsyncConnectWiseAutomateAPIClient:
+    \"""
+    Asynchronous ConnectWise Automate API client. Handles the connection to the ConnectWise Automate API
+    and the configuration of all the available endpoints, whose requests are awaitable.
+    \"""
+    def __init__(
+        self,
+        automate_url: str,
+        client_id: str,
+        username: str,
+        password: str,
+        pool_maxsize: int = 100,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        transport: AsyncConnectWiseTransport | None = None,
+        response_format: str = \"models\",
+        json_backend: JSONBackend | None = None,
+        trusted_parsing: bool = False,
+    ):
+        \"""
+        Initializes the client with the given credentials. An access token is obtained before the first request.
+
+        Parameters:
+            automate_url (str): URL of your ConnectWise Automate instance.
+            client_id (str): Your ConnectWise Automate API Client ID.
+            username (str): Your ConnectWise Automate API username.
+            password (str): Your ConnectWise Automate API password.
+            pool_maxsize (int, optional): Maximum number of concurrent keep-alive connections to the API. Defaults to 100.
+            retry_policy (RetryPolicy, optional): How failed requests are retried. Defaults to RetryPolicy().
+            rate_limiter (RateLimiter, optional): Limits the request rate and number of concurrent requests. Defaults to None (no limit).
+            concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Adapts the number of concurrent requests to the API's latency and throttling. Defaults to None (no limit).
+            transport (AsyncConnectWiseTransport, optional): The transport requests are sent through. Defaults to an HttpxTransport using pool_maxsize.
+            response_format (str, optional): What requests return: \"models\" (parsed models), \"stream\" (models parsed one at a time as the response body is read), \"json\" (decoded JSON), \"raw\" (undecoded response bodies) or \"arrow\" (pyarrow Tables, requires pyarrow). Endpoints can override it with with_response_format(). Defaults to \"models\".
+            json_backend (JSONBackend, optional): Decodes the responses that aren't parsed into models. Defaults to the fastest backend installed (see default_json_backend).
+            trusted_parsing (bool, optional): Parse responses into models without validating them (see ConnectWiseEndpoint.with_trusted_parsing). Only for data read straight from ConnectWise. Defaults to False.
+        \"""
+        self.client_id: str = client_id
+        self.automate_url: str = automate_url
+        self.username: str = username
+        self.password: str = password
+        self.token_expiry_time: datetime = datetime.utcnow()
+        self.access_token: str = ""
+        self._token_lock: asyncio.Lock = asyncio.Lock()
+        self.transport: AsyncConnectWiseTransport = transport if transport is not None else HttpxTransport(pool_maxsize)
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self.response_format: str = validate_response_format(response_format)
+        self.json_backend: JSONBackend = json_backend if json_backend is not None else default_json_backend()
+        self.trusted_parsing: bool = trusted_parsing
+
+    # Endpoints are created, and their modules imported, on first access
+    {%- for endpoint in endpoints %}
+    @cached_property
+    def {{ endpoint.field_name }}(self) -> "{{ endpoint.class_name }}":
+        from {{ endpoint_package }}.{{ endpoint.class_name }} import {{ endpoint.class_name }}
+
+        return {{ endpoint.class_name }}(self)
+    {% endfor %}
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        \"""
+        Closes the client's transport and releases all pooled connections.
+        \"""
+        await self.transport.close()
+
+    def _get_url(self) -> str:
+        \"""
+        Generates and returns the URL for the ConnectWise Automate API endpoints based on the company url and codebase.
+
+        Returns:
+            str: API URL.
+        \"""
+        return f"https://{self.automate_url}/cwa/api/v1"
+
+    async def _get_access_token(self) -> str:
+        \"""
+        Performs a request to the ConnectWise Automate API to obtain an access token.
+
+        Raises:
+            ConnectWiseRequestException: If the API rejects the credentials or the request fails.
+        \"""
+        auth_response = await self.transport.request('POST', f'{self._get_url()}/apitoken', json={
+            "UserName": self.username,
+            "Password": self.password
+        }, headers={'Content-Type': 'application/json', 'ClientId': self.client_id})
+        if auth_response.status_code >= 400:
+            raise ConnectWiseRequestException(auth_response)
+        auth_body = auth_response.json()
+        self.token_expiry_time = datetime.fromisoformat(auth_body['ExpirationDate'])
+        return auth_body['AccessToken']
+
+    async def _refresh_access_token_if_necessary(self):
+        if self.access_token and datetime.utcnow() <= self.token_expiry_time:
+            return
+        async with self._token_lock:
+            # Another request may have refreshed the token while we waited for the lock
+            if self.access_token and datetime.utcnow() <= self.token_expiry_time:
+                return
+            self.access_token = await self._get_access_token()
+
+    async def _get_headers(self) -> dict[str, str]:
+        \"""
+        Generates and returns the headers required for making API requests. The access token is refreshed if necessary before returning.
+
+        Returns:
+            dict[str, str]: Dictionary of headers including Content-Type, Client ID, and Authorization.
+        \"""
+        await self._refresh_access_token_if_necessary()
+        headers = {
+            "Content-Type": "application/json",
+            "clientId": self.client_id,
+            "Authorization": f"Bearer {self.access_token}",
+        }
+        return headers
+
+"""
+)
@@ -37,6 +37,7 @@ def parse_link_headers(headers: dict[str, str]) -> dict[str, Any] | None:
       - "last_page": An optional integer representing the number of the last page.
       - "has_next_page": A boolean indicating whether there is a next page.
       - "has_prev_page": A boolean indicating whether there is a previous page.
+      - "next_page_id": An optional integer representing the pageId of the next page, when using forward-only pagination.
 
     If the "Link" header is not present in the headers dictionary, None is returned.
 
@@ -47,6 +48,13 @@ def parse_link_headers(headers: dict[str, str]) -> dict[str, Any] | None:
         pagination_info = parse_link_headers(headers)
         print(pagination_info)
         # Output: {'first_page': 1, 'next_page': 2, 'has_next_page': True}
+
+        headers = {
+            "Link": '<https://example.com/api?pageSize=25&pageId=1250>; rel="next"'
+        }
+        pagination_info = parse_link_headers(headers)
+        print(pagination_info)
+        # Output: {'has_next_page': True, 'next_page_id': 1250}
     """
     if headers.get("Link") is None:
         return None
@@ -57,8 +65,16 @@ def parse_link_headers(headers: dict[str, str]) -> dict[str, Any] | None:
     prev_page: int | None = None
     next_page: int | None = None
     last_page: int | None = None
+    next_page_id: int | None = None
 
     for link in links:
+        # Forward-only pagination links carry a pageId instead of a page number
+        page_id_match = re.search(r'pageId=(\d+)[^>]*>; rel="next"', link)
+        if page_id_match:
+            next_page_id = int(page_id_match.group(1))
+            has_next_page = True
+            continue
+
         match = re.search(r'page=(\d+)>; rel="(.*?)"', link)
         if match:
             page_number = int(match.group(1))
@@ -94,4 +110,7 @@ def parse_link_headers(headers: dict[str, str]) -> dict[str, Any] | None:
     if has_prev_page:
         result["has_prev_page"] = has_prev_page
 
+    if next_page_id is not None:
+        result["next_page_id"] = next_page_id
+
     return result
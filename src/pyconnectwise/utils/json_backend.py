@@ -0,0 +1,75 @@
+import json
+from typing import Any
+
+
+class JSONBackend:
+    """
+    JSONBackend decodes the JSON response bodies a client hands back undecoded to models, i.e.
+    those requested in the "json" response format and those read with _make_request_and_get_json.
+    Responses parsed into models don't go through it, as pydantic-core decodes and validates them
+    in a single pass.
+
+    This base class uses the standard library's json module. Clients use the fastest backend
+    installed (see default_json_backend) unless another one is passed in.
+    """
+
+    name: str = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        """
+        Decode a JSON document.
+
+        Parameters:
+            data (bytes | str): The JSON document, e.g. a response body.
+
+        Returns:
+            Any: The decoded document, made of dicts, lists, strings, numbers, booleans and None.
+        """
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    A JSONBackend using orjson (pip install orjson).
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._loads = orjson.loads
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._loads(data)
+
+
+class MsgspecBackend(JSONBackend):
+    """
+    A JSONBackend using msgspec (pip install msgspec).
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+def default_json_backend() -> JSONBackend:
+    """
+    Get the fastest JSON backend installed: orjson, then msgspec, then the standard library's json.
+
+    Returns:
+        JSONBackend: The backend.
+    """
+    for backend in (OrjsonBackend, MsgspecBackend):
+        try:
+            return backend()
+        except ImportError:
+            continue
+    return JSONBackend()
@@ -0,0 +1,80 @@
+"""
+Incremental decoding of JSON arrays, used by the "stream" response format to read a response body
+one item at a time as it arrives from the network, instead of holding the whole body, and every item
+decoded from it, in memory at once.
+"""
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\r\n"
+_SEPARATORS = _WHITESPACE + ","
+_decoder = json.JSONDecoder()
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Decode a JSON array one item at a time from chunks of its UTF-8 encoding, e.g. a response body
+    as it's read. Only the chunk being read and the item being decoded are held in memory, so memory
+    use is bounded by the size of the largest item rather than by the size of the array.
+
+    Parameters:
+        chunks (Iterable[bytes]): The encoded array, in chunks of any size.
+
+    Yields:
+        Any: Each item of the array, decoded to dicts, lists, strings, numbers, booleans and None.
+
+    Raises:
+        ValueError: If the document isn't a JSON array, or ends before the array does.
+    """
+    chunks = iter(chunks)
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    exhausted = False
+    in_array = False
+    while True:
+        while position < len(buffer) and buffer[position] in _SEPARATORS:
+            position += 1
+        if position < len(buffer):
+            if not in_array:
+                if buffer[position] != "[":
+                    raise ValueError(f"Expected a JSON array, got {buffer[position:position + 20]!r}")
+                in_array = True
+                position += 1
+                continue
+            if buffer[position] == "]":
+                return
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # The item runs into the next chunk
+                if exhausted:
+                    raise
+            else:
+                # An item is complete once a separator or the end of the array follows it. Until then it
+                # may carry on in the next chunk, e.g. a number cut off after "1." or "1.5e".
+                following = end
+                while following < len(buffer) and buffer[following] in _WHITESPACE:
+                    following += 1
+                if following < len(buffer) and buffer[following] in ",]":
+                    yield item
+                    position = end
+                    continue
+                if exhausted:
+                    if following < len(buffer):
+                        raise ValueError(f"Unexpected {buffer[following:following + 20]!r} after an array item")
+                    # The array isn't closed, which is reported below
+                    yield item
+                    position = end
+                    continue
+        elif exhausted:
+            raise ValueError("The JSON array ended unexpectedly")
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
@@ -0,0 +1,219 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import Any, Callable
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class RateLimiter:
+    """
+    RateLimiter keeps a client under a request rate and a cap on concurrent requests.
+
+    The rate is enforced with a token bucket: it refills at `requests_per_second` tokens a second,
+    holds at most `burst` tokens, and every request takes one. `max_in_flight` caps how many
+    requests may be waiting on the API at the same time.
+
+    By default the bucket lives in memory and is shared by every thread using the limiter. Pass a
+    `state_file` to share it between processes on the same host as well: the state is kept in that
+    file and guarded by an OS file lock, so every worker pointed at the same file draws from one
+    bucket.
+
+    Example:
+        limiter = RateLimiter(requests_per_second=10, max_in_flight=4, state_file="/tmp/cw-rate-limit")
+        client = ConnectWiseManageAPIClient(..., rate_limiter=limiter)
+    """
+
+    IN_FLIGHT_POLL_INTERVAL: float = 0.01
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        max_in_flight: int | None = None,
+        burst: int | None = None,
+        state_file: str | None = None,
+    ):
+        """
+        Parameters:
+            requests_per_second (float, optional): Sustained number of requests allowed per second. Defaults to None (no rate limit).
+            max_in_flight (int, optional): Maximum number of requests in progress at once. Defaults to None (no limit).
+            burst (int, optional): Number of requests that can be sent back to back after an idle period. Defaults to 1.
+            state_file (str, optional): Path of a file to keep the limiter state in, shared between processes. Defaults to None (per-process state).
+        """
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0.")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        self.requests_per_second = requests_per_second
+        self.max_in_flight = max_in_flight
+        self.burst: int = burst if burst is not None else 1
+        self._state = _FileState(state_file) if state_file else _MemoryState()
+
+    def acquire(self):
+        """
+        Block until a request may be sent, then reserve a slot for it. Every acquire() must be
+        followed by a release() once the request has completed.
+        """
+        while wait := self._state.update(self._try_acquire):
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Wait, without blocking the event loop, until a request may be sent, then reserve a slot for it.
+        """
+        while wait := self._state.update(self._try_acquire):
+            await asyncio.sleep(wait)
+
+    def release(self):
+        """
+        Free the in-flight slot reserved by acquire().
+        """
+        self._state.update(self._release)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    def _try_acquire(self, state: dict[str, Any]) -> float:
+        """
+        Take a token and an in-flight slot from the state if both are available.
+
+        Parameters:
+            state (dict[str, Any]): The limiter state, which is updated in place.
+
+        Returns:
+            float: 0 if the request may go ahead, otherwise the number of seconds to wait before trying again.
+        """
+        now = time.time()
+        in_flight: dict[str, int] = state.setdefault("in_flight", {})
+        if self.max_in_flight is not None:
+            _prune_dead_processes(in_flight)
+            if sum(in_flight.values()) >= self.max_in_flight:
+                return self.IN_FLIGHT_POLL_INTERVAL
+
+        if self.requests_per_second is not None:
+            tokens = state.get("tokens", self.burst)
+            elapsed = max(0.0, now - state.get("updated", now))
+            tokens = min(self.burst, tokens + elapsed * self.requests_per_second)
+            state["updated"] = now
+            if tokens < 1:
+                state["tokens"] = tokens
+                return (1 - tokens) / self.requests_per_second
+            state["tokens"] = tokens - 1
+
+        pid = str(os.getpid())
+        in_flight[pid] = in_flight.get(pid, 0) + 1
+        return 0.0
+
+    def _release(self, state: dict[str, Any]):
+        """
+        Give back this process's in-flight slot.
+
+        Parameters:
+            state (dict[str, Any]): The limiter state, which is updated in place.
+        """
+        in_flight: dict[str, int] = state.setdefault("in_flight", {})
+        pid = str(os.getpid())
+        remaining = in_flight.get(pid, 0) - 1
+        if remaining > 0:
+            in_flight[pid] = remaining
+        else:
+            in_flight.pop(pid, None)
+
+
+def _prune_dead_processes(in_flight: dict[str, int]):
+    """
+    Drop the in-flight slots held by processes that have exited without releasing them.
+
+    Parameters:
+        in_flight (dict[str, int]): Number of in-flight requests by process id.
+    """
+    if os.name != "posix":
+        return
+    for pid in list(in_flight):
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            del in_flight[pid]
+        except PermissionError:
+            pass
+
+
+class _MemoryState:
+    """
+    Limiter state kept in memory, shared by the threads of one process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: dict[str, Any] = {}
+
+    def update(self, func: Callable[[dict[str, Any]], Any]) -> Any:
+        with self._lock:
+            return func(self._state)
+
+
+class _FileState:
+    """
+    Limiter state kept as JSON in a file, shared by every process that opens the same path.
+    An exclusive OS lock on the file is held while the state is read and written back.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # File locks are held per process, so threads of the same process also need a lock of their own
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+    def update(self, func: Callable[[dict[str, Any]], Any]) -> Any:
+        with self._lock, open(self.path, "a+b") as file:
+            _lock_file(file)
+            try:
+                file.seek(0)
+                content = file.read()
+                state = json.loads(content) if content else {}
+                result = func(state)
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(state).encode())
+                file.flush()
+                return result
+            finally:
+                _unlock_file(file)
+
+
+def _lock_file(file):
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(file):
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    else:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
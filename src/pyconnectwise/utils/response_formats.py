@@ -0,0 +1,21 @@
+# What requests return: parsed models, models parsed one at a time as the body is read, the decoded JSON,
+# the undecoded response bodies, or Arrow tables
+RESPONSE_FORMATS: tuple[str, ...] = ("models", "stream", "json", "raw", "arrow")
+
+
+def validate_response_format(response_format: str) -> str:
+    """
+    Check that a response format is one of RESPONSE_FORMATS.
+
+    Args:
+        response_format (str): The response format.
+
+    Returns:
+        str: The response format.
+
+    Raises:
+        ValueError: If the response format isn't one of RESPONSE_FORMATS.
+    """
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(f"Unknown response format {response_format!r}, expected one of {RESPONSE_FORMATS}")
+    return response_format
@@ -0,0 +1,111 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy:
+    """
+    RetryPolicy decides whether a failed request should be retried and how long to wait first.
+
+    Requests are retried when they fail with one of the retryable status codes (429 Too Many
+    Requests and the 5xx gateway/availability errors by default) or when the connection is
+    reset. Only idempotent methods are retried, except for 429 responses: the server rejected
+    those before processing them, so they're safe to send again whatever the method.
+
+    Waits grow exponentially with each attempt and are randomised ("full jitter") so that many
+    workers throttled at the same moment don't all retry in lockstep. A Retry-After header on the
+    response is honoured when it asks for a longer wait.
+
+    Example:
+        client = ConnectWiseManageAPIClient(..., retry_policy=RetryPolicy(max_retries=5, backoff_factor=1.0))
+
+        # disable retries
+        client = ConnectWiseManageAPIClient(..., retry_policy=RetryPolicy(max_retries=0))
+    """
+
+    DEFAULT_RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    DEFAULT_RETRY_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES,
+        retry_methods: frozenset[str] = DEFAULT_RETRY_METHODS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 300.0,
+    ):
+        """
+        Parameters:
+            max_retries (int, optional): Maximum number of retries per request. 0 disables retrying. Defaults to 3.
+            backoff_factor (float, optional): Base wait in seconds, doubled on every attempt. Defaults to 0.5.
+            max_backoff (float, optional): Upper bound in seconds for the exponential wait. Defaults to 30.
+            retry_statuses (frozenset[int], optional): Status codes that are retried. Defaults to 429, 500, 502, 503 and 504.
+            retry_methods (frozenset[str], optional): HTTP methods that are retried. Defaults to the idempotent methods.
+            respect_retry_after (bool, optional): Whether to wait at least as long as a Retry-After header asks. Defaults to True.
+            max_retry_after (float, optional): Upper bound in seconds for waits taken from Retry-After. Defaults to 300.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, method: str, attempt: int, status_code: int | None = None) -> bool:
+        """
+        Decide whether a failed request should be retried.
+
+        Parameters:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of retries already made for the request.
+            status_code (int, optional): The response status code, or None if the connection failed.
+
+        Returns:
+            bool: True if the request should be sent again.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status_code is not None and status_code not in self.retry_statuses:
+            return False
+        return method.upper() in self.retry_methods or status_code == 429
+
+    def get_delay(self, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Calculate how long to wait before the next retry.
+
+        Parameters:
+            attempt (int): The number of retries already made for the request.
+            retry_after (str, optional): The value of the response's Retry-After header, if any.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * (2**attempt)))
+        if self.respect_retry_after and retry_after:
+            delay = max(delay, min(self.max_retry_after, self._parse_retry_after(retry_after)))
+        return delay
+
+    def _parse_retry_after(self, retry_after: str) -> float:
+        """
+        Parse a Retry-After header, which is either a number of seconds or an HTTP date.
+
+        Parameters:
+            retry_after (str): The header value.
+
+        Returns:
+            float: The number of seconds to wait, or 0 if the header can't be parsed.
+        """
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 0.0
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
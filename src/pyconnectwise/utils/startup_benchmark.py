@@ -0,0 +1,96 @@
+"""
+Benchmark of pyconnectwise's start-up cost: the wall time and peak RSS of importing pyconnectwise,
+of first using a few models, and of importing every model of an API, with the models' validators
+built on first use (the default, see ConnectWiseModel) and built when their classes are defined.
+Every measurement runs in a fresh interpreter.
+
+Usage:
+    python -m pyconnectwise.utils.startup_benchmark
+    python -m pyconnectwise.utils.startup_benchmark --api automate --models AutomateComputer --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# Run in a fresh interpreter. Prints the seconds taken and the peak RSS in KiB as JSON.
+SCRIPT = """
+import json, resource, sys, time
+eager, api, models = json.loads(sys.argv[1])
+started = time.perf_counter()
+import pyconnectwise
+if eager:
+    from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+    ConnectWiseModel.model_config["defer_build"] = False
+if models is not None:
+    import pydantic
+    package = __import__(f"pyconnectwise.models.{api}", fromlist=["__all__"])
+    for name in models or package.__all__:
+        model = getattr(package, name)
+        if models:
+            try:
+                model.model_validate({})
+            except pydantic.ValidationError:
+                pass
+seconds = time.perf_counter() - started
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([seconds, peak_rss // 1024 if sys.platform == "darwin" else peak_rss]))
+"""
+
+DEFAULT_MODELS = {"manage": "Ticket,Company", "automate": "AutomateComputer,AutomateClient"}
+HEADER = f"{'scenario':<40} {'build':<9} {'seconds':>9} {'peak RSS (MiB)':>15}"
+
+
+def measure(eager: bool, api: str, models: list[str] | None, runs: int) -> tuple[float, float]:
+    """
+    Run a scenario in fresh interpreters.
+
+    Parameters:
+        eager (bool): Build the models' validators when their classes are defined instead of on first use.
+        api (str): "manage" or "automate".
+        models (list[str], optional): The models to import and validate, an empty list for every model of the API
+        (imported, not validated), or None for none at all.
+        runs (int): The number of interpreters to run the scenario in.
+
+    Returns:
+        tuple[float, float]: The median seconds taken and the median peak RSS in MiB.
+    """
+    seconds, peak_rss = [], []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", SCRIPT, json.dumps([eager, api, models])],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        run_seconds, run_peak_rss = json.loads(output)
+        seconds.append(run_seconds)
+        peak_rss.append(run_peak_rss / 1024)
+    return statistics.median(seconds), statistics.median(peak_rss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the start-up cost of pyconnectwise.")
+    parser.add_argument("--api", choices=("manage", "automate"), default="manage", help="API whose models are used.")
+    parser.add_argument("--models", type=str, default=None, help="Comma separated models to use, e.g. Ticket,Company.")
+    parser.add_argument("--runs", type=int, default=3, help="Number of fresh interpreters per scenario.")
+    args = parser.parse_args()
+    models = (args.models or DEFAULT_MODELS[args.api]).split(",")
+
+    scenarios = (
+        ("import pyconnectwise", None),
+        (f"use {', '.join(models)}", models),
+        (f"import every {args.api} model", []),
+    )
+    print(HEADER)
+    for name, scenario_models in scenarios:
+        # Importing pyconnectwise alone doesn't define any model, so it only runs once
+        for eager in (True, False) if scenario_models is not None else (False,):
+            seconds, peak_rss = measure(eager, args.api, scenario_models, args.runs)
+            build = "eager" if eager else "deferred" if scenario_models is not None else "-"
+            print(f"{name:<40} {build:<9} {seconds:>9.3f} {peak_rss:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
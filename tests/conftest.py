@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+# The package is laid out under src/ and isn't installed to run the tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from pyconnectwise import ConnectWiseManageAPIClient  # noqa: E402
+from pyconnectwise.transports.memory_transport import InMemoryTransport  # noqa: E402
+
+
+@pytest.fixture
+def transport() -> InMemoryTransport:
+    return InMemoryTransport()
+
+
+@pytest.fixture
+def manage_client(transport: InMemoryTransport) -> ConnectWiseManageAPIClient:
+    return ConnectWiseManageAPIClient(
+        "company", "manage.local", "client-id", "public", "private", codebase="v4_6_release/", transport=transport
+    )
@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pyconnectwise.transports.httpx_transport import HttpxTransport
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def run_without_httpx(code: str) -> subprocess.CompletedProcess:
+    # A None entry in sys.modules makes importing httpx raise ImportError, as if it wasn't installed
+    return subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.modules['httpx'] = None\n{code}"],
+        env={**os.environ, "PYTHONPATH": SRC},
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_package_imports_without_httpx():
+    result = run_without_httpx(
+        "import pyconnectwise\n"
+        "from pyconnectwise.transports.memory_transport import InMemoryTransport\n"
+        "client = pyconnectwise.ConnectWiseManageAPIClient('c', 'h', 'id', 'pub', 'priv', codebase='v1/',"
+        " transport=InMemoryTransport())\n"
+        "print(type(client.service.tickets).__name__)"
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ServiceTicketsEndpoint"
+
+
+def test_async_client_without_httpx():
+    result = run_without_httpx(
+        "import pyconnectwise\n"
+        "pyconnectwise.AsyncConnectWiseManageAPIClient('c', 'h', 'id', 'pub', 'priv', codebase='v1/')"
+    )
+
+    assert result.returncode != 0
+    assert "ImportError: The async clients require httpx. Install it with: pip install pyconnectwise[async]" in (
+        result.stderr
+    )
+
+
+def test_httpx_transport_without_httpx(monkeypatch):
+    monkeypatch.setitem(sys.modules, "httpx", None)
+
+    with pytest.raises(ImportError, match=r"pyconnectwise\[async\]"):
+        HttpxTransport()
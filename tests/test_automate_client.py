@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from pyconnectwise import AsyncConnectWiseAutomateAPIClient, ConnectWiseAutomateAPIClient
+from pyconnectwise.exceptions import ConnectWiseRequestException
+from pyconnectwise.transports.memory_transport import AsyncInMemoryTransport, InMemoryTransport
+
+TOKEN = {"AccessToken": "token", "ExpirationDate": "2099-01-01T00:00:00"}
+REJECTED = {"Message": "Invalid credentials"}
+
+
+def test_access_token(transport):
+    transport.add_response("POST", "/apitoken", json=TOKEN)
+
+    client = ConnectWiseAutomateAPIClient("automate.local", "client-id", "user", "password", transport=transport)
+
+    assert client.access_token == "token"
+    assert client._get_headers()["Authorization"] == "Bearer token"
+
+
+def test_rejected_credentials_raise():
+    transport = InMemoryTransport()
+    transport.add_response("POST", "/apitoken", json=REJECTED, status_code=401)
+
+    with pytest.raises(ConnectWiseRequestException) as exception_info:
+        ConnectWiseAutomateAPIClient("automate.local", "client-id", "user", "wrong", transport=transport)
+
+    assert exception_info.value.status_code == 401
+
+
+def test_async_rejected_credentials_raise():
+    transport = AsyncInMemoryTransport()
+    transport.add_response("POST", "/apitoken", json=REJECTED, status_code=401)
+    client = AsyncConnectWiseAutomateAPIClient("automate.local", "client-id", "user", "wrong", transport=transport)
+
+    with pytest.raises(ConnectWiseRequestException) as exception_info:
+        asyncio.run(client._get_access_token())
+
+    assert exception_info.value.status_code == 401
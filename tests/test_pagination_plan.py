@@ -0,0 +1,65 @@
+import asyncio
+
+from pyconnectwise import AsyncConnectWiseManageAPIClient
+from pyconnectwise.transports.memory_transport import AsyncInMemoryTransport
+
+TICKETS = [{"id": id, "summary": f"Ticket {id}"} for id in range(1, 8)]
+PARAMS = {
+    "conditions": "closedFlag = false",
+    "childConditions": "configurations/id = 3",
+    "customFieldConditions": 'caption = "Site" and value = "HQ"',
+    "orderBy": "id desc",
+    "fields": "id,summary",
+    "columns": "id",
+}
+COUNT_PARAMS = {
+    "conditions": "closedFlag = false",
+    "childConditions": "configurations/id = 3",
+    "customFieldConditions": 'caption = "Site" and value = "HQ"',
+}
+
+
+def count_requests(transport):
+    return [request for request in transport.requests if request.path.endswith("/count")]
+
+
+def test_count_is_sent_filter_params_only(manage_client, transport):
+    transport.add_pages("/service/tickets", TICKETS)
+    transport.add_response("GET", "/service/tickets/count", json={"count": len(TICKETS)})
+
+    page = manage_client.service.tickets.paginated(1, 3, PARAMS)
+    plan = page.plan()
+    tickets = list(page.extract(concurrency=2))
+
+    assert count_requests(transport)
+    assert all(request.params == COUNT_PARAMS for request in count_requests(transport))
+    assert (plan.total_count, plan.last_page) == (7, 3)
+    assert len(tickets) == 7
+    # The pages themselves are still requested with every param
+    pages = [request.params for request in transport.requests if not request.path.endswith("/count")]
+    assert all(params.items() >= PARAMS.items() for params in pages)
+
+
+def test_count_without_filters(manage_client, transport):
+    transport.add_pages("/service/tickets", TICKETS)
+    transport.add_response("GET", "/service/tickets/count", json={"count": len(TICKETS)})
+
+    manage_client.service.tickets.paginated(1, 3, {"orderBy": "id desc"}).plan()
+
+    assert [request.params for request in count_requests(transport)] == [{}]
+
+
+def test_async_count_is_sent_filter_params_only():
+    transport = AsyncInMemoryTransport()
+    transport.add_pages("/service/tickets", TICKETS)
+    transport.add_response("GET", "/service/tickets/count", json={"count": len(TICKETS)})
+    client = AsyncConnectWiseManageAPIClient(
+        "company", "manage.local", "client-id", "public", "private", codebase="v4_6_release/", transport=transport
+    )
+
+    async def plan():
+        page = await client.service.tickets.paginated(1, 3, PARAMS)
+        return await page.plan()
+
+    assert asyncio.run(plan()).total_count == 7
+    assert [request.params for request in count_requests(transport)] == [COUNT_PARAMS]
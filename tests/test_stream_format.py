@@ -0,0 +1,53 @@
+from pyconnectwise.models.manage import Ticket
+
+TICKETS = [{"id": id, "summary": f"Ticket {id}"} for id in range(1, 6)]
+
+
+def test_get_empty_page(manage_client, transport):
+    transport.add_response("GET", "/service/tickets", json=[])
+
+    tickets = manage_client.service.tickets.with_response_format("stream").get()
+
+    assert iter(tickets) is tickets
+    assert list(tickets) == []
+
+
+def test_get(manage_client, transport):
+    transport.add_response("GET", "/service/tickets", json=TICKETS)
+
+    tickets = manage_client.service.tickets.with_response_format("stream").get()
+
+    assert [ticket.id for ticket in tickets] == [1, 2, 3, 4, 5]
+
+
+def test_paginated_empty_page(manage_client, transport):
+    transport.add_pages("/service/tickets", [])
+
+    page = manage_client.service.tickets.with_response_format("stream").paginated(1, 10)
+
+    assert not page.has_data
+    assert page.item_count == 0
+    assert list(page.all()) == []
+    assert len(transport.requests) == 1
+
+
+def test_paginated_page_past_the_end(manage_client, transport):
+    transport.add_pages("/service/tickets", TICKETS)
+
+    page = manage_client.service.tickets.with_response_format("stream").paginated(3, 5)
+
+    assert not page.has_data
+    assert list(page.all()) == []
+
+
+def test_paginated(manage_client, transport):
+    transport.add_pages("/service/tickets", TICKETS)
+
+    page = manage_client.service.tickets.with_response_format("stream").paginated(1, 2)
+
+    assert page.has_data
+    assert page.item_count is None
+    tickets = list(page.all())
+    assert all(isinstance(ticket, Ticket) for ticket in tickets)
+    assert [ticket.id for ticket in tickets] == [1, 2, 3, 4, 5]
+    assert len(transport.requests) == 3
@@ -0,0 +1,111 @@
+import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from pyconnectwise import ConnectWiseManageAPIClient
+from pyconnectwise.models.manage import BoardReference, CustomFieldValue, Ticket
+
+TICKETS = [
+    {
+        "id": id,
+        "summary": "Printer on fire",
+        "board": {"id": 1, "name": "Help Desk", "_info": {"board_href": "https://manage.local/boards/1"}},
+        "requiredDate": "2024-01-02T03:04:05Z",
+        "customFields": [{"id": 7, "caption": "Site", "type": "Text", "entryMethod": "EntryField", "value": "HQ"}],
+        "notAField": True,
+    }
+    for id in range(1, 6)
+]
+# Doesn't pass validation, so it tells validated and trusted parsing apart
+INVALID_TICKET = {"id": "not a number", "summary": "Unvalidated"}
+
+
+def assert_constructed(ticket: Ticket):
+    assert isinstance(ticket, Ticket)
+    assert isinstance(ticket.board, BoardReference)
+    assert ticket.board.name == "Help Desk"
+    assert ticket.board.info == {"board_href": "https://manage.local/boards/1"}
+    assert isinstance(ticket.custom_fields[0], CustomFieldValue)
+    assert ticket.custom_fields[0].entry_method == "EntryField"
+    # Values aren't converted, and missing fields hold their defaults
+    assert ticket.required_date == "2024-01-02T03:04:05Z"
+    assert ticket.contact is None
+    assert ticket.model_fields_set == {"id", "summary", "board", "required_date", "custom_fields"}
+
+
+def test_validates_by_default(manage_client, transport):
+    transport.add_response("GET", "/service/tickets", json=TICKETS)
+    transport.add_response("GET", "/service/tickets/1", json=INVALID_TICKET)
+
+    tickets = manage_client.service.tickets.get()
+
+    assert tickets[0].required_date == datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    with pytest.raises(ValidationError):
+        manage_client.service.tickets.id(1).get()
+
+
+def test_client_trusted_parsing(transport):
+    client = ConnectWiseManageAPIClient(
+        "company", "manage.local", "client-id", "public", "private", codebase="v4_6_release/",
+        transport=transport, trusted_parsing=True,
+    )
+    transport.add_response("GET", "/service/tickets", json=TICKETS)
+    transport.add_response("GET", "/service/tickets/1", json=INVALID_TICKET)
+
+    tickets = client.service.tickets.get()
+    ticket = client.service.tickets.id(1).get()
+
+    assert len(tickets) == 5
+    assert_constructed(tickets[0])
+    assert ticket.id == "not a number"
+
+
+def test_with_trusted_parsing_is_per_view(manage_client, transport):
+    transport.add_response("GET", "/service/tickets/1", json=INVALID_TICKET)
+    tickets = manage_client.service.tickets
+
+    assert tickets.with_trusted_parsing().id(1).get().id == "not a number"
+    # The endpoint the view was made from still validates
+    with pytest.raises(ValidationError):
+        tickets.id(1).get()
+
+
+def test_with_trusted_parsing_false_validates(transport):
+    client = ConnectWiseManageAPIClient(
+        "company", "manage.local", "client-id", "public", "private", codebase="v4_6_release/",
+        transport=transport, trusted_parsing=True,
+    )
+    transport.add_response("GET", "/service/tickets/1", json=INVALID_TICKET)
+
+    with pytest.raises(ValidationError):
+        client.service.tickets.with_trusted_parsing(False).id(1).get()
+
+
+def test_paginated_walk(manage_client, transport):
+    transport.add_pages("/service/tickets", [*TICKETS, INVALID_TICKET])
+
+    tickets = list(manage_client.service.tickets.with_trusted_parsing().paginated(1, 2).all())
+
+    assert len(tickets) == 6
+    assert all(isinstance(ticket, Ticket) for ticket in tickets)
+    assert_constructed(tickets[4])
+    assert tickets[5].id == "not a number"
+    with pytest.raises(ValidationError):
+        list(manage_client.service.tickets.paginated(1, 2).all())
+
+
+@pytest.mark.parametrize("order", ["format first", "trusted first"])
+def test_stream_format(manage_client, transport, order):
+    transport.add_pages("/service/tickets", [*TICKETS, INVALID_TICKET])
+    tickets = manage_client.service.tickets
+    if order == "format first":
+        endpoint = tickets.with_response_format("stream").with_trusted_parsing()
+    else:
+        endpoint = tickets.with_trusted_parsing().with_response_format("stream")
+
+    streamed = list(endpoint.paginated(1, 4).all())
+
+    assert len(streamed) == 6
+    assert_constructed(streamed[0])
+    assert streamed[5].id == "not a number"